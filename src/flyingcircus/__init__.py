@@ -1,5 +1,8 @@
 from ._about import __version__
 from . import intrinsic_function as Fn
+from .difference import diff
+from .export import export_many
+from .loader import load_stack
 
 from .yaml import register_yaml_representers
 
@@ -0,0 +1,121 @@
+"""Create the classes in a module when they are first used.
+
+The generated modules in the `_raw` package define thousands of classes, and
+most programs only use a few of them. Rather than creating every class when
+the module is imported, each module defines a function that creates each
+group of related classes, and uses `create_lazy_classes` to call it when
+one of those classes is first accessed (see PEP 562).
+
+Python 3.6 doesn't support `__getattr__` for modules, so all of the classes
+are created immediately instead.
+"""
+
+import sys
+import threading
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+#: Whether a module can define `__getattr__` for missing attributes
+_HAS_MODULE_GETATTR = sys.version_info >= (3, 7)
+
+#: Ensures that each class is only created once, even when several threads
+#: use it for the first time together. This is re-entrant, because creating
+#: one class can require another class to be created.
+_LOCK = threading.RLock()
+
+
+def create_lazy_classes(
+    namespace: Dict[str, Any], factories: Dict[str, Callable[[], Tuple[type, ...]]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Create the classes in a module when they are first used.
+
+    Args:
+        namespace: The `globals()` of the module.
+        factories: The function that creates each class, keyed by class
+            name. A function may create several classes, which must all be
+            listed here.
+
+    Returns:
+        The `__getattr__` and `__dir__` functions for the module.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            factory = factories[name]
+        except KeyError:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(namespace["__name__"], name)
+            ) from None
+
+        with _LOCK:
+            # Another thread may have created the class while we were waiting
+            if name not in namespace:
+                for cls in factory():
+                    # The class is defined in a function, but it is
+                    # published at the top level of the module (which also
+                    # allows it to be pickled)
+                    cls.__qualname__ = cls.__name__
+                    namespace[cls.__name__] = cls
+        return namespace[name]
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(factories))
+
+    if not _HAS_MODULE_GETATTR:  # pragma: no cover
+        for class_name in factories:
+            __getattr__(class_name)
+
+    return __getattr__, __dir__
+
+
+def reexport_lazily(
+    namespace: Dict[str, Any], module: ModuleType
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Re-export the public names from another module, without using them.
+
+    This is the equivalent of `from module import *`, except that the
+    names are looked up when they are first used, so any lazy classes in
+    the other module are not created yet.
+
+    The module's `__all__` is calculated when it is first requested (eg.
+    by `from ... import *`), and consists of the public names in the
+    module (as though it didn't have an `__all__`) and all of the names
+    that are re-exported.
+
+    Args:
+        namespace: The `globals()` of the re-exporting module.
+        module: The module that has names to re-export. It must have an
+            `__all__`.
+
+    Returns:
+        The `__getattr__` and `__dir__` functions for the module.
+    """
+    reexported_names = frozenset(module.__all__)
+
+    def __getattr__(name: str) -> Any:
+        if name in reexported_names:
+            value = getattr(module, name)
+        elif name == "__all__":
+            value = [key for key in namespace if not key.startswith("_")]
+            value.extend(key for key in module.__all__ if key not in namespace)
+        else:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(namespace["__name__"], name)
+            )
+
+        # Don't look it up again next time
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | reexported_names)
+
+    if not _HAS_MODULE_GETATTR:  # pragma: no cover
+        for name in module.__all__:
+            namespace[name] = getattr(module, name)
+
+    return __getattr__, __dir__
@@ -0,0 +1,257 @@
+"""Support for classes that were built ahead of time.
+
+Decorating a class with `attrs` generates the source code for it's
+`__init__` (and other methods), and compiles it when the class is created.
+This is the main cost of creating the thousands of classes in the `_raw`
+package, so the code generator writes out the finished class body instead:
+the `__slots__`, and an `__init__` that is equivalent to the one that
+`attrs` would create.
+
+The functions in this module create the rest of the class, in the same way
+that `attrs` would, but without compiling any code. They only use the
+public parts of the `attrs` API, so the result is compatible with the
+installed version of `attrs` (eg. for `attr.fields()`, `attr.evolve()`, or
+decorating a subclass).
+
+The attributes that a class inherits from it's base class in the `core`
+module are found when the module is imported, so the generated code
+doesn't depend on them. The generated `__init__` only has parameters for
+the class's own attributes, and passes any other keyword arguments to a
+function that sets the inherited attributes.
+
+The generated module looks like::
+
+    _init_ResourceProperties = _prebuilt.create_inherited_init(
+        _ResourceProperties
+    )
+
+    class MyProperties(_ResourceProperties):
+        __slots__ = ("Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MyProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Tags=None, **kwargs) -> None:
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+"""
+
+import threading
+from operator import itemgetter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Sequence
+from typing import Tuple
+
+from attr import Attribute
+from attr import Factory
+from attr import NOTHING
+from attr import attrib
+
+#: The attributes that a class inherits from each base class, keyed by
+#: the base class
+_INHERITED_ATTRIBUTES: Dict[type, Tuple[Attribute, ...]] = {}
+
+#: The function that sets the inherited attributes of a new object, keyed
+#: by the base class. See `create_inherited_init`.
+_INHERITED_INITS: Dict[type, Callable[[Any, Dict[str, Any]], None]] = {}
+
+#: The objects that are currently being converted to a string in each
+#: thread, so that a recursive data structure doesn't recurse forever
+_REPR_CONTEXT = threading.local()
+
+
+def create_attributes(
+    class_name: str,
+    base: type,
+    names: Sequence[str],
+    converters: Dict[str, Callable[[Any], Any]] = None,
+    factories: Dict[str, Callable[[], Any]] = None,
+    types: Dict[str, Any] = None,
+) -> Tuple[Attribute, ...]:
+    """Create the `__attrs_attrs__` for a class that was built ahead of time.
+
+    This is the same as the attribute declarations that `attrs` creates for
+    a class with `ATTRSCONFIG`: the attributes inherited from the base
+    class come first, followed by the class's own keyword-only attributes.
+
+    Args:
+        class_name: The name of the class.
+        base: The base class, which must be an `attrs` class.
+        names: The names of the class's own attributes, in declaration
+            order (ie. it's `__slots__`).
+        converters: The converter for each attribute that has one.
+        factories: The factory for each attribute that has one. Any other
+            attribute has a default value of None.
+        types: The type annotation for each attribute that has one.
+    """
+    converters = converters or {}
+    factories = factories or {}
+    types = types or {}
+
+    attributes = list(_get_inherited_attributes(base))
+    for name in names:
+        if name in factories:
+            declaration = attrib(
+                factory=factories[name], converter=converters.get(name), kw_only=True
+            )
+        else:
+            declaration = attrib(
+                default=None, converter=converters.get(name), kw_only=True
+            )
+        attributes.append(
+            Attribute.from_counting_attr(name, declaration, types.get(name))
+        )
+
+    return _create_attributes_class(class_name, attributes)(attributes)
+
+
+def _get_inherited_attributes(base: type) -> Tuple[Attribute, ...]:
+    """Get the attributes that a subclass of this class inherits."""
+    try:
+        return _INHERITED_ATTRIBUTES[base]
+    except KeyError:
+        pass
+
+    # attrs >= 20.1 records which attributes were inherited. These
+    # declarations don't change, so they are shared by every subclass.
+    inherited = tuple(
+        (
+            attribute.evolve(inherited=True)
+            if getattr(attribute, "inherited", True) is False
+            else attribute
+        )
+        for attribute in base.__attrs_attrs__
+    )
+    _INHERITED_ATTRIBUTES[base] = inherited
+    return inherited
+
+
+def create_inherited_init(base: type) -> Callable[[Any, Dict[str, Any]], None]:
+    """Create the function that finishes initialising a new object of a
+    prebuilt class, which is derived from this base class.
+
+    The function is called with the object and the keyword arguments that
+    aren't for the class's own attributes. It sets the inherited attributes
+    in the same way as the `__init__` that `attrs` would create (so each
+    value is converted and validated when it is set), and then calls the
+    `__attrs_post_init__` method, if there is one.
+    """
+    try:
+        return _INHERITED_INITS[base]
+    except KeyError:
+        pass
+
+    if hasattr(base, "__attrs_pre_init__"):
+        raise TypeError("Prebuilt classes don't support __attrs_pre_init__")
+
+    # attrs removes leading underscores from the names of the parameters
+    fields = tuple(
+        (
+            attribute.name,
+            attribute.name.lstrip("_") if attribute.init else None,
+            attribute.default,
+        )
+        for attribute in _get_inherited_attributes(base)
+    )
+    post_init = hasattr(base, "__attrs_post_init__")
+
+    def init_inherited(self, values: Dict[str, Any]):
+        for name, parameter, default in fields:
+            value = NOTHING if parameter is None else values.pop(parameter, NOTHING)
+            if value is NOTHING:
+                if isinstance(default, Factory) and default.takes_self:
+                    value = default.factory(self)
+                elif isinstance(default, Factory):
+                    value = default.factory()
+                elif default is NOTHING:
+                    raise TypeError(
+                        "__init__() missing required keyword-only argument: "
+                        "'{}'".format(parameter)
+                    )
+                else:
+                    value = default
+            setattr(self, name, value)
+
+        if values:
+            raise TypeError(
+                "__init__() got an unexpected keyword argument '{}'".format(
+                    next(iter(values))
+                )
+            )
+
+        if post_init:
+            self.__attrs_post_init__()
+
+    _INHERITED_INITS[base] = init_inherited
+    return init_inherited
+
+
+def _create_attributes_class(class_name: str, attributes: Sequence[Attribute]) -> type:
+    """Create the tuple subclass that `attrs` uses for `__attrs_attrs__`,
+    with a property to get each attribute by name."""
+    namespace = {"__slots__": ()}
+    for index, attribute in enumerate(attributes):
+        namespace[attribute.name] = property(itemgetter(index))
+    return type(class_name + "Attributes", (tuple,), namespace)
+
+
+def create_repr(attributes: Sequence[Attribute]) -> Callable[[Any], str]:
+    """Create the `__repr__` for a class, which is the same as the one that
+    `attrs` creates."""
+    # An attribute's repr can be disabled, or replaced with a function
+    names_and_reprs = tuple(
+        (attribute.name, repr if attribute.repr is True else attribute.repr)
+        for attribute in attributes
+        if attribute.repr is not False
+    )
+
+    def __repr__(self):
+        try:
+            already_repring = _REPR_CONTEXT.already_repring
+        except AttributeError:
+            already_repring = _REPR_CONTEXT.already_repring = set()
+
+        if id(self) in already_repring:
+            return "..."
+        already_repring.add(id(self))
+        try:
+            return "{}({})".format(
+                self.__class__.__qualname__.rsplit(">.", 1)[-1],
+                ", ".join(
+                    "{}={}".format(name, attribute_repr(getattr(self, name, NOTHING)))
+                    for name, attribute_repr in names_and_reprs
+                ),
+            )
+        finally:
+            already_repring.remove(id(self))
+
+    return __repr__
+
+
+def create_state_methods(
+    attributes: Sequence[Attribute],
+) -> Tuple[Callable[[Any], tuple], Callable[[Any, tuple], None]]:
+    """Create the `__getstate__` and `__setstate__` for a class, which are
+    the same as the ones that `attrs` creates for pickling a slotted
+    class."""
+    names = tuple(attribute.name for attribute in attributes)
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in names)
+
+    def __setstate__(self, state):
+        # Set the values directly, as they were when they were pickled
+        set_attribute = object.__setattr__.__get__(self)
+        for name, value in zip(names, state):
+            set_attribute(name, value)
+
+    return __getstate__, __setstate__
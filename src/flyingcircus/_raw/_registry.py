@@ -0,0 +1,650 @@
+"""Lookup table of the raw class for every AWS resource type.
+
+This file is automatically generated, and should not be directly edited.
+"""
+
+#: The module and class name in the `_raw` package for each CloudFormation
+#: resource type, keyed by the resource type. This allows the class for a
+#: resource type to be found without importing every module.
+RESOURCE_TYPES = {
+    "AWS::AccessAnalyzer::Analyzer": ("accessanalyzer", "Analyzer"),
+    "AWS::AmazonMQ::Broker": ("amazonmq", "Broker"),
+    "AWS::AmazonMQ::Configuration": ("amazonmq", "Configuration"),
+    "AWS::AmazonMQ::ConfigurationAssociation": ("amazonmq", "ConfigurationAssociation"),
+    "AWS::Amplify::App": ("amplify", "App"),
+    "AWS::Amplify::Branch": ("amplify", "Branch"),
+    "AWS::Amplify::Domain": ("amplify", "Domain"),
+    "AWS::ApiGateway::Account": ("apigateway", "Account"),
+    "AWS::ApiGateway::ApiKey": ("apigateway", "ApiKey"),
+    "AWS::ApiGateway::Authorizer": ("apigateway", "Authorizer"),
+    "AWS::ApiGateway::BasePathMapping": ("apigateway", "BasePathMapping"),
+    "AWS::ApiGateway::ClientCertificate": ("apigateway", "ClientCertificate"),
+    "AWS::ApiGateway::Deployment": ("apigateway", "Deployment"),
+    "AWS::ApiGateway::DocumentationPart": ("apigateway", "DocumentationPart"),
+    "AWS::ApiGateway::DocumentationVersion": ("apigateway", "DocumentationVersion"),
+    "AWS::ApiGateway::DomainName": ("apigateway", "DomainName"),
+    "AWS::ApiGateway::GatewayResponse": ("apigateway", "GatewayResponse"),
+    "AWS::ApiGateway::Method": ("apigateway", "Method"),
+    "AWS::ApiGateway::Model": ("apigateway", "Model"),
+    "AWS::ApiGateway::RequestValidator": ("apigateway", "RequestValidator"),
+    "AWS::ApiGateway::Resource": ("apigateway", "Resource"),
+    "AWS::ApiGateway::RestApi": ("apigateway", "RestApi"),
+    "AWS::ApiGateway::Stage": ("apigateway", "Stage"),
+    "AWS::ApiGateway::UsagePlan": ("apigateway", "UsagePlan"),
+    "AWS::ApiGateway::UsagePlanKey": ("apigateway", "UsagePlanKey"),
+    "AWS::ApiGateway::VpcLink": ("apigateway", "VpcLink"),
+    "AWS::ApiGatewayV2::Api": ("apigatewayv2", "Api"),
+    "AWS::ApiGatewayV2::ApiMapping": ("apigatewayv2", "ApiMapping"),
+    "AWS::ApiGatewayV2::Authorizer": ("apigatewayv2", "Authorizer"),
+    "AWS::ApiGatewayV2::Deployment": ("apigatewayv2", "Deployment"),
+    "AWS::ApiGatewayV2::DomainName": ("apigatewayv2", "DomainName"),
+    "AWS::ApiGatewayV2::Integration": ("apigatewayv2", "Integration"),
+    "AWS::ApiGatewayV2::IntegrationResponse": ("apigatewayv2", "IntegrationResponse"),
+    "AWS::ApiGatewayV2::Model": ("apigatewayv2", "Model"),
+    "AWS::ApiGatewayV2::Route": ("apigatewayv2", "Route"),
+    "AWS::ApiGatewayV2::RouteResponse": ("apigatewayv2", "RouteResponse"),
+    "AWS::ApiGatewayV2::Stage": ("apigatewayv2", "Stage"),
+    "AWS::AppMesh::Mesh": ("appmesh", "Mesh"),
+    "AWS::AppMesh::Route": ("appmesh", "Route"),
+    "AWS::AppMesh::VirtualNode": ("appmesh", "VirtualNode"),
+    "AWS::AppMesh::VirtualRouter": ("appmesh", "VirtualRouter"),
+    "AWS::AppMesh::VirtualService": ("appmesh", "VirtualService"),
+    "AWS::AppStream::DirectoryConfig": ("appstream", "DirectoryConfig"),
+    "AWS::AppStream::Fleet": ("appstream", "Fleet"),
+    "AWS::AppStream::ImageBuilder": ("appstream", "ImageBuilder"),
+    "AWS::AppStream::Stack": ("appstream", "Stack"),
+    "AWS::AppStream::StackFleetAssociation": ("appstream", "StackFleetAssociation"),
+    "AWS::AppStream::StackUserAssociation": ("appstream", "StackUserAssociation"),
+    "AWS::AppStream::User": ("appstream", "User"),
+    "AWS::AppSync::ApiCache": ("appsync", "ApiCache"),
+    "AWS::AppSync::ApiKey": ("appsync", "ApiKey"),
+    "AWS::AppSync::DataSource": ("appsync", "DataSource"),
+    "AWS::AppSync::FunctionConfiguration": ("appsync", "FunctionConfiguration"),
+    "AWS::AppSync::GraphQLApi": ("appsync", "GraphQLApi"),
+    "AWS::AppSync::GraphQLSchema": ("appsync", "GraphQLSchema"),
+    "AWS::AppSync::Resolver": ("appsync", "Resolver"),
+    "AWS::ApplicationAutoScaling::ScalableTarget": (
+        "applicationautoscaling",
+        "ScalableTarget",
+    ),
+    "AWS::ApplicationAutoScaling::ScalingPolicy": (
+        "applicationautoscaling",
+        "ScalingPolicy",
+    ),
+    "AWS::Athena::NamedQuery": ("athena", "NamedQuery"),
+    "AWS::AutoScaling::AutoScalingGroup": ("autoscaling", "AutoScalingGroup"),
+    "AWS::AutoScaling::LaunchConfiguration": ("autoscaling", "LaunchConfiguration"),
+    "AWS::AutoScaling::LifecycleHook": ("autoscaling", "LifecycleHook"),
+    "AWS::AutoScaling::ScalingPolicy": ("autoscaling", "ScalingPolicy"),
+    "AWS::AutoScaling::ScheduledAction": ("autoscaling", "ScheduledAction"),
+    "AWS::AutoScalingPlans::ScalingPlan": ("autoscalingplans", "ScalingPlan"),
+    "AWS::Backup::BackupPlan": ("backup", "BackupPlan"),
+    "AWS::Backup::BackupSelection": ("backup", "BackupSelection"),
+    "AWS::Backup::BackupVault": ("backup", "BackupVault"),
+    "AWS::Batch::ComputeEnvironment": ("batch", "ComputeEnvironment"),
+    "AWS::Batch::JobDefinition": ("batch", "JobDefinition"),
+    "AWS::Batch::JobQueue": ("batch", "JobQueue"),
+    "AWS::Budgets::Budget": ("budgets", "Budget"),
+    "AWS::CertificateManager::Certificate": ("certificatemanager", "Certificate"),
+    "AWS::Cloud9::EnvironmentEC2": ("cloud9", "EnvironmentEC2"),
+    "AWS::CloudFormation::CustomResource": ("cloudformation", "CustomResource"),
+    "AWS::CloudFormation::Macro": ("cloudformation", "Macro"),
+    "AWS::CloudFormation::Stack": ("cloudformation", "Stack"),
+    "AWS::CloudFormation::WaitCondition": ("cloudformation", "WaitCondition"),
+    "AWS::CloudFormation::WaitConditionHandle": (
+        "cloudformation",
+        "WaitConditionHandle",
+    ),
+    "AWS::CloudFront::CloudFrontOriginAccessIdentity": (
+        "cloudfront",
+        "CloudFrontOriginAccessIdentity",
+    ),
+    "AWS::CloudFront::Distribution": ("cloudfront", "Distribution"),
+    "AWS::CloudFront::StreamingDistribution": ("cloudfront", "StreamingDistribution"),
+    "AWS::CloudTrail::Trail": ("cloudtrail", "Trail"),
+    "AWS::CloudWatch::Alarm": ("cloudwatch", "Alarm"),
+    "AWS::CloudWatch::AnomalyDetector": ("cloudwatch", "AnomalyDetector"),
+    "AWS::CloudWatch::Dashboard": ("cloudwatch", "Dashboard"),
+    "AWS::CloudWatch::InsightRule": ("cloudwatch", "InsightRule"),
+    "AWS::CodeBuild::Project": ("codebuild", "Project"),
+    "AWS::CodeBuild::ReportGroup": ("codebuild", "ReportGroup"),
+    "AWS::CodeBuild::SourceCredential": ("codebuild", "SourceCredential"),
+    "AWS::CodeCommit::Repository": ("codecommit", "Repository"),
+    "AWS::CodeDeploy::Application": ("codedeploy", "Application"),
+    "AWS::CodeDeploy::DeploymentConfig": ("codedeploy", "DeploymentConfig"),
+    "AWS::CodeDeploy::DeploymentGroup": ("codedeploy", "DeploymentGroup"),
+    "AWS::CodePipeline::CustomActionType": ("codepipeline", "CustomActionType"),
+    "AWS::CodePipeline::Pipeline": ("codepipeline", "Pipeline"),
+    "AWS::CodePipeline::Webhook": ("codepipeline", "Webhook"),
+    "AWS::CodeStar::GitHubRepository": ("codestar", "GitHubRepository"),
+    "AWS::CodeStarNotifications::NotificationRule": (
+        "codestarnotifications",
+        "NotificationRule",
+    ),
+    "AWS::Cognito::IdentityPool": ("cognito", "IdentityPool"),
+    "AWS::Cognito::IdentityPoolRoleAttachment": (
+        "cognito",
+        "IdentityPoolRoleAttachment",
+    ),
+    "AWS::Cognito::UserPool": ("cognito", "UserPool"),
+    "AWS::Cognito::UserPoolClient": ("cognito", "UserPoolClient"),
+    "AWS::Cognito::UserPoolDomain": ("cognito", "UserPoolDomain"),
+    "AWS::Cognito::UserPoolGroup": ("cognito", "UserPoolGroup"),
+    "AWS::Cognito::UserPoolIdentityProvider": ("cognito", "UserPoolIdentityProvider"),
+    "AWS::Cognito::UserPoolResourceServer": ("cognito", "UserPoolResourceServer"),
+    "AWS::Cognito::UserPoolRiskConfigurationAttachment": (
+        "cognito",
+        "UserPoolRiskConfigurationAttachment",
+    ),
+    "AWS::Cognito::UserPoolUICustomizationAttachment": (
+        "cognito",
+        "UserPoolUICustomizationAttachment",
+    ),
+    "AWS::Cognito::UserPoolUser": ("cognito", "UserPoolUser"),
+    "AWS::Cognito::UserPoolUserToGroupAttachment": (
+        "cognito",
+        "UserPoolUserToGroupAttachment",
+    ),
+    "AWS::Config::AggregationAuthorization": ("config", "AggregationAuthorization"),
+    "AWS::Config::ConfigRule": ("config", "ConfigRule"),
+    "AWS::Config::ConfigurationAggregator": ("config", "ConfigurationAggregator"),
+    "AWS::Config::ConfigurationRecorder": ("config", "ConfigurationRecorder"),
+    "AWS::Config::DeliveryChannel": ("config", "DeliveryChannel"),
+    "AWS::Config::OrganizationConfigRule": ("config", "OrganizationConfigRule"),
+    "AWS::Config::RemediationConfiguration": ("config", "RemediationConfiguration"),
+    "AWS::DAX::Cluster": ("dax", "Cluster"),
+    "AWS::DAX::ParameterGroup": ("dax", "ParameterGroup"),
+    "AWS::DAX::SubnetGroup": ("dax", "SubnetGroup"),
+    "AWS::DLM::LifecyclePolicy": ("dlm", "LifecyclePolicy"),
+    "AWS::DMS::Certificate": ("dms", "Certificate"),
+    "AWS::DMS::Endpoint": ("dms", "Endpoint"),
+    "AWS::DMS::EventSubscription": ("dms", "EventSubscription"),
+    "AWS::DMS::ReplicationInstance": ("dms", "ReplicationInstance"),
+    "AWS::DMS::ReplicationSubnetGroup": ("dms", "ReplicationSubnetGroup"),
+    "AWS::DMS::ReplicationTask": ("dms", "ReplicationTask"),
+    "AWS::DataPipeline::Pipeline": ("datapipeline", "Pipeline"),
+    "AWS::DirectoryService::MicrosoftAD": ("directoryservice", "MicrosoftAD"),
+    "AWS::DirectoryService::SimpleAD": ("directoryservice", "SimpleAD"),
+    "AWS::DocDB::DBCluster": ("docdb", "DBCluster"),
+    "AWS::DocDB::DBClusterParameterGroup": ("docdb", "DBClusterParameterGroup"),
+    "AWS::DocDB::DBInstance": ("docdb", "DBInstance"),
+    "AWS::DocDB::DBSubnetGroup": ("docdb", "DBSubnetGroup"),
+    "AWS::DynamoDB::Table": ("dynamodb", "Table"),
+    "AWS::EC2::CapacityReservation": ("ec2", "CapacityReservation"),
+    "AWS::EC2::ClientVpnAuthorizationRule": ("ec2", "ClientVpnAuthorizationRule"),
+    "AWS::EC2::ClientVpnEndpoint": ("ec2", "ClientVpnEndpoint"),
+    "AWS::EC2::ClientVpnRoute": ("ec2", "ClientVpnRoute"),
+    "AWS::EC2::ClientVpnTargetNetworkAssociation": (
+        "ec2",
+        "ClientVpnTargetNetworkAssociation",
+    ),
+    "AWS::EC2::CustomerGateway": ("ec2", "CustomerGateway"),
+    "AWS::EC2::DHCPOptions": ("ec2", "DHCPOptions"),
+    "AWS::EC2::EC2Fleet": ("ec2", "EC2Fleet"),
+    "AWS::EC2::EIP": ("ec2", "EIP"),
+    "AWS::EC2::EIPAssociation": ("ec2", "EIPAssociation"),
+    "AWS::EC2::EgressOnlyInternetGateway": ("ec2", "EgressOnlyInternetGateway"),
+    "AWS::EC2::FlowLog": ("ec2", "FlowLog"),
+    "AWS::EC2::GatewayRouteTableAssociation": ("ec2", "GatewayRouteTableAssociation"),
+    "AWS::EC2::Host": ("ec2", "Host"),
+    "AWS::EC2::Instance": ("ec2", "Instance"),
+    "AWS::EC2::InternetGateway": ("ec2", "InternetGateway"),
+    "AWS::EC2::LaunchTemplate": ("ec2", "LaunchTemplate"),
+    "AWS::EC2::NatGateway": ("ec2", "NatGateway"),
+    "AWS::EC2::NetworkAcl": ("ec2", "NetworkAcl"),
+    "AWS::EC2::NetworkAclEntry": ("ec2", "NetworkAclEntry"),
+    "AWS::EC2::NetworkInterface": ("ec2", "NetworkInterface"),
+    "AWS::EC2::NetworkInterfaceAttachment": ("ec2", "NetworkInterfaceAttachment"),
+    "AWS::EC2::NetworkInterfacePermission": ("ec2", "NetworkInterfacePermission"),
+    "AWS::EC2::PlacementGroup": ("ec2", "PlacementGroup"),
+    "AWS::EC2::Route": ("ec2", "Route"),
+    "AWS::EC2::RouteTable": ("ec2", "RouteTable"),
+    "AWS::EC2::SecurityGroup": ("ec2", "SecurityGroup"),
+    "AWS::EC2::SecurityGroupEgress": ("ec2", "SecurityGroupEgress"),
+    "AWS::EC2::SecurityGroupIngress": ("ec2", "SecurityGroupIngress"),
+    "AWS::EC2::SpotFleet": ("ec2", "SpotFleet"),
+    "AWS::EC2::Subnet": ("ec2", "Subnet"),
+    "AWS::EC2::SubnetCidrBlock": ("ec2", "SubnetCidrBlock"),
+    "AWS::EC2::SubnetNetworkAclAssociation": ("ec2", "SubnetNetworkAclAssociation"),
+    "AWS::EC2::SubnetRouteTableAssociation": ("ec2", "SubnetRouteTableAssociation"),
+    "AWS::EC2::TrafficMirrorFilter": ("ec2", "TrafficMirrorFilter"),
+    "AWS::EC2::TrafficMirrorFilterRule": ("ec2", "TrafficMirrorFilterRule"),
+    "AWS::EC2::TrafficMirrorSession": ("ec2", "TrafficMirrorSession"),
+    "AWS::EC2::TrafficMirrorTarget": ("ec2", "TrafficMirrorTarget"),
+    "AWS::EC2::TransitGateway": ("ec2", "TransitGateway"),
+    "AWS::EC2::TransitGatewayAttachment": ("ec2", "TransitGatewayAttachment"),
+    "AWS::EC2::TransitGatewayRoute": ("ec2", "TransitGatewayRoute"),
+    "AWS::EC2::TransitGatewayRouteTable": ("ec2", "TransitGatewayRouteTable"),
+    "AWS::EC2::TransitGatewayRouteTableAssociation": (
+        "ec2",
+        "TransitGatewayRouteTableAssociation",
+    ),
+    "AWS::EC2::TransitGatewayRouteTablePropagation": (
+        "ec2",
+        "TransitGatewayRouteTablePropagation",
+    ),
+    "AWS::EC2::VPC": ("ec2", "VPC"),
+    "AWS::EC2::VPCCidrBlock": ("ec2", "VPCCidrBlock"),
+    "AWS::EC2::VPCDHCPOptionsAssociation": ("ec2", "VPCDHCPOptionsAssociation"),
+    "AWS::EC2::VPCEndpoint": ("ec2", "VPCEndpoint"),
+    "AWS::EC2::VPCEndpointConnectionNotification": (
+        "ec2",
+        "VPCEndpointConnectionNotification",
+    ),
+    "AWS::EC2::VPCEndpointService": ("ec2", "VPCEndpointService"),
+    "AWS::EC2::VPCEndpointServicePermissions": ("ec2", "VPCEndpointServicePermissions"),
+    "AWS::EC2::VPCGatewayAttachment": ("ec2", "VPCGatewayAttachment"),
+    "AWS::EC2::VPCPeeringConnection": ("ec2", "VPCPeeringConnection"),
+    "AWS::EC2::VPNConnection": ("ec2", "VPNConnection"),
+    "AWS::EC2::VPNConnectionRoute": ("ec2", "VPNConnectionRoute"),
+    "AWS::EC2::VPNGateway": ("ec2", "VPNGateway"),
+    "AWS::EC2::VPNGatewayRoutePropagation": ("ec2", "VPNGatewayRoutePropagation"),
+    "AWS::EC2::Volume": ("ec2", "Volume"),
+    "AWS::EC2::VolumeAttachment": ("ec2", "VolumeAttachment"),
+    "AWS::ECR::Repository": ("ecr", "Repository"),
+    "AWS::ECS::Cluster": ("ecs", "Cluster"),
+    "AWS::ECS::PrimaryTaskSet": ("ecs", "PrimaryTaskSet"),
+    "AWS::ECS::Service": ("ecs", "Service"),
+    "AWS::ECS::TaskDefinition": ("ecs", "TaskDefinition"),
+    "AWS::ECS::TaskSet": ("ecs", "TaskSet"),
+    "AWS::EFS::FileSystem": ("efs", "FileSystem"),
+    "AWS::EFS::MountTarget": ("efs", "MountTarget"),
+    "AWS::EKS::Cluster": ("eks", "Cluster"),
+    "AWS::EKS::Nodegroup": ("eks", "Nodegroup"),
+    "AWS::EMR::Cluster": ("emr", "Cluster"),
+    "AWS::EMR::InstanceFleetConfig": ("emr", "InstanceFleetConfig"),
+    "AWS::EMR::InstanceGroupConfig": ("emr", "InstanceGroupConfig"),
+    "AWS::EMR::SecurityConfiguration": ("emr", "SecurityConfiguration"),
+    "AWS::EMR::Step": ("emr", "Step"),
+    "AWS::ElastiCache::CacheCluster": ("elasticache", "CacheCluster"),
+    "AWS::ElastiCache::ParameterGroup": ("elasticache", "ParameterGroup"),
+    "AWS::ElastiCache::ReplicationGroup": ("elasticache", "ReplicationGroup"),
+    "AWS::ElastiCache::SecurityGroup": ("elasticache", "SecurityGroup"),
+    "AWS::ElastiCache::SecurityGroupIngress": ("elasticache", "SecurityGroupIngress"),
+    "AWS::ElastiCache::SubnetGroup": ("elasticache", "SubnetGroup"),
+    "AWS::ElasticBeanstalk::Application": ("elasticbeanstalk", "Application"),
+    "AWS::ElasticBeanstalk::ApplicationVersion": (
+        "elasticbeanstalk",
+        "ApplicationVersion",
+    ),
+    "AWS::ElasticBeanstalk::ConfigurationTemplate": (
+        "elasticbeanstalk",
+        "ConfigurationTemplate",
+    ),
+    "AWS::ElasticBeanstalk::Environment": ("elasticbeanstalk", "Environment"),
+    "AWS::ElasticLoadBalancing::LoadBalancer": ("elasticloadbalancing", "LoadBalancer"),
+    "AWS::ElasticLoadBalancingV2::Listener": ("elasticloadbalancingv2", "Listener"),
+    "AWS::ElasticLoadBalancingV2::ListenerCertificate": (
+        "elasticloadbalancingv2",
+        "ListenerCertificate",
+    ),
+    "AWS::ElasticLoadBalancingV2::ListenerRule": (
+        "elasticloadbalancingv2",
+        "ListenerRule",
+    ),
+    "AWS::ElasticLoadBalancingV2::LoadBalancer": (
+        "elasticloadbalancingv2",
+        "LoadBalancer",
+    ),
+    "AWS::ElasticLoadBalancingV2::TargetGroup": (
+        "elasticloadbalancingv2",
+        "TargetGroup",
+    ),
+    "AWS::Elasticsearch::Domain": ("elasticsearch", "Domain"),
+    "AWS::EventSchemas::Discoverer": ("eventschemas", "Discoverer"),
+    "AWS::EventSchemas::Registry": ("eventschemas", "Registry"),
+    "AWS::EventSchemas::Schema": ("eventschemas", "Schema"),
+    "AWS::Events::EventBus": ("events", "EventBus"),
+    "AWS::Events::EventBusPolicy": ("events", "EventBusPolicy"),
+    "AWS::Events::Rule": ("events", "Rule"),
+    "AWS::FSx::FileSystem": ("fsx", "FileSystem"),
+    "AWS::GameLift::Alias": ("gamelift", "Alias"),
+    "AWS::GameLift::Build": ("gamelift", "Build"),
+    "AWS::GameLift::Fleet": ("gamelift", "Fleet"),
+    "AWS::GameLift::GameSessionQueue": ("gamelift", "GameSessionQueue"),
+    "AWS::GameLift::MatchmakingConfiguration": ("gamelift", "MatchmakingConfiguration"),
+    "AWS::GameLift::MatchmakingRuleSet": ("gamelift", "MatchmakingRuleSet"),
+    "AWS::GameLift::Script": ("gamelift", "Script"),
+    "AWS::Glue::Classifier": ("glue", "Classifier"),
+    "AWS::Glue::Connection": ("glue", "Connection"),
+    "AWS::Glue::Crawler": ("glue", "Crawler"),
+    "AWS::Glue::DataCatalogEncryptionSettings": (
+        "glue",
+        "DataCatalogEncryptionSettings",
+    ),
+    "AWS::Glue::Database": ("glue", "Database"),
+    "AWS::Glue::DevEndpoint": ("glue", "DevEndpoint"),
+    "AWS::Glue::Job": ("glue", "Job"),
+    "AWS::Glue::MLTransform": ("glue", "MLTransform"),
+    "AWS::Glue::Partition": ("glue", "Partition"),
+    "AWS::Glue::SecurityConfiguration": ("glue", "SecurityConfiguration"),
+    "AWS::Glue::Table": ("glue", "Table"),
+    "AWS::Glue::Trigger": ("glue", "Trigger"),
+    "AWS::Glue::Workflow": ("glue", "Workflow"),
+    "AWS::Greengrass::ConnectorDefinition": ("greengrass", "ConnectorDefinition"),
+    "AWS::Greengrass::ConnectorDefinitionVersion": (
+        "greengrass",
+        "ConnectorDefinitionVersion",
+    ),
+    "AWS::Greengrass::CoreDefinition": ("greengrass", "CoreDefinition"),
+    "AWS::Greengrass::CoreDefinitionVersion": ("greengrass", "CoreDefinitionVersion"),
+    "AWS::Greengrass::DeviceDefinition": ("greengrass", "DeviceDefinition"),
+    "AWS::Greengrass::DeviceDefinitionVersion": (
+        "greengrass",
+        "DeviceDefinitionVersion",
+    ),
+    "AWS::Greengrass::FunctionDefinition": ("greengrass", "FunctionDefinition"),
+    "AWS::Greengrass::FunctionDefinitionVersion": (
+        "greengrass",
+        "FunctionDefinitionVersion",
+    ),
+    "AWS::Greengrass::Group": ("greengrass", "Group"),
+    "AWS::Greengrass::GroupVersion": ("greengrass", "GroupVersion"),
+    "AWS::Greengrass::LoggerDefinition": ("greengrass", "LoggerDefinition"),
+    "AWS::Greengrass::LoggerDefinitionVersion": (
+        "greengrass",
+        "LoggerDefinitionVersion",
+    ),
+    "AWS::Greengrass::ResourceDefinition": ("greengrass", "ResourceDefinition"),
+    "AWS::Greengrass::ResourceDefinitionVersion": (
+        "greengrass",
+        "ResourceDefinitionVersion",
+    ),
+    "AWS::Greengrass::SubscriptionDefinition": ("greengrass", "SubscriptionDefinition"),
+    "AWS::Greengrass::SubscriptionDefinitionVersion": (
+        "greengrass",
+        "SubscriptionDefinitionVersion",
+    ),
+    "AWS::GuardDuty::Detector": ("guardduty", "Detector"),
+    "AWS::GuardDuty::Filter": ("guardduty", "Filter"),
+    "AWS::GuardDuty::IPSet": ("guardduty", "IPSet"),
+    "AWS::GuardDuty::Master": ("guardduty", "Master"),
+    "AWS::GuardDuty::Member": ("guardduty", "Member"),
+    "AWS::GuardDuty::ThreatIntelSet": ("guardduty", "ThreatIntelSet"),
+    "AWS::IAM::AccessKey": ("iam", "AccessKey"),
+    "AWS::IAM::Group": ("iam", "Group"),
+    "AWS::IAM::InstanceProfile": ("iam", "InstanceProfile"),
+    "AWS::IAM::ManagedPolicy": ("iam", "ManagedPolicy"),
+    "AWS::IAM::Policy": ("iam", "Policy"),
+    "AWS::IAM::Role": ("iam", "Role"),
+    "AWS::IAM::ServiceLinkedRole": ("iam", "ServiceLinkedRole"),
+    "AWS::IAM::User": ("iam", "User"),
+    "AWS::IAM::UserToGroupAddition": ("iam", "UserToGroupAddition"),
+    "AWS::Inspector::AssessmentTarget": ("inspector", "AssessmentTarget"),
+    "AWS::Inspector::AssessmentTemplate": ("inspector", "AssessmentTemplate"),
+    "AWS::Inspector::ResourceGroup": ("inspector", "ResourceGroup"),
+    "AWS::IoT1Click::Device": ("iot1click", "Device"),
+    "AWS::IoT1Click::Placement": ("iot1click", "Placement"),
+    "AWS::IoT1Click::Project": ("iot1click", "Project"),
+    "AWS::IoT::Certificate": ("iot", "Certificate"),
+    "AWS::IoT::Policy": ("iot", "Policy"),
+    "AWS::IoT::PolicyPrincipalAttachment": ("iot", "PolicyPrincipalAttachment"),
+    "AWS::IoT::Thing": ("iot", "Thing"),
+    "AWS::IoT::ThingPrincipalAttachment": ("iot", "ThingPrincipalAttachment"),
+    "AWS::IoT::TopicRule": ("iot", "TopicRule"),
+    "AWS::IoTAnalytics::Channel": ("iotanalytics", "Channel"),
+    "AWS::IoTAnalytics::Dataset": ("iotanalytics", "Dataset"),
+    "AWS::IoTAnalytics::Datastore": ("iotanalytics", "Datastore"),
+    "AWS::IoTAnalytics::Pipeline": ("iotanalytics", "Pipeline"),
+    "AWS::IoTEvents::DetectorModel": ("iotevents", "DetectorModel"),
+    "AWS::IoTEvents::Input": ("iotevents", "Input"),
+    "AWS::IoTThingsGraph::FlowTemplate": ("iotthingsgraph", "FlowTemplate"),
+    "AWS::KMS::Alias": ("kms", "Alias"),
+    "AWS::KMS::Key": ("kms", "Key"),
+    "AWS::Kinesis::Stream": ("kinesis", "Stream"),
+    "AWS::Kinesis::StreamConsumer": ("kinesis", "StreamConsumer"),
+    "AWS::KinesisAnalytics::Application": ("kinesisanalytics", "Application"),
+    "AWS::KinesisAnalytics::ApplicationOutput": (
+        "kinesisanalytics",
+        "ApplicationOutput",
+    ),
+    "AWS::KinesisAnalytics::ApplicationReferenceDataSource": (
+        "kinesisanalytics",
+        "ApplicationReferenceDataSource",
+    ),
+    "AWS::KinesisAnalyticsV2::Application": ("kinesisanalyticsv2", "Application"),
+    "AWS::KinesisAnalyticsV2::ApplicationCloudWatchLoggingOption": (
+        "kinesisanalyticsv2",
+        "ApplicationCloudWatchLoggingOption",
+    ),
+    "AWS::KinesisAnalyticsV2::ApplicationOutput": (
+        "kinesisanalyticsv2",
+        "ApplicationOutput",
+    ),
+    "AWS::KinesisAnalyticsV2::ApplicationReferenceDataSource": (
+        "kinesisanalyticsv2",
+        "ApplicationReferenceDataSource",
+    ),
+    "AWS::KinesisFirehose::DeliveryStream": ("kinesisfirehose", "DeliveryStream"),
+    "AWS::LakeFormation::DataLakeSettings": ("lakeformation", "DataLakeSettings"),
+    "AWS::LakeFormation::Permissions": ("lakeformation", "Permissions"),
+    "AWS::LakeFormation::Resource": ("lakeformation", "Resource"),
+    "AWS::Lambda::Alias": ("lambda_", "Alias"),
+    "AWS::Lambda::EventInvokeConfig": ("lambda_", "EventInvokeConfig"),
+    "AWS::Lambda::EventSourceMapping": ("lambda_", "EventSourceMapping"),
+    "AWS::Lambda::Function": ("lambda_", "Function"),
+    "AWS::Lambda::LayerVersion": ("lambda_", "LayerVersion"),
+    "AWS::Lambda::LayerVersionPermission": ("lambda_", "LayerVersionPermission"),
+    "AWS::Lambda::Permission": ("lambda_", "Permission"),
+    "AWS::Lambda::Version": ("lambda_", "Version"),
+    "AWS::Logs::Destination": ("logs", "Destination"),
+    "AWS::Logs::LogGroup": ("logs", "LogGroup"),
+    "AWS::Logs::LogStream": ("logs", "LogStream"),
+    "AWS::Logs::MetricFilter": ("logs", "MetricFilter"),
+    "AWS::Logs::SubscriptionFilter": ("logs", "SubscriptionFilter"),
+    "AWS::MSK::Cluster": ("msk", "Cluster"),
+    "AWS::ManagedBlockchain::Member": ("managedblockchain", "Member"),
+    "AWS::ManagedBlockchain::Node": ("managedblockchain", "Node"),
+    "AWS::MediaConvert::JobTemplate": ("mediaconvert", "JobTemplate"),
+    "AWS::MediaConvert::Preset": ("mediaconvert", "Preset"),
+    "AWS::MediaConvert::Queue": ("mediaconvert", "Queue"),
+    "AWS::MediaLive::Channel": ("medialive", "Channel"),
+    "AWS::MediaLive::Input": ("medialive", "Input"),
+    "AWS::MediaLive::InputSecurityGroup": ("medialive", "InputSecurityGroup"),
+    "AWS::MediaStore::Container": ("mediastore", "Container"),
+    "AWS::Neptune::DBCluster": ("neptune", "DBCluster"),
+    "AWS::Neptune::DBClusterParameterGroup": ("neptune", "DBClusterParameterGroup"),
+    "AWS::Neptune::DBInstance": ("neptune", "DBInstance"),
+    "AWS::Neptune::DBParameterGroup": ("neptune", "DBParameterGroup"),
+    "AWS::Neptune::DBSubnetGroup": ("neptune", "DBSubnetGroup"),
+    "AWS::OpsWorks::App": ("opsworks", "App"),
+    "AWS::OpsWorks::ElasticLoadBalancerAttachment": (
+        "opsworks",
+        "ElasticLoadBalancerAttachment",
+    ),
+    "AWS::OpsWorks::Instance": ("opsworks", "Instance"),
+    "AWS::OpsWorks::Layer": ("opsworks", "Layer"),
+    "AWS::OpsWorks::Stack": ("opsworks", "Stack"),
+    "AWS::OpsWorks::UserProfile": ("opsworks", "UserProfile"),
+    "AWS::OpsWorks::Volume": ("opsworks", "Volume"),
+    "AWS::OpsWorksCM::Server": ("opsworkscm", "Server"),
+    "AWS::Pinpoint::ADMChannel": ("pinpoint", "ADMChannel"),
+    "AWS::Pinpoint::APNSChannel": ("pinpoint", "APNSChannel"),
+    "AWS::Pinpoint::APNSSandboxChannel": ("pinpoint", "APNSSandboxChannel"),
+    "AWS::Pinpoint::APNSVoipChannel": ("pinpoint", "APNSVoipChannel"),
+    "AWS::Pinpoint::APNSVoipSandboxChannel": ("pinpoint", "APNSVoipSandboxChannel"),
+    "AWS::Pinpoint::App": ("pinpoint", "App"),
+    "AWS::Pinpoint::ApplicationSettings": ("pinpoint", "ApplicationSettings"),
+    "AWS::Pinpoint::BaiduChannel": ("pinpoint", "BaiduChannel"),
+    "AWS::Pinpoint::Campaign": ("pinpoint", "Campaign"),
+    "AWS::Pinpoint::EmailChannel": ("pinpoint", "EmailChannel"),
+    "AWS::Pinpoint::EmailTemplate": ("pinpoint", "EmailTemplate"),
+    "AWS::Pinpoint::EventStream": ("pinpoint", "EventStream"),
+    "AWS::Pinpoint::GCMChannel": ("pinpoint", "GCMChannel"),
+    "AWS::Pinpoint::PushTemplate": ("pinpoint", "PushTemplate"),
+    "AWS::Pinpoint::SMSChannel": ("pinpoint", "SMSChannel"),
+    "AWS::Pinpoint::Segment": ("pinpoint", "Segment"),
+    "AWS::Pinpoint::SmsTemplate": ("pinpoint", "SmsTemplate"),
+    "AWS::Pinpoint::VoiceChannel": ("pinpoint", "VoiceChannel"),
+    "AWS::PinpointEmail::ConfigurationSet": ("pinpointemail", "ConfigurationSet"),
+    "AWS::PinpointEmail::ConfigurationSetEventDestination": (
+        "pinpointemail",
+        "ConfigurationSetEventDestination",
+    ),
+    "AWS::PinpointEmail::DedicatedIpPool": ("pinpointemail", "DedicatedIpPool"),
+    "AWS::PinpointEmail::Identity": ("pinpointemail", "Identity"),
+    "AWS::QLDB::Ledger": ("qldb", "Ledger"),
+    "AWS::RAM::ResourceShare": ("ram", "ResourceShare"),
+    "AWS::RDS::DBCluster": ("rds", "DBCluster"),
+    "AWS::RDS::DBClusterParameterGroup": ("rds", "DBClusterParameterGroup"),
+    "AWS::RDS::DBInstance": ("rds", "DBInstance"),
+    "AWS::RDS::DBParameterGroup": ("rds", "DBParameterGroup"),
+    "AWS::RDS::DBSecurityGroup": ("rds", "DBSecurityGroup"),
+    "AWS::RDS::DBSecurityGroupIngress": ("rds", "DBSecurityGroupIngress"),
+    "AWS::RDS::DBSubnetGroup": ("rds", "DBSubnetGroup"),
+    "AWS::RDS::EventSubscription": ("rds", "EventSubscription"),
+    "AWS::RDS::OptionGroup": ("rds", "OptionGroup"),
+    "AWS::Redshift::Cluster": ("redshift", "Cluster"),
+    "AWS::Redshift::ClusterParameterGroup": ("redshift", "ClusterParameterGroup"),
+    "AWS::Redshift::ClusterSecurityGroup": ("redshift", "ClusterSecurityGroup"),
+    "AWS::Redshift::ClusterSecurityGroupIngress": (
+        "redshift",
+        "ClusterSecurityGroupIngress",
+    ),
+    "AWS::Redshift::ClusterSubnetGroup": ("redshift", "ClusterSubnetGroup"),
+    "AWS::RoboMaker::Fleet": ("robomaker", "Fleet"),
+    "AWS::RoboMaker::Robot": ("robomaker", "Robot"),
+    "AWS::RoboMaker::RobotApplication": ("robomaker", "RobotApplication"),
+    "AWS::RoboMaker::RobotApplicationVersion": ("robomaker", "RobotApplicationVersion"),
+    "AWS::RoboMaker::SimulationApplication": ("robomaker", "SimulationApplication"),
+    "AWS::RoboMaker::SimulationApplicationVersion": (
+        "robomaker",
+        "SimulationApplicationVersion",
+    ),
+    "AWS::Route53::HealthCheck": ("route53", "HealthCheck"),
+    "AWS::Route53::HostedZone": ("route53", "HostedZone"),
+    "AWS::Route53::RecordSet": ("route53", "RecordSet"),
+    "AWS::Route53::RecordSetGroup": ("route53", "RecordSetGroup"),
+    "AWS::Route53Resolver::ResolverEndpoint": ("route53resolver", "ResolverEndpoint"),
+    "AWS::Route53Resolver::ResolverRule": ("route53resolver", "ResolverRule"),
+    "AWS::Route53Resolver::ResolverRuleAssociation": (
+        "route53resolver",
+        "ResolverRuleAssociation",
+    ),
+    "AWS::S3::AccessPoint": ("s3", "AccessPoint"),
+    "AWS::S3::Bucket": ("s3", "Bucket"),
+    "AWS::S3::BucketPolicy": ("s3", "BucketPolicy"),
+    "AWS::SDB::Domain": ("sdb", "Domain"),
+    "AWS::SES::ConfigurationSet": ("ses", "ConfigurationSet"),
+    "AWS::SES::ConfigurationSetEventDestination": (
+        "ses",
+        "ConfigurationSetEventDestination",
+    ),
+    "AWS::SES::ReceiptFilter": ("ses", "ReceiptFilter"),
+    "AWS::SES::ReceiptRule": ("ses", "ReceiptRule"),
+    "AWS::SES::ReceiptRuleSet": ("ses", "ReceiptRuleSet"),
+    "AWS::SES::Template": ("ses", "Template"),
+    "AWS::SNS::Subscription": ("sns", "Subscription"),
+    "AWS::SNS::Topic": ("sns", "Topic"),
+    "AWS::SNS::TopicPolicy": ("sns", "TopicPolicy"),
+    "AWS::SQS::Queue": ("sqs", "Queue"),
+    "AWS::SQS::QueuePolicy": ("sqs", "QueuePolicy"),
+    "AWS::SSM::Association": ("ssm", "Association"),
+    "AWS::SSM::Document": ("ssm", "Document"),
+    "AWS::SSM::MaintenanceWindow": ("ssm", "MaintenanceWindow"),
+    "AWS::SSM::MaintenanceWindowTarget": ("ssm", "MaintenanceWindowTarget"),
+    "AWS::SSM::MaintenanceWindowTask": ("ssm", "MaintenanceWindowTask"),
+    "AWS::SSM::Parameter": ("ssm", "Parameter"),
+    "AWS::SSM::PatchBaseline": ("ssm", "PatchBaseline"),
+    "AWS::SSM::ResourceDataSync": ("ssm", "ResourceDataSync"),
+    "AWS::SageMaker::CodeRepository": ("sagemaker", "CodeRepository"),
+    "AWS::SageMaker::Endpoint": ("sagemaker", "Endpoint"),
+    "AWS::SageMaker::EndpointConfig": ("sagemaker", "EndpointConfig"),
+    "AWS::SageMaker::Model": ("sagemaker", "Model"),
+    "AWS::SageMaker::NotebookInstance": ("sagemaker", "NotebookInstance"),
+    "AWS::SageMaker::NotebookInstanceLifecycleConfig": (
+        "sagemaker",
+        "NotebookInstanceLifecycleConfig",
+    ),
+    "AWS::SageMaker::Workteam": ("sagemaker", "Workteam"),
+    "AWS::SecretsManager::ResourcePolicy": ("secretsmanager", "ResourcePolicy"),
+    "AWS::SecretsManager::RotationSchedule": ("secretsmanager", "RotationSchedule"),
+    "AWS::SecretsManager::Secret": ("secretsmanager", "Secret"),
+    "AWS::SecretsManager::SecretTargetAttachment": (
+        "secretsmanager",
+        "SecretTargetAttachment",
+    ),
+    "AWS::SecurityHub::Hub": ("securityhub", "Hub"),
+    "AWS::ServiceCatalog::AcceptedPortfolioShare": (
+        "servicecatalog",
+        "AcceptedPortfolioShare",
+    ),
+    "AWS::ServiceCatalog::CloudFormationProduct": (
+        "servicecatalog",
+        "CloudFormationProduct",
+    ),
+    "AWS::ServiceCatalog::CloudFormationProvisionedProduct": (
+        "servicecatalog",
+        "CloudFormationProvisionedProduct",
+    ),
+    "AWS::ServiceCatalog::LaunchNotificationConstraint": (
+        "servicecatalog",
+        "LaunchNotificationConstraint",
+    ),
+    "AWS::ServiceCatalog::LaunchRoleConstraint": (
+        "servicecatalog",
+        "LaunchRoleConstraint",
+    ),
+    "AWS::ServiceCatalog::LaunchTemplateConstraint": (
+        "servicecatalog",
+        "LaunchTemplateConstraint",
+    ),
+    "AWS::ServiceCatalog::Portfolio": ("servicecatalog", "Portfolio"),
+    "AWS::ServiceCatalog::PortfolioPrincipalAssociation": (
+        "servicecatalog",
+        "PortfolioPrincipalAssociation",
+    ),
+    "AWS::ServiceCatalog::PortfolioProductAssociation": (
+        "servicecatalog",
+        "PortfolioProductAssociation",
+    ),
+    "AWS::ServiceCatalog::PortfolioShare": ("servicecatalog", "PortfolioShare"),
+    "AWS::ServiceCatalog::ResourceUpdateConstraint": (
+        "servicecatalog",
+        "ResourceUpdateConstraint",
+    ),
+    "AWS::ServiceCatalog::StackSetConstraint": ("servicecatalog", "StackSetConstraint"),
+    "AWS::ServiceCatalog::TagOption": ("servicecatalog", "TagOption"),
+    "AWS::ServiceCatalog::TagOptionAssociation": (
+        "servicecatalog",
+        "TagOptionAssociation",
+    ),
+    "AWS::ServiceDiscovery::HttpNamespace": ("servicediscovery", "HttpNamespace"),
+    "AWS::ServiceDiscovery::Instance": ("servicediscovery", "Instance"),
+    "AWS::ServiceDiscovery::PrivateDnsNamespace": (
+        "servicediscovery",
+        "PrivateDnsNamespace",
+    ),
+    "AWS::ServiceDiscovery::PublicDnsNamespace": (
+        "servicediscovery",
+        "PublicDnsNamespace",
+    ),
+    "AWS::ServiceDiscovery::Service": ("servicediscovery", "Service"),
+    "AWS::StepFunctions::Activity": ("stepfunctions", "Activity"),
+    "AWS::StepFunctions::StateMachine": ("stepfunctions", "StateMachine"),
+    "AWS::Transfer::Server": ("transfer", "Server"),
+    "AWS::Transfer::User": ("transfer", "User"),
+    "AWS::WAF::ByteMatchSet": ("waf", "ByteMatchSet"),
+    "AWS::WAF::IPSet": ("waf", "IPSet"),
+    "AWS::WAF::Rule": ("waf", "Rule"),
+    "AWS::WAF::SizeConstraintSet": ("waf", "SizeConstraintSet"),
+    "AWS::WAF::SqlInjectionMatchSet": ("waf", "SqlInjectionMatchSet"),
+    "AWS::WAF::WebACL": ("waf", "WebACL"),
+    "AWS::WAF::XssMatchSet": ("waf", "XssMatchSet"),
+    "AWS::WAFRegional::ByteMatchSet": ("wafregional", "ByteMatchSet"),
+    "AWS::WAFRegional::GeoMatchSet": ("wafregional", "GeoMatchSet"),
+    "AWS::WAFRegional::IPSet": ("wafregional", "IPSet"),
+    "AWS::WAFRegional::RateBasedRule": ("wafregional", "RateBasedRule"),
+    "AWS::WAFRegional::RegexPatternSet": ("wafregional", "RegexPatternSet"),
+    "AWS::WAFRegional::Rule": ("wafregional", "Rule"),
+    "AWS::WAFRegional::SizeConstraintSet": ("wafregional", "SizeConstraintSet"),
+    "AWS::WAFRegional::SqlInjectionMatchSet": ("wafregional", "SqlInjectionMatchSet"),
+    "AWS::WAFRegional::WebACL": ("wafregional", "WebACL"),
+    "AWS::WAFRegional::WebACLAssociation": ("wafregional", "WebACLAssociation"),
+    "AWS::WAFRegional::XssMatchSet": ("wafregional", "XssMatchSet"),
+    "AWS::WAFv2::IPSet": ("wafv2", "IPSet"),
+    "AWS::WAFv2::RegexPatternSet": ("wafv2", "RegexPatternSet"),
+    "AWS::WAFv2::RuleGroup": ("wafv2", "RuleGroup"),
+    "AWS::WAFv2::WebACL": ("wafv2", "WebACL"),
+    "AWS::WorkSpaces::Workspace": ("workspaces", "Workspace"),
+}
@@ -7,37 +7,172 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Analyzer", "AnalyzerProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Analyzer",
+    "AnalyzerProperties",
+    "AnalyzerArchiveRule",
+    "AnalyzerFilter",
+]
 
-@attrs(**ATTRSCONFIG)
-class AnalyzerProperties(ResourceProperties):
-    AnalyzerName = attrib(default=None)
-    ArchiveRules = attrib(default=None)
-    Tags = attrib(default=None)
-    Type = attrib(default=None)
 
+def _create_Analyzer():
+    class AnalyzerFilter(_PropertyType):
+        """The Filter property type for Analyzer in AccessAnalyzer.
 
-@attrs(**ATTRSCONFIG)
-class Analyzer(Resource):
-    """A Analyzer for AccessAnalyzer.
+        See Also:
+            `AWS Cloud Formation documentation for Filter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-accessanalyzer-analyzer-filter.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Analyzer
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-accessanalyzer-analyzer.html>`_
-    """
+        __slots__ = ("Contains", "Eq", "Exists", "Neq", "Property")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AnalyzerFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::AccessAnalyzer::Analyzer"
+        def __init__(
+            self,
+            *,
+            Contains=None,
+            Eq=None,
+            Exists=None,
+            Neq=None,
+            Property=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Contains", Contains)
+            _setattr("Eq", Eq)
+            _setattr("Exists", Exists)
+            _setattr("Neq", Neq)
+            _setattr("Property", Property)
+            _init_PropertyType(self, kwargs)
 
-    Properties: AnalyzerProperties = attrib(
-        factory=AnalyzerProperties,
-        converter=create_object_converter(AnalyzerProperties),
+    _convert_AnalyzerFilter_list = create_object_list_converter(AnalyzerFilter)
+
+    class AnalyzerArchiveRule(_PropertyType):
+        """The Archive Rule property type for Analyzer in AccessAnalyzer.
+
+        See Also:
+            `AWS Cloud Formation documentation for ArchiveRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-accessanalyzer-analyzer-archiverule.html>`_
+        """
+
+        __slots__ = ("Filter", "RuleName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AnalyzerArchiveRule",
+            _PropertyType,
+            __slots__,
+            converters={"Filter": _convert_AnalyzerFilter_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Filter=None, RuleName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Filter", _convert_AnalyzerFilter_list(Filter))
+            _setattr("RuleName", RuleName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AnalyzerArchiveRule_list = create_object_list_converter(
+        AnalyzerArchiveRule
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class AnalyzerProperties(_ResourceProperties):
+        __slots__ = ("AnalyzerName", "ArchiveRules", "Tags", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AnalyzerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ArchiveRules": _convert_AnalyzerArchiveRule_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AnalyzerName=None,
+            ArchiveRules=None,
+            Tags=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AnalyzerName", AnalyzerName)
+            _setattr("ArchiveRules", _convert_AnalyzerArchiveRule_list(ArchiveRules))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AnalyzerProperties = create_object_converter(AnalyzerProperties)
+
+    class Analyzer(_Resource):
+        """A Analyzer for AccessAnalyzer.
+
+        See Also:
+            `AWS Cloud Formation documentation for Analyzer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-accessanalyzer-analyzer.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AccessAnalyzer::Analyzer"
+
+        Properties: AnalyzerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Analyzer",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AnalyzerProperties},
+            factories={"Properties": AnalyzerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AnalyzerProperties()
+            _setattr("Properties", _convert_AnalyzerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Analyzer, AnalyzerProperties, AnalyzerFilter, AnalyzerArchiveRule
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Analyzer": _create_Analyzer,
+        "AnalyzerProperties": _create_Analyzer,
+        "AnalyzerArchiveRule": _create_Analyzer,
+        "AnalyzerFilter": _create_Analyzer,
+    },
+)
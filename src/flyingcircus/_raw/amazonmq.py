@@ -7,105 +7,534 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Broker",
     "BrokerProperties",
+    "BrokerConfigurationId",
+    "BrokerEncryptionOptions",
+    "BrokerLogList",
+    "BrokerMaintenanceWindow",
+    "BrokerTagsEntry",
+    "BrokerUser",
     "Configuration",
     "ConfigurationProperties",
+    "ConfigurationTagsEntry",
     "ConfigurationAssociation",
     "ConfigurationAssociationProperties",
+    "ConfigurationAssociationConfigurationId",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class BrokerProperties(ResourceProperties):
-    AutoMinorVersionUpgrade = attrib(default=None)
-    BrokerName = attrib(default=None)
-    Configuration = attrib(default=None)
-    DeploymentMode = attrib(default=None)
-    EncryptionOptions = attrib(default=None)
-    EngineType = attrib(default=None)
-    EngineVersion = attrib(default=None)
-    HostInstanceType = attrib(default=None)
-    Logs = attrib(default=None)
-    MaintenanceWindowStartTime = attrib(default=None)
-    PubliclyAccessible = attrib(default=None)
-    SecurityGroups = attrib(default=None)
-    StorageType = attrib(default=None)
-    SubnetIds = attrib(default=None)
-    Tags = attrib(default=None)
-    Users = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Broker(Resource):
-    """A Broker for AmazonMQ.
-
-    See Also:
-        `AWS Cloud Formation documentation for Broker
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amazonmq-broker.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AmazonMQ::Broker"
-
-    Properties: BrokerProperties = attrib(
-        factory=BrokerProperties, converter=create_object_converter(BrokerProperties)
+def _create_Broker():
+    class BrokerConfigurationId(_PropertyType):
+        """The Configuration property type for Broker in AmazonMQ.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationId
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amazonmq-broker-configurationid.html>`_
+        """
+
+        __slots__ = ("Id", "Revision")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BrokerConfigurationId", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Id=None, Revision=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Revision", Revision)
+            _init_PropertyType(self, kwargs)
+
+    class BrokerEncryptionOptions(_PropertyType):
+        """The Encryption Options property type for Broker in AmazonMQ.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amazonmq-broker-encryptionoptions.html>`_
+        """
+
+        __slots__ = ("KmsKeyId", "UseAwsOwnedKey")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BrokerEncryptionOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, KmsKeyId=None, UseAwsOwnedKey=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("UseAwsOwnedKey", UseAwsOwnedKey)
+            _init_PropertyType(self, kwargs)
+
+    class BrokerLogList(_PropertyType):
+        """The Log List property type for Broker in AmazonMQ.
+
+        See Also:
+            `AWS Cloud Formation documentation for LogList
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amazonmq-broker-loglist.html>`_
+        """
+
+        __slots__ = ("Audit", "General")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BrokerLogList", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Audit=None, General=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Audit", Audit)
+            _setattr("General", General)
+            _init_PropertyType(self, kwargs)
+
+    class BrokerMaintenanceWindow(_PropertyType):
+        """The Maintenance Window property type for Broker in AmazonMQ.
+
+        See Also:
+            `AWS Cloud Formation documentation for MaintenanceWindow
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amazonmq-broker-maintenancewindow.html>`_
+        """
+
+        __slots__ = ("DayOfWeek", "TimeOfDay", "TimeZone")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BrokerMaintenanceWindow", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DayOfWeek=None, TimeOfDay=None, TimeZone=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DayOfWeek", DayOfWeek)
+            _setattr("TimeOfDay", TimeOfDay)
+            _setattr("TimeZone", TimeZone)
+            _init_PropertyType(self, kwargs)
+
+    class BrokerTagsEntry(_PropertyType):
+        """The Tags Entry property type for Broker in AmazonMQ.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagsEntry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amazonmq-broker-tagsentry.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BrokerTagsEntry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class BrokerUser(_PropertyType):
+        """The User property type for Broker in AmazonMQ.
+
+        See Also:
+            `AWS Cloud Formation documentation for User
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amazonmq-broker-user.html>`_
+        """
+
+        __slots__ = ("ConsoleAccess", "Groups", "Password", "Username")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BrokerUser", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConsoleAccess=None,
+            Groups=None,
+            Password=None,
+            Username=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConsoleAccess", ConsoleAccess)
+            _setattr("Groups", Groups)
+            _setattr("Password", Password)
+            _setattr("Username", Username)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BrokerConfigurationId = create_object_converter(BrokerConfigurationId)
+    _convert_BrokerEncryptionOptions = create_object_converter(BrokerEncryptionOptions)
+    _convert_BrokerLogList = create_object_converter(BrokerLogList)
+    _convert_BrokerMaintenanceWindow = create_object_converter(BrokerMaintenanceWindow)
+    _convert_BrokerTagsEntry_list = create_object_list_converter(BrokerTagsEntry)
+    _convert_BrokerUser_list = create_object_list_converter(BrokerUser)
+
+    class BrokerProperties(_ResourceProperties):
+        __slots__ = (
+            "AutoMinorVersionUpgrade",
+            "BrokerName",
+            "Configuration",
+            "DeploymentMode",
+            "EncryptionOptions",
+            "EngineType",
+            "EngineVersion",
+            "HostInstanceType",
+            "Logs",
+            "MaintenanceWindowStartTime",
+            "PubliclyAccessible",
+            "SecurityGroups",
+            "StorageType",
+            "SubnetIds",
+            "Tags",
+            "Users",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BrokerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Configuration": _convert_BrokerConfigurationId,
+                "EncryptionOptions": _convert_BrokerEncryptionOptions,
+                "Logs": _convert_BrokerLogList,
+                "MaintenanceWindowStartTime": _convert_BrokerMaintenanceWindow,
+                "Tags": _convert_BrokerTagsEntry_list,
+                "Users": _convert_BrokerUser_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoMinorVersionUpgrade=None,
+            BrokerName=None,
+            Configuration=None,
+            DeploymentMode=None,
+            EncryptionOptions=None,
+            EngineType=None,
+            EngineVersion=None,
+            HostInstanceType=None,
+            Logs=None,
+            MaintenanceWindowStartTime=None,
+            PubliclyAccessible=None,
+            SecurityGroups=None,
+            StorageType=None,
+            SubnetIds=None,
+            Tags=None,
+            Users=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoMinorVersionUpgrade", AutoMinorVersionUpgrade)
+            _setattr("BrokerName", BrokerName)
+            _setattr("Configuration", _convert_BrokerConfigurationId(Configuration))
+            _setattr("DeploymentMode", DeploymentMode)
+            _setattr(
+                "EncryptionOptions", _convert_BrokerEncryptionOptions(EncryptionOptions)
+            )
+            _setattr("EngineType", EngineType)
+            _setattr("EngineVersion", EngineVersion)
+            _setattr("HostInstanceType", HostInstanceType)
+            _setattr("Logs", _convert_BrokerLogList(Logs))
+            _setattr(
+                "MaintenanceWindowStartTime",
+                _convert_BrokerMaintenanceWindow(MaintenanceWindowStartTime),
+            )
+            _setattr("PubliclyAccessible", PubliclyAccessible)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr("StorageType", StorageType)
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("Tags", _convert_BrokerTagsEntry_list(Tags))
+            _setattr("Users", _convert_BrokerUser_list(Users))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_BrokerProperties = create_object_converter(BrokerProperties)
+
+    class Broker(_Resource):
+        """A Broker for AmazonMQ.
+
+        See Also:
+            `AWS Cloud Formation documentation for Broker
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amazonmq-broker.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AmazonMQ::Broker"
+
+        Properties: BrokerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Broker",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BrokerProperties},
+            factories={"Properties": BrokerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BrokerProperties()
+            _setattr("Properties", _convert_BrokerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Broker,
+        BrokerProperties,
+        BrokerConfigurationId,
+        BrokerEncryptionOptions,
+        BrokerLogList,
+        BrokerMaintenanceWindow,
+        BrokerTagsEntry,
+        BrokerUser,
+    )
+
+
+def _create_Configuration():
+    class ConfigurationTagsEntry(_PropertyType):
+        """The Tags Entry property type for Configuration in AmazonMQ.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagsEntry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amazonmq-configuration-tagsentry.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationTagsEntry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationTagsEntry_list = create_object_list_converter(
+        ConfigurationTagsEntry
     )
 
+    class ConfigurationProperties(_ResourceProperties):
+        __slots__ = (
+            "Data",
+            "Description",
+            "EngineType",
+            "EngineVersion",
+            "Name",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_ConfigurationTagsEntry_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Data=None,
+            Description=None,
+            EngineType=None,
+            EngineVersion=None,
+            Name=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Data", Data)
+            _setattr("Description", Description)
+            _setattr("EngineType", EngineType)
+            _setattr("EngineVersion", EngineVersion)
+            _setattr("Name", Name)
+            _setattr("Tags", _convert_ConfigurationTagsEntry_list(Tags))
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationProperties(ResourceProperties):
-    Data = attrib(default=None)
-    Description = attrib(default=None)
-    EngineType = attrib(default=None)
-    EngineVersion = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
+    _convert_ConfigurationProperties = create_object_converter(ConfigurationProperties)
 
+    class Configuration(_Resource):
+        """A Configuration for AmazonMQ.
 
-@attrs(**ATTRSCONFIG)
-class Configuration(Resource):
-    """A Configuration for AmazonMQ.
+        See Also:
+            `AWS Cloud Formation documentation for Configuration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amazonmq-configuration.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Configuration
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amazonmq-configuration.html>`_
-    """
+        RESOURCE_TYPE = "AWS::AmazonMQ::Configuration"
 
-    RESOURCE_TYPE = "AWS::AmazonMQ::Configuration"
+        Properties: ConfigurationProperties
 
-    Properties: ConfigurationProperties = attrib(
-        factory=ConfigurationProperties,
-        converter=create_object_converter(ConfigurationProperties),
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Configuration",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConfigurationProperties},
+            factories={"Properties": ConfigurationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigurationProperties()
+            _setattr("Properties", _convert_ConfigurationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Configuration, ConfigurationProperties, ConfigurationTagsEntry
+
+
+def _create_ConfigurationAssociation():
+    class ConfigurationAssociationConfigurationId(_PropertyType):
+        """The Configuration property type for ConfigurationAssociation in AmazonMQ.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationId
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amazonmq-configurationassociation-configurationid.html>`_
+        """
+
+        __slots__ = ("Id", "Revision")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationAssociationConfigurationId", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Id=None, Revision=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Revision", Revision)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationAssociationConfigurationId = create_object_converter(
+        ConfigurationAssociationConfigurationId
     )
 
+    class ConfigurationAssociationProperties(_ResourceProperties):
+        __slots__ = ("Broker", "Configuration")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationAssociationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Configuration": _convert_ConfigurationAssociationConfigurationId
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Broker=None, Configuration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Broker", Broker)
+            _setattr(
+                "Configuration",
+                _convert_ConfigurationAssociationConfigurationId(Configuration),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConfigurationAssociationProperties = create_object_converter(
+        ConfigurationAssociationProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationAssociationProperties(ResourceProperties):
-    Broker = attrib(default=None)
-    Configuration = attrib(default=None)
+    class ConfigurationAssociation(_Resource):
+        """A Configuration Association for AmazonMQ.
 
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amazonmq-configurationassociation.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationAssociation(Resource):
-    """A Configuration Association for AmazonMQ.
+        RESOURCE_TYPE = "AWS::AmazonMQ::ConfigurationAssociation"
 
-    See Also:
-        `AWS Cloud Formation documentation for ConfigurationAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amazonmq-configurationassociation.html>`_
-    """
+        Properties: ConfigurationAssociationProperties
 
-    RESOURCE_TYPE = "AWS::AmazonMQ::ConfigurationAssociation"
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConfigurationAssociationProperties},
+            factories={"Properties": ConfigurationAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ConfigurationAssociationProperties = attrib(
-        factory=ConfigurationAssociationProperties,
-        converter=create_object_converter(ConfigurationAssociationProperties),
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigurationAssociationProperties()
+            _setattr(
+                "Properties", _convert_ConfigurationAssociationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        ConfigurationAssociation,
+        ConfigurationAssociationProperties,
+        ConfigurationAssociationConfigurationId,
     )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Broker": _create_Broker,
+        "BrokerProperties": _create_Broker,
+        "BrokerConfigurationId": _create_Broker,
+        "BrokerEncryptionOptions": _create_Broker,
+        "BrokerLogList": _create_Broker,
+        "BrokerMaintenanceWindow": _create_Broker,
+        "BrokerTagsEntry": _create_Broker,
+        "BrokerUser": _create_Broker,
+        "Configuration": _create_Configuration,
+        "ConfigurationProperties": _create_Configuration,
+        "ConfigurationTagsEntry": _create_Configuration,
+        "ConfigurationAssociation": _create_ConfigurationAssociation,
+        "ConfigurationAssociationProperties": _create_ConfigurationAssociation,
+        "ConfigurationAssociationConfigurationId": _create_ConfigurationAssociation,
+    },
+)
@@ -7,105 +7,554 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "App",
     "AppProperties",
+    "AppAutoBranchCreationConfig",
+    "AppBasicAuthConfig",
+    "AppCustomRule",
+    "AppEnvironmentVariable",
     "Branch",
     "BranchProperties",
+    "BranchBasicAuthConfig",
+    "BranchEnvironmentVariable",
     "Domain",
     "DomainProperties",
+    "DomainSubDomainSetting",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AppProperties(ResourceProperties):
-    AccessToken = attrib(default=None)
-    AutoBranchCreationConfig = attrib(default=None)
-    BasicAuthConfig = attrib(default=None)
-    BuildSpec = attrib(default=None)
-    CustomRules = attrib(default=None)
-    Description = attrib(default=None)
-    EnvironmentVariables = attrib(default=None)
-    IAMServiceRole = attrib(default=None)
-    Name = attrib(default=None)
-    OauthToken = attrib(default=None)
-    Repository = attrib(default=None)
-    Tags = attrib(default=None)
+def _create_App():
+    class AppEnvironmentVariable(_PropertyType):
+        """The Environment Variable property type for App in Amplify.
+
+        See Also:
+            `AWS Cloud Formation documentation for EnvironmentVariable
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amplify-app-environmentvariable.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppEnvironmentVariable", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
+    class AppBasicAuthConfig(_PropertyType):
+        """The Basic Auth Config property type for App in Amplify.
 
-@attrs(**ATTRSCONFIG)
-class App(Resource):
-    """A App for Amplify.
+        See Also:
+            `AWS Cloud Formation documentation for BasicAuthConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amplify-app-basicauthconfig.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for App
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amplify-app.html>`_
-    """
+        __slots__ = ("EnableBasicAuth", "Password", "Username")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppBasicAuthConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Amplify::App"
+        def __init__(
+            self, *, EnableBasicAuth=None, Password=None, Username=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EnableBasicAuth", EnableBasicAuth)
+            _setattr("Password", Password)
+            _setattr("Username", Username)
+            _init_PropertyType(self, kwargs)
 
-    Properties: AppProperties = attrib(
-        factory=AppProperties, converter=create_object_converter(AppProperties)
+    _convert_AppBasicAuthConfig = create_object_converter(AppBasicAuthConfig)
+    _convert_AppEnvironmentVariable_list = create_object_list_converter(
+        AppEnvironmentVariable
     )
 
+    class AppAutoBranchCreationConfig(_PropertyType):
+        """The Auto Branch Creation Config property type for App in Amplify.
 
-@attrs(**ATTRSCONFIG)
-class BranchProperties(ResourceProperties):
-    AppId = attrib(default=None)
-    BasicAuthConfig = attrib(default=None)
-    BranchName = attrib(default=None)
-    BuildSpec = attrib(default=None)
-    Description = attrib(default=None)
-    EnableAutoBuild = attrib(default=None)
-    EnablePullRequestPreview = attrib(default=None)
-    EnvironmentVariables = attrib(default=None)
-    PullRequestEnvironmentName = attrib(default=None)
-    Stage = attrib(default=None)
-    Tags = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for AutoBranchCreationConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amplify-app-autobranchcreationconfig.html>`_
+        """
 
+        __slots__ = (
+            "AutoBranchCreationPatterns",
+            "BasicAuthConfig",
+            "BuildSpec",
+            "EnableAutoBranchCreation",
+            "EnableAutoBuild",
+            "EnablePullRequestPreview",
+            "EnvironmentVariables",
+            "PullRequestEnvironmentName",
+            "Stage",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppAutoBranchCreationConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BasicAuthConfig": _convert_AppBasicAuthConfig,
+                "EnvironmentVariables": _convert_AppEnvironmentVariable_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Branch(Resource):
-    """A Branch for Amplify.
+        def __init__(
+            self,
+            *,
+            AutoBranchCreationPatterns=None,
+            BasicAuthConfig=None,
+            BuildSpec=None,
+            EnableAutoBranchCreation=None,
+            EnableAutoBuild=None,
+            EnablePullRequestPreview=None,
+            EnvironmentVariables=None,
+            PullRequestEnvironmentName=None,
+            Stage=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoBranchCreationPatterns", AutoBranchCreationPatterns)
+            _setattr("BasicAuthConfig", _convert_AppBasicAuthConfig(BasicAuthConfig))
+            _setattr("BuildSpec", BuildSpec)
+            _setattr("EnableAutoBranchCreation", EnableAutoBranchCreation)
+            _setattr("EnableAutoBuild", EnableAutoBuild)
+            _setattr("EnablePullRequestPreview", EnablePullRequestPreview)
+            _setattr(
+                "EnvironmentVariables",
+                _convert_AppEnvironmentVariable_list(EnvironmentVariables),
+            )
+            _setattr("PullRequestEnvironmentName", PullRequestEnvironmentName)
+            _setattr("Stage", Stage)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Branch
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amplify-branch.html>`_
-    """
+    class AppCustomRule(_PropertyType):
+        """The Custom Rule property type for App in Amplify.
 
-    RESOURCE_TYPE = "AWS::Amplify::Branch"
+        See Also:
+            `AWS Cloud Formation documentation for CustomRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amplify-app-customrule.html>`_
+        """
 
-    Properties: BranchProperties = attrib(
-        factory=BranchProperties, converter=create_object_converter(BranchProperties)
+        __slots__ = ("Condition", "Source", "Status", "Target")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppCustomRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Condition=None, Source=None, Status=None, Target=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Condition", Condition)
+            _setattr("Source", Source)
+            _setattr("Status", Status)
+            _setattr("Target", Target)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AppAutoBranchCreationConfig = create_object_converter(
+        AppAutoBranchCreationConfig
     )
+    _convert_AppCustomRule_list = create_object_list_converter(AppCustomRule)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class AppProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessToken",
+            "AutoBranchCreationConfig",
+            "BasicAuthConfig",
+            "BuildSpec",
+            "CustomRules",
+            "Description",
+            "EnvironmentVariables",
+            "IAMServiceRole",
+            "Name",
+            "OauthToken",
+            "Repository",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AutoBranchCreationConfig": _convert_AppAutoBranchCreationConfig,
+                "BasicAuthConfig": _convert_AppBasicAuthConfig,
+                "CustomRules": _convert_AppCustomRule_list,
+                "EnvironmentVariables": _convert_AppEnvironmentVariable_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            AccessToken=None,
+            AutoBranchCreationConfig=None,
+            BasicAuthConfig=None,
+            BuildSpec=None,
+            CustomRules=None,
+            Description=None,
+            EnvironmentVariables=None,
+            IAMServiceRole=None,
+            Name=None,
+            OauthToken=None,
+            Repository=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccessToken", AccessToken)
+            _setattr(
+                "AutoBranchCreationConfig",
+                _convert_AppAutoBranchCreationConfig(AutoBranchCreationConfig),
+            )
+            _setattr("BasicAuthConfig", _convert_AppBasicAuthConfig(BasicAuthConfig))
+            _setattr("BuildSpec", BuildSpec)
+            _setattr("CustomRules", _convert_AppCustomRule_list(CustomRules))
+            _setattr("Description", Description)
+            _setattr(
+                "EnvironmentVariables",
+                _convert_AppEnvironmentVariable_list(EnvironmentVariables),
+            )
+            _setattr("IAMServiceRole", IAMServiceRole)
+            _setattr("Name", Name)
+            _setattr("OauthToken", OauthToken)
+            _setattr("Repository", Repository)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class DomainProperties(ResourceProperties):
-    AppId = attrib(default=None)
-    DomainName = attrib(default=None)
-    SubDomainSettings = attrib(default=None)
+    _convert_AppProperties = create_object_converter(AppProperties)
 
+    class App(_Resource):
+        """A App for Amplify.
 
-@attrs(**ATTRSCONFIG)
-class Domain(Resource):
-    """A Domain for Amplify.
+        See Also:
+            `AWS Cloud Formation documentation for App
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amplify-app.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Domain
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amplify-domain.html>`_
-    """
+        RESOURCE_TYPE = "AWS::Amplify::App"
 
-    RESOURCE_TYPE = "AWS::Amplify::Domain"
+        Properties: AppProperties
 
-    Properties: DomainProperties = attrib(
-        factory=DomainProperties, converter=create_object_converter(DomainProperties)
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "App",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AppProperties},
+            factories={"Properties": AppProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AppProperties()
+            _setattr("Properties", _convert_AppProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        App,
+        AppProperties,
+        AppEnvironmentVariable,
+        AppBasicAuthConfig,
+        AppAutoBranchCreationConfig,
+        AppCustomRule,
     )
+
+
+def _create_Branch():
+    class BranchBasicAuthConfig(_PropertyType):
+        """The Basic Auth Config property type for Branch in Amplify.
+
+        See Also:
+            `AWS Cloud Formation documentation for BasicAuthConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amplify-branch-basicauthconfig.html>`_
+        """
+
+        __slots__ = ("EnableBasicAuth", "Password", "Username")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BranchBasicAuthConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, EnableBasicAuth=None, Password=None, Username=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EnableBasicAuth", EnableBasicAuth)
+            _setattr("Password", Password)
+            _setattr("Username", Username)
+            _init_PropertyType(self, kwargs)
+
+    class BranchEnvironmentVariable(_PropertyType):
+        """The Environment Variable property type for Branch in Amplify.
+
+        See Also:
+            `AWS Cloud Formation documentation for EnvironmentVariable
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amplify-branch-environmentvariable.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BranchEnvironmentVariable", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BranchBasicAuthConfig = create_object_converter(BranchBasicAuthConfig)
+    _convert_BranchEnvironmentVariable_list = create_object_list_converter(
+        BranchEnvironmentVariable
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class BranchProperties(_ResourceProperties):
+        __slots__ = (
+            "AppId",
+            "BasicAuthConfig",
+            "BranchName",
+            "BuildSpec",
+            "Description",
+            "EnableAutoBuild",
+            "EnablePullRequestPreview",
+            "EnvironmentVariables",
+            "PullRequestEnvironmentName",
+            "Stage",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BranchProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "BasicAuthConfig": _convert_BranchBasicAuthConfig,
+                "EnvironmentVariables": _convert_BranchEnvironmentVariable_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AppId=None,
+            BasicAuthConfig=None,
+            BranchName=None,
+            BuildSpec=None,
+            Description=None,
+            EnableAutoBuild=None,
+            EnablePullRequestPreview=None,
+            EnvironmentVariables=None,
+            PullRequestEnvironmentName=None,
+            Stage=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AppId", AppId)
+            _setattr("BasicAuthConfig", _convert_BranchBasicAuthConfig(BasicAuthConfig))
+            _setattr("BranchName", BranchName)
+            _setattr("BuildSpec", BuildSpec)
+            _setattr("Description", Description)
+            _setattr("EnableAutoBuild", EnableAutoBuild)
+            _setattr("EnablePullRequestPreview", EnablePullRequestPreview)
+            _setattr(
+                "EnvironmentVariables",
+                _convert_BranchEnvironmentVariable_list(EnvironmentVariables),
+            )
+            _setattr("PullRequestEnvironmentName", PullRequestEnvironmentName)
+            _setattr("Stage", Stage)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_BranchProperties = create_object_converter(BranchProperties)
+
+    class Branch(_Resource):
+        """A Branch for Amplify.
+
+        See Also:
+            `AWS Cloud Formation documentation for Branch
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amplify-branch.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Amplify::Branch"
+
+        Properties: BranchProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Branch",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BranchProperties},
+            factories={"Properties": BranchProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BranchProperties()
+            _setattr("Properties", _convert_BranchProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Branch, BranchProperties, BranchBasicAuthConfig, BranchEnvironmentVariable
+
+
+def _create_Domain():
+    class DomainSubDomainSetting(_PropertyType):
+        """The Sub Domain Setting property type for Domain in Amplify.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubDomainSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-amplify-domain-subdomainsetting.html>`_
+        """
+
+        __slots__ = ("BranchName", "Prefix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainSubDomainSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, BranchName=None, Prefix=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BranchName", BranchName)
+            _setattr("Prefix", Prefix)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DomainSubDomainSetting_list = create_object_list_converter(
+        DomainSubDomainSetting
+    )
+
+    class DomainProperties(_ResourceProperties):
+        __slots__ = ("AppId", "DomainName", "SubDomainSettings")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"SubDomainSettings": _convert_DomainSubDomainSetting_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AppId=None, DomainName=None, SubDomainSettings=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AppId", AppId)
+            _setattr("DomainName", DomainName)
+            _setattr(
+                "SubDomainSettings",
+                _convert_DomainSubDomainSetting_list(SubDomainSettings),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DomainProperties = create_object_converter(DomainProperties)
+
+    class Domain(_Resource):
+        """A Domain for Amplify.
+
+        See Also:
+            `AWS Cloud Formation documentation for Domain
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-amplify-domain.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Amplify::Domain"
+
+        Properties: DomainProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Domain",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DomainProperties},
+            factories={"Properties": DomainProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DomainProperties()
+            _setattr("Properties", _convert_DomainProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Domain, DomainProperties, DomainSubDomainSetting
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "App": _create_App,
+        "AppProperties": _create_App,
+        "AppAutoBranchCreationConfig": _create_App,
+        "AppBasicAuthConfig": _create_App,
+        "AppCustomRule": _create_App,
+        "AppEnvironmentVariable": _create_App,
+        "Branch": _create_Branch,
+        "BranchProperties": _create_Branch,
+        "BranchBasicAuthConfig": _create_Branch,
+        "BranchEnvironmentVariable": _create_Branch,
+        "Domain": _create_Domain,
+        "DomainProperties": _create_Domain,
+        "DomainSubDomainSetting": _create_Domain,
+    },
+)
@@ -7,19 +7,29 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+from ..core import create_object_map_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Account",
     "AccountProperties",
     "ApiKey",
     "ApiKeyProperties",
+    "ApiKeyStageKey",
     "Authorizer",
     "AuthorizerProperties",
     "BasePathMapping",
@@ -28,16 +38,26 @@ __all__ = [
     "ClientCertificateProperties",
     "Deployment",
     "DeploymentProperties",
+    "DeploymentAccessLogSetting",
+    "DeploymentCanarySetting",
+    "DeploymentDeploymentCanarySettings",
+    "DeploymentMethodSetting",
+    "DeploymentStageDescription",
     "DocumentationPart",
     "DocumentationPartProperties",
+    "DocumentationPartLocation",
     "DocumentationVersion",
     "DocumentationVersionProperties",
     "DomainName",
     "DomainNameProperties",
+    "DomainNameEndpointConfiguration",
     "GatewayResponse",
     "GatewayResponseProperties",
     "Method",
     "MethodProperties",
+    "MethodIntegration",
+    "MethodIntegrationResponse",
+    "MethodMethodResponse",
     "Model",
     "ModelProperties",
     "RequestValidator",
@@ -46,10 +66,18 @@ __all__ = [
     "ResourceProperties",
     "RestApi",
     "RestApiProperties",
+    "RestApiEndpointConfiguration",
+    "RestApiS3Location",
     "Stage",
     "StageProperties",
+    "StageAccessLogSetting",
+    "StageCanarySetting",
+    "StageMethodSetting",
     "UsagePlan",
     "UsagePlanProperties",
+    "UsagePlanApiStage",
+    "UsagePlanQuotaSettings",
+    "UsagePlanThrottleSettings",
     "UsagePlanKey",
     "UsagePlanKeyProperties",
     "VpcLink",
@@ -57,504 +85,2251 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AccountProperties(ResourceProperties):
-    CloudWatchRoleArn = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Account(Resource):
-    """A Account for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for Account
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-account.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::Account"
-
-    Properties: AccountProperties = attrib(
-        factory=AccountProperties, converter=create_object_converter(AccountProperties)
+def _create_Account():
+    class AccountProperties(_ResourceProperties):
+        __slots__ = ("CloudWatchRoleArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AccountProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CloudWatchRoleArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudWatchRoleArn", CloudWatchRoleArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AccountProperties = create_object_converter(AccountProperties)
+
+    class Account(_Resource):
+        """A Account for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for Account
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-account.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::Account"
+
+        Properties: AccountProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Account",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AccountProperties},
+            factories={"Properties": AccountProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AccountProperties()
+            _setattr("Properties", _convert_AccountProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Account, AccountProperties
+
+
+def _create_ApiKey():
+    class ApiKeyStageKey(_PropertyType):
+        """The Stage Key property type for ApiKey in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for StageKey
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-apikey-stagekey.html>`_
+        """
+
+        __slots__ = ("RestApiId", "StageName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiKeyStageKey", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RestApiId=None, StageName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RestApiId", RestApiId)
+            _setattr("StageName", StageName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApiKeyStageKey_list = create_object_list_converter(ApiKeyStageKey)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ApiKeyProperties(_ResourceProperties):
+        __slots__ = (
+            "CustomerId",
+            "Description",
+            "Enabled",
+            "GenerateDistinctId",
+            "Name",
+            "StageKeys",
+            "Tags",
+            "Value",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiKeyProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "StageKeys": _convert_ApiKeyStageKey_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CustomerId=None,
+            Description=None,
+            Enabled=None,
+            GenerateDistinctId=None,
+            Name=None,
+            StageKeys=None,
+            Tags=None,
+            Value=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CustomerId", CustomerId)
+            _setattr("Description", Description)
+            _setattr("Enabled", Enabled)
+            _setattr("GenerateDistinctId", GenerateDistinctId)
+            _setattr("Name", Name)
+            _setattr("StageKeys", _convert_ApiKeyStageKey_list(StageKeys))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Value", Value)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApiKeyProperties = create_object_converter(ApiKeyProperties)
+
+    class ApiKey(_Resource):
+        """A Api Key for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApiKey
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-apikey.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::ApiKey"
+
+        Properties: ApiKeyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiKey",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApiKeyProperties},
+            factories={"Properties": ApiKeyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApiKeyProperties()
+            _setattr("Properties", _convert_ApiKeyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ApiKey, ApiKeyProperties, ApiKeyStageKey
+
+
+def _create_Authorizer():
+    class AuthorizerProperties(_ResourceProperties):
+        __slots__ = (
+            "AuthorizerCredentials",
+            "AuthorizerResultTtlInSeconds",
+            "AuthorizerUri",
+            "AuthType",
+            "IdentitySource",
+            "IdentityValidationExpression",
+            "Name",
+            "ProviderARNs",
+            "RestApiId",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AuthorizerProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthorizerCredentials=None,
+            AuthorizerResultTtlInSeconds=None,
+            AuthorizerUri=None,
+            AuthType=None,
+            IdentitySource=None,
+            IdentityValidationExpression=None,
+            Name=None,
+            ProviderARNs=None,
+            RestApiId=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AuthorizerCredentials", AuthorizerCredentials)
+            _setattr("AuthorizerResultTtlInSeconds", AuthorizerResultTtlInSeconds)
+            _setattr("AuthorizerUri", AuthorizerUri)
+            _setattr("AuthType", AuthType)
+            _setattr("IdentitySource", IdentitySource)
+            _setattr("IdentityValidationExpression", IdentityValidationExpression)
+            _setattr("Name", Name)
+            _setattr("ProviderARNs", ProviderARNs)
+            _setattr("RestApiId", RestApiId)
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AuthorizerProperties = create_object_converter(AuthorizerProperties)
+
+    class Authorizer(_Resource):
+        """A Authorizer for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for Authorizer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-authorizer.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::Authorizer"
+
+        Properties: AuthorizerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Authorizer",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AuthorizerProperties},
+            factories={"Properties": AuthorizerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AuthorizerProperties()
+            _setattr("Properties", _convert_AuthorizerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Authorizer, AuthorizerProperties
+
+
+def _create_BasePathMapping():
+    class BasePathMappingProperties(_ResourceProperties):
+        __slots__ = ("BasePath", "DomainName", "RestApiId", "Stage")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BasePathMappingProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BasePath=None,
+            DomainName=None,
+            RestApiId=None,
+            Stage=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BasePath", BasePath)
+            _setattr("DomainName", DomainName)
+            _setattr("RestApiId", RestApiId)
+            _setattr("Stage", Stage)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_BasePathMappingProperties = create_object_converter(
+        BasePathMappingProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ApiKeyProperties(ResourceProperties):
-    CustomerId = attrib(default=None)
-    Description = attrib(default=None)
-    Enabled = attrib(default=None)
-    GenerateDistinctId = attrib(default=None)
-    Name = attrib(default=None)
-    StageKeys = attrib(default=None)
-    Tags = attrib(default=None)
-    Value = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ApiKey(Resource):
-    """A Api Key for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for ApiKey
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-apikey.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::ApiKey"
-
-    Properties: ApiKeyProperties = attrib(
-        factory=ApiKeyProperties, converter=create_object_converter(ApiKeyProperties)
+    class BasePathMapping(_Resource):
+        """A Base Path Mapping for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for BasePathMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-basepathmapping.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::BasePathMapping"
+
+        Properties: BasePathMappingProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BasePathMapping",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BasePathMappingProperties},
+            factories={"Properties": BasePathMappingProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BasePathMappingProperties()
+            _setattr("Properties", _convert_BasePathMappingProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return BasePathMapping, BasePathMappingProperties
+
+
+def _create_ClientCertificate():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ClientCertificateProperties(_ResourceProperties):
+        __slots__ = ("Description", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientCertificateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Description=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClientCertificateProperties = create_object_converter(
+        ClientCertificateProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class AuthorizerProperties(ResourceProperties):
-    AuthorizerCredentials = attrib(default=None)
-    AuthorizerResultTtlInSeconds = attrib(default=None)
-    AuthorizerUri = attrib(default=None)
-    AuthType = attrib(default=None)
-    IdentitySource = attrib(default=None)
-    IdentityValidationExpression = attrib(default=None)
-    Name = attrib(default=None)
-    ProviderARNs = attrib(default=None)
-    RestApiId = attrib(default=None)
-    Type = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Authorizer(Resource):
-    """A Authorizer for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for Authorizer
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-authorizer.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::Authorizer"
-
-    Properties: AuthorizerProperties = attrib(
-        factory=AuthorizerProperties,
-        converter=create_object_converter(AuthorizerProperties),
+    class ClientCertificate(_Resource):
+        """A Client Certificate for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClientCertificate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-clientcertificate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::ClientCertificate"
+
+        Properties: ClientCertificateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientCertificate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClientCertificateProperties},
+            factories={"Properties": ClientCertificateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClientCertificateProperties()
+            _setattr("Properties", _convert_ClientCertificateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ClientCertificate, ClientCertificateProperties
+
+
+def _create_Deployment():
+    class DeploymentAccessLogSetting(_PropertyType):
+        """The Access Log Setting property type for Deployment in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccessLogSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-deployment-accesslogsetting.html>`_
+        """
+
+        __slots__ = ("DestinationArn", "Format")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentAccessLogSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DestinationArn=None, Format=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationArn", DestinationArn)
+            _setattr("Format", Format)
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentCanarySetting(_PropertyType):
+        """The Canary Setting property type for Deployment in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for CanarySetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-deployment-canarysetting.html>`_
+        """
+
+        __slots__ = ("PercentTraffic", "StageVariableOverrides", "UseStageCache")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentCanarySetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            PercentTraffic=None,
+            StageVariableOverrides=None,
+            UseStageCache=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PercentTraffic", PercentTraffic)
+            _setattr("StageVariableOverrides", StageVariableOverrides)
+            _setattr("UseStageCache", UseStageCache)
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentDeploymentCanarySettings(_PropertyType):
+        """The Deployment Canary Settings property type for Deployment in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeploymentCanarySettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-deployment-deploymentcanarysettings.html>`_
+        """
+
+        __slots__ = ("PercentTraffic", "StageVariableOverrides", "UseStageCache")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentDeploymentCanarySettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            PercentTraffic=None,
+            StageVariableOverrides=None,
+            UseStageCache=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PercentTraffic", PercentTraffic)
+            _setattr("StageVariableOverrides", StageVariableOverrides)
+            _setattr("UseStageCache", UseStageCache)
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentMethodSetting(_PropertyType):
+        """The Method Setting property type for Deployment in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for MethodSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-deployment-stagedescription-methodsetting.html>`_
+        """
+
+        __slots__ = (
+            "CacheDataEncrypted",
+            "CacheTtlInSeconds",
+            "CachingEnabled",
+            "DataTraceEnabled",
+            "HttpMethod",
+            "LoggingLevel",
+            "MetricsEnabled",
+            "ResourcePath",
+            "ThrottlingBurstLimit",
+            "ThrottlingRateLimit",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentMethodSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CacheDataEncrypted=None,
+            CacheTtlInSeconds=None,
+            CachingEnabled=None,
+            DataTraceEnabled=None,
+            HttpMethod=None,
+            LoggingLevel=None,
+            MetricsEnabled=None,
+            ResourcePath=None,
+            ThrottlingBurstLimit=None,
+            ThrottlingRateLimit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CacheDataEncrypted", CacheDataEncrypted)
+            _setattr("CacheTtlInSeconds", CacheTtlInSeconds)
+            _setattr("CachingEnabled", CachingEnabled)
+            _setattr("DataTraceEnabled", DataTraceEnabled)
+            _setattr("HttpMethod", HttpMethod)
+            _setattr("LoggingLevel", LoggingLevel)
+            _setattr("MetricsEnabled", MetricsEnabled)
+            _setattr("ResourcePath", ResourcePath)
+            _setattr("ThrottlingBurstLimit", ThrottlingBurstLimit)
+            _setattr("ThrottlingRateLimit", ThrottlingRateLimit)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentAccessLogSetting = create_object_converter(
+        DeploymentAccessLogSetting
     )
-
-
-@attrs(**ATTRSCONFIG)
-class BasePathMappingProperties(ResourceProperties):
-    BasePath = attrib(default=None)
-    DomainName = attrib(default=None)
-    RestApiId = attrib(default=None)
-    Stage = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class BasePathMapping(Resource):
-    """A Base Path Mapping for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for BasePathMapping
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-basepathmapping.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::BasePathMapping"
-
-    Properties: BasePathMappingProperties = attrib(
-        factory=BasePathMappingProperties,
-        converter=create_object_converter(BasePathMappingProperties),
+    _convert_DeploymentCanarySetting = create_object_converter(DeploymentCanarySetting)
+    _convert_DeploymentMethodSetting_list = create_object_list_converter(
+        DeploymentMethodSetting
     )
-
-
-@attrs(**ATTRSCONFIG)
-class ClientCertificateProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ClientCertificate(Resource):
-    """A Client Certificate for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for ClientCertificate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-clientcertificate.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::ClientCertificate"
-
-    Properties: ClientCertificateProperties = attrib(
-        factory=ClientCertificateProperties,
-        converter=create_object_converter(ClientCertificateProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DeploymentStageDescription(_PropertyType):
+        """The Stage Description property type for Deployment in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for StageDescription
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-deployment-stagedescription.html>`_
+        """
+
+        __slots__ = (
+            "AccessLogSetting",
+            "CacheClusterEnabled",
+            "CacheClusterSize",
+            "CacheDataEncrypted",
+            "CacheTtlInSeconds",
+            "CachingEnabled",
+            "CanarySetting",
+            "ClientCertificateId",
+            "DataTraceEnabled",
+            "Description",
+            "DocumentationVersion",
+            "LoggingLevel",
+            "MethodSettings",
+            "MetricsEnabled",
+            "Tags",
+            "ThrottlingBurstLimit",
+            "ThrottlingRateLimit",
+            "TracingEnabled",
+            "Variables",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentStageDescription",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AccessLogSetting": _convert_DeploymentAccessLogSetting,
+                "CanarySetting": _convert_DeploymentCanarySetting,
+                "MethodSettings": _convert_DeploymentMethodSetting_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessLogSetting=None,
+            CacheClusterEnabled=None,
+            CacheClusterSize=None,
+            CacheDataEncrypted=None,
+            CacheTtlInSeconds=None,
+            CachingEnabled=None,
+            CanarySetting=None,
+            ClientCertificateId=None,
+            DataTraceEnabled=None,
+            Description=None,
+            DocumentationVersion=None,
+            LoggingLevel=None,
+            MethodSettings=None,
+            MetricsEnabled=None,
+            Tags=None,
+            ThrottlingBurstLimit=None,
+            ThrottlingRateLimit=None,
+            TracingEnabled=None,
+            Variables=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccessLogSetting",
+                _convert_DeploymentAccessLogSetting(AccessLogSetting),
+            )
+            _setattr("CacheClusterEnabled", CacheClusterEnabled)
+            _setattr("CacheClusterSize", CacheClusterSize)
+            _setattr("CacheDataEncrypted", CacheDataEncrypted)
+            _setattr("CacheTtlInSeconds", CacheTtlInSeconds)
+            _setattr("CachingEnabled", CachingEnabled)
+            _setattr("CanarySetting", _convert_DeploymentCanarySetting(CanarySetting))
+            _setattr("ClientCertificateId", ClientCertificateId)
+            _setattr("DataTraceEnabled", DataTraceEnabled)
+            _setattr("Description", Description)
+            _setattr("DocumentationVersion", DocumentationVersion)
+            _setattr("LoggingLevel", LoggingLevel)
+            _setattr(
+                "MethodSettings", _convert_DeploymentMethodSetting_list(MethodSettings)
+            )
+            _setattr("MetricsEnabled", MetricsEnabled)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("ThrottlingBurstLimit", ThrottlingBurstLimit)
+            _setattr("ThrottlingRateLimit", ThrottlingRateLimit)
+            _setattr("TracingEnabled", TracingEnabled)
+            _setattr("Variables", Variables)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentDeploymentCanarySettings = create_object_converter(
+        DeploymentDeploymentCanarySettings
     )
-
-
-@attrs(**ATTRSCONFIG)
-class DeploymentProperties(ResourceProperties):
-    DeploymentCanarySettings = attrib(default=None)
-    Description = attrib(default=None)
-    RestApiId = attrib(default=None)
-    StageDescription = attrib(default=None)
-    StageName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Deployment(Resource):
-    """A Deployment for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for Deployment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-deployment.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::Deployment"
-
-    Properties: DeploymentProperties = attrib(
-        factory=DeploymentProperties,
-        converter=create_object_converter(DeploymentProperties),
+    _convert_DeploymentStageDescription = create_object_converter(
+        DeploymentStageDescription
     )
 
-
-@attrs(**ATTRSCONFIG)
-class DocumentationPartProperties(ResourceProperties):
-    Location = attrib(default=None)
-    Properties = attrib(default=None)
-    RestApiId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DocumentationPart(Resource):
-    """A Documentation Part for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for DocumentationPart
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-documentationpart.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::DocumentationPart"
-
-    Properties: DocumentationPartProperties = attrib(
-        factory=DocumentationPartProperties,
-        converter=create_object_converter(DocumentationPartProperties),
+    class DeploymentProperties(_ResourceProperties):
+        __slots__ = (
+            "DeploymentCanarySettings",
+            "Description",
+            "RestApiId",
+            "StageDescription",
+            "StageName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DeploymentCanarySettings": _convert_DeploymentDeploymentCanarySettings,
+                "StageDescription": _convert_DeploymentStageDescription,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeploymentCanarySettings=None,
+            Description=None,
+            RestApiId=None,
+            StageDescription=None,
+            StageName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DeploymentCanarySettings",
+                _convert_DeploymentDeploymentCanarySettings(DeploymentCanarySettings),
+            )
+            _setattr("Description", Description)
+            _setattr("RestApiId", RestApiId)
+            _setattr(
+                "StageDescription",
+                _convert_DeploymentStageDescription(StageDescription),
+            )
+            _setattr("StageName", StageName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DeploymentProperties = create_object_converter(DeploymentProperties)
+
+    class Deployment(_Resource):
+        """A Deployment for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for Deployment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-deployment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::Deployment"
+
+        Properties: DeploymentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Deployment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DeploymentProperties},
+            factories={"Properties": DeploymentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DeploymentProperties()
+            _setattr("Properties", _convert_DeploymentProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Deployment,
+        DeploymentProperties,
+        DeploymentAccessLogSetting,
+        DeploymentCanarySetting,
+        DeploymentDeploymentCanarySettings,
+        DeploymentMethodSetting,
+        DeploymentStageDescription,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class DocumentationVersionProperties(ResourceProperties):
-    Description = attrib(default=None)
-    DocumentationVersion = attrib(default=None)
-    RestApiId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DocumentationVersion(Resource):
-    """A Documentation Version for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for DocumentationVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-documentationversion.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::DocumentationVersion"
-
-    Properties: DocumentationVersionProperties = attrib(
-        factory=DocumentationVersionProperties,
-        converter=create_object_converter(DocumentationVersionProperties),
+def _create_DocumentationPart():
+    class DocumentationPartLocation(_PropertyType):
+        """The Location property type for DocumentationPart in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for Location
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-documentationpart-location.html>`_
+        """
+
+        __slots__ = ("Method", "Name", "Path", "StatusCode", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DocumentationPartLocation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Method=None,
+            Name=None,
+            Path=None,
+            StatusCode=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Method", Method)
+            _setattr("Name", Name)
+            _setattr("Path", Path)
+            _setattr("StatusCode", StatusCode)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DocumentationPartLocation = create_object_converter(
+        DocumentationPartLocation
     )
 
-
-@attrs(**ATTRSCONFIG)
-class DomainNameProperties(ResourceProperties):
-    CertificateArn = attrib(default=None)
-    DomainName = attrib(default=None)
-    EndpointConfiguration = attrib(default=None)
-    RegionalCertificateArn = attrib(default=None)
-    SecurityPolicy = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DomainName(Resource):
-    """A Domain Name for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for DomainName
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-domainname.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::DomainName"
-
-    Properties: DomainNameProperties = attrib(
-        factory=DomainNameProperties,
-        converter=create_object_converter(DomainNameProperties),
+    class DocumentationPartProperties(_ResourceProperties):
+        __slots__ = ("Location", "Properties", "RestApiId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DocumentationPartProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Location": _convert_DocumentationPartLocation},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Location=None, Properties=None, RestApiId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Location", _convert_DocumentationPartLocation(Location))
+            _setattr("Properties", Properties)
+            _setattr("RestApiId", RestApiId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DocumentationPartProperties = create_object_converter(
+        DocumentationPartProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class GatewayResponseProperties(ResourceProperties):
-    ResponseParameters = attrib(default=None)
-    ResponseTemplates = attrib(default=None)
-    ResponseType = attrib(default=None)
-    RestApiId = attrib(default=None)
-    StatusCode = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class GatewayResponse(Resource):
-    """A Gateway Response for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for GatewayResponse
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-gatewayresponse.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::GatewayResponse"
-
-    Properties: GatewayResponseProperties = attrib(
-        factory=GatewayResponseProperties,
-        converter=create_object_converter(GatewayResponseProperties),
+    class DocumentationPart(_Resource):
+        """A Documentation Part for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for DocumentationPart
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-documentationpart.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::DocumentationPart"
+
+        Properties: DocumentationPartProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DocumentationPart",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DocumentationPartProperties},
+            factories={"Properties": DocumentationPartProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DocumentationPartProperties()
+            _setattr("Properties", _convert_DocumentationPartProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DocumentationPart, DocumentationPartProperties, DocumentationPartLocation
+
+
+def _create_DocumentationVersion():
+    class DocumentationVersionProperties(_ResourceProperties):
+        __slots__ = ("Description", "DocumentationVersion", "RestApiId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DocumentationVersionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            DocumentationVersion=None,
+            RestApiId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("DocumentationVersion", DocumentationVersion)
+            _setattr("RestApiId", RestApiId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DocumentationVersionProperties = create_object_converter(
+        DocumentationVersionProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class MethodProperties(ResourceProperties):
-    ApiKeyRequired = attrib(default=None)
-    AuthorizationScopes = attrib(default=None)
-    AuthorizationType = attrib(default=None)
-    AuthorizerId = attrib(default=None)
-    HttpMethod = attrib(default=None)
-    Integration = attrib(default=None)
-    MethodResponses = attrib(default=None)
-    OperationName = attrib(default=None)
-    RequestModels = attrib(default=None)
-    RequestParameters = attrib(default=None)
-    RequestValidatorId = attrib(default=None)
-    ResourceId = attrib(default=None)
-    RestApiId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Method(Resource):
-    """A Method for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for Method
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-method.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::Method"
-
-    Properties: MethodProperties = attrib(
-        factory=MethodProperties, converter=create_object_converter(MethodProperties)
+    class DocumentationVersion(_Resource):
+        """A Documentation Version for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for DocumentationVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-documentationversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::DocumentationVersion"
+
+        Properties: DocumentationVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DocumentationVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DocumentationVersionProperties},
+            factories={"Properties": DocumentationVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DocumentationVersionProperties()
+            _setattr("Properties", _convert_DocumentationVersionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DocumentationVersion, DocumentationVersionProperties
+
+
+def _create_DomainName():
+    class DomainNameEndpointConfiguration(_PropertyType):
+        """The Endpoint Configuration property type for DomainName in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for EndpointConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-domainname-endpointconfiguration.html>`_
+        """
+
+        __slots__ = ("Types",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainNameEndpointConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Types=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Types", Types)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DomainNameEndpointConfiguration = create_object_converter(
+        DomainNameEndpointConfiguration
     )
-
-
-@attrs(**ATTRSCONFIG)
-class ModelProperties(ResourceProperties):
-    ContentType = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    RestApiId = attrib(default=None)
-    Schema = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Model(Resource):
-    """A Model for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for Model
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-model.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::Model"
-
-    Properties: ModelProperties = attrib(
-        factory=ModelProperties, converter=create_object_converter(ModelProperties)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DomainNameProperties(_ResourceProperties):
+        __slots__ = (
+            "CertificateArn",
+            "DomainName",
+            "EndpointConfiguration",
+            "RegionalCertificateArn",
+            "SecurityPolicy",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainNameProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "EndpointConfiguration": _convert_DomainNameEndpointConfiguration,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CertificateArn=None,
+            DomainName=None,
+            EndpointConfiguration=None,
+            RegionalCertificateArn=None,
+            SecurityPolicy=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _setattr("DomainName", DomainName)
+            _setattr(
+                "EndpointConfiguration",
+                _convert_DomainNameEndpointConfiguration(EndpointConfiguration),
+            )
+            _setattr("RegionalCertificateArn", RegionalCertificateArn)
+            _setattr("SecurityPolicy", SecurityPolicy)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DomainNameProperties = create_object_converter(DomainNameProperties)
+
+    class DomainName(_Resource):
+        """A Domain Name for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for DomainName
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-domainname.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::DomainName"
+
+        Properties: DomainNameProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainName",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DomainNameProperties},
+            factories={"Properties": DomainNameProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DomainNameProperties()
+            _setattr("Properties", _convert_DomainNameProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DomainName, DomainNameProperties, DomainNameEndpointConfiguration
+
+
+def _create_GatewayResponse():
+    class GatewayResponseProperties(_ResourceProperties):
+        __slots__ = (
+            "ResponseParameters",
+            "ResponseTemplates",
+            "ResponseType",
+            "RestApiId",
+            "StatusCode",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GatewayResponseProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ResponseParameters=None,
+            ResponseTemplates=None,
+            ResponseType=None,
+            RestApiId=None,
+            StatusCode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResponseParameters", ResponseParameters)
+            _setattr("ResponseTemplates", ResponseTemplates)
+            _setattr("ResponseType", ResponseType)
+            _setattr("RestApiId", RestApiId)
+            _setattr("StatusCode", StatusCode)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GatewayResponseProperties = create_object_converter(
+        GatewayResponseProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RequestValidatorProperties(ResourceProperties):
-    Name = attrib(default=None)
-    RestApiId = attrib(default=None)
-    ValidateRequestBody = attrib(default=None)
-    ValidateRequestParameters = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class RequestValidator(Resource):
-    """A Request Validator for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for RequestValidator
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-requestvalidator.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::RequestValidator"
-
-    Properties: RequestValidatorProperties = attrib(
-        factory=RequestValidatorProperties,
-        converter=create_object_converter(RequestValidatorProperties),
+    class GatewayResponse(_Resource):
+        """A Gateway Response for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for GatewayResponse
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-gatewayresponse.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::GatewayResponse"
+
+        Properties: GatewayResponseProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GatewayResponse",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GatewayResponseProperties},
+            factories={"Properties": GatewayResponseProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GatewayResponseProperties()
+            _setattr("Properties", _convert_GatewayResponseProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return GatewayResponse, GatewayResponseProperties
+
+
+def _create_Method():
+    class MethodIntegrationResponse(_PropertyType):
+        """The Integration Response property type for Method in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for IntegrationResponse
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apitgateway-method-integration-integrationresponse.html>`_
+        """
+
+        __slots__ = (
+            "ContentHandling",
+            "ResponseParameters",
+            "ResponseTemplates",
+            "SelectionPattern",
+            "StatusCode",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MethodIntegrationResponse", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContentHandling=None,
+            ResponseParameters=None,
+            ResponseTemplates=None,
+            SelectionPattern=None,
+            StatusCode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContentHandling", ContentHandling)
+            _setattr("ResponseParameters", ResponseParameters)
+            _setattr("ResponseTemplates", ResponseTemplates)
+            _setattr("SelectionPattern", SelectionPattern)
+            _setattr("StatusCode", StatusCode)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MethodIntegrationResponse_list = create_object_list_converter(
+        MethodIntegrationResponse
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ResourceProperties(ResourceProperties):
-    ParentId = attrib(default=None)
-    PathPart = attrib(default=None)
-    RestApiId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Resource(Resource):
-    """A Resource for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for Resource
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-resource.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::Resource"
-
-    Properties: ResourceProperties = attrib(
-        factory=ResourceProperties,
-        converter=create_object_converter(ResourceProperties),
+    class MethodIntegration(_PropertyType):
+        """The Integration property type for Method in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for Integration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apitgateway-method-integration.html>`_
+        """
+
+        __slots__ = (
+            "CacheKeyParameters",
+            "CacheNamespace",
+            "ConnectionId",
+            "ConnectionType",
+            "ContentHandling",
+            "Credentials",
+            "IntegrationHttpMethod",
+            "IntegrationResponses",
+            "PassthroughBehavior",
+            "RequestParameters",
+            "RequestTemplates",
+            "TimeoutInMillis",
+            "Type",
+            "Uri",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MethodIntegration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "IntegrationResponses": _convert_MethodIntegrationResponse_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CacheKeyParameters=None,
+            CacheNamespace=None,
+            ConnectionId=None,
+            ConnectionType=None,
+            ContentHandling=None,
+            Credentials=None,
+            IntegrationHttpMethod=None,
+            IntegrationResponses=None,
+            PassthroughBehavior=None,
+            RequestParameters=None,
+            RequestTemplates=None,
+            TimeoutInMillis=None,
+            Type=None,
+            Uri=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CacheKeyParameters", CacheKeyParameters)
+            _setattr("CacheNamespace", CacheNamespace)
+            _setattr("ConnectionId", ConnectionId)
+            _setattr("ConnectionType", ConnectionType)
+            _setattr("ContentHandling", ContentHandling)
+            _setattr("Credentials", Credentials)
+            _setattr("IntegrationHttpMethod", IntegrationHttpMethod)
+            _setattr(
+                "IntegrationResponses",
+                _convert_MethodIntegrationResponse_list(IntegrationResponses),
+            )
+            _setattr("PassthroughBehavior", PassthroughBehavior)
+            _setattr("RequestParameters", RequestParameters)
+            _setattr("RequestTemplates", RequestTemplates)
+            _setattr("TimeoutInMillis", TimeoutInMillis)
+            _setattr("Type", Type)
+            _setattr("Uri", Uri)
+            _init_PropertyType(self, kwargs)
+
+    class MethodMethodResponse(_PropertyType):
+        """The Method Response property type for Method in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for MethodResponse
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apitgateway-method-methodresponse.html>`_
+        """
+
+        __slots__ = ("ResponseModels", "ResponseParameters", "StatusCode")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MethodMethodResponse", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ResponseModels=None,
+            ResponseParameters=None,
+            StatusCode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResponseModels", ResponseModels)
+            _setattr("ResponseParameters", ResponseParameters)
+            _setattr("StatusCode", StatusCode)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MethodIntegration = create_object_converter(MethodIntegration)
+    _convert_MethodMethodResponse_list = create_object_list_converter(
+        MethodMethodResponse
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RestApiProperties(ResourceProperties):
-    ApiKeySourceType = attrib(default=None)
-    BinaryMediaTypes = attrib(default=None)
-    Body = attrib(default=None)
-    BodyS3Location = attrib(default=None)
-    CloneFrom = attrib(default=None)
-    Description = attrib(default=None)
-    EndpointConfiguration = attrib(default=None)
-    FailOnWarnings = attrib(default=None)
-    MinimumCompressionSize = attrib(default=None)
-    Name = attrib(default=None)
-    Parameters = attrib(default=None)
-    Policy = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class RestApi(Resource):
-    """A Rest Api for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for RestApi
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-restapi.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::RestApi"
-
-    Properties: RestApiProperties = attrib(
-        factory=RestApiProperties, converter=create_object_converter(RestApiProperties)
+    class MethodProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiKeyRequired",
+            "AuthorizationScopes",
+            "AuthorizationType",
+            "AuthorizerId",
+            "HttpMethod",
+            "Integration",
+            "MethodResponses",
+            "OperationName",
+            "RequestModels",
+            "RequestParameters",
+            "RequestValidatorId",
+            "ResourceId",
+            "RestApiId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MethodProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Integration": _convert_MethodIntegration,
+                "MethodResponses": _convert_MethodMethodResponse_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiKeyRequired=None,
+            AuthorizationScopes=None,
+            AuthorizationType=None,
+            AuthorizerId=None,
+            HttpMethod=None,
+            Integration=None,
+            MethodResponses=None,
+            OperationName=None,
+            RequestModels=None,
+            RequestParameters=None,
+            RequestValidatorId=None,
+            ResourceId=None,
+            RestApiId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiKeyRequired", ApiKeyRequired)
+            _setattr("AuthorizationScopes", AuthorizationScopes)
+            _setattr("AuthorizationType", AuthorizationType)
+            _setattr("AuthorizerId", AuthorizerId)
+            _setattr("HttpMethod", HttpMethod)
+            _setattr("Integration", _convert_MethodIntegration(Integration))
+            _setattr(
+                "MethodResponses", _convert_MethodMethodResponse_list(MethodResponses)
+            )
+            _setattr("OperationName", OperationName)
+            _setattr("RequestModels", RequestModels)
+            _setattr("RequestParameters", RequestParameters)
+            _setattr("RequestValidatorId", RequestValidatorId)
+            _setattr("ResourceId", ResourceId)
+            _setattr("RestApiId", RestApiId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MethodProperties = create_object_converter(MethodProperties)
+
+    class Method(_Resource):
+        """A Method for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for Method
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-method.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::Method"
+
+        Properties: MethodProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Method",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MethodProperties},
+            factories={"Properties": MethodProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MethodProperties()
+            _setattr("Properties", _convert_MethodProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Method,
+        MethodProperties,
+        MethodIntegrationResponse,
+        MethodIntegration,
+        MethodMethodResponse,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class StageProperties(ResourceProperties):
-    AccessLogSetting = attrib(default=None)
-    CacheClusterEnabled = attrib(default=None)
-    CacheClusterSize = attrib(default=None)
-    CanarySetting = attrib(default=None)
-    ClientCertificateId = attrib(default=None)
-    DeploymentId = attrib(default=None)
-    Description = attrib(default=None)
-    DocumentationVersion = attrib(default=None)
-    MethodSettings = attrib(default=None)
-    RestApiId = attrib(default=None)
-    StageName = attrib(default=None)
-    Tags = attrib(default=None)
-    TracingEnabled = attrib(default=None)
-    Variables = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Stage(Resource):
-    """A Stage for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for Stage
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-stage.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::Stage"
-
-    Properties: StageProperties = attrib(
-        factory=StageProperties, converter=create_object_converter(StageProperties)
+def _create_Model():
+    class ModelProperties(_ResourceProperties):
+        __slots__ = ("ContentType", "Description", "Name", "RestApiId", "Schema")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ModelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContentType=None,
+            Description=None,
+            Name=None,
+            RestApiId=None,
+            Schema=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContentType", ContentType)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("RestApiId", RestApiId)
+            _setattr("Schema", Schema)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ModelProperties = create_object_converter(ModelProperties)
+
+    class Model(_Resource):
+        """A Model for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for Model
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-model.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::Model"
+
+        Properties: ModelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Model",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ModelProperties},
+            factories={"Properties": ModelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ModelProperties()
+            _setattr("Properties", _convert_ModelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Model, ModelProperties
+
+
+def _create_RequestValidator():
+    class RequestValidatorProperties(_ResourceProperties):
+        __slots__ = (
+            "Name",
+            "RestApiId",
+            "ValidateRequestBody",
+            "ValidateRequestParameters",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RequestValidatorProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Name=None,
+            RestApiId=None,
+            ValidateRequestBody=None,
+            ValidateRequestParameters=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("RestApiId", RestApiId)
+            _setattr("ValidateRequestBody", ValidateRequestBody)
+            _setattr("ValidateRequestParameters", ValidateRequestParameters)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RequestValidatorProperties = create_object_converter(
+        RequestValidatorProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class UsagePlanProperties(ResourceProperties):
-    ApiStages = attrib(default=None)
-    Description = attrib(default=None)
-    Quota = attrib(default=None)
-    Tags = attrib(default=None)
-    Throttle = attrib(default=None)
-    UsagePlanName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class UsagePlan(Resource):
-    """A Usage Plan for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for UsagePlan
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-usageplan.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGateway::UsagePlan"
-
-    Properties: UsagePlanProperties = attrib(
-        factory=UsagePlanProperties,
-        converter=create_object_converter(UsagePlanProperties),
+    class RequestValidator(_Resource):
+        """A Request Validator for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for RequestValidator
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-requestvalidator.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::RequestValidator"
+
+        Properties: RequestValidatorProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RequestValidator",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RequestValidatorProperties},
+            factories={"Properties": RequestValidatorProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RequestValidatorProperties()
+            _setattr("Properties", _convert_RequestValidatorProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return RequestValidator, RequestValidatorProperties
+
+
+def _create_Resource():
+    class ResourceProperties(_ResourceProperties):
+        __slots__ = ("ParentId", "PathPart", "RestApiId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ParentId=None, PathPart=None, RestApiId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ParentId", ParentId)
+            _setattr("PathPart", PathPart)
+            _setattr("RestApiId", RestApiId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResourceProperties = create_object_converter(ResourceProperties)
+
+    class Resource(_Resource):
+        """A Resource for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for Resource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-resource.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::Resource"
+
+        Properties: ResourceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Resource",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResourceProperties},
+            factories={"Properties": ResourceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResourceProperties()
+            _setattr("Properties", _convert_ResourceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Resource, ResourceProperties
+
+
+def _create_RestApi():
+    class RestApiEndpointConfiguration(_PropertyType):
+        """The Endpoint Configuration property type for RestApi in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for EndpointConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-restapi-endpointconfiguration.html>`_
+        """
+
+        __slots__ = ("Types", "VpcEndpointIds")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RestApiEndpointConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Types=None, VpcEndpointIds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Types", Types)
+            _setattr("VpcEndpointIds", VpcEndpointIds)
+            _init_PropertyType(self, kwargs)
+
+    class RestApiS3Location(_PropertyType):
+        """The S3 Location property type for RestApi in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3Location
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-restapi-s3location.html>`_
+        """
+
+        __slots__ = ("Bucket", "ETag", "Key", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RestApiS3Location", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Bucket=None, ETag=None, Key=None, Version=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("ETag", ETag)
+            _setattr("Key", Key)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RestApiS3Location = create_object_converter(RestApiS3Location)
+    _convert_RestApiEndpointConfiguration = create_object_converter(
+        RestApiEndpointConfiguration
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class RestApiProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiKeySourceType",
+            "BinaryMediaTypes",
+            "Body",
+            "BodyS3Location",
+            "CloneFrom",
+            "Description",
+            "EndpointConfiguration",
+            "FailOnWarnings",
+            "MinimumCompressionSize",
+            "Name",
+            "Parameters",
+            "Policy",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RestApiProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "BodyS3Location": _convert_RestApiS3Location,
+                "EndpointConfiguration": _convert_RestApiEndpointConfiguration,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiKeySourceType=None,
+            BinaryMediaTypes=None,
+            Body=None,
+            BodyS3Location=None,
+            CloneFrom=None,
+            Description=None,
+            EndpointConfiguration=None,
+            FailOnWarnings=None,
+            MinimumCompressionSize=None,
+            Name=None,
+            Parameters=None,
+            Policy=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiKeySourceType", ApiKeySourceType)
+            _setattr("BinaryMediaTypes", BinaryMediaTypes)
+            _setattr("Body", Body)
+            _setattr("BodyS3Location", _convert_RestApiS3Location(BodyS3Location))
+            _setattr("CloneFrom", CloneFrom)
+            _setattr("Description", Description)
+            _setattr(
+                "EndpointConfiguration",
+                _convert_RestApiEndpointConfiguration(EndpointConfiguration),
+            )
+            _setattr("FailOnWarnings", FailOnWarnings)
+            _setattr("MinimumCompressionSize", MinimumCompressionSize)
+            _setattr("Name", Name)
+            _setattr("Parameters", Parameters)
+            _setattr("Policy", Policy)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RestApiProperties = create_object_converter(RestApiProperties)
+
+    class RestApi(_Resource):
+        """A Rest Api for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for RestApi
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-restapi.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::RestApi"
+
+        Properties: RestApiProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RestApi",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RestApiProperties},
+            factories={"Properties": RestApiProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RestApiProperties()
+            _setattr("Properties", _convert_RestApiProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return RestApi, RestApiProperties, RestApiEndpointConfiguration, RestApiS3Location
+
+
+def _create_Stage():
+    class StageAccessLogSetting(_PropertyType):
+        """The Access Log Setting property type for Stage in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccessLogSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-stage-accesslogsetting.html>`_
+        """
+
+        __slots__ = ("DestinationArn", "Format")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StageAccessLogSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DestinationArn=None, Format=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationArn", DestinationArn)
+            _setattr("Format", Format)
+            _init_PropertyType(self, kwargs)
+
+    class StageCanarySetting(_PropertyType):
+        """The Canary Setting property type for Stage in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for CanarySetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-stage-canarysetting.html>`_
+        """
+
+        __slots__ = (
+            "DeploymentId",
+            "PercentTraffic",
+            "StageVariableOverrides",
+            "UseStageCache",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StageCanarySetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeploymentId=None,
+            PercentTraffic=None,
+            StageVariableOverrides=None,
+            UseStageCache=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeploymentId", DeploymentId)
+            _setattr("PercentTraffic", PercentTraffic)
+            _setattr("StageVariableOverrides", StageVariableOverrides)
+            _setattr("UseStageCache", UseStageCache)
+            _init_PropertyType(self, kwargs)
+
+    class StageMethodSetting(_PropertyType):
+        """The Method Setting property type for Stage in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for MethodSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apitgateway-stage-methodsetting.html>`_
+        """
+
+        __slots__ = (
+            "CacheDataEncrypted",
+            "CacheTtlInSeconds",
+            "CachingEnabled",
+            "DataTraceEnabled",
+            "HttpMethod",
+            "LoggingLevel",
+            "MetricsEnabled",
+            "ResourcePath",
+            "ThrottlingBurstLimit",
+            "ThrottlingRateLimit",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StageMethodSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CacheDataEncrypted=None,
+            CacheTtlInSeconds=None,
+            CachingEnabled=None,
+            DataTraceEnabled=None,
+            HttpMethod=None,
+            LoggingLevel=None,
+            MetricsEnabled=None,
+            ResourcePath=None,
+            ThrottlingBurstLimit=None,
+            ThrottlingRateLimit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CacheDataEncrypted", CacheDataEncrypted)
+            _setattr("CacheTtlInSeconds", CacheTtlInSeconds)
+            _setattr("CachingEnabled", CachingEnabled)
+            _setattr("DataTraceEnabled", DataTraceEnabled)
+            _setattr("HttpMethod", HttpMethod)
+            _setattr("LoggingLevel", LoggingLevel)
+            _setattr("MetricsEnabled", MetricsEnabled)
+            _setattr("ResourcePath", ResourcePath)
+            _setattr("ThrottlingBurstLimit", ThrottlingBurstLimit)
+            _setattr("ThrottlingRateLimit", ThrottlingRateLimit)
+            _init_PropertyType(self, kwargs)
+
+    _convert_StageAccessLogSetting = create_object_converter(StageAccessLogSetting)
+    _convert_StageCanarySetting = create_object_converter(StageCanarySetting)
+    _convert_StageMethodSetting_list = create_object_list_converter(StageMethodSetting)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class StageProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessLogSetting",
+            "CacheClusterEnabled",
+            "CacheClusterSize",
+            "CanarySetting",
+            "ClientCertificateId",
+            "DeploymentId",
+            "Description",
+            "DocumentationVersion",
+            "MethodSettings",
+            "RestApiId",
+            "StageName",
+            "Tags",
+            "TracingEnabled",
+            "Variables",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StageProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AccessLogSetting": _convert_StageAccessLogSetting,
+                "CanarySetting": _convert_StageCanarySetting,
+                "MethodSettings": _convert_StageMethodSetting_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessLogSetting=None,
+            CacheClusterEnabled=None,
+            CacheClusterSize=None,
+            CanarySetting=None,
+            ClientCertificateId=None,
+            DeploymentId=None,
+            Description=None,
+            DocumentationVersion=None,
+            MethodSettings=None,
+            RestApiId=None,
+            StageName=None,
+            Tags=None,
+            TracingEnabled=None,
+            Variables=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccessLogSetting", _convert_StageAccessLogSetting(AccessLogSetting)
+            )
+            _setattr("CacheClusterEnabled", CacheClusterEnabled)
+            _setattr("CacheClusterSize", CacheClusterSize)
+            _setattr("CanarySetting", _convert_StageCanarySetting(CanarySetting))
+            _setattr("ClientCertificateId", ClientCertificateId)
+            _setattr("DeploymentId", DeploymentId)
+            _setattr("Description", Description)
+            _setattr("DocumentationVersion", DocumentationVersion)
+            _setattr("MethodSettings", _convert_StageMethodSetting_list(MethodSettings))
+            _setattr("RestApiId", RestApiId)
+            _setattr("StageName", StageName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TracingEnabled", TracingEnabled)
+            _setattr("Variables", Variables)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StageProperties = create_object_converter(StageProperties)
+
+    class Stage(_Resource):
+        """A Stage for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for Stage
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-stage.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::Stage"
+
+        Properties: StageProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Stage",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StageProperties},
+            factories={"Properties": StageProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StageProperties()
+            _setattr("Properties", _convert_StageProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Stage,
+        StageProperties,
+        StageAccessLogSetting,
+        StageCanarySetting,
+        StageMethodSetting,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class UsagePlanKeyProperties(ResourceProperties):
-    KeyId = attrib(default=None)
-    KeyType = attrib(default=None)
-    UsagePlanId = attrib(default=None)
-
+def _create_UsagePlan():
+    class UsagePlanThrottleSettings(_PropertyType):
+        """The Throttle Settings property type for UsagePlan in ApiGateway.
 
-@attrs(**ATTRSCONFIG)
-class UsagePlanKey(Resource):
-    """A Usage Plan Key for ApiGateway.
+        See Also:
+            `AWS Cloud Formation documentation for ThrottleSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-usageplan-throttlesettings.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for UsagePlanKey
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-usageplankey.html>`_
-    """
+        __slots__ = ("BurstLimit", "RateLimit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UsagePlanThrottleSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::ApiGateway::UsagePlanKey"
+        def __init__(self, *, BurstLimit=None, RateLimit=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BurstLimit", BurstLimit)
+            _setattr("RateLimit", RateLimit)
+            _init_PropertyType(self, kwargs)
 
-    Properties: UsagePlanKeyProperties = attrib(
-        factory=UsagePlanKeyProperties,
-        converter=create_object_converter(UsagePlanKeyProperties),
+    _convert_UsagePlanThrottleSettings_map = create_object_map_converter(
+        UsagePlanThrottleSettings
     )
 
+    class UsagePlanApiStage(_PropertyType):
+        """The Api Stage property type for UsagePlan in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApiStage
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-usageplan-apistage.html>`_
+        """
+
+        __slots__ = ("ApiId", "Stage", "Throttle")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UsagePlanApiStage",
+            _PropertyType,
+            __slots__,
+            converters={"Throttle": _convert_UsagePlanThrottleSettings_map},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ApiId=None, Stage=None, Throttle=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("Stage", Stage)
+            _setattr("Throttle", _convert_UsagePlanThrottleSettings_map(Throttle))
+            _init_PropertyType(self, kwargs)
+
+    class UsagePlanQuotaSettings(_PropertyType):
+        """The Quota Settings property type for UsagePlan in ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for QuotaSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigateway-usageplan-quotasettings.html>`_
+        """
+
+        __slots__ = ("Limit", "Offset", "Period")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UsagePlanQuotaSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Limit=None, Offset=None, Period=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Limit", Limit)
+            _setattr("Offset", Offset)
+            _setattr("Period", Period)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UsagePlanApiStage_list = create_object_list_converter(UsagePlanApiStage)
+    _convert_UsagePlanQuotaSettings = create_object_converter(UsagePlanQuotaSettings)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_UsagePlanThrottleSettings = create_object_converter(
+        UsagePlanThrottleSettings
+    )
 
-@attrs(**ATTRSCONFIG)
-class VpcLinkProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    TargetArns = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class VpcLink(Resource):
-    """A Vpc Link for ApiGateway.
-
-    See Also:
-        `AWS Cloud Formation documentation for VpcLink
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-vpclink.html>`_
-    """
+    class UsagePlanProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiStages",
+            "Description",
+            "Quota",
+            "Tags",
+            "Throttle",
+            "UsagePlanName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UsagePlanProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ApiStages": _convert_UsagePlanApiStage_list,
+                "Quota": _convert_UsagePlanQuotaSettings,
+                "Tags": _convert_Tag_list,
+                "Throttle": _convert_UsagePlanThrottleSettings,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiStages=None,
+            Description=None,
+            Quota=None,
+            Tags=None,
+            Throttle=None,
+            UsagePlanName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiStages", _convert_UsagePlanApiStage_list(ApiStages))
+            _setattr("Description", Description)
+            _setattr("Quota", _convert_UsagePlanQuotaSettings(Quota))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Throttle", _convert_UsagePlanThrottleSettings(Throttle))
+            _setattr("UsagePlanName", UsagePlanName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UsagePlanProperties = create_object_converter(UsagePlanProperties)
+
+    class UsagePlan(_Resource):
+        """A Usage Plan for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for UsagePlan
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-usageplan.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::UsagePlan"
+
+        Properties: UsagePlanProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UsagePlan",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UsagePlanProperties},
+            factories={"Properties": UsagePlanProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UsagePlanProperties()
+            _setattr("Properties", _convert_UsagePlanProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        UsagePlan,
+        UsagePlanProperties,
+        UsagePlanThrottleSettings,
+        UsagePlanApiStage,
+        UsagePlanQuotaSettings,
+    )
 
-    RESOURCE_TYPE = "AWS::ApiGateway::VpcLink"
 
-    Properties: VpcLinkProperties = attrib(
-        factory=VpcLinkProperties, converter=create_object_converter(VpcLinkProperties)
-    )
+def _create_UsagePlanKey():
+    class UsagePlanKeyProperties(_ResourceProperties):
+        __slots__ = ("KeyId", "KeyType", "UsagePlanId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UsagePlanKeyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, KeyId=None, KeyType=None, UsagePlanId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("KeyId", KeyId)
+            _setattr("KeyType", KeyType)
+            _setattr("UsagePlanId", UsagePlanId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UsagePlanKeyProperties = create_object_converter(UsagePlanKeyProperties)
+
+    class UsagePlanKey(_Resource):
+        """A Usage Plan Key for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for UsagePlanKey
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-usageplankey.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::UsagePlanKey"
+
+        Properties: UsagePlanKeyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UsagePlanKey",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UsagePlanKeyProperties},
+            factories={"Properties": UsagePlanKeyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UsagePlanKeyProperties()
+            _setattr("Properties", _convert_UsagePlanKeyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return UsagePlanKey, UsagePlanKeyProperties
+
+
+def _create_VpcLink():
+    class VpcLinkProperties(_ResourceProperties):
+        __slots__ = ("Description", "Name", "TargetArns")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VpcLinkProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Description=None, Name=None, TargetArns=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("TargetArns", TargetArns)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VpcLinkProperties = create_object_converter(VpcLinkProperties)
+
+    class VpcLink(_Resource):
+        """A Vpc Link for ApiGateway.
+
+        See Also:
+            `AWS Cloud Formation documentation for VpcLink
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigateway-vpclink.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGateway::VpcLink"
+
+        Properties: VpcLinkProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VpcLink",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VpcLinkProperties},
+            factories={"Properties": VpcLinkProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VpcLinkProperties()
+            _setattr("Properties", _convert_VpcLinkProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VpcLink, VpcLinkProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Account": _create_Account,
+        "AccountProperties": _create_Account,
+        "ApiKey": _create_ApiKey,
+        "ApiKeyProperties": _create_ApiKey,
+        "ApiKeyStageKey": _create_ApiKey,
+        "Authorizer": _create_Authorizer,
+        "AuthorizerProperties": _create_Authorizer,
+        "BasePathMapping": _create_BasePathMapping,
+        "BasePathMappingProperties": _create_BasePathMapping,
+        "ClientCertificate": _create_ClientCertificate,
+        "ClientCertificateProperties": _create_ClientCertificate,
+        "Deployment": _create_Deployment,
+        "DeploymentProperties": _create_Deployment,
+        "DeploymentAccessLogSetting": _create_Deployment,
+        "DeploymentCanarySetting": _create_Deployment,
+        "DeploymentDeploymentCanarySettings": _create_Deployment,
+        "DeploymentMethodSetting": _create_Deployment,
+        "DeploymentStageDescription": _create_Deployment,
+        "DocumentationPart": _create_DocumentationPart,
+        "DocumentationPartProperties": _create_DocumentationPart,
+        "DocumentationPartLocation": _create_DocumentationPart,
+        "DocumentationVersion": _create_DocumentationVersion,
+        "DocumentationVersionProperties": _create_DocumentationVersion,
+        "DomainName": _create_DomainName,
+        "DomainNameProperties": _create_DomainName,
+        "DomainNameEndpointConfiguration": _create_DomainName,
+        "GatewayResponse": _create_GatewayResponse,
+        "GatewayResponseProperties": _create_GatewayResponse,
+        "Method": _create_Method,
+        "MethodProperties": _create_Method,
+        "MethodIntegration": _create_Method,
+        "MethodIntegrationResponse": _create_Method,
+        "MethodMethodResponse": _create_Method,
+        "Model": _create_Model,
+        "ModelProperties": _create_Model,
+        "RequestValidator": _create_RequestValidator,
+        "RequestValidatorProperties": _create_RequestValidator,
+        "Resource": _create_Resource,
+        "ResourceProperties": _create_Resource,
+        "RestApi": _create_RestApi,
+        "RestApiProperties": _create_RestApi,
+        "RestApiEndpointConfiguration": _create_RestApi,
+        "RestApiS3Location": _create_RestApi,
+        "Stage": _create_Stage,
+        "StageProperties": _create_Stage,
+        "StageAccessLogSetting": _create_Stage,
+        "StageCanarySetting": _create_Stage,
+        "StageMethodSetting": _create_Stage,
+        "UsagePlan": _create_UsagePlan,
+        "UsagePlanProperties": _create_UsagePlan,
+        "UsagePlanApiStage": _create_UsagePlan,
+        "UsagePlanQuotaSettings": _create_UsagePlan,
+        "UsagePlanThrottleSettings": _create_UsagePlan,
+        "UsagePlanKey": _create_UsagePlanKey,
+        "UsagePlanKeyProperties": _create_UsagePlanKey,
+        "VpcLink": _create_VpcLink,
+        "VpcLinkProperties": _create_VpcLink,
+    },
+)
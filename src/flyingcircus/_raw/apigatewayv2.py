@@ -7,25 +7,36 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Api",
     "ApiProperties",
+    "ApiBodyS3Location",
+    "ApiCors",
     "ApiMapping",
     "ApiMappingProperties",
     "Authorizer",
     "AuthorizerProperties",
+    "AuthorizerJWTConfiguration",
     "Deployment",
     "DeploymentProperties",
     "DomainName",
     "DomainNameProperties",
+    "DomainNameDomainNameConfiguration",
     "Integration",
     "IntegrationProperties",
     "IntegrationResponse",
@@ -34,325 +45,1186 @@ __all__ = [
     "ModelProperties",
     "Route",
     "RouteProperties",
+    "RouteParameterConstraints",
     "RouteResponse",
     "RouteResponseProperties",
+    "RouteResponseParameterConstraints",
     "Stage",
     "StageProperties",
+    "StageAccessLogSettings",
+    "StageRouteSettings",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ApiProperties(ResourceProperties):
-    ApiKeySelectionExpression = attrib(default=None)
-    BasePath = attrib(default=None)
-    Body = attrib(default=None)
-    BodyS3Location = attrib(default=None)
-    CorsConfiguration = attrib(default=None)
-    CredentialsArn = attrib(default=None)
-    Description = attrib(default=None)
-    DisableSchemaValidation = attrib(default=None)
-    FailOnWarnings = attrib(default=None)
-    Name = attrib(default=None)
-    ProtocolType = attrib(default=None)
-    RouteKey = attrib(default=None)
-    RouteSelectionExpression = attrib(default=None)
-    Tags = attrib(default=None)
-    Target = attrib(default=None)
-    Version = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Api(Resource):
-    """A Api for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Api
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-api.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::Api"
-
-    Properties: ApiProperties = attrib(
-        factory=ApiProperties, converter=create_object_converter(ApiProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class ApiMappingProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    ApiMappingKey = attrib(default=None)
-    DomainName = attrib(default=None)
-    Stage = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ApiMapping(Resource):
-    """A Api Mapping for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for ApiMapping
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-apimapping.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::ApiMapping"
-
-    Properties: ApiMappingProperties = attrib(
-        factory=ApiMappingProperties,
-        converter=create_object_converter(ApiMappingProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class AuthorizerProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    AuthorizerCredentialsArn = attrib(default=None)
-    AuthorizerResultTtlInSeconds = attrib(default=None)
-    AuthorizerType = attrib(default=None)
-    AuthorizerUri = attrib(default=None)
-    IdentitySource = attrib(default=None)
-    IdentityValidationExpression = attrib(default=None)
-    JwtConfiguration = attrib(default=None)
-    Name = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Authorizer(Resource):
-    """A Authorizer for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Authorizer
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-authorizer.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::Authorizer"
-
-    Properties: AuthorizerProperties = attrib(
-        factory=AuthorizerProperties,
-        converter=create_object_converter(AuthorizerProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class DeploymentProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    Description = attrib(default=None)
-    StageName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Deployment(Resource):
-    """A Deployment for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Deployment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-deployment.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::Deployment"
-
-    Properties: DeploymentProperties = attrib(
-        factory=DeploymentProperties,
-        converter=create_object_converter(DeploymentProperties),
+def _create_Api():
+    class ApiBodyS3Location(_PropertyType):
+        """The Body S3 Location property type for Api in ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for BodyS3Location
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigatewayv2-api-bodys3location.html>`_
+        """
+
+        __slots__ = ("Bucket", "Etag", "Key", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiBodyS3Location", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Bucket=None, Etag=None, Key=None, Version=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("Etag", Etag)
+            _setattr("Key", Key)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class ApiCors(_PropertyType):
+        """The Cors property type for Api in ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Cors
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigatewayv2-api-cors.html>`_
+        """
+
+        __slots__ = (
+            "AllowCredentials",
+            "AllowHeaders",
+            "AllowMethods",
+            "AllowOrigins",
+            "ExposeHeaders",
+            "MaxAge",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiCors", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowCredentials=None,
+            AllowHeaders=None,
+            AllowMethods=None,
+            AllowOrigins=None,
+            ExposeHeaders=None,
+            MaxAge=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowCredentials", AllowCredentials)
+            _setattr("AllowHeaders", AllowHeaders)
+            _setattr("AllowMethods", AllowMethods)
+            _setattr("AllowOrigins", AllowOrigins)
+            _setattr("ExposeHeaders", ExposeHeaders)
+            _setattr("MaxAge", MaxAge)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApiBodyS3Location = create_object_converter(ApiBodyS3Location)
+    _convert_ApiCors = create_object_converter(ApiCors)
+
+    class ApiProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiKeySelectionExpression",
+            "BasePath",
+            "Body",
+            "BodyS3Location",
+            "CorsConfiguration",
+            "CredentialsArn",
+            "Description",
+            "DisableSchemaValidation",
+            "FailOnWarnings",
+            "Name",
+            "ProtocolType",
+            "RouteKey",
+            "RouteSelectionExpression",
+            "Tags",
+            "Target",
+            "Version",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "BodyS3Location": _convert_ApiBodyS3Location,
+                "CorsConfiguration": _convert_ApiCors,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiKeySelectionExpression=None,
+            BasePath=None,
+            Body=None,
+            BodyS3Location=None,
+            CorsConfiguration=None,
+            CredentialsArn=None,
+            Description=None,
+            DisableSchemaValidation=None,
+            FailOnWarnings=None,
+            Name=None,
+            ProtocolType=None,
+            RouteKey=None,
+            RouteSelectionExpression=None,
+            Tags=None,
+            Target=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiKeySelectionExpression", ApiKeySelectionExpression)
+            _setattr("BasePath", BasePath)
+            _setattr("Body", Body)
+            _setattr("BodyS3Location", _convert_ApiBodyS3Location(BodyS3Location))
+            _setattr("CorsConfiguration", _convert_ApiCors(CorsConfiguration))
+            _setattr("CredentialsArn", CredentialsArn)
+            _setattr("Description", Description)
+            _setattr("DisableSchemaValidation", DisableSchemaValidation)
+            _setattr("FailOnWarnings", FailOnWarnings)
+            _setattr("Name", Name)
+            _setattr("ProtocolType", ProtocolType)
+            _setattr("RouteKey", RouteKey)
+            _setattr("RouteSelectionExpression", RouteSelectionExpression)
+            _setattr("Tags", Tags)
+            _setattr("Target", Target)
+            _setattr("Version", Version)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApiProperties = create_object_converter(ApiProperties)
+
+    class Api(_Resource):
+        """A Api for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Api
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-api.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::Api"
+        TAG_FORMAT = "Map"
+
+        Properties: ApiProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Api",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApiProperties},
+            factories={"Properties": ApiProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApiProperties()
+            _setattr("Properties", _convert_ApiProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Api, ApiProperties, ApiBodyS3Location, ApiCors
+
+
+def _create_ApiMapping():
+    class ApiMappingProperties(_ResourceProperties):
+        __slots__ = ("ApiId", "ApiMappingKey", "DomainName", "Stage")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiMappingProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            ApiMappingKey=None,
+            DomainName=None,
+            Stage=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("ApiMappingKey", ApiMappingKey)
+            _setattr("DomainName", DomainName)
+            _setattr("Stage", Stage)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApiMappingProperties = create_object_converter(ApiMappingProperties)
+
+    class ApiMapping(_Resource):
+        """A Api Mapping for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApiMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-apimapping.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::ApiMapping"
+
+        Properties: ApiMappingProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiMapping",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApiMappingProperties},
+            factories={"Properties": ApiMappingProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApiMappingProperties()
+            _setattr("Properties", _convert_ApiMappingProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ApiMapping, ApiMappingProperties
+
+
+def _create_Authorizer():
+    class AuthorizerJWTConfiguration(_PropertyType):
+        """The Jwt Configuration property type for Authorizer in ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for JWTConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigatewayv2-authorizer-jwtconfiguration.html>`_
+        """
+
+        __slots__ = ("Audience", "Issuer")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AuthorizerJWTConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Audience=None, Issuer=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Audience", Audience)
+            _setattr("Issuer", Issuer)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AuthorizerJWTConfiguration = create_object_converter(
+        AuthorizerJWTConfiguration
     )
 
-
-@attrs(**ATTRSCONFIG)
-class DomainNameProperties(ResourceProperties):
-    DomainName = attrib(default=None)
-    DomainNameConfigurations = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DomainName(Resource):
-    """A Domain Name for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for DomainName
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-domainname.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::DomainName"
-
-    Properties: DomainNameProperties = attrib(
-        factory=DomainNameProperties,
-        converter=create_object_converter(DomainNameProperties),
+    class AuthorizerProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiId",
+            "AuthorizerCredentialsArn",
+            "AuthorizerResultTtlInSeconds",
+            "AuthorizerType",
+            "AuthorizerUri",
+            "IdentitySource",
+            "IdentityValidationExpression",
+            "JwtConfiguration",
+            "Name",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AuthorizerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"JwtConfiguration": _convert_AuthorizerJWTConfiguration},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            AuthorizerCredentialsArn=None,
+            AuthorizerResultTtlInSeconds=None,
+            AuthorizerType=None,
+            AuthorizerUri=None,
+            IdentitySource=None,
+            IdentityValidationExpression=None,
+            JwtConfiguration=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("AuthorizerCredentialsArn", AuthorizerCredentialsArn)
+            _setattr("AuthorizerResultTtlInSeconds", AuthorizerResultTtlInSeconds)
+            _setattr("AuthorizerType", AuthorizerType)
+            _setattr("AuthorizerUri", AuthorizerUri)
+            _setattr("IdentitySource", IdentitySource)
+            _setattr("IdentityValidationExpression", IdentityValidationExpression)
+            _setattr(
+                "JwtConfiguration",
+                _convert_AuthorizerJWTConfiguration(JwtConfiguration),
+            )
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AuthorizerProperties = create_object_converter(AuthorizerProperties)
+
+    class Authorizer(_Resource):
+        """A Authorizer for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Authorizer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-authorizer.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::Authorizer"
+
+        Properties: AuthorizerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Authorizer",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AuthorizerProperties},
+            factories={"Properties": AuthorizerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AuthorizerProperties()
+            _setattr("Properties", _convert_AuthorizerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Authorizer, AuthorizerProperties, AuthorizerJWTConfiguration
+
+
+def _create_Deployment():
+    class DeploymentProperties(_ResourceProperties):
+        __slots__ = ("ApiId", "Description", "StageName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApiId=None, Description=None, StageName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("Description", Description)
+            _setattr("StageName", StageName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DeploymentProperties = create_object_converter(DeploymentProperties)
+
+    class Deployment(_Resource):
+        """A Deployment for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Deployment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-deployment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::Deployment"
+
+        Properties: DeploymentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Deployment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DeploymentProperties},
+            factories={"Properties": DeploymentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DeploymentProperties()
+            _setattr("Properties", _convert_DeploymentProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Deployment, DeploymentProperties
+
+
+def _create_DomainName():
+    class DomainNameDomainNameConfiguration(_PropertyType):
+        """The Domain Name Configuration property type for DomainName in ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for DomainNameConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigatewayv2-domainname-domainnameconfiguration.html>`_
+        """
+
+        __slots__ = ("CertificateArn", "CertificateName", "EndpointType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainNameDomainNameConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CertificateArn=None,
+            CertificateName=None,
+            EndpointType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _setattr("CertificateName", CertificateName)
+            _setattr("EndpointType", EndpointType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DomainNameDomainNameConfiguration_list = create_object_list_converter(
+        DomainNameDomainNameConfiguration
     )
 
-
-@attrs(**ATTRSCONFIG)
-class IntegrationProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    ConnectionType = attrib(default=None)
-    ContentHandlingStrategy = attrib(default=None)
-    CredentialsArn = attrib(default=None)
-    Description = attrib(default=None)
-    IntegrationMethod = attrib(default=None)
-    IntegrationType = attrib(default=None)
-    IntegrationUri = attrib(default=None)
-    PassthroughBehavior = attrib(default=None)
-    PayloadFormatVersion = attrib(default=None)
-    RequestParameters = attrib(default=None)
-    RequestTemplates = attrib(default=None)
-    TemplateSelectionExpression = attrib(default=None)
-    TimeoutInMillis = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Integration(Resource):
-    """A Integration for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Integration
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-integration.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::Integration"
-
-    Properties: IntegrationProperties = attrib(
-        factory=IntegrationProperties,
-        converter=create_object_converter(IntegrationProperties),
+    class DomainNameProperties(_ResourceProperties):
+        __slots__ = ("DomainName", "DomainNameConfigurations", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainNameProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DomainNameConfigurations": _convert_DomainNameDomainNameConfiguration_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DomainName=None, DomainNameConfigurations=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DomainName", DomainName)
+            _setattr(
+                "DomainNameConfigurations",
+                _convert_DomainNameDomainNameConfiguration_list(
+                    DomainNameConfigurations
+                ),
+            )
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DomainNameProperties = create_object_converter(DomainNameProperties)
+
+    class DomainName(_Resource):
+        """A Domain Name for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for DomainName
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-domainname.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::DomainName"
+        TAG_FORMAT = "Map"
+
+        Properties: DomainNameProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainName",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DomainNameProperties},
+            factories={"Properties": DomainNameProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DomainNameProperties()
+            _setattr("Properties", _convert_DomainNameProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DomainName, DomainNameProperties, DomainNameDomainNameConfiguration
+
+
+def _create_Integration():
+    class IntegrationProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiId",
+            "ConnectionType",
+            "ContentHandlingStrategy",
+            "CredentialsArn",
+            "Description",
+            "IntegrationMethod",
+            "IntegrationType",
+            "IntegrationUri",
+            "PassthroughBehavior",
+            "PayloadFormatVersion",
+            "RequestParameters",
+            "RequestTemplates",
+            "TemplateSelectionExpression",
+            "TimeoutInMillis",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IntegrationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            ConnectionType=None,
+            ContentHandlingStrategy=None,
+            CredentialsArn=None,
+            Description=None,
+            IntegrationMethod=None,
+            IntegrationType=None,
+            IntegrationUri=None,
+            PassthroughBehavior=None,
+            PayloadFormatVersion=None,
+            RequestParameters=None,
+            RequestTemplates=None,
+            TemplateSelectionExpression=None,
+            TimeoutInMillis=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("ConnectionType", ConnectionType)
+            _setattr("ContentHandlingStrategy", ContentHandlingStrategy)
+            _setattr("CredentialsArn", CredentialsArn)
+            _setattr("Description", Description)
+            _setattr("IntegrationMethod", IntegrationMethod)
+            _setattr("IntegrationType", IntegrationType)
+            _setattr("IntegrationUri", IntegrationUri)
+            _setattr("PassthroughBehavior", PassthroughBehavior)
+            _setattr("PayloadFormatVersion", PayloadFormatVersion)
+            _setattr("RequestParameters", RequestParameters)
+            _setattr("RequestTemplates", RequestTemplates)
+            _setattr("TemplateSelectionExpression", TemplateSelectionExpression)
+            _setattr("TimeoutInMillis", TimeoutInMillis)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_IntegrationProperties = create_object_converter(IntegrationProperties)
+
+    class Integration(_Resource):
+        """A Integration for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Integration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-integration.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::Integration"
+
+        Properties: IntegrationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Integration",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_IntegrationProperties},
+            factories={"Properties": IntegrationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = IntegrationProperties()
+            _setattr("Properties", _convert_IntegrationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Integration, IntegrationProperties
+
+
+def _create_IntegrationResponse():
+    class IntegrationResponseProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiId",
+            "ContentHandlingStrategy",
+            "IntegrationId",
+            "IntegrationResponseKey",
+            "ResponseParameters",
+            "ResponseTemplates",
+            "TemplateSelectionExpression",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IntegrationResponseProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            ContentHandlingStrategy=None,
+            IntegrationId=None,
+            IntegrationResponseKey=None,
+            ResponseParameters=None,
+            ResponseTemplates=None,
+            TemplateSelectionExpression=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("ContentHandlingStrategy", ContentHandlingStrategy)
+            _setattr("IntegrationId", IntegrationId)
+            _setattr("IntegrationResponseKey", IntegrationResponseKey)
+            _setattr("ResponseParameters", ResponseParameters)
+            _setattr("ResponseTemplates", ResponseTemplates)
+            _setattr("TemplateSelectionExpression", TemplateSelectionExpression)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_IntegrationResponseProperties = create_object_converter(
+        IntegrationResponseProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class IntegrationResponseProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    ContentHandlingStrategy = attrib(default=None)
-    IntegrationId = attrib(default=None)
-    IntegrationResponseKey = attrib(default=None)
-    ResponseParameters = attrib(default=None)
-    ResponseTemplates = attrib(default=None)
-    TemplateSelectionExpression = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class IntegrationResponse(Resource):
-    """A Integration Response for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for IntegrationResponse
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-integrationresponse.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::IntegrationResponse"
-
-    Properties: IntegrationResponseProperties = attrib(
-        factory=IntegrationResponseProperties,
-        converter=create_object_converter(IntegrationResponseProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class ModelProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    ContentType = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    Schema = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Model(Resource):
-    """A Model for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Model
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-model.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::Model"
-
-    Properties: ModelProperties = attrib(
-        factory=ModelProperties, converter=create_object_converter(ModelProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class RouteProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    ApiKeyRequired = attrib(default=None)
-    AuthorizationScopes = attrib(default=None)
-    AuthorizationType = attrib(default=None)
-    AuthorizerId = attrib(default=None)
-    ModelSelectionExpression = attrib(default=None)
-    OperationName = attrib(default=None)
-    RequestModels = attrib(default=None)
-    RequestParameters = attrib(default=None)
-    RouteKey = attrib(default=None)
-    RouteResponseSelectionExpression = attrib(default=None)
-    Target = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Route(Resource):
-    """A Route for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Route
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-route.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::Route"
-
-    Properties: RouteProperties = attrib(
-        factory=RouteProperties, converter=create_object_converter(RouteProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class RouteResponseProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    ModelSelectionExpression = attrib(default=None)
-    ResponseModels = attrib(default=None)
-    ResponseParameters = attrib(default=None)
-    RouteId = attrib(default=None)
-    RouteResponseKey = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class RouteResponse(Resource):
-    """A Route Response for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for RouteResponse
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-routeresponse.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::RouteResponse"
-
-    Properties: RouteResponseProperties = attrib(
-        factory=RouteResponseProperties,
-        converter=create_object_converter(RouteResponseProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class StageProperties(ResourceProperties):
-    AccessLogSettings = attrib(default=None)
-    ApiId = attrib(default=None)
-    AutoDeploy = attrib(default=None)
-    ClientCertificateId = attrib(default=None)
-    DefaultRouteSettings = attrib(default=None)
-    DeploymentId = attrib(default=None)
-    Description = attrib(default=None)
-    RouteSettings = attrib(default=None)
-    StageName = attrib(default=None)
-    StageVariables = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Stage(Resource):
-    """A Stage for ApiGatewayV2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Stage
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-stage.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ApiGatewayV2::Stage"
-
-    Properties: StageProperties = attrib(
-        factory=StageProperties, converter=create_object_converter(StageProperties)
-    )
+    class IntegrationResponse(_Resource):
+        """A Integration Response for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for IntegrationResponse
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-integrationresponse.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::IntegrationResponse"
+
+        Properties: IntegrationResponseProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IntegrationResponse",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_IntegrationResponseProperties},
+            factories={"Properties": IntegrationResponseProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = IntegrationResponseProperties()
+            _setattr("Properties", _convert_IntegrationResponseProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return IntegrationResponse, IntegrationResponseProperties
+
+
+def _create_Model():
+    class ModelProperties(_ResourceProperties):
+        __slots__ = ("ApiId", "ContentType", "Description", "Name", "Schema")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ModelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            ContentType=None,
+            Description=None,
+            Name=None,
+            Schema=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("ContentType", ContentType)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Schema", Schema)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ModelProperties = create_object_converter(ModelProperties)
+
+    class Model(_Resource):
+        """A Model for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Model
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-model.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::Model"
+
+        Properties: ModelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Model",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ModelProperties},
+            factories={"Properties": ModelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ModelProperties()
+            _setattr("Properties", _convert_ModelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Model, ModelProperties
+
+
+def _create_Route():
+    class RouteParameterConstraints(_PropertyType):
+        """The Parameter Constraints property type for Route in ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParameterConstraints
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigatewayv2-route-parameterconstraints.html>`_
+        """
+
+        __slots__ = ("Required",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteParameterConstraints", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Required=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Required", Required)
+            _init_PropertyType(self, kwargs)
+
+    class RouteProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiId",
+            "ApiKeyRequired",
+            "AuthorizationScopes",
+            "AuthorizationType",
+            "AuthorizerId",
+            "ModelSelectionExpression",
+            "OperationName",
+            "RequestModels",
+            "RequestParameters",
+            "RouteKey",
+            "RouteResponseSelectionExpression",
+            "Target",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            ApiKeyRequired=None,
+            AuthorizationScopes=None,
+            AuthorizationType=None,
+            AuthorizerId=None,
+            ModelSelectionExpression=None,
+            OperationName=None,
+            RequestModels=None,
+            RequestParameters=None,
+            RouteKey=None,
+            RouteResponseSelectionExpression=None,
+            Target=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("ApiKeyRequired", ApiKeyRequired)
+            _setattr("AuthorizationScopes", AuthorizationScopes)
+            _setattr("AuthorizationType", AuthorizationType)
+            _setattr("AuthorizerId", AuthorizerId)
+            _setattr("ModelSelectionExpression", ModelSelectionExpression)
+            _setattr("OperationName", OperationName)
+            _setattr("RequestModels", RequestModels)
+            _setattr("RequestParameters", RequestParameters)
+            _setattr("RouteKey", RouteKey)
+            _setattr(
+                "RouteResponseSelectionExpression", RouteResponseSelectionExpression
+            )
+            _setattr("Target", Target)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RouteProperties = create_object_converter(RouteProperties)
+
+    class Route(_Resource):
+        """A Route for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Route
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-route.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::Route"
+
+        Properties: RouteProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Route",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RouteProperties},
+            factories={"Properties": RouteProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RouteProperties()
+            _setattr("Properties", _convert_RouteProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Route, RouteProperties, RouteParameterConstraints
+
+
+def _create_RouteResponse():
+    class RouteResponseParameterConstraints(_PropertyType):
+        """The Parameter Constraints property type for RouteResponse in ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParameterConstraints
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigatewayv2-routeresponse-parameterconstraints.html>`_
+        """
+
+        __slots__ = ("Required",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteResponseParameterConstraints", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Required=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Required", Required)
+            _init_PropertyType(self, kwargs)
+
+    class RouteResponseProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiId",
+            "ModelSelectionExpression",
+            "ResponseModels",
+            "ResponseParameters",
+            "RouteId",
+            "RouteResponseKey",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteResponseProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            ModelSelectionExpression=None,
+            ResponseModels=None,
+            ResponseParameters=None,
+            RouteId=None,
+            RouteResponseKey=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("ModelSelectionExpression", ModelSelectionExpression)
+            _setattr("ResponseModels", ResponseModels)
+            _setattr("ResponseParameters", ResponseParameters)
+            _setattr("RouteId", RouteId)
+            _setattr("RouteResponseKey", RouteResponseKey)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RouteResponseProperties = create_object_converter(RouteResponseProperties)
+
+    class RouteResponse(_Resource):
+        """A Route Response for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RouteResponse
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-routeresponse.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::RouteResponse"
+
+        Properties: RouteResponseProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteResponse",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RouteResponseProperties},
+            factories={"Properties": RouteResponseProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RouteResponseProperties()
+            _setattr("Properties", _convert_RouteResponseProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return RouteResponse, RouteResponseProperties, RouteResponseParameterConstraints
+
+
+def _create_Stage():
+    class StageAccessLogSettings(_PropertyType):
+        """The Access Log Settings property type for Stage in ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccessLogSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigatewayv2-stage-accesslogsettings.html>`_
+        """
+
+        __slots__ = ("DestinationArn", "Format")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StageAccessLogSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DestinationArn=None, Format=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationArn", DestinationArn)
+            _setattr("Format", Format)
+            _init_PropertyType(self, kwargs)
+
+    class StageRouteSettings(_PropertyType):
+        """The Route Settings property type for Stage in ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RouteSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-apigatewayv2-stage-routesettings.html>`_
+        """
+
+        __slots__ = (
+            "DataTraceEnabled",
+            "DetailedMetricsEnabled",
+            "LoggingLevel",
+            "ThrottlingBurstLimit",
+            "ThrottlingRateLimit",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StageRouteSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DataTraceEnabled=None,
+            DetailedMetricsEnabled=None,
+            LoggingLevel=None,
+            ThrottlingBurstLimit=None,
+            ThrottlingRateLimit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DataTraceEnabled", DataTraceEnabled)
+            _setattr("DetailedMetricsEnabled", DetailedMetricsEnabled)
+            _setattr("LoggingLevel", LoggingLevel)
+            _setattr("ThrottlingBurstLimit", ThrottlingBurstLimit)
+            _setattr("ThrottlingRateLimit", ThrottlingRateLimit)
+            _init_PropertyType(self, kwargs)
+
+    _convert_StageAccessLogSettings = create_object_converter(StageAccessLogSettings)
+    _convert_StageRouteSettings = create_object_converter(StageRouteSettings)
+
+    class StageProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessLogSettings",
+            "ApiId",
+            "AutoDeploy",
+            "ClientCertificateId",
+            "DefaultRouteSettings",
+            "DeploymentId",
+            "Description",
+            "RouteSettings",
+            "StageName",
+            "StageVariables",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StageProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AccessLogSettings": _convert_StageAccessLogSettings,
+                "DefaultRouteSettings": _convert_StageRouteSettings,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessLogSettings=None,
+            ApiId=None,
+            AutoDeploy=None,
+            ClientCertificateId=None,
+            DefaultRouteSettings=None,
+            DeploymentId=None,
+            Description=None,
+            RouteSettings=None,
+            StageName=None,
+            StageVariables=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccessLogSettings", _convert_StageAccessLogSettings(AccessLogSettings)
+            )
+            _setattr("ApiId", ApiId)
+            _setattr("AutoDeploy", AutoDeploy)
+            _setattr("ClientCertificateId", ClientCertificateId)
+            _setattr(
+                "DefaultRouteSettings",
+                _convert_StageRouteSettings(DefaultRouteSettings),
+            )
+            _setattr("DeploymentId", DeploymentId)
+            _setattr("Description", Description)
+            _setattr("RouteSettings", RouteSettings)
+            _setattr("StageName", StageName)
+            _setattr("StageVariables", StageVariables)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StageProperties = create_object_converter(StageProperties)
+
+    class Stage(_Resource):
+        """A Stage for ApiGatewayV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Stage
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-apigatewayv2-stage.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApiGatewayV2::Stage"
+        TAG_FORMAT = "Map"
+
+        Properties: StageProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Stage",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StageProperties},
+            factories={"Properties": StageProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StageProperties()
+            _setattr("Properties", _convert_StageProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Stage, StageProperties, StageAccessLogSettings, StageRouteSettings
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Api": _create_Api,
+        "ApiProperties": _create_Api,
+        "ApiBodyS3Location": _create_Api,
+        "ApiCors": _create_Api,
+        "ApiMapping": _create_ApiMapping,
+        "ApiMappingProperties": _create_ApiMapping,
+        "Authorizer": _create_Authorizer,
+        "AuthorizerProperties": _create_Authorizer,
+        "AuthorizerJWTConfiguration": _create_Authorizer,
+        "Deployment": _create_Deployment,
+        "DeploymentProperties": _create_Deployment,
+        "DomainName": _create_DomainName,
+        "DomainNameProperties": _create_DomainName,
+        "DomainNameDomainNameConfiguration": _create_DomainName,
+        "Integration": _create_Integration,
+        "IntegrationProperties": _create_Integration,
+        "IntegrationResponse": _create_IntegrationResponse,
+        "IntegrationResponseProperties": _create_IntegrationResponse,
+        "Model": _create_Model,
+        "ModelProperties": _create_Model,
+        "Route": _create_Route,
+        "RouteProperties": _create_Route,
+        "RouteParameterConstraints": _create_Route,
+        "RouteResponse": _create_RouteResponse,
+        "RouteResponseProperties": _create_RouteResponse,
+        "RouteResponseParameterConstraints": _create_RouteResponse,
+        "Stage": _create_Stage,
+        "StageProperties": _create_Stage,
+        "StageAccessLogSettings": _create_Stage,
+        "StageRouteSettings": _create_Stage,
+    },
+)
@@ -7,75 +7,619 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "ScalableTarget",
     "ScalableTargetProperties",
+    "ScalableTargetScalableTargetAction",
+    "ScalableTargetScheduledAction",
+    "ScalableTargetSuspendedState",
     "ScalingPolicy",
     "ScalingPolicyProperties",
+    "ScalingPolicyCustomizedMetricSpecification",
+    "ScalingPolicyMetricDimension",
+    "ScalingPolicyPredefinedMetricSpecification",
+    "ScalingPolicyStepAdjustment",
+    "ScalingPolicyStepScalingPolicyConfiguration",
+    "ScalingPolicyTargetTrackingScalingPolicyConfiguration",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ScalableTargetProperties(ResourceProperties):
-    MaxCapacity = attrib(default=None)
-    MinCapacity = attrib(default=None)
-    ResourceId = attrib(default=None)
-    RoleARN = attrib(default=None)
-    ScalableDimension = attrib(default=None)
-    ScheduledActions = attrib(default=None)
-    ServiceNamespace = attrib(default=None)
-    SuspendedState = attrib(default=None)
+def _create_ScalableTarget():
+    class ScalableTargetScalableTargetAction(_PropertyType):
+        """The Scalable Target Action property type for ScalableTarget in ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalableTargetAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-applicationautoscaling-scalabletarget-scalabletargetaction.html>`_
+        """
+
+        __slots__ = ("MaxCapacity", "MinCapacity")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalableTargetScalableTargetAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MaxCapacity=None, MinCapacity=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaxCapacity", MaxCapacity)
+            _setattr("MinCapacity", MinCapacity)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalableTargetScalableTargetAction = create_object_converter(
+        ScalableTargetScalableTargetAction
+    )
+
+    class ScalableTargetScheduledAction(_PropertyType):
+        """The Scheduled Action property type for ScalableTarget in ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScheduledAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-applicationautoscaling-scalabletarget-scheduledaction.html>`_
+        """
 
+        __slots__ = (
+            "EndTime",
+            "ScalableTargetAction",
+            "Schedule",
+            "ScheduledActionName",
+            "StartTime",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalableTargetScheduledAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ScalableTargetAction": _convert_ScalableTargetScalableTargetAction
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ScalableTarget(Resource):
-    """A Scalable Target for ApplicationAutoScaling.
+        def __init__(
+            self,
+            *,
+            EndTime=None,
+            ScalableTargetAction=None,
+            Schedule=None,
+            ScheduledActionName=None,
+            StartTime=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EndTime", EndTime)
+            _setattr(
+                "ScalableTargetAction",
+                _convert_ScalableTargetScalableTargetAction(ScalableTargetAction),
+            )
+            _setattr("Schedule", Schedule)
+            _setattr("ScheduledActionName", ScheduledActionName)
+            _setattr("StartTime", StartTime)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for ScalableTarget
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-applicationautoscaling-scalabletarget.html>`_
-    """
+    class ScalableTargetSuspendedState(_PropertyType):
+        """The Suspended State property type for ScalableTarget in ApplicationAutoScaling.
 
-    RESOURCE_TYPE = "AWS::ApplicationAutoScaling::ScalableTarget"
+        See Also:
+            `AWS Cloud Formation documentation for SuspendedState
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-applicationautoscaling-scalabletarget-suspendedstate.html>`_
+        """
 
-    Properties: ScalableTargetProperties = attrib(
-        factory=ScalableTargetProperties,
-        converter=create_object_converter(ScalableTargetProperties),
+        __slots__ = (
+            "DynamicScalingInSuspended",
+            "DynamicScalingOutSuspended",
+            "ScheduledScalingSuspended",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalableTargetSuspendedState", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DynamicScalingInSuspended=None,
+            DynamicScalingOutSuspended=None,
+            ScheduledScalingSuspended=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DynamicScalingInSuspended", DynamicScalingInSuspended)
+            _setattr("DynamicScalingOutSuspended", DynamicScalingOutSuspended)
+            _setattr("ScheduledScalingSuspended", ScheduledScalingSuspended)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalableTargetScheduledAction_list = create_object_list_converter(
+        ScalableTargetScheduledAction
+    )
+    _convert_ScalableTargetSuspendedState = create_object_converter(
+        ScalableTargetSuspendedState
+    )
+
+    class ScalableTargetProperties(_ResourceProperties):
+        __slots__ = (
+            "MaxCapacity",
+            "MinCapacity",
+            "ResourceId",
+            "RoleARN",
+            "ScalableDimension",
+            "ScheduledActions",
+            "ServiceNamespace",
+            "SuspendedState",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalableTargetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ScheduledActions": _convert_ScalableTargetScheduledAction_list,
+                "SuspendedState": _convert_ScalableTargetSuspendedState,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MaxCapacity=None,
+            MinCapacity=None,
+            ResourceId=None,
+            RoleARN=None,
+            ScalableDimension=None,
+            ScheduledActions=None,
+            ServiceNamespace=None,
+            SuspendedState=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaxCapacity", MaxCapacity)
+            _setattr("MinCapacity", MinCapacity)
+            _setattr("ResourceId", ResourceId)
+            _setattr("RoleARN", RoleARN)
+            _setattr("ScalableDimension", ScalableDimension)
+            _setattr(
+                "ScheduledActions",
+                _convert_ScalableTargetScheduledAction_list(ScheduledActions),
+            )
+            _setattr("ServiceNamespace", ServiceNamespace)
+            _setattr(
+                "SuspendedState", _convert_ScalableTargetSuspendedState(SuspendedState)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ScalableTargetProperties = create_object_converter(
+        ScalableTargetProperties
     )
 
+    class ScalableTarget(_Resource):
+        """A Scalable Target for ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalableTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-applicationautoscaling-scalabletarget.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class ScalingPolicyProperties(ResourceProperties):
-    PolicyName = attrib(default=None)
-    PolicyType = attrib(default=None)
-    ResourceId = attrib(default=None)
-    ScalableDimension = attrib(default=None)
-    ScalingTargetId = attrib(default=None)
-    ServiceNamespace = attrib(default=None)
-    StepScalingPolicyConfiguration = attrib(default=None)
-    TargetTrackingScalingPolicyConfiguration = attrib(default=None)
+        RESOURCE_TYPE = "AWS::ApplicationAutoScaling::ScalableTarget"
 
+        Properties: ScalableTargetProperties
 
-@attrs(**ATTRSCONFIG)
-class ScalingPolicy(Resource):
-    """A Scaling Policy for ApplicationAutoScaling.
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalableTarget",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ScalableTargetProperties},
+            factories={"Properties": ScalableTargetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for ScalingPolicy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-applicationautoscaling-scalingpolicy.html>`_
-    """
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ScalableTargetProperties()
+            _setattr("Properties", _convert_ScalableTargetProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::ApplicationAutoScaling::ScalingPolicy"
+    return (
+        ScalableTarget,
+        ScalableTargetProperties,
+        ScalableTargetScalableTargetAction,
+        ScalableTargetScheduledAction,
+        ScalableTargetSuspendedState,
+    )
+
+
+def _create_ScalingPolicy():
+    class ScalingPolicyMetricDimension(_PropertyType):
+        """The Metric Dimension property type for ScalingPolicy in ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-applicationautoscaling-scalingpolicy-metricdimension.html>`_
+        """
 
-    Properties: ScalingPolicyProperties = attrib(
-        factory=ScalingPolicyProperties,
-        converter=create_object_converter(ScalingPolicyProperties),
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyMetricDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPolicyMetricDimension_list = create_object_list_converter(
+        ScalingPolicyMetricDimension
     )
+
+    class ScalingPolicyCustomizedMetricSpecification(_PropertyType):
+        """The Customized Metric Specification property type for ScalingPolicy in ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomizedMetricSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-applicationautoscaling-scalingpolicy-customizedmetricspecification.html>`_
+        """
+
+        __slots__ = ("Dimensions", "MetricName", "Namespace", "Statistic", "Unit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyCustomizedMetricSpecification",
+            _PropertyType,
+            __slots__,
+            converters={"Dimensions": _convert_ScalingPolicyMetricDimension_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Dimensions=None,
+            MetricName=None,
+            Namespace=None,
+            Statistic=None,
+            Unit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Dimensions", _convert_ScalingPolicyMetricDimension_list(Dimensions)
+            )
+            _setattr("MetricName", MetricName)
+            _setattr("Namespace", Namespace)
+            _setattr("Statistic", Statistic)
+            _setattr("Unit", Unit)
+            _init_PropertyType(self, kwargs)
+
+    class ScalingPolicyPredefinedMetricSpecification(_PropertyType):
+        """The Predefined Metric Specification property type for ScalingPolicy in ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for PredefinedMetricSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-applicationautoscaling-scalingpolicy-predefinedmetricspecification.html>`_
+        """
+
+        __slots__ = ("PredefinedMetricType", "ResourceLabel")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyPredefinedMetricSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, PredefinedMetricType=None, ResourceLabel=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PredefinedMetricType", PredefinedMetricType)
+            _setattr("ResourceLabel", ResourceLabel)
+            _init_PropertyType(self, kwargs)
+
+    class ScalingPolicyStepAdjustment(_PropertyType):
+        """The Step Adjustment property type for ScalingPolicy in ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for StepAdjustment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-applicationautoscaling-scalingpolicy-stepscalingpolicyconfiguration-stepadjustment.html>`_
+        """
+
+        __slots__ = (
+            "MetricIntervalLowerBound",
+            "MetricIntervalUpperBound",
+            "ScalingAdjustment",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyStepAdjustment", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MetricIntervalLowerBound=None,
+            MetricIntervalUpperBound=None,
+            ScalingAdjustment=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MetricIntervalLowerBound", MetricIntervalLowerBound)
+            _setattr("MetricIntervalUpperBound", MetricIntervalUpperBound)
+            _setattr("ScalingAdjustment", ScalingAdjustment)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPolicyStepAdjustment_list = create_object_list_converter(
+        ScalingPolicyStepAdjustment
+    )
+
+    class ScalingPolicyStepScalingPolicyConfiguration(_PropertyType):
+        """The Step Scaling Policy Configuration property type for ScalingPolicy in ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for StepScalingPolicyConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-applicationautoscaling-scalingpolicy-stepscalingpolicyconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "AdjustmentType",
+            "Cooldown",
+            "MetricAggregationType",
+            "MinAdjustmentMagnitude",
+            "StepAdjustments",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyStepScalingPolicyConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"StepAdjustments": _convert_ScalingPolicyStepAdjustment_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AdjustmentType=None,
+            Cooldown=None,
+            MetricAggregationType=None,
+            MinAdjustmentMagnitude=None,
+            StepAdjustments=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdjustmentType", AdjustmentType)
+            _setattr("Cooldown", Cooldown)
+            _setattr("MetricAggregationType", MetricAggregationType)
+            _setattr("MinAdjustmentMagnitude", MinAdjustmentMagnitude)
+            _setattr(
+                "StepAdjustments",
+                _convert_ScalingPolicyStepAdjustment_list(StepAdjustments),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPolicyCustomizedMetricSpecification = create_object_converter(
+        ScalingPolicyCustomizedMetricSpecification
+    )
+    _convert_ScalingPolicyPredefinedMetricSpecification = create_object_converter(
+        ScalingPolicyPredefinedMetricSpecification
+    )
+
+    class ScalingPolicyTargetTrackingScalingPolicyConfiguration(_PropertyType):
+        """The Target Tracking Scaling Policy Configuration property type for ScalingPolicy in ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for TargetTrackingScalingPolicyConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-applicationautoscaling-scalingpolicy-targettrackingscalingpolicyconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "CustomizedMetricSpecification",
+            "DisableScaleIn",
+            "PredefinedMetricSpecification",
+            "ScaleInCooldown",
+            "ScaleOutCooldown",
+            "TargetValue",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyTargetTrackingScalingPolicyConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CustomizedMetricSpecification": _convert_ScalingPolicyCustomizedMetricSpecification,
+                "PredefinedMetricSpecification": _convert_ScalingPolicyPredefinedMetricSpecification,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CustomizedMetricSpecification=None,
+            DisableScaleIn=None,
+            PredefinedMetricSpecification=None,
+            ScaleInCooldown=None,
+            ScaleOutCooldown=None,
+            TargetValue=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CustomizedMetricSpecification",
+                _convert_ScalingPolicyCustomizedMetricSpecification(
+                    CustomizedMetricSpecification
+                ),
+            )
+            _setattr("DisableScaleIn", DisableScaleIn)
+            _setattr(
+                "PredefinedMetricSpecification",
+                _convert_ScalingPolicyPredefinedMetricSpecification(
+                    PredefinedMetricSpecification
+                ),
+            )
+            _setattr("ScaleInCooldown", ScaleInCooldown)
+            _setattr("ScaleOutCooldown", ScaleOutCooldown)
+            _setattr("TargetValue", TargetValue)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPolicyStepScalingPolicyConfiguration = create_object_converter(
+        ScalingPolicyStepScalingPolicyConfiguration
+    )
+    _convert_ScalingPolicyTargetTrackingScalingPolicyConfiguration = (
+        create_object_converter(ScalingPolicyTargetTrackingScalingPolicyConfiguration)
+    )
+
+    class ScalingPolicyProperties(_ResourceProperties):
+        __slots__ = (
+            "PolicyName",
+            "PolicyType",
+            "ResourceId",
+            "ScalableDimension",
+            "ScalingTargetId",
+            "ServiceNamespace",
+            "StepScalingPolicyConfiguration",
+            "TargetTrackingScalingPolicyConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "StepScalingPolicyConfiguration": _convert_ScalingPolicyStepScalingPolicyConfiguration,
+                "TargetTrackingScalingPolicyConfiguration": _convert_ScalingPolicyTargetTrackingScalingPolicyConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            PolicyName=None,
+            PolicyType=None,
+            ResourceId=None,
+            ScalableDimension=None,
+            ScalingTargetId=None,
+            ServiceNamespace=None,
+            StepScalingPolicyConfiguration=None,
+            TargetTrackingScalingPolicyConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PolicyName", PolicyName)
+            _setattr("PolicyType", PolicyType)
+            _setattr("ResourceId", ResourceId)
+            _setattr("ScalableDimension", ScalableDimension)
+            _setattr("ScalingTargetId", ScalingTargetId)
+            _setattr("ServiceNamespace", ServiceNamespace)
+            _setattr(
+                "StepScalingPolicyConfiguration",
+                _convert_ScalingPolicyStepScalingPolicyConfiguration(
+                    StepScalingPolicyConfiguration
+                ),
+            )
+            _setattr(
+                "TargetTrackingScalingPolicyConfiguration",
+                _convert_ScalingPolicyTargetTrackingScalingPolicyConfiguration(
+                    TargetTrackingScalingPolicyConfiguration
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ScalingPolicyProperties = create_object_converter(ScalingPolicyProperties)
+
+    class ScalingPolicy(_Resource):
+        """A Scaling Policy for ApplicationAutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-applicationautoscaling-scalingpolicy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ApplicationAutoScaling::ScalingPolicy"
+
+        Properties: ScalingPolicyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ScalingPolicyProperties},
+            factories={"Properties": ScalingPolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ScalingPolicyProperties()
+            _setattr("Properties", _convert_ScalingPolicyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ScalingPolicy,
+        ScalingPolicyProperties,
+        ScalingPolicyMetricDimension,
+        ScalingPolicyCustomizedMetricSpecification,
+        ScalingPolicyPredefinedMetricSpecification,
+        ScalingPolicyStepAdjustment,
+        ScalingPolicyStepScalingPolicyConfiguration,
+        ScalingPolicyTargetTrackingScalingPolicyConfiguration,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ScalableTarget": _create_ScalableTarget,
+        "ScalableTargetProperties": _create_ScalableTarget,
+        "ScalableTargetScalableTargetAction": _create_ScalableTarget,
+        "ScalableTargetScheduledAction": _create_ScalableTarget,
+        "ScalableTargetSuspendedState": _create_ScalableTarget,
+        "ScalingPolicy": _create_ScalingPolicy,
+        "ScalingPolicyProperties": _create_ScalingPolicy,
+        "ScalingPolicyCustomizedMetricSpecification": _create_ScalingPolicy,
+        "ScalingPolicyMetricDimension": _create_ScalingPolicy,
+        "ScalingPolicyPredefinedMetricSpecification": _create_ScalingPolicy,
+        "ScalingPolicyStepAdjustment": _create_ScalingPolicy,
+        "ScalingPolicyStepScalingPolicyConfiguration": _create_ScalingPolicy,
+        "ScalingPolicyTargetTrackingScalingPolicyConfiguration": _create_ScalingPolicy,
+    },
+)
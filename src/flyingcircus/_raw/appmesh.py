@@ -7,146 +7,1740 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Mesh",
     "MeshProperties",
+    "MeshEgressFilter",
+    "MeshMeshSpec",
     "Route",
     "RouteProperties",
+    "RouteDuration",
+    "RouteGrpcRetryPolicy",
+    "RouteGrpcRoute",
+    "RouteGrpcRouteAction",
+    "RouteGrpcRouteMatch",
+    "RouteGrpcRouteMetadata",
+    "RouteGrpcRouteMetadataMatchMethod",
+    "RouteHeaderMatchMethod",
+    "RouteHttpRetryPolicy",
+    "RouteHttpRoute",
+    "RouteHttpRouteAction",
+    "RouteHttpRouteHeader",
+    "RouteHttpRouteMatch",
+    "RouteMatchRange",
+    "RouteRouteSpec",
+    "RouteTcpRoute",
+    "RouteTcpRouteAction",
+    "RouteWeightedTarget",
     "VirtualNode",
     "VirtualNodeProperties",
+    "VirtualNodeAccessLog",
+    "VirtualNodeAwsCloudMapInstanceAttribute",
+    "VirtualNodeAwsCloudMapServiceDiscovery",
+    "VirtualNodeBackend",
+    "VirtualNodeDnsServiceDiscovery",
+    "VirtualNodeFileAccessLog",
+    "VirtualNodeHealthCheck",
+    "VirtualNodeListener",
+    "VirtualNodeLogging",
+    "VirtualNodePortMapping",
+    "VirtualNodeServiceDiscovery",
+    "VirtualNodeVirtualNodeSpec",
+    "VirtualNodeVirtualServiceBackend",
     "VirtualRouter",
     "VirtualRouterProperties",
+    "VirtualRouterPortMapping",
+    "VirtualRouterVirtualRouterListener",
+    "VirtualRouterVirtualRouterSpec",
     "VirtualService",
     "VirtualServiceProperties",
+    "VirtualServiceVirtualNodeServiceProvider",
+    "VirtualServiceVirtualRouterServiceProvider",
+    "VirtualServiceVirtualServiceProvider",
+    "VirtualServiceVirtualServiceSpec",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class MeshProperties(ResourceProperties):
-    MeshName = attrib(default=None)
-    Spec = attrib(default=None)
-    Tags = attrib(default=None)
+def _create_Mesh():
+    class MeshEgressFilter(_PropertyType):
+        """The Egress Filter property type for Mesh in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for EgressFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-mesh-egressfilter.html>`_
+        """
+
+        __slots__ = ("Type",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MeshEgressFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MeshEgressFilter = create_object_converter(MeshEgressFilter)
+
+    class MeshMeshSpec(_PropertyType):
+        """The Mesh Spec property type for Mesh in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for MeshSpec
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-mesh-meshspec.html>`_
+        """
+
+        __slots__ = ("EgressFilter",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MeshMeshSpec",
+            _PropertyType,
+            __slots__,
+            converters={"EgressFilter": _convert_MeshEgressFilter},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EgressFilter=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EgressFilter", _convert_MeshEgressFilter(EgressFilter))
+            _init_PropertyType(self, kwargs)
+
+    _convert_MeshMeshSpec = create_object_converter(MeshMeshSpec)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class MeshProperties(_ResourceProperties):
+        __slots__ = ("MeshName", "Spec", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MeshProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Spec": _convert_MeshMeshSpec, "Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MeshName=None, Spec=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MeshName", MeshName)
+            _setattr("Spec", _convert_MeshMeshSpec(Spec))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MeshProperties = create_object_converter(MeshProperties)
+
+    class Mesh(_Resource):
+        """A Mesh for AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for Mesh
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-mesh.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppMesh::Mesh"
+
+        Properties: MeshProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Mesh",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MeshProperties},
+            factories={"Properties": MeshProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MeshProperties()
+            _setattr("Properties", _convert_MeshProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Mesh, MeshProperties, MeshEgressFilter, MeshMeshSpec
+
+
+def _create_Route():
+    class RouteDuration(_PropertyType):
+        """The Duration property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for Duration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-duration.html>`_
+        """
+
+        __slots__ = ("Unit", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteDuration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Unit=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Unit", Unit)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteDuration = create_object_converter(RouteDuration)
+
+    class RouteGrpcRetryPolicy(_PropertyType):
+        """The Grpc Retry Policy property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for GrpcRetryPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-grpcretrypolicy.html>`_
+        """
+
+        __slots__ = (
+            "GrpcRetryEvents",
+            "HttpRetryEvents",
+            "MaxRetries",
+            "PerRetryTimeout",
+            "TcpRetryEvents",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteGrpcRetryPolicy",
+            _PropertyType,
+            __slots__,
+            converters={"PerRetryTimeout": _convert_RouteDuration},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            GrpcRetryEvents=None,
+            HttpRetryEvents=None,
+            MaxRetries=None,
+            PerRetryTimeout=None,
+            TcpRetryEvents=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GrpcRetryEvents", GrpcRetryEvents)
+            _setattr("HttpRetryEvents", HttpRetryEvents)
+            _setattr("MaxRetries", MaxRetries)
+            _setattr("PerRetryTimeout", _convert_RouteDuration(PerRetryTimeout))
+            _setattr("TcpRetryEvents", TcpRetryEvents)
+            _init_PropertyType(self, kwargs)
+
+    class RouteWeightedTarget(_PropertyType):
+        """The Weighted Target property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for WeightedTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-weightedtarget.html>`_
+        """
+
+        __slots__ = ("VirtualNode", "Weight")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteWeightedTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VirtualNode=None, Weight=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VirtualNode", VirtualNode)
+            _setattr("Weight", Weight)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteWeightedTarget_list = create_object_list_converter(
+        RouteWeightedTarget
+    )
+
+    class RouteGrpcRouteAction(_PropertyType):
+        """The Grpc Route Action property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for GrpcRouteAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-grpcrouteaction.html>`_
+        """
+
+        __slots__ = ("WeightedTargets",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteGrpcRouteAction",
+            _PropertyType,
+            __slots__,
+            converters={"WeightedTargets": _convert_RouteWeightedTarget_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, WeightedTargets=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "WeightedTargets", _convert_RouteWeightedTarget_list(WeightedTargets)
+            )
+            _init_PropertyType(self, kwargs)
+
+    class RouteMatchRange(_PropertyType):
+        """The Match Range property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for MatchRange
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-matchrange.html>`_
+        """
+
+        __slots__ = ("End", "Start")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteMatchRange", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, End=None, Start=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("End", End)
+            _setattr("Start", Start)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteMatchRange = create_object_converter(RouteMatchRange)
+
+    class RouteGrpcRouteMetadataMatchMethod(_PropertyType):
+        """The Grpc Route Metadata Match Method property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for GrpcRouteMetadataMatchMethod
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-grpcroutemetadatamatchmethod.html>`_
+        """
+
+        __slots__ = ("Exact", "Prefix", "Range", "Regex", "Suffix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteGrpcRouteMetadataMatchMethod",
+            _PropertyType,
+            __slots__,
+            converters={"Range": _convert_RouteMatchRange},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Exact=None,
+            Prefix=None,
+            Range=None,
+            Regex=None,
+            Suffix=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Exact", Exact)
+            _setattr("Prefix", Prefix)
+            _setattr("Range", _convert_RouteMatchRange(Range))
+            _setattr("Regex", Regex)
+            _setattr("Suffix", Suffix)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteGrpcRouteMetadataMatchMethod = create_object_converter(
+        RouteGrpcRouteMetadataMatchMethod
+    )
+
+    class RouteGrpcRouteMetadata(_PropertyType):
+        """The Grpc Route Metadata property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for GrpcRouteMetadata
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-grpcroutemetadata.html>`_
+        """
+
+        __slots__ = ("Invert", "Match", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteGrpcRouteMetadata",
+            _PropertyType,
+            __slots__,
+            converters={"Match": _convert_RouteGrpcRouteMetadataMatchMethod},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Invert=None, Match=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Invert", Invert)
+            _setattr("Match", _convert_RouteGrpcRouteMetadataMatchMethod(Match))
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteGrpcRouteMetadata_list = create_object_list_converter(
+        RouteGrpcRouteMetadata
+    )
+
+    class RouteGrpcRouteMatch(_PropertyType):
+        """The Grpc Route Match property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for GrpcRouteMatch
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-grpcroutematch.html>`_
+        """
+
+        __slots__ = ("Metadata", "MethodName", "ServiceName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteGrpcRouteMatch",
+            _PropertyType,
+            __slots__,
+            converters={"Metadata": _convert_RouteGrpcRouteMetadata_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Metadata=None, MethodName=None, ServiceName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Metadata", _convert_RouteGrpcRouteMetadata_list(Metadata))
+            _setattr("MethodName", MethodName)
+            _setattr("ServiceName", ServiceName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteGrpcRouteAction = create_object_converter(RouteGrpcRouteAction)
+    _convert_RouteGrpcRouteMatch = create_object_converter(RouteGrpcRouteMatch)
+    _convert_RouteGrpcRetryPolicy = create_object_converter(RouteGrpcRetryPolicy)
+
+    class RouteGrpcRoute(_PropertyType):
+        """The Grpc Route property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for GrpcRoute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-grpcroute.html>`_
+        """
+
+        __slots__ = ("Action", "Match", "RetryPolicy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteGrpcRoute",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Action": _convert_RouteGrpcRouteAction,
+                "Match": _convert_RouteGrpcRouteMatch,
+                "RetryPolicy": _convert_RouteGrpcRetryPolicy,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Action=None, Match=None, RetryPolicy=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", _convert_RouteGrpcRouteAction(Action))
+            _setattr("Match", _convert_RouteGrpcRouteMatch(Match))
+            _setattr("RetryPolicy", _convert_RouteGrpcRetryPolicy(RetryPolicy))
+            _init_PropertyType(self, kwargs)
+
+    class RouteHeaderMatchMethod(_PropertyType):
+        """The Header Match Method property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for HeaderMatchMethod
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-headermatchmethod.html>`_
+        """
+
+        __slots__ = ("Exact", "Prefix", "Range", "Regex", "Suffix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteHeaderMatchMethod",
+            _PropertyType,
+            __slots__,
+            converters={"Range": _convert_RouteMatchRange},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Exact=None,
+            Prefix=None,
+            Range=None,
+            Regex=None,
+            Suffix=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Exact", Exact)
+            _setattr("Prefix", Prefix)
+            _setattr("Range", _convert_RouteMatchRange(Range))
+            _setattr("Regex", Regex)
+            _setattr("Suffix", Suffix)
+            _init_PropertyType(self, kwargs)
+
+    class RouteHttpRetryPolicy(_PropertyType):
+        """The Http Retry Policy property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for HttpRetryPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-httpretrypolicy.html>`_
+        """
+
+        __slots__ = (
+            "HttpRetryEvents",
+            "MaxRetries",
+            "PerRetryTimeout",
+            "TcpRetryEvents",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteHttpRetryPolicy",
+            _PropertyType,
+            __slots__,
+            converters={"PerRetryTimeout": _convert_RouteDuration},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            HttpRetryEvents=None,
+            MaxRetries=None,
+            PerRetryTimeout=None,
+            TcpRetryEvents=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HttpRetryEvents", HttpRetryEvents)
+            _setattr("MaxRetries", MaxRetries)
+            _setattr("PerRetryTimeout", _convert_RouteDuration(PerRetryTimeout))
+            _setattr("TcpRetryEvents", TcpRetryEvents)
+            _init_PropertyType(self, kwargs)
+
+    class RouteHttpRouteAction(_PropertyType):
+        """The Http Route Action property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for HttpRouteAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-httprouteaction.html>`_
+        """
+
+        __slots__ = ("WeightedTargets",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteHttpRouteAction",
+            _PropertyType,
+            __slots__,
+            converters={"WeightedTargets": _convert_RouteWeightedTarget_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, WeightedTargets=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "WeightedTargets", _convert_RouteWeightedTarget_list(WeightedTargets)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteHeaderMatchMethod = create_object_converter(RouteHeaderMatchMethod)
+
+    class RouteHttpRouteHeader(_PropertyType):
+        """The Http Route Header property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for HttpRouteHeader
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-httprouteheader.html>`_
+        """
+
+        __slots__ = ("Invert", "Match", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteHttpRouteHeader",
+            _PropertyType,
+            __slots__,
+            converters={"Match": _convert_RouteHeaderMatchMethod},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Invert=None, Match=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Invert", Invert)
+            _setattr("Match", _convert_RouteHeaderMatchMethod(Match))
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteHttpRouteHeader_list = create_object_list_converter(
+        RouteHttpRouteHeader
+    )
+
+    class RouteHttpRouteMatch(_PropertyType):
+        """The Http Route Match property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for HttpRouteMatch
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-httproutematch.html>`_
+        """
+
+        __slots__ = ("Headers", "Method", "Prefix", "Scheme")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteHttpRouteMatch",
+            _PropertyType,
+            __slots__,
+            converters={"Headers": _convert_RouteHttpRouteHeader_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Headers=None, Method=None, Prefix=None, Scheme=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Headers", _convert_RouteHttpRouteHeader_list(Headers))
+            _setattr("Method", Method)
+            _setattr("Prefix", Prefix)
+            _setattr("Scheme", Scheme)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteHttpRouteAction = create_object_converter(RouteHttpRouteAction)
+    _convert_RouteHttpRouteMatch = create_object_converter(RouteHttpRouteMatch)
+    _convert_RouteHttpRetryPolicy = create_object_converter(RouteHttpRetryPolicy)
+
+    class RouteHttpRoute(_PropertyType):
+        """The Http Route property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for HttpRoute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-httproute.html>`_
+        """
+
+        __slots__ = ("Action", "Match", "RetryPolicy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteHttpRoute",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Action": _convert_RouteHttpRouteAction,
+                "Match": _convert_RouteHttpRouteMatch,
+                "RetryPolicy": _convert_RouteHttpRetryPolicy,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Action=None, Match=None, RetryPolicy=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", _convert_RouteHttpRouteAction(Action))
+            _setattr("Match", _convert_RouteHttpRouteMatch(Match))
+            _setattr("RetryPolicy", _convert_RouteHttpRetryPolicy(RetryPolicy))
+            _init_PropertyType(self, kwargs)
+
+    class RouteTcpRouteAction(_PropertyType):
+        """The Tcp Route Action property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for TcpRouteAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-tcprouteaction.html>`_
+        """
+
+        __slots__ = ("WeightedTargets",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteTcpRouteAction",
+            _PropertyType,
+            __slots__,
+            converters={"WeightedTargets": _convert_RouteWeightedTarget_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, WeightedTargets=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "WeightedTargets", _convert_RouteWeightedTarget_list(WeightedTargets)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteTcpRouteAction = create_object_converter(RouteTcpRouteAction)
+
+    class RouteTcpRoute(_PropertyType):
+        """The Tcp Route property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for TcpRoute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-tcproute.html>`_
+        """
+
+        __slots__ = ("Action",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteTcpRoute",
+            _PropertyType,
+            __slots__,
+            converters={"Action": _convert_RouteTcpRouteAction},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Action=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", _convert_RouteTcpRouteAction(Action))
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteGrpcRoute = create_object_converter(RouteGrpcRoute)
+    _convert_RouteHttpRoute = create_object_converter(RouteHttpRoute)
+    _convert_RouteTcpRoute = create_object_converter(RouteTcpRoute)
+
+    class RouteRouteSpec(_PropertyType):
+        """The Route Spec property type for Route in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for RouteSpec
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-route-routespec.html>`_
+        """
+
+        __slots__ = ("GrpcRoute", "Http2Route", "HttpRoute", "Priority", "TcpRoute")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteRouteSpec",
+            _PropertyType,
+            __slots__,
+            converters={
+                "GrpcRoute": _convert_RouteGrpcRoute,
+                "Http2Route": _convert_RouteHttpRoute,
+                "HttpRoute": _convert_RouteHttpRoute,
+                "TcpRoute": _convert_RouteTcpRoute,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            GrpcRoute=None,
+            Http2Route=None,
+            HttpRoute=None,
+            Priority=None,
+            TcpRoute=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GrpcRoute", _convert_RouteGrpcRoute(GrpcRoute))
+            _setattr("Http2Route", _convert_RouteHttpRoute(Http2Route))
+            _setattr("HttpRoute", _convert_RouteHttpRoute(HttpRoute))
+            _setattr("Priority", Priority)
+            _setattr("TcpRoute", _convert_RouteTcpRoute(TcpRoute))
+            _init_PropertyType(self, kwargs)
+
+    _convert_RouteRouteSpec = create_object_converter(RouteRouteSpec)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class RouteProperties(_ResourceProperties):
+        __slots__ = ("MeshName", "RouteName", "Spec", "Tags", "VirtualRouterName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Spec": _convert_RouteRouteSpec, "Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MeshName=None,
+            RouteName=None,
+            Spec=None,
+            Tags=None,
+            VirtualRouterName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MeshName", MeshName)
+            _setattr("RouteName", RouteName)
+            _setattr("Spec", _convert_RouteRouteSpec(Spec))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VirtualRouterName", VirtualRouterName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RouteProperties = create_object_converter(RouteProperties)
+
+    class Route(_Resource):
+        """A Route for AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for Route
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-route.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppMesh::Route"
 
+        Properties: RouteProperties
 
-@attrs(**ATTRSCONFIG)
-class Mesh(Resource):
-    """A Mesh for AppMesh.
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Route",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RouteProperties},
+            factories={"Properties": RouteProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for Mesh
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-mesh.html>`_
-    """
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RouteProperties()
+            _setattr("Properties", _convert_RouteProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::AppMesh::Mesh"
+    return (
+        Route,
+        RouteProperties,
+        RouteDuration,
+        RouteGrpcRetryPolicy,
+        RouteWeightedTarget,
+        RouteGrpcRouteAction,
+        RouteMatchRange,
+        RouteGrpcRouteMetadataMatchMethod,
+        RouteGrpcRouteMetadata,
+        RouteGrpcRouteMatch,
+        RouteGrpcRoute,
+        RouteHeaderMatchMethod,
+        RouteHttpRetryPolicy,
+        RouteHttpRouteAction,
+        RouteHttpRouteHeader,
+        RouteHttpRouteMatch,
+        RouteHttpRoute,
+        RouteTcpRouteAction,
+        RouteTcpRoute,
+        RouteRouteSpec,
+    )
+
+
+def _create_VirtualNode():
+    class VirtualNodeFileAccessLog(_PropertyType):
+        """The File Access Log property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for FileAccessLog
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-fileaccesslog.html>`_
+        """
 
-    Properties: MeshProperties = attrib(
-        factory=MeshProperties, converter=create_object_converter(MeshProperties)
+        __slots__ = ("Path",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeFileAccessLog", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Path=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Path", Path)
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualNodeFileAccessLog = create_object_converter(
+        VirtualNodeFileAccessLog
     )
 
+    class VirtualNodeAccessLog(_PropertyType):
+        """The Access Log property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccessLog
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-accesslog.html>`_
+        """
+
+        __slots__ = ("File",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeAccessLog",
+            _PropertyType,
+            __slots__,
+            converters={"File": _convert_VirtualNodeFileAccessLog},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class RouteProperties(ResourceProperties):
-    MeshName = attrib(default=None)
-    RouteName = attrib(default=None)
-    Spec = attrib(default=None)
-    Tags = attrib(default=None)
-    VirtualRouterName = attrib(default=None)
+        def __init__(self, *, File=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("File", _convert_VirtualNodeFileAccessLog(File))
+            _init_PropertyType(self, kwargs)
 
+    class VirtualNodeAwsCloudMapInstanceAttribute(_PropertyType):
+        """The Aws Cloud Map Instance Attribute property type for VirtualNode in AppMesh.
 
-@attrs(**ATTRSCONFIG)
-class Route(Resource):
-    """A Route for AppMesh.
+        See Also:
+            `AWS Cloud Formation documentation for AwsCloudMapInstanceAttribute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-awscloudmapinstanceattribute.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Route
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-route.html>`_
-    """
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeAwsCloudMapInstanceAttribute", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::AppMesh::Route"
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    Properties: RouteProperties = attrib(
-        factory=RouteProperties, converter=create_object_converter(RouteProperties)
+    _convert_VirtualNodeAwsCloudMapInstanceAttribute_list = (
+        create_object_list_converter(VirtualNodeAwsCloudMapInstanceAttribute)
     )
 
+    class VirtualNodeAwsCloudMapServiceDiscovery(_PropertyType):
+        """The Aws Cloud Map Service Discovery property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for AwsCloudMapServiceDiscovery
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-awscloudmapservicediscovery.html>`_
+        """
+
+        __slots__ = ("Attributes", "NamespaceName", "ServiceName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeAwsCloudMapServiceDiscovery",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Attributes": _convert_VirtualNodeAwsCloudMapInstanceAttribute_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Attributes=None, NamespaceName=None, ServiceName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Attributes",
+                _convert_VirtualNodeAwsCloudMapInstanceAttribute_list(Attributes),
+            )
+            _setattr("NamespaceName", NamespaceName)
+            _setattr("ServiceName", ServiceName)
+            _init_PropertyType(self, kwargs)
+
+    class VirtualNodeVirtualServiceBackend(_PropertyType):
+        """The Virtual Service Backend property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for VirtualServiceBackend
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-virtualservicebackend.html>`_
+        """
+
+        __slots__ = ("VirtualServiceName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeVirtualServiceBackend", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VirtualServiceName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VirtualServiceName", VirtualServiceName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualNodeVirtualServiceBackend = create_object_converter(
+        VirtualNodeVirtualServiceBackend
+    )
+
+    class VirtualNodeBackend(_PropertyType):
+        """The Backend property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for Backend
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-backend.html>`_
+        """
+
+        __slots__ = ("VirtualService",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeBackend",
+            _PropertyType,
+            __slots__,
+            converters={"VirtualService": _convert_VirtualNodeVirtualServiceBackend},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VirtualService=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "VirtualService",
+                _convert_VirtualNodeVirtualServiceBackend(VirtualService),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class VirtualNodeDnsServiceDiscovery(_PropertyType):
+        """The Dns Service Discovery property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for DnsServiceDiscovery
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-dnsservicediscovery.html>`_
+        """
+
+        __slots__ = ("Hostname",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeDnsServiceDiscovery", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Hostname=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Hostname", Hostname)
+            _init_PropertyType(self, kwargs)
+
+    class VirtualNodeHealthCheck(_PropertyType):
+        """The Health Check property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for HealthCheck
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-healthcheck.html>`_
+        """
+
+        __slots__ = (
+            "HealthyThreshold",
+            "IntervalMillis",
+            "Path",
+            "Port",
+            "Protocol",
+            "TimeoutMillis",
+            "UnhealthyThreshold",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeHealthCheck", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            HealthyThreshold=None,
+            IntervalMillis=None,
+            Path=None,
+            Port=None,
+            Protocol=None,
+            TimeoutMillis=None,
+            UnhealthyThreshold=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HealthyThreshold", HealthyThreshold)
+            _setattr("IntervalMillis", IntervalMillis)
+            _setattr("Path", Path)
+            _setattr("Port", Port)
+            _setattr("Protocol", Protocol)
+            _setattr("TimeoutMillis", TimeoutMillis)
+            _setattr("UnhealthyThreshold", UnhealthyThreshold)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class VirtualNodeProperties(ResourceProperties):
-    MeshName = attrib(default=None)
-    Spec = attrib(default=None)
-    Tags = attrib(default=None)
-    VirtualNodeName = attrib(default=None)
+    class VirtualNodePortMapping(_PropertyType):
+        """The Port Mapping property type for VirtualNode in AppMesh.
 
+        See Also:
+            `AWS Cloud Formation documentation for PortMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-portmapping.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class VirtualNode(Resource):
-    """A Virtual Node for AppMesh.
+        __slots__ = ("Port", "Protocol")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodePortMapping", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for VirtualNode
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-virtualnode.html>`_
-    """
+        def __init__(self, *, Port=None, Protocol=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Port", Port)
+            _setattr("Protocol", Protocol)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::AppMesh::VirtualNode"
+    _convert_VirtualNodeHealthCheck = create_object_converter(VirtualNodeHealthCheck)
+    _convert_VirtualNodePortMapping = create_object_converter(VirtualNodePortMapping)
 
-    Properties: VirtualNodeProperties = attrib(
-        factory=VirtualNodeProperties,
-        converter=create_object_converter(VirtualNodeProperties),
+    class VirtualNodeListener(_PropertyType):
+        """The Listener property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for Listener
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-listener.html>`_
+        """
+
+        __slots__ = ("HealthCheck", "PortMapping")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeListener",
+            _PropertyType,
+            __slots__,
+            converters={
+                "HealthCheck": _convert_VirtualNodeHealthCheck,
+                "PortMapping": _convert_VirtualNodePortMapping,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, HealthCheck=None, PortMapping=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HealthCheck", _convert_VirtualNodeHealthCheck(HealthCheck))
+            _setattr("PortMapping", _convert_VirtualNodePortMapping(PortMapping))
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualNodeAccessLog = create_object_converter(VirtualNodeAccessLog)
+
+    class VirtualNodeLogging(_PropertyType):
+        """The Logging property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for Logging
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-logging.html>`_
+        """
+
+        __slots__ = ("AccessLog",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeLogging",
+            _PropertyType,
+            __slots__,
+            converters={"AccessLog": _convert_VirtualNodeAccessLog},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AccessLog=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccessLog", _convert_VirtualNodeAccessLog(AccessLog))
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualNodeAwsCloudMapServiceDiscovery = create_object_converter(
+        VirtualNodeAwsCloudMapServiceDiscovery
+    )
+    _convert_VirtualNodeDnsServiceDiscovery = create_object_converter(
+        VirtualNodeDnsServiceDiscovery
     )
 
+    class VirtualNodeServiceDiscovery(_PropertyType):
+        """The Service Discovery property type for VirtualNode in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for ServiceDiscovery
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-servicediscovery.html>`_
+        """
+
+        __slots__ = ("AWSCloudMap", "DNS")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeServiceDiscovery",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AWSCloudMap": _convert_VirtualNodeAwsCloudMapServiceDiscovery,
+                "DNS": _convert_VirtualNodeDnsServiceDiscovery,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class VirtualRouterProperties(ResourceProperties):
-    MeshName = attrib(default=None)
-    Spec = attrib(default=None)
-    Tags = attrib(default=None)
-    VirtualRouterName = attrib(default=None)
+        def __init__(self, *, AWSCloudMap=None, DNS=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AWSCloudMap",
+                _convert_VirtualNodeAwsCloudMapServiceDiscovery(AWSCloudMap),
+            )
+            _setattr("DNS", _convert_VirtualNodeDnsServiceDiscovery(DNS))
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualNodeBackend_list = create_object_list_converter(VirtualNodeBackend)
+    _convert_VirtualNodeListener_list = create_object_list_converter(
+        VirtualNodeListener
+    )
+    _convert_VirtualNodeLogging = create_object_converter(VirtualNodeLogging)
+    _convert_VirtualNodeServiceDiscovery = create_object_converter(
+        VirtualNodeServiceDiscovery
+    )
 
+    class VirtualNodeVirtualNodeSpec(_PropertyType):
+        """The Virtual Node Spec property type for VirtualNode in AppMesh.
 
-@attrs(**ATTRSCONFIG)
-class VirtualRouter(Resource):
-    """A Virtual Router for AppMesh.
+        See Also:
+            `AWS Cloud Formation documentation for VirtualNodeSpec
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualnode-virtualnodespec.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for VirtualRouter
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-virtualrouter.html>`_
-    """
+        __slots__ = ("Backends", "Listeners", "Logging", "ServiceDiscovery")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeVirtualNodeSpec",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Backends": _convert_VirtualNodeBackend_list,
+                "Listeners": _convert_VirtualNodeListener_list,
+                "Logging": _convert_VirtualNodeLogging,
+                "ServiceDiscovery": _convert_VirtualNodeServiceDiscovery,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::AppMesh::VirtualRouter"
+        def __init__(
+            self,
+            *,
+            Backends=None,
+            Listeners=None,
+            Logging=None,
+            ServiceDiscovery=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Backends", _convert_VirtualNodeBackend_list(Backends))
+            _setattr("Listeners", _convert_VirtualNodeListener_list(Listeners))
+            _setattr("Logging", _convert_VirtualNodeLogging(Logging))
+            _setattr(
+                "ServiceDiscovery",
+                _convert_VirtualNodeServiceDiscovery(ServiceDiscovery),
+            )
+            _init_PropertyType(self, kwargs)
 
-    Properties: VirtualRouterProperties = attrib(
-        factory=VirtualRouterProperties,
-        converter=create_object_converter(VirtualRouterProperties),
+    _convert_VirtualNodeVirtualNodeSpec = create_object_converter(
+        VirtualNodeVirtualNodeSpec
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
 
+    class VirtualNodeProperties(_ResourceProperties):
+        __slots__ = ("MeshName", "Spec", "Tags", "VirtualNodeName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNodeProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Spec": _convert_VirtualNodeVirtualNodeSpec,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class VirtualServiceProperties(ResourceProperties):
-    MeshName = attrib(default=None)
-    Spec = attrib(default=None)
-    Tags = attrib(default=None)
-    VirtualServiceName = attrib(default=None)
+        def __init__(
+            self, *, MeshName=None, Spec=None, Tags=None, VirtualNodeName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MeshName", MeshName)
+            _setattr("Spec", _convert_VirtualNodeVirtualNodeSpec(Spec))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VirtualNodeName", VirtualNodeName)
+            _init_ResourceProperties(self, kwargs)
 
+    _convert_VirtualNodeProperties = create_object_converter(VirtualNodeProperties)
 
-@attrs(**ATTRSCONFIG)
-class VirtualService(Resource):
-    """A Virtual Service for AppMesh.
+    class VirtualNode(_Resource):
+        """A Virtual Node for AppMesh.
 
-    See Also:
-        `AWS Cloud Formation documentation for VirtualService
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-virtualservice.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for VirtualNode
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-virtualnode.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::AppMesh::VirtualService"
+        RESOURCE_TYPE = "AWS::AppMesh::VirtualNode"
 
-    Properties: VirtualServiceProperties = attrib(
-        factory=VirtualServiceProperties,
-        converter=create_object_converter(VirtualServiceProperties),
+        Properties: VirtualNodeProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualNode",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VirtualNodeProperties},
+            factories={"Properties": VirtualNodeProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VirtualNodeProperties()
+            _setattr("Properties", _convert_VirtualNodeProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        VirtualNode,
+        VirtualNodeProperties,
+        VirtualNodeFileAccessLog,
+        VirtualNodeAccessLog,
+        VirtualNodeAwsCloudMapInstanceAttribute,
+        VirtualNodeAwsCloudMapServiceDiscovery,
+        VirtualNodeVirtualServiceBackend,
+        VirtualNodeBackend,
+        VirtualNodeDnsServiceDiscovery,
+        VirtualNodeHealthCheck,
+        VirtualNodePortMapping,
+        VirtualNodeListener,
+        VirtualNodeLogging,
+        VirtualNodeServiceDiscovery,
+        VirtualNodeVirtualNodeSpec,
+    )
+
+
+def _create_VirtualRouter():
+    class VirtualRouterPortMapping(_PropertyType):
+        """The Port Mapping property type for VirtualRouter in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for PortMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualrouter-portmapping.html>`_
+        """
+
+        __slots__ = ("Port", "Protocol")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualRouterPortMapping", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Port=None, Protocol=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Port", Port)
+            _setattr("Protocol", Protocol)
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualRouterPortMapping = create_object_converter(
+        VirtualRouterPortMapping
     )
+
+    class VirtualRouterVirtualRouterListener(_PropertyType):
+        """The Virtual Router Listener property type for VirtualRouter in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for VirtualRouterListener
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualrouter-virtualrouterlistener.html>`_
+        """
+
+        __slots__ = ("PortMapping",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualRouterVirtualRouterListener",
+            _PropertyType,
+            __slots__,
+            converters={"PortMapping": _convert_VirtualRouterPortMapping},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PortMapping=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PortMapping", _convert_VirtualRouterPortMapping(PortMapping))
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualRouterVirtualRouterListener_list = create_object_list_converter(
+        VirtualRouterVirtualRouterListener
+    )
+
+    class VirtualRouterVirtualRouterSpec(_PropertyType):
+        """The Virtual Router Spec property type for VirtualRouter in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for VirtualRouterSpec
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualrouter-virtualrouterspec.html>`_
+        """
+
+        __slots__ = ("Listeners",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualRouterVirtualRouterSpec",
+            _PropertyType,
+            __slots__,
+            converters={"Listeners": _convert_VirtualRouterVirtualRouterListener_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Listeners=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Listeners", _convert_VirtualRouterVirtualRouterListener_list(Listeners)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualRouterVirtualRouterSpec = create_object_converter(
+        VirtualRouterVirtualRouterSpec
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class VirtualRouterProperties(_ResourceProperties):
+        __slots__ = ("MeshName", "Spec", "Tags", "VirtualRouterName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualRouterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Spec": _convert_VirtualRouterVirtualRouterSpec,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MeshName=None,
+            Spec=None,
+            Tags=None,
+            VirtualRouterName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MeshName", MeshName)
+            _setattr("Spec", _convert_VirtualRouterVirtualRouterSpec(Spec))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VirtualRouterName", VirtualRouterName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VirtualRouterProperties = create_object_converter(VirtualRouterProperties)
+
+    class VirtualRouter(_Resource):
+        """A Virtual Router for AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for VirtualRouter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-virtualrouter.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppMesh::VirtualRouter"
+
+        Properties: VirtualRouterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualRouter",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VirtualRouterProperties},
+            factories={"Properties": VirtualRouterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VirtualRouterProperties()
+            _setattr("Properties", _convert_VirtualRouterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        VirtualRouter,
+        VirtualRouterProperties,
+        VirtualRouterPortMapping,
+        VirtualRouterVirtualRouterListener,
+        VirtualRouterVirtualRouterSpec,
+    )
+
+
+def _create_VirtualService():
+    class VirtualServiceVirtualNodeServiceProvider(_PropertyType):
+        """The Virtual Node Service Provider property type for VirtualService in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for VirtualNodeServiceProvider
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualservice-virtualnodeserviceprovider.html>`_
+        """
+
+        __slots__ = ("VirtualNodeName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualServiceVirtualNodeServiceProvider", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VirtualNodeName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VirtualNodeName", VirtualNodeName)
+            _init_PropertyType(self, kwargs)
+
+    class VirtualServiceVirtualRouterServiceProvider(_PropertyType):
+        """The Virtual Router Service Provider property type for VirtualService in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for VirtualRouterServiceProvider
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualservice-virtualrouterserviceprovider.html>`_
+        """
+
+        __slots__ = ("VirtualRouterName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualServiceVirtualRouterServiceProvider", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VirtualRouterName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VirtualRouterName", VirtualRouterName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualServiceVirtualNodeServiceProvider = create_object_converter(
+        VirtualServiceVirtualNodeServiceProvider
+    )
+    _convert_VirtualServiceVirtualRouterServiceProvider = create_object_converter(
+        VirtualServiceVirtualRouterServiceProvider
+    )
+
+    class VirtualServiceVirtualServiceProvider(_PropertyType):
+        """The Virtual Service Provider property type for VirtualService in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for VirtualServiceProvider
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualservice-virtualserviceprovider.html>`_
+        """
+
+        __slots__ = ("VirtualNode", "VirtualRouter")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualServiceVirtualServiceProvider",
+            _PropertyType,
+            __slots__,
+            converters={
+                "VirtualNode": _convert_VirtualServiceVirtualNodeServiceProvider,
+                "VirtualRouter": _convert_VirtualServiceVirtualRouterServiceProvider,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VirtualNode=None, VirtualRouter=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "VirtualNode",
+                _convert_VirtualServiceVirtualNodeServiceProvider(VirtualNode),
+            )
+            _setattr(
+                "VirtualRouter",
+                _convert_VirtualServiceVirtualRouterServiceProvider(VirtualRouter),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualServiceVirtualServiceProvider = create_object_converter(
+        VirtualServiceVirtualServiceProvider
+    )
+
+    class VirtualServiceVirtualServiceSpec(_PropertyType):
+        """The Virtual Service Spec property type for VirtualService in AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for VirtualServiceSpec
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appmesh-virtualservice-virtualservicespec.html>`_
+        """
+
+        __slots__ = ("Provider",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualServiceVirtualServiceSpec",
+            _PropertyType,
+            __slots__,
+            converters={"Provider": _convert_VirtualServiceVirtualServiceProvider},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Provider=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Provider", _convert_VirtualServiceVirtualServiceProvider(Provider)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_VirtualServiceVirtualServiceSpec = create_object_converter(
+        VirtualServiceVirtualServiceSpec
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class VirtualServiceProperties(_ResourceProperties):
+        __slots__ = ("MeshName", "Spec", "Tags", "VirtualServiceName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualServiceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Spec": _convert_VirtualServiceVirtualServiceSpec,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MeshName=None,
+            Spec=None,
+            Tags=None,
+            VirtualServiceName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MeshName", MeshName)
+            _setattr("Spec", _convert_VirtualServiceVirtualServiceSpec(Spec))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VirtualServiceName", VirtualServiceName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VirtualServiceProperties = create_object_converter(
+        VirtualServiceProperties
+    )
+
+    class VirtualService(_Resource):
+        """A Virtual Service for AppMesh.
+
+        See Also:
+            `AWS Cloud Formation documentation for VirtualService
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appmesh-virtualservice.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppMesh::VirtualService"
+
+        Properties: VirtualServiceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VirtualService",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VirtualServiceProperties},
+            factories={"Properties": VirtualServiceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VirtualServiceProperties()
+            _setattr("Properties", _convert_VirtualServiceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        VirtualService,
+        VirtualServiceProperties,
+        VirtualServiceVirtualNodeServiceProvider,
+        VirtualServiceVirtualRouterServiceProvider,
+        VirtualServiceVirtualServiceProvider,
+        VirtualServiceVirtualServiceSpec,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Mesh": _create_Mesh,
+        "MeshProperties": _create_Mesh,
+        "MeshEgressFilter": _create_Mesh,
+        "MeshMeshSpec": _create_Mesh,
+        "Route": _create_Route,
+        "RouteProperties": _create_Route,
+        "RouteDuration": _create_Route,
+        "RouteGrpcRetryPolicy": _create_Route,
+        "RouteGrpcRoute": _create_Route,
+        "RouteGrpcRouteAction": _create_Route,
+        "RouteGrpcRouteMatch": _create_Route,
+        "RouteGrpcRouteMetadata": _create_Route,
+        "RouteGrpcRouteMetadataMatchMethod": _create_Route,
+        "RouteHeaderMatchMethod": _create_Route,
+        "RouteHttpRetryPolicy": _create_Route,
+        "RouteHttpRoute": _create_Route,
+        "RouteHttpRouteAction": _create_Route,
+        "RouteHttpRouteHeader": _create_Route,
+        "RouteHttpRouteMatch": _create_Route,
+        "RouteMatchRange": _create_Route,
+        "RouteRouteSpec": _create_Route,
+        "RouteTcpRoute": _create_Route,
+        "RouteTcpRouteAction": _create_Route,
+        "RouteWeightedTarget": _create_Route,
+        "VirtualNode": _create_VirtualNode,
+        "VirtualNodeProperties": _create_VirtualNode,
+        "VirtualNodeAccessLog": _create_VirtualNode,
+        "VirtualNodeAwsCloudMapInstanceAttribute": _create_VirtualNode,
+        "VirtualNodeAwsCloudMapServiceDiscovery": _create_VirtualNode,
+        "VirtualNodeBackend": _create_VirtualNode,
+        "VirtualNodeDnsServiceDiscovery": _create_VirtualNode,
+        "VirtualNodeFileAccessLog": _create_VirtualNode,
+        "VirtualNodeHealthCheck": _create_VirtualNode,
+        "VirtualNodeListener": _create_VirtualNode,
+        "VirtualNodeLogging": _create_VirtualNode,
+        "VirtualNodePortMapping": _create_VirtualNode,
+        "VirtualNodeServiceDiscovery": _create_VirtualNode,
+        "VirtualNodeVirtualNodeSpec": _create_VirtualNode,
+        "VirtualNodeVirtualServiceBackend": _create_VirtualNode,
+        "VirtualRouter": _create_VirtualRouter,
+        "VirtualRouterProperties": _create_VirtualRouter,
+        "VirtualRouterPortMapping": _create_VirtualRouter,
+        "VirtualRouterVirtualRouterListener": _create_VirtualRouter,
+        "VirtualRouterVirtualRouterSpec": _create_VirtualRouter,
+        "VirtualService": _create_VirtualService,
+        "VirtualServiceProperties": _create_VirtualService,
+        "VirtualServiceVirtualNodeServiceProvider": _create_VirtualService,
+        "VirtualServiceVirtualRouterServiceProvider": _create_VirtualService,
+        "VirtualServiceVirtualServiceProvider": _create_VirtualService,
+        "VirtualServiceVirtualServiceSpec": _create_VirtualService,
+    },
+)
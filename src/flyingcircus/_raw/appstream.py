@@ -7,23 +7,42 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "DirectoryConfig",
     "DirectoryConfigProperties",
+    "DirectoryConfigServiceAccountCredentials",
     "Fleet",
     "FleetProperties",
+    "FleetComputeCapacity",
+    "FleetDomainJoinInfo",
+    "FleetVpcConfig",
     "ImageBuilder",
     "ImageBuilderProperties",
+    "ImageBuilderAccessEndpoint",
+    "ImageBuilderDomainJoinInfo",
+    "ImageBuilderVpcConfig",
     "Stack",
     "StackProperties",
+    "StackAccessEndpoint",
+    "StackApplicationSettings",
+    "StackStorageConnector",
+    "StackUserSetting",
     "StackFleetAssociation",
     "StackFleetAssociationProperties",
     "StackUserAssociation",
@@ -33,199 +52,951 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class DirectoryConfigProperties(ResourceProperties):
-    DirectoryName = attrib(default=None)
-    OrganizationalUnitDistinguishedNames = attrib(default=None)
-    ServiceAccountCredentials = attrib(default=None)
+def _create_DirectoryConfig():
+    class DirectoryConfigServiceAccountCredentials(_PropertyType):
+        """The Service Account Credentials property type for DirectoryConfig in AppStream.
 
+        See Also:
+            `AWS Cloud Formation documentation for ServiceAccountCredentials
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-directoryconfig-serviceaccountcredentials.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class DirectoryConfig(Resource):
-    """A Directory Config for AppStream.
+        __slots__ = ("AccountName", "AccountPassword")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DirectoryConfigServiceAccountCredentials", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for DirectoryConfig
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-directoryconfig.html>`_
-    """
+        def __init__(self, *, AccountName=None, AccountPassword=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccountName", AccountName)
+            _setattr("AccountPassword", AccountPassword)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::AppStream::DirectoryConfig"
-
-    Properties: DirectoryConfigProperties = attrib(
-        factory=DirectoryConfigProperties,
-        converter=create_object_converter(DirectoryConfigProperties),
+    _convert_DirectoryConfigServiceAccountCredentials = create_object_converter(
+        DirectoryConfigServiceAccountCredentials
     )
 
-
-@attrs(**ATTRSCONFIG)
-class FleetProperties(ResourceProperties):
-    ComputeCapacity = attrib(default=None)
-    Description = attrib(default=None)
-    DisconnectTimeoutInSeconds = attrib(default=None)
-    DisplayName = attrib(default=None)
-    DomainJoinInfo = attrib(default=None)
-    EnableDefaultInternetAccess = attrib(default=None)
-    FleetType = attrib(default=None)
-    IdleDisconnectTimeoutInSeconds = attrib(default=None)
-    ImageArn = attrib(default=None)
-    ImageName = attrib(default=None)
-    InstanceType = attrib(default=None)
-    MaxUserDurationInSeconds = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcConfig = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Fleet(Resource):
-    """A Fleet for AppStream.
-
-    See Also:
-        `AWS Cloud Formation documentation for Fleet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-fleet.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AppStream::Fleet"
-
-    Properties: FleetProperties = attrib(
-        factory=FleetProperties, converter=create_object_converter(FleetProperties)
+    class DirectoryConfigProperties(_ResourceProperties):
+        __slots__ = (
+            "DirectoryName",
+            "OrganizationalUnitDistinguishedNames",
+            "ServiceAccountCredentials",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DirectoryConfigProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ServiceAccountCredentials": _convert_DirectoryConfigServiceAccountCredentials
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DirectoryName=None,
+            OrganizationalUnitDistinguishedNames=None,
+            ServiceAccountCredentials=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DirectoryName", DirectoryName)
+            _setattr(
+                "OrganizationalUnitDistinguishedNames",
+                OrganizationalUnitDistinguishedNames,
+            )
+            _setattr(
+                "ServiceAccountCredentials",
+                _convert_DirectoryConfigServiceAccountCredentials(
+                    ServiceAccountCredentials
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DirectoryConfigProperties = create_object_converter(
+        DirectoryConfigProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ImageBuilderProperties(ResourceProperties):
-    AccessEndpoints = attrib(default=None)
-    AppstreamAgentVersion = attrib(default=None)
-    Description = attrib(default=None)
-    DisplayName = attrib(default=None)
-    DomainJoinInfo = attrib(default=None)
-    EnableDefaultInternetAccess = attrib(default=None)
-    ImageArn = attrib(default=None)
-    ImageName = attrib(default=None)
-    InstanceType = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcConfig = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ImageBuilder(Resource):
-    """A Image Builder for AppStream.
-
-    See Also:
-        `AWS Cloud Formation documentation for ImageBuilder
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-imagebuilder.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AppStream::ImageBuilder"
-
-    Properties: ImageBuilderProperties = attrib(
-        factory=ImageBuilderProperties,
-        converter=create_object_converter(ImageBuilderProperties),
+    class DirectoryConfig(_Resource):
+        """A Directory Config for AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for DirectoryConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-directoryconfig.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppStream::DirectoryConfig"
+
+        Properties: DirectoryConfigProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DirectoryConfig",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DirectoryConfigProperties},
+            factories={"Properties": DirectoryConfigProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DirectoryConfigProperties()
+            _setattr("Properties", _convert_DirectoryConfigProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        DirectoryConfig,
+        DirectoryConfigProperties,
+        DirectoryConfigServiceAccountCredentials,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class StackProperties(ResourceProperties):
-    AccessEndpoints = attrib(default=None)
-    ApplicationSettings = attrib(default=None)
-    AttributesToDelete = attrib(default=None)
-    DeleteStorageConnectors = attrib(default=None)
-    Description = attrib(default=None)
-    DisplayName = attrib(default=None)
-    EmbedHostDomains = attrib(default=None)
-    FeedbackURL = attrib(default=None)
-    Name = attrib(default=None)
-    RedirectURL = attrib(default=None)
-    StorageConnectors = attrib(default=None)
-    Tags = attrib(default=None)
-    UserSettings = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Stack(Resource):
-    """A Stack for AppStream.
-
-    See Also:
-        `AWS Cloud Formation documentation for Stack
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-stack.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AppStream::Stack"
-
-    Properties: StackProperties = attrib(
-        factory=StackProperties, converter=create_object_converter(StackProperties)
+def _create_Fleet():
+    class FleetComputeCapacity(_PropertyType):
+        """The Compute Capacity property type for Fleet in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for ComputeCapacity
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-fleet-computecapacity.html>`_
+        """
+
+        __slots__ = ("DesiredInstances",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetComputeCapacity", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DesiredInstances=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DesiredInstances", DesiredInstances)
+            _init_PropertyType(self, kwargs)
+
+    class FleetDomainJoinInfo(_PropertyType):
+        """The Domain Join Info property type for Fleet in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for DomainJoinInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-fleet-domainjoininfo.html>`_
+        """
+
+        __slots__ = ("DirectoryName", "OrganizationalUnitDistinguishedName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetDomainJoinInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DirectoryName=None,
+            OrganizationalUnitDistinguishedName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DirectoryName", DirectoryName)
+            _setattr(
+                "OrganizationalUnitDistinguishedName",
+                OrganizationalUnitDistinguishedName,
+            )
+            _init_PropertyType(self, kwargs)
+
+    class FleetVpcConfig(_PropertyType):
+        """The Vpc Config property type for Fleet in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for VpcConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-fleet-vpcconfig.html>`_
+        """
+
+        __slots__ = ("SecurityGroupIds", "SubnetIds")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetVpcConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SecurityGroupIds=None, SubnetIds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SubnetIds", SubnetIds)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FleetComputeCapacity = create_object_converter(FleetComputeCapacity)
+    _convert_FleetDomainJoinInfo = create_object_converter(FleetDomainJoinInfo)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_FleetVpcConfig = create_object_converter(FleetVpcConfig)
+
+    class FleetProperties(_ResourceProperties):
+        __slots__ = (
+            "ComputeCapacity",
+            "Description",
+            "DisconnectTimeoutInSeconds",
+            "DisplayName",
+            "DomainJoinInfo",
+            "EnableDefaultInternetAccess",
+            "FleetType",
+            "IdleDisconnectTimeoutInSeconds",
+            "ImageArn",
+            "ImageName",
+            "InstanceType",
+            "MaxUserDurationInSeconds",
+            "Name",
+            "Tags",
+            "VpcConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ComputeCapacity": _convert_FleetComputeCapacity,
+                "DomainJoinInfo": _convert_FleetDomainJoinInfo,
+                "Tags": _convert_Tag_list,
+                "VpcConfig": _convert_FleetVpcConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ComputeCapacity=None,
+            Description=None,
+            DisconnectTimeoutInSeconds=None,
+            DisplayName=None,
+            DomainJoinInfo=None,
+            EnableDefaultInternetAccess=None,
+            FleetType=None,
+            IdleDisconnectTimeoutInSeconds=None,
+            ImageArn=None,
+            ImageName=None,
+            InstanceType=None,
+            MaxUserDurationInSeconds=None,
+            Name=None,
+            Tags=None,
+            VpcConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComputeCapacity", _convert_FleetComputeCapacity(ComputeCapacity))
+            _setattr("Description", Description)
+            _setattr("DisconnectTimeoutInSeconds", DisconnectTimeoutInSeconds)
+            _setattr("DisplayName", DisplayName)
+            _setattr("DomainJoinInfo", _convert_FleetDomainJoinInfo(DomainJoinInfo))
+            _setattr("EnableDefaultInternetAccess", EnableDefaultInternetAccess)
+            _setattr("FleetType", FleetType)
+            _setattr("IdleDisconnectTimeoutInSeconds", IdleDisconnectTimeoutInSeconds)
+            _setattr("ImageArn", ImageArn)
+            _setattr("ImageName", ImageName)
+            _setattr("InstanceType", InstanceType)
+            _setattr("MaxUserDurationInSeconds", MaxUserDurationInSeconds)
+            _setattr("Name", Name)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcConfig", _convert_FleetVpcConfig(VpcConfig))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FleetProperties = create_object_converter(FleetProperties)
+
+    class Fleet(_Resource):
+        """A Fleet for AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for Fleet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-fleet.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppStream::Fleet"
+
+        Properties: FleetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Fleet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FleetProperties},
+            factories={"Properties": FleetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FleetProperties()
+            _setattr("Properties", _convert_FleetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Fleet,
+        FleetProperties,
+        FleetComputeCapacity,
+        FleetDomainJoinInfo,
+        FleetVpcConfig,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class StackFleetAssociationProperties(ResourceProperties):
-    FleetName = attrib(default=None)
-    StackName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class StackFleetAssociation(Resource):
-    """A Stack Fleet Association for AppStream.
-
-    See Also:
-        `AWS Cloud Formation documentation for StackFleetAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-stackfleetassociation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AppStream::StackFleetAssociation"
-
-    Properties: StackFleetAssociationProperties = attrib(
-        factory=StackFleetAssociationProperties,
-        converter=create_object_converter(StackFleetAssociationProperties),
+def _create_ImageBuilder():
+    class ImageBuilderAccessEndpoint(_PropertyType):
+        """The Access Endpoint property type for ImageBuilder in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccessEndpoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-imagebuilder-accessendpoint.html>`_
+        """
+
+        __slots__ = ("EndpointType", "VpceId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ImageBuilderAccessEndpoint", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EndpointType=None, VpceId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EndpointType", EndpointType)
+            _setattr("VpceId", VpceId)
+            _init_PropertyType(self, kwargs)
+
+    class ImageBuilderDomainJoinInfo(_PropertyType):
+        """The Domain Join Info property type for ImageBuilder in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for DomainJoinInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-imagebuilder-domainjoininfo.html>`_
+        """
+
+        __slots__ = ("DirectoryName", "OrganizationalUnitDistinguishedName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ImageBuilderDomainJoinInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DirectoryName=None,
+            OrganizationalUnitDistinguishedName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DirectoryName", DirectoryName)
+            _setattr(
+                "OrganizationalUnitDistinguishedName",
+                OrganizationalUnitDistinguishedName,
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ImageBuilderVpcConfig(_PropertyType):
+        """The Vpc Config property type for ImageBuilder in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for VpcConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-imagebuilder-vpcconfig.html>`_
+        """
+
+        __slots__ = ("SecurityGroupIds", "SubnetIds")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ImageBuilderVpcConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SecurityGroupIds=None, SubnetIds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SubnetIds", SubnetIds)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ImageBuilderAccessEndpoint_list = create_object_list_converter(
+        ImageBuilderAccessEndpoint
     )
-
-
-@attrs(**ATTRSCONFIG)
-class StackUserAssociationProperties(ResourceProperties):
-    AuthenticationType = attrib(default=None)
-    SendEmailNotification = attrib(default=None)
-    StackName = attrib(default=None)
-    UserName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class StackUserAssociation(Resource):
-    """A Stack User Association for AppStream.
-
-    See Also:
-        `AWS Cloud Formation documentation for StackUserAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-stackuserassociation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AppStream::StackUserAssociation"
-
-    Properties: StackUserAssociationProperties = attrib(
-        factory=StackUserAssociationProperties,
-        converter=create_object_converter(StackUserAssociationProperties),
+    _convert_ImageBuilderDomainJoinInfo = create_object_converter(
+        ImageBuilderDomainJoinInfo
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_ImageBuilderVpcConfig = create_object_converter(ImageBuilderVpcConfig)
+
+    class ImageBuilderProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessEndpoints",
+            "AppstreamAgentVersion",
+            "Description",
+            "DisplayName",
+            "DomainJoinInfo",
+            "EnableDefaultInternetAccess",
+            "ImageArn",
+            "ImageName",
+            "InstanceType",
+            "Name",
+            "Tags",
+            "VpcConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ImageBuilderProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AccessEndpoints": _convert_ImageBuilderAccessEndpoint_list,
+                "DomainJoinInfo": _convert_ImageBuilderDomainJoinInfo,
+                "Tags": _convert_Tag_list,
+                "VpcConfig": _convert_ImageBuilderVpcConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessEndpoints=None,
+            AppstreamAgentVersion=None,
+            Description=None,
+            DisplayName=None,
+            DomainJoinInfo=None,
+            EnableDefaultInternetAccess=None,
+            ImageArn=None,
+            ImageName=None,
+            InstanceType=None,
+            Name=None,
+            Tags=None,
+            VpcConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccessEndpoints",
+                _convert_ImageBuilderAccessEndpoint_list(AccessEndpoints),
+            )
+            _setattr("AppstreamAgentVersion", AppstreamAgentVersion)
+            _setattr("Description", Description)
+            _setattr("DisplayName", DisplayName)
+            _setattr(
+                "DomainJoinInfo", _convert_ImageBuilderDomainJoinInfo(DomainJoinInfo)
+            )
+            _setattr("EnableDefaultInternetAccess", EnableDefaultInternetAccess)
+            _setattr("ImageArn", ImageArn)
+            _setattr("ImageName", ImageName)
+            _setattr("InstanceType", InstanceType)
+            _setattr("Name", Name)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcConfig", _convert_ImageBuilderVpcConfig(VpcConfig))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ImageBuilderProperties = create_object_converter(ImageBuilderProperties)
+
+    class ImageBuilder(_Resource):
+        """A Image Builder for AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for ImageBuilder
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-imagebuilder.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppStream::ImageBuilder"
+
+        Properties: ImageBuilderProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ImageBuilder",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ImageBuilderProperties},
+            factories={"Properties": ImageBuilderProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ImageBuilderProperties()
+            _setattr("Properties", _convert_ImageBuilderProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ImageBuilder,
+        ImageBuilderProperties,
+        ImageBuilderAccessEndpoint,
+        ImageBuilderDomainJoinInfo,
+        ImageBuilderVpcConfig,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class UserProperties(ResourceProperties):
-    AuthenticationType = attrib(default=None)
-    FirstName = attrib(default=None)
-    LastName = attrib(default=None)
-    MessageAction = attrib(default=None)
-    UserName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class User(Resource):
-    """A User for AppStream.
+def _create_Stack():
+    class StackAccessEndpoint(_PropertyType):
+        """The Access Endpoint property type for Stack in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccessEndpoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-stack-accessendpoint.html>`_
+        """
+
+        __slots__ = ("EndpointType", "VpceId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackAccessEndpoint", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EndpointType=None, VpceId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EndpointType", EndpointType)
+            _setattr("VpceId", VpceId)
+            _init_PropertyType(self, kwargs)
+
+    class StackApplicationSettings(_PropertyType):
+        """The Application Settings property type for Stack in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-stack-applicationsettings.html>`_
+        """
+
+        __slots__ = ("Enabled", "SettingsGroup")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackApplicationSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Enabled=None, SettingsGroup=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr("SettingsGroup", SettingsGroup)
+            _init_PropertyType(self, kwargs)
+
+    class StackStorageConnector(_PropertyType):
+        """The Storage Connector property type for Stack in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for StorageConnector
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-stack-storageconnector.html>`_
+        """
+
+        __slots__ = ("ConnectorType", "Domains", "ResourceIdentifier")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackStorageConnector", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ConnectorType=None, Domains=None, ResourceIdentifier=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConnectorType", ConnectorType)
+            _setattr("Domains", Domains)
+            _setattr("ResourceIdentifier", ResourceIdentifier)
+            _init_PropertyType(self, kwargs)
+
+    class StackUserSetting(_PropertyType):
+        """The User Setting property type for Stack in AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appstream-stack-usersetting.html>`_
+        """
+
+        __slots__ = ("Action", "Permission")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackUserSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Action=None, Permission=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", Action)
+            _setattr("Permission", Permission)
+            _init_PropertyType(self, kwargs)
+
+    _convert_StackAccessEndpoint_list = create_object_list_converter(
+        StackAccessEndpoint
+    )
+    _convert_StackApplicationSettings = create_object_converter(
+        StackApplicationSettings
+    )
+    _convert_StackStorageConnector_list = create_object_list_converter(
+        StackStorageConnector
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_StackUserSetting_list = create_object_list_converter(StackUserSetting)
+
+    class StackProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessEndpoints",
+            "ApplicationSettings",
+            "AttributesToDelete",
+            "DeleteStorageConnectors",
+            "Description",
+            "DisplayName",
+            "EmbedHostDomains",
+            "FeedbackURL",
+            "Name",
+            "RedirectURL",
+            "StorageConnectors",
+            "Tags",
+            "UserSettings",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AccessEndpoints": _convert_StackAccessEndpoint_list,
+                "ApplicationSettings": _convert_StackApplicationSettings,
+                "StorageConnectors": _convert_StackStorageConnector_list,
+                "Tags": _convert_Tag_list,
+                "UserSettings": _convert_StackUserSetting_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessEndpoints=None,
+            ApplicationSettings=None,
+            AttributesToDelete=None,
+            DeleteStorageConnectors=None,
+            Description=None,
+            DisplayName=None,
+            EmbedHostDomains=None,
+            FeedbackURL=None,
+            Name=None,
+            RedirectURL=None,
+            StorageConnectors=None,
+            Tags=None,
+            UserSettings=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccessEndpoints", _convert_StackAccessEndpoint_list(AccessEndpoints)
+            )
+            _setattr(
+                "ApplicationSettings",
+                _convert_StackApplicationSettings(ApplicationSettings),
+            )
+            _setattr("AttributesToDelete", AttributesToDelete)
+            _setattr("DeleteStorageConnectors", DeleteStorageConnectors)
+            _setattr("Description", Description)
+            _setattr("DisplayName", DisplayName)
+            _setattr("EmbedHostDomains", EmbedHostDomains)
+            _setattr("FeedbackURL", FeedbackURL)
+            _setattr("Name", Name)
+            _setattr("RedirectURL", RedirectURL)
+            _setattr(
+                "StorageConnectors",
+                _convert_StackStorageConnector_list(StorageConnectors),
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("UserSettings", _convert_StackUserSetting_list(UserSettings))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StackProperties = create_object_converter(StackProperties)
+
+    class Stack(_Resource):
+        """A Stack for AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for Stack
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-stack.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppStream::Stack"
+
+        Properties: StackProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Stack",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StackProperties},
+            factories={"Properties": StackProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StackProperties()
+            _setattr("Properties", _convert_StackProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Stack,
+        StackProperties,
+        StackAccessEndpoint,
+        StackApplicationSettings,
+        StackStorageConnector,
+        StackUserSetting,
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for User
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-user.html>`_
-    """
 
-    RESOURCE_TYPE = "AWS::AppStream::User"
+def _create_StackFleetAssociation():
+    class StackFleetAssociationProperties(_ResourceProperties):
+        __slots__ = ("FleetName", "StackName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackFleetAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FleetName=None, StackName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FleetName", FleetName)
+            _setattr("StackName", StackName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StackFleetAssociationProperties = create_object_converter(
+        StackFleetAssociationProperties
+    )
 
-    Properties: UserProperties = attrib(
-        factory=UserProperties, converter=create_object_converter(UserProperties)
+    class StackFleetAssociation(_Resource):
+        """A Stack Fleet Association for AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for StackFleetAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-stackfleetassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppStream::StackFleetAssociation"
+
+        Properties: StackFleetAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackFleetAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StackFleetAssociationProperties},
+            factories={"Properties": StackFleetAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StackFleetAssociationProperties()
+            _setattr("Properties", _convert_StackFleetAssociationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return StackFleetAssociation, StackFleetAssociationProperties
+
+
+def _create_StackUserAssociation():
+    class StackUserAssociationProperties(_ResourceProperties):
+        __slots__ = (
+            "AuthenticationType",
+            "SendEmailNotification",
+            "StackName",
+            "UserName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackUserAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticationType=None,
+            SendEmailNotification=None,
+            StackName=None,
+            UserName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AuthenticationType", AuthenticationType)
+            _setattr("SendEmailNotification", SendEmailNotification)
+            _setattr("StackName", StackName)
+            _setattr("UserName", UserName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StackUserAssociationProperties = create_object_converter(
+        StackUserAssociationProperties
     )
+
+    class StackUserAssociation(_Resource):
+        """A Stack User Association for AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for StackUserAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-stackuserassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppStream::StackUserAssociation"
+
+        Properties: StackUserAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackUserAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StackUserAssociationProperties},
+            factories={"Properties": StackUserAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StackUserAssociationProperties()
+            _setattr("Properties", _convert_StackUserAssociationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return StackUserAssociation, StackUserAssociationProperties
+
+
+def _create_User():
+    class UserProperties(_ResourceProperties):
+        __slots__ = (
+            "AuthenticationType",
+            "FirstName",
+            "LastName",
+            "MessageAction",
+            "UserName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticationType=None,
+            FirstName=None,
+            LastName=None,
+            MessageAction=None,
+            UserName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AuthenticationType", AuthenticationType)
+            _setattr("FirstName", FirstName)
+            _setattr("LastName", LastName)
+            _setattr("MessageAction", MessageAction)
+            _setattr("UserName", UserName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserProperties = create_object_converter(UserProperties)
+
+    class User(_Resource):
+        """A User for AppStream.
+
+        See Also:
+            `AWS Cloud Formation documentation for User
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appstream-user.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppStream::User"
+
+        Properties: UserProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "User",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserProperties},
+            factories={"Properties": UserProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserProperties()
+            _setattr("Properties", _convert_UserProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return User, UserProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "DirectoryConfig": _create_DirectoryConfig,
+        "DirectoryConfigProperties": _create_DirectoryConfig,
+        "DirectoryConfigServiceAccountCredentials": _create_DirectoryConfig,
+        "Fleet": _create_Fleet,
+        "FleetProperties": _create_Fleet,
+        "FleetComputeCapacity": _create_Fleet,
+        "FleetDomainJoinInfo": _create_Fleet,
+        "FleetVpcConfig": _create_Fleet,
+        "ImageBuilder": _create_ImageBuilder,
+        "ImageBuilderProperties": _create_ImageBuilder,
+        "ImageBuilderAccessEndpoint": _create_ImageBuilder,
+        "ImageBuilderDomainJoinInfo": _create_ImageBuilder,
+        "ImageBuilderVpcConfig": _create_ImageBuilder,
+        "Stack": _create_Stack,
+        "StackProperties": _create_Stack,
+        "StackAccessEndpoint": _create_Stack,
+        "StackApplicationSettings": _create_Stack,
+        "StackStorageConnector": _create_Stack,
+        "StackUserSetting": _create_Stack,
+        "StackFleetAssociation": _create_StackFleetAssociation,
+        "StackFleetAssociationProperties": _create_StackFleetAssociation,
+        "StackUserAssociation": _create_StackUserAssociation,
+        "StackUserAssociationProperties": _create_StackUserAssociation,
+        "User": _create_User,
+        "UserProperties": _create_User,
+    },
+)
@@ -7,14 +7,20 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
 __all__ = [
     "ApiCache",
     "ApiCacheProperties",
@@ -22,208 +28,1255 @@ __all__ = [
     "ApiKeyProperties",
     "DataSource",
     "DataSourceProperties",
+    "DataSourceAuthorizationConfig",
+    "DataSourceAwsIamConfig",
+    "DataSourceDeltaSyncConfig",
+    "DataSourceDynamoDBConfig",
+    "DataSourceElasticsearchConfig",
+    "DataSourceHttpConfig",
+    "DataSourceLambdaConfig",
+    "DataSourceRdsHttpEndpointConfig",
+    "DataSourceRelationalDatabaseConfig",
     "FunctionConfiguration",
     "FunctionConfigurationProperties",
     "GraphQLApi",
     "GraphQLApiProperties",
+    "GraphQLApiAdditionalAuthenticationProvider",
+    "GraphQLApiCognitoUserPoolConfig",
+    "GraphQLApiLogConfig",
+    "GraphQLApiOpenIDConnectConfig",
+    "GraphQLApiUserPoolConfig",
     "GraphQLSchema",
     "GraphQLSchemaProperties",
     "Resolver",
     "ResolverProperties",
+    "ResolverCachingConfig",
+    "ResolverLambdaConflictHandlerConfig",
+    "ResolverPipelineConfig",
+    "ResolverSyncConfig",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ApiCacheProperties(ResourceProperties):
-    ApiCachingBehavior = attrib(default=None)
-    ApiId = attrib(default=None)
-    AtRestEncryptionEnabled = attrib(default=None)
-    TransitEncryptionEnabled = attrib(default=None)
-    Ttl = attrib(default=None)
-    Type = attrib(default=None)
+def _create_ApiCache():
+    class ApiCacheProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiCachingBehavior",
+            "ApiId",
+            "AtRestEncryptionEnabled",
+            "TransitEncryptionEnabled",
+            "Ttl",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiCacheProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiCachingBehavior=None,
+            ApiId=None,
+            AtRestEncryptionEnabled=None,
+            TransitEncryptionEnabled=None,
+            Ttl=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiCachingBehavior", ApiCachingBehavior)
+            _setattr("ApiId", ApiId)
+            _setattr("AtRestEncryptionEnabled", AtRestEncryptionEnabled)
+            _setattr("TransitEncryptionEnabled", TransitEncryptionEnabled)
+            _setattr("Ttl", Ttl)
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApiCacheProperties = create_object_converter(ApiCacheProperties)
+
+    class ApiCache(_Resource):
+        """A Api Cache for AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApiCache
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-apicache.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppSync::ApiCache"
+
+        Properties: ApiCacheProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiCache",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApiCacheProperties},
+            factories={"Properties": ApiCacheProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApiCacheProperties()
+            _setattr("Properties", _convert_ApiCacheProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ApiCache, ApiCacheProperties
+
+
+def _create_ApiKey():
+    class ApiKeyProperties(_ResourceProperties):
+        __slots__ = ("ApiId", "Description", "Expires")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiKeyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApiId=None, Description=None, Expires=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("Description", Description)
+            _setattr("Expires", Expires)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApiKeyProperties = create_object_converter(ApiKeyProperties)
+
+    class ApiKey(_Resource):
+        """A Api Key for AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApiKey
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-apikey.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppSync::ApiKey"
+
+        Properties: ApiKeyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApiKey",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApiKeyProperties},
+            factories={"Properties": ApiKeyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApiKeyProperties()
+            _setattr("Properties", _convert_ApiKeyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ApiKey, ApiKeyProperties
+
+
+def _create_DataSource():
+    class DataSourceAwsIamConfig(_PropertyType):
+        """The Aws Iam Config property type for DataSource in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for AwsIamConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-datasource-awsiamconfig.html>`_
+        """
+
+        __slots__ = ("SigningRegion", "SigningServiceName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceAwsIamConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, SigningRegion=None, SigningServiceName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SigningRegion", SigningRegion)
+            _setattr("SigningServiceName", SigningServiceName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DataSourceAwsIamConfig = create_object_converter(DataSourceAwsIamConfig)
+
+    class DataSourceAuthorizationConfig(_PropertyType):
+        """The Authorization Config property type for DataSource in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for AuthorizationConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-datasource-authorizationconfig.html>`_
+        """
+
+        __slots__ = ("AuthorizationType", "AwsIamConfig")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceAuthorizationConfig",
+            _PropertyType,
+            __slots__,
+            converters={"AwsIamConfig": _convert_DataSourceAwsIamConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AuthorizationType=None, AwsIamConfig=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AuthorizationType", AuthorizationType)
+            _setattr("AwsIamConfig", _convert_DataSourceAwsIamConfig(AwsIamConfig))
+            _init_PropertyType(self, kwargs)
 
+    class DataSourceDeltaSyncConfig(_PropertyType):
+        """The Delta Sync Config property type for DataSource in AppSync.
 
-@attrs(**ATTRSCONFIG)
-class ApiCache(Resource):
-    """A Api Cache for AppSync.
+        See Also:
+            `AWS Cloud Formation documentation for DeltaSyncConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-datasource-deltasyncconfig.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for ApiCache
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-apicache.html>`_
-    """
+        __slots__ = ("BaseTableTTL", "DeltaSyncTableName", "DeltaSyncTableTTL")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceDeltaSyncConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::AppSync::ApiCache"
+        def __init__(
+            self,
+            *,
+            BaseTableTTL=None,
+            DeltaSyncTableName=None,
+            DeltaSyncTableTTL=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BaseTableTTL", BaseTableTTL)
+            _setattr("DeltaSyncTableName", DeltaSyncTableName)
+            _setattr("DeltaSyncTableTTL", DeltaSyncTableTTL)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ApiCacheProperties = attrib(
-        factory=ApiCacheProperties,
-        converter=create_object_converter(ApiCacheProperties),
+    _convert_DataSourceDeltaSyncConfig = create_object_converter(
+        DataSourceDeltaSyncConfig
+    )
+
+    class DataSourceDynamoDBConfig(_PropertyType):
+        """The Dynamo Db Config property type for DataSource in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for DynamoDBConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-datasource-dynamodbconfig.html>`_
+        """
+
+        __slots__ = (
+            "AwsRegion",
+            "DeltaSyncConfig",
+            "TableName",
+            "UseCallerCredentials",
+            "Versioned",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceDynamoDBConfig",
+            _PropertyType,
+            __slots__,
+            converters={"DeltaSyncConfig": _convert_DataSourceDeltaSyncConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AwsRegion=None,
+            DeltaSyncConfig=None,
+            TableName=None,
+            UseCallerCredentials=None,
+            Versioned=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AwsRegion", AwsRegion)
+            _setattr(
+                "DeltaSyncConfig", _convert_DataSourceDeltaSyncConfig(DeltaSyncConfig)
+            )
+            _setattr("TableName", TableName)
+            _setattr("UseCallerCredentials", UseCallerCredentials)
+            _setattr("Versioned", Versioned)
+            _init_PropertyType(self, kwargs)
+
+    class DataSourceElasticsearchConfig(_PropertyType):
+        """The Elasticsearch Config property type for DataSource in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticsearchConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-datasource-elasticsearchconfig.html>`_
+        """
+
+        __slots__ = ("AwsRegion", "Endpoint")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceElasticsearchConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AwsRegion=None, Endpoint=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AwsRegion", AwsRegion)
+            _setattr("Endpoint", Endpoint)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DataSourceAuthorizationConfig = create_object_converter(
+        DataSourceAuthorizationConfig
+    )
+
+    class DataSourceHttpConfig(_PropertyType):
+        """The Http Config property type for DataSource in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for HttpConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-datasource-httpconfig.html>`_
+        """
+
+        __slots__ = ("AuthorizationConfig", "Endpoint")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceHttpConfig",
+            _PropertyType,
+            __slots__,
+            converters={"AuthorizationConfig": _convert_DataSourceAuthorizationConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AuthorizationConfig=None, Endpoint=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AuthorizationConfig",
+                _convert_DataSourceAuthorizationConfig(AuthorizationConfig),
+            )
+            _setattr("Endpoint", Endpoint)
+            _init_PropertyType(self, kwargs)
+
+    class DataSourceLambdaConfig(_PropertyType):
+        """The Lambda Config property type for DataSource in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for LambdaConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-datasource-lambdaconfig.html>`_
+        """
+
+        __slots__ = ("LambdaFunctionArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceLambdaConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, LambdaFunctionArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LambdaFunctionArn", LambdaFunctionArn)
+            _init_PropertyType(self, kwargs)
+
+    class DataSourceRdsHttpEndpointConfig(_PropertyType):
+        """The Rds Http Endpoint Config property type for DataSource in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for RdsHttpEndpointConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-datasource-rdshttpendpointconfig.html>`_
+        """
+
+        __slots__ = (
+            "AwsRegion",
+            "AwsSecretStoreArn",
+            "DatabaseName",
+            "DbClusterIdentifier",
+            "Schema",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceRdsHttpEndpointConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AwsRegion=None,
+            AwsSecretStoreArn=None,
+            DatabaseName=None,
+            DbClusterIdentifier=None,
+            Schema=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AwsRegion", AwsRegion)
+            _setattr("AwsSecretStoreArn", AwsSecretStoreArn)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("DbClusterIdentifier", DbClusterIdentifier)
+            _setattr("Schema", Schema)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DataSourceRdsHttpEndpointConfig = create_object_converter(
+        DataSourceRdsHttpEndpointConfig
+    )
+
+    class DataSourceRelationalDatabaseConfig(_PropertyType):
+        """The Relational Database Config property type for DataSource in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for RelationalDatabaseConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-datasource-relationaldatabaseconfig.html>`_
+        """
+
+        __slots__ = ("RdsHttpEndpointConfig", "RelationalDatabaseSourceType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceRelationalDatabaseConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "RdsHttpEndpointConfig": _convert_DataSourceRdsHttpEndpointConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            RdsHttpEndpointConfig=None,
+            RelationalDatabaseSourceType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "RdsHttpEndpointConfig",
+                _convert_DataSourceRdsHttpEndpointConfig(RdsHttpEndpointConfig),
+            )
+            _setattr("RelationalDatabaseSourceType", RelationalDatabaseSourceType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DataSourceDynamoDBConfig = create_object_converter(
+        DataSourceDynamoDBConfig
+    )
+    _convert_DataSourceElasticsearchConfig = create_object_converter(
+        DataSourceElasticsearchConfig
     )
+    _convert_DataSourceHttpConfig = create_object_converter(DataSourceHttpConfig)
+    _convert_DataSourceLambdaConfig = create_object_converter(DataSourceLambdaConfig)
+    _convert_DataSourceRelationalDatabaseConfig = create_object_converter(
+        DataSourceRelationalDatabaseConfig
+    )
+
+    class DataSourceProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiId",
+            "Description",
+            "DynamoDBConfig",
+            "ElasticsearchConfig",
+            "HttpConfig",
+            "LambdaConfig",
+            "Name",
+            "RelationalDatabaseConfig",
+            "ServiceRoleArn",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSourceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DynamoDBConfig": _convert_DataSourceDynamoDBConfig,
+                "ElasticsearchConfig": _convert_DataSourceElasticsearchConfig,
+                "HttpConfig": _convert_DataSourceHttpConfig,
+                "LambdaConfig": _convert_DataSourceLambdaConfig,
+                "RelationalDatabaseConfig": _convert_DataSourceRelationalDatabaseConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            Description=None,
+            DynamoDBConfig=None,
+            ElasticsearchConfig=None,
+            HttpConfig=None,
+            LambdaConfig=None,
+            Name=None,
+            RelationalDatabaseConfig=None,
+            ServiceRoleArn=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("Description", Description)
+            _setattr(
+                "DynamoDBConfig", _convert_DataSourceDynamoDBConfig(DynamoDBConfig)
+            )
+            _setattr(
+                "ElasticsearchConfig",
+                _convert_DataSourceElasticsearchConfig(ElasticsearchConfig),
+            )
+            _setattr("HttpConfig", _convert_DataSourceHttpConfig(HttpConfig))
+            _setattr("LambdaConfig", _convert_DataSourceLambdaConfig(LambdaConfig))
+            _setattr("Name", Name)
+            _setattr(
+                "RelationalDatabaseConfig",
+                _convert_DataSourceRelationalDatabaseConfig(RelationalDatabaseConfig),
+            )
+            _setattr("ServiceRoleArn", ServiceRoleArn)
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DataSourceProperties = create_object_converter(DataSourceProperties)
+
+    class DataSource(_Resource):
+        """A Data Source for AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for DataSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-datasource.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppSync::DataSource"
+
+        Properties: DataSourceProperties
 
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataSource",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DataSourceProperties},
+            factories={"Properties": DataSourceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ApiKeyProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    Description = attrib(default=None)
-    Expires = attrib(default=None)
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DataSourceProperties()
+            _setattr("Properties", _convert_DataSourceProperties(Properties))
+            _init_Resource(self, kwargs)
 
+    return (
+        DataSource,
+        DataSourceProperties,
+        DataSourceAwsIamConfig,
+        DataSourceAuthorizationConfig,
+        DataSourceDeltaSyncConfig,
+        DataSourceDynamoDBConfig,
+        DataSourceElasticsearchConfig,
+        DataSourceHttpConfig,
+        DataSourceLambdaConfig,
+        DataSourceRdsHttpEndpointConfig,
+        DataSourceRelationalDatabaseConfig,
+    )
 
-@attrs(**ATTRSCONFIG)
-class ApiKey(Resource):
-    """A Api Key for AppSync.
 
-    See Also:
-        `AWS Cloud Formation documentation for ApiKey
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-apikey.html>`_
-    """
+def _create_FunctionConfiguration():
+    class FunctionConfigurationProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiId",
+            "DataSourceName",
+            "Description",
+            "FunctionVersion",
+            "Name",
+            "RequestMappingTemplate",
+            "RequestMappingTemplateS3Location",
+            "ResponseMappingTemplate",
+            "ResponseMappingTemplateS3Location",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionConfigurationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::AppSync::ApiKey"
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            DataSourceName=None,
+            Description=None,
+            FunctionVersion=None,
+            Name=None,
+            RequestMappingTemplate=None,
+            RequestMappingTemplateS3Location=None,
+            ResponseMappingTemplate=None,
+            ResponseMappingTemplateS3Location=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("DataSourceName", DataSourceName)
+            _setattr("Description", Description)
+            _setattr("FunctionVersion", FunctionVersion)
+            _setattr("Name", Name)
+            _setattr("RequestMappingTemplate", RequestMappingTemplate)
+            _setattr(
+                "RequestMappingTemplateS3Location", RequestMappingTemplateS3Location
+            )
+            _setattr("ResponseMappingTemplate", ResponseMappingTemplate)
+            _setattr(
+                "ResponseMappingTemplateS3Location", ResponseMappingTemplateS3Location
+            )
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: ApiKeyProperties = attrib(
-        factory=ApiKeyProperties, converter=create_object_converter(ApiKeyProperties)
+    _convert_FunctionConfigurationProperties = create_object_converter(
+        FunctionConfigurationProperties
     )
 
+    class FunctionConfiguration(_Resource):
+        """A Function Configuration for AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for FunctionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-functionconfiguration.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppSync::FunctionConfiguration"
+
+        Properties: FunctionConfigurationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionConfiguration",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FunctionConfigurationProperties},
+            factories={"Properties": FunctionConfigurationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FunctionConfigurationProperties()
+            _setattr("Properties", _convert_FunctionConfigurationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return FunctionConfiguration, FunctionConfigurationProperties
+
 
-@attrs(**ATTRSCONFIG)
-class DataSourceProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    Description = attrib(default=None)
-    DynamoDBConfig = attrib(default=None)
-    ElasticsearchConfig = attrib(default=None)
-    HttpConfig = attrib(default=None)
-    LambdaConfig = attrib(default=None)
-    Name = attrib(default=None)
-    RelationalDatabaseConfig = attrib(default=None)
-    ServiceRoleArn = attrib(default=None)
-    Type = attrib(default=None)
+def _create_GraphQLApi():
+    class GraphQLApiOpenIDConnectConfig(_PropertyType):
+        """The Open Id Connect Config property type for GraphQLApi in AppSync.
 
+        See Also:
+            `AWS Cloud Formation documentation for OpenIDConnectConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-graphqlapi-openidconnectconfig.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class DataSource(Resource):
-    """A Data Source for AppSync.
+        __slots__ = ("AuthTTL", "ClientId", "IatTTL", "Issuer")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GraphQLApiOpenIDConnectConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for DataSource
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-datasource.html>`_
-    """
+        def __init__(
+            self, *, AuthTTL=None, ClientId=None, IatTTL=None, Issuer=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AuthTTL", AuthTTL)
+            _setattr("ClientId", ClientId)
+            _setattr("IatTTL", IatTTL)
+            _setattr("Issuer", Issuer)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::AppSync::DataSource"
+    class GraphQLApiCognitoUserPoolConfig(_PropertyType):
+        """The Cognito User Pool Config property type for GraphQLApi in AppSync.
 
-    Properties: DataSourceProperties = attrib(
-        factory=DataSourceProperties,
-        converter=create_object_converter(DataSourceProperties),
+        See Also:
+            `AWS Cloud Formation documentation for CognitoUserPoolConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-graphqlapi-cognitouserpoolconfig.html>`_
+        """
+
+        __slots__ = ("AppIdClientRegex", "AwsRegion", "UserPoolId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GraphQLApiCognitoUserPoolConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AppIdClientRegex=None, AwsRegion=None, UserPoolId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AppIdClientRegex", AppIdClientRegex)
+            _setattr("AwsRegion", AwsRegion)
+            _setattr("UserPoolId", UserPoolId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_GraphQLApiOpenIDConnectConfig = create_object_converter(
+        GraphQLApiOpenIDConnectConfig
+    )
+    _convert_GraphQLApiCognitoUserPoolConfig = create_object_converter(
+        GraphQLApiCognitoUserPoolConfig
     )
 
+    class GraphQLApiAdditionalAuthenticationProvider(_PropertyType):
+        """The Additional Authentication Provider property type for GraphQLApi in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for AdditionalAuthenticationProvider
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-graphqlapi-additionalauthenticationprovider.html>`_
+        """
+
+        __slots__ = ("AuthenticationType", "OpenIDConnectConfig", "UserPoolConfig")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GraphQLApiAdditionalAuthenticationProvider",
+            _PropertyType,
+            __slots__,
+            converters={
+                "OpenIDConnectConfig": _convert_GraphQLApiOpenIDConnectConfig,
+                "UserPoolConfig": _convert_GraphQLApiCognitoUserPoolConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticationType=None,
+            OpenIDConnectConfig=None,
+            UserPoolConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AuthenticationType", AuthenticationType)
+            _setattr(
+                "OpenIDConnectConfig",
+                _convert_GraphQLApiOpenIDConnectConfig(OpenIDConnectConfig),
+            )
+            _setattr(
+                "UserPoolConfig",
+                _convert_GraphQLApiCognitoUserPoolConfig(UserPoolConfig),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class GraphQLApiLogConfig(_PropertyType):
+        """The Log Config property type for GraphQLApi in AppSync.
 
-@attrs(**ATTRSCONFIG)
-class FunctionConfigurationProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    DataSourceName = attrib(default=None)
-    Description = attrib(default=None)
-    FunctionVersion = attrib(default=None)
-    Name = attrib(default=None)
-    RequestMappingTemplate = attrib(default=None)
-    RequestMappingTemplateS3Location = attrib(default=None)
-    ResponseMappingTemplate = attrib(default=None)
-    ResponseMappingTemplateS3Location = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for LogConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-graphqlapi-logconfig.html>`_
+        """
 
+        __slots__ = ("CloudWatchLogsRoleArn", "ExcludeVerboseContent", "FieldLogLevel")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GraphQLApiLogConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class FunctionConfiguration(Resource):
-    """A Function Configuration for AppSync.
+        def __init__(
+            self,
+            *,
+            CloudWatchLogsRoleArn=None,
+            ExcludeVerboseContent=None,
+            FieldLogLevel=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudWatchLogsRoleArn", CloudWatchLogsRoleArn)
+            _setattr("ExcludeVerboseContent", ExcludeVerboseContent)
+            _setattr("FieldLogLevel", FieldLogLevel)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for FunctionConfiguration
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-functionconfiguration.html>`_
-    """
+    class GraphQLApiUserPoolConfig(_PropertyType):
+        """The User Pool Config property type for GraphQLApi in AppSync.
 
-    RESOURCE_TYPE = "AWS::AppSync::FunctionConfiguration"
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-graphqlapi-userpoolconfig.html>`_
+        """
 
-    Properties: FunctionConfigurationProperties = attrib(
-        factory=FunctionConfigurationProperties,
-        converter=create_object_converter(FunctionConfigurationProperties),
+        __slots__ = ("AppIdClientRegex", "AwsRegion", "DefaultAction", "UserPoolId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GraphQLApiUserPoolConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AppIdClientRegex=None,
+            AwsRegion=None,
+            DefaultAction=None,
+            UserPoolId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AppIdClientRegex", AppIdClientRegex)
+            _setattr("AwsRegion", AwsRegion)
+            _setattr("DefaultAction", DefaultAction)
+            _setattr("UserPoolId", UserPoolId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_GraphQLApiLogConfig = create_object_converter(GraphQLApiLogConfig)
+    _convert_GraphQLApiUserPoolConfig = create_object_converter(
+        GraphQLApiUserPoolConfig
     )
 
+    class GraphQLApiProperties(_ResourceProperties):
+        __slots__ = (
+            "AdditionalAuthenticationProviders",
+            "AuthenticationType",
+            "LogConfig",
+            "Name",
+            "OpenIDConnectConfig",
+            "Tags",
+            "UserPoolConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GraphQLApiProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LogConfig": _convert_GraphQLApiLogConfig,
+                "OpenIDConnectConfig": _convert_GraphQLApiOpenIDConnectConfig,
+                "UserPoolConfig": _convert_GraphQLApiUserPoolConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AdditionalAuthenticationProviders=None,
+            AuthenticationType=None,
+            LogConfig=None,
+            Name=None,
+            OpenIDConnectConfig=None,
+            Tags=None,
+            UserPoolConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AdditionalAuthenticationProviders", AdditionalAuthenticationProviders
+            )
+            _setattr("AuthenticationType", AuthenticationType)
+            _setattr("LogConfig", _convert_GraphQLApiLogConfig(LogConfig))
+            _setattr("Name", Name)
+            _setattr(
+                "OpenIDConnectConfig",
+                _convert_GraphQLApiOpenIDConnectConfig(OpenIDConnectConfig),
+            )
+            _setattr("Tags", Tags)
+            _setattr(
+                "UserPoolConfig", _convert_GraphQLApiUserPoolConfig(UserPoolConfig)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GraphQLApiProperties = create_object_converter(GraphQLApiProperties)
 
-@attrs(**ATTRSCONFIG)
-class GraphQLApiProperties(ResourceProperties):
-    AdditionalAuthenticationProviders = attrib(default=None)
-    AuthenticationType = attrib(default=None)
-    LogConfig = attrib(default=None)
-    Name = attrib(default=None)
-    OpenIDConnectConfig = attrib(default=None)
-    Tags = attrib(default=None)
-    UserPoolConfig = attrib(default=None)
+    class GraphQLApi(_Resource):
+        """A Graph Ql Api for AppSync.
 
+        See Also:
+            `AWS Cloud Formation documentation for GraphQLApi
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-graphqlapi.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class GraphQLApi(Resource):
-    """A Graph Ql Api for AppSync.
+        RESOURCE_TYPE = "AWS::AppSync::GraphQLApi"
+        # NB: GraphQLApi stores tags in a format that we don't support
+        TAG_FORMAT = None
 
-    See Also:
-        `AWS Cloud Formation documentation for GraphQLApi
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-graphqlapi.html>`_
-    """
+        Properties: GraphQLApiProperties
 
-    RESOURCE_TYPE = "AWS::AppSync::GraphQLApi"
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GraphQLApi",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GraphQLApiProperties},
+            factories={"Properties": GraphQLApiProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: GraphQLApiProperties = attrib(
-        factory=GraphQLApiProperties,
-        converter=create_object_converter(GraphQLApiProperties),
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GraphQLApiProperties()
+            _setattr("Properties", _convert_GraphQLApiProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        GraphQLApi,
+        GraphQLApiProperties,
+        GraphQLApiOpenIDConnectConfig,
+        GraphQLApiCognitoUserPoolConfig,
+        GraphQLApiAdditionalAuthenticationProvider,
+        GraphQLApiLogConfig,
+        GraphQLApiUserPoolConfig,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class GraphQLSchemaProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    Definition = attrib(default=None)
-    DefinitionS3Location = attrib(default=None)
+def _create_GraphQLSchema():
+    class GraphQLSchemaProperties(_ResourceProperties):
+        __slots__ = ("ApiId", "Definition", "DefinitionS3Location")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GraphQLSchemaProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApiId=None, Definition=None, DefinitionS3Location=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("Definition", Definition)
+            _setattr("DefinitionS3Location", DefinitionS3Location)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GraphQLSchemaProperties = create_object_converter(GraphQLSchemaProperties)
 
+    class GraphQLSchema(_Resource):
+        """A Graph Ql Schema for AppSync.
 
-@attrs(**ATTRSCONFIG)
-class GraphQLSchema(Resource):
-    """A Graph Ql Schema for AppSync.
+        See Also:
+            `AWS Cloud Formation documentation for GraphQLSchema
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-graphqlschema.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for GraphQLSchema
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-graphqlschema.html>`_
-    """
+        RESOURCE_TYPE = "AWS::AppSync::GraphQLSchema"
 
-    RESOURCE_TYPE = "AWS::AppSync::GraphQLSchema"
+        Properties: GraphQLSchemaProperties
 
-    Properties: GraphQLSchemaProperties = attrib(
-        factory=GraphQLSchemaProperties,
-        converter=create_object_converter(GraphQLSchemaProperties),
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GraphQLSchema",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GraphQLSchemaProperties},
+            factories={"Properties": GraphQLSchemaProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GraphQLSchemaProperties()
+            _setattr("Properties", _convert_GraphQLSchemaProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return GraphQLSchema, GraphQLSchemaProperties
+
+
+def _create_Resolver():
+    class ResolverCachingConfig(_PropertyType):
+        """The Caching Config property type for Resolver in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for CachingConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-resolver-cachingconfig.html>`_
+        """
+
+        __slots__ = ("CachingKeys", "Ttl")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverCachingConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CachingKeys=None, Ttl=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CachingKeys", CachingKeys)
+            _setattr("Ttl", Ttl)
+            _init_PropertyType(self, kwargs)
+
+    class ResolverLambdaConflictHandlerConfig(_PropertyType):
+        """The Lambda Conflict Handler Config property type for Resolver in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for LambdaConflictHandlerConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-resolver-lambdaconflicthandlerconfig.html>`_
+        """
+
+        __slots__ = ("LambdaConflictHandlerArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverLambdaConflictHandlerConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, LambdaConflictHandlerArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LambdaConflictHandlerArn", LambdaConflictHandlerArn)
+            _init_PropertyType(self, kwargs)
+
+    class ResolverPipelineConfig(_PropertyType):
+        """The Pipeline Config property type for Resolver in AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for PipelineConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-resolver-pipelineconfig.html>`_
+        """
+
+        __slots__ = ("Functions",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverPipelineConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Functions=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Functions", Functions)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResolverLambdaConflictHandlerConfig = create_object_converter(
+        ResolverLambdaConflictHandlerConfig
     )
 
+    class ResolverSyncConfig(_PropertyType):
+        """The Sync Config property type for Resolver in AppSync.
 
-@attrs(**ATTRSCONFIG)
-class ResolverProperties(ResourceProperties):
-    ApiId = attrib(default=None)
-    CachingConfig = attrib(default=None)
-    DataSourceName = attrib(default=None)
-    FieldName = attrib(default=None)
-    Kind = attrib(default=None)
-    PipelineConfig = attrib(default=None)
-    RequestMappingTemplate = attrib(default=None)
-    RequestMappingTemplateS3Location = attrib(default=None)
-    ResponseMappingTemplate = attrib(default=None)
-    ResponseMappingTemplateS3Location = attrib(default=None)
-    SyncConfig = attrib(default=None)
-    TypeName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Resolver(Resource):
-    """A Resolver for AppSync.
-
-    See Also:
-        `AWS Cloud Formation documentation for Resolver
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-resolver.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AppSync::Resolver"
-
-    Properties: ResolverProperties = attrib(
-        factory=ResolverProperties,
-        converter=create_object_converter(ResolverProperties),
+        See Also:
+            `AWS Cloud Formation documentation for SyncConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-appsync-resolver-syncconfig.html>`_
+        """
+
+        __slots__ = (
+            "ConflictDetection",
+            "ConflictHandler",
+            "LambdaConflictHandlerConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverSyncConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "LambdaConflictHandlerConfig": _convert_ResolverLambdaConflictHandlerConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConflictDetection=None,
+            ConflictHandler=None,
+            LambdaConflictHandlerConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConflictDetection", ConflictDetection)
+            _setattr("ConflictHandler", ConflictHandler)
+            _setattr(
+                "LambdaConflictHandlerConfig",
+                _convert_ResolverLambdaConflictHandlerConfig(
+                    LambdaConflictHandlerConfig
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResolverCachingConfig = create_object_converter(ResolverCachingConfig)
+    _convert_ResolverPipelineConfig = create_object_converter(ResolverPipelineConfig)
+    _convert_ResolverSyncConfig = create_object_converter(ResolverSyncConfig)
+
+    class ResolverProperties(_ResourceProperties):
+        __slots__ = (
+            "ApiId",
+            "CachingConfig",
+            "DataSourceName",
+            "FieldName",
+            "Kind",
+            "PipelineConfig",
+            "RequestMappingTemplate",
+            "RequestMappingTemplateS3Location",
+            "ResponseMappingTemplate",
+            "ResponseMappingTemplateS3Location",
+            "SyncConfig",
+            "TypeName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CachingConfig": _convert_ResolverCachingConfig,
+                "PipelineConfig": _convert_ResolverPipelineConfig,
+                "SyncConfig": _convert_ResolverSyncConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiId=None,
+            CachingConfig=None,
+            DataSourceName=None,
+            FieldName=None,
+            Kind=None,
+            PipelineConfig=None,
+            RequestMappingTemplate=None,
+            RequestMappingTemplateS3Location=None,
+            ResponseMappingTemplate=None,
+            ResponseMappingTemplateS3Location=None,
+            SyncConfig=None,
+            TypeName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiId", ApiId)
+            _setattr("CachingConfig", _convert_ResolverCachingConfig(CachingConfig))
+            _setattr("DataSourceName", DataSourceName)
+            _setattr("FieldName", FieldName)
+            _setattr("Kind", Kind)
+            _setattr("PipelineConfig", _convert_ResolverPipelineConfig(PipelineConfig))
+            _setattr("RequestMappingTemplate", RequestMappingTemplate)
+            _setattr(
+                "RequestMappingTemplateS3Location", RequestMappingTemplateS3Location
+            )
+            _setattr("ResponseMappingTemplate", ResponseMappingTemplate)
+            _setattr(
+                "ResponseMappingTemplateS3Location", ResponseMappingTemplateS3Location
+            )
+            _setattr("SyncConfig", _convert_ResolverSyncConfig(SyncConfig))
+            _setattr("TypeName", TypeName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResolverProperties = create_object_converter(ResolverProperties)
+
+    class Resolver(_Resource):
+        """A Resolver for AppSync.
+
+        See Also:
+            `AWS Cloud Formation documentation for Resolver
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-appsync-resolver.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AppSync::Resolver"
+
+        Properties: ResolverProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Resolver",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResolverProperties},
+            factories={"Properties": ResolverProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResolverProperties()
+            _setattr("Properties", _convert_ResolverProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Resolver,
+        ResolverProperties,
+        ResolverCachingConfig,
+        ResolverLambdaConflictHandlerConfig,
+        ResolverPipelineConfig,
+        ResolverSyncConfig,
     )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ApiCache": _create_ApiCache,
+        "ApiCacheProperties": _create_ApiCache,
+        "ApiKey": _create_ApiKey,
+        "ApiKeyProperties": _create_ApiKey,
+        "DataSource": _create_DataSource,
+        "DataSourceProperties": _create_DataSource,
+        "DataSourceAuthorizationConfig": _create_DataSource,
+        "DataSourceAwsIamConfig": _create_DataSource,
+        "DataSourceDeltaSyncConfig": _create_DataSource,
+        "DataSourceDynamoDBConfig": _create_DataSource,
+        "DataSourceElasticsearchConfig": _create_DataSource,
+        "DataSourceHttpConfig": _create_DataSource,
+        "DataSourceLambdaConfig": _create_DataSource,
+        "DataSourceRdsHttpEndpointConfig": _create_DataSource,
+        "DataSourceRelationalDatabaseConfig": _create_DataSource,
+        "FunctionConfiguration": _create_FunctionConfiguration,
+        "FunctionConfigurationProperties": _create_FunctionConfiguration,
+        "GraphQLApi": _create_GraphQLApi,
+        "GraphQLApiProperties": _create_GraphQLApi,
+        "GraphQLApiAdditionalAuthenticationProvider": _create_GraphQLApi,
+        "GraphQLApiCognitoUserPoolConfig": _create_GraphQLApi,
+        "GraphQLApiLogConfig": _create_GraphQLApi,
+        "GraphQLApiOpenIDConnectConfig": _create_GraphQLApi,
+        "GraphQLApiUserPoolConfig": _create_GraphQLApi,
+        "GraphQLSchema": _create_GraphQLSchema,
+        "GraphQLSchemaProperties": _create_GraphQLSchema,
+        "Resolver": _create_Resolver,
+        "ResolverProperties": _create_Resolver,
+        "ResolverCachingConfig": _create_Resolver,
+        "ResolverLambdaConflictHandlerConfig": _create_Resolver,
+        "ResolverPipelineConfig": _create_Resolver,
+        "ResolverSyncConfig": _create_Resolver,
+    },
+)
@@ -7,37 +7,92 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
-__all__ = ["NamedQuery", "NamedQueryProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "NamedQuery",
+    "NamedQueryProperties",
+]
 
-@attrs(**ATTRSCONFIG)
-class NamedQueryProperties(ResourceProperties):
-    Database = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    QueryString = attrib(default=None)
 
+def _create_NamedQuery():
+    class NamedQueryProperties(_ResourceProperties):
+        __slots__ = ("Database", "Description", "Name", "QueryString")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NamedQueryProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class NamedQuery(Resource):
-    """A Named Query for Athena.
+        def __init__(
+            self,
+            *,
+            Database=None,
+            Description=None,
+            Name=None,
+            QueryString=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Database", Database)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("QueryString", QueryString)
+            _init_ResourceProperties(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for NamedQuery
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-athena-namedquery.html>`_
-    """
+    _convert_NamedQueryProperties = create_object_converter(NamedQueryProperties)
 
-    RESOURCE_TYPE = "AWS::Athena::NamedQuery"
+    class NamedQuery(_Resource):
+        """A Named Query for Athena.
 
-    Properties: NamedQueryProperties = attrib(
-        factory=NamedQueryProperties,
-        converter=create_object_converter(NamedQueryProperties),
-    )
+        See Also:
+            `AWS Cloud Formation documentation for NamedQuery
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-athena-namedquery.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Athena::NamedQuery"
+
+        Properties: NamedQueryProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NamedQuery",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NamedQueryProperties},
+            factories={"Properties": NamedQueryProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NamedQueryProperties()
+            _setattr("Properties", _convert_NamedQueryProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return NamedQuery, NamedQueryProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "NamedQuery": _create_NamedQuery,
+        "NamedQueryProperties": _create_NamedQuery,
+    },
+)
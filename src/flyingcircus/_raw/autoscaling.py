@@ -10,201 +10,1257 @@ This file is automatically generated, and should not be directly edited.
 from typing import Any
 from typing import Dict
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "AutoScalingGroup",
     "AutoScalingGroupProperties",
+    "AutoScalingGroupInstancesDistribution",
+    "AutoScalingGroupLaunchTemplate",
+    "AutoScalingGroupLaunchTemplateOverrides",
+    "AutoScalingGroupLaunchTemplateSpecification",
+    "AutoScalingGroupLifecycleHookSpecification",
+    "AutoScalingGroupMetricsCollection",
+    "AutoScalingGroupMixedInstancesPolicy",
+    "AutoScalingGroupNotificationConfiguration",
+    "AutoScalingGroupTagProperty",
     "LaunchConfiguration",
     "LaunchConfigurationProperties",
+    "LaunchConfigurationBlockDevice",
+    "LaunchConfigurationBlockDeviceMapping",
     "LifecycleHook",
     "LifecycleHookProperties",
     "ScalingPolicy",
     "ScalingPolicyProperties",
+    "ScalingPolicyCustomizedMetricSpecification",
+    "ScalingPolicyMetricDimension",
+    "ScalingPolicyPredefinedMetricSpecification",
+    "ScalingPolicyStepAdjustment",
+    "ScalingPolicyTargetTrackingConfiguration",
     "ScheduledAction",
     "ScheduledActionProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AutoScalingGroupProperties(ResourceProperties):
-    AutoScalingGroupName = attrib(default=None)
-    AvailabilityZones = attrib(default=None)
-    Cooldown = attrib(default=None)
-    DesiredCapacity = attrib(default=None)
-    HealthCheckGracePeriod = attrib(default=None)
-    HealthCheckType = attrib(default=None)
-    InstanceId = attrib(default=None)
-    LaunchConfigurationName = attrib(default=None)
-    LaunchTemplate = attrib(default=None)
-    LifecycleHookSpecificationList = attrib(default=None)
-    LoadBalancerNames = attrib(default=None)
-    MaxSize = attrib(default=None)
-    MetricsCollection = attrib(default=None)
-    MinSize = attrib(default=None)
-    MixedInstancesPolicy = attrib(default=None)
-    NotificationConfigurations = attrib(default=None)
-    PlacementGroup = attrib(default=None)
-    ServiceLinkedRoleARN = attrib(default=None)
-    Tags = attrib(default=None)
-    TargetGroupARNs = attrib(default=None)
-    TerminationPolicies = attrib(default=None)
-    VPCZoneIdentifier = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class AutoScalingGroup(Resource):
-    """A Auto Scaling Group for AutoScaling.
-
-    See Also:
-        `AWS Cloud Formation documentation for AutoScalingGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-group.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AutoScaling::AutoScalingGroup"
-
-    Properties: AutoScalingGroupProperties = attrib(
-        factory=AutoScalingGroupProperties,
-        converter=create_object_converter(AutoScalingGroupProperties),
-    )
-
-    # NB: CreationPolicy may be set for AutoScalingGroup
-    # (unlike most Resource types)
-    CreationPolicy: Dict[str, Any] = attrib(factory=dict)
-
-    # NB: UpdatePolicy may be set for AutoScalingGroup
-    # (unlike most Resource types)
-    UpdatePolicy: Dict[str, Any] = attrib(factory=dict)
-
-
-@attrs(**ATTRSCONFIG)
-class LaunchConfigurationProperties(ResourceProperties):
-    AssociatePublicIpAddress = attrib(default=None)
-    BlockDeviceMappings = attrib(default=None)
-    ClassicLinkVPCId = attrib(default=None)
-    ClassicLinkVPCSecurityGroups = attrib(default=None)
-    EbsOptimized = attrib(default=None)
-    IamInstanceProfile = attrib(default=None)
-    ImageId = attrib(default=None)
-    InstanceId = attrib(default=None)
-    InstanceMonitoring = attrib(default=None)
-    InstanceType = attrib(default=None)
-    KernelId = attrib(default=None)
-    KeyName = attrib(default=None)
-    LaunchConfigurationName = attrib(default=None)
-    PlacementTenancy = attrib(default=None)
-    RamDiskId = attrib(default=None)
-    SecurityGroups = attrib(default=None)
-    SpotPrice = attrib(default=None)
-    UserData = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class LaunchConfiguration(Resource):
-    """A Launch Configuration for AutoScaling.
-
-    See Also:
-        `AWS Cloud Formation documentation for LaunchConfiguration
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-launchconfig.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AutoScaling::LaunchConfiguration"
-
-    Properties: LaunchConfigurationProperties = attrib(
-        factory=LaunchConfigurationProperties,
-        converter=create_object_converter(LaunchConfigurationProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class LifecycleHookProperties(ResourceProperties):
-    AutoScalingGroupName = attrib(default=None)
-    DefaultResult = attrib(default=None)
-    HeartbeatTimeout = attrib(default=None)
-    LifecycleHookName = attrib(default=None)
-    LifecycleTransition = attrib(default=None)
-    NotificationMetadata = attrib(default=None)
-    NotificationTargetARN = attrib(default=None)
-    RoleARN = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class LifecycleHook(Resource):
-    """A Lifecycle Hook for AutoScaling.
-
-    See Also:
-        `AWS Cloud Formation documentation for LifecycleHook
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-as-lifecyclehook.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::AutoScaling::LifecycleHook"
-
-    Properties: LifecycleHookProperties = attrib(
-        factory=LifecycleHookProperties,
-        converter=create_object_converter(LifecycleHookProperties),
+def _create_AutoScalingGroup():
+    class AutoScalingGroupInstancesDistribution(_PropertyType):
+        """The Instances Distribution property type for AutoScalingGroup in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstancesDistribution
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/cfn-as-mixedinstancespolicy-instancesdistribution.html>`_
+        """
+
+        __slots__ = (
+            "OnDemandAllocationStrategy",
+            "OnDemandBaseCapacity",
+            "OnDemandPercentageAboveBaseCapacity",
+            "SpotAllocationStrategy",
+            "SpotInstancePools",
+            "SpotMaxPrice",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupInstancesDistribution", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            OnDemandAllocationStrategy=None,
+            OnDemandBaseCapacity=None,
+            OnDemandPercentageAboveBaseCapacity=None,
+            SpotAllocationStrategy=None,
+            SpotInstancePools=None,
+            SpotMaxPrice=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("OnDemandAllocationStrategy", OnDemandAllocationStrategy)
+            _setattr("OnDemandBaseCapacity", OnDemandBaseCapacity)
+            _setattr(
+                "OnDemandPercentageAboveBaseCapacity",
+                OnDemandPercentageAboveBaseCapacity,
+            )
+            _setattr("SpotAllocationStrategy", SpotAllocationStrategy)
+            _setattr("SpotInstancePools", SpotInstancePools)
+            _setattr("SpotMaxPrice", SpotMaxPrice)
+            _init_PropertyType(self, kwargs)
+
+    class AutoScalingGroupLaunchTemplateSpecification(_PropertyType):
+        """The Launch Template Specification property type for AutoScalingGroup in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplateSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscaling-autoscalinggroup-launchtemplatespecification.html>`_
+        """
+
+        __slots__ = ("LaunchTemplateId", "LaunchTemplateName", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupLaunchTemplateSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            LaunchTemplateId=None,
+            LaunchTemplateName=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LaunchTemplateId", LaunchTemplateId)
+            _setattr("LaunchTemplateName", LaunchTemplateName)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class AutoScalingGroupLaunchTemplateOverrides(_PropertyType):
+        """The Launch Template Overrides property type for AutoScalingGroup in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplateOverrides
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/cfn-as-mixedinstancespolicy-launchtemplateoverrides.html>`_
+        """
+
+        __slots__ = ("InstanceType",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupLaunchTemplateOverrides", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, InstanceType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InstanceType", InstanceType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AutoScalingGroupLaunchTemplateSpecification = create_object_converter(
+        AutoScalingGroupLaunchTemplateSpecification
+    )
+    _convert_AutoScalingGroupLaunchTemplateOverrides_list = (
+        create_object_list_converter(AutoScalingGroupLaunchTemplateOverrides)
+    )
+
+    class AutoScalingGroupLaunchTemplate(_PropertyType):
+        """The Launch Template property type for AutoScalingGroup in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/cfn-as-mixedinstancespolicy-launchtemplate.html>`_
+        """
+
+        __slots__ = ("LaunchTemplateSpecification", "Overrides")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupLaunchTemplate",
+            _PropertyType,
+            __slots__,
+            converters={
+                "LaunchTemplateSpecification": _convert_AutoScalingGroupLaunchTemplateSpecification,
+                "Overrides": _convert_AutoScalingGroupLaunchTemplateOverrides_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, LaunchTemplateSpecification=None, Overrides=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "LaunchTemplateSpecification",
+                _convert_AutoScalingGroupLaunchTemplateSpecification(
+                    LaunchTemplateSpecification
+                ),
+            )
+            _setattr(
+                "Overrides",
+                _convert_AutoScalingGroupLaunchTemplateOverrides_list(Overrides),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class AutoScalingGroupLifecycleHookSpecification(_PropertyType):
+        """The Lifecycle Hook Specification property type for AutoScalingGroup in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for LifecycleHookSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscaling-autoscalinggroup-lifecyclehookspecification.html>`_
+        """
+
+        __slots__ = (
+            "DefaultResult",
+            "HeartbeatTimeout",
+            "LifecycleHookName",
+            "LifecycleTransition",
+            "NotificationMetadata",
+            "NotificationTargetARN",
+            "RoleARN",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupLifecycleHookSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultResult=None,
+            HeartbeatTimeout=None,
+            LifecycleHookName=None,
+            LifecycleTransition=None,
+            NotificationMetadata=None,
+            NotificationTargetARN=None,
+            RoleARN=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultResult", DefaultResult)
+            _setattr("HeartbeatTimeout", HeartbeatTimeout)
+            _setattr("LifecycleHookName", LifecycleHookName)
+            _setattr("LifecycleTransition", LifecycleTransition)
+            _setattr("NotificationMetadata", NotificationMetadata)
+            _setattr("NotificationTargetARN", NotificationTargetARN)
+            _setattr("RoleARN", RoleARN)
+            _init_PropertyType(self, kwargs)
+
+    class AutoScalingGroupMetricsCollection(_PropertyType):
+        """The Metrics Collection property type for AutoScalingGroup in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricsCollection
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-metricscollection.html>`_
+        """
+
+        __slots__ = ("Granularity", "Metrics")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupMetricsCollection", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Granularity=None, Metrics=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Granularity", Granularity)
+            _setattr("Metrics", Metrics)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AutoScalingGroupInstancesDistribution = create_object_converter(
+        AutoScalingGroupInstancesDistribution
+    )
+    _convert_AutoScalingGroupLaunchTemplate = create_object_converter(
+        AutoScalingGroupLaunchTemplate
+    )
+
+    class AutoScalingGroupMixedInstancesPolicy(_PropertyType):
+        """The Mixed Instances Policy property type for AutoScalingGroup in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for MixedInstancesPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/cfn-as-group-mixedinstancespolicy.html>`_
+        """
+
+        __slots__ = ("InstancesDistribution", "LaunchTemplate")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupMixedInstancesPolicy",
+            _PropertyType,
+            __slots__,
+            converters={
+                "InstancesDistribution": _convert_AutoScalingGroupInstancesDistribution,
+                "LaunchTemplate": _convert_AutoScalingGroupLaunchTemplate,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InstancesDistribution=None, LaunchTemplate=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InstancesDistribution",
+                _convert_AutoScalingGroupInstancesDistribution(InstancesDistribution),
+            )
+            _setattr(
+                "LaunchTemplate",
+                _convert_AutoScalingGroupLaunchTemplate(LaunchTemplate),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class AutoScalingGroupNotificationConfiguration(_PropertyType):
+        """The Notification Configuration property type for AutoScalingGroup in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotificationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-notificationconfigurations.html>`_
+        """
+
+        __slots__ = ("NotificationTypes", "TopicARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupNotificationConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, NotificationTypes=None, TopicARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NotificationTypes", NotificationTypes)
+            _setattr("TopicARN", TopicARN)
+            _init_PropertyType(self, kwargs)
+
+    class AutoScalingGroupTagProperty(_PropertyType):
+        """The Tag Property property type for AutoScalingGroup in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagProperty
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-tags.html>`_
+        """
+
+        __slots__ = ("Key", "PropagateAtLaunch", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupTagProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Key=None, PropagateAtLaunch=None, Value=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("PropagateAtLaunch", PropagateAtLaunch)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AutoScalingGroupLifecycleHookSpecification_list = (
+        create_object_list_converter(AutoScalingGroupLifecycleHookSpecification)
+    )
+    _convert_AutoScalingGroupMetricsCollection_list = create_object_list_converter(
+        AutoScalingGroupMetricsCollection
+    )
+    _convert_AutoScalingGroupMixedInstancesPolicy = create_object_converter(
+        AutoScalingGroupMixedInstancesPolicy
+    )
+    _convert_AutoScalingGroupNotificationConfiguration_list = (
+        create_object_list_converter(AutoScalingGroupNotificationConfiguration)
+    )
+    _convert_AutoScalingGroupTagProperty_list = create_object_list_converter(
+        AutoScalingGroupTagProperty
+    )
+
+    class AutoScalingGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "AutoScalingGroupName",
+            "AvailabilityZones",
+            "Cooldown",
+            "DesiredCapacity",
+            "HealthCheckGracePeriod",
+            "HealthCheckType",
+            "InstanceId",
+            "LaunchConfigurationName",
+            "LaunchTemplate",
+            "LifecycleHookSpecificationList",
+            "LoadBalancerNames",
+            "MaxSize",
+            "MetricsCollection",
+            "MinSize",
+            "MixedInstancesPolicy",
+            "NotificationConfigurations",
+            "PlacementGroup",
+            "ServiceLinkedRoleARN",
+            "Tags",
+            "TargetGroupARNs",
+            "TerminationPolicies",
+            "VPCZoneIdentifier",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LaunchTemplate": _convert_AutoScalingGroupLaunchTemplateSpecification,
+                "LifecycleHookSpecificationList": _convert_AutoScalingGroupLifecycleHookSpecification_list,
+                "MetricsCollection": _convert_AutoScalingGroupMetricsCollection_list,
+                "MixedInstancesPolicy": _convert_AutoScalingGroupMixedInstancesPolicy,
+                "NotificationConfigurations": _convert_AutoScalingGroupNotificationConfiguration_list,
+                "Tags": _convert_AutoScalingGroupTagProperty_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoScalingGroupName=None,
+            AvailabilityZones=None,
+            Cooldown=None,
+            DesiredCapacity=None,
+            HealthCheckGracePeriod=None,
+            HealthCheckType=None,
+            InstanceId=None,
+            LaunchConfigurationName=None,
+            LaunchTemplate=None,
+            LifecycleHookSpecificationList=None,
+            LoadBalancerNames=None,
+            MaxSize=None,
+            MetricsCollection=None,
+            MinSize=None,
+            MixedInstancesPolicy=None,
+            NotificationConfigurations=None,
+            PlacementGroup=None,
+            ServiceLinkedRoleARN=None,
+            Tags=None,
+            TargetGroupARNs=None,
+            TerminationPolicies=None,
+            VPCZoneIdentifier=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoScalingGroupName", AutoScalingGroupName)
+            _setattr("AvailabilityZones", AvailabilityZones)
+            _setattr("Cooldown", Cooldown)
+            _setattr("DesiredCapacity", DesiredCapacity)
+            _setattr("HealthCheckGracePeriod", HealthCheckGracePeriod)
+            _setattr("HealthCheckType", HealthCheckType)
+            _setattr("InstanceId", InstanceId)
+            _setattr("LaunchConfigurationName", LaunchConfigurationName)
+            _setattr(
+                "LaunchTemplate",
+                _convert_AutoScalingGroupLaunchTemplateSpecification(LaunchTemplate),
+            )
+            _setattr(
+                "LifecycleHookSpecificationList",
+                _convert_AutoScalingGroupLifecycleHookSpecification_list(
+                    LifecycleHookSpecificationList
+                ),
+            )
+            _setattr("LoadBalancerNames", LoadBalancerNames)
+            _setattr("MaxSize", MaxSize)
+            _setattr(
+                "MetricsCollection",
+                _convert_AutoScalingGroupMetricsCollection_list(MetricsCollection),
+            )
+            _setattr("MinSize", MinSize)
+            _setattr(
+                "MixedInstancesPolicy",
+                _convert_AutoScalingGroupMixedInstancesPolicy(MixedInstancesPolicy),
+            )
+            _setattr(
+                "NotificationConfigurations",
+                _convert_AutoScalingGroupNotificationConfiguration_list(
+                    NotificationConfigurations
+                ),
+            )
+            _setattr("PlacementGroup", PlacementGroup)
+            _setattr("ServiceLinkedRoleARN", ServiceLinkedRoleARN)
+            _setattr("Tags", _convert_AutoScalingGroupTagProperty_list(Tags))
+            _setattr("TargetGroupARNs", TargetGroupARNs)
+            _setattr("TerminationPolicies", TerminationPolicies)
+            _setattr("VPCZoneIdentifier", VPCZoneIdentifier)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AutoScalingGroupProperties = create_object_converter(
+        AutoScalingGroupProperties
     )
 
+    class AutoScalingGroup(_Resource):
+        """A Auto Scaling Group for AutoScaling.
 
-@attrs(**ATTRSCONFIG)
-class ScalingPolicyProperties(ResourceProperties):
-    AdjustmentType = attrib(default=None)
-    AutoScalingGroupName = attrib(default=None)
-    Cooldown = attrib(default=None)
-    EstimatedInstanceWarmup = attrib(default=None)
-    MetricAggregationType = attrib(default=None)
-    MinAdjustmentMagnitude = attrib(default=None)
-    PolicyType = attrib(default=None)
-    ScalingAdjustment = attrib(default=None)
-    StepAdjustments = attrib(default=None)
-    TargetTrackingConfiguration = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for AutoScalingGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-group.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::AutoScaling::AutoScalingGroup"
+        TAG_FORMAT = "PropagatingKeyValueList"
 
-@attrs(**ATTRSCONFIG)
-class ScalingPolicy(Resource):
-    """A Scaling Policy for AutoScaling.
+        Properties: AutoScalingGroupProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for ScalingPolicy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-policy.html>`_
-    """
+        # NB: CreationPolicy may be set for AutoScalingGroup
+        # (unlike most Resource types)
+        CreationPolicy: Dict[str, Any]
 
-    RESOURCE_TYPE = "AWS::AutoScaling::ScalingPolicy"
+        # NB: UpdatePolicy may be set for AutoScalingGroup
+        # (unlike most Resource types)
+        UpdatePolicy: Dict[str, Any]
 
-    Properties: ScalingPolicyProperties = attrib(
-        factory=ScalingPolicyProperties,
-        converter=create_object_converter(ScalingPolicyProperties),
+        __slots__ = ("Properties", "CreationPolicy", "UpdatePolicy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AutoScalingGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AutoScalingGroupProperties},
+            factories={
+                "Properties": AutoScalingGroupProperties,
+                "CreationPolicy": dict,
+                "UpdatePolicy": dict,
+            },
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Properties=NOTHING,
+            CreationPolicy: Dict[str, Any] = NOTHING,
+            UpdatePolicy: Dict[str, Any] = NOTHING,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AutoScalingGroupProperties()
+            _setattr("Properties", _convert_AutoScalingGroupProperties(Properties))
+            if CreationPolicy is NOTHING:
+                CreationPolicy = dict()
+            _setattr("CreationPolicy", CreationPolicy)
+            if UpdatePolicy is NOTHING:
+                UpdatePolicy = dict()
+            _setattr("UpdatePolicy", UpdatePolicy)
+            _init_Resource(self, kwargs)
+
+    return (
+        AutoScalingGroup,
+        AutoScalingGroupProperties,
+        AutoScalingGroupInstancesDistribution,
+        AutoScalingGroupLaunchTemplateSpecification,
+        AutoScalingGroupLaunchTemplateOverrides,
+        AutoScalingGroupLaunchTemplate,
+        AutoScalingGroupLifecycleHookSpecification,
+        AutoScalingGroupMetricsCollection,
+        AutoScalingGroupMixedInstancesPolicy,
+        AutoScalingGroupNotificationConfiguration,
+        AutoScalingGroupTagProperty,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class ScheduledActionProperties(ResourceProperties):
-    AutoScalingGroupName = attrib(default=None)
-    DesiredCapacity = attrib(default=None)
-    EndTime = attrib(default=None)
-    MaxSize = attrib(default=None)
-    MinSize = attrib(default=None)
-    Recurrence = attrib(default=None)
-    StartTime = attrib(default=None)
+def _create_LaunchConfiguration():
+    class LaunchConfigurationBlockDevice(_PropertyType):
+        """The Block Device property type for LaunchConfiguration in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for BlockDevice
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-launchconfig-blockdev-template.html>`_
+        """
 
+        __slots__ = (
+            "DeleteOnTermination",
+            "Encrypted",
+            "Iops",
+            "SnapshotId",
+            "VolumeSize",
+            "VolumeType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchConfigurationBlockDevice", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ScheduledAction(Resource):
-    """A Scheduled Action for AutoScaling.
+        def __init__(
+            self,
+            *,
+            DeleteOnTermination=None,
+            Encrypted=None,
+            Iops=None,
+            SnapshotId=None,
+            VolumeSize=None,
+            VolumeType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteOnTermination", DeleteOnTermination)
+            _setattr("Encrypted", Encrypted)
+            _setattr("Iops", Iops)
+            _setattr("SnapshotId", SnapshotId)
+            _setattr("VolumeSize", VolumeSize)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LaunchConfigurationBlockDevice = create_object_converter(
+        LaunchConfigurationBlockDevice
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for ScheduledAction
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-as-scheduledaction.html>`_
-    """
+    class LaunchConfigurationBlockDeviceMapping(_PropertyType):
+        """The Block Device Mapping property type for LaunchConfiguration in AutoScaling.
 
-    RESOURCE_TYPE = "AWS::AutoScaling::ScheduledAction"
+        See Also:
+            `AWS Cloud Formation documentation for BlockDeviceMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-launchconfig-blockdev-mapping.html>`_
+        """
 
-    Properties: ScheduledActionProperties = attrib(
-        factory=ScheduledActionProperties,
-        converter=create_object_converter(ScheduledActionProperties),
+        __slots__ = ("DeviceName", "Ebs", "NoDevice", "VirtualName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchConfigurationBlockDeviceMapping",
+            _PropertyType,
+            __slots__,
+            converters={"Ebs": _convert_LaunchConfigurationBlockDevice},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeviceName=None,
+            Ebs=None,
+            NoDevice=None,
+            VirtualName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeviceName", DeviceName)
+            _setattr("Ebs", _convert_LaunchConfigurationBlockDevice(Ebs))
+            _setattr("NoDevice", NoDevice)
+            _setattr("VirtualName", VirtualName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LaunchConfigurationBlockDeviceMapping_list = create_object_list_converter(
+        LaunchConfigurationBlockDeviceMapping
     )
+
+    class LaunchConfigurationProperties(_ResourceProperties):
+        __slots__ = (
+            "AssociatePublicIpAddress",
+            "BlockDeviceMappings",
+            "ClassicLinkVPCId",
+            "ClassicLinkVPCSecurityGroups",
+            "EbsOptimized",
+            "IamInstanceProfile",
+            "ImageId",
+            "InstanceId",
+            "InstanceMonitoring",
+            "InstanceType",
+            "KernelId",
+            "KeyName",
+            "LaunchConfigurationName",
+            "PlacementTenancy",
+            "RamDiskId",
+            "SecurityGroups",
+            "SpotPrice",
+            "UserData",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchConfigurationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "BlockDeviceMappings": _convert_LaunchConfigurationBlockDeviceMapping_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssociatePublicIpAddress=None,
+            BlockDeviceMappings=None,
+            ClassicLinkVPCId=None,
+            ClassicLinkVPCSecurityGroups=None,
+            EbsOptimized=None,
+            IamInstanceProfile=None,
+            ImageId=None,
+            InstanceId=None,
+            InstanceMonitoring=None,
+            InstanceType=None,
+            KernelId=None,
+            KeyName=None,
+            LaunchConfigurationName=None,
+            PlacementTenancy=None,
+            RamDiskId=None,
+            SecurityGroups=None,
+            SpotPrice=None,
+            UserData=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssociatePublicIpAddress", AssociatePublicIpAddress)
+            _setattr(
+                "BlockDeviceMappings",
+                _convert_LaunchConfigurationBlockDeviceMapping_list(
+                    BlockDeviceMappings
+                ),
+            )
+            _setattr("ClassicLinkVPCId", ClassicLinkVPCId)
+            _setattr("ClassicLinkVPCSecurityGroups", ClassicLinkVPCSecurityGroups)
+            _setattr("EbsOptimized", EbsOptimized)
+            _setattr("IamInstanceProfile", IamInstanceProfile)
+            _setattr("ImageId", ImageId)
+            _setattr("InstanceId", InstanceId)
+            _setattr("InstanceMonitoring", InstanceMonitoring)
+            _setattr("InstanceType", InstanceType)
+            _setattr("KernelId", KernelId)
+            _setattr("KeyName", KeyName)
+            _setattr("LaunchConfigurationName", LaunchConfigurationName)
+            _setattr("PlacementTenancy", PlacementTenancy)
+            _setattr("RamDiskId", RamDiskId)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr("SpotPrice", SpotPrice)
+            _setattr("UserData", UserData)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LaunchConfigurationProperties = create_object_converter(
+        LaunchConfigurationProperties
+    )
+
+    class LaunchConfiguration(_Resource):
+        """A Launch Configuration for AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-launchconfig.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AutoScaling::LaunchConfiguration"
+
+        Properties: LaunchConfigurationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchConfiguration",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LaunchConfigurationProperties},
+            factories={"Properties": LaunchConfigurationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LaunchConfigurationProperties()
+            _setattr("Properties", _convert_LaunchConfigurationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        LaunchConfiguration,
+        LaunchConfigurationProperties,
+        LaunchConfigurationBlockDevice,
+        LaunchConfigurationBlockDeviceMapping,
+    )
+
+
+def _create_LifecycleHook():
+    class LifecycleHookProperties(_ResourceProperties):
+        __slots__ = (
+            "AutoScalingGroupName",
+            "DefaultResult",
+            "HeartbeatTimeout",
+            "LifecycleHookName",
+            "LifecycleTransition",
+            "NotificationMetadata",
+            "NotificationTargetARN",
+            "RoleARN",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecycleHookProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoScalingGroupName=None,
+            DefaultResult=None,
+            HeartbeatTimeout=None,
+            LifecycleHookName=None,
+            LifecycleTransition=None,
+            NotificationMetadata=None,
+            NotificationTargetARN=None,
+            RoleARN=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoScalingGroupName", AutoScalingGroupName)
+            _setattr("DefaultResult", DefaultResult)
+            _setattr("HeartbeatTimeout", HeartbeatTimeout)
+            _setattr("LifecycleHookName", LifecycleHookName)
+            _setattr("LifecycleTransition", LifecycleTransition)
+            _setattr("NotificationMetadata", NotificationMetadata)
+            _setattr("NotificationTargetARN", NotificationTargetARN)
+            _setattr("RoleARN", RoleARN)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LifecycleHookProperties = create_object_converter(LifecycleHookProperties)
+
+    class LifecycleHook(_Resource):
+        """A Lifecycle Hook for AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for LifecycleHook
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-as-lifecyclehook.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AutoScaling::LifecycleHook"
+
+        Properties: LifecycleHookProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecycleHook",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LifecycleHookProperties},
+            factories={"Properties": LifecycleHookProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LifecycleHookProperties()
+            _setattr("Properties", _convert_LifecycleHookProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return LifecycleHook, LifecycleHookProperties
+
+
+def _create_ScalingPolicy():
+    class ScalingPolicyMetricDimension(_PropertyType):
+        """The Metric Dimension property type for ScalingPolicy in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscaling-scalingpolicy-metricdimension.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyMetricDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPolicyMetricDimension_list = create_object_list_converter(
+        ScalingPolicyMetricDimension
+    )
+
+    class ScalingPolicyCustomizedMetricSpecification(_PropertyType):
+        """The Customized Metric Specification property type for ScalingPolicy in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomizedMetricSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscaling-scalingpolicy-customizedmetricspecification.html>`_
+        """
+
+        __slots__ = ("Dimensions", "MetricName", "Namespace", "Statistic", "Unit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyCustomizedMetricSpecification",
+            _PropertyType,
+            __slots__,
+            converters={"Dimensions": _convert_ScalingPolicyMetricDimension_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Dimensions=None,
+            MetricName=None,
+            Namespace=None,
+            Statistic=None,
+            Unit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Dimensions", _convert_ScalingPolicyMetricDimension_list(Dimensions)
+            )
+            _setattr("MetricName", MetricName)
+            _setattr("Namespace", Namespace)
+            _setattr("Statistic", Statistic)
+            _setattr("Unit", Unit)
+            _init_PropertyType(self, kwargs)
+
+    class ScalingPolicyPredefinedMetricSpecification(_PropertyType):
+        """The Predefined Metric Specification property type for ScalingPolicy in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for PredefinedMetricSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscaling-scalingpolicy-predefinedmetricspecification.html>`_
+        """
+
+        __slots__ = ("PredefinedMetricType", "ResourceLabel")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyPredefinedMetricSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, PredefinedMetricType=None, ResourceLabel=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PredefinedMetricType", PredefinedMetricType)
+            _setattr("ResourceLabel", ResourceLabel)
+            _init_PropertyType(self, kwargs)
+
+    class ScalingPolicyStepAdjustment(_PropertyType):
+        """The Step Adjustment property type for ScalingPolicy in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for StepAdjustment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscaling-scalingpolicy-stepadjustments.html>`_
+        """
+
+        __slots__ = (
+            "MetricIntervalLowerBound",
+            "MetricIntervalUpperBound",
+            "ScalingAdjustment",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyStepAdjustment", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MetricIntervalLowerBound=None,
+            MetricIntervalUpperBound=None,
+            ScalingAdjustment=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MetricIntervalLowerBound", MetricIntervalLowerBound)
+            _setattr("MetricIntervalUpperBound", MetricIntervalUpperBound)
+            _setattr("ScalingAdjustment", ScalingAdjustment)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPolicyCustomizedMetricSpecification = create_object_converter(
+        ScalingPolicyCustomizedMetricSpecification
+    )
+    _convert_ScalingPolicyPredefinedMetricSpecification = create_object_converter(
+        ScalingPolicyPredefinedMetricSpecification
+    )
+
+    class ScalingPolicyTargetTrackingConfiguration(_PropertyType):
+        """The Target Tracking Configuration property type for ScalingPolicy in AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for TargetTrackingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscaling-scalingpolicy-targettrackingconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "CustomizedMetricSpecification",
+            "DisableScaleIn",
+            "PredefinedMetricSpecification",
+            "TargetValue",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyTargetTrackingConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CustomizedMetricSpecification": _convert_ScalingPolicyCustomizedMetricSpecification,
+                "PredefinedMetricSpecification": _convert_ScalingPolicyPredefinedMetricSpecification,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CustomizedMetricSpecification=None,
+            DisableScaleIn=None,
+            PredefinedMetricSpecification=None,
+            TargetValue=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CustomizedMetricSpecification",
+                _convert_ScalingPolicyCustomizedMetricSpecification(
+                    CustomizedMetricSpecification
+                ),
+            )
+            _setattr("DisableScaleIn", DisableScaleIn)
+            _setattr(
+                "PredefinedMetricSpecification",
+                _convert_ScalingPolicyPredefinedMetricSpecification(
+                    PredefinedMetricSpecification
+                ),
+            )
+            _setattr("TargetValue", TargetValue)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPolicyStepAdjustment_list = create_object_list_converter(
+        ScalingPolicyStepAdjustment
+    )
+    _convert_ScalingPolicyTargetTrackingConfiguration = create_object_converter(
+        ScalingPolicyTargetTrackingConfiguration
+    )
+
+    class ScalingPolicyProperties(_ResourceProperties):
+        __slots__ = (
+            "AdjustmentType",
+            "AutoScalingGroupName",
+            "Cooldown",
+            "EstimatedInstanceWarmup",
+            "MetricAggregationType",
+            "MinAdjustmentMagnitude",
+            "PolicyType",
+            "ScalingAdjustment",
+            "StepAdjustments",
+            "TargetTrackingConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicyProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "StepAdjustments": _convert_ScalingPolicyStepAdjustment_list,
+                "TargetTrackingConfiguration": _convert_ScalingPolicyTargetTrackingConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AdjustmentType=None,
+            AutoScalingGroupName=None,
+            Cooldown=None,
+            EstimatedInstanceWarmup=None,
+            MetricAggregationType=None,
+            MinAdjustmentMagnitude=None,
+            PolicyType=None,
+            ScalingAdjustment=None,
+            StepAdjustments=None,
+            TargetTrackingConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdjustmentType", AdjustmentType)
+            _setattr("AutoScalingGroupName", AutoScalingGroupName)
+            _setattr("Cooldown", Cooldown)
+            _setattr("EstimatedInstanceWarmup", EstimatedInstanceWarmup)
+            _setattr("MetricAggregationType", MetricAggregationType)
+            _setattr("MinAdjustmentMagnitude", MinAdjustmentMagnitude)
+            _setattr("PolicyType", PolicyType)
+            _setattr("ScalingAdjustment", ScalingAdjustment)
+            _setattr(
+                "StepAdjustments",
+                _convert_ScalingPolicyStepAdjustment_list(StepAdjustments),
+            )
+            _setattr(
+                "TargetTrackingConfiguration",
+                _convert_ScalingPolicyTargetTrackingConfiguration(
+                    TargetTrackingConfiguration
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ScalingPolicyProperties = create_object_converter(ScalingPolicyProperties)
+
+    class ScalingPolicy(_Resource):
+        """A Scaling Policy for AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-as-policy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AutoScaling::ScalingPolicy"
+
+        Properties: ScalingPolicyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPolicy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ScalingPolicyProperties},
+            factories={"Properties": ScalingPolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ScalingPolicyProperties()
+            _setattr("Properties", _convert_ScalingPolicyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ScalingPolicy,
+        ScalingPolicyProperties,
+        ScalingPolicyMetricDimension,
+        ScalingPolicyCustomizedMetricSpecification,
+        ScalingPolicyPredefinedMetricSpecification,
+        ScalingPolicyStepAdjustment,
+        ScalingPolicyTargetTrackingConfiguration,
+    )
+
+
+def _create_ScheduledAction():
+    class ScheduledActionProperties(_ResourceProperties):
+        __slots__ = (
+            "AutoScalingGroupName",
+            "DesiredCapacity",
+            "EndTime",
+            "MaxSize",
+            "MinSize",
+            "Recurrence",
+            "StartTime",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScheduledActionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoScalingGroupName=None,
+            DesiredCapacity=None,
+            EndTime=None,
+            MaxSize=None,
+            MinSize=None,
+            Recurrence=None,
+            StartTime=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoScalingGroupName", AutoScalingGroupName)
+            _setattr("DesiredCapacity", DesiredCapacity)
+            _setattr("EndTime", EndTime)
+            _setattr("MaxSize", MaxSize)
+            _setattr("MinSize", MinSize)
+            _setattr("Recurrence", Recurrence)
+            _setattr("StartTime", StartTime)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ScheduledActionProperties = create_object_converter(
+        ScheduledActionProperties
+    )
+
+    class ScheduledAction(_Resource):
+        """A Scheduled Action for AutoScaling.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScheduledAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-as-scheduledaction.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AutoScaling::ScheduledAction"
+
+        Properties: ScheduledActionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScheduledAction",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ScheduledActionProperties},
+            factories={"Properties": ScheduledActionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ScheduledActionProperties()
+            _setattr("Properties", _convert_ScheduledActionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ScheduledAction, ScheduledActionProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "AutoScalingGroup": _create_AutoScalingGroup,
+        "AutoScalingGroupProperties": _create_AutoScalingGroup,
+        "AutoScalingGroupInstancesDistribution": _create_AutoScalingGroup,
+        "AutoScalingGroupLaunchTemplate": _create_AutoScalingGroup,
+        "AutoScalingGroupLaunchTemplateOverrides": _create_AutoScalingGroup,
+        "AutoScalingGroupLaunchTemplateSpecification": _create_AutoScalingGroup,
+        "AutoScalingGroupLifecycleHookSpecification": _create_AutoScalingGroup,
+        "AutoScalingGroupMetricsCollection": _create_AutoScalingGroup,
+        "AutoScalingGroupMixedInstancesPolicy": _create_AutoScalingGroup,
+        "AutoScalingGroupNotificationConfiguration": _create_AutoScalingGroup,
+        "AutoScalingGroupTagProperty": _create_AutoScalingGroup,
+        "LaunchConfiguration": _create_LaunchConfiguration,
+        "LaunchConfigurationProperties": _create_LaunchConfiguration,
+        "LaunchConfigurationBlockDevice": _create_LaunchConfiguration,
+        "LaunchConfigurationBlockDeviceMapping": _create_LaunchConfiguration,
+        "LifecycleHook": _create_LifecycleHook,
+        "LifecycleHookProperties": _create_LifecycleHook,
+        "ScalingPolicy": _create_ScalingPolicy,
+        "ScalingPolicyProperties": _create_ScalingPolicy,
+        "ScalingPolicyCustomizedMetricSpecification": _create_ScalingPolicy,
+        "ScalingPolicyMetricDimension": _create_ScalingPolicy,
+        "ScalingPolicyPredefinedMetricSpecification": _create_ScalingPolicy,
+        "ScalingPolicyStepAdjustment": _create_ScalingPolicy,
+        "ScalingPolicyTargetTrackingConfiguration": _create_ScalingPolicy,
+        "ScheduledAction": _create_ScheduledAction,
+        "ScheduledActionProperties": _create_ScheduledAction,
+    },
+)
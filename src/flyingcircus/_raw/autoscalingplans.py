@@ -7,35 +7,510 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["ScalingPlan", "ScalingPlanProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "ScalingPlan",
+    "ScalingPlanProperties",
+    "ScalingPlanApplicationSource",
+    "ScalingPlanCustomizedLoadMetricSpecification",
+    "ScalingPlanCustomizedScalingMetricSpecification",
+    "ScalingPlanMetricDimension",
+    "ScalingPlanPredefinedLoadMetricSpecification",
+    "ScalingPlanPredefinedScalingMetricSpecification",
+    "ScalingPlanScalingInstruction",
+    "ScalingPlanTagFilter",
+    "ScalingPlanTargetTrackingConfiguration",
+]
 
-@attrs(**ATTRSCONFIG)
-class ScalingPlanProperties(ResourceProperties):
-    ApplicationSource = attrib(default=None)
-    ScalingInstructions = attrib(default=None)
 
+def _create_ScalingPlan():
+    class ScalingPlanTagFilter(_PropertyType):
+        """The Tag Filter property type for ScalingPlan in AutoScalingPlans.
 
-@attrs(**ATTRSCONFIG)
-class ScalingPlan(Resource):
-    """A Scaling Plan for AutoScalingPlans.
+        See Also:
+            `AWS Cloud Formation documentation for TagFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscalingplans-scalingplan-tagfilter.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for ScalingPlan
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-autoscalingplans-scalingplan.html>`_
-    """
+        __slots__ = ("Key", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanTagFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::AutoScalingPlans::ScalingPlan"
+        def __init__(self, *, Key=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ScalingPlanProperties = attrib(
-        factory=ScalingPlanProperties,
-        converter=create_object_converter(ScalingPlanProperties),
+    _convert_ScalingPlanTagFilter_list = create_object_list_converter(
+        ScalingPlanTagFilter
     )
+
+    class ScalingPlanApplicationSource(_PropertyType):
+        """The Application Source property type for ScalingPlan in AutoScalingPlans.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscalingplans-scalingplan-applicationsource.html>`_
+        """
+
+        __slots__ = ("CloudFormationStackARN", "TagFilters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanApplicationSource",
+            _PropertyType,
+            __slots__,
+            converters={"TagFilters": _convert_ScalingPlanTagFilter_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CloudFormationStackARN=None, TagFilters=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudFormationStackARN", CloudFormationStackARN)
+            _setattr("TagFilters", _convert_ScalingPlanTagFilter_list(TagFilters))
+            _init_PropertyType(self, kwargs)
+
+    class ScalingPlanMetricDimension(_PropertyType):
+        """The Metric Dimension property type for ScalingPlan in AutoScalingPlans.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscalingplans-scalingplan-metricdimension.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanMetricDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPlanMetricDimension_list = create_object_list_converter(
+        ScalingPlanMetricDimension
+    )
+
+    class ScalingPlanCustomizedLoadMetricSpecification(_PropertyType):
+        """The Customized Load Metric Specification property type for ScalingPlan in AutoScalingPlans.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomizedLoadMetricSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscalingplans-scalingplan-customizedloadmetricspecification.html>`_
+        """
+
+        __slots__ = ("Dimensions", "MetricName", "Namespace", "Statistic", "Unit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanCustomizedLoadMetricSpecification",
+            _PropertyType,
+            __slots__,
+            converters={"Dimensions": _convert_ScalingPlanMetricDimension_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Dimensions=None,
+            MetricName=None,
+            Namespace=None,
+            Statistic=None,
+            Unit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Dimensions", _convert_ScalingPlanMetricDimension_list(Dimensions))
+            _setattr("MetricName", MetricName)
+            _setattr("Namespace", Namespace)
+            _setattr("Statistic", Statistic)
+            _setattr("Unit", Unit)
+            _init_PropertyType(self, kwargs)
+
+    class ScalingPlanCustomizedScalingMetricSpecification(_PropertyType):
+        """The Customized Scaling Metric Specification property type for ScalingPlan in AutoScalingPlans.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomizedScalingMetricSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscalingplans-scalingplan-customizedscalingmetricspecification.html>`_
+        """
+
+        __slots__ = ("Dimensions", "MetricName", "Namespace", "Statistic", "Unit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanCustomizedScalingMetricSpecification",
+            _PropertyType,
+            __slots__,
+            converters={"Dimensions": _convert_ScalingPlanMetricDimension_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Dimensions=None,
+            MetricName=None,
+            Namespace=None,
+            Statistic=None,
+            Unit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Dimensions", _convert_ScalingPlanMetricDimension_list(Dimensions))
+            _setattr("MetricName", MetricName)
+            _setattr("Namespace", Namespace)
+            _setattr("Statistic", Statistic)
+            _setattr("Unit", Unit)
+            _init_PropertyType(self, kwargs)
+
+    class ScalingPlanPredefinedLoadMetricSpecification(_PropertyType):
+        """The Predefined Load Metric Specification property type for ScalingPlan in AutoScalingPlans.
+
+        See Also:
+            `AWS Cloud Formation documentation for PredefinedLoadMetricSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscalingplans-scalingplan-predefinedloadmetricspecification.html>`_
+        """
+
+        __slots__ = ("PredefinedLoadMetricType", "ResourceLabel")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanPredefinedLoadMetricSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, PredefinedLoadMetricType=None, ResourceLabel=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PredefinedLoadMetricType", PredefinedLoadMetricType)
+            _setattr("ResourceLabel", ResourceLabel)
+            _init_PropertyType(self, kwargs)
+
+    class ScalingPlanPredefinedScalingMetricSpecification(_PropertyType):
+        """The Predefined Scaling Metric Specification property type for ScalingPlan in AutoScalingPlans.
+
+        See Also:
+            `AWS Cloud Formation documentation for PredefinedScalingMetricSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscalingplans-scalingplan-predefinedscalingmetricspecification.html>`_
+        """
+
+        __slots__ = ("PredefinedScalingMetricType", "ResourceLabel")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanPredefinedScalingMetricSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, PredefinedScalingMetricType=None, ResourceLabel=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PredefinedScalingMetricType", PredefinedScalingMetricType)
+            _setattr("ResourceLabel", ResourceLabel)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPlanCustomizedScalingMetricSpecification = create_object_converter(
+        ScalingPlanCustomizedScalingMetricSpecification
+    )
+    _convert_ScalingPlanPredefinedScalingMetricSpecification = create_object_converter(
+        ScalingPlanPredefinedScalingMetricSpecification
+    )
+
+    class ScalingPlanTargetTrackingConfiguration(_PropertyType):
+        """The Target Tracking Configuration property type for ScalingPlan in AutoScalingPlans.
+
+        See Also:
+            `AWS Cloud Formation documentation for TargetTrackingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscalingplans-scalingplan-targettrackingconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "CustomizedScalingMetricSpecification",
+            "DisableScaleIn",
+            "EstimatedInstanceWarmup",
+            "PredefinedScalingMetricSpecification",
+            "ScaleInCooldown",
+            "ScaleOutCooldown",
+            "TargetValue",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanTargetTrackingConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CustomizedScalingMetricSpecification": _convert_ScalingPlanCustomizedScalingMetricSpecification,
+                "PredefinedScalingMetricSpecification": _convert_ScalingPlanPredefinedScalingMetricSpecification,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CustomizedScalingMetricSpecification=None,
+            DisableScaleIn=None,
+            EstimatedInstanceWarmup=None,
+            PredefinedScalingMetricSpecification=None,
+            ScaleInCooldown=None,
+            ScaleOutCooldown=None,
+            TargetValue=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CustomizedScalingMetricSpecification",
+                _convert_ScalingPlanCustomizedScalingMetricSpecification(
+                    CustomizedScalingMetricSpecification
+                ),
+            )
+            _setattr("DisableScaleIn", DisableScaleIn)
+            _setattr("EstimatedInstanceWarmup", EstimatedInstanceWarmup)
+            _setattr(
+                "PredefinedScalingMetricSpecification",
+                _convert_ScalingPlanPredefinedScalingMetricSpecification(
+                    PredefinedScalingMetricSpecification
+                ),
+            )
+            _setattr("ScaleInCooldown", ScaleInCooldown)
+            _setattr("ScaleOutCooldown", ScaleOutCooldown)
+            _setattr("TargetValue", TargetValue)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPlanCustomizedLoadMetricSpecification = create_object_converter(
+        ScalingPlanCustomizedLoadMetricSpecification
+    )
+    _convert_ScalingPlanPredefinedLoadMetricSpecification = create_object_converter(
+        ScalingPlanPredefinedLoadMetricSpecification
+    )
+    _convert_ScalingPlanTargetTrackingConfiguration_list = create_object_list_converter(
+        ScalingPlanTargetTrackingConfiguration
+    )
+
+    class ScalingPlanScalingInstruction(_PropertyType):
+        """The Scaling Instruction property type for ScalingPlan in AutoScalingPlans.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingInstruction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-autoscalingplans-scalingplan-scalinginstruction.html>`_
+        """
+
+        __slots__ = (
+            "CustomizedLoadMetricSpecification",
+            "DisableDynamicScaling",
+            "MaxCapacity",
+            "MinCapacity",
+            "PredefinedLoadMetricSpecification",
+            "PredictiveScalingMaxCapacityBehavior",
+            "PredictiveScalingMaxCapacityBuffer",
+            "PredictiveScalingMode",
+            "ResourceId",
+            "ScalableDimension",
+            "ScalingPolicyUpdateBehavior",
+            "ScheduledActionBufferTime",
+            "ServiceNamespace",
+            "TargetTrackingConfigurations",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanScalingInstruction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CustomizedLoadMetricSpecification": _convert_ScalingPlanCustomizedLoadMetricSpecification,
+                "PredefinedLoadMetricSpecification": _convert_ScalingPlanPredefinedLoadMetricSpecification,
+                "TargetTrackingConfigurations": _convert_ScalingPlanTargetTrackingConfiguration_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CustomizedLoadMetricSpecification=None,
+            DisableDynamicScaling=None,
+            MaxCapacity=None,
+            MinCapacity=None,
+            PredefinedLoadMetricSpecification=None,
+            PredictiveScalingMaxCapacityBehavior=None,
+            PredictiveScalingMaxCapacityBuffer=None,
+            PredictiveScalingMode=None,
+            ResourceId=None,
+            ScalableDimension=None,
+            ScalingPolicyUpdateBehavior=None,
+            ScheduledActionBufferTime=None,
+            ServiceNamespace=None,
+            TargetTrackingConfigurations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CustomizedLoadMetricSpecification",
+                _convert_ScalingPlanCustomizedLoadMetricSpecification(
+                    CustomizedLoadMetricSpecification
+                ),
+            )
+            _setattr("DisableDynamicScaling", DisableDynamicScaling)
+            _setattr("MaxCapacity", MaxCapacity)
+            _setattr("MinCapacity", MinCapacity)
+            _setattr(
+                "PredefinedLoadMetricSpecification",
+                _convert_ScalingPlanPredefinedLoadMetricSpecification(
+                    PredefinedLoadMetricSpecification
+                ),
+            )
+            _setattr(
+                "PredictiveScalingMaxCapacityBehavior",
+                PredictiveScalingMaxCapacityBehavior,
+            )
+            _setattr(
+                "PredictiveScalingMaxCapacityBuffer", PredictiveScalingMaxCapacityBuffer
+            )
+            _setattr("PredictiveScalingMode", PredictiveScalingMode)
+            _setattr("ResourceId", ResourceId)
+            _setattr("ScalableDimension", ScalableDimension)
+            _setattr("ScalingPolicyUpdateBehavior", ScalingPolicyUpdateBehavior)
+            _setattr("ScheduledActionBufferTime", ScheduledActionBufferTime)
+            _setattr("ServiceNamespace", ServiceNamespace)
+            _setattr(
+                "TargetTrackingConfigurations",
+                _convert_ScalingPlanTargetTrackingConfiguration_list(
+                    TargetTrackingConfigurations
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScalingPlanApplicationSource = create_object_converter(
+        ScalingPlanApplicationSource
+    )
+    _convert_ScalingPlanScalingInstruction_list = create_object_list_converter(
+        ScalingPlanScalingInstruction
+    )
+
+    class ScalingPlanProperties(_ResourceProperties):
+        __slots__ = ("ApplicationSource", "ScalingInstructions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlanProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ApplicationSource": _convert_ScalingPlanApplicationSource,
+                "ScalingInstructions": _convert_ScalingPlanScalingInstruction_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApplicationSource=None, ScalingInstructions=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ApplicationSource",
+                _convert_ScalingPlanApplicationSource(ApplicationSource),
+            )
+            _setattr(
+                "ScalingInstructions",
+                _convert_ScalingPlanScalingInstruction_list(ScalingInstructions),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ScalingPlanProperties = create_object_converter(ScalingPlanProperties)
+
+    class ScalingPlan(_Resource):
+        """A Scaling Plan for AutoScalingPlans.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingPlan
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-autoscalingplans-scalingplan.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::AutoScalingPlans::ScalingPlan"
+
+        Properties: ScalingPlanProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScalingPlan",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ScalingPlanProperties},
+            factories={"Properties": ScalingPlanProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ScalingPlanProperties()
+            _setattr("Properties", _convert_ScalingPlanProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ScalingPlan,
+        ScalingPlanProperties,
+        ScalingPlanTagFilter,
+        ScalingPlanApplicationSource,
+        ScalingPlanMetricDimension,
+        ScalingPlanCustomizedLoadMetricSpecification,
+        ScalingPlanCustomizedScalingMetricSpecification,
+        ScalingPlanPredefinedLoadMetricSpecification,
+        ScalingPlanPredefinedScalingMetricSpecification,
+        ScalingPlanTargetTrackingConfiguration,
+        ScalingPlanScalingInstruction,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ScalingPlan": _create_ScalingPlan,
+        "ScalingPlanProperties": _create_ScalingPlan,
+        "ScalingPlanApplicationSource": _create_ScalingPlan,
+        "ScalingPlanCustomizedLoadMetricSpecification": _create_ScalingPlan,
+        "ScalingPlanCustomizedScalingMetricSpecification": _create_ScalingPlan,
+        "ScalingPlanMetricDimension": _create_ScalingPlan,
+        "ScalingPlanPredefinedLoadMetricSpecification": _create_ScalingPlan,
+        "ScalingPlanPredefinedScalingMetricSpecification": _create_ScalingPlan,
+        "ScalingPlanScalingInstruction": _create_ScalingPlan,
+        "ScalingPlanTagFilter": _create_ScalingPlan,
+        "ScalingPlanTargetTrackingConfiguration": _create_ScalingPlan,
+    },
+)
@@ -7,91 +7,490 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "BackupPlan",
     "BackupPlanProperties",
+    "BackupPlanBackupPlanResourceType",
+    "BackupPlanBackupRuleResourceType",
+    "BackupPlanLifecycleResourceType",
     "BackupSelection",
     "BackupSelectionProperties",
+    "BackupSelectionBackupSelectionResourceType",
+    "BackupSelectionConditionResourceType",
     "BackupVault",
     "BackupVaultProperties",
+    "BackupVaultNotificationObjectType",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class BackupPlanProperties(ResourceProperties):
-    BackupPlan = attrib(default=None)
-    BackupPlanTags = attrib(default=None)
+def _create_BackupPlan():
+    class BackupPlanLifecycleResourceType(_PropertyType):
+        """The Lifecycle Resource Type property type for BackupPlan in Backup.
+
+        See Also:
+            `AWS Cloud Formation documentation for LifecycleResourceType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-backup-backupplan-lifecycleresourcetype.html>`_
+        """
 
+        __slots__ = ("DeleteAfterDays", "MoveToColdStorageAfterDays")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupPlanLifecycleResourceType", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class BackupPlan(Resource):
-    """A Backup Plan for Backup.
+        def __init__(
+            self, *, DeleteAfterDays=None, MoveToColdStorageAfterDays=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteAfterDays", DeleteAfterDays)
+            _setattr("MoveToColdStorageAfterDays", MoveToColdStorageAfterDays)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BackupPlanLifecycleResourceType = create_object_converter(
+        BackupPlanLifecycleResourceType
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for BackupPlan
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-backup-backupplan.html>`_
-    """
+    class BackupPlanBackupRuleResourceType(_PropertyType):
+        """The Backup Rule Resource Type property type for BackupPlan in Backup.
 
-    RESOURCE_TYPE = "AWS::Backup::BackupPlan"
+        See Also:
+            `AWS Cloud Formation documentation for BackupRuleResourceType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-backup-backupplan-backupruleresourcetype.html>`_
+        """
 
-    Properties: BackupPlanProperties = attrib(
-        factory=BackupPlanProperties,
-        converter=create_object_converter(BackupPlanProperties),
+        __slots__ = (
+            "CompletionWindowMinutes",
+            "Lifecycle",
+            "RecoveryPointTags",
+            "RuleName",
+            "ScheduleExpression",
+            "StartWindowMinutes",
+            "TargetBackupVault",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupPlanBackupRuleResourceType",
+            _PropertyType,
+            __slots__,
+            converters={"Lifecycle": _convert_BackupPlanLifecycleResourceType},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CompletionWindowMinutes=None,
+            Lifecycle=None,
+            RecoveryPointTags=None,
+            RuleName=None,
+            ScheduleExpression=None,
+            StartWindowMinutes=None,
+            TargetBackupVault=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CompletionWindowMinutes", CompletionWindowMinutes)
+            _setattr("Lifecycle", _convert_BackupPlanLifecycleResourceType(Lifecycle))
+            _setattr("RecoveryPointTags", RecoveryPointTags)
+            _setattr("RuleName", RuleName)
+            _setattr("ScheduleExpression", ScheduleExpression)
+            _setattr("StartWindowMinutes", StartWindowMinutes)
+            _setattr("TargetBackupVault", TargetBackupVault)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BackupPlanBackupRuleResourceType_list = create_object_list_converter(
+        BackupPlanBackupRuleResourceType
     )
 
+    class BackupPlanBackupPlanResourceType(_PropertyType):
+        """The Backup Plan Resource Type property type for BackupPlan in Backup.
+
+        See Also:
+            `AWS Cloud Formation documentation for BackupPlanResourceType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-backup-backupplan-backupplanresourcetype.html>`_
+        """
+
+        __slots__ = ("BackupPlanName", "BackupPlanRule")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupPlanBackupPlanResourceType",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BackupPlanRule": _convert_BackupPlanBackupRuleResourceType_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BackupPlanName=None, BackupPlanRule=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BackupPlanName", BackupPlanName)
+            _setattr(
+                "BackupPlanRule",
+                _convert_BackupPlanBackupRuleResourceType_list(BackupPlanRule),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_BackupPlanBackupPlanResourceType = create_object_converter(
+        BackupPlanBackupPlanResourceType
+    )
+
+    class BackupPlanProperties(_ResourceProperties):
+        __slots__ = ("BackupPlan", "BackupPlanTags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupPlanProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"BackupPlan": _convert_BackupPlanBackupPlanResourceType},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, BackupPlan=None, BackupPlanTags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "BackupPlan", _convert_BackupPlanBackupPlanResourceType(BackupPlan)
+            )
+            _setattr("BackupPlanTags", BackupPlanTags)
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class BackupSelectionProperties(ResourceProperties):
-    BackupPlanId = attrib(default=None)
-    BackupSelection = attrib(default=None)
+    _convert_BackupPlanProperties = create_object_converter(BackupPlanProperties)
 
+    class BackupPlan(_Resource):
+        """A Backup Plan for Backup.
 
-@attrs(**ATTRSCONFIG)
-class BackupSelection(Resource):
-    """A Backup Selection for Backup.
+        See Also:
+            `AWS Cloud Formation documentation for BackupPlan
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-backup-backupplan.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for BackupSelection
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-backup-backupselection.html>`_
-    """
+        RESOURCE_TYPE = "AWS::Backup::BackupPlan"
+        TAG_PROPERTY = "BackupPlanTags"
+        TAG_FORMAT = "Map"
 
-    RESOURCE_TYPE = "AWS::Backup::BackupSelection"
+        Properties: BackupPlanProperties
 
-    Properties: BackupSelectionProperties = attrib(
-        factory=BackupSelectionProperties,
-        converter=create_object_converter(BackupSelectionProperties),
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupPlan",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BackupPlanProperties},
+            factories={"Properties": BackupPlanProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BackupPlanProperties()
+            _setattr("Properties", _convert_BackupPlanProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        BackupPlan,
+        BackupPlanProperties,
+        BackupPlanLifecycleResourceType,
+        BackupPlanBackupRuleResourceType,
+        BackupPlanBackupPlanResourceType,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class BackupVaultProperties(ResourceProperties):
-    AccessPolicy = attrib(default=None)
-    BackupVaultName = attrib(default=None)
-    BackupVaultTags = attrib(default=None)
-    EncryptionKeyArn = attrib(default=None)
-    Notifications = attrib(default=None)
+def _create_BackupSelection():
+    class BackupSelectionConditionResourceType(_PropertyType):
+        """The Condition Resource Type property type for BackupSelection in Backup.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConditionResourceType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-backup-backupselection-conditionresourcetype.html>`_
+        """
+
+        __slots__ = ("ConditionKey", "ConditionType", "ConditionValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupSelectionConditionResourceType", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConditionKey=None,
+            ConditionType=None,
+            ConditionValue=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConditionKey", ConditionKey)
+            _setattr("ConditionType", ConditionType)
+            _setattr("ConditionValue", ConditionValue)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BackupSelectionConditionResourceType_list = create_object_list_converter(
+        BackupSelectionConditionResourceType
+    )
 
+    class BackupSelectionBackupSelectionResourceType(_PropertyType):
+        """The Backup Selection Resource Type property type for BackupSelection in Backup.
 
-@attrs(**ATTRSCONFIG)
-class BackupVault(Resource):
-    """A Backup Vault for Backup.
+        See Also:
+            `AWS Cloud Formation documentation for BackupSelectionResourceType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-backup-backupselection-backupselectionresourcetype.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for BackupVault
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-backup-backupvault.html>`_
-    """
+        __slots__ = ("IamRoleArn", "ListOfTags", "Resources", "SelectionName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupSelectionBackupSelectionResourceType",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ListOfTags": _convert_BackupSelectionConditionResourceType_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Backup::BackupVault"
+        def __init__(
+            self,
+            *,
+            IamRoleArn=None,
+            ListOfTags=None,
+            Resources=None,
+            SelectionName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IamRoleArn", IamRoleArn)
+            _setattr(
+                "ListOfTags",
+                _convert_BackupSelectionConditionResourceType_list(ListOfTags),
+            )
+            _setattr("Resources", Resources)
+            _setattr("SelectionName", SelectionName)
+            _init_PropertyType(self, kwargs)
 
-    Properties: BackupVaultProperties = attrib(
-        factory=BackupVaultProperties,
-        converter=create_object_converter(BackupVaultProperties),
+    _convert_BackupSelectionBackupSelectionResourceType = create_object_converter(
+        BackupSelectionBackupSelectionResourceType
     )
+
+    class BackupSelectionProperties(_ResourceProperties):
+        __slots__ = ("BackupPlanId", "BackupSelection")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupSelectionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "BackupSelection": _convert_BackupSelectionBackupSelectionResourceType
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BackupPlanId=None, BackupSelection=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BackupPlanId", BackupPlanId)
+            _setattr(
+                "BackupSelection",
+                _convert_BackupSelectionBackupSelectionResourceType(BackupSelection),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_BackupSelectionProperties = create_object_converter(
+        BackupSelectionProperties
+    )
+
+    class BackupSelection(_Resource):
+        """A Backup Selection for Backup.
+
+        See Also:
+            `AWS Cloud Formation documentation for BackupSelection
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-backup-backupselection.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Backup::BackupSelection"
+
+        Properties: BackupSelectionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupSelection",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BackupSelectionProperties},
+            factories={"Properties": BackupSelectionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BackupSelectionProperties()
+            _setattr("Properties", _convert_BackupSelectionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        BackupSelection,
+        BackupSelectionProperties,
+        BackupSelectionConditionResourceType,
+        BackupSelectionBackupSelectionResourceType,
+    )
+
+
+def _create_BackupVault():
+    class BackupVaultNotificationObjectType(_PropertyType):
+        """The Notification Object Type property type for BackupVault in Backup.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotificationObjectType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-backup-backupvault-notificationobjecttype.html>`_
+        """
+
+        __slots__ = ("BackupVaultEvents", "SNSTopicArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupVaultNotificationObjectType", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BackupVaultEvents=None, SNSTopicArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BackupVaultEvents", BackupVaultEvents)
+            _setattr("SNSTopicArn", SNSTopicArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BackupVaultNotificationObjectType = create_object_converter(
+        BackupVaultNotificationObjectType
+    )
+
+    class BackupVaultProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessPolicy",
+            "BackupVaultName",
+            "BackupVaultTags",
+            "EncryptionKeyArn",
+            "Notifications",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupVaultProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Notifications": _convert_BackupVaultNotificationObjectType},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessPolicy=None,
+            BackupVaultName=None,
+            BackupVaultTags=None,
+            EncryptionKeyArn=None,
+            Notifications=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccessPolicy", AccessPolicy)
+            _setattr("BackupVaultName", BackupVaultName)
+            _setattr("BackupVaultTags", BackupVaultTags)
+            _setattr("EncryptionKeyArn", EncryptionKeyArn)
+            _setattr(
+                "Notifications",
+                _convert_BackupVaultNotificationObjectType(Notifications),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_BackupVaultProperties = create_object_converter(BackupVaultProperties)
+
+    class BackupVault(_Resource):
+        """A Backup Vault for Backup.
+
+        See Also:
+            `AWS Cloud Formation documentation for BackupVault
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-backup-backupvault.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Backup::BackupVault"
+        TAG_PROPERTY = "BackupVaultTags"
+        TAG_FORMAT = "Map"
+
+        Properties: BackupVaultProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BackupVault",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BackupVaultProperties},
+            factories={"Properties": BackupVaultProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BackupVaultProperties()
+            _setattr("Properties", _convert_BackupVaultProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return BackupVault, BackupVaultProperties, BackupVaultNotificationObjectType
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "BackupPlan": _create_BackupPlan,
+        "BackupPlanProperties": _create_BackupPlan,
+        "BackupPlanBackupPlanResourceType": _create_BackupPlan,
+        "BackupPlanBackupRuleResourceType": _create_BackupPlan,
+        "BackupPlanLifecycleResourceType": _create_BackupPlan,
+        "BackupSelection": _create_BackupSelection,
+        "BackupSelectionProperties": _create_BackupSelection,
+        "BackupSelectionBackupSelectionResourceType": _create_BackupSelection,
+        "BackupSelectionConditionResourceType": _create_BackupSelection,
+        "BackupVault": _create_BackupVault,
+        "BackupVaultProperties": _create_BackupVault,
+        "BackupVaultNotificationObjectType": _create_BackupVault,
+    },
+)
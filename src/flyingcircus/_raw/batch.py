@@ -7,98 +7,900 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "ComputeEnvironment",
     "ComputeEnvironmentProperties",
+    "ComputeEnvironmentComputeResources",
+    "ComputeEnvironmentLaunchTemplateSpecification",
     "JobDefinition",
     "JobDefinitionProperties",
+    "JobDefinitionContainerProperties",
+    "JobDefinitionDevice",
+    "JobDefinitionEnvironment",
+    "JobDefinitionLinuxParameters",
+    "JobDefinitionMountPoints",
+    "JobDefinitionNodeProperties",
+    "JobDefinitionNodeRangeProperty",
+    "JobDefinitionResourceRequirement",
+    "JobDefinitionRetryStrategy",
+    "JobDefinitionTimeout",
+    "JobDefinitionUlimit",
+    "JobDefinitionVolumes",
+    "JobDefinitionVolumesHost",
     "JobQueue",
     "JobQueueProperties",
+    "JobQueueComputeEnvironmentOrder",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ComputeEnvironmentProperties(ResourceProperties):
-    ComputeEnvironmentName = attrib(default=None)
-    ComputeResources = attrib(default=None)
-    ServiceRole = attrib(default=None)
-    State = attrib(default=None)
-    Type = attrib(default=None)
+def _create_ComputeEnvironment():
+    class ComputeEnvironmentLaunchTemplateSpecification(_PropertyType):
+        """The Launch Template Specification property type for ComputeEnvironment in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplateSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-computeenvironment-launchtemplatespecification.html>`_
+        """
+
+        __slots__ = ("LaunchTemplateId", "LaunchTemplateName", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ComputeEnvironmentLaunchTemplateSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            LaunchTemplateId=None,
+            LaunchTemplateName=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LaunchTemplateId", LaunchTemplateId)
+            _setattr("LaunchTemplateName", LaunchTemplateName)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ComputeEnvironmentLaunchTemplateSpecification = create_object_converter(
+        ComputeEnvironmentLaunchTemplateSpecification
+    )
+
+    class ComputeEnvironmentComputeResources(_PropertyType):
+        """The Compute Resources property type for ComputeEnvironment in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for ComputeResources
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-computeenvironment-computeresources.html>`_
+        """
+
+        __slots__ = (
+            "AllocationStrategy",
+            "BidPercentage",
+            "DesiredvCpus",
+            "Ec2KeyPair",
+            "ImageId",
+            "InstanceRole",
+            "InstanceTypes",
+            "LaunchTemplate",
+            "MaxvCpus",
+            "MinvCpus",
+            "PlacementGroup",
+            "SecurityGroupIds",
+            "SpotIamFleetRole",
+            "Subnets",
+            "Tags",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ComputeEnvironmentComputeResources",
+            _PropertyType,
+            __slots__,
+            converters={
+                "LaunchTemplate": _convert_ComputeEnvironmentLaunchTemplateSpecification
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllocationStrategy=None,
+            BidPercentage=None,
+            DesiredvCpus=None,
+            Ec2KeyPair=None,
+            ImageId=None,
+            InstanceRole=None,
+            InstanceTypes=None,
+            LaunchTemplate=None,
+            MaxvCpus=None,
+            MinvCpus=None,
+            PlacementGroup=None,
+            SecurityGroupIds=None,
+            SpotIamFleetRole=None,
+            Subnets=None,
+            Tags=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocationStrategy", AllocationStrategy)
+            _setattr("BidPercentage", BidPercentage)
+            _setattr("DesiredvCpus", DesiredvCpus)
+            _setattr("Ec2KeyPair", Ec2KeyPair)
+            _setattr("ImageId", ImageId)
+            _setattr("InstanceRole", InstanceRole)
+            _setattr("InstanceTypes", InstanceTypes)
+            _setattr(
+                "LaunchTemplate",
+                _convert_ComputeEnvironmentLaunchTemplateSpecification(LaunchTemplate),
+            )
+            _setattr("MaxvCpus", MaxvCpus)
+            _setattr("MinvCpus", MinvCpus)
+            _setattr("PlacementGroup", PlacementGroup)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SpotIamFleetRole", SpotIamFleetRole)
+            _setattr("Subnets", Subnets)
+            _setattr("Tags", Tags)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ComputeEnvironmentComputeResources = create_object_converter(
+        ComputeEnvironmentComputeResources
+    )
+
+    class ComputeEnvironmentProperties(_ResourceProperties):
+        __slots__ = (
+            "ComputeEnvironmentName",
+            "ComputeResources",
+            "ServiceRole",
+            "State",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ComputeEnvironmentProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ComputeResources": _convert_ComputeEnvironmentComputeResources
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ComputeEnvironmentName=None,
+            ComputeResources=None,
+            ServiceRole=None,
+            State=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComputeEnvironmentName", ComputeEnvironmentName)
+            _setattr(
+                "ComputeResources",
+                _convert_ComputeEnvironmentComputeResources(ComputeResources),
+            )
+            _setattr("ServiceRole", ServiceRole)
+            _setattr("State", State)
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ComputeEnvironmentProperties = create_object_converter(
+        ComputeEnvironmentProperties
+    )
+
+    class ComputeEnvironment(_Resource):
+        """A Compute Environment for Batch.
 
+        See Also:
+            `AWS Cloud Formation documentation for ComputeEnvironment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-batch-computeenvironment.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class ComputeEnvironment(Resource):
-    """A Compute Environment for Batch.
+        RESOURCE_TYPE = "AWS::Batch::ComputeEnvironment"
 
-    See Also:
-        `AWS Cloud Formation documentation for ComputeEnvironment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-batch-computeenvironment.html>`_
-    """
+        Properties: ComputeEnvironmentProperties
 
-    RESOURCE_TYPE = "AWS::Batch::ComputeEnvironment"
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ComputeEnvironment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ComputeEnvironmentProperties},
+            factories={"Properties": ComputeEnvironmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ComputeEnvironmentProperties = attrib(
-        factory=ComputeEnvironmentProperties,
-        converter=create_object_converter(ComputeEnvironmentProperties),
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ComputeEnvironmentProperties()
+            _setattr("Properties", _convert_ComputeEnvironmentProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ComputeEnvironment,
+        ComputeEnvironmentProperties,
+        ComputeEnvironmentLaunchTemplateSpecification,
+        ComputeEnvironmentComputeResources,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class JobDefinitionProperties(ResourceProperties):
-    ContainerProperties = attrib(default=None)
-    JobDefinitionName = attrib(default=None)
-    NodeProperties = attrib(default=None)
-    Parameters = attrib(default=None)
-    RetryStrategy = attrib(default=None)
-    Timeout = attrib(default=None)
-    Type = attrib(default=None)
+def _create_JobDefinition():
+    class JobDefinitionDevice(_PropertyType):
+        """The Device property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Device
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-device.html>`_
+        """
+
+        __slots__ = ("ContainerPath", "HostPath", "Permissions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionDevice", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ContainerPath=None, HostPath=None, Permissions=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerPath", ContainerPath)
+            _setattr("HostPath", HostPath)
+            _setattr("Permissions", Permissions)
+            _init_PropertyType(self, kwargs)
+
+    _convert_JobDefinitionDevice_list = create_object_list_converter(
+        JobDefinitionDevice
+    )
+
+    class JobDefinitionLinuxParameters(_PropertyType):
+        """The Linux Parameters property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for LinuxParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-containerproperties-linuxparameters.html>`_
+        """
+
+        __slots__ = ("Devices",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionLinuxParameters",
+            _PropertyType,
+            __slots__,
+            converters={"Devices": _convert_JobDefinitionDevice_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, Devices=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Devices", _convert_JobDefinitionDevice_list(Devices))
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class JobDefinition(Resource):
-    """A Job Definition for Batch.
+    class JobDefinitionResourceRequirement(_PropertyType):
+        """The Resource Requirement property type for JobDefinition in Batch.
 
-    See Also:
-        `AWS Cloud Formation documentation for JobDefinition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-batch-jobdefinition.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for ResourceRequirement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-resourcerequirement.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::Batch::JobDefinition"
+        __slots__ = ("Type", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionResourceRequirement", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: JobDefinitionProperties = attrib(
-        factory=JobDefinitionProperties,
-        converter=create_object_converter(JobDefinitionProperties),
+        def __init__(self, *, Type=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class JobDefinitionMountPoints(_PropertyType):
+        """The Mount Points property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for MountPoints
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-mountpoints.html>`_
+        """
+
+        __slots__ = ("ContainerPath", "ReadOnly", "SourceVolume")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionMountPoints", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ContainerPath=None, ReadOnly=None, SourceVolume=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerPath", ContainerPath)
+            _setattr("ReadOnly", ReadOnly)
+            _setattr("SourceVolume", SourceVolume)
+            _init_PropertyType(self, kwargs)
+
+    class JobDefinitionVolumesHost(_PropertyType):
+        """The Volumes Host property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for VolumesHost
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-volumeshost.html>`_
+        """
+
+        __slots__ = ("SourcePath",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionVolumesHost", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SourcePath=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SourcePath", SourcePath)
+            _init_PropertyType(self, kwargs)
+
+    _convert_JobDefinitionVolumesHost = create_object_converter(
+        JobDefinitionVolumesHost
     )
 
+    class JobDefinitionVolumes(_PropertyType):
+        """The Volumes property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Volumes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-volumes.html>`_
+        """
+
+        __slots__ = ("Host", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionVolumes",
+            _PropertyType,
+            __slots__,
+            converters={"Host": _convert_JobDefinitionVolumesHost},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Host=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Host", _convert_JobDefinitionVolumesHost(Host))
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class JobDefinitionEnvironment(_PropertyType):
+        """The Environment property type for JobDefinition in Batch.
 
-@attrs(**ATTRSCONFIG)
-class JobQueueProperties(ResourceProperties):
-    ComputeEnvironmentOrder = attrib(default=None)
-    JobQueueName = attrib(default=None)
-    Priority = attrib(default=None)
-    State = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for Environment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-environment.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionEnvironment", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class JobDefinitionUlimit(_PropertyType):
+        """The Ulimit property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Ulimit
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-ulimit.html>`_
+        """
+
+        __slots__ = ("HardLimit", "Name", "SoftLimit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionUlimit", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, HardLimit=None, Name=None, SoftLimit=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HardLimit", HardLimit)
+            _setattr("Name", Name)
+            _setattr("SoftLimit", SoftLimit)
+            _init_PropertyType(self, kwargs)
+
+    _convert_JobDefinitionEnvironment_list = create_object_list_converter(
+        JobDefinitionEnvironment
+    )
+    _convert_JobDefinitionLinuxParameters = create_object_converter(
+        JobDefinitionLinuxParameters
+    )
+    _convert_JobDefinitionMountPoints_list = create_object_list_converter(
+        JobDefinitionMountPoints
+    )
+    _convert_JobDefinitionResourceRequirement_list = create_object_list_converter(
+        JobDefinitionResourceRequirement
+    )
+    _convert_JobDefinitionUlimit_list = create_object_list_converter(
+        JobDefinitionUlimit
+    )
+    _convert_JobDefinitionVolumes_list = create_object_list_converter(
+        JobDefinitionVolumes
+    )
 
+    class JobDefinitionContainerProperties(_PropertyType):
+        """The Container Properties property type for JobDefinition in Batch.
 
-@attrs(**ATTRSCONFIG)
-class JobQueue(Resource):
-    """A Job Queue for Batch.
+        See Also:
+            `AWS Cloud Formation documentation for ContainerProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-containerproperties.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for JobQueue
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-batch-jobqueue.html>`_
-    """
+        __slots__ = (
+            "Command",
+            "Environment",
+            "Image",
+            "InstanceType",
+            "JobRoleArn",
+            "LinuxParameters",
+            "Memory",
+            "MountPoints",
+            "Privileged",
+            "ReadonlyRootFilesystem",
+            "ResourceRequirements",
+            "Ulimits",
+            "User",
+            "Vcpus",
+            "Volumes",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionContainerProperties",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Environment": _convert_JobDefinitionEnvironment_list,
+                "LinuxParameters": _convert_JobDefinitionLinuxParameters,
+                "MountPoints": _convert_JobDefinitionMountPoints_list,
+                "ResourceRequirements": _convert_JobDefinitionResourceRequirement_list,
+                "Ulimits": _convert_JobDefinitionUlimit_list,
+                "Volumes": _convert_JobDefinitionVolumes_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Batch::JobQueue"
+        def __init__(
+            self,
+            *,
+            Command=None,
+            Environment=None,
+            Image=None,
+            InstanceType=None,
+            JobRoleArn=None,
+            LinuxParameters=None,
+            Memory=None,
+            MountPoints=None,
+            Privileged=None,
+            ReadonlyRootFilesystem=None,
+            ResourceRequirements=None,
+            Ulimits=None,
+            User=None,
+            Vcpus=None,
+            Volumes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Command", Command)
+            _setattr("Environment", _convert_JobDefinitionEnvironment_list(Environment))
+            _setattr("Image", Image)
+            _setattr("InstanceType", InstanceType)
+            _setattr("JobRoleArn", JobRoleArn)
+            _setattr(
+                "LinuxParameters",
+                _convert_JobDefinitionLinuxParameters(LinuxParameters),
+            )
+            _setattr("Memory", Memory)
+            _setattr("MountPoints", _convert_JobDefinitionMountPoints_list(MountPoints))
+            _setattr("Privileged", Privileged)
+            _setattr("ReadonlyRootFilesystem", ReadonlyRootFilesystem)
+            _setattr(
+                "ResourceRequirements",
+                _convert_JobDefinitionResourceRequirement_list(ResourceRequirements),
+            )
+            _setattr("Ulimits", _convert_JobDefinitionUlimit_list(Ulimits))
+            _setattr("User", User)
+            _setattr("Vcpus", Vcpus)
+            _setattr("Volumes", _convert_JobDefinitionVolumes_list(Volumes))
+            _init_PropertyType(self, kwargs)
 
-    Properties: JobQueueProperties = attrib(
-        factory=JobQueueProperties,
-        converter=create_object_converter(JobQueueProperties),
+    _convert_JobDefinitionContainerProperties = create_object_converter(
+        JobDefinitionContainerProperties
     )
+
+    class JobDefinitionNodeRangeProperty(_PropertyType):
+        """The Node Range Property property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for NodeRangeProperty
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-noderangeproperty.html>`_
+        """
+
+        __slots__ = ("Container", "TargetNodes")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionNodeRangeProperty",
+            _PropertyType,
+            __slots__,
+            converters={"Container": _convert_JobDefinitionContainerProperties},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Container=None, TargetNodes=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Container", _convert_JobDefinitionContainerProperties(Container))
+            _setattr("TargetNodes", TargetNodes)
+            _init_PropertyType(self, kwargs)
+
+    _convert_JobDefinitionNodeRangeProperty_list = create_object_list_converter(
+        JobDefinitionNodeRangeProperty
+    )
+
+    class JobDefinitionNodeProperties(_PropertyType):
+        """The Node Properties property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for NodeProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-nodeproperties.html>`_
+        """
+
+        __slots__ = ("MainNode", "NodeRangeProperties", "NumNodes")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionNodeProperties",
+            _PropertyType,
+            __slots__,
+            converters={
+                "NodeRangeProperties": _convert_JobDefinitionNodeRangeProperty_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, MainNode=None, NodeRangeProperties=None, NumNodes=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MainNode", MainNode)
+            _setattr(
+                "NodeRangeProperties",
+                _convert_JobDefinitionNodeRangeProperty_list(NodeRangeProperties),
+            )
+            _setattr("NumNodes", NumNodes)
+            _init_PropertyType(self, kwargs)
+
+    class JobDefinitionRetryStrategy(_PropertyType):
+        """The Retry Strategy property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for RetryStrategy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-retrystrategy.html>`_
+        """
+
+        __slots__ = ("Attempts",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionRetryStrategy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Attempts=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attempts", Attempts)
+            _init_PropertyType(self, kwargs)
+
+    class JobDefinitionTimeout(_PropertyType):
+        """The Timeout property type for JobDefinition in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Timeout
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobdefinition-timeout.html>`_
+        """
+
+        __slots__ = ("AttemptDurationSeconds",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionTimeout", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AttemptDurationSeconds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AttemptDurationSeconds", AttemptDurationSeconds)
+            _init_PropertyType(self, kwargs)
+
+    _convert_JobDefinitionNodeProperties = create_object_converter(
+        JobDefinitionNodeProperties
+    )
+    _convert_JobDefinitionRetryStrategy = create_object_converter(
+        JobDefinitionRetryStrategy
+    )
+    _convert_JobDefinitionTimeout = create_object_converter(JobDefinitionTimeout)
+
+    class JobDefinitionProperties(_ResourceProperties):
+        __slots__ = (
+            "ContainerProperties",
+            "JobDefinitionName",
+            "NodeProperties",
+            "Parameters",
+            "RetryStrategy",
+            "Timeout",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ContainerProperties": _convert_JobDefinitionContainerProperties,
+                "NodeProperties": _convert_JobDefinitionNodeProperties,
+                "RetryStrategy": _convert_JobDefinitionRetryStrategy,
+                "Timeout": _convert_JobDefinitionTimeout,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContainerProperties=None,
+            JobDefinitionName=None,
+            NodeProperties=None,
+            Parameters=None,
+            RetryStrategy=None,
+            Timeout=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ContainerProperties",
+                _convert_JobDefinitionContainerProperties(ContainerProperties),
+            )
+            _setattr("JobDefinitionName", JobDefinitionName)
+            _setattr(
+                "NodeProperties", _convert_JobDefinitionNodeProperties(NodeProperties)
+            )
+            _setattr("Parameters", Parameters)
+            _setattr(
+                "RetryStrategy", _convert_JobDefinitionRetryStrategy(RetryStrategy)
+            )
+            _setattr("Timeout", _convert_JobDefinitionTimeout(Timeout))
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_JobDefinitionProperties = create_object_converter(JobDefinitionProperties)
+
+    class JobDefinition(_Resource):
+        """A Job Definition for Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for JobDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-batch-jobdefinition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Batch::JobDefinition"
+
+        Properties: JobDefinitionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobDefinition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_JobDefinitionProperties},
+            factories={"Properties": JobDefinitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = JobDefinitionProperties()
+            _setattr("Properties", _convert_JobDefinitionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        JobDefinition,
+        JobDefinitionProperties,
+        JobDefinitionDevice,
+        JobDefinitionLinuxParameters,
+        JobDefinitionResourceRequirement,
+        JobDefinitionMountPoints,
+        JobDefinitionVolumesHost,
+        JobDefinitionVolumes,
+        JobDefinitionEnvironment,
+        JobDefinitionUlimit,
+        JobDefinitionContainerProperties,
+        JobDefinitionNodeRangeProperty,
+        JobDefinitionNodeProperties,
+        JobDefinitionRetryStrategy,
+        JobDefinitionTimeout,
+    )
+
+
+def _create_JobQueue():
+    class JobQueueComputeEnvironmentOrder(_PropertyType):
+        """The Compute Environment Order property type for JobQueue in Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for ComputeEnvironmentOrder
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-batch-jobqueue-computeenvironmentorder.html>`_
+        """
+
+        __slots__ = ("ComputeEnvironment", "Order")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobQueueComputeEnvironmentOrder", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ComputeEnvironment=None, Order=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComputeEnvironment", ComputeEnvironment)
+            _setattr("Order", Order)
+            _init_PropertyType(self, kwargs)
+
+    _convert_JobQueueComputeEnvironmentOrder_list = create_object_list_converter(
+        JobQueueComputeEnvironmentOrder
+    )
+
+    class JobQueueProperties(_ResourceProperties):
+        __slots__ = ("ComputeEnvironmentOrder", "JobQueueName", "Priority", "State")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobQueueProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ComputeEnvironmentOrder": _convert_JobQueueComputeEnvironmentOrder_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ComputeEnvironmentOrder=None,
+            JobQueueName=None,
+            Priority=None,
+            State=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ComputeEnvironmentOrder",
+                _convert_JobQueueComputeEnvironmentOrder_list(ComputeEnvironmentOrder),
+            )
+            _setattr("JobQueueName", JobQueueName)
+            _setattr("Priority", Priority)
+            _setattr("State", State)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_JobQueueProperties = create_object_converter(JobQueueProperties)
+
+    class JobQueue(_Resource):
+        """A Job Queue for Batch.
+
+        See Also:
+            `AWS Cloud Formation documentation for JobQueue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-batch-jobqueue.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Batch::JobQueue"
+
+        Properties: JobQueueProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobQueue",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_JobQueueProperties},
+            factories={"Properties": JobQueueProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = JobQueueProperties()
+            _setattr("Properties", _convert_JobQueueProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return JobQueue, JobQueueProperties, JobQueueComputeEnvironmentOrder
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ComputeEnvironment": _create_ComputeEnvironment,
+        "ComputeEnvironmentProperties": _create_ComputeEnvironment,
+        "ComputeEnvironmentComputeResources": _create_ComputeEnvironment,
+        "ComputeEnvironmentLaunchTemplateSpecification": _create_ComputeEnvironment,
+        "JobDefinition": _create_JobDefinition,
+        "JobDefinitionProperties": _create_JobDefinition,
+        "JobDefinitionContainerProperties": _create_JobDefinition,
+        "JobDefinitionDevice": _create_JobDefinition,
+        "JobDefinitionEnvironment": _create_JobDefinition,
+        "JobDefinitionLinuxParameters": _create_JobDefinition,
+        "JobDefinitionMountPoints": _create_JobDefinition,
+        "JobDefinitionNodeProperties": _create_JobDefinition,
+        "JobDefinitionNodeRangeProperty": _create_JobDefinition,
+        "JobDefinitionResourceRequirement": _create_JobDefinition,
+        "JobDefinitionRetryStrategy": _create_JobDefinition,
+        "JobDefinitionTimeout": _create_JobDefinition,
+        "JobDefinitionUlimit": _create_JobDefinition,
+        "JobDefinitionVolumes": _create_JobDefinition,
+        "JobDefinitionVolumesHost": _create_JobDefinition,
+        "JobQueue": _create_JobQueue,
+        "JobQueueProperties": _create_JobQueue,
+        "JobQueueComputeEnvironmentOrder": _create_JobQueue,
+    },
+)
@@ -7,34 +7,379 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Budget", "BudgetProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Budget",
+    "BudgetProperties",
+    "BudgetBudgetData",
+    "BudgetCostTypes",
+    "BudgetNotification",
+    "BudgetNotificationWithSubscribers",
+    "BudgetSpend",
+    "BudgetSubscriber",
+    "BudgetTimePeriod",
+]
 
-@attrs(**ATTRSCONFIG)
-class BudgetProperties(ResourceProperties):
-    Budget = attrib(default=None)
-    NotificationsWithSubscribers = attrib(default=None)
 
+def _create_Budget():
+    class BudgetSpend(_PropertyType):
+        """The Spend property type for Budget in Budgets.
 
-@attrs(**ATTRSCONFIG)
-class Budget(Resource):
-    """A Budget for Budgets.
+        See Also:
+            `AWS Cloud Formation documentation for Spend
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-budgets-budget-spend.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Budget
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-budgets-budget.html>`_
-    """
+        __slots__ = ("Amount", "Unit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BudgetSpend", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Budgets::Budget"
+        def __init__(self, *, Amount=None, Unit=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Amount", Amount)
+            _setattr("Unit", Unit)
+            _init_PropertyType(self, kwargs)
 
-    Properties: BudgetProperties = attrib(
-        factory=BudgetProperties, converter=create_object_converter(BudgetProperties)
+    class BudgetTimePeriod(_PropertyType):
+        """The Time Period property type for Budget in Budgets.
+
+        See Also:
+            `AWS Cloud Formation documentation for TimePeriod
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-budgets-budget-timeperiod.html>`_
+        """
+
+        __slots__ = ("End", "Start")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BudgetTimePeriod", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, End=None, Start=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("End", End)
+            _setattr("Start", Start)
+            _init_PropertyType(self, kwargs)
+
+    class BudgetCostTypes(_PropertyType):
+        """The Cost Types property type for Budget in Budgets.
+
+        See Also:
+            `AWS Cloud Formation documentation for CostTypes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-budgets-budget-costtypes.html>`_
+        """
+
+        __slots__ = (
+            "IncludeCredit",
+            "IncludeDiscount",
+            "IncludeOtherSubscription",
+            "IncludeRecurring",
+            "IncludeRefund",
+            "IncludeSubscription",
+            "IncludeSupport",
+            "IncludeTax",
+            "IncludeUpfront",
+            "UseAmortized",
+            "UseBlended",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BudgetCostTypes", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            IncludeCredit=None,
+            IncludeDiscount=None,
+            IncludeOtherSubscription=None,
+            IncludeRecurring=None,
+            IncludeRefund=None,
+            IncludeSubscription=None,
+            IncludeSupport=None,
+            IncludeTax=None,
+            IncludeUpfront=None,
+            UseAmortized=None,
+            UseBlended=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IncludeCredit", IncludeCredit)
+            _setattr("IncludeDiscount", IncludeDiscount)
+            _setattr("IncludeOtherSubscription", IncludeOtherSubscription)
+            _setattr("IncludeRecurring", IncludeRecurring)
+            _setattr("IncludeRefund", IncludeRefund)
+            _setattr("IncludeSubscription", IncludeSubscription)
+            _setattr("IncludeSupport", IncludeSupport)
+            _setattr("IncludeTax", IncludeTax)
+            _setattr("IncludeUpfront", IncludeUpfront)
+            _setattr("UseAmortized", UseAmortized)
+            _setattr("UseBlended", UseBlended)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BudgetSpend = create_object_converter(BudgetSpend)
+    _convert_BudgetCostTypes = create_object_converter(BudgetCostTypes)
+    _convert_BudgetTimePeriod = create_object_converter(BudgetTimePeriod)
+
+    class BudgetBudgetData(_PropertyType):
+        """The Budget Data property type for Budget in Budgets.
+
+        See Also:
+            `AWS Cloud Formation documentation for BudgetData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-budgets-budget-budgetdata.html>`_
+        """
+
+        __slots__ = (
+            "BudgetLimit",
+            "BudgetName",
+            "BudgetType",
+            "CostFilters",
+            "CostTypes",
+            "PlannedBudgetLimits",
+            "TimePeriod",
+            "TimeUnit",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BudgetBudgetData",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BudgetLimit": _convert_BudgetSpend,
+                "CostTypes": _convert_BudgetCostTypes,
+                "TimePeriod": _convert_BudgetTimePeriod,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BudgetLimit=None,
+            BudgetName=None,
+            BudgetType=None,
+            CostFilters=None,
+            CostTypes=None,
+            PlannedBudgetLimits=None,
+            TimePeriod=None,
+            TimeUnit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BudgetLimit", _convert_BudgetSpend(BudgetLimit))
+            _setattr("BudgetName", BudgetName)
+            _setattr("BudgetType", BudgetType)
+            _setattr("CostFilters", CostFilters)
+            _setattr("CostTypes", _convert_BudgetCostTypes(CostTypes))
+            _setattr("PlannedBudgetLimits", PlannedBudgetLimits)
+            _setattr("TimePeriod", _convert_BudgetTimePeriod(TimePeriod))
+            _setattr("TimeUnit", TimeUnit)
+            _init_PropertyType(self, kwargs)
+
+    class BudgetNotification(_PropertyType):
+        """The Notification property type for Budget in Budgets.
+
+        See Also:
+            `AWS Cloud Formation documentation for Notification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-budgets-budget-notification.html>`_
+        """
+
+        __slots__ = (
+            "ComparisonOperator",
+            "NotificationType",
+            "Threshold",
+            "ThresholdType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BudgetNotification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ComparisonOperator=None,
+            NotificationType=None,
+            Threshold=None,
+            ThresholdType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComparisonOperator", ComparisonOperator)
+            _setattr("NotificationType", NotificationType)
+            _setattr("Threshold", Threshold)
+            _setattr("ThresholdType", ThresholdType)
+            _init_PropertyType(self, kwargs)
+
+    class BudgetSubscriber(_PropertyType):
+        """The Subscriber property type for Budget in Budgets.
+
+        See Also:
+            `AWS Cloud Formation documentation for Subscriber
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-budgets-budget-subscriber.html>`_
+        """
+
+        __slots__ = ("Address", "SubscriptionType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BudgetSubscriber", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Address=None, SubscriptionType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Address", Address)
+            _setattr("SubscriptionType", SubscriptionType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BudgetNotification = create_object_converter(BudgetNotification)
+    _convert_BudgetSubscriber_list = create_object_list_converter(BudgetSubscriber)
+
+    class BudgetNotificationWithSubscribers(_PropertyType):
+        """The Notification With Subscribers property type for Budget in Budgets.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotificationWithSubscribers
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-budgets-budget-notificationwithsubscribers.html>`_
+        """
+
+        __slots__ = ("Notification", "Subscribers")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BudgetNotificationWithSubscribers",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Notification": _convert_BudgetNotification,
+                "Subscribers": _convert_BudgetSubscriber_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Notification=None, Subscribers=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Notification", _convert_BudgetNotification(Notification))
+            _setattr("Subscribers", _convert_BudgetSubscriber_list(Subscribers))
+            _init_PropertyType(self, kwargs)
+
+    _convert_BudgetBudgetData = create_object_converter(BudgetBudgetData)
+    _convert_BudgetNotificationWithSubscribers_list = create_object_list_converter(
+        BudgetNotificationWithSubscribers
     )
+
+    class BudgetProperties(_ResourceProperties):
+        __slots__ = ("Budget", "NotificationsWithSubscribers")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BudgetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Budget": _convert_BudgetBudgetData,
+                "NotificationsWithSubscribers": _convert_BudgetNotificationWithSubscribers_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Budget=None, NotificationsWithSubscribers=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Budget", _convert_BudgetBudgetData(Budget))
+            _setattr(
+                "NotificationsWithSubscribers",
+                _convert_BudgetNotificationWithSubscribers_list(
+                    NotificationsWithSubscribers
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_BudgetProperties = create_object_converter(BudgetProperties)
+
+    class Budget(_Resource):
+        """A Budget for Budgets.
+
+        See Also:
+            `AWS Cloud Formation documentation for Budget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-budgets-budget.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Budgets::Budget"
+
+        Properties: BudgetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Budget",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BudgetProperties},
+            factories={"Properties": BudgetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BudgetProperties()
+            _setattr("Properties", _convert_BudgetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Budget,
+        BudgetProperties,
+        BudgetSpend,
+        BudgetTimePeriod,
+        BudgetCostTypes,
+        BudgetBudgetData,
+        BudgetNotification,
+        BudgetSubscriber,
+        BudgetNotificationWithSubscribers,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Budget": _create_Budget,
+        "BudgetProperties": _create_Budget,
+        "BudgetBudgetData": _create_Budget,
+        "BudgetCostTypes": _create_Budget,
+        "BudgetNotification": _create_Budget,
+        "BudgetNotificationWithSubscribers": _create_Budget,
+        "BudgetSpend": _create_Budget,
+        "BudgetSubscriber": _create_Budget,
+        "BudgetTimePeriod": _create_Budget,
+    },
+)
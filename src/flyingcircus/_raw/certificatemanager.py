@@ -7,38 +7,144 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Certificate", "CertificateProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Certificate",
+    "CertificateProperties",
+    "CertificateDomainValidationOption",
+]
 
-@attrs(**ATTRSCONFIG)
-class CertificateProperties(ResourceProperties):
-    DomainName = attrib(default=None)
-    DomainValidationOptions = attrib(default=None)
-    SubjectAlternativeNames = attrib(default=None)
-    Tags = attrib(default=None)
-    ValidationMethod = attrib(default=None)
 
+def _create_Certificate():
+    class CertificateDomainValidationOption(_PropertyType):
+        """The Domain Validation Option property type for Certificate in CertificateManager.
 
-@attrs(**ATTRSCONFIG)
-class Certificate(Resource):
-    """A Certificate for CertificateManager.
+        See Also:
+            `AWS Cloud Formation documentation for DomainValidationOption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-certificatemanager-certificate-domainvalidationoption.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Certificate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-certificatemanager-certificate.html>`_
-    """
+        __slots__ = ("DomainName", "ValidationDomain")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CertificateDomainValidationOption", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CertificateManager::Certificate"
+        def __init__(self, *, DomainName=None, ValidationDomain=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DomainName", DomainName)
+            _setattr("ValidationDomain", ValidationDomain)
+            _init_PropertyType(self, kwargs)
 
-    Properties: CertificateProperties = attrib(
-        factory=CertificateProperties,
-        converter=create_object_converter(CertificateProperties),
+    _convert_CertificateDomainValidationOption_list = create_object_list_converter(
+        CertificateDomainValidationOption
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class CertificateProperties(_ResourceProperties):
+        __slots__ = (
+            "DomainName",
+            "DomainValidationOptions",
+            "SubjectAlternativeNames",
+            "Tags",
+            "ValidationMethod",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CertificateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DomainValidationOptions": _convert_CertificateDomainValidationOption_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DomainName=None,
+            DomainValidationOptions=None,
+            SubjectAlternativeNames=None,
+            Tags=None,
+            ValidationMethod=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DomainName", DomainName)
+            _setattr(
+                "DomainValidationOptions",
+                _convert_CertificateDomainValidationOption_list(
+                    DomainValidationOptions
+                ),
+            )
+            _setattr("SubjectAlternativeNames", SubjectAlternativeNames)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("ValidationMethod", ValidationMethod)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CertificateProperties = create_object_converter(CertificateProperties)
+
+    class Certificate(_Resource):
+        """A Certificate for CertificateManager.
+
+        See Also:
+            `AWS Cloud Formation documentation for Certificate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-certificatemanager-certificate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CertificateManager::Certificate"
+
+        Properties: CertificateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Certificate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CertificateProperties},
+            factories={"Properties": CertificateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CertificateProperties()
+            _setattr("Properties", _convert_CertificateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Certificate, CertificateProperties, CertificateDomainValidationOption
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Certificate": _create_Certificate,
+        "CertificateProperties": _create_Certificate,
+        "CertificateDomainValidationOption": _create_Certificate,
+    },
+)
@@ -7,41 +7,152 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["EnvironmentEC2", "EnvironmentEC2Properties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "EnvironmentEC2",
+    "EnvironmentEC2Properties",
+    "EnvironmentEC2Repository",
+]
 
-@attrs(**ATTRSCONFIG)
-class EnvironmentEC2Properties(ResourceProperties):
-    AutomaticStopTimeMinutes = attrib(default=None)
-    Description = attrib(default=None)
-    InstanceType = attrib(default=None)
-    Name = attrib(default=None)
-    OwnerArn = attrib(default=None)
-    Repositories = attrib(default=None)
-    SubnetId = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_EnvironmentEC2():
+    class EnvironmentEC2Repository(_PropertyType):
+        """The Repository property type for EnvironmentEC2 in Cloud9.
 
-@attrs(**ATTRSCONFIG)
-class EnvironmentEC2(Resource):
-    """A Environment Ec2 for Cloud9.
+        See Also:
+            `AWS Cloud Formation documentation for Repository
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloud9-environmentec2-repository.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for EnvironmentEC2
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloud9-environmentec2.html>`_
-    """
+        __slots__ = ("PathComponent", "RepositoryUrl")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EnvironmentEC2Repository", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Cloud9::EnvironmentEC2"
+        def __init__(self, *, PathComponent=None, RepositoryUrl=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PathComponent", PathComponent)
+            _setattr("RepositoryUrl", RepositoryUrl)
+            _init_PropertyType(self, kwargs)
 
-    Properties: EnvironmentEC2Properties = attrib(
-        factory=EnvironmentEC2Properties,
-        converter=create_object_converter(EnvironmentEC2Properties),
+    _convert_EnvironmentEC2Repository_list = create_object_list_converter(
+        EnvironmentEC2Repository
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class EnvironmentEC2Properties(_ResourceProperties):
+        __slots__ = (
+            "AutomaticStopTimeMinutes",
+            "Description",
+            "InstanceType",
+            "Name",
+            "OwnerArn",
+            "Repositories",
+            "SubnetId",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EnvironmentEC2Properties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Repositories": _convert_EnvironmentEC2Repository_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutomaticStopTimeMinutes=None,
+            Description=None,
+            InstanceType=None,
+            Name=None,
+            OwnerArn=None,
+            Repositories=None,
+            SubnetId=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutomaticStopTimeMinutes", AutomaticStopTimeMinutes)
+            _setattr("Description", Description)
+            _setattr("InstanceType", InstanceType)
+            _setattr("Name", Name)
+            _setattr("OwnerArn", OwnerArn)
+            _setattr(
+                "Repositories", _convert_EnvironmentEC2Repository_list(Repositories)
+            )
+            _setattr("SubnetId", SubnetId)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EnvironmentEC2Properties = create_object_converter(
+        EnvironmentEC2Properties
+    )
+
+    class EnvironmentEC2(_Resource):
+        """A Environment Ec2 for Cloud9.
+
+        See Also:
+            `AWS Cloud Formation documentation for EnvironmentEC2
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloud9-environmentec2.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cloud9::EnvironmentEC2"
+
+        Properties: EnvironmentEC2Properties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EnvironmentEC2",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EnvironmentEC2Properties},
+            factories={"Properties": EnvironmentEC2Properties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EnvironmentEC2Properties()
+            _setattr("Properties", _convert_EnvironmentEC2Properties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EnvironmentEC2, EnvironmentEC2Properties, EnvironmentEC2Repository
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "EnvironmentEC2": _create_EnvironmentEC2,
+        "EnvironmentEC2Properties": _create_EnvironmentEC2,
+        "EnvironmentEC2Repository": _create_EnvironmentEC2,
+    },
+)
@@ -10,13 +10,19 @@ This file is automatically generated, and should not be directly edited.
 from typing import Any
 from typing import Dict
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "CustomResource",
@@ -32,124 +38,339 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class CustomResourceProperties(ResourceProperties):
-    ServiceToken = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class CustomResource(Resource):
-    """A Custom Resource for CloudFormation.
-
-    See Also:
-        `AWS Cloud Formation documentation for CustomResource
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cfn-customresource.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::CloudFormation::CustomResource"
-
-    Properties: CustomResourceProperties = attrib(
-        factory=CustomResourceProperties,
-        converter=create_object_converter(CustomResourceProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class MacroProperties(ResourceProperties):
-    Description = attrib(default=None)
-    FunctionName = attrib(default=None)
-    LogGroupName = attrib(default=None)
-    LogRoleARN = attrib(default=None)
-    Name = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Macro(Resource):
-    """A Macro for CloudFormation.
-
-    See Also:
-        `AWS Cloud Formation documentation for Macro
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudformation-macro.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::CloudFormation::Macro"
-
-    Properties: MacroProperties = attrib(
-        factory=MacroProperties, converter=create_object_converter(MacroProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class StackProperties(ResourceProperties):
-    NotificationARNs = attrib(default=None)
-    Parameters = attrib(default=None)
-    Tags = attrib(default=None)
-    TemplateURL = attrib(default=None)
-    TimeoutInMinutes = attrib(default=None)
+def _create_CustomResource():
+    class CustomResourceProperties(_ResourceProperties):
+        __slots__ = ("ServiceToken",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CustomResourceProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, ServiceToken=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ServiceToken", ServiceToken)
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Stack(Resource):
-    """A Stack for CloudFormation.
-
-    See Also:
-        `AWS Cloud Formation documentation for Stack
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-stack.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::CloudFormation::Stack"
-
-    Properties: StackProperties = attrib(
-        factory=StackProperties, converter=create_object_converter(StackProperties)
+    _convert_CustomResourceProperties = create_object_converter(
+        CustomResourceProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class WaitConditionProperties(ResourceProperties):
-    Count = attrib(default=None)
-    Handle = attrib(default=None)
-    Timeout = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class WaitCondition(Resource):
-    """A Wait Condition for CloudFormation.
-
-    See Also:
-        `AWS Cloud Formation documentation for WaitCondition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-waitcondition.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::CloudFormation::WaitCondition"
-
-    Properties: WaitConditionProperties = attrib(
-        factory=WaitConditionProperties,
-        converter=create_object_converter(WaitConditionProperties),
+    class CustomResource(_Resource):
+        """A Custom Resource for CloudFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomResource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cfn-customresource.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudFormation::CustomResource"
+
+        Properties: CustomResourceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CustomResource",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CustomResourceProperties},
+            factories={"Properties": CustomResourceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CustomResourceProperties()
+            _setattr("Properties", _convert_CustomResourceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return CustomResource, CustomResourceProperties
+
+
+def _create_Macro():
+    class MacroProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "FunctionName",
+            "LogGroupName",
+            "LogRoleARN",
+            "Name",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MacroProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            FunctionName=None,
+            LogGroupName=None,
+            LogRoleARN=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("FunctionName", FunctionName)
+            _setattr("LogGroupName", LogGroupName)
+            _setattr("LogRoleARN", LogRoleARN)
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MacroProperties = create_object_converter(MacroProperties)
+
+    class Macro(_Resource):
+        """A Macro for CloudFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for Macro
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudformation-macro.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudFormation::Macro"
+
+        Properties: MacroProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Macro",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MacroProperties},
+            factories={"Properties": MacroProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MacroProperties()
+            _setattr("Properties", _convert_MacroProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Macro, MacroProperties
+
+
+def _create_Stack():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class StackProperties(_ResourceProperties):
+        __slots__ = (
+            "NotificationARNs",
+            "Parameters",
+            "Tags",
+            "TemplateURL",
+            "TimeoutInMinutes",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            NotificationARNs=None,
+            Parameters=None,
+            Tags=None,
+            TemplateURL=None,
+            TimeoutInMinutes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NotificationARNs", NotificationARNs)
+            _setattr("Parameters", Parameters)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TemplateURL", TemplateURL)
+            _setattr("TimeoutInMinutes", TimeoutInMinutes)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StackProperties = create_object_converter(StackProperties)
+
+    class Stack(_Resource):
+        """A Stack for CloudFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for Stack
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-stack.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudFormation::Stack"
+
+        Properties: StackProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Stack",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StackProperties},
+            factories={"Properties": StackProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StackProperties()
+            _setattr("Properties", _convert_StackProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Stack, StackProperties
+
+
+def _create_WaitCondition():
+    class WaitConditionProperties(_ResourceProperties):
+        __slots__ = ("Count", "Handle", "Timeout")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WaitConditionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Count=None, Handle=None, Timeout=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Count", Count)
+            _setattr("Handle", Handle)
+            _setattr("Timeout", Timeout)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_WaitConditionProperties = create_object_converter(WaitConditionProperties)
+
+    class WaitCondition(_Resource):
+        """A Wait Condition for CloudFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for WaitCondition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-waitcondition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudFormation::WaitCondition"
+
+        Properties: WaitConditionProperties
+
+        # NB: CreationPolicy may be set for WaitCondition
+        # (unlike most Resource types)
+        CreationPolicy: Dict[str, Any]
+
+        __slots__ = ("Properties", "CreationPolicy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WaitCondition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_WaitConditionProperties},
+            factories={"Properties": WaitConditionProperties, "CreationPolicy": dict},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Properties=NOTHING,
+            CreationPolicy: Dict[str, Any] = NOTHING,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = WaitConditionProperties()
+            _setattr("Properties", _convert_WaitConditionProperties(Properties))
+            if CreationPolicy is NOTHING:
+                CreationPolicy = dict()
+            _setattr("CreationPolicy", CreationPolicy)
+            _init_Resource(self, kwargs)
+
+    return WaitCondition, WaitConditionProperties
+
+
+def _create_WaitConditionHandle():
+    class WaitConditionHandleProperties(_ResourceProperties):
+        # A WaitConditionHandle doesn't actually have any Properties.
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WaitConditionHandleProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_WaitConditionHandleProperties = create_object_converter(
+        WaitConditionHandleProperties
     )
 
-    # NB: CreationPolicy may be set for WaitCondition
-    # (unlike most Resource types)
-    CreationPolicy: Dict[str, Any] = attrib(factory=dict)
-
-
-@attrs(**ATTRSCONFIG)
-class WaitConditionHandleProperties(ResourceProperties):
-    # A WaitConditionHandle doesn't actually have any Properties.
-    pass
-
-
-@attrs(**ATTRSCONFIG)
-class WaitConditionHandle(Resource):
-    """A Wait Condition Handle for CloudFormation.
-
-    See Also:
-        `AWS Cloud Formation documentation for WaitConditionHandle
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-waitconditionhandle.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::CloudFormation::WaitConditionHandle"
-
-    Properties: WaitConditionHandleProperties = attrib(
-        factory=WaitConditionHandleProperties,
-        converter=create_object_converter(WaitConditionHandleProperties),
-    )
+    class WaitConditionHandle(_Resource):
+        """A Wait Condition Handle for CloudFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for WaitConditionHandle
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-waitconditionhandle.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudFormation::WaitConditionHandle"
+
+        Properties: WaitConditionHandleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WaitConditionHandle",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_WaitConditionHandleProperties},
+            factories={"Properties": WaitConditionHandleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = WaitConditionHandleProperties()
+            _setattr("Properties", _convert_WaitConditionHandleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return WaitConditionHandle, WaitConditionHandleProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "CustomResource": _create_CustomResource,
+        "CustomResourceProperties": _create_CustomResource,
+        "Macro": _create_Macro,
+        "MacroProperties": _create_Macro,
+        "Stack": _create_Stack,
+        "StackProperties": _create_Stack,
+        "WaitCondition": _create_WaitCondition,
+        "WaitConditionProperties": _create_WaitCondition,
+        "WaitConditionHandle": _create_WaitConditionHandle,
+        "WaitConditionHandleProperties": _create_WaitConditionHandle,
+    },
+)
@@ -7,87 +7,1151 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "CloudFrontOriginAccessIdentity",
     "CloudFrontOriginAccessIdentityProperties",
+    "CloudFrontOriginAccessIdentityCloudFrontOriginAccessIdentityConfig",
     "Distribution",
     "DistributionProperties",
+    "DistributionCacheBehavior",
+    "DistributionCookies",
+    "DistributionCustomErrorResponse",
+    "DistributionCustomOriginConfig",
+    "DistributionDefaultCacheBehavior",
+    "DistributionDistributionConfig",
+    "DistributionForwardedValues",
+    "DistributionGeoRestriction",
+    "DistributionLambdaFunctionAssociation",
+    "DistributionLogging",
+    "DistributionOrigin",
+    "DistributionOriginCustomHeader",
+    "DistributionRestrictions",
+    "DistributionS3OriginConfig",
+    "DistributionViewerCertificate",
     "StreamingDistribution",
     "StreamingDistributionProperties",
+    "StreamingDistributionLogging",
+    "StreamingDistributionS3Origin",
+    "StreamingDistributionStreamingDistributionConfig",
+    "StreamingDistributionTrustedSigners",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class CloudFrontOriginAccessIdentityProperties(ResourceProperties):
-    CloudFrontOriginAccessIdentityConfig = attrib(default=None)
+def _create_CloudFrontOriginAccessIdentity():
+    class CloudFrontOriginAccessIdentityCloudFrontOriginAccessIdentityConfig(
+        _PropertyType
+    ):
+        """The Cloud Front Origin Access Identity Config property type for CloudFrontOriginAccessIdentity in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudFrontOriginAccessIdentityConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-cloudfrontoriginaccessidentity-cloudfrontoriginaccessidentityconfig.html>`_
+        """
+
+        __slots__ = ("Comment",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFrontOriginAccessIdentityCloudFrontOriginAccessIdentityConfig",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Comment=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Comment", Comment)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CloudFrontOriginAccessIdentityCloudFrontOriginAccessIdentityConfig = (
+        create_object_converter(
+            CloudFrontOriginAccessIdentityCloudFrontOriginAccessIdentityConfig
+        )
+    )
+
+    class CloudFrontOriginAccessIdentityProperties(_ResourceProperties):
+        __slots__ = ("CloudFrontOriginAccessIdentityConfig",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFrontOriginAccessIdentityProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CloudFrontOriginAccessIdentityConfig": _convert_CloudFrontOriginAccessIdentityCloudFrontOriginAccessIdentityConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CloudFrontOriginAccessIdentityConfig=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudFrontOriginAccessIdentityConfig",
+                _convert_CloudFrontOriginAccessIdentityCloudFrontOriginAccessIdentityConfig(
+                    CloudFrontOriginAccessIdentityConfig
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
 
+    _convert_CloudFrontOriginAccessIdentityProperties = create_object_converter(
+        CloudFrontOriginAccessIdentityProperties
+    )
+
+    class CloudFrontOriginAccessIdentity(_Resource):
+        """A Cloud Front Origin Access Identity for CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudFrontOriginAccessIdentity
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudfront-cloudfrontoriginaccessidentity.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudFront::CloudFrontOriginAccessIdentity"
 
-@attrs(**ATTRSCONFIG)
-class CloudFrontOriginAccessIdentity(Resource):
-    """A Cloud Front Origin Access Identity for CloudFront.
+        Properties: CloudFrontOriginAccessIdentityProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for CloudFrontOriginAccessIdentity
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudfront-cloudfrontoriginaccessidentity.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFrontOriginAccessIdentity",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_CloudFrontOriginAccessIdentityProperties
+            },
+            factories={"Properties": CloudFrontOriginAccessIdentityProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CloudFront::CloudFrontOriginAccessIdentity"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CloudFrontOriginAccessIdentityProperties()
+            _setattr(
+                "Properties",
+                _convert_CloudFrontOriginAccessIdentityProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
 
-    Properties: CloudFrontOriginAccessIdentityProperties = attrib(
-        factory=CloudFrontOriginAccessIdentityProperties,
-        converter=create_object_converter(CloudFrontOriginAccessIdentityProperties),
+    return (
+        CloudFrontOriginAccessIdentity,
+        CloudFrontOriginAccessIdentityProperties,
+        CloudFrontOriginAccessIdentityCloudFrontOriginAccessIdentityConfig,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class DistributionProperties(ResourceProperties):
-    DistributionConfig = attrib(default=None)
-    Tags = attrib(default=None)
+def _create_Distribution():
+    class DistributionLambdaFunctionAssociation(_PropertyType):
+        """The Lambda Function Association property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for LambdaFunctionAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-lambdafunctionassociation.html>`_
+        """
+
+        __slots__ = ("EventType", "LambdaFunctionARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionLambdaFunctionAssociation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EventType=None, LambdaFunctionARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EventType", EventType)
+            _setattr("LambdaFunctionARN", LambdaFunctionARN)
+            _init_PropertyType(self, kwargs)
+
+    class DistributionCookies(_PropertyType):
+        """The Cookies property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for Cookies
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-cookies.html>`_
+        """
+
+        __slots__ = ("Forward", "WhitelistedNames")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionCookies", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Forward=None, WhitelistedNames=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Forward", Forward)
+            _setattr("WhitelistedNames", WhitelistedNames)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DistributionCookies = create_object_converter(DistributionCookies)
+
+    class DistributionForwardedValues(_PropertyType):
+        """The Forwarded Values property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for ForwardedValues
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-forwardedvalues.html>`_
+        """
+
+        __slots__ = ("Cookies", "Headers", "QueryString", "QueryStringCacheKeys")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionForwardedValues",
+            _PropertyType,
+            __slots__,
+            converters={"Cookies": _convert_DistributionCookies},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Cookies=None,
+            Headers=None,
+            QueryString=None,
+            QueryStringCacheKeys=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Cookies", _convert_DistributionCookies(Cookies))
+            _setattr("Headers", Headers)
+            _setattr("QueryString", QueryString)
+            _setattr("QueryStringCacheKeys", QueryStringCacheKeys)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DistributionForwardedValues = create_object_converter(
+        DistributionForwardedValues
+    )
+    _convert_DistributionLambdaFunctionAssociation_list = create_object_list_converter(
+        DistributionLambdaFunctionAssociation
+    )
+
+    class DistributionCacheBehavior(_PropertyType):
+        """The Cache Behavior property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for CacheBehavior
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-cachebehavior.html>`_
+        """
+
+        __slots__ = (
+            "AllowedMethods",
+            "CachedMethods",
+            "Compress",
+            "DefaultTTL",
+            "FieldLevelEncryptionId",
+            "ForwardedValues",
+            "LambdaFunctionAssociations",
+            "MaxTTL",
+            "MinTTL",
+            "PathPattern",
+            "SmoothStreaming",
+            "TargetOriginId",
+            "TrustedSigners",
+            "ViewerProtocolPolicy",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionCacheBehavior",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ForwardedValues": _convert_DistributionForwardedValues,
+                "LambdaFunctionAssociations": _convert_DistributionLambdaFunctionAssociation_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowedMethods=None,
+            CachedMethods=None,
+            Compress=None,
+            DefaultTTL=None,
+            FieldLevelEncryptionId=None,
+            ForwardedValues=None,
+            LambdaFunctionAssociations=None,
+            MaxTTL=None,
+            MinTTL=None,
+            PathPattern=None,
+            SmoothStreaming=None,
+            TargetOriginId=None,
+            TrustedSigners=None,
+            ViewerProtocolPolicy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowedMethods", AllowedMethods)
+            _setattr("CachedMethods", CachedMethods)
+            _setattr("Compress", Compress)
+            _setattr("DefaultTTL", DefaultTTL)
+            _setattr("FieldLevelEncryptionId", FieldLevelEncryptionId)
+            _setattr(
+                "ForwardedValues", _convert_DistributionForwardedValues(ForwardedValues)
+            )
+            _setattr(
+                "LambdaFunctionAssociations",
+                _convert_DistributionLambdaFunctionAssociation_list(
+                    LambdaFunctionAssociations
+                ),
+            )
+            _setattr("MaxTTL", MaxTTL)
+            _setattr("MinTTL", MinTTL)
+            _setattr("PathPattern", PathPattern)
+            _setattr("SmoothStreaming", SmoothStreaming)
+            _setattr("TargetOriginId", TargetOriginId)
+            _setattr("TrustedSigners", TrustedSigners)
+            _setattr("ViewerProtocolPolicy", ViewerProtocolPolicy)
+            _init_PropertyType(self, kwargs)
 
+    class DistributionCustomErrorResponse(_PropertyType):
+        """The Custom Error Response property type for Distribution in CloudFront.
 
-@attrs(**ATTRSCONFIG)
-class Distribution(Resource):
-    """A Distribution for CloudFront.
+        See Also:
+            `AWS Cloud Formation documentation for CustomErrorResponse
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-customerrorresponse.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Distribution
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudfront-distribution.html>`_
-    """
+        __slots__ = (
+            "ErrorCachingMinTTL",
+            "ErrorCode",
+            "ResponseCode",
+            "ResponsePagePath",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionCustomErrorResponse", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CloudFront::Distribution"
+        def __init__(
+            self,
+            *,
+            ErrorCachingMinTTL=None,
+            ErrorCode=None,
+            ResponseCode=None,
+            ResponsePagePath=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ErrorCachingMinTTL", ErrorCachingMinTTL)
+            _setattr("ErrorCode", ErrorCode)
+            _setattr("ResponseCode", ResponseCode)
+            _setattr("ResponsePagePath", ResponsePagePath)
+            _init_PropertyType(self, kwargs)
 
-    Properties: DistributionProperties = attrib(
-        factory=DistributionProperties,
-        converter=create_object_converter(DistributionProperties),
+    class DistributionCustomOriginConfig(_PropertyType):
+        """The Custom Origin Config property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomOriginConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-customoriginconfig.html>`_
+        """
+
+        __slots__ = (
+            "HTTPPort",
+            "HTTPSPort",
+            "OriginKeepaliveTimeout",
+            "OriginProtocolPolicy",
+            "OriginReadTimeout",
+            "OriginSSLProtocols",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionCustomOriginConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            HTTPPort=None,
+            HTTPSPort=None,
+            OriginKeepaliveTimeout=None,
+            OriginProtocolPolicy=None,
+            OriginReadTimeout=None,
+            OriginSSLProtocols=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HTTPPort", HTTPPort)
+            _setattr("HTTPSPort", HTTPSPort)
+            _setattr("OriginKeepaliveTimeout", OriginKeepaliveTimeout)
+            _setattr("OriginProtocolPolicy", OriginProtocolPolicy)
+            _setattr("OriginReadTimeout", OriginReadTimeout)
+            _setattr("OriginSSLProtocols", OriginSSLProtocols)
+            _init_PropertyType(self, kwargs)
+
+    class DistributionDefaultCacheBehavior(_PropertyType):
+        """The Default Cache Behavior property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for DefaultCacheBehavior
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-defaultcachebehavior.html>`_
+        """
+
+        __slots__ = (
+            "AllowedMethods",
+            "CachedMethods",
+            "Compress",
+            "DefaultTTL",
+            "FieldLevelEncryptionId",
+            "ForwardedValues",
+            "LambdaFunctionAssociations",
+            "MaxTTL",
+            "MinTTL",
+            "SmoothStreaming",
+            "TargetOriginId",
+            "TrustedSigners",
+            "ViewerProtocolPolicy",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionDefaultCacheBehavior",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ForwardedValues": _convert_DistributionForwardedValues,
+                "LambdaFunctionAssociations": _convert_DistributionLambdaFunctionAssociation_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowedMethods=None,
+            CachedMethods=None,
+            Compress=None,
+            DefaultTTL=None,
+            FieldLevelEncryptionId=None,
+            ForwardedValues=None,
+            LambdaFunctionAssociations=None,
+            MaxTTL=None,
+            MinTTL=None,
+            SmoothStreaming=None,
+            TargetOriginId=None,
+            TrustedSigners=None,
+            ViewerProtocolPolicy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowedMethods", AllowedMethods)
+            _setattr("CachedMethods", CachedMethods)
+            _setattr("Compress", Compress)
+            _setattr("DefaultTTL", DefaultTTL)
+            _setattr("FieldLevelEncryptionId", FieldLevelEncryptionId)
+            _setattr(
+                "ForwardedValues", _convert_DistributionForwardedValues(ForwardedValues)
+            )
+            _setattr(
+                "LambdaFunctionAssociations",
+                _convert_DistributionLambdaFunctionAssociation_list(
+                    LambdaFunctionAssociations
+                ),
+            )
+            _setattr("MaxTTL", MaxTTL)
+            _setattr("MinTTL", MinTTL)
+            _setattr("SmoothStreaming", SmoothStreaming)
+            _setattr("TargetOriginId", TargetOriginId)
+            _setattr("TrustedSigners", TrustedSigners)
+            _setattr("ViewerProtocolPolicy", ViewerProtocolPolicy)
+            _init_PropertyType(self, kwargs)
+
+    class DistributionLogging(_PropertyType):
+        """The Logging property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for Logging
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-logging.html>`_
+        """
+
+        __slots__ = ("Bucket", "IncludeCookies", "Prefix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionLogging", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Bucket=None, IncludeCookies=None, Prefix=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("IncludeCookies", IncludeCookies)
+            _setattr("Prefix", Prefix)
+            _init_PropertyType(self, kwargs)
+
+    class DistributionOriginCustomHeader(_PropertyType):
+        """The Origin Custom Header property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for OriginCustomHeader
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-origincustomheader.html>`_
+        """
+
+        __slots__ = ("HeaderName", "HeaderValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionOriginCustomHeader", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, HeaderName=None, HeaderValue=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HeaderName", HeaderName)
+            _setattr("HeaderValue", HeaderValue)
+            _init_PropertyType(self, kwargs)
+
+    class DistributionS3OriginConfig(_PropertyType):
+        """The S3 Origin Config property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3OriginConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-s3originconfig.html>`_
+        """
+
+        __slots__ = ("OriginAccessIdentity",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionS3OriginConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, OriginAccessIdentity=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("OriginAccessIdentity", OriginAccessIdentity)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DistributionCustomOriginConfig = create_object_converter(
+        DistributionCustomOriginConfig
     )
+    _convert_DistributionOriginCustomHeader_list = create_object_list_converter(
+        DistributionOriginCustomHeader
+    )
+    _convert_DistributionS3OriginConfig = create_object_converter(
+        DistributionS3OriginConfig
+    )
+
+    class DistributionOrigin(_PropertyType):
+        """The Origin property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for Origin
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-origin.html>`_
+        """
 
+        __slots__ = (
+            "CustomOriginConfig",
+            "DomainName",
+            "Id",
+            "OriginCustomHeaders",
+            "OriginPath",
+            "S3OriginConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionOrigin",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CustomOriginConfig": _convert_DistributionCustomOriginConfig,
+                "OriginCustomHeaders": _convert_DistributionOriginCustomHeader_list,
+                "S3OriginConfig": _convert_DistributionS3OriginConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class StreamingDistributionProperties(ResourceProperties):
-    StreamingDistributionConfig = attrib(default=None)
-    Tags = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            CustomOriginConfig=None,
+            DomainName=None,
+            Id=None,
+            OriginCustomHeaders=None,
+            OriginPath=None,
+            S3OriginConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CustomOriginConfig",
+                _convert_DistributionCustomOriginConfig(CustomOriginConfig),
+            )
+            _setattr("DomainName", DomainName)
+            _setattr("Id", Id)
+            _setattr(
+                "OriginCustomHeaders",
+                _convert_DistributionOriginCustomHeader_list(OriginCustomHeaders),
+            )
+            _setattr("OriginPath", OriginPath)
+            _setattr(
+                "S3OriginConfig", _convert_DistributionS3OriginConfig(S3OriginConfig)
+            )
+            _init_PropertyType(self, kwargs)
 
+    class DistributionViewerCertificate(_PropertyType):
+        """The Viewer Certificate property type for Distribution in CloudFront.
 
-@attrs(**ATTRSCONFIG)
-class StreamingDistribution(Resource):
-    """A Streaming Distribution for CloudFront.
+        See Also:
+            `AWS Cloud Formation documentation for ViewerCertificate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-viewercertificate.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for StreamingDistribution
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudfront-streamingdistribution.html>`_
-    """
+        __slots__ = (
+            "AcmCertificateArn",
+            "CloudFrontDefaultCertificate",
+            "IamCertificateId",
+            "MinimumProtocolVersion",
+            "SslSupportMethod",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionViewerCertificate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CloudFront::StreamingDistribution"
+        def __init__(
+            self,
+            *,
+            AcmCertificateArn=None,
+            CloudFrontDefaultCertificate=None,
+            IamCertificateId=None,
+            MinimumProtocolVersion=None,
+            SslSupportMethod=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcmCertificateArn", AcmCertificateArn)
+            _setattr("CloudFrontDefaultCertificate", CloudFrontDefaultCertificate)
+            _setattr("IamCertificateId", IamCertificateId)
+            _setattr("MinimumProtocolVersion", MinimumProtocolVersion)
+            _setattr("SslSupportMethod", SslSupportMethod)
+            _init_PropertyType(self, kwargs)
 
-    Properties: StreamingDistributionProperties = attrib(
-        factory=StreamingDistributionProperties,
-        converter=create_object_converter(StreamingDistributionProperties),
+    class DistributionGeoRestriction(_PropertyType):
+        """The Geo Restriction property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for GeoRestriction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-georestriction.html>`_
+        """
+
+        __slots__ = ("Locations", "RestrictionType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionGeoRestriction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Locations=None, RestrictionType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Locations", Locations)
+            _setattr("RestrictionType", RestrictionType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DistributionGeoRestriction = create_object_converter(
+        DistributionGeoRestriction
     )
+
+    class DistributionRestrictions(_PropertyType):
+        """The Restrictions property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for Restrictions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-restrictions.html>`_
+        """
+
+        __slots__ = ("GeoRestriction",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionRestrictions",
+            _PropertyType,
+            __slots__,
+            converters={"GeoRestriction": _convert_DistributionGeoRestriction},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, GeoRestriction=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "GeoRestriction", _convert_DistributionGeoRestriction(GeoRestriction)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_DistributionCacheBehavior_list = create_object_list_converter(
+        DistributionCacheBehavior
+    )
+    _convert_DistributionCustomErrorResponse_list = create_object_list_converter(
+        DistributionCustomErrorResponse
+    )
+    _convert_DistributionDefaultCacheBehavior = create_object_converter(
+        DistributionDefaultCacheBehavior
+    )
+    _convert_DistributionLogging = create_object_converter(DistributionLogging)
+    _convert_DistributionOrigin_list = create_object_list_converter(DistributionOrigin)
+    _convert_DistributionRestrictions = create_object_converter(
+        DistributionRestrictions
+    )
+    _convert_DistributionViewerCertificate = create_object_converter(
+        DistributionViewerCertificate
+    )
+
+    class DistributionDistributionConfig(_PropertyType):
+        """The Distribution Config property type for Distribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for DistributionConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-distribution-distributionconfig.html>`_
+        """
+
+        __slots__ = (
+            "Aliases",
+            "CacheBehaviors",
+            "Comment",
+            "CustomErrorResponses",
+            "DefaultCacheBehavior",
+            "DefaultRootObject",
+            "Enabled",
+            "HttpVersion",
+            "IPV6Enabled",
+            "Logging",
+            "Origins",
+            "PriceClass",
+            "Restrictions",
+            "ViewerCertificate",
+            "WebACLId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionDistributionConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CacheBehaviors": _convert_DistributionCacheBehavior_list,
+                "CustomErrorResponses": _convert_DistributionCustomErrorResponse_list,
+                "DefaultCacheBehavior": _convert_DistributionDefaultCacheBehavior,
+                "Logging": _convert_DistributionLogging,
+                "Origins": _convert_DistributionOrigin_list,
+                "Restrictions": _convert_DistributionRestrictions,
+                "ViewerCertificate": _convert_DistributionViewerCertificate,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Aliases=None,
+            CacheBehaviors=None,
+            Comment=None,
+            CustomErrorResponses=None,
+            DefaultCacheBehavior=None,
+            DefaultRootObject=None,
+            Enabled=None,
+            HttpVersion=None,
+            IPV6Enabled=None,
+            Logging=None,
+            Origins=None,
+            PriceClass=None,
+            Restrictions=None,
+            ViewerCertificate=None,
+            WebACLId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Aliases", Aliases)
+            _setattr(
+                "CacheBehaviors",
+                _convert_DistributionCacheBehavior_list(CacheBehaviors),
+            )
+            _setattr("Comment", Comment)
+            _setattr(
+                "CustomErrorResponses",
+                _convert_DistributionCustomErrorResponse_list(CustomErrorResponses),
+            )
+            _setattr(
+                "DefaultCacheBehavior",
+                _convert_DistributionDefaultCacheBehavior(DefaultCacheBehavior),
+            )
+            _setattr("DefaultRootObject", DefaultRootObject)
+            _setattr("Enabled", Enabled)
+            _setattr("HttpVersion", HttpVersion)
+            _setattr("IPV6Enabled", IPV6Enabled)
+            _setattr("Logging", _convert_DistributionLogging(Logging))
+            _setattr("Origins", _convert_DistributionOrigin_list(Origins))
+            _setattr("PriceClass", PriceClass)
+            _setattr("Restrictions", _convert_DistributionRestrictions(Restrictions))
+            _setattr(
+                "ViewerCertificate",
+                _convert_DistributionViewerCertificate(ViewerCertificate),
+            )
+            _setattr("WebACLId", WebACLId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DistributionDistributionConfig = create_object_converter(
+        DistributionDistributionConfig
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DistributionProperties(_ResourceProperties):
+        __slots__ = ("DistributionConfig", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DistributionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DistributionConfig": _convert_DistributionDistributionConfig,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DistributionConfig=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DistributionConfig",
+                _convert_DistributionDistributionConfig(DistributionConfig),
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DistributionProperties = create_object_converter(DistributionProperties)
+
+    class Distribution(_Resource):
+        """A Distribution for CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for Distribution
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudfront-distribution.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudFront::Distribution"
+
+        Properties: DistributionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Distribution",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DistributionProperties},
+            factories={"Properties": DistributionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DistributionProperties()
+            _setattr("Properties", _convert_DistributionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Distribution,
+        DistributionProperties,
+        DistributionLambdaFunctionAssociation,
+        DistributionCookies,
+        DistributionForwardedValues,
+        DistributionCacheBehavior,
+        DistributionCustomErrorResponse,
+        DistributionCustomOriginConfig,
+        DistributionDefaultCacheBehavior,
+        DistributionLogging,
+        DistributionOriginCustomHeader,
+        DistributionS3OriginConfig,
+        DistributionOrigin,
+        DistributionViewerCertificate,
+        DistributionGeoRestriction,
+        DistributionRestrictions,
+        DistributionDistributionConfig,
+    )
+
+
+def _create_StreamingDistribution():
+    class StreamingDistributionLogging(_PropertyType):
+        """The Logging property type for StreamingDistribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for Logging
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-streamingdistribution-logging.html>`_
+        """
+
+        __slots__ = ("Bucket", "Enabled", "Prefix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamingDistributionLogging", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Bucket=None, Enabled=None, Prefix=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("Enabled", Enabled)
+            _setattr("Prefix", Prefix)
+            _init_PropertyType(self, kwargs)
+
+    class StreamingDistributionS3Origin(_PropertyType):
+        """The S3 Origin property type for StreamingDistribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3Origin
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-streamingdistribution-s3origin.html>`_
+        """
+
+        __slots__ = ("DomainName", "OriginAccessIdentity")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamingDistributionS3Origin", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DomainName=None, OriginAccessIdentity=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DomainName", DomainName)
+            _setattr("OriginAccessIdentity", OriginAccessIdentity)
+            _init_PropertyType(self, kwargs)
+
+    class StreamingDistributionTrustedSigners(_PropertyType):
+        """The Trusted Signers property type for StreamingDistribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for TrustedSigners
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-streamingdistribution-trustedsigners.html>`_
+        """
+
+        __slots__ = ("AwsAccountNumbers", "Enabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamingDistributionTrustedSigners", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AwsAccountNumbers=None, Enabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AwsAccountNumbers", AwsAccountNumbers)
+            _setattr("Enabled", Enabled)
+            _init_PropertyType(self, kwargs)
+
+    _convert_StreamingDistributionLogging = create_object_converter(
+        StreamingDistributionLogging
+    )
+    _convert_StreamingDistributionS3Origin = create_object_converter(
+        StreamingDistributionS3Origin
+    )
+    _convert_StreamingDistributionTrustedSigners = create_object_converter(
+        StreamingDistributionTrustedSigners
+    )
+
+    class StreamingDistributionStreamingDistributionConfig(_PropertyType):
+        """The Streaming Distribution Config property type for StreamingDistribution in CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for StreamingDistributionConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudfront-streamingdistribution-streamingdistributionconfig.html>`_
+        """
+
+        __slots__ = (
+            "Aliases",
+            "Comment",
+            "Enabled",
+            "Logging",
+            "PriceClass",
+            "S3Origin",
+            "TrustedSigners",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamingDistributionStreamingDistributionConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Logging": _convert_StreamingDistributionLogging,
+                "S3Origin": _convert_StreamingDistributionS3Origin,
+                "TrustedSigners": _convert_StreamingDistributionTrustedSigners,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Aliases=None,
+            Comment=None,
+            Enabled=None,
+            Logging=None,
+            PriceClass=None,
+            S3Origin=None,
+            TrustedSigners=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Aliases", Aliases)
+            _setattr("Comment", Comment)
+            _setattr("Enabled", Enabled)
+            _setattr("Logging", _convert_StreamingDistributionLogging(Logging))
+            _setattr("PriceClass", PriceClass)
+            _setattr("S3Origin", _convert_StreamingDistributionS3Origin(S3Origin))
+            _setattr(
+                "TrustedSigners",
+                _convert_StreamingDistributionTrustedSigners(TrustedSigners),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_StreamingDistributionStreamingDistributionConfig = create_object_converter(
+        StreamingDistributionStreamingDistributionConfig
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class StreamingDistributionProperties(_ResourceProperties):
+        __slots__ = ("StreamingDistributionConfig", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamingDistributionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "StreamingDistributionConfig": _convert_StreamingDistributionStreamingDistributionConfig,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, StreamingDistributionConfig=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "StreamingDistributionConfig",
+                _convert_StreamingDistributionStreamingDistributionConfig(
+                    StreamingDistributionConfig
+                ),
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StreamingDistributionProperties = create_object_converter(
+        StreamingDistributionProperties
+    )
+
+    class StreamingDistribution(_Resource):
+        """A Streaming Distribution for CloudFront.
+
+        See Also:
+            `AWS Cloud Formation documentation for StreamingDistribution
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudfront-streamingdistribution.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudFront::StreamingDistribution"
+
+        Properties: StreamingDistributionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamingDistribution",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StreamingDistributionProperties},
+            factories={"Properties": StreamingDistributionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StreamingDistributionProperties()
+            _setattr("Properties", _convert_StreamingDistributionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        StreamingDistribution,
+        StreamingDistributionProperties,
+        StreamingDistributionLogging,
+        StreamingDistributionS3Origin,
+        StreamingDistributionTrustedSigners,
+        StreamingDistributionStreamingDistributionConfig,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "CloudFrontOriginAccessIdentity": _create_CloudFrontOriginAccessIdentity,
+        "CloudFrontOriginAccessIdentityProperties": _create_CloudFrontOriginAccessIdentity,
+        "CloudFrontOriginAccessIdentityCloudFrontOriginAccessIdentityConfig": _create_CloudFrontOriginAccessIdentity,
+        "Distribution": _create_Distribution,
+        "DistributionProperties": _create_Distribution,
+        "DistributionCacheBehavior": _create_Distribution,
+        "DistributionCookies": _create_Distribution,
+        "DistributionCustomErrorResponse": _create_Distribution,
+        "DistributionCustomOriginConfig": _create_Distribution,
+        "DistributionDefaultCacheBehavior": _create_Distribution,
+        "DistributionDistributionConfig": _create_Distribution,
+        "DistributionForwardedValues": _create_Distribution,
+        "DistributionGeoRestriction": _create_Distribution,
+        "DistributionLambdaFunctionAssociation": _create_Distribution,
+        "DistributionLogging": _create_Distribution,
+        "DistributionOrigin": _create_Distribution,
+        "DistributionOriginCustomHeader": _create_Distribution,
+        "DistributionRestrictions": _create_Distribution,
+        "DistributionS3OriginConfig": _create_Distribution,
+        "DistributionViewerCertificate": _create_Distribution,
+        "StreamingDistribution": _create_StreamingDistribution,
+        "StreamingDistributionProperties": _create_StreamingDistribution,
+        "StreamingDistributionLogging": _create_StreamingDistribution,
+        "StreamingDistributionS3Origin": _create_StreamingDistribution,
+        "StreamingDistributionStreamingDistributionConfig": _create_StreamingDistribution,
+        "StreamingDistributionTrustedSigners": _create_StreamingDistribution,
+    },
+)
@@ -7,45 +7,198 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Trail", "TrailProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Trail",
+    "TrailProperties",
+    "TrailDataResource",
+    "TrailEventSelector",
+]
 
-@attrs(**ATTRSCONFIG)
-class TrailProperties(ResourceProperties):
-    CloudWatchLogsLogGroupArn = attrib(default=None)
-    CloudWatchLogsRoleArn = attrib(default=None)
-    EnableLogFileValidation = attrib(default=None)
-    EventSelectors = attrib(default=None)
-    IncludeGlobalServiceEvents = attrib(default=None)
-    IsLogging = attrib(default=None)
-    IsMultiRegionTrail = attrib(default=None)
-    KMSKeyId = attrib(default=None)
-    S3BucketName = attrib(default=None)
-    S3KeyPrefix = attrib(default=None)
-    SnsTopicName = attrib(default=None)
-    Tags = attrib(default=None)
-    TrailName = attrib(default=None)
 
+def _create_Trail():
+    class TrailDataResource(_PropertyType):
+        """The Data Resource property type for Trail in CloudTrail.
 
-@attrs(**ATTRSCONFIG)
-class Trail(Resource):
-    """A Trail for CloudTrail.
+        See Also:
+            `AWS Cloud Formation documentation for DataResource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudtrail-trail-dataresource.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Trail
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudtrail-trail.html>`_
-    """
+        __slots__ = ("Type", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrailDataResource", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CloudTrail::Trail"
+        def __init__(self, *, Type=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
 
-    Properties: TrailProperties = attrib(
-        factory=TrailProperties, converter=create_object_converter(TrailProperties)
-    )
+    _convert_TrailDataResource_list = create_object_list_converter(TrailDataResource)
+
+    class TrailEventSelector(_PropertyType):
+        """The Event Selector property type for Trail in CloudTrail.
+
+        See Also:
+            `AWS Cloud Formation documentation for EventSelector
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudtrail-trail-eventselector.html>`_
+        """
+
+        __slots__ = ("DataResources", "IncludeManagementEvents", "ReadWriteType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrailEventSelector",
+            _PropertyType,
+            __slots__,
+            converters={"DataResources": _convert_TrailDataResource_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DataResources=None,
+            IncludeManagementEvents=None,
+            ReadWriteType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DataResources", _convert_TrailDataResource_list(DataResources))
+            _setattr("IncludeManagementEvents", IncludeManagementEvents)
+            _setattr("ReadWriteType", ReadWriteType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TrailEventSelector_list = create_object_list_converter(TrailEventSelector)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class TrailProperties(_ResourceProperties):
+        __slots__ = (
+            "CloudWatchLogsLogGroupArn",
+            "CloudWatchLogsRoleArn",
+            "EnableLogFileValidation",
+            "EventSelectors",
+            "IncludeGlobalServiceEvents",
+            "IsLogging",
+            "IsMultiRegionTrail",
+            "KMSKeyId",
+            "S3BucketName",
+            "S3KeyPrefix",
+            "SnsTopicName",
+            "Tags",
+            "TrailName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrailProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "EventSelectors": _convert_TrailEventSelector_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CloudWatchLogsLogGroupArn=None,
+            CloudWatchLogsRoleArn=None,
+            EnableLogFileValidation=None,
+            EventSelectors=None,
+            IncludeGlobalServiceEvents=None,
+            IsLogging=None,
+            IsMultiRegionTrail=None,
+            KMSKeyId=None,
+            S3BucketName=None,
+            S3KeyPrefix=None,
+            SnsTopicName=None,
+            Tags=None,
+            TrailName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudWatchLogsLogGroupArn", CloudWatchLogsLogGroupArn)
+            _setattr("CloudWatchLogsRoleArn", CloudWatchLogsRoleArn)
+            _setattr("EnableLogFileValidation", EnableLogFileValidation)
+            _setattr("EventSelectors", _convert_TrailEventSelector_list(EventSelectors))
+            _setattr("IncludeGlobalServiceEvents", IncludeGlobalServiceEvents)
+            _setattr("IsLogging", IsLogging)
+            _setattr("IsMultiRegionTrail", IsMultiRegionTrail)
+            _setattr("KMSKeyId", KMSKeyId)
+            _setattr("S3BucketName", S3BucketName)
+            _setattr("S3KeyPrefix", S3KeyPrefix)
+            _setattr("SnsTopicName", SnsTopicName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TrailName", TrailName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TrailProperties = create_object_converter(TrailProperties)
+
+    class Trail(_Resource):
+        """A Trail for CloudTrail.
+
+        See Also:
+            `AWS Cloud Formation documentation for Trail
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudtrail-trail.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudTrail::Trail"
+
+        Properties: TrailProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Trail",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TrailProperties},
+            factories={"Properties": TrailProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TrailProperties()
+            _setattr("Properties", _convert_TrailProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Trail, TrailProperties, TrailDataResource, TrailEventSelector
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Trail": _create_Trail,
+        "TrailProperties": _create_Trail,
+        "TrailDataResource": _create_Trail,
+        "TrailEventSelector": _create_Trail,
+    },
+)
@@ -7,19 +7,33 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Alarm",
     "AlarmProperties",
+    "AlarmDimension",
+    "AlarmMetric",
+    "AlarmMetricDataQuery",
+    "AlarmMetricStat",
     "AnomalyDetector",
     "AnomalyDetectorProperties",
+    "AnomalyDetectorConfiguration",
+    "AnomalyDetectorDimension",
+    "AnomalyDetectorRange",
     "Dashboard",
     "DashboardProperties",
     "InsightRule",
@@ -27,115 +41,559 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AlarmProperties(ResourceProperties):
-    ActionsEnabled = attrib(default=None)
-    AlarmActions = attrib(default=None)
-    AlarmDescription = attrib(default=None)
-    AlarmName = attrib(default=None)
-    ComparisonOperator = attrib(default=None)
-    DatapointsToAlarm = attrib(default=None)
-    Dimensions = attrib(default=None)
-    EvaluateLowSampleCountPercentile = attrib(default=None)
-    EvaluationPeriods = attrib(default=None)
-    ExtendedStatistic = attrib(default=None)
-    InsufficientDataActions = attrib(default=None)
-    MetricName = attrib(default=None)
-    Metrics = attrib(default=None)
-    Namespace = attrib(default=None)
-    OKActions = attrib(default=None)
-    Period = attrib(default=None)
-    Statistic = attrib(default=None)
-    Threshold = attrib(default=None)
-    ThresholdMetricId = attrib(default=None)
-    TreatMissingData = attrib(default=None)
-    Unit = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Alarm(Resource):
-    """A Alarm for CloudWatch.
-
-    See Also:
-        `AWS Cloud Formation documentation for Alarm
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cw-alarm.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::CloudWatch::Alarm"
-
-    Properties: AlarmProperties = attrib(
-        factory=AlarmProperties, converter=create_object_converter(AlarmProperties)
+def _create_Alarm():
+    class AlarmDimension(_PropertyType):
+        """The Dimension property type for Alarm in CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Dimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cw-dimension.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AlarmDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AlarmDimension_list = create_object_list_converter(AlarmDimension)
+
+    class AlarmMetric(_PropertyType):
+        """The Metric property type for Alarm in CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Metric
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudwatch-alarm-metric.html>`_
+        """
+
+        __slots__ = ("Dimensions", "MetricName", "Namespace")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AlarmMetric",
+            _PropertyType,
+            __slots__,
+            converters={"Dimensions": _convert_AlarmDimension_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Dimensions=None, MetricName=None, Namespace=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Dimensions", _convert_AlarmDimension_list(Dimensions))
+            _setattr("MetricName", MetricName)
+            _setattr("Namespace", Namespace)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AlarmMetric = create_object_converter(AlarmMetric)
+
+    class AlarmMetricStat(_PropertyType):
+        """The Metric Stat property type for Alarm in CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricStat
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudwatch-alarm-metricstat.html>`_
+        """
+
+        __slots__ = ("Metric", "Period", "Stat", "Unit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AlarmMetricStat",
+            _PropertyType,
+            __slots__,
+            converters={"Metric": _convert_AlarmMetric},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Metric=None, Period=None, Stat=None, Unit=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Metric", _convert_AlarmMetric(Metric))
+            _setattr("Period", Period)
+            _setattr("Stat", Stat)
+            _setattr("Unit", Unit)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AlarmMetricStat = create_object_converter(AlarmMetricStat)
+
+    class AlarmMetricDataQuery(_PropertyType):
+        """The Metric Data Query property type for Alarm in CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricDataQuery
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudwatch-alarm-metricdataquery.html>`_
+        """
+
+        __slots__ = ("Expression", "Id", "Label", "MetricStat", "ReturnData")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AlarmMetricDataQuery",
+            _PropertyType,
+            __slots__,
+            converters={"MetricStat": _convert_AlarmMetricStat},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Expression=None,
+            Id=None,
+            Label=None,
+            MetricStat=None,
+            ReturnData=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Expression", Expression)
+            _setattr("Id", Id)
+            _setattr("Label", Label)
+            _setattr("MetricStat", _convert_AlarmMetricStat(MetricStat))
+            _setattr("ReturnData", ReturnData)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AlarmMetricDataQuery_list = create_object_list_converter(
+        AlarmMetricDataQuery
     )
 
-
-@attrs(**ATTRSCONFIG)
-class AnomalyDetectorProperties(ResourceProperties):
-    Configuration = attrib(default=None)
-    Dimensions = attrib(default=None)
-    MetricName = attrib(default=None)
-    Namespace = attrib(default=None)
-    Stat = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class AnomalyDetector(Resource):
-    """A Anomaly Detector for CloudWatch.
-
-    See Also:
-        `AWS Cloud Formation documentation for AnomalyDetector
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudwatch-anomalydetector.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::CloudWatch::AnomalyDetector"
-
-    Properties: AnomalyDetectorProperties = attrib(
-        factory=AnomalyDetectorProperties,
-        converter=create_object_converter(AnomalyDetectorProperties),
+    class AlarmProperties(_ResourceProperties):
+        __slots__ = (
+            "ActionsEnabled",
+            "AlarmActions",
+            "AlarmDescription",
+            "AlarmName",
+            "ComparisonOperator",
+            "DatapointsToAlarm",
+            "Dimensions",
+            "EvaluateLowSampleCountPercentile",
+            "EvaluationPeriods",
+            "ExtendedStatistic",
+            "InsufficientDataActions",
+            "MetricName",
+            "Metrics",
+            "Namespace",
+            "OKActions",
+            "Period",
+            "Statistic",
+            "Threshold",
+            "ThresholdMetricId",
+            "TreatMissingData",
+            "Unit",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AlarmProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Dimensions": _convert_AlarmDimension_list,
+                "Metrics": _convert_AlarmMetricDataQuery_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ActionsEnabled=None,
+            AlarmActions=None,
+            AlarmDescription=None,
+            AlarmName=None,
+            ComparisonOperator=None,
+            DatapointsToAlarm=None,
+            Dimensions=None,
+            EvaluateLowSampleCountPercentile=None,
+            EvaluationPeriods=None,
+            ExtendedStatistic=None,
+            InsufficientDataActions=None,
+            MetricName=None,
+            Metrics=None,
+            Namespace=None,
+            OKActions=None,
+            Period=None,
+            Statistic=None,
+            Threshold=None,
+            ThresholdMetricId=None,
+            TreatMissingData=None,
+            Unit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ActionsEnabled", ActionsEnabled)
+            _setattr("AlarmActions", AlarmActions)
+            _setattr("AlarmDescription", AlarmDescription)
+            _setattr("AlarmName", AlarmName)
+            _setattr("ComparisonOperator", ComparisonOperator)
+            _setattr("DatapointsToAlarm", DatapointsToAlarm)
+            _setattr("Dimensions", _convert_AlarmDimension_list(Dimensions))
+            _setattr(
+                "EvaluateLowSampleCountPercentile", EvaluateLowSampleCountPercentile
+            )
+            _setattr("EvaluationPeriods", EvaluationPeriods)
+            _setattr("ExtendedStatistic", ExtendedStatistic)
+            _setattr("InsufficientDataActions", InsufficientDataActions)
+            _setattr("MetricName", MetricName)
+            _setattr("Metrics", _convert_AlarmMetricDataQuery_list(Metrics))
+            _setattr("Namespace", Namespace)
+            _setattr("OKActions", OKActions)
+            _setattr("Period", Period)
+            _setattr("Statistic", Statistic)
+            _setattr("Threshold", Threshold)
+            _setattr("ThresholdMetricId", ThresholdMetricId)
+            _setattr("TreatMissingData", TreatMissingData)
+            _setattr("Unit", Unit)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AlarmProperties = create_object_converter(AlarmProperties)
+
+    class Alarm(_Resource):
+        """A Alarm for CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Alarm
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cw-alarm.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudWatch::Alarm"
+
+        Properties: AlarmProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Alarm",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AlarmProperties},
+            factories={"Properties": AlarmProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AlarmProperties()
+            _setattr("Properties", _convert_AlarmProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Alarm,
+        AlarmProperties,
+        AlarmDimension,
+        AlarmMetric,
+        AlarmMetricStat,
+        AlarmMetricDataQuery,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class DashboardProperties(ResourceProperties):
-    DashboardBody = attrib(default=None)
-    DashboardName = attrib(default=None)
-
+def _create_AnomalyDetector():
+    class AnomalyDetectorRange(_PropertyType):
+        """The Range property type for AnomalyDetector in CloudWatch.
 
-@attrs(**ATTRSCONFIG)
-class Dashboard(Resource):
-    """A Dashboard for CloudWatch.
+        See Also:
+            `AWS Cloud Formation documentation for Range
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudwatch-anomalydetector-range.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Dashboard
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudwatch-dashboard.html>`_
-    """
+        __slots__ = ("EndTime", "StartTime")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AnomalyDetectorRange", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CloudWatch::Dashboard"
+        def __init__(self, *, EndTime=None, StartTime=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EndTime", EndTime)
+            _setattr("StartTime", StartTime)
+            _init_PropertyType(self, kwargs)
 
-    Properties: DashboardProperties = attrib(
-        factory=DashboardProperties,
-        converter=create_object_converter(DashboardProperties),
+    _convert_AnomalyDetectorRange_list = create_object_list_converter(
+        AnomalyDetectorRange
     )
 
+    class AnomalyDetectorConfiguration(_PropertyType):
+        """The Configuration property type for AnomalyDetector in CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Configuration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudwatch-anomalydetector-configuration.html>`_
+        """
+
+        __slots__ = ("ExcludedTimeRanges", "MetricTimeZone")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AnomalyDetectorConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"ExcludedTimeRanges": _convert_AnomalyDetectorRange_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ExcludedTimeRanges=None, MetricTimeZone=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ExcludedTimeRanges",
+                _convert_AnomalyDetectorRange_list(ExcludedTimeRanges),
+            )
+            _setattr("MetricTimeZone", MetricTimeZone)
+            _init_PropertyType(self, kwargs)
+
+    class AnomalyDetectorDimension(_PropertyType):
+        """The Dimension property type for AnomalyDetector in CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Dimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cloudwatch-anomalydetector-dimension.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AnomalyDetectorDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AnomalyDetectorConfiguration = create_object_converter(
+        AnomalyDetectorConfiguration
+    )
+    _convert_AnomalyDetectorDimension_list = create_object_list_converter(
+        AnomalyDetectorDimension
+    )
 
-@attrs(**ATTRSCONFIG)
-class InsightRuleProperties(ResourceProperties):
-    RuleBody = attrib(default=None)
-    RuleName = attrib(default=None)
-    RuleState = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class InsightRule(Resource):
-    """A Insight Rule for CloudWatch.
+    class AnomalyDetectorProperties(_ResourceProperties):
+        __slots__ = ("Configuration", "Dimensions", "MetricName", "Namespace", "Stat")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AnomalyDetectorProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Configuration": _convert_AnomalyDetectorConfiguration,
+                "Dimensions": _convert_AnomalyDetectorDimension_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Configuration=None,
+            Dimensions=None,
+            MetricName=None,
+            Namespace=None,
+            Stat=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Configuration", _convert_AnomalyDetectorConfiguration(Configuration)
+            )
+            _setattr("Dimensions", _convert_AnomalyDetectorDimension_list(Dimensions))
+            _setattr("MetricName", MetricName)
+            _setattr("Namespace", Namespace)
+            _setattr("Stat", Stat)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AnomalyDetectorProperties = create_object_converter(
+        AnomalyDetectorProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for InsightRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudwatch-insightrule.html>`_
-    """
+    class AnomalyDetector(_Resource):
+        """A Anomaly Detector for CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for AnomalyDetector
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudwatch-anomalydetector.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudWatch::AnomalyDetector"
+
+        Properties: AnomalyDetectorProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AnomalyDetector",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AnomalyDetectorProperties},
+            factories={"Properties": AnomalyDetectorProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AnomalyDetectorProperties()
+            _setattr("Properties", _convert_AnomalyDetectorProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        AnomalyDetector,
+        AnomalyDetectorProperties,
+        AnomalyDetectorRange,
+        AnomalyDetectorConfiguration,
+        AnomalyDetectorDimension,
+    )
 
-    RESOURCE_TYPE = "AWS::CloudWatch::InsightRule"
 
-    Properties: InsightRuleProperties = attrib(
-        factory=InsightRuleProperties,
-        converter=create_object_converter(InsightRuleProperties),
-    )
+def _create_Dashboard():
+    class DashboardProperties(_ResourceProperties):
+        __slots__ = ("DashboardBody", "DashboardName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DashboardProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DashboardBody=None, DashboardName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DashboardBody", DashboardBody)
+            _setattr("DashboardName", DashboardName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DashboardProperties = create_object_converter(DashboardProperties)
+
+    class Dashboard(_Resource):
+        """A Dashboard for CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Dashboard
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudwatch-dashboard.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudWatch::Dashboard"
+
+        Properties: DashboardProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Dashboard",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DashboardProperties},
+            factories={"Properties": DashboardProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DashboardProperties()
+            _setattr("Properties", _convert_DashboardProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Dashboard, DashboardProperties
+
+
+def _create_InsightRule():
+    class InsightRuleProperties(_ResourceProperties):
+        __slots__ = ("RuleBody", "RuleName", "RuleState")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InsightRuleProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, RuleBody=None, RuleName=None, RuleState=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RuleBody", RuleBody)
+            _setattr("RuleName", RuleName)
+            _setattr("RuleState", RuleState)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InsightRuleProperties = create_object_converter(InsightRuleProperties)
+
+    class InsightRule(_Resource):
+        """A Insight Rule for CloudWatch.
+
+        See Also:
+            `AWS Cloud Formation documentation for InsightRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cloudwatch-insightrule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CloudWatch::InsightRule"
+
+        Properties: InsightRuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InsightRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InsightRuleProperties},
+            factories={"Properties": InsightRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InsightRuleProperties()
+            _setattr("Properties", _convert_InsightRuleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return InsightRule, InsightRuleProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Alarm": _create_Alarm,
+        "AlarmProperties": _create_Alarm,
+        "AlarmDimension": _create_Alarm,
+        "AlarmMetric": _create_Alarm,
+        "AlarmMetricDataQuery": _create_Alarm,
+        "AlarmMetricStat": _create_Alarm,
+        "AnomalyDetector": _create_AnomalyDetector,
+        "AnomalyDetectorProperties": _create_AnomalyDetector,
+        "AnomalyDetectorConfiguration": _create_AnomalyDetector,
+        "AnomalyDetectorDimension": _create_AnomalyDetector,
+        "AnomalyDetectorRange": _create_AnomalyDetector,
+        "Dashboard": _create_Dashboard,
+        "DashboardProperties": _create_Dashboard,
+        "InsightRule": _create_InsightRule,
+        "InsightRuleProperties": _create_InsightRule,
+    },
+)
@@ -7,107 +7,922 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Project",
     "ProjectProperties",
+    "ProjectArtifacts",
+    "ProjectCloudWatchLogsConfig",
+    "ProjectEnvironment",
+    "ProjectEnvironmentVariable",
+    "ProjectGitSubmodulesConfig",
+    "ProjectLogsConfig",
+    "ProjectProjectCache",
+    "ProjectProjectSourceVersion",
+    "ProjectProjectTriggers",
+    "ProjectRegistryCredential",
+    "ProjectS3LogsConfig",
+    "ProjectSource",
+    "ProjectSourceAuth",
+    "ProjectVpcConfig",
+    "ProjectWebhookFilter",
     "ReportGroup",
     "ReportGroupProperties",
+    "ReportGroupReportExportConfig",
+    "ReportGroupS3ReportExportConfig",
     "SourceCredential",
     "SourceCredentialProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ProjectProperties(ResourceProperties):
-    Artifacts = attrib(default=None)
-    BadgeEnabled = attrib(default=None)
-    Cache = attrib(default=None)
-    Description = attrib(default=None)
-    EncryptionKey = attrib(default=None)
-    Environment = attrib(default=None)
-    LogsConfig = attrib(default=None)
-    Name = attrib(default=None)
-    QueuedTimeoutInMinutes = attrib(default=None)
-    SecondaryArtifacts = attrib(default=None)
-    SecondarySources = attrib(default=None)
-    SecondarySourceVersions = attrib(default=None)
-    ServiceRole = attrib(default=None)
-    Source = attrib(default=None)
-    SourceVersion = attrib(default=None)
-    Tags = attrib(default=None)
-    TimeoutInMinutes = attrib(default=None)
-    Triggers = attrib(default=None)
-    VpcConfig = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Project(Resource):
-    """A Project for CodeBuild.
-
-    See Also:
-        `AWS Cloud Formation documentation for Project
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codebuild-project.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::CodeBuild::Project"
-
-    Properties: ProjectProperties = attrib(
-        factory=ProjectProperties, converter=create_object_converter(ProjectProperties)
+def _create_Project():
+    class ProjectArtifacts(_PropertyType):
+        """The Artifacts property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for Artifacts
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-artifacts.html>`_
+        """
+
+        __slots__ = (
+            "ArtifactIdentifier",
+            "EncryptionDisabled",
+            "Location",
+            "Name",
+            "NamespaceType",
+            "OverrideArtifactName",
+            "Packaging",
+            "Path",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectArtifacts", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ArtifactIdentifier=None,
+            EncryptionDisabled=None,
+            Location=None,
+            Name=None,
+            NamespaceType=None,
+            OverrideArtifactName=None,
+            Packaging=None,
+            Path=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ArtifactIdentifier", ArtifactIdentifier)
+            _setattr("EncryptionDisabled", EncryptionDisabled)
+            _setattr("Location", Location)
+            _setattr("Name", Name)
+            _setattr("NamespaceType", NamespaceType)
+            _setattr("OverrideArtifactName", OverrideArtifactName)
+            _setattr("Packaging", Packaging)
+            _setattr("Path", Path)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class ProjectCloudWatchLogsConfig(_PropertyType):
+        """The Cloud Watch Logs Config property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudWatchLogsConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-cloudwatchlogsconfig.html>`_
+        """
+
+        __slots__ = ("GroupName", "Status", "StreamName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectCloudWatchLogsConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, GroupName=None, Status=None, StreamName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GroupName", GroupName)
+            _setattr("Status", Status)
+            _setattr("StreamName", StreamName)
+            _init_PropertyType(self, kwargs)
+
+    class ProjectEnvironmentVariable(_PropertyType):
+        """The Environment Variable property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for EnvironmentVariable
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-environmentvariable.html>`_
+        """
+
+        __slots__ = ("Name", "Type", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectEnvironmentVariable", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Type=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class ProjectRegistryCredential(_PropertyType):
+        """The Registry Credential property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for RegistryCredential
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-registrycredential.html>`_
+        """
+
+        __slots__ = ("Credential", "CredentialProvider")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectRegistryCredential", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Credential=None, CredentialProvider=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Credential", Credential)
+            _setattr("CredentialProvider", CredentialProvider)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ProjectEnvironmentVariable_list = create_object_list_converter(
+        ProjectEnvironmentVariable
     )
+    _convert_ProjectRegistryCredential = create_object_converter(
+        ProjectRegistryCredential
+    )
+
+    class ProjectEnvironment(_PropertyType):
+        """The Environment property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for Environment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-environment.html>`_
+        """
 
+        __slots__ = (
+            "Certificate",
+            "ComputeType",
+            "EnvironmentVariables",
+            "Image",
+            "ImagePullCredentialsType",
+            "PrivilegedMode",
+            "RegistryCredential",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectEnvironment",
+            _PropertyType,
+            __slots__,
+            converters={
+                "EnvironmentVariables": _convert_ProjectEnvironmentVariable_list,
+                "RegistryCredential": _convert_ProjectRegistryCredential,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ReportGroupProperties(ResourceProperties):
-    ExportConfig = attrib(default=None)
-    Name = attrib(default=None)
-    Type = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            Certificate=None,
+            ComputeType=None,
+            EnvironmentVariables=None,
+            Image=None,
+            ImagePullCredentialsType=None,
+            PrivilegedMode=None,
+            RegistryCredential=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Certificate", Certificate)
+            _setattr("ComputeType", ComputeType)
+            _setattr(
+                "EnvironmentVariables",
+                _convert_ProjectEnvironmentVariable_list(EnvironmentVariables),
+            )
+            _setattr("Image", Image)
+            _setattr("ImagePullCredentialsType", ImagePullCredentialsType)
+            _setattr("PrivilegedMode", PrivilegedMode)
+            _setattr(
+                "RegistryCredential",
+                _convert_ProjectRegistryCredential(RegistryCredential),
+            )
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
 
+    class ProjectGitSubmodulesConfig(_PropertyType):
+        """The Git Submodules Config property type for Project in CodeBuild.
 
-@attrs(**ATTRSCONFIG)
-class ReportGroup(Resource):
-    """A Report Group for CodeBuild.
+        See Also:
+            `AWS Cloud Formation documentation for GitSubmodulesConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-gitsubmodulesconfig.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for ReportGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codebuild-reportgroup.html>`_
-    """
+        __slots__ = ("FetchSubmodules",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectGitSubmodulesConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CodeBuild::ReportGroup"
+        def __init__(self, *, FetchSubmodules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FetchSubmodules", FetchSubmodules)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ReportGroupProperties = attrib(
-        factory=ReportGroupProperties,
-        converter=create_object_converter(ReportGroupProperties),
+    class ProjectS3LogsConfig(_PropertyType):
+        """The S3 Logs Config property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3LogsConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-s3logsconfig.html>`_
+        """
+
+        __slots__ = ("EncryptionDisabled", "Location", "Status")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectS3LogsConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, EncryptionDisabled=None, Location=None, Status=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EncryptionDisabled", EncryptionDisabled)
+            _setattr("Location", Location)
+            _setattr("Status", Status)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ProjectCloudWatchLogsConfig = create_object_converter(
+        ProjectCloudWatchLogsConfig
     )
+    _convert_ProjectS3LogsConfig = create_object_converter(ProjectS3LogsConfig)
+
+    class ProjectLogsConfig(_PropertyType):
+        """The Logs Config property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for LogsConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-logsconfig.html>`_
+        """
 
+        __slots__ = ("CloudWatchLogs", "S3Logs")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectLogsConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudWatchLogs": _convert_ProjectCloudWatchLogsConfig,
+                "S3Logs": _convert_ProjectS3LogsConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class SourceCredentialProperties(ResourceProperties):
-    AuthType = attrib(default=None)
-    ServerType = attrib(default=None)
-    Token = attrib(default=None)
-    Username = attrib(default=None)
+        def __init__(self, *, CloudWatchLogs=None, S3Logs=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudWatchLogs", _convert_ProjectCloudWatchLogsConfig(CloudWatchLogs)
+            )
+            _setattr("S3Logs", _convert_ProjectS3LogsConfig(S3Logs))
+            _init_PropertyType(self, kwargs)
 
+    class ProjectProjectCache(_PropertyType):
+        """The Project Cache property type for Project in CodeBuild.
 
-@attrs(**ATTRSCONFIG)
-class SourceCredential(Resource):
-    """A Source Credential for CodeBuild.
+        See Also:
+            `AWS Cloud Formation documentation for ProjectCache
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-projectcache.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for SourceCredential
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codebuild-sourcecredential.html>`_
-    """
+        __slots__ = ("Location", "Modes", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectProjectCache", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CodeBuild::SourceCredential"
+        def __init__(self, *, Location=None, Modes=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Location", Location)
+            _setattr("Modes", Modes)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
 
-    Properties: SourceCredentialProperties = attrib(
-        factory=SourceCredentialProperties,
-        converter=create_object_converter(SourceCredentialProperties),
+    class ProjectProjectSourceVersion(_PropertyType):
+        """The Project Source Version property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProjectSourceVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-projectsourceversion.html>`_
+        """
+
+        __slots__ = ("SourceIdentifier", "SourceVersion")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectProjectSourceVersion", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, SourceIdentifier=None, SourceVersion=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SourceIdentifier", SourceIdentifier)
+            _setattr("SourceVersion", SourceVersion)
+            _init_PropertyType(self, kwargs)
+
+    class ProjectProjectTriggers(_PropertyType):
+        """The Project Triggers property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProjectTriggers
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-projecttriggers.html>`_
+        """
+
+        __slots__ = ("FilterGroups", "Webhook")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectProjectTriggers", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FilterGroups=None, Webhook=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FilterGroups", FilterGroups)
+            _setattr("Webhook", Webhook)
+            _init_PropertyType(self, kwargs)
+
+    class ProjectSourceAuth(_PropertyType):
+        """The Source Auth property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for SourceAuth
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-sourceauth.html>`_
+        """
+
+        __slots__ = ("Resource", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectSourceAuth", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Resource=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Resource", Resource)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ProjectSourceAuth = create_object_converter(ProjectSourceAuth)
+    _convert_ProjectGitSubmodulesConfig = create_object_converter(
+        ProjectGitSubmodulesConfig
     )
+
+    class ProjectSource(_PropertyType):
+        """The Source property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for Source
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-source.html>`_
+        """
+
+        __slots__ = (
+            "Auth",
+            "BuildSpec",
+            "GitCloneDepth",
+            "GitSubmodulesConfig",
+            "InsecureSsl",
+            "Location",
+            "ReportBuildStatus",
+            "SourceIdentifier",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectSource",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Auth": _convert_ProjectSourceAuth,
+                "GitSubmodulesConfig": _convert_ProjectGitSubmodulesConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Auth=None,
+            BuildSpec=None,
+            GitCloneDepth=None,
+            GitSubmodulesConfig=None,
+            InsecureSsl=None,
+            Location=None,
+            ReportBuildStatus=None,
+            SourceIdentifier=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Auth", _convert_ProjectSourceAuth(Auth))
+            _setattr("BuildSpec", BuildSpec)
+            _setattr("GitCloneDepth", GitCloneDepth)
+            _setattr(
+                "GitSubmodulesConfig",
+                _convert_ProjectGitSubmodulesConfig(GitSubmodulesConfig),
+            )
+            _setattr("InsecureSsl", InsecureSsl)
+            _setattr("Location", Location)
+            _setattr("ReportBuildStatus", ReportBuildStatus)
+            _setattr("SourceIdentifier", SourceIdentifier)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class ProjectVpcConfig(_PropertyType):
+        """The Vpc Config property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for VpcConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-vpcconfig.html>`_
+        """
+
+        __slots__ = ("SecurityGroupIds", "Subnets", "VpcId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectVpcConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, SecurityGroupIds=None, Subnets=None, VpcId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("Subnets", Subnets)
+            _setattr("VpcId", VpcId)
+            _init_PropertyType(self, kwargs)
+
+    class ProjectWebhookFilter(_PropertyType):
+        """The Webhook Filter property type for Project in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for WebhookFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-project-webhookfilter.html>`_
+        """
+
+        __slots__ = ("ExcludeMatchedPattern", "Pattern", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectWebhookFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ExcludeMatchedPattern=None, Pattern=None, Type=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExcludeMatchedPattern", ExcludeMatchedPattern)
+            _setattr("Pattern", Pattern)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ProjectArtifacts = create_object_converter(ProjectArtifacts)
+    _convert_ProjectProjectCache = create_object_converter(ProjectProjectCache)
+    _convert_ProjectEnvironment = create_object_converter(ProjectEnvironment)
+    _convert_ProjectLogsConfig = create_object_converter(ProjectLogsConfig)
+    _convert_ProjectArtifacts_list = create_object_list_converter(ProjectArtifacts)
+    _convert_ProjectSource_list = create_object_list_converter(ProjectSource)
+    _convert_ProjectProjectSourceVersion_list = create_object_list_converter(
+        ProjectProjectSourceVersion
+    )
+    _convert_ProjectSource = create_object_converter(ProjectSource)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_ProjectProjectTriggers = create_object_converter(ProjectProjectTriggers)
+    _convert_ProjectVpcConfig = create_object_converter(ProjectVpcConfig)
+
+    class ProjectProperties(_ResourceProperties):
+        __slots__ = (
+            "Artifacts",
+            "BadgeEnabled",
+            "Cache",
+            "Description",
+            "EncryptionKey",
+            "Environment",
+            "LogsConfig",
+            "Name",
+            "QueuedTimeoutInMinutes",
+            "SecondaryArtifacts",
+            "SecondarySources",
+            "SecondarySourceVersions",
+            "ServiceRole",
+            "Source",
+            "SourceVersion",
+            "Tags",
+            "TimeoutInMinutes",
+            "Triggers",
+            "VpcConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Artifacts": _convert_ProjectArtifacts,
+                "Cache": _convert_ProjectProjectCache,
+                "Environment": _convert_ProjectEnvironment,
+                "LogsConfig": _convert_ProjectLogsConfig,
+                "SecondaryArtifacts": _convert_ProjectArtifacts_list,
+                "SecondarySources": _convert_ProjectSource_list,
+                "SecondarySourceVersions": _convert_ProjectProjectSourceVersion_list,
+                "Source": _convert_ProjectSource,
+                "Tags": _convert_Tag_list,
+                "Triggers": _convert_ProjectProjectTriggers,
+                "VpcConfig": _convert_ProjectVpcConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Artifacts=None,
+            BadgeEnabled=None,
+            Cache=None,
+            Description=None,
+            EncryptionKey=None,
+            Environment=None,
+            LogsConfig=None,
+            Name=None,
+            QueuedTimeoutInMinutes=None,
+            SecondaryArtifacts=None,
+            SecondarySources=None,
+            SecondarySourceVersions=None,
+            ServiceRole=None,
+            Source=None,
+            SourceVersion=None,
+            Tags=None,
+            TimeoutInMinutes=None,
+            Triggers=None,
+            VpcConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Artifacts", _convert_ProjectArtifacts(Artifacts))
+            _setattr("BadgeEnabled", BadgeEnabled)
+            _setattr("Cache", _convert_ProjectProjectCache(Cache))
+            _setattr("Description", Description)
+            _setattr("EncryptionKey", EncryptionKey)
+            _setattr("Environment", _convert_ProjectEnvironment(Environment))
+            _setattr("LogsConfig", _convert_ProjectLogsConfig(LogsConfig))
+            _setattr("Name", Name)
+            _setattr("QueuedTimeoutInMinutes", QueuedTimeoutInMinutes)
+            _setattr(
+                "SecondaryArtifacts", _convert_ProjectArtifacts_list(SecondaryArtifacts)
+            )
+            _setattr("SecondarySources", _convert_ProjectSource_list(SecondarySources))
+            _setattr(
+                "SecondarySourceVersions",
+                _convert_ProjectProjectSourceVersion_list(SecondarySourceVersions),
+            )
+            _setattr("ServiceRole", ServiceRole)
+            _setattr("Source", _convert_ProjectSource(Source))
+            _setattr("SourceVersion", SourceVersion)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TimeoutInMinutes", TimeoutInMinutes)
+            _setattr("Triggers", _convert_ProjectProjectTriggers(Triggers))
+            _setattr("VpcConfig", _convert_ProjectVpcConfig(VpcConfig))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ProjectProperties = create_object_converter(ProjectProperties)
+
+    class Project(_Resource):
+        """A Project for CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for Project
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codebuild-project.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodeBuild::Project"
+
+        Properties: ProjectProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Project",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ProjectProperties},
+            factories={"Properties": ProjectProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ProjectProperties()
+            _setattr("Properties", _convert_ProjectProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Project,
+        ProjectProperties,
+        ProjectArtifacts,
+        ProjectCloudWatchLogsConfig,
+        ProjectEnvironmentVariable,
+        ProjectRegistryCredential,
+        ProjectEnvironment,
+        ProjectGitSubmodulesConfig,
+        ProjectS3LogsConfig,
+        ProjectLogsConfig,
+        ProjectProjectCache,
+        ProjectProjectSourceVersion,
+        ProjectProjectTriggers,
+        ProjectSourceAuth,
+        ProjectSource,
+        ProjectVpcConfig,
+        ProjectWebhookFilter,
+    )
+
+
+def _create_ReportGroup():
+    class ReportGroupS3ReportExportConfig(_PropertyType):
+        """The S3 Report Export Config property type for ReportGroup in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3ReportExportConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-reportgroup-s3reportexportconfig.html>`_
+        """
+
+        __slots__ = (
+            "Bucket",
+            "EncryptionDisabled",
+            "EncryptionKey",
+            "Packaging",
+            "Path",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReportGroupS3ReportExportConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Bucket=None,
+            EncryptionDisabled=None,
+            EncryptionKey=None,
+            Packaging=None,
+            Path=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("EncryptionDisabled", EncryptionDisabled)
+            _setattr("EncryptionKey", EncryptionKey)
+            _setattr("Packaging", Packaging)
+            _setattr("Path", Path)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ReportGroupS3ReportExportConfig = create_object_converter(
+        ReportGroupS3ReportExportConfig
+    )
+
+    class ReportGroupReportExportConfig(_PropertyType):
+        """The Report Export Config property type for ReportGroup in CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReportExportConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codebuild-reportgroup-reportexportconfig.html>`_
+        """
+
+        __slots__ = ("ExportConfigType", "S3Destination")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReportGroupReportExportConfig",
+            _PropertyType,
+            __slots__,
+            converters={"S3Destination": _convert_ReportGroupS3ReportExportConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ExportConfigType=None, S3Destination=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExportConfigType", ExportConfigType)
+            _setattr(
+                "S3Destination", _convert_ReportGroupS3ReportExportConfig(S3Destination)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ReportGroupReportExportConfig = create_object_converter(
+        ReportGroupReportExportConfig
+    )
+
+    class ReportGroupProperties(_ResourceProperties):
+        __slots__ = ("ExportConfig", "Name", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReportGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"ExportConfig": _convert_ReportGroupReportExportConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ExportConfig=None, Name=None, Type=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ExportConfig", _convert_ReportGroupReportExportConfig(ExportConfig)
+            )
+            _setattr("Name", Name)
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ReportGroupProperties = create_object_converter(ReportGroupProperties)
+
+    class ReportGroup(_Resource):
+        """A Report Group for CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReportGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codebuild-reportgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodeBuild::ReportGroup"
+
+        Properties: ReportGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReportGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ReportGroupProperties},
+            factories={"Properties": ReportGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ReportGroupProperties()
+            _setattr("Properties", _convert_ReportGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ReportGroup,
+        ReportGroupProperties,
+        ReportGroupS3ReportExportConfig,
+        ReportGroupReportExportConfig,
+    )
+
+
+def _create_SourceCredential():
+    class SourceCredentialProperties(_ResourceProperties):
+        __slots__ = ("AuthType", "ServerType", "Token", "Username")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SourceCredentialProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AuthType=None, ServerType=None, Token=None, Username=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AuthType", AuthType)
+            _setattr("ServerType", ServerType)
+            _setattr("Token", Token)
+            _setattr("Username", Username)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SourceCredentialProperties = create_object_converter(
+        SourceCredentialProperties
+    )
+
+    class SourceCredential(_Resource):
+        """A Source Credential for CodeBuild.
+
+        See Also:
+            `AWS Cloud Formation documentation for SourceCredential
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codebuild-sourcecredential.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodeBuild::SourceCredential"
+
+        Properties: SourceCredentialProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SourceCredential",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SourceCredentialProperties},
+            factories={"Properties": SourceCredentialProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SourceCredentialProperties()
+            _setattr("Properties", _convert_SourceCredentialProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SourceCredential, SourceCredentialProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Project": _create_Project,
+        "ProjectProperties": _create_Project,
+        "ProjectArtifacts": _create_Project,
+        "ProjectCloudWatchLogsConfig": _create_Project,
+        "ProjectEnvironment": _create_Project,
+        "ProjectEnvironmentVariable": _create_Project,
+        "ProjectGitSubmodulesConfig": _create_Project,
+        "ProjectLogsConfig": _create_Project,
+        "ProjectProjectCache": _create_Project,
+        "ProjectProjectSourceVersion": _create_Project,
+        "ProjectProjectTriggers": _create_Project,
+        "ProjectRegistryCredential": _create_Project,
+        "ProjectS3LogsConfig": _create_Project,
+        "ProjectSource": _create_Project,
+        "ProjectSourceAuth": _create_Project,
+        "ProjectVpcConfig": _create_Project,
+        "ProjectWebhookFilter": _create_Project,
+        "ReportGroup": _create_ReportGroup,
+        "ReportGroupProperties": _create_ReportGroup,
+        "ReportGroupReportExportConfig": _create_ReportGroup,
+        "ReportGroupS3ReportExportConfig": _create_ReportGroup,
+        "SourceCredential": _create_SourceCredential,
+        "SourceCredentialProperties": _create_SourceCredential,
+    },
+)
@@ -7,38 +7,214 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Repository", "RepositoryProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Repository",
+    "RepositoryProperties",
+    "RepositoryCode",
+    "RepositoryRepositoryTrigger",
+    "RepositoryS3",
+]
 
-@attrs(**ATTRSCONFIG)
-class RepositoryProperties(ResourceProperties):
-    Code = attrib(default=None)
-    RepositoryDescription = attrib(default=None)
-    RepositoryName = attrib(default=None)
-    Tags = attrib(default=None)
-    Triggers = attrib(default=None)
 
+def _create_Repository():
+    class RepositoryS3(_PropertyType):
+        """The S3 property type for Repository in CodeCommit.
 
-@attrs(**ATTRSCONFIG)
-class Repository(Resource):
-    """A Repository for CodeCommit.
+        See Also:
+            `AWS Cloud Formation documentation for S3
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codecommit-repository-s3.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Repository
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codecommit-repository.html>`_
-    """
+        __slots__ = ("Bucket", "Key", "ObjectVersion")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RepositoryS3", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CodeCommit::Repository"
+        def __init__(
+            self, *, Bucket=None, Key=None, ObjectVersion=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("Key", Key)
+            _setattr("ObjectVersion", ObjectVersion)
+            _init_PropertyType(self, kwargs)
 
-    Properties: RepositoryProperties = attrib(
-        factory=RepositoryProperties,
-        converter=create_object_converter(RepositoryProperties),
+    _convert_RepositoryS3 = create_object_converter(RepositoryS3)
+
+    class RepositoryCode(_PropertyType):
+        """The Code property type for Repository in CodeCommit.
+
+        See Also:
+            `AWS Cloud Formation documentation for Code
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codecommit-repository-code.html>`_
+        """
+
+        __slots__ = ("S3",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RepositoryCode",
+            _PropertyType,
+            __slots__,
+            converters={"S3": _convert_RepositoryS3},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, S3=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("S3", _convert_RepositoryS3(S3))
+            _init_PropertyType(self, kwargs)
+
+    class RepositoryRepositoryTrigger(_PropertyType):
+        """The Repository Trigger property type for Repository in CodeCommit.
+
+        See Also:
+            `AWS Cloud Formation documentation for RepositoryTrigger
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codecommit-repository-repositorytrigger.html>`_
+        """
+
+        __slots__ = ("Branches", "CustomData", "DestinationArn", "Events", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RepositoryRepositoryTrigger", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Branches=None,
+            CustomData=None,
+            DestinationArn=None,
+            Events=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Branches", Branches)
+            _setattr("CustomData", CustomData)
+            _setattr("DestinationArn", DestinationArn)
+            _setattr("Events", Events)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RepositoryCode = create_object_converter(RepositoryCode)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_RepositoryRepositoryTrigger_list = create_object_list_converter(
+        RepositoryRepositoryTrigger
+    )
+
+    class RepositoryProperties(_ResourceProperties):
+        __slots__ = (
+            "Code",
+            "RepositoryDescription",
+            "RepositoryName",
+            "Tags",
+            "Triggers",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RepositoryProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Code": _convert_RepositoryCode,
+                "Tags": _convert_Tag_list,
+                "Triggers": _convert_RepositoryRepositoryTrigger_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Code=None,
+            RepositoryDescription=None,
+            RepositoryName=None,
+            Tags=None,
+            Triggers=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Code", _convert_RepositoryCode(Code))
+            _setattr("RepositoryDescription", RepositoryDescription)
+            _setattr("RepositoryName", RepositoryName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Triggers", _convert_RepositoryRepositoryTrigger_list(Triggers))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RepositoryProperties = create_object_converter(RepositoryProperties)
+
+    class Repository(_Resource):
+        """A Repository for CodeCommit.
+
+        See Also:
+            `AWS Cloud Formation documentation for Repository
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codecommit-repository.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodeCommit::Repository"
+
+        Properties: RepositoryProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Repository",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RepositoryProperties},
+            factories={"Properties": RepositoryProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RepositoryProperties()
+            _setattr("Properties", _convert_RepositoryProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Repository,
+        RepositoryProperties,
+        RepositoryS3,
+        RepositoryCode,
+        RepositoryRepositoryTrigger,
     )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Repository": _create_Repository,
+        "RepositoryProperties": _create_Repository,
+        "RepositoryCode": _create_Repository,
+        "RepositoryRepositoryTrigger": _create_Repository,
+        "RepositoryS3": _create_Repository,
+    },
+)
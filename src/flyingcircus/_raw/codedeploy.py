@@ -7,101 +7,936 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Application",
     "ApplicationProperties",
     "DeploymentConfig",
     "DeploymentConfigProperties",
+    "DeploymentConfigMinimumHealthyHosts",
     "DeploymentGroup",
     "DeploymentGroupProperties",
+    "DeploymentGroupAlarm",
+    "DeploymentGroupAlarmConfiguration",
+    "DeploymentGroupAutoRollbackConfiguration",
+    "DeploymentGroupDeployment",
+    "DeploymentGroupDeploymentStyle",
+    "DeploymentGroupEC2TagFilter",
+    "DeploymentGroupEC2TagSet",
+    "DeploymentGroupEC2TagSetListObject",
+    "DeploymentGroupELBInfo",
+    "DeploymentGroupGitHubLocation",
+    "DeploymentGroupLoadBalancerInfo",
+    "DeploymentGroupOnPremisesTagSet",
+    "DeploymentGroupOnPremisesTagSetListObject",
+    "DeploymentGroupRevisionLocation",
+    "DeploymentGroupS3Location",
+    "DeploymentGroupTagFilter",
+    "DeploymentGroupTargetGroupInfo",
+    "DeploymentGroupTriggerConfig",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ApplicationProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    ComputePlatform = attrib(default=None)
+def _create_Application():
+    class ApplicationProperties(_ResourceProperties):
+        __slots__ = ("ApplicationName", "ComputePlatform")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApplicationName=None, ComputePlatform=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("ComputePlatform", ComputePlatform)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationProperties = create_object_converter(ApplicationProperties)
+
+    class Application(_Resource):
+        """A Application for CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for Application
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codedeploy-application.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodeDeploy::Application"
+
+        Properties: ApplicationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Application",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApplicationProperties},
+            factories={"Properties": ApplicationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationProperties()
+            _setattr("Properties", _convert_ApplicationProperties(Properties))
+            _init_Resource(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Application(Resource):
-    """A Application for CodeDeploy.
+    return Application, ApplicationProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for Application
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codedeploy-application.html>`_
-    """
 
-    RESOURCE_TYPE = "AWS::CodeDeploy::Application"
+def _create_DeploymentConfig():
+    class DeploymentConfigMinimumHealthyHosts(_PropertyType):
+        """The Minimum Healthy Hosts property type for DeploymentConfig in CodeDeploy.
 
-    Properties: ApplicationProperties = attrib(
-        factory=ApplicationProperties,
-        converter=create_object_converter(ApplicationProperties),
+        See Also:
+            `AWS Cloud Formation documentation for MinimumHealthyHosts
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentconfig-minimumhealthyhosts.html>`_
+        """
+
+        __slots__ = ("Type", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentConfigMinimumHealthyHosts", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Type=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentConfigMinimumHealthyHosts = create_object_converter(
+        DeploymentConfigMinimumHealthyHosts
+    )
+
+    class DeploymentConfigProperties(_ResourceProperties):
+        __slots__ = ("DeploymentConfigName", "MinimumHealthyHosts")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentConfigProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "MinimumHealthyHosts": _convert_DeploymentConfigMinimumHealthyHosts
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeploymentConfigName=None, MinimumHealthyHosts=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeploymentConfigName", DeploymentConfigName)
+            _setattr(
+                "MinimumHealthyHosts",
+                _convert_DeploymentConfigMinimumHealthyHosts(MinimumHealthyHosts),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DeploymentConfigProperties = create_object_converter(
+        DeploymentConfigProperties
     )
 
+    class DeploymentConfig(_Resource):
+        """A Deployment Config for CodeDeploy.
 
-@attrs(**ATTRSCONFIG)
-class DeploymentConfigProperties(ResourceProperties):
-    DeploymentConfigName = attrib(default=None)
-    MinimumHealthyHosts = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for DeploymentConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codedeploy-deploymentconfig.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::CodeDeploy::DeploymentConfig"
 
-@attrs(**ATTRSCONFIG)
-class DeploymentConfig(Resource):
-    """A Deployment Config for CodeDeploy.
+        Properties: DeploymentConfigProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for DeploymentConfig
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codedeploy-deploymentconfig.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentConfig",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DeploymentConfigProperties},
+            factories={"Properties": DeploymentConfigProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CodeDeploy::DeploymentConfig"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DeploymentConfigProperties()
+            _setattr("Properties", _convert_DeploymentConfigProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    Properties: DeploymentConfigProperties = attrib(
-        factory=DeploymentConfigProperties,
-        converter=create_object_converter(DeploymentConfigProperties),
+    return (
+        DeploymentConfig,
+        DeploymentConfigProperties,
+        DeploymentConfigMinimumHealthyHosts,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class DeploymentGroupProperties(ResourceProperties):
-    AlarmConfiguration = attrib(default=None)
-    ApplicationName = attrib(default=None)
-    AutoRollbackConfiguration = attrib(default=None)
-    AutoScalingGroups = attrib(default=None)
-    Deployment = attrib(default=None)
-    DeploymentConfigName = attrib(default=None)
-    DeploymentGroupName = attrib(default=None)
-    DeploymentStyle = attrib(default=None)
-    Ec2TagFilters = attrib(default=None)
-    Ec2TagSet = attrib(default=None)
-    LoadBalancerInfo = attrib(default=None)
-    OnPremisesInstanceTagFilters = attrib(default=None)
-    OnPremisesTagSet = attrib(default=None)
-    ServiceRoleArn = attrib(default=None)
-    TriggerConfigurations = attrib(default=None)
+def _create_DeploymentGroup():
+    class DeploymentGroupAlarm(_PropertyType):
+        """The Alarm property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for Alarm
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-alarm.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupAlarm", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentGroupAlarm_list = create_object_list_converter(
+        DeploymentGroupAlarm
+    )
+
+    class DeploymentGroupAlarmConfiguration(_PropertyType):
+        """The Alarm Configuration property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for AlarmConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-alarmconfiguration.html>`_
+        """
+
+        __slots__ = ("Alarms", "Enabled", "IgnorePollAlarmFailure")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupAlarmConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Alarms": _convert_DeploymentGroupAlarm_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Alarms=None, Enabled=None, IgnorePollAlarmFailure=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Alarms", _convert_DeploymentGroupAlarm_list(Alarms))
+            _setattr("Enabled", Enabled)
+            _setattr("IgnorePollAlarmFailure", IgnorePollAlarmFailure)
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentGroupAutoRollbackConfiguration(_PropertyType):
+        """The Auto Rollback Configuration property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for AutoRollbackConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-autorollbackconfiguration.html>`_
+        """
+
+        __slots__ = ("Enabled", "Events")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupAutoRollbackConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Enabled=None, Events=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr("Events", Events)
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentGroupGitHubLocation(_PropertyType):
+        """The Git Hub Location property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for GitHubLocation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-deployment-revision-githublocation.html>`_
+        """
+
+        __slots__ = ("CommitId", "Repository")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupGitHubLocation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, CommitId=None, Repository=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CommitId", CommitId)
+            _setattr("Repository", Repository)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class DeploymentGroup(Resource):
-    """A Deployment Group for CodeDeploy.
+    class DeploymentGroupS3Location(_PropertyType):
+        """The S3 Location property type for DeploymentGroup in CodeDeploy.
 
-    See Also:
-        `AWS Cloud Formation documentation for DeploymentGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codedeploy-deploymentgroup.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for S3Location
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-deployment-revision-s3location.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::CodeDeploy::DeploymentGroup"
+        __slots__ = ("Bucket", "BundleType", "ETag", "Key", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupS3Location", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: DeploymentGroupProperties = attrib(
-        factory=DeploymentGroupProperties,
-        converter=create_object_converter(DeploymentGroupProperties),
+        def __init__(
+            self,
+            *,
+            Bucket=None,
+            BundleType=None,
+            ETag=None,
+            Key=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("BundleType", BundleType)
+            _setattr("ETag", ETag)
+            _setattr("Key", Key)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentGroupGitHubLocation = create_object_converter(
+        DeploymentGroupGitHubLocation
+    )
+    _convert_DeploymentGroupS3Location = create_object_converter(
+        DeploymentGroupS3Location
+    )
+
+    class DeploymentGroupRevisionLocation(_PropertyType):
+        """The Revision Location property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for RevisionLocation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-deployment-revision.html>`_
+        """
+
+        __slots__ = ("GitHubLocation", "RevisionType", "S3Location")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupRevisionLocation",
+            _PropertyType,
+            __slots__,
+            converters={
+                "GitHubLocation": _convert_DeploymentGroupGitHubLocation,
+                "S3Location": _convert_DeploymentGroupS3Location,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, GitHubLocation=None, RevisionType=None, S3Location=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "GitHubLocation", _convert_DeploymentGroupGitHubLocation(GitHubLocation)
+            )
+            _setattr("RevisionType", RevisionType)
+            _setattr("S3Location", _convert_DeploymentGroupS3Location(S3Location))
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentGroupRevisionLocation = create_object_converter(
+        DeploymentGroupRevisionLocation
+    )
+
+    class DeploymentGroupDeployment(_PropertyType):
+        """The Deployment property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for Deployment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-deployment.html>`_
+        """
+
+        __slots__ = ("Description", "IgnoreApplicationStopFailures", "Revision")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupDeployment",
+            _PropertyType,
+            __slots__,
+            converters={"Revision": _convert_DeploymentGroupRevisionLocation},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            IgnoreApplicationStopFailures=None,
+            Revision=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("IgnoreApplicationStopFailures", IgnoreApplicationStopFailures)
+            _setattr("Revision", _convert_DeploymentGroupRevisionLocation(Revision))
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentGroupDeploymentStyle(_PropertyType):
+        """The Deployment Style property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeploymentStyle
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-deploymentstyle.html>`_
+        """
+
+        __slots__ = ("DeploymentOption", "DeploymentType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupDeploymentStyle", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeploymentOption=None, DeploymentType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeploymentOption", DeploymentOption)
+            _setattr("DeploymentType", DeploymentType)
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentGroupEC2TagFilter(_PropertyType):
+        """The Ec2 Tag Filter property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for EC2TagFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-ec2tagfilter.html>`_
+        """
+
+        __slots__ = ("Key", "Type", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupEC2TagFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Type=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentGroupEC2TagFilter_list = create_object_list_converter(
+        DeploymentGroupEC2TagFilter
     )
+
+    class DeploymentGroupEC2TagSetListObject(_PropertyType):
+        """The Ec2 Tag Set List Object property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for EC2TagSetListObject
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-ec2tagsetlistobject.html>`_
+        """
+
+        __slots__ = ("Ec2TagGroup",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupEC2TagSetListObject",
+            _PropertyType,
+            __slots__,
+            converters={"Ec2TagGroup": _convert_DeploymentGroupEC2TagFilter_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Ec2TagGroup=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Ec2TagGroup", _convert_DeploymentGroupEC2TagFilter_list(Ec2TagGroup)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentGroupEC2TagSetListObject_list = create_object_list_converter(
+        DeploymentGroupEC2TagSetListObject
+    )
+
+    class DeploymentGroupEC2TagSet(_PropertyType):
+        """The Ec2 Tag Set property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for EC2TagSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-ec2tagset.html>`_
+        """
+
+        __slots__ = ("Ec2TagSetList",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupEC2TagSet",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Ec2TagSetList": _convert_DeploymentGroupEC2TagSetListObject_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Ec2TagSetList=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Ec2TagSetList",
+                _convert_DeploymentGroupEC2TagSetListObject_list(Ec2TagSetList),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentGroupELBInfo(_PropertyType):
+        """The Elb Info property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for ELBInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-elbinfo.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupELBInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentGroupTargetGroupInfo(_PropertyType):
+        """The Target Group Info property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for TargetGroupInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-targetgroupinfo.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupTargetGroupInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentGroupELBInfo_list = create_object_list_converter(
+        DeploymentGroupELBInfo
+    )
+    _convert_DeploymentGroupTargetGroupInfo_list = create_object_list_converter(
+        DeploymentGroupTargetGroupInfo
+    )
+
+    class DeploymentGroupLoadBalancerInfo(_PropertyType):
+        """The Load Balancer Info property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoadBalancerInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-loadbalancerinfo.html>`_
+        """
+
+        __slots__ = ("ElbInfoList", "TargetGroupInfoList")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupLoadBalancerInfo",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ElbInfoList": _convert_DeploymentGroupELBInfo_list,
+                "TargetGroupInfoList": _convert_DeploymentGroupTargetGroupInfo_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ElbInfoList=None, TargetGroupInfoList=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ElbInfoList", _convert_DeploymentGroupELBInfo_list(ElbInfoList))
+            _setattr(
+                "TargetGroupInfoList",
+                _convert_DeploymentGroupTargetGroupInfo_list(TargetGroupInfoList),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentGroupTagFilter(_PropertyType):
+        """The Tag Filter property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-tagfilter.html>`_
+        """
+
+        __slots__ = ("Key", "Type", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupTagFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Type=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentGroupTagFilter_list = create_object_list_converter(
+        DeploymentGroupTagFilter
+    )
+
+    class DeploymentGroupOnPremisesTagSetListObject(_PropertyType):
+        """The On Premises Tag Set List Object property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for OnPremisesTagSetListObject
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-onpremisestagsetlistobject.html>`_
+        """
+
+        __slots__ = ("OnPremisesTagGroup",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupOnPremisesTagSetListObject",
+            _PropertyType,
+            __slots__,
+            converters={"OnPremisesTagGroup": _convert_DeploymentGroupTagFilter_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, OnPremisesTagGroup=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "OnPremisesTagGroup",
+                _convert_DeploymentGroupTagFilter_list(OnPremisesTagGroup),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentGroupOnPremisesTagSetListObject_list = (
+        create_object_list_converter(DeploymentGroupOnPremisesTagSetListObject)
+    )
+
+    class DeploymentGroupOnPremisesTagSet(_PropertyType):
+        """The On Premises Tag Set property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for OnPremisesTagSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-onpremisestagset.html>`_
+        """
+
+        __slots__ = ("OnPremisesTagSetList",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupOnPremisesTagSet",
+            _PropertyType,
+            __slots__,
+            converters={
+                "OnPremisesTagSetList": _convert_DeploymentGroupOnPremisesTagSetListObject_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, OnPremisesTagSetList=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "OnPremisesTagSetList",
+                _convert_DeploymentGroupOnPremisesTagSetListObject_list(
+                    OnPremisesTagSetList
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class DeploymentGroupTriggerConfig(_PropertyType):
+        """The Trigger Config property type for DeploymentGroup in CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for TriggerConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codedeploy-deploymentgroup-triggerconfig.html>`_
+        """
+
+        __slots__ = ("TriggerEvents", "TriggerName", "TriggerTargetArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupTriggerConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            TriggerEvents=None,
+            TriggerName=None,
+            TriggerTargetArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TriggerEvents", TriggerEvents)
+            _setattr("TriggerName", TriggerName)
+            _setattr("TriggerTargetArn", TriggerTargetArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeploymentGroupAlarmConfiguration = create_object_converter(
+        DeploymentGroupAlarmConfiguration
+    )
+    _convert_DeploymentGroupAutoRollbackConfiguration = create_object_converter(
+        DeploymentGroupAutoRollbackConfiguration
+    )
+    _convert_DeploymentGroupDeployment = create_object_converter(
+        DeploymentGroupDeployment
+    )
+    _convert_DeploymentGroupDeploymentStyle = create_object_converter(
+        DeploymentGroupDeploymentStyle
+    )
+    _convert_DeploymentGroupEC2TagSet = create_object_converter(
+        DeploymentGroupEC2TagSet
+    )
+    _convert_DeploymentGroupLoadBalancerInfo = create_object_converter(
+        DeploymentGroupLoadBalancerInfo
+    )
+    _convert_DeploymentGroupOnPremisesTagSet = create_object_converter(
+        DeploymentGroupOnPremisesTagSet
+    )
+    _convert_DeploymentGroupTriggerConfig_list = create_object_list_converter(
+        DeploymentGroupTriggerConfig
+    )
+
+    class DeploymentGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "AlarmConfiguration",
+            "ApplicationName",
+            "AutoRollbackConfiguration",
+            "AutoScalingGroups",
+            "Deployment",
+            "DeploymentConfigName",
+            "DeploymentGroupName",
+            "DeploymentStyle",
+            "Ec2TagFilters",
+            "Ec2TagSet",
+            "LoadBalancerInfo",
+            "OnPremisesInstanceTagFilters",
+            "OnPremisesTagSet",
+            "ServiceRoleArn",
+            "TriggerConfigurations",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AlarmConfiguration": _convert_DeploymentGroupAlarmConfiguration,
+                "AutoRollbackConfiguration": _convert_DeploymentGroupAutoRollbackConfiguration,
+                "Deployment": _convert_DeploymentGroupDeployment,
+                "DeploymentStyle": _convert_DeploymentGroupDeploymentStyle,
+                "Ec2TagFilters": _convert_DeploymentGroupEC2TagFilter_list,
+                "Ec2TagSet": _convert_DeploymentGroupEC2TagSet,
+                "LoadBalancerInfo": _convert_DeploymentGroupLoadBalancerInfo,
+                "OnPremisesInstanceTagFilters": _convert_DeploymentGroupTagFilter_list,
+                "OnPremisesTagSet": _convert_DeploymentGroupOnPremisesTagSet,
+                "TriggerConfigurations": _convert_DeploymentGroupTriggerConfig_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AlarmConfiguration=None,
+            ApplicationName=None,
+            AutoRollbackConfiguration=None,
+            AutoScalingGroups=None,
+            Deployment=None,
+            DeploymentConfigName=None,
+            DeploymentGroupName=None,
+            DeploymentStyle=None,
+            Ec2TagFilters=None,
+            Ec2TagSet=None,
+            LoadBalancerInfo=None,
+            OnPremisesInstanceTagFilters=None,
+            OnPremisesTagSet=None,
+            ServiceRoleArn=None,
+            TriggerConfigurations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AlarmConfiguration",
+                _convert_DeploymentGroupAlarmConfiguration(AlarmConfiguration),
+            )
+            _setattr("ApplicationName", ApplicationName)
+            _setattr(
+                "AutoRollbackConfiguration",
+                _convert_DeploymentGroupAutoRollbackConfiguration(
+                    AutoRollbackConfiguration
+                ),
+            )
+            _setattr("AutoScalingGroups", AutoScalingGroups)
+            _setattr("Deployment", _convert_DeploymentGroupDeployment(Deployment))
+            _setattr("DeploymentConfigName", DeploymentConfigName)
+            _setattr("DeploymentGroupName", DeploymentGroupName)
+            _setattr(
+                "DeploymentStyle",
+                _convert_DeploymentGroupDeploymentStyle(DeploymentStyle),
+            )
+            _setattr(
+                "Ec2TagFilters",
+                _convert_DeploymentGroupEC2TagFilter_list(Ec2TagFilters),
+            )
+            _setattr("Ec2TagSet", _convert_DeploymentGroupEC2TagSet(Ec2TagSet))
+            _setattr(
+                "LoadBalancerInfo",
+                _convert_DeploymentGroupLoadBalancerInfo(LoadBalancerInfo),
+            )
+            _setattr(
+                "OnPremisesInstanceTagFilters",
+                _convert_DeploymentGroupTagFilter_list(OnPremisesInstanceTagFilters),
+            )
+            _setattr(
+                "OnPremisesTagSet",
+                _convert_DeploymentGroupOnPremisesTagSet(OnPremisesTagSet),
+            )
+            _setattr("ServiceRoleArn", ServiceRoleArn)
+            _setattr(
+                "TriggerConfigurations",
+                _convert_DeploymentGroupTriggerConfig_list(TriggerConfigurations),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DeploymentGroupProperties = create_object_converter(
+        DeploymentGroupProperties
+    )
+
+    class DeploymentGroup(_Resource):
+        """A Deployment Group for CodeDeploy.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeploymentGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codedeploy-deploymentgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodeDeploy::DeploymentGroup"
+
+        Properties: DeploymentGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeploymentGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DeploymentGroupProperties},
+            factories={"Properties": DeploymentGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DeploymentGroupProperties()
+            _setattr("Properties", _convert_DeploymentGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        DeploymentGroup,
+        DeploymentGroupProperties,
+        DeploymentGroupAlarm,
+        DeploymentGroupAlarmConfiguration,
+        DeploymentGroupAutoRollbackConfiguration,
+        DeploymentGroupGitHubLocation,
+        DeploymentGroupS3Location,
+        DeploymentGroupRevisionLocation,
+        DeploymentGroupDeployment,
+        DeploymentGroupDeploymentStyle,
+        DeploymentGroupEC2TagFilter,
+        DeploymentGroupEC2TagSetListObject,
+        DeploymentGroupEC2TagSet,
+        DeploymentGroupELBInfo,
+        DeploymentGroupTargetGroupInfo,
+        DeploymentGroupLoadBalancerInfo,
+        DeploymentGroupTagFilter,
+        DeploymentGroupOnPremisesTagSetListObject,
+        DeploymentGroupOnPremisesTagSet,
+        DeploymentGroupTriggerConfig,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Application": _create_Application,
+        "ApplicationProperties": _create_Application,
+        "DeploymentConfig": _create_DeploymentConfig,
+        "DeploymentConfigProperties": _create_DeploymentConfig,
+        "DeploymentConfigMinimumHealthyHosts": _create_DeploymentConfig,
+        "DeploymentGroup": _create_DeploymentGroup,
+        "DeploymentGroupProperties": _create_DeploymentGroup,
+        "DeploymentGroupAlarm": _create_DeploymentGroup,
+        "DeploymentGroupAlarmConfiguration": _create_DeploymentGroup,
+        "DeploymentGroupAutoRollbackConfiguration": _create_DeploymentGroup,
+        "DeploymentGroupDeployment": _create_DeploymentGroup,
+        "DeploymentGroupDeploymentStyle": _create_DeploymentGroup,
+        "DeploymentGroupEC2TagFilter": _create_DeploymentGroup,
+        "DeploymentGroupEC2TagSet": _create_DeploymentGroup,
+        "DeploymentGroupEC2TagSetListObject": _create_DeploymentGroup,
+        "DeploymentGroupELBInfo": _create_DeploymentGroup,
+        "DeploymentGroupGitHubLocation": _create_DeploymentGroup,
+        "DeploymentGroupLoadBalancerInfo": _create_DeploymentGroup,
+        "DeploymentGroupOnPremisesTagSet": _create_DeploymentGroup,
+        "DeploymentGroupOnPremisesTagSetListObject": _create_DeploymentGroup,
+        "DeploymentGroupRevisionLocation": _create_DeploymentGroup,
+        "DeploymentGroupS3Location": _create_DeploymentGroup,
+        "DeploymentGroupTagFilter": _create_DeploymentGroup,
+        "DeploymentGroupTargetGroupInfo": _create_DeploymentGroup,
+        "DeploymentGroupTriggerConfig": _create_DeploymentGroup,
+    },
+)
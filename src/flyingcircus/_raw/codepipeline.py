@@ -7,105 +7,856 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "CustomActionType",
     "CustomActionTypeProperties",
+    "CustomActionTypeArtifactDetails",
+    "CustomActionTypeConfigurationProperties",
+    "CustomActionTypeSettings",
     "Pipeline",
     "PipelineProperties",
+    "PipelineActionDeclaration",
+    "PipelineActionTypeId",
+    "PipelineArtifactStore",
+    "PipelineArtifactStoreMap",
+    "PipelineBlockerDeclaration",
+    "PipelineEncryptionKey",
+    "PipelineInputArtifact",
+    "PipelineOutputArtifact",
+    "PipelineStageDeclaration",
+    "PipelineStageTransition",
     "Webhook",
     "WebhookProperties",
+    "WebhookWebhookAuthConfiguration",
+    "WebhookWebhookFilterRule",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class CustomActionTypeProperties(ResourceProperties):
-    Category = attrib(default=None)
-    ConfigurationProperties = attrib(default=None)
-    InputArtifactDetails = attrib(default=None)
-    OutputArtifactDetails = attrib(default=None)
-    Provider = attrib(default=None)
-    Settings = attrib(default=None)
-    Tags = attrib(default=None)
-    Version = attrib(default=None)
+def _create_CustomActionType():
+    class CustomActionTypeArtifactDetails(_PropertyType):
+        """The Artifact Details property type for CustomActionType in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for ArtifactDetails
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-customactiontype-artifactdetails.html>`_
+        """
+
+        __slots__ = ("MaximumCount", "MinimumCount")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CustomActionTypeArtifactDetails", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MaximumCount=None, MinimumCount=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaximumCount", MaximumCount)
+            _setattr("MinimumCount", MinimumCount)
+            _init_PropertyType(self, kwargs)
+
+    class CustomActionTypeConfigurationProperties(_PropertyType):
+        """The Configuration Properties property type for CustomActionType in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-customactiontype-configurationproperties.html>`_
+        """
+
+        __slots__ = (
+            "Description",
+            "Key",
+            "Name",
+            "Queryable",
+            "Required",
+            "Secret",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CustomActionTypeConfigurationProperties", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Key=None,
+            Name=None,
+            Queryable=None,
+            Required=None,
+            Secret=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Key", Key)
+            _setattr("Name", Name)
+            _setattr("Queryable", Queryable)
+            _setattr("Required", Required)
+            _setattr("Secret", Secret)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class CustomActionTypeSettings(_PropertyType):
+        """The Settings property type for CustomActionType in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for Settings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-customactiontype-settings.html>`_
+        """
+
+        __slots__ = (
+            "EntityUrlTemplate",
+            "ExecutionUrlTemplate",
+            "RevisionUrlTemplate",
+            "ThirdPartyConfigurationUrl",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CustomActionTypeSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EntityUrlTemplate=None,
+            ExecutionUrlTemplate=None,
+            RevisionUrlTemplate=None,
+            ThirdPartyConfigurationUrl=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EntityUrlTemplate", EntityUrlTemplate)
+            _setattr("ExecutionUrlTemplate", ExecutionUrlTemplate)
+            _setattr("RevisionUrlTemplate", RevisionUrlTemplate)
+            _setattr("ThirdPartyConfigurationUrl", ThirdPartyConfigurationUrl)
+            _init_PropertyType(self, kwargs)
 
+    _convert_CustomActionTypeConfigurationProperties_list = (
+        create_object_list_converter(CustomActionTypeConfigurationProperties)
+    )
+    _convert_CustomActionTypeArtifactDetails = create_object_converter(
+        CustomActionTypeArtifactDetails
+    )
+    _convert_CustomActionTypeSettings = create_object_converter(
+        CustomActionTypeSettings
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class CustomActionTypeProperties(_ResourceProperties):
+        __slots__ = (
+            "Category",
+            "ConfigurationProperties",
+            "InputArtifactDetails",
+            "OutputArtifactDetails",
+            "Provider",
+            "Settings",
+            "Tags",
+            "Version",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CustomActionTypeProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ConfigurationProperties": _convert_CustomActionTypeConfigurationProperties_list,
+                "InputArtifactDetails": _convert_CustomActionTypeArtifactDetails,
+                "OutputArtifactDetails": _convert_CustomActionTypeArtifactDetails,
+                "Settings": _convert_CustomActionTypeSettings,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Category=None,
+            ConfigurationProperties=None,
+            InputArtifactDetails=None,
+            OutputArtifactDetails=None,
+            Provider=None,
+            Settings=None,
+            Tags=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Category", Category)
+            _setattr(
+                "ConfigurationProperties",
+                _convert_CustomActionTypeConfigurationProperties_list(
+                    ConfigurationProperties
+                ),
+            )
+            _setattr(
+                "InputArtifactDetails",
+                _convert_CustomActionTypeArtifactDetails(InputArtifactDetails),
+            )
+            _setattr(
+                "OutputArtifactDetails",
+                _convert_CustomActionTypeArtifactDetails(OutputArtifactDetails),
+            )
+            _setattr("Provider", Provider)
+            _setattr("Settings", _convert_CustomActionTypeSettings(Settings))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Version", Version)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CustomActionTypeProperties = create_object_converter(
+        CustomActionTypeProperties
+    )
+
+    class CustomActionType(_Resource):
+        """A Custom Action Type for CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomActionType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codepipeline-customactiontype.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class CustomActionType(Resource):
-    """A Custom Action Type for CodePipeline.
+        RESOURCE_TYPE = "AWS::CodePipeline::CustomActionType"
 
-    See Also:
-        `AWS Cloud Formation documentation for CustomActionType
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codepipeline-customactiontype.html>`_
-    """
+        Properties: CustomActionTypeProperties
 
-    RESOURCE_TYPE = "AWS::CodePipeline::CustomActionType"
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CustomActionType",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CustomActionTypeProperties},
+            factories={"Properties": CustomActionTypeProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: CustomActionTypeProperties = attrib(
-        factory=CustomActionTypeProperties,
-        converter=create_object_converter(CustomActionTypeProperties),
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CustomActionTypeProperties()
+            _setattr("Properties", _convert_CustomActionTypeProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        CustomActionType,
+        CustomActionTypeProperties,
+        CustomActionTypeArtifactDetails,
+        CustomActionTypeConfigurationProperties,
+        CustomActionTypeSettings,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class PipelineProperties(ResourceProperties):
-    ArtifactStore = attrib(default=None)
-    ArtifactStores = attrib(default=None)
-    DisableInboundStageTransitions = attrib(default=None)
-    Name = attrib(default=None)
-    RestartExecutionOnUpdate = attrib(default=None)
-    RoleArn = attrib(default=None)
-    Stages = attrib(default=None)
-    Tags = attrib(default=None)
+def _create_Pipeline():
+    class PipelineActionTypeId(_PropertyType):
+        """The Action Type property type for Pipeline in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for ActionTypeId
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-stages-actions-actiontypeid.html>`_
+        """
+
+        __slots__ = ("Category", "Owner", "Provider", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineActionTypeId", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self, *, Category=None, Owner=None, Provider=None, Version=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Category", Category)
+            _setattr("Owner", Owner)
+            _setattr("Provider", Provider)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Pipeline(Resource):
-    """A Pipeline for CodePipeline.
+    class PipelineInputArtifact(_PropertyType):
+        """The Input Artifact property type for Pipeline in CodePipeline.
 
-    See Also:
-        `AWS Cloud Formation documentation for Pipeline
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codepipeline-pipeline.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for InputArtifact
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-stages-actions-inputartifacts.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::CodePipeline::Pipeline"
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineInputArtifact", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: PipelineProperties = attrib(
-        factory=PipelineProperties,
-        converter=create_object_converter(PipelineProperties),
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineOutputArtifact(_PropertyType):
+        """The Output Artifact property type for Pipeline in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for OutputArtifact
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-stages-actions-outputartifacts.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineOutputArtifact", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PipelineActionTypeId = create_object_converter(PipelineActionTypeId)
+    _convert_PipelineInputArtifact_list = create_object_list_converter(
+        PipelineInputArtifact
+    )
+    _convert_PipelineOutputArtifact_list = create_object_list_converter(
+        PipelineOutputArtifact
     )
 
+    class PipelineActionDeclaration(_PropertyType):
+        """The Action Declaration property type for Pipeline in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for ActionDeclaration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-stages-actions.html>`_
+        """
+
+        __slots__ = (
+            "ActionTypeId",
+            "Configuration",
+            "InputArtifacts",
+            "Name",
+            "Namespace",
+            "OutputArtifacts",
+            "Region",
+            "RoleArn",
+            "RunOrder",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineActionDeclaration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ActionTypeId": _convert_PipelineActionTypeId,
+                "InputArtifacts": _convert_PipelineInputArtifact_list,
+                "OutputArtifacts": _convert_PipelineOutputArtifact_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ActionTypeId=None,
+            Configuration=None,
+            InputArtifacts=None,
+            Name=None,
+            Namespace=None,
+            OutputArtifacts=None,
+            Region=None,
+            RoleArn=None,
+            RunOrder=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ActionTypeId", _convert_PipelineActionTypeId(ActionTypeId))
+            _setattr("Configuration", Configuration)
+            _setattr(
+                "InputArtifacts", _convert_PipelineInputArtifact_list(InputArtifacts)
+            )
+            _setattr("Name", Name)
+            _setattr("Namespace", Namespace)
+            _setattr(
+                "OutputArtifacts", _convert_PipelineOutputArtifact_list(OutputArtifacts)
+            )
+            _setattr("Region", Region)
+            _setattr("RoleArn", RoleArn)
+            _setattr("RunOrder", RunOrder)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineEncryptionKey(_PropertyType):
+        """The Encryption Key property type for Pipeline in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionKey
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-artifactstore-encryptionkey.html>`_
+        """
+
+        __slots__ = ("Id", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineEncryptionKey", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class WebhookProperties(ResourceProperties):
-    Authentication = attrib(default=None)
-    AuthenticationConfiguration = attrib(default=None)
-    Filters = attrib(default=None)
-    Name = attrib(default=None)
-    RegisterWithThirdParty = attrib(default=None)
-    TargetAction = attrib(default=None)
-    TargetPipeline = attrib(default=None)
-    TargetPipelineVersion = attrib(default=None)
+        def __init__(self, *, Id=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
 
+    _convert_PipelineEncryptionKey = create_object_converter(PipelineEncryptionKey)
 
-@attrs(**ATTRSCONFIG)
-class Webhook(Resource):
-    """A Webhook for CodePipeline.
+    class PipelineArtifactStore(_PropertyType):
+        """The Artifact Store property type for Pipeline in CodePipeline.
 
-    See Also:
-        `AWS Cloud Formation documentation for Webhook
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codepipeline-webhook.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for ArtifactStore
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-artifactstore.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::CodePipeline::Webhook"
+        __slots__ = ("EncryptionKey", "Location", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineArtifactStore",
+            _PropertyType,
+            __slots__,
+            converters={"EncryptionKey": _convert_PipelineEncryptionKey},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: WebhookProperties = attrib(
-        factory=WebhookProperties, converter=create_object_converter(WebhookProperties)
+        def __init__(
+            self, *, EncryptionKey=None, Location=None, Type=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EncryptionKey", _convert_PipelineEncryptionKey(EncryptionKey))
+            _setattr("Location", Location)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PipelineArtifactStore = create_object_converter(PipelineArtifactStore)
+
+    class PipelineArtifactStoreMap(_PropertyType):
+        """The Artifact Store Map property type for Pipeline in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for ArtifactStoreMap
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-artifactstoremap.html>`_
+        """
+
+        __slots__ = ("ArtifactStore", "Region")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineArtifactStoreMap",
+            _PropertyType,
+            __slots__,
+            converters={"ArtifactStore": _convert_PipelineArtifactStore},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ArtifactStore=None, Region=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ArtifactStore", _convert_PipelineArtifactStore(ArtifactStore))
+            _setattr("Region", Region)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineBlockerDeclaration(_PropertyType):
+        """The Blocker Declaration property type for Pipeline in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for BlockerDeclaration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-stages-blockers.html>`_
+        """
+
+        __slots__ = ("Name", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineBlockerDeclaration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PipelineActionDeclaration_list = create_object_list_converter(
+        PipelineActionDeclaration
+    )
+    _convert_PipelineBlockerDeclaration_list = create_object_list_converter(
+        PipelineBlockerDeclaration
     )
+
+    class PipelineStageDeclaration(_PropertyType):
+        """The Stage Declaration property type for Pipeline in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for StageDeclaration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-stages.html>`_
+        """
+
+        __slots__ = ("Actions", "Blockers", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineStageDeclaration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Actions": _convert_PipelineActionDeclaration_list,
+                "Blockers": _convert_PipelineBlockerDeclaration_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Actions=None, Blockers=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Actions", _convert_PipelineActionDeclaration_list(Actions))
+            _setattr("Blockers", _convert_PipelineBlockerDeclaration_list(Blockers))
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineStageTransition(_PropertyType):
+        """The Stage Transition property type for Pipeline in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for StageTransition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-pipeline-disableinboundstagetransitions.html>`_
+        """
+
+        __slots__ = ("Reason", "StageName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineStageTransition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Reason=None, StageName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Reason", Reason)
+            _setattr("StageName", StageName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PipelineArtifactStoreMap_list = create_object_list_converter(
+        PipelineArtifactStoreMap
+    )
+    _convert_PipelineStageTransition_list = create_object_list_converter(
+        PipelineStageTransition
+    )
+    _convert_PipelineStageDeclaration_list = create_object_list_converter(
+        PipelineStageDeclaration
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class PipelineProperties(_ResourceProperties):
+        __slots__ = (
+            "ArtifactStore",
+            "ArtifactStores",
+            "DisableInboundStageTransitions",
+            "Name",
+            "RestartExecutionOnUpdate",
+            "RoleArn",
+            "Stages",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ArtifactStore": _convert_PipelineArtifactStore,
+                "ArtifactStores": _convert_PipelineArtifactStoreMap_list,
+                "DisableInboundStageTransitions": _convert_PipelineStageTransition_list,
+                "Stages": _convert_PipelineStageDeclaration_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ArtifactStore=None,
+            ArtifactStores=None,
+            DisableInboundStageTransitions=None,
+            Name=None,
+            RestartExecutionOnUpdate=None,
+            RoleArn=None,
+            Stages=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ArtifactStore", _convert_PipelineArtifactStore(ArtifactStore))
+            _setattr(
+                "ArtifactStores", _convert_PipelineArtifactStoreMap_list(ArtifactStores)
+            )
+            _setattr(
+                "DisableInboundStageTransitions",
+                _convert_PipelineStageTransition_list(DisableInboundStageTransitions),
+            )
+            _setattr("Name", Name)
+            _setattr("RestartExecutionOnUpdate", RestartExecutionOnUpdate)
+            _setattr("RoleArn", RoleArn)
+            _setattr("Stages", _convert_PipelineStageDeclaration_list(Stages))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PipelineProperties = create_object_converter(PipelineProperties)
+
+    class Pipeline(_Resource):
+        """A Pipeline for CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for Pipeline
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codepipeline-pipeline.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodePipeline::Pipeline"
+
+        Properties: PipelineProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Pipeline",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PipelineProperties},
+            factories={"Properties": PipelineProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PipelineProperties()
+            _setattr("Properties", _convert_PipelineProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Pipeline,
+        PipelineProperties,
+        PipelineActionTypeId,
+        PipelineInputArtifact,
+        PipelineOutputArtifact,
+        PipelineActionDeclaration,
+        PipelineEncryptionKey,
+        PipelineArtifactStore,
+        PipelineArtifactStoreMap,
+        PipelineBlockerDeclaration,
+        PipelineStageDeclaration,
+        PipelineStageTransition,
+    )
+
+
+def _create_Webhook():
+    class WebhookWebhookAuthConfiguration(_PropertyType):
+        """The Webhook Auth Configuration property type for Webhook in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for WebhookAuthConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-webhook-webhookauthconfiguration.html>`_
+        """
+
+        __slots__ = ("AllowedIPRange", "SecretToken")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebhookWebhookAuthConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AllowedIPRange=None, SecretToken=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowedIPRange", AllowedIPRange)
+            _setattr("SecretToken", SecretToken)
+            _init_PropertyType(self, kwargs)
+
+    class WebhookWebhookFilterRule(_PropertyType):
+        """The Webhook Filter Rule property type for Webhook in CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for WebhookFilterRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codepipeline-webhook-webhookfilterrule.html>`_
+        """
+
+        __slots__ = ("JsonPath", "MatchEquals")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebhookWebhookFilterRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, JsonPath=None, MatchEquals=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("JsonPath", JsonPath)
+            _setattr("MatchEquals", MatchEquals)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebhookWebhookAuthConfiguration = create_object_converter(
+        WebhookWebhookAuthConfiguration
+    )
+    _convert_WebhookWebhookFilterRule_list = create_object_list_converter(
+        WebhookWebhookFilterRule
+    )
+
+    class WebhookProperties(_ResourceProperties):
+        __slots__ = (
+            "Authentication",
+            "AuthenticationConfiguration",
+            "Filters",
+            "Name",
+            "RegisterWithThirdParty",
+            "TargetAction",
+            "TargetPipeline",
+            "TargetPipelineVersion",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebhookProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AuthenticationConfiguration": _convert_WebhookWebhookAuthConfiguration,
+                "Filters": _convert_WebhookWebhookFilterRule_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Authentication=None,
+            AuthenticationConfiguration=None,
+            Filters=None,
+            Name=None,
+            RegisterWithThirdParty=None,
+            TargetAction=None,
+            TargetPipeline=None,
+            TargetPipelineVersion=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Authentication", Authentication)
+            _setattr(
+                "AuthenticationConfiguration",
+                _convert_WebhookWebhookAuthConfiguration(AuthenticationConfiguration),
+            )
+            _setattr("Filters", _convert_WebhookWebhookFilterRule_list(Filters))
+            _setattr("Name", Name)
+            _setattr("RegisterWithThirdParty", RegisterWithThirdParty)
+            _setattr("TargetAction", TargetAction)
+            _setattr("TargetPipeline", TargetPipeline)
+            _setattr("TargetPipelineVersion", TargetPipelineVersion)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_WebhookProperties = create_object_converter(WebhookProperties)
+
+    class Webhook(_Resource):
+        """A Webhook for CodePipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for Webhook
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codepipeline-webhook.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodePipeline::Webhook"
+
+        Properties: WebhookProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Webhook",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_WebhookProperties},
+            factories={"Properties": WebhookProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = WebhookProperties()
+            _setattr("Properties", _convert_WebhookProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Webhook,
+        WebhookProperties,
+        WebhookWebhookAuthConfiguration,
+        WebhookWebhookFilterRule,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "CustomActionType": _create_CustomActionType,
+        "CustomActionTypeProperties": _create_CustomActionType,
+        "CustomActionTypeArtifactDetails": _create_CustomActionType,
+        "CustomActionTypeConfigurationProperties": _create_CustomActionType,
+        "CustomActionTypeSettings": _create_CustomActionType,
+        "Pipeline": _create_Pipeline,
+        "PipelineProperties": _create_Pipeline,
+        "PipelineActionDeclaration": _create_Pipeline,
+        "PipelineActionTypeId": _create_Pipeline,
+        "PipelineArtifactStore": _create_Pipeline,
+        "PipelineArtifactStoreMap": _create_Pipeline,
+        "PipelineBlockerDeclaration": _create_Pipeline,
+        "PipelineEncryptionKey": _create_Pipeline,
+        "PipelineInputArtifact": _create_Pipeline,
+        "PipelineOutputArtifact": _create_Pipeline,
+        "PipelineStageDeclaration": _create_Pipeline,
+        "PipelineStageTransition": _create_Pipeline,
+        "Webhook": _create_Webhook,
+        "WebhookProperties": _create_Webhook,
+        "WebhookWebhookAuthConfiguration": _create_Webhook,
+        "WebhookWebhookFilterRule": _create_Webhook,
+    },
+)
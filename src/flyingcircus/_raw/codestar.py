@@ -7,40 +7,175 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
-__all__ = ["GitHubRepository", "GitHubRepositoryProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "GitHubRepository",
+    "GitHubRepositoryProperties",
+    "GitHubRepositoryCode",
+    "GitHubRepositoryS3",
+]
 
-@attrs(**ATTRSCONFIG)
-class GitHubRepositoryProperties(ResourceProperties):
-    Code = attrib(default=None)
-    EnableIssues = attrib(default=None)
-    IsPrivate = attrib(default=None)
-    RepositoryAccessToken = attrib(default=None)
-    RepositoryDescription = attrib(default=None)
-    RepositoryName = attrib(default=None)
-    RepositoryOwner = attrib(default=None)
 
+def _create_GitHubRepository():
+    class GitHubRepositoryS3(_PropertyType):
+        """The S3 property type for GitHubRepository in CodeStar.
 
-@attrs(**ATTRSCONFIG)
-class GitHubRepository(Resource):
-    """A Git Hub Repository for CodeStar.
+        See Also:
+            `AWS Cloud Formation documentation for S3
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codestar-githubrepository-s3.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for GitHubRepository
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codestar-githubrepository.html>`_
-    """
+        __slots__ = ("Bucket", "Key", "ObjectVersion")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GitHubRepositoryS3", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CodeStar::GitHubRepository"
+        def __init__(
+            self, *, Bucket=None, Key=None, ObjectVersion=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("Key", Key)
+            _setattr("ObjectVersion", ObjectVersion)
+            _init_PropertyType(self, kwargs)
 
-    Properties: GitHubRepositoryProperties = attrib(
-        factory=GitHubRepositoryProperties,
-        converter=create_object_converter(GitHubRepositoryProperties),
+    _convert_GitHubRepositoryS3 = create_object_converter(GitHubRepositoryS3)
+
+    class GitHubRepositoryCode(_PropertyType):
+        """The Code property type for GitHubRepository in CodeStar.
+
+        See Also:
+            `AWS Cloud Formation documentation for Code
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codestar-githubrepository-code.html>`_
+        """
+
+        __slots__ = ("S3",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GitHubRepositoryCode",
+            _PropertyType,
+            __slots__,
+            converters={"S3": _convert_GitHubRepositoryS3},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, S3=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("S3", _convert_GitHubRepositoryS3(S3))
+            _init_PropertyType(self, kwargs)
+
+    _convert_GitHubRepositoryCode = create_object_converter(GitHubRepositoryCode)
+
+    class GitHubRepositoryProperties(_ResourceProperties):
+        __slots__ = (
+            "Code",
+            "EnableIssues",
+            "IsPrivate",
+            "RepositoryAccessToken",
+            "RepositoryDescription",
+            "RepositoryName",
+            "RepositoryOwner",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GitHubRepositoryProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Code": _convert_GitHubRepositoryCode},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Code=None,
+            EnableIssues=None,
+            IsPrivate=None,
+            RepositoryAccessToken=None,
+            RepositoryDescription=None,
+            RepositoryName=None,
+            RepositoryOwner=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Code", _convert_GitHubRepositoryCode(Code))
+            _setattr("EnableIssues", EnableIssues)
+            _setattr("IsPrivate", IsPrivate)
+            _setattr("RepositoryAccessToken", RepositoryAccessToken)
+            _setattr("RepositoryDescription", RepositoryDescription)
+            _setattr("RepositoryName", RepositoryName)
+            _setattr("RepositoryOwner", RepositoryOwner)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GitHubRepositoryProperties = create_object_converter(
+        GitHubRepositoryProperties
+    )
+
+    class GitHubRepository(_Resource):
+        """A Git Hub Repository for CodeStar.
+
+        See Also:
+            `AWS Cloud Formation documentation for GitHubRepository
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codestar-githubrepository.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodeStar::GitHubRepository"
+
+        Properties: GitHubRepositoryProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GitHubRepository",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GitHubRepositoryProperties},
+            factories={"Properties": GitHubRepositoryProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GitHubRepositoryProperties()
+            _setattr("Properties", _convert_GitHubRepositoryProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        GitHubRepository,
+        GitHubRepositoryProperties,
+        GitHubRepositoryS3,
+        GitHubRepositoryCode,
     )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "GitHubRepository": _create_GitHubRepository,
+        "GitHubRepositoryProperties": _create_GitHubRepository,
+        "GitHubRepositoryCode": _create_GitHubRepository,
+        "GitHubRepositoryS3": _create_GitHubRepository,
+    },
+)
@@ -7,40 +7,143 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["NotificationRule", "NotificationRuleProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "NotificationRule",
+    "NotificationRuleProperties",
+    "NotificationRuleTarget",
+]
 
-@attrs(**ATTRSCONFIG)
-class NotificationRuleProperties(ResourceProperties):
-    DetailType = attrib(default=None)
-    EventTypeIds = attrib(default=None)
-    Name = attrib(default=None)
-    Resource = attrib(default=None)
-    Status = attrib(default=None)
-    Tags = attrib(default=None)
-    Targets = attrib(default=None)
 
+def _create_NotificationRule():
+    class NotificationRuleTarget(_PropertyType):
+        """The Target property type for NotificationRule in CodeStarNotifications.
 
-@attrs(**ATTRSCONFIG)
-class NotificationRule(Resource):
-    """A Notification Rule for CodeStarNotifications.
+        See Also:
+            `AWS Cloud Formation documentation for Target
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-codestarnotifications-notificationrule-target.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for NotificationRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codestarnotifications-notificationrule.html>`_
-    """
+        __slots__ = ("TargetAddress", "TargetType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NotificationRuleTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::CodeStarNotifications::NotificationRule"
+        def __init__(self, *, TargetAddress=None, TargetType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TargetAddress", TargetAddress)
+            _setattr("TargetType", TargetType)
+            _init_PropertyType(self, kwargs)
 
-    Properties: NotificationRuleProperties = attrib(
-        factory=NotificationRuleProperties,
-        converter=create_object_converter(NotificationRuleProperties),
+    _convert_NotificationRuleTarget_list = create_object_list_converter(
+        NotificationRuleTarget
     )
+
+    class NotificationRuleProperties(_ResourceProperties):
+        __slots__ = (
+            "DetailType",
+            "EventTypeIds",
+            "Name",
+            "Resource",
+            "Status",
+            "Tags",
+            "Targets",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NotificationRuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Targets": _convert_NotificationRuleTarget_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DetailType=None,
+            EventTypeIds=None,
+            Name=None,
+            Resource=None,
+            Status=None,
+            Tags=None,
+            Targets=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DetailType", DetailType)
+            _setattr("EventTypeIds", EventTypeIds)
+            _setattr("Name", Name)
+            _setattr("Resource", Resource)
+            _setattr("Status", Status)
+            _setattr("Tags", Tags)
+            _setattr("Targets", _convert_NotificationRuleTarget_list(Targets))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NotificationRuleProperties = create_object_converter(
+        NotificationRuleProperties
+    )
+
+    class NotificationRule(_Resource):
+        """A Notification Rule for CodeStarNotifications.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotificationRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-codestarnotifications-notificationrule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::CodeStarNotifications::NotificationRule"
+        TAG_FORMAT = "Map"
+
+        Properties: NotificationRuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NotificationRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NotificationRuleProperties},
+            factories={"Properties": NotificationRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NotificationRuleProperties()
+            _setattr("Properties", _convert_NotificationRuleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return NotificationRule, NotificationRuleProperties, NotificationRuleTarget
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "NotificationRule": _create_NotificationRule,
+        "NotificationRuleProperties": _create_NotificationRule,
+        "NotificationRuleTarget": _create_NotificationRule,
+    },
+)
@@ -7,378 +7,2326 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "IdentityPool",
     "IdentityPoolProperties",
+    "IdentityPoolCognitoIdentityProvider",
+    "IdentityPoolCognitoStreams",
+    "IdentityPoolPushSync",
     "IdentityPoolRoleAttachment",
     "IdentityPoolRoleAttachmentProperties",
+    "IdentityPoolRoleAttachmentMappingRule",
+    "IdentityPoolRoleAttachmentRoleMapping",
+    "IdentityPoolRoleAttachmentRulesConfigurationType",
     "UserPool",
     "UserPoolProperties",
+    "UserPoolAdminCreateUserConfig",
+    "UserPoolDeviceConfiguration",
+    "UserPoolEmailConfiguration",
+    "UserPoolInviteMessageTemplate",
+    "UserPoolLambdaConfig",
+    "UserPoolNumberAttributeConstraints",
+    "UserPoolPasswordPolicy",
+    "UserPoolPolicies",
+    "UserPoolSchemaAttribute",
+    "UserPoolSmsConfiguration",
+    "UserPoolStringAttributeConstraints",
+    "UserPoolUserPoolAddOns",
+    "UserPoolVerificationMessageTemplate",
     "UserPoolClient",
     "UserPoolClientProperties",
+    "UserPoolClientAnalyticsConfiguration",
     "UserPoolDomain",
     "UserPoolDomainProperties",
+    "UserPoolDomainCustomDomainConfigType",
     "UserPoolGroup",
     "UserPoolGroupProperties",
     "UserPoolIdentityProvider",
     "UserPoolIdentityProviderProperties",
     "UserPoolResourceServer",
     "UserPoolResourceServerProperties",
+    "UserPoolResourceServerResourceServerScopeType",
     "UserPoolRiskConfigurationAttachment",
     "UserPoolRiskConfigurationAttachmentProperties",
+    "UserPoolRiskConfigurationAttachmentAccountTakeoverActionsType",
+    "UserPoolRiskConfigurationAttachmentAccountTakeoverActionType",
+    "UserPoolRiskConfigurationAttachmentAccountTakeoverRiskConfigurationType",
+    "UserPoolRiskConfigurationAttachmentCompromisedCredentialsActionsType",
+    "UserPoolRiskConfigurationAttachmentCompromisedCredentialsRiskConfigurationType",
+    "UserPoolRiskConfigurationAttachmentNotifyConfigurationType",
+    "UserPoolRiskConfigurationAttachmentNotifyEmailType",
+    "UserPoolRiskConfigurationAttachmentRiskExceptionConfigurationType",
     "UserPoolUICustomizationAttachment",
     "UserPoolUICustomizationAttachmentProperties",
     "UserPoolUser",
     "UserPoolUserProperties",
+    "UserPoolUserAttributeType",
     "UserPoolUserToGroupAttachment",
     "UserPoolUserToGroupAttachmentProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class IdentityPoolProperties(ResourceProperties):
-    AllowClassicFlow = attrib(default=None)
-    AllowUnauthenticatedIdentities = attrib(default=None)
-    CognitoEvents = attrib(default=None)
-    CognitoIdentityProviders = attrib(default=None)
-    CognitoStreams = attrib(default=None)
-    DeveloperProviderName = attrib(default=None)
-    IdentityPoolName = attrib(default=None)
-    OpenIdConnectProviderARNs = attrib(default=None)
-    PushSync = attrib(default=None)
-    SamlProviderARNs = attrib(default=None)
-    SupportedLoginProviders = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class IdentityPool(Resource):
-    """A Identity Pool for Cognito.
-
-    See Also:
-        `AWS Cloud Formation documentation for IdentityPool
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-identitypool.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Cognito::IdentityPool"
-
-    Properties: IdentityPoolProperties = attrib(
-        factory=IdentityPoolProperties,
-        converter=create_object_converter(IdentityPoolProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class IdentityPoolRoleAttachmentProperties(ResourceProperties):
-    IdentityPoolId = attrib(default=None)
-    RoleMappings = attrib(default=None)
-    Roles = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class IdentityPoolRoleAttachment(Resource):
-    """A Identity Pool Role Attachment for Cognito.
-
-    See Also:
-        `AWS Cloud Formation documentation for IdentityPoolRoleAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-identitypoolroleattachment.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Cognito::IdentityPoolRoleAttachment"
-
-    Properties: IdentityPoolRoleAttachmentProperties = attrib(
-        factory=IdentityPoolRoleAttachmentProperties,
-        converter=create_object_converter(IdentityPoolRoleAttachmentProperties),
+def _create_IdentityPool():
+    class IdentityPoolCognitoIdentityProvider(_PropertyType):
+        """The Cognito Identity Provider property type for IdentityPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for CognitoIdentityProvider
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-identitypool-cognitoidentityprovider.html>`_
+        """
+
+        __slots__ = ("ClientId", "ProviderName", "ServerSideTokenCheck")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPoolCognitoIdentityProvider", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ClientId=None,
+            ProviderName=None,
+            ServerSideTokenCheck=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClientId", ClientId)
+            _setattr("ProviderName", ProviderName)
+            _setattr("ServerSideTokenCheck", ServerSideTokenCheck)
+            _init_PropertyType(self, kwargs)
+
+    class IdentityPoolCognitoStreams(_PropertyType):
+        """The Cognito Streams property type for IdentityPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for CognitoStreams
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-identitypool-cognitostreams.html>`_
+        """
+
+        __slots__ = ("RoleArn", "StreamingStatus", "StreamName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPoolCognitoStreams", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, RoleArn=None, StreamingStatus=None, StreamName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RoleArn", RoleArn)
+            _setattr("StreamingStatus", StreamingStatus)
+            _setattr("StreamName", StreamName)
+            _init_PropertyType(self, kwargs)
+
+    class IdentityPoolPushSync(_PropertyType):
+        """The Push Sync property type for IdentityPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for PushSync
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-identitypool-pushsync.html>`_
+        """
+
+        __slots__ = ("ApplicationArns", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPoolPushSync", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ApplicationArns=None, RoleArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationArns", ApplicationArns)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_IdentityPoolCognitoIdentityProvider_list = create_object_list_converter(
+        IdentityPoolCognitoIdentityProvider
     )
-
-
-@attrs(**ATTRSCONFIG)
-class UserPoolProperties(ResourceProperties):
-    AdminCreateUserConfig = attrib(default=None)
-    AliasAttributes = attrib(default=None)
-    AutoVerifiedAttributes = attrib(default=None)
-    DeviceConfiguration = attrib(default=None)
-    EmailConfiguration = attrib(default=None)
-    EmailVerificationMessage = attrib(default=None)
-    EmailVerificationSubject = attrib(default=None)
-    EnabledMfas = attrib(default=None)
-    LambdaConfig = attrib(default=None)
-    MfaConfiguration = attrib(default=None)
-    Policies = attrib(default=None)
-    Schema = attrib(default=None)
-    SmsAuthenticationMessage = attrib(default=None)
-    SmsConfiguration = attrib(default=None)
-    SmsVerificationMessage = attrib(default=None)
-    UsernameAttributes = attrib(default=None)
-    UserPoolAddOns = attrib(default=None)
-    UserPoolName = attrib(default=None)
-    UserPoolTags = attrib(default=None)
-    VerificationMessageTemplate = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class UserPool(Resource):
-    """A User Pool for Cognito.
-
-    See Also:
-        `AWS Cloud Formation documentation for UserPool
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpool.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Cognito::UserPool"
-
-    Properties: UserPoolProperties = attrib(
-        factory=UserPoolProperties,
-        converter=create_object_converter(UserPoolProperties),
+    _convert_IdentityPoolCognitoStreams = create_object_converter(
+        IdentityPoolCognitoStreams
     )
-
-
-@attrs(**ATTRSCONFIG)
-class UserPoolClientProperties(ResourceProperties):
-    AllowedOAuthFlows = attrib(default=None)
-    AllowedOAuthFlowsUserPoolClient = attrib(default=None)
-    AllowedOAuthScopes = attrib(default=None)
-    AnalyticsConfiguration = attrib(default=None)
-    CallbackURLs = attrib(default=None)
-    ClientName = attrib(default=None)
-    DefaultRedirectURI = attrib(default=None)
-    ExplicitAuthFlows = attrib(default=None)
-    GenerateSecret = attrib(default=None)
-    LogoutURLs = attrib(default=None)
-    PreventUserExistenceErrors = attrib(default=None)
-    ReadAttributes = attrib(default=None)
-    RefreshTokenValidity = attrib(default=None)
-    SupportedIdentityProviders = attrib(default=None)
-    UserPoolId = attrib(default=None)
-    WriteAttributes = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class UserPoolClient(Resource):
-    """A User Pool Client for Cognito.
-
-    See Also:
-        `AWS Cloud Formation documentation for UserPoolClient
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolclient.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Cognito::UserPoolClient"
-
-    Properties: UserPoolClientProperties = attrib(
-        factory=UserPoolClientProperties,
-        converter=create_object_converter(UserPoolClientProperties),
+    _convert_IdentityPoolPushSync = create_object_converter(IdentityPoolPushSync)
+
+    class IdentityPoolProperties(_ResourceProperties):
+        __slots__ = (
+            "AllowClassicFlow",
+            "AllowUnauthenticatedIdentities",
+            "CognitoEvents",
+            "CognitoIdentityProviders",
+            "CognitoStreams",
+            "DeveloperProviderName",
+            "IdentityPoolName",
+            "OpenIdConnectProviderARNs",
+            "PushSync",
+            "SamlProviderARNs",
+            "SupportedLoginProviders",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPoolProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CognitoIdentityProviders": _convert_IdentityPoolCognitoIdentityProvider_list,
+                "CognitoStreams": _convert_IdentityPoolCognitoStreams,
+                "PushSync": _convert_IdentityPoolPushSync,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowClassicFlow=None,
+            AllowUnauthenticatedIdentities=None,
+            CognitoEvents=None,
+            CognitoIdentityProviders=None,
+            CognitoStreams=None,
+            DeveloperProviderName=None,
+            IdentityPoolName=None,
+            OpenIdConnectProviderARNs=None,
+            PushSync=None,
+            SamlProviderARNs=None,
+            SupportedLoginProviders=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowClassicFlow", AllowClassicFlow)
+            _setattr("AllowUnauthenticatedIdentities", AllowUnauthenticatedIdentities)
+            _setattr("CognitoEvents", CognitoEvents)
+            _setattr(
+                "CognitoIdentityProviders",
+                _convert_IdentityPoolCognitoIdentityProvider_list(
+                    CognitoIdentityProviders
+                ),
+            )
+            _setattr(
+                "CognitoStreams", _convert_IdentityPoolCognitoStreams(CognitoStreams)
+            )
+            _setattr("DeveloperProviderName", DeveloperProviderName)
+            _setattr("IdentityPoolName", IdentityPoolName)
+            _setattr("OpenIdConnectProviderARNs", OpenIdConnectProviderARNs)
+            _setattr("PushSync", _convert_IdentityPoolPushSync(PushSync))
+            _setattr("SamlProviderARNs", SamlProviderARNs)
+            _setattr("SupportedLoginProviders", SupportedLoginProviders)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_IdentityPoolProperties = create_object_converter(IdentityPoolProperties)
+
+    class IdentityPool(_Resource):
+        """A Identity Pool for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for IdentityPool
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-identitypool.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::IdentityPool"
+
+        Properties: IdentityPoolProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPool",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_IdentityPoolProperties},
+            factories={"Properties": IdentityPoolProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = IdentityPoolProperties()
+            _setattr("Properties", _convert_IdentityPoolProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        IdentityPool,
+        IdentityPoolProperties,
+        IdentityPoolCognitoIdentityProvider,
+        IdentityPoolCognitoStreams,
+        IdentityPoolPushSync,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class UserPoolDomainProperties(ResourceProperties):
-    CustomDomainConfig = attrib(default=None)
-    Domain = attrib(default=None)
-    UserPoolId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class UserPoolDomain(Resource):
-    """A User Pool Domain for Cognito.
-
-    See Also:
-        `AWS Cloud Formation documentation for UserPoolDomain
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpooldomain.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Cognito::UserPoolDomain"
-
-    Properties: UserPoolDomainProperties = attrib(
-        factory=UserPoolDomainProperties,
-        converter=create_object_converter(UserPoolDomainProperties),
+def _create_IdentityPoolRoleAttachment():
+    class IdentityPoolRoleAttachmentMappingRule(_PropertyType):
+        """The Mapping Rule property type for IdentityPoolRoleAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for MappingRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-identitypoolroleattachment-mappingrule.html>`_
+        """
+
+        __slots__ = ("Claim", "MatchType", "RoleARN", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPoolRoleAttachmentMappingRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Claim=None, MatchType=None, RoleARN=None, Value=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Claim", Claim)
+            _setattr("MatchType", MatchType)
+            _setattr("RoleARN", RoleARN)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_IdentityPoolRoleAttachmentMappingRule_list = create_object_list_converter(
+        IdentityPoolRoleAttachmentMappingRule
     )
 
+    class IdentityPoolRoleAttachmentRulesConfigurationType(_PropertyType):
+        """The Rules Configuration Type property type for IdentityPoolRoleAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for RulesConfigurationType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-identitypoolroleattachment-rulesconfigurationtype.html>`_
+        """
+
+        __slots__ = ("Rules",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPoolRoleAttachmentRulesConfigurationType",
+            _PropertyType,
+            __slots__,
+            converters={"Rules": _convert_IdentityPoolRoleAttachmentMappingRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Rules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Rules", _convert_IdentityPoolRoleAttachmentMappingRule_list(Rules)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_IdentityPoolRoleAttachmentRulesConfigurationType = create_object_converter(
+        IdentityPoolRoleAttachmentRulesConfigurationType
+    )
 
-@attrs(**ATTRSCONFIG)
-class UserPoolGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    GroupName = attrib(default=None)
-    Precedence = attrib(default=None)
-    RoleArn = attrib(default=None)
-    UserPoolId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class UserPoolGroup(Resource):
-    """A User Pool Group for Cognito.
+    class IdentityPoolRoleAttachmentRoleMapping(_PropertyType):
+        """The Role Mapping property type for IdentityPoolRoleAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for RoleMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-identitypoolroleattachment-rolemapping.html>`_
+        """
+
+        __slots__ = (
+            "AmbiguousRoleResolution",
+            "IdentityProvider",
+            "RulesConfiguration",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPoolRoleAttachmentRoleMapping",
+            _PropertyType,
+            __slots__,
+            converters={
+                "RulesConfiguration": _convert_IdentityPoolRoleAttachmentRulesConfigurationType
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AmbiguousRoleResolution=None,
+            IdentityProvider=None,
+            RulesConfiguration=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AmbiguousRoleResolution", AmbiguousRoleResolution)
+            _setattr("IdentityProvider", IdentityProvider)
+            _setattr(
+                "RulesConfiguration",
+                _convert_IdentityPoolRoleAttachmentRulesConfigurationType(
+                    RulesConfiguration
+                ),
+            )
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class IdentityPoolRoleAttachmentProperties(_ResourceProperties):
+        __slots__ = ("IdentityPoolId", "RoleMappings", "Roles")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPoolRoleAttachmentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, IdentityPoolId=None, RoleMappings=None, Roles=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IdentityPoolId", IdentityPoolId)
+            _setattr("RoleMappings", RoleMappings)
+            _setattr("Roles", Roles)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_IdentityPoolRoleAttachmentProperties = create_object_converter(
+        IdentityPoolRoleAttachmentProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for UserPoolGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolgroup.html>`_
-    """
+    class IdentityPoolRoleAttachment(_Resource):
+        """A Identity Pool Role Attachment for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for IdentityPoolRoleAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-identitypoolroleattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::IdentityPoolRoleAttachment"
+
+        Properties: IdentityPoolRoleAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityPoolRoleAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_IdentityPoolRoleAttachmentProperties},
+            factories={"Properties": IdentityPoolRoleAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = IdentityPoolRoleAttachmentProperties()
+            _setattr(
+                "Properties", _convert_IdentityPoolRoleAttachmentProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        IdentityPoolRoleAttachment,
+        IdentityPoolRoleAttachmentProperties,
+        IdentityPoolRoleAttachmentMappingRule,
+        IdentityPoolRoleAttachmentRulesConfigurationType,
+        IdentityPoolRoleAttachmentRoleMapping,
+    )
 
-    RESOURCE_TYPE = "AWS::Cognito::UserPoolGroup"
 
-    Properties: UserPoolGroupProperties = attrib(
-        factory=UserPoolGroupProperties,
-        converter=create_object_converter(UserPoolGroupProperties),
+def _create_UserPool():
+    class UserPoolInviteMessageTemplate(_PropertyType):
+        """The Invite Message Template property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for InviteMessageTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-invitemessagetemplate.html>`_
+        """
+
+        __slots__ = ("EmailMessage", "EmailSubject", "SMSMessage")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolInviteMessageTemplate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, EmailMessage=None, EmailSubject=None, SMSMessage=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EmailMessage", EmailMessage)
+            _setattr("EmailSubject", EmailSubject)
+            _setattr("SMSMessage", SMSMessage)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolInviteMessageTemplate = create_object_converter(
+        UserPoolInviteMessageTemplate
     )
 
+    class UserPoolAdminCreateUserConfig(_PropertyType):
+        """The Admin Create User Config property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for AdminCreateUserConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-admincreateuserconfig.html>`_
+        """
+
+        __slots__ = (
+            "AllowAdminCreateUserOnly",
+            "InviteMessageTemplate",
+            "UnusedAccountValidityDays",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolAdminCreateUserConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "InviteMessageTemplate": _convert_UserPoolInviteMessageTemplate
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowAdminCreateUserOnly=None,
+            InviteMessageTemplate=None,
+            UnusedAccountValidityDays=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowAdminCreateUserOnly", AllowAdminCreateUserOnly)
+            _setattr(
+                "InviteMessageTemplate",
+                _convert_UserPoolInviteMessageTemplate(InviteMessageTemplate),
+            )
+            _setattr("UnusedAccountValidityDays", UnusedAccountValidityDays)
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolDeviceConfiguration(_PropertyType):
+        """The Device Configuration property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeviceConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-deviceconfiguration.html>`_
+        """
+
+        __slots__ = ("ChallengeRequiredOnNewDevice", "DeviceOnlyRememberedOnUserPrompt")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolDeviceConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ChallengeRequiredOnNewDevice=None,
+            DeviceOnlyRememberedOnUserPrompt=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ChallengeRequiredOnNewDevice", ChallengeRequiredOnNewDevice)
+            _setattr(
+                "DeviceOnlyRememberedOnUserPrompt", DeviceOnlyRememberedOnUserPrompt
+            )
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolEmailConfiguration(_PropertyType):
+        """The Email Configuration property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for EmailConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-emailconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "ConfigurationSet",
+            "EmailSendingAccount",
+            "From",
+            "ReplyToEmailAddress",
+            "SourceArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolEmailConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConfigurationSet=None,
+            EmailSendingAccount=None,
+            From=None,
+            ReplyToEmailAddress=None,
+            SourceArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConfigurationSet", ConfigurationSet)
+            _setattr("EmailSendingAccount", EmailSendingAccount)
+            _setattr("From", From)
+            _setattr("ReplyToEmailAddress", ReplyToEmailAddress)
+            _setattr("SourceArn", SourceArn)
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolLambdaConfig(_PropertyType):
+        """The Lambda Config property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for LambdaConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-lambdaconfig.html>`_
+        """
+
+        __slots__ = (
+            "CreateAuthChallenge",
+            "CustomMessage",
+            "DefineAuthChallenge",
+            "PostAuthentication",
+            "PostConfirmation",
+            "PreAuthentication",
+            "PreSignUp",
+            "PreTokenGeneration",
+            "UserMigration",
+            "VerifyAuthChallengeResponse",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolLambdaConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CreateAuthChallenge=None,
+            CustomMessage=None,
+            DefineAuthChallenge=None,
+            PostAuthentication=None,
+            PostConfirmation=None,
+            PreAuthentication=None,
+            PreSignUp=None,
+            PreTokenGeneration=None,
+            UserMigration=None,
+            VerifyAuthChallengeResponse=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CreateAuthChallenge", CreateAuthChallenge)
+            _setattr("CustomMessage", CustomMessage)
+            _setattr("DefineAuthChallenge", DefineAuthChallenge)
+            _setattr("PostAuthentication", PostAuthentication)
+            _setattr("PostConfirmation", PostConfirmation)
+            _setattr("PreAuthentication", PreAuthentication)
+            _setattr("PreSignUp", PreSignUp)
+            _setattr("PreTokenGeneration", PreTokenGeneration)
+            _setattr("UserMigration", UserMigration)
+            _setattr("VerifyAuthChallengeResponse", VerifyAuthChallengeResponse)
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolNumberAttributeConstraints(_PropertyType):
+        """The Number Attribute Constraints property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for NumberAttributeConstraints
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-numberattributeconstraints.html>`_
+        """
+
+        __slots__ = ("MaxValue", "MinValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolNumberAttributeConstraints", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MaxValue=None, MinValue=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaxValue", MaxValue)
+            _setattr("MinValue", MinValue)
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolPasswordPolicy(_PropertyType):
+        """The Password Policy property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for PasswordPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-passwordpolicy.html>`_
+        """
+
+        __slots__ = (
+            "MinimumLength",
+            "RequireLowercase",
+            "RequireNumbers",
+            "RequireSymbols",
+            "RequireUppercase",
+            "TemporaryPasswordValidityDays",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolPasswordPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MinimumLength=None,
+            RequireLowercase=None,
+            RequireNumbers=None,
+            RequireSymbols=None,
+            RequireUppercase=None,
+            TemporaryPasswordValidityDays=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MinimumLength", MinimumLength)
+            _setattr("RequireLowercase", RequireLowercase)
+            _setattr("RequireNumbers", RequireNumbers)
+            _setattr("RequireSymbols", RequireSymbols)
+            _setattr("RequireUppercase", RequireUppercase)
+            _setattr("TemporaryPasswordValidityDays", TemporaryPasswordValidityDays)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolPasswordPolicy = create_object_converter(UserPoolPasswordPolicy)
+
+    class UserPoolPolicies(_PropertyType):
+        """The Policies property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for Policies
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-policies.html>`_
+        """
+
+        __slots__ = ("PasswordPolicy",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolPolicies",
+            _PropertyType,
+            __slots__,
+            converters={"PasswordPolicy": _convert_UserPoolPasswordPolicy},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PasswordPolicy=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PasswordPolicy", _convert_UserPoolPasswordPolicy(PasswordPolicy))
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolStringAttributeConstraints(_PropertyType):
+        """The String Attribute Constraints property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for StringAttributeConstraints
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-stringattributeconstraints.html>`_
+        """
+
+        __slots__ = ("MaxLength", "MinLength")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolStringAttributeConstraints", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MaxLength=None, MinLength=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaxLength", MaxLength)
+            _setattr("MinLength", MinLength)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolNumberAttributeConstraints = create_object_converter(
+        UserPoolNumberAttributeConstraints
+    )
+    _convert_UserPoolStringAttributeConstraints = create_object_converter(
+        UserPoolStringAttributeConstraints
+    )
 
-@attrs(**ATTRSCONFIG)
-class UserPoolIdentityProviderProperties(ResourceProperties):
-    AttributeMapping = attrib(default=None)
-    IdpIdentifiers = attrib(default=None)
-    ProviderDetails = attrib(default=None)
-    ProviderName = attrib(default=None)
-    ProviderType = attrib(default=None)
-    UserPoolId = attrib(default=None)
-
+    class UserPoolSchemaAttribute(_PropertyType):
+        """The Schema Attribute property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for SchemaAttribute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-schemaattribute.html>`_
+        """
+
+        __slots__ = (
+            "AttributeDataType",
+            "DeveloperOnlyAttribute",
+            "Mutable",
+            "Name",
+            "NumberAttributeConstraints",
+            "Required",
+            "StringAttributeConstraints",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolSchemaAttribute",
+            _PropertyType,
+            __slots__,
+            converters={
+                "NumberAttributeConstraints": _convert_UserPoolNumberAttributeConstraints,
+                "StringAttributeConstraints": _convert_UserPoolStringAttributeConstraints,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AttributeDataType=None,
+            DeveloperOnlyAttribute=None,
+            Mutable=None,
+            Name=None,
+            NumberAttributeConstraints=None,
+            Required=None,
+            StringAttributeConstraints=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AttributeDataType", AttributeDataType)
+            _setattr("DeveloperOnlyAttribute", DeveloperOnlyAttribute)
+            _setattr("Mutable", Mutable)
+            _setattr("Name", Name)
+            _setattr(
+                "NumberAttributeConstraints",
+                _convert_UserPoolNumberAttributeConstraints(NumberAttributeConstraints),
+            )
+            _setattr("Required", Required)
+            _setattr(
+                "StringAttributeConstraints",
+                _convert_UserPoolStringAttributeConstraints(StringAttributeConstraints),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolSmsConfiguration(_PropertyType):
+        """The Sms Configuration property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for SmsConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-smsconfiguration.html>`_
+        """
+
+        __slots__ = ("ExternalId", "SnsCallerArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolSmsConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ExternalId=None, SnsCallerArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExternalId", ExternalId)
+            _setattr("SnsCallerArn", SnsCallerArn)
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolUserPoolAddOns(_PropertyType):
+        """The User Pool Add Ons property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolAddOns
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-userpooladdons.html>`_
+        """
+
+        __slots__ = ("AdvancedSecurityMode",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolUserPoolAddOns", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AdvancedSecurityMode=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdvancedSecurityMode", AdvancedSecurityMode)
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolVerificationMessageTemplate(_PropertyType):
+        """The Verification Message Template property type for UserPool in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for VerificationMessageTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpool-verificationmessagetemplate.html>`_
+        """
+
+        __slots__ = (
+            "DefaultEmailOption",
+            "EmailMessage",
+            "EmailMessageByLink",
+            "EmailSubject",
+            "EmailSubjectByLink",
+            "SmsMessage",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolVerificationMessageTemplate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultEmailOption=None,
+            EmailMessage=None,
+            EmailMessageByLink=None,
+            EmailSubject=None,
+            EmailSubjectByLink=None,
+            SmsMessage=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultEmailOption", DefaultEmailOption)
+            _setattr("EmailMessage", EmailMessage)
+            _setattr("EmailMessageByLink", EmailMessageByLink)
+            _setattr("EmailSubject", EmailSubject)
+            _setattr("EmailSubjectByLink", EmailSubjectByLink)
+            _setattr("SmsMessage", SmsMessage)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolAdminCreateUserConfig = create_object_converter(
+        UserPoolAdminCreateUserConfig
+    )
+    _convert_UserPoolDeviceConfiguration = create_object_converter(
+        UserPoolDeviceConfiguration
+    )
+    _convert_UserPoolEmailConfiguration = create_object_converter(
+        UserPoolEmailConfiguration
+    )
+    _convert_UserPoolLambdaConfig = create_object_converter(UserPoolLambdaConfig)
+    _convert_UserPoolPolicies = create_object_converter(UserPoolPolicies)
+    _convert_UserPoolSchemaAttribute_list = create_object_list_converter(
+        UserPoolSchemaAttribute
+    )
+    _convert_UserPoolSmsConfiguration = create_object_converter(
+        UserPoolSmsConfiguration
+    )
+    _convert_UserPoolUserPoolAddOns = create_object_converter(UserPoolUserPoolAddOns)
+    _convert_UserPoolVerificationMessageTemplate = create_object_converter(
+        UserPoolVerificationMessageTemplate
+    )
 
-@attrs(**ATTRSCONFIG)
-class UserPoolIdentityProvider(Resource):
-    """A User Pool Identity Provider for Cognito.
+    class UserPoolProperties(_ResourceProperties):
+        __slots__ = (
+            "AdminCreateUserConfig",
+            "AliasAttributes",
+            "AutoVerifiedAttributes",
+            "DeviceConfiguration",
+            "EmailConfiguration",
+            "EmailVerificationMessage",
+            "EmailVerificationSubject",
+            "EnabledMfas",
+            "LambdaConfig",
+            "MfaConfiguration",
+            "Policies",
+            "Schema",
+            "SmsAuthenticationMessage",
+            "SmsConfiguration",
+            "SmsVerificationMessage",
+            "UsernameAttributes",
+            "UserPoolAddOns",
+            "UserPoolName",
+            "UserPoolTags",
+            "VerificationMessageTemplate",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AdminCreateUserConfig": _convert_UserPoolAdminCreateUserConfig,
+                "DeviceConfiguration": _convert_UserPoolDeviceConfiguration,
+                "EmailConfiguration": _convert_UserPoolEmailConfiguration,
+                "LambdaConfig": _convert_UserPoolLambdaConfig,
+                "Policies": _convert_UserPoolPolicies,
+                "Schema": _convert_UserPoolSchemaAttribute_list,
+                "SmsConfiguration": _convert_UserPoolSmsConfiguration,
+                "UserPoolAddOns": _convert_UserPoolUserPoolAddOns,
+                "VerificationMessageTemplate": _convert_UserPoolVerificationMessageTemplate,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AdminCreateUserConfig=None,
+            AliasAttributes=None,
+            AutoVerifiedAttributes=None,
+            DeviceConfiguration=None,
+            EmailConfiguration=None,
+            EmailVerificationMessage=None,
+            EmailVerificationSubject=None,
+            EnabledMfas=None,
+            LambdaConfig=None,
+            MfaConfiguration=None,
+            Policies=None,
+            Schema=None,
+            SmsAuthenticationMessage=None,
+            SmsConfiguration=None,
+            SmsVerificationMessage=None,
+            UsernameAttributes=None,
+            UserPoolAddOns=None,
+            UserPoolName=None,
+            UserPoolTags=None,
+            VerificationMessageTemplate=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AdminCreateUserConfig",
+                _convert_UserPoolAdminCreateUserConfig(AdminCreateUserConfig),
+            )
+            _setattr("AliasAttributes", AliasAttributes)
+            _setattr("AutoVerifiedAttributes", AutoVerifiedAttributes)
+            _setattr(
+                "DeviceConfiguration",
+                _convert_UserPoolDeviceConfiguration(DeviceConfiguration),
+            )
+            _setattr(
+                "EmailConfiguration",
+                _convert_UserPoolEmailConfiguration(EmailConfiguration),
+            )
+            _setattr("EmailVerificationMessage", EmailVerificationMessage)
+            _setattr("EmailVerificationSubject", EmailVerificationSubject)
+            _setattr("EnabledMfas", EnabledMfas)
+            _setattr("LambdaConfig", _convert_UserPoolLambdaConfig(LambdaConfig))
+            _setattr("MfaConfiguration", MfaConfiguration)
+            _setattr("Policies", _convert_UserPoolPolicies(Policies))
+            _setattr("Schema", _convert_UserPoolSchemaAttribute_list(Schema))
+            _setattr("SmsAuthenticationMessage", SmsAuthenticationMessage)
+            _setattr(
+                "SmsConfiguration", _convert_UserPoolSmsConfiguration(SmsConfiguration)
+            )
+            _setattr("SmsVerificationMessage", SmsVerificationMessage)
+            _setattr("UsernameAttributes", UsernameAttributes)
+            _setattr("UserPoolAddOns", _convert_UserPoolUserPoolAddOns(UserPoolAddOns))
+            _setattr("UserPoolName", UserPoolName)
+            _setattr("UserPoolTags", UserPoolTags)
+            _setattr(
+                "VerificationMessageTemplate",
+                _convert_UserPoolVerificationMessageTemplate(
+                    VerificationMessageTemplate
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolProperties = create_object_converter(UserPoolProperties)
+
+    class UserPool(_Resource):
+        """A User Pool for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPool
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpool.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPool"
+        TAG_PROPERTY = "UserPoolTags"
+        TAG_FORMAT = "Map"
+
+        Properties: UserPoolProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPool",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserPoolProperties},
+            factories={"Properties": UserPoolProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolProperties()
+            _setattr("Properties", _convert_UserPoolProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        UserPool,
+        UserPoolProperties,
+        UserPoolInviteMessageTemplate,
+        UserPoolAdminCreateUserConfig,
+        UserPoolDeviceConfiguration,
+        UserPoolEmailConfiguration,
+        UserPoolLambdaConfig,
+        UserPoolNumberAttributeConstraints,
+        UserPoolPasswordPolicy,
+        UserPoolPolicies,
+        UserPoolStringAttributeConstraints,
+        UserPoolSchemaAttribute,
+        UserPoolSmsConfiguration,
+        UserPoolUserPoolAddOns,
+        UserPoolVerificationMessageTemplate,
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for UserPoolIdentityProvider
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolidentityprovider.html>`_
-    """
 
-    RESOURCE_TYPE = "AWS::Cognito::UserPoolIdentityProvider"
+def _create_UserPoolClient():
+    class UserPoolClientAnalyticsConfiguration(_PropertyType):
+        """The Analytics Configuration property type for UserPoolClient in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for AnalyticsConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolclient-analyticsconfiguration.html>`_
+        """
+
+        __slots__ = ("ApplicationId", "ExternalId", "RoleArn", "UserDataShared")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolClientAnalyticsConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            ExternalId=None,
+            RoleArn=None,
+            UserDataShared=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("ExternalId", ExternalId)
+            _setattr("RoleArn", RoleArn)
+            _setattr("UserDataShared", UserDataShared)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolClientAnalyticsConfiguration = create_object_converter(
+        UserPoolClientAnalyticsConfiguration
+    )
 
-    Properties: UserPoolIdentityProviderProperties = attrib(
-        factory=UserPoolIdentityProviderProperties,
-        converter=create_object_converter(UserPoolIdentityProviderProperties),
+    class UserPoolClientProperties(_ResourceProperties):
+        __slots__ = (
+            "AllowedOAuthFlows",
+            "AllowedOAuthFlowsUserPoolClient",
+            "AllowedOAuthScopes",
+            "AnalyticsConfiguration",
+            "CallbackURLs",
+            "ClientName",
+            "DefaultRedirectURI",
+            "ExplicitAuthFlows",
+            "GenerateSecret",
+            "LogoutURLs",
+            "PreventUserExistenceErrors",
+            "ReadAttributes",
+            "RefreshTokenValidity",
+            "SupportedIdentityProviders",
+            "UserPoolId",
+            "WriteAttributes",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolClientProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AnalyticsConfiguration": _convert_UserPoolClientAnalyticsConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowedOAuthFlows=None,
+            AllowedOAuthFlowsUserPoolClient=None,
+            AllowedOAuthScopes=None,
+            AnalyticsConfiguration=None,
+            CallbackURLs=None,
+            ClientName=None,
+            DefaultRedirectURI=None,
+            ExplicitAuthFlows=None,
+            GenerateSecret=None,
+            LogoutURLs=None,
+            PreventUserExistenceErrors=None,
+            ReadAttributes=None,
+            RefreshTokenValidity=None,
+            SupportedIdentityProviders=None,
+            UserPoolId=None,
+            WriteAttributes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowedOAuthFlows", AllowedOAuthFlows)
+            _setattr("AllowedOAuthFlowsUserPoolClient", AllowedOAuthFlowsUserPoolClient)
+            _setattr("AllowedOAuthScopes", AllowedOAuthScopes)
+            _setattr(
+                "AnalyticsConfiguration",
+                _convert_UserPoolClientAnalyticsConfiguration(AnalyticsConfiguration),
+            )
+            _setattr("CallbackURLs", CallbackURLs)
+            _setattr("ClientName", ClientName)
+            _setattr("DefaultRedirectURI", DefaultRedirectURI)
+            _setattr("ExplicitAuthFlows", ExplicitAuthFlows)
+            _setattr("GenerateSecret", GenerateSecret)
+            _setattr("LogoutURLs", LogoutURLs)
+            _setattr("PreventUserExistenceErrors", PreventUserExistenceErrors)
+            _setattr("ReadAttributes", ReadAttributes)
+            _setattr("RefreshTokenValidity", RefreshTokenValidity)
+            _setattr("SupportedIdentityProviders", SupportedIdentityProviders)
+            _setattr("UserPoolId", UserPoolId)
+            _setattr("WriteAttributes", WriteAttributes)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolClientProperties = create_object_converter(
+        UserPoolClientProperties
     )
 
+    class UserPoolClient(_Resource):
+        """A User Pool Client for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolClient
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolclient.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPoolClient"
+
+        Properties: UserPoolClientProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolClient",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserPoolClientProperties},
+            factories={"Properties": UserPoolClientProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolClientProperties()
+            _setattr("Properties", _convert_UserPoolClientProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        UserPoolClient,
+        UserPoolClientProperties,
+        UserPoolClientAnalyticsConfiguration,
+    )
 
-@attrs(**ATTRSCONFIG)
-class UserPoolResourceServerProperties(ResourceProperties):
-    Identifier = attrib(default=None)
-    Name = attrib(default=None)
-    Scopes = attrib(default=None)
-    UserPoolId = attrib(default=None)
 
+def _create_UserPoolDomain():
+    class UserPoolDomainCustomDomainConfigType(_PropertyType):
+        """The Custom Domain Config Type property type for UserPoolDomain in Cognito.
 
-@attrs(**ATTRSCONFIG)
-class UserPoolResourceServer(Resource):
-    """A User Pool Resource Server for Cognito.
+        See Also:
+            `AWS Cloud Formation documentation for CustomDomainConfigType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpooldomain-customdomainconfigtype.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for UserPoolResourceServer
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolresourceserver.html>`_
-    """
+        __slots__ = ("CertificateArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolDomainCustomDomainConfigType", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Cognito::UserPoolResourceServer"
+        def __init__(self, *, CertificateArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _init_PropertyType(self, kwargs)
 
-    Properties: UserPoolResourceServerProperties = attrib(
-        factory=UserPoolResourceServerProperties,
-        converter=create_object_converter(UserPoolResourceServerProperties),
+    _convert_UserPoolDomainCustomDomainConfigType = create_object_converter(
+        UserPoolDomainCustomDomainConfigType
     )
 
+    class UserPoolDomainProperties(_ResourceProperties):
+        __slots__ = ("CustomDomainConfig", "Domain", "UserPoolId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolDomainProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CustomDomainConfig": _convert_UserPoolDomainCustomDomainConfigType
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CustomDomainConfig=None, Domain=None, UserPoolId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CustomDomainConfig",
+                _convert_UserPoolDomainCustomDomainConfigType(CustomDomainConfig),
+            )
+            _setattr("Domain", Domain)
+            _setattr("UserPoolId", UserPoolId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolDomainProperties = create_object_converter(
+        UserPoolDomainProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class UserPoolRiskConfigurationAttachmentProperties(ResourceProperties):
-    AccountTakeoverRiskConfiguration = attrib(default=None)
-    ClientId = attrib(default=None)
-    CompromisedCredentialsRiskConfiguration = attrib(default=None)
-    RiskExceptionConfiguration = attrib(default=None)
-    UserPoolId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class UserPoolRiskConfigurationAttachment(Resource):
-    """A User Pool Risk Configuration Attachment for Cognito.
-
-    See Also:
-        `AWS Cloud Formation documentation for UserPoolRiskConfigurationAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolriskconfigurationattachment.html>`_
-    """
+    class UserPoolDomain(_Resource):
+        """A User Pool Domain for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolDomain
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpooldomain.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPoolDomain"
+
+        Properties: UserPoolDomainProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolDomain",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserPoolDomainProperties},
+            factories={"Properties": UserPoolDomainProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolDomainProperties()
+            _setattr("Properties", _convert_UserPoolDomainProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        UserPoolDomain,
+        UserPoolDomainProperties,
+        UserPoolDomainCustomDomainConfigType,
+    )
 
-    RESOURCE_TYPE = "AWS::Cognito::UserPoolRiskConfigurationAttachment"
 
-    Properties: UserPoolRiskConfigurationAttachmentProperties = attrib(
-        factory=UserPoolRiskConfigurationAttachmentProperties,
-        converter=create_object_converter(
-            UserPoolRiskConfigurationAttachmentProperties
-        ),
+def _create_UserPoolGroup():
+    class UserPoolGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "GroupName", "Precedence", "RoleArn", "UserPoolId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolGroupProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            GroupName=None,
+            Precedence=None,
+            RoleArn=None,
+            UserPoolId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("GroupName", GroupName)
+            _setattr("Precedence", Precedence)
+            _setattr("RoleArn", RoleArn)
+            _setattr("UserPoolId", UserPoolId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolGroupProperties = create_object_converter(UserPoolGroupProperties)
+
+    class UserPoolGroup(_Resource):
+        """A User Pool Group for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPoolGroup"
+
+        Properties: UserPoolGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserPoolGroupProperties},
+            factories={"Properties": UserPoolGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolGroupProperties()
+            _setattr("Properties", _convert_UserPoolGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return UserPoolGroup, UserPoolGroupProperties
+
+
+def _create_UserPoolIdentityProvider():
+    class UserPoolIdentityProviderProperties(_ResourceProperties):
+        __slots__ = (
+            "AttributeMapping",
+            "IdpIdentifiers",
+            "ProviderDetails",
+            "ProviderName",
+            "ProviderType",
+            "UserPoolId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolIdentityProviderProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AttributeMapping=None,
+            IdpIdentifiers=None,
+            ProviderDetails=None,
+            ProviderName=None,
+            ProviderType=None,
+            UserPoolId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AttributeMapping", AttributeMapping)
+            _setattr("IdpIdentifiers", IdpIdentifiers)
+            _setattr("ProviderDetails", ProviderDetails)
+            _setattr("ProviderName", ProviderName)
+            _setattr("ProviderType", ProviderType)
+            _setattr("UserPoolId", UserPoolId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolIdentityProviderProperties = create_object_converter(
+        UserPoolIdentityProviderProperties
     )
 
+    class UserPoolIdentityProvider(_Resource):
+        """A User Pool Identity Provider for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolIdentityProvider
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolidentityprovider.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPoolIdentityProvider"
+
+        Properties: UserPoolIdentityProviderProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolIdentityProvider",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserPoolIdentityProviderProperties},
+            factories={"Properties": UserPoolIdentityProviderProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolIdentityProviderProperties()
+            _setattr(
+                "Properties", _convert_UserPoolIdentityProviderProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return UserPoolIdentityProvider, UserPoolIdentityProviderProperties
+
+
+def _create_UserPoolResourceServer():
+    class UserPoolResourceServerResourceServerScopeType(_PropertyType):
+        """The Resource Server Scope Type property type for UserPoolResourceServer in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceServerScopeType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolresourceserver-resourceserverscopetype.html>`_
+        """
+
+        __slots__ = ("ScopeDescription", "ScopeName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolResourceServerResourceServerScopeType", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ScopeDescription=None, ScopeName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ScopeDescription", ScopeDescription)
+            _setattr("ScopeName", ScopeName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolResourceServerResourceServerScopeType_list = (
+        create_object_list_converter(UserPoolResourceServerResourceServerScopeType)
+    )
 
-@attrs(**ATTRSCONFIG)
-class UserPoolUICustomizationAttachmentProperties(ResourceProperties):
-    ClientId = attrib(default=None)
-    CSS = attrib(default=None)
-    UserPoolId = attrib(default=None)
+    class UserPoolResourceServerProperties(_ResourceProperties):
+        __slots__ = ("Identifier", "Name", "Scopes", "UserPoolId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolResourceServerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Scopes": _convert_UserPoolResourceServerResourceServerScopeType_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Identifier=None, Name=None, Scopes=None, UserPoolId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Identifier", Identifier)
+            _setattr("Name", Name)
+            _setattr(
+                "Scopes",
+                _convert_UserPoolResourceServerResourceServerScopeType_list(Scopes),
+            )
+            _setattr("UserPoolId", UserPoolId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolResourceServerProperties = create_object_converter(
+        UserPoolResourceServerProperties
+    )
 
+    class UserPoolResourceServer(_Resource):
+        """A User Pool Resource Server for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolResourceServer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolresourceserver.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPoolResourceServer"
+
+        Properties: UserPoolResourceServerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolResourceServer",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserPoolResourceServerProperties},
+            factories={"Properties": UserPoolResourceServerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolResourceServerProperties()
+            _setattr(
+                "Properties", _convert_UserPoolResourceServerProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        UserPoolResourceServer,
+        UserPoolResourceServerProperties,
+        UserPoolResourceServerResourceServerScopeType,
+    )
 
-@attrs(**ATTRSCONFIG)
-class UserPoolUICustomizationAttachment(Resource):
-    """A User Pool Ui Customization Attachment for Cognito.
 
-    See Also:
-        `AWS Cloud Formation documentation for UserPoolUICustomizationAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpooluicustomizationattachment.html>`_
-    """
+def _create_UserPoolRiskConfigurationAttachment():
+    class UserPoolRiskConfigurationAttachmentAccountTakeoverActionType(_PropertyType):
+        """The Account Takeover Action Type property type for UserPoolRiskConfigurationAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccountTakeoverActionType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolriskconfigurationattachment-accounttakeoveractiontype.html>`_
+        """
+
+        __slots__ = ("EventAction", "Notify")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachmentAccountTakeoverActionType",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EventAction=None, Notify=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EventAction", EventAction)
+            _setattr("Notify", Notify)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionType = (
+        create_object_converter(
+            UserPoolRiskConfigurationAttachmentAccountTakeoverActionType
+        )
+    )
 
-    RESOURCE_TYPE = "AWS::Cognito::UserPoolUICustomizationAttachment"
+    class UserPoolRiskConfigurationAttachmentAccountTakeoverActionsType(_PropertyType):
+        """The Account Takeover Actions Type property type for UserPoolRiskConfigurationAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccountTakeoverActionsType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolriskconfigurationattachment-accounttakeoveractionstype.html>`_
+        """
+
+        __slots__ = ("HighAction", "LowAction", "MediumAction")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachmentAccountTakeoverActionsType",
+            _PropertyType,
+            __slots__,
+            converters={
+                "HighAction": _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionType,
+                "LowAction": _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionType,
+                "MediumAction": _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionType,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, HighAction=None, LowAction=None, MediumAction=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "HighAction",
+                _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionType(
+                    HighAction
+                ),
+            )
+            _setattr(
+                "LowAction",
+                _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionType(
+                    LowAction
+                ),
+            )
+            _setattr(
+                "MediumAction",
+                _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionType(
+                    MediumAction
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolRiskConfigurationAttachmentNotifyEmailType(_PropertyType):
+        """The Notify Email Type property type for UserPoolRiskConfigurationAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotifyEmailType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolriskconfigurationattachment-notifyemailtype.html>`_
+        """
+
+        __slots__ = ("HtmlBody", "Subject", "TextBody")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachmentNotifyEmailType",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, HtmlBody=None, Subject=None, TextBody=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HtmlBody", HtmlBody)
+            _setattr("Subject", Subject)
+            _setattr("TextBody", TextBody)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolRiskConfigurationAttachmentNotifyEmailType = (
+        create_object_converter(UserPoolRiskConfigurationAttachmentNotifyEmailType)
+    )
 
-    Properties: UserPoolUICustomizationAttachmentProperties = attrib(
-        factory=UserPoolUICustomizationAttachmentProperties,
-        converter=create_object_converter(UserPoolUICustomizationAttachmentProperties),
+    class UserPoolRiskConfigurationAttachmentNotifyConfigurationType(_PropertyType):
+        """The Notify Configuration Type property type for UserPoolRiskConfigurationAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotifyConfigurationType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolriskconfigurationattachment-notifyconfigurationtype.html>`_
+        """
+
+        __slots__ = (
+            "BlockEmail",
+            "From",
+            "MfaEmail",
+            "NoActionEmail",
+            "ReplyTo",
+            "SourceArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachmentNotifyConfigurationType",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BlockEmail": _convert_UserPoolRiskConfigurationAttachmentNotifyEmailType,
+                "MfaEmail": _convert_UserPoolRiskConfigurationAttachmentNotifyEmailType,
+                "NoActionEmail": _convert_UserPoolRiskConfigurationAttachmentNotifyEmailType,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockEmail=None,
+            From=None,
+            MfaEmail=None,
+            NoActionEmail=None,
+            ReplyTo=None,
+            SourceArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "BlockEmail",
+                _convert_UserPoolRiskConfigurationAttachmentNotifyEmailType(BlockEmail),
+            )
+            _setattr("From", From)
+            _setattr(
+                "MfaEmail",
+                _convert_UserPoolRiskConfigurationAttachmentNotifyEmailType(MfaEmail),
+            )
+            _setattr(
+                "NoActionEmail",
+                _convert_UserPoolRiskConfigurationAttachmentNotifyEmailType(
+                    NoActionEmail
+                ),
+            )
+            _setattr("ReplyTo", ReplyTo)
+            _setattr("SourceArn", SourceArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionsType = (
+        create_object_converter(
+            UserPoolRiskConfigurationAttachmentAccountTakeoverActionsType
+        )
+    )
+    _convert_UserPoolRiskConfigurationAttachmentNotifyConfigurationType = (
+        create_object_converter(
+            UserPoolRiskConfigurationAttachmentNotifyConfigurationType
+        )
     )
 
+    class UserPoolRiskConfigurationAttachmentAccountTakeoverRiskConfigurationType(
+        _PropertyType
+    ):
+        """The Account Takeover Risk Configuration Type property type for UserPoolRiskConfigurationAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccountTakeoverRiskConfigurationType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolriskconfigurationattachment-accounttakeoverriskconfigurationtype.html>`_
+        """
+
+        __slots__ = ("Actions", "NotifyConfiguration")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachmentAccountTakeoverRiskConfigurationType",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Actions": _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionsType,
+                "NotifyConfiguration": _convert_UserPoolRiskConfigurationAttachmentNotifyConfigurationType,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Actions=None, NotifyConfiguration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Actions",
+                _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverActionsType(
+                    Actions
+                ),
+            )
+            _setattr(
+                "NotifyConfiguration",
+                _convert_UserPoolRiskConfigurationAttachmentNotifyConfigurationType(
+                    NotifyConfiguration
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolRiskConfigurationAttachmentCompromisedCredentialsActionsType(
+        _PropertyType
+    ):
+        """The Compromised Credentials Actions Type property type for UserPoolRiskConfigurationAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for CompromisedCredentialsActionsType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolriskconfigurationattachment-compromisedcredentialsactionstype.html>`_
+        """
+
+        __slots__ = ("EventAction",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachmentCompromisedCredentialsActionsType",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EventAction=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EventAction", EventAction)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolRiskConfigurationAttachmentCompromisedCredentialsActionsType = (
+        create_object_converter(
+            UserPoolRiskConfigurationAttachmentCompromisedCredentialsActionsType
+        )
+    )
 
-@attrs(**ATTRSCONFIG)
-class UserPoolUserProperties(ResourceProperties):
-    ClientMetadata = attrib(default=None)
-    DesiredDeliveryMediums = attrib(default=None)
-    ForceAliasCreation = attrib(default=None)
-    MessageAction = attrib(default=None)
-    UserAttributes = attrib(default=None)
-    Username = attrib(default=None)
-    UserPoolId = attrib(default=None)
-    ValidationData = attrib(default=None)
+    class UserPoolRiskConfigurationAttachmentCompromisedCredentialsRiskConfigurationType(
+        _PropertyType
+    ):
+        """The Compromised Credentials Risk Configuration Type property type for UserPoolRiskConfigurationAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for CompromisedCredentialsRiskConfigurationType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolriskconfigurationattachment-compromisedcredentialsriskconfigurationtype.html>`_
+        """
+
+        __slots__ = ("Actions", "EventFilter")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachmentCompromisedCredentialsRiskConfigurationType",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Actions": _convert_UserPoolRiskConfigurationAttachmentCompromisedCredentialsActionsType
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Actions=None, EventFilter=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Actions",
+                _convert_UserPoolRiskConfigurationAttachmentCompromisedCredentialsActionsType(
+                    Actions
+                ),
+            )
+            _setattr("EventFilter", EventFilter)
+            _init_PropertyType(self, kwargs)
+
+    class UserPoolRiskConfigurationAttachmentRiskExceptionConfigurationType(
+        _PropertyType
+    ):
+        """The Risk Exception Configuration Type property type for UserPoolRiskConfigurationAttachment in Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for RiskExceptionConfigurationType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpoolriskconfigurationattachment-riskexceptionconfigurationtype.html>`_
+        """
+
+        __slots__ = ("BlockedIPRangeList", "SkippedIPRangeList")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachmentRiskExceptionConfigurationType",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BlockedIPRangeList=None, SkippedIPRangeList=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BlockedIPRangeList", BlockedIPRangeList)
+            _setattr("SkippedIPRangeList", SkippedIPRangeList)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverRiskConfigurationType = (
+        create_object_converter(
+            UserPoolRiskConfigurationAttachmentAccountTakeoverRiskConfigurationType
+        )
+    )
+    _convert_UserPoolRiskConfigurationAttachmentCompromisedCredentialsRiskConfigurationType = create_object_converter(
+        UserPoolRiskConfigurationAttachmentCompromisedCredentialsRiskConfigurationType
+    )
+    _convert_UserPoolRiskConfigurationAttachmentRiskExceptionConfigurationType = (
+        create_object_converter(
+            UserPoolRiskConfigurationAttachmentRiskExceptionConfigurationType
+        )
+    )
 
+    class UserPoolRiskConfigurationAttachmentProperties(_ResourceProperties):
+        __slots__ = (
+            "AccountTakeoverRiskConfiguration",
+            "ClientId",
+            "CompromisedCredentialsRiskConfiguration",
+            "RiskExceptionConfiguration",
+            "UserPoolId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachmentProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AccountTakeoverRiskConfiguration": _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverRiskConfigurationType,
+                "CompromisedCredentialsRiskConfiguration": _convert_UserPoolRiskConfigurationAttachmentCompromisedCredentialsRiskConfigurationType,
+                "RiskExceptionConfiguration": _convert_UserPoolRiskConfigurationAttachmentRiskExceptionConfigurationType,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccountTakeoverRiskConfiguration=None,
+            ClientId=None,
+            CompromisedCredentialsRiskConfiguration=None,
+            RiskExceptionConfiguration=None,
+            UserPoolId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccountTakeoverRiskConfiguration",
+                _convert_UserPoolRiskConfigurationAttachmentAccountTakeoverRiskConfigurationType(
+                    AccountTakeoverRiskConfiguration
+                ),
+            )
+            _setattr("ClientId", ClientId)
+            _setattr(
+                "CompromisedCredentialsRiskConfiguration",
+                _convert_UserPoolRiskConfigurationAttachmentCompromisedCredentialsRiskConfigurationType(
+                    CompromisedCredentialsRiskConfiguration
+                ),
+            )
+            _setattr(
+                "RiskExceptionConfiguration",
+                _convert_UserPoolRiskConfigurationAttachmentRiskExceptionConfigurationType(
+                    RiskExceptionConfiguration
+                ),
+            )
+            _setattr("UserPoolId", UserPoolId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolRiskConfigurationAttachmentProperties = create_object_converter(
+        UserPoolRiskConfigurationAttachmentProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class UserPoolUser(Resource):
-    """A User Pool User for Cognito.
+    class UserPoolRiskConfigurationAttachment(_Resource):
+        """A User Pool Risk Configuration Attachment for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolRiskConfigurationAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolriskconfigurationattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPoolRiskConfigurationAttachment"
+
+        Properties: UserPoolRiskConfigurationAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolRiskConfigurationAttachment",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_UserPoolRiskConfigurationAttachmentProperties
+            },
+            factories={"Properties": UserPoolRiskConfigurationAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolRiskConfigurationAttachmentProperties()
+            _setattr(
+                "Properties",
+                _convert_UserPoolRiskConfigurationAttachmentProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        UserPoolRiskConfigurationAttachment,
+        UserPoolRiskConfigurationAttachmentProperties,
+        UserPoolRiskConfigurationAttachmentAccountTakeoverActionType,
+        UserPoolRiskConfigurationAttachmentAccountTakeoverActionsType,
+        UserPoolRiskConfigurationAttachmentNotifyEmailType,
+        UserPoolRiskConfigurationAttachmentNotifyConfigurationType,
+        UserPoolRiskConfigurationAttachmentAccountTakeoverRiskConfigurationType,
+        UserPoolRiskConfigurationAttachmentCompromisedCredentialsActionsType,
+        UserPoolRiskConfigurationAttachmentCompromisedCredentialsRiskConfigurationType,
+        UserPoolRiskConfigurationAttachmentRiskExceptionConfigurationType,
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for UserPoolUser
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpooluser.html>`_
-    """
 
-    RESOURCE_TYPE = "AWS::Cognito::UserPoolUser"
+def _create_UserPoolUICustomizationAttachment():
+    class UserPoolUICustomizationAttachmentProperties(_ResourceProperties):
+        __slots__ = ("ClientId", "CSS", "UserPoolId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolUICustomizationAttachmentProperties",
+            _ResourceProperties,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ClientId=None, CSS=None, UserPoolId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClientId", ClientId)
+            _setattr("CSS", CSS)
+            _setattr("UserPoolId", UserPoolId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolUICustomizationAttachmentProperties = create_object_converter(
+        UserPoolUICustomizationAttachmentProperties
+    )
 
-    Properties: UserPoolUserProperties = attrib(
-        factory=UserPoolUserProperties,
-        converter=create_object_converter(UserPoolUserProperties),
+    class UserPoolUICustomizationAttachment(_Resource):
+        """A User Pool Ui Customization Attachment for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolUICustomizationAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpooluicustomizationattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPoolUICustomizationAttachment"
+
+        Properties: UserPoolUICustomizationAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolUICustomizationAttachment",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_UserPoolUICustomizationAttachmentProperties
+            },
+            factories={"Properties": UserPoolUICustomizationAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolUICustomizationAttachmentProperties()
+            _setattr(
+                "Properties",
+                _convert_UserPoolUICustomizationAttachmentProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        UserPoolUICustomizationAttachment,
+        UserPoolUICustomizationAttachmentProperties,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class UserPoolUserToGroupAttachmentProperties(ResourceProperties):
-    GroupName = attrib(default=None)
-    Username = attrib(default=None)
-    UserPoolId = attrib(default=None)
+def _create_UserPoolUser():
+    class UserPoolUserAttributeType(_PropertyType):
+        """The Attribute Type property type for UserPoolUser in Cognito.
 
+        See Also:
+            `AWS Cloud Formation documentation for AttributeType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-cognito-userpooluser-attributetype.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class UserPoolUserToGroupAttachment(Resource):
-    """A User Pool User To Group Attachment for Cognito.
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolUserAttributeType", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for UserPoolUserToGroupAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolusertogroupattachment.html>`_
-    """
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::Cognito::UserPoolUserToGroupAttachment"
+    _convert_UserPoolUserAttributeType_list = create_object_list_converter(
+        UserPoolUserAttributeType
+    )
 
-    Properties: UserPoolUserToGroupAttachmentProperties = attrib(
-        factory=UserPoolUserToGroupAttachmentProperties,
-        converter=create_object_converter(UserPoolUserToGroupAttachmentProperties),
+    class UserPoolUserProperties(_ResourceProperties):
+        __slots__ = (
+            "ClientMetadata",
+            "DesiredDeliveryMediums",
+            "ForceAliasCreation",
+            "MessageAction",
+            "UserAttributes",
+            "Username",
+            "UserPoolId",
+            "ValidationData",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolUserProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "UserAttributes": _convert_UserPoolUserAttributeType_list,
+                "ValidationData": _convert_UserPoolUserAttributeType_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ClientMetadata=None,
+            DesiredDeliveryMediums=None,
+            ForceAliasCreation=None,
+            MessageAction=None,
+            UserAttributes=None,
+            Username=None,
+            UserPoolId=None,
+            ValidationData=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClientMetadata", ClientMetadata)
+            _setattr("DesiredDeliveryMediums", DesiredDeliveryMediums)
+            _setattr("ForceAliasCreation", ForceAliasCreation)
+            _setattr("MessageAction", MessageAction)
+            _setattr(
+                "UserAttributes",
+                _convert_UserPoolUserAttributeType_list(UserAttributes),
+            )
+            _setattr("Username", Username)
+            _setattr("UserPoolId", UserPoolId)
+            _setattr(
+                "ValidationData",
+                _convert_UserPoolUserAttributeType_list(ValidationData),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolUserProperties = create_object_converter(UserPoolUserProperties)
+
+    class UserPoolUser(_Resource):
+        """A User Pool User for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolUser
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpooluser.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPoolUser"
+
+        Properties: UserPoolUserProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolUser",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserPoolUserProperties},
+            factories={"Properties": UserPoolUserProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolUserProperties()
+            _setattr("Properties", _convert_UserPoolUserProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return UserPoolUser, UserPoolUserProperties, UserPoolUserAttributeType
+
+
+def _create_UserPoolUserToGroupAttachment():
+    class UserPoolUserToGroupAttachmentProperties(_ResourceProperties):
+        __slots__ = ("GroupName", "Username", "UserPoolId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolUserToGroupAttachmentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, GroupName=None, Username=None, UserPoolId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GroupName", GroupName)
+            _setattr("Username", Username)
+            _setattr("UserPoolId", UserPoolId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserPoolUserToGroupAttachmentProperties = create_object_converter(
+        UserPoolUserToGroupAttachmentProperties
     )
+
+    class UserPoolUserToGroupAttachment(_Resource):
+        """A User Pool User To Group Attachment for Cognito.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserPoolUserToGroupAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-cognito-userpoolusertogroupattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Cognito::UserPoolUserToGroupAttachment"
+
+        Properties: UserPoolUserToGroupAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPoolUserToGroupAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserPoolUserToGroupAttachmentProperties},
+            factories={"Properties": UserPoolUserToGroupAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserPoolUserToGroupAttachmentProperties()
+            _setattr(
+                "Properties",
+                _convert_UserPoolUserToGroupAttachmentProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return UserPoolUserToGroupAttachment, UserPoolUserToGroupAttachmentProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "IdentityPool": _create_IdentityPool,
+        "IdentityPoolProperties": _create_IdentityPool,
+        "IdentityPoolCognitoIdentityProvider": _create_IdentityPool,
+        "IdentityPoolCognitoStreams": _create_IdentityPool,
+        "IdentityPoolPushSync": _create_IdentityPool,
+        "IdentityPoolRoleAttachment": _create_IdentityPoolRoleAttachment,
+        "IdentityPoolRoleAttachmentProperties": _create_IdentityPoolRoleAttachment,
+        "IdentityPoolRoleAttachmentMappingRule": _create_IdentityPoolRoleAttachment,
+        "IdentityPoolRoleAttachmentRoleMapping": _create_IdentityPoolRoleAttachment,
+        "IdentityPoolRoleAttachmentRulesConfigurationType": _create_IdentityPoolRoleAttachment,
+        "UserPool": _create_UserPool,
+        "UserPoolProperties": _create_UserPool,
+        "UserPoolAdminCreateUserConfig": _create_UserPool,
+        "UserPoolDeviceConfiguration": _create_UserPool,
+        "UserPoolEmailConfiguration": _create_UserPool,
+        "UserPoolInviteMessageTemplate": _create_UserPool,
+        "UserPoolLambdaConfig": _create_UserPool,
+        "UserPoolNumberAttributeConstraints": _create_UserPool,
+        "UserPoolPasswordPolicy": _create_UserPool,
+        "UserPoolPolicies": _create_UserPool,
+        "UserPoolSchemaAttribute": _create_UserPool,
+        "UserPoolSmsConfiguration": _create_UserPool,
+        "UserPoolStringAttributeConstraints": _create_UserPool,
+        "UserPoolUserPoolAddOns": _create_UserPool,
+        "UserPoolVerificationMessageTemplate": _create_UserPool,
+        "UserPoolClient": _create_UserPoolClient,
+        "UserPoolClientProperties": _create_UserPoolClient,
+        "UserPoolClientAnalyticsConfiguration": _create_UserPoolClient,
+        "UserPoolDomain": _create_UserPoolDomain,
+        "UserPoolDomainProperties": _create_UserPoolDomain,
+        "UserPoolDomainCustomDomainConfigType": _create_UserPoolDomain,
+        "UserPoolGroup": _create_UserPoolGroup,
+        "UserPoolGroupProperties": _create_UserPoolGroup,
+        "UserPoolIdentityProvider": _create_UserPoolIdentityProvider,
+        "UserPoolIdentityProviderProperties": _create_UserPoolIdentityProvider,
+        "UserPoolResourceServer": _create_UserPoolResourceServer,
+        "UserPoolResourceServerProperties": _create_UserPoolResourceServer,
+        "UserPoolResourceServerResourceServerScopeType": _create_UserPoolResourceServer,
+        "UserPoolRiskConfigurationAttachment": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolRiskConfigurationAttachmentProperties": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolRiskConfigurationAttachmentAccountTakeoverActionsType": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolRiskConfigurationAttachmentAccountTakeoverActionType": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolRiskConfigurationAttachmentAccountTakeoverRiskConfigurationType": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolRiskConfigurationAttachmentCompromisedCredentialsActionsType": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolRiskConfigurationAttachmentCompromisedCredentialsRiskConfigurationType": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolRiskConfigurationAttachmentNotifyConfigurationType": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolRiskConfigurationAttachmentNotifyEmailType": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolRiskConfigurationAttachmentRiskExceptionConfigurationType": _create_UserPoolRiskConfigurationAttachment,
+        "UserPoolUICustomizationAttachment": _create_UserPoolUICustomizationAttachment,
+        "UserPoolUICustomizationAttachmentProperties": _create_UserPoolUICustomizationAttachment,
+        "UserPoolUser": _create_UserPoolUser,
+        "UserPoolUserProperties": _create_UserPoolUser,
+        "UserPoolUserAttributeType": _create_UserPoolUser,
+        "UserPoolUserToGroupAttachment": _create_UserPoolUserToGroupAttachment,
+        "UserPoolUserToGroupAttachmentProperties": _create_UserPoolUserToGroupAttachment,
+    },
+)
@@ -7,207 +7,1155 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "AggregationAuthorization",
     "AggregationAuthorizationProperties",
     "ConfigRule",
     "ConfigRuleProperties",
+    "ConfigRuleScope",
+    "ConfigRuleSource",
+    "ConfigRuleSourceDetail",
     "ConfigurationAggregator",
     "ConfigurationAggregatorProperties",
+    "ConfigurationAggregatorAccountAggregationSource",
+    "ConfigurationAggregatorOrganizationAggregationSource",
     "ConfigurationRecorder",
     "ConfigurationRecorderProperties",
+    "ConfigurationRecorderRecordingGroup",
     "DeliveryChannel",
     "DeliveryChannelProperties",
+    "DeliveryChannelConfigSnapshotDeliveryProperties",
     "OrganizationConfigRule",
     "OrganizationConfigRuleProperties",
+    "OrganizationConfigRuleOrganizationCustomRuleMetadata",
+    "OrganizationConfigRuleOrganizationManagedRuleMetadata",
     "RemediationConfiguration",
     "RemediationConfigurationProperties",
+    "RemediationConfigurationExecutionControls",
+    "RemediationConfigurationRemediationParameterValue",
+    "RemediationConfigurationResourceValue",
+    "RemediationConfigurationSsmControls",
+    "RemediationConfigurationStaticValue",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AggregationAuthorizationProperties(ResourceProperties):
-    AuthorizedAccountId = attrib(default=None)
-    AuthorizedAwsRegion = attrib(default=None)
+def _create_AggregationAuthorization():
+    class AggregationAuthorizationProperties(_ResourceProperties):
+        __slots__ = ("AuthorizedAccountId", "AuthorizedAwsRegion")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AggregationAuthorizationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AuthorizedAccountId=None, AuthorizedAwsRegion=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AuthorizedAccountId", AuthorizedAccountId)
+            _setattr("AuthorizedAwsRegion", AuthorizedAwsRegion)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AggregationAuthorizationProperties = create_object_converter(
+        AggregationAuthorizationProperties
+    )
+
+    class AggregationAuthorization(_Resource):
+        """A Aggregation Authorization for Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for AggregationAuthorization
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-aggregationauthorization.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Config::AggregationAuthorization"
+
+        Properties: AggregationAuthorizationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AggregationAuthorization",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AggregationAuthorizationProperties},
+            factories={"Properties": AggregationAuthorizationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AggregationAuthorizationProperties()
+            _setattr(
+                "Properties", _convert_AggregationAuthorizationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return AggregationAuthorization, AggregationAuthorizationProperties
+
+
+def _create_ConfigRule():
+    class ConfigRuleScope(_PropertyType):
+        """The Scope property type for ConfigRule in Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for Scope
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-configrule-scope.html>`_
+        """
+
+        __slots__ = (
+            "ComplianceResourceId",
+            "ComplianceResourceTypes",
+            "TagKey",
+            "TagValue",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigRuleScope", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ComplianceResourceId=None,
+            ComplianceResourceTypes=None,
+            TagKey=None,
+            TagValue=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComplianceResourceId", ComplianceResourceId)
+            _setattr("ComplianceResourceTypes", ComplianceResourceTypes)
+            _setattr("TagKey", TagKey)
+            _setattr("TagValue", TagValue)
+            _init_PropertyType(self, kwargs)
+
+    class ConfigRuleSourceDetail(_PropertyType):
+        """The Source Detail property type for ConfigRule in Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for SourceDetail
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-configrule-source-sourcedetails.html>`_
+        """
+
+        __slots__ = ("EventSource", "MaximumExecutionFrequency", "MessageType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigRuleSourceDetail", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EventSource=None,
+            MaximumExecutionFrequency=None,
+            MessageType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EventSource", EventSource)
+            _setattr("MaximumExecutionFrequency", MaximumExecutionFrequency)
+            _setattr("MessageType", MessageType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigRuleSourceDetail_list = create_object_list_converter(
+        ConfigRuleSourceDetail
+    )
+
+    class ConfigRuleSource(_PropertyType):
+        """The Source property type for ConfigRule in Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for Source
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-configrule-source.html>`_
+        """
+
+        __slots__ = ("Owner", "SourceDetails", "SourceIdentifier")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigRuleSource",
+            _PropertyType,
+            __slots__,
+            converters={"SourceDetails": _convert_ConfigRuleSourceDetail_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Owner=None, SourceDetails=None, SourceIdentifier=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Owner", Owner)
+            _setattr(
+                "SourceDetails", _convert_ConfigRuleSourceDetail_list(SourceDetails)
+            )
+            _setattr("SourceIdentifier", SourceIdentifier)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigRuleScope = create_object_converter(ConfigRuleScope)
+    _convert_ConfigRuleSource = create_object_converter(ConfigRuleSource)
+
+    class ConfigRuleProperties(_ResourceProperties):
+        __slots__ = (
+            "ConfigRuleName",
+            "Description",
+            "InputParameters",
+            "MaximumExecutionFrequency",
+            "Scope",
+            "Source",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigRuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Scope": _convert_ConfigRuleScope,
+                "Source": _convert_ConfigRuleSource,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConfigRuleName=None,
+            Description=None,
+            InputParameters=None,
+            MaximumExecutionFrequency=None,
+            Scope=None,
+            Source=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConfigRuleName", ConfigRuleName)
+            _setattr("Description", Description)
+            _setattr("InputParameters", InputParameters)
+            _setattr("MaximumExecutionFrequency", MaximumExecutionFrequency)
+            _setattr("Scope", _convert_ConfigRuleScope(Scope))
+            _setattr("Source", _convert_ConfigRuleSource(Source))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConfigRuleProperties = create_object_converter(ConfigRuleProperties)
+
+    class ConfigRule(_Resource):
+        """A Config Rule for Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-configrule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Config::ConfigRule"
+
+        Properties: ConfigRuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConfigRuleProperties},
+            factories={"Properties": ConfigRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigRuleProperties()
+            _setattr("Properties", _convert_ConfigRuleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ConfigRule,
+        ConfigRuleProperties,
+        ConfigRuleScope,
+        ConfigRuleSourceDetail,
+        ConfigRuleSource,
+    )
+
+
+def _create_ConfigurationAggregator():
+    class ConfigurationAggregatorAccountAggregationSource(_PropertyType):
+        """The Account Aggregation Source property type for ConfigurationAggregator in Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccountAggregationSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-configurationaggregator-accountaggregationsource.html>`_
+        """
+
+        __slots__ = ("AccountIds", "AllAwsRegions", "AwsRegions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationAggregatorAccountAggregationSource", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AccountIds=None, AllAwsRegions=None, AwsRegions=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccountIds", AccountIds)
+            _setattr("AllAwsRegions", AllAwsRegions)
+            _setattr("AwsRegions", AwsRegions)
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationAggregatorOrganizationAggregationSource(_PropertyType):
+        """The Organization Aggregation Source property type for ConfigurationAggregator in Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for OrganizationAggregationSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-configurationaggregator-organizationaggregationsource.html>`_
+        """
+
+        __slots__ = ("AllAwsRegions", "AwsRegions", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationAggregatorOrganizationAggregationSource",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AllAwsRegions=None, AwsRegions=None, RoleArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllAwsRegions", AllAwsRegions)
+            _setattr("AwsRegions", AwsRegions)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationAggregatorAccountAggregationSource_list = (
+        create_object_list_converter(ConfigurationAggregatorAccountAggregationSource)
+    )
+    _convert_ConfigurationAggregatorOrganizationAggregationSource = (
+        create_object_converter(ConfigurationAggregatorOrganizationAggregationSource)
+    )
+
+    class ConfigurationAggregatorProperties(_ResourceProperties):
+        __slots__ = (
+            "AccountAggregationSources",
+            "ConfigurationAggregatorName",
+            "OrganizationAggregationSource",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationAggregatorProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AccountAggregationSources": _convert_ConfigurationAggregatorAccountAggregationSource_list,
+                "OrganizationAggregationSource": _convert_ConfigurationAggregatorOrganizationAggregationSource,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccountAggregationSources=None,
+            ConfigurationAggregatorName=None,
+            OrganizationAggregationSource=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccountAggregationSources",
+                _convert_ConfigurationAggregatorAccountAggregationSource_list(
+                    AccountAggregationSources
+                ),
+            )
+            _setattr("ConfigurationAggregatorName", ConfigurationAggregatorName)
+            _setattr(
+                "OrganizationAggregationSource",
+                _convert_ConfigurationAggregatorOrganizationAggregationSource(
+                    OrganizationAggregationSource
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConfigurationAggregatorProperties = create_object_converter(
+        ConfigurationAggregatorProperties
+    )
+
+    class ConfigurationAggregator(_Resource):
+        """A Configuration Aggregator for Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationAggregator
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-configurationaggregator.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::Config::ConfigurationAggregator"
 
-@attrs(**ATTRSCONFIG)
-class AggregationAuthorization(Resource):
-    """A Aggregation Authorization for Config.
+        Properties: ConfigurationAggregatorProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for AggregationAuthorization
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-aggregationauthorization.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationAggregator",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConfigurationAggregatorProperties},
+            factories={"Properties": ConfigurationAggregatorProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Config::AggregationAuthorization"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigurationAggregatorProperties()
+            _setattr(
+                "Properties", _convert_ConfigurationAggregatorProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
 
-    Properties: AggregationAuthorizationProperties = attrib(
-        factory=AggregationAuthorizationProperties,
-        converter=create_object_converter(AggregationAuthorizationProperties),
+    return (
+        ConfigurationAggregator,
+        ConfigurationAggregatorProperties,
+        ConfigurationAggregatorAccountAggregationSource,
+        ConfigurationAggregatorOrganizationAggregationSource,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class ConfigRuleProperties(ResourceProperties):
-    ConfigRuleName = attrib(default=None)
-    Description = attrib(default=None)
-    InputParameters = attrib(default=None)
-    MaximumExecutionFrequency = attrib(default=None)
-    Scope = attrib(default=None)
-    Source = attrib(default=None)
+def _create_ConfigurationRecorder():
+    class ConfigurationRecorderRecordingGroup(_PropertyType):
+        """The Recording Group property type for ConfigurationRecorder in Config.
 
+        See Also:
+            `AWS Cloud Formation documentation for RecordingGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-configurationrecorder-recordinggroup.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class ConfigRule(Resource):
-    """A Config Rule for Config.
+        __slots__ = ("AllSupported", "IncludeGlobalResourceTypes", "ResourceTypes")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationRecorderRecordingGroup", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for ConfigRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-configrule.html>`_
-    """
+        def __init__(
+            self,
+            *,
+            AllSupported=None,
+            IncludeGlobalResourceTypes=None,
+            ResourceTypes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllSupported", AllSupported)
+            _setattr("IncludeGlobalResourceTypes", IncludeGlobalResourceTypes)
+            _setattr("ResourceTypes", ResourceTypes)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::Config::ConfigRule"
+    _convert_ConfigurationRecorderRecordingGroup = create_object_converter(
+        ConfigurationRecorderRecordingGroup
+    )
+
+    class ConfigurationRecorderProperties(_ResourceProperties):
+        __slots__ = ("Name", "RecordingGroup", "RoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationRecorderProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"RecordingGroup": _convert_ConfigurationRecorderRecordingGroup},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Name=None, RecordingGroup=None, RoleARN=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr(
+                "RecordingGroup",
+                _convert_ConfigurationRecorderRecordingGroup(RecordingGroup),
+            )
+            _setattr("RoleARN", RoleARN)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConfigurationRecorderProperties = create_object_converter(
+        ConfigurationRecorderProperties
+    )
+
+    class ConfigurationRecorder(_Resource):
+        """A Configuration Recorder for Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationRecorder
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-configurationrecorder.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Config::ConfigurationRecorder"
+
+        Properties: ConfigurationRecorderProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationRecorder",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConfigurationRecorderProperties},
+            factories={"Properties": ConfigurationRecorderProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigurationRecorderProperties()
+            _setattr("Properties", _convert_ConfigurationRecorderProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ConfigurationRecorder,
+        ConfigurationRecorderProperties,
+        ConfigurationRecorderRecordingGroup,
+    )
+
+
+def _create_DeliveryChannel():
+    class DeliveryChannelConfigSnapshotDeliveryProperties(_PropertyType):
+        """The Config Snapshot Delivery Properties property type for DeliveryChannel in Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigSnapshotDeliveryProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-deliverychannel-configsnapshotdeliveryproperties.html>`_
+        """
+
+        __slots__ = ("DeliveryFrequency",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryChannelConfigSnapshotDeliveryProperties", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DeliveryFrequency=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeliveryFrequency", DeliveryFrequency)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryChannelConfigSnapshotDeliveryProperties = create_object_converter(
+        DeliveryChannelConfigSnapshotDeliveryProperties
+    )
+
+    class DeliveryChannelProperties(_ResourceProperties):
+        __slots__ = (
+            "ConfigSnapshotDeliveryProperties",
+            "Name",
+            "S3BucketName",
+            "S3KeyPrefix",
+            "SnsTopicARN",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryChannelProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ConfigSnapshotDeliveryProperties": _convert_DeliveryChannelConfigSnapshotDeliveryProperties
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConfigSnapshotDeliveryProperties=None,
+            Name=None,
+            S3BucketName=None,
+            S3KeyPrefix=None,
+            SnsTopicARN=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ConfigSnapshotDeliveryProperties",
+                _convert_DeliveryChannelConfigSnapshotDeliveryProperties(
+                    ConfigSnapshotDeliveryProperties
+                ),
+            )
+            _setattr("Name", Name)
+            _setattr("S3BucketName", S3BucketName)
+            _setattr("S3KeyPrefix", S3KeyPrefix)
+            _setattr("SnsTopicARN", SnsTopicARN)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DeliveryChannelProperties = create_object_converter(
+        DeliveryChannelProperties
+    )
+
+    class DeliveryChannel(_Resource):
+        """A Delivery Channel for Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeliveryChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-deliverychannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Config::DeliveryChannel"
+
+        Properties: DeliveryChannelProperties
 
-    Properties: ConfigRuleProperties = attrib(
-        factory=ConfigRuleProperties,
-        converter=create_object_converter(ConfigRuleProperties),
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DeliveryChannelProperties},
+            factories={"Properties": DeliveryChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DeliveryChannelProperties()
+            _setattr("Properties", _convert_DeliveryChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        DeliveryChannel,
+        DeliveryChannelProperties,
+        DeliveryChannelConfigSnapshotDeliveryProperties,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationAggregatorProperties(ResourceProperties):
-    AccountAggregationSources = attrib(default=None)
-    ConfigurationAggregatorName = attrib(default=None)
-    OrganizationAggregationSource = attrib(default=None)
+def _create_OrganizationConfigRule():
+    class OrganizationConfigRuleOrganizationCustomRuleMetadata(_PropertyType):
+        """The Organization Custom Rule Metadata property type for OrganizationConfigRule in Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for OrganizationCustomRuleMetadata
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-organizationconfigrule-organizationcustomrulemetadata.html>`_
+        """
+
+        __slots__ = (
+            "Description",
+            "InputParameters",
+            "LambdaFunctionArn",
+            "MaximumExecutionFrequency",
+            "OrganizationConfigRuleTriggerTypes",
+            "ResourceIdScope",
+            "ResourceTypesScope",
+            "TagKeyScope",
+            "TagValueScope",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "OrganizationConfigRuleOrganizationCustomRuleMetadata",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            InputParameters=None,
+            LambdaFunctionArn=None,
+            MaximumExecutionFrequency=None,
+            OrganizationConfigRuleTriggerTypes=None,
+            ResourceIdScope=None,
+            ResourceTypesScope=None,
+            TagKeyScope=None,
+            TagValueScope=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("InputParameters", InputParameters)
+            _setattr("LambdaFunctionArn", LambdaFunctionArn)
+            _setattr("MaximumExecutionFrequency", MaximumExecutionFrequency)
+            _setattr(
+                "OrganizationConfigRuleTriggerTypes", OrganizationConfigRuleTriggerTypes
+            )
+            _setattr("ResourceIdScope", ResourceIdScope)
+            _setattr("ResourceTypesScope", ResourceTypesScope)
+            _setattr("TagKeyScope", TagKeyScope)
+            _setattr("TagValueScope", TagValueScope)
+            _init_PropertyType(self, kwargs)
+
+    class OrganizationConfigRuleOrganizationManagedRuleMetadata(_PropertyType):
+        """The Organization Managed Rule Metadata property type for OrganizationConfigRule in Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for OrganizationManagedRuleMetadata
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-organizationconfigrule-organizationmanagedrulemetadata.html>`_
+        """
 
+        __slots__ = (
+            "Description",
+            "InputParameters",
+            "MaximumExecutionFrequency",
+            "ResourceIdScope",
+            "ResourceTypesScope",
+            "RuleIdentifier",
+            "TagKeyScope",
+            "TagValueScope",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "OrganizationConfigRuleOrganizationManagedRuleMetadata",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationAggregator(Resource):
-    """A Configuration Aggregator for Config.
+        def __init__(
+            self,
+            *,
+            Description=None,
+            InputParameters=None,
+            MaximumExecutionFrequency=None,
+            ResourceIdScope=None,
+            ResourceTypesScope=None,
+            RuleIdentifier=None,
+            TagKeyScope=None,
+            TagValueScope=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("InputParameters", InputParameters)
+            _setattr("MaximumExecutionFrequency", MaximumExecutionFrequency)
+            _setattr("ResourceIdScope", ResourceIdScope)
+            _setattr("ResourceTypesScope", ResourceTypesScope)
+            _setattr("RuleIdentifier", RuleIdentifier)
+            _setattr("TagKeyScope", TagKeyScope)
+            _setattr("TagValueScope", TagValueScope)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for ConfigurationAggregator
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-configurationaggregator.html>`_
-    """
+    _convert_OrganizationConfigRuleOrganizationCustomRuleMetadata = (
+        create_object_converter(OrganizationConfigRuleOrganizationCustomRuleMetadata)
+    )
+    _convert_OrganizationConfigRuleOrganizationManagedRuleMetadata = (
+        create_object_converter(OrganizationConfigRuleOrganizationManagedRuleMetadata)
+    )
 
-    RESOURCE_TYPE = "AWS::Config::ConfigurationAggregator"
+    class OrganizationConfigRuleProperties(_ResourceProperties):
+        __slots__ = (
+            "ExcludedAccounts",
+            "OrganizationConfigRuleName",
+            "OrganizationCustomRuleMetadata",
+            "OrganizationManagedRuleMetadata",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "OrganizationConfigRuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "OrganizationCustomRuleMetadata": _convert_OrganizationConfigRuleOrganizationCustomRuleMetadata,
+                "OrganizationManagedRuleMetadata": _convert_OrganizationConfigRuleOrganizationManagedRuleMetadata,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ConfigurationAggregatorProperties = attrib(
-        factory=ConfigurationAggregatorProperties,
-        converter=create_object_converter(ConfigurationAggregatorProperties),
+        def __init__(
+            self,
+            *,
+            ExcludedAccounts=None,
+            OrganizationConfigRuleName=None,
+            OrganizationCustomRuleMetadata=None,
+            OrganizationManagedRuleMetadata=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExcludedAccounts", ExcludedAccounts)
+            _setattr("OrganizationConfigRuleName", OrganizationConfigRuleName)
+            _setattr(
+                "OrganizationCustomRuleMetadata",
+                _convert_OrganizationConfigRuleOrganizationCustomRuleMetadata(
+                    OrganizationCustomRuleMetadata
+                ),
+            )
+            _setattr(
+                "OrganizationManagedRuleMetadata",
+                _convert_OrganizationConfigRuleOrganizationManagedRuleMetadata(
+                    OrganizationManagedRuleMetadata
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_OrganizationConfigRuleProperties = create_object_converter(
+        OrganizationConfigRuleProperties
     )
 
+    class OrganizationConfigRule(_Resource):
+        """A Organization Config Rule for Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for OrganizationConfigRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-organizationconfigrule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Config::OrganizationConfigRule"
+
+        Properties: OrganizationConfigRuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "OrganizationConfigRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_OrganizationConfigRuleProperties},
+            factories={"Properties": OrganizationConfigRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationRecorderProperties(ResourceProperties):
-    Name = attrib(default=None)
-    RecordingGroup = attrib(default=None)
-    RoleARN = attrib(default=None)
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = OrganizationConfigRuleProperties()
+            _setattr(
+                "Properties", _convert_OrganizationConfigRuleProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        OrganizationConfigRule,
+        OrganizationConfigRuleProperties,
+        OrganizationConfigRuleOrganizationCustomRuleMetadata,
+        OrganizationConfigRuleOrganizationManagedRuleMetadata,
+    )
 
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationRecorder(Resource):
-    """A Configuration Recorder for Config.
+def _create_RemediationConfiguration():
+    class RemediationConfigurationSsmControls(_PropertyType):
+        """The Ssm Controls property type for RemediationConfiguration in Config.
 
-    See Also:
-        `AWS Cloud Formation documentation for ConfigurationRecorder
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-configurationrecorder.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for SsmControls
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-remediationconfiguration-ssmcontrols.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::Config::ConfigurationRecorder"
+        __slots__ = ("ConcurrentExecutionRatePercentage", "ErrorPercentage")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RemediationConfigurationSsmControls", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ConfigurationRecorderProperties = attrib(
-        factory=ConfigurationRecorderProperties,
-        converter=create_object_converter(ConfigurationRecorderProperties),
+        def __init__(
+            self,
+            *,
+            ConcurrentExecutionRatePercentage=None,
+            ErrorPercentage=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ConcurrentExecutionRatePercentage", ConcurrentExecutionRatePercentage
+            )
+            _setattr("ErrorPercentage", ErrorPercentage)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RemediationConfigurationSsmControls = create_object_converter(
+        RemediationConfigurationSsmControls
     )
 
+    class RemediationConfigurationExecutionControls(_PropertyType):
+        """The Execution Controls property type for RemediationConfiguration in Config.
+
+        See Also:
+            `AWS Cloud Formation documentation for ExecutionControls
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-remediationconfiguration-executioncontrols.html>`_
+        """
+
+        __slots__ = ("SsmControls",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RemediationConfigurationExecutionControls",
+            _PropertyType,
+            __slots__,
+            converters={"SsmControls": _convert_RemediationConfigurationSsmControls},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SsmControls=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "SsmControls", _convert_RemediationConfigurationSsmControls(SsmControls)
+            )
+            _init_PropertyType(self, kwargs)
+
+    class RemediationConfigurationResourceValue(_PropertyType):
+        """The Resource Value property type for RemediationConfiguration in Config.
 
-@attrs(**ATTRSCONFIG)
-class DeliveryChannelProperties(ResourceProperties):
-    ConfigSnapshotDeliveryProperties = attrib(default=None)
-    Name = attrib(default=None)
-    S3BucketName = attrib(default=None)
-    S3KeyPrefix = attrib(default=None)
-    SnsTopicARN = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for ResourceValue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-remediationconfiguration-resourcevalue.html>`_
+        """
 
+        __slots__ = ("Value",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RemediationConfigurationResourceValue", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class DeliveryChannel(Resource):
-    """A Delivery Channel for Config.
+        def __init__(self, *, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for DeliveryChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-deliverychannel.html>`_
-    """
+    class RemediationConfigurationStaticValue(_PropertyType):
+        """The Static Value property type for RemediationConfiguration in Config.
 
-    RESOURCE_TYPE = "AWS::Config::DeliveryChannel"
+        See Also:
+            `AWS Cloud Formation documentation for StaticValue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-remediationconfiguration-staticvalue.html>`_
+        """
 
-    Properties: DeliveryChannelProperties = attrib(
-        factory=DeliveryChannelProperties,
-        converter=create_object_converter(DeliveryChannelProperties),
+        __slots__ = ("Values",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RemediationConfigurationStaticValue", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RemediationConfigurationResourceValue = create_object_converter(
+        RemediationConfigurationResourceValue
+    )
+    _convert_RemediationConfigurationStaticValue = create_object_converter(
+        RemediationConfigurationStaticValue
     )
 
+    class RemediationConfigurationRemediationParameterValue(_PropertyType):
+        """The Remediation Parameter Value property type for RemediationConfiguration in Config.
 
-@attrs(**ATTRSCONFIG)
-class OrganizationConfigRuleProperties(ResourceProperties):
-    ExcludedAccounts = attrib(default=None)
-    OrganizationConfigRuleName = attrib(default=None)
-    OrganizationCustomRuleMetadata = attrib(default=None)
-    OrganizationManagedRuleMetadata = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for RemediationParameterValue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-config-remediationconfiguration-remediationparametervalue.html>`_
+        """
 
+        __slots__ = ("ResourceValue", "StaticValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RemediationConfigurationRemediationParameterValue",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ResourceValue": _convert_RemediationConfigurationResourceValue,
+                "StaticValue": _convert_RemediationConfigurationStaticValue,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class OrganizationConfigRule(Resource):
-    """A Organization Config Rule for Config.
+        def __init__(self, *, ResourceValue=None, StaticValue=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ResourceValue",
+                _convert_RemediationConfigurationResourceValue(ResourceValue),
+            )
+            _setattr(
+                "StaticValue", _convert_RemediationConfigurationStaticValue(StaticValue)
+            )
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for OrganizationConfigRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-organizationconfigrule.html>`_
-    """
+    _convert_RemediationConfigurationExecutionControls = create_object_converter(
+        RemediationConfigurationExecutionControls
+    )
 
-    RESOURCE_TYPE = "AWS::Config::OrganizationConfigRule"
+    class RemediationConfigurationProperties(_ResourceProperties):
+        __slots__ = (
+            "Automatic",
+            "ConfigRuleName",
+            "ExecutionControls",
+            "MaximumAutomaticAttempts",
+            "Parameters",
+            "ResourceType",
+            "RetryAttemptSeconds",
+            "TargetId",
+            "TargetType",
+            "TargetVersion",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RemediationConfigurationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ExecutionControls": _convert_RemediationConfigurationExecutionControls
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: OrganizationConfigRuleProperties = attrib(
-        factory=OrganizationConfigRuleProperties,
-        converter=create_object_converter(OrganizationConfigRuleProperties),
+        def __init__(
+            self,
+            *,
+            Automatic=None,
+            ConfigRuleName=None,
+            ExecutionControls=None,
+            MaximumAutomaticAttempts=None,
+            Parameters=None,
+            ResourceType=None,
+            RetryAttemptSeconds=None,
+            TargetId=None,
+            TargetType=None,
+            TargetVersion=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Automatic", Automatic)
+            _setattr("ConfigRuleName", ConfigRuleName)
+            _setattr(
+                "ExecutionControls",
+                _convert_RemediationConfigurationExecutionControls(ExecutionControls),
+            )
+            _setattr("MaximumAutomaticAttempts", MaximumAutomaticAttempts)
+            _setattr("Parameters", Parameters)
+            _setattr("ResourceType", ResourceType)
+            _setattr("RetryAttemptSeconds", RetryAttemptSeconds)
+            _setattr("TargetId", TargetId)
+            _setattr("TargetType", TargetType)
+            _setattr("TargetVersion", TargetVersion)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RemediationConfigurationProperties = create_object_converter(
+        RemediationConfigurationProperties
     )
 
+    class RemediationConfiguration(_Resource):
+        """A Remediation Configuration for Config.
 
-@attrs(**ATTRSCONFIG)
-class RemediationConfigurationProperties(ResourceProperties):
-    Automatic = attrib(default=None)
-    ConfigRuleName = attrib(default=None)
-    ExecutionControls = attrib(default=None)
-    MaximumAutomaticAttempts = attrib(default=None)
-    Parameters = attrib(default=None)
-    ResourceType = attrib(default=None)
-    RetryAttemptSeconds = attrib(default=None)
-    TargetId = attrib(default=None)
-    TargetType = attrib(default=None)
-    TargetVersion = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for RemediationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-remediationconfiguration.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::Config::RemediationConfiguration"
 
-@attrs(**ATTRSCONFIG)
-class RemediationConfiguration(Resource):
-    """A Remediation Configuration for Config.
+        Properties: RemediationConfigurationProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for RemediationConfiguration
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-config-remediationconfiguration.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RemediationConfiguration",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RemediationConfigurationProperties},
+            factories={"Properties": RemediationConfigurationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Config::RemediationConfiguration"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RemediationConfigurationProperties()
+            _setattr(
+                "Properties", _convert_RemediationConfigurationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
 
-    Properties: RemediationConfigurationProperties = attrib(
-        factory=RemediationConfigurationProperties,
-        converter=create_object_converter(RemediationConfigurationProperties),
+    return (
+        RemediationConfiguration,
+        RemediationConfigurationProperties,
+        RemediationConfigurationSsmControls,
+        RemediationConfigurationExecutionControls,
+        RemediationConfigurationResourceValue,
+        RemediationConfigurationStaticValue,
+        RemediationConfigurationRemediationParameterValue,
     )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "AggregationAuthorization": _create_AggregationAuthorization,
+        "AggregationAuthorizationProperties": _create_AggregationAuthorization,
+        "ConfigRule": _create_ConfigRule,
+        "ConfigRuleProperties": _create_ConfigRule,
+        "ConfigRuleScope": _create_ConfigRule,
+        "ConfigRuleSource": _create_ConfigRule,
+        "ConfigRuleSourceDetail": _create_ConfigRule,
+        "ConfigurationAggregator": _create_ConfigurationAggregator,
+        "ConfigurationAggregatorProperties": _create_ConfigurationAggregator,
+        "ConfigurationAggregatorAccountAggregationSource": _create_ConfigurationAggregator,
+        "ConfigurationAggregatorOrganizationAggregationSource": _create_ConfigurationAggregator,
+        "ConfigurationRecorder": _create_ConfigurationRecorder,
+        "ConfigurationRecorderProperties": _create_ConfigurationRecorder,
+        "ConfigurationRecorderRecordingGroup": _create_ConfigurationRecorder,
+        "DeliveryChannel": _create_DeliveryChannel,
+        "DeliveryChannelProperties": _create_DeliveryChannel,
+        "DeliveryChannelConfigSnapshotDeliveryProperties": _create_DeliveryChannel,
+        "OrganizationConfigRule": _create_OrganizationConfigRule,
+        "OrganizationConfigRuleProperties": _create_OrganizationConfigRule,
+        "OrganizationConfigRuleOrganizationCustomRuleMetadata": _create_OrganizationConfigRule,
+        "OrganizationConfigRuleOrganizationManagedRuleMetadata": _create_OrganizationConfigRule,
+        "RemediationConfiguration": _create_RemediationConfiguration,
+        "RemediationConfigurationProperties": _create_RemediationConfiguration,
+        "RemediationConfigurationExecutionControls": _create_RemediationConfiguration,
+        "RemediationConfigurationRemediationParameterValue": _create_RemediationConfiguration,
+        "RemediationConfigurationResourceValue": _create_RemediationConfiguration,
+        "RemediationConfigurationSsmControls": _create_RemediationConfiguration,
+        "RemediationConfigurationStaticValue": _create_RemediationConfiguration,
+    },
+)
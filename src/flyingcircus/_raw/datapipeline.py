@@ -7,40 +7,307 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Pipeline", "PipelineProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Pipeline",
+    "PipelineProperties",
+    "PipelineField",
+    "PipelineParameterAttribute",
+    "PipelineParameterObject",
+    "PipelineParameterValue",
+    "PipelinePipelineObject",
+    "PipelinePipelineTag",
+]
 
-@attrs(**ATTRSCONFIG)
-class PipelineProperties(ResourceProperties):
-    Activate = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    ParameterObjects = attrib(default=None)
-    ParameterValues = attrib(default=None)
-    PipelineObjects = attrib(default=None)
-    PipelineTags = attrib(default=None)
 
+def _create_Pipeline():
+    class PipelineField(_PropertyType):
+        """The Field property type for Pipeline in DataPipeline.
 
-@attrs(**ATTRSCONFIG)
-class Pipeline(Resource):
-    """A Pipeline for DataPipeline.
+        See Also:
+            `AWS Cloud Formation documentation for Field
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-datapipeline-pipeline-pipelineobjects-fields.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Pipeline
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-datapipeline-pipeline.html>`_
-    """
+        __slots__ = ("Key", "RefValue", "StringValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineField", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::DataPipeline::Pipeline"
+        def __init__(
+            self, *, Key=None, RefValue=None, StringValue=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("RefValue", RefValue)
+            _setattr("StringValue", StringValue)
+            _init_PropertyType(self, kwargs)
 
-    Properties: PipelineProperties = attrib(
-        factory=PipelineProperties,
-        converter=create_object_converter(PipelineProperties),
+    class PipelineParameterAttribute(_PropertyType):
+        """The Parameter Attribute property type for Pipeline in DataPipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParameterAttribute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-datapipeline-pipeline-parameterobjects-attributes.html>`_
+        """
+
+        __slots__ = ("Key", "StringValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineParameterAttribute", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, StringValue=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("StringValue", StringValue)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PipelineParameterAttribute_list = create_object_list_converter(
+        PipelineParameterAttribute
     )
+
+    class PipelineParameterObject(_PropertyType):
+        """The Parameter Object property type for Pipeline in DataPipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParameterObject
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-datapipeline-pipeline-parameterobjects.html>`_
+        """
+
+        __slots__ = ("Attributes", "Id")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineParameterObject",
+            _PropertyType,
+            __slots__,
+            converters={"Attributes": _convert_PipelineParameterAttribute_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Attributes=None, Id=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", _convert_PipelineParameterAttribute_list(Attributes))
+            _setattr("Id", Id)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineParameterValue(_PropertyType):
+        """The Parameter Value property type for Pipeline in DataPipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParameterValue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-datapipeline-pipeline-parametervalues.html>`_
+        """
+
+        __slots__ = ("Id", "StringValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineParameterValue", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Id=None, StringValue=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("StringValue", StringValue)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PipelineField_list = create_object_list_converter(PipelineField)
+
+    class PipelinePipelineObject(_PropertyType):
+        """The Pipeline Object property type for Pipeline in DataPipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for PipelineObject
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-datapipeline-pipeline-pipelineobjects.html>`_
+        """
+
+        __slots__ = ("Fields", "Id", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelinePipelineObject",
+            _PropertyType,
+            __slots__,
+            converters={"Fields": _convert_PipelineField_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Fields=None, Id=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Fields", _convert_PipelineField_list(Fields))
+            _setattr("Id", Id)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class PipelinePipelineTag(_PropertyType):
+        """The Pipeline Tag property type for Pipeline in DataPipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for PipelineTag
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-datapipeline-pipeline-pipelinetags.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelinePipelineTag", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PipelineParameterObject_list = create_object_list_converter(
+        PipelineParameterObject
+    )
+    _convert_PipelineParameterValue_list = create_object_list_converter(
+        PipelineParameterValue
+    )
+    _convert_PipelinePipelineObject_list = create_object_list_converter(
+        PipelinePipelineObject
+    )
+    _convert_PipelinePipelineTag_list = create_object_list_converter(
+        PipelinePipelineTag
+    )
+
+    class PipelineProperties(_ResourceProperties):
+        __slots__ = (
+            "Activate",
+            "Description",
+            "Name",
+            "ParameterObjects",
+            "ParameterValues",
+            "PipelineObjects",
+            "PipelineTags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ParameterObjects": _convert_PipelineParameterObject_list,
+                "ParameterValues": _convert_PipelineParameterValue_list,
+                "PipelineObjects": _convert_PipelinePipelineObject_list,
+                "PipelineTags": _convert_PipelinePipelineTag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Activate=None,
+            Description=None,
+            Name=None,
+            ParameterObjects=None,
+            ParameterValues=None,
+            PipelineObjects=None,
+            PipelineTags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Activate", Activate)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr(
+                "ParameterObjects",
+                _convert_PipelineParameterObject_list(ParameterObjects),
+            )
+            _setattr(
+                "ParameterValues", _convert_PipelineParameterValue_list(ParameterValues)
+            )
+            _setattr(
+                "PipelineObjects", _convert_PipelinePipelineObject_list(PipelineObjects)
+            )
+            _setattr("PipelineTags", _convert_PipelinePipelineTag_list(PipelineTags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PipelineProperties = create_object_converter(PipelineProperties)
+
+    class Pipeline(_Resource):
+        """A Pipeline for DataPipeline.
+
+        See Also:
+            `AWS Cloud Formation documentation for Pipeline
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-datapipeline-pipeline.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DataPipeline::Pipeline"
+        TAG_PROPERTY = "PipelineTags"
+
+        Properties: PipelineProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Pipeline",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PipelineProperties},
+            factories={"Properties": PipelineProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PipelineProperties()
+            _setattr("Properties", _convert_PipelineProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Pipeline,
+        PipelineProperties,
+        PipelineField,
+        PipelineParameterAttribute,
+        PipelineParameterObject,
+        PipelineParameterValue,
+        PipelinePipelineObject,
+        PipelinePipelineTag,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Pipeline": _create_Pipeline,
+        "PipelineProperties": _create_Pipeline,
+        "PipelineField": _create_Pipeline,
+        "PipelineParameterAttribute": _create_Pipeline,
+        "PipelineParameterObject": _create_Pipeline,
+        "PipelineParameterValue": _create_Pipeline,
+        "PipelinePipelineObject": _create_Pipeline,
+        "PipelinePipelineTag": _create_Pipeline,
+    },
+)
@@ -7,17 +7,24 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
 __all__ = [
     "Cluster",
     "ClusterProperties",
+    "ClusterSSESpecification",
     "ParameterGroup",
     "ParameterGroupProperties",
     "SubnetGroup",
@@ -25,82 +32,259 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ClusterProperties(ResourceProperties):
-    AvailabilityZones = attrib(default=None)
-    ClusterName = attrib(default=None)
-    Description = attrib(default=None)
-    IAMRoleARN = attrib(default=None)
-    NodeType = attrib(default=None)
-    NotificationTopicARN = attrib(default=None)
-    ParameterGroupName = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    ReplicationFactor = attrib(default=None)
-    SecurityGroupIds = attrib(default=None)
-    SSESpecification = attrib(default=None)
-    SubnetGroupName = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Cluster(Resource):
-    """A Cluster for DAX.
-
-    See Also:
-        `AWS Cloud Formation documentation for Cluster
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dax-cluster.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::DAX::Cluster"
-
-    Properties: ClusterProperties = attrib(
-        factory=ClusterProperties, converter=create_object_converter(ClusterProperties)
-    )
+def _create_Cluster():
+    class ClusterSSESpecification(_PropertyType):
+        """The Sse Specification property type for Cluster in DAX.
 
+        See Also:
+            `AWS Cloud Formation documentation for SSESpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dax-cluster-ssespecification.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class ParameterGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    ParameterGroupName = attrib(default=None)
-    ParameterNameValues = attrib(default=None)
+        __slots__ = ("SSEEnabled",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterSSESpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, SSEEnabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SSEEnabled", SSEEnabled)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class ParameterGroup(Resource):
-    """A Parameter Group for DAX.
+    _convert_ClusterSSESpecification = create_object_converter(ClusterSSESpecification)
 
-    See Also:
-        `AWS Cloud Formation documentation for ParameterGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dax-parametergroup.html>`_
-    """
+    class ClusterProperties(_ResourceProperties):
+        __slots__ = (
+            "AvailabilityZones",
+            "ClusterName",
+            "Description",
+            "IAMRoleARN",
+            "NodeType",
+            "NotificationTopicARN",
+            "ParameterGroupName",
+            "PreferredMaintenanceWindow",
+            "ReplicationFactor",
+            "SecurityGroupIds",
+            "SSESpecification",
+            "SubnetGroupName",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"SSESpecification": _convert_ClusterSSESpecification},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::DAX::ParameterGroup"
+        def __init__(
+            self,
+            *,
+            AvailabilityZones=None,
+            ClusterName=None,
+            Description=None,
+            IAMRoleARN=None,
+            NodeType=None,
+            NotificationTopicARN=None,
+            ParameterGroupName=None,
+            PreferredMaintenanceWindow=None,
+            ReplicationFactor=None,
+            SecurityGroupIds=None,
+            SSESpecification=None,
+            SubnetGroupName=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZones", AvailabilityZones)
+            _setattr("ClusterName", ClusterName)
+            _setattr("Description", Description)
+            _setattr("IAMRoleARN", IAMRoleARN)
+            _setattr("NodeType", NodeType)
+            _setattr("NotificationTopicARN", NotificationTopicARN)
+            _setattr("ParameterGroupName", ParameterGroupName)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr("ReplicationFactor", ReplicationFactor)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr(
+                "SSESpecification", _convert_ClusterSSESpecification(SSESpecification)
+            )
+            _setattr("SubnetGroupName", SubnetGroupName)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: ParameterGroupProperties = attrib(
-        factory=ParameterGroupProperties,
-        converter=create_object_converter(ParameterGroupProperties),
-    )
+    _convert_ClusterProperties = create_object_converter(ClusterProperties)
+
+    class Cluster(_Resource):
+        """A Cluster for DAX.
+
+        See Also:
+            `AWS Cloud Formation documentation for Cluster
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dax-cluster.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DAX::Cluster"
+        TAG_FORMAT = "Map"
+
+        Properties: ClusterProperties
 
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Cluster",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterProperties},
+            factories={"Properties": ClusterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class SubnetGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    SubnetGroupName = attrib(default=None)
-    SubnetIds = attrib(default=None)
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterProperties()
+            _setattr("Properties", _convert_ClusterProperties(Properties))
+            _init_Resource(self, kwargs)
 
+    return Cluster, ClusterProperties, ClusterSSESpecification
 
-@attrs(**ATTRSCONFIG)
-class SubnetGroup(Resource):
-    """A Subnet Group for DAX.
 
-    See Also:
-        `AWS Cloud Formation documentation for SubnetGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dax-subnetgroup.html>`_
-    """
+def _create_ParameterGroup():
+    class ParameterGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "ParameterGroupName", "ParameterNameValues")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ParameterGroupProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::DAX::SubnetGroup"
+        def __init__(
+            self,
+            *,
+            Description=None,
+            ParameterGroupName=None,
+            ParameterNameValues=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("ParameterGroupName", ParameterGroupName)
+            _setattr("ParameterNameValues", ParameterNameValues)
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: SubnetGroupProperties = attrib(
-        factory=SubnetGroupProperties,
-        converter=create_object_converter(SubnetGroupProperties),
+    _convert_ParameterGroupProperties = create_object_converter(
+        ParameterGroupProperties
     )
+
+    class ParameterGroup(_Resource):
+        """A Parameter Group for DAX.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParameterGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dax-parametergroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DAX::ParameterGroup"
+
+        Properties: ParameterGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ParameterGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ParameterGroupProperties},
+            factories={"Properties": ParameterGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ParameterGroupProperties()
+            _setattr("Properties", _convert_ParameterGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ParameterGroup, ParameterGroupProperties
+
+
+def _create_SubnetGroup():
+    class SubnetGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "SubnetGroupName", "SubnetIds")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetGroupProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Description=None, SubnetGroupName=None, SubnetIds=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("SubnetGroupName", SubnetGroupName)
+            _setattr("SubnetIds", SubnetIds)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubnetGroupProperties = create_object_converter(SubnetGroupProperties)
+
+    class SubnetGroup(_Resource):
+        """A Subnet Group for DAX.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubnetGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dax-subnetgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DAX::SubnetGroup"
+
+        Properties: SubnetGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubnetGroupProperties},
+            factories={"Properties": SubnetGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubnetGroupProperties()
+            _setattr("Properties", _convert_SubnetGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SubnetGroup, SubnetGroupProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Cluster": _create_Cluster,
+        "ClusterProperties": _create_Cluster,
+        "ClusterSSESpecification": _create_Cluster,
+        "ParameterGroup": _create_ParameterGroup,
+        "ParameterGroupProperties": _create_ParameterGroup,
+        "SubnetGroup": _create_SubnetGroup,
+        "SubnetGroupProperties": _create_SubnetGroup,
+    },
+)
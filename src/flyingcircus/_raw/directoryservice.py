@@ -7,69 +7,250 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
-__all__ = ["MicrosoftAD", "MicrosoftADProperties", "SimpleAD", "SimpleADProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "MicrosoftAD",
+    "MicrosoftADProperties",
+    "MicrosoftADVpcSettings",
+    "SimpleAD",
+    "SimpleADProperties",
+    "SimpleADVpcSettings",
+]
 
-@attrs(**ATTRSCONFIG)
-class MicrosoftADProperties(ResourceProperties):
-    CreateAlias = attrib(default=None)
-    Edition = attrib(default=None)
-    EnableSso = attrib(default=None)
-    Name = attrib(default=None)
-    Password = attrib(default=None)
-    ShortName = attrib(default=None)
-    VpcSettings = attrib(default=None)
 
+def _create_MicrosoftAD():
+    class MicrosoftADVpcSettings(_PropertyType):
+        """The Vpc Settings property type for MicrosoftAD in DirectoryService.
 
-@attrs(**ATTRSCONFIG)
-class MicrosoftAD(Resource):
-    """A Microsoft Ad for DirectoryService.
+        See Also:
+            `AWS Cloud Formation documentation for VpcSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-directoryservice-microsoftad-vpcsettings.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for MicrosoftAD
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-directoryservice-microsoftad.html>`_
-    """
+        __slots__ = ("SubnetIds", "VpcId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MicrosoftADVpcSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::DirectoryService::MicrosoftAD"
+        def __init__(self, *, SubnetIds=None, VpcId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("VpcId", VpcId)
+            _init_PropertyType(self, kwargs)
 
-    Properties: MicrosoftADProperties = attrib(
-        factory=MicrosoftADProperties,
-        converter=create_object_converter(MicrosoftADProperties),
-    )
+    _convert_MicrosoftADVpcSettings = create_object_converter(MicrosoftADVpcSettings)
 
+    class MicrosoftADProperties(_ResourceProperties):
+        __slots__ = (
+            "CreateAlias",
+            "Edition",
+            "EnableSso",
+            "Name",
+            "Password",
+            "ShortName",
+            "VpcSettings",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MicrosoftADProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"VpcSettings": _convert_MicrosoftADVpcSettings},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class SimpleADProperties(ResourceProperties):
-    CreateAlias = attrib(default=None)
-    Description = attrib(default=None)
-    EnableSso = attrib(default=None)
-    Name = attrib(default=None)
-    Password = attrib(default=None)
-    ShortName = attrib(default=None)
-    Size = attrib(default=None)
-    VpcSettings = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            CreateAlias=None,
+            Edition=None,
+            EnableSso=None,
+            Name=None,
+            Password=None,
+            ShortName=None,
+            VpcSettings=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CreateAlias", CreateAlias)
+            _setattr("Edition", Edition)
+            _setattr("EnableSso", EnableSso)
+            _setattr("Name", Name)
+            _setattr("Password", Password)
+            _setattr("ShortName", ShortName)
+            _setattr("VpcSettings", _convert_MicrosoftADVpcSettings(VpcSettings))
+            _init_ResourceProperties(self, kwargs)
 
+    _convert_MicrosoftADProperties = create_object_converter(MicrosoftADProperties)
 
-@attrs(**ATTRSCONFIG)
-class SimpleAD(Resource):
-    """A Simple Ad for DirectoryService.
+    class MicrosoftAD(_Resource):
+        """A Microsoft Ad for DirectoryService.
 
-    See Also:
-        `AWS Cloud Formation documentation for SimpleAD
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-directoryservice-simplead.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for MicrosoftAD
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-directoryservice-microsoftad.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::DirectoryService::SimpleAD"
+        RESOURCE_TYPE = "AWS::DirectoryService::MicrosoftAD"
 
-    Properties: SimpleADProperties = attrib(
-        factory=SimpleADProperties,
-        converter=create_object_converter(SimpleADProperties),
-    )
+        Properties: MicrosoftADProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MicrosoftAD",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MicrosoftADProperties},
+            factories={"Properties": MicrosoftADProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MicrosoftADProperties()
+            _setattr("Properties", _convert_MicrosoftADProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return MicrosoftAD, MicrosoftADProperties, MicrosoftADVpcSettings
+
+
+def _create_SimpleAD():
+    class SimpleADVpcSettings(_PropertyType):
+        """The Vpc Settings property type for SimpleAD in DirectoryService.
+
+        See Also:
+            `AWS Cloud Formation documentation for VpcSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-directoryservice-simplead-vpcsettings.html>`_
+        """
+
+        __slots__ = ("SubnetIds", "VpcId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimpleADVpcSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SubnetIds=None, VpcId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("VpcId", VpcId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SimpleADVpcSettings = create_object_converter(SimpleADVpcSettings)
+
+    class SimpleADProperties(_ResourceProperties):
+        __slots__ = (
+            "CreateAlias",
+            "Description",
+            "EnableSso",
+            "Name",
+            "Password",
+            "ShortName",
+            "Size",
+            "VpcSettings",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimpleADProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"VpcSettings": _convert_SimpleADVpcSettings},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CreateAlias=None,
+            Description=None,
+            EnableSso=None,
+            Name=None,
+            Password=None,
+            ShortName=None,
+            Size=None,
+            VpcSettings=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CreateAlias", CreateAlias)
+            _setattr("Description", Description)
+            _setattr("EnableSso", EnableSso)
+            _setattr("Name", Name)
+            _setattr("Password", Password)
+            _setattr("ShortName", ShortName)
+            _setattr("Size", Size)
+            _setattr("VpcSettings", _convert_SimpleADVpcSettings(VpcSettings))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SimpleADProperties = create_object_converter(SimpleADProperties)
+
+    class SimpleAD(_Resource):
+        """A Simple Ad for DirectoryService.
+
+        See Also:
+            `AWS Cloud Formation documentation for SimpleAD
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-directoryservice-simplead.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DirectoryService::SimpleAD"
+
+        Properties: SimpleADProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimpleAD",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SimpleADProperties},
+            factories={"Properties": SimpleADProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SimpleADProperties()
+            _setattr("Properties", _convert_SimpleADProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SimpleAD, SimpleADProperties, SimpleADVpcSettings
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "MicrosoftAD": _create_MicrosoftAD,
+        "MicrosoftADProperties": _create_MicrosoftAD,
+        "MicrosoftADVpcSettings": _create_MicrosoftAD,
+        "SimpleAD": _create_SimpleAD,
+        "SimpleADProperties": _create_SimpleAD,
+        "SimpleADVpcSettings": _create_SimpleAD,
+    },
+)
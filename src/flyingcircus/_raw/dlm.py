@@ -7,37 +7,438 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["LifecyclePolicy", "LifecyclePolicyProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "LifecyclePolicy",
+    "LifecyclePolicyProperties",
+    "LifecyclePolicyCreateRule",
+    "LifecyclePolicyCrossRegionCopyRetainRule",
+    "LifecyclePolicyCrossRegionCopyRule",
+    "LifecyclePolicyFastRestoreRule",
+    "LifecyclePolicyParameters",
+    "LifecyclePolicyPolicyDetails",
+    "LifecyclePolicyRetainRule",
+    "LifecyclePolicySchedule",
+]
 
-@attrs(**ATTRSCONFIG)
-class LifecyclePolicyProperties(ResourceProperties):
-    Description = attrib(default=None)
-    ExecutionRoleArn = attrib(default=None)
-    PolicyDetails = attrib(default=None)
-    State = attrib(default=None)
 
+def _create_LifecyclePolicy():
+    class LifecyclePolicyCreateRule(_PropertyType):
+        """The Create Rule property type for LifecyclePolicy in DLM.
 
-@attrs(**ATTRSCONFIG)
-class LifecyclePolicy(Resource):
-    """A Lifecycle Policy for DLM.
+        See Also:
+            `AWS Cloud Formation documentation for CreateRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dlm-lifecyclepolicy-createrule.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for LifecyclePolicy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dlm-lifecyclepolicy.html>`_
-    """
+        __slots__ = ("Interval", "IntervalUnit", "Times")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicyCreateRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::DLM::LifecyclePolicy"
+        def __init__(
+            self, *, Interval=None, IntervalUnit=None, Times=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Interval", Interval)
+            _setattr("IntervalUnit", IntervalUnit)
+            _setattr("Times", Times)
+            _init_PropertyType(self, kwargs)
 
-    Properties: LifecyclePolicyProperties = attrib(
-        factory=LifecyclePolicyProperties,
-        converter=create_object_converter(LifecyclePolicyProperties),
+    class LifecyclePolicyCrossRegionCopyRetainRule(_PropertyType):
+        """The Cross Region Copy Retain Rule property type for LifecyclePolicy in DLM.
+
+        See Also:
+            `AWS Cloud Formation documentation for CrossRegionCopyRetainRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dlm-lifecyclepolicy-crossregioncopyretainrule.html>`_
+        """
+
+        __slots__ = ("Interval", "IntervalUnit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicyCrossRegionCopyRetainRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Interval=None, IntervalUnit=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Interval", Interval)
+            _setattr("IntervalUnit", IntervalUnit)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LifecyclePolicyCrossRegionCopyRetainRule = create_object_converter(
+        LifecyclePolicyCrossRegionCopyRetainRule
+    )
+
+    class LifecyclePolicyCrossRegionCopyRule(_PropertyType):
+        """The Cross Region Copy Rule property type for LifecyclePolicy in DLM.
+
+        See Also:
+            `AWS Cloud Formation documentation for CrossRegionCopyRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dlm-lifecyclepolicy-crossregioncopyrule.html>`_
+        """
+
+        __slots__ = ("CmkArn", "CopyTags", "Encrypted", "RetainRule", "TargetRegion")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicyCrossRegionCopyRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "RetainRule": _convert_LifecyclePolicyCrossRegionCopyRetainRule
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CmkArn=None,
+            CopyTags=None,
+            Encrypted=None,
+            RetainRule=None,
+            TargetRegion=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CmkArn", CmkArn)
+            _setattr("CopyTags", CopyTags)
+            _setattr("Encrypted", Encrypted)
+            _setattr(
+                "RetainRule",
+                _convert_LifecyclePolicyCrossRegionCopyRetainRule(RetainRule),
+            )
+            _setattr("TargetRegion", TargetRegion)
+            _init_PropertyType(self, kwargs)
+
+    class LifecyclePolicyFastRestoreRule(_PropertyType):
+        """The Fast Restore Rule property type for LifecyclePolicy in DLM.
+
+        See Also:
+            `AWS Cloud Formation documentation for FastRestoreRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dlm-lifecyclepolicy-fastrestorerule.html>`_
+        """
+
+        __slots__ = ("AvailabilityZones", "Count", "Interval", "IntervalUnit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicyFastRestoreRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AvailabilityZones=None,
+            Count=None,
+            Interval=None,
+            IntervalUnit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZones", AvailabilityZones)
+            _setattr("Count", Count)
+            _setattr("Interval", Interval)
+            _setattr("IntervalUnit", IntervalUnit)
+            _init_PropertyType(self, kwargs)
+
+    class LifecyclePolicyParameters(_PropertyType):
+        """The Parameters property type for LifecyclePolicy in DLM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Parameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dlm-lifecyclepolicy-parameters.html>`_
+        """
+
+        __slots__ = ("ExcludeBootVolume",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicyParameters", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ExcludeBootVolume=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExcludeBootVolume", ExcludeBootVolume)
+            _init_PropertyType(self, kwargs)
+
+    class LifecyclePolicyRetainRule(_PropertyType):
+        """The Retain Rule property type for LifecyclePolicy in DLM.
+
+        See Also:
+            `AWS Cloud Formation documentation for RetainRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dlm-lifecyclepolicy-retainrule.html>`_
+        """
+
+        __slots__ = ("Count", "Interval", "IntervalUnit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicyRetainRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Count=None, Interval=None, IntervalUnit=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Count", Count)
+            _setattr("Interval", Interval)
+            _setattr("IntervalUnit", IntervalUnit)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LifecyclePolicyCreateRule = create_object_converter(
+        LifecyclePolicyCreateRule
+    )
+    _convert_LifecyclePolicyCrossRegionCopyRule_list = create_object_list_converter(
+        LifecyclePolicyCrossRegionCopyRule
+    )
+    _convert_LifecyclePolicyFastRestoreRule = create_object_converter(
+        LifecyclePolicyFastRestoreRule
+    )
+    _convert_LifecyclePolicyRetainRule = create_object_converter(
+        LifecyclePolicyRetainRule
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class LifecyclePolicySchedule(_PropertyType):
+        """The Schedule property type for LifecyclePolicy in DLM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Schedule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dlm-lifecyclepolicy-schedule.html>`_
+        """
+
+        __slots__ = (
+            "CopyTags",
+            "CreateRule",
+            "CrossRegionCopyRules",
+            "FastRestoreRule",
+            "Name",
+            "RetainRule",
+            "TagsToAdd",
+            "VariableTags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicySchedule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CreateRule": _convert_LifecyclePolicyCreateRule,
+                "CrossRegionCopyRules": _convert_LifecyclePolicyCrossRegionCopyRule_list,
+                "FastRestoreRule": _convert_LifecyclePolicyFastRestoreRule,
+                "RetainRule": _convert_LifecyclePolicyRetainRule,
+                "TagsToAdd": _convert_Tag_list,
+                "VariableTags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CopyTags=None,
+            CreateRule=None,
+            CrossRegionCopyRules=None,
+            FastRestoreRule=None,
+            Name=None,
+            RetainRule=None,
+            TagsToAdd=None,
+            VariableTags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CopyTags", CopyTags)
+            _setattr("CreateRule", _convert_LifecyclePolicyCreateRule(CreateRule))
+            _setattr(
+                "CrossRegionCopyRules",
+                _convert_LifecyclePolicyCrossRegionCopyRule_list(CrossRegionCopyRules),
+            )
+            _setattr(
+                "FastRestoreRule",
+                _convert_LifecyclePolicyFastRestoreRule(FastRestoreRule),
+            )
+            _setattr("Name", Name)
+            _setattr("RetainRule", _convert_LifecyclePolicyRetainRule(RetainRule))
+            _setattr("TagsToAdd", _convert_Tag_list(TagsToAdd))
+            _setattr("VariableTags", _convert_Tag_list(VariableTags))
+            _init_PropertyType(self, kwargs)
+
+    _convert_LifecyclePolicyParameters = create_object_converter(
+        LifecyclePolicyParameters
+    )
+    _convert_LifecyclePolicySchedule_list = create_object_list_converter(
+        LifecyclePolicySchedule
+    )
+
+    class LifecyclePolicyPolicyDetails(_PropertyType):
+        """The Policy Details property type for LifecyclePolicy in DLM.
+
+        See Also:
+            `AWS Cloud Formation documentation for PolicyDetails
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dlm-lifecyclepolicy-policydetails.html>`_
+        """
+
+        __slots__ = (
+            "Parameters",
+            "PolicyType",
+            "ResourceTypes",
+            "Schedules",
+            "TargetTags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicyPolicyDetails",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Parameters": _convert_LifecyclePolicyParameters,
+                "Schedules": _convert_LifecyclePolicySchedule_list,
+                "TargetTags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Parameters=None,
+            PolicyType=None,
+            ResourceTypes=None,
+            Schedules=None,
+            TargetTags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Parameters", _convert_LifecyclePolicyParameters(Parameters))
+            _setattr("PolicyType", PolicyType)
+            _setattr("ResourceTypes", ResourceTypes)
+            _setattr("Schedules", _convert_LifecyclePolicySchedule_list(Schedules))
+            _setattr("TargetTags", _convert_Tag_list(TargetTags))
+            _init_PropertyType(self, kwargs)
+
+    _convert_LifecyclePolicyPolicyDetails = create_object_converter(
+        LifecyclePolicyPolicyDetails
+    )
+
+    class LifecyclePolicyProperties(_ResourceProperties):
+        __slots__ = ("Description", "ExecutionRoleArn", "PolicyDetails", "State")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicyProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"PolicyDetails": _convert_LifecyclePolicyPolicyDetails},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            ExecutionRoleArn=None,
+            PolicyDetails=None,
+            State=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("ExecutionRoleArn", ExecutionRoleArn)
+            _setattr(
+                "PolicyDetails", _convert_LifecyclePolicyPolicyDetails(PolicyDetails)
+            )
+            _setattr("State", State)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LifecyclePolicyProperties = create_object_converter(
+        LifecyclePolicyProperties
     )
+
+    class LifecyclePolicy(_Resource):
+        """A Lifecycle Policy for DLM.
+
+        See Also:
+            `AWS Cloud Formation documentation for LifecyclePolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dlm-lifecyclepolicy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DLM::LifecyclePolicy"
+
+        Properties: LifecyclePolicyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LifecyclePolicy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LifecyclePolicyProperties},
+            factories={"Properties": LifecyclePolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LifecyclePolicyProperties()
+            _setattr("Properties", _convert_LifecyclePolicyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        LifecyclePolicy,
+        LifecyclePolicyProperties,
+        LifecyclePolicyCreateRule,
+        LifecyclePolicyCrossRegionCopyRetainRule,
+        LifecyclePolicyCrossRegionCopyRule,
+        LifecyclePolicyFastRestoreRule,
+        LifecyclePolicyParameters,
+        LifecyclePolicyRetainRule,
+        LifecyclePolicySchedule,
+        LifecyclePolicyPolicyDetails,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "LifecyclePolicy": _create_LifecyclePolicy,
+        "LifecyclePolicyProperties": _create_LifecyclePolicy,
+        "LifecyclePolicyCreateRule": _create_LifecyclePolicy,
+        "LifecyclePolicyCrossRegionCopyRetainRule": _create_LifecyclePolicy,
+        "LifecyclePolicyCrossRegionCopyRule": _create_LifecyclePolicy,
+        "LifecyclePolicyFastRestoreRule": _create_LifecyclePolicy,
+        "LifecyclePolicyParameters": _create_LifecyclePolicy,
+        "LifecyclePolicyPolicyDetails": _create_LifecyclePolicy,
+        "LifecyclePolicyRetainRule": _create_LifecyclePolicy,
+        "LifecyclePolicySchedule": _create_LifecyclePolicy,
+    },
+)
@@ -7,19 +7,32 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Certificate",
     "CertificateProperties",
     "Endpoint",
     "EndpointProperties",
+    "EndpointDynamoDbSettings",
+    "EndpointElasticsearchSettings",
+    "EndpointKinesisSettings",
+    "EndpointMongoDbSettings",
+    "EndpointS3Settings",
     "EventSubscription",
     "EventSubscriptionProperties",
     "ReplicationInstance",
@@ -31,184 +44,795 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class CertificateProperties(ResourceProperties):
-    CertificateIdentifier = attrib(default=None)
-    CertificatePem = attrib(default=None)
-    CertificateWallet = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Certificate(Resource):
-    """A Certificate for DMS.
-
-    See Also:
-        `AWS Cloud Formation documentation for Certificate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-certificate.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::DMS::Certificate"
-
-    Properties: CertificateProperties = attrib(
-        factory=CertificateProperties,
-        converter=create_object_converter(CertificateProperties),
+def _create_Certificate():
+    class CertificateProperties(_ResourceProperties):
+        __slots__ = ("CertificateIdentifier", "CertificatePem", "CertificateWallet")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CertificateProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CertificateIdentifier=None,
+            CertificatePem=None,
+            CertificateWallet=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateIdentifier", CertificateIdentifier)
+            _setattr("CertificatePem", CertificatePem)
+            _setattr("CertificateWallet", CertificateWallet)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CertificateProperties = create_object_converter(CertificateProperties)
+
+    class Certificate(_Resource):
+        """A Certificate for DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Certificate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-certificate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DMS::Certificate"
+
+        Properties: CertificateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Certificate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CertificateProperties},
+            factories={"Properties": CertificateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CertificateProperties()
+            _setattr("Properties", _convert_CertificateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Certificate, CertificateProperties
+
+
+def _create_Endpoint():
+    class EndpointDynamoDbSettings(_PropertyType):
+        """The Dynamo Db Settings property type for Endpoint in DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DynamoDbSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dms-endpoint-dynamodbsettings.html>`_
+        """
+
+        __slots__ = ("ServiceAccessRoleArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointDynamoDbSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ServiceAccessRoleArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ServiceAccessRoleArn", ServiceAccessRoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class EndpointElasticsearchSettings(_PropertyType):
+        """The Elasticsearch Settings property type for Endpoint in DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticsearchSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dms-endpoint-elasticsearchsettings.html>`_
+        """
+
+        __slots__ = (
+            "EndpointUri",
+            "ErrorRetryDuration",
+            "FullLoadErrorPercentage",
+            "ServiceAccessRoleArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointElasticsearchSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EndpointUri=None,
+            ErrorRetryDuration=None,
+            FullLoadErrorPercentage=None,
+            ServiceAccessRoleArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EndpointUri", EndpointUri)
+            _setattr("ErrorRetryDuration", ErrorRetryDuration)
+            _setattr("FullLoadErrorPercentage", FullLoadErrorPercentage)
+            _setattr("ServiceAccessRoleArn", ServiceAccessRoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class EndpointKinesisSettings(_PropertyType):
+        """The Kinesis Settings property type for Endpoint in DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dms-endpoint-kinesissettings.html>`_
+        """
+
+        __slots__ = ("MessageFormat", "ServiceAccessRoleArn", "StreamArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointKinesisSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MessageFormat=None,
+            ServiceAccessRoleArn=None,
+            StreamArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MessageFormat", MessageFormat)
+            _setattr("ServiceAccessRoleArn", ServiceAccessRoleArn)
+            _setattr("StreamArn", StreamArn)
+            _init_PropertyType(self, kwargs)
+
+    class EndpointMongoDbSettings(_PropertyType):
+        """The Mongo Db Settings property type for Endpoint in DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for MongoDbSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dms-endpoint-mongodbsettings.html>`_
+        """
+
+        __slots__ = (
+            "AuthMechanism",
+            "AuthSource",
+            "AuthType",
+            "DatabaseName",
+            "DocsToInvestigate",
+            "ExtractDocId",
+            "NestingLevel",
+            "Password",
+            "Port",
+            "ServerName",
+            "Username",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointMongoDbSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthMechanism=None,
+            AuthSource=None,
+            AuthType=None,
+            DatabaseName=None,
+            DocsToInvestigate=None,
+            ExtractDocId=None,
+            NestingLevel=None,
+            Password=None,
+            Port=None,
+            ServerName=None,
+            Username=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AuthMechanism", AuthMechanism)
+            _setattr("AuthSource", AuthSource)
+            _setattr("AuthType", AuthType)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("DocsToInvestigate", DocsToInvestigate)
+            _setattr("ExtractDocId", ExtractDocId)
+            _setattr("NestingLevel", NestingLevel)
+            _setattr("Password", Password)
+            _setattr("Port", Port)
+            _setattr("ServerName", ServerName)
+            _setattr("Username", Username)
+            _init_PropertyType(self, kwargs)
+
+    class EndpointS3Settings(_PropertyType):
+        """The S3 Settings property type for Endpoint in DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3Settings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dms-endpoint-s3settings.html>`_
+        """
+
+        __slots__ = (
+            "BucketFolder",
+            "BucketName",
+            "CompressionType",
+            "CsvDelimiter",
+            "CsvRowDelimiter",
+            "ExternalTableDefinition",
+            "ServiceAccessRoleArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointS3Settings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BucketFolder=None,
+            BucketName=None,
+            CompressionType=None,
+            CsvDelimiter=None,
+            CsvRowDelimiter=None,
+            ExternalTableDefinition=None,
+            ServiceAccessRoleArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketFolder", BucketFolder)
+            _setattr("BucketName", BucketName)
+            _setattr("CompressionType", CompressionType)
+            _setattr("CsvDelimiter", CsvDelimiter)
+            _setattr("CsvRowDelimiter", CsvRowDelimiter)
+            _setattr("ExternalTableDefinition", ExternalTableDefinition)
+            _setattr("ServiceAccessRoleArn", ServiceAccessRoleArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EndpointDynamoDbSettings = create_object_converter(
+        EndpointDynamoDbSettings
     )
-
-
-@attrs(**ATTRSCONFIG)
-class EndpointProperties(ResourceProperties):
-    CertificateArn = attrib(default=None)
-    DatabaseName = attrib(default=None)
-    DynamoDbSettings = attrib(default=None)
-    ElasticsearchSettings = attrib(default=None)
-    EndpointIdentifier = attrib(default=None)
-    EndpointType = attrib(default=None)
-    EngineName = attrib(default=None)
-    ExtraConnectionAttributes = attrib(default=None)
-    KinesisSettings = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    MongoDbSettings = attrib(default=None)
-    Password = attrib(default=None)
-    Port = attrib(default=None)
-    S3Settings = attrib(default=None)
-    ServerName = attrib(default=None)
-    SslMode = attrib(default=None)
-    Tags = attrib(default=None)
-    Username = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Endpoint(Resource):
-    """A Endpoint for DMS.
-
-    See Also:
-        `AWS Cloud Formation documentation for Endpoint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-endpoint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::DMS::Endpoint"
-
-    Properties: EndpointProperties = attrib(
-        factory=EndpointProperties,
-        converter=create_object_converter(EndpointProperties),
+    _convert_EndpointElasticsearchSettings = create_object_converter(
+        EndpointElasticsearchSettings
     )
-
-
-@attrs(**ATTRSCONFIG)
-class EventSubscriptionProperties(ResourceProperties):
-    Enabled = attrib(default=None)
-    EventCategories = attrib(default=None)
-    SnsTopicArn = attrib(default=None)
-    SourceIds = attrib(default=None)
-    SourceType = attrib(default=None)
-    SubscriptionName = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EventSubscription(Resource):
-    """A Event Subscription for DMS.
-
-    See Also:
-        `AWS Cloud Formation documentation for EventSubscription
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-eventsubscription.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::DMS::EventSubscription"
-
-    Properties: EventSubscriptionProperties = attrib(
-        factory=EventSubscriptionProperties,
-        converter=create_object_converter(EventSubscriptionProperties),
+    _convert_EndpointKinesisSettings = create_object_converter(EndpointKinesisSettings)
+    _convert_EndpointMongoDbSettings = create_object_converter(EndpointMongoDbSettings)
+    _convert_EndpointS3Settings = create_object_converter(EndpointS3Settings)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class EndpointProperties(_ResourceProperties):
+        __slots__ = (
+            "CertificateArn",
+            "DatabaseName",
+            "DynamoDbSettings",
+            "ElasticsearchSettings",
+            "EndpointIdentifier",
+            "EndpointType",
+            "EngineName",
+            "ExtraConnectionAttributes",
+            "KinesisSettings",
+            "KmsKeyId",
+            "MongoDbSettings",
+            "Password",
+            "Port",
+            "S3Settings",
+            "ServerName",
+            "SslMode",
+            "Tags",
+            "Username",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DynamoDbSettings": _convert_EndpointDynamoDbSettings,
+                "ElasticsearchSettings": _convert_EndpointElasticsearchSettings,
+                "KinesisSettings": _convert_EndpointKinesisSettings,
+                "MongoDbSettings": _convert_EndpointMongoDbSettings,
+                "S3Settings": _convert_EndpointS3Settings,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CertificateArn=None,
+            DatabaseName=None,
+            DynamoDbSettings=None,
+            ElasticsearchSettings=None,
+            EndpointIdentifier=None,
+            EndpointType=None,
+            EngineName=None,
+            ExtraConnectionAttributes=None,
+            KinesisSettings=None,
+            KmsKeyId=None,
+            MongoDbSettings=None,
+            Password=None,
+            Port=None,
+            S3Settings=None,
+            ServerName=None,
+            SslMode=None,
+            Tags=None,
+            Username=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr(
+                "DynamoDbSettings", _convert_EndpointDynamoDbSettings(DynamoDbSettings)
+            )
+            _setattr(
+                "ElasticsearchSettings",
+                _convert_EndpointElasticsearchSettings(ElasticsearchSettings),
+            )
+            _setattr("EndpointIdentifier", EndpointIdentifier)
+            _setattr("EndpointType", EndpointType)
+            _setattr("EngineName", EngineName)
+            _setattr("ExtraConnectionAttributes", ExtraConnectionAttributes)
+            _setattr(
+                "KinesisSettings", _convert_EndpointKinesisSettings(KinesisSettings)
+            )
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr(
+                "MongoDbSettings", _convert_EndpointMongoDbSettings(MongoDbSettings)
+            )
+            _setattr("Password", Password)
+            _setattr("Port", Port)
+            _setattr("S3Settings", _convert_EndpointS3Settings(S3Settings))
+            _setattr("ServerName", ServerName)
+            _setattr("SslMode", SslMode)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Username", Username)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EndpointProperties = create_object_converter(EndpointProperties)
+
+    class Endpoint(_Resource):
+        """A Endpoint for DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Endpoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-endpoint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DMS::Endpoint"
+
+        Properties: EndpointProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Endpoint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EndpointProperties},
+            factories={"Properties": EndpointProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EndpointProperties()
+            _setattr("Properties", _convert_EndpointProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Endpoint,
+        EndpointProperties,
+        EndpointDynamoDbSettings,
+        EndpointElasticsearchSettings,
+        EndpointKinesisSettings,
+        EndpointMongoDbSettings,
+        EndpointS3Settings,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class ReplicationInstanceProperties(ResourceProperties):
-    AllocatedStorage = attrib(default=None)
-    AllowMajorVersionUpgrade = attrib(default=None)
-    AutoMinorVersionUpgrade = attrib(default=None)
-    AvailabilityZone = attrib(default=None)
-    EngineVersion = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    MultiAZ = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    PubliclyAccessible = attrib(default=None)
-    ReplicationInstanceClass = attrib(default=None)
-    ReplicationInstanceIdentifier = attrib(default=None)
-    ReplicationSubnetGroupIdentifier = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcSecurityGroupIds = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ReplicationInstance(Resource):
-    """A Replication Instance for DMS.
-
-    See Also:
-        `AWS Cloud Formation documentation for ReplicationInstance
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-replicationinstance.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::DMS::ReplicationInstance"
-
-    Properties: ReplicationInstanceProperties = attrib(
-        factory=ReplicationInstanceProperties,
-        converter=create_object_converter(ReplicationInstanceProperties),
+def _create_EventSubscription():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class EventSubscriptionProperties(_ResourceProperties):
+        __slots__ = (
+            "Enabled",
+            "EventCategories",
+            "SnsTopicArn",
+            "SourceIds",
+            "SourceType",
+            "SubscriptionName",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventSubscriptionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Enabled=None,
+            EventCategories=None,
+            SnsTopicArn=None,
+            SourceIds=None,
+            SourceType=None,
+            SubscriptionName=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr("EventCategories", EventCategories)
+            _setattr("SnsTopicArn", SnsTopicArn)
+            _setattr("SourceIds", SourceIds)
+            _setattr("SourceType", SourceType)
+            _setattr("SubscriptionName", SubscriptionName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EventSubscriptionProperties = create_object_converter(
+        EventSubscriptionProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ReplicationSubnetGroupProperties(ResourceProperties):
-    ReplicationSubnetGroupDescription = attrib(default=None)
-    ReplicationSubnetGroupIdentifier = attrib(default=None)
-    SubnetIds = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ReplicationSubnetGroup(Resource):
-    """A Replication Subnet Group for DMS.
-
-    See Also:
-        `AWS Cloud Formation documentation for ReplicationSubnetGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-replicationsubnetgroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::DMS::ReplicationSubnetGroup"
-
-    Properties: ReplicationSubnetGroupProperties = attrib(
-        factory=ReplicationSubnetGroupProperties,
-        converter=create_object_converter(ReplicationSubnetGroupProperties),
+    class EventSubscription(_Resource):
+        """A Event Subscription for DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for EventSubscription
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-eventsubscription.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DMS::EventSubscription"
+
+        Properties: EventSubscriptionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventSubscription",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EventSubscriptionProperties},
+            factories={"Properties": EventSubscriptionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EventSubscriptionProperties()
+            _setattr("Properties", _convert_EventSubscriptionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EventSubscription, EventSubscriptionProperties
+
+
+def _create_ReplicationInstance():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ReplicationInstanceProperties(_ResourceProperties):
+        __slots__ = (
+            "AllocatedStorage",
+            "AllowMajorVersionUpgrade",
+            "AutoMinorVersionUpgrade",
+            "AvailabilityZone",
+            "EngineVersion",
+            "KmsKeyId",
+            "MultiAZ",
+            "PreferredMaintenanceWindow",
+            "PubliclyAccessible",
+            "ReplicationInstanceClass",
+            "ReplicationInstanceIdentifier",
+            "ReplicationSubnetGroupIdentifier",
+            "Tags",
+            "VpcSecurityGroupIds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReplicationInstanceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllocatedStorage=None,
+            AllowMajorVersionUpgrade=None,
+            AutoMinorVersionUpgrade=None,
+            AvailabilityZone=None,
+            EngineVersion=None,
+            KmsKeyId=None,
+            MultiAZ=None,
+            PreferredMaintenanceWindow=None,
+            PubliclyAccessible=None,
+            ReplicationInstanceClass=None,
+            ReplicationInstanceIdentifier=None,
+            ReplicationSubnetGroupIdentifier=None,
+            Tags=None,
+            VpcSecurityGroupIds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocatedStorage", AllocatedStorage)
+            _setattr("AllowMajorVersionUpgrade", AllowMajorVersionUpgrade)
+            _setattr("AutoMinorVersionUpgrade", AutoMinorVersionUpgrade)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("EngineVersion", EngineVersion)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("MultiAZ", MultiAZ)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr("PubliclyAccessible", PubliclyAccessible)
+            _setattr("ReplicationInstanceClass", ReplicationInstanceClass)
+            _setattr("ReplicationInstanceIdentifier", ReplicationInstanceIdentifier)
+            _setattr(
+                "ReplicationSubnetGroupIdentifier", ReplicationSubnetGroupIdentifier
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcSecurityGroupIds", VpcSecurityGroupIds)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ReplicationInstanceProperties = create_object_converter(
+        ReplicationInstanceProperties
     )
 
+    class ReplicationInstance(_Resource):
+        """A Replication Instance for DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReplicationInstance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-replicationinstance.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DMS::ReplicationInstance"
+
+        Properties: ReplicationInstanceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReplicationInstance",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ReplicationInstanceProperties},
+            factories={"Properties": ReplicationInstanceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ReplicationInstanceProperties()
+            _setattr("Properties", _convert_ReplicationInstanceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ReplicationInstance, ReplicationInstanceProperties
+
+
+def _create_ReplicationSubnetGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ReplicationSubnetGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "ReplicationSubnetGroupDescription",
+            "ReplicationSubnetGroupIdentifier",
+            "SubnetIds",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReplicationSubnetGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ReplicationSubnetGroupDescription=None,
+            ReplicationSubnetGroupIdentifier=None,
+            SubnetIds=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ReplicationSubnetGroupDescription", ReplicationSubnetGroupDescription
+            )
+            _setattr(
+                "ReplicationSubnetGroupIdentifier", ReplicationSubnetGroupIdentifier
+            )
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ReplicationSubnetGroupProperties = create_object_converter(
+        ReplicationSubnetGroupProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class ReplicationTaskProperties(ResourceProperties):
-    CdcStartPosition = attrib(default=None)
-    CdcStartTime = attrib(default=None)
-    CdcStopPosition = attrib(default=None)
-    MigrationType = attrib(default=None)
-    ReplicationInstanceArn = attrib(default=None)
-    ReplicationTaskIdentifier = attrib(default=None)
-    ReplicationTaskSettings = attrib(default=None)
-    SourceEndpointArn = attrib(default=None)
-    TableMappings = attrib(default=None)
-    Tags = attrib(default=None)
-    TargetEndpointArn = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ReplicationTask(Resource):
-    """A Replication Task for DMS.
-
-    See Also:
-        `AWS Cloud Formation documentation for ReplicationTask
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-replicationtask.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::DMS::ReplicationTask"
-
-    Properties: ReplicationTaskProperties = attrib(
-        factory=ReplicationTaskProperties,
-        converter=create_object_converter(ReplicationTaskProperties),
+    class ReplicationSubnetGroup(_Resource):
+        """A Replication Subnet Group for DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReplicationSubnetGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-replicationsubnetgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DMS::ReplicationSubnetGroup"
+
+        Properties: ReplicationSubnetGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReplicationSubnetGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ReplicationSubnetGroupProperties},
+            factories={"Properties": ReplicationSubnetGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ReplicationSubnetGroupProperties()
+            _setattr(
+                "Properties", _convert_ReplicationSubnetGroupProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return ReplicationSubnetGroup, ReplicationSubnetGroupProperties
+
+
+def _create_ReplicationTask():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ReplicationTaskProperties(_ResourceProperties):
+        __slots__ = (
+            "CdcStartPosition",
+            "CdcStartTime",
+            "CdcStopPosition",
+            "MigrationType",
+            "ReplicationInstanceArn",
+            "ReplicationTaskIdentifier",
+            "ReplicationTaskSettings",
+            "SourceEndpointArn",
+            "TableMappings",
+            "Tags",
+            "TargetEndpointArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReplicationTaskProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CdcStartPosition=None,
+            CdcStartTime=None,
+            CdcStopPosition=None,
+            MigrationType=None,
+            ReplicationInstanceArn=None,
+            ReplicationTaskIdentifier=None,
+            ReplicationTaskSettings=None,
+            SourceEndpointArn=None,
+            TableMappings=None,
+            Tags=None,
+            TargetEndpointArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CdcStartPosition", CdcStartPosition)
+            _setattr("CdcStartTime", CdcStartTime)
+            _setattr("CdcStopPosition", CdcStopPosition)
+            _setattr("MigrationType", MigrationType)
+            _setattr("ReplicationInstanceArn", ReplicationInstanceArn)
+            _setattr("ReplicationTaskIdentifier", ReplicationTaskIdentifier)
+            _setattr("ReplicationTaskSettings", ReplicationTaskSettings)
+            _setattr("SourceEndpointArn", SourceEndpointArn)
+            _setattr("TableMappings", TableMappings)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TargetEndpointArn", TargetEndpointArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ReplicationTaskProperties = create_object_converter(
+        ReplicationTaskProperties
     )
+
+    class ReplicationTask(_Resource):
+        """A Replication Task for DMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReplicationTask
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dms-replicationtask.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DMS::ReplicationTask"
+
+        Properties: ReplicationTaskProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReplicationTask",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ReplicationTaskProperties},
+            factories={"Properties": ReplicationTaskProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ReplicationTaskProperties()
+            _setattr("Properties", _convert_ReplicationTaskProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ReplicationTask, ReplicationTaskProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Certificate": _create_Certificate,
+        "CertificateProperties": _create_Certificate,
+        "Endpoint": _create_Endpoint,
+        "EndpointProperties": _create_Endpoint,
+        "EndpointDynamoDbSettings": _create_Endpoint,
+        "EndpointElasticsearchSettings": _create_Endpoint,
+        "EndpointKinesisSettings": _create_Endpoint,
+        "EndpointMongoDbSettings": _create_Endpoint,
+        "EndpointS3Settings": _create_Endpoint,
+        "EventSubscription": _create_EventSubscription,
+        "EventSubscriptionProperties": _create_EventSubscription,
+        "ReplicationInstance": _create_ReplicationInstance,
+        "ReplicationInstanceProperties": _create_ReplicationInstance,
+        "ReplicationSubnetGroup": _create_ReplicationSubnetGroup,
+        "ReplicationSubnetGroupProperties": _create_ReplicationSubnetGroup,
+        "ReplicationTask": _create_ReplicationTask,
+        "ReplicationTaskProperties": _create_ReplicationTask,
+    },
+)
@@ -7,44 +7,478 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Table", "TableProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Table",
+    "TableProperties",
+    "TableAttributeDefinition",
+    "TableGlobalSecondaryIndex",
+    "TableKeySchema",
+    "TableLocalSecondaryIndex",
+    "TablePointInTimeRecoverySpecification",
+    "TableProjection",
+    "TableProvisionedThroughput",
+    "TableSSESpecification",
+    "TableStreamSpecification",
+    "TableTimeToLiveSpecification",
+]
 
-@attrs(**ATTRSCONFIG)
-class TableProperties(ResourceProperties):
-    AttributeDefinitions = attrib(default=None)
-    BillingMode = attrib(default=None)
-    GlobalSecondaryIndexes = attrib(default=None)
-    KeySchema = attrib(default=None)
-    LocalSecondaryIndexes = attrib(default=None)
-    PointInTimeRecoverySpecification = attrib(default=None)
-    ProvisionedThroughput = attrib(default=None)
-    SSESpecification = attrib(default=None)
-    StreamSpecification = attrib(default=None)
-    TableName = attrib(default=None)
-    Tags = attrib(default=None)
-    TimeToLiveSpecification = attrib(default=None)
 
+def _create_Table():
+    class TableAttributeDefinition(_PropertyType):
+        """The Attribute Definition property type for Table in DynamoDB.
 
-@attrs(**ATTRSCONFIG)
-class Table(Resource):
-    """A Table for DynamoDB.
+        See Also:
+            `AWS Cloud Formation documentation for AttributeDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-attributedef.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Table
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dynamodb-table.html>`_
-    """
+        __slots__ = ("AttributeName", "AttributeType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableAttributeDefinition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::DynamoDB::Table"
+        def __init__(self, *, AttributeName=None, AttributeType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AttributeName", AttributeName)
+            _setattr("AttributeType", AttributeType)
+            _init_PropertyType(self, kwargs)
 
-    Properties: TableProperties = attrib(
-        factory=TableProperties, converter=create_object_converter(TableProperties)
+    class TableKeySchema(_PropertyType):
+        """The Key Schema property type for Table in DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for KeySchema
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-keyschema.html>`_
+        """
+
+        __slots__ = ("AttributeName", "KeyType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableKeySchema", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AttributeName=None, KeyType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AttributeName", AttributeName)
+            _setattr("KeyType", KeyType)
+            _init_PropertyType(self, kwargs)
+
+    class TableProjection(_PropertyType):
+        """The Projection property type for Table in DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for Projection
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-projectionobject.html>`_
+        """
+
+        __slots__ = ("NonKeyAttributes", "ProjectionType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableProjection", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, NonKeyAttributes=None, ProjectionType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NonKeyAttributes", NonKeyAttributes)
+            _setattr("ProjectionType", ProjectionType)
+            _init_PropertyType(self, kwargs)
+
+    class TableProvisionedThroughput(_PropertyType):
+        """The Provisioned Throughput property type for Table in DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProvisionedThroughput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-provisionedthroughput.html>`_
+        """
+
+        __slots__ = ("ReadCapacityUnits", "WriteCapacityUnits")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableProvisionedThroughput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ReadCapacityUnits=None, WriteCapacityUnits=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ReadCapacityUnits", ReadCapacityUnits)
+            _setattr("WriteCapacityUnits", WriteCapacityUnits)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TableKeySchema_list = create_object_list_converter(TableKeySchema)
+    _convert_TableProjection = create_object_converter(TableProjection)
+    _convert_TableProvisionedThroughput = create_object_converter(
+        TableProvisionedThroughput
+    )
+
+    class TableGlobalSecondaryIndex(_PropertyType):
+        """The Global Secondary Index property type for Table in DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for GlobalSecondaryIndex
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-gsi.html>`_
+        """
+
+        __slots__ = ("IndexName", "KeySchema", "Projection", "ProvisionedThroughput")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableGlobalSecondaryIndex",
+            _PropertyType,
+            __slots__,
+            converters={
+                "KeySchema": _convert_TableKeySchema_list,
+                "Projection": _convert_TableProjection,
+                "ProvisionedThroughput": _convert_TableProvisionedThroughput,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            IndexName=None,
+            KeySchema=None,
+            Projection=None,
+            ProvisionedThroughput=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IndexName", IndexName)
+            _setattr("KeySchema", _convert_TableKeySchema_list(KeySchema))
+            _setattr("Projection", _convert_TableProjection(Projection))
+            _setattr(
+                "ProvisionedThroughput",
+                _convert_TableProvisionedThroughput(ProvisionedThroughput),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class TableLocalSecondaryIndex(_PropertyType):
+        """The Local Secondary Index property type for Table in DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for LocalSecondaryIndex
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-lsi.html>`_
+        """
+
+        __slots__ = ("IndexName", "KeySchema", "Projection")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableLocalSecondaryIndex",
+            _PropertyType,
+            __slots__,
+            converters={
+                "KeySchema": _convert_TableKeySchema_list,
+                "Projection": _convert_TableProjection,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, IndexName=None, KeySchema=None, Projection=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IndexName", IndexName)
+            _setattr("KeySchema", _convert_TableKeySchema_list(KeySchema))
+            _setattr("Projection", _convert_TableProjection(Projection))
+            _init_PropertyType(self, kwargs)
+
+    class TablePointInTimeRecoverySpecification(_PropertyType):
+        """The Point In Time Recovery Specification property type for Table in DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for PointInTimeRecoverySpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-table-pointintimerecoveryspecification.html>`_
+        """
+
+        __slots__ = ("PointInTimeRecoveryEnabled",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TablePointInTimeRecoverySpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PointInTimeRecoveryEnabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PointInTimeRecoveryEnabled", PointInTimeRecoveryEnabled)
+            _init_PropertyType(self, kwargs)
+
+    class TableSSESpecification(_PropertyType):
+        """The Sse Specification property type for Table in DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for SSESpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-table-ssespecification.html>`_
+        """
+
+        __slots__ = ("KMSMasterKeyId", "SSEEnabled", "SSEType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableSSESpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, KMSMasterKeyId=None, SSEEnabled=None, SSEType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("KMSMasterKeyId", KMSMasterKeyId)
+            _setattr("SSEEnabled", SSEEnabled)
+            _setattr("SSEType", SSEType)
+            _init_PropertyType(self, kwargs)
+
+    class TableStreamSpecification(_PropertyType):
+        """The Stream Specification property type for Table in DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for StreamSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-streamspecification.html>`_
+        """
+
+        __slots__ = ("StreamViewType",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableStreamSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, StreamViewType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("StreamViewType", StreamViewType)
+            _init_PropertyType(self, kwargs)
+
+    class TableTimeToLiveSpecification(_PropertyType):
+        """The Time To Live Specification property type for Table in DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for TimeToLiveSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-dynamodb-timetolivespecification.html>`_
+        """
+
+        __slots__ = ("AttributeName", "Enabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableTimeToLiveSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AttributeName=None, Enabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AttributeName", AttributeName)
+            _setattr("Enabled", Enabled)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TableAttributeDefinition_list = create_object_list_converter(
+        TableAttributeDefinition
+    )
+    _convert_TableGlobalSecondaryIndex_list = create_object_list_converter(
+        TableGlobalSecondaryIndex
+    )
+    _convert_TableLocalSecondaryIndex_list = create_object_list_converter(
+        TableLocalSecondaryIndex
+    )
+    _convert_TablePointInTimeRecoverySpecification = create_object_converter(
+        TablePointInTimeRecoverySpecification
+    )
+    _convert_TableSSESpecification = create_object_converter(TableSSESpecification)
+    _convert_TableStreamSpecification = create_object_converter(
+        TableStreamSpecification
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_TableTimeToLiveSpecification = create_object_converter(
+        TableTimeToLiveSpecification
+    )
+
+    class TableProperties(_ResourceProperties):
+        __slots__ = (
+            "AttributeDefinitions",
+            "BillingMode",
+            "GlobalSecondaryIndexes",
+            "KeySchema",
+            "LocalSecondaryIndexes",
+            "PointInTimeRecoverySpecification",
+            "ProvisionedThroughput",
+            "SSESpecification",
+            "StreamSpecification",
+            "TableName",
+            "Tags",
+            "TimeToLiveSpecification",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AttributeDefinitions": _convert_TableAttributeDefinition_list,
+                "GlobalSecondaryIndexes": _convert_TableGlobalSecondaryIndex_list,
+                "KeySchema": _convert_TableKeySchema_list,
+                "LocalSecondaryIndexes": _convert_TableLocalSecondaryIndex_list,
+                "PointInTimeRecoverySpecification": _convert_TablePointInTimeRecoverySpecification,
+                "ProvisionedThroughput": _convert_TableProvisionedThroughput,
+                "SSESpecification": _convert_TableSSESpecification,
+                "StreamSpecification": _convert_TableStreamSpecification,
+                "Tags": _convert_Tag_list,
+                "TimeToLiveSpecification": _convert_TableTimeToLiveSpecification,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AttributeDefinitions=None,
+            BillingMode=None,
+            GlobalSecondaryIndexes=None,
+            KeySchema=None,
+            LocalSecondaryIndexes=None,
+            PointInTimeRecoverySpecification=None,
+            ProvisionedThroughput=None,
+            SSESpecification=None,
+            StreamSpecification=None,
+            TableName=None,
+            Tags=None,
+            TimeToLiveSpecification=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AttributeDefinitions",
+                _convert_TableAttributeDefinition_list(AttributeDefinitions),
+            )
+            _setattr("BillingMode", BillingMode)
+            _setattr(
+                "GlobalSecondaryIndexes",
+                _convert_TableGlobalSecondaryIndex_list(GlobalSecondaryIndexes),
+            )
+            _setattr("KeySchema", _convert_TableKeySchema_list(KeySchema))
+            _setattr(
+                "LocalSecondaryIndexes",
+                _convert_TableLocalSecondaryIndex_list(LocalSecondaryIndexes),
+            )
+            _setattr(
+                "PointInTimeRecoverySpecification",
+                _convert_TablePointInTimeRecoverySpecification(
+                    PointInTimeRecoverySpecification
+                ),
+            )
+            _setattr(
+                "ProvisionedThroughput",
+                _convert_TableProvisionedThroughput(ProvisionedThroughput),
+            )
+            _setattr(
+                "SSESpecification", _convert_TableSSESpecification(SSESpecification)
+            )
+            _setattr(
+                "StreamSpecification",
+                _convert_TableStreamSpecification(StreamSpecification),
+            )
+            _setattr("TableName", TableName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr(
+                "TimeToLiveSpecification",
+                _convert_TableTimeToLiveSpecification(TimeToLiveSpecification),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TableProperties = create_object_converter(TableProperties)
+
+    class Table(_Resource):
+        """A Table for DynamoDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for Table
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-dynamodb-table.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::DynamoDB::Table"
+
+        Properties: TableProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Table",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TableProperties},
+            factories={"Properties": TableProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TableProperties()
+            _setattr("Properties", _convert_TableProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Table,
+        TableProperties,
+        TableAttributeDefinition,
+        TableKeySchema,
+        TableProjection,
+        TableProvisionedThroughput,
+        TableGlobalSecondaryIndex,
+        TableLocalSecondaryIndex,
+        TablePointInTimeRecoverySpecification,
+        TableSSESpecification,
+        TableStreamSpecification,
+        TableTimeToLiveSpecification,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Table": _create_Table,
+        "TableProperties": _create_Table,
+        "TableAttributeDefinition": _create_Table,
+        "TableGlobalSecondaryIndex": _create_Table,
+        "TableKeySchema": _create_Table,
+        "TableLocalSecondaryIndex": _create_Table,
+        "TablePointInTimeRecoverySpecification": _create_Table,
+        "TableProjection": _create_Table,
+        "TableProvisionedThroughput": _create_Table,
+        "TableSSESpecification": _create_Table,
+        "TableStreamSpecification": _create_Table,
+        "TableTimeToLiveSpecification": _create_Table,
+    },
+)
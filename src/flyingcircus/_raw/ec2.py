@@ -10,21 +10,35 @@ This file is automatically generated, and should not be directly edited.
 from typing import Any
 from typing import Dict
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "CapacityReservation",
     "CapacityReservationProperties",
+    "CapacityReservationTagSpecification",
     "ClientVpnAuthorizationRule",
     "ClientVpnAuthorizationRuleProperties",
     "ClientVpnEndpoint",
     "ClientVpnEndpointProperties",
+    "ClientVpnEndpointCertificateAuthenticationRequest",
+    "ClientVpnEndpointClientAuthenticationRequest",
+    "ClientVpnEndpointConnectionLogOptions",
+    "ClientVpnEndpointDirectoryServiceAuthenticationRequest",
+    "ClientVpnEndpointTagSpecification",
     "ClientVpnRoute",
     "ClientVpnRouteProperties",
     "ClientVpnTargetNetworkAssociation",
@@ -35,12 +49,20 @@ __all__ = [
     "DHCPOptionsProperties",
     "EC2Fleet",
     "EC2FleetProperties",
-    "EgressOnlyInternetGateway",
-    "EgressOnlyInternetGatewayProperties",
+    "EC2FleetFleetLaunchTemplateConfigRequest",
+    "EC2FleetFleetLaunchTemplateOverridesRequest",
+    "EC2FleetFleetLaunchTemplateSpecificationRequest",
+    "EC2FleetOnDemandOptionsRequest",
+    "EC2FleetSpotOptionsRequest",
+    "EC2FleetTagRequest",
+    "EC2FleetTagSpecification",
+    "EC2FleetTargetCapacitySpecificationRequest",
     "EIP",
     "EIPProperties",
     "EIPAssociation",
     "EIPAssociationProperties",
+    "EgressOnlyInternetGateway",
+    "EgressOnlyInternetGatewayProperties",
     "FlowLog",
     "FlowLogProperties",
     "GatewayRouteTableAssociation",
@@ -49,18 +71,57 @@ __all__ = [
     "HostProperties",
     "Instance",
     "InstanceProperties",
+    "InstanceAssociationParameter",
+    "InstanceBlockDeviceMapping",
+    "InstanceCpuOptions",
+    "InstanceCreditSpecification",
+    "InstanceEbs",
+    "InstanceElasticGpuSpecification",
+    "InstanceElasticInferenceAccelerator",
+    "InstanceInstanceIpv6Address",
+    "InstanceLaunchTemplateSpecification",
+    "InstanceLicenseSpecification",
+    "InstanceNetworkInterface",
+    "InstanceNoDevice",
+    "InstancePrivateIpAddressSpecification",
+    "InstanceSsmAssociation",
+    "InstanceVolume",
     "InternetGateway",
     "InternetGatewayProperties",
     "LaunchTemplate",
     "LaunchTemplateProperties",
+    "LaunchTemplateBlockDeviceMapping",
+    "LaunchTemplateCapacityReservationSpecification",
+    "LaunchTemplateCapacityReservationTarget",
+    "LaunchTemplateCpuOptions",
+    "LaunchTemplateCreditSpecification",
+    "LaunchTemplateEbs",
+    "LaunchTemplateElasticGpuSpecification",
+    "LaunchTemplateHibernationOptions",
+    "LaunchTemplateIamInstanceProfile",
+    "LaunchTemplateInstanceMarketOptions",
+    "LaunchTemplateIpv6Add",
+    "LaunchTemplateLaunchTemplateData",
+    "LaunchTemplateLaunchTemplateElasticInferenceAccelerator",
+    "LaunchTemplateLicenseSpecification",
+    "LaunchTemplateMonitoring",
+    "LaunchTemplateNetworkInterface",
+    "LaunchTemplatePlacement",
+    "LaunchTemplatePrivateIpAdd",
+    "LaunchTemplateSpotOptions",
+    "LaunchTemplateTagSpecification",
     "NatGateway",
     "NatGatewayProperties",
     "NetworkAcl",
     "NetworkAclProperties",
     "NetworkAclEntry",
     "NetworkAclEntryProperties",
+    "NetworkAclEntryIcmp",
+    "NetworkAclEntryPortRange",
     "NetworkInterface",
     "NetworkInterfaceProperties",
+    "NetworkInterfaceInstanceIpv6Address",
+    "NetworkInterfacePrivateIpAddressSpecification",
     "NetworkInterfaceAttachment",
     "NetworkInterfaceAttachmentProperties",
     "NetworkInterfacePermission",
@@ -73,12 +134,34 @@ __all__ = [
     "RouteTableProperties",
     "SecurityGroup",
     "SecurityGroupProperties",
+    "SecurityGroupEgressProperty",
+    "SecurityGroupIngressProperty",
     "SecurityGroupEgress",
     "SecurityGroupEgressProperties",
     "SecurityGroupIngress",
     "SecurityGroupIngressProperties",
     "SpotFleet",
     "SpotFleetProperties",
+    "SpotFleetBlockDeviceMapping",
+    "SpotFleetClassicLoadBalancer",
+    "SpotFleetClassicLoadBalancersConfig",
+    "SpotFleetEbsBlockDevice",
+    "SpotFleetFleetLaunchTemplateSpecification",
+    "SpotFleetGroupIdentifier",
+    "SpotFleetIamInstanceProfileSpecification",
+    "SpotFleetInstanceIpv6Address",
+    "SpotFleetInstanceNetworkInterfaceSpecification",
+    "SpotFleetLaunchTemplateConfig",
+    "SpotFleetLaunchTemplateOverrides",
+    "SpotFleetLoadBalancersConfig",
+    "SpotFleetPrivateIpAddressSpecification",
+    "SpotFleetSpotFleetLaunchSpecification",
+    "SpotFleetSpotFleetMonitoring",
+    "SpotFleetSpotFleetRequestConfigData",
+    "SpotFleetSpotFleetTagSpecification",
+    "SpotFleetSpotPlacement",
+    "SpotFleetTargetGroup",
+    "SpotFleetTargetGroupsConfig",
     "Subnet",
     "SubnetProperties",
     "SubnetCidrBlock",
@@ -91,6 +174,7 @@ __all__ = [
     "TrafficMirrorFilterProperties",
     "TrafficMirrorFilterRule",
     "TrafficMirrorFilterRuleProperties",
+    "TrafficMirrorFilterRuleTrafficMirrorPortRange",
     "TrafficMirrorSession",
     "TrafficMirrorSessionProperties",
     "TrafficMirrorTarget",
@@ -107,10 +191,6 @@ __all__ = [
     "TransitGatewayRouteTableAssociationProperties",
     "TransitGatewayRouteTablePropagation",
     "TransitGatewayRouteTablePropagationProperties",
-    "Volume",
-    "VolumeProperties",
-    "VolumeAttachment",
-    "VolumeAttachmentProperties",
     "VPC",
     "VPCProperties",
     "VPCCidrBlock",
@@ -131,1557 +211,7548 @@ __all__ = [
     "VPCPeeringConnectionProperties",
     "VPNConnection",
     "VPNConnectionProperties",
+    "VPNConnectionVpnTunnelOptionsSpecification",
     "VPNConnectionRoute",
     "VPNConnectionRouteProperties",
     "VPNGateway",
     "VPNGatewayProperties",
     "VPNGatewayRoutePropagation",
     "VPNGatewayRoutePropagationProperties",
+    "Volume",
+    "VolumeProperties",
+    "VolumeAttachment",
+    "VolumeAttachmentProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class CapacityReservationProperties(ResourceProperties):
-    AvailabilityZone = attrib(default=None)
-    EbsOptimized = attrib(default=None)
-    EndDate = attrib(default=None)
-    EndDateType = attrib(default=None)
-    EphemeralStorage = attrib(default=None)
-    InstanceCount = attrib(default=None)
-    InstanceMatchCriteria = attrib(default=None)
-    InstancePlatform = attrib(default=None)
-    InstanceType = attrib(default=None)
-    TagSpecifications = attrib(default=None)
-    Tenancy = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class CapacityReservation(Resource):
-    """A Capacity Reservation for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for CapacityReservation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-capacityreservation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::CapacityReservation"
-
-    Properties: CapacityReservationProperties = attrib(
-        factory=CapacityReservationProperties,
-        converter=create_object_converter(CapacityReservationProperties),
+def _create_CapacityReservation():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class CapacityReservationTagSpecification(_PropertyType):
+        """The Tag Specification property type for CapacityReservation in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-capacityreservation-tagspecification.html>`_
+        """
+
+        __slots__ = ("ResourceType", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CapacityReservationTagSpecification",
+            _PropertyType,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceType=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceType", ResourceType)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_PropertyType(self, kwargs)
+
+    _convert_CapacityReservationTagSpecification_list = create_object_list_converter(
+        CapacityReservationTagSpecification
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ClientVpnAuthorizationRuleProperties(ResourceProperties):
-    AccessGroupId = attrib(default=None)
-    AuthorizeAllGroups = attrib(default=None)
-    ClientVpnEndpointId = attrib(default=None)
-    Description = attrib(default=None)
-    TargetNetworkCidr = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ClientVpnAuthorizationRule(Resource):
-    """A Client Vpn Authorization Rule for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for ClientVpnAuthorizationRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-clientvpnauthorizationrule.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::ClientVpnAuthorizationRule"
-
-    Properties: ClientVpnAuthorizationRuleProperties = attrib(
-        factory=ClientVpnAuthorizationRuleProperties,
-        converter=create_object_converter(ClientVpnAuthorizationRuleProperties),
+    class CapacityReservationProperties(_ResourceProperties):
+        __slots__ = (
+            "AvailabilityZone",
+            "EbsOptimized",
+            "EndDate",
+            "EndDateType",
+            "EphemeralStorage",
+            "InstanceCount",
+            "InstanceMatchCriteria",
+            "InstancePlatform",
+            "InstanceType",
+            "TagSpecifications",
+            "Tenancy",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CapacityReservationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "TagSpecifications": _convert_CapacityReservationTagSpecification_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AvailabilityZone=None,
+            EbsOptimized=None,
+            EndDate=None,
+            EndDateType=None,
+            EphemeralStorage=None,
+            InstanceCount=None,
+            InstanceMatchCriteria=None,
+            InstancePlatform=None,
+            InstanceType=None,
+            TagSpecifications=None,
+            Tenancy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("EbsOptimized", EbsOptimized)
+            _setattr("EndDate", EndDate)
+            _setattr("EndDateType", EndDateType)
+            _setattr("EphemeralStorage", EphemeralStorage)
+            _setattr("InstanceCount", InstanceCount)
+            _setattr("InstanceMatchCriteria", InstanceMatchCriteria)
+            _setattr("InstancePlatform", InstancePlatform)
+            _setattr("InstanceType", InstanceType)
+            _setattr(
+                "TagSpecifications",
+                _convert_CapacityReservationTagSpecification_list(TagSpecifications),
+            )
+            _setattr("Tenancy", Tenancy)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CapacityReservationProperties = create_object_converter(
+        CapacityReservationProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ClientVpnEndpointProperties(ResourceProperties):
-    AuthenticationOptions = attrib(default=None)
-    ClientCidrBlock = attrib(default=None)
-    ConnectionLogOptions = attrib(default=None)
-    Description = attrib(default=None)
-    DnsServers = attrib(default=None)
-    ServerCertificateArn = attrib(default=None)
-    SplitTunnel = attrib(default=None)
-    TagSpecifications = attrib(default=None)
-    TransportProtocol = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ClientVpnEndpoint(Resource):
-    """A Client Vpn Endpoint for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for ClientVpnEndpoint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-clientvpnendpoint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::ClientVpnEndpoint"
-
-    Properties: ClientVpnEndpointProperties = attrib(
-        factory=ClientVpnEndpointProperties,
-        converter=create_object_converter(ClientVpnEndpointProperties),
+    class CapacityReservation(_Resource):
+        """A Capacity Reservation for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CapacityReservation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-capacityreservation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::CapacityReservation"
+
+        Properties: CapacityReservationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CapacityReservation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CapacityReservationProperties},
+            factories={"Properties": CapacityReservationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CapacityReservationProperties()
+            _setattr("Properties", _convert_CapacityReservationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        CapacityReservation,
+        CapacityReservationProperties,
+        CapacityReservationTagSpecification,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class ClientVpnRouteProperties(ResourceProperties):
-    ClientVpnEndpointId = attrib(default=None)
-    Description = attrib(default=None)
-    DestinationCidrBlock = attrib(default=None)
-    TargetVpcSubnetId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ClientVpnRoute(Resource):
-    """A Client Vpn Route for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for ClientVpnRoute
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-clientvpnroute.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::ClientVpnRoute"
-
-    Properties: ClientVpnRouteProperties = attrib(
-        factory=ClientVpnRouteProperties,
-        converter=create_object_converter(ClientVpnRouteProperties),
+def _create_ClientVpnAuthorizationRule():
+    class ClientVpnAuthorizationRuleProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessGroupId",
+            "AuthorizeAllGroups",
+            "ClientVpnEndpointId",
+            "Description",
+            "TargetNetworkCidr",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnAuthorizationRuleProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessGroupId=None,
+            AuthorizeAllGroups=None,
+            ClientVpnEndpointId=None,
+            Description=None,
+            TargetNetworkCidr=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccessGroupId", AccessGroupId)
+            _setattr("AuthorizeAllGroups", AuthorizeAllGroups)
+            _setattr("ClientVpnEndpointId", ClientVpnEndpointId)
+            _setattr("Description", Description)
+            _setattr("TargetNetworkCidr", TargetNetworkCidr)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClientVpnAuthorizationRuleProperties = create_object_converter(
+        ClientVpnAuthorizationRuleProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ClientVpnTargetNetworkAssociationProperties(ResourceProperties):
-    ClientVpnEndpointId = attrib(default=None)
-    SubnetId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ClientVpnTargetNetworkAssociation(Resource):
-    """A Client Vpn Target Network Association for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for ClientVpnTargetNetworkAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-clientvpntargetnetworkassociation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::ClientVpnTargetNetworkAssociation"
-
-    Properties: ClientVpnTargetNetworkAssociationProperties = attrib(
-        factory=ClientVpnTargetNetworkAssociationProperties,
-        converter=create_object_converter(ClientVpnTargetNetworkAssociationProperties),
+    class ClientVpnAuthorizationRule(_Resource):
+        """A Client Vpn Authorization Rule for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClientVpnAuthorizationRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-clientvpnauthorizationrule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::ClientVpnAuthorizationRule"
+
+        Properties: ClientVpnAuthorizationRuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnAuthorizationRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClientVpnAuthorizationRuleProperties},
+            factories={"Properties": ClientVpnAuthorizationRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClientVpnAuthorizationRuleProperties()
+            _setattr(
+                "Properties", _convert_ClientVpnAuthorizationRuleProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return ClientVpnAuthorizationRule, ClientVpnAuthorizationRuleProperties
+
+
+def _create_ClientVpnEndpoint():
+    class ClientVpnEndpointCertificateAuthenticationRequest(_PropertyType):
+        """The Certificate Authentication Request property type for ClientVpnEndpoint in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CertificateAuthenticationRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-clientvpnendpoint-certificateauthenticationrequest.html>`_
+        """
+
+        __slots__ = ("ClientRootCertificateChainArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnEndpointCertificateAuthenticationRequest",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ClientRootCertificateChainArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClientRootCertificateChainArn", ClientRootCertificateChainArn)
+            _init_PropertyType(self, kwargs)
+
+    class ClientVpnEndpointDirectoryServiceAuthenticationRequest(_PropertyType):
+        """The Directory Service Authentication Request property type for ClientVpnEndpoint in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for DirectoryServiceAuthenticationRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-clientvpnendpoint-directoryserviceauthenticationrequest.html>`_
+        """
+
+        __slots__ = ("DirectoryId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnEndpointDirectoryServiceAuthenticationRequest",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DirectoryId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DirectoryId", DirectoryId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClientVpnEndpointDirectoryServiceAuthenticationRequest = (
+        create_object_converter(ClientVpnEndpointDirectoryServiceAuthenticationRequest)
     )
-
-
-@attrs(**ATTRSCONFIG)
-class CustomerGatewayProperties(ResourceProperties):
-    BgpAsn = attrib(default=None)
-    IpAddress = attrib(default=None)
-    Tags = attrib(default=None)
-    Type = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class CustomerGateway(Resource):
-    """A Customer Gateway for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for CustomerGateway
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-customer-gateway.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::CustomerGateway"
-
-    Properties: CustomerGatewayProperties = attrib(
-        factory=CustomerGatewayProperties,
-        converter=create_object_converter(CustomerGatewayProperties),
+    _convert_ClientVpnEndpointCertificateAuthenticationRequest = (
+        create_object_converter(ClientVpnEndpointCertificateAuthenticationRequest)
     )
 
-
-@attrs(**ATTRSCONFIG)
-class DHCPOptionsProperties(ResourceProperties):
-    DomainName = attrib(default=None)
-    DomainNameServers = attrib(default=None)
-    NetbiosNameServers = attrib(default=None)
-    NetbiosNodeType = attrib(default=None)
-    NtpServers = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DHCPOptions(Resource):
-    """A Dhcp Options for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for DHCPOptions
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-dhcp-options.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::DHCPOptions"
-
-    Properties: DHCPOptionsProperties = attrib(
-        factory=DHCPOptionsProperties,
-        converter=create_object_converter(DHCPOptionsProperties),
+    class ClientVpnEndpointClientAuthenticationRequest(_PropertyType):
+        """The Client Authentication Request property type for ClientVpnEndpoint in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClientAuthenticationRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-clientvpnendpoint-clientauthenticationrequest.html>`_
+        """
+
+        __slots__ = ("ActiveDirectory", "MutualAuthentication", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnEndpointClientAuthenticationRequest",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ActiveDirectory": _convert_ClientVpnEndpointDirectoryServiceAuthenticationRequest,
+                "MutualAuthentication": _convert_ClientVpnEndpointCertificateAuthenticationRequest,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ActiveDirectory=None,
+            MutualAuthentication=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ActiveDirectory",
+                _convert_ClientVpnEndpointDirectoryServiceAuthenticationRequest(
+                    ActiveDirectory
+                ),
+            )
+            _setattr(
+                "MutualAuthentication",
+                _convert_ClientVpnEndpointCertificateAuthenticationRequest(
+                    MutualAuthentication
+                ),
+            )
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class ClientVpnEndpointConnectionLogOptions(_PropertyType):
+        """The Connection Log Options property type for ClientVpnEndpoint in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConnectionLogOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-clientvpnendpoint-connectionlogoptions.html>`_
+        """
+
+        __slots__ = ("CloudwatchLogGroup", "CloudwatchLogStream", "Enabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnEndpointConnectionLogOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CloudwatchLogGroup=None,
+            CloudwatchLogStream=None,
+            Enabled=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudwatchLogGroup", CloudwatchLogGroup)
+            _setattr("CloudwatchLogStream", CloudwatchLogStream)
+            _setattr("Enabled", Enabled)
+            _init_PropertyType(self, kwargs)
+
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ClientVpnEndpointTagSpecification(_PropertyType):
+        """The Tag Specification property type for ClientVpnEndpoint in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-clientvpnendpoint-tagspecification.html>`_
+        """
+
+        __slots__ = ("ResourceType", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnEndpointTagSpecification",
+            _PropertyType,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceType=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceType", ResourceType)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClientVpnEndpointClientAuthenticationRequest_list = (
+        create_object_list_converter(ClientVpnEndpointClientAuthenticationRequest)
     )
-
-
-@attrs(**ATTRSCONFIG)
-class EC2FleetProperties(ResourceProperties):
-    ExcessCapacityTerminationPolicy = attrib(default=None)
-    LaunchTemplateConfigs = attrib(default=None)
-    OnDemandOptions = attrib(default=None)
-    ReplaceUnhealthyInstances = attrib(default=None)
-    SpotOptions = attrib(default=None)
-    TagSpecifications = attrib(default=None)
-    TargetCapacitySpecification = attrib(default=None)
-    TerminateInstancesWithExpiration = attrib(default=None)
-    Type = attrib(default=None)
-    ValidFrom = attrib(default=None)
-    ValidUntil = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EC2Fleet(Resource):
-    """A Ec2 Fleet for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for EC2Fleet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-ec2fleet.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::EC2Fleet"
-
-    Properties: EC2FleetProperties = attrib(
-        factory=EC2FleetProperties,
-        converter=create_object_converter(EC2FleetProperties),
+    _convert_ClientVpnEndpointConnectionLogOptions = create_object_converter(
+        ClientVpnEndpointConnectionLogOptions
     )
-
-
-@attrs(**ATTRSCONFIG)
-class EIPProperties(ResourceProperties):
-    Domain = attrib(default=None)
-    InstanceId = attrib(default=None)
-    PublicIpv4Pool = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EIP(Resource):
-    """A Eip for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for EIP
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-eip.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::EIP"
-
-    Properties: EIPProperties = attrib(
-        factory=EIPProperties, converter=create_object_converter(EIPProperties)
+    _convert_ClientVpnEndpointTagSpecification_list = create_object_list_converter(
+        ClientVpnEndpointTagSpecification
     )
 
-
-@attrs(**ATTRSCONFIG)
-class EIPAssociationProperties(ResourceProperties):
-    AllocationId = attrib(default=None)
-    EIP = attrib(default=None)
-    InstanceId = attrib(default=None)
-    NetworkInterfaceId = attrib(default=None)
-    PrivateIpAddress = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EIPAssociation(Resource):
-    """A Eip Association for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for EIPAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-eip-association.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::EIPAssociation"
-
-    Properties: EIPAssociationProperties = attrib(
-        factory=EIPAssociationProperties,
-        converter=create_object_converter(EIPAssociationProperties),
+    class ClientVpnEndpointProperties(_ResourceProperties):
+        __slots__ = (
+            "AuthenticationOptions",
+            "ClientCidrBlock",
+            "ConnectionLogOptions",
+            "Description",
+            "DnsServers",
+            "ServerCertificateArn",
+            "SplitTunnel",
+            "TagSpecifications",
+            "TransportProtocol",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnEndpointProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AuthenticationOptions": _convert_ClientVpnEndpointClientAuthenticationRequest_list,
+                "ConnectionLogOptions": _convert_ClientVpnEndpointConnectionLogOptions,
+                "TagSpecifications": _convert_ClientVpnEndpointTagSpecification_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticationOptions=None,
+            ClientCidrBlock=None,
+            ConnectionLogOptions=None,
+            Description=None,
+            DnsServers=None,
+            ServerCertificateArn=None,
+            SplitTunnel=None,
+            TagSpecifications=None,
+            TransportProtocol=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AuthenticationOptions",
+                _convert_ClientVpnEndpointClientAuthenticationRequest_list(
+                    AuthenticationOptions
+                ),
+            )
+            _setattr("ClientCidrBlock", ClientCidrBlock)
+            _setattr(
+                "ConnectionLogOptions",
+                _convert_ClientVpnEndpointConnectionLogOptions(ConnectionLogOptions),
+            )
+            _setattr("Description", Description)
+            _setattr("DnsServers", DnsServers)
+            _setattr("ServerCertificateArn", ServerCertificateArn)
+            _setattr("SplitTunnel", SplitTunnel)
+            _setattr(
+                "TagSpecifications",
+                _convert_ClientVpnEndpointTagSpecification_list(TagSpecifications),
+            )
+            _setattr("TransportProtocol", TransportProtocol)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClientVpnEndpointProperties = create_object_converter(
+        ClientVpnEndpointProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class EgressOnlyInternetGatewayProperties(ResourceProperties):
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EgressOnlyInternetGateway(Resource):
-    """A Egress Only Internet Gateway for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for EgressOnlyInternetGateway
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-egressonlyinternetgateway.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::EgressOnlyInternetGateway"
-
-    Properties: EgressOnlyInternetGatewayProperties = attrib(
-        factory=EgressOnlyInternetGatewayProperties,
-        converter=create_object_converter(EgressOnlyInternetGatewayProperties),
+    class ClientVpnEndpoint(_Resource):
+        """A Client Vpn Endpoint for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClientVpnEndpoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-clientvpnendpoint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::ClientVpnEndpoint"
+
+        Properties: ClientVpnEndpointProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnEndpoint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClientVpnEndpointProperties},
+            factories={"Properties": ClientVpnEndpointProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClientVpnEndpointProperties()
+            _setattr("Properties", _convert_ClientVpnEndpointProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ClientVpnEndpoint,
+        ClientVpnEndpointProperties,
+        ClientVpnEndpointCertificateAuthenticationRequest,
+        ClientVpnEndpointDirectoryServiceAuthenticationRequest,
+        ClientVpnEndpointClientAuthenticationRequest,
+        ClientVpnEndpointConnectionLogOptions,
+        ClientVpnEndpointTagSpecification,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class FlowLogProperties(ResourceProperties):
-    DeliverLogsPermissionArn = attrib(default=None)
-    LogDestination = attrib(default=None)
-    LogDestinationType = attrib(default=None)
-    LogGroupName = attrib(default=None)
-    ResourceId = attrib(default=None)
-    ResourceType = attrib(default=None)
-    TrafficType = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class FlowLog(Resource):
-    """A Flow Log for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for FlowLog
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-flowlog.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::FlowLog"
-
-    Properties: FlowLogProperties = attrib(
-        factory=FlowLogProperties, converter=create_object_converter(FlowLogProperties)
+def _create_ClientVpnRoute():
+    class ClientVpnRouteProperties(_ResourceProperties):
+        __slots__ = (
+            "ClientVpnEndpointId",
+            "Description",
+            "DestinationCidrBlock",
+            "TargetVpcSubnetId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnRouteProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ClientVpnEndpointId=None,
+            Description=None,
+            DestinationCidrBlock=None,
+            TargetVpcSubnetId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClientVpnEndpointId", ClientVpnEndpointId)
+            _setattr("Description", Description)
+            _setattr("DestinationCidrBlock", DestinationCidrBlock)
+            _setattr("TargetVpcSubnetId", TargetVpcSubnetId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClientVpnRouteProperties = create_object_converter(
+        ClientVpnRouteProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class GatewayRouteTableAssociationProperties(ResourceProperties):
-    GatewayId = attrib(default=None)
-    RouteTableId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class GatewayRouteTableAssociation(Resource):
-    """A Gateway Route Table Association for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for GatewayRouteTableAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-gatewayroutetableassociation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::GatewayRouteTableAssociation"
-
-    Properties: GatewayRouteTableAssociationProperties = attrib(
-        factory=GatewayRouteTableAssociationProperties,
-        converter=create_object_converter(GatewayRouteTableAssociationProperties),
+    class ClientVpnRoute(_Resource):
+        """A Client Vpn Route for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClientVpnRoute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-clientvpnroute.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::ClientVpnRoute"
+
+        Properties: ClientVpnRouteProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnRoute",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClientVpnRouteProperties},
+            factories={"Properties": ClientVpnRouteProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClientVpnRouteProperties()
+            _setattr("Properties", _convert_ClientVpnRouteProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ClientVpnRoute, ClientVpnRouteProperties
+
+
+def _create_ClientVpnTargetNetworkAssociation():
+    class ClientVpnTargetNetworkAssociationProperties(_ResourceProperties):
+        __slots__ = ("ClientVpnEndpointId", "SubnetId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnTargetNetworkAssociationProperties",
+            _ResourceProperties,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ClientVpnEndpointId=None, SubnetId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClientVpnEndpointId", ClientVpnEndpointId)
+            _setattr("SubnetId", SubnetId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClientVpnTargetNetworkAssociationProperties = create_object_converter(
+        ClientVpnTargetNetworkAssociationProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class HostProperties(ResourceProperties):
-    AutoPlacement = attrib(default=None)
-    AvailabilityZone = attrib(default=None)
-    HostRecovery = attrib(default=None)
-    InstanceType = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Host(Resource):
-    """A Host for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Host
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-host.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::Host"
-
-    Properties: HostProperties = attrib(
-        factory=HostProperties, converter=create_object_converter(HostProperties)
+    class ClientVpnTargetNetworkAssociation(_Resource):
+        """A Client Vpn Target Network Association for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClientVpnTargetNetworkAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-clientvpntargetnetworkassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::ClientVpnTargetNetworkAssociation"
+
+        Properties: ClientVpnTargetNetworkAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClientVpnTargetNetworkAssociation",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_ClientVpnTargetNetworkAssociationProperties
+            },
+            factories={"Properties": ClientVpnTargetNetworkAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClientVpnTargetNetworkAssociationProperties()
+            _setattr(
+                "Properties",
+                _convert_ClientVpnTargetNetworkAssociationProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        ClientVpnTargetNetworkAssociation,
+        ClientVpnTargetNetworkAssociationProperties,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class InstanceProperties(ResourceProperties):
-    AdditionalInfo = attrib(default=None)
-    Affinity = attrib(default=None)
-    AvailabilityZone = attrib(default=None)
-    BlockDeviceMappings = attrib(default=None)
-    CpuOptions = attrib(default=None)
-    CreditSpecification = attrib(default=None)
-    DisableApiTermination = attrib(default=None)
-    EbsOptimized = attrib(default=None)
-    ElasticGpuSpecifications = attrib(default=None)
-    ElasticInferenceAccelerators = attrib(default=None)
-    HostId = attrib(default=None)
-    IamInstanceProfile = attrib(default=None)
-    ImageId = attrib(default=None)
-    InstanceInitiatedShutdownBehavior = attrib(default=None)
-    InstanceType = attrib(default=None)
-    Ipv6AddressCount = attrib(default=None)
-    Ipv6Addresses = attrib(default=None)
-    KernelId = attrib(default=None)
-    KeyName = attrib(default=None)
-    LaunchTemplate = attrib(default=None)
-    LicenseSpecifications = attrib(default=None)
-    Monitoring = attrib(default=None)
-    NetworkInterfaces = attrib(default=None)
-    PlacementGroupName = attrib(default=None)
-    PrivateIpAddress = attrib(default=None)
-    RamdiskId = attrib(default=None)
-    SecurityGroupIds = attrib(default=None)
-    SecurityGroups = attrib(default=None)
-    SourceDestCheck = attrib(default=None)
-    SsmAssociations = attrib(default=None)
-    SubnetId = attrib(default=None)
-    Tags = attrib(default=None)
-    Tenancy = attrib(default=None)
-    UserData = attrib(default=None)
-    Volumes = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Instance(Resource):
-    """A Instance for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Instance
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::Instance"
-
-    Properties: InstanceProperties = attrib(
-        factory=InstanceProperties,
-        converter=create_object_converter(InstanceProperties),
+def _create_CustomerGateway():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class CustomerGatewayProperties(_ResourceProperties):
+        __slots__ = ("BgpAsn", "IpAddress", "Tags", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CustomerGatewayProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BgpAsn=None, IpAddress=None, Tags=None, Type=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BgpAsn", BgpAsn)
+            _setattr("IpAddress", IpAddress)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CustomerGatewayProperties = create_object_converter(
+        CustomerGatewayProperties
     )
 
-    # NB: CreationPolicy may be set for Instance
-    # (unlike most Resource types)
-    CreationPolicy: Dict[str, Any] = attrib(factory=dict)
-
-
-@attrs(**ATTRSCONFIG)
-class InternetGatewayProperties(ResourceProperties):
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class InternetGateway(Resource):
-    """A Internet Gateway for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for InternetGateway
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-internetgateway.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::InternetGateway"
-
-    Properties: InternetGatewayProperties = attrib(
-        factory=InternetGatewayProperties,
-        converter=create_object_converter(InternetGatewayProperties),
+    class CustomerGateway(_Resource):
+        """A Customer Gateway for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomerGateway
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-customer-gateway.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::CustomerGateway"
+
+        Properties: CustomerGatewayProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CustomerGateway",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CustomerGatewayProperties},
+            factories={"Properties": CustomerGatewayProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CustomerGatewayProperties()
+            _setattr("Properties", _convert_CustomerGatewayProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return CustomerGateway, CustomerGatewayProperties
+
+
+def _create_DHCPOptions():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DHCPOptionsProperties(_ResourceProperties):
+        __slots__ = (
+            "DomainName",
+            "DomainNameServers",
+            "NetbiosNameServers",
+            "NetbiosNodeType",
+            "NtpServers",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DHCPOptionsProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DomainName=None,
+            DomainNameServers=None,
+            NetbiosNameServers=None,
+            NetbiosNodeType=None,
+            NtpServers=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DomainName", DomainName)
+            _setattr("DomainNameServers", DomainNameServers)
+            _setattr("NetbiosNameServers", NetbiosNameServers)
+            _setattr("NetbiosNodeType", NetbiosNodeType)
+            _setattr("NtpServers", NtpServers)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DHCPOptionsProperties = create_object_converter(DHCPOptionsProperties)
+
+    class DHCPOptions(_Resource):
+        """A Dhcp Options for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for DHCPOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-dhcp-options.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::DHCPOptions"
+
+        Properties: DHCPOptionsProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DHCPOptions",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DHCPOptionsProperties},
+            factories={"Properties": DHCPOptionsProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DHCPOptionsProperties()
+            _setattr("Properties", _convert_DHCPOptionsProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DHCPOptions, DHCPOptionsProperties
+
+
+def _create_EC2Fleet():
+    class EC2FleetFleetLaunchTemplateSpecificationRequest(_PropertyType):
+        """The Fleet Launch Template Specification Request property type for EC2Fleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FleetLaunchTemplateSpecificationRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ec2fleet-fleetlaunchtemplatespecificationrequest.html>`_
+        """
+
+        __slots__ = ("LaunchTemplateId", "LaunchTemplateName", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2FleetFleetLaunchTemplateSpecificationRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            LaunchTemplateId=None,
+            LaunchTemplateName=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LaunchTemplateId", LaunchTemplateId)
+            _setattr("LaunchTemplateName", LaunchTemplateName)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class EC2FleetFleetLaunchTemplateOverridesRequest(_PropertyType):
+        """The Fleet Launch Template Overrides Request property type for EC2Fleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FleetLaunchTemplateOverridesRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ec2fleet-fleetlaunchtemplateoverridesrequest.html>`_
+        """
+
+        __slots__ = (
+            "AvailabilityZone",
+            "InstanceType",
+            "MaxPrice",
+            "Priority",
+            "SubnetId",
+            "WeightedCapacity",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2FleetFleetLaunchTemplateOverridesRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AvailabilityZone=None,
+            InstanceType=None,
+            MaxPrice=None,
+            Priority=None,
+            SubnetId=None,
+            WeightedCapacity=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("InstanceType", InstanceType)
+            _setattr("MaxPrice", MaxPrice)
+            _setattr("Priority", Priority)
+            _setattr("SubnetId", SubnetId)
+            _setattr("WeightedCapacity", WeightedCapacity)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EC2FleetFleetLaunchTemplateSpecificationRequest = create_object_converter(
+        EC2FleetFleetLaunchTemplateSpecificationRequest
     )
-
-
-@attrs(**ATTRSCONFIG)
-class LaunchTemplateProperties(ResourceProperties):
-    LaunchTemplateData = attrib(default=None)
-    LaunchTemplateName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class LaunchTemplate(Resource):
-    """A Launch Template for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for LaunchTemplate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-launchtemplate.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::LaunchTemplate"
-
-    Properties: LaunchTemplateProperties = attrib(
-        factory=LaunchTemplateProperties,
-        converter=create_object_converter(LaunchTemplateProperties),
+    _convert_EC2FleetFleetLaunchTemplateOverridesRequest_list = (
+        create_object_list_converter(EC2FleetFleetLaunchTemplateOverridesRequest)
     )
 
-
-@attrs(**ATTRSCONFIG)
-class NatGatewayProperties(ResourceProperties):
-    AllocationId = attrib(default=None)
-    SubnetId = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class NatGateway(Resource):
-    """A Nat Gateway for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for NatGateway
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-natgateway.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::NatGateway"
-
-    Properties: NatGatewayProperties = attrib(
-        factory=NatGatewayProperties,
-        converter=create_object_converter(NatGatewayProperties),
+    class EC2FleetFleetLaunchTemplateConfigRequest(_PropertyType):
+        """The Fleet Launch Template Config Request property type for EC2Fleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FleetLaunchTemplateConfigRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ec2fleet-fleetlaunchtemplateconfigrequest.html>`_
+        """
+
+        __slots__ = ("LaunchTemplateSpecification", "Overrides")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2FleetFleetLaunchTemplateConfigRequest",
+            _PropertyType,
+            __slots__,
+            converters={
+                "LaunchTemplateSpecification": _convert_EC2FleetFleetLaunchTemplateSpecificationRequest,
+                "Overrides": _convert_EC2FleetFleetLaunchTemplateOverridesRequest_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, LaunchTemplateSpecification=None, Overrides=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "LaunchTemplateSpecification",
+                _convert_EC2FleetFleetLaunchTemplateSpecificationRequest(
+                    LaunchTemplateSpecification
+                ),
+            )
+            _setattr(
+                "Overrides",
+                _convert_EC2FleetFleetLaunchTemplateOverridesRequest_list(Overrides),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class EC2FleetOnDemandOptionsRequest(_PropertyType):
+        """The On Demand Options Request property type for EC2Fleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for OnDemandOptionsRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ec2fleet-ondemandoptionsrequest.html>`_
+        """
+
+        __slots__ = ("AllocationStrategy",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2FleetOnDemandOptionsRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AllocationStrategy=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocationStrategy", AllocationStrategy)
+            _init_PropertyType(self, kwargs)
+
+    class EC2FleetSpotOptionsRequest(_PropertyType):
+        """The Spot Options Request property type for EC2Fleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SpotOptionsRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ec2fleet-spotoptionsrequest.html>`_
+        """
+
+        __slots__ = (
+            "AllocationStrategy",
+            "InstanceInterruptionBehavior",
+            "InstancePoolsToUseCount",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2FleetSpotOptionsRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllocationStrategy=None,
+            InstanceInterruptionBehavior=None,
+            InstancePoolsToUseCount=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocationStrategy", AllocationStrategy)
+            _setattr("InstanceInterruptionBehavior", InstanceInterruptionBehavior)
+            _setattr("InstancePoolsToUseCount", InstancePoolsToUseCount)
+            _init_PropertyType(self, kwargs)
+
+    class EC2FleetTagRequest(_PropertyType):
+        """The Tag Request property type for EC2Fleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ec2fleet-tagrequest.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2FleetTagRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EC2FleetTagRequest_list = create_object_list_converter(EC2FleetTagRequest)
+
+    class EC2FleetTagSpecification(_PropertyType):
+        """The Tag Specification property type for EC2Fleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ec2fleet-tagspecification.html>`_
+        """
+
+        __slots__ = ("ResourceType", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2FleetTagSpecification",
+            _PropertyType,
+            __slots__,
+            converters={"Tags": _convert_EC2FleetTagRequest_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceType=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceType", ResourceType)
+            _setattr("Tags", _convert_EC2FleetTagRequest_list(Tags))
+            _init_PropertyType(self, kwargs)
+
+    class EC2FleetTargetCapacitySpecificationRequest(_PropertyType):
+        """The Target Capacity Specification Request property type for EC2Fleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TargetCapacitySpecificationRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ec2fleet-targetcapacityspecificationrequest.html>`_
+        """
+
+        __slots__ = (
+            "DefaultTargetCapacityType",
+            "OnDemandTargetCapacity",
+            "SpotTargetCapacity",
+            "TotalTargetCapacity",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2FleetTargetCapacitySpecificationRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultTargetCapacityType=None,
+            OnDemandTargetCapacity=None,
+            SpotTargetCapacity=None,
+            TotalTargetCapacity=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultTargetCapacityType", DefaultTargetCapacityType)
+            _setattr("OnDemandTargetCapacity", OnDemandTargetCapacity)
+            _setattr("SpotTargetCapacity", SpotTargetCapacity)
+            _setattr("TotalTargetCapacity", TotalTargetCapacity)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EC2FleetFleetLaunchTemplateConfigRequest_list = (
+        create_object_list_converter(EC2FleetFleetLaunchTemplateConfigRequest)
     )
-
-
-@attrs(**ATTRSCONFIG)
-class NetworkAclProperties(ResourceProperties):
-    Tags = attrib(default=None)
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class NetworkAcl(Resource):
-    """A Network Acl for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for NetworkAcl
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-network-acl.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::NetworkAcl"
-
-    Properties: NetworkAclProperties = attrib(
-        factory=NetworkAclProperties,
-        converter=create_object_converter(NetworkAclProperties),
+    _convert_EC2FleetOnDemandOptionsRequest = create_object_converter(
+        EC2FleetOnDemandOptionsRequest
     )
-
-
-@attrs(**ATTRSCONFIG)
-class NetworkAclEntryProperties(ResourceProperties):
-    CidrBlock = attrib(default=None)
-    Egress = attrib(default=None)
-    Icmp = attrib(default=None)
-    Ipv6CidrBlock = attrib(default=None)
-    NetworkAclId = attrib(default=None)
-    PortRange = attrib(default=None)
-    Protocol = attrib(default=None)
-    RuleAction = attrib(default=None)
-    RuleNumber = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class NetworkAclEntry(Resource):
-    """A Network Acl Entry for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for NetworkAclEntry
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-network-acl-entry.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::NetworkAclEntry"
-
-    Properties: NetworkAclEntryProperties = attrib(
-        factory=NetworkAclEntryProperties,
-        converter=create_object_converter(NetworkAclEntryProperties),
+    _convert_EC2FleetSpotOptionsRequest = create_object_converter(
+        EC2FleetSpotOptionsRequest
     )
-
-
-@attrs(**ATTRSCONFIG)
-class NetworkInterfaceProperties(ResourceProperties):
-    Description = attrib(default=None)
-    GroupSet = attrib(default=None)
-    InterfaceType = attrib(default=None)
-    Ipv6AddressCount = attrib(default=None)
-    Ipv6Addresses = attrib(default=None)
-    PrivateIpAddress = attrib(default=None)
-    PrivateIpAddresses = attrib(default=None)
-    SecondaryPrivateIpAddressCount = attrib(default=None)
-    SourceDestCheck = attrib(default=None)
-    SubnetId = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class NetworkInterface(Resource):
-    """A Network Interface for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for NetworkInterface
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-network-interface.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::NetworkInterface"
-
-    Properties: NetworkInterfaceProperties = attrib(
-        factory=NetworkInterfaceProperties,
-        converter=create_object_converter(NetworkInterfaceProperties),
+    _convert_EC2FleetTagSpecification_list = create_object_list_converter(
+        EC2FleetTagSpecification
     )
-
-
-@attrs(**ATTRSCONFIG)
-class NetworkInterfaceAttachmentProperties(ResourceProperties):
-    DeleteOnTermination = attrib(default=None)
-    DeviceIndex = attrib(default=None)
-    InstanceId = attrib(default=None)
-    NetworkInterfaceId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class NetworkInterfaceAttachment(Resource):
-    """A Network Interface Attachment for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for NetworkInterfaceAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-network-interface-attachment.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::NetworkInterfaceAttachment"
-
-    Properties: NetworkInterfaceAttachmentProperties = attrib(
-        factory=NetworkInterfaceAttachmentProperties,
-        converter=create_object_converter(NetworkInterfaceAttachmentProperties),
+    _convert_EC2FleetTargetCapacitySpecificationRequest = create_object_converter(
+        EC2FleetTargetCapacitySpecificationRequest
     )
 
-
-@attrs(**ATTRSCONFIG)
-class NetworkInterfacePermissionProperties(ResourceProperties):
-    AwsAccountId = attrib(default=None)
-    NetworkInterfaceId = attrib(default=None)
-    Permission = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class NetworkInterfacePermission(Resource):
-    """A Network Interface Permission for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for NetworkInterfacePermission
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-networkinterfacepermission.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::NetworkInterfacePermission"
-
-    Properties: NetworkInterfacePermissionProperties = attrib(
-        factory=NetworkInterfacePermissionProperties,
-        converter=create_object_converter(NetworkInterfacePermissionProperties),
+    class EC2FleetProperties(_ResourceProperties):
+        __slots__ = (
+            "ExcessCapacityTerminationPolicy",
+            "LaunchTemplateConfigs",
+            "OnDemandOptions",
+            "ReplaceUnhealthyInstances",
+            "SpotOptions",
+            "TagSpecifications",
+            "TargetCapacitySpecification",
+            "TerminateInstancesWithExpiration",
+            "Type",
+            "ValidFrom",
+            "ValidUntil",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2FleetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LaunchTemplateConfigs": _convert_EC2FleetFleetLaunchTemplateConfigRequest_list,
+                "OnDemandOptions": _convert_EC2FleetOnDemandOptionsRequest,
+                "SpotOptions": _convert_EC2FleetSpotOptionsRequest,
+                "TagSpecifications": _convert_EC2FleetTagSpecification_list,
+                "TargetCapacitySpecification": _convert_EC2FleetTargetCapacitySpecificationRequest,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ExcessCapacityTerminationPolicy=None,
+            LaunchTemplateConfigs=None,
+            OnDemandOptions=None,
+            ReplaceUnhealthyInstances=None,
+            SpotOptions=None,
+            TagSpecifications=None,
+            TargetCapacitySpecification=None,
+            TerminateInstancesWithExpiration=None,
+            Type=None,
+            ValidFrom=None,
+            ValidUntil=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExcessCapacityTerminationPolicy", ExcessCapacityTerminationPolicy)
+            _setattr(
+                "LaunchTemplateConfigs",
+                _convert_EC2FleetFleetLaunchTemplateConfigRequest_list(
+                    LaunchTemplateConfigs
+                ),
+            )
+            _setattr(
+                "OnDemandOptions",
+                _convert_EC2FleetOnDemandOptionsRequest(OnDemandOptions),
+            )
+            _setattr("ReplaceUnhealthyInstances", ReplaceUnhealthyInstances)
+            _setattr("SpotOptions", _convert_EC2FleetSpotOptionsRequest(SpotOptions))
+            _setattr(
+                "TagSpecifications",
+                _convert_EC2FleetTagSpecification_list(TagSpecifications),
+            )
+            _setattr(
+                "TargetCapacitySpecification",
+                _convert_EC2FleetTargetCapacitySpecificationRequest(
+                    TargetCapacitySpecification
+                ),
+            )
+            _setattr(
+                "TerminateInstancesWithExpiration", TerminateInstancesWithExpiration
+            )
+            _setattr("Type", Type)
+            _setattr("ValidFrom", ValidFrom)
+            _setattr("ValidUntil", ValidUntil)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EC2FleetProperties = create_object_converter(EC2FleetProperties)
+
+    class EC2Fleet(_Resource):
+        """A Ec2 Fleet for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for EC2Fleet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-ec2fleet.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::EC2Fleet"
+
+        Properties: EC2FleetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EC2Fleet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EC2FleetProperties},
+            factories={"Properties": EC2FleetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EC2FleetProperties()
+            _setattr("Properties", _convert_EC2FleetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        EC2Fleet,
+        EC2FleetProperties,
+        EC2FleetFleetLaunchTemplateSpecificationRequest,
+        EC2FleetFleetLaunchTemplateOverridesRequest,
+        EC2FleetFleetLaunchTemplateConfigRequest,
+        EC2FleetOnDemandOptionsRequest,
+        EC2FleetSpotOptionsRequest,
+        EC2FleetTagRequest,
+        EC2FleetTagSpecification,
+        EC2FleetTargetCapacitySpecificationRequest,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class PlacementGroupProperties(ResourceProperties):
-    Strategy = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class PlacementGroup(Resource):
-    """A Placement Group for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for PlacementGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-placementgroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::PlacementGroup"
-
-    Properties: PlacementGroupProperties = attrib(
-        factory=PlacementGroupProperties,
-        converter=create_object_converter(PlacementGroupProperties),
+def _create_EIP():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class EIPProperties(_ResourceProperties):
+        __slots__ = ("Domain", "InstanceId", "PublicIpv4Pool", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EIPProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Domain=None,
+            InstanceId=None,
+            PublicIpv4Pool=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Domain", Domain)
+            _setattr("InstanceId", InstanceId)
+            _setattr("PublicIpv4Pool", PublicIpv4Pool)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EIPProperties = create_object_converter(EIPProperties)
+
+    class EIP(_Resource):
+        """A Eip for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for EIP
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-eip.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::EIP"
+
+        Properties: EIPProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EIP",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EIPProperties},
+            factories={"Properties": EIPProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EIPProperties()
+            _setattr("Properties", _convert_EIPProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EIP, EIPProperties
+
+
+def _create_EIPAssociation():
+    class EIPAssociationProperties(_ResourceProperties):
+        __slots__ = (
+            "AllocationId",
+            "EIP",
+            "InstanceId",
+            "NetworkInterfaceId",
+            "PrivateIpAddress",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EIPAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllocationId=None,
+            EIP=None,
+            InstanceId=None,
+            NetworkInterfaceId=None,
+            PrivateIpAddress=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocationId", AllocationId)
+            _setattr("EIP", EIP)
+            _setattr("InstanceId", InstanceId)
+            _setattr("NetworkInterfaceId", NetworkInterfaceId)
+            _setattr("PrivateIpAddress", PrivateIpAddress)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EIPAssociationProperties = create_object_converter(
+        EIPAssociationProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RouteProperties(ResourceProperties):
-    DestinationCidrBlock = attrib(default=None)
-    DestinationIpv6CidrBlock = attrib(default=None)
-    EgressOnlyInternetGatewayId = attrib(default=None)
-    GatewayId = attrib(default=None)
-    InstanceId = attrib(default=None)
-    NatGatewayId = attrib(default=None)
-    NetworkInterfaceId = attrib(default=None)
-    RouteTableId = attrib(default=None)
-    TransitGatewayId = attrib(default=None)
-    VpcPeeringConnectionId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Route(Resource):
-    """A Route for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Route
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-route.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::Route"
-
-    Properties: RouteProperties = attrib(
-        factory=RouteProperties, converter=create_object_converter(RouteProperties)
+    class EIPAssociation(_Resource):
+        """A Eip Association for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for EIPAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-eip-association.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::EIPAssociation"
+
+        Properties: EIPAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EIPAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EIPAssociationProperties},
+            factories={"Properties": EIPAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EIPAssociationProperties()
+            _setattr("Properties", _convert_EIPAssociationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EIPAssociation, EIPAssociationProperties
+
+
+def _create_EgressOnlyInternetGateway():
+    class EgressOnlyInternetGatewayProperties(_ResourceProperties):
+        __slots__ = ("VpcId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EgressOnlyInternetGatewayProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VpcId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EgressOnlyInternetGatewayProperties = create_object_converter(
+        EgressOnlyInternetGatewayProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RouteTableProperties(ResourceProperties):
-    Tags = attrib(default=None)
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class RouteTable(Resource):
-    """A Route Table for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for RouteTable
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-route-table.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::RouteTable"
-
-    Properties: RouteTableProperties = attrib(
-        factory=RouteTableProperties,
-        converter=create_object_converter(RouteTableProperties),
+    class EgressOnlyInternetGateway(_Resource):
+        """A Egress Only Internet Gateway for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for EgressOnlyInternetGateway
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-egressonlyinternetgateway.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::EgressOnlyInternetGateway"
+
+        Properties: EgressOnlyInternetGatewayProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EgressOnlyInternetGateway",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EgressOnlyInternetGatewayProperties},
+            factories={"Properties": EgressOnlyInternetGatewayProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EgressOnlyInternetGatewayProperties()
+            _setattr(
+                "Properties", _convert_EgressOnlyInternetGatewayProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return EgressOnlyInternetGateway, EgressOnlyInternetGatewayProperties
+
+
+def _create_FlowLog():
+    class FlowLogProperties(_ResourceProperties):
+        __slots__ = (
+            "DeliverLogsPermissionArn",
+            "LogDestination",
+            "LogDestinationType",
+            "LogGroupName",
+            "ResourceId",
+            "ResourceType",
+            "TrafficType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FlowLogProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeliverLogsPermissionArn=None,
+            LogDestination=None,
+            LogDestinationType=None,
+            LogGroupName=None,
+            ResourceId=None,
+            ResourceType=None,
+            TrafficType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeliverLogsPermissionArn", DeliverLogsPermissionArn)
+            _setattr("LogDestination", LogDestination)
+            _setattr("LogDestinationType", LogDestinationType)
+            _setattr("LogGroupName", LogGroupName)
+            _setattr("ResourceId", ResourceId)
+            _setattr("ResourceType", ResourceType)
+            _setattr("TrafficType", TrafficType)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FlowLogProperties = create_object_converter(FlowLogProperties)
+
+    class FlowLog(_Resource):
+        """A Flow Log for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FlowLog
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-flowlog.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::FlowLog"
+
+        Properties: FlowLogProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FlowLog",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FlowLogProperties},
+            factories={"Properties": FlowLogProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FlowLogProperties()
+            _setattr("Properties", _convert_FlowLogProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return FlowLog, FlowLogProperties
+
+
+def _create_GatewayRouteTableAssociation():
+    class GatewayRouteTableAssociationProperties(_ResourceProperties):
+        __slots__ = ("GatewayId", "RouteTableId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GatewayRouteTableAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, GatewayId=None, RouteTableId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GatewayId", GatewayId)
+            _setattr("RouteTableId", RouteTableId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GatewayRouteTableAssociationProperties = create_object_converter(
+        GatewayRouteTableAssociationProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class SecurityGroupProperties(ResourceProperties):
-    GroupDescription = attrib(default=None)
-    GroupName = attrib(default=None)
-    SecurityGroupEgress = attrib(default=None)
-    SecurityGroupIngress = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SecurityGroup(Resource):
-    """A Security Group for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for SecurityGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-security-group.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::SecurityGroup"
-
-    Properties: SecurityGroupProperties = attrib(
-        factory=SecurityGroupProperties,
-        converter=create_object_converter(SecurityGroupProperties),
+    class GatewayRouteTableAssociation(_Resource):
+        """A Gateway Route Table Association for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for GatewayRouteTableAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-gatewayroutetableassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::GatewayRouteTableAssociation"
+
+        Properties: GatewayRouteTableAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GatewayRouteTableAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GatewayRouteTableAssociationProperties},
+            factories={"Properties": GatewayRouteTableAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GatewayRouteTableAssociationProperties()
+            _setattr(
+                "Properties",
+                _convert_GatewayRouteTableAssociationProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return GatewayRouteTableAssociation, GatewayRouteTableAssociationProperties
+
+
+def _create_Host():
+    class HostProperties(_ResourceProperties):
+        __slots__ = (
+            "AutoPlacement",
+            "AvailabilityZone",
+            "HostRecovery",
+            "InstanceType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HostProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoPlacement=None,
+            AvailabilityZone=None,
+            HostRecovery=None,
+            InstanceType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoPlacement", AutoPlacement)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("HostRecovery", HostRecovery)
+            _setattr("InstanceType", InstanceType)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_HostProperties = create_object_converter(HostProperties)
+
+    class Host(_Resource):
+        """A Host for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Host
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-host.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::Host"
+
+        Properties: HostProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Host",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_HostProperties},
+            factories={"Properties": HostProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = HostProperties()
+            _setattr("Properties", _convert_HostProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Host, HostProperties
+
+
+def _create_Instance():
+    class InstanceAssociationParameter(_PropertyType):
+        """The Association Parameter property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AssociationParameter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-ssmassociations-associationparameters.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceAssociationParameter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceEbs(_PropertyType):
+        """The Ebs property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Ebs
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-blockdev-template.html>`_
+        """
+
+        __slots__ = (
+            "DeleteOnTermination",
+            "Encrypted",
+            "Iops",
+            "KmsKeyId",
+            "SnapshotId",
+            "VolumeSize",
+            "VolumeType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceEbs", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeleteOnTermination=None,
+            Encrypted=None,
+            Iops=None,
+            KmsKeyId=None,
+            SnapshotId=None,
+            VolumeSize=None,
+            VolumeType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteOnTermination", DeleteOnTermination)
+            _setattr("Encrypted", Encrypted)
+            _setattr("Iops", Iops)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("SnapshotId", SnapshotId)
+            _setattr("VolumeSize", VolumeSize)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceNoDevice(_PropertyType):
+        """The No Device property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NoDevice
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-nodevice.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceNoDevice", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceEbs = create_object_converter(InstanceEbs)
+    _convert_InstanceNoDevice = create_object_converter(InstanceNoDevice)
+
+    class InstanceBlockDeviceMapping(_PropertyType):
+        """The Block Device Mapping property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for BlockDeviceMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-blockdev-mapping.html>`_
+        """
+
+        __slots__ = ("DeviceName", "Ebs", "NoDevice", "VirtualName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceBlockDeviceMapping",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Ebs": _convert_InstanceEbs,
+                "NoDevice": _convert_InstanceNoDevice,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeviceName=None,
+            Ebs=None,
+            NoDevice=None,
+            VirtualName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeviceName", DeviceName)
+            _setattr("Ebs", _convert_InstanceEbs(Ebs))
+            _setattr("NoDevice", _convert_InstanceNoDevice(NoDevice))
+            _setattr("VirtualName", VirtualName)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceCpuOptions(_PropertyType):
+        """The Cpu Options property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CpuOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-cpuoptions.html>`_
+        """
+
+        __slots__ = ("CoreCount", "ThreadsPerCore")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceCpuOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CoreCount=None, ThreadsPerCore=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CoreCount", CoreCount)
+            _setattr("ThreadsPerCore", ThreadsPerCore)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceCreditSpecification(_PropertyType):
+        """The Credit Specification property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CreditSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-creditspecification.html>`_
+        """
+
+        __slots__ = ("CPUCredits",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceCreditSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CPUCredits=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CPUCredits", CPUCredits)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceElasticGpuSpecification(_PropertyType):
+        """The Elastic Gpu Specification property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticGpuSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-elasticgpuspecification.html>`_
+        """
+
+        __slots__ = ("Type",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceElasticGpuSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceElasticInferenceAccelerator(_PropertyType):
+        """The Elastic Inference Accelerator property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticInferenceAccelerator
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-elasticinferenceaccelerator.html>`_
+        """
+
+        __slots__ = ("Count", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceElasticInferenceAccelerator", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Count=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Count", Count)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceInstanceIpv6Address(_PropertyType):
+        """The Instance Ipv6 Address property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceIpv6Address
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-instanceipv6address.html>`_
+        """
+
+        __slots__ = ("Ipv6Address",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceInstanceIpv6Address", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Ipv6Address=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ipv6Address", Ipv6Address)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceLaunchTemplateSpecification(_PropertyType):
+        """The Launch Template Specification property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplateSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-launchtemplatespecification.html>`_
+        """
+
+        __slots__ = ("LaunchTemplateId", "LaunchTemplateName", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceLaunchTemplateSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            LaunchTemplateId=None,
+            LaunchTemplateName=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LaunchTemplateId", LaunchTemplateId)
+            _setattr("LaunchTemplateName", LaunchTemplateName)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceLicenseSpecification(_PropertyType):
+        """The License Specification property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LicenseSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-licensespecification.html>`_
+        """
+
+        __slots__ = ("LicenseConfigurationArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceLicenseSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, LicenseConfigurationArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LicenseConfigurationArn", LicenseConfigurationArn)
+            _init_PropertyType(self, kwargs)
+
+    class InstancePrivateIpAddressSpecification(_PropertyType):
+        """The Private Ip Address Specification property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for PrivateIpAddressSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-network-interface-privateipspec.html>`_
+        """
+
+        __slots__ = ("Primary", "PrivateIpAddress")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstancePrivateIpAddressSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Primary=None, PrivateIpAddress=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Primary", Primary)
+            _setattr("PrivateIpAddress", PrivateIpAddress)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceInstanceIpv6Address_list = create_object_list_converter(
+        InstanceInstanceIpv6Address
     )
-
-
-@attrs(**ATTRSCONFIG)
-class SecurityGroupEgressProperties(ResourceProperties):
-    CidrIp = attrib(default=None)
-    CidrIpv6 = attrib(default=None)
-    Description = attrib(default=None)
-    DestinationPrefixListId = attrib(default=None)
-    DestinationSecurityGroupId = attrib(default=None)
-    FromPort = attrib(default=None)
-    GroupId = attrib(default=None)
-    IpProtocol = attrib(default=None)
-    ToPort = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SecurityGroupEgress(Resource):
-    """A Security Group Egress for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for SecurityGroupEgress
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-security-group-egress.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::SecurityGroupEgress"
-
-    Properties: SecurityGroupEgressProperties = attrib(
-        factory=SecurityGroupEgressProperties,
-        converter=create_object_converter(SecurityGroupEgressProperties),
+    _convert_InstancePrivateIpAddressSpecification_list = create_object_list_converter(
+        InstancePrivateIpAddressSpecification
     )
 
-
-@attrs(**ATTRSCONFIG)
-class SecurityGroupIngressProperties(ResourceProperties):
-    CidrIp = attrib(default=None)
-    CidrIpv6 = attrib(default=None)
-    Description = attrib(default=None)
-    FromPort = attrib(default=None)
-    GroupId = attrib(default=None)
-    GroupName = attrib(default=None)
-    IpProtocol = attrib(default=None)
-    SourcePrefixListId = attrib(default=None)
-    SourceSecurityGroupId = attrib(default=None)
-    SourceSecurityGroupName = attrib(default=None)
-    SourceSecurityGroupOwnerId = attrib(default=None)
-    ToPort = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SecurityGroupIngress(Resource):
-    """A Security Group Ingress for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for SecurityGroupIngress
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-security-group-ingress.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::SecurityGroupIngress"
-
-    Properties: SecurityGroupIngressProperties = attrib(
-        factory=SecurityGroupIngressProperties,
-        converter=create_object_converter(SecurityGroupIngressProperties),
+    class InstanceNetworkInterface(_PropertyType):
+        """The Network Interface property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkInterface
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-network-iface-embedded.html>`_
+        """
+
+        __slots__ = (
+            "AssociatePublicIpAddress",
+            "DeleteOnTermination",
+            "Description",
+            "DeviceIndex",
+            "GroupSet",
+            "Ipv6AddressCount",
+            "Ipv6Addresses",
+            "NetworkInterfaceId",
+            "PrivateIpAddress",
+            "PrivateIpAddresses",
+            "SecondaryPrivateIpAddressCount",
+            "SubnetId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceNetworkInterface",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Ipv6Addresses": _convert_InstanceInstanceIpv6Address_list,
+                "PrivateIpAddresses": _convert_InstancePrivateIpAddressSpecification_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssociatePublicIpAddress=None,
+            DeleteOnTermination=None,
+            Description=None,
+            DeviceIndex=None,
+            GroupSet=None,
+            Ipv6AddressCount=None,
+            Ipv6Addresses=None,
+            NetworkInterfaceId=None,
+            PrivateIpAddress=None,
+            PrivateIpAddresses=None,
+            SecondaryPrivateIpAddressCount=None,
+            SubnetId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssociatePublicIpAddress", AssociatePublicIpAddress)
+            _setattr("DeleteOnTermination", DeleteOnTermination)
+            _setattr("Description", Description)
+            _setattr("DeviceIndex", DeviceIndex)
+            _setattr("GroupSet", GroupSet)
+            _setattr("Ipv6AddressCount", Ipv6AddressCount)
+            _setattr(
+                "Ipv6Addresses",
+                _convert_InstanceInstanceIpv6Address_list(Ipv6Addresses),
+            )
+            _setattr("NetworkInterfaceId", NetworkInterfaceId)
+            _setattr("PrivateIpAddress", PrivateIpAddress)
+            _setattr(
+                "PrivateIpAddresses",
+                _convert_InstancePrivateIpAddressSpecification_list(PrivateIpAddresses),
+            )
+            _setattr("SecondaryPrivateIpAddressCount", SecondaryPrivateIpAddressCount)
+            _setattr("SubnetId", SubnetId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceAssociationParameter_list = create_object_list_converter(
+        InstanceAssociationParameter
     )
 
-
-@attrs(**ATTRSCONFIG)
-class SpotFleetProperties(ResourceProperties):
-    SpotFleetRequestConfigData = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SpotFleet(Resource):
-    """A Spot Fleet for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for SpotFleet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-spotfleet.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::SpotFleet"
-
-    Properties: SpotFleetProperties = attrib(
-        factory=SpotFleetProperties,
-        converter=create_object_converter(SpotFleetProperties),
+    class InstanceSsmAssociation(_PropertyType):
+        """The Ssm Association property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SsmAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance-ssmassociations.html>`_
+        """
+
+        __slots__ = ("AssociationParameters", "DocumentName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceSsmAssociation",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AssociationParameters": _convert_InstanceAssociationParameter_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AssociationParameters=None, DocumentName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AssociationParameters",
+                _convert_InstanceAssociationParameter_list(AssociationParameters),
+            )
+            _setattr("DocumentName", DocumentName)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceVolume(_PropertyType):
+        """The Volume property type for Instance in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Volume
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-mount-point.html>`_
+        """
+
+        __slots__ = ("Device", "VolumeId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceVolume", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Device=None, VolumeId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Device", Device)
+            _setattr("VolumeId", VolumeId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceBlockDeviceMapping_list = create_object_list_converter(
+        InstanceBlockDeviceMapping
     )
-
-
-@attrs(**ATTRSCONFIG)
-class SubnetProperties(ResourceProperties):
-    AssignIpv6AddressOnCreation = attrib(default=None)
-    AvailabilityZone = attrib(default=None)
-    CidrBlock = attrib(default=None)
-    Ipv6CidrBlock = attrib(default=None)
-    MapPublicIpOnLaunch = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Subnet(Resource):
-    """A Subnet for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for Subnet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-subnet.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::Subnet"
-
-    Properties: SubnetProperties = attrib(
-        factory=SubnetProperties, converter=create_object_converter(SubnetProperties)
+    _convert_InstanceCpuOptions = create_object_converter(InstanceCpuOptions)
+    _convert_InstanceCreditSpecification = create_object_converter(
+        InstanceCreditSpecification
     )
-
-
-@attrs(**ATTRSCONFIG)
-class SubnetCidrBlockProperties(ResourceProperties):
-    Ipv6CidrBlock = attrib(default=None)
-    SubnetId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SubnetCidrBlock(Resource):
-    """A Subnet Cidr Block for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for SubnetCidrBlock
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-subnetcidrblock.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::SubnetCidrBlock"
-
-    Properties: SubnetCidrBlockProperties = attrib(
-        factory=SubnetCidrBlockProperties,
-        converter=create_object_converter(SubnetCidrBlockProperties),
+    _convert_InstanceElasticGpuSpecification_list = create_object_list_converter(
+        InstanceElasticGpuSpecification
     )
-
-
-@attrs(**ATTRSCONFIG)
-class SubnetNetworkAclAssociationProperties(ResourceProperties):
-    NetworkAclId = attrib(default=None)
-    SubnetId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SubnetNetworkAclAssociation(Resource):
-    """A Subnet Network Acl Association for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for SubnetNetworkAclAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-subnet-network-acl-assoc.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::SubnetNetworkAclAssociation"
-
-    Properties: SubnetNetworkAclAssociationProperties = attrib(
-        factory=SubnetNetworkAclAssociationProperties,
-        converter=create_object_converter(SubnetNetworkAclAssociationProperties),
+    _convert_InstanceElasticInferenceAccelerator_list = create_object_list_converter(
+        InstanceElasticInferenceAccelerator
     )
-
-
-@attrs(**ATTRSCONFIG)
-class SubnetRouteTableAssociationProperties(ResourceProperties):
-    RouteTableId = attrib(default=None)
-    SubnetId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SubnetRouteTableAssociation(Resource):
-    """A Subnet Route Table Association for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for SubnetRouteTableAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-subnet-route-table-assoc.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::SubnetRouteTableAssociation"
-
-    Properties: SubnetRouteTableAssociationProperties = attrib(
-        factory=SubnetRouteTableAssociationProperties,
-        converter=create_object_converter(SubnetRouteTableAssociationProperties),
+    _convert_InstanceLaunchTemplateSpecification = create_object_converter(
+        InstanceLaunchTemplateSpecification
     )
-
-
-@attrs(**ATTRSCONFIG)
-class TrafficMirrorFilterProperties(ResourceProperties):
-    Description = attrib(default=None)
-    NetworkServices = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TrafficMirrorFilter(Resource):
-    """A Traffic Mirror Filter for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TrafficMirrorFilter
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-trafficmirrorfilter.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TrafficMirrorFilter"
-
-    Properties: TrafficMirrorFilterProperties = attrib(
-        factory=TrafficMirrorFilterProperties,
-        converter=create_object_converter(TrafficMirrorFilterProperties),
+    _convert_InstanceLicenseSpecification_list = create_object_list_converter(
+        InstanceLicenseSpecification
     )
-
-
-@attrs(**ATTRSCONFIG)
-class TrafficMirrorFilterRuleProperties(ResourceProperties):
-    Description = attrib(default=None)
-    DestinationCidrBlock = attrib(default=None)
-    DestinationPortRange = attrib(default=None)
-    Protocol = attrib(default=None)
-    RuleAction = attrib(default=None)
-    RuleNumber = attrib(default=None)
-    SourceCidrBlock = attrib(default=None)
-    SourcePortRange = attrib(default=None)
-    TrafficDirection = attrib(default=None)
-    TrafficMirrorFilterId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TrafficMirrorFilterRule(Resource):
-    """A Traffic Mirror Filter Rule for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TrafficMirrorFilterRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-trafficmirrorfilterrule.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TrafficMirrorFilterRule"
-
-    Properties: TrafficMirrorFilterRuleProperties = attrib(
-        factory=TrafficMirrorFilterRuleProperties,
-        converter=create_object_converter(TrafficMirrorFilterRuleProperties),
+    _convert_InstanceNetworkInterface_list = create_object_list_converter(
+        InstanceNetworkInterface
     )
-
-
-@attrs(**ATTRSCONFIG)
-class TrafficMirrorSessionProperties(ResourceProperties):
-    Description = attrib(default=None)
-    NetworkInterfaceId = attrib(default=None)
-    PacketLength = attrib(default=None)
-    SessionNumber = attrib(default=None)
-    Tags = attrib(default=None)
-    TrafficMirrorFilterId = attrib(default=None)
-    TrafficMirrorTargetId = attrib(default=None)
-    VirtualNetworkId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TrafficMirrorSession(Resource):
-    """A Traffic Mirror Session for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TrafficMirrorSession
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-trafficmirrorsession.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TrafficMirrorSession"
-
-    Properties: TrafficMirrorSessionProperties = attrib(
-        factory=TrafficMirrorSessionProperties,
-        converter=create_object_converter(TrafficMirrorSessionProperties),
+    _convert_InstanceSsmAssociation_list = create_object_list_converter(
+        InstanceSsmAssociation
     )
-
-
-@attrs(**ATTRSCONFIG)
-class TrafficMirrorTargetProperties(ResourceProperties):
-    Description = attrib(default=None)
-    NetworkInterfaceId = attrib(default=None)
-    NetworkLoadBalancerArn = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TrafficMirrorTarget(Resource):
-    """A Traffic Mirror Target for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TrafficMirrorTarget
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-trafficmirrortarget.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TrafficMirrorTarget"
-
-    Properties: TrafficMirrorTargetProperties = attrib(
-        factory=TrafficMirrorTargetProperties,
-        converter=create_object_converter(TrafficMirrorTargetProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_InstanceVolume_list = create_object_list_converter(InstanceVolume)
+
+    class InstanceProperties(_ResourceProperties):
+        __slots__ = (
+            "AdditionalInfo",
+            "Affinity",
+            "AvailabilityZone",
+            "BlockDeviceMappings",
+            "CpuOptions",
+            "CreditSpecification",
+            "DisableApiTermination",
+            "EbsOptimized",
+            "ElasticGpuSpecifications",
+            "ElasticInferenceAccelerators",
+            "HostId",
+            "IamInstanceProfile",
+            "ImageId",
+            "InstanceInitiatedShutdownBehavior",
+            "InstanceType",
+            "Ipv6AddressCount",
+            "Ipv6Addresses",
+            "KernelId",
+            "KeyName",
+            "LaunchTemplate",
+            "LicenseSpecifications",
+            "Monitoring",
+            "NetworkInterfaces",
+            "PlacementGroupName",
+            "PrivateIpAddress",
+            "RamdiskId",
+            "SecurityGroupIds",
+            "SecurityGroups",
+            "SourceDestCheck",
+            "SsmAssociations",
+            "SubnetId",
+            "Tags",
+            "Tenancy",
+            "UserData",
+            "Volumes",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "BlockDeviceMappings": _convert_InstanceBlockDeviceMapping_list,
+                "CpuOptions": _convert_InstanceCpuOptions,
+                "CreditSpecification": _convert_InstanceCreditSpecification,
+                "ElasticGpuSpecifications": _convert_InstanceElasticGpuSpecification_list,
+                "ElasticInferenceAccelerators": _convert_InstanceElasticInferenceAccelerator_list,
+                "Ipv6Addresses": _convert_InstanceInstanceIpv6Address_list,
+                "LaunchTemplate": _convert_InstanceLaunchTemplateSpecification,
+                "LicenseSpecifications": _convert_InstanceLicenseSpecification_list,
+                "NetworkInterfaces": _convert_InstanceNetworkInterface_list,
+                "SsmAssociations": _convert_InstanceSsmAssociation_list,
+                "Tags": _convert_Tag_list,
+                "Volumes": _convert_InstanceVolume_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AdditionalInfo=None,
+            Affinity=None,
+            AvailabilityZone=None,
+            BlockDeviceMappings=None,
+            CpuOptions=None,
+            CreditSpecification=None,
+            DisableApiTermination=None,
+            EbsOptimized=None,
+            ElasticGpuSpecifications=None,
+            ElasticInferenceAccelerators=None,
+            HostId=None,
+            IamInstanceProfile=None,
+            ImageId=None,
+            InstanceInitiatedShutdownBehavior=None,
+            InstanceType=None,
+            Ipv6AddressCount=None,
+            Ipv6Addresses=None,
+            KernelId=None,
+            KeyName=None,
+            LaunchTemplate=None,
+            LicenseSpecifications=None,
+            Monitoring=None,
+            NetworkInterfaces=None,
+            PlacementGroupName=None,
+            PrivateIpAddress=None,
+            RamdiskId=None,
+            SecurityGroupIds=None,
+            SecurityGroups=None,
+            SourceDestCheck=None,
+            SsmAssociations=None,
+            SubnetId=None,
+            Tags=None,
+            Tenancy=None,
+            UserData=None,
+            Volumes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdditionalInfo", AdditionalInfo)
+            _setattr("Affinity", Affinity)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr(
+                "BlockDeviceMappings",
+                _convert_InstanceBlockDeviceMapping_list(BlockDeviceMappings),
+            )
+            _setattr("CpuOptions", _convert_InstanceCpuOptions(CpuOptions))
+            _setattr(
+                "CreditSpecification",
+                _convert_InstanceCreditSpecification(CreditSpecification),
+            )
+            _setattr("DisableApiTermination", DisableApiTermination)
+            _setattr("EbsOptimized", EbsOptimized)
+            _setattr(
+                "ElasticGpuSpecifications",
+                _convert_InstanceElasticGpuSpecification_list(ElasticGpuSpecifications),
+            )
+            _setattr(
+                "ElasticInferenceAccelerators",
+                _convert_InstanceElasticInferenceAccelerator_list(
+                    ElasticInferenceAccelerators
+                ),
+            )
+            _setattr("HostId", HostId)
+            _setattr("IamInstanceProfile", IamInstanceProfile)
+            _setattr("ImageId", ImageId)
+            _setattr(
+                "InstanceInitiatedShutdownBehavior", InstanceInitiatedShutdownBehavior
+            )
+            _setattr("InstanceType", InstanceType)
+            _setattr("Ipv6AddressCount", Ipv6AddressCount)
+            _setattr(
+                "Ipv6Addresses",
+                _convert_InstanceInstanceIpv6Address_list(Ipv6Addresses),
+            )
+            _setattr("KernelId", KernelId)
+            _setattr("KeyName", KeyName)
+            _setattr(
+                "LaunchTemplate",
+                _convert_InstanceLaunchTemplateSpecification(LaunchTemplate),
+            )
+            _setattr(
+                "LicenseSpecifications",
+                _convert_InstanceLicenseSpecification_list(LicenseSpecifications),
+            )
+            _setattr("Monitoring", Monitoring)
+            _setattr(
+                "NetworkInterfaces",
+                _convert_InstanceNetworkInterface_list(NetworkInterfaces),
+            )
+            _setattr("PlacementGroupName", PlacementGroupName)
+            _setattr("PrivateIpAddress", PrivateIpAddress)
+            _setattr("RamdiskId", RamdiskId)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr("SourceDestCheck", SourceDestCheck)
+            _setattr(
+                "SsmAssociations", _convert_InstanceSsmAssociation_list(SsmAssociations)
+            )
+            _setattr("SubnetId", SubnetId)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Tenancy", Tenancy)
+            _setattr("UserData", UserData)
+            _setattr("Volumes", _convert_InstanceVolume_list(Volumes))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InstanceProperties = create_object_converter(InstanceProperties)
+
+    class Instance(_Resource):
+        """A Instance for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Instance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-instance.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::Instance"
+
+        Properties: InstanceProperties
+
+        # NB: CreationPolicy may be set for Instance
+        # (unlike most Resource types)
+        CreationPolicy: Dict[str, Any]
+
+        __slots__ = ("Properties", "CreationPolicy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Instance",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InstanceProperties},
+            factories={"Properties": InstanceProperties, "CreationPolicy": dict},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Properties=NOTHING,
+            CreationPolicy: Dict[str, Any] = NOTHING,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InstanceProperties()
+            _setattr("Properties", _convert_InstanceProperties(Properties))
+            if CreationPolicy is NOTHING:
+                CreationPolicy = dict()
+            _setattr("CreationPolicy", CreationPolicy)
+            _init_Resource(self, kwargs)
+
+    return (
+        Instance,
+        InstanceProperties,
+        InstanceAssociationParameter,
+        InstanceEbs,
+        InstanceNoDevice,
+        InstanceBlockDeviceMapping,
+        InstanceCpuOptions,
+        InstanceCreditSpecification,
+        InstanceElasticGpuSpecification,
+        InstanceElasticInferenceAccelerator,
+        InstanceInstanceIpv6Address,
+        InstanceLaunchTemplateSpecification,
+        InstanceLicenseSpecification,
+        InstancePrivateIpAddressSpecification,
+        InstanceNetworkInterface,
+        InstanceSsmAssociation,
+        InstanceVolume,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class TransitGatewayProperties(ResourceProperties):
-    AmazonSideAsn = attrib(default=None)
-    AutoAcceptSharedAttachments = attrib(default=None)
-    DefaultRouteTableAssociation = attrib(default=None)
-    DefaultRouteTablePropagation = attrib(default=None)
-    Description = attrib(default=None)
-    DnsSupport = attrib(default=None)
-    Tags = attrib(default=None)
-    VpnEcmpSupport = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TransitGateway(Resource):
-    """A Transit Gateway for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TransitGateway
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgateway.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TransitGateway"
-
-    Properties: TransitGatewayProperties = attrib(
-        factory=TransitGatewayProperties,
-        converter=create_object_converter(TransitGatewayProperties),
+def _create_InternetGateway():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class InternetGatewayProperties(_ResourceProperties):
+        __slots__ = ("Tags",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InternetGatewayProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InternetGatewayProperties = create_object_converter(
+        InternetGatewayProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayAttachmentProperties(ResourceProperties):
-    SubnetIds = attrib(default=None)
-    Tags = attrib(default=None)
-    TransitGatewayId = attrib(default=None)
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayAttachment(Resource):
-    """A Transit Gateway Attachment for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TransitGatewayAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayattachment.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TransitGatewayAttachment"
-
-    Properties: TransitGatewayAttachmentProperties = attrib(
-        factory=TransitGatewayAttachmentProperties,
-        converter=create_object_converter(TransitGatewayAttachmentProperties),
+    class InternetGateway(_Resource):
+        """A Internet Gateway for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for InternetGateway
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-internetgateway.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::InternetGateway"
+
+        Properties: InternetGatewayProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InternetGateway",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InternetGatewayProperties},
+            factories={"Properties": InternetGatewayProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InternetGatewayProperties()
+            _setattr("Properties", _convert_InternetGatewayProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return InternetGateway, InternetGatewayProperties
+
+
+def _create_LaunchTemplate():
+    class LaunchTemplateEbs(_PropertyType):
+        """The Ebs property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Ebs
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-blockdevicemapping-ebs.html>`_
+        """
+
+        __slots__ = (
+            "DeleteOnTermination",
+            "Encrypted",
+            "Iops",
+            "KmsKeyId",
+            "SnapshotId",
+            "VolumeSize",
+            "VolumeType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateEbs", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeleteOnTermination=None,
+            Encrypted=None,
+            Iops=None,
+            KmsKeyId=None,
+            SnapshotId=None,
+            VolumeSize=None,
+            VolumeType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteOnTermination", DeleteOnTermination)
+            _setattr("Encrypted", Encrypted)
+            _setattr("Iops", Iops)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("SnapshotId", SnapshotId)
+            _setattr("VolumeSize", VolumeSize)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LaunchTemplateEbs = create_object_converter(LaunchTemplateEbs)
+
+    class LaunchTemplateBlockDeviceMapping(_PropertyType):
+        """The Block Device Mapping property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for BlockDeviceMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-blockdevicemapping.html>`_
+        """
+
+        __slots__ = ("DeviceName", "Ebs", "NoDevice", "VirtualName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateBlockDeviceMapping",
+            _PropertyType,
+            __slots__,
+            converters={"Ebs": _convert_LaunchTemplateEbs},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeviceName=None,
+            Ebs=None,
+            NoDevice=None,
+            VirtualName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeviceName", DeviceName)
+            _setattr("Ebs", _convert_LaunchTemplateEbs(Ebs))
+            _setattr("NoDevice", NoDevice)
+            _setattr("VirtualName", VirtualName)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateCapacityReservationTarget(_PropertyType):
+        """The Capacity Reservation Target property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CapacityReservationTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-capacityreservationtarget.html>`_
+        """
+
+        __slots__ = ("CapacityReservationId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateCapacityReservationTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CapacityReservationId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CapacityReservationId", CapacityReservationId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LaunchTemplateCapacityReservationTarget = create_object_converter(
+        LaunchTemplateCapacityReservationTarget
     )
 
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayRouteProperties(ResourceProperties):
-    Blackhole = attrib(default=None)
-    DestinationCidrBlock = attrib(default=None)
-    TransitGatewayAttachmentId = attrib(default=None)
-    TransitGatewayRouteTableId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayRoute(Resource):
-    """A Transit Gateway Route for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TransitGatewayRoute
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayroute.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TransitGatewayRoute"
-
-    Properties: TransitGatewayRouteProperties = attrib(
-        factory=TransitGatewayRouteProperties,
-        converter=create_object_converter(TransitGatewayRouteProperties),
+    class LaunchTemplateCapacityReservationSpecification(_PropertyType):
+        """The Capacity Reservation Specification property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CapacityReservationSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata-capacityreservationspecification.html>`_
+        """
+
+        __slots__ = ("CapacityReservationPreference", "CapacityReservationTarget")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateCapacityReservationSpecification",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CapacityReservationTarget": _convert_LaunchTemplateCapacityReservationTarget
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CapacityReservationPreference=None,
+            CapacityReservationTarget=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CapacityReservationPreference", CapacityReservationPreference)
+            _setattr(
+                "CapacityReservationTarget",
+                _convert_LaunchTemplateCapacityReservationTarget(
+                    CapacityReservationTarget
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateCpuOptions(_PropertyType):
+        """The Cpu Options property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CpuOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata-cpuoptions.html>`_
+        """
+
+        __slots__ = ("CoreCount", "ThreadsPerCore")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateCpuOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CoreCount=None, ThreadsPerCore=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CoreCount", CoreCount)
+            _setattr("ThreadsPerCore", ThreadsPerCore)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateCreditSpecification(_PropertyType):
+        """The Credit Specification property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CreditSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata-creditspecification.html>`_
+        """
+
+        __slots__ = ("CpuCredits",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateCreditSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CpuCredits=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CpuCredits", CpuCredits)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateElasticGpuSpecification(_PropertyType):
+        """The Elastic Gpu Specification property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticGpuSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-elasticgpuspecification.html>`_
+        """
+
+        __slots__ = ("Type",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateElasticGpuSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateHibernationOptions(_PropertyType):
+        """The Hibernation Options property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for HibernationOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata-hibernationoptions.html>`_
+        """
+
+        __slots__ = ("Configured",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateHibernationOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Configured=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Configured", Configured)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateIamInstanceProfile(_PropertyType):
+        """The Iam Instance Profile property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for IamInstanceProfile
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata-iaminstanceprofile.html>`_
+        """
+
+        __slots__ = ("Arn", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateIamInstanceProfile", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Arn=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateSpotOptions(_PropertyType):
+        """The Spot Options property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SpotOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata-instancemarketoptions-spotoptions.html>`_
+        """
+
+        __slots__ = (
+            "BlockDurationMinutes",
+            "InstanceInterruptionBehavior",
+            "MaxPrice",
+            "SpotInstanceType",
+            "ValidUntil",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateSpotOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockDurationMinutes=None,
+            InstanceInterruptionBehavior=None,
+            MaxPrice=None,
+            SpotInstanceType=None,
+            ValidUntil=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BlockDurationMinutes", BlockDurationMinutes)
+            _setattr("InstanceInterruptionBehavior", InstanceInterruptionBehavior)
+            _setattr("MaxPrice", MaxPrice)
+            _setattr("SpotInstanceType", SpotInstanceType)
+            _setattr("ValidUntil", ValidUntil)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LaunchTemplateSpotOptions = create_object_converter(
+        LaunchTemplateSpotOptions
     )
 
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayRouteTableProperties(ResourceProperties):
-    Tags = attrib(default=None)
-    TransitGatewayId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayRouteTable(Resource):
-    """A Transit Gateway Route Table for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TransitGatewayRouteTable
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayroutetable.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TransitGatewayRouteTable"
-
-    Properties: TransitGatewayRouteTableProperties = attrib(
-        factory=TransitGatewayRouteTableProperties,
-        converter=create_object_converter(TransitGatewayRouteTableProperties),
+    class LaunchTemplateInstanceMarketOptions(_PropertyType):
+        """The Instance Market Options property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceMarketOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata-instancemarketoptions.html>`_
+        """
+
+        __slots__ = ("MarketType", "SpotOptions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateInstanceMarketOptions",
+            _PropertyType,
+            __slots__,
+            converters={"SpotOptions": _convert_LaunchTemplateSpotOptions},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MarketType=None, SpotOptions=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MarketType", MarketType)
+            _setattr("SpotOptions", _convert_LaunchTemplateSpotOptions(SpotOptions))
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateIpv6Add(_PropertyType):
+        """The Ipv6 Add property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Ipv6Add
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-ipv6add.html>`_
+        """
+
+        __slots__ = ("Ipv6Address",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateIpv6Add", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Ipv6Address=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ipv6Address", Ipv6Address)
+            _init_PropertyType(self, kwargs)
+
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class LaunchTemplateTagSpecification(_PropertyType):
+        """The Tag Specification property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-tagspecification.html>`_
+        """
+
+        __slots__ = ("ResourceType", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateTagSpecification",
+            _PropertyType,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceType=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceType", ResourceType)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateLaunchTemplateElasticInferenceAccelerator(_PropertyType):
+        """The Launch Template Elastic Inference Accelerator property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplateElasticInferenceAccelerator
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplateelasticinferenceaccelerator.html>`_
+        """
+
+        __slots__ = ("Type",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateLaunchTemplateElasticInferenceAccelerator",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplatePlacement(_PropertyType):
+        """The Placement property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Placement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata-placement.html>`_
+        """
+
+        __slots__ = ("Affinity", "AvailabilityZone", "GroupName", "HostId", "Tenancy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplatePlacement", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Affinity=None,
+            AvailabilityZone=None,
+            GroupName=None,
+            HostId=None,
+            Tenancy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Affinity", Affinity)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("GroupName", GroupName)
+            _setattr("HostId", HostId)
+            _setattr("Tenancy", Tenancy)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplatePrivateIpAdd(_PropertyType):
+        """The Private Ip Add property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for PrivateIpAdd
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-privateipadd.html>`_
+        """
+
+        __slots__ = ("Primary", "PrivateIpAddress")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplatePrivateIpAdd", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Primary=None, PrivateIpAddress=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Primary", Primary)
+            _setattr("PrivateIpAddress", PrivateIpAddress)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LaunchTemplateIpv6Add_list = create_object_list_converter(
+        LaunchTemplateIpv6Add
     )
-
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayRouteTableAssociationProperties(ResourceProperties):
-    TransitGatewayAttachmentId = attrib(default=None)
-    TransitGatewayRouteTableId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayRouteTableAssociation(Resource):
-    """A Transit Gateway Route Table Association for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TransitGatewayRouteTableAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayroutetableassociation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TransitGatewayRouteTableAssociation"
-
-    Properties: TransitGatewayRouteTableAssociationProperties = attrib(
-        factory=TransitGatewayRouteTableAssociationProperties,
-        converter=create_object_converter(
-            TransitGatewayRouteTableAssociationProperties
-        ),
+    _convert_LaunchTemplatePrivateIpAdd_list = create_object_list_converter(
+        LaunchTemplatePrivateIpAdd
     )
 
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayRouteTablePropagationProperties(ResourceProperties):
-    TransitGatewayAttachmentId = attrib(default=None)
-    TransitGatewayRouteTableId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TransitGatewayRouteTablePropagation(Resource):
-    """A Transit Gateway Route Table Propagation for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for TransitGatewayRouteTablePropagation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayroutetablepropagation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::TransitGatewayRouteTablePropagation"
-
-    Properties: TransitGatewayRouteTablePropagationProperties = attrib(
-        factory=TransitGatewayRouteTablePropagationProperties,
-        converter=create_object_converter(
-            TransitGatewayRouteTablePropagationProperties
-        ),
+    class LaunchTemplateNetworkInterface(_PropertyType):
+        """The Network Interface property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkInterface
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-networkinterface.html>`_
+        """
+
+        __slots__ = (
+            "AssociatePublicIpAddress",
+            "DeleteOnTermination",
+            "Description",
+            "DeviceIndex",
+            "Groups",
+            "InterfaceType",
+            "Ipv6AddressCount",
+            "Ipv6Addresses",
+            "NetworkInterfaceId",
+            "PrivateIpAddress",
+            "PrivateIpAddresses",
+            "SecondaryPrivateIpAddressCount",
+            "SubnetId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateNetworkInterface",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Ipv6Addresses": _convert_LaunchTemplateIpv6Add_list,
+                "PrivateIpAddresses": _convert_LaunchTemplatePrivateIpAdd_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssociatePublicIpAddress=None,
+            DeleteOnTermination=None,
+            Description=None,
+            DeviceIndex=None,
+            Groups=None,
+            InterfaceType=None,
+            Ipv6AddressCount=None,
+            Ipv6Addresses=None,
+            NetworkInterfaceId=None,
+            PrivateIpAddress=None,
+            PrivateIpAddresses=None,
+            SecondaryPrivateIpAddressCount=None,
+            SubnetId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssociatePublicIpAddress", AssociatePublicIpAddress)
+            _setattr("DeleteOnTermination", DeleteOnTermination)
+            _setattr("Description", Description)
+            _setattr("DeviceIndex", DeviceIndex)
+            _setattr("Groups", Groups)
+            _setattr("InterfaceType", InterfaceType)
+            _setattr("Ipv6AddressCount", Ipv6AddressCount)
+            _setattr(
+                "Ipv6Addresses", _convert_LaunchTemplateIpv6Add_list(Ipv6Addresses)
+            )
+            _setattr("NetworkInterfaceId", NetworkInterfaceId)
+            _setattr("PrivateIpAddress", PrivateIpAddress)
+            _setattr(
+                "PrivateIpAddresses",
+                _convert_LaunchTemplatePrivateIpAdd_list(PrivateIpAddresses),
+            )
+            _setattr("SecondaryPrivateIpAddressCount", SecondaryPrivateIpAddressCount)
+            _setattr("SubnetId", SubnetId)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateMonitoring(_PropertyType):
+        """The Monitoring property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Monitoring
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata-monitoring.html>`_
+        """
+
+        __slots__ = ("Enabled",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateMonitoring", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Enabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _init_PropertyType(self, kwargs)
+
+    class LaunchTemplateLicenseSpecification(_PropertyType):
+        """The License Specification property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LicenseSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-licensespecification.html>`_
+        """
+
+        __slots__ = ("LicenseConfigurationArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateLicenseSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, LicenseConfigurationArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LicenseConfigurationArn", LicenseConfigurationArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LaunchTemplateBlockDeviceMapping_list = create_object_list_converter(
+        LaunchTemplateBlockDeviceMapping
     )
-
-
-@attrs(**ATTRSCONFIG)
-class VPCProperties(ResourceProperties):
-    CidrBlock = attrib(default=None)
-    EnableDnsHostnames = attrib(default=None)
-    EnableDnsSupport = attrib(default=None)
-    InstanceTenancy = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class VPC(Resource):
-    """A Vpc for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for VPC
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpc.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::VPC"
-
-    Properties: VPCProperties = attrib(
-        factory=VPCProperties, converter=create_object_converter(VPCProperties)
+    _convert_LaunchTemplateCapacityReservationSpecification = create_object_converter(
+        LaunchTemplateCapacityReservationSpecification
     )
-
-
-@attrs(**ATTRSCONFIG)
-class VPCCidrBlockProperties(ResourceProperties):
-    AmazonProvidedIpv6CidrBlock = attrib(default=None)
-    CidrBlock = attrib(default=None)
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class VPCCidrBlock(Resource):
-    """A Vpc Cidr Block for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for VPCCidrBlock
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpccidrblock.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::VPCCidrBlock"
-
-    Properties: VPCCidrBlockProperties = attrib(
-        factory=VPCCidrBlockProperties,
-        converter=create_object_converter(VPCCidrBlockProperties),
+    _convert_LaunchTemplateCpuOptions = create_object_converter(
+        LaunchTemplateCpuOptions
     )
-
-
-@attrs(**ATTRSCONFIG)
-class VPCDHCPOptionsAssociationProperties(ResourceProperties):
-    DhcpOptionsId = attrib(default=None)
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class VPCDHCPOptionsAssociation(Resource):
-    """A Vpcdhcp Options Association for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for VPCDHCPOptionsAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpc-dhcp-options-assoc.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::VPCDHCPOptionsAssociation"
-
-    Properties: VPCDHCPOptionsAssociationProperties = attrib(
-        factory=VPCDHCPOptionsAssociationProperties,
-        converter=create_object_converter(VPCDHCPOptionsAssociationProperties),
+    _convert_LaunchTemplateCreditSpecification = create_object_converter(
+        LaunchTemplateCreditSpecification
     )
-
-
-@attrs(**ATTRSCONFIG)
-class VPCEndpointProperties(ResourceProperties):
-    PolicyDocument = attrib(default=None)
-    PrivateDnsEnabled = attrib(default=None)
-    RouteTableIds = attrib(default=None)
-    SecurityGroupIds = attrib(default=None)
-    ServiceName = attrib(default=None)
-    SubnetIds = attrib(default=None)
-    VpcEndpointType = attrib(default=None)
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class VPCEndpoint(Resource):
-    """A Vpc Endpoint for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for VPCEndpoint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcendpoint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::VPCEndpoint"
-
-    Properties: VPCEndpointProperties = attrib(
-        factory=VPCEndpointProperties,
-        converter=create_object_converter(VPCEndpointProperties),
+    _convert_LaunchTemplateElasticGpuSpecification_list = create_object_list_converter(
+        LaunchTemplateElasticGpuSpecification
     )
-
-
-@attrs(**ATTRSCONFIG)
-class VPCEndpointConnectionNotificationProperties(ResourceProperties):
-    ConnectionEvents = attrib(default=None)
-    ConnectionNotificationArn = attrib(default=None)
-    ServiceId = attrib(default=None)
-    VPCEndpointId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class VPCEndpointConnectionNotification(Resource):
-    """A Vpc Endpoint Connection Notification for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for VPCEndpointConnectionNotification
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcendpointconnectionnotification.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::VPCEndpointConnectionNotification"
-
-    Properties: VPCEndpointConnectionNotificationProperties = attrib(
-        factory=VPCEndpointConnectionNotificationProperties,
-        converter=create_object_converter(VPCEndpointConnectionNotificationProperties),
+    _convert_LaunchTemplateLaunchTemplateElasticInferenceAccelerator_list = (
+        create_object_list_converter(
+            LaunchTemplateLaunchTemplateElasticInferenceAccelerator
+        )
+    )
+    _convert_LaunchTemplateHibernationOptions = create_object_converter(
+        LaunchTemplateHibernationOptions
+    )
+    _convert_LaunchTemplateIamInstanceProfile = create_object_converter(
+        LaunchTemplateIamInstanceProfile
+    )
+    _convert_LaunchTemplateInstanceMarketOptions = create_object_converter(
+        LaunchTemplateInstanceMarketOptions
+    )
+    _convert_LaunchTemplateLicenseSpecification_list = create_object_list_converter(
+        LaunchTemplateLicenseSpecification
+    )
+    _convert_LaunchTemplateMonitoring = create_object_converter(
+        LaunchTemplateMonitoring
+    )
+    _convert_LaunchTemplateNetworkInterface_list = create_object_list_converter(
+        LaunchTemplateNetworkInterface
+    )
+    _convert_LaunchTemplatePlacement = create_object_converter(LaunchTemplatePlacement)
+    _convert_LaunchTemplateTagSpecification_list = create_object_list_converter(
+        LaunchTemplateTagSpecification
     )
 
+    class LaunchTemplateLaunchTemplateData(_PropertyType):
+        """The Launch Template Data property type for LaunchTemplate in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplateData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-launchtemplate-launchtemplatedata.html>`_
+        """
+
+        __slots__ = (
+            "BlockDeviceMappings",
+            "CapacityReservationSpecification",
+            "CpuOptions",
+            "CreditSpecification",
+            "DisableApiTermination",
+            "EbsOptimized",
+            "ElasticGpuSpecifications",
+            "ElasticInferenceAccelerators",
+            "HibernationOptions",
+            "IamInstanceProfile",
+            "ImageId",
+            "InstanceInitiatedShutdownBehavior",
+            "InstanceMarketOptions",
+            "InstanceType",
+            "KernelId",
+            "KeyName",
+            "LicenseSpecifications",
+            "Monitoring",
+            "NetworkInterfaces",
+            "Placement",
+            "RamDiskId",
+            "SecurityGroupIds",
+            "SecurityGroups",
+            "TagSpecifications",
+            "UserData",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateLaunchTemplateData",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BlockDeviceMappings": _convert_LaunchTemplateBlockDeviceMapping_list,
+                "CapacityReservationSpecification": _convert_LaunchTemplateCapacityReservationSpecification,
+                "CpuOptions": _convert_LaunchTemplateCpuOptions,
+                "CreditSpecification": _convert_LaunchTemplateCreditSpecification,
+                "ElasticGpuSpecifications": _convert_LaunchTemplateElasticGpuSpecification_list,
+                "ElasticInferenceAccelerators": _convert_LaunchTemplateLaunchTemplateElasticInferenceAccelerator_list,
+                "HibernationOptions": _convert_LaunchTemplateHibernationOptions,
+                "IamInstanceProfile": _convert_LaunchTemplateIamInstanceProfile,
+                "InstanceMarketOptions": _convert_LaunchTemplateInstanceMarketOptions,
+                "LicenseSpecifications": _convert_LaunchTemplateLicenseSpecification_list,
+                "Monitoring": _convert_LaunchTemplateMonitoring,
+                "NetworkInterfaces": _convert_LaunchTemplateNetworkInterface_list,
+                "Placement": _convert_LaunchTemplatePlacement,
+                "TagSpecifications": _convert_LaunchTemplateTagSpecification_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockDeviceMappings=None,
+            CapacityReservationSpecification=None,
+            CpuOptions=None,
+            CreditSpecification=None,
+            DisableApiTermination=None,
+            EbsOptimized=None,
+            ElasticGpuSpecifications=None,
+            ElasticInferenceAccelerators=None,
+            HibernationOptions=None,
+            IamInstanceProfile=None,
+            ImageId=None,
+            InstanceInitiatedShutdownBehavior=None,
+            InstanceMarketOptions=None,
+            InstanceType=None,
+            KernelId=None,
+            KeyName=None,
+            LicenseSpecifications=None,
+            Monitoring=None,
+            NetworkInterfaces=None,
+            Placement=None,
+            RamDiskId=None,
+            SecurityGroupIds=None,
+            SecurityGroups=None,
+            TagSpecifications=None,
+            UserData=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "BlockDeviceMappings",
+                _convert_LaunchTemplateBlockDeviceMapping_list(BlockDeviceMappings),
+            )
+            _setattr(
+                "CapacityReservationSpecification",
+                _convert_LaunchTemplateCapacityReservationSpecification(
+                    CapacityReservationSpecification
+                ),
+            )
+            _setattr("CpuOptions", _convert_LaunchTemplateCpuOptions(CpuOptions))
+            _setattr(
+                "CreditSpecification",
+                _convert_LaunchTemplateCreditSpecification(CreditSpecification),
+            )
+            _setattr("DisableApiTermination", DisableApiTermination)
+            _setattr("EbsOptimized", EbsOptimized)
+            _setattr(
+                "ElasticGpuSpecifications",
+                _convert_LaunchTemplateElasticGpuSpecification_list(
+                    ElasticGpuSpecifications
+                ),
+            )
+            _setattr(
+                "ElasticInferenceAccelerators",
+                _convert_LaunchTemplateLaunchTemplateElasticInferenceAccelerator_list(
+                    ElasticInferenceAccelerators
+                ),
+            )
+            _setattr(
+                "HibernationOptions",
+                _convert_LaunchTemplateHibernationOptions(HibernationOptions),
+            )
+            _setattr(
+                "IamInstanceProfile",
+                _convert_LaunchTemplateIamInstanceProfile(IamInstanceProfile),
+            )
+            _setattr("ImageId", ImageId)
+            _setattr(
+                "InstanceInitiatedShutdownBehavior", InstanceInitiatedShutdownBehavior
+            )
+            _setattr(
+                "InstanceMarketOptions",
+                _convert_LaunchTemplateInstanceMarketOptions(InstanceMarketOptions),
+            )
+            _setattr("InstanceType", InstanceType)
+            _setattr("KernelId", KernelId)
+            _setattr("KeyName", KeyName)
+            _setattr(
+                "LicenseSpecifications",
+                _convert_LaunchTemplateLicenseSpecification_list(LicenseSpecifications),
+            )
+            _setattr("Monitoring", _convert_LaunchTemplateMonitoring(Monitoring))
+            _setattr(
+                "NetworkInterfaces",
+                _convert_LaunchTemplateNetworkInterface_list(NetworkInterfaces),
+            )
+            _setattr("Placement", _convert_LaunchTemplatePlacement(Placement))
+            _setattr("RamDiskId", RamDiskId)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr(
+                "TagSpecifications",
+                _convert_LaunchTemplateTagSpecification_list(TagSpecifications),
+            )
+            _setattr("UserData", UserData)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LaunchTemplateLaunchTemplateData = create_object_converter(
+        LaunchTemplateLaunchTemplateData
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPCEndpointServiceProperties(ResourceProperties):
-    AcceptanceRequired = attrib(default=None)
-    NetworkLoadBalancerArns = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class VPCEndpointService(Resource):
-    """A Vpc Endpoint Service for EC2.
-
-    See Also:
-        `AWS Cloud Formation documentation for VPCEndpointService
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcendpointservice.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EC2::VPCEndpointService"
-
-    Properties: VPCEndpointServiceProperties = attrib(
-        factory=VPCEndpointServiceProperties,
-        converter=create_object_converter(VPCEndpointServiceProperties),
+    class LaunchTemplateProperties(_ResourceProperties):
+        __slots__ = ("LaunchTemplateData", "LaunchTemplateName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LaunchTemplateData": _convert_LaunchTemplateLaunchTemplateData
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, LaunchTemplateData=None, LaunchTemplateName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "LaunchTemplateData",
+                _convert_LaunchTemplateLaunchTemplateData(LaunchTemplateData),
+            )
+            _setattr("LaunchTemplateName", LaunchTemplateName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LaunchTemplateProperties = create_object_converter(
+        LaunchTemplateProperties
     )
 
+    class LaunchTemplate(_Resource):
+        """A Launch Template for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-launchtemplate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::LaunchTemplate"
+
+        Properties: LaunchTemplateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LaunchTemplateProperties},
+            factories={"Properties": LaunchTemplateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LaunchTemplateProperties()
+            _setattr("Properties", _convert_LaunchTemplateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        LaunchTemplate,
+        LaunchTemplateProperties,
+        LaunchTemplateEbs,
+        LaunchTemplateBlockDeviceMapping,
+        LaunchTemplateCapacityReservationTarget,
+        LaunchTemplateCapacityReservationSpecification,
+        LaunchTemplateCpuOptions,
+        LaunchTemplateCreditSpecification,
+        LaunchTemplateElasticGpuSpecification,
+        LaunchTemplateHibernationOptions,
+        LaunchTemplateIamInstanceProfile,
+        LaunchTemplateSpotOptions,
+        LaunchTemplateInstanceMarketOptions,
+        LaunchTemplateIpv6Add,
+        LaunchTemplateTagSpecification,
+        LaunchTemplateLaunchTemplateElasticInferenceAccelerator,
+        LaunchTemplatePlacement,
+        LaunchTemplatePrivateIpAdd,
+        LaunchTemplateNetworkInterface,
+        LaunchTemplateMonitoring,
+        LaunchTemplateLicenseSpecification,
+        LaunchTemplateLaunchTemplateData,
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPCEndpointServicePermissionsProperties(ResourceProperties):
-    AllowedPrincipals = attrib(default=None)
-    ServiceId = attrib(default=None)
 
+def _create_NatGateway():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class NatGatewayProperties(_ResourceProperties):
+        __slots__ = ("AllocationId", "SubnetId", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NatGatewayProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AllocationId=None, SubnetId=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocationId", AllocationId)
+            _setattr("SubnetId", SubnetId)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NatGatewayProperties = create_object_converter(NatGatewayProperties)
+
+    class NatGateway(_Resource):
+        """A Nat Gateway for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NatGateway
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-natgateway.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::NatGateway"
+
+        Properties: NatGatewayProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NatGateway",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NatGatewayProperties},
+            factories={"Properties": NatGatewayProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NatGatewayProperties()
+            _setattr("Properties", _convert_NatGatewayProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return NatGateway, NatGatewayProperties
+
+
+def _create_NetworkAcl():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class NetworkAclProperties(_ResourceProperties):
+        __slots__ = ("Tags", "VpcId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkAclProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Tags=None, VpcId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NetworkAclProperties = create_object_converter(NetworkAclProperties)
+
+    class NetworkAcl(_Resource):
+        """A Network Acl for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkAcl
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-network-acl.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::NetworkAcl"
+
+        Properties: NetworkAclProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkAcl",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NetworkAclProperties},
+            factories={"Properties": NetworkAclProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NetworkAclProperties()
+            _setattr("Properties", _convert_NetworkAclProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return NetworkAcl, NetworkAclProperties
+
+
+def _create_NetworkAclEntry():
+    class NetworkAclEntryIcmp(_PropertyType):
+        """The Icmp property type for NetworkAclEntry in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Icmp
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-networkaclentry-icmp.html>`_
+        """
+
+        __slots__ = ("Code", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkAclEntryIcmp", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Code=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Code", Code)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class NetworkAclEntryPortRange(_PropertyType):
+        """The Port Range property type for NetworkAclEntry in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for PortRange
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-networkaclentry-portrange.html>`_
+        """
+
+        __slots__ = ("From", "To")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkAclEntryPortRange", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, From=None, To=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("From", From)
+            _setattr("To", To)
+            _init_PropertyType(self, kwargs)
+
+    _convert_NetworkAclEntryIcmp = create_object_converter(NetworkAclEntryIcmp)
+    _convert_NetworkAclEntryPortRange = create_object_converter(
+        NetworkAclEntryPortRange
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPCEndpointServicePermissions(Resource):
-    """A Vpc Endpoint Service Permissions for EC2.
+    class NetworkAclEntryProperties(_ResourceProperties):
+        __slots__ = (
+            "CidrBlock",
+            "Egress",
+            "Icmp",
+            "Ipv6CidrBlock",
+            "NetworkAclId",
+            "PortRange",
+            "Protocol",
+            "RuleAction",
+            "RuleNumber",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkAclEntryProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Icmp": _convert_NetworkAclEntryIcmp,
+                "PortRange": _convert_NetworkAclEntryPortRange,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CidrBlock=None,
+            Egress=None,
+            Icmp=None,
+            Ipv6CidrBlock=None,
+            NetworkAclId=None,
+            PortRange=None,
+            Protocol=None,
+            RuleAction=None,
+            RuleNumber=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CidrBlock", CidrBlock)
+            _setattr("Egress", Egress)
+            _setattr("Icmp", _convert_NetworkAclEntryIcmp(Icmp))
+            _setattr("Ipv6CidrBlock", Ipv6CidrBlock)
+            _setattr("NetworkAclId", NetworkAclId)
+            _setattr("PortRange", _convert_NetworkAclEntryPortRange(PortRange))
+            _setattr("Protocol", Protocol)
+            _setattr("RuleAction", RuleAction)
+            _setattr("RuleNumber", RuleNumber)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NetworkAclEntryProperties = create_object_converter(
+        NetworkAclEntryProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for VPCEndpointServicePermissions
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcendpointservicepermissions.html>`_
-    """
+    class NetworkAclEntry(_Resource):
+        """A Network Acl Entry for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkAclEntry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-network-acl-entry.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::NetworkAclEntry"
+
+        Properties: NetworkAclEntryProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkAclEntry",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NetworkAclEntryProperties},
+            factories={"Properties": NetworkAclEntryProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NetworkAclEntryProperties()
+            _setattr("Properties", _convert_NetworkAclEntryProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        NetworkAclEntry,
+        NetworkAclEntryProperties,
+        NetworkAclEntryIcmp,
+        NetworkAclEntryPortRange,
+    )
 
-    RESOURCE_TYPE = "AWS::EC2::VPCEndpointServicePermissions"
 
-    Properties: VPCEndpointServicePermissionsProperties = attrib(
-        factory=VPCEndpointServicePermissionsProperties,
-        converter=create_object_converter(VPCEndpointServicePermissionsProperties),
+def _create_NetworkInterface():
+    class NetworkInterfaceInstanceIpv6Address(_PropertyType):
+        """The Instance Ipv6 Address property type for NetworkInterface in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceIpv6Address
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-networkinterface-instanceipv6address.html>`_
+        """
+
+        __slots__ = ("Ipv6Address",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkInterfaceInstanceIpv6Address", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Ipv6Address=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ipv6Address", Ipv6Address)
+            _init_PropertyType(self, kwargs)
+
+    class NetworkInterfacePrivateIpAddressSpecification(_PropertyType):
+        """The Private Ip Address Specification property type for NetworkInterface in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for PrivateIpAddressSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-network-interface-privateipspec.html>`_
+        """
+
+        __slots__ = ("Primary", "PrivateIpAddress")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkInterfacePrivateIpAddressSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Primary=None, PrivateIpAddress=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Primary", Primary)
+            _setattr("PrivateIpAddress", PrivateIpAddress)
+            _init_PropertyType(self, kwargs)
+
+    _convert_NetworkInterfaceInstanceIpv6Address = create_object_converter(
+        NetworkInterfaceInstanceIpv6Address
+    )
+    _convert_NetworkInterfacePrivateIpAddressSpecification_list = (
+        create_object_list_converter(NetworkInterfacePrivateIpAddressSpecification)
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class NetworkInterfaceProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "GroupSet",
+            "InterfaceType",
+            "Ipv6AddressCount",
+            "Ipv6Addresses",
+            "PrivateIpAddress",
+            "PrivateIpAddresses",
+            "SecondaryPrivateIpAddressCount",
+            "SourceDestCheck",
+            "SubnetId",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkInterfaceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Ipv6Addresses": _convert_NetworkInterfaceInstanceIpv6Address,
+                "PrivateIpAddresses": _convert_NetworkInterfacePrivateIpAddressSpecification_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            GroupSet=None,
+            InterfaceType=None,
+            Ipv6AddressCount=None,
+            Ipv6Addresses=None,
+            PrivateIpAddress=None,
+            PrivateIpAddresses=None,
+            SecondaryPrivateIpAddressCount=None,
+            SourceDestCheck=None,
+            SubnetId=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("GroupSet", GroupSet)
+            _setattr("InterfaceType", InterfaceType)
+            _setattr("Ipv6AddressCount", Ipv6AddressCount)
+            _setattr(
+                "Ipv6Addresses",
+                _convert_NetworkInterfaceInstanceIpv6Address(Ipv6Addresses),
+            )
+            _setattr("PrivateIpAddress", PrivateIpAddress)
+            _setattr(
+                "PrivateIpAddresses",
+                _convert_NetworkInterfacePrivateIpAddressSpecification_list(
+                    PrivateIpAddresses
+                ),
+            )
+            _setattr("SecondaryPrivateIpAddressCount", SecondaryPrivateIpAddressCount)
+            _setattr("SourceDestCheck", SourceDestCheck)
+            _setattr("SubnetId", SubnetId)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NetworkInterfaceProperties = create_object_converter(
+        NetworkInterfaceProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class VPCGatewayAttachmentProperties(ResourceProperties):
-    InternetGatewayId = attrib(default=None)
-    VpcId = attrib(default=None)
-    VpnGatewayId = attrib(default=None)
+    class NetworkInterface(_Resource):
+        """A Network Interface for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkInterface
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-network-interface.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::NetworkInterface"
+
+        Properties: NetworkInterfaceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkInterface",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NetworkInterfaceProperties},
+            factories={"Properties": NetworkInterfaceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NetworkInterfaceProperties()
+            _setattr("Properties", _convert_NetworkInterfaceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        NetworkInterface,
+        NetworkInterfaceProperties,
+        NetworkInterfaceInstanceIpv6Address,
+        NetworkInterfacePrivateIpAddressSpecification,
+    )
 
 
-@attrs(**ATTRSCONFIG)
-class VPCGatewayAttachment(Resource):
-    """A Vpc Gateway Attachment for EC2.
+def _create_NetworkInterfaceAttachment():
+    class NetworkInterfaceAttachmentProperties(_ResourceProperties):
+        __slots__ = (
+            "DeleteOnTermination",
+            "DeviceIndex",
+            "InstanceId",
+            "NetworkInterfaceId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkInterfaceAttachmentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeleteOnTermination=None,
+            DeviceIndex=None,
+            InstanceId=None,
+            NetworkInterfaceId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteOnTermination", DeleteOnTermination)
+            _setattr("DeviceIndex", DeviceIndex)
+            _setattr("InstanceId", InstanceId)
+            _setattr("NetworkInterfaceId", NetworkInterfaceId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NetworkInterfaceAttachmentProperties = create_object_converter(
+        NetworkInterfaceAttachmentProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for VPCGatewayAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpc-gateway-attachment.html>`_
-    """
+    class NetworkInterfaceAttachment(_Resource):
+        """A Network Interface Attachment for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkInterfaceAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-network-interface-attachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::NetworkInterfaceAttachment"
+
+        Properties: NetworkInterfaceAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkInterfaceAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NetworkInterfaceAttachmentProperties},
+            factories={"Properties": NetworkInterfaceAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NetworkInterfaceAttachmentProperties()
+            _setattr(
+                "Properties", _convert_NetworkInterfaceAttachmentProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return NetworkInterfaceAttachment, NetworkInterfaceAttachmentProperties
+
+
+def _create_NetworkInterfacePermission():
+    class NetworkInterfacePermissionProperties(_ResourceProperties):
+        __slots__ = ("AwsAccountId", "NetworkInterfaceId", "Permission")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkInterfacePermissionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AwsAccountId=None,
+            NetworkInterfaceId=None,
+            Permission=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AwsAccountId", AwsAccountId)
+            _setattr("NetworkInterfaceId", NetworkInterfaceId)
+            _setattr("Permission", Permission)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NetworkInterfacePermissionProperties = create_object_converter(
+        NetworkInterfacePermissionProperties
+    )
 
-    RESOURCE_TYPE = "AWS::EC2::VPCGatewayAttachment"
+    class NetworkInterfacePermission(_Resource):
+        """A Network Interface Permission for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkInterfacePermission
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-networkinterfacepermission.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::NetworkInterfacePermission"
+
+        Properties: NetworkInterfacePermissionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NetworkInterfacePermission",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NetworkInterfacePermissionProperties},
+            factories={"Properties": NetworkInterfacePermissionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NetworkInterfacePermissionProperties()
+            _setattr(
+                "Properties", _convert_NetworkInterfacePermissionProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return NetworkInterfacePermission, NetworkInterfacePermissionProperties
+
+
+def _create_PlacementGroup():
+    class PlacementGroupProperties(_ResourceProperties):
+        __slots__ = ("Strategy",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PlacementGroupProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Strategy=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Strategy", Strategy)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PlacementGroupProperties = create_object_converter(
+        PlacementGroupProperties
+    )
 
-    Properties: VPCGatewayAttachmentProperties = attrib(
-        factory=VPCGatewayAttachmentProperties,
-        converter=create_object_converter(VPCGatewayAttachmentProperties),
+    class PlacementGroup(_Resource):
+        """A Placement Group for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for PlacementGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-placementgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::PlacementGroup"
+
+        Properties: PlacementGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PlacementGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PlacementGroupProperties},
+            factories={"Properties": PlacementGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PlacementGroupProperties()
+            _setattr("Properties", _convert_PlacementGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return PlacementGroup, PlacementGroupProperties
+
+
+def _create_Route():
+    class RouteProperties(_ResourceProperties):
+        __slots__ = (
+            "DestinationCidrBlock",
+            "DestinationIpv6CidrBlock",
+            "EgressOnlyInternetGatewayId",
+            "GatewayId",
+            "InstanceId",
+            "NatGatewayId",
+            "NetworkInterfaceId",
+            "RouteTableId",
+            "TransitGatewayId",
+            "VpcPeeringConnectionId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DestinationCidrBlock=None,
+            DestinationIpv6CidrBlock=None,
+            EgressOnlyInternetGatewayId=None,
+            GatewayId=None,
+            InstanceId=None,
+            NatGatewayId=None,
+            NetworkInterfaceId=None,
+            RouteTableId=None,
+            TransitGatewayId=None,
+            VpcPeeringConnectionId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationCidrBlock", DestinationCidrBlock)
+            _setattr("DestinationIpv6CidrBlock", DestinationIpv6CidrBlock)
+            _setattr("EgressOnlyInternetGatewayId", EgressOnlyInternetGatewayId)
+            _setattr("GatewayId", GatewayId)
+            _setattr("InstanceId", InstanceId)
+            _setattr("NatGatewayId", NatGatewayId)
+            _setattr("NetworkInterfaceId", NetworkInterfaceId)
+            _setattr("RouteTableId", RouteTableId)
+            _setattr("TransitGatewayId", TransitGatewayId)
+            _setattr("VpcPeeringConnectionId", VpcPeeringConnectionId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RouteProperties = create_object_converter(RouteProperties)
+
+    class Route(_Resource):
+        """A Route for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Route
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-route.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::Route"
+
+        Properties: RouteProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Route",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RouteProperties},
+            factories={"Properties": RouteProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RouteProperties()
+            _setattr("Properties", _convert_RouteProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Route, RouteProperties
+
+
+def _create_RouteTable():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class RouteTableProperties(_ResourceProperties):
+        __slots__ = ("Tags", "VpcId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteTableProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Tags=None, VpcId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RouteTableProperties = create_object_converter(RouteTableProperties)
+
+    class RouteTable(_Resource):
+        """A Route Table for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RouteTable
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-route-table.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::RouteTable"
+
+        Properties: RouteTableProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RouteTable",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RouteTableProperties},
+            factories={"Properties": RouteTableProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RouteTableProperties()
+            _setattr("Properties", _convert_RouteTableProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return RouteTable, RouteTableProperties
+
+
+def _create_SecurityGroup():
+    class SecurityGroupEgressProperty(_PropertyType):
+        """The Egress property type for SecurityGroup in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Egress
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-security-group-rule.html>`_
+        """
+
+        __slots__ = (
+            "CidrIp",
+            "CidrIpv6",
+            "Description",
+            "DestinationPrefixListId",
+            "DestinationSecurityGroupId",
+            "FromPort",
+            "IpProtocol",
+            "ToPort",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupEgressProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CidrIp=None,
+            CidrIpv6=None,
+            Description=None,
+            DestinationPrefixListId=None,
+            DestinationSecurityGroupId=None,
+            FromPort=None,
+            IpProtocol=None,
+            ToPort=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CidrIp", CidrIp)
+            _setattr("CidrIpv6", CidrIpv6)
+            _setattr("Description", Description)
+            _setattr("DestinationPrefixListId", DestinationPrefixListId)
+            _setattr("DestinationSecurityGroupId", DestinationSecurityGroupId)
+            _setattr("FromPort", FromPort)
+            _setattr("IpProtocol", IpProtocol)
+            _setattr("ToPort", ToPort)
+            _init_PropertyType(self, kwargs)
+
+    class SecurityGroupIngressProperty(_PropertyType):
+        """The Ingress property type for SecurityGroup in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Ingress
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-security-group-rule.html>`_
+        """
+
+        __slots__ = (
+            "CidrIp",
+            "CidrIpv6",
+            "Description",
+            "FromPort",
+            "IpProtocol",
+            "SourcePrefixListId",
+            "SourceSecurityGroupId",
+            "SourceSecurityGroupName",
+            "SourceSecurityGroupOwnerId",
+            "ToPort",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupIngressProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CidrIp=None,
+            CidrIpv6=None,
+            Description=None,
+            FromPort=None,
+            IpProtocol=None,
+            SourcePrefixListId=None,
+            SourceSecurityGroupId=None,
+            SourceSecurityGroupName=None,
+            SourceSecurityGroupOwnerId=None,
+            ToPort=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CidrIp", CidrIp)
+            _setattr("CidrIpv6", CidrIpv6)
+            _setattr("Description", Description)
+            _setattr("FromPort", FromPort)
+            _setattr("IpProtocol", IpProtocol)
+            _setattr("SourcePrefixListId", SourcePrefixListId)
+            _setattr("SourceSecurityGroupId", SourceSecurityGroupId)
+            _setattr("SourceSecurityGroupName", SourceSecurityGroupName)
+            _setattr("SourceSecurityGroupOwnerId", SourceSecurityGroupOwnerId)
+            _setattr("ToPort", ToPort)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SecurityGroupEgressProperty_list = create_object_list_converter(
+        SecurityGroupEgressProperty
+    )
+    _convert_SecurityGroupIngressProperty_list = create_object_list_converter(
+        SecurityGroupIngressProperty
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class SecurityGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "GroupDescription",
+            "GroupName",
+            "SecurityGroupEgress",
+            "SecurityGroupIngress",
+            "Tags",
+            "VpcId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "SecurityGroupEgress": _convert_SecurityGroupEgressProperty_list,
+                "SecurityGroupIngress": _convert_SecurityGroupIngressProperty_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            GroupDescription=None,
+            GroupName=None,
+            SecurityGroupEgress=None,
+            SecurityGroupIngress=None,
+            Tags=None,
+            VpcId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GroupDescription", GroupDescription)
+            _setattr("GroupName", GroupName)
+            _setattr(
+                "SecurityGroupEgress",
+                _convert_SecurityGroupEgressProperty_list(SecurityGroupEgress),
+            )
+            _setattr(
+                "SecurityGroupIngress",
+                _convert_SecurityGroupIngressProperty_list(SecurityGroupIngress),
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SecurityGroupProperties = create_object_converter(SecurityGroupProperties)
+
+    class SecurityGroup(_Resource):
+        """A Security Group for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecurityGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-security-group.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::SecurityGroup"
+
+        Properties: SecurityGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SecurityGroupProperties},
+            factories={"Properties": SecurityGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SecurityGroupProperties()
+            _setattr("Properties", _convert_SecurityGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        SecurityGroup,
+        SecurityGroupProperties,
+        SecurityGroupEgressProperty,
+        SecurityGroupIngressProperty,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class VPCPeeringConnectionProperties(ResourceProperties):
-    PeerOwnerId = attrib(default=None)
-    PeerRegion = attrib(default=None)
-    PeerRoleArn = attrib(default=None)
-    PeerVpcId = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcId = attrib(default=None)
+def _create_SecurityGroupEgress():
+    class SecurityGroupEgressProperties(_ResourceProperties):
+        __slots__ = (
+            "CidrIp",
+            "CidrIpv6",
+            "Description",
+            "DestinationPrefixListId",
+            "DestinationSecurityGroupId",
+            "FromPort",
+            "GroupId",
+            "IpProtocol",
+            "ToPort",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupEgressProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CidrIp=None,
+            CidrIpv6=None,
+            Description=None,
+            DestinationPrefixListId=None,
+            DestinationSecurityGroupId=None,
+            FromPort=None,
+            GroupId=None,
+            IpProtocol=None,
+            ToPort=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CidrIp", CidrIp)
+            _setattr("CidrIpv6", CidrIpv6)
+            _setattr("Description", Description)
+            _setattr("DestinationPrefixListId", DestinationPrefixListId)
+            _setattr("DestinationSecurityGroupId", DestinationSecurityGroupId)
+            _setattr("FromPort", FromPort)
+            _setattr("GroupId", GroupId)
+            _setattr("IpProtocol", IpProtocol)
+            _setattr("ToPort", ToPort)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SecurityGroupEgressProperties = create_object_converter(
+        SecurityGroupEgressProperties
+    )
 
+    class SecurityGroupEgress(_Resource):
+        """A Security Group Egress for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecurityGroupEgress
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-security-group-egress.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::SecurityGroupEgress"
+
+        Properties: SecurityGroupEgressProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupEgress",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SecurityGroupEgressProperties},
+            factories={"Properties": SecurityGroupEgressProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SecurityGroupEgressProperties()
+            _setattr("Properties", _convert_SecurityGroupEgressProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SecurityGroupEgress, SecurityGroupEgressProperties
+
+
+def _create_SecurityGroupIngress():
+    class SecurityGroupIngressProperties(_ResourceProperties):
+        __slots__ = (
+            "CidrIp",
+            "CidrIpv6",
+            "Description",
+            "FromPort",
+            "GroupId",
+            "GroupName",
+            "IpProtocol",
+            "SourcePrefixListId",
+            "SourceSecurityGroupId",
+            "SourceSecurityGroupName",
+            "SourceSecurityGroupOwnerId",
+            "ToPort",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupIngressProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CidrIp=None,
+            CidrIpv6=None,
+            Description=None,
+            FromPort=None,
+            GroupId=None,
+            GroupName=None,
+            IpProtocol=None,
+            SourcePrefixListId=None,
+            SourceSecurityGroupId=None,
+            SourceSecurityGroupName=None,
+            SourceSecurityGroupOwnerId=None,
+            ToPort=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CidrIp", CidrIp)
+            _setattr("CidrIpv6", CidrIpv6)
+            _setattr("Description", Description)
+            _setattr("FromPort", FromPort)
+            _setattr("GroupId", GroupId)
+            _setattr("GroupName", GroupName)
+            _setattr("IpProtocol", IpProtocol)
+            _setattr("SourcePrefixListId", SourcePrefixListId)
+            _setattr("SourceSecurityGroupId", SourceSecurityGroupId)
+            _setattr("SourceSecurityGroupName", SourceSecurityGroupName)
+            _setattr("SourceSecurityGroupOwnerId", SourceSecurityGroupOwnerId)
+            _setattr("ToPort", ToPort)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SecurityGroupIngressProperties = create_object_converter(
+        SecurityGroupIngressProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPCPeeringConnection(Resource):
-    """A Vpc Peering Connection for EC2.
+    class SecurityGroupIngress(_Resource):
+        """A Security Group Ingress for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecurityGroupIngress
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-security-group-ingress.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::SecurityGroupIngress"
+
+        Properties: SecurityGroupIngressProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupIngress",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SecurityGroupIngressProperties},
+            factories={"Properties": SecurityGroupIngressProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SecurityGroupIngressProperties()
+            _setattr("Properties", _convert_SecurityGroupIngressProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SecurityGroupIngress, SecurityGroupIngressProperties
+
+
+def _create_SpotFleet():
+    class SpotFleetEbsBlockDevice(_PropertyType):
+        """The Ebs Block Device property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for EbsBlockDevice
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications-blockdevicemappings-ebs.html>`_
+        """
+
+        __slots__ = (
+            "DeleteOnTermination",
+            "Encrypted",
+            "Iops",
+            "SnapshotId",
+            "VolumeSize",
+            "VolumeType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetEbsBlockDevice", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeleteOnTermination=None,
+            Encrypted=None,
+            Iops=None,
+            SnapshotId=None,
+            VolumeSize=None,
+            VolumeType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteOnTermination", DeleteOnTermination)
+            _setattr("Encrypted", Encrypted)
+            _setattr("Iops", Iops)
+            _setattr("SnapshotId", SnapshotId)
+            _setattr("VolumeSize", VolumeSize)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SpotFleetEbsBlockDevice = create_object_converter(SpotFleetEbsBlockDevice)
+
+    class SpotFleetBlockDeviceMapping(_PropertyType):
+        """The Block Device Mapping property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for BlockDeviceMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications-blockdevicemappings.html>`_
+        """
+
+        __slots__ = ("DeviceName", "Ebs", "NoDevice", "VirtualName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetBlockDeviceMapping",
+            _PropertyType,
+            __slots__,
+            converters={"Ebs": _convert_SpotFleetEbsBlockDevice},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeviceName=None,
+            Ebs=None,
+            NoDevice=None,
+            VirtualName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeviceName", DeviceName)
+            _setattr("Ebs", _convert_SpotFleetEbsBlockDevice(Ebs))
+            _setattr("NoDevice", NoDevice)
+            _setattr("VirtualName", VirtualName)
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetClassicLoadBalancer(_PropertyType):
+        """The Classic Load Balancer property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClassicLoadBalancer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-classicloadbalancer.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetClassicLoadBalancer", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SpotFleetClassicLoadBalancer_list = create_object_list_converter(
+        SpotFleetClassicLoadBalancer
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for VPCPeeringConnection
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcpeeringconnection.html>`_
-    """
+    class SpotFleetClassicLoadBalancersConfig(_PropertyType):
+        """The Classic Load Balancers Config property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClassicLoadBalancersConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-classicloadbalancersconfig.html>`_
+        """
+
+        __slots__ = ("ClassicLoadBalancers",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetClassicLoadBalancersConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ClassicLoadBalancers": _convert_SpotFleetClassicLoadBalancer_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ClassicLoadBalancers=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ClassicLoadBalancers",
+                _convert_SpotFleetClassicLoadBalancer_list(ClassicLoadBalancers),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetFleetLaunchTemplateSpecification(_PropertyType):
+        """The Fleet Launch Template Specification property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FleetLaunchTemplateSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-fleetlaunchtemplatespecification.html>`_
+        """
+
+        __slots__ = ("LaunchTemplateId", "LaunchTemplateName", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetFleetLaunchTemplateSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            LaunchTemplateId=None,
+            LaunchTemplateName=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LaunchTemplateId", LaunchTemplateId)
+            _setattr("LaunchTemplateName", LaunchTemplateName)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetGroupIdentifier(_PropertyType):
+        """The Group Identifier property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for GroupIdentifier
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications-securitygroups.html>`_
+        """
+
+        __slots__ = ("GroupId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetGroupIdentifier", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, GroupId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GroupId", GroupId)
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetIamInstanceProfileSpecification(_PropertyType):
+        """The Iam Instance Profile Specification property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for IamInstanceProfileSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications-iaminstanceprofile.html>`_
+        """
+
+        __slots__ = ("Arn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetIamInstanceProfileSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Arn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetInstanceIpv6Address(_PropertyType):
+        """The Instance Ipv6 Address property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceIpv6Address
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-instanceipv6address.html>`_
+        """
+
+        __slots__ = ("Ipv6Address",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetInstanceIpv6Address", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Ipv6Address=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ipv6Address", Ipv6Address)
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetPrivateIpAddressSpecification(_PropertyType):
+        """The Private Ip Address Specification property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for PrivateIpAddressSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications-networkinterfaces-privateipaddresses.html>`_
+        """
+
+        __slots__ = ("Primary", "PrivateIpAddress")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetPrivateIpAddressSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Primary=None, PrivateIpAddress=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Primary", Primary)
+            _setattr("PrivateIpAddress", PrivateIpAddress)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SpotFleetInstanceIpv6Address_list = create_object_list_converter(
+        SpotFleetInstanceIpv6Address
+    )
+    _convert_SpotFleetPrivateIpAddressSpecification_list = create_object_list_converter(
+        SpotFleetPrivateIpAddressSpecification
+    )
 
-    RESOURCE_TYPE = "AWS::EC2::VPCPeeringConnection"
+    class SpotFleetInstanceNetworkInterfaceSpecification(_PropertyType):
+        """The Instance Network Interface Specification property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceNetworkInterfaceSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications-networkinterfaces.html>`_
+        """
+
+        __slots__ = (
+            "AssociatePublicIpAddress",
+            "DeleteOnTermination",
+            "Description",
+            "DeviceIndex",
+            "Groups",
+            "Ipv6AddressCount",
+            "Ipv6Addresses",
+            "NetworkInterfaceId",
+            "PrivateIpAddresses",
+            "SecondaryPrivateIpAddressCount",
+            "SubnetId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetInstanceNetworkInterfaceSpecification",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Ipv6Addresses": _convert_SpotFleetInstanceIpv6Address_list,
+                "PrivateIpAddresses": _convert_SpotFleetPrivateIpAddressSpecification_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssociatePublicIpAddress=None,
+            DeleteOnTermination=None,
+            Description=None,
+            DeviceIndex=None,
+            Groups=None,
+            Ipv6AddressCount=None,
+            Ipv6Addresses=None,
+            NetworkInterfaceId=None,
+            PrivateIpAddresses=None,
+            SecondaryPrivateIpAddressCount=None,
+            SubnetId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssociatePublicIpAddress", AssociatePublicIpAddress)
+            _setattr("DeleteOnTermination", DeleteOnTermination)
+            _setattr("Description", Description)
+            _setattr("DeviceIndex", DeviceIndex)
+            _setattr("Groups", Groups)
+            _setattr("Ipv6AddressCount", Ipv6AddressCount)
+            _setattr(
+                "Ipv6Addresses",
+                _convert_SpotFleetInstanceIpv6Address_list(Ipv6Addresses),
+            )
+            _setattr("NetworkInterfaceId", NetworkInterfaceId)
+            _setattr(
+                "PrivateIpAddresses",
+                _convert_SpotFleetPrivateIpAddressSpecification_list(
+                    PrivateIpAddresses
+                ),
+            )
+            _setattr("SecondaryPrivateIpAddressCount", SecondaryPrivateIpAddressCount)
+            _setattr("SubnetId", SubnetId)
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetLaunchTemplateOverrides(_PropertyType):
+        """The Launch Template Overrides property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplateOverrides
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-launchtemplateoverrides.html>`_
+        """
+
+        __slots__ = (
+            "AvailabilityZone",
+            "InstanceType",
+            "SpotPrice",
+            "SubnetId",
+            "WeightedCapacity",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetLaunchTemplateOverrides", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AvailabilityZone=None,
+            InstanceType=None,
+            SpotPrice=None,
+            SubnetId=None,
+            WeightedCapacity=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("InstanceType", InstanceType)
+            _setattr("SpotPrice", SpotPrice)
+            _setattr("SubnetId", SubnetId)
+            _setattr("WeightedCapacity", WeightedCapacity)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SpotFleetFleetLaunchTemplateSpecification = create_object_converter(
+        SpotFleetFleetLaunchTemplateSpecification
+    )
+    _convert_SpotFleetLaunchTemplateOverrides_list = create_object_list_converter(
+        SpotFleetLaunchTemplateOverrides
+    )
 
-    Properties: VPCPeeringConnectionProperties = attrib(
-        factory=VPCPeeringConnectionProperties,
-        converter=create_object_converter(VPCPeeringConnectionProperties),
+    class SpotFleetLaunchTemplateConfig(_PropertyType):
+        """The Launch Template Config property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplateConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-launchtemplateconfig.html>`_
+        """
+
+        __slots__ = ("LaunchTemplateSpecification", "Overrides")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetLaunchTemplateConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "LaunchTemplateSpecification": _convert_SpotFleetFleetLaunchTemplateSpecification,
+                "Overrides": _convert_SpotFleetLaunchTemplateOverrides_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, LaunchTemplateSpecification=None, Overrides=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "LaunchTemplateSpecification",
+                _convert_SpotFleetFleetLaunchTemplateSpecification(
+                    LaunchTemplateSpecification
+                ),
+            )
+            _setattr(
+                "Overrides", _convert_SpotFleetLaunchTemplateOverrides_list(Overrides)
+            )
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetTargetGroup(_PropertyType):
+        """The Target Group property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TargetGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-targetgroup.html>`_
+        """
+
+        __slots__ = ("Arn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetTargetGroup", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Arn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SpotFleetTargetGroup_list = create_object_list_converter(
+        SpotFleetTargetGroup
     )
 
+    class SpotFleetTargetGroupsConfig(_PropertyType):
+        """The Target Groups Config property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TargetGroupsConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-targetgroupsconfig.html>`_
+        """
+
+        __slots__ = ("TargetGroups",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetTargetGroupsConfig",
+            _PropertyType,
+            __slots__,
+            converters={"TargetGroups": _convert_SpotFleetTargetGroup_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TargetGroups=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TargetGroups", _convert_SpotFleetTargetGroup_list(TargetGroups))
+            _init_PropertyType(self, kwargs)
+
+    _convert_SpotFleetClassicLoadBalancersConfig = create_object_converter(
+        SpotFleetClassicLoadBalancersConfig
+    )
+    _convert_SpotFleetTargetGroupsConfig = create_object_converter(
+        SpotFleetTargetGroupsConfig
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPNConnectionProperties(ResourceProperties):
-    CustomerGatewayId = attrib(default=None)
-    StaticRoutesOnly = attrib(default=None)
-    Tags = attrib(default=None)
-    TransitGatewayId = attrib(default=None)
-    Type = attrib(default=None)
-    VpnGatewayId = attrib(default=None)
-    VpnTunnelOptionsSpecifications = attrib(default=None)
+    class SpotFleetLoadBalancersConfig(_PropertyType):
+        """The Load Balancers Config property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoadBalancersConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-loadbalancersconfig.html>`_
+        """
+
+        __slots__ = ("ClassicLoadBalancersConfig", "TargetGroupsConfig")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetLoadBalancersConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ClassicLoadBalancersConfig": _convert_SpotFleetClassicLoadBalancersConfig,
+                "TargetGroupsConfig": _convert_SpotFleetTargetGroupsConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ClassicLoadBalancersConfig=None, TargetGroupsConfig=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ClassicLoadBalancersConfig",
+                _convert_SpotFleetClassicLoadBalancersConfig(
+                    ClassicLoadBalancersConfig
+                ),
+            )
+            _setattr(
+                "TargetGroupsConfig",
+                _convert_SpotFleetTargetGroupsConfig(TargetGroupsConfig),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetSpotFleetMonitoring(_PropertyType):
+        """The Spot Fleet Monitoring property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SpotFleetMonitoring
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications-monitoring.html>`_
+        """
+
+        __slots__ = ("Enabled",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetSpotFleetMonitoring", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Enabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _init_PropertyType(self, kwargs)
+
+    class SpotFleetSpotPlacement(_PropertyType):
+        """The Spot Placement property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SpotPlacement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications-placement.html>`_
+        """
+
+        __slots__ = ("AvailabilityZone", "GroupName", "Tenancy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetSpotPlacement", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AvailabilityZone=None, GroupName=None, Tenancy=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("GroupName", GroupName)
+            _setattr("Tenancy", Tenancy)
+            _init_PropertyType(self, kwargs)
+
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class SpotFleetSpotFleetTagSpecification(_PropertyType):
+        """The Spot Fleet Tag Specification property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SpotFleetTagSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications-tagspecifications.html>`_
+        """
+
+        __slots__ = ("ResourceType", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetSpotFleetTagSpecification",
+            _PropertyType,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceType=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceType", ResourceType)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_PropertyType(self, kwargs)
+
+    _convert_SpotFleetBlockDeviceMapping_list = create_object_list_converter(
+        SpotFleetBlockDeviceMapping
+    )
+    _convert_SpotFleetIamInstanceProfileSpecification = create_object_converter(
+        SpotFleetIamInstanceProfileSpecification
+    )
+    _convert_SpotFleetSpotFleetMonitoring = create_object_converter(
+        SpotFleetSpotFleetMonitoring
+    )
+    _convert_SpotFleetInstanceNetworkInterfaceSpecification_list = (
+        create_object_list_converter(SpotFleetInstanceNetworkInterfaceSpecification)
+    )
+    _convert_SpotFleetSpotPlacement = create_object_converter(SpotFleetSpotPlacement)
+    _convert_SpotFleetGroupIdentifier_list = create_object_list_converter(
+        SpotFleetGroupIdentifier
+    )
+    _convert_SpotFleetSpotFleetTagSpecification_list = create_object_list_converter(
+        SpotFleetSpotFleetTagSpecification
+    )
 
+    class SpotFleetSpotFleetLaunchSpecification(_PropertyType):
+        """The Spot Fleet Launch Specification property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SpotFleetLaunchSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata-launchspecifications.html>`_
+        """
+
+        __slots__ = (
+            "BlockDeviceMappings",
+            "EbsOptimized",
+            "IamInstanceProfile",
+            "ImageId",
+            "InstanceType",
+            "KernelId",
+            "KeyName",
+            "Monitoring",
+            "NetworkInterfaces",
+            "Placement",
+            "RamdiskId",
+            "SecurityGroups",
+            "SpotPrice",
+            "SubnetId",
+            "TagSpecifications",
+            "UserData",
+            "WeightedCapacity",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetSpotFleetLaunchSpecification",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BlockDeviceMappings": _convert_SpotFleetBlockDeviceMapping_list,
+                "IamInstanceProfile": _convert_SpotFleetIamInstanceProfileSpecification,
+                "Monitoring": _convert_SpotFleetSpotFleetMonitoring,
+                "NetworkInterfaces": _convert_SpotFleetInstanceNetworkInterfaceSpecification_list,
+                "Placement": _convert_SpotFleetSpotPlacement,
+                "SecurityGroups": _convert_SpotFleetGroupIdentifier_list,
+                "TagSpecifications": _convert_SpotFleetSpotFleetTagSpecification_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockDeviceMappings=None,
+            EbsOptimized=None,
+            IamInstanceProfile=None,
+            ImageId=None,
+            InstanceType=None,
+            KernelId=None,
+            KeyName=None,
+            Monitoring=None,
+            NetworkInterfaces=None,
+            Placement=None,
+            RamdiskId=None,
+            SecurityGroups=None,
+            SpotPrice=None,
+            SubnetId=None,
+            TagSpecifications=None,
+            UserData=None,
+            WeightedCapacity=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "BlockDeviceMappings",
+                _convert_SpotFleetBlockDeviceMapping_list(BlockDeviceMappings),
+            )
+            _setattr("EbsOptimized", EbsOptimized)
+            _setattr(
+                "IamInstanceProfile",
+                _convert_SpotFleetIamInstanceProfileSpecification(IamInstanceProfile),
+            )
+            _setattr("ImageId", ImageId)
+            _setattr("InstanceType", InstanceType)
+            _setattr("KernelId", KernelId)
+            _setattr("KeyName", KeyName)
+            _setattr("Monitoring", _convert_SpotFleetSpotFleetMonitoring(Monitoring))
+            _setattr(
+                "NetworkInterfaces",
+                _convert_SpotFleetInstanceNetworkInterfaceSpecification_list(
+                    NetworkInterfaces
+                ),
+            )
+            _setattr("Placement", _convert_SpotFleetSpotPlacement(Placement))
+            _setattr("RamdiskId", RamdiskId)
+            _setattr(
+                "SecurityGroups", _convert_SpotFleetGroupIdentifier_list(SecurityGroups)
+            )
+            _setattr("SpotPrice", SpotPrice)
+            _setattr("SubnetId", SubnetId)
+            _setattr(
+                "TagSpecifications",
+                _convert_SpotFleetSpotFleetTagSpecification_list(TagSpecifications),
+            )
+            _setattr("UserData", UserData)
+            _setattr("WeightedCapacity", WeightedCapacity)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SpotFleetSpotFleetLaunchSpecification_list = create_object_list_converter(
+        SpotFleetSpotFleetLaunchSpecification
+    )
+    _convert_SpotFleetLaunchTemplateConfig_list = create_object_list_converter(
+        SpotFleetLaunchTemplateConfig
+    )
+    _convert_SpotFleetLoadBalancersConfig = create_object_converter(
+        SpotFleetLoadBalancersConfig
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPNConnection(Resource):
-    """A Vpn Connection for EC2.
+    class SpotFleetSpotFleetRequestConfigData(_PropertyType):
+        """The Spot Fleet Request Config Data property type for SpotFleet in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SpotFleetRequestConfigData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-spotfleet-spotfleetrequestconfigdata.html>`_
+        """
+
+        __slots__ = (
+            "AllocationStrategy",
+            "ExcessCapacityTerminationPolicy",
+            "IamFleetRole",
+            "InstanceInterruptionBehavior",
+            "LaunchSpecifications",
+            "LaunchTemplateConfigs",
+            "LoadBalancersConfig",
+            "ReplaceUnhealthyInstances",
+            "SpotPrice",
+            "TargetCapacity",
+            "TerminateInstancesWithExpiration",
+            "Type",
+            "ValidFrom",
+            "ValidUntil",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetSpotFleetRequestConfigData",
+            _PropertyType,
+            __slots__,
+            converters={
+                "LaunchSpecifications": _convert_SpotFleetSpotFleetLaunchSpecification_list,
+                "LaunchTemplateConfigs": _convert_SpotFleetLaunchTemplateConfig_list,
+                "LoadBalancersConfig": _convert_SpotFleetLoadBalancersConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllocationStrategy=None,
+            ExcessCapacityTerminationPolicy=None,
+            IamFleetRole=None,
+            InstanceInterruptionBehavior=None,
+            LaunchSpecifications=None,
+            LaunchTemplateConfigs=None,
+            LoadBalancersConfig=None,
+            ReplaceUnhealthyInstances=None,
+            SpotPrice=None,
+            TargetCapacity=None,
+            TerminateInstancesWithExpiration=None,
+            Type=None,
+            ValidFrom=None,
+            ValidUntil=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocationStrategy", AllocationStrategy)
+            _setattr("ExcessCapacityTerminationPolicy", ExcessCapacityTerminationPolicy)
+            _setattr("IamFleetRole", IamFleetRole)
+            _setattr("InstanceInterruptionBehavior", InstanceInterruptionBehavior)
+            _setattr(
+                "LaunchSpecifications",
+                _convert_SpotFleetSpotFleetLaunchSpecification_list(
+                    LaunchSpecifications
+                ),
+            )
+            _setattr(
+                "LaunchTemplateConfigs",
+                _convert_SpotFleetLaunchTemplateConfig_list(LaunchTemplateConfigs),
+            )
+            _setattr(
+                "LoadBalancersConfig",
+                _convert_SpotFleetLoadBalancersConfig(LoadBalancersConfig),
+            )
+            _setattr("ReplaceUnhealthyInstances", ReplaceUnhealthyInstances)
+            _setattr("SpotPrice", SpotPrice)
+            _setattr("TargetCapacity", TargetCapacity)
+            _setattr(
+                "TerminateInstancesWithExpiration", TerminateInstancesWithExpiration
+            )
+            _setattr("Type", Type)
+            _setattr("ValidFrom", ValidFrom)
+            _setattr("ValidUntil", ValidUntil)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SpotFleetSpotFleetRequestConfigData = create_object_converter(
+        SpotFleetSpotFleetRequestConfigData
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for VPNConnection
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpn-connection.html>`_
-    """
+    class SpotFleetProperties(_ResourceProperties):
+        __slots__ = ("SpotFleetRequestConfigData",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "SpotFleetRequestConfigData": _convert_SpotFleetSpotFleetRequestConfigData
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SpotFleetRequestConfigData=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "SpotFleetRequestConfigData",
+                _convert_SpotFleetSpotFleetRequestConfigData(
+                    SpotFleetRequestConfigData
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SpotFleetProperties = create_object_converter(SpotFleetProperties)
+
+    class SpotFleet(_Resource):
+        """A Spot Fleet for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SpotFleet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-spotfleet.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::SpotFleet"
+
+        Properties: SpotFleetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SpotFleet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SpotFleetProperties},
+            factories={"Properties": SpotFleetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SpotFleetProperties()
+            _setattr("Properties", _convert_SpotFleetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        SpotFleet,
+        SpotFleetProperties,
+        SpotFleetEbsBlockDevice,
+        SpotFleetBlockDeviceMapping,
+        SpotFleetClassicLoadBalancer,
+        SpotFleetClassicLoadBalancersConfig,
+        SpotFleetFleetLaunchTemplateSpecification,
+        SpotFleetGroupIdentifier,
+        SpotFleetIamInstanceProfileSpecification,
+        SpotFleetInstanceIpv6Address,
+        SpotFleetPrivateIpAddressSpecification,
+        SpotFleetInstanceNetworkInterfaceSpecification,
+        SpotFleetLaunchTemplateOverrides,
+        SpotFleetLaunchTemplateConfig,
+        SpotFleetTargetGroup,
+        SpotFleetTargetGroupsConfig,
+        SpotFleetLoadBalancersConfig,
+        SpotFleetSpotFleetMonitoring,
+        SpotFleetSpotPlacement,
+        SpotFleetSpotFleetTagSpecification,
+        SpotFleetSpotFleetLaunchSpecification,
+        SpotFleetSpotFleetRequestConfigData,
+    )
 
-    RESOURCE_TYPE = "AWS::EC2::VPNConnection"
 
-    Properties: VPNConnectionProperties = attrib(
-        factory=VPNConnectionProperties,
-        converter=create_object_converter(VPNConnectionProperties),
+def _create_Subnet():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class SubnetProperties(_ResourceProperties):
+        __slots__ = (
+            "AssignIpv6AddressOnCreation",
+            "AvailabilityZone",
+            "CidrBlock",
+            "Ipv6CidrBlock",
+            "MapPublicIpOnLaunch",
+            "Tags",
+            "VpcId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssignIpv6AddressOnCreation=None,
+            AvailabilityZone=None,
+            CidrBlock=None,
+            Ipv6CidrBlock=None,
+            MapPublicIpOnLaunch=None,
+            Tags=None,
+            VpcId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssignIpv6AddressOnCreation", AssignIpv6AddressOnCreation)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("CidrBlock", CidrBlock)
+            _setattr("Ipv6CidrBlock", Ipv6CidrBlock)
+            _setattr("MapPublicIpOnLaunch", MapPublicIpOnLaunch)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubnetProperties = create_object_converter(SubnetProperties)
+
+    class Subnet(_Resource):
+        """A Subnet for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Subnet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-subnet.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::Subnet"
+
+        Properties: SubnetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Subnet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubnetProperties},
+            factories={"Properties": SubnetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubnetProperties()
+            _setattr("Properties", _convert_SubnetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Subnet, SubnetProperties
+
+
+def _create_SubnetCidrBlock():
+    class SubnetCidrBlockProperties(_ResourceProperties):
+        __slots__ = ("Ipv6CidrBlock", "SubnetId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetCidrBlockProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Ipv6CidrBlock=None, SubnetId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ipv6CidrBlock", Ipv6CidrBlock)
+            _setattr("SubnetId", SubnetId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubnetCidrBlockProperties = create_object_converter(
+        SubnetCidrBlockProperties
     )
 
+    class SubnetCidrBlock(_Resource):
+        """A Subnet Cidr Block for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubnetCidrBlock
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-subnetcidrblock.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::SubnetCidrBlock"
+
+        Properties: SubnetCidrBlockProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetCidrBlock",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubnetCidrBlockProperties},
+            factories={"Properties": SubnetCidrBlockProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubnetCidrBlockProperties()
+            _setattr("Properties", _convert_SubnetCidrBlockProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SubnetCidrBlock, SubnetCidrBlockProperties
+
+
+def _create_SubnetNetworkAclAssociation():
+    class SubnetNetworkAclAssociationProperties(_ResourceProperties):
+        __slots__ = ("NetworkAclId", "SubnetId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetNetworkAclAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, NetworkAclId=None, SubnetId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NetworkAclId", NetworkAclId)
+            _setattr("SubnetId", SubnetId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubnetNetworkAclAssociationProperties = create_object_converter(
+        SubnetNetworkAclAssociationProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPNConnectionRouteProperties(ResourceProperties):
-    DestinationCidrBlock = attrib(default=None)
-    VpnConnectionId = attrib(default=None)
-
+    class SubnetNetworkAclAssociation(_Resource):
+        """A Subnet Network Acl Association for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubnetNetworkAclAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-subnet-network-acl-assoc.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::SubnetNetworkAclAssociation"
+
+        Properties: SubnetNetworkAclAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetNetworkAclAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubnetNetworkAclAssociationProperties},
+            factories={"Properties": SubnetNetworkAclAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubnetNetworkAclAssociationProperties()
+            _setattr(
+                "Properties", _convert_SubnetNetworkAclAssociationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return SubnetNetworkAclAssociation, SubnetNetworkAclAssociationProperties
+
+
+def _create_SubnetRouteTableAssociation():
+    class SubnetRouteTableAssociationProperties(_ResourceProperties):
+        __slots__ = ("RouteTableId", "SubnetId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetRouteTableAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RouteTableId=None, SubnetId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RouteTableId", RouteTableId)
+            _setattr("SubnetId", SubnetId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubnetRouteTableAssociationProperties = create_object_converter(
+        SubnetRouteTableAssociationProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPNConnectionRoute(Resource):
-    """A Vpn Connection Route for EC2.
+    class SubnetRouteTableAssociation(_Resource):
+        """A Subnet Route Table Association for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubnetRouteTableAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-subnet-route-table-assoc.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::SubnetRouteTableAssociation"
+
+        Properties: SubnetRouteTableAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetRouteTableAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubnetRouteTableAssociationProperties},
+            factories={"Properties": SubnetRouteTableAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubnetRouteTableAssociationProperties()
+            _setattr(
+                "Properties", _convert_SubnetRouteTableAssociationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return SubnetRouteTableAssociation, SubnetRouteTableAssociationProperties
+
+
+def _create_TrafficMirrorFilter():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class TrafficMirrorFilterProperties(_ResourceProperties):
+        __slots__ = ("Description", "NetworkServices", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrafficMirrorFilterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Description=None, NetworkServices=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("NetworkServices", NetworkServices)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TrafficMirrorFilterProperties = create_object_converter(
+        TrafficMirrorFilterProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for VPNConnectionRoute
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpn-connection-route.html>`_
-    """
+    class TrafficMirrorFilter(_Resource):
+        """A Traffic Mirror Filter for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TrafficMirrorFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-trafficmirrorfilter.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TrafficMirrorFilter"
+
+        Properties: TrafficMirrorFilterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrafficMirrorFilter",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TrafficMirrorFilterProperties},
+            factories={"Properties": TrafficMirrorFilterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TrafficMirrorFilterProperties()
+            _setattr("Properties", _convert_TrafficMirrorFilterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return TrafficMirrorFilter, TrafficMirrorFilterProperties
+
+
+def _create_TrafficMirrorFilterRule():
+    class TrafficMirrorFilterRuleTrafficMirrorPortRange(_PropertyType):
+        """The Traffic Mirror Port Range property type for TrafficMirrorFilterRule in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TrafficMirrorPortRange
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-trafficmirrorfilterrule-trafficmirrorportrange.html>`_
+        """
+
+        __slots__ = ("FromPort", "ToPort")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrafficMirrorFilterRuleTrafficMirrorPortRange", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FromPort=None, ToPort=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FromPort", FromPort)
+            _setattr("ToPort", ToPort)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TrafficMirrorFilterRuleTrafficMirrorPortRange = create_object_converter(
+        TrafficMirrorFilterRuleTrafficMirrorPortRange
+    )
 
-    RESOURCE_TYPE = "AWS::EC2::VPNConnectionRoute"
+    class TrafficMirrorFilterRuleProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "DestinationCidrBlock",
+            "DestinationPortRange",
+            "Protocol",
+            "RuleAction",
+            "RuleNumber",
+            "SourceCidrBlock",
+            "SourcePortRange",
+            "TrafficDirection",
+            "TrafficMirrorFilterId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrafficMirrorFilterRuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DestinationPortRange": _convert_TrafficMirrorFilterRuleTrafficMirrorPortRange,
+                "SourcePortRange": _convert_TrafficMirrorFilterRuleTrafficMirrorPortRange,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            DestinationCidrBlock=None,
+            DestinationPortRange=None,
+            Protocol=None,
+            RuleAction=None,
+            RuleNumber=None,
+            SourceCidrBlock=None,
+            SourcePortRange=None,
+            TrafficDirection=None,
+            TrafficMirrorFilterId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("DestinationCidrBlock", DestinationCidrBlock)
+            _setattr(
+                "DestinationPortRange",
+                _convert_TrafficMirrorFilterRuleTrafficMirrorPortRange(
+                    DestinationPortRange
+                ),
+            )
+            _setattr("Protocol", Protocol)
+            _setattr("RuleAction", RuleAction)
+            _setattr("RuleNumber", RuleNumber)
+            _setattr("SourceCidrBlock", SourceCidrBlock)
+            _setattr(
+                "SourcePortRange",
+                _convert_TrafficMirrorFilterRuleTrafficMirrorPortRange(SourcePortRange),
+            )
+            _setattr("TrafficDirection", TrafficDirection)
+            _setattr("TrafficMirrorFilterId", TrafficMirrorFilterId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TrafficMirrorFilterRuleProperties = create_object_converter(
+        TrafficMirrorFilterRuleProperties
+    )
 
-    Properties: VPNConnectionRouteProperties = attrib(
-        factory=VPNConnectionRouteProperties,
-        converter=create_object_converter(VPNConnectionRouteProperties),
+    class TrafficMirrorFilterRule(_Resource):
+        """A Traffic Mirror Filter Rule for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TrafficMirrorFilterRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-trafficmirrorfilterrule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TrafficMirrorFilterRule"
+
+        Properties: TrafficMirrorFilterRuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrafficMirrorFilterRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TrafficMirrorFilterRuleProperties},
+            factories={"Properties": TrafficMirrorFilterRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TrafficMirrorFilterRuleProperties()
+            _setattr(
+                "Properties", _convert_TrafficMirrorFilterRuleProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        TrafficMirrorFilterRule,
+        TrafficMirrorFilterRuleProperties,
+        TrafficMirrorFilterRuleTrafficMirrorPortRange,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class VPNGatewayProperties(ResourceProperties):
-    AmazonSideAsn = attrib(default=None)
-    Tags = attrib(default=None)
-    Type = attrib(default=None)
+def _create_TrafficMirrorSession():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class TrafficMirrorSessionProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "NetworkInterfaceId",
+            "PacketLength",
+            "SessionNumber",
+            "Tags",
+            "TrafficMirrorFilterId",
+            "TrafficMirrorTargetId",
+            "VirtualNetworkId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrafficMirrorSessionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            NetworkInterfaceId=None,
+            PacketLength=None,
+            SessionNumber=None,
+            Tags=None,
+            TrafficMirrorFilterId=None,
+            TrafficMirrorTargetId=None,
+            VirtualNetworkId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("NetworkInterfaceId", NetworkInterfaceId)
+            _setattr("PacketLength", PacketLength)
+            _setattr("SessionNumber", SessionNumber)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TrafficMirrorFilterId", TrafficMirrorFilterId)
+            _setattr("TrafficMirrorTargetId", TrafficMirrorTargetId)
+            _setattr("VirtualNetworkId", VirtualNetworkId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TrafficMirrorSessionProperties = create_object_converter(
+        TrafficMirrorSessionProperties
+    )
 
+    class TrafficMirrorSession(_Resource):
+        """A Traffic Mirror Session for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TrafficMirrorSession
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-trafficmirrorsession.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TrafficMirrorSession"
+
+        Properties: TrafficMirrorSessionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrafficMirrorSession",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TrafficMirrorSessionProperties},
+            factories={"Properties": TrafficMirrorSessionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TrafficMirrorSessionProperties()
+            _setattr("Properties", _convert_TrafficMirrorSessionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return TrafficMirrorSession, TrafficMirrorSessionProperties
+
+
+def _create_TrafficMirrorTarget():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class TrafficMirrorTargetProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "NetworkInterfaceId",
+            "NetworkLoadBalancerArn",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrafficMirrorTargetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            NetworkInterfaceId=None,
+            NetworkLoadBalancerArn=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("NetworkInterfaceId", NetworkInterfaceId)
+            _setattr("NetworkLoadBalancerArn", NetworkLoadBalancerArn)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TrafficMirrorTargetProperties = create_object_converter(
+        TrafficMirrorTargetProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPNGateway(Resource):
-    """A Vpn Gateway for EC2.
+    class TrafficMirrorTarget(_Resource):
+        """A Traffic Mirror Target for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TrafficMirrorTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-trafficmirrortarget.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TrafficMirrorTarget"
+
+        Properties: TrafficMirrorTargetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TrafficMirrorTarget",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TrafficMirrorTargetProperties},
+            factories={"Properties": TrafficMirrorTargetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TrafficMirrorTargetProperties()
+            _setattr("Properties", _convert_TrafficMirrorTargetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return TrafficMirrorTarget, TrafficMirrorTargetProperties
+
+
+def _create_TransitGateway():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class TransitGatewayProperties(_ResourceProperties):
+        __slots__ = (
+            "AmazonSideAsn",
+            "AutoAcceptSharedAttachments",
+            "DefaultRouteTableAssociation",
+            "DefaultRouteTablePropagation",
+            "Description",
+            "DnsSupport",
+            "Tags",
+            "VpnEcmpSupport",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AmazonSideAsn=None,
+            AutoAcceptSharedAttachments=None,
+            DefaultRouteTableAssociation=None,
+            DefaultRouteTablePropagation=None,
+            Description=None,
+            DnsSupport=None,
+            Tags=None,
+            VpnEcmpSupport=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AmazonSideAsn", AmazonSideAsn)
+            _setattr("AutoAcceptSharedAttachments", AutoAcceptSharedAttachments)
+            _setattr("DefaultRouteTableAssociation", DefaultRouteTableAssociation)
+            _setattr("DefaultRouteTablePropagation", DefaultRouteTablePropagation)
+            _setattr("Description", Description)
+            _setattr("DnsSupport", DnsSupport)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpnEcmpSupport", VpnEcmpSupport)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TransitGatewayProperties = create_object_converter(
+        TransitGatewayProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for VPNGateway
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpn-gateway.html>`_
-    """
+    class TransitGateway(_Resource):
+        """A Transit Gateway for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TransitGateway
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgateway.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TransitGateway"
+
+        Properties: TransitGatewayProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGateway",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TransitGatewayProperties},
+            factories={"Properties": TransitGatewayProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TransitGatewayProperties()
+            _setattr("Properties", _convert_TransitGatewayProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return TransitGateway, TransitGatewayProperties
+
+
+def _create_TransitGatewayAttachment():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class TransitGatewayAttachmentProperties(_ResourceProperties):
+        __slots__ = ("SubnetIds", "Tags", "TransitGatewayId", "VpcId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayAttachmentProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            SubnetIds=None,
+            Tags=None,
+            TransitGatewayId=None,
+            VpcId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TransitGatewayId", TransitGatewayId)
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TransitGatewayAttachmentProperties = create_object_converter(
+        TransitGatewayAttachmentProperties
+    )
 
-    RESOURCE_TYPE = "AWS::EC2::VPNGateway"
+    class TransitGatewayAttachment(_Resource):
+        """A Transit Gateway Attachment for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TransitGatewayAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TransitGatewayAttachment"
+
+        Properties: TransitGatewayAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TransitGatewayAttachmentProperties},
+            factories={"Properties": TransitGatewayAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TransitGatewayAttachmentProperties()
+            _setattr(
+                "Properties", _convert_TransitGatewayAttachmentProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return TransitGatewayAttachment, TransitGatewayAttachmentProperties
+
+
+def _create_TransitGatewayRoute():
+    class TransitGatewayRouteProperties(_ResourceProperties):
+        __slots__ = (
+            "Blackhole",
+            "DestinationCidrBlock",
+            "TransitGatewayAttachmentId",
+            "TransitGatewayRouteTableId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayRouteProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Blackhole=None,
+            DestinationCidrBlock=None,
+            TransitGatewayAttachmentId=None,
+            TransitGatewayRouteTableId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Blackhole", Blackhole)
+            _setattr("DestinationCidrBlock", DestinationCidrBlock)
+            _setattr("TransitGatewayAttachmentId", TransitGatewayAttachmentId)
+            _setattr("TransitGatewayRouteTableId", TransitGatewayRouteTableId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TransitGatewayRouteProperties = create_object_converter(
+        TransitGatewayRouteProperties
+    )
 
-    Properties: VPNGatewayProperties = attrib(
-        factory=VPNGatewayProperties,
-        converter=create_object_converter(VPNGatewayProperties),
+    class TransitGatewayRoute(_Resource):
+        """A Transit Gateway Route for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TransitGatewayRoute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayroute.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TransitGatewayRoute"
+
+        Properties: TransitGatewayRouteProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayRoute",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TransitGatewayRouteProperties},
+            factories={"Properties": TransitGatewayRouteProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TransitGatewayRouteProperties()
+            _setattr("Properties", _convert_TransitGatewayRouteProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return TransitGatewayRoute, TransitGatewayRouteProperties
+
+
+def _create_TransitGatewayRouteTable():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class TransitGatewayRouteTableProperties(_ResourceProperties):
+        __slots__ = ("Tags", "TransitGatewayId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayRouteTableProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Tags=None, TransitGatewayId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TransitGatewayId", TransitGatewayId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TransitGatewayRouteTableProperties = create_object_converter(
+        TransitGatewayRouteTableProperties
     )
 
+    class TransitGatewayRouteTable(_Resource):
+        """A Transit Gateway Route Table for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TransitGatewayRouteTable
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayroutetable.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TransitGatewayRouteTable"
+
+        Properties: TransitGatewayRouteTableProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayRouteTable",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TransitGatewayRouteTableProperties},
+            factories={"Properties": TransitGatewayRouteTableProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TransitGatewayRouteTableProperties()
+            _setattr(
+                "Properties", _convert_TransitGatewayRouteTableProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return TransitGatewayRouteTable, TransitGatewayRouteTableProperties
+
+
+def _create_TransitGatewayRouteTableAssociation():
+    class TransitGatewayRouteTableAssociationProperties(_ResourceProperties):
+        __slots__ = ("TransitGatewayAttachmentId", "TransitGatewayRouteTableId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayRouteTableAssociationProperties",
+            _ResourceProperties,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            TransitGatewayAttachmentId=None,
+            TransitGatewayRouteTableId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TransitGatewayAttachmentId", TransitGatewayAttachmentId)
+            _setattr("TransitGatewayRouteTableId", TransitGatewayRouteTableId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TransitGatewayRouteTableAssociationProperties = create_object_converter(
+        TransitGatewayRouteTableAssociationProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class VPNGatewayRoutePropagationProperties(ResourceProperties):
-    RouteTableIds = attrib(default=None)
-    VpnGatewayId = attrib(default=None)
+    class TransitGatewayRouteTableAssociation(_Resource):
+        """A Transit Gateway Route Table Association for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TransitGatewayRouteTableAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayroutetableassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TransitGatewayRouteTableAssociation"
+
+        Properties: TransitGatewayRouteTableAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayRouteTableAssociation",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_TransitGatewayRouteTableAssociationProperties
+            },
+            factories={"Properties": TransitGatewayRouteTableAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TransitGatewayRouteTableAssociationProperties()
+            _setattr(
+                "Properties",
+                _convert_TransitGatewayRouteTableAssociationProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        TransitGatewayRouteTableAssociation,
+        TransitGatewayRouteTableAssociationProperties,
+    )
 
 
-@attrs(**ATTRSCONFIG)
-class VPNGatewayRoutePropagation(Resource):
-    """A Vpn Gateway Route Propagation for EC2.
+def _create_TransitGatewayRouteTablePropagation():
+    class TransitGatewayRouteTablePropagationProperties(_ResourceProperties):
+        __slots__ = ("TransitGatewayAttachmentId", "TransitGatewayRouteTableId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayRouteTablePropagationProperties",
+            _ResourceProperties,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            TransitGatewayAttachmentId=None,
+            TransitGatewayRouteTableId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TransitGatewayAttachmentId", TransitGatewayAttachmentId)
+            _setattr("TransitGatewayRouteTableId", TransitGatewayRouteTableId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TransitGatewayRouteTablePropagationProperties = create_object_converter(
+        TransitGatewayRouteTablePropagationProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for VPNGatewayRoutePropagation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpn-gatewayrouteprop.html>`_
-    """
+    class TransitGatewayRouteTablePropagation(_Resource):
+        """A Transit Gateway Route Table Propagation for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TransitGatewayRouteTablePropagation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-transitgatewayroutetablepropagation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::TransitGatewayRouteTablePropagation"
+
+        Properties: TransitGatewayRouteTablePropagationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TransitGatewayRouteTablePropagation",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_TransitGatewayRouteTablePropagationProperties
+            },
+            factories={"Properties": TransitGatewayRouteTablePropagationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TransitGatewayRouteTablePropagationProperties()
+            _setattr(
+                "Properties",
+                _convert_TransitGatewayRouteTablePropagationProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        TransitGatewayRouteTablePropagation,
+        TransitGatewayRouteTablePropagationProperties,
+    )
 
-    RESOURCE_TYPE = "AWS::EC2::VPNGatewayRoutePropagation"
 
-    Properties: VPNGatewayRoutePropagationProperties = attrib(
-        factory=VPNGatewayRoutePropagationProperties,
-        converter=create_object_converter(VPNGatewayRoutePropagationProperties),
+def _create_VPC():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class VPCProperties(_ResourceProperties):
+        __slots__ = (
+            "CidrBlock",
+            "EnableDnsHostnames",
+            "EnableDnsSupport",
+            "InstanceTenancy",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CidrBlock=None,
+            EnableDnsHostnames=None,
+            EnableDnsSupport=None,
+            InstanceTenancy=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CidrBlock", CidrBlock)
+            _setattr("EnableDnsHostnames", EnableDnsHostnames)
+            _setattr("EnableDnsSupport", EnableDnsSupport)
+            _setattr("InstanceTenancy", InstanceTenancy)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPCProperties = create_object_converter(VPCProperties)
+
+    class VPC(_Resource):
+        """A Vpc for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPC
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpc.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPC"
+
+        Properties: VPCProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPC",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPCProperties},
+            factories={"Properties": VPCProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPCProperties()
+            _setattr("Properties", _convert_VPCProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VPC, VPCProperties
+
+
+def _create_VPCCidrBlock():
+    class VPCCidrBlockProperties(_ResourceProperties):
+        __slots__ = ("AmazonProvidedIpv6CidrBlock", "CidrBlock", "VpcId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCCidrBlockProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AmazonProvidedIpv6CidrBlock=None,
+            CidrBlock=None,
+            VpcId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AmazonProvidedIpv6CidrBlock", AmazonProvidedIpv6CidrBlock)
+            _setattr("CidrBlock", CidrBlock)
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPCCidrBlockProperties = create_object_converter(VPCCidrBlockProperties)
+
+    class VPCCidrBlock(_Resource):
+        """A Vpc Cidr Block for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPCCidrBlock
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpccidrblock.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPCCidrBlock"
+
+        Properties: VPCCidrBlockProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCCidrBlock",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPCCidrBlockProperties},
+            factories={"Properties": VPCCidrBlockProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPCCidrBlockProperties()
+            _setattr("Properties", _convert_VPCCidrBlockProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VPCCidrBlock, VPCCidrBlockProperties
+
+
+def _create_VPCDHCPOptionsAssociation():
+    class VPCDHCPOptionsAssociationProperties(_ResourceProperties):
+        __slots__ = ("DhcpOptionsId", "VpcId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCDHCPOptionsAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DhcpOptionsId=None, VpcId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DhcpOptionsId", DhcpOptionsId)
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPCDHCPOptionsAssociationProperties = create_object_converter(
+        VPCDHCPOptionsAssociationProperties
     )
 
+    class VPCDHCPOptionsAssociation(_Resource):
+        """A Vpcdhcp Options Association for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPCDHCPOptionsAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpc-dhcp-options-assoc.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPCDHCPOptionsAssociation"
+
+        Properties: VPCDHCPOptionsAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCDHCPOptionsAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPCDHCPOptionsAssociationProperties},
+            factories={"Properties": VPCDHCPOptionsAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPCDHCPOptionsAssociationProperties()
+            _setattr(
+                "Properties", _convert_VPCDHCPOptionsAssociationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return VPCDHCPOptionsAssociation, VPCDHCPOptionsAssociationProperties
+
+
+def _create_VPCEndpoint():
+    class VPCEndpointProperties(_ResourceProperties):
+        __slots__ = (
+            "PolicyDocument",
+            "PrivateDnsEnabled",
+            "RouteTableIds",
+            "SecurityGroupIds",
+            "ServiceName",
+            "SubnetIds",
+            "VpcEndpointType",
+            "VpcId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCEndpointProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            PolicyDocument=None,
+            PrivateDnsEnabled=None,
+            RouteTableIds=None,
+            SecurityGroupIds=None,
+            ServiceName=None,
+            SubnetIds=None,
+            VpcEndpointType=None,
+            VpcId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PolicyDocument", PolicyDocument)
+            _setattr("PrivateDnsEnabled", PrivateDnsEnabled)
+            _setattr("RouteTableIds", RouteTableIds)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("ServiceName", ServiceName)
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("VpcEndpointType", VpcEndpointType)
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPCEndpointProperties = create_object_converter(VPCEndpointProperties)
+
+    class VPCEndpoint(_Resource):
+        """A Vpc Endpoint for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPCEndpoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcendpoint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPCEndpoint"
+
+        Properties: VPCEndpointProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCEndpoint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPCEndpointProperties},
+            factories={"Properties": VPCEndpointProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPCEndpointProperties()
+            _setattr("Properties", _convert_VPCEndpointProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VPCEndpoint, VPCEndpointProperties
+
+
+def _create_VPCEndpointConnectionNotification():
+    class VPCEndpointConnectionNotificationProperties(_ResourceProperties):
+        __slots__ = (
+            "ConnectionEvents",
+            "ConnectionNotificationArn",
+            "ServiceId",
+            "VPCEndpointId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCEndpointConnectionNotificationProperties",
+            _ResourceProperties,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConnectionEvents=None,
+            ConnectionNotificationArn=None,
+            ServiceId=None,
+            VPCEndpointId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConnectionEvents", ConnectionEvents)
+            _setattr("ConnectionNotificationArn", ConnectionNotificationArn)
+            _setattr("ServiceId", ServiceId)
+            _setattr("VPCEndpointId", VPCEndpointId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPCEndpointConnectionNotificationProperties = create_object_converter(
+        VPCEndpointConnectionNotificationProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class VolumeProperties(ResourceProperties):
-    AutoEnableIO = attrib(default=None)
-    AvailabilityZone = attrib(default=None)
-    Encrypted = attrib(default=None)
-    Iops = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    Size = attrib(default=None)
-    SnapshotId = attrib(default=None)
-    Tags = attrib(default=None)
-    VolumeType = attrib(default=None)
-
+    class VPCEndpointConnectionNotification(_Resource):
+        """A Vpc Endpoint Connection Notification for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPCEndpointConnectionNotification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcendpointconnectionnotification.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPCEndpointConnectionNotification"
+
+        Properties: VPCEndpointConnectionNotificationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCEndpointConnectionNotification",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_VPCEndpointConnectionNotificationProperties
+            },
+            factories={"Properties": VPCEndpointConnectionNotificationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPCEndpointConnectionNotificationProperties()
+            _setattr(
+                "Properties",
+                _convert_VPCEndpointConnectionNotificationProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        VPCEndpointConnectionNotification,
+        VPCEndpointConnectionNotificationProperties,
+    )
 
-@attrs(**ATTRSCONFIG)
-class Volume(Resource):
-    """A Volume for EC2.
 
-    See Also:
-        `AWS Cloud Formation documentation for Volume
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ebs-volume.html>`_
-    """
+def _create_VPCEndpointService():
+    class VPCEndpointServiceProperties(_ResourceProperties):
+        __slots__ = ("AcceptanceRequired", "NetworkLoadBalancerArns")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCEndpointServiceProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AcceptanceRequired=None, NetworkLoadBalancerArns=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptanceRequired", AcceptanceRequired)
+            _setattr("NetworkLoadBalancerArns", NetworkLoadBalancerArns)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPCEndpointServiceProperties = create_object_converter(
+        VPCEndpointServiceProperties
+    )
 
-    RESOURCE_TYPE = "AWS::EC2::Volume"
+    class VPCEndpointService(_Resource):
+        """A Vpc Endpoint Service for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPCEndpointService
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcendpointservice.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPCEndpointService"
+
+        Properties: VPCEndpointServiceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCEndpointService",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPCEndpointServiceProperties},
+            factories={"Properties": VPCEndpointServiceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPCEndpointServiceProperties()
+            _setattr("Properties", _convert_VPCEndpointServiceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VPCEndpointService, VPCEndpointServiceProperties
+
+
+def _create_VPCEndpointServicePermissions():
+    class VPCEndpointServicePermissionsProperties(_ResourceProperties):
+        __slots__ = ("AllowedPrincipals", "ServiceId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCEndpointServicePermissionsProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AllowedPrincipals=None, ServiceId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowedPrincipals", AllowedPrincipals)
+            _setattr("ServiceId", ServiceId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPCEndpointServicePermissionsProperties = create_object_converter(
+        VPCEndpointServicePermissionsProperties
+    )
 
-    Properties: VolumeProperties = attrib(
-        factory=VolumeProperties, converter=create_object_converter(VolumeProperties)
+    class VPCEndpointServicePermissions(_Resource):
+        """A Vpc Endpoint Service Permissions for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPCEndpointServicePermissions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcendpointservicepermissions.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPCEndpointServicePermissions"
+
+        Properties: VPCEndpointServicePermissionsProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCEndpointServicePermissions",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPCEndpointServicePermissionsProperties},
+            factories={"Properties": VPCEndpointServicePermissionsProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPCEndpointServicePermissionsProperties()
+            _setattr(
+                "Properties",
+                _convert_VPCEndpointServicePermissionsProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return VPCEndpointServicePermissions, VPCEndpointServicePermissionsProperties
+
+
+def _create_VPCGatewayAttachment():
+    class VPCGatewayAttachmentProperties(_ResourceProperties):
+        __slots__ = ("InternetGatewayId", "VpcId", "VpnGatewayId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCGatewayAttachmentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InternetGatewayId=None, VpcId=None, VpnGatewayId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InternetGatewayId", InternetGatewayId)
+            _setattr("VpcId", VpcId)
+            _setattr("VpnGatewayId", VpnGatewayId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPCGatewayAttachmentProperties = create_object_converter(
+        VPCGatewayAttachmentProperties
     )
 
+    class VPCGatewayAttachment(_Resource):
+        """A Vpc Gateway Attachment for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPCGatewayAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpc-gateway-attachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPCGatewayAttachment"
+
+        Properties: VPCGatewayAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCGatewayAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPCGatewayAttachmentProperties},
+            factories={"Properties": VPCGatewayAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPCGatewayAttachmentProperties()
+            _setattr("Properties", _convert_VPCGatewayAttachmentProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VPCGatewayAttachment, VPCGatewayAttachmentProperties
+
+
+def _create_VPCPeeringConnection():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class VPCPeeringConnectionProperties(_ResourceProperties):
+        __slots__ = (
+            "PeerOwnerId",
+            "PeerRegion",
+            "PeerRoleArn",
+            "PeerVpcId",
+            "Tags",
+            "VpcId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCPeeringConnectionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            PeerOwnerId=None,
+            PeerRegion=None,
+            PeerRoleArn=None,
+            PeerVpcId=None,
+            Tags=None,
+            VpcId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PeerOwnerId", PeerOwnerId)
+            _setattr("PeerRegion", PeerRegion)
+            _setattr("PeerRoleArn", PeerRoleArn)
+            _setattr("PeerVpcId", PeerVpcId)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPCPeeringConnectionProperties = create_object_converter(
+        VPCPeeringConnectionProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class VolumeAttachmentProperties(ResourceProperties):
-    Device = attrib(default=None)
-    InstanceId = attrib(default=None)
-    VolumeId = attrib(default=None)
+    class VPCPeeringConnection(_Resource):
+        """A Vpc Peering Connection for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPCPeeringConnection
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpcpeeringconnection.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPCPeeringConnection"
+
+        Properties: VPCPeeringConnectionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPCPeeringConnection",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPCPeeringConnectionProperties},
+            factories={"Properties": VPCPeeringConnectionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPCPeeringConnectionProperties()
+            _setattr("Properties", _convert_VPCPeeringConnectionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VPCPeeringConnection, VPCPeeringConnectionProperties
+
+
+def _create_VPNConnection():
+    class VPNConnectionVpnTunnelOptionsSpecification(_PropertyType):
+        """The Vpn Tunnel Options Specification property type for VPNConnection in EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VpnTunnelOptionsSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-vpnconnection-vpntunneloptionsspecification.html>`_
+        """
+
+        __slots__ = ("PreSharedKey", "TunnelInsideCidr")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPNConnectionVpnTunnelOptionsSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, PreSharedKey=None, TunnelInsideCidr=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PreSharedKey", PreSharedKey)
+            _setattr("TunnelInsideCidr", TunnelInsideCidr)
+            _init_PropertyType(self, kwargs)
+
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_VPNConnectionVpnTunnelOptionsSpecification_list = (
+        create_object_list_converter(VPNConnectionVpnTunnelOptionsSpecification)
+    )
 
+    class VPNConnectionProperties(_ResourceProperties):
+        __slots__ = (
+            "CustomerGatewayId",
+            "StaticRoutesOnly",
+            "Tags",
+            "TransitGatewayId",
+            "Type",
+            "VpnGatewayId",
+            "VpnTunnelOptionsSpecifications",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPNConnectionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Tags": _convert_Tag_list,
+                "VpnTunnelOptionsSpecifications": _convert_VPNConnectionVpnTunnelOptionsSpecification_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CustomerGatewayId=None,
+            StaticRoutesOnly=None,
+            Tags=None,
+            TransitGatewayId=None,
+            Type=None,
+            VpnGatewayId=None,
+            VpnTunnelOptionsSpecifications=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CustomerGatewayId", CustomerGatewayId)
+            _setattr("StaticRoutesOnly", StaticRoutesOnly)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TransitGatewayId", TransitGatewayId)
+            _setattr("Type", Type)
+            _setattr("VpnGatewayId", VpnGatewayId)
+            _setattr(
+                "VpnTunnelOptionsSpecifications",
+                _convert_VPNConnectionVpnTunnelOptionsSpecification_list(
+                    VpnTunnelOptionsSpecifications
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPNConnectionProperties = create_object_converter(VPNConnectionProperties)
+
+    class VPNConnection(_Resource):
+        """A Vpn Connection for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPNConnection
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpn-connection.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPNConnection"
+
+        Properties: VPNConnectionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPNConnection",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPNConnectionProperties},
+            factories={"Properties": VPNConnectionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPNConnectionProperties()
+            _setattr("Properties", _convert_VPNConnectionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        VPNConnection,
+        VPNConnectionProperties,
+        VPNConnectionVpnTunnelOptionsSpecification,
+    )
 
-@attrs(**ATTRSCONFIG)
-class VolumeAttachment(Resource):
-    """A Volume Attachment for EC2.
 
-    See Also:
-        `AWS Cloud Formation documentation for VolumeAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ebs-volumeattachment.html>`_
-    """
+def _create_VPNConnectionRoute():
+    class VPNConnectionRouteProperties(_ResourceProperties):
+        __slots__ = ("DestinationCidrBlock", "VpnConnectionId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPNConnectionRouteProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DestinationCidrBlock=None, VpnConnectionId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationCidrBlock", DestinationCidrBlock)
+            _setattr("VpnConnectionId", VpnConnectionId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPNConnectionRouteProperties = create_object_converter(
+        VPNConnectionRouteProperties
+    )
 
-    RESOURCE_TYPE = "AWS::EC2::VolumeAttachment"
+    class VPNConnectionRoute(_Resource):
+        """A Vpn Connection Route for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPNConnectionRoute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpn-connection-route.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPNConnectionRoute"
+
+        Properties: VPNConnectionRouteProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPNConnectionRoute",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPNConnectionRouteProperties},
+            factories={"Properties": VPNConnectionRouteProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPNConnectionRouteProperties()
+            _setattr("Properties", _convert_VPNConnectionRouteProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VPNConnectionRoute, VPNConnectionRouteProperties
+
+
+def _create_VPNGateway():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class VPNGatewayProperties(_ResourceProperties):
+        __slots__ = ("AmazonSideAsn", "Tags", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPNGatewayProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AmazonSideAsn=None, Tags=None, Type=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AmazonSideAsn", AmazonSideAsn)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPNGatewayProperties = create_object_converter(VPNGatewayProperties)
+
+    class VPNGateway(_Resource):
+        """A Vpn Gateway for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPNGateway
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpn-gateway.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPNGateway"
+
+        Properties: VPNGatewayProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPNGateway",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPNGatewayProperties},
+            factories={"Properties": VPNGatewayProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPNGatewayProperties()
+            _setattr("Properties", _convert_VPNGatewayProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VPNGateway, VPNGatewayProperties
+
+
+def _create_VPNGatewayRoutePropagation():
+    class VPNGatewayRoutePropagationProperties(_ResourceProperties):
+        __slots__ = ("RouteTableIds", "VpnGatewayId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPNGatewayRoutePropagationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RouteTableIds=None, VpnGatewayId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RouteTableIds", RouteTableIds)
+            _setattr("VpnGatewayId", VpnGatewayId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VPNGatewayRoutePropagationProperties = create_object_converter(
+        VPNGatewayRoutePropagationProperties
+    )
 
-    Properties: VolumeAttachmentProperties = attrib(
-        factory=VolumeAttachmentProperties,
-        converter=create_object_converter(VolumeAttachmentProperties),
+    class VPNGatewayRoutePropagation(_Resource):
+        """A Vpn Gateway Route Propagation for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPNGatewayRoutePropagation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ec2-vpn-gatewayrouteprop.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VPNGatewayRoutePropagation"
+
+        Properties: VPNGatewayRoutePropagationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VPNGatewayRoutePropagation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VPNGatewayRoutePropagationProperties},
+            factories={"Properties": VPNGatewayRoutePropagationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VPNGatewayRoutePropagationProperties()
+            _setattr(
+                "Properties", _convert_VPNGatewayRoutePropagationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return VPNGatewayRoutePropagation, VPNGatewayRoutePropagationProperties
+
+
+def _create_Volume():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class VolumeProperties(_ResourceProperties):
+        __slots__ = (
+            "AutoEnableIO",
+            "AvailabilityZone",
+            "Encrypted",
+            "Iops",
+            "KmsKeyId",
+            "Size",
+            "SnapshotId",
+            "Tags",
+            "VolumeType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VolumeProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoEnableIO=None,
+            AvailabilityZone=None,
+            Encrypted=None,
+            Iops=None,
+            KmsKeyId=None,
+            Size=None,
+            SnapshotId=None,
+            Tags=None,
+            VolumeType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoEnableIO", AutoEnableIO)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("Encrypted", Encrypted)
+            _setattr("Iops", Iops)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("Size", Size)
+            _setattr("SnapshotId", SnapshotId)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VolumeType", VolumeType)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VolumeProperties = create_object_converter(VolumeProperties)
+
+    class Volume(_Resource):
+        """A Volume for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Volume
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ebs-volume.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::Volume"
+
+        Properties: VolumeProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Volume",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VolumeProperties},
+            factories={"Properties": VolumeProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VolumeProperties()
+            _setattr("Properties", _convert_VolumeProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Volume, VolumeProperties
+
+
+def _create_VolumeAttachment():
+    class VolumeAttachmentProperties(_ResourceProperties):
+        __slots__ = ("Device", "InstanceId", "VolumeId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VolumeAttachmentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Device=None, InstanceId=None, VolumeId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Device", Device)
+            _setattr("InstanceId", InstanceId)
+            _setattr("VolumeId", VolumeId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VolumeAttachmentProperties = create_object_converter(
+        VolumeAttachmentProperties
     )
+
+    class VolumeAttachment(_Resource):
+        """A Volume Attachment for EC2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VolumeAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-ebs-volumeattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EC2::VolumeAttachment"
+
+        Properties: VolumeAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VolumeAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VolumeAttachmentProperties},
+            factories={"Properties": VolumeAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VolumeAttachmentProperties()
+            _setattr("Properties", _convert_VolumeAttachmentProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VolumeAttachment, VolumeAttachmentProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "CapacityReservation": _create_CapacityReservation,
+        "CapacityReservationProperties": _create_CapacityReservation,
+        "CapacityReservationTagSpecification": _create_CapacityReservation,
+        "ClientVpnAuthorizationRule": _create_ClientVpnAuthorizationRule,
+        "ClientVpnAuthorizationRuleProperties": _create_ClientVpnAuthorizationRule,
+        "ClientVpnEndpoint": _create_ClientVpnEndpoint,
+        "ClientVpnEndpointProperties": _create_ClientVpnEndpoint,
+        "ClientVpnEndpointCertificateAuthenticationRequest": _create_ClientVpnEndpoint,
+        "ClientVpnEndpointClientAuthenticationRequest": _create_ClientVpnEndpoint,
+        "ClientVpnEndpointConnectionLogOptions": _create_ClientVpnEndpoint,
+        "ClientVpnEndpointDirectoryServiceAuthenticationRequest": _create_ClientVpnEndpoint,
+        "ClientVpnEndpointTagSpecification": _create_ClientVpnEndpoint,
+        "ClientVpnRoute": _create_ClientVpnRoute,
+        "ClientVpnRouteProperties": _create_ClientVpnRoute,
+        "ClientVpnTargetNetworkAssociation": _create_ClientVpnTargetNetworkAssociation,
+        "ClientVpnTargetNetworkAssociationProperties": _create_ClientVpnTargetNetworkAssociation,
+        "CustomerGateway": _create_CustomerGateway,
+        "CustomerGatewayProperties": _create_CustomerGateway,
+        "DHCPOptions": _create_DHCPOptions,
+        "DHCPOptionsProperties": _create_DHCPOptions,
+        "EC2Fleet": _create_EC2Fleet,
+        "EC2FleetProperties": _create_EC2Fleet,
+        "EC2FleetFleetLaunchTemplateConfigRequest": _create_EC2Fleet,
+        "EC2FleetFleetLaunchTemplateOverridesRequest": _create_EC2Fleet,
+        "EC2FleetFleetLaunchTemplateSpecificationRequest": _create_EC2Fleet,
+        "EC2FleetOnDemandOptionsRequest": _create_EC2Fleet,
+        "EC2FleetSpotOptionsRequest": _create_EC2Fleet,
+        "EC2FleetTagRequest": _create_EC2Fleet,
+        "EC2FleetTagSpecification": _create_EC2Fleet,
+        "EC2FleetTargetCapacitySpecificationRequest": _create_EC2Fleet,
+        "EIP": _create_EIP,
+        "EIPProperties": _create_EIP,
+        "EIPAssociation": _create_EIPAssociation,
+        "EIPAssociationProperties": _create_EIPAssociation,
+        "EgressOnlyInternetGateway": _create_EgressOnlyInternetGateway,
+        "EgressOnlyInternetGatewayProperties": _create_EgressOnlyInternetGateway,
+        "FlowLog": _create_FlowLog,
+        "FlowLogProperties": _create_FlowLog,
+        "GatewayRouteTableAssociation": _create_GatewayRouteTableAssociation,
+        "GatewayRouteTableAssociationProperties": _create_GatewayRouteTableAssociation,
+        "Host": _create_Host,
+        "HostProperties": _create_Host,
+        "Instance": _create_Instance,
+        "InstanceProperties": _create_Instance,
+        "InstanceAssociationParameter": _create_Instance,
+        "InstanceBlockDeviceMapping": _create_Instance,
+        "InstanceCpuOptions": _create_Instance,
+        "InstanceCreditSpecification": _create_Instance,
+        "InstanceEbs": _create_Instance,
+        "InstanceElasticGpuSpecification": _create_Instance,
+        "InstanceElasticInferenceAccelerator": _create_Instance,
+        "InstanceInstanceIpv6Address": _create_Instance,
+        "InstanceLaunchTemplateSpecification": _create_Instance,
+        "InstanceLicenseSpecification": _create_Instance,
+        "InstanceNetworkInterface": _create_Instance,
+        "InstanceNoDevice": _create_Instance,
+        "InstancePrivateIpAddressSpecification": _create_Instance,
+        "InstanceSsmAssociation": _create_Instance,
+        "InstanceVolume": _create_Instance,
+        "InternetGateway": _create_InternetGateway,
+        "InternetGatewayProperties": _create_InternetGateway,
+        "LaunchTemplate": _create_LaunchTemplate,
+        "LaunchTemplateProperties": _create_LaunchTemplate,
+        "LaunchTemplateBlockDeviceMapping": _create_LaunchTemplate,
+        "LaunchTemplateCapacityReservationSpecification": _create_LaunchTemplate,
+        "LaunchTemplateCapacityReservationTarget": _create_LaunchTemplate,
+        "LaunchTemplateCpuOptions": _create_LaunchTemplate,
+        "LaunchTemplateCreditSpecification": _create_LaunchTemplate,
+        "LaunchTemplateEbs": _create_LaunchTemplate,
+        "LaunchTemplateElasticGpuSpecification": _create_LaunchTemplate,
+        "LaunchTemplateHibernationOptions": _create_LaunchTemplate,
+        "LaunchTemplateIamInstanceProfile": _create_LaunchTemplate,
+        "LaunchTemplateInstanceMarketOptions": _create_LaunchTemplate,
+        "LaunchTemplateIpv6Add": _create_LaunchTemplate,
+        "LaunchTemplateLaunchTemplateData": _create_LaunchTemplate,
+        "LaunchTemplateLaunchTemplateElasticInferenceAccelerator": _create_LaunchTemplate,
+        "LaunchTemplateLicenseSpecification": _create_LaunchTemplate,
+        "LaunchTemplateMonitoring": _create_LaunchTemplate,
+        "LaunchTemplateNetworkInterface": _create_LaunchTemplate,
+        "LaunchTemplatePlacement": _create_LaunchTemplate,
+        "LaunchTemplatePrivateIpAdd": _create_LaunchTemplate,
+        "LaunchTemplateSpotOptions": _create_LaunchTemplate,
+        "LaunchTemplateTagSpecification": _create_LaunchTemplate,
+        "NatGateway": _create_NatGateway,
+        "NatGatewayProperties": _create_NatGateway,
+        "NetworkAcl": _create_NetworkAcl,
+        "NetworkAclProperties": _create_NetworkAcl,
+        "NetworkAclEntry": _create_NetworkAclEntry,
+        "NetworkAclEntryProperties": _create_NetworkAclEntry,
+        "NetworkAclEntryIcmp": _create_NetworkAclEntry,
+        "NetworkAclEntryPortRange": _create_NetworkAclEntry,
+        "NetworkInterface": _create_NetworkInterface,
+        "NetworkInterfaceProperties": _create_NetworkInterface,
+        "NetworkInterfaceInstanceIpv6Address": _create_NetworkInterface,
+        "NetworkInterfacePrivateIpAddressSpecification": _create_NetworkInterface,
+        "NetworkInterfaceAttachment": _create_NetworkInterfaceAttachment,
+        "NetworkInterfaceAttachmentProperties": _create_NetworkInterfaceAttachment,
+        "NetworkInterfacePermission": _create_NetworkInterfacePermission,
+        "NetworkInterfacePermissionProperties": _create_NetworkInterfacePermission,
+        "PlacementGroup": _create_PlacementGroup,
+        "PlacementGroupProperties": _create_PlacementGroup,
+        "Route": _create_Route,
+        "RouteProperties": _create_Route,
+        "RouteTable": _create_RouteTable,
+        "RouteTableProperties": _create_RouteTable,
+        "SecurityGroup": _create_SecurityGroup,
+        "SecurityGroupProperties": _create_SecurityGroup,
+        "SecurityGroupEgressProperty": _create_SecurityGroup,
+        "SecurityGroupIngressProperty": _create_SecurityGroup,
+        "SecurityGroupEgress": _create_SecurityGroupEgress,
+        "SecurityGroupEgressProperties": _create_SecurityGroupEgress,
+        "SecurityGroupIngress": _create_SecurityGroupIngress,
+        "SecurityGroupIngressProperties": _create_SecurityGroupIngress,
+        "SpotFleet": _create_SpotFleet,
+        "SpotFleetProperties": _create_SpotFleet,
+        "SpotFleetBlockDeviceMapping": _create_SpotFleet,
+        "SpotFleetClassicLoadBalancer": _create_SpotFleet,
+        "SpotFleetClassicLoadBalancersConfig": _create_SpotFleet,
+        "SpotFleetEbsBlockDevice": _create_SpotFleet,
+        "SpotFleetFleetLaunchTemplateSpecification": _create_SpotFleet,
+        "SpotFleetGroupIdentifier": _create_SpotFleet,
+        "SpotFleetIamInstanceProfileSpecification": _create_SpotFleet,
+        "SpotFleetInstanceIpv6Address": _create_SpotFleet,
+        "SpotFleetInstanceNetworkInterfaceSpecification": _create_SpotFleet,
+        "SpotFleetLaunchTemplateConfig": _create_SpotFleet,
+        "SpotFleetLaunchTemplateOverrides": _create_SpotFleet,
+        "SpotFleetLoadBalancersConfig": _create_SpotFleet,
+        "SpotFleetPrivateIpAddressSpecification": _create_SpotFleet,
+        "SpotFleetSpotFleetLaunchSpecification": _create_SpotFleet,
+        "SpotFleetSpotFleetMonitoring": _create_SpotFleet,
+        "SpotFleetSpotFleetRequestConfigData": _create_SpotFleet,
+        "SpotFleetSpotFleetTagSpecification": _create_SpotFleet,
+        "SpotFleetSpotPlacement": _create_SpotFleet,
+        "SpotFleetTargetGroup": _create_SpotFleet,
+        "SpotFleetTargetGroupsConfig": _create_SpotFleet,
+        "Subnet": _create_Subnet,
+        "SubnetProperties": _create_Subnet,
+        "SubnetCidrBlock": _create_SubnetCidrBlock,
+        "SubnetCidrBlockProperties": _create_SubnetCidrBlock,
+        "SubnetNetworkAclAssociation": _create_SubnetNetworkAclAssociation,
+        "SubnetNetworkAclAssociationProperties": _create_SubnetNetworkAclAssociation,
+        "SubnetRouteTableAssociation": _create_SubnetRouteTableAssociation,
+        "SubnetRouteTableAssociationProperties": _create_SubnetRouteTableAssociation,
+        "TrafficMirrorFilter": _create_TrafficMirrorFilter,
+        "TrafficMirrorFilterProperties": _create_TrafficMirrorFilter,
+        "TrafficMirrorFilterRule": _create_TrafficMirrorFilterRule,
+        "TrafficMirrorFilterRuleProperties": _create_TrafficMirrorFilterRule,
+        "TrafficMirrorFilterRuleTrafficMirrorPortRange": _create_TrafficMirrorFilterRule,
+        "TrafficMirrorSession": _create_TrafficMirrorSession,
+        "TrafficMirrorSessionProperties": _create_TrafficMirrorSession,
+        "TrafficMirrorTarget": _create_TrafficMirrorTarget,
+        "TrafficMirrorTargetProperties": _create_TrafficMirrorTarget,
+        "TransitGateway": _create_TransitGateway,
+        "TransitGatewayProperties": _create_TransitGateway,
+        "TransitGatewayAttachment": _create_TransitGatewayAttachment,
+        "TransitGatewayAttachmentProperties": _create_TransitGatewayAttachment,
+        "TransitGatewayRoute": _create_TransitGatewayRoute,
+        "TransitGatewayRouteProperties": _create_TransitGatewayRoute,
+        "TransitGatewayRouteTable": _create_TransitGatewayRouteTable,
+        "TransitGatewayRouteTableProperties": _create_TransitGatewayRouteTable,
+        "TransitGatewayRouteTableAssociation": _create_TransitGatewayRouteTableAssociation,
+        "TransitGatewayRouteTableAssociationProperties": _create_TransitGatewayRouteTableAssociation,
+        "TransitGatewayRouteTablePropagation": _create_TransitGatewayRouteTablePropagation,
+        "TransitGatewayRouteTablePropagationProperties": _create_TransitGatewayRouteTablePropagation,
+        "VPC": _create_VPC,
+        "VPCProperties": _create_VPC,
+        "VPCCidrBlock": _create_VPCCidrBlock,
+        "VPCCidrBlockProperties": _create_VPCCidrBlock,
+        "VPCDHCPOptionsAssociation": _create_VPCDHCPOptionsAssociation,
+        "VPCDHCPOptionsAssociationProperties": _create_VPCDHCPOptionsAssociation,
+        "VPCEndpoint": _create_VPCEndpoint,
+        "VPCEndpointProperties": _create_VPCEndpoint,
+        "VPCEndpointConnectionNotification": _create_VPCEndpointConnectionNotification,
+        "VPCEndpointConnectionNotificationProperties": _create_VPCEndpointConnectionNotification,
+        "VPCEndpointService": _create_VPCEndpointService,
+        "VPCEndpointServiceProperties": _create_VPCEndpointService,
+        "VPCEndpointServicePermissions": _create_VPCEndpointServicePermissions,
+        "VPCEndpointServicePermissionsProperties": _create_VPCEndpointServicePermissions,
+        "VPCGatewayAttachment": _create_VPCGatewayAttachment,
+        "VPCGatewayAttachmentProperties": _create_VPCGatewayAttachment,
+        "VPCPeeringConnection": _create_VPCPeeringConnection,
+        "VPCPeeringConnectionProperties": _create_VPCPeeringConnection,
+        "VPNConnection": _create_VPNConnection,
+        "VPNConnectionProperties": _create_VPNConnection,
+        "VPNConnectionVpnTunnelOptionsSpecification": _create_VPNConnection,
+        "VPNConnectionRoute": _create_VPNConnectionRoute,
+        "VPNConnectionRouteProperties": _create_VPNConnectionRoute,
+        "VPNGateway": _create_VPNGateway,
+        "VPNGatewayProperties": _create_VPNGateway,
+        "VPNGatewayRoutePropagation": _create_VPNGatewayRoutePropagation,
+        "VPNGatewayRoutePropagationProperties": _create_VPNGatewayRoutePropagation,
+        "Volume": _create_Volume,
+        "VolumeProperties": _create_Volume,
+        "VolumeAttachment": _create_VolumeAttachment,
+        "VolumeAttachmentProperties": _create_VolumeAttachment,
+    },
+)
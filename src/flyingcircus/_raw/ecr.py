@@ -7,37 +7,140 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Repository", "RepositoryProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Repository",
+    "RepositoryProperties",
+    "RepositoryLifecyclePolicy",
+]
 
-@attrs(**ATTRSCONFIG)
-class RepositoryProperties(ResourceProperties):
-    LifecyclePolicy = attrib(default=None)
-    RepositoryName = attrib(default=None)
-    RepositoryPolicyText = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_Repository():
+    class RepositoryLifecyclePolicy(_PropertyType):
+        """The Lifecycle Policy property type for Repository in ECR.
 
-@attrs(**ATTRSCONFIG)
-class Repository(Resource):
-    """A Repository for ECR.
+        See Also:
+            `AWS Cloud Formation documentation for LifecyclePolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecr-repository-lifecyclepolicy.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Repository
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecr-repository.html>`_
-    """
+        __slots__ = ("LifecyclePolicyText", "RegistryId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RepositoryLifecyclePolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::ECR::Repository"
+        def __init__(
+            self, *, LifecyclePolicyText=None, RegistryId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LifecyclePolicyText", LifecyclePolicyText)
+            _setattr("RegistryId", RegistryId)
+            _init_PropertyType(self, kwargs)
 
-    Properties: RepositoryProperties = attrib(
-        factory=RepositoryProperties,
-        converter=create_object_converter(RepositoryProperties),
+    _convert_RepositoryLifecyclePolicy = create_object_converter(
+        RepositoryLifecyclePolicy
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class RepositoryProperties(_ResourceProperties):
+        __slots__ = (
+            "LifecyclePolicy",
+            "RepositoryName",
+            "RepositoryPolicyText",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RepositoryProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LifecyclePolicy": _convert_RepositoryLifecyclePolicy,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            LifecyclePolicy=None,
+            RepositoryName=None,
+            RepositoryPolicyText=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "LifecyclePolicy", _convert_RepositoryLifecyclePolicy(LifecyclePolicy)
+            )
+            _setattr("RepositoryName", RepositoryName)
+            _setattr("RepositoryPolicyText", RepositoryPolicyText)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RepositoryProperties = create_object_converter(RepositoryProperties)
+
+    class Repository(_Resource):
+        """A Repository for ECR.
+
+        See Also:
+            `AWS Cloud Formation documentation for Repository
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecr-repository.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ECR::Repository"
+
+        Properties: RepositoryProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Repository",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RepositoryProperties},
+            factories={"Properties": RepositoryProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RepositoryProperties()
+            _setattr("Properties", _convert_RepositoryProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Repository, RepositoryProperties, RepositoryLifecyclePolicy
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Repository": _create_Repository,
+        "RepositoryProperties": _create_Repository,
+        "RepositoryLifecyclePolicy": _create_Repository,
+    },
+)
@@ -7,175 +7,1988 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Cluster",
     "ClusterProperties",
+    "ClusterClusterSetting",
     "PrimaryTaskSet",
     "PrimaryTaskSetProperties",
     "Service",
     "ServiceProperties",
+    "ServiceAwsVpcConfiguration",
+    "ServiceDeploymentConfiguration",
+    "ServiceDeploymentController",
+    "ServiceLoadBalancer",
+    "ServiceNetworkConfiguration",
+    "ServicePlacementConstraint",
+    "ServicePlacementStrategy",
+    "ServiceServiceRegistry",
     "TaskDefinition",
     "TaskDefinitionProperties",
+    "TaskDefinitionContainerDefinition",
+    "TaskDefinitionContainerDependency",
+    "TaskDefinitionDevice",
+    "TaskDefinitionDockerVolumeConfiguration",
+    "TaskDefinitionFirelensConfiguration",
+    "TaskDefinitionHealthCheck",
+    "TaskDefinitionHostEntry",
+    "TaskDefinitionHostVolumeProperties",
+    "TaskDefinitionInferenceAccelerator",
+    "TaskDefinitionKernelCapabilities",
+    "TaskDefinitionKeyValuePair",
+    "TaskDefinitionLinuxParameters",
+    "TaskDefinitionLogConfiguration",
+    "TaskDefinitionMountPoint",
+    "TaskDefinitionPortMapping",
+    "TaskDefinitionProxyConfiguration",
+    "TaskDefinitionRepositoryCredentials",
+    "TaskDefinitionResourceRequirement",
+    "TaskDefinitionSecret",
+    "TaskDefinitionSystemControl",
+    "TaskDefinitionTaskDefinitionPlacementConstraint",
+    "TaskDefinitionTmpfs",
+    "TaskDefinitionUlimit",
+    "TaskDefinitionVolume",
+    "TaskDefinitionVolumeFrom",
     "TaskSet",
     "TaskSetProperties",
+    "TaskSetAwsVpcConfiguration",
+    "TaskSetLoadBalancer",
+    "TaskSetNetworkConfiguration",
+    "TaskSetScale",
+    "TaskSetServiceRegistry",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ClusterProperties(ResourceProperties):
-    ClusterName = attrib(default=None)
-    ClusterSettings = attrib(default=None)
-    Tags = attrib(default=None)
+def _create_Cluster():
+    class ClusterClusterSetting(_PropertyType):
+        """The Cluster Setting property type for Cluster in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClusterSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-cluster-clustersetting.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterClusterSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterClusterSetting_list = create_object_list_converter(
+        ClusterClusterSetting
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ClusterProperties(_ResourceProperties):
+        __slots__ = ("ClusterName", "ClusterSettings", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ClusterSettings": _convert_ClusterClusterSetting_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ClusterName=None, ClusterSettings=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClusterName", ClusterName)
+            _setattr(
+                "ClusterSettings", _convert_ClusterClusterSetting_list(ClusterSettings)
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClusterProperties = create_object_converter(ClusterProperties)
+
+    class Cluster(_Resource):
+        """A Cluster for ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Cluster
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-cluster.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ECS::Cluster"
+
+        Properties: ClusterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Cluster",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterProperties},
+            factories={"Properties": ClusterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterProperties()
+            _setattr("Properties", _convert_ClusterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Cluster, ClusterProperties, ClusterClusterSetting
+
+
+def _create_PrimaryTaskSet():
+    class PrimaryTaskSetProperties(_ResourceProperties):
+        __slots__ = ("Cluster", "Service", "TaskSetId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PrimaryTaskSetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Cluster=None, Service=None, TaskSetId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Cluster", Cluster)
+            _setattr("Service", Service)
+            _setattr("TaskSetId", TaskSetId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PrimaryTaskSetProperties = create_object_converter(
+        PrimaryTaskSetProperties
+    )
+
+    class PrimaryTaskSet(_Resource):
+        """A Primary Task Set for ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for PrimaryTaskSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-primarytaskset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ECS::PrimaryTaskSet"
+
+        Properties: PrimaryTaskSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PrimaryTaskSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PrimaryTaskSetProperties},
+            factories={"Properties": PrimaryTaskSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PrimaryTaskSetProperties()
+            _setattr("Properties", _convert_PrimaryTaskSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return PrimaryTaskSet, PrimaryTaskSetProperties
+
+
+def _create_Service():
+    class ServiceAwsVpcConfiguration(_PropertyType):
+        """The Aws Vpc Configuration property type for Service in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for AwsVpcConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-service-awsvpcconfiguration.html>`_
+        """
+
+        __slots__ = ("AssignPublicIp", "SecurityGroups", "Subnets")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceAwsVpcConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AssignPublicIp=None, SecurityGroups=None, Subnets=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssignPublicIp", AssignPublicIp)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr("Subnets", Subnets)
+            _init_PropertyType(self, kwargs)
+
+    class ServiceDeploymentConfiguration(_PropertyType):
+        """The Deployment Configuration property type for Service in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeploymentConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-service-deploymentconfiguration.html>`_
+        """
+
+        __slots__ = ("MaximumPercent", "MinimumHealthyPercent")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceDeploymentConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, MaximumPercent=None, MinimumHealthyPercent=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaximumPercent", MaximumPercent)
+            _setattr("MinimumHealthyPercent", MinimumHealthyPercent)
+            _init_PropertyType(self, kwargs)
+
+    class ServiceDeploymentController(_PropertyType):
+        """The Deployment Controller property type for Service in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeploymentController
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-service-deploymentcontroller.html>`_
+        """
+
+        __slots__ = ("Type",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceDeploymentController", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class ServiceLoadBalancer(_PropertyType):
+        """The Load Balancer property type for Service in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoadBalancer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-service-loadbalancers.html>`_
+        """
+
+        __slots__ = (
+            "ContainerName",
+            "ContainerPort",
+            "LoadBalancerName",
+            "TargetGroupArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceLoadBalancer", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContainerName=None,
+            ContainerPort=None,
+            LoadBalancerName=None,
+            TargetGroupArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerName", ContainerName)
+            _setattr("ContainerPort", ContainerPort)
+            _setattr("LoadBalancerName", LoadBalancerName)
+            _setattr("TargetGroupArn", TargetGroupArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ServiceAwsVpcConfiguration = create_object_converter(
+        ServiceAwsVpcConfiguration
+    )
+
+    class ServiceNetworkConfiguration(_PropertyType):
+        """The Network Configuration property type for Service in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-service-networkconfiguration.html>`_
+        """
+
+        __slots__ = ("AwsvpcConfiguration",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceNetworkConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"AwsvpcConfiguration": _convert_ServiceAwsVpcConfiguration},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AwsvpcConfiguration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AwsvpcConfiguration",
+                _convert_ServiceAwsVpcConfiguration(AwsvpcConfiguration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ServicePlacementConstraint(_PropertyType):
+        """The Placement Constraint property type for Service in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for PlacementConstraint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-service-placementconstraint.html>`_
+        """
+
+        __slots__ = ("Expression", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServicePlacementConstraint", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Expression=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Expression", Expression)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class ServicePlacementStrategy(_PropertyType):
+        """The Placement Strategy property type for Service in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for PlacementStrategy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-service-placementstrategy.html>`_
+        """
+
+        __slots__ = ("Field", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServicePlacementStrategy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Field=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Field", Field)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class ServiceServiceRegistry(_PropertyType):
+        """The Service Registry property type for Service in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ServiceRegistry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-service-serviceregistry.html>`_
+        """
+
+        __slots__ = ("ContainerName", "ContainerPort", "Port", "RegistryArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceServiceRegistry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContainerName=None,
+            ContainerPort=None,
+            Port=None,
+            RegistryArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerName", ContainerName)
+            _setattr("ContainerPort", ContainerPort)
+            _setattr("Port", Port)
+            _setattr("RegistryArn", RegistryArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ServiceDeploymentConfiguration = create_object_converter(
+        ServiceDeploymentConfiguration
+    )
+    _convert_ServiceDeploymentController = create_object_converter(
+        ServiceDeploymentController
+    )
+    _convert_ServiceLoadBalancer_list = create_object_list_converter(
+        ServiceLoadBalancer
+    )
+    _convert_ServiceNetworkConfiguration = create_object_converter(
+        ServiceNetworkConfiguration
+    )
+    _convert_ServicePlacementConstraint_list = create_object_list_converter(
+        ServicePlacementConstraint
+    )
+    _convert_ServicePlacementStrategy_list = create_object_list_converter(
+        ServicePlacementStrategy
+    )
+    _convert_ServiceServiceRegistry_list = create_object_list_converter(
+        ServiceServiceRegistry
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ServiceProperties(_ResourceProperties):
+        __slots__ = (
+            "Cluster",
+            "DeploymentConfiguration",
+            "DeploymentController",
+            "DesiredCount",
+            "EnableECSManagedTags",
+            "HealthCheckGracePeriodSeconds",
+            "LaunchType",
+            "LoadBalancers",
+            "NetworkConfiguration",
+            "PlacementConstraints",
+            "PlacementStrategies",
+            "PlatformVersion",
+            "PropagateTags",
+            "Role",
+            "SchedulingStrategy",
+            "ServiceName",
+            "ServiceRegistries",
+            "Tags",
+            "TaskDefinition",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DeploymentConfiguration": _convert_ServiceDeploymentConfiguration,
+                "DeploymentController": _convert_ServiceDeploymentController,
+                "LoadBalancers": _convert_ServiceLoadBalancer_list,
+                "NetworkConfiguration": _convert_ServiceNetworkConfiguration,
+                "PlacementConstraints": _convert_ServicePlacementConstraint_list,
+                "PlacementStrategies": _convert_ServicePlacementStrategy_list,
+                "ServiceRegistries": _convert_ServiceServiceRegistry_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Cluster=None,
+            DeploymentConfiguration=None,
+            DeploymentController=None,
+            DesiredCount=None,
+            EnableECSManagedTags=None,
+            HealthCheckGracePeriodSeconds=None,
+            LaunchType=None,
+            LoadBalancers=None,
+            NetworkConfiguration=None,
+            PlacementConstraints=None,
+            PlacementStrategies=None,
+            PlatformVersion=None,
+            PropagateTags=None,
+            Role=None,
+            SchedulingStrategy=None,
+            ServiceName=None,
+            ServiceRegistries=None,
+            Tags=None,
+            TaskDefinition=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Cluster", Cluster)
+            _setattr(
+                "DeploymentConfiguration",
+                _convert_ServiceDeploymentConfiguration(DeploymentConfiguration),
+            )
+            _setattr(
+                "DeploymentController",
+                _convert_ServiceDeploymentController(DeploymentController),
+            )
+            _setattr("DesiredCount", DesiredCount)
+            _setattr("EnableECSManagedTags", EnableECSManagedTags)
+            _setattr("HealthCheckGracePeriodSeconds", HealthCheckGracePeriodSeconds)
+            _setattr("LaunchType", LaunchType)
+            _setattr("LoadBalancers", _convert_ServiceLoadBalancer_list(LoadBalancers))
+            _setattr(
+                "NetworkConfiguration",
+                _convert_ServiceNetworkConfiguration(NetworkConfiguration),
+            )
+            _setattr(
+                "PlacementConstraints",
+                _convert_ServicePlacementConstraint_list(PlacementConstraints),
+            )
+            _setattr(
+                "PlacementStrategies",
+                _convert_ServicePlacementStrategy_list(PlacementStrategies),
+            )
+            _setattr("PlatformVersion", PlatformVersion)
+            _setattr("PropagateTags", PropagateTags)
+            _setattr("Role", Role)
+            _setattr("SchedulingStrategy", SchedulingStrategy)
+            _setattr("ServiceName", ServiceName)
+            _setattr(
+                "ServiceRegistries",
+                _convert_ServiceServiceRegistry_list(ServiceRegistries),
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TaskDefinition", TaskDefinition)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ServiceProperties = create_object_converter(ServiceProperties)
+
+    class Service(_Resource):
+        """A Service for ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Service
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-service.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ECS::Service"
+
+        Properties: ServiceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Service",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ServiceProperties},
+            factories={"Properties": ServiceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ServiceProperties()
+            _setattr("Properties", _convert_ServiceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Service,
+        ServiceProperties,
+        ServiceAwsVpcConfiguration,
+        ServiceDeploymentConfiguration,
+        ServiceDeploymentController,
+        ServiceLoadBalancer,
+        ServiceNetworkConfiguration,
+        ServicePlacementConstraint,
+        ServicePlacementStrategy,
+        ServiceServiceRegistry,
+    )
+
+
+def _create_TaskDefinition():
+    class TaskDefinitionContainerDependency(_PropertyType):
+        """The Container Dependency property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ContainerDependency
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-containerdependency.html>`_
+        """
+
+        __slots__ = ("Condition", "ContainerName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionContainerDependency", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Condition=None, ContainerName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Condition", Condition)
+            _setattr("ContainerName", ContainerName)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionKeyValuePair(_PropertyType):
+        """The Key Value Pair property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for KeyValuePair
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-containerdefinitions-environment.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionKeyValuePair", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionHostEntry(_PropertyType):
+        """The Host Entry property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for HostEntry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-containerdefinitions-hostentry.html>`_
+        """
+
+        __slots__ = ("Hostname", "IpAddress")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionHostEntry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Hostname=None, IpAddress=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Hostname", Hostname)
+            _setattr("IpAddress", IpAddress)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionFirelensConfiguration(_PropertyType):
+        """The Firelens Configuration property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for FirelensConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-firelensconfiguration.html>`_
+        """
+
+        __slots__ = ("Options", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionFirelensConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Options=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Options", Options)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionHealthCheck(_PropertyType):
+        """The Health Check property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for HealthCheck
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-healthcheck.html>`_
+        """
+
+        __slots__ = ("Command", "Interval", "Retries", "StartPeriod", "Timeout")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionHealthCheck", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Command=None,
+            Interval=None,
+            Retries=None,
+            StartPeriod=None,
+            Timeout=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Command", Command)
+            _setattr("Interval", Interval)
+            _setattr("Retries", Retries)
+            _setattr("StartPeriod", StartPeriod)
+            _setattr("Timeout", Timeout)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionKernelCapabilities(_PropertyType):
+        """The Kernel Capabilities property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for KernelCapabilities
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-kernelcapabilities.html>`_
+        """
+
+        __slots__ = ("Add", "Drop")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionKernelCapabilities", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Add=None, Drop=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Add", Add)
+            _setattr("Drop", Drop)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionDevice(_PropertyType):
+        """The Device property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Device
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-device.html>`_
+        """
+
+        __slots__ = ("ContainerPath", "HostPath", "Permissions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionDevice", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ContainerPath=None, HostPath=None, Permissions=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerPath", ContainerPath)
+            _setattr("HostPath", HostPath)
+            _setattr("Permissions", Permissions)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionTmpfs(_PropertyType):
+        """The Tmpfs property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Tmpfs
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-tmpfs.html>`_
+        """
+
+        __slots__ = ("ContainerPath", "MountOptions", "Size")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionTmpfs", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ContainerPath=None, MountOptions=None, Size=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerPath", ContainerPath)
+            _setattr("MountOptions", MountOptions)
+            _setattr("Size", Size)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TaskDefinitionKernelCapabilities = create_object_converter(
+        TaskDefinitionKernelCapabilities
+    )
+    _convert_TaskDefinitionDevice_list = create_object_list_converter(
+        TaskDefinitionDevice
+    )
+    _convert_TaskDefinitionTmpfs_list = create_object_list_converter(
+        TaskDefinitionTmpfs
+    )
+
+    class TaskDefinitionLinuxParameters(_PropertyType):
+        """The Linux Parameters property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for LinuxParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-linuxparameters.html>`_
+        """
+
+        __slots__ = (
+            "Capabilities",
+            "Devices",
+            "InitProcessEnabled",
+            "MaxSwap",
+            "SharedMemorySize",
+            "Swappiness",
+            "Tmpfs",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionLinuxParameters",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Capabilities": _convert_TaskDefinitionKernelCapabilities,
+                "Devices": _convert_TaskDefinitionDevice_list,
+                "Tmpfs": _convert_TaskDefinitionTmpfs_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Capabilities=None,
+            Devices=None,
+            InitProcessEnabled=None,
+            MaxSwap=None,
+            SharedMemorySize=None,
+            Swappiness=None,
+            Tmpfs=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Capabilities", _convert_TaskDefinitionKernelCapabilities(Capabilities)
+            )
+            _setattr("Devices", _convert_TaskDefinitionDevice_list(Devices))
+            _setattr("InitProcessEnabled", InitProcessEnabled)
+            _setattr("MaxSwap", MaxSwap)
+            _setattr("SharedMemorySize", SharedMemorySize)
+            _setattr("Swappiness", Swappiness)
+            _setattr("Tmpfs", _convert_TaskDefinitionTmpfs_list(Tmpfs))
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionSecret(_PropertyType):
+        """The Secret property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Secret
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-secret.html>`_
+        """
+
+        __slots__ = ("Name", "ValueFrom")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionSecret", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, ValueFrom=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("ValueFrom", ValueFrom)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TaskDefinitionSecret_list = create_object_list_converter(
+        TaskDefinitionSecret
+    )
+
+    class TaskDefinitionLogConfiguration(_PropertyType):
+        """The Log Configuration property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for LogConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-containerdefinitions-logconfiguration.html>`_
+        """
+
+        __slots__ = ("LogDriver", "Options", "SecretOptions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionLogConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"SecretOptions": _convert_TaskDefinitionSecret_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, LogDriver=None, Options=None, SecretOptions=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LogDriver", LogDriver)
+            _setattr("Options", Options)
+            _setattr("SecretOptions", _convert_TaskDefinitionSecret_list(SecretOptions))
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionMountPoint(_PropertyType):
+        """The Mount Point property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for MountPoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-containerdefinitions-mountpoints.html>`_
+        """
+
+        __slots__ = ("ContainerPath", "ReadOnly", "SourceVolume")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionMountPoint", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ContainerPath=None, ReadOnly=None, SourceVolume=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerPath", ContainerPath)
+            _setattr("ReadOnly", ReadOnly)
+            _setattr("SourceVolume", SourceVolume)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionPortMapping(_PropertyType):
+        """The Port Mapping property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for PortMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-containerdefinitions-portmappings.html>`_
+        """
+
+        __slots__ = ("ContainerPort", "HostPort", "Protocol")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionPortMapping", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ContainerPort=None, HostPort=None, Protocol=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerPort", ContainerPort)
+            _setattr("HostPort", HostPort)
+            _setattr("Protocol", Protocol)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionRepositoryCredentials(_PropertyType):
+        """The Repository Credentials property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for RepositoryCredentials
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-repositorycredentials.html>`_
+        """
+
+        __slots__ = ("CredentialsParameter",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionRepositoryCredentials", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CredentialsParameter=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CredentialsParameter", CredentialsParameter)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionResourceRequirement(_PropertyType):
+        """The Resource Requirement property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceRequirement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-resourcerequirement.html>`_
+        """
+
+        __slots__ = ("Type", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionResourceRequirement", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Type=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionSystemControl(_PropertyType):
+        """The System Control property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for SystemControl
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-systemcontrol.html>`_
+        """
+
+        __slots__ = ("Namespace", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionSystemControl", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Namespace=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Namespace", Namespace)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionUlimit(_PropertyType):
+        """The Ulimit property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Ulimit
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-containerdefinitions-ulimit.html>`_
+        """
+
+        __slots__ = ("HardLimit", "Name", "SoftLimit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionUlimit", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, HardLimit=None, Name=None, SoftLimit=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HardLimit", HardLimit)
+            _setattr("Name", Name)
+            _setattr("SoftLimit", SoftLimit)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionVolumeFrom(_PropertyType):
+        """The Volume From property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for VolumeFrom
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-containerdefinitions-volumesfrom.html>`_
+        """
+
+        __slots__ = ("ReadOnly", "SourceContainer")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionVolumeFrom", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ReadOnly=None, SourceContainer=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ReadOnly", ReadOnly)
+            _setattr("SourceContainer", SourceContainer)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TaskDefinitionContainerDependency_list = create_object_list_converter(
+        TaskDefinitionContainerDependency
+    )
+    _convert_TaskDefinitionKeyValuePair_list = create_object_list_converter(
+        TaskDefinitionKeyValuePair
+    )
+    _convert_TaskDefinitionHostEntry_list = create_object_list_converter(
+        TaskDefinitionHostEntry
+    )
+    _convert_TaskDefinitionFirelensConfiguration = create_object_converter(
+        TaskDefinitionFirelensConfiguration
+    )
+    _convert_TaskDefinitionHealthCheck = create_object_converter(
+        TaskDefinitionHealthCheck
+    )
+    _convert_TaskDefinitionLinuxParameters = create_object_converter(
+        TaskDefinitionLinuxParameters
+    )
+    _convert_TaskDefinitionLogConfiguration = create_object_converter(
+        TaskDefinitionLogConfiguration
+    )
+    _convert_TaskDefinitionMountPoint_list = create_object_list_converter(
+        TaskDefinitionMountPoint
+    )
+    _convert_TaskDefinitionPortMapping_list = create_object_list_converter(
+        TaskDefinitionPortMapping
+    )
+    _convert_TaskDefinitionRepositoryCredentials = create_object_converter(
+        TaskDefinitionRepositoryCredentials
+    )
+    _convert_TaskDefinitionResourceRequirement_list = create_object_list_converter(
+        TaskDefinitionResourceRequirement
+    )
+    _convert_TaskDefinitionSystemControl_list = create_object_list_converter(
+        TaskDefinitionSystemControl
+    )
+    _convert_TaskDefinitionUlimit_list = create_object_list_converter(
+        TaskDefinitionUlimit
+    )
+    _convert_TaskDefinitionVolumeFrom_list = create_object_list_converter(
+        TaskDefinitionVolumeFrom
+    )
+
+    class TaskDefinitionContainerDefinition(_PropertyType):
+        """The Container Definition property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ContainerDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-containerdefinitions.html>`_
+        """
+
+        __slots__ = (
+            "Command",
+            "Cpu",
+            "DependsOn",
+            "DisableNetworking",
+            "DnsSearchDomains",
+            "DnsServers",
+            "DockerLabels",
+            "DockerSecurityOptions",
+            "EntryPoint",
+            "Environment",
+            "Essential",
+            "ExtraHosts",
+            "FirelensConfiguration",
+            "HealthCheck",
+            "Hostname",
+            "Image",
+            "Interactive",
+            "Links",
+            "LinuxParameters",
+            "LogConfiguration",
+            "Memory",
+            "MemoryReservation",
+            "MountPoints",
+            "Name",
+            "PortMappings",
+            "Privileged",
+            "PseudoTerminal",
+            "ReadonlyRootFilesystem",
+            "RepositoryCredentials",
+            "ResourceRequirements",
+            "Secrets",
+            "StartTimeout",
+            "StopTimeout",
+            "SystemControls",
+            "Ulimits",
+            "User",
+            "VolumesFrom",
+            "WorkingDirectory",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionContainerDefinition",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DependsOn": _convert_TaskDefinitionContainerDependency_list,
+                "Environment": _convert_TaskDefinitionKeyValuePair_list,
+                "ExtraHosts": _convert_TaskDefinitionHostEntry_list,
+                "FirelensConfiguration": _convert_TaskDefinitionFirelensConfiguration,
+                "HealthCheck": _convert_TaskDefinitionHealthCheck,
+                "LinuxParameters": _convert_TaskDefinitionLinuxParameters,
+                "LogConfiguration": _convert_TaskDefinitionLogConfiguration,
+                "MountPoints": _convert_TaskDefinitionMountPoint_list,
+                "PortMappings": _convert_TaskDefinitionPortMapping_list,
+                "RepositoryCredentials": _convert_TaskDefinitionRepositoryCredentials,
+                "ResourceRequirements": _convert_TaskDefinitionResourceRequirement_list,
+                "Secrets": _convert_TaskDefinitionSecret_list,
+                "SystemControls": _convert_TaskDefinitionSystemControl_list,
+                "Ulimits": _convert_TaskDefinitionUlimit_list,
+                "VolumesFrom": _convert_TaskDefinitionVolumeFrom_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Command=None,
+            Cpu=None,
+            DependsOn=None,
+            DisableNetworking=None,
+            DnsSearchDomains=None,
+            DnsServers=None,
+            DockerLabels=None,
+            DockerSecurityOptions=None,
+            EntryPoint=None,
+            Environment=None,
+            Essential=None,
+            ExtraHosts=None,
+            FirelensConfiguration=None,
+            HealthCheck=None,
+            Hostname=None,
+            Image=None,
+            Interactive=None,
+            Links=None,
+            LinuxParameters=None,
+            LogConfiguration=None,
+            Memory=None,
+            MemoryReservation=None,
+            MountPoints=None,
+            Name=None,
+            PortMappings=None,
+            Privileged=None,
+            PseudoTerminal=None,
+            ReadonlyRootFilesystem=None,
+            RepositoryCredentials=None,
+            ResourceRequirements=None,
+            Secrets=None,
+            StartTimeout=None,
+            StopTimeout=None,
+            SystemControls=None,
+            Ulimits=None,
+            User=None,
+            VolumesFrom=None,
+            WorkingDirectory=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Command", Command)
+            _setattr("Cpu", Cpu)
+            _setattr(
+                "DependsOn", _convert_TaskDefinitionContainerDependency_list(DependsOn)
+            )
+            _setattr("DisableNetworking", DisableNetworking)
+            _setattr("DnsSearchDomains", DnsSearchDomains)
+            _setattr("DnsServers", DnsServers)
+            _setattr("DockerLabels", DockerLabels)
+            _setattr("DockerSecurityOptions", DockerSecurityOptions)
+            _setattr("EntryPoint", EntryPoint)
+            _setattr(
+                "Environment", _convert_TaskDefinitionKeyValuePair_list(Environment)
+            )
+            _setattr("Essential", Essential)
+            _setattr("ExtraHosts", _convert_TaskDefinitionHostEntry_list(ExtraHosts))
+            _setattr(
+                "FirelensConfiguration",
+                _convert_TaskDefinitionFirelensConfiguration(FirelensConfiguration),
+            )
+            _setattr("HealthCheck", _convert_TaskDefinitionHealthCheck(HealthCheck))
+            _setattr("Hostname", Hostname)
+            _setattr("Image", Image)
+            _setattr("Interactive", Interactive)
+            _setattr("Links", Links)
+            _setattr(
+                "LinuxParameters",
+                _convert_TaskDefinitionLinuxParameters(LinuxParameters),
+            )
+            _setattr(
+                "LogConfiguration",
+                _convert_TaskDefinitionLogConfiguration(LogConfiguration),
+            )
+            _setattr("Memory", Memory)
+            _setattr("MemoryReservation", MemoryReservation)
+            _setattr("MountPoints", _convert_TaskDefinitionMountPoint_list(MountPoints))
+            _setattr("Name", Name)
+            _setattr(
+                "PortMappings", _convert_TaskDefinitionPortMapping_list(PortMappings)
+            )
+            _setattr("Privileged", Privileged)
+            _setattr("PseudoTerminal", PseudoTerminal)
+            _setattr("ReadonlyRootFilesystem", ReadonlyRootFilesystem)
+            _setattr(
+                "RepositoryCredentials",
+                _convert_TaskDefinitionRepositoryCredentials(RepositoryCredentials),
+            )
+            _setattr(
+                "ResourceRequirements",
+                _convert_TaskDefinitionResourceRequirement_list(ResourceRequirements),
+            )
+            _setattr("Secrets", _convert_TaskDefinitionSecret_list(Secrets))
+            _setattr("StartTimeout", StartTimeout)
+            _setattr("StopTimeout", StopTimeout)
+            _setattr(
+                "SystemControls",
+                _convert_TaskDefinitionSystemControl_list(SystemControls),
+            )
+            _setattr("Ulimits", _convert_TaskDefinitionUlimit_list(Ulimits))
+            _setattr("User", User)
+            _setattr("VolumesFrom", _convert_TaskDefinitionVolumeFrom_list(VolumesFrom))
+            _setattr("WorkingDirectory", WorkingDirectory)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionDockerVolumeConfiguration(_PropertyType):
+        """The Docker Volume Configuration property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DockerVolumeConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-dockervolumeconfiguration.html>`_
+        """
+
+        __slots__ = ("Autoprovision", "Driver", "DriverOpts", "Labels", "Scope")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionDockerVolumeConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Autoprovision=None,
+            Driver=None,
+            DriverOpts=None,
+            Labels=None,
+            Scope=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Autoprovision", Autoprovision)
+            _setattr("Driver", Driver)
+            _setattr("DriverOpts", DriverOpts)
+            _setattr("Labels", Labels)
+            _setattr("Scope", Scope)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionHostVolumeProperties(_PropertyType):
+        """The Host Volume Properties property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for HostVolumeProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-volumes-host.html>`_
+        """
+
+        __slots__ = ("SourcePath",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionHostVolumeProperties", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SourcePath=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SourcePath", SourcePath)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionInferenceAccelerator(_PropertyType):
+        """The Inference Accelerator property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for InferenceAccelerator
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-inferenceaccelerator.html>`_
+        """
+
+        __slots__ = ("DeviceName", "DevicePolicy", "DeviceType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionInferenceAccelerator", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeviceName=None, DevicePolicy=None, DeviceType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeviceName", DeviceName)
+            _setattr("DevicePolicy", DevicePolicy)
+            _setattr("DeviceType", DeviceType)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionProxyConfiguration(_PropertyType):
+        """The Proxy Configuration property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProxyConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-proxyconfiguration.html>`_
+        """
+
+        __slots__ = ("ContainerName", "ProxyConfigurationProperties", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionProxyConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ProxyConfigurationProperties": _convert_TaskDefinitionKeyValuePair_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContainerName=None,
+            ProxyConfigurationProperties=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerName", ContainerName)
+            _setattr(
+                "ProxyConfigurationProperties",
+                _convert_TaskDefinitionKeyValuePair_list(ProxyConfigurationProperties),
+            )
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class TaskDefinitionTaskDefinitionPlacementConstraint(_PropertyType):
+        """The Task Definition Placement Constraint property type for TaskDefinition in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for TaskDefinitionPlacementConstraint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-taskdefinitionplacementconstraint.html>`_
+        """
+
+        __slots__ = ("Expression", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionTaskDefinitionPlacementConstraint", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Expression=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Expression", Expression)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TaskDefinitionDockerVolumeConfiguration = create_object_converter(
+        TaskDefinitionDockerVolumeConfiguration
+    )
+    _convert_TaskDefinitionHostVolumeProperties = create_object_converter(
+        TaskDefinitionHostVolumeProperties
+    )
 
+    class TaskDefinitionVolume(_PropertyType):
+        """The Volume property type for TaskDefinition in ECS.
 
-@attrs(**ATTRSCONFIG)
-class Cluster(Resource):
-    """A Cluster for ECS.
+        See Also:
+            `AWS Cloud Formation documentation for Volume
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskdefinition-volumes.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Cluster
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-cluster.html>`_
-    """
+        __slots__ = ("DockerVolumeConfiguration", "Host", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionVolume",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DockerVolumeConfiguration": _convert_TaskDefinitionDockerVolumeConfiguration,
+                "Host": _convert_TaskDefinitionHostVolumeProperties,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::ECS::Cluster"
+        def __init__(
+            self, *, DockerVolumeConfiguration=None, Host=None, Name=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DockerVolumeConfiguration",
+                _convert_TaskDefinitionDockerVolumeConfiguration(
+                    DockerVolumeConfiguration
+                ),
+            )
+            _setattr("Host", _convert_TaskDefinitionHostVolumeProperties(Host))
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ClusterProperties = attrib(
-        factory=ClusterProperties, converter=create_object_converter(ClusterProperties)
+    _convert_TaskDefinitionContainerDefinition_list = create_object_list_converter(
+        TaskDefinitionContainerDefinition
+    )
+    _convert_TaskDefinitionInferenceAccelerator_list = create_object_list_converter(
+        TaskDefinitionInferenceAccelerator
+    )
+    _convert_TaskDefinitionTaskDefinitionPlacementConstraint_list = (
+        create_object_list_converter(TaskDefinitionTaskDefinitionPlacementConstraint)
+    )
+    _convert_TaskDefinitionProxyConfiguration = create_object_converter(
+        TaskDefinitionProxyConfiguration
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_TaskDefinitionVolume_list = create_object_list_converter(
+        TaskDefinitionVolume
+    )
+
+    class TaskDefinitionProperties(_ResourceProperties):
+        __slots__ = (
+            "ContainerDefinitions",
+            "Cpu",
+            "ExecutionRoleArn",
+            "Family",
+            "InferenceAccelerators",
+            "IpcMode",
+            "Memory",
+            "NetworkMode",
+            "PidMode",
+            "PlacementConstraints",
+            "ProxyConfiguration",
+            "RequiresCompatibilities",
+            "Tags",
+            "TaskRoleArn",
+            "Volumes",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ContainerDefinitions": _convert_TaskDefinitionContainerDefinition_list,
+                "InferenceAccelerators": _convert_TaskDefinitionInferenceAccelerator_list,
+                "PlacementConstraints": _convert_TaskDefinitionTaskDefinitionPlacementConstraint_list,
+                "ProxyConfiguration": _convert_TaskDefinitionProxyConfiguration,
+                "Tags": _convert_Tag_list,
+                "Volumes": _convert_TaskDefinitionVolume_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContainerDefinitions=None,
+            Cpu=None,
+            ExecutionRoleArn=None,
+            Family=None,
+            InferenceAccelerators=None,
+            IpcMode=None,
+            Memory=None,
+            NetworkMode=None,
+            PidMode=None,
+            PlacementConstraints=None,
+            ProxyConfiguration=None,
+            RequiresCompatibilities=None,
+            Tags=None,
+            TaskRoleArn=None,
+            Volumes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ContainerDefinitions",
+                _convert_TaskDefinitionContainerDefinition_list(ContainerDefinitions),
+            )
+            _setattr("Cpu", Cpu)
+            _setattr("ExecutionRoleArn", ExecutionRoleArn)
+            _setattr("Family", Family)
+            _setattr(
+                "InferenceAccelerators",
+                _convert_TaskDefinitionInferenceAccelerator_list(InferenceAccelerators),
+            )
+            _setattr("IpcMode", IpcMode)
+            _setattr("Memory", Memory)
+            _setattr("NetworkMode", NetworkMode)
+            _setattr("PidMode", PidMode)
+            _setattr(
+                "PlacementConstraints",
+                _convert_TaskDefinitionTaskDefinitionPlacementConstraint_list(
+                    PlacementConstraints
+                ),
+            )
+            _setattr(
+                "ProxyConfiguration",
+                _convert_TaskDefinitionProxyConfiguration(ProxyConfiguration),
+            )
+            _setattr("RequiresCompatibilities", RequiresCompatibilities)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TaskRoleArn", TaskRoleArn)
+            _setattr("Volumes", _convert_TaskDefinitionVolume_list(Volumes))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TaskDefinitionProperties = create_object_converter(
+        TaskDefinitionProperties
     )
 
+    class TaskDefinition(_Resource):
+        """A Task Definition for ECS.
 
-@attrs(**ATTRSCONFIG)
-class PrimaryTaskSetProperties(ResourceProperties):
-    Cluster = attrib(default=None)
-    Service = attrib(default=None)
-    TaskSetId = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for TaskDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-taskdefinition.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::ECS::TaskDefinition"
 
-@attrs(**ATTRSCONFIG)
-class PrimaryTaskSet(Resource):
-    """A Primary Task Set for ECS.
+        Properties: TaskDefinitionProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for PrimaryTaskSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-primarytaskset.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskDefinition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TaskDefinitionProperties},
+            factories={"Properties": TaskDefinitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::ECS::PrimaryTaskSet"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TaskDefinitionProperties()
+            _setattr("Properties", _convert_TaskDefinitionProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    Properties: PrimaryTaskSetProperties = attrib(
-        factory=PrimaryTaskSetProperties,
-        converter=create_object_converter(PrimaryTaskSetProperties),
+    return (
+        TaskDefinition,
+        TaskDefinitionProperties,
+        TaskDefinitionContainerDependency,
+        TaskDefinitionKeyValuePair,
+        TaskDefinitionHostEntry,
+        TaskDefinitionFirelensConfiguration,
+        TaskDefinitionHealthCheck,
+        TaskDefinitionKernelCapabilities,
+        TaskDefinitionDevice,
+        TaskDefinitionTmpfs,
+        TaskDefinitionLinuxParameters,
+        TaskDefinitionSecret,
+        TaskDefinitionLogConfiguration,
+        TaskDefinitionMountPoint,
+        TaskDefinitionPortMapping,
+        TaskDefinitionRepositoryCredentials,
+        TaskDefinitionResourceRequirement,
+        TaskDefinitionSystemControl,
+        TaskDefinitionUlimit,
+        TaskDefinitionVolumeFrom,
+        TaskDefinitionContainerDefinition,
+        TaskDefinitionDockerVolumeConfiguration,
+        TaskDefinitionHostVolumeProperties,
+        TaskDefinitionInferenceAccelerator,
+        TaskDefinitionProxyConfiguration,
+        TaskDefinitionTaskDefinitionPlacementConstraint,
+        TaskDefinitionVolume,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class ServiceProperties(ResourceProperties):
-    Cluster = attrib(default=None)
-    DeploymentConfiguration = attrib(default=None)
-    DeploymentController = attrib(default=None)
-    DesiredCount = attrib(default=None)
-    EnableECSManagedTags = attrib(default=None)
-    HealthCheckGracePeriodSeconds = attrib(default=None)
-    LaunchType = attrib(default=None)
-    LoadBalancers = attrib(default=None)
-    NetworkConfiguration = attrib(default=None)
-    PlacementConstraints = attrib(default=None)
-    PlacementStrategies = attrib(default=None)
-    PlatformVersion = attrib(default=None)
-    PropagateTags = attrib(default=None)
-    Role = attrib(default=None)
-    SchedulingStrategy = attrib(default=None)
-    ServiceName = attrib(default=None)
-    ServiceRegistries = attrib(default=None)
-    Tags = attrib(default=None)
-    TaskDefinition = attrib(default=None)
+def _create_TaskSet():
+    class TaskSetAwsVpcConfiguration(_PropertyType):
+        """The Aws Vpc Configuration property type for TaskSet in ECS.
 
+        See Also:
+            `AWS Cloud Formation documentation for AwsVpcConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskset-awsvpcconfiguration.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class Service(Resource):
-    """A Service for ECS.
+        __slots__ = ("AssignPublicIp", "SecurityGroups", "Subnets")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskSetAwsVpcConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for Service
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-service.html>`_
-    """
+        def __init__(
+            self, *, AssignPublicIp=None, SecurityGroups=None, Subnets=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssignPublicIp", AssignPublicIp)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr("Subnets", Subnets)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::ECS::Service"
+    class TaskSetLoadBalancer(_PropertyType):
+        """The Load Balancer property type for TaskSet in ECS.
 
-    Properties: ServiceProperties = attrib(
-        factory=ServiceProperties, converter=create_object_converter(ServiceProperties)
+        See Also:
+            `AWS Cloud Formation documentation for LoadBalancer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskset-loadbalancer.html>`_
+        """
+
+        __slots__ = (
+            "ContainerName",
+            "ContainerPort",
+            "LoadBalancerName",
+            "TargetGroupArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskSetLoadBalancer", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContainerName=None,
+            ContainerPort=None,
+            LoadBalancerName=None,
+            TargetGroupArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerName", ContainerName)
+            _setattr("ContainerPort", ContainerPort)
+            _setattr("LoadBalancerName", LoadBalancerName)
+            _setattr("TargetGroupArn", TargetGroupArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TaskSetAwsVpcConfiguration = create_object_converter(
+        TaskSetAwsVpcConfiguration
     )
 
+    class TaskSetNetworkConfiguration(_PropertyType):
+        """The Network Configuration property type for TaskSet in ECS.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskset-networkconfiguration.html>`_
+        """
+
+        __slots__ = ("AwsVpcConfiguration",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskSetNetworkConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"AwsVpcConfiguration": _convert_TaskSetAwsVpcConfiguration},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AwsVpcConfiguration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AwsVpcConfiguration",
+                _convert_TaskSetAwsVpcConfiguration(AwsVpcConfiguration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class TaskSetScale(_PropertyType):
+        """The Scale property type for TaskSet in ECS.
 
-@attrs(**ATTRSCONFIG)
-class TaskDefinitionProperties(ResourceProperties):
-    ContainerDefinitions = attrib(default=None)
-    Cpu = attrib(default=None)
-    ExecutionRoleArn = attrib(default=None)
-    Family = attrib(default=None)
-    InferenceAccelerators = attrib(default=None)
-    IpcMode = attrib(default=None)
-    Memory = attrib(default=None)
-    NetworkMode = attrib(default=None)
-    PidMode = attrib(default=None)
-    PlacementConstraints = attrib(default=None)
-    ProxyConfiguration = attrib(default=None)
-    RequiresCompatibilities = attrib(default=None)
-    Tags = attrib(default=None)
-    TaskRoleArn = attrib(default=None)
-    Volumes = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for Scale
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskset-scale.html>`_
+        """
 
+        __slots__ = ("Unit", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskSetScale", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class TaskDefinition(Resource):
-    """A Task Definition for ECS.
+        def __init__(self, *, Unit=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Unit", Unit)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for TaskDefinition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-taskdefinition.html>`_
-    """
+    class TaskSetServiceRegistry(_PropertyType):
+        """The Service Registry property type for TaskSet in ECS.
 
-    RESOURCE_TYPE = "AWS::ECS::TaskDefinition"
+        See Also:
+            `AWS Cloud Formation documentation for ServiceRegistry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ecs-taskset-serviceregistry.html>`_
+        """
 
-    Properties: TaskDefinitionProperties = attrib(
-        factory=TaskDefinitionProperties,
-        converter=create_object_converter(TaskDefinitionProperties),
+        __slots__ = ("ContainerName", "ContainerPort", "Port", "RegistryArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskSetServiceRegistry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContainerName=None,
+            ContainerPort=None,
+            Port=None,
+            RegistryArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerName", ContainerName)
+            _setattr("ContainerPort", ContainerPort)
+            _setattr("Port", Port)
+            _setattr("RegistryArn", RegistryArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TaskSetLoadBalancer_list = create_object_list_converter(
+        TaskSetLoadBalancer
+    )
+    _convert_TaskSetNetworkConfiguration = create_object_converter(
+        TaskSetNetworkConfiguration
+    )
+    _convert_TaskSetScale = create_object_converter(TaskSetScale)
+    _convert_TaskSetServiceRegistry_list = create_object_list_converter(
+        TaskSetServiceRegistry
     )
 
+    class TaskSetProperties(_ResourceProperties):
+        __slots__ = (
+            "Cluster",
+            "ExternalId",
+            "LaunchType",
+            "LoadBalancers",
+            "NetworkConfiguration",
+            "PlatformVersion",
+            "Scale",
+            "Service",
+            "ServiceRegistries",
+            "TaskDefinition",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LoadBalancers": _convert_TaskSetLoadBalancer_list,
+                "NetworkConfiguration": _convert_TaskSetNetworkConfiguration,
+                "Scale": _convert_TaskSetScale,
+                "ServiceRegistries": _convert_TaskSetServiceRegistry_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Cluster=None,
+            ExternalId=None,
+            LaunchType=None,
+            LoadBalancers=None,
+            NetworkConfiguration=None,
+            PlatformVersion=None,
+            Scale=None,
+            Service=None,
+            ServiceRegistries=None,
+            TaskDefinition=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Cluster", Cluster)
+            _setattr("ExternalId", ExternalId)
+            _setattr("LaunchType", LaunchType)
+            _setattr("LoadBalancers", _convert_TaskSetLoadBalancer_list(LoadBalancers))
+            _setattr(
+                "NetworkConfiguration",
+                _convert_TaskSetNetworkConfiguration(NetworkConfiguration),
+            )
+            _setattr("PlatformVersion", PlatformVersion)
+            _setattr("Scale", _convert_TaskSetScale(Scale))
+            _setattr("Service", Service)
+            _setattr(
+                "ServiceRegistries",
+                _convert_TaskSetServiceRegistry_list(ServiceRegistries),
+            )
+            _setattr("TaskDefinition", TaskDefinition)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TaskSetProperties = create_object_converter(TaskSetProperties)
+
+    class TaskSet(_Resource):
+        """A Task Set for ECS.
 
-@attrs(**ATTRSCONFIG)
-class TaskSetProperties(ResourceProperties):
-    Cluster = attrib(default=None)
-    ExternalId = attrib(default=None)
-    LaunchType = attrib(default=None)
-    LoadBalancers = attrib(default=None)
-    NetworkConfiguration = attrib(default=None)
-    PlatformVersion = attrib(default=None)
-    Scale = attrib(default=None)
-    Service = attrib(default=None)
-    ServiceRegistries = attrib(default=None)
-    TaskDefinition = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TaskSet(Resource):
-    """A Task Set for ECS.
-
-    See Also:
-        `AWS Cloud Formation documentation for TaskSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-taskset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ECS::TaskSet"
-
-    Properties: TaskSetProperties = attrib(
-        factory=TaskSetProperties, converter=create_object_converter(TaskSetProperties)
+        See Also:
+            `AWS Cloud Formation documentation for TaskSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ecs-taskset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ECS::TaskSet"
+
+        Properties: TaskSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TaskSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TaskSetProperties},
+            factories={"Properties": TaskSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TaskSetProperties()
+            _setattr("Properties", _convert_TaskSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        TaskSet,
+        TaskSetProperties,
+        TaskSetAwsVpcConfiguration,
+        TaskSetLoadBalancer,
+        TaskSetNetworkConfiguration,
+        TaskSetScale,
+        TaskSetServiceRegistry,
     )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Cluster": _create_Cluster,
+        "ClusterProperties": _create_Cluster,
+        "ClusterClusterSetting": _create_Cluster,
+        "PrimaryTaskSet": _create_PrimaryTaskSet,
+        "PrimaryTaskSetProperties": _create_PrimaryTaskSet,
+        "Service": _create_Service,
+        "ServiceProperties": _create_Service,
+        "ServiceAwsVpcConfiguration": _create_Service,
+        "ServiceDeploymentConfiguration": _create_Service,
+        "ServiceDeploymentController": _create_Service,
+        "ServiceLoadBalancer": _create_Service,
+        "ServiceNetworkConfiguration": _create_Service,
+        "ServicePlacementConstraint": _create_Service,
+        "ServicePlacementStrategy": _create_Service,
+        "ServiceServiceRegistry": _create_Service,
+        "TaskDefinition": _create_TaskDefinition,
+        "TaskDefinitionProperties": _create_TaskDefinition,
+        "TaskDefinitionContainerDefinition": _create_TaskDefinition,
+        "TaskDefinitionContainerDependency": _create_TaskDefinition,
+        "TaskDefinitionDevice": _create_TaskDefinition,
+        "TaskDefinitionDockerVolumeConfiguration": _create_TaskDefinition,
+        "TaskDefinitionFirelensConfiguration": _create_TaskDefinition,
+        "TaskDefinitionHealthCheck": _create_TaskDefinition,
+        "TaskDefinitionHostEntry": _create_TaskDefinition,
+        "TaskDefinitionHostVolumeProperties": _create_TaskDefinition,
+        "TaskDefinitionInferenceAccelerator": _create_TaskDefinition,
+        "TaskDefinitionKernelCapabilities": _create_TaskDefinition,
+        "TaskDefinitionKeyValuePair": _create_TaskDefinition,
+        "TaskDefinitionLinuxParameters": _create_TaskDefinition,
+        "TaskDefinitionLogConfiguration": _create_TaskDefinition,
+        "TaskDefinitionMountPoint": _create_TaskDefinition,
+        "TaskDefinitionPortMapping": _create_TaskDefinition,
+        "TaskDefinitionProxyConfiguration": _create_TaskDefinition,
+        "TaskDefinitionRepositoryCredentials": _create_TaskDefinition,
+        "TaskDefinitionResourceRequirement": _create_TaskDefinition,
+        "TaskDefinitionSecret": _create_TaskDefinition,
+        "TaskDefinitionSystemControl": _create_TaskDefinition,
+        "TaskDefinitionTaskDefinitionPlacementConstraint": _create_TaskDefinition,
+        "TaskDefinitionTmpfs": _create_TaskDefinition,
+        "TaskDefinitionUlimit": _create_TaskDefinition,
+        "TaskDefinitionVolume": _create_TaskDefinition,
+        "TaskDefinitionVolumeFrom": _create_TaskDefinition,
+        "TaskSet": _create_TaskSet,
+        "TaskSetProperties": _create_TaskSet,
+        "TaskSetAwsVpcConfiguration": _create_TaskSet,
+        "TaskSetLoadBalancer": _create_TaskSet,
+        "TaskSetNetworkConfiguration": _create_TaskSet,
+        "TaskSetScale": _create_TaskSet,
+        "TaskSetServiceRegistry": _create_TaskSet,
+    },
+)
@@ -7,65 +7,248 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
-
-__all__ = ["FileSystem", "FileSystemProperties", "MountTarget", "MountTargetProperties"]
-
-
-@attrs(**ATTRSCONFIG)
-class FileSystemProperties(ResourceProperties):
-    Encrypted = attrib(default=None)
-    FileSystemTags = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    LifecyclePolicies = attrib(default=None)
-    PerformanceMode = attrib(default=None)
-    ProvisionedThroughputInMibps = attrib(default=None)
-    ThroughputMode = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class FileSystem(Resource):
-    """A File System for EFS.
-
-    See Also:
-        `AWS Cloud Formation documentation for FileSystem
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-efs-filesystem.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EFS::FileSystem"
-
-    Properties: FileSystemProperties = attrib(
-        factory=FileSystemProperties,
-        converter=create_object_converter(FileSystemProperties),
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
+__all__ = [
+    "FileSystem",
+    "FileSystemProperties",
+    "FileSystemElasticFileSystemTag",
+    "FileSystemLifecyclePolicy",
+    "MountTarget",
+    "MountTargetProperties",
+]
+
+
+def _create_FileSystem():
+    class FileSystemElasticFileSystemTag(_PropertyType):
+        """The Elastic File System Tag property type for FileSystem in EFS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticFileSystemTag
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-efs-filesystem-filesystemtags.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FileSystemElasticFileSystemTag", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class FileSystemLifecyclePolicy(_PropertyType):
+        """The Lifecycle Policy property type for FileSystem in EFS.
+
+        See Also:
+            `AWS Cloud Formation documentation for LifecyclePolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticfilesystem-filesystem-lifecyclepolicy.html>`_
+        """
+
+        __slots__ = ("TransitionToIA",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FileSystemLifecyclePolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TransitionToIA=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TransitionToIA", TransitionToIA)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FileSystemElasticFileSystemTag_list = create_object_list_converter(
+        FileSystemElasticFileSystemTag
+    )
+    _convert_FileSystemLifecyclePolicy_list = create_object_list_converter(
+        FileSystemLifecyclePolicy
     )
 
+    class FileSystemProperties(_ResourceProperties):
+        __slots__ = (
+            "Encrypted",
+            "FileSystemTags",
+            "KmsKeyId",
+            "LifecyclePolicies",
+            "PerformanceMode",
+            "ProvisionedThroughputInMibps",
+            "ThroughputMode",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FileSystemProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "FileSystemTags": _convert_FileSystemElasticFileSystemTag_list,
+                "LifecyclePolicies": _convert_FileSystemLifecyclePolicy_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Encrypted=None,
+            FileSystemTags=None,
+            KmsKeyId=None,
+            LifecyclePolicies=None,
+            PerformanceMode=None,
+            ProvisionedThroughputInMibps=None,
+            ThroughputMode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Encrypted", Encrypted)
+            _setattr(
+                "FileSystemTags",
+                _convert_FileSystemElasticFileSystemTag_list(FileSystemTags),
+            )
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr(
+                "LifecyclePolicies",
+                _convert_FileSystemLifecyclePolicy_list(LifecyclePolicies),
+            )
+            _setattr("PerformanceMode", PerformanceMode)
+            _setattr("ProvisionedThroughputInMibps", ProvisionedThroughputInMibps)
+            _setattr("ThroughputMode", ThroughputMode)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FileSystemProperties = create_object_converter(FileSystemProperties)
+
+    class FileSystem(_Resource):
+        """A File System for EFS.
+
+        See Also:
+            `AWS Cloud Formation documentation for FileSystem
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-efs-filesystem.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EFS::FileSystem"
+        TAG_PROPERTY = "FileSystemTags"
+
+        Properties: FileSystemProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FileSystem",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FileSystemProperties},
+            factories={"Properties": FileSystemProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FileSystemProperties()
+            _setattr("Properties", _convert_FileSystemProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        FileSystem,
+        FileSystemProperties,
+        FileSystemElasticFileSystemTag,
+        FileSystemLifecyclePolicy,
+    )
 
-@attrs(**ATTRSCONFIG)
-class MountTargetProperties(ResourceProperties):
-    FileSystemId = attrib(default=None)
-    IpAddress = attrib(default=None)
-    SecurityGroups = attrib(default=None)
-    SubnetId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class MountTarget(Resource):
-    """A Mount Target for EFS.
-
-    See Also:
-        `AWS Cloud Formation documentation for MountTarget
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-efs-mounttarget.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EFS::MountTarget"
 
-    Properties: MountTargetProperties = attrib(
-        factory=MountTargetProperties,
-        converter=create_object_converter(MountTargetProperties),
-    )
+def _create_MountTarget():
+    class MountTargetProperties(_ResourceProperties):
+        __slots__ = ("FileSystemId", "IpAddress", "SecurityGroups", "SubnetId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MountTargetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            FileSystemId=None,
+            IpAddress=None,
+            SecurityGroups=None,
+            SubnetId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FileSystemId", FileSystemId)
+            _setattr("IpAddress", IpAddress)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr("SubnetId", SubnetId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MountTargetProperties = create_object_converter(MountTargetProperties)
+
+    class MountTarget(_Resource):
+        """A Mount Target for EFS.
+
+        See Also:
+            `AWS Cloud Formation documentation for MountTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-efs-mounttarget.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EFS::MountTarget"
+
+        Properties: MountTargetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MountTarget",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MountTargetProperties},
+            factories={"Properties": MountTargetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MountTargetProperties()
+            _setattr("Properties", _convert_MountTargetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return MountTarget, MountTargetProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "FileSystem": _create_FileSystem,
+        "FileSystemProperties": _create_FileSystem,
+        "FileSystemElasticFileSystemTag": _create_FileSystem,
+        "FileSystemLifecyclePolicy": _create_FileSystem,
+        "MountTarget": _create_MountTarget,
+        "MountTargetProperties": _create_MountTarget,
+    },
+)
@@ -7,71 +7,293 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
-__all__ = ["Cluster", "ClusterProperties", "Nodegroup", "NodegroupProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Cluster",
+    "ClusterProperties",
+    "ClusterResourcesVpcConfig",
+    "Nodegroup",
+    "NodegroupProperties",
+    "NodegroupRemoteAccess",
+    "NodegroupScalingConfig",
+]
 
-@attrs(**ATTRSCONFIG)
-class ClusterProperties(ResourceProperties):
-    Name = attrib(default=None)
-    ResourcesVpcConfig = attrib(default=None)
-    RoleArn = attrib(default=None)
-    Version = attrib(default=None)
 
+def _create_Cluster():
+    class ClusterResourcesVpcConfig(_PropertyType):
+        """The Resources Vpc Config property type for Cluster in EKS.
 
-@attrs(**ATTRSCONFIG)
-class Cluster(Resource):
-    """A Cluster for EKS.
+        See Also:
+            `AWS Cloud Formation documentation for ResourcesVpcConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-eks-cluster-resourcesvpcconfig.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Cluster
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eks-cluster.html>`_
-    """
+        __slots__ = ("SecurityGroupIds", "SubnetIds")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterResourcesVpcConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::EKS::Cluster"
+        def __init__(self, *, SecurityGroupIds=None, SubnetIds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SubnetIds", SubnetIds)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ClusterProperties = attrib(
-        factory=ClusterProperties, converter=create_object_converter(ClusterProperties)
+    _convert_ClusterResourcesVpcConfig = create_object_converter(
+        ClusterResourcesVpcConfig
     )
 
+    class ClusterProperties(_ResourceProperties):
+        __slots__ = ("Name", "ResourcesVpcConfig", "RoleArn", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"ResourcesVpcConfig": _convert_ClusterResourcesVpcConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class NodegroupProperties(ResourceProperties):
-    AmiType = attrib(default=None)
-    ClusterName = attrib(default=None)
-    DiskSize = attrib(default=None)
-    ForceUpdateEnabled = attrib(default=None)
-    InstanceTypes = attrib(default=None)
-    Labels = attrib(default=None)
-    NodegroupName = attrib(default=None)
-    NodeRole = attrib(default=None)
-    ReleaseVersion = attrib(default=None)
-    RemoteAccess = attrib(default=None)
-    ScalingConfig = attrib(default=None)
-    Subnets = attrib(default=None)
-    Tags = attrib(default=None)
-    Version = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Nodegroup(Resource):
-    """A Nodegroup for EKS.
-
-    See Also:
-        `AWS Cloud Formation documentation for Nodegroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eks-nodegroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::EKS::Nodegroup"
-
-    Properties: NodegroupProperties = attrib(
-        factory=NodegroupProperties,
-        converter=create_object_converter(NodegroupProperties),
-    )
+        def __init__(
+            self,
+            *,
+            Name=None,
+            ResourcesVpcConfig=None,
+            RoleArn=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr(
+                "ResourcesVpcConfig",
+                _convert_ClusterResourcesVpcConfig(ResourcesVpcConfig),
+            )
+            _setattr("RoleArn", RoleArn)
+            _setattr("Version", Version)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClusterProperties = create_object_converter(ClusterProperties)
+
+    class Cluster(_Resource):
+        """A Cluster for EKS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Cluster
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eks-cluster.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EKS::Cluster"
+
+        Properties: ClusterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Cluster",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterProperties},
+            factories={"Properties": ClusterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterProperties()
+            _setattr("Properties", _convert_ClusterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Cluster, ClusterProperties, ClusterResourcesVpcConfig
+
+
+def _create_Nodegroup():
+    class NodegroupRemoteAccess(_PropertyType):
+        """The Remote Access property type for Nodegroup in EKS.
+
+        See Also:
+            `AWS Cloud Formation documentation for RemoteAccess
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-eks-nodegroup-remoteaccess.html>`_
+        """
+
+        __slots__ = ("Ec2SshKey", "SourceSecurityGroups")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NodegroupRemoteAccess", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Ec2SshKey=None, SourceSecurityGroups=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ec2SshKey", Ec2SshKey)
+            _setattr("SourceSecurityGroups", SourceSecurityGroups)
+            _init_PropertyType(self, kwargs)
+
+    class NodegroupScalingConfig(_PropertyType):
+        """The Scaling Config property type for Nodegroup in EKS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-eks-nodegroup-scalingconfig.html>`_
+        """
+
+        __slots__ = ("DesiredSize", "MaxSize", "MinSize")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NodegroupScalingConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DesiredSize=None, MaxSize=None, MinSize=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DesiredSize", DesiredSize)
+            _setattr("MaxSize", MaxSize)
+            _setattr("MinSize", MinSize)
+            _init_PropertyType(self, kwargs)
+
+    _convert_NodegroupRemoteAccess = create_object_converter(NodegroupRemoteAccess)
+    _convert_NodegroupScalingConfig = create_object_converter(NodegroupScalingConfig)
+
+    class NodegroupProperties(_ResourceProperties):
+        __slots__ = (
+            "AmiType",
+            "ClusterName",
+            "DiskSize",
+            "ForceUpdateEnabled",
+            "InstanceTypes",
+            "Labels",
+            "NodegroupName",
+            "NodeRole",
+            "ReleaseVersion",
+            "RemoteAccess",
+            "ScalingConfig",
+            "Subnets",
+            "Tags",
+            "Version",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NodegroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "RemoteAccess": _convert_NodegroupRemoteAccess,
+                "ScalingConfig": _convert_NodegroupScalingConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AmiType=None,
+            ClusterName=None,
+            DiskSize=None,
+            ForceUpdateEnabled=None,
+            InstanceTypes=None,
+            Labels=None,
+            NodegroupName=None,
+            NodeRole=None,
+            ReleaseVersion=None,
+            RemoteAccess=None,
+            ScalingConfig=None,
+            Subnets=None,
+            Tags=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AmiType", AmiType)
+            _setattr("ClusterName", ClusterName)
+            _setattr("DiskSize", DiskSize)
+            _setattr("ForceUpdateEnabled", ForceUpdateEnabled)
+            _setattr("InstanceTypes", InstanceTypes)
+            _setattr("Labels", Labels)
+            _setattr("NodegroupName", NodegroupName)
+            _setattr("NodeRole", NodeRole)
+            _setattr("ReleaseVersion", ReleaseVersion)
+            _setattr("RemoteAccess", _convert_NodegroupRemoteAccess(RemoteAccess))
+            _setattr("ScalingConfig", _convert_NodegroupScalingConfig(ScalingConfig))
+            _setattr("Subnets", Subnets)
+            _setattr("Tags", Tags)
+            _setattr("Version", Version)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NodegroupProperties = create_object_converter(NodegroupProperties)
+
+    class Nodegroup(_Resource):
+        """A Nodegroup for EKS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Nodegroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eks-nodegroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EKS::Nodegroup"
+        TAG_FORMAT = "Map"
+
+        Properties: NodegroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Nodegroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NodegroupProperties},
+            factories={"Properties": NodegroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NodegroupProperties()
+            _setattr("Properties", _convert_NodegroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Nodegroup, NodegroupProperties, NodegroupRemoteAccess, NodegroupScalingConfig
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Cluster": _create_Cluster,
+        "ClusterProperties": _create_Cluster,
+        "ClusterResourcesVpcConfig": _create_Cluster,
+        "Nodegroup": _create_Nodegroup,
+        "NodegroupProperties": _create_Nodegroup,
+        "NodegroupRemoteAccess": _create_Nodegroup,
+        "NodegroupScalingConfig": _create_Nodegroup,
+    },
+)
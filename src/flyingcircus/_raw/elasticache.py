@@ -10,13 +10,21 @@ This file is automatically generated, and should not be directly edited.
 from typing import Any
 from typing import Dict
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "CacheCluster",
@@ -25,6 +33,7 @@ __all__ = [
     "ParameterGroupProperties",
     "ReplicationGroup",
     "ReplicationGroupProperties",
+    "ReplicationGroupNodeGroupConfiguration",
     "SecurityGroup",
     "SecurityGroupProperties",
     "SecurityGroupIngress",
@@ -34,192 +43,610 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class CacheClusterProperties(ResourceProperties):
-    AutoMinorVersionUpgrade = attrib(default=None)
-    AZMode = attrib(default=None)
-    CacheNodeType = attrib(default=None)
-    CacheParameterGroupName = attrib(default=None)
-    CacheSecurityGroupNames = attrib(default=None)
-    CacheSubnetGroupName = attrib(default=None)
-    ClusterName = attrib(default=None)
-    Engine = attrib(default=None)
-    EngineVersion = attrib(default=None)
-    NotificationTopicArn = attrib(default=None)
-    NumCacheNodes = attrib(default=None)
-    Port = attrib(default=None)
-    PreferredAvailabilityZone = attrib(default=None)
-    PreferredAvailabilityZones = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    SnapshotArns = attrib(default=None)
-    SnapshotName = attrib(default=None)
-    SnapshotRetentionLimit = attrib(default=None)
-    SnapshotWindow = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcSecurityGroupIds = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class CacheCluster(Resource):
-    """A Cache Cluster for ElastiCache.
-
-    See Also:
-        `AWS Cloud Formation documentation for CacheCluster
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-cache-cluster.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ElastiCache::CacheCluster"
-
-    Properties: CacheClusterProperties = attrib(
-        factory=CacheClusterProperties,
-        converter=create_object_converter(CacheClusterProperties),
+def _create_CacheCluster():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class CacheClusterProperties(_ResourceProperties):
+        __slots__ = (
+            "AutoMinorVersionUpgrade",
+            "AZMode",
+            "CacheNodeType",
+            "CacheParameterGroupName",
+            "CacheSecurityGroupNames",
+            "CacheSubnetGroupName",
+            "ClusterName",
+            "Engine",
+            "EngineVersion",
+            "NotificationTopicArn",
+            "NumCacheNodes",
+            "Port",
+            "PreferredAvailabilityZone",
+            "PreferredAvailabilityZones",
+            "PreferredMaintenanceWindow",
+            "SnapshotArns",
+            "SnapshotName",
+            "SnapshotRetentionLimit",
+            "SnapshotWindow",
+            "Tags",
+            "VpcSecurityGroupIds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CacheClusterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoMinorVersionUpgrade=None,
+            AZMode=None,
+            CacheNodeType=None,
+            CacheParameterGroupName=None,
+            CacheSecurityGroupNames=None,
+            CacheSubnetGroupName=None,
+            ClusterName=None,
+            Engine=None,
+            EngineVersion=None,
+            NotificationTopicArn=None,
+            NumCacheNodes=None,
+            Port=None,
+            PreferredAvailabilityZone=None,
+            PreferredAvailabilityZones=None,
+            PreferredMaintenanceWindow=None,
+            SnapshotArns=None,
+            SnapshotName=None,
+            SnapshotRetentionLimit=None,
+            SnapshotWindow=None,
+            Tags=None,
+            VpcSecurityGroupIds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoMinorVersionUpgrade", AutoMinorVersionUpgrade)
+            _setattr("AZMode", AZMode)
+            _setattr("CacheNodeType", CacheNodeType)
+            _setattr("CacheParameterGroupName", CacheParameterGroupName)
+            _setattr("CacheSecurityGroupNames", CacheSecurityGroupNames)
+            _setattr("CacheSubnetGroupName", CacheSubnetGroupName)
+            _setattr("ClusterName", ClusterName)
+            _setattr("Engine", Engine)
+            _setattr("EngineVersion", EngineVersion)
+            _setattr("NotificationTopicArn", NotificationTopicArn)
+            _setattr("NumCacheNodes", NumCacheNodes)
+            _setattr("Port", Port)
+            _setattr("PreferredAvailabilityZone", PreferredAvailabilityZone)
+            _setattr("PreferredAvailabilityZones", PreferredAvailabilityZones)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr("SnapshotArns", SnapshotArns)
+            _setattr("SnapshotName", SnapshotName)
+            _setattr("SnapshotRetentionLimit", SnapshotRetentionLimit)
+            _setattr("SnapshotWindow", SnapshotWindow)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcSecurityGroupIds", VpcSecurityGroupIds)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CacheClusterProperties = create_object_converter(CacheClusterProperties)
+
+    class CacheCluster(_Resource):
+        """A Cache Cluster for ElastiCache.
+
+        See Also:
+            `AWS Cloud Formation documentation for CacheCluster
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-cache-cluster.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElastiCache::CacheCluster"
+
+        Properties: CacheClusterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CacheCluster",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CacheClusterProperties},
+            factories={"Properties": CacheClusterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CacheClusterProperties()
+            _setattr("Properties", _convert_CacheClusterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return CacheCluster, CacheClusterProperties
+
+
+def _create_ParameterGroup():
+    class ParameterGroupProperties(_ResourceProperties):
+        __slots__ = ("CacheParameterGroupFamily", "Description", "Properties")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ParameterGroupProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CacheParameterGroupFamily=None,
+            Description=None,
+            Properties=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CacheParameterGroupFamily", CacheParameterGroupFamily)
+            _setattr("Description", Description)
+            _setattr("Properties", Properties)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ParameterGroupProperties = create_object_converter(
+        ParameterGroupProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ParameterGroupProperties(ResourceProperties):
-    CacheParameterGroupFamily = attrib(default=None)
-    Description = attrib(default=None)
-    Properties = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ParameterGroup(Resource):
-    """A Parameter Group for ElastiCache.
-
-    See Also:
-        `AWS Cloud Formation documentation for ParameterGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-parameter-group.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ElastiCache::ParameterGroup"
-
-    Properties: ParameterGroupProperties = attrib(
-        factory=ParameterGroupProperties,
-        converter=create_object_converter(ParameterGroupProperties),
+    class ParameterGroup(_Resource):
+        """A Parameter Group for ElastiCache.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParameterGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-parameter-group.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElastiCache::ParameterGroup"
+
+        Properties: ParameterGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ParameterGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ParameterGroupProperties},
+            factories={"Properties": ParameterGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ParameterGroupProperties()
+            _setattr("Properties", _convert_ParameterGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ParameterGroup, ParameterGroupProperties
+
+
+def _create_ReplicationGroup():
+    class ReplicationGroupNodeGroupConfiguration(_PropertyType):
+        """The Node Group Configuration property type for ReplicationGroup in ElastiCache.
+
+        See Also:
+            `AWS Cloud Formation documentation for NodeGroupConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-replicationgroup-nodegroupconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "NodeGroupId",
+            "PrimaryAvailabilityZone",
+            "ReplicaAvailabilityZones",
+            "ReplicaCount",
+            "Slots",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReplicationGroupNodeGroupConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            NodeGroupId=None,
+            PrimaryAvailabilityZone=None,
+            ReplicaAvailabilityZones=None,
+            ReplicaCount=None,
+            Slots=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NodeGroupId", NodeGroupId)
+            _setattr("PrimaryAvailabilityZone", PrimaryAvailabilityZone)
+            _setattr("ReplicaAvailabilityZones", ReplicaAvailabilityZones)
+            _setattr("ReplicaCount", ReplicaCount)
+            _setattr("Slots", Slots)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ReplicationGroupNodeGroupConfiguration_list = create_object_list_converter(
+        ReplicationGroupNodeGroupConfiguration
     )
-
-
-@attrs(**ATTRSCONFIG)
-class ReplicationGroupProperties(ResourceProperties):
-    AtRestEncryptionEnabled = attrib(default=None)
-    AuthToken = attrib(default=None)
-    AutomaticFailoverEnabled = attrib(default=None)
-    AutoMinorVersionUpgrade = attrib(default=None)
-    CacheNodeType = attrib(default=None)
-    CacheParameterGroupName = attrib(default=None)
-    CacheSecurityGroupNames = attrib(default=None)
-    CacheSubnetGroupName = attrib(default=None)
-    Engine = attrib(default=None)
-    EngineVersion = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    NodeGroupConfiguration = attrib(default=None)
-    NotificationTopicArn = attrib(default=None)
-    NumCacheClusters = attrib(default=None)
-    NumNodeGroups = attrib(default=None)
-    Port = attrib(default=None)
-    PreferredCacheClusterAZs = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    PrimaryClusterId = attrib(default=None)
-    ReplicasPerNodeGroup = attrib(default=None)
-    ReplicationGroupDescription = attrib(default=None)
-    ReplicationGroupId = attrib(default=None)
-    SecurityGroupIds = attrib(default=None)
-    SnapshotArns = attrib(default=None)
-    SnapshotName = attrib(default=None)
-    SnapshotRetentionLimit = attrib(default=None)
-    SnapshottingClusterId = attrib(default=None)
-    SnapshotWindow = attrib(default=None)
-    Tags = attrib(default=None)
-    TransitEncryptionEnabled = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ReplicationGroup(Resource):
-    """A Replication Group for ElastiCache.
-
-    See Also:
-        `AWS Cloud Formation documentation for ReplicationGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticache-replicationgroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ElastiCache::ReplicationGroup"
-
-    Properties: ReplicationGroupProperties = attrib(
-        factory=ReplicationGroupProperties,
-        converter=create_object_converter(ReplicationGroupProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ReplicationGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "AtRestEncryptionEnabled",
+            "AuthToken",
+            "AutomaticFailoverEnabled",
+            "AutoMinorVersionUpgrade",
+            "CacheNodeType",
+            "CacheParameterGroupName",
+            "CacheSecurityGroupNames",
+            "CacheSubnetGroupName",
+            "Engine",
+            "EngineVersion",
+            "KmsKeyId",
+            "NodeGroupConfiguration",
+            "NotificationTopicArn",
+            "NumCacheClusters",
+            "NumNodeGroups",
+            "Port",
+            "PreferredCacheClusterAZs",
+            "PreferredMaintenanceWindow",
+            "PrimaryClusterId",
+            "ReplicasPerNodeGroup",
+            "ReplicationGroupDescription",
+            "ReplicationGroupId",
+            "SecurityGroupIds",
+            "SnapshotArns",
+            "SnapshotName",
+            "SnapshotRetentionLimit",
+            "SnapshottingClusterId",
+            "SnapshotWindow",
+            "Tags",
+            "TransitEncryptionEnabled",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReplicationGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "NodeGroupConfiguration": _convert_ReplicationGroupNodeGroupConfiguration_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AtRestEncryptionEnabled=None,
+            AuthToken=None,
+            AutomaticFailoverEnabled=None,
+            AutoMinorVersionUpgrade=None,
+            CacheNodeType=None,
+            CacheParameterGroupName=None,
+            CacheSecurityGroupNames=None,
+            CacheSubnetGroupName=None,
+            Engine=None,
+            EngineVersion=None,
+            KmsKeyId=None,
+            NodeGroupConfiguration=None,
+            NotificationTopicArn=None,
+            NumCacheClusters=None,
+            NumNodeGroups=None,
+            Port=None,
+            PreferredCacheClusterAZs=None,
+            PreferredMaintenanceWindow=None,
+            PrimaryClusterId=None,
+            ReplicasPerNodeGroup=None,
+            ReplicationGroupDescription=None,
+            ReplicationGroupId=None,
+            SecurityGroupIds=None,
+            SnapshotArns=None,
+            SnapshotName=None,
+            SnapshotRetentionLimit=None,
+            SnapshottingClusterId=None,
+            SnapshotWindow=None,
+            Tags=None,
+            TransitEncryptionEnabled=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AtRestEncryptionEnabled", AtRestEncryptionEnabled)
+            _setattr("AuthToken", AuthToken)
+            _setattr("AutomaticFailoverEnabled", AutomaticFailoverEnabled)
+            _setattr("AutoMinorVersionUpgrade", AutoMinorVersionUpgrade)
+            _setattr("CacheNodeType", CacheNodeType)
+            _setattr("CacheParameterGroupName", CacheParameterGroupName)
+            _setattr("CacheSecurityGroupNames", CacheSecurityGroupNames)
+            _setattr("CacheSubnetGroupName", CacheSubnetGroupName)
+            _setattr("Engine", Engine)
+            _setattr("EngineVersion", EngineVersion)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr(
+                "NodeGroupConfiguration",
+                _convert_ReplicationGroupNodeGroupConfiguration_list(
+                    NodeGroupConfiguration
+                ),
+            )
+            _setattr("NotificationTopicArn", NotificationTopicArn)
+            _setattr("NumCacheClusters", NumCacheClusters)
+            _setattr("NumNodeGroups", NumNodeGroups)
+            _setattr("Port", Port)
+            _setattr("PreferredCacheClusterAZs", PreferredCacheClusterAZs)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr("PrimaryClusterId", PrimaryClusterId)
+            _setattr("ReplicasPerNodeGroup", ReplicasPerNodeGroup)
+            _setattr("ReplicationGroupDescription", ReplicationGroupDescription)
+            _setattr("ReplicationGroupId", ReplicationGroupId)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SnapshotArns", SnapshotArns)
+            _setattr("SnapshotName", SnapshotName)
+            _setattr("SnapshotRetentionLimit", SnapshotRetentionLimit)
+            _setattr("SnapshottingClusterId", SnapshottingClusterId)
+            _setattr("SnapshotWindow", SnapshotWindow)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TransitEncryptionEnabled", TransitEncryptionEnabled)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ReplicationGroupProperties = create_object_converter(
+        ReplicationGroupProperties
     )
 
-    # NB: UpdatePolicy may be set for ReplicationGroup
-    # (unlike most Resource types)
-    UpdatePolicy: Dict[str, Any] = attrib(factory=dict)
-
-
-@attrs(**ATTRSCONFIG)
-class SecurityGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SecurityGroup(Resource):
-    """A Security Group for ElastiCache.
-
-    See Also:
-        `AWS Cloud Formation documentation for SecurityGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-security-group.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ElastiCache::SecurityGroup"
-
-    Properties: SecurityGroupProperties = attrib(
-        factory=SecurityGroupProperties,
-        converter=create_object_converter(SecurityGroupProperties),
+    class ReplicationGroup(_Resource):
+        """A Replication Group for ElastiCache.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReplicationGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticache-replicationgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElastiCache::ReplicationGroup"
+
+        Properties: ReplicationGroupProperties
+
+        # NB: UpdatePolicy may be set for ReplicationGroup
+        # (unlike most Resource types)
+        UpdatePolicy: Dict[str, Any]
+
+        __slots__ = ("Properties", "UpdatePolicy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReplicationGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ReplicationGroupProperties},
+            factories={"Properties": ReplicationGroupProperties, "UpdatePolicy": dict},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Properties=NOTHING,
+            UpdatePolicy: Dict[str, Any] = NOTHING,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ReplicationGroupProperties()
+            _setattr("Properties", _convert_ReplicationGroupProperties(Properties))
+            if UpdatePolicy is NOTHING:
+                UpdatePolicy = dict()
+            _setattr("UpdatePolicy", UpdatePolicy)
+            _init_Resource(self, kwargs)
+
+    return (
+        ReplicationGroup,
+        ReplicationGroupProperties,
+        ReplicationGroupNodeGroupConfiguration,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class SecurityGroupIngressProperties(ResourceProperties):
-    CacheSecurityGroupName = attrib(default=None)
-    EC2SecurityGroupName = attrib(default=None)
-    EC2SecurityGroupOwnerId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SecurityGroupIngress(Resource):
-    """A Security Group Ingress for ElastiCache.
-
-    See Also:
-        `AWS Cloud Formation documentation for SecurityGroupIngress
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-security-group-ingress.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ElastiCache::SecurityGroupIngress"
-
-    Properties: SecurityGroupIngressProperties = attrib(
-        factory=SecurityGroupIngressProperties,
-        converter=create_object_converter(SecurityGroupIngressProperties),
+def _create_SecurityGroup():
+    class SecurityGroupProperties(_ResourceProperties):
+        __slots__ = ("Description",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Description=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SecurityGroupProperties = create_object_converter(SecurityGroupProperties)
+
+    class SecurityGroup(_Resource):
+        """A Security Group for ElastiCache.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecurityGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-security-group.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElastiCache::SecurityGroup"
+
+        Properties: SecurityGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SecurityGroupProperties},
+            factories={"Properties": SecurityGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SecurityGroupProperties()
+            _setattr("Properties", _convert_SecurityGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SecurityGroup, SecurityGroupProperties
+
+
+def _create_SecurityGroupIngress():
+    class SecurityGroupIngressProperties(_ResourceProperties):
+        __slots__ = (
+            "CacheSecurityGroupName",
+            "EC2SecurityGroupName",
+            "EC2SecurityGroupOwnerId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupIngressProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CacheSecurityGroupName=None,
+            EC2SecurityGroupName=None,
+            EC2SecurityGroupOwnerId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CacheSecurityGroupName", CacheSecurityGroupName)
+            _setattr("EC2SecurityGroupName", EC2SecurityGroupName)
+            _setattr("EC2SecurityGroupOwnerId", EC2SecurityGroupOwnerId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SecurityGroupIngressProperties = create_object_converter(
+        SecurityGroupIngressProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class SubnetGroupProperties(ResourceProperties):
-    CacheSubnetGroupName = attrib(default=None)
-    Description = attrib(default=None)
-    SubnetIds = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SubnetGroup(Resource):
-    """A Subnet Group for ElastiCache.
-
-    See Also:
-        `AWS Cloud Formation documentation for SubnetGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-subnetgroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ElastiCache::SubnetGroup"
-
-    Properties: SubnetGroupProperties = attrib(
-        factory=SubnetGroupProperties,
-        converter=create_object_converter(SubnetGroupProperties),
-    )
+    class SecurityGroupIngress(_Resource):
+        """A Security Group Ingress for ElastiCache.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecurityGroupIngress
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-security-group-ingress.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElastiCache::SecurityGroupIngress"
+
+        Properties: SecurityGroupIngressProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityGroupIngress",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SecurityGroupIngressProperties},
+            factories={"Properties": SecurityGroupIngressProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SecurityGroupIngressProperties()
+            _setattr("Properties", _convert_SecurityGroupIngressProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SecurityGroupIngress, SecurityGroupIngressProperties
+
+
+def _create_SubnetGroup():
+    class SubnetGroupProperties(_ResourceProperties):
+        __slots__ = ("CacheSubnetGroupName", "Description", "SubnetIds")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetGroupProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CacheSubnetGroupName=None,
+            Description=None,
+            SubnetIds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CacheSubnetGroupName", CacheSubnetGroupName)
+            _setattr("Description", Description)
+            _setattr("SubnetIds", SubnetIds)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubnetGroupProperties = create_object_converter(SubnetGroupProperties)
+
+    class SubnetGroup(_Resource):
+        """A Subnet Group for ElastiCache.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubnetGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticache-subnetgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElastiCache::SubnetGroup"
+
+        Properties: SubnetGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubnetGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubnetGroupProperties},
+            factories={"Properties": SubnetGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubnetGroupProperties()
+            _setattr("Properties", _convert_SubnetGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SubnetGroup, SubnetGroupProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "CacheCluster": _create_CacheCluster,
+        "CacheClusterProperties": _create_CacheCluster,
+        "ParameterGroup": _create_ParameterGroup,
+        "ParameterGroupProperties": _create_ParameterGroup,
+        "ReplicationGroup": _create_ReplicationGroup,
+        "ReplicationGroupProperties": _create_ReplicationGroup,
+        "ReplicationGroupNodeGroupConfiguration": _create_ReplicationGroup,
+        "SecurityGroup": _create_SecurityGroup,
+        "SecurityGroupProperties": _create_SecurityGroup,
+        "SecurityGroupIngress": _create_SecurityGroupIngress,
+        "SecurityGroupIngressProperties": _create_SecurityGroupIngress,
+        "SubnetGroup": _create_SubnetGroup,
+        "SubnetGroupProperties": _create_SubnetGroup,
+    },
+)
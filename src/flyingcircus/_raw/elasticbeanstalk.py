@@ -7,129 +7,677 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Application",
     "ApplicationProperties",
+    "ApplicationApplicationResourceLifecycleConfig",
+    "ApplicationApplicationVersionLifecycleConfig",
+    "ApplicationMaxAgeRule",
+    "ApplicationMaxCountRule",
     "ApplicationVersion",
     "ApplicationVersionProperties",
+    "ApplicationVersionSourceBundle",
     "ConfigurationTemplate",
     "ConfigurationTemplateProperties",
+    "ConfigurationTemplateConfigurationOptionSetting",
+    "ConfigurationTemplateSourceConfiguration",
     "Environment",
     "EnvironmentProperties",
+    "EnvironmentOptionSetting",
+    "EnvironmentTier",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ApplicationProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    Description = attrib(default=None)
-    ResourceLifecycleConfig = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Application(Resource):
-    """A Application for ElasticBeanstalk.
-
-    See Also:
-        `AWS Cloud Formation documentation for Application
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-beanstalk.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ElasticBeanstalk::Application"
-
-    Properties: ApplicationProperties = attrib(
-        factory=ApplicationProperties,
-        converter=create_object_converter(ApplicationProperties),
+def _create_Application():
+    class ApplicationMaxAgeRule(_PropertyType):
+        """The Max Age Rule property type for Application in ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for MaxAgeRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticbeanstalk-application-maxagerule.html>`_
+        """
+
+        __slots__ = ("DeleteSourceFromS3", "Enabled", "MaxAgeInDays")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationMaxAgeRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeleteSourceFromS3=None, Enabled=None, MaxAgeInDays=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteSourceFromS3", DeleteSourceFromS3)
+            _setattr("Enabled", Enabled)
+            _setattr("MaxAgeInDays", MaxAgeInDays)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationMaxCountRule(_PropertyType):
+        """The Max Count Rule property type for Application in ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for MaxCountRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticbeanstalk-application-maxcountrule.html>`_
+        """
+
+        __slots__ = ("DeleteSourceFromS3", "Enabled", "MaxCount")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationMaxCountRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeleteSourceFromS3=None, Enabled=None, MaxCount=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteSourceFromS3", DeleteSourceFromS3)
+            _setattr("Enabled", Enabled)
+            _setattr("MaxCount", MaxCount)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationMaxAgeRule = create_object_converter(ApplicationMaxAgeRule)
+    _convert_ApplicationMaxCountRule = create_object_converter(ApplicationMaxCountRule)
+
+    class ApplicationApplicationVersionLifecycleConfig(_PropertyType):
+        """The Application Version Lifecycle Config property type for Application in ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationVersionLifecycleConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticbeanstalk-application-applicationversionlifecycleconfig.html>`_
+        """
+
+        __slots__ = ("MaxAgeRule", "MaxCountRule")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationApplicationVersionLifecycleConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "MaxAgeRule": _convert_ApplicationMaxAgeRule,
+                "MaxCountRule": _convert_ApplicationMaxCountRule,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MaxAgeRule=None, MaxCountRule=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaxAgeRule", _convert_ApplicationMaxAgeRule(MaxAgeRule))
+            _setattr("MaxCountRule", _convert_ApplicationMaxCountRule(MaxCountRule))
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationApplicationVersionLifecycleConfig = create_object_converter(
+        ApplicationApplicationVersionLifecycleConfig
     )
 
+    class ApplicationApplicationResourceLifecycleConfig(_PropertyType):
+        """The Application Resource Lifecycle Config property type for Application in ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationResourceLifecycleConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticbeanstalk-application-applicationresourcelifecycleconfig.html>`_
+        """
+
+        __slots__ = ("ServiceRole", "VersionLifecycleConfig")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationApplicationResourceLifecycleConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "VersionLifecycleConfig": _convert_ApplicationApplicationVersionLifecycleConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ServiceRole=None, VersionLifecycleConfig=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ServiceRole", ServiceRole)
+            _setattr(
+                "VersionLifecycleConfig",
+                _convert_ApplicationApplicationVersionLifecycleConfig(
+                    VersionLifecycleConfig
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationApplicationResourceLifecycleConfig = create_object_converter(
+        ApplicationApplicationResourceLifecycleConfig
+    )
 
-@attrs(**ATTRSCONFIG)
-class ApplicationVersionProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    Description = attrib(default=None)
-    SourceBundle = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ApplicationVersion(Resource):
-    """A Application Version for ElasticBeanstalk.
-
-    See Also:
-        `AWS Cloud Formation documentation for ApplicationVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-beanstalk-version.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ElasticBeanstalk::ApplicationVersion"
-
-    Properties: ApplicationVersionProperties = attrib(
-        factory=ApplicationVersionProperties,
-        converter=create_object_converter(ApplicationVersionProperties),
+    class ApplicationProperties(_ResourceProperties):
+        __slots__ = ("ApplicationName", "Description", "ResourceLifecycleConfig")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ResourceLifecycleConfig": _convert_ApplicationApplicationResourceLifecycleConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationName=None,
+            Description=None,
+            ResourceLifecycleConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("Description", Description)
+            _setattr(
+                "ResourceLifecycleConfig",
+                _convert_ApplicationApplicationResourceLifecycleConfig(
+                    ResourceLifecycleConfig
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationProperties = create_object_converter(ApplicationProperties)
+
+    class Application(_Resource):
+        """A Application for ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for Application
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-beanstalk.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElasticBeanstalk::Application"
+
+        Properties: ApplicationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Application",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApplicationProperties},
+            factories={"Properties": ApplicationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationProperties()
+            _setattr("Properties", _convert_ApplicationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Application,
+        ApplicationProperties,
+        ApplicationMaxAgeRule,
+        ApplicationMaxCountRule,
+        ApplicationApplicationVersionLifecycleConfig,
+        ApplicationApplicationResourceLifecycleConfig,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationTemplateProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    Description = attrib(default=None)
-    EnvironmentId = attrib(default=None)
-    OptionSettings = attrib(default=None)
-    PlatformArn = attrib(default=None)
-    SolutionStackName = attrib(default=None)
-    SourceConfiguration = attrib(default=None)
+def _create_ApplicationVersion():
+    class ApplicationVersionSourceBundle(_PropertyType):
+        """The Source Bundle property type for ApplicationVersion in ElasticBeanstalk.
 
+        See Also:
+            `AWS Cloud Formation documentation for SourceBundle
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-beanstalk-sourcebundle.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationTemplate(Resource):
-    """A Configuration Template for ElasticBeanstalk.
+        __slots__ = ("S3Bucket", "S3Key")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationVersionSourceBundle", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for ConfigurationTemplate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticbeanstalk-configurationtemplate.html>`_
-    """
+        def __init__(self, *, S3Bucket=None, S3Key=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("S3Bucket", S3Bucket)
+            _setattr("S3Key", S3Key)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::ElasticBeanstalk::ConfigurationTemplate"
+    _convert_ApplicationVersionSourceBundle = create_object_converter(
+        ApplicationVersionSourceBundle
+    )
 
-    Properties: ConfigurationTemplateProperties = attrib(
-        factory=ConfigurationTemplateProperties,
-        converter=create_object_converter(ConfigurationTemplateProperties),
+    class ApplicationVersionProperties(_ResourceProperties):
+        __slots__ = ("ApplicationName", "Description", "SourceBundle")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationVersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"SourceBundle": _convert_ApplicationVersionSourceBundle},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApplicationName=None, Description=None, SourceBundle=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("Description", Description)
+            _setattr(
+                "SourceBundle", _convert_ApplicationVersionSourceBundle(SourceBundle)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationVersionProperties = create_object_converter(
+        ApplicationVersionProperties
     )
 
+    class ApplicationVersion(_Resource):
+        """A Application Version for ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-beanstalk-version.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElasticBeanstalk::ApplicationVersion"
+
+        Properties: ApplicationVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApplicationVersionProperties},
+            factories={"Properties": ApplicationVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationVersionProperties()
+            _setattr("Properties", _convert_ApplicationVersionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ApplicationVersion,
+        ApplicationVersionProperties,
+        ApplicationVersionSourceBundle,
+    )
 
-@attrs(**ATTRSCONFIG)
-class EnvironmentProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    CNAMEPrefix = attrib(default=None)
-    Description = attrib(default=None)
-    EnvironmentName = attrib(default=None)
-    OptionSettings = attrib(default=None)
-    PlatformArn = attrib(default=None)
-    SolutionStackName = attrib(default=None)
-    Tags = attrib(default=None)
-    TemplateName = attrib(default=None)
-    Tier = attrib(default=None)
-    VersionLabel = attrib(default=None)
 
+def _create_ConfigurationTemplate():
+    class ConfigurationTemplateConfigurationOptionSetting(_PropertyType):
+        """The Configuration Option Setting property type for ConfigurationTemplate in ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationOptionSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticbeanstalk-configurationtemplate-configurationoptionsetting.html>`_
+        """
+
+        __slots__ = ("Namespace", "OptionName", "ResourceName", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationTemplateConfigurationOptionSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Namespace=None,
+            OptionName=None,
+            ResourceName=None,
+            Value=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Namespace", Namespace)
+            _setattr("OptionName", OptionName)
+            _setattr("ResourceName", ResourceName)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationTemplateSourceConfiguration(_PropertyType):
+        """The Source Configuration property type for ConfigurationTemplate in ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for SourceConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticbeanstalk-configurationtemplate-sourceconfiguration.html>`_
+        """
+
+        __slots__ = ("ApplicationName", "TemplateName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationTemplateSourceConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApplicationName=None, TemplateName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("TemplateName", TemplateName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationTemplateConfigurationOptionSetting_list = (
+        create_object_list_converter(ConfigurationTemplateConfigurationOptionSetting)
+    )
+    _convert_ConfigurationTemplateSourceConfiguration = create_object_converter(
+        ConfigurationTemplateSourceConfiguration
+    )
 
-@attrs(**ATTRSCONFIG)
-class Environment(Resource):
-    """A Environment for ElasticBeanstalk.
+    class ConfigurationTemplateProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationName",
+            "Description",
+            "EnvironmentId",
+            "OptionSettings",
+            "PlatformArn",
+            "SolutionStackName",
+            "SourceConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationTemplateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "OptionSettings": _convert_ConfigurationTemplateConfigurationOptionSetting_list,
+                "SourceConfiguration": _convert_ConfigurationTemplateSourceConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationName=None,
+            Description=None,
+            EnvironmentId=None,
+            OptionSettings=None,
+            PlatformArn=None,
+            SolutionStackName=None,
+            SourceConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("Description", Description)
+            _setattr("EnvironmentId", EnvironmentId)
+            _setattr(
+                "OptionSettings",
+                _convert_ConfigurationTemplateConfigurationOptionSetting_list(
+                    OptionSettings
+                ),
+            )
+            _setattr("PlatformArn", PlatformArn)
+            _setattr("SolutionStackName", SolutionStackName)
+            _setattr(
+                "SourceConfiguration",
+                _convert_ConfigurationTemplateSourceConfiguration(SourceConfiguration),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConfigurationTemplateProperties = create_object_converter(
+        ConfigurationTemplateProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for Environment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-beanstalk-environment.html>`_
-    """
+    class ConfigurationTemplate(_Resource):
+        """A Configuration Template for ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticbeanstalk-configurationtemplate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElasticBeanstalk::ConfigurationTemplate"
+
+        Properties: ConfigurationTemplateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationTemplate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConfigurationTemplateProperties},
+            factories={"Properties": ConfigurationTemplateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigurationTemplateProperties()
+            _setattr("Properties", _convert_ConfigurationTemplateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ConfigurationTemplate,
+        ConfigurationTemplateProperties,
+        ConfigurationTemplateConfigurationOptionSetting,
+        ConfigurationTemplateSourceConfiguration,
+    )
 
-    RESOURCE_TYPE = "AWS::ElasticBeanstalk::Environment"
 
-    Properties: EnvironmentProperties = attrib(
-        factory=EnvironmentProperties,
-        converter=create_object_converter(EnvironmentProperties),
+def _create_Environment():
+    class EnvironmentOptionSetting(_PropertyType):
+        """The Option Setting property type for Environment in ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for OptionSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-beanstalk-option-settings.html>`_
+        """
+
+        __slots__ = ("Namespace", "OptionName", "ResourceName", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EnvironmentOptionSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Namespace=None,
+            OptionName=None,
+            ResourceName=None,
+            Value=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Namespace", Namespace)
+            _setattr("OptionName", OptionName)
+            _setattr("ResourceName", ResourceName)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class EnvironmentTier(_PropertyType):
+        """The Tier property type for Environment in ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for Tier
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-beanstalk-environment-tier.html>`_
+        """
+
+        __slots__ = ("Name", "Type", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EnvironmentTier", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Type=None, Version=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Type", Type)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EnvironmentOptionSetting_list = create_object_list_converter(
+        EnvironmentOptionSetting
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_EnvironmentTier = create_object_converter(EnvironmentTier)
+
+    class EnvironmentProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationName",
+            "CNAMEPrefix",
+            "Description",
+            "EnvironmentName",
+            "OptionSettings",
+            "PlatformArn",
+            "SolutionStackName",
+            "Tags",
+            "TemplateName",
+            "Tier",
+            "VersionLabel",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EnvironmentProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "OptionSettings": _convert_EnvironmentOptionSetting_list,
+                "Tags": _convert_Tag_list,
+                "Tier": _convert_EnvironmentTier,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationName=None,
+            CNAMEPrefix=None,
+            Description=None,
+            EnvironmentName=None,
+            OptionSettings=None,
+            PlatformArn=None,
+            SolutionStackName=None,
+            Tags=None,
+            TemplateName=None,
+            Tier=None,
+            VersionLabel=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("CNAMEPrefix", CNAMEPrefix)
+            _setattr("Description", Description)
+            _setattr("EnvironmentName", EnvironmentName)
+            _setattr(
+                "OptionSettings", _convert_EnvironmentOptionSetting_list(OptionSettings)
+            )
+            _setattr("PlatformArn", PlatformArn)
+            _setattr("SolutionStackName", SolutionStackName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TemplateName", TemplateName)
+            _setattr("Tier", _convert_EnvironmentTier(Tier))
+            _setattr("VersionLabel", VersionLabel)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EnvironmentProperties = create_object_converter(EnvironmentProperties)
+
+    class Environment(_Resource):
+        """A Environment for ElasticBeanstalk.
+
+        See Also:
+            `AWS Cloud Formation documentation for Environment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-beanstalk-environment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElasticBeanstalk::Environment"
+
+        Properties: EnvironmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Environment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EnvironmentProperties},
+            factories={"Properties": EnvironmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EnvironmentProperties()
+            _setattr("Properties", _convert_EnvironmentProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Environment, EnvironmentProperties, EnvironmentOptionSetting, EnvironmentTier
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Application": _create_Application,
+        "ApplicationProperties": _create_Application,
+        "ApplicationApplicationResourceLifecycleConfig": _create_Application,
+        "ApplicationApplicationVersionLifecycleConfig": _create_Application,
+        "ApplicationMaxAgeRule": _create_Application,
+        "ApplicationMaxCountRule": _create_Application,
+        "ApplicationVersion": _create_ApplicationVersion,
+        "ApplicationVersionProperties": _create_ApplicationVersion,
+        "ApplicationVersionSourceBundle": _create_ApplicationVersion,
+        "ConfigurationTemplate": _create_ConfigurationTemplate,
+        "ConfigurationTemplateProperties": _create_ConfigurationTemplate,
+        "ConfigurationTemplateConfigurationOptionSetting": _create_ConfigurationTemplate,
+        "ConfigurationTemplateSourceConfiguration": _create_ConfigurationTemplate,
+        "Environment": _create_Environment,
+        "EnvironmentProperties": _create_Environment,
+        "EnvironmentOptionSetting": _create_Environment,
+        "EnvironmentTier": _create_Environment,
+    },
+)
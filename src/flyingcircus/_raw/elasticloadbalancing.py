@@ -7,49 +7,464 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["LoadBalancer", "LoadBalancerProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "LoadBalancer",
+    "LoadBalancerProperties",
+    "LoadBalancerAccessLoggingPolicy",
+    "LoadBalancerAppCookieStickinessPolicy",
+    "LoadBalancerConnectionDrainingPolicy",
+    "LoadBalancerConnectionSettings",
+    "LoadBalancerHealthCheck",
+    "LoadBalancerLBCookieStickinessPolicy",
+    "LoadBalancerListeners",
+    "LoadBalancerPolicies",
+]
 
-@attrs(**ATTRSCONFIG)
-class LoadBalancerProperties(ResourceProperties):
-    AccessLoggingPolicy = attrib(default=None)
-    AppCookieStickinessPolicy = attrib(default=None)
-    AvailabilityZones = attrib(default=None)
-    ConnectionDrainingPolicy = attrib(default=None)
-    ConnectionSettings = attrib(default=None)
-    CrossZone = attrib(default=None)
-    HealthCheck = attrib(default=None)
-    Instances = attrib(default=None)
-    LBCookieStickinessPolicy = attrib(default=None)
-    Listeners = attrib(default=None)
-    LoadBalancerName = attrib(default=None)
-    Policies = attrib(default=None)
-    Scheme = attrib(default=None)
-    SecurityGroups = attrib(default=None)
-    Subnets = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_LoadBalancer():
+    class LoadBalancerAccessLoggingPolicy(_PropertyType):
+        """The Access Logging Policy property type for LoadBalancer in ElasticLoadBalancing.
 
-@attrs(**ATTRSCONFIG)
-class LoadBalancer(Resource):
-    """A Load Balancer for ElasticLoadBalancing.
+        See Also:
+            `AWS Cloud Formation documentation for AccessLoggingPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb-accessloggingpolicy.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for LoadBalancer
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb.html>`_
-    """
+        __slots__ = ("EmitInterval", "Enabled", "S3BucketName", "S3BucketPrefix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerAccessLoggingPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::ElasticLoadBalancing::LoadBalancer"
+        def __init__(
+            self,
+            *,
+            EmitInterval=None,
+            Enabled=None,
+            S3BucketName=None,
+            S3BucketPrefix=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EmitInterval", EmitInterval)
+            _setattr("Enabled", Enabled)
+            _setattr("S3BucketName", S3BucketName)
+            _setattr("S3BucketPrefix", S3BucketPrefix)
+            _init_PropertyType(self, kwargs)
 
-    Properties: LoadBalancerProperties = attrib(
-        factory=LoadBalancerProperties,
-        converter=create_object_converter(LoadBalancerProperties),
+    class LoadBalancerAppCookieStickinessPolicy(_PropertyType):
+        """The App Cookie Stickiness Policy property type for LoadBalancer in ElasticLoadBalancing.
+
+        See Also:
+            `AWS Cloud Formation documentation for AppCookieStickinessPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb-AppCookieStickinessPolicy.html>`_
+        """
+
+        __slots__ = ("CookieName", "PolicyName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerAppCookieStickinessPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CookieName=None, PolicyName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CookieName", CookieName)
+            _setattr("PolicyName", PolicyName)
+            _init_PropertyType(self, kwargs)
+
+    class LoadBalancerConnectionDrainingPolicy(_PropertyType):
+        """The Connection Draining Policy property type for LoadBalancer in ElasticLoadBalancing.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConnectionDrainingPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb-connectiondrainingpolicy.html>`_
+        """
+
+        __slots__ = ("Enabled", "Timeout")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerConnectionDrainingPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Enabled=None, Timeout=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr("Timeout", Timeout)
+            _init_PropertyType(self, kwargs)
+
+    class LoadBalancerConnectionSettings(_PropertyType):
+        """The Connection Settings property type for LoadBalancer in ElasticLoadBalancing.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConnectionSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb-connectionsettings.html>`_
+        """
+
+        __slots__ = ("IdleTimeout",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerConnectionSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, IdleTimeout=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IdleTimeout", IdleTimeout)
+            _init_PropertyType(self, kwargs)
+
+    class LoadBalancerHealthCheck(_PropertyType):
+        """The Health Check property type for LoadBalancer in ElasticLoadBalancing.
+
+        See Also:
+            `AWS Cloud Formation documentation for HealthCheck
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb-health-check.html>`_
+        """
+
+        __slots__ = (
+            "HealthyThreshold",
+            "Interval",
+            "Target",
+            "Timeout",
+            "UnhealthyThreshold",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerHealthCheck", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            HealthyThreshold=None,
+            Interval=None,
+            Target=None,
+            Timeout=None,
+            UnhealthyThreshold=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HealthyThreshold", HealthyThreshold)
+            _setattr("Interval", Interval)
+            _setattr("Target", Target)
+            _setattr("Timeout", Timeout)
+            _setattr("UnhealthyThreshold", UnhealthyThreshold)
+            _init_PropertyType(self, kwargs)
+
+    class LoadBalancerLBCookieStickinessPolicy(_PropertyType):
+        """The Lb Cookie Stickiness Policy property type for LoadBalancer in ElasticLoadBalancing.
+
+        See Also:
+            `AWS Cloud Formation documentation for LBCookieStickinessPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb-LBCookieStickinessPolicy.html>`_
+        """
+
+        __slots__ = ("CookieExpirationPeriod", "PolicyName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerLBCookieStickinessPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CookieExpirationPeriod=None, PolicyName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CookieExpirationPeriod", CookieExpirationPeriod)
+            _setattr("PolicyName", PolicyName)
+            _init_PropertyType(self, kwargs)
+
+    class LoadBalancerListeners(_PropertyType):
+        """The Listeners property type for LoadBalancer in ElasticLoadBalancing.
+
+        See Also:
+            `AWS Cloud Formation documentation for Listeners
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb-listener.html>`_
+        """
+
+        __slots__ = (
+            "InstancePort",
+            "InstanceProtocol",
+            "LoadBalancerPort",
+            "PolicyNames",
+            "Protocol",
+            "SSLCertificateId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerListeners", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            InstancePort=None,
+            InstanceProtocol=None,
+            LoadBalancerPort=None,
+            PolicyNames=None,
+            Protocol=None,
+            SSLCertificateId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InstancePort", InstancePort)
+            _setattr("InstanceProtocol", InstanceProtocol)
+            _setattr("LoadBalancerPort", LoadBalancerPort)
+            _setattr("PolicyNames", PolicyNames)
+            _setattr("Protocol", Protocol)
+            _setattr("SSLCertificateId", SSLCertificateId)
+            _init_PropertyType(self, kwargs)
+
+    class LoadBalancerPolicies(_PropertyType):
+        """The Policies property type for LoadBalancer in ElasticLoadBalancing.
+
+        See Also:
+            `AWS Cloud Formation documentation for Policies
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb-policy.html>`_
+        """
+
+        __slots__ = (
+            "Attributes",
+            "InstancePorts",
+            "LoadBalancerPorts",
+            "PolicyName",
+            "PolicyType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerPolicies", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Attributes=None,
+            InstancePorts=None,
+            LoadBalancerPorts=None,
+            PolicyName=None,
+            PolicyType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", Attributes)
+            _setattr("InstancePorts", InstancePorts)
+            _setattr("LoadBalancerPorts", LoadBalancerPorts)
+            _setattr("PolicyName", PolicyName)
+            _setattr("PolicyType", PolicyType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LoadBalancerAccessLoggingPolicy = create_object_converter(
+        LoadBalancerAccessLoggingPolicy
+    )
+    _convert_LoadBalancerAppCookieStickinessPolicy_list = create_object_list_converter(
+        LoadBalancerAppCookieStickinessPolicy
+    )
+    _convert_LoadBalancerConnectionDrainingPolicy = create_object_converter(
+        LoadBalancerConnectionDrainingPolicy
     )
+    _convert_LoadBalancerConnectionSettings = create_object_converter(
+        LoadBalancerConnectionSettings
+    )
+    _convert_LoadBalancerHealthCheck = create_object_converter(LoadBalancerHealthCheck)
+    _convert_LoadBalancerLBCookieStickinessPolicy_list = create_object_list_converter(
+        LoadBalancerLBCookieStickinessPolicy
+    )
+    _convert_LoadBalancerListeners_list = create_object_list_converter(
+        LoadBalancerListeners
+    )
+    _convert_LoadBalancerPolicies_list = create_object_list_converter(
+        LoadBalancerPolicies
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class LoadBalancerProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessLoggingPolicy",
+            "AppCookieStickinessPolicy",
+            "AvailabilityZones",
+            "ConnectionDrainingPolicy",
+            "ConnectionSettings",
+            "CrossZone",
+            "HealthCheck",
+            "Instances",
+            "LBCookieStickinessPolicy",
+            "Listeners",
+            "LoadBalancerName",
+            "Policies",
+            "Scheme",
+            "SecurityGroups",
+            "Subnets",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AccessLoggingPolicy": _convert_LoadBalancerAccessLoggingPolicy,
+                "AppCookieStickinessPolicy": _convert_LoadBalancerAppCookieStickinessPolicy_list,
+                "ConnectionDrainingPolicy": _convert_LoadBalancerConnectionDrainingPolicy,
+                "ConnectionSettings": _convert_LoadBalancerConnectionSettings,
+                "HealthCheck": _convert_LoadBalancerHealthCheck,
+                "LBCookieStickinessPolicy": _convert_LoadBalancerLBCookieStickinessPolicy_list,
+                "Listeners": _convert_LoadBalancerListeners_list,
+                "Policies": _convert_LoadBalancerPolicies_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessLoggingPolicy=None,
+            AppCookieStickinessPolicy=None,
+            AvailabilityZones=None,
+            ConnectionDrainingPolicy=None,
+            ConnectionSettings=None,
+            CrossZone=None,
+            HealthCheck=None,
+            Instances=None,
+            LBCookieStickinessPolicy=None,
+            Listeners=None,
+            LoadBalancerName=None,
+            Policies=None,
+            Scheme=None,
+            SecurityGroups=None,
+            Subnets=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccessLoggingPolicy",
+                _convert_LoadBalancerAccessLoggingPolicy(AccessLoggingPolicy),
+            )
+            _setattr(
+                "AppCookieStickinessPolicy",
+                _convert_LoadBalancerAppCookieStickinessPolicy_list(
+                    AppCookieStickinessPolicy
+                ),
+            )
+            _setattr("AvailabilityZones", AvailabilityZones)
+            _setattr(
+                "ConnectionDrainingPolicy",
+                _convert_LoadBalancerConnectionDrainingPolicy(ConnectionDrainingPolicy),
+            )
+            _setattr(
+                "ConnectionSettings",
+                _convert_LoadBalancerConnectionSettings(ConnectionSettings),
+            )
+            _setattr("CrossZone", CrossZone)
+            _setattr("HealthCheck", _convert_LoadBalancerHealthCheck(HealthCheck))
+            _setattr("Instances", Instances)
+            _setattr(
+                "LBCookieStickinessPolicy",
+                _convert_LoadBalancerLBCookieStickinessPolicy_list(
+                    LBCookieStickinessPolicy
+                ),
+            )
+            _setattr("Listeners", _convert_LoadBalancerListeners_list(Listeners))
+            _setattr("LoadBalancerName", LoadBalancerName)
+            _setattr("Policies", _convert_LoadBalancerPolicies_list(Policies))
+            _setattr("Scheme", Scheme)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr("Subnets", Subnets)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LoadBalancerProperties = create_object_converter(LoadBalancerProperties)
+
+    class LoadBalancer(_Resource):
+        """A Load Balancer for ElasticLoadBalancing.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoadBalancer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ec2-elb.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElasticLoadBalancing::LoadBalancer"
+
+        Properties: LoadBalancerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancer",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LoadBalancerProperties},
+            factories={"Properties": LoadBalancerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LoadBalancerProperties()
+            _setattr("Properties", _convert_LoadBalancerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        LoadBalancer,
+        LoadBalancerProperties,
+        LoadBalancerAccessLoggingPolicy,
+        LoadBalancerAppCookieStickinessPolicy,
+        LoadBalancerConnectionDrainingPolicy,
+        LoadBalancerConnectionSettings,
+        LoadBalancerHealthCheck,
+        LoadBalancerLBCookieStickinessPolicy,
+        LoadBalancerListeners,
+        LoadBalancerPolicies,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "LoadBalancer": _create_LoadBalancer,
+        "LoadBalancerProperties": _create_LoadBalancer,
+        "LoadBalancerAccessLoggingPolicy": _create_LoadBalancer,
+        "LoadBalancerAppCookieStickinessPolicy": _create_LoadBalancer,
+        "LoadBalancerConnectionDrainingPolicy": _create_LoadBalancer,
+        "LoadBalancerConnectionSettings": _create_LoadBalancer,
+        "LoadBalancerHealthCheck": _create_LoadBalancer,
+        "LoadBalancerLBCookieStickinessPolicy": _create_LoadBalancer,
+        "LoadBalancerListeners": _create_LoadBalancer,
+        "LoadBalancerPolicies": _create_LoadBalancer,
+    },
+)
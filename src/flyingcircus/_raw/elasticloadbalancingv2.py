@@ -7,166 +7,1499 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Listener",
     "ListenerProperties",
+    "ListenerAction",
+    "ListenerAuthenticateCognitoConfig",
+    "ListenerAuthenticateOidcConfig",
+    "ListenerCertificateProperty",
+    "ListenerFixedResponseConfig",
+    "ListenerRedirectConfig",
     "ListenerCertificate",
     "ListenerCertificateProperties",
+    "ListenerCertificateCertificate",
     "ListenerRule",
     "ListenerRuleProperties",
+    "ListenerRuleAction",
+    "ListenerRuleAuthenticateCognitoConfig",
+    "ListenerRuleAuthenticateOidcConfig",
+    "ListenerRuleFixedResponseConfig",
+    "ListenerRuleHostHeaderConfig",
+    "ListenerRuleHttpHeaderConfig",
+    "ListenerRuleHttpRequestMethodConfig",
+    "ListenerRulePathPatternConfig",
+    "ListenerRuleQueryStringConfig",
+    "ListenerRuleQueryStringKeyValue",
+    "ListenerRuleRedirectConfig",
+    "ListenerRuleRuleCondition",
+    "ListenerRuleSourceIpConfig",
     "LoadBalancer",
     "LoadBalancerProperties",
+    "LoadBalancerLoadBalancerAttribute",
+    "LoadBalancerSubnetMapping",
     "TargetGroup",
     "TargetGroupProperties",
+    "TargetGroupMatcher",
+    "TargetGroupTargetDescription",
+    "TargetGroupTargetGroupAttribute",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ListenerProperties(ResourceProperties):
-    Certificates = attrib(default=None)
-    DefaultActions = attrib(default=None)
-    LoadBalancerArn = attrib(default=None)
-    Port = attrib(default=None)
-    Protocol = attrib(default=None)
-    SslPolicy = attrib(default=None)
+def _create_Listener():
+    class ListenerAuthenticateCognitoConfig(_PropertyType):
+        """The Authenticate Cognito Config property type for Listener in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AuthenticateCognitoConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listener-authenticatecognitoconfig.html>`_
+        """
+
+        __slots__ = (
+            "AuthenticationRequestExtraParams",
+            "OnUnauthenticatedRequest",
+            "Scope",
+            "SessionCookieName",
+            "SessionTimeout",
+            "UserPoolArn",
+            "UserPoolClientId",
+            "UserPoolDomain",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerAuthenticateCognitoConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticationRequestExtraParams=None,
+            OnUnauthenticatedRequest=None,
+            Scope=None,
+            SessionCookieName=None,
+            SessionTimeout=None,
+            UserPoolArn=None,
+            UserPoolClientId=None,
+            UserPoolDomain=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AuthenticationRequestExtraParams", AuthenticationRequestExtraParams
+            )
+            _setattr("OnUnauthenticatedRequest", OnUnauthenticatedRequest)
+            _setattr("Scope", Scope)
+            _setattr("SessionCookieName", SessionCookieName)
+            _setattr("SessionTimeout", SessionTimeout)
+            _setattr("UserPoolArn", UserPoolArn)
+            _setattr("UserPoolClientId", UserPoolClientId)
+            _setattr("UserPoolDomain", UserPoolDomain)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerAuthenticateOidcConfig(_PropertyType):
+        """The Authenticate Oidc Config property type for Listener in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AuthenticateOidcConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listener-authenticateoidcconfig.html>`_
+        """
+
+        __slots__ = (
+            "AuthenticationRequestExtraParams",
+            "AuthorizationEndpoint",
+            "ClientId",
+            "ClientSecret",
+            "Issuer",
+            "OnUnauthenticatedRequest",
+            "Scope",
+            "SessionCookieName",
+            "SessionTimeout",
+            "TokenEndpoint",
+            "UserInfoEndpoint",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerAuthenticateOidcConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticationRequestExtraParams=None,
+            AuthorizationEndpoint=None,
+            ClientId=None,
+            ClientSecret=None,
+            Issuer=None,
+            OnUnauthenticatedRequest=None,
+            Scope=None,
+            SessionCookieName=None,
+            SessionTimeout=None,
+            TokenEndpoint=None,
+            UserInfoEndpoint=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AuthenticationRequestExtraParams", AuthenticationRequestExtraParams
+            )
+            _setattr("AuthorizationEndpoint", AuthorizationEndpoint)
+            _setattr("ClientId", ClientId)
+            _setattr("ClientSecret", ClientSecret)
+            _setattr("Issuer", Issuer)
+            _setattr("OnUnauthenticatedRequest", OnUnauthenticatedRequest)
+            _setattr("Scope", Scope)
+            _setattr("SessionCookieName", SessionCookieName)
+            _setattr("SessionTimeout", SessionTimeout)
+            _setattr("TokenEndpoint", TokenEndpoint)
+            _setattr("UserInfoEndpoint", UserInfoEndpoint)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerFixedResponseConfig(_PropertyType):
+        """The Fixed Response Config property type for Listener in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FixedResponseConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listener-fixedresponseconfig.html>`_
+        """
+
+        __slots__ = ("ContentType", "MessageBody", "StatusCode")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerFixedResponseConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ContentType=None, MessageBody=None, StatusCode=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContentType", ContentType)
+            _setattr("MessageBody", MessageBody)
+            _setattr("StatusCode", StatusCode)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerRedirectConfig(_PropertyType):
+        """The Redirect Config property type for Listener in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RedirectConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listener-redirectconfig.html>`_
+        """
+
+        __slots__ = ("Host", "Path", "Port", "Protocol", "Query", "StatusCode")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRedirectConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Host=None,
+            Path=None,
+            Port=None,
+            Protocol=None,
+            Query=None,
+            StatusCode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Host", Host)
+            _setattr("Path", Path)
+            _setattr("Port", Port)
+            _setattr("Protocol", Protocol)
+            _setattr("Query", Query)
+            _setattr("StatusCode", StatusCode)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ListenerAuthenticateCognitoConfig = create_object_converter(
+        ListenerAuthenticateCognitoConfig
+    )
+    _convert_ListenerAuthenticateOidcConfig = create_object_converter(
+        ListenerAuthenticateOidcConfig
+    )
+    _convert_ListenerFixedResponseConfig = create_object_converter(
+        ListenerFixedResponseConfig
+    )
+    _convert_ListenerRedirectConfig = create_object_converter(ListenerRedirectConfig)
+
+    class ListenerAction(_PropertyType):
+        """The Action property type for Listener in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listener-defaultactions.html>`_
+        """
+
+        __slots__ = (
+            "AuthenticateCognitoConfig",
+            "AuthenticateOidcConfig",
+            "FixedResponseConfig",
+            "Order",
+            "RedirectConfig",
+            "TargetGroupArn",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AuthenticateCognitoConfig": _convert_ListenerAuthenticateCognitoConfig,
+                "AuthenticateOidcConfig": _convert_ListenerAuthenticateOidcConfig,
+                "FixedResponseConfig": _convert_ListenerFixedResponseConfig,
+                "RedirectConfig": _convert_ListenerRedirectConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticateCognitoConfig=None,
+            AuthenticateOidcConfig=None,
+            FixedResponseConfig=None,
+            Order=None,
+            RedirectConfig=None,
+            TargetGroupArn=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AuthenticateCognitoConfig",
+                _convert_ListenerAuthenticateCognitoConfig(AuthenticateCognitoConfig),
+            )
+            _setattr(
+                "AuthenticateOidcConfig",
+                _convert_ListenerAuthenticateOidcConfig(AuthenticateOidcConfig),
+            )
+            _setattr(
+                "FixedResponseConfig",
+                _convert_ListenerFixedResponseConfig(FixedResponseConfig),
+            )
+            _setattr("Order", Order)
+            _setattr("RedirectConfig", _convert_ListenerRedirectConfig(RedirectConfig))
+            _setattr("TargetGroupArn", TargetGroupArn)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerCertificateProperty(_PropertyType):
+        """The Certificate property type for Listener in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Certificate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listener-certificates.html>`_
+        """
+
+        __slots__ = ("CertificateArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerCertificateProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CertificateArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ListenerCertificateProperty_list = create_object_list_converter(
+        ListenerCertificateProperty
+    )
+    _convert_ListenerAction_list = create_object_list_converter(ListenerAction)
+
+    class ListenerProperties(_ResourceProperties):
+        __slots__ = (
+            "Certificates",
+            "DefaultActions",
+            "LoadBalancerArn",
+            "Port",
+            "Protocol",
+            "SslPolicy",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Certificates": _convert_ListenerCertificateProperty_list,
+                "DefaultActions": _convert_ListenerAction_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Certificates=None,
+            DefaultActions=None,
+            LoadBalancerArn=None,
+            Port=None,
+            Protocol=None,
+            SslPolicy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Certificates", _convert_ListenerCertificateProperty_list(Certificates)
+            )
+            _setattr("DefaultActions", _convert_ListenerAction_list(DefaultActions))
+            _setattr("LoadBalancerArn", LoadBalancerArn)
+            _setattr("Port", Port)
+            _setattr("Protocol", Protocol)
+            _setattr("SslPolicy", SslPolicy)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ListenerProperties = create_object_converter(ListenerProperties)
+
+    class Listener(_Resource):
+        """A Listener for ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Listener
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-listener.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::Listener"
+
+        Properties: ListenerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Listener",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ListenerProperties},
+            factories={"Properties": ListenerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ListenerProperties()
+            _setattr("Properties", _convert_ListenerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Listener,
+        ListenerProperties,
+        ListenerAuthenticateCognitoConfig,
+        ListenerAuthenticateOidcConfig,
+        ListenerFixedResponseConfig,
+        ListenerRedirectConfig,
+        ListenerAction,
+        ListenerCertificateProperty,
+    )
+
+
+def _create_ListenerCertificate():
+    class ListenerCertificateCertificate(_PropertyType):
+        """The Certificate property type for ListenerCertificate in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Certificate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listener-certificates.html>`_
+        """
+
+        __slots__ = ("CertificateArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerCertificateCertificate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CertificateArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ListenerCertificateCertificate_list = create_object_list_converter(
+        ListenerCertificateCertificate
+    )
+
+    class ListenerCertificateProperties(_ResourceProperties):
+        __slots__ = ("Certificates", "ListenerArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerCertificateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Certificates": _convert_ListenerCertificateCertificate_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Certificates=None, ListenerArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Certificates",
+                _convert_ListenerCertificateCertificate_list(Certificates),
+            )
+            _setattr("ListenerArn", ListenerArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ListenerCertificateProperties = create_object_converter(
+        ListenerCertificateProperties
+    )
+
+    class ListenerCertificate(_Resource):
+        """A Listener Certificate for ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ListenerCertificate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-listenercertificate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::ListenerCertificate"
+
+        Properties: ListenerCertificateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerCertificate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ListenerCertificateProperties},
+            factories={"Properties": ListenerCertificateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ListenerCertificateProperties()
+            _setattr("Properties", _convert_ListenerCertificateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ListenerCertificate,
+        ListenerCertificateProperties,
+        ListenerCertificateCertificate,
+    )
+
+
+def _create_ListenerRule():
+    class ListenerRuleAuthenticateCognitoConfig(_PropertyType):
+        """The Authenticate Cognito Config property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AuthenticateCognitoConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-authenticatecognitoconfig.html>`_
+        """
+
+        __slots__ = (
+            "AuthenticationRequestExtraParams",
+            "OnUnauthenticatedRequest",
+            "Scope",
+            "SessionCookieName",
+            "SessionTimeout",
+            "UserPoolArn",
+            "UserPoolClientId",
+            "UserPoolDomain",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleAuthenticateCognitoConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticationRequestExtraParams=None,
+            OnUnauthenticatedRequest=None,
+            Scope=None,
+            SessionCookieName=None,
+            SessionTimeout=None,
+            UserPoolArn=None,
+            UserPoolClientId=None,
+            UserPoolDomain=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AuthenticationRequestExtraParams", AuthenticationRequestExtraParams
+            )
+            _setattr("OnUnauthenticatedRequest", OnUnauthenticatedRequest)
+            _setattr("Scope", Scope)
+            _setattr("SessionCookieName", SessionCookieName)
+            _setattr("SessionTimeout", SessionTimeout)
+            _setattr("UserPoolArn", UserPoolArn)
+            _setattr("UserPoolClientId", UserPoolClientId)
+            _setattr("UserPoolDomain", UserPoolDomain)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerRuleAuthenticateOidcConfig(_PropertyType):
+        """The Authenticate Oidc Config property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AuthenticateOidcConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-authenticateoidcconfig.html>`_
+        """
+
+        __slots__ = (
+            "AuthenticationRequestExtraParams",
+            "AuthorizationEndpoint",
+            "ClientId",
+            "ClientSecret",
+            "Issuer",
+            "OnUnauthenticatedRequest",
+            "Scope",
+            "SessionCookieName",
+            "SessionTimeout",
+            "TokenEndpoint",
+            "UserInfoEndpoint",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleAuthenticateOidcConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticationRequestExtraParams=None,
+            AuthorizationEndpoint=None,
+            ClientId=None,
+            ClientSecret=None,
+            Issuer=None,
+            OnUnauthenticatedRequest=None,
+            Scope=None,
+            SessionCookieName=None,
+            SessionTimeout=None,
+            TokenEndpoint=None,
+            UserInfoEndpoint=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AuthenticationRequestExtraParams", AuthenticationRequestExtraParams
+            )
+            _setattr("AuthorizationEndpoint", AuthorizationEndpoint)
+            _setattr("ClientId", ClientId)
+            _setattr("ClientSecret", ClientSecret)
+            _setattr("Issuer", Issuer)
+            _setattr("OnUnauthenticatedRequest", OnUnauthenticatedRequest)
+            _setattr("Scope", Scope)
+            _setattr("SessionCookieName", SessionCookieName)
+            _setattr("SessionTimeout", SessionTimeout)
+            _setattr("TokenEndpoint", TokenEndpoint)
+            _setattr("UserInfoEndpoint", UserInfoEndpoint)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerRuleFixedResponseConfig(_PropertyType):
+        """The Fixed Response Config property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FixedResponseConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-fixedresponseconfig.html>`_
+        """
+
+        __slots__ = ("ContentType", "MessageBody", "StatusCode")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleFixedResponseConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ContentType=None, MessageBody=None, StatusCode=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContentType", ContentType)
+            _setattr("MessageBody", MessageBody)
+            _setattr("StatusCode", StatusCode)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerRuleRedirectConfig(_PropertyType):
+        """The Redirect Config property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RedirectConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-redirectconfig.html>`_
+        """
+
+        __slots__ = ("Host", "Path", "Port", "Protocol", "Query", "StatusCode")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleRedirectConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Host=None,
+            Path=None,
+            Port=None,
+            Protocol=None,
+            Query=None,
+            StatusCode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Host", Host)
+            _setattr("Path", Path)
+            _setattr("Port", Port)
+            _setattr("Protocol", Protocol)
+            _setattr("Query", Query)
+            _setattr("StatusCode", StatusCode)
+            _init_PropertyType(self, kwargs)
 
+    _convert_ListenerRuleAuthenticateCognitoConfig = create_object_converter(
+        ListenerRuleAuthenticateCognitoConfig
+    )
+    _convert_ListenerRuleAuthenticateOidcConfig = create_object_converter(
+        ListenerRuleAuthenticateOidcConfig
+    )
+    _convert_ListenerRuleFixedResponseConfig = create_object_converter(
+        ListenerRuleFixedResponseConfig
+    )
+    _convert_ListenerRuleRedirectConfig = create_object_converter(
+        ListenerRuleRedirectConfig
+    )
+
+    class ListenerRuleAction(_PropertyType):
+        """The Action property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-actions.html>`_
+        """
+
+        __slots__ = (
+            "AuthenticateCognitoConfig",
+            "AuthenticateOidcConfig",
+            "FixedResponseConfig",
+            "Order",
+            "RedirectConfig",
+            "TargetGroupArn",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AuthenticateCognitoConfig": _convert_ListenerRuleAuthenticateCognitoConfig,
+                "AuthenticateOidcConfig": _convert_ListenerRuleAuthenticateOidcConfig,
+                "FixedResponseConfig": _convert_ListenerRuleFixedResponseConfig,
+                "RedirectConfig": _convert_ListenerRuleRedirectConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AuthenticateCognitoConfig=None,
+            AuthenticateOidcConfig=None,
+            FixedResponseConfig=None,
+            Order=None,
+            RedirectConfig=None,
+            TargetGroupArn=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AuthenticateCognitoConfig",
+                _convert_ListenerRuleAuthenticateCognitoConfig(
+                    AuthenticateCognitoConfig
+                ),
+            )
+            _setattr(
+                "AuthenticateOidcConfig",
+                _convert_ListenerRuleAuthenticateOidcConfig(AuthenticateOidcConfig),
+            )
+            _setattr(
+                "FixedResponseConfig",
+                _convert_ListenerRuleFixedResponseConfig(FixedResponseConfig),
+            )
+            _setattr("Order", Order)
+            _setattr(
+                "RedirectConfig", _convert_ListenerRuleRedirectConfig(RedirectConfig)
+            )
+            _setattr("TargetGroupArn", TargetGroupArn)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerRuleHostHeaderConfig(_PropertyType):
+        """The Host Header Config property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for HostHeaderConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-hostheaderconfig.html>`_
+        """
+
+        __slots__ = ("Values",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleHostHeaderConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerRuleHttpHeaderConfig(_PropertyType):
+        """The Http Header Config property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for HttpHeaderConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-httpheaderconfig.html>`_
+        """
+
+        __slots__ = ("HttpHeaderName", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleHttpHeaderConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, HttpHeaderName=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HttpHeaderName", HttpHeaderName)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerRuleHttpRequestMethodConfig(_PropertyType):
+        """The Http Request Method Config property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for HttpRequestMethodConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-httprequestmethodconfig.html>`_
+        """
+
+        __slots__ = ("Values",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleHttpRequestMethodConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Listener(Resource):
-    """A Listener for ElasticLoadBalancingV2.
+    class ListenerRulePathPatternConfig(_PropertyType):
+        """The Path Pattern Config property type for ListenerRule in ElasticLoadBalancingV2.
 
-    See Also:
-        `AWS Cloud Formation documentation for Listener
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-listener.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for PathPatternConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-pathpatternconfig.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::Listener"
+        __slots__ = ("Values",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRulePathPatternConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ListenerProperties = attrib(
-        factory=ListenerProperties,
-        converter=create_object_converter(ListenerProperties),
+        def __init__(self, *, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    class ListenerRuleQueryStringKeyValue(_PropertyType):
+        """The Query String Key Value property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for QueryStringKeyValue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-querystringkeyvalue.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleQueryStringKeyValue", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ListenerRuleQueryStringKeyValue_list = create_object_list_converter(
+        ListenerRuleQueryStringKeyValue
     )
 
+    class ListenerRuleQueryStringConfig(_PropertyType):
+        """The Query String Config property type for ListenerRule in ElasticLoadBalancingV2.
 
-@attrs(**ATTRSCONFIG)
-class ListenerCertificateProperties(ResourceProperties):
-    Certificates = attrib(default=None)
-    ListenerArn = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for QueryStringConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-querystringconfig.html>`_
+        """
 
+        __slots__ = ("Values",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleQueryStringConfig",
+            _PropertyType,
+            __slots__,
+            converters={"Values": _convert_ListenerRuleQueryStringKeyValue_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ListenerCertificate(Resource):
-    """A Listener Certificate for ElasticLoadBalancingV2.
+        def __init__(self, *, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Values", _convert_ListenerRuleQueryStringKeyValue_list(Values))
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for ListenerCertificate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-listenercertificate.html>`_
-    """
+    class ListenerRuleSourceIpConfig(_PropertyType):
+        """The Source Ip Config property type for ListenerRule in ElasticLoadBalancingV2.
 
-    RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::ListenerCertificate"
+        See Also:
+            `AWS Cloud Formation documentation for SourceIpConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-sourceipconfig.html>`_
+        """
 
-    Properties: ListenerCertificateProperties = attrib(
-        factory=ListenerCertificateProperties,
-        converter=create_object_converter(ListenerCertificateProperties),
+        __slots__ = ("Values",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleSourceIpConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ListenerRuleHostHeaderConfig = create_object_converter(
+        ListenerRuleHostHeaderConfig
+    )
+    _convert_ListenerRuleHttpHeaderConfig = create_object_converter(
+        ListenerRuleHttpHeaderConfig
+    )
+    _convert_ListenerRuleHttpRequestMethodConfig = create_object_converter(
+        ListenerRuleHttpRequestMethodConfig
+    )
+    _convert_ListenerRulePathPatternConfig = create_object_converter(
+        ListenerRulePathPatternConfig
     )
+    _convert_ListenerRuleQueryStringConfig = create_object_converter(
+        ListenerRuleQueryStringConfig
+    )
+    _convert_ListenerRuleSourceIpConfig = create_object_converter(
+        ListenerRuleSourceIpConfig
+    )
+
+    class ListenerRuleRuleCondition(_PropertyType):
+        """The Rule Condition property type for ListenerRule in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RuleCondition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-listenerrule-conditions.html>`_
+        """
+
+        __slots__ = (
+            "Field",
+            "HostHeaderConfig",
+            "HttpHeaderConfig",
+            "HttpRequestMethodConfig",
+            "PathPatternConfig",
+            "QueryStringConfig",
+            "SourceIpConfig",
+            "Values",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleRuleCondition",
+            _PropertyType,
+            __slots__,
+            converters={
+                "HostHeaderConfig": _convert_ListenerRuleHostHeaderConfig,
+                "HttpHeaderConfig": _convert_ListenerRuleHttpHeaderConfig,
+                "HttpRequestMethodConfig": _convert_ListenerRuleHttpRequestMethodConfig,
+                "PathPatternConfig": _convert_ListenerRulePathPatternConfig,
+                "QueryStringConfig": _convert_ListenerRuleQueryStringConfig,
+                "SourceIpConfig": _convert_ListenerRuleSourceIpConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Field=None,
+            HostHeaderConfig=None,
+            HttpHeaderConfig=None,
+            HttpRequestMethodConfig=None,
+            PathPatternConfig=None,
+            QueryStringConfig=None,
+            SourceIpConfig=None,
+            Values=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Field", Field)
+            _setattr(
+                "HostHeaderConfig",
+                _convert_ListenerRuleHostHeaderConfig(HostHeaderConfig),
+            )
+            _setattr(
+                "HttpHeaderConfig",
+                _convert_ListenerRuleHttpHeaderConfig(HttpHeaderConfig),
+            )
+            _setattr(
+                "HttpRequestMethodConfig",
+                _convert_ListenerRuleHttpRequestMethodConfig(HttpRequestMethodConfig),
+            )
+            _setattr(
+                "PathPatternConfig",
+                _convert_ListenerRulePathPatternConfig(PathPatternConfig),
+            )
+            _setattr(
+                "QueryStringConfig",
+                _convert_ListenerRuleQueryStringConfig(QueryStringConfig),
+            )
+            _setattr(
+                "SourceIpConfig", _convert_ListenerRuleSourceIpConfig(SourceIpConfig)
+            )
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ListenerRuleAction_list = create_object_list_converter(ListenerRuleAction)
+    _convert_ListenerRuleRuleCondition_list = create_object_list_converter(
+        ListenerRuleRuleCondition
+    )
+
+    class ListenerRuleProperties(_ResourceProperties):
+        __slots__ = ("Actions", "Conditions", "ListenerArn", "Priority")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Actions": _convert_ListenerRuleAction_list,
+                "Conditions": _convert_ListenerRuleRuleCondition_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            Actions=None,
+            Conditions=None,
+            ListenerArn=None,
+            Priority=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Actions", _convert_ListenerRuleAction_list(Actions))
+            _setattr("Conditions", _convert_ListenerRuleRuleCondition_list(Conditions))
+            _setattr("ListenerArn", ListenerArn)
+            _setattr("Priority", Priority)
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class ListenerRuleProperties(ResourceProperties):
-    Actions = attrib(default=None)
-    Conditions = attrib(default=None)
-    ListenerArn = attrib(default=None)
-    Priority = attrib(default=None)
+    _convert_ListenerRuleProperties = create_object_converter(ListenerRuleProperties)
 
+    class ListenerRule(_Resource):
+        """A Listener Rule for ElasticLoadBalancingV2.
 
-@attrs(**ATTRSCONFIG)
-class ListenerRule(Resource):
-    """A Listener Rule for ElasticLoadBalancingV2.
+        See Also:
+            `AWS Cloud Formation documentation for ListenerRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-listenerrule.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for ListenerRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-listenerrule.html>`_
-    """
+        RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::ListenerRule"
 
-    RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::ListenerRule"
+        Properties: ListenerRuleProperties
 
-    Properties: ListenerRuleProperties = attrib(
-        factory=ListenerRuleProperties,
-        converter=create_object_converter(ListenerRuleProperties),
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ListenerRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ListenerRuleProperties},
+            factories={"Properties": ListenerRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ListenerRuleProperties()
+            _setattr("Properties", _convert_ListenerRuleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ListenerRule,
+        ListenerRuleProperties,
+        ListenerRuleAuthenticateCognitoConfig,
+        ListenerRuleAuthenticateOidcConfig,
+        ListenerRuleFixedResponseConfig,
+        ListenerRuleRedirectConfig,
+        ListenerRuleAction,
+        ListenerRuleHostHeaderConfig,
+        ListenerRuleHttpHeaderConfig,
+        ListenerRuleHttpRequestMethodConfig,
+        ListenerRulePathPatternConfig,
+        ListenerRuleQueryStringKeyValue,
+        ListenerRuleQueryStringConfig,
+        ListenerRuleSourceIpConfig,
+        ListenerRuleRuleCondition,
+    )
+
+
+def _create_LoadBalancer():
+    class LoadBalancerLoadBalancerAttribute(_PropertyType):
+        """The Load Balancer Attribute property type for LoadBalancer in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoadBalancerAttribute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-loadbalancer-loadbalancerattributes.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerLoadBalancerAttribute", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class LoadBalancerSubnetMapping(_PropertyType):
+        """The Subnet Mapping property type for LoadBalancer in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubnetMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-loadbalancer-subnetmapping.html>`_
+        """
+
+        __slots__ = ("AllocationId", "SubnetId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerSubnetMapping", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AllocationId=None, SubnetId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocationId", AllocationId)
+            _setattr("SubnetId", SubnetId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LoadBalancerLoadBalancerAttribute_list = create_object_list_converter(
+        LoadBalancerLoadBalancerAttribute
+    )
+    _convert_LoadBalancerSubnetMapping_list = create_object_list_converter(
+        LoadBalancerSubnetMapping
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class LoadBalancerProperties(_ResourceProperties):
+        __slots__ = (
+            "IpAddressType",
+            "LoadBalancerAttributes",
+            "Name",
+            "Scheme",
+            "SecurityGroups",
+            "SubnetMappings",
+            "Subnets",
+            "Tags",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LoadBalancerAttributes": _convert_LoadBalancerLoadBalancerAttribute_list,
+                "SubnetMappings": _convert_LoadBalancerSubnetMapping_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            IpAddressType=None,
+            LoadBalancerAttributes=None,
+            Name=None,
+            Scheme=None,
+            SecurityGroups=None,
+            SubnetMappings=None,
+            Subnets=None,
+            Tags=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IpAddressType", IpAddressType)
+            _setattr(
+                "LoadBalancerAttributes",
+                _convert_LoadBalancerLoadBalancerAttribute_list(LoadBalancerAttributes),
+            )
+            _setattr("Name", Name)
+            _setattr("Scheme", Scheme)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr(
+                "SubnetMappings",
+                _convert_LoadBalancerSubnetMapping_list(SubnetMappings),
+            )
+            _setattr("Subnets", Subnets)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LoadBalancerProperties = create_object_converter(LoadBalancerProperties)
+
+    class LoadBalancer(_Resource):
+        """A Load Balancer for ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoadBalancer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-loadbalancer.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::LoadBalancer"
+
+        Properties: LoadBalancerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoadBalancer",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LoadBalancerProperties},
+            factories={"Properties": LoadBalancerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LoadBalancerProperties()
+            _setattr("Properties", _convert_LoadBalancerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        LoadBalancer,
+        LoadBalancerProperties,
+        LoadBalancerLoadBalancerAttribute,
+        LoadBalancerSubnetMapping,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class LoadBalancerProperties(ResourceProperties):
-    IpAddressType = attrib(default=None)
-    LoadBalancerAttributes = attrib(default=None)
-    Name = attrib(default=None)
-    Scheme = attrib(default=None)
-    SecurityGroups = attrib(default=None)
-    SubnetMappings = attrib(default=None)
-    Subnets = attrib(default=None)
-    Tags = attrib(default=None)
-    Type = attrib(default=None)
+def _create_TargetGroup():
+    class TargetGroupMatcher(_PropertyType):
+        """The Matcher property type for TargetGroup in ElasticLoadBalancingV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Matcher
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-targetgroup-matcher.html>`_
+        """
+
+        __slots__ = ("HttpCode",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TargetGroupMatcher", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, HttpCode=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HttpCode", HttpCode)
+            _init_PropertyType(self, kwargs)
+
+    class TargetGroupTargetDescription(_PropertyType):
+        """The Target Description property type for TargetGroup in ElasticLoadBalancingV2.
 
+        See Also:
+            `AWS Cloud Formation documentation for TargetDescription
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-targetgroup-targetdescription.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class LoadBalancer(Resource):
-    """A Load Balancer for ElasticLoadBalancingV2.
+        __slots__ = ("AvailabilityZone", "Id", "Port")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TargetGroupTargetDescription", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for LoadBalancer
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-loadbalancer.html>`_
-    """
+        def __init__(
+            self, *, AvailabilityZone=None, Id=None, Port=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("Id", Id)
+            _setattr("Port", Port)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::LoadBalancer"
+    class TargetGroupTargetGroupAttribute(_PropertyType):
+        """The Target Group Attribute property type for TargetGroup in ElasticLoadBalancingV2.
 
-    Properties: LoadBalancerProperties = attrib(
-        factory=LoadBalancerProperties,
-        converter=create_object_converter(LoadBalancerProperties),
+        See Also:
+            `AWS Cloud Formation documentation for TargetGroupAttribute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticloadbalancingv2-targetgroup-targetgroupattribute.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TargetGroupTargetGroupAttribute", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TargetGroupMatcher = create_object_converter(TargetGroupMatcher)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_TargetGroupTargetGroupAttribute_list = create_object_list_converter(
+        TargetGroupTargetGroupAttribute
     )
+    _convert_TargetGroupTargetDescription_list = create_object_list_converter(
+        TargetGroupTargetDescription
+    )
+
+    class TargetGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "HealthCheckEnabled",
+            "HealthCheckIntervalSeconds",
+            "HealthCheckPath",
+            "HealthCheckPort",
+            "HealthCheckProtocol",
+            "HealthCheckTimeoutSeconds",
+            "HealthyThresholdCount",
+            "Matcher",
+            "Name",
+            "Port",
+            "Protocol",
+            "Tags",
+            "TargetGroupAttributes",
+            "Targets",
+            "TargetType",
+            "UnhealthyThresholdCount",
+            "VpcId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TargetGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Matcher": _convert_TargetGroupMatcher,
+                "Tags": _convert_Tag_list,
+                "TargetGroupAttributes": _convert_TargetGroupTargetGroupAttribute_list,
+                "Targets": _convert_TargetGroupTargetDescription_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            HealthCheckEnabled=None,
+            HealthCheckIntervalSeconds=None,
+            HealthCheckPath=None,
+            HealthCheckPort=None,
+            HealthCheckProtocol=None,
+            HealthCheckTimeoutSeconds=None,
+            HealthyThresholdCount=None,
+            Matcher=None,
+            Name=None,
+            Port=None,
+            Protocol=None,
+            Tags=None,
+            TargetGroupAttributes=None,
+            Targets=None,
+            TargetType=None,
+            UnhealthyThresholdCount=None,
+            VpcId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HealthCheckEnabled", HealthCheckEnabled)
+            _setattr("HealthCheckIntervalSeconds", HealthCheckIntervalSeconds)
+            _setattr("HealthCheckPath", HealthCheckPath)
+            _setattr("HealthCheckPort", HealthCheckPort)
+            _setattr("HealthCheckProtocol", HealthCheckProtocol)
+            _setattr("HealthCheckTimeoutSeconds", HealthCheckTimeoutSeconds)
+            _setattr("HealthyThresholdCount", HealthyThresholdCount)
+            _setattr("Matcher", _convert_TargetGroupMatcher(Matcher))
+            _setattr("Name", Name)
+            _setattr("Port", Port)
+            _setattr("Protocol", Protocol)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr(
+                "TargetGroupAttributes",
+                _convert_TargetGroupTargetGroupAttribute_list(TargetGroupAttributes),
+            )
+            _setattr("Targets", _convert_TargetGroupTargetDescription_list(Targets))
+            _setattr("TargetType", TargetType)
+            _setattr("UnhealthyThresholdCount", UnhealthyThresholdCount)
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class TargetGroupProperties(ResourceProperties):
-    HealthCheckEnabled = attrib(default=None)
-    HealthCheckIntervalSeconds = attrib(default=None)
-    HealthCheckPath = attrib(default=None)
-    HealthCheckPort = attrib(default=None)
-    HealthCheckProtocol = attrib(default=None)
-    HealthCheckTimeoutSeconds = attrib(default=None)
-    HealthyThresholdCount = attrib(default=None)
-    Matcher = attrib(default=None)
-    Name = attrib(default=None)
-    Port = attrib(default=None)
-    Protocol = attrib(default=None)
-    Tags = attrib(default=None)
-    TargetGroupAttributes = attrib(default=None)
-    Targets = attrib(default=None)
-    TargetType = attrib(default=None)
-    UnhealthyThresholdCount = attrib(default=None)
-    VpcId = attrib(default=None)
+    _convert_TargetGroupProperties = create_object_converter(TargetGroupProperties)
 
+    class TargetGroup(_Resource):
+        """A Target Group for ElasticLoadBalancingV2.
 
-@attrs(**ATTRSCONFIG)
-class TargetGroup(Resource):
-    """A Target Group for ElasticLoadBalancingV2.
+        See Also:
+            `AWS Cloud Formation documentation for TargetGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-targetgroup.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for TargetGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticloadbalancingv2-targetgroup.html>`_
-    """
+        RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::TargetGroup"
 
-    RESOURCE_TYPE = "AWS::ElasticLoadBalancingV2::TargetGroup"
+        Properties: TargetGroupProperties
 
-    Properties: TargetGroupProperties = attrib(
-        factory=TargetGroupProperties,
-        converter=create_object_converter(TargetGroupProperties),
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TargetGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TargetGroupProperties},
+            factories={"Properties": TargetGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TargetGroupProperties()
+            _setattr("Properties", _convert_TargetGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        TargetGroup,
+        TargetGroupProperties,
+        TargetGroupMatcher,
+        TargetGroupTargetDescription,
+        TargetGroupTargetGroupAttribute,
     )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Listener": _create_Listener,
+        "ListenerProperties": _create_Listener,
+        "ListenerAction": _create_Listener,
+        "ListenerAuthenticateCognitoConfig": _create_Listener,
+        "ListenerAuthenticateOidcConfig": _create_Listener,
+        "ListenerCertificateProperty": _create_Listener,
+        "ListenerFixedResponseConfig": _create_Listener,
+        "ListenerRedirectConfig": _create_Listener,
+        "ListenerCertificate": _create_ListenerCertificate,
+        "ListenerCertificateProperties": _create_ListenerCertificate,
+        "ListenerCertificateCertificate": _create_ListenerCertificate,
+        "ListenerRule": _create_ListenerRule,
+        "ListenerRuleProperties": _create_ListenerRule,
+        "ListenerRuleAction": _create_ListenerRule,
+        "ListenerRuleAuthenticateCognitoConfig": _create_ListenerRule,
+        "ListenerRuleAuthenticateOidcConfig": _create_ListenerRule,
+        "ListenerRuleFixedResponseConfig": _create_ListenerRule,
+        "ListenerRuleHostHeaderConfig": _create_ListenerRule,
+        "ListenerRuleHttpHeaderConfig": _create_ListenerRule,
+        "ListenerRuleHttpRequestMethodConfig": _create_ListenerRule,
+        "ListenerRulePathPatternConfig": _create_ListenerRule,
+        "ListenerRuleQueryStringConfig": _create_ListenerRule,
+        "ListenerRuleQueryStringKeyValue": _create_ListenerRule,
+        "ListenerRuleRedirectConfig": _create_ListenerRule,
+        "ListenerRuleRuleCondition": _create_ListenerRule,
+        "ListenerRuleSourceIpConfig": _create_ListenerRule,
+        "LoadBalancer": _create_LoadBalancer,
+        "LoadBalancerProperties": _create_LoadBalancer,
+        "LoadBalancerLoadBalancerAttribute": _create_LoadBalancer,
+        "LoadBalancerSubnetMapping": _create_LoadBalancer,
+        "TargetGroup": _create_TargetGroup,
+        "TargetGroupProperties": _create_TargetGroup,
+        "TargetGroupMatcher": _create_TargetGroup,
+        "TargetGroupTargetDescription": _create_TargetGroup,
+        "TargetGroupTargetGroupAttribute": _create_TargetGroup,
+    },
+)
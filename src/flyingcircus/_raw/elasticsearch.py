@@ -7,45 +7,453 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+from ..core import create_object_map_converter
 
-__all__ = ["Domain", "DomainProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Domain",
+    "DomainProperties",
+    "DomainCognitoOptions",
+    "DomainEBSOptions",
+    "DomainElasticsearchClusterConfig",
+    "DomainEncryptionAtRestOptions",
+    "DomainLogPublishingOption",
+    "DomainNodeToNodeEncryptionOptions",
+    "DomainSnapshotOptions",
+    "DomainVPCOptions",
+    "DomainZoneAwarenessConfig",
+]
 
-@attrs(**ATTRSCONFIG)
-class DomainProperties(ResourceProperties):
-    AccessPolicies = attrib(default=None)
-    AdvancedOptions = attrib(default=None)
-    CognitoOptions = attrib(default=None)
-    DomainName = attrib(default=None)
-    EBSOptions = attrib(default=None)
-    ElasticsearchClusterConfig = attrib(default=None)
-    ElasticsearchVersion = attrib(default=None)
-    EncryptionAtRestOptions = attrib(default=None)
-    LogPublishingOptions = attrib(default=None)
-    NodeToNodeEncryptionOptions = attrib(default=None)
-    SnapshotOptions = attrib(default=None)
-    Tags = attrib(default=None)
-    VPCOptions = attrib(default=None)
 
+def _create_Domain():
+    class DomainCognitoOptions(_PropertyType):
+        """The Cognito Options property type for Domain in Elasticsearch.
 
-@attrs(**ATTRSCONFIG)
-class Domain(Resource):
-    """A Domain for Elasticsearch.
+        See Also:
+            `AWS Cloud Formation documentation for CognitoOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticsearch-domain-cognitooptions.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Domain
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticsearch-domain.html>`_
-    """
+        __slots__ = ("Enabled", "IdentityPoolId", "RoleArn", "UserPoolId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainCognitoOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Elasticsearch::Domain"
+        def __init__(
+            self,
+            *,
+            Enabled=None,
+            IdentityPoolId=None,
+            RoleArn=None,
+            UserPoolId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr("IdentityPoolId", IdentityPoolId)
+            _setattr("RoleArn", RoleArn)
+            _setattr("UserPoolId", UserPoolId)
+            _init_PropertyType(self, kwargs)
 
-    Properties: DomainProperties = attrib(
-        factory=DomainProperties, converter=create_object_converter(DomainProperties)
+    class DomainEBSOptions(_PropertyType):
+        """The Ebs Options property type for Domain in Elasticsearch.
+
+        See Also:
+            `AWS Cloud Formation documentation for EBSOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticsearch-domain-ebsoptions.html>`_
+        """
+
+        __slots__ = ("EBSEnabled", "Iops", "VolumeSize", "VolumeType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainEBSOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EBSEnabled=None,
+            Iops=None,
+            VolumeSize=None,
+            VolumeType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EBSEnabled", EBSEnabled)
+            _setattr("Iops", Iops)
+            _setattr("VolumeSize", VolumeSize)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    class DomainZoneAwarenessConfig(_PropertyType):
+        """The Zone Awareness Config property type for Domain in Elasticsearch.
+
+        See Also:
+            `AWS Cloud Formation documentation for ZoneAwarenessConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticsearch-domain-zoneawarenessconfig.html>`_
+        """
+
+        __slots__ = ("AvailabilityZoneCount",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainZoneAwarenessConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AvailabilityZoneCount=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZoneCount", AvailabilityZoneCount)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DomainZoneAwarenessConfig = create_object_converter(
+        DomainZoneAwarenessConfig
+    )
+
+    class DomainElasticsearchClusterConfig(_PropertyType):
+        """The Elasticsearch Cluster Config property type for Domain in Elasticsearch.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticsearchClusterConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticsearch-domain-elasticsearchclusterconfig.html>`_
+        """
+
+        __slots__ = (
+            "DedicatedMasterCount",
+            "DedicatedMasterEnabled",
+            "DedicatedMasterType",
+            "InstanceCount",
+            "InstanceType",
+            "ZoneAwarenessConfig",
+            "ZoneAwarenessEnabled",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainElasticsearchClusterConfig",
+            _PropertyType,
+            __slots__,
+            converters={"ZoneAwarenessConfig": _convert_DomainZoneAwarenessConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DedicatedMasterCount=None,
+            DedicatedMasterEnabled=None,
+            DedicatedMasterType=None,
+            InstanceCount=None,
+            InstanceType=None,
+            ZoneAwarenessConfig=None,
+            ZoneAwarenessEnabled=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DedicatedMasterCount", DedicatedMasterCount)
+            _setattr("DedicatedMasterEnabled", DedicatedMasterEnabled)
+            _setattr("DedicatedMasterType", DedicatedMasterType)
+            _setattr("InstanceCount", InstanceCount)
+            _setattr("InstanceType", InstanceType)
+            _setattr(
+                "ZoneAwarenessConfig",
+                _convert_DomainZoneAwarenessConfig(ZoneAwarenessConfig),
+            )
+            _setattr("ZoneAwarenessEnabled", ZoneAwarenessEnabled)
+            _init_PropertyType(self, kwargs)
+
+    class DomainEncryptionAtRestOptions(_PropertyType):
+        """The Encryption At Rest Options property type for Domain in Elasticsearch.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionAtRestOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticsearch-domain-encryptionatrestoptions.html>`_
+        """
+
+        __slots__ = ("Enabled", "KmsKeyId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainEncryptionAtRestOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Enabled=None, KmsKeyId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr("KmsKeyId", KmsKeyId)
+            _init_PropertyType(self, kwargs)
+
+    class DomainLogPublishingOption(_PropertyType):
+        """The Log Publishing Option property type for Domain in Elasticsearch.
+
+        See Also:
+            `AWS Cloud Formation documentation for LogPublishingOption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticsearch-domain-logpublishingoption.html>`_
+        """
+
+        __slots__ = ("CloudWatchLogsLogGroupArn", "Enabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainLogPublishingOption", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CloudWatchLogsLogGroupArn=None, Enabled=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudWatchLogsLogGroupArn", CloudWatchLogsLogGroupArn)
+            _setattr("Enabled", Enabled)
+            _init_PropertyType(self, kwargs)
+
+    class DomainNodeToNodeEncryptionOptions(_PropertyType):
+        """The Node To Node Encryption Options property type for Domain in Elasticsearch.
+
+        See Also:
+            `AWS Cloud Formation documentation for NodeToNodeEncryptionOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticsearch-domain-nodetonodeencryptionoptions.html>`_
+        """
+
+        __slots__ = ("Enabled",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainNodeToNodeEncryptionOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Enabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _init_PropertyType(self, kwargs)
+
+    class DomainSnapshotOptions(_PropertyType):
+        """The Snapshot Options property type for Domain in Elasticsearch.
+
+        See Also:
+            `AWS Cloud Formation documentation for SnapshotOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticsearch-domain-snapshotoptions.html>`_
+        """
+
+        __slots__ = ("AutomatedSnapshotStartHour",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainSnapshotOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AutomatedSnapshotStartHour=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutomatedSnapshotStartHour", AutomatedSnapshotStartHour)
+            _init_PropertyType(self, kwargs)
+
+    class DomainVPCOptions(_PropertyType):
+        """The Vpc Options property type for Domain in Elasticsearch.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPCOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticsearch-domain-vpcoptions.html>`_
+        """
+
+        __slots__ = ("SecurityGroupIds", "SubnetIds")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainVPCOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SecurityGroupIds=None, SubnetIds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SubnetIds", SubnetIds)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DomainCognitoOptions = create_object_converter(DomainCognitoOptions)
+    _convert_DomainEBSOptions = create_object_converter(DomainEBSOptions)
+    _convert_DomainElasticsearchClusterConfig = create_object_converter(
+        DomainElasticsearchClusterConfig
+    )
+    _convert_DomainEncryptionAtRestOptions = create_object_converter(
+        DomainEncryptionAtRestOptions
     )
+    _convert_DomainLogPublishingOption_map = create_object_map_converter(
+        DomainLogPublishingOption
+    )
+    _convert_DomainNodeToNodeEncryptionOptions = create_object_converter(
+        DomainNodeToNodeEncryptionOptions
+    )
+    _convert_DomainSnapshotOptions = create_object_converter(DomainSnapshotOptions)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_DomainVPCOptions = create_object_converter(DomainVPCOptions)
+
+    class DomainProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessPolicies",
+            "AdvancedOptions",
+            "CognitoOptions",
+            "DomainName",
+            "EBSOptions",
+            "ElasticsearchClusterConfig",
+            "ElasticsearchVersion",
+            "EncryptionAtRestOptions",
+            "LogPublishingOptions",
+            "NodeToNodeEncryptionOptions",
+            "SnapshotOptions",
+            "Tags",
+            "VPCOptions",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CognitoOptions": _convert_DomainCognitoOptions,
+                "EBSOptions": _convert_DomainEBSOptions,
+                "ElasticsearchClusterConfig": _convert_DomainElasticsearchClusterConfig,
+                "EncryptionAtRestOptions": _convert_DomainEncryptionAtRestOptions,
+                "LogPublishingOptions": _convert_DomainLogPublishingOption_map,
+                "NodeToNodeEncryptionOptions": _convert_DomainNodeToNodeEncryptionOptions,
+                "SnapshotOptions": _convert_DomainSnapshotOptions,
+                "Tags": _convert_Tag_list,
+                "VPCOptions": _convert_DomainVPCOptions,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessPolicies=None,
+            AdvancedOptions=None,
+            CognitoOptions=None,
+            DomainName=None,
+            EBSOptions=None,
+            ElasticsearchClusterConfig=None,
+            ElasticsearchVersion=None,
+            EncryptionAtRestOptions=None,
+            LogPublishingOptions=None,
+            NodeToNodeEncryptionOptions=None,
+            SnapshotOptions=None,
+            Tags=None,
+            VPCOptions=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccessPolicies", AccessPolicies)
+            _setattr("AdvancedOptions", AdvancedOptions)
+            _setattr("CognitoOptions", _convert_DomainCognitoOptions(CognitoOptions))
+            _setattr("DomainName", DomainName)
+            _setattr("EBSOptions", _convert_DomainEBSOptions(EBSOptions))
+            _setattr(
+                "ElasticsearchClusterConfig",
+                _convert_DomainElasticsearchClusterConfig(ElasticsearchClusterConfig),
+            )
+            _setattr("ElasticsearchVersion", ElasticsearchVersion)
+            _setattr(
+                "EncryptionAtRestOptions",
+                _convert_DomainEncryptionAtRestOptions(EncryptionAtRestOptions),
+            )
+            _setattr(
+                "LogPublishingOptions",
+                _convert_DomainLogPublishingOption_map(LogPublishingOptions),
+            )
+            _setattr(
+                "NodeToNodeEncryptionOptions",
+                _convert_DomainNodeToNodeEncryptionOptions(NodeToNodeEncryptionOptions),
+            )
+            _setattr("SnapshotOptions", _convert_DomainSnapshotOptions(SnapshotOptions))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VPCOptions", _convert_DomainVPCOptions(VPCOptions))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DomainProperties = create_object_converter(DomainProperties)
+
+    class Domain(_Resource):
+        """A Domain for Elasticsearch.
+
+        See Also:
+            `AWS Cloud Formation documentation for Domain
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticsearch-domain.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Elasticsearch::Domain"
+
+        Properties: DomainProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Domain",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DomainProperties},
+            factories={"Properties": DomainProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DomainProperties()
+            _setattr("Properties", _convert_DomainProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Domain,
+        DomainProperties,
+        DomainCognitoOptions,
+        DomainEBSOptions,
+        DomainZoneAwarenessConfig,
+        DomainElasticsearchClusterConfig,
+        DomainEncryptionAtRestOptions,
+        DomainLogPublishingOption,
+        DomainNodeToNodeEncryptionOptions,
+        DomainSnapshotOptions,
+        DomainVPCOptions,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Domain": _create_Domain,
+        "DomainProperties": _create_Domain,
+        "DomainCognitoOptions": _create_Domain,
+        "DomainEBSOptions": _create_Domain,
+        "DomainElasticsearchClusterConfig": _create_Domain,
+        "DomainEncryptionAtRestOptions": _create_Domain,
+        "DomainLogPublishingOption": _create_Domain,
+        "DomainNodeToNodeEncryptionOptions": _create_Domain,
+        "DomainSnapshotOptions": _create_Domain,
+        "DomainVPCOptions": _create_Domain,
+        "DomainZoneAwarenessConfig": _create_Domain,
+    },
+)
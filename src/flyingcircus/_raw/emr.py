@@ -7,168 +7,2419 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Cluster",
     "ClusterProperties",
+    "ClusterApplication",
+    "ClusterAutoScalingPolicy",
+    "ClusterBootstrapActionConfig",
+    "ClusterCloudWatchAlarmDefinition",
+    "ClusterConfiguration",
+    "ClusterEbsBlockDeviceConfig",
+    "ClusterEbsConfiguration",
+    "ClusterHadoopJarStepConfig",
+    "ClusterInstanceFleetConfig",
+    "ClusterInstanceFleetProvisioningSpecifications",
+    "ClusterInstanceGroupConfig",
+    "ClusterInstanceTypeConfig",
+    "ClusterJobFlowInstancesConfig",
+    "ClusterKerberosAttributes",
+    "ClusterKeyValue",
+    "ClusterMetricDimension",
+    "ClusterPlacementType",
+    "ClusterScalingAction",
+    "ClusterScalingConstraints",
+    "ClusterScalingRule",
+    "ClusterScalingTrigger",
+    "ClusterScriptBootstrapActionConfig",
+    "ClusterSimpleScalingPolicyConfiguration",
+    "ClusterSpotProvisioningSpecification",
+    "ClusterStepConfig",
+    "ClusterVolumeSpecification",
     "InstanceFleetConfig",
     "InstanceFleetConfigProperties",
+    "InstanceFleetConfigConfiguration",
+    "InstanceFleetConfigEbsBlockDeviceConfig",
+    "InstanceFleetConfigEbsConfiguration",
+    "InstanceFleetConfigInstanceFleetProvisioningSpecifications",
+    "InstanceFleetConfigInstanceTypeConfig",
+    "InstanceFleetConfigSpotProvisioningSpecification",
+    "InstanceFleetConfigVolumeSpecification",
     "InstanceGroupConfig",
     "InstanceGroupConfigProperties",
+    "InstanceGroupConfigAutoScalingPolicy",
+    "InstanceGroupConfigCloudWatchAlarmDefinition",
+    "InstanceGroupConfigConfiguration",
+    "InstanceGroupConfigEbsBlockDeviceConfig",
+    "InstanceGroupConfigEbsConfiguration",
+    "InstanceGroupConfigMetricDimension",
+    "InstanceGroupConfigScalingAction",
+    "InstanceGroupConfigScalingConstraints",
+    "InstanceGroupConfigScalingRule",
+    "InstanceGroupConfigScalingTrigger",
+    "InstanceGroupConfigSimpleScalingPolicyConfiguration",
+    "InstanceGroupConfigVolumeSpecification",
     "SecurityConfiguration",
     "SecurityConfigurationProperties",
     "Step",
     "StepProperties",
+    "StepHadoopJarStepConfig",
+    "StepKeyValue",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ClusterProperties(ResourceProperties):
-    AdditionalInfo = attrib(default=None)
-    Applications = attrib(default=None)
-    AutoScalingRole = attrib(default=None)
-    BootstrapActions = attrib(default=None)
-    Configurations = attrib(default=None)
-    CustomAmiId = attrib(default=None)
-    EbsRootVolumeSize = attrib(default=None)
-    Instances = attrib(default=None)
-    JobFlowRole = attrib(default=None)
-    KerberosAttributes = attrib(default=None)
-    LogUri = attrib(default=None)
-    Name = attrib(default=None)
-    ReleaseLabel = attrib(default=None)
-    ScaleDownBehavior = attrib(default=None)
-    SecurityConfiguration = attrib(default=None)
-    ServiceRole = attrib(default=None)
-    Steps = attrib(default=None)
-    Tags = attrib(default=None)
-    VisibleToAllUsers = attrib(default=None)
+def _create_Cluster():
+    class ClusterApplication(_PropertyType):
+        """The Application property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for Application
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-application.html>`_
+        """
+
+        __slots__ = ("AdditionalInfo", "Args", "Name", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterApplication", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AdditionalInfo=None, Args=None, Name=None, Version=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdditionalInfo", AdditionalInfo)
+            _setattr("Args", Args)
+            _setattr("Name", Name)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class ClusterScalingConstraints(_PropertyType):
+        """The Scaling Constraints property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingConstraints
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-scalingconstraints.html>`_
+        """
+
+        __slots__ = ("MaxCapacity", "MinCapacity")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterScalingConstraints", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MaxCapacity=None, MinCapacity=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaxCapacity", MaxCapacity)
+            _setattr("MinCapacity", MinCapacity)
+            _init_PropertyType(self, kwargs)
+
+    class ClusterSimpleScalingPolicyConfiguration(_PropertyType):
+        """The Simple Scaling Policy Configuration property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for SimpleScalingPolicyConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-simplescalingpolicyconfiguration.html>`_
+        """
+
+        __slots__ = ("AdjustmentType", "CoolDown", "ScalingAdjustment")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterSimpleScalingPolicyConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AdjustmentType=None,
+            CoolDown=None,
+            ScalingAdjustment=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdjustmentType", AdjustmentType)
+            _setattr("CoolDown", CoolDown)
+            _setattr("ScalingAdjustment", ScalingAdjustment)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterSimpleScalingPolicyConfiguration = create_object_converter(
+        ClusterSimpleScalingPolicyConfiguration
+    )
+
+    class ClusterScalingAction(_PropertyType):
+        """The Scaling Action property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-scalingaction.html>`_
+        """
+
+        __slots__ = ("Market", "SimpleScalingPolicyConfiguration")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterScalingAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "SimpleScalingPolicyConfiguration": _convert_ClusterSimpleScalingPolicyConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Market=None, SimpleScalingPolicyConfiguration=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Market", Market)
+            _setattr(
+                "SimpleScalingPolicyConfiguration",
+                _convert_ClusterSimpleScalingPolicyConfiguration(
+                    SimpleScalingPolicyConfiguration
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ClusterMetricDimension(_PropertyType):
+        """The Metric Dimension property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-metricdimension.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterMetricDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterMetricDimension_list = create_object_list_converter(
+        ClusterMetricDimension
+    )
+
+    class ClusterCloudWatchAlarmDefinition(_PropertyType):
+        """The Cloud Watch Alarm Definition property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudWatchAlarmDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-cloudwatchalarmdefinition.html>`_
+        """
+
+        __slots__ = (
+            "ComparisonOperator",
+            "Dimensions",
+            "EvaluationPeriods",
+            "MetricName",
+            "Namespace",
+            "Period",
+            "Statistic",
+            "Threshold",
+            "Unit",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterCloudWatchAlarmDefinition",
+            _PropertyType,
+            __slots__,
+            converters={"Dimensions": _convert_ClusterMetricDimension_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ComparisonOperator=None,
+            Dimensions=None,
+            EvaluationPeriods=None,
+            MetricName=None,
+            Namespace=None,
+            Period=None,
+            Statistic=None,
+            Threshold=None,
+            Unit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComparisonOperator", ComparisonOperator)
+            _setattr("Dimensions", _convert_ClusterMetricDimension_list(Dimensions))
+            _setattr("EvaluationPeriods", EvaluationPeriods)
+            _setattr("MetricName", MetricName)
+            _setattr("Namespace", Namespace)
+            _setattr("Period", Period)
+            _setattr("Statistic", Statistic)
+            _setattr("Threshold", Threshold)
+            _setattr("Unit", Unit)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterCloudWatchAlarmDefinition = create_object_converter(
+        ClusterCloudWatchAlarmDefinition
+    )
+
+    class ClusterScalingTrigger(_PropertyType):
+        """The Scaling Trigger property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingTrigger
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-scalingtrigger.html>`_
+        """
+
+        __slots__ = ("CloudWatchAlarmDefinition",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterScalingTrigger",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudWatchAlarmDefinition": _convert_ClusterCloudWatchAlarmDefinition
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CloudWatchAlarmDefinition=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudWatchAlarmDefinition",
+                _convert_ClusterCloudWatchAlarmDefinition(CloudWatchAlarmDefinition),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterScalingAction = create_object_converter(ClusterScalingAction)
+    _convert_ClusterScalingTrigger = create_object_converter(ClusterScalingTrigger)
+
+    class ClusterScalingRule(_PropertyType):
+        """The Scaling Rule property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-scalingrule.html>`_
+        """
+
+        __slots__ = ("Action", "Description", "Name", "Trigger")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterScalingRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Action": _convert_ClusterScalingAction,
+                "Trigger": _convert_ClusterScalingTrigger,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Action=None, Description=None, Name=None, Trigger=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", _convert_ClusterScalingAction(Action))
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Trigger", _convert_ClusterScalingTrigger(Trigger))
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterScalingConstraints = create_object_converter(
+        ClusterScalingConstraints
+    )
+    _convert_ClusterScalingRule_list = create_object_list_converter(ClusterScalingRule)
+
+    class ClusterAutoScalingPolicy(_PropertyType):
+        """The Auto Scaling Policy property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for AutoScalingPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-autoscalingpolicy.html>`_
+        """
+
+        __slots__ = ("Constraints", "Rules")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterAutoScalingPolicy",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Constraints": _convert_ClusterScalingConstraints,
+                "Rules": _convert_ClusterScalingRule_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Constraints=None, Rules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Constraints", _convert_ClusterScalingConstraints(Constraints))
+            _setattr("Rules", _convert_ClusterScalingRule_list(Rules))
+            _init_PropertyType(self, kwargs)
+
+    class ClusterScriptBootstrapActionConfig(_PropertyType):
+        """The Script Bootstrap Action Config property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScriptBootstrapActionConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-scriptbootstrapactionconfig.html>`_
+        """
+
+        __slots__ = ("Args", "Path")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterScriptBootstrapActionConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Args=None, Path=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Args", Args)
+            _setattr("Path", Path)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterScriptBootstrapActionConfig = create_object_converter(
+        ClusterScriptBootstrapActionConfig
+    )
+
+    class ClusterBootstrapActionConfig(_PropertyType):
+        """The Bootstrap Action Config property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for BootstrapActionConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-bootstrapactionconfig.html>`_
+        """
+
+        __slots__ = ("Name", "ScriptBootstrapAction")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterBootstrapActionConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ScriptBootstrapAction": _convert_ClusterScriptBootstrapActionConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, ScriptBootstrapAction=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr(
+                "ScriptBootstrapAction",
+                _convert_ClusterScriptBootstrapActionConfig(ScriptBootstrapAction),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterConfiguration_list = create_object_list_converter(
+        lambda **kwargs: ClusterConfiguration(**kwargs)
+    )
+
+    class ClusterConfiguration(_PropertyType):
+        """The Configuration property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for Configuration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-configuration.html>`_
+        """
+
+        __slots__ = ("Classification", "ConfigurationProperties", "Configurations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Configurations": _convert_ClusterConfiguration_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Classification=None,
+            ConfigurationProperties=None,
+            Configurations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Classification", Classification)
+            _setattr("ConfigurationProperties", ConfigurationProperties)
+            _setattr(
+                "Configurations", _convert_ClusterConfiguration_list(Configurations)
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ClusterVolumeSpecification(_PropertyType):
+        """The Volume Specification property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for VolumeSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-volumespecification.html>`_
+        """
+
+        __slots__ = ("Iops", "SizeInGB", "VolumeType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterVolumeSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Iops=None, SizeInGB=None, VolumeType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Iops", Iops)
+            _setattr("SizeInGB", SizeInGB)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterVolumeSpecification = create_object_converter(
+        ClusterVolumeSpecification
+    )
+
+    class ClusterEbsBlockDeviceConfig(_PropertyType):
+        """The Ebs Block Device Config property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for EbsBlockDeviceConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-ebsblockdeviceconfig.html>`_
+        """
+
+        __slots__ = ("VolumeSpecification", "VolumesPerInstance")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterEbsBlockDeviceConfig",
+            _PropertyType,
+            __slots__,
+            converters={"VolumeSpecification": _convert_ClusterVolumeSpecification},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, VolumeSpecification=None, VolumesPerInstance=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "VolumeSpecification",
+                _convert_ClusterVolumeSpecification(VolumeSpecification),
+            )
+            _setattr("VolumesPerInstance", VolumesPerInstance)
+            _init_PropertyType(self, kwargs)
 
+    _convert_ClusterEbsBlockDeviceConfig_list = create_object_list_converter(
+        ClusterEbsBlockDeviceConfig
+    )
+
+    class ClusterEbsConfiguration(_PropertyType):
+        """The Ebs Configuration property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for EbsConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-ebsconfiguration.html>`_
+        """
+
+        __slots__ = ("EbsBlockDeviceConfigs", "EbsOptimized")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterEbsConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "EbsBlockDeviceConfigs": _convert_ClusterEbsBlockDeviceConfig_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, EbsBlockDeviceConfigs=None, EbsOptimized=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "EbsBlockDeviceConfigs",
+                _convert_ClusterEbsBlockDeviceConfig_list(EbsBlockDeviceConfigs),
+            )
+            _setattr("EbsOptimized", EbsOptimized)
+            _init_PropertyType(self, kwargs)
+
+    class ClusterKeyValue(_PropertyType):
+        """The Key Value property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for KeyValue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-keyvalue.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterKeyValue", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterKeyValue_list = create_object_list_converter(ClusterKeyValue)
+
+    class ClusterHadoopJarStepConfig(_PropertyType):
+        """The Hadoop Jar Step Config property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for HadoopJarStepConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-hadoopjarstepconfig.html>`_
+        """
+
+        __slots__ = ("Args", "Jar", "MainClass", "StepProperties")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterHadoopJarStepConfig",
+            _PropertyType,
+            __slots__,
+            converters={"StepProperties": _convert_ClusterKeyValue_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Args=None, Jar=None, MainClass=None, StepProperties=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Args", Args)
+            _setattr("Jar", Jar)
+            _setattr("MainClass", MainClass)
+            _setattr("StepProperties", _convert_ClusterKeyValue_list(StepProperties))
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterEbsConfiguration = create_object_converter(ClusterEbsConfiguration)
+
+    class ClusterInstanceTypeConfig(_PropertyType):
+        """The Instance Type Config property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceTypeConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-instancetypeconfig.html>`_
+        """
+
+        __slots__ = (
+            "BidPrice",
+            "BidPriceAsPercentageOfOnDemandPrice",
+            "Configurations",
+            "EbsConfiguration",
+            "InstanceType",
+            "WeightedCapacity",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterInstanceTypeConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Configurations": _convert_ClusterConfiguration_list,
+                "EbsConfiguration": _convert_ClusterEbsConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Cluster(Resource):
-    """A Cluster for EMR.
+        def __init__(
+            self,
+            *,
+            BidPrice=None,
+            BidPriceAsPercentageOfOnDemandPrice=None,
+            Configurations=None,
+            EbsConfiguration=None,
+            InstanceType=None,
+            WeightedCapacity=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BidPrice", BidPrice)
+            _setattr(
+                "BidPriceAsPercentageOfOnDemandPrice",
+                BidPriceAsPercentageOfOnDemandPrice,
+            )
+            _setattr(
+                "Configurations", _convert_ClusterConfiguration_list(Configurations)
+            )
+            _setattr(
+                "EbsConfiguration", _convert_ClusterEbsConfiguration(EbsConfiguration)
+            )
+            _setattr("InstanceType", InstanceType)
+            _setattr("WeightedCapacity", WeightedCapacity)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Cluster
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticmapreduce-cluster.html>`_
-    """
+    class ClusterSpotProvisioningSpecification(_PropertyType):
+        """The Spot Provisioning Specification property type for Cluster in EMR.
 
-    RESOURCE_TYPE = "AWS::EMR::Cluster"
+        See Also:
+            `AWS Cloud Formation documentation for SpotProvisioningSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-spotprovisioningspecification.html>`_
+        """
 
-    Properties: ClusterProperties = attrib(
-        factory=ClusterProperties, converter=create_object_converter(ClusterProperties)
+        __slots__ = ("BlockDurationMinutes", "TimeoutAction", "TimeoutDurationMinutes")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterSpotProvisioningSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockDurationMinutes=None,
+            TimeoutAction=None,
+            TimeoutDurationMinutes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BlockDurationMinutes", BlockDurationMinutes)
+            _setattr("TimeoutAction", TimeoutAction)
+            _setattr("TimeoutDurationMinutes", TimeoutDurationMinutes)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterSpotProvisioningSpecification = create_object_converter(
+        ClusterSpotProvisioningSpecification
     )
 
+    class ClusterInstanceFleetProvisioningSpecifications(_PropertyType):
+        """The Instance Fleet Provisioning Specifications property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceFleetProvisioningSpecifications
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-instancefleetprovisioningspecifications.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class InstanceFleetConfigProperties(ResourceProperties):
-    ClusterId = attrib(default=None)
-    InstanceFleetType = attrib(default=None)
-    InstanceTypeConfigs = attrib(default=None)
-    LaunchSpecifications = attrib(default=None)
-    Name = attrib(default=None)
-    TargetOnDemandCapacity = attrib(default=None)
-    TargetSpotCapacity = attrib(default=None)
+        __slots__ = ("SpotSpecification",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterInstanceFleetProvisioningSpecifications",
+            _PropertyType,
+            __slots__,
+            converters={
+                "SpotSpecification": _convert_ClusterSpotProvisioningSpecification
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, SpotSpecification=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "SpotSpecification",
+                _convert_ClusterSpotProvisioningSpecification(SpotSpecification),
+            )
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class InstanceFleetConfig(Resource):
-    """A Instance Fleet Config for EMR.
+    _convert_ClusterInstanceTypeConfig_list = create_object_list_converter(
+        ClusterInstanceTypeConfig
+    )
+    _convert_ClusterInstanceFleetProvisioningSpecifications = create_object_converter(
+        ClusterInstanceFleetProvisioningSpecifications
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for InstanceFleetConfig
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticmapreduce-instancefleetconfig.html>`_
-    """
+    class ClusterInstanceFleetConfig(_PropertyType):
+        """The Instance Fleet Config property type for Cluster in EMR.
 
-    RESOURCE_TYPE = "AWS::EMR::InstanceFleetConfig"
+        See Also:
+            `AWS Cloud Formation documentation for InstanceFleetConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-instancefleetconfig.html>`_
+        """
 
-    Properties: InstanceFleetConfigProperties = attrib(
-        factory=InstanceFleetConfigProperties,
-        converter=create_object_converter(InstanceFleetConfigProperties),
+        __slots__ = (
+            "InstanceTypeConfigs",
+            "LaunchSpecifications",
+            "Name",
+            "TargetOnDemandCapacity",
+            "TargetSpotCapacity",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterInstanceFleetConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "InstanceTypeConfigs": _convert_ClusterInstanceTypeConfig_list,
+                "LaunchSpecifications": _convert_ClusterInstanceFleetProvisioningSpecifications,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            InstanceTypeConfigs=None,
+            LaunchSpecifications=None,
+            Name=None,
+            TargetOnDemandCapacity=None,
+            TargetSpotCapacity=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InstanceTypeConfigs",
+                _convert_ClusterInstanceTypeConfig_list(InstanceTypeConfigs),
+            )
+            _setattr(
+                "LaunchSpecifications",
+                _convert_ClusterInstanceFleetProvisioningSpecifications(
+                    LaunchSpecifications
+                ),
+            )
+            _setattr("Name", Name)
+            _setattr("TargetOnDemandCapacity", TargetOnDemandCapacity)
+            _setattr("TargetSpotCapacity", TargetSpotCapacity)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterAutoScalingPolicy = create_object_converter(
+        ClusterAutoScalingPolicy
     )
 
+    class ClusterInstanceGroupConfig(_PropertyType):
+        """The Instance Group Config property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceGroupConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-instancegroupconfig.html>`_
+        """
+
+        __slots__ = (
+            "AutoScalingPolicy",
+            "BidPrice",
+            "Configurations",
+            "EbsConfiguration",
+            "InstanceCount",
+            "InstanceType",
+            "Market",
+            "Name",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterInstanceGroupConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AutoScalingPolicy": _convert_ClusterAutoScalingPolicy,
+                "Configurations": _convert_ClusterConfiguration_list,
+                "EbsConfiguration": _convert_ClusterEbsConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class InstanceGroupConfigProperties(ResourceProperties):
-    AutoScalingPolicy = attrib(default=None)
-    BidPrice = attrib(default=None)
-    Configurations = attrib(default=None)
-    EbsConfiguration = attrib(default=None)
-    InstanceCount = attrib(default=None)
-    InstanceRole = attrib(default=None)
-    InstanceType = attrib(default=None)
-    JobFlowId = attrib(default=None)
-    Market = attrib(default=None)
-    Name = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            AutoScalingPolicy=None,
+            BidPrice=None,
+            Configurations=None,
+            EbsConfiguration=None,
+            InstanceCount=None,
+            InstanceType=None,
+            Market=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AutoScalingPolicy",
+                _convert_ClusterAutoScalingPolicy(AutoScalingPolicy),
+            )
+            _setattr("BidPrice", BidPrice)
+            _setattr(
+                "Configurations", _convert_ClusterConfiguration_list(Configurations)
+            )
+            _setattr(
+                "EbsConfiguration", _convert_ClusterEbsConfiguration(EbsConfiguration)
+            )
+            _setattr("InstanceCount", InstanceCount)
+            _setattr("InstanceType", InstanceType)
+            _setattr("Market", Market)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
 
+    class ClusterPlacementType(_PropertyType):
+        """The Placement Type property type for Cluster in EMR.
 
-@attrs(**ATTRSCONFIG)
-class InstanceGroupConfig(Resource):
-    """A Instance Group Config for EMR.
+        See Also:
+            `AWS Cloud Formation documentation for PlacementType
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-placementtype.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for InstanceGroupConfig
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-emr-instancegroupconfig.html>`_
-    """
+        __slots__ = ("AvailabilityZone",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterPlacementType", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::EMR::InstanceGroupConfig"
+        def __init__(self, *, AvailabilityZone=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _init_PropertyType(self, kwargs)
 
-    Properties: InstanceGroupConfigProperties = attrib(
-        factory=InstanceGroupConfigProperties,
-        converter=create_object_converter(InstanceGroupConfigProperties),
+    _convert_ClusterInstanceFleetConfig = create_object_converter(
+        ClusterInstanceFleetConfig
     )
+    _convert_ClusterInstanceGroupConfig = create_object_converter(
+        ClusterInstanceGroupConfig
+    )
+    _convert_ClusterPlacementType = create_object_converter(ClusterPlacementType)
+
+    class ClusterJobFlowInstancesConfig(_PropertyType):
+        """The Job Flow Instances Config property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for JobFlowInstancesConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-jobflowinstancesconfig.html>`_
+        """
 
+        __slots__ = (
+            "AdditionalMasterSecurityGroups",
+            "AdditionalSlaveSecurityGroups",
+            "CoreInstanceFleet",
+            "CoreInstanceGroup",
+            "Ec2KeyName",
+            "Ec2SubnetId",
+            "Ec2SubnetIds",
+            "EmrManagedMasterSecurityGroup",
+            "EmrManagedSlaveSecurityGroup",
+            "HadoopVersion",
+            "KeepJobFlowAliveWhenNoSteps",
+            "MasterInstanceFleet",
+            "MasterInstanceGroup",
+            "Placement",
+            "ServiceAccessSecurityGroup",
+            "TerminationProtected",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterJobFlowInstancesConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CoreInstanceFleet": _convert_ClusterInstanceFleetConfig,
+                "CoreInstanceGroup": _convert_ClusterInstanceGroupConfig,
+                "MasterInstanceFleet": _convert_ClusterInstanceFleetConfig,
+                "MasterInstanceGroup": _convert_ClusterInstanceGroupConfig,
+                "Placement": _convert_ClusterPlacementType,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class SecurityConfigurationProperties(ResourceProperties):
-    Name = attrib(default=None)
-    SecurityConfiguration = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            AdditionalMasterSecurityGroups=None,
+            AdditionalSlaveSecurityGroups=None,
+            CoreInstanceFleet=None,
+            CoreInstanceGroup=None,
+            Ec2KeyName=None,
+            Ec2SubnetId=None,
+            Ec2SubnetIds=None,
+            EmrManagedMasterSecurityGroup=None,
+            EmrManagedSlaveSecurityGroup=None,
+            HadoopVersion=None,
+            KeepJobFlowAliveWhenNoSteps=None,
+            MasterInstanceFleet=None,
+            MasterInstanceGroup=None,
+            Placement=None,
+            ServiceAccessSecurityGroup=None,
+            TerminationProtected=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdditionalMasterSecurityGroups", AdditionalMasterSecurityGroups)
+            _setattr("AdditionalSlaveSecurityGroups", AdditionalSlaveSecurityGroups)
+            _setattr(
+                "CoreInstanceFleet",
+                _convert_ClusterInstanceFleetConfig(CoreInstanceFleet),
+            )
+            _setattr(
+                "CoreInstanceGroup",
+                _convert_ClusterInstanceGroupConfig(CoreInstanceGroup),
+            )
+            _setattr("Ec2KeyName", Ec2KeyName)
+            _setattr("Ec2SubnetId", Ec2SubnetId)
+            _setattr("Ec2SubnetIds", Ec2SubnetIds)
+            _setattr("EmrManagedMasterSecurityGroup", EmrManagedMasterSecurityGroup)
+            _setattr("EmrManagedSlaveSecurityGroup", EmrManagedSlaveSecurityGroup)
+            _setattr("HadoopVersion", HadoopVersion)
+            _setattr("KeepJobFlowAliveWhenNoSteps", KeepJobFlowAliveWhenNoSteps)
+            _setattr(
+                "MasterInstanceFleet",
+                _convert_ClusterInstanceFleetConfig(MasterInstanceFleet),
+            )
+            _setattr(
+                "MasterInstanceGroup",
+                _convert_ClusterInstanceGroupConfig(MasterInstanceGroup),
+            )
+            _setattr("Placement", _convert_ClusterPlacementType(Placement))
+            _setattr("ServiceAccessSecurityGroup", ServiceAccessSecurityGroup)
+            _setattr("TerminationProtected", TerminationProtected)
+            _init_PropertyType(self, kwargs)
 
+    class ClusterKerberosAttributes(_PropertyType):
+        """The Kerberos Attributes property type for Cluster in EMR.
 
-@attrs(**ATTRSCONFIG)
-class SecurityConfiguration(Resource):
-    """A Security Configuration for EMR.
+        See Also:
+            `AWS Cloud Formation documentation for KerberosAttributes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-kerberosattributes.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for SecurityConfiguration
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-emr-securityconfiguration.html>`_
-    """
+        __slots__ = (
+            "ADDomainJoinPassword",
+            "ADDomainJoinUser",
+            "CrossRealmTrustPrincipalPassword",
+            "KdcAdminPassword",
+            "Realm",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterKerberosAttributes", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::EMR::SecurityConfiguration"
+        def __init__(
+            self,
+            *,
+            ADDomainJoinPassword=None,
+            ADDomainJoinUser=None,
+            CrossRealmTrustPrincipalPassword=None,
+            KdcAdminPassword=None,
+            Realm=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ADDomainJoinPassword", ADDomainJoinPassword)
+            _setattr("ADDomainJoinUser", ADDomainJoinUser)
+            _setattr(
+                "CrossRealmTrustPrincipalPassword", CrossRealmTrustPrincipalPassword
+            )
+            _setattr("KdcAdminPassword", KdcAdminPassword)
+            _setattr("Realm", Realm)
+            _init_PropertyType(self, kwargs)
 
-    Properties: SecurityConfigurationProperties = attrib(
-        factory=SecurityConfigurationProperties,
-        converter=create_object_converter(SecurityConfigurationProperties),
+    _convert_ClusterHadoopJarStepConfig = create_object_converter(
+        ClusterHadoopJarStepConfig
     )
 
+    class ClusterStepConfig(_PropertyType):
+        """The Step Config property type for Cluster in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for StepConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-cluster-stepconfig.html>`_
+        """
+
+        __slots__ = ("ActionOnFailure", "HadoopJarStep", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterStepConfig",
+            _PropertyType,
+            __slots__,
+            converters={"HadoopJarStep": _convert_ClusterHadoopJarStepConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class StepProperties(ResourceProperties):
-    ActionOnFailure = attrib(default=None)
-    HadoopJarStep = attrib(default=None)
-    JobFlowId = attrib(default=None)
-    Name = attrib(default=None)
+        def __init__(
+            self, *, ActionOnFailure=None, HadoopJarStep=None, Name=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ActionOnFailure", ActionOnFailure)
+            _setattr(
+                "HadoopJarStep", _convert_ClusterHadoopJarStepConfig(HadoopJarStep)
+            )
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterApplication_list = create_object_list_converter(ClusterApplication)
+    _convert_ClusterBootstrapActionConfig_list = create_object_list_converter(
+        ClusterBootstrapActionConfig
+    )
+    _convert_ClusterJobFlowInstancesConfig = create_object_converter(
+        ClusterJobFlowInstancesConfig
+    )
+    _convert_ClusterKerberosAttributes = create_object_converter(
+        ClusterKerberosAttributes
+    )
+    _convert_ClusterStepConfig_list = create_object_list_converter(ClusterStepConfig)
+    _convert_Tag_list = create_object_list_converter(_Tag)
 
+    class ClusterProperties(_ResourceProperties):
+        __slots__ = (
+            "AdditionalInfo",
+            "Applications",
+            "AutoScalingRole",
+            "BootstrapActions",
+            "Configurations",
+            "CustomAmiId",
+            "EbsRootVolumeSize",
+            "Instances",
+            "JobFlowRole",
+            "KerberosAttributes",
+            "LogUri",
+            "Name",
+            "ReleaseLabel",
+            "ScaleDownBehavior",
+            "SecurityConfiguration",
+            "ServiceRole",
+            "Steps",
+            "Tags",
+            "VisibleToAllUsers",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Applications": _convert_ClusterApplication_list,
+                "BootstrapActions": _convert_ClusterBootstrapActionConfig_list,
+                "Configurations": _convert_ClusterConfiguration_list,
+                "Instances": _convert_ClusterJobFlowInstancesConfig,
+                "KerberosAttributes": _convert_ClusterKerberosAttributes,
+                "Steps": _convert_ClusterStepConfig_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Step(Resource):
-    """A Step for EMR.
+        def __init__(
+            self,
+            *,
+            AdditionalInfo=None,
+            Applications=None,
+            AutoScalingRole=None,
+            BootstrapActions=None,
+            Configurations=None,
+            CustomAmiId=None,
+            EbsRootVolumeSize=None,
+            Instances=None,
+            JobFlowRole=None,
+            KerberosAttributes=None,
+            LogUri=None,
+            Name=None,
+            ReleaseLabel=None,
+            ScaleDownBehavior=None,
+            SecurityConfiguration=None,
+            ServiceRole=None,
+            Steps=None,
+            Tags=None,
+            VisibleToAllUsers=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdditionalInfo", AdditionalInfo)
+            _setattr("Applications", _convert_ClusterApplication_list(Applications))
+            _setattr("AutoScalingRole", AutoScalingRole)
+            _setattr(
+                "BootstrapActions",
+                _convert_ClusterBootstrapActionConfig_list(BootstrapActions),
+            )
+            _setattr(
+                "Configurations", _convert_ClusterConfiguration_list(Configurations)
+            )
+            _setattr("CustomAmiId", CustomAmiId)
+            _setattr("EbsRootVolumeSize", EbsRootVolumeSize)
+            _setattr("Instances", _convert_ClusterJobFlowInstancesConfig(Instances))
+            _setattr("JobFlowRole", JobFlowRole)
+            _setattr(
+                "KerberosAttributes",
+                _convert_ClusterKerberosAttributes(KerberosAttributes),
+            )
+            _setattr("LogUri", LogUri)
+            _setattr("Name", Name)
+            _setattr("ReleaseLabel", ReleaseLabel)
+            _setattr("ScaleDownBehavior", ScaleDownBehavior)
+            _setattr("SecurityConfiguration", SecurityConfiguration)
+            _setattr("ServiceRole", ServiceRole)
+            _setattr("Steps", _convert_ClusterStepConfig_list(Steps))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VisibleToAllUsers", VisibleToAllUsers)
+            _init_ResourceProperties(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Step
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-emr-step.html>`_
-    """
+    _convert_ClusterProperties = create_object_converter(ClusterProperties)
 
-    RESOURCE_TYPE = "AWS::EMR::Step"
+    class Cluster(_Resource):
+        """A Cluster for EMR.
 
-    Properties: StepProperties = attrib(
-        factory=StepProperties, converter=create_object_converter(StepProperties)
+        See Also:
+            `AWS Cloud Formation documentation for Cluster
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticmapreduce-cluster.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EMR::Cluster"
+
+        Properties: ClusterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Cluster",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterProperties},
+            factories={"Properties": ClusterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterProperties()
+            _setattr("Properties", _convert_ClusterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Cluster,
+        ClusterProperties,
+        ClusterApplication,
+        ClusterScalingConstraints,
+        ClusterSimpleScalingPolicyConfiguration,
+        ClusterScalingAction,
+        ClusterMetricDimension,
+        ClusterCloudWatchAlarmDefinition,
+        ClusterScalingTrigger,
+        ClusterScalingRule,
+        ClusterAutoScalingPolicy,
+        ClusterScriptBootstrapActionConfig,
+        ClusterBootstrapActionConfig,
+        ClusterConfiguration,
+        ClusterVolumeSpecification,
+        ClusterEbsBlockDeviceConfig,
+        ClusterEbsConfiguration,
+        ClusterKeyValue,
+        ClusterHadoopJarStepConfig,
+        ClusterInstanceTypeConfig,
+        ClusterSpotProvisioningSpecification,
+        ClusterInstanceFleetProvisioningSpecifications,
+        ClusterInstanceFleetConfig,
+        ClusterInstanceGroupConfig,
+        ClusterPlacementType,
+        ClusterJobFlowInstancesConfig,
+        ClusterKerberosAttributes,
+        ClusterStepConfig,
+    )
+
+
+def _create_InstanceFleetConfig():
+    _convert_InstanceFleetConfigConfiguration_list = create_object_list_converter(
+        lambda **kwargs: InstanceFleetConfigConfiguration(**kwargs)
+    )
+
+    class InstanceFleetConfigConfiguration(_PropertyType):
+        """The Configuration property type for InstanceFleetConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for Configuration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancefleetconfig-configuration.html>`_
+        """
+
+        __slots__ = ("Classification", "ConfigurationProperties", "Configurations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceFleetConfigConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Configurations": _convert_InstanceFleetConfigConfiguration_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Classification=None,
+            ConfigurationProperties=None,
+            Configurations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Classification", Classification)
+            _setattr("ConfigurationProperties", ConfigurationProperties)
+            _setattr(
+                "Configurations",
+                _convert_InstanceFleetConfigConfiguration_list(Configurations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class InstanceFleetConfigVolumeSpecification(_PropertyType):
+        """The Volume Specification property type for InstanceFleetConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for VolumeSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancefleetconfig-volumespecification.html>`_
+        """
+
+        __slots__ = ("Iops", "SizeInGB", "VolumeType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceFleetConfigVolumeSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Iops=None, SizeInGB=None, VolumeType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Iops", Iops)
+            _setattr("SizeInGB", SizeInGB)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceFleetConfigVolumeSpecification = create_object_converter(
+        InstanceFleetConfigVolumeSpecification
     )
+
+    class InstanceFleetConfigEbsBlockDeviceConfig(_PropertyType):
+        """The Ebs Block Device Config property type for InstanceFleetConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for EbsBlockDeviceConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancefleetconfig-ebsblockdeviceconfig.html>`_
+        """
+
+        __slots__ = ("VolumeSpecification", "VolumesPerInstance")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceFleetConfigEbsBlockDeviceConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "VolumeSpecification": _convert_InstanceFleetConfigVolumeSpecification
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, VolumeSpecification=None, VolumesPerInstance=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "VolumeSpecification",
+                _convert_InstanceFleetConfigVolumeSpecification(VolumeSpecification),
+            )
+            _setattr("VolumesPerInstance", VolumesPerInstance)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceFleetConfigEbsBlockDeviceConfig_list = (
+        create_object_list_converter(InstanceFleetConfigEbsBlockDeviceConfig)
+    )
+
+    class InstanceFleetConfigEbsConfiguration(_PropertyType):
+        """The Ebs Configuration property type for InstanceFleetConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for EbsConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancefleetconfig-ebsconfiguration.html>`_
+        """
+
+        __slots__ = ("EbsBlockDeviceConfigs", "EbsOptimized")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceFleetConfigEbsConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "EbsBlockDeviceConfigs": _convert_InstanceFleetConfigEbsBlockDeviceConfig_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, EbsBlockDeviceConfigs=None, EbsOptimized=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "EbsBlockDeviceConfigs",
+                _convert_InstanceFleetConfigEbsBlockDeviceConfig_list(
+                    EbsBlockDeviceConfigs
+                ),
+            )
+            _setattr("EbsOptimized", EbsOptimized)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceFleetConfigSpotProvisioningSpecification(_PropertyType):
+        """The Spot Provisioning Specification property type for InstanceFleetConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for SpotProvisioningSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancefleetconfig-spotprovisioningspecification.html>`_
+        """
+
+        __slots__ = ("BlockDurationMinutes", "TimeoutAction", "TimeoutDurationMinutes")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceFleetConfigSpotProvisioningSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockDurationMinutes=None,
+            TimeoutAction=None,
+            TimeoutDurationMinutes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BlockDurationMinutes", BlockDurationMinutes)
+            _setattr("TimeoutAction", TimeoutAction)
+            _setattr("TimeoutDurationMinutes", TimeoutDurationMinutes)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceFleetConfigSpotProvisioningSpecification = create_object_converter(
+        InstanceFleetConfigSpotProvisioningSpecification
+    )
+
+    class InstanceFleetConfigInstanceFleetProvisioningSpecifications(_PropertyType):
+        """The Instance Fleet Provisioning Specifications property type for InstanceFleetConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceFleetProvisioningSpecifications
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancefleetconfig-instancefleetprovisioningspecifications.html>`_
+        """
+
+        __slots__ = ("SpotSpecification",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceFleetConfigInstanceFleetProvisioningSpecifications",
+            _PropertyType,
+            __slots__,
+            converters={
+                "SpotSpecification": _convert_InstanceFleetConfigSpotProvisioningSpecification
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SpotSpecification=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "SpotSpecification",
+                _convert_InstanceFleetConfigSpotProvisioningSpecification(
+                    SpotSpecification
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceFleetConfigEbsConfiguration = create_object_converter(
+        InstanceFleetConfigEbsConfiguration
+    )
+
+    class InstanceFleetConfigInstanceTypeConfig(_PropertyType):
+        """The Instance Type Config property type for InstanceFleetConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceTypeConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancefleetconfig-instancetypeconfig.html>`_
+        """
+
+        __slots__ = (
+            "BidPrice",
+            "BidPriceAsPercentageOfOnDemandPrice",
+            "Configurations",
+            "EbsConfiguration",
+            "InstanceType",
+            "WeightedCapacity",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceFleetConfigInstanceTypeConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Configurations": _convert_InstanceFleetConfigConfiguration_list,
+                "EbsConfiguration": _convert_InstanceFleetConfigEbsConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BidPrice=None,
+            BidPriceAsPercentageOfOnDemandPrice=None,
+            Configurations=None,
+            EbsConfiguration=None,
+            InstanceType=None,
+            WeightedCapacity=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BidPrice", BidPrice)
+            _setattr(
+                "BidPriceAsPercentageOfOnDemandPrice",
+                BidPriceAsPercentageOfOnDemandPrice,
+            )
+            _setattr(
+                "Configurations",
+                _convert_InstanceFleetConfigConfiguration_list(Configurations),
+            )
+            _setattr(
+                "EbsConfiguration",
+                _convert_InstanceFleetConfigEbsConfiguration(EbsConfiguration),
+            )
+            _setattr("InstanceType", InstanceType)
+            _setattr("WeightedCapacity", WeightedCapacity)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceFleetConfigInstanceTypeConfig_list = create_object_list_converter(
+        InstanceFleetConfigInstanceTypeConfig
+    )
+    _convert_InstanceFleetConfigInstanceFleetProvisioningSpecifications = (
+        create_object_converter(
+            InstanceFleetConfigInstanceFleetProvisioningSpecifications
+        )
+    )
+
+    class InstanceFleetConfigProperties(_ResourceProperties):
+        __slots__ = (
+            "ClusterId",
+            "InstanceFleetType",
+            "InstanceTypeConfigs",
+            "LaunchSpecifications",
+            "Name",
+            "TargetOnDemandCapacity",
+            "TargetSpotCapacity",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceFleetConfigProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "InstanceTypeConfigs": _convert_InstanceFleetConfigInstanceTypeConfig_list,
+                "LaunchSpecifications": _convert_InstanceFleetConfigInstanceFleetProvisioningSpecifications,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ClusterId=None,
+            InstanceFleetType=None,
+            InstanceTypeConfigs=None,
+            LaunchSpecifications=None,
+            Name=None,
+            TargetOnDemandCapacity=None,
+            TargetSpotCapacity=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClusterId", ClusterId)
+            _setattr("InstanceFleetType", InstanceFleetType)
+            _setattr(
+                "InstanceTypeConfigs",
+                _convert_InstanceFleetConfigInstanceTypeConfig_list(
+                    InstanceTypeConfigs
+                ),
+            )
+            _setattr(
+                "LaunchSpecifications",
+                _convert_InstanceFleetConfigInstanceFleetProvisioningSpecifications(
+                    LaunchSpecifications
+                ),
+            )
+            _setattr("Name", Name)
+            _setattr("TargetOnDemandCapacity", TargetOnDemandCapacity)
+            _setattr("TargetSpotCapacity", TargetSpotCapacity)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InstanceFleetConfigProperties = create_object_converter(
+        InstanceFleetConfigProperties
+    )
+
+    class InstanceFleetConfig(_Resource):
+        """A Instance Fleet Config for EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceFleetConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-elasticmapreduce-instancefleetconfig.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EMR::InstanceFleetConfig"
+
+        Properties: InstanceFleetConfigProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceFleetConfig",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InstanceFleetConfigProperties},
+            factories={"Properties": InstanceFleetConfigProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InstanceFleetConfigProperties()
+            _setattr("Properties", _convert_InstanceFleetConfigProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        InstanceFleetConfig,
+        InstanceFleetConfigProperties,
+        InstanceFleetConfigConfiguration,
+        InstanceFleetConfigVolumeSpecification,
+        InstanceFleetConfigEbsBlockDeviceConfig,
+        InstanceFleetConfigEbsConfiguration,
+        InstanceFleetConfigSpotProvisioningSpecification,
+        InstanceFleetConfigInstanceFleetProvisioningSpecifications,
+        InstanceFleetConfigInstanceTypeConfig,
+    )
+
+
+def _create_InstanceGroupConfig():
+    class InstanceGroupConfigScalingConstraints(_PropertyType):
+        """The Scaling Constraints property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingConstraints
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancegroupconfig-scalingconstraints.html>`_
+        """
+
+        __slots__ = ("MaxCapacity", "MinCapacity")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigScalingConstraints", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MaxCapacity=None, MinCapacity=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaxCapacity", MaxCapacity)
+            _setattr("MinCapacity", MinCapacity)
+            _init_PropertyType(self, kwargs)
+
+    class InstanceGroupConfigSimpleScalingPolicyConfiguration(_PropertyType):
+        """The Simple Scaling Policy Configuration property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for SimpleScalingPolicyConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancegroupconfig-simplescalingpolicyconfiguration.html>`_
+        """
+
+        __slots__ = ("AdjustmentType", "CoolDown", "ScalingAdjustment")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigSimpleScalingPolicyConfiguration",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AdjustmentType=None,
+            CoolDown=None,
+            ScalingAdjustment=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdjustmentType", AdjustmentType)
+            _setattr("CoolDown", CoolDown)
+            _setattr("ScalingAdjustment", ScalingAdjustment)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceGroupConfigSimpleScalingPolicyConfiguration = (
+        create_object_converter(InstanceGroupConfigSimpleScalingPolicyConfiguration)
+    )
+
+    class InstanceGroupConfigScalingAction(_PropertyType):
+        """The Scaling Action property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancegroupconfig-scalingaction.html>`_
+        """
+
+        __slots__ = ("Market", "SimpleScalingPolicyConfiguration")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigScalingAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "SimpleScalingPolicyConfiguration": _convert_InstanceGroupConfigSimpleScalingPolicyConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Market=None, SimpleScalingPolicyConfiguration=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Market", Market)
+            _setattr(
+                "SimpleScalingPolicyConfiguration",
+                _convert_InstanceGroupConfigSimpleScalingPolicyConfiguration(
+                    SimpleScalingPolicyConfiguration
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class InstanceGroupConfigMetricDimension(_PropertyType):
+        """The Metric Dimension property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancegroupconfig-metricdimension.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigMetricDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceGroupConfigMetricDimension_list = create_object_list_converter(
+        InstanceGroupConfigMetricDimension
+    )
+
+    class InstanceGroupConfigCloudWatchAlarmDefinition(_PropertyType):
+        """The Cloud Watch Alarm Definition property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudWatchAlarmDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancegroupconfig-cloudwatchalarmdefinition.html>`_
+        """
+
+        __slots__ = (
+            "ComparisonOperator",
+            "Dimensions",
+            "EvaluationPeriods",
+            "MetricName",
+            "Namespace",
+            "Period",
+            "Statistic",
+            "Threshold",
+            "Unit",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigCloudWatchAlarmDefinition",
+            _PropertyType,
+            __slots__,
+            converters={"Dimensions": _convert_InstanceGroupConfigMetricDimension_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ComparisonOperator=None,
+            Dimensions=None,
+            EvaluationPeriods=None,
+            MetricName=None,
+            Namespace=None,
+            Period=None,
+            Statistic=None,
+            Threshold=None,
+            Unit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComparisonOperator", ComparisonOperator)
+            _setattr(
+                "Dimensions",
+                _convert_InstanceGroupConfigMetricDimension_list(Dimensions),
+            )
+            _setattr("EvaluationPeriods", EvaluationPeriods)
+            _setattr("MetricName", MetricName)
+            _setattr("Namespace", Namespace)
+            _setattr("Period", Period)
+            _setattr("Statistic", Statistic)
+            _setattr("Threshold", Threshold)
+            _setattr("Unit", Unit)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceGroupConfigCloudWatchAlarmDefinition = create_object_converter(
+        InstanceGroupConfigCloudWatchAlarmDefinition
+    )
+
+    class InstanceGroupConfigScalingTrigger(_PropertyType):
+        """The Scaling Trigger property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingTrigger
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancegroupconfig-scalingtrigger.html>`_
+        """
+
+        __slots__ = ("CloudWatchAlarmDefinition",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigScalingTrigger",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudWatchAlarmDefinition": _convert_InstanceGroupConfigCloudWatchAlarmDefinition
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CloudWatchAlarmDefinition=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudWatchAlarmDefinition",
+                _convert_InstanceGroupConfigCloudWatchAlarmDefinition(
+                    CloudWatchAlarmDefinition
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceGroupConfigScalingAction = create_object_converter(
+        InstanceGroupConfigScalingAction
+    )
+    _convert_InstanceGroupConfigScalingTrigger = create_object_converter(
+        InstanceGroupConfigScalingTrigger
+    )
+
+    class InstanceGroupConfigScalingRule(_PropertyType):
+        """The Scaling Rule property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancegroupconfig-scalingrule.html>`_
+        """
+
+        __slots__ = ("Action", "Description", "Name", "Trigger")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigScalingRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Action": _convert_InstanceGroupConfigScalingAction,
+                "Trigger": _convert_InstanceGroupConfigScalingTrigger,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Action=None, Description=None, Name=None, Trigger=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", _convert_InstanceGroupConfigScalingAction(Action))
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Trigger", _convert_InstanceGroupConfigScalingTrigger(Trigger))
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceGroupConfigScalingConstraints = create_object_converter(
+        InstanceGroupConfigScalingConstraints
+    )
+    _convert_InstanceGroupConfigScalingRule_list = create_object_list_converter(
+        InstanceGroupConfigScalingRule
+    )
+
+    class InstanceGroupConfigAutoScalingPolicy(_PropertyType):
+        """The Auto Scaling Policy property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for AutoScalingPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-instancegroupconfig-autoscalingpolicy.html>`_
+        """
+
+        __slots__ = ("Constraints", "Rules")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigAutoScalingPolicy",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Constraints": _convert_InstanceGroupConfigScalingConstraints,
+                "Rules": _convert_InstanceGroupConfigScalingRule_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Constraints=None, Rules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Constraints",
+                _convert_InstanceGroupConfigScalingConstraints(Constraints),
+            )
+            _setattr("Rules", _convert_InstanceGroupConfigScalingRule_list(Rules))
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceGroupConfigConfiguration_list = create_object_list_converter(
+        lambda **kwargs: InstanceGroupConfigConfiguration(**kwargs)
+    )
+
+    class InstanceGroupConfigConfiguration(_PropertyType):
+        """The Configuration property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for Configuration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-emr-cluster-configuration.html>`_
+        """
+
+        __slots__ = ("Classification", "ConfigurationProperties", "Configurations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Configurations": _convert_InstanceGroupConfigConfiguration_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Classification=None,
+            ConfigurationProperties=None,
+            Configurations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Classification", Classification)
+            _setattr("ConfigurationProperties", ConfigurationProperties)
+            _setattr(
+                "Configurations",
+                _convert_InstanceGroupConfigConfiguration_list(Configurations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class InstanceGroupConfigVolumeSpecification(_PropertyType):
+        """The Volume Specification property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for VolumeSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-emr-ebsconfiguration-ebsblockdeviceconfig-volumespecification.html>`_
+        """
+
+        __slots__ = ("Iops", "SizeInGB", "VolumeType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigVolumeSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Iops=None, SizeInGB=None, VolumeType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Iops", Iops)
+            _setattr("SizeInGB", SizeInGB)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceGroupConfigVolumeSpecification = create_object_converter(
+        InstanceGroupConfigVolumeSpecification
+    )
+
+    class InstanceGroupConfigEbsBlockDeviceConfig(_PropertyType):
+        """The Ebs Block Device Config property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for EbsBlockDeviceConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-emr-ebsconfiguration-ebsblockdeviceconfig.html>`_
+        """
+
+        __slots__ = ("VolumeSpecification", "VolumesPerInstance")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigEbsBlockDeviceConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "VolumeSpecification": _convert_InstanceGroupConfigVolumeSpecification
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, VolumeSpecification=None, VolumesPerInstance=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "VolumeSpecification",
+                _convert_InstanceGroupConfigVolumeSpecification(VolumeSpecification),
+            )
+            _setattr("VolumesPerInstance", VolumesPerInstance)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceGroupConfigEbsBlockDeviceConfig_list = (
+        create_object_list_converter(InstanceGroupConfigEbsBlockDeviceConfig)
+    )
+
+    class InstanceGroupConfigEbsConfiguration(_PropertyType):
+        """The Ebs Configuration property type for InstanceGroupConfig in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for EbsConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-emr-ebsconfiguration.html>`_
+        """
+
+        __slots__ = ("EbsBlockDeviceConfigs", "EbsOptimized")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigEbsConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "EbsBlockDeviceConfigs": _convert_InstanceGroupConfigEbsBlockDeviceConfig_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, EbsBlockDeviceConfigs=None, EbsOptimized=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "EbsBlockDeviceConfigs",
+                _convert_InstanceGroupConfigEbsBlockDeviceConfig_list(
+                    EbsBlockDeviceConfigs
+                ),
+            )
+            _setattr("EbsOptimized", EbsOptimized)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceGroupConfigAutoScalingPolicy = create_object_converter(
+        InstanceGroupConfigAutoScalingPolicy
+    )
+    _convert_InstanceGroupConfigEbsConfiguration = create_object_converter(
+        InstanceGroupConfigEbsConfiguration
+    )
+
+    class InstanceGroupConfigProperties(_ResourceProperties):
+        __slots__ = (
+            "AutoScalingPolicy",
+            "BidPrice",
+            "Configurations",
+            "EbsConfiguration",
+            "InstanceCount",
+            "InstanceRole",
+            "InstanceType",
+            "JobFlowId",
+            "Market",
+            "Name",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfigProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AutoScalingPolicy": _convert_InstanceGroupConfigAutoScalingPolicy,
+                "Configurations": _convert_InstanceGroupConfigConfiguration_list,
+                "EbsConfiguration": _convert_InstanceGroupConfigEbsConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoScalingPolicy=None,
+            BidPrice=None,
+            Configurations=None,
+            EbsConfiguration=None,
+            InstanceCount=None,
+            InstanceRole=None,
+            InstanceType=None,
+            JobFlowId=None,
+            Market=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AutoScalingPolicy",
+                _convert_InstanceGroupConfigAutoScalingPolicy(AutoScalingPolicy),
+            )
+            _setattr("BidPrice", BidPrice)
+            _setattr(
+                "Configurations",
+                _convert_InstanceGroupConfigConfiguration_list(Configurations),
+            )
+            _setattr(
+                "EbsConfiguration",
+                _convert_InstanceGroupConfigEbsConfiguration(EbsConfiguration),
+            )
+            _setattr("InstanceCount", InstanceCount)
+            _setattr("InstanceRole", InstanceRole)
+            _setattr("InstanceType", InstanceType)
+            _setattr("JobFlowId", JobFlowId)
+            _setattr("Market", Market)
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InstanceGroupConfigProperties = create_object_converter(
+        InstanceGroupConfigProperties
+    )
+
+    class InstanceGroupConfig(_Resource):
+        """A Instance Group Config for EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceGroupConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-emr-instancegroupconfig.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EMR::InstanceGroupConfig"
+
+        Properties: InstanceGroupConfigProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceGroupConfig",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InstanceGroupConfigProperties},
+            factories={"Properties": InstanceGroupConfigProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InstanceGroupConfigProperties()
+            _setattr("Properties", _convert_InstanceGroupConfigProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        InstanceGroupConfig,
+        InstanceGroupConfigProperties,
+        InstanceGroupConfigScalingConstraints,
+        InstanceGroupConfigSimpleScalingPolicyConfiguration,
+        InstanceGroupConfigScalingAction,
+        InstanceGroupConfigMetricDimension,
+        InstanceGroupConfigCloudWatchAlarmDefinition,
+        InstanceGroupConfigScalingTrigger,
+        InstanceGroupConfigScalingRule,
+        InstanceGroupConfigAutoScalingPolicy,
+        InstanceGroupConfigConfiguration,
+        InstanceGroupConfigVolumeSpecification,
+        InstanceGroupConfigEbsBlockDeviceConfig,
+        InstanceGroupConfigEbsConfiguration,
+    )
+
+
+def _create_SecurityConfiguration():
+    class SecurityConfigurationProperties(_ResourceProperties):
+        __slots__ = ("Name", "SecurityConfiguration")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityConfigurationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, SecurityConfiguration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("SecurityConfiguration", SecurityConfiguration)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SecurityConfigurationProperties = create_object_converter(
+        SecurityConfigurationProperties
+    )
+
+    class SecurityConfiguration(_Resource):
+        """A Security Configuration for EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecurityConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-emr-securityconfiguration.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EMR::SecurityConfiguration"
+
+        Properties: SecurityConfigurationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityConfiguration",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SecurityConfigurationProperties},
+            factories={"Properties": SecurityConfigurationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SecurityConfigurationProperties()
+            _setattr("Properties", _convert_SecurityConfigurationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SecurityConfiguration, SecurityConfigurationProperties
+
+
+def _create_Step():
+    class StepKeyValue(_PropertyType):
+        """The Key Value property type for Step in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for KeyValue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-step-keyvalue.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StepKeyValue", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_StepKeyValue_list = create_object_list_converter(StepKeyValue)
+
+    class StepHadoopJarStepConfig(_PropertyType):
+        """The Hadoop Jar Step Config property type for Step in EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for HadoopJarStepConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-elasticmapreduce-step-hadoopjarstepconfig.html>`_
+        """
+
+        __slots__ = ("Args", "Jar", "MainClass", "StepProperties")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StepHadoopJarStepConfig",
+            _PropertyType,
+            __slots__,
+            converters={"StepProperties": _convert_StepKeyValue_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Args=None, Jar=None, MainClass=None, StepProperties=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Args", Args)
+            _setattr("Jar", Jar)
+            _setattr("MainClass", MainClass)
+            _setattr("StepProperties", _convert_StepKeyValue_list(StepProperties))
+            _init_PropertyType(self, kwargs)
+
+    _convert_StepHadoopJarStepConfig = create_object_converter(StepHadoopJarStepConfig)
+
+    class StepProperties(_ResourceProperties):
+        __slots__ = ("ActionOnFailure", "HadoopJarStep", "JobFlowId", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StepProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"HadoopJarStep": _convert_StepHadoopJarStepConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ActionOnFailure=None,
+            HadoopJarStep=None,
+            JobFlowId=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ActionOnFailure", ActionOnFailure)
+            _setattr("HadoopJarStep", _convert_StepHadoopJarStepConfig(HadoopJarStep))
+            _setattr("JobFlowId", JobFlowId)
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StepProperties = create_object_converter(StepProperties)
+
+    class Step(_Resource):
+        """A Step for EMR.
+
+        See Also:
+            `AWS Cloud Formation documentation for Step
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-emr-step.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EMR::Step"
+
+        Properties: StepProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Step",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StepProperties},
+            factories={"Properties": StepProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StepProperties()
+            _setattr("Properties", _convert_StepProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Step, StepProperties, StepKeyValue, StepHadoopJarStepConfig
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Cluster": _create_Cluster,
+        "ClusterProperties": _create_Cluster,
+        "ClusterApplication": _create_Cluster,
+        "ClusterAutoScalingPolicy": _create_Cluster,
+        "ClusterBootstrapActionConfig": _create_Cluster,
+        "ClusterCloudWatchAlarmDefinition": _create_Cluster,
+        "ClusterConfiguration": _create_Cluster,
+        "ClusterEbsBlockDeviceConfig": _create_Cluster,
+        "ClusterEbsConfiguration": _create_Cluster,
+        "ClusterHadoopJarStepConfig": _create_Cluster,
+        "ClusterInstanceFleetConfig": _create_Cluster,
+        "ClusterInstanceFleetProvisioningSpecifications": _create_Cluster,
+        "ClusterInstanceGroupConfig": _create_Cluster,
+        "ClusterInstanceTypeConfig": _create_Cluster,
+        "ClusterJobFlowInstancesConfig": _create_Cluster,
+        "ClusterKerberosAttributes": _create_Cluster,
+        "ClusterKeyValue": _create_Cluster,
+        "ClusterMetricDimension": _create_Cluster,
+        "ClusterPlacementType": _create_Cluster,
+        "ClusterScalingAction": _create_Cluster,
+        "ClusterScalingConstraints": _create_Cluster,
+        "ClusterScalingRule": _create_Cluster,
+        "ClusterScalingTrigger": _create_Cluster,
+        "ClusterScriptBootstrapActionConfig": _create_Cluster,
+        "ClusterSimpleScalingPolicyConfiguration": _create_Cluster,
+        "ClusterSpotProvisioningSpecification": _create_Cluster,
+        "ClusterStepConfig": _create_Cluster,
+        "ClusterVolumeSpecification": _create_Cluster,
+        "InstanceFleetConfig": _create_InstanceFleetConfig,
+        "InstanceFleetConfigProperties": _create_InstanceFleetConfig,
+        "InstanceFleetConfigConfiguration": _create_InstanceFleetConfig,
+        "InstanceFleetConfigEbsBlockDeviceConfig": _create_InstanceFleetConfig,
+        "InstanceFleetConfigEbsConfiguration": _create_InstanceFleetConfig,
+        "InstanceFleetConfigInstanceFleetProvisioningSpecifications": _create_InstanceFleetConfig,
+        "InstanceFleetConfigInstanceTypeConfig": _create_InstanceFleetConfig,
+        "InstanceFleetConfigSpotProvisioningSpecification": _create_InstanceFleetConfig,
+        "InstanceFleetConfigVolumeSpecification": _create_InstanceFleetConfig,
+        "InstanceGroupConfig": _create_InstanceGroupConfig,
+        "InstanceGroupConfigProperties": _create_InstanceGroupConfig,
+        "InstanceGroupConfigAutoScalingPolicy": _create_InstanceGroupConfig,
+        "InstanceGroupConfigCloudWatchAlarmDefinition": _create_InstanceGroupConfig,
+        "InstanceGroupConfigConfiguration": _create_InstanceGroupConfig,
+        "InstanceGroupConfigEbsBlockDeviceConfig": _create_InstanceGroupConfig,
+        "InstanceGroupConfigEbsConfiguration": _create_InstanceGroupConfig,
+        "InstanceGroupConfigMetricDimension": _create_InstanceGroupConfig,
+        "InstanceGroupConfigScalingAction": _create_InstanceGroupConfig,
+        "InstanceGroupConfigScalingConstraints": _create_InstanceGroupConfig,
+        "InstanceGroupConfigScalingRule": _create_InstanceGroupConfig,
+        "InstanceGroupConfigScalingTrigger": _create_InstanceGroupConfig,
+        "InstanceGroupConfigSimpleScalingPolicyConfiguration": _create_InstanceGroupConfig,
+        "InstanceGroupConfigVolumeSpecification": _create_InstanceGroupConfig,
+        "SecurityConfiguration": _create_SecurityConfiguration,
+        "SecurityConfigurationProperties": _create_SecurityConfiguration,
+        "Step": _create_Step,
+        "StepProperties": _create_Step,
+        "StepHadoopJarStepConfig": _create_Step,
+        "StepKeyValue": _create_Step,
+    },
+)
@@ -7,96 +7,709 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "EventBus",
     "EventBusProperties",
     "EventBusPolicy",
     "EventBusPolicyProperties",
+    "EventBusPolicyCondition",
     "Rule",
     "RuleProperties",
+    "RuleAwsVpcConfiguration",
+    "RuleBatchArrayProperties",
+    "RuleBatchParameters",
+    "RuleBatchRetryStrategy",
+    "RuleEcsParameters",
+    "RuleInputTransformer",
+    "RuleKinesisParameters",
+    "RuleNetworkConfiguration",
+    "RuleRunCommandParameters",
+    "RuleRunCommandTarget",
+    "RuleSqsParameters",
+    "RuleTarget",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class EventBusProperties(ResourceProperties):
-    EventSourceName = attrib(default=None)
-    Name = attrib(default=None)
+def _create_EventBus():
+    class EventBusProperties(_ResourceProperties):
+        __slots__ = ("EventSourceName", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventBusProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EventSourceName=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EventSourceName", EventSourceName)
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EventBusProperties = create_object_converter(EventBusProperties)
+
+    class EventBus(_Resource):
+        """A Event Bus for Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for EventBus
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-events-eventbus.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Events::EventBus"
+
+        Properties: EventBusProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventBus",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EventBusProperties},
+            factories={"Properties": EventBusProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EventBusProperties()
+            _setattr("Properties", _convert_EventBusProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EventBus, EventBusProperties
 
 
-@attrs(**ATTRSCONFIG)
-class EventBus(Resource):
-    """A Event Bus for Events.
+def _create_EventBusPolicy():
+    class EventBusPolicyCondition(_PropertyType):
+        """The Condition property type for EventBusPolicy in Events.
 
-    See Also:
-        `AWS Cloud Formation documentation for EventBus
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-events-eventbus.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for Condition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-eventbuspolicy-condition.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::Events::EventBus"
+        __slots__ = ("Key", "Type", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventBusPolicyCondition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: EventBusProperties = attrib(
-        factory=EventBusProperties,
-        converter=create_object_converter(EventBusProperties),
+        def __init__(self, *, Key=None, Type=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EventBusPolicyCondition = create_object_converter(EventBusPolicyCondition)
+
+    class EventBusPolicyProperties(_ResourceProperties):
+        __slots__ = ("Action", "Condition", "EventBusName", "Principal", "StatementId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventBusPolicyProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Condition": _convert_EventBusPolicyCondition},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Action=None,
+            Condition=None,
+            EventBusName=None,
+            Principal=None,
+            StatementId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", Action)
+            _setattr("Condition", _convert_EventBusPolicyCondition(Condition))
+            _setattr("EventBusName", EventBusName)
+            _setattr("Principal", Principal)
+            _setattr("StatementId", StatementId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EventBusPolicyProperties = create_object_converter(
+        EventBusPolicyProperties
     )
 
+    class EventBusPolicy(_Resource):
+        """A Event Bus Policy for Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for EventBusPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-events-eventbuspolicy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Events::EventBusPolicy"
+
+        Properties: EventBusPolicyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventBusPolicy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EventBusPolicyProperties},
+            factories={"Properties": EventBusPolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EventBusPolicyProperties()
+            _setattr("Properties", _convert_EventBusPolicyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EventBusPolicy, EventBusPolicyProperties, EventBusPolicyCondition
 
-@attrs(**ATTRSCONFIG)
-class EventBusPolicyProperties(ResourceProperties):
-    Action = attrib(default=None)
-    Condition = attrib(default=None)
-    EventBusName = attrib(default=None)
-    Principal = attrib(default=None)
-    StatementId = attrib(default=None)
 
+def _create_Rule():
+    class RuleAwsVpcConfiguration(_PropertyType):
+        """The Aws Vpc Configuration property type for Rule in Events.
 
-@attrs(**ATTRSCONFIG)
-class EventBusPolicy(Resource):
-    """A Event Bus Policy for Events.
+        See Also:
+            `AWS Cloud Formation documentation for AwsVpcConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-awsvpcconfiguration.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for EventBusPolicy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-events-eventbuspolicy.html>`_
-    """
+        __slots__ = ("AssignPublicIp", "SecurityGroups", "Subnets")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleAwsVpcConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Events::EventBusPolicy"
+        def __init__(
+            self, *, AssignPublicIp=None, SecurityGroups=None, Subnets=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssignPublicIp", AssignPublicIp)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr("Subnets", Subnets)
+            _init_PropertyType(self, kwargs)
 
-    Properties: EventBusPolicyProperties = attrib(
-        factory=EventBusPolicyProperties,
-        converter=create_object_converter(EventBusPolicyProperties),
+    class RuleBatchArrayProperties(_PropertyType):
+        """The Batch Array Properties property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for BatchArrayProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-batcharrayproperties.html>`_
+        """
+
+        __slots__ = ("Size",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleBatchArrayProperties", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Size=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Size", Size)
+            _init_PropertyType(self, kwargs)
+
+    class RuleBatchRetryStrategy(_PropertyType):
+        """The Batch Retry Strategy property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for BatchRetryStrategy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-batchretrystrategy.html>`_
+        """
+
+        __slots__ = ("Attempts",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleBatchRetryStrategy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Attempts=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attempts", Attempts)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleBatchArrayProperties = create_object_converter(
+        RuleBatchArrayProperties
     )
+    _convert_RuleBatchRetryStrategy = create_object_converter(RuleBatchRetryStrategy)
+
+    class RuleBatchParameters(_PropertyType):
+        """The Batch Parameters property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for BatchParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-batchparameters.html>`_
+        """
 
+        __slots__ = ("ArrayProperties", "JobDefinition", "JobName", "RetryStrategy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleBatchParameters",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ArrayProperties": _convert_RuleBatchArrayProperties,
+                "RetryStrategy": _convert_RuleBatchRetryStrategy,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class RuleProperties(ResourceProperties):
-    Description = attrib(default=None)
-    EventBusName = attrib(default=None)
-    EventPattern = attrib(default=None)
-    Name = attrib(default=None)
-    RoleArn = attrib(default=None)
-    ScheduleExpression = attrib(default=None)
-    State = attrib(default=None)
-    Targets = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            ArrayProperties=None,
+            JobDefinition=None,
+            JobName=None,
+            RetryStrategy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ArrayProperties", _convert_RuleBatchArrayProperties(ArrayProperties)
+            )
+            _setattr("JobDefinition", JobDefinition)
+            _setattr("JobName", JobName)
+            _setattr("RetryStrategy", _convert_RuleBatchRetryStrategy(RetryStrategy))
+            _init_PropertyType(self, kwargs)
 
+    _convert_RuleAwsVpcConfiguration = create_object_converter(RuleAwsVpcConfiguration)
 
-@attrs(**ATTRSCONFIG)
-class Rule(Resource):
-    """A Rule for Events.
+    class RuleNetworkConfiguration(_PropertyType):
+        """The Network Configuration property type for Rule in Events.
 
-    See Also:
-        `AWS Cloud Formation documentation for Rule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-events-rule.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for NetworkConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-networkconfiguration.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::Events::Rule"
+        __slots__ = ("AwsVpcConfiguration",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleNetworkConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"AwsVpcConfiguration": _convert_RuleAwsVpcConfiguration},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: RuleProperties = attrib(
-        factory=RuleProperties, converter=create_object_converter(RuleProperties)
+        def __init__(self, *, AwsVpcConfiguration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AwsVpcConfiguration",
+                _convert_RuleAwsVpcConfiguration(AwsVpcConfiguration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleNetworkConfiguration = create_object_converter(
+        RuleNetworkConfiguration
     )
+
+    class RuleEcsParameters(_PropertyType):
+        """The Ecs Parameters property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for EcsParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-ecsparameters.html>`_
+        """
+
+        __slots__ = (
+            "Group",
+            "LaunchType",
+            "NetworkConfiguration",
+            "PlatformVersion",
+            "TaskCount",
+            "TaskDefinitionArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleEcsParameters",
+            _PropertyType,
+            __slots__,
+            converters={"NetworkConfiguration": _convert_RuleNetworkConfiguration},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Group=None,
+            LaunchType=None,
+            NetworkConfiguration=None,
+            PlatformVersion=None,
+            TaskCount=None,
+            TaskDefinitionArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Group", Group)
+            _setattr("LaunchType", LaunchType)
+            _setattr(
+                "NetworkConfiguration",
+                _convert_RuleNetworkConfiguration(NetworkConfiguration),
+            )
+            _setattr("PlatformVersion", PlatformVersion)
+            _setattr("TaskCount", TaskCount)
+            _setattr("TaskDefinitionArn", TaskDefinitionArn)
+            _init_PropertyType(self, kwargs)
+
+    class RuleInputTransformer(_PropertyType):
+        """The Input Transformer property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputTransformer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-inputtransformer.html>`_
+        """
+
+        __slots__ = ("InputPathsMap", "InputTemplate")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleInputTransformer", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, InputPathsMap=None, InputTemplate=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InputPathsMap", InputPathsMap)
+            _setattr("InputTemplate", InputTemplate)
+            _init_PropertyType(self, kwargs)
+
+    class RuleKinesisParameters(_PropertyType):
+        """The Kinesis Parameters property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-kinesisparameters.html>`_
+        """
+
+        __slots__ = ("PartitionKeyPath",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleKinesisParameters", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PartitionKeyPath=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PartitionKeyPath", PartitionKeyPath)
+            _init_PropertyType(self, kwargs)
+
+    class RuleRunCommandTarget(_PropertyType):
+        """The Run Command Target property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for RunCommandTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-runcommandtarget.html>`_
+        """
+
+        __slots__ = ("Key", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleRunCommandTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleRunCommandTarget_list = create_object_list_converter(
+        RuleRunCommandTarget
+    )
+
+    class RuleRunCommandParameters(_PropertyType):
+        """The Run Command Parameters property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for RunCommandParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-runcommandparameters.html>`_
+        """
+
+        __slots__ = ("RunCommandTargets",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleRunCommandParameters",
+            _PropertyType,
+            __slots__,
+            converters={"RunCommandTargets": _convert_RuleRunCommandTarget_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RunCommandTargets=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "RunCommandTargets",
+                _convert_RuleRunCommandTarget_list(RunCommandTargets),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class RuleSqsParameters(_PropertyType):
+        """The Sqs Parameters property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for SqsParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-sqsparameters.html>`_
+        """
+
+        __slots__ = ("MessageGroupId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleSqsParameters", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MessageGroupId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MessageGroupId", MessageGroupId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleBatchParameters = create_object_converter(RuleBatchParameters)
+    _convert_RuleEcsParameters = create_object_converter(RuleEcsParameters)
+    _convert_RuleInputTransformer = create_object_converter(RuleInputTransformer)
+    _convert_RuleKinesisParameters = create_object_converter(RuleKinesisParameters)
+    _convert_RuleRunCommandParameters = create_object_converter(
+        RuleRunCommandParameters
+    )
+    _convert_RuleSqsParameters = create_object_converter(RuleSqsParameters)
+
+    class RuleTarget(_PropertyType):
+        """The Target property type for Rule in Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for Target
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-events-rule-target.html>`_
+        """
+
+        __slots__ = (
+            "Arn",
+            "BatchParameters",
+            "EcsParameters",
+            "Id",
+            "Input",
+            "InputPath",
+            "InputTransformer",
+            "KinesisParameters",
+            "RoleArn",
+            "RunCommandParameters",
+            "SqsParameters",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleTarget",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BatchParameters": _convert_RuleBatchParameters,
+                "EcsParameters": _convert_RuleEcsParameters,
+                "InputTransformer": _convert_RuleInputTransformer,
+                "KinesisParameters": _convert_RuleKinesisParameters,
+                "RunCommandParameters": _convert_RuleRunCommandParameters,
+                "SqsParameters": _convert_RuleSqsParameters,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Arn=None,
+            BatchParameters=None,
+            EcsParameters=None,
+            Id=None,
+            Input=None,
+            InputPath=None,
+            InputTransformer=None,
+            KinesisParameters=None,
+            RoleArn=None,
+            RunCommandParameters=None,
+            SqsParameters=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _setattr("BatchParameters", _convert_RuleBatchParameters(BatchParameters))
+            _setattr("EcsParameters", _convert_RuleEcsParameters(EcsParameters))
+            _setattr("Id", Id)
+            _setattr("Input", Input)
+            _setattr("InputPath", InputPath)
+            _setattr(
+                "InputTransformer", _convert_RuleInputTransformer(InputTransformer)
+            )
+            _setattr(
+                "KinesisParameters", _convert_RuleKinesisParameters(KinesisParameters)
+            )
+            _setattr("RoleArn", RoleArn)
+            _setattr(
+                "RunCommandParameters",
+                _convert_RuleRunCommandParameters(RunCommandParameters),
+            )
+            _setattr("SqsParameters", _convert_RuleSqsParameters(SqsParameters))
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleTarget_list = create_object_list_converter(RuleTarget)
+
+    class RuleProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "EventBusName",
+            "EventPattern",
+            "Name",
+            "RoleArn",
+            "ScheduleExpression",
+            "State",
+            "Targets",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Targets": _convert_RuleTarget_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            EventBusName=None,
+            EventPattern=None,
+            Name=None,
+            RoleArn=None,
+            ScheduleExpression=None,
+            State=None,
+            Targets=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("EventBusName", EventBusName)
+            _setattr("EventPattern", EventPattern)
+            _setattr("Name", Name)
+            _setattr("RoleArn", RoleArn)
+            _setattr("ScheduleExpression", ScheduleExpression)
+            _setattr("State", State)
+            _setattr("Targets", _convert_RuleTarget_list(Targets))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RuleProperties = create_object_converter(RuleProperties)
+
+    class Rule(_Resource):
+        """A Rule for Events.
+
+        See Also:
+            `AWS Cloud Formation documentation for Rule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-events-rule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Events::Rule"
+
+        Properties: RuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Rule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RuleProperties},
+            factories={"Properties": RuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RuleProperties()
+            _setattr("Properties", _convert_RuleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Rule,
+        RuleProperties,
+        RuleAwsVpcConfiguration,
+        RuleBatchArrayProperties,
+        RuleBatchRetryStrategy,
+        RuleBatchParameters,
+        RuleNetworkConfiguration,
+        RuleEcsParameters,
+        RuleInputTransformer,
+        RuleKinesisParameters,
+        RuleRunCommandTarget,
+        RuleRunCommandParameters,
+        RuleSqsParameters,
+        RuleTarget,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "EventBus": _create_EventBus,
+        "EventBusProperties": _create_EventBus,
+        "EventBusPolicy": _create_EventBusPolicy,
+        "EventBusPolicyProperties": _create_EventBusPolicy,
+        "EventBusPolicyCondition": _create_EventBusPolicy,
+        "Rule": _create_Rule,
+        "RuleProperties": _create_Rule,
+        "RuleAwsVpcConfiguration": _create_Rule,
+        "RuleBatchArrayProperties": _create_Rule,
+        "RuleBatchParameters": _create_Rule,
+        "RuleBatchRetryStrategy": _create_Rule,
+        "RuleEcsParameters": _create_Rule,
+        "RuleInputTransformer": _create_Rule,
+        "RuleKinesisParameters": _create_Rule,
+        "RuleNetworkConfiguration": _create_Rule,
+        "RuleRunCommandParameters": _create_Rule,
+        "RuleRunCommandTarget": _create_Rule,
+        "RuleSqsParameters": _create_Rule,
+        "RuleTarget": _create_Rule,
+    },
+)
@@ -7,93 +7,315 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Discoverer",
     "DiscovererProperties",
+    "DiscovererTagsEntry",
     "Registry",
     "RegistryProperties",
+    "RegistryTagsEntry",
     "Schema",
     "SchemaProperties",
+    "SchemaTagsEntry",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class DiscovererProperties(ResourceProperties):
-    Description = attrib(default=None)
-    SourceArn = attrib(default=None)
-    Tags = attrib(default=None)
-
+def _create_Discoverer():
+    class DiscovererTagsEntry(_PropertyType):
+        """The Tags Entry property type for Discoverer in EventSchemas.
 
-@attrs(**ATTRSCONFIG)
-class Discoverer(Resource):
-    """A Discoverer for EventSchemas.
+        See Also:
+            `AWS Cloud Formation documentation for TagsEntry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-eventschemas-discoverer-tagsentry.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Discoverer
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eventschemas-discoverer.html>`_
-    """
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DiscovererTagsEntry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::EventSchemas::Discoverer"
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    Properties: DiscovererProperties = attrib(
-        factory=DiscovererProperties,
-        converter=create_object_converter(DiscovererProperties),
+    _convert_DiscovererTagsEntry_list = create_object_list_converter(
+        DiscovererTagsEntry
     )
 
+    class DiscovererProperties(_ResourceProperties):
+        __slots__ = ("Description", "SourceArn", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DiscovererProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_DiscovererTagsEntry_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class RegistryProperties(ResourceProperties):
-    Description = attrib(default=None)
-    RegistryName = attrib(default=None)
-    Tags = attrib(default=None)
+        def __init__(
+            self, *, Description=None, SourceArn=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("SourceArn", SourceArn)
+            _setattr("Tags", _convert_DiscovererTagsEntry_list(Tags))
+            _init_ResourceProperties(self, kwargs)
 
+    _convert_DiscovererProperties = create_object_converter(DiscovererProperties)
 
-@attrs(**ATTRSCONFIG)
-class Registry(Resource):
-    """A Registry for EventSchemas.
+    class Discoverer(_Resource):
+        """A Discoverer for EventSchemas.
 
-    See Also:
-        `AWS Cloud Formation documentation for Registry
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eventschemas-registry.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for Discoverer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eventschemas-discoverer.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::EventSchemas::Registry"
+        RESOURCE_TYPE = "AWS::EventSchemas::Discoverer"
 
-    Properties: RegistryProperties = attrib(
-        factory=RegistryProperties,
-        converter=create_object_converter(RegistryProperties),
-    )
+        Properties: DiscovererProperties
 
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Discoverer",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DiscovererProperties},
+            factories={"Properties": DiscovererProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class SchemaProperties(ResourceProperties):
-    Content = attrib(default=None)
-    Description = attrib(default=None)
-    RegistryName = attrib(default=None)
-    SchemaName = attrib(default=None)
-    Tags = attrib(default=None)
-    Type = attrib(default=None)
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DiscovererProperties()
+            _setattr("Properties", _convert_DiscovererProperties(Properties))
+            _init_Resource(self, kwargs)
 
+    return Discoverer, DiscovererProperties, DiscovererTagsEntry
 
-@attrs(**ATTRSCONFIG)
-class Schema(Resource):
-    """A Schema for EventSchemas.
 
-    See Also:
-        `AWS Cloud Formation documentation for Schema
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eventschemas-schema.html>`_
-    """
+def _create_Registry():
+    class RegistryTagsEntry(_PropertyType):
+        """The Tags Entry property type for Registry in EventSchemas.
 
-    RESOURCE_TYPE = "AWS::EventSchemas::Schema"
+        See Also:
+            `AWS Cloud Formation documentation for TagsEntry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-eventschemas-registry-tagsentry.html>`_
+        """
 
-    Properties: SchemaProperties = attrib(
-        factory=SchemaProperties, converter=create_object_converter(SchemaProperties)
-    )
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RegistryTagsEntry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RegistryTagsEntry_list = create_object_list_converter(RegistryTagsEntry)
+
+    class RegistryProperties(_ResourceProperties):
+        __slots__ = ("Description", "RegistryName", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RegistryProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_RegistryTagsEntry_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Description=None, RegistryName=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("RegistryName", RegistryName)
+            _setattr("Tags", _convert_RegistryTagsEntry_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RegistryProperties = create_object_converter(RegistryProperties)
+
+    class Registry(_Resource):
+        """A Registry for EventSchemas.
+
+        See Also:
+            `AWS Cloud Formation documentation for Registry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eventschemas-registry.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EventSchemas::Registry"
+
+        Properties: RegistryProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Registry",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RegistryProperties},
+            factories={"Properties": RegistryProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RegistryProperties()
+            _setattr("Properties", _convert_RegistryProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Registry, RegistryProperties, RegistryTagsEntry
+
+
+def _create_Schema():
+    class SchemaTagsEntry(_PropertyType):
+        """The Tags Entry property type for Schema in EventSchemas.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagsEntry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-eventschemas-schema-tagsentry.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SchemaTagsEntry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SchemaTagsEntry_list = create_object_list_converter(SchemaTagsEntry)
+
+    class SchemaProperties(_ResourceProperties):
+        __slots__ = (
+            "Content",
+            "Description",
+            "RegistryName",
+            "SchemaName",
+            "Tags",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SchemaProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_SchemaTagsEntry_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Content=None,
+            Description=None,
+            RegistryName=None,
+            SchemaName=None,
+            Tags=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Content", Content)
+            _setattr("Description", Description)
+            _setattr("RegistryName", RegistryName)
+            _setattr("SchemaName", SchemaName)
+            _setattr("Tags", _convert_SchemaTagsEntry_list(Tags))
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SchemaProperties = create_object_converter(SchemaProperties)
+
+    class Schema(_Resource):
+        """A Schema for EventSchemas.
+
+        See Also:
+            `AWS Cloud Formation documentation for Schema
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-eventschemas-schema.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::EventSchemas::Schema"
+
+        Properties: SchemaProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Schema",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SchemaProperties},
+            factories={"Properties": SchemaProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SchemaProperties()
+            _setattr("Properties", _convert_SchemaProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Schema, SchemaProperties, SchemaTagsEntry
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Discoverer": _create_Discoverer,
+        "DiscovererProperties": _create_Discoverer,
+        "DiscovererTagsEntry": _create_Discoverer,
+        "Registry": _create_Registry,
+        "RegistryProperties": _create_Registry,
+        "RegistryTagsEntry": _create_Registry,
+        "Schema": _create_Schema,
+        "SchemaProperties": _create_Schema,
+        "SchemaTagsEntry": _create_Schema,
+    },
+)
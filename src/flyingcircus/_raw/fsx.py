@@ -7,42 +7,300 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["FileSystem", "FileSystemProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "FileSystem",
+    "FileSystemProperties",
+    "FileSystemLustreConfiguration",
+    "FileSystemSelfManagedActiveDirectoryConfiguration",
+    "FileSystemWindowsConfiguration",
+]
 
-@attrs(**ATTRSCONFIG)
-class FileSystemProperties(ResourceProperties):
-    BackupId = attrib(default=None)
-    FileSystemType = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    LustreConfiguration = attrib(default=None)
-    SecurityGroupIds = attrib(default=None)
-    StorageCapacity = attrib(default=None)
-    SubnetIds = attrib(default=None)
-    Tags = attrib(default=None)
-    WindowsConfiguration = attrib(default=None)
 
+def _create_FileSystem():
+    class FileSystemLustreConfiguration(_PropertyType):
+        """The Lustre Configuration property type for FileSystem in FSx.
 
-@attrs(**ATTRSCONFIG)
-class FileSystem(Resource):
-    """A File System for FSx.
+        See Also:
+            `AWS Cloud Formation documentation for LustreConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-fsx-filesystem-lustreconfiguration.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for FileSystem
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-fsx-filesystem.html>`_
-    """
+        __slots__ = (
+            "ExportPath",
+            "ImportedFileChunkSize",
+            "ImportPath",
+            "WeeklyMaintenanceStartTime",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FileSystemLustreConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::FSx::FileSystem"
+        def __init__(
+            self,
+            *,
+            ExportPath=None,
+            ImportedFileChunkSize=None,
+            ImportPath=None,
+            WeeklyMaintenanceStartTime=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExportPath", ExportPath)
+            _setattr("ImportedFileChunkSize", ImportedFileChunkSize)
+            _setattr("ImportPath", ImportPath)
+            _setattr("WeeklyMaintenanceStartTime", WeeklyMaintenanceStartTime)
+            _init_PropertyType(self, kwargs)
 
-    Properties: FileSystemProperties = attrib(
-        factory=FileSystemProperties,
-        converter=create_object_converter(FileSystemProperties),
+    class FileSystemSelfManagedActiveDirectoryConfiguration(_PropertyType):
+        """The Self Managed Active Directory Configuration property type for FileSystem in FSx.
+
+        See Also:
+            `AWS Cloud Formation documentation for SelfManagedActiveDirectoryConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-fsx-filesystem-windowsconfiguration-selfmanagedactivedirectoryconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "DnsIps",
+            "DomainName",
+            "FileSystemAdministratorsGroup",
+            "OrganizationalUnitDistinguishedName",
+            "Password",
+            "UserName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FileSystemSelfManagedActiveDirectoryConfiguration",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DnsIps=None,
+            DomainName=None,
+            FileSystemAdministratorsGroup=None,
+            OrganizationalUnitDistinguishedName=None,
+            Password=None,
+            UserName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DnsIps", DnsIps)
+            _setattr("DomainName", DomainName)
+            _setattr("FileSystemAdministratorsGroup", FileSystemAdministratorsGroup)
+            _setattr(
+                "OrganizationalUnitDistinguishedName",
+                OrganizationalUnitDistinguishedName,
+            )
+            _setattr("Password", Password)
+            _setattr("UserName", UserName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FileSystemSelfManagedActiveDirectoryConfiguration = (
+        create_object_converter(FileSystemSelfManagedActiveDirectoryConfiguration)
+    )
+
+    class FileSystemWindowsConfiguration(_PropertyType):
+        """The Windows Configuration property type for FileSystem in FSx.
+
+        See Also:
+            `AWS Cloud Formation documentation for WindowsConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-fsx-filesystem-windowsconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "ActiveDirectoryId",
+            "AutomaticBackupRetentionDays",
+            "CopyTagsToBackups",
+            "DailyAutomaticBackupStartTime",
+            "DeploymentType",
+            "PreferredSubnetId",
+            "SelfManagedActiveDirectoryConfiguration",
+            "ThroughputCapacity",
+            "WeeklyMaintenanceStartTime",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FileSystemWindowsConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "SelfManagedActiveDirectoryConfiguration": _convert_FileSystemSelfManagedActiveDirectoryConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ActiveDirectoryId=None,
+            AutomaticBackupRetentionDays=None,
+            CopyTagsToBackups=None,
+            DailyAutomaticBackupStartTime=None,
+            DeploymentType=None,
+            PreferredSubnetId=None,
+            SelfManagedActiveDirectoryConfiguration=None,
+            ThroughputCapacity=None,
+            WeeklyMaintenanceStartTime=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ActiveDirectoryId", ActiveDirectoryId)
+            _setattr("AutomaticBackupRetentionDays", AutomaticBackupRetentionDays)
+            _setattr("CopyTagsToBackups", CopyTagsToBackups)
+            _setattr("DailyAutomaticBackupStartTime", DailyAutomaticBackupStartTime)
+            _setattr("DeploymentType", DeploymentType)
+            _setattr("PreferredSubnetId", PreferredSubnetId)
+            _setattr(
+                "SelfManagedActiveDirectoryConfiguration",
+                _convert_FileSystemSelfManagedActiveDirectoryConfiguration(
+                    SelfManagedActiveDirectoryConfiguration
+                ),
+            )
+            _setattr("ThroughputCapacity", ThroughputCapacity)
+            _setattr("WeeklyMaintenanceStartTime", WeeklyMaintenanceStartTime)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FileSystemLustreConfiguration = create_object_converter(
+        FileSystemLustreConfiguration
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_FileSystemWindowsConfiguration = create_object_converter(
+        FileSystemWindowsConfiguration
+    )
+
+    class FileSystemProperties(_ResourceProperties):
+        __slots__ = (
+            "BackupId",
+            "FileSystemType",
+            "KmsKeyId",
+            "LustreConfiguration",
+            "SecurityGroupIds",
+            "StorageCapacity",
+            "SubnetIds",
+            "Tags",
+            "WindowsConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FileSystemProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LustreConfiguration": _convert_FileSystemLustreConfiguration,
+                "Tags": _convert_Tag_list,
+                "WindowsConfiguration": _convert_FileSystemWindowsConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BackupId=None,
+            FileSystemType=None,
+            KmsKeyId=None,
+            LustreConfiguration=None,
+            SecurityGroupIds=None,
+            StorageCapacity=None,
+            SubnetIds=None,
+            Tags=None,
+            WindowsConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BackupId", BackupId)
+            _setattr("FileSystemType", FileSystemType)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr(
+                "LustreConfiguration",
+                _convert_FileSystemLustreConfiguration(LustreConfiguration),
+            )
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("StorageCapacity", StorageCapacity)
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr(
+                "WindowsConfiguration",
+                _convert_FileSystemWindowsConfiguration(WindowsConfiguration),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FileSystemProperties = create_object_converter(FileSystemProperties)
+
+    class FileSystem(_Resource):
+        """A File System for FSx.
+
+        See Also:
+            `AWS Cloud Formation documentation for FileSystem
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-fsx-filesystem.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::FSx::FileSystem"
+
+        Properties: FileSystemProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FileSystem",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FileSystemProperties},
+            factories={"Properties": FileSystemProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FileSystemProperties()
+            _setattr("Properties", _convert_FileSystemProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        FileSystem,
+        FileSystemProperties,
+        FileSystemLustreConfiguration,
+        FileSystemSelfManagedActiveDirectoryConfiguration,
+        FileSystemWindowsConfiguration,
     )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "FileSystem": _create_FileSystem,
+        "FileSystemProperties": _create_FileSystem,
+        "FileSystemLustreConfiguration": _create_FileSystem,
+        "FileSystemSelfManagedActiveDirectoryConfiguration": _create_FileSystem,
+        "FileSystemWindowsConfiguration": _create_FileSystem,
+    },
+)
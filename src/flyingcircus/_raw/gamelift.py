@@ -7,220 +7,995 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Alias",
     "AliasProperties",
+    "AliasRoutingStrategy",
     "Build",
     "BuildProperties",
+    "BuildS3Location",
     "Fleet",
     "FleetProperties",
+    "FleetCertificateConfiguration",
+    "FleetIpPermission",
+    "FleetResourceCreationLimitPolicy",
+    "FleetRuntimeConfiguration",
+    "FleetServerProcess",
     "GameSessionQueue",
     "GameSessionQueueProperties",
+    "GameSessionQueueDestination",
+    "GameSessionQueuePlayerLatencyPolicy",
     "MatchmakingConfiguration",
     "MatchmakingConfigurationProperties",
+    "MatchmakingConfigurationGameProperty",
     "MatchmakingRuleSet",
     "MatchmakingRuleSetProperties",
     "Script",
     "ScriptProperties",
+    "ScriptS3Location",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AliasProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    RoutingStrategy = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Alias(Resource):
-    """A Alias for GameLift.
-
-    See Also:
-        `AWS Cloud Formation documentation for Alias
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-alias.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GameLift::Alias"
-
-    Properties: AliasProperties = attrib(
-        factory=AliasProperties, converter=create_object_converter(AliasProperties)
+def _create_Alias():
+    class AliasRoutingStrategy(_PropertyType):
+        """The Routing Strategy property type for Alias in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for RoutingStrategy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-alias-routingstrategy.html>`_
+        """
+
+        __slots__ = ("FleetId", "Message", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AliasRoutingStrategy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FleetId=None, Message=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FleetId", FleetId)
+            _setattr("Message", Message)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AliasRoutingStrategy = create_object_converter(AliasRoutingStrategy)
+
+    class AliasProperties(_ResourceProperties):
+        __slots__ = ("Description", "Name", "RoutingStrategy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AliasProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"RoutingStrategy": _convert_AliasRoutingStrategy},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Description=None, Name=None, RoutingStrategy=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("RoutingStrategy", _convert_AliasRoutingStrategy(RoutingStrategy))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AliasProperties = create_object_converter(AliasProperties)
+
+    class Alias(_Resource):
+        """A Alias for GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for Alias
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-alias.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GameLift::Alias"
+
+        Properties: AliasProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Alias",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AliasProperties},
+            factories={"Properties": AliasProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AliasProperties()
+            _setattr("Properties", _convert_AliasProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Alias, AliasProperties, AliasRoutingStrategy
+
+
+def _create_Build():
+    class BuildS3Location(_PropertyType):
+        """The S3 Location property type for Build in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3Location
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-build-storagelocation.html>`_
+        """
+
+        __slots__ = ("Bucket", "Key", "ObjectVersion", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BuildS3Location", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Bucket=None, Key=None, ObjectVersion=None, RoleArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("Key", Key)
+            _setattr("ObjectVersion", ObjectVersion)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BuildS3Location = create_object_converter(BuildS3Location)
+
+    class BuildProperties(_ResourceProperties):
+        __slots__ = ("Name", "OperatingSystem", "StorageLocation", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BuildProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"StorageLocation": _convert_BuildS3Location},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Name=None,
+            OperatingSystem=None,
+            StorageLocation=None,
+            Version=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("OperatingSystem", OperatingSystem)
+            _setattr("StorageLocation", _convert_BuildS3Location(StorageLocation))
+            _setattr("Version", Version)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_BuildProperties = create_object_converter(BuildProperties)
+
+    class Build(_Resource):
+        """A Build for GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for Build
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-build.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GameLift::Build"
+
+        Properties: BuildProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Build",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BuildProperties},
+            factories={"Properties": BuildProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BuildProperties()
+            _setattr("Properties", _convert_BuildProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Build, BuildProperties, BuildS3Location
+
+
+def _create_Fleet():
+    class FleetCertificateConfiguration(_PropertyType):
+        """The Certificate Configuration property type for Fleet in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for CertificateConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-fleet-certificateconfiguration.html>`_
+        """
+
+        __slots__ = ("CertificateType",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetCertificateConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CertificateType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateType", CertificateType)
+            _init_PropertyType(self, kwargs)
+
+    class FleetIpPermission(_PropertyType):
+        """The Ip Permission property type for Fleet in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for IpPermission
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-fleet-ec2inboundpermission.html>`_
+        """
+
+        __slots__ = ("FromPort", "IpRange", "Protocol", "ToPort")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetIpPermission", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FromPort=None, IpRange=None, Protocol=None, ToPort=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FromPort", FromPort)
+            _setattr("IpRange", IpRange)
+            _setattr("Protocol", Protocol)
+            _setattr("ToPort", ToPort)
+            _init_PropertyType(self, kwargs)
+
+    class FleetResourceCreationLimitPolicy(_PropertyType):
+        """The Resource Creation Limit Policy property type for Fleet in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceCreationLimitPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-fleet-resourcecreationlimitpolicy.html>`_
+        """
+
+        __slots__ = ("NewGameSessionsPerCreator", "PolicyPeriodInMinutes")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetResourceCreationLimitPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            NewGameSessionsPerCreator=None,
+            PolicyPeriodInMinutes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NewGameSessionsPerCreator", NewGameSessionsPerCreator)
+            _setattr("PolicyPeriodInMinutes", PolicyPeriodInMinutes)
+            _init_PropertyType(self, kwargs)
+
+    class FleetServerProcess(_PropertyType):
+        """The Server Process property type for Fleet in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for ServerProcess
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-fleet-serverprocess.html>`_
+        """
+
+        __slots__ = ("ConcurrentExecutions", "LaunchPath", "Parameters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetServerProcess", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConcurrentExecutions=None,
+            LaunchPath=None,
+            Parameters=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConcurrentExecutions", ConcurrentExecutions)
+            _setattr("LaunchPath", LaunchPath)
+            _setattr("Parameters", Parameters)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FleetServerProcess_list = create_object_list_converter(FleetServerProcess)
+
+    class FleetRuntimeConfiguration(_PropertyType):
+        """The Runtime Configuration property type for Fleet in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for RuntimeConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-fleet-runtimeconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "GameSessionActivationTimeoutSeconds",
+            "MaxConcurrentGameSessionActivations",
+            "ServerProcesses",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetRuntimeConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"ServerProcesses": _convert_FleetServerProcess_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            GameSessionActivationTimeoutSeconds=None,
+            MaxConcurrentGameSessionActivations=None,
+            ServerProcesses=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "GameSessionActivationTimeoutSeconds",
+                GameSessionActivationTimeoutSeconds,
+            )
+            _setattr(
+                "MaxConcurrentGameSessionActivations",
+                MaxConcurrentGameSessionActivations,
+            )
+            _setattr(
+                "ServerProcesses", _convert_FleetServerProcess_list(ServerProcesses)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_FleetCertificateConfiguration = create_object_converter(
+        FleetCertificateConfiguration
     )
-
-
-@attrs(**ATTRSCONFIG)
-class BuildProperties(ResourceProperties):
-    Name = attrib(default=None)
-    OperatingSystem = attrib(default=None)
-    StorageLocation = attrib(default=None)
-    Version = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Build(Resource):
-    """A Build for GameLift.
-
-    See Also:
-        `AWS Cloud Formation documentation for Build
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-build.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GameLift::Build"
-
-    Properties: BuildProperties = attrib(
-        factory=BuildProperties, converter=create_object_converter(BuildProperties)
+    _convert_FleetIpPermission_list = create_object_list_converter(FleetIpPermission)
+    _convert_FleetResourceCreationLimitPolicy = create_object_converter(
+        FleetResourceCreationLimitPolicy
     )
-
-
-@attrs(**ATTRSCONFIG)
-class FleetProperties(ResourceProperties):
-    BuildId = attrib(default=None)
-    CertificateConfiguration = attrib(default=None)
-    Description = attrib(default=None)
-    DesiredEC2Instances = attrib(default=None)
-    EC2InboundPermissions = attrib(default=None)
-    EC2InstanceType = attrib(default=None)
-    FleetType = attrib(default=None)
-    InstanceRoleARN = attrib(default=None)
-    LogPaths = attrib(default=None)
-    MaxSize = attrib(default=None)
-    MetricGroups = attrib(default=None)
-    MinSize = attrib(default=None)
-    Name = attrib(default=None)
-    NewGameSessionProtectionPolicy = attrib(default=None)
-    PeerVpcAwsAccountId = attrib(default=None)
-    PeerVpcId = attrib(default=None)
-    ResourceCreationLimitPolicy = attrib(default=None)
-    RuntimeConfiguration = attrib(default=None)
-    ScriptId = attrib(default=None)
-    ServerLaunchParameters = attrib(default=None)
-    ServerLaunchPath = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Fleet(Resource):
-    """A Fleet for GameLift.
-
-    See Also:
-        `AWS Cloud Formation documentation for Fleet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-fleet.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GameLift::Fleet"
-
-    Properties: FleetProperties = attrib(
-        factory=FleetProperties, converter=create_object_converter(FleetProperties)
+    _convert_FleetRuntimeConfiguration = create_object_converter(
+        FleetRuntimeConfiguration
     )
 
+    class FleetProperties(_ResourceProperties):
+        __slots__ = (
+            "BuildId",
+            "CertificateConfiguration",
+            "Description",
+            "DesiredEC2Instances",
+            "EC2InboundPermissions",
+            "EC2InstanceType",
+            "FleetType",
+            "InstanceRoleARN",
+            "LogPaths",
+            "MaxSize",
+            "MetricGroups",
+            "MinSize",
+            "Name",
+            "NewGameSessionProtectionPolicy",
+            "PeerVpcAwsAccountId",
+            "PeerVpcId",
+            "ResourceCreationLimitPolicy",
+            "RuntimeConfiguration",
+            "ScriptId",
+            "ServerLaunchParameters",
+            "ServerLaunchPath",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CertificateConfiguration": _convert_FleetCertificateConfiguration,
+                "EC2InboundPermissions": _convert_FleetIpPermission_list,
+                "ResourceCreationLimitPolicy": _convert_FleetResourceCreationLimitPolicy,
+                "RuntimeConfiguration": _convert_FleetRuntimeConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BuildId=None,
+            CertificateConfiguration=None,
+            Description=None,
+            DesiredEC2Instances=None,
+            EC2InboundPermissions=None,
+            EC2InstanceType=None,
+            FleetType=None,
+            InstanceRoleARN=None,
+            LogPaths=None,
+            MaxSize=None,
+            MetricGroups=None,
+            MinSize=None,
+            Name=None,
+            NewGameSessionProtectionPolicy=None,
+            PeerVpcAwsAccountId=None,
+            PeerVpcId=None,
+            ResourceCreationLimitPolicy=None,
+            RuntimeConfiguration=None,
+            ScriptId=None,
+            ServerLaunchParameters=None,
+            ServerLaunchPath=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BuildId", BuildId)
+            _setattr(
+                "CertificateConfiguration",
+                _convert_FleetCertificateConfiguration(CertificateConfiguration),
+            )
+            _setattr("Description", Description)
+            _setattr("DesiredEC2Instances", DesiredEC2Instances)
+            _setattr(
+                "EC2InboundPermissions",
+                _convert_FleetIpPermission_list(EC2InboundPermissions),
+            )
+            _setattr("EC2InstanceType", EC2InstanceType)
+            _setattr("FleetType", FleetType)
+            _setattr("InstanceRoleARN", InstanceRoleARN)
+            _setattr("LogPaths", LogPaths)
+            _setattr("MaxSize", MaxSize)
+            _setattr("MetricGroups", MetricGroups)
+            _setattr("MinSize", MinSize)
+            _setattr("Name", Name)
+            _setattr("NewGameSessionProtectionPolicy", NewGameSessionProtectionPolicy)
+            _setattr("PeerVpcAwsAccountId", PeerVpcAwsAccountId)
+            _setattr("PeerVpcId", PeerVpcId)
+            _setattr(
+                "ResourceCreationLimitPolicy",
+                _convert_FleetResourceCreationLimitPolicy(ResourceCreationLimitPolicy),
+            )
+            _setattr(
+                "RuntimeConfiguration",
+                _convert_FleetRuntimeConfiguration(RuntimeConfiguration),
+            )
+            _setattr("ScriptId", ScriptId)
+            _setattr("ServerLaunchParameters", ServerLaunchParameters)
+            _setattr("ServerLaunchPath", ServerLaunchPath)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FleetProperties = create_object_converter(FleetProperties)
+
+    class Fleet(_Resource):
+        """A Fleet for GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for Fleet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-fleet.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GameLift::Fleet"
+
+        Properties: FleetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Fleet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FleetProperties},
+            factories={"Properties": FleetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FleetProperties()
+            _setattr("Properties", _convert_FleetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Fleet,
+        FleetProperties,
+        FleetCertificateConfiguration,
+        FleetIpPermission,
+        FleetResourceCreationLimitPolicy,
+        FleetServerProcess,
+        FleetRuntimeConfiguration,
+    )
 
-@attrs(**ATTRSCONFIG)
-class GameSessionQueueProperties(ResourceProperties):
-    Destinations = attrib(default=None)
-    Name = attrib(default=None)
-    PlayerLatencyPolicies = attrib(default=None)
-    TimeoutInSeconds = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class GameSessionQueue(Resource):
-    """A Game Session Queue for GameLift.
-
-    See Also:
-        `AWS Cloud Formation documentation for GameSessionQueue
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-gamesessionqueue.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GameLift::GameSessionQueue"
 
-    Properties: GameSessionQueueProperties = attrib(
-        factory=GameSessionQueueProperties,
-        converter=create_object_converter(GameSessionQueueProperties),
+def _create_GameSessionQueue():
+    class GameSessionQueueDestination(_PropertyType):
+        """The Destination property type for GameSessionQueue in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for Destination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-gamesessionqueue-destination.html>`_
+        """
+
+        __slots__ = ("DestinationArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GameSessionQueueDestination", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DestinationArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationArn", DestinationArn)
+            _init_PropertyType(self, kwargs)
+
+    class GameSessionQueuePlayerLatencyPolicy(_PropertyType):
+        """The Player Latency Policy property type for GameSessionQueue in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for PlayerLatencyPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-gamesessionqueue-playerlatencypolicy.html>`_
+        """
+
+        __slots__ = (
+            "MaximumIndividualPlayerLatencyMilliseconds",
+            "PolicyDurationSeconds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GameSessionQueuePlayerLatencyPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MaximumIndividualPlayerLatencyMilliseconds=None,
+            PolicyDurationSeconds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "MaximumIndividualPlayerLatencyMilliseconds",
+                MaximumIndividualPlayerLatencyMilliseconds,
+            )
+            _setattr("PolicyDurationSeconds", PolicyDurationSeconds)
+            _init_PropertyType(self, kwargs)
+
+    _convert_GameSessionQueueDestination_list = create_object_list_converter(
+        GameSessionQueueDestination
+    )
+    _convert_GameSessionQueuePlayerLatencyPolicy_list = create_object_list_converter(
+        GameSessionQueuePlayerLatencyPolicy
     )
 
-
-@attrs(**ATTRSCONFIG)
-class MatchmakingConfigurationProperties(ResourceProperties):
-    AcceptanceRequired = attrib(default=None)
-    AcceptanceTimeoutSeconds = attrib(default=None)
-    AdditionalPlayerCount = attrib(default=None)
-    BackfillMode = attrib(default=None)
-    CustomEventData = attrib(default=None)
-    Description = attrib(default=None)
-    GameProperties = attrib(default=None)
-    GameSessionData = attrib(default=None)
-    GameSessionQueueArns = attrib(default=None)
-    Name = attrib(default=None)
-    NotificationTarget = attrib(default=None)
-    RequestTimeoutSeconds = attrib(default=None)
-    RuleSetName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class MatchmakingConfiguration(Resource):
-    """A Matchmaking Configuration for GameLift.
-
-    See Also:
-        `AWS Cloud Formation documentation for MatchmakingConfiguration
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-matchmakingconfiguration.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GameLift::MatchmakingConfiguration"
-
-    Properties: MatchmakingConfigurationProperties = attrib(
-        factory=MatchmakingConfigurationProperties,
-        converter=create_object_converter(MatchmakingConfigurationProperties),
+    class GameSessionQueueProperties(_ResourceProperties):
+        __slots__ = (
+            "Destinations",
+            "Name",
+            "PlayerLatencyPolicies",
+            "TimeoutInSeconds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GameSessionQueueProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Destinations": _convert_GameSessionQueueDestination_list,
+                "PlayerLatencyPolicies": _convert_GameSessionQueuePlayerLatencyPolicy_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Destinations=None,
+            Name=None,
+            PlayerLatencyPolicies=None,
+            TimeoutInSeconds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Destinations", _convert_GameSessionQueueDestination_list(Destinations)
+            )
+            _setattr("Name", Name)
+            _setattr(
+                "PlayerLatencyPolicies",
+                _convert_GameSessionQueuePlayerLatencyPolicy_list(
+                    PlayerLatencyPolicies
+                ),
+            )
+            _setattr("TimeoutInSeconds", TimeoutInSeconds)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GameSessionQueueProperties = create_object_converter(
+        GameSessionQueueProperties
     )
 
+    class GameSessionQueue(_Resource):
+        """A Game Session Queue for GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for GameSessionQueue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-gamesessionqueue.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GameLift::GameSessionQueue"
+
+        Properties: GameSessionQueueProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GameSessionQueue",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GameSessionQueueProperties},
+            factories={"Properties": GameSessionQueueProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GameSessionQueueProperties()
+            _setattr("Properties", _convert_GameSessionQueueProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        GameSessionQueue,
+        GameSessionQueueProperties,
+        GameSessionQueueDestination,
+        GameSessionQueuePlayerLatencyPolicy,
+    )
 
-@attrs(**ATTRSCONFIG)
-class MatchmakingRuleSetProperties(ResourceProperties):
-    Name = attrib(default=None)
-    RuleSetBody = attrib(default=None)
 
+def _create_MatchmakingConfiguration():
+    class MatchmakingConfigurationGameProperty(_PropertyType):
+        """The Game Property property type for MatchmakingConfiguration in GameLift.
 
-@attrs(**ATTRSCONFIG)
-class MatchmakingRuleSet(Resource):
-    """A Matchmaking Rule Set for GameLift.
+        See Also:
+            `AWS Cloud Formation documentation for GameProperty
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-matchmakingconfiguration-gameproperty.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for MatchmakingRuleSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-matchmakingruleset.html>`_
-    """
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MatchmakingConfigurationGameProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::GameLift::MatchmakingRuleSet"
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    Properties: MatchmakingRuleSetProperties = attrib(
-        factory=MatchmakingRuleSetProperties,
-        converter=create_object_converter(MatchmakingRuleSetProperties),
+    _convert_MatchmakingConfigurationGameProperty_list = create_object_list_converter(
+        MatchmakingConfigurationGameProperty
     )
 
+    class MatchmakingConfigurationProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceptanceRequired",
+            "AcceptanceTimeoutSeconds",
+            "AdditionalPlayerCount",
+            "BackfillMode",
+            "CustomEventData",
+            "Description",
+            "GameProperties",
+            "GameSessionData",
+            "GameSessionQueueArns",
+            "Name",
+            "NotificationTarget",
+            "RequestTimeoutSeconds",
+            "RuleSetName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MatchmakingConfigurationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "GameProperties": _convert_MatchmakingConfigurationGameProperty_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptanceRequired=None,
+            AcceptanceTimeoutSeconds=None,
+            AdditionalPlayerCount=None,
+            BackfillMode=None,
+            CustomEventData=None,
+            Description=None,
+            GameProperties=None,
+            GameSessionData=None,
+            GameSessionQueueArns=None,
+            Name=None,
+            NotificationTarget=None,
+            RequestTimeoutSeconds=None,
+            RuleSetName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptanceRequired", AcceptanceRequired)
+            _setattr("AcceptanceTimeoutSeconds", AcceptanceTimeoutSeconds)
+            _setattr("AdditionalPlayerCount", AdditionalPlayerCount)
+            _setattr("BackfillMode", BackfillMode)
+            _setattr("CustomEventData", CustomEventData)
+            _setattr("Description", Description)
+            _setattr(
+                "GameProperties",
+                _convert_MatchmakingConfigurationGameProperty_list(GameProperties),
+            )
+            _setattr("GameSessionData", GameSessionData)
+            _setattr("GameSessionQueueArns", GameSessionQueueArns)
+            _setattr("Name", Name)
+            _setattr("NotificationTarget", NotificationTarget)
+            _setattr("RequestTimeoutSeconds", RequestTimeoutSeconds)
+            _setattr("RuleSetName", RuleSetName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MatchmakingConfigurationProperties = create_object_converter(
+        MatchmakingConfigurationProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class ScriptProperties(ResourceProperties):
-    Name = attrib(default=None)
-    StorageLocation = attrib(default=None)
-    Version = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Script(Resource):
-    """A Script for GameLift.
-
-    See Also:
-        `AWS Cloud Formation documentation for Script
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-script.html>`_
-    """
+    class MatchmakingConfiguration(_Resource):
+        """A Matchmaking Configuration for GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for MatchmakingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-matchmakingconfiguration.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GameLift::MatchmakingConfiguration"
+
+        Properties: MatchmakingConfigurationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MatchmakingConfiguration",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MatchmakingConfigurationProperties},
+            factories={"Properties": MatchmakingConfigurationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MatchmakingConfigurationProperties()
+            _setattr(
+                "Properties", _convert_MatchmakingConfigurationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        MatchmakingConfiguration,
+        MatchmakingConfigurationProperties,
+        MatchmakingConfigurationGameProperty,
+    )
 
-    RESOURCE_TYPE = "AWS::GameLift::Script"
 
-    Properties: ScriptProperties = attrib(
-        factory=ScriptProperties, converter=create_object_converter(ScriptProperties)
+def _create_MatchmakingRuleSet():
+    class MatchmakingRuleSetProperties(_ResourceProperties):
+        __slots__ = ("Name", "RuleSetBody")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MatchmakingRuleSetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, RuleSetBody=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("RuleSetBody", RuleSetBody)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MatchmakingRuleSetProperties = create_object_converter(
+        MatchmakingRuleSetProperties
     )
+
+    class MatchmakingRuleSet(_Resource):
+        """A Matchmaking Rule Set for GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for MatchmakingRuleSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-matchmakingruleset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GameLift::MatchmakingRuleSet"
+
+        Properties: MatchmakingRuleSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MatchmakingRuleSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MatchmakingRuleSetProperties},
+            factories={"Properties": MatchmakingRuleSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MatchmakingRuleSetProperties()
+            _setattr("Properties", _convert_MatchmakingRuleSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return MatchmakingRuleSet, MatchmakingRuleSetProperties
+
+
+def _create_Script():
+    class ScriptS3Location(_PropertyType):
+        """The S3 Location property type for Script in GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3Location
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-gamelift-script-s3location.html>`_
+        """
+
+        __slots__ = ("Bucket", "Key", "ObjectVersion", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScriptS3Location", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Bucket=None, Key=None, ObjectVersion=None, RoleArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("Key", Key)
+            _setattr("ObjectVersion", ObjectVersion)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ScriptS3Location = create_object_converter(ScriptS3Location)
+
+    class ScriptProperties(_ResourceProperties):
+        __slots__ = ("Name", "StorageLocation", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ScriptProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"StorageLocation": _convert_ScriptS3Location},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Name=None, StorageLocation=None, Version=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("StorageLocation", _convert_ScriptS3Location(StorageLocation))
+            _setattr("Version", Version)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ScriptProperties = create_object_converter(ScriptProperties)
+
+    class Script(_Resource):
+        """A Script for GameLift.
+
+        See Also:
+            `AWS Cloud Formation documentation for Script
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-gamelift-script.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GameLift::Script"
+
+        Properties: ScriptProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Script",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ScriptProperties},
+            factories={"Properties": ScriptProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ScriptProperties()
+            _setattr("Properties", _convert_ScriptProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Script, ScriptProperties, ScriptS3Location
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Alias": _create_Alias,
+        "AliasProperties": _create_Alias,
+        "AliasRoutingStrategy": _create_Alias,
+        "Build": _create_Build,
+        "BuildProperties": _create_Build,
+        "BuildS3Location": _create_Build,
+        "Fleet": _create_Fleet,
+        "FleetProperties": _create_Fleet,
+        "FleetCertificateConfiguration": _create_Fleet,
+        "FleetIpPermission": _create_Fleet,
+        "FleetResourceCreationLimitPolicy": _create_Fleet,
+        "FleetRuntimeConfiguration": _create_Fleet,
+        "FleetServerProcess": _create_Fleet,
+        "GameSessionQueue": _create_GameSessionQueue,
+        "GameSessionQueueProperties": _create_GameSessionQueue,
+        "GameSessionQueueDestination": _create_GameSessionQueue,
+        "GameSessionQueuePlayerLatencyPolicy": _create_GameSessionQueue,
+        "MatchmakingConfiguration": _create_MatchmakingConfiguration,
+        "MatchmakingConfigurationProperties": _create_MatchmakingConfiguration,
+        "MatchmakingConfigurationGameProperty": _create_MatchmakingConfiguration,
+        "MatchmakingRuleSet": _create_MatchmakingRuleSet,
+        "MatchmakingRuleSetProperties": _create_MatchmakingRuleSet,
+        "Script": _create_Script,
+        "ScriptProperties": _create_Script,
+        "ScriptS3Location": _create_Script,
+    },
+)
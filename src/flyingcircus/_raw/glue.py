@@ -7,395 +7,2799 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Classifier",
     "ClassifierProperties",
+    "ClassifierCsvClassifier",
+    "ClassifierGrokClassifier",
+    "ClassifierJsonClassifier",
+    "ClassifierXMLClassifier",
     "Connection",
     "ConnectionProperties",
+    "ConnectionConnectionInput",
+    "ConnectionPhysicalConnectionRequirements",
     "Crawler",
     "CrawlerProperties",
-    "Database",
-    "DatabaseProperties",
+    "CrawlerCatalogTarget",
+    "CrawlerDynamoDBTarget",
+    "CrawlerJdbcTarget",
+    "CrawlerS3Target",
+    "CrawlerSchedule",
+    "CrawlerSchemaChangePolicy",
+    "CrawlerTargets",
     "DataCatalogEncryptionSettings",
     "DataCatalogEncryptionSettingsProperties",
+    "DataCatalogEncryptionSettingsConnectionPasswordEncryption",
+    "DataCatalogEncryptionSettingsDataCatalogEncryptionSettings",
+    "DataCatalogEncryptionSettingsEncryptionAtRest",
+    "Database",
+    "DatabaseProperties",
+    "DatabaseDatabaseInput",
     "DevEndpoint",
     "DevEndpointProperties",
     "Job",
     "JobProperties",
+    "JobConnectionsList",
+    "JobExecutionProperty",
+    "JobJobCommand",
+    "JobNotificationProperty",
     "MLTransform",
     "MLTransformProperties",
+    "MLTransformFindMatchesParameters",
+    "MLTransformGlueTables",
+    "MLTransformInputRecordTables",
+    "MLTransformTransformParameters",
     "Partition",
     "PartitionProperties",
+    "PartitionColumn",
+    "PartitionOrder",
+    "PartitionPartitionInput",
+    "PartitionSerdeInfo",
+    "PartitionSkewedInfo",
+    "PartitionStorageDescriptor",
     "SecurityConfiguration",
     "SecurityConfigurationProperties",
+    "SecurityConfigurationCloudWatchEncryption",
+    "SecurityConfigurationEncryptionConfiguration",
+    "SecurityConfigurationJobBookmarksEncryption",
+    "SecurityConfigurationS3Encryption",
     "Table",
     "TableProperties",
+    "TableColumn",
+    "TableOrder",
+    "TableSerdeInfo",
+    "TableSkewedInfo",
+    "TableStorageDescriptor",
+    "TableTableInput",
     "Trigger",
     "TriggerProperties",
+    "TriggerAction",
+    "TriggerCondition",
+    "TriggerNotificationProperty",
+    "TriggerPredicate",
     "Workflow",
     "WorkflowProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ClassifierProperties(ResourceProperties):
-    CsvClassifier = attrib(default=None)
-    GrokClassifier = attrib(default=None)
-    JsonClassifier = attrib(default=None)
-    XMLClassifier = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Classifier(Resource):
-    """A Classifier for Glue.
-
-    See Also:
-        `AWS Cloud Formation documentation for Classifier
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-classifier.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Glue::Classifier"
-
-    Properties: ClassifierProperties = attrib(
-        factory=ClassifierProperties,
-        converter=create_object_converter(ClassifierProperties),
+def _create_Classifier():
+    class ClassifierCsvClassifier(_PropertyType):
+        """The Csv Classifier property type for Classifier in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for CsvClassifier
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-classifier-csvclassifier.html>`_
+        """
+
+        __slots__ = (
+            "AllowSingleColumn",
+            "ContainsHeader",
+            "Delimiter",
+            "DisableValueTrimming",
+            "Header",
+            "Name",
+            "QuoteSymbol",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClassifierCsvClassifier", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowSingleColumn=None,
+            ContainsHeader=None,
+            Delimiter=None,
+            DisableValueTrimming=None,
+            Header=None,
+            Name=None,
+            QuoteSymbol=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowSingleColumn", AllowSingleColumn)
+            _setattr("ContainsHeader", ContainsHeader)
+            _setattr("Delimiter", Delimiter)
+            _setattr("DisableValueTrimming", DisableValueTrimming)
+            _setattr("Header", Header)
+            _setattr("Name", Name)
+            _setattr("QuoteSymbol", QuoteSymbol)
+            _init_PropertyType(self, kwargs)
+
+    class ClassifierGrokClassifier(_PropertyType):
+        """The Grok Classifier property type for Classifier in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for GrokClassifier
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-classifier-grokclassifier.html>`_
+        """
+
+        __slots__ = ("Classification", "CustomPatterns", "GrokPattern", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClassifierGrokClassifier", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Classification=None,
+            CustomPatterns=None,
+            GrokPattern=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Classification", Classification)
+            _setattr("CustomPatterns", CustomPatterns)
+            _setattr("GrokPattern", GrokPattern)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class ClassifierJsonClassifier(_PropertyType):
+        """The Json Classifier property type for Classifier in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for JsonClassifier
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-classifier-jsonclassifier.html>`_
+        """
+
+        __slots__ = ("JsonPath", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClassifierJsonClassifier", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, JsonPath=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("JsonPath", JsonPath)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class ClassifierXMLClassifier(_PropertyType):
+        """The Xml Classifier property type for Classifier in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for XMLClassifier
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-classifier-xmlclassifier.html>`_
+        """
+
+        __slots__ = ("Classification", "Name", "RowTag")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClassifierXMLClassifier", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Classification=None, Name=None, RowTag=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Classification", Classification)
+            _setattr("Name", Name)
+            _setattr("RowTag", RowTag)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClassifierCsvClassifier = create_object_converter(ClassifierCsvClassifier)
+    _convert_ClassifierGrokClassifier = create_object_converter(
+        ClassifierGrokClassifier
     )
-
-
-@attrs(**ATTRSCONFIG)
-class ConnectionProperties(ResourceProperties):
-    CatalogId = attrib(default=None)
-    ConnectionInput = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Connection(Resource):
-    """A Connection for Glue.
-
-    See Also:
-        `AWS Cloud Formation documentation for Connection
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-connection.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Glue::Connection"
-
-    Properties: ConnectionProperties = attrib(
-        factory=ConnectionProperties,
-        converter=create_object_converter(ConnectionProperties),
+    _convert_ClassifierJsonClassifier = create_object_converter(
+        ClassifierJsonClassifier
     )
-
-
-@attrs(**ATTRSCONFIG)
-class CrawlerProperties(ResourceProperties):
-    Classifiers = attrib(default=None)
-    Configuration = attrib(default=None)
-    CrawlerSecurityConfiguration = attrib(default=None)
-    DatabaseName = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    Role = attrib(default=None)
-    Schedule = attrib(default=None)
-    SchemaChangePolicy = attrib(default=None)
-    TablePrefix = attrib(default=None)
-    Tags = attrib(default=None)
-    Targets = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Crawler(Resource):
-    """A Crawler for Glue.
-
-    See Also:
-        `AWS Cloud Formation documentation for Crawler
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-crawler.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Glue::Crawler"
-
-    Properties: CrawlerProperties = attrib(
-        factory=CrawlerProperties, converter=create_object_converter(CrawlerProperties)
+    _convert_ClassifierXMLClassifier = create_object_converter(ClassifierXMLClassifier)
+
+    class ClassifierProperties(_ResourceProperties):
+        __slots__ = (
+            "CsvClassifier",
+            "GrokClassifier",
+            "JsonClassifier",
+            "XMLClassifier",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClassifierProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CsvClassifier": _convert_ClassifierCsvClassifier,
+                "GrokClassifier": _convert_ClassifierGrokClassifier,
+                "JsonClassifier": _convert_ClassifierJsonClassifier,
+                "XMLClassifier": _convert_ClassifierXMLClassifier,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CsvClassifier=None,
+            GrokClassifier=None,
+            JsonClassifier=None,
+            XMLClassifier=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CsvClassifier", _convert_ClassifierCsvClassifier(CsvClassifier))
+            _setattr(
+                "GrokClassifier", _convert_ClassifierGrokClassifier(GrokClassifier)
+            )
+            _setattr(
+                "JsonClassifier", _convert_ClassifierJsonClassifier(JsonClassifier)
+            )
+            _setattr("XMLClassifier", _convert_ClassifierXMLClassifier(XMLClassifier))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClassifierProperties = create_object_converter(ClassifierProperties)
+
+    class Classifier(_Resource):
+        """A Classifier for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Classifier
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-classifier.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::Classifier"
+
+        Properties: ClassifierProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Classifier",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClassifierProperties},
+            factories={"Properties": ClassifierProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClassifierProperties()
+            _setattr("Properties", _convert_ClassifierProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Classifier,
+        ClassifierProperties,
+        ClassifierCsvClassifier,
+        ClassifierGrokClassifier,
+        ClassifierJsonClassifier,
+        ClassifierXMLClassifier,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class DataCatalogEncryptionSettingsProperties(ResourceProperties):
-    CatalogId = attrib(default=None)
-    DataCatalogEncryptionSettings = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DataCatalogEncryptionSettings(Resource):
-    """A Data Catalog Encryption Settings for Glue.
-
-    See Also:
-        `AWS Cloud Formation documentation for DataCatalogEncryptionSettings
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-datacatalogencryptionsettings.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Glue::DataCatalogEncryptionSettings"
-
-    Properties: DataCatalogEncryptionSettingsProperties = attrib(
-        factory=DataCatalogEncryptionSettingsProperties,
-        converter=create_object_converter(DataCatalogEncryptionSettingsProperties),
+def _create_Connection():
+    class ConnectionPhysicalConnectionRequirements(_PropertyType):
+        """The Physical Connection Requirements property type for Connection in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for PhysicalConnectionRequirements
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-connection-physicalconnectionrequirements.html>`_
+        """
+
+        __slots__ = ("AvailabilityZone", "SecurityGroupIdList", "SubnetId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectionPhysicalConnectionRequirements", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AvailabilityZone=None,
+            SecurityGroupIdList=None,
+            SubnetId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("SecurityGroupIdList", SecurityGroupIdList)
+            _setattr("SubnetId", SubnetId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConnectionPhysicalConnectionRequirements = create_object_converter(
+        ConnectionPhysicalConnectionRequirements
     )
 
-
-@attrs(**ATTRSCONFIG)
-class DatabaseProperties(ResourceProperties):
-    CatalogId = attrib(default=None)
-    DatabaseInput = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Database(Resource):
-    """A Database for Glue.
-
-    See Also:
-        `AWS Cloud Formation documentation for Database
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-database.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Glue::Database"
-
-    Properties: DatabaseProperties = attrib(
-        factory=DatabaseProperties,
-        converter=create_object_converter(DatabaseProperties),
+    class ConnectionConnectionInput(_PropertyType):
+        """The Connection Input property type for Connection in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConnectionInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-connection-connectioninput.html>`_
+        """
+
+        __slots__ = (
+            "ConnectionProperties",
+            "ConnectionType",
+            "Description",
+            "MatchCriteria",
+            "Name",
+            "PhysicalConnectionRequirements",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectionConnectionInput",
+            _PropertyType,
+            __slots__,
+            converters={
+                "PhysicalConnectionRequirements": _convert_ConnectionPhysicalConnectionRequirements
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConnectionProperties=None,
+            ConnectionType=None,
+            Description=None,
+            MatchCriteria=None,
+            Name=None,
+            PhysicalConnectionRequirements=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConnectionProperties", ConnectionProperties)
+            _setattr("ConnectionType", ConnectionType)
+            _setattr("Description", Description)
+            _setattr("MatchCriteria", MatchCriteria)
+            _setattr("Name", Name)
+            _setattr(
+                "PhysicalConnectionRequirements",
+                _convert_ConnectionPhysicalConnectionRequirements(
+                    PhysicalConnectionRequirements
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConnectionConnectionInput = create_object_converter(
+        ConnectionConnectionInput
     )
 
-
-@attrs(**ATTRSCONFIG)
-class DevEndpointProperties(ResourceProperties):
-    Arguments = attrib(default=None)
-    EndpointName = attrib(default=None)
-    ExtraJarsS3Path = attrib(default=None)
-    ExtraPythonLibsS3Path = attrib(default=None)
-    GlueVersion = attrib(default=None)
-    NumberOfNodes = attrib(default=None)
-    NumberOfWorkers = attrib(default=None)
-    PublicKey = attrib(default=None)
-    RoleArn = attrib(default=None)
-    SecurityConfiguration = attrib(default=None)
-    SecurityGroupIds = attrib(default=None)
-    SubnetId = attrib(default=None)
-    Tags = attrib(default=None)
-    WorkerType = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DevEndpoint(Resource):
-    """A Dev Endpoint for Glue.
-
-    See Also:
-        `AWS Cloud Formation documentation for DevEndpoint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-devendpoint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Glue::DevEndpoint"
-
-    Properties: DevEndpointProperties = attrib(
-        factory=DevEndpointProperties,
-        converter=create_object_converter(DevEndpointProperties),
+    class ConnectionProperties(_ResourceProperties):
+        __slots__ = ("CatalogId", "ConnectionInput")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"ConnectionInput": _convert_ConnectionConnectionInput},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CatalogId=None, ConnectionInput=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CatalogId", CatalogId)
+            _setattr(
+                "ConnectionInput", _convert_ConnectionConnectionInput(ConnectionInput)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConnectionProperties = create_object_converter(ConnectionProperties)
+
+    class Connection(_Resource):
+        """A Connection for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Connection
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-connection.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::Connection"
+
+        Properties: ConnectionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Connection",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConnectionProperties},
+            factories={"Properties": ConnectionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConnectionProperties()
+            _setattr("Properties", _convert_ConnectionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Connection,
+        ConnectionProperties,
+        ConnectionPhysicalConnectionRequirements,
+        ConnectionConnectionInput,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class JobProperties(ResourceProperties):
-    AllocatedCapacity = attrib(default=None)
-    Command = attrib(default=None)
-    Connections = attrib(default=None)
-    DefaultArguments = attrib(default=None)
-    Description = attrib(default=None)
-    ExecutionProperty = attrib(default=None)
-    GlueVersion = attrib(default=None)
-    LogUri = attrib(default=None)
-    MaxCapacity = attrib(default=None)
-    MaxRetries = attrib(default=None)
-    Name = attrib(default=None)
-    NotificationProperty = attrib(default=None)
-    NumberOfWorkers = attrib(default=None)
-    Role = attrib(default=None)
-    SecurityConfiguration = attrib(default=None)
-    Tags = attrib(default=None)
-    Timeout = attrib(default=None)
-    WorkerType = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Job(Resource):
-    """A Job for Glue.
-
-    See Also:
-        `AWS Cloud Formation documentation for Job
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-job.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Glue::Job"
-
-    Properties: JobProperties = attrib(
-        factory=JobProperties, converter=create_object_converter(JobProperties)
+def _create_Crawler():
+    class CrawlerCatalogTarget(_PropertyType):
+        """The Catalog Target property type for Crawler in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for CatalogTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-crawler-catalogtarget.html>`_
+        """
+
+        __slots__ = ("DatabaseName", "Tables")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CrawlerCatalogTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DatabaseName=None, Tables=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("Tables", Tables)
+            _init_PropertyType(self, kwargs)
+
+    class CrawlerDynamoDBTarget(_PropertyType):
+        """The Dynamo Db Target property type for Crawler in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for DynamoDBTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-crawler-dynamodbtarget.html>`_
+        """
+
+        __slots__ = ("Path",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CrawlerDynamoDBTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Path=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Path", Path)
+            _init_PropertyType(self, kwargs)
+
+    class CrawlerJdbcTarget(_PropertyType):
+        """The Jdbc Target property type for Crawler in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for JdbcTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-crawler-jdbctarget.html>`_
+        """
+
+        __slots__ = ("ConnectionName", "Exclusions", "Path")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CrawlerJdbcTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ConnectionName=None, Exclusions=None, Path=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConnectionName", ConnectionName)
+            _setattr("Exclusions", Exclusions)
+            _setattr("Path", Path)
+            _init_PropertyType(self, kwargs)
+
+    class CrawlerS3Target(_PropertyType):
+        """The S3 Target property type for Crawler in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3Target
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-crawler-s3target.html>`_
+        """
+
+        __slots__ = ("Exclusions", "Path")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CrawlerS3Target", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Exclusions=None, Path=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Exclusions", Exclusions)
+            _setattr("Path", Path)
+            _init_PropertyType(self, kwargs)
+
+    class CrawlerSchedule(_PropertyType):
+        """The Schedule property type for Crawler in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Schedule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-crawler-schedule.html>`_
+        """
+
+        __slots__ = ("ScheduleExpression",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CrawlerSchedule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ScheduleExpression=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ScheduleExpression", ScheduleExpression)
+            _init_PropertyType(self, kwargs)
+
+    class CrawlerSchemaChangePolicy(_PropertyType):
+        """The Schema Change Policy property type for Crawler in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for SchemaChangePolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-crawler-schemachangepolicy.html>`_
+        """
+
+        __slots__ = ("DeleteBehavior", "UpdateBehavior")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CrawlerSchemaChangePolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeleteBehavior=None, UpdateBehavior=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteBehavior", DeleteBehavior)
+            _setattr("UpdateBehavior", UpdateBehavior)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CrawlerCatalogTarget_list = create_object_list_converter(
+        CrawlerCatalogTarget
+    )
+    _convert_CrawlerDynamoDBTarget_list = create_object_list_converter(
+        CrawlerDynamoDBTarget
+    )
+    _convert_CrawlerJdbcTarget_list = create_object_list_converter(CrawlerJdbcTarget)
+    _convert_CrawlerS3Target_list = create_object_list_converter(CrawlerS3Target)
+
+    class CrawlerTargets(_PropertyType):
+        """The Targets property type for Crawler in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Targets
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-crawler-targets.html>`_
+        """
+
+        __slots__ = ("CatalogTargets", "DynamoDBTargets", "JdbcTargets", "S3Targets")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CrawlerTargets",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CatalogTargets": _convert_CrawlerCatalogTarget_list,
+                "DynamoDBTargets": _convert_CrawlerDynamoDBTarget_list,
+                "JdbcTargets": _convert_CrawlerJdbcTarget_list,
+                "S3Targets": _convert_CrawlerS3Target_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CatalogTargets=None,
+            DynamoDBTargets=None,
+            JdbcTargets=None,
+            S3Targets=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CatalogTargets", _convert_CrawlerCatalogTarget_list(CatalogTargets)
+            )
+            _setattr(
+                "DynamoDBTargets", _convert_CrawlerDynamoDBTarget_list(DynamoDBTargets)
+            )
+            _setattr("JdbcTargets", _convert_CrawlerJdbcTarget_list(JdbcTargets))
+            _setattr("S3Targets", _convert_CrawlerS3Target_list(S3Targets))
+            _init_PropertyType(self, kwargs)
+
+    _convert_CrawlerSchedule = create_object_converter(CrawlerSchedule)
+    _convert_CrawlerSchemaChangePolicy = create_object_converter(
+        CrawlerSchemaChangePolicy
+    )
+    _convert_CrawlerTargets = create_object_converter(CrawlerTargets)
+
+    class CrawlerProperties(_ResourceProperties):
+        __slots__ = (
+            "Classifiers",
+            "Configuration",
+            "CrawlerSecurityConfiguration",
+            "DatabaseName",
+            "Description",
+            "Name",
+            "Role",
+            "Schedule",
+            "SchemaChangePolicy",
+            "TablePrefix",
+            "Tags",
+            "Targets",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CrawlerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Schedule": _convert_CrawlerSchedule,
+                "SchemaChangePolicy": _convert_CrawlerSchemaChangePolicy,
+                "Targets": _convert_CrawlerTargets,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Classifiers=None,
+            Configuration=None,
+            CrawlerSecurityConfiguration=None,
+            DatabaseName=None,
+            Description=None,
+            Name=None,
+            Role=None,
+            Schedule=None,
+            SchemaChangePolicy=None,
+            TablePrefix=None,
+            Tags=None,
+            Targets=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Classifiers", Classifiers)
+            _setattr("Configuration", Configuration)
+            _setattr("CrawlerSecurityConfiguration", CrawlerSecurityConfiguration)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Role", Role)
+            _setattr("Schedule", _convert_CrawlerSchedule(Schedule))
+            _setattr(
+                "SchemaChangePolicy",
+                _convert_CrawlerSchemaChangePolicy(SchemaChangePolicy),
+            )
+            _setattr("TablePrefix", TablePrefix)
+            _setattr("Tags", Tags)
+            _setattr("Targets", _convert_CrawlerTargets(Targets))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CrawlerProperties = create_object_converter(CrawlerProperties)
+
+    class Crawler(_Resource):
+        """A Crawler for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Crawler
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-crawler.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::Crawler"
+        TAG_FORMAT = "Map"
+
+        Properties: CrawlerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Crawler",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CrawlerProperties},
+            factories={"Properties": CrawlerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CrawlerProperties()
+            _setattr("Properties", _convert_CrawlerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Crawler,
+        CrawlerProperties,
+        CrawlerCatalogTarget,
+        CrawlerDynamoDBTarget,
+        CrawlerJdbcTarget,
+        CrawlerS3Target,
+        CrawlerSchedule,
+        CrawlerSchemaChangePolicy,
+        CrawlerTargets,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class MLTransformProperties(ResourceProperties):
-    Description = attrib(default=None)
-    GlueVersion = attrib(default=None)
-    InputRecordTables = attrib(default=None)
-    MaxCapacity = attrib(default=None)
-    MaxRetries = attrib(default=None)
-    Name = attrib(default=None)
-    NumberOfWorkers = attrib(default=None)
-    Role = attrib(default=None)
-    Timeout = attrib(default=None)
-    TransformParameters = attrib(default=None)
-    WorkerType = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class MLTransform(Resource):
-    """A Ml Transform for Glue.
-
-    See Also:
-        `AWS Cloud Formation documentation for MLTransform
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-mltransform.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Glue::MLTransform"
-
-    Properties: MLTransformProperties = attrib(
-        factory=MLTransformProperties,
-        converter=create_object_converter(MLTransformProperties),
+def _create_DataCatalogEncryptionSettings():
+    class DataCatalogEncryptionSettingsConnectionPasswordEncryption(_PropertyType):
+        """The Connection Password Encryption property type for DataCatalogEncryptionSettings in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConnectionPasswordEncryption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-datacatalogencryptionsettings-connectionpasswordencryption.html>`_
+        """
+
+        __slots__ = ("KmsKeyId", "ReturnConnectionPasswordEncrypted")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataCatalogEncryptionSettingsConnectionPasswordEncryption",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, KmsKeyId=None, ReturnConnectionPasswordEncrypted=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr(
+                "ReturnConnectionPasswordEncrypted", ReturnConnectionPasswordEncrypted
+            )
+            _init_PropertyType(self, kwargs)
+
+    class DataCatalogEncryptionSettingsEncryptionAtRest(_PropertyType):
+        """The Encryption At Rest property type for DataCatalogEncryptionSettings in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionAtRest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-datacatalogencryptionsettings-encryptionatrest.html>`_
+        """
+
+        __slots__ = ("CatalogEncryptionMode", "SseAwsKmsKeyId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataCatalogEncryptionSettingsEncryptionAtRest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CatalogEncryptionMode=None, SseAwsKmsKeyId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CatalogEncryptionMode", CatalogEncryptionMode)
+            _setattr("SseAwsKmsKeyId", SseAwsKmsKeyId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DataCatalogEncryptionSettingsConnectionPasswordEncryption = (
+        create_object_converter(
+            DataCatalogEncryptionSettingsConnectionPasswordEncryption
+        )
+    )
+    _convert_DataCatalogEncryptionSettingsEncryptionAtRest = create_object_converter(
+        DataCatalogEncryptionSettingsEncryptionAtRest
     )
 
+    class DataCatalogEncryptionSettingsDataCatalogEncryptionSettings(_PropertyType):
+        """The Data Catalog Encryption Settings property type for DataCatalogEncryptionSettings in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for DataCatalogEncryptionSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-datacatalogencryptionsettings-datacatalogencryptionsettings.html>`_
+        """
+
+        __slots__ = ("ConnectionPasswordEncryption", "EncryptionAtRest")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataCatalogEncryptionSettingsDataCatalogEncryptionSettings",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ConnectionPasswordEncryption": _convert_DataCatalogEncryptionSettingsConnectionPasswordEncryption,
+                "EncryptionAtRest": _convert_DataCatalogEncryptionSettingsEncryptionAtRest,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ConnectionPasswordEncryption=None, EncryptionAtRest=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ConnectionPasswordEncryption",
+                _convert_DataCatalogEncryptionSettingsConnectionPasswordEncryption(
+                    ConnectionPasswordEncryption
+                ),
+            )
+            _setattr(
+                "EncryptionAtRest",
+                _convert_DataCatalogEncryptionSettingsEncryptionAtRest(
+                    EncryptionAtRest
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_DataCatalogEncryptionSettingsDataCatalogEncryptionSettings = (
+        create_object_converter(
+            DataCatalogEncryptionSettingsDataCatalogEncryptionSettings
+        )
+    )
 
-@attrs(**ATTRSCONFIG)
-class PartitionProperties(ResourceProperties):
-    CatalogId = attrib(default=None)
-    DatabaseName = attrib(default=None)
-    PartitionInput = attrib(default=None)
-    TableName = attrib(default=None)
+    class DataCatalogEncryptionSettingsProperties(_ResourceProperties):
+        __slots__ = ("CatalogId", "DataCatalogEncryptionSettings")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataCatalogEncryptionSettingsProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DataCatalogEncryptionSettings": _convert_DataCatalogEncryptionSettingsDataCatalogEncryptionSettings
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CatalogId=None, DataCatalogEncryptionSettings=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CatalogId", CatalogId)
+            _setattr(
+                "DataCatalogEncryptionSettings",
+                _convert_DataCatalogEncryptionSettingsDataCatalogEncryptionSettings(
+                    DataCatalogEncryptionSettings
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DataCatalogEncryptionSettingsProperties = create_object_converter(
+        DataCatalogEncryptionSettingsProperties
+    )
 
+    class DataCatalogEncryptionSettings(_Resource):
+        """A Data Catalog Encryption Settings for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for DataCatalogEncryptionSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-datacatalogencryptionsettings.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::DataCatalogEncryptionSettings"
+
+        Properties: DataCatalogEncryptionSettingsProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataCatalogEncryptionSettings",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DataCatalogEncryptionSettingsProperties},
+            factories={"Properties": DataCatalogEncryptionSettingsProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DataCatalogEncryptionSettingsProperties()
+            _setattr(
+                "Properties",
+                _convert_DataCatalogEncryptionSettingsProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        DataCatalogEncryptionSettings,
+        DataCatalogEncryptionSettingsProperties,
+        DataCatalogEncryptionSettingsConnectionPasswordEncryption,
+        DataCatalogEncryptionSettingsEncryptionAtRest,
+        DataCatalogEncryptionSettingsDataCatalogEncryptionSettings,
+    )
 
-@attrs(**ATTRSCONFIG)
-class Partition(Resource):
-    """A Partition for Glue.
 
-    See Also:
-        `AWS Cloud Formation documentation for Partition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-partition.html>`_
-    """
+def _create_Database():
+    class DatabaseDatabaseInput(_PropertyType):
+        """The Database Input property type for Database in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for DatabaseInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-database-databaseinput.html>`_
+        """
+
+        __slots__ = ("Description", "LocationUri", "Name", "Parameters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatabaseDatabaseInput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            LocationUri=None,
+            Name=None,
+            Parameters=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("LocationUri", LocationUri)
+            _setattr("Name", Name)
+            _setattr("Parameters", Parameters)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatabaseDatabaseInput = create_object_converter(DatabaseDatabaseInput)
+
+    class DatabaseProperties(_ResourceProperties):
+        __slots__ = ("CatalogId", "DatabaseInput")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatabaseProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"DatabaseInput": _convert_DatabaseDatabaseInput},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CatalogId=None, DatabaseInput=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CatalogId", CatalogId)
+            _setattr("DatabaseInput", _convert_DatabaseDatabaseInput(DatabaseInput))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DatabaseProperties = create_object_converter(DatabaseProperties)
+
+    class Database(_Resource):
+        """A Database for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Database
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-database.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::Database"
+
+        Properties: DatabaseProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Database",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DatabaseProperties},
+            factories={"Properties": DatabaseProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DatabaseProperties()
+            _setattr("Properties", _convert_DatabaseProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Database, DatabaseProperties, DatabaseDatabaseInput
+
+
+def _create_DevEndpoint():
+    class DevEndpointProperties(_ResourceProperties):
+        __slots__ = (
+            "Arguments",
+            "EndpointName",
+            "ExtraJarsS3Path",
+            "ExtraPythonLibsS3Path",
+            "GlueVersion",
+            "NumberOfNodes",
+            "NumberOfWorkers",
+            "PublicKey",
+            "RoleArn",
+            "SecurityConfiguration",
+            "SecurityGroupIds",
+            "SubnetId",
+            "Tags",
+            "WorkerType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DevEndpointProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Arguments=None,
+            EndpointName=None,
+            ExtraJarsS3Path=None,
+            ExtraPythonLibsS3Path=None,
+            GlueVersion=None,
+            NumberOfNodes=None,
+            NumberOfWorkers=None,
+            PublicKey=None,
+            RoleArn=None,
+            SecurityConfiguration=None,
+            SecurityGroupIds=None,
+            SubnetId=None,
+            Tags=None,
+            WorkerType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arguments", Arguments)
+            _setattr("EndpointName", EndpointName)
+            _setattr("ExtraJarsS3Path", ExtraJarsS3Path)
+            _setattr("ExtraPythonLibsS3Path", ExtraPythonLibsS3Path)
+            _setattr("GlueVersion", GlueVersion)
+            _setattr("NumberOfNodes", NumberOfNodes)
+            _setattr("NumberOfWorkers", NumberOfWorkers)
+            _setattr("PublicKey", PublicKey)
+            _setattr("RoleArn", RoleArn)
+            _setattr("SecurityConfiguration", SecurityConfiguration)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SubnetId", SubnetId)
+            _setattr("Tags", Tags)
+            _setattr("WorkerType", WorkerType)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DevEndpointProperties = create_object_converter(DevEndpointProperties)
+
+    class DevEndpoint(_Resource):
+        """A Dev Endpoint for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for DevEndpoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-devendpoint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::DevEndpoint"
+        TAG_FORMAT = "Map"
+
+        Properties: DevEndpointProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DevEndpoint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DevEndpointProperties},
+            factories={"Properties": DevEndpointProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DevEndpointProperties()
+            _setattr("Properties", _convert_DevEndpointProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DevEndpoint, DevEndpointProperties
+
+
+def _create_Job():
+    class JobConnectionsList(_PropertyType):
+        """The Connections List property type for Job in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConnectionsList
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-job-connectionslist.html>`_
+        """
+
+        __slots__ = ("Connections",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobConnectionsList", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Connections=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Connections", Connections)
+            _init_PropertyType(self, kwargs)
+
+    class JobExecutionProperty(_PropertyType):
+        """The Execution Property property type for Job in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for ExecutionProperty
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-job-executionproperty.html>`_
+        """
+
+        __slots__ = ("MaxConcurrentRuns",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobExecutionProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MaxConcurrentRuns=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaxConcurrentRuns", MaxConcurrentRuns)
+            _init_PropertyType(self, kwargs)
+
+    class JobJobCommand(_PropertyType):
+        """The Job Command property type for Job in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for JobCommand
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-job-jobcommand.html>`_
+        """
+
+        __slots__ = ("Name", "PythonVersion", "ScriptLocation")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobJobCommand", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Name=None, PythonVersion=None, ScriptLocation=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("PythonVersion", PythonVersion)
+            _setattr("ScriptLocation", ScriptLocation)
+            _init_PropertyType(self, kwargs)
+
+    class JobNotificationProperty(_PropertyType):
+        """The Notification Property property type for Job in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotificationProperty
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-job-notificationproperty.html>`_
+        """
+
+        __slots__ = ("NotifyDelayAfter",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobNotificationProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, NotifyDelayAfter=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NotifyDelayAfter", NotifyDelayAfter)
+            _init_PropertyType(self, kwargs)
+
+    _convert_JobJobCommand = create_object_converter(JobJobCommand)
+    _convert_JobConnectionsList = create_object_converter(JobConnectionsList)
+    _convert_JobExecutionProperty = create_object_converter(JobExecutionProperty)
+    _convert_JobNotificationProperty = create_object_converter(JobNotificationProperty)
+
+    class JobProperties(_ResourceProperties):
+        __slots__ = (
+            "AllocatedCapacity",
+            "Command",
+            "Connections",
+            "DefaultArguments",
+            "Description",
+            "ExecutionProperty",
+            "GlueVersion",
+            "LogUri",
+            "MaxCapacity",
+            "MaxRetries",
+            "Name",
+            "NotificationProperty",
+            "NumberOfWorkers",
+            "Role",
+            "SecurityConfiguration",
+            "Tags",
+            "Timeout",
+            "WorkerType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Command": _convert_JobJobCommand,
+                "Connections": _convert_JobConnectionsList,
+                "ExecutionProperty": _convert_JobExecutionProperty,
+                "NotificationProperty": _convert_JobNotificationProperty,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllocatedCapacity=None,
+            Command=None,
+            Connections=None,
+            DefaultArguments=None,
+            Description=None,
+            ExecutionProperty=None,
+            GlueVersion=None,
+            LogUri=None,
+            MaxCapacity=None,
+            MaxRetries=None,
+            Name=None,
+            NotificationProperty=None,
+            NumberOfWorkers=None,
+            Role=None,
+            SecurityConfiguration=None,
+            Tags=None,
+            Timeout=None,
+            WorkerType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocatedCapacity", AllocatedCapacity)
+            _setattr("Command", _convert_JobJobCommand(Command))
+            _setattr("Connections", _convert_JobConnectionsList(Connections))
+            _setattr("DefaultArguments", DefaultArguments)
+            _setattr("Description", Description)
+            _setattr(
+                "ExecutionProperty", _convert_JobExecutionProperty(ExecutionProperty)
+            )
+            _setattr("GlueVersion", GlueVersion)
+            _setattr("LogUri", LogUri)
+            _setattr("MaxCapacity", MaxCapacity)
+            _setattr("MaxRetries", MaxRetries)
+            _setattr("Name", Name)
+            _setattr(
+                "NotificationProperty",
+                _convert_JobNotificationProperty(NotificationProperty),
+            )
+            _setattr("NumberOfWorkers", NumberOfWorkers)
+            _setattr("Role", Role)
+            _setattr("SecurityConfiguration", SecurityConfiguration)
+            _setattr("Tags", Tags)
+            _setattr("Timeout", Timeout)
+            _setattr("WorkerType", WorkerType)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_JobProperties = create_object_converter(JobProperties)
+
+    class Job(_Resource):
+        """A Job for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Job
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-job.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::Job"
+        TAG_FORMAT = "Map"
+
+        Properties: JobProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Job",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_JobProperties},
+            factories={"Properties": JobProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = JobProperties()
+            _setattr("Properties", _convert_JobProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Job,
+        JobProperties,
+        JobConnectionsList,
+        JobExecutionProperty,
+        JobJobCommand,
+        JobNotificationProperty,
+    )
 
-    RESOURCE_TYPE = "AWS::Glue::Partition"
 
-    Properties: PartitionProperties = attrib(
-        factory=PartitionProperties,
-        converter=create_object_converter(PartitionProperties),
+def _create_MLTransform():
+    class MLTransformFindMatchesParameters(_PropertyType):
+        """The Find Matches Parameters property type for MLTransform in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for FindMatchesParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-mltransform-transformparameters-findmatchesparameters.html>`_
+        """
+
+        __slots__ = (
+            "AccuracyCostTradeoff",
+            "EnforceProvidedLabels",
+            "PrecisionRecallTradeoff",
+            "PrimaryKeyColumnName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MLTransformFindMatchesParameters", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccuracyCostTradeoff=None,
+            EnforceProvidedLabels=None,
+            PrecisionRecallTradeoff=None,
+            PrimaryKeyColumnName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccuracyCostTradeoff", AccuracyCostTradeoff)
+            _setattr("EnforceProvidedLabels", EnforceProvidedLabels)
+            _setattr("PrecisionRecallTradeoff", PrecisionRecallTradeoff)
+            _setattr("PrimaryKeyColumnName", PrimaryKeyColumnName)
+            _init_PropertyType(self, kwargs)
+
+    class MLTransformGlueTables(_PropertyType):
+        """The Glue Tables property type for MLTransform in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for GlueTables
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-mltransform-inputrecordtables-gluetables.html>`_
+        """
+
+        __slots__ = ("CatalogId", "ConnectionName", "DatabaseName", "TableName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MLTransformGlueTables", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CatalogId=None,
+            ConnectionName=None,
+            DatabaseName=None,
+            TableName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CatalogId", CatalogId)
+            _setattr("ConnectionName", ConnectionName)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("TableName", TableName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MLTransformGlueTables_list = create_object_list_converter(
+        MLTransformGlueTables
     )
 
+    class MLTransformInputRecordTables(_PropertyType):
+        """The Input Record Tables property type for MLTransform in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputRecordTables
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-mltransform-inputrecordtables.html>`_
+        """
+
+        __slots__ = ("GlueTables",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MLTransformInputRecordTables",
+            _PropertyType,
+            __slots__,
+            converters={"GlueTables": _convert_MLTransformGlueTables_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, GlueTables=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GlueTables", _convert_MLTransformGlueTables_list(GlueTables))
+            _init_PropertyType(self, kwargs)
+
+    _convert_MLTransformFindMatchesParameters = create_object_converter(
+        MLTransformFindMatchesParameters
+    )
 
-@attrs(**ATTRSCONFIG)
-class SecurityConfigurationProperties(ResourceProperties):
-    EncryptionConfiguration = attrib(default=None)
-    Name = attrib(default=None)
-
+    class MLTransformTransformParameters(_PropertyType):
+        """The Transform Parameters property type for MLTransform in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for TransformParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-mltransform-transformparameters.html>`_
+        """
+
+        __slots__ = ("FindMatchesParameters", "TransformType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MLTransformTransformParameters",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FindMatchesParameters": _convert_MLTransformFindMatchesParameters
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FindMatchesParameters=None, TransformType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "FindMatchesParameters",
+                _convert_MLTransformFindMatchesParameters(FindMatchesParameters),
+            )
+            _setattr("TransformType", TransformType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MLTransformInputRecordTables = create_object_converter(
+        MLTransformInputRecordTables
+    )
+    _convert_MLTransformTransformParameters = create_object_converter(
+        MLTransformTransformParameters
+    )
 
-@attrs(**ATTRSCONFIG)
-class SecurityConfiguration(Resource):
-    """A Security Configuration for Glue.
+    class MLTransformProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "GlueVersion",
+            "InputRecordTables",
+            "MaxCapacity",
+            "MaxRetries",
+            "Name",
+            "NumberOfWorkers",
+            "Role",
+            "Timeout",
+            "TransformParameters",
+            "WorkerType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MLTransformProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "InputRecordTables": _convert_MLTransformInputRecordTables,
+                "TransformParameters": _convert_MLTransformTransformParameters,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            GlueVersion=None,
+            InputRecordTables=None,
+            MaxCapacity=None,
+            MaxRetries=None,
+            Name=None,
+            NumberOfWorkers=None,
+            Role=None,
+            Timeout=None,
+            TransformParameters=None,
+            WorkerType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("GlueVersion", GlueVersion)
+            _setattr(
+                "InputRecordTables",
+                _convert_MLTransformInputRecordTables(InputRecordTables),
+            )
+            _setattr("MaxCapacity", MaxCapacity)
+            _setattr("MaxRetries", MaxRetries)
+            _setattr("Name", Name)
+            _setattr("NumberOfWorkers", NumberOfWorkers)
+            _setattr("Role", Role)
+            _setattr("Timeout", Timeout)
+            _setattr(
+                "TransformParameters",
+                _convert_MLTransformTransformParameters(TransformParameters),
+            )
+            _setattr("WorkerType", WorkerType)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MLTransformProperties = create_object_converter(MLTransformProperties)
+
+    class MLTransform(_Resource):
+        """A Ml Transform for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for MLTransform
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-mltransform.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::MLTransform"
+
+        Properties: MLTransformProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MLTransform",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MLTransformProperties},
+            factories={"Properties": MLTransformProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MLTransformProperties()
+            _setattr("Properties", _convert_MLTransformProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        MLTransform,
+        MLTransformProperties,
+        MLTransformFindMatchesParameters,
+        MLTransformGlueTables,
+        MLTransformInputRecordTables,
+        MLTransformTransformParameters,
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for SecurityConfiguration
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-securityconfiguration.html>`_
-    """
 
-    RESOURCE_TYPE = "AWS::Glue::SecurityConfiguration"
+def _create_Partition():
+    class PartitionColumn(_PropertyType):
+        """The Column property type for Partition in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Column
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-partition-column.html>`_
+        """
+
+        __slots__ = ("Comment", "Name", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PartitionColumn", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Comment=None, Name=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Comment", Comment)
+            _setattr("Name", Name)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class PartitionOrder(_PropertyType):
+        """The Order property type for Partition in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Order
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-partition-order.html>`_
+        """
+
+        __slots__ = ("Column", "SortOrder")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PartitionOrder", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Column=None, SortOrder=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Column", Column)
+            _setattr("SortOrder", SortOrder)
+            _init_PropertyType(self, kwargs)
+
+    class PartitionSkewedInfo(_PropertyType):
+        """The Skewed Info property type for Partition in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for SkewedInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-partition-skewedinfo.html>`_
+        """
+
+        __slots__ = (
+            "SkewedColumnNames",
+            "SkewedColumnValueLocationMaps",
+            "SkewedColumnValues",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PartitionSkewedInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            SkewedColumnNames=None,
+            SkewedColumnValueLocationMaps=None,
+            SkewedColumnValues=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SkewedColumnNames", SkewedColumnNames)
+            _setattr("SkewedColumnValueLocationMaps", SkewedColumnValueLocationMaps)
+            _setattr("SkewedColumnValues", SkewedColumnValues)
+            _init_PropertyType(self, kwargs)
+
+    class PartitionSerdeInfo(_PropertyType):
+        """The Serde Info property type for Partition in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for SerdeInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-partition-serdeinfo.html>`_
+        """
+
+        __slots__ = ("Name", "Parameters", "SerializationLibrary")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PartitionSerdeInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Name=None, Parameters=None, SerializationLibrary=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Parameters", Parameters)
+            _setattr("SerializationLibrary", SerializationLibrary)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PartitionColumn_list = create_object_list_converter(PartitionColumn)
+    _convert_PartitionSerdeInfo = create_object_converter(PartitionSerdeInfo)
+    _convert_PartitionSkewedInfo = create_object_converter(PartitionSkewedInfo)
+    _convert_PartitionOrder_list = create_object_list_converter(PartitionOrder)
+
+    class PartitionStorageDescriptor(_PropertyType):
+        """The Storage Descriptor property type for Partition in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for StorageDescriptor
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-partition-storagedescriptor.html>`_
+        """
+
+        __slots__ = (
+            "BucketColumns",
+            "Columns",
+            "Compressed",
+            "InputFormat",
+            "Location",
+            "NumberOfBuckets",
+            "OutputFormat",
+            "Parameters",
+            "SerdeInfo",
+            "SkewedInfo",
+            "SortColumns",
+            "StoredAsSubDirectories",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PartitionStorageDescriptor",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Columns": _convert_PartitionColumn_list,
+                "SerdeInfo": _convert_PartitionSerdeInfo,
+                "SkewedInfo": _convert_PartitionSkewedInfo,
+                "SortColumns": _convert_PartitionOrder_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BucketColumns=None,
+            Columns=None,
+            Compressed=None,
+            InputFormat=None,
+            Location=None,
+            NumberOfBuckets=None,
+            OutputFormat=None,
+            Parameters=None,
+            SerdeInfo=None,
+            SkewedInfo=None,
+            SortColumns=None,
+            StoredAsSubDirectories=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketColumns", BucketColumns)
+            _setattr("Columns", _convert_PartitionColumn_list(Columns))
+            _setattr("Compressed", Compressed)
+            _setattr("InputFormat", InputFormat)
+            _setattr("Location", Location)
+            _setattr("NumberOfBuckets", NumberOfBuckets)
+            _setattr("OutputFormat", OutputFormat)
+            _setattr("Parameters", Parameters)
+            _setattr("SerdeInfo", _convert_PartitionSerdeInfo(SerdeInfo))
+            _setattr("SkewedInfo", _convert_PartitionSkewedInfo(SkewedInfo))
+            _setattr("SortColumns", _convert_PartitionOrder_list(SortColumns))
+            _setattr("StoredAsSubDirectories", StoredAsSubDirectories)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PartitionStorageDescriptor = create_object_converter(
+        PartitionStorageDescriptor
+    )
 
-    Properties: SecurityConfigurationProperties = attrib(
-        factory=SecurityConfigurationProperties,
-        converter=create_object_converter(SecurityConfigurationProperties),
+    class PartitionPartitionInput(_PropertyType):
+        """The Partition Input property type for Partition in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for PartitionInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-partition-partitioninput.html>`_
+        """
+
+        __slots__ = ("Parameters", "StorageDescriptor", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PartitionPartitionInput",
+            _PropertyType,
+            __slots__,
+            converters={"StorageDescriptor": _convert_PartitionStorageDescriptor},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Parameters=None, StorageDescriptor=None, Values=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Parameters", Parameters)
+            _setattr(
+                "StorageDescriptor",
+                _convert_PartitionStorageDescriptor(StorageDescriptor),
+            )
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PartitionPartitionInput = create_object_converter(PartitionPartitionInput)
+
+    class PartitionProperties(_ResourceProperties):
+        __slots__ = ("CatalogId", "DatabaseName", "PartitionInput", "TableName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PartitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"PartitionInput": _convert_PartitionPartitionInput},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CatalogId=None,
+            DatabaseName=None,
+            PartitionInput=None,
+            TableName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CatalogId", CatalogId)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("PartitionInput", _convert_PartitionPartitionInput(PartitionInput))
+            _setattr("TableName", TableName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PartitionProperties = create_object_converter(PartitionProperties)
+
+    class Partition(_Resource):
+        """A Partition for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Partition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-partition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::Partition"
+
+        Properties: PartitionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Partition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PartitionProperties},
+            factories={"Properties": PartitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PartitionProperties()
+            _setattr("Properties", _convert_PartitionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Partition,
+        PartitionProperties,
+        PartitionColumn,
+        PartitionOrder,
+        PartitionSkewedInfo,
+        PartitionSerdeInfo,
+        PartitionStorageDescriptor,
+        PartitionPartitionInput,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class TableProperties(ResourceProperties):
-    CatalogId = attrib(default=None)
-    DatabaseName = attrib(default=None)
-    TableInput = attrib(default=None)
+def _create_SecurityConfiguration():
+    class SecurityConfigurationCloudWatchEncryption(_PropertyType):
+        """The Cloud Watch Encryption property type for SecurityConfiguration in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudWatchEncryption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-securityconfiguration-cloudwatchencryption.html>`_
+        """
+
+        __slots__ = ("CloudWatchEncryptionMode", "KmsKeyArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityConfigurationCloudWatchEncryption", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CloudWatchEncryptionMode=None, KmsKeyArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudWatchEncryptionMode", CloudWatchEncryptionMode)
+            _setattr("KmsKeyArn", KmsKeyArn)
+            _init_PropertyType(self, kwargs)
+
+    class SecurityConfigurationJobBookmarksEncryption(_PropertyType):
+        """The Job Bookmarks Encryption property type for SecurityConfiguration in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for JobBookmarksEncryption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-securityconfiguration-jobbookmarksencryption.html>`_
+        """
+
+        __slots__ = ("JobBookmarksEncryptionMode", "KmsKeyArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityConfigurationJobBookmarksEncryption", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, JobBookmarksEncryptionMode=None, KmsKeyArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("JobBookmarksEncryptionMode", JobBookmarksEncryptionMode)
+            _setattr("KmsKeyArn", KmsKeyArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SecurityConfigurationCloudWatchEncryption = create_object_converter(
+        SecurityConfigurationCloudWatchEncryption
+    )
+    _convert_SecurityConfigurationJobBookmarksEncryption = create_object_converter(
+        SecurityConfigurationJobBookmarksEncryption
+    )
 
+    class SecurityConfigurationEncryptionConfiguration(_PropertyType):
+        """The Encryption Configuration property type for SecurityConfiguration in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-securityconfiguration-encryptionconfiguration.html>`_
+        """
+
+        __slots__ = ("CloudWatchEncryption", "JobBookmarksEncryption", "S3Encryptions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityConfigurationEncryptionConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudWatchEncryption": _convert_SecurityConfigurationCloudWatchEncryption,
+                "JobBookmarksEncryption": _convert_SecurityConfigurationJobBookmarksEncryption,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CloudWatchEncryption=None,
+            JobBookmarksEncryption=None,
+            S3Encryptions=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudWatchEncryption",
+                _convert_SecurityConfigurationCloudWatchEncryption(
+                    CloudWatchEncryption
+                ),
+            )
+            _setattr(
+                "JobBookmarksEncryption",
+                _convert_SecurityConfigurationJobBookmarksEncryption(
+                    JobBookmarksEncryption
+                ),
+            )
+            _setattr("S3Encryptions", S3Encryptions)
+            _init_PropertyType(self, kwargs)
+
+    class SecurityConfigurationS3Encryption(_PropertyType):
+        """The S3 Encryption property type for SecurityConfiguration in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3Encryption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-securityconfiguration-s3encryption.html>`_
+        """
+
+        __slots__ = ("KmsKeyArn", "S3EncryptionMode")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityConfigurationS3Encryption", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, KmsKeyArn=None, S3EncryptionMode=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("KmsKeyArn", KmsKeyArn)
+            _setattr("S3EncryptionMode", S3EncryptionMode)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SecurityConfigurationEncryptionConfiguration = create_object_converter(
+        SecurityConfigurationEncryptionConfiguration
+    )
 
-@attrs(**ATTRSCONFIG)
-class Table(Resource):
-    """A Table for Glue.
+    class SecurityConfigurationProperties(_ResourceProperties):
+        __slots__ = ("EncryptionConfiguration", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityConfigurationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "EncryptionConfiguration": _convert_SecurityConfigurationEncryptionConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, EncryptionConfiguration=None, Name=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "EncryptionConfiguration",
+                _convert_SecurityConfigurationEncryptionConfiguration(
+                    EncryptionConfiguration
+                ),
+            )
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SecurityConfigurationProperties = create_object_converter(
+        SecurityConfigurationProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for Table
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-table.html>`_
-    """
+    class SecurityConfiguration(_Resource):
+        """A Security Configuration for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecurityConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-securityconfiguration.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::SecurityConfiguration"
+
+        Properties: SecurityConfigurationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecurityConfiguration",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SecurityConfigurationProperties},
+            factories={"Properties": SecurityConfigurationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SecurityConfigurationProperties()
+            _setattr("Properties", _convert_SecurityConfigurationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        SecurityConfiguration,
+        SecurityConfigurationProperties,
+        SecurityConfigurationCloudWatchEncryption,
+        SecurityConfigurationJobBookmarksEncryption,
+        SecurityConfigurationEncryptionConfiguration,
+        SecurityConfigurationS3Encryption,
+    )
 
-    RESOURCE_TYPE = "AWS::Glue::Table"
 
-    Properties: TableProperties = attrib(
-        factory=TableProperties, converter=create_object_converter(TableProperties)
+def _create_Table():
+    class TableColumn(_PropertyType):
+        """The Column property type for Table in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Column
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-table-column.html>`_
+        """
+
+        __slots__ = ("Comment", "Name", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableColumn", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Comment=None, Name=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Comment", Comment)
+            _setattr("Name", Name)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class TableOrder(_PropertyType):
+        """The Order property type for Table in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Order
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-table-order.html>`_
+        """
+
+        __slots__ = ("Column", "SortOrder")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableOrder", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Column=None, SortOrder=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Column", Column)
+            _setattr("SortOrder", SortOrder)
+            _init_PropertyType(self, kwargs)
+
+    class TableSerdeInfo(_PropertyType):
+        """The Serde Info property type for Table in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for SerdeInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-table-serdeinfo.html>`_
+        """
+
+        __slots__ = ("Name", "Parameters", "SerializationLibrary")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableSerdeInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Name=None, Parameters=None, SerializationLibrary=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Parameters", Parameters)
+            _setattr("SerializationLibrary", SerializationLibrary)
+            _init_PropertyType(self, kwargs)
+
+    class TableSkewedInfo(_PropertyType):
+        """The Skewed Info property type for Table in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for SkewedInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-table-skewedinfo.html>`_
+        """
+
+        __slots__ = (
+            "SkewedColumnNames",
+            "SkewedColumnValueLocationMaps",
+            "SkewedColumnValues",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableSkewedInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            SkewedColumnNames=None,
+            SkewedColumnValueLocationMaps=None,
+            SkewedColumnValues=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SkewedColumnNames", SkewedColumnNames)
+            _setattr("SkewedColumnValueLocationMaps", SkewedColumnValueLocationMaps)
+            _setattr("SkewedColumnValues", SkewedColumnValues)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TableColumn_list = create_object_list_converter(TableColumn)
+    _convert_TableSerdeInfo = create_object_converter(TableSerdeInfo)
+    _convert_TableSkewedInfo = create_object_converter(TableSkewedInfo)
+    _convert_TableOrder_list = create_object_list_converter(TableOrder)
+
+    class TableStorageDescriptor(_PropertyType):
+        """The Storage Descriptor property type for Table in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for StorageDescriptor
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-table-storagedescriptor.html>`_
+        """
+
+        __slots__ = (
+            "BucketColumns",
+            "Columns",
+            "Compressed",
+            "InputFormat",
+            "Location",
+            "NumberOfBuckets",
+            "OutputFormat",
+            "Parameters",
+            "SerdeInfo",
+            "SkewedInfo",
+            "SortColumns",
+            "StoredAsSubDirectories",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableStorageDescriptor",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Columns": _convert_TableColumn_list,
+                "SerdeInfo": _convert_TableSerdeInfo,
+                "SkewedInfo": _convert_TableSkewedInfo,
+                "SortColumns": _convert_TableOrder_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BucketColumns=None,
+            Columns=None,
+            Compressed=None,
+            InputFormat=None,
+            Location=None,
+            NumberOfBuckets=None,
+            OutputFormat=None,
+            Parameters=None,
+            SerdeInfo=None,
+            SkewedInfo=None,
+            SortColumns=None,
+            StoredAsSubDirectories=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketColumns", BucketColumns)
+            _setattr("Columns", _convert_TableColumn_list(Columns))
+            _setattr("Compressed", Compressed)
+            _setattr("InputFormat", InputFormat)
+            _setattr("Location", Location)
+            _setattr("NumberOfBuckets", NumberOfBuckets)
+            _setattr("OutputFormat", OutputFormat)
+            _setattr("Parameters", Parameters)
+            _setattr("SerdeInfo", _convert_TableSerdeInfo(SerdeInfo))
+            _setattr("SkewedInfo", _convert_TableSkewedInfo(SkewedInfo))
+            _setattr("SortColumns", _convert_TableOrder_list(SortColumns))
+            _setattr("StoredAsSubDirectories", StoredAsSubDirectories)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TableStorageDescriptor = create_object_converter(TableStorageDescriptor)
+
+    class TableTableInput(_PropertyType):
+        """The Table Input property type for Table in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for TableInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-table-tableinput.html>`_
+        """
+
+        __slots__ = (
+            "Description",
+            "Name",
+            "Owner",
+            "Parameters",
+            "PartitionKeys",
+            "Retention",
+            "StorageDescriptor",
+            "TableType",
+            "ViewExpandedText",
+            "ViewOriginalText",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableTableInput",
+            _PropertyType,
+            __slots__,
+            converters={
+                "PartitionKeys": _convert_TableColumn_list,
+                "StorageDescriptor": _convert_TableStorageDescriptor,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Name=None,
+            Owner=None,
+            Parameters=None,
+            PartitionKeys=None,
+            Retention=None,
+            StorageDescriptor=None,
+            TableType=None,
+            ViewExpandedText=None,
+            ViewOriginalText=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Owner", Owner)
+            _setattr("Parameters", Parameters)
+            _setattr("PartitionKeys", _convert_TableColumn_list(PartitionKeys))
+            _setattr("Retention", Retention)
+            _setattr(
+                "StorageDescriptor", _convert_TableStorageDescriptor(StorageDescriptor)
+            )
+            _setattr("TableType", TableType)
+            _setattr("ViewExpandedText", ViewExpandedText)
+            _setattr("ViewOriginalText", ViewOriginalText)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TableTableInput = create_object_converter(TableTableInput)
+
+    class TableProperties(_ResourceProperties):
+        __slots__ = ("CatalogId", "DatabaseName", "TableInput")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TableProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"TableInput": _convert_TableTableInput},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CatalogId=None, DatabaseName=None, TableInput=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CatalogId", CatalogId)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("TableInput", _convert_TableTableInput(TableInput))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TableProperties = create_object_converter(TableProperties)
+
+    class Table(_Resource):
+        """A Table for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Table
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-table.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::Table"
+
+        Properties: TableProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Table",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TableProperties},
+            factories={"Properties": TableProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TableProperties()
+            _setattr("Properties", _convert_TableProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Table,
+        TableProperties,
+        TableColumn,
+        TableOrder,
+        TableSerdeInfo,
+        TableSkewedInfo,
+        TableStorageDescriptor,
+        TableTableInput,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class TriggerProperties(ResourceProperties):
-    Actions = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    Predicate = attrib(default=None)
-    Schedule = attrib(default=None)
-    StartOnCreation = attrib(default=None)
-    Tags = attrib(default=None)
-    Type = attrib(default=None)
-    WorkflowName = attrib(default=None)
-
+def _create_Trigger():
+    class TriggerNotificationProperty(_PropertyType):
+        """The Notification Property property type for Trigger in Glue.
 
-@attrs(**ATTRSCONFIG)
-class Trigger(Resource):
-    """A Trigger for Glue.
+        See Also:
+            `AWS Cloud Formation documentation for NotificationProperty
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-trigger-notificationproperty.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Trigger
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-trigger.html>`_
-    """
+        __slots__ = ("NotifyDelayAfter",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TriggerNotificationProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Glue::Trigger"
+        def __init__(self, *, NotifyDelayAfter=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NotifyDelayAfter", NotifyDelayAfter)
+            _init_PropertyType(self, kwargs)
 
-    Properties: TriggerProperties = attrib(
-        factory=TriggerProperties, converter=create_object_converter(TriggerProperties)
+    _convert_TriggerNotificationProperty = create_object_converter(
+        TriggerNotificationProperty
     )
 
+    class TriggerAction(_PropertyType):
+        """The Action property type for Trigger in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-trigger-action.html>`_
+        """
+
+        __slots__ = (
+            "Arguments",
+            "CrawlerName",
+            "JobName",
+            "NotificationProperty",
+            "SecurityConfiguration",
+            "Timeout",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TriggerAction",
+            _PropertyType,
+            __slots__,
+            converters={"NotificationProperty": _convert_TriggerNotificationProperty},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Arguments=None,
+            CrawlerName=None,
+            JobName=None,
+            NotificationProperty=None,
+            SecurityConfiguration=None,
+            Timeout=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arguments", Arguments)
+            _setattr("CrawlerName", CrawlerName)
+            _setattr("JobName", JobName)
+            _setattr(
+                "NotificationProperty",
+                _convert_TriggerNotificationProperty(NotificationProperty),
+            )
+            _setattr("SecurityConfiguration", SecurityConfiguration)
+            _setattr("Timeout", Timeout)
+            _init_PropertyType(self, kwargs)
+
+    class TriggerCondition(_PropertyType):
+        """The Condition property type for Trigger in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Condition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-trigger-condition.html>`_
+        """
+
+        __slots__ = ("CrawlerName", "CrawlState", "JobName", "LogicalOperator", "State")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TriggerCondition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CrawlerName=None,
+            CrawlState=None,
+            JobName=None,
+            LogicalOperator=None,
+            State=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CrawlerName", CrawlerName)
+            _setattr("CrawlState", CrawlState)
+            _setattr("JobName", JobName)
+            _setattr("LogicalOperator", LogicalOperator)
+            _setattr("State", State)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TriggerCondition_list = create_object_list_converter(TriggerCondition)
+
+    class TriggerPredicate(_PropertyType):
+        """The Predicate property type for Trigger in Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Predicate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-glue-trigger-predicate.html>`_
+        """
+
+        __slots__ = ("Conditions", "Logical")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TriggerPredicate",
+            _PropertyType,
+            __slots__,
+            converters={"Conditions": _convert_TriggerCondition_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Conditions=None, Logical=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Conditions", _convert_TriggerCondition_list(Conditions))
+            _setattr("Logical", Logical)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TriggerAction_list = create_object_list_converter(TriggerAction)
+    _convert_TriggerPredicate = create_object_converter(TriggerPredicate)
+
+    class TriggerProperties(_ResourceProperties):
+        __slots__ = (
+            "Actions",
+            "Description",
+            "Name",
+            "Predicate",
+            "Schedule",
+            "StartOnCreation",
+            "Tags",
+            "Type",
+            "WorkflowName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TriggerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Actions": _convert_TriggerAction_list,
+                "Predicate": _convert_TriggerPredicate,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Actions=None,
+            Description=None,
+            Name=None,
+            Predicate=None,
+            Schedule=None,
+            StartOnCreation=None,
+            Tags=None,
+            Type=None,
+            WorkflowName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Actions", _convert_TriggerAction_list(Actions))
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Predicate", _convert_TriggerPredicate(Predicate))
+            _setattr("Schedule", Schedule)
+            _setattr("StartOnCreation", StartOnCreation)
+            _setattr("Tags", Tags)
+            _setattr("Type", Type)
+            _setattr("WorkflowName", WorkflowName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TriggerProperties = create_object_converter(TriggerProperties)
+
+    class Trigger(_Resource):
+        """A Trigger for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Trigger
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-trigger.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::Trigger"
+        TAG_FORMAT = "Map"
+
+        Properties: TriggerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Trigger",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TriggerProperties},
+            factories={"Properties": TriggerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TriggerProperties()
+            _setattr("Properties", _convert_TriggerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Trigger,
+        TriggerProperties,
+        TriggerNotificationProperty,
+        TriggerAction,
+        TriggerCondition,
+        TriggerPredicate,
+    )
 
-@attrs(**ATTRSCONFIG)
-class WorkflowProperties(ResourceProperties):
-    DefaultRunProperties = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Workflow(Resource):
-    """A Workflow for Glue.
-
-    See Also:
-        `AWS Cloud Formation documentation for Workflow
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-workflow.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Glue::Workflow"
 
-    Properties: WorkflowProperties = attrib(
-        factory=WorkflowProperties,
-        converter=create_object_converter(WorkflowProperties),
-    )
+def _create_Workflow():
+    class WorkflowProperties(_ResourceProperties):
+        __slots__ = ("DefaultRunProperties", "Description", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WorkflowProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultRunProperties=None,
+            Description=None,
+            Name=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultRunProperties", DefaultRunProperties)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_WorkflowProperties = create_object_converter(WorkflowProperties)
+
+    class Workflow(_Resource):
+        """A Workflow for Glue.
+
+        See Also:
+            `AWS Cloud Formation documentation for Workflow
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-glue-workflow.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Glue::Workflow"
+        TAG_FORMAT = "Map"
+
+        Properties: WorkflowProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Workflow",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_WorkflowProperties},
+            factories={"Properties": WorkflowProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = WorkflowProperties()
+            _setattr("Properties", _convert_WorkflowProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Workflow, WorkflowProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Classifier": _create_Classifier,
+        "ClassifierProperties": _create_Classifier,
+        "ClassifierCsvClassifier": _create_Classifier,
+        "ClassifierGrokClassifier": _create_Classifier,
+        "ClassifierJsonClassifier": _create_Classifier,
+        "ClassifierXMLClassifier": _create_Classifier,
+        "Connection": _create_Connection,
+        "ConnectionProperties": _create_Connection,
+        "ConnectionConnectionInput": _create_Connection,
+        "ConnectionPhysicalConnectionRequirements": _create_Connection,
+        "Crawler": _create_Crawler,
+        "CrawlerProperties": _create_Crawler,
+        "CrawlerCatalogTarget": _create_Crawler,
+        "CrawlerDynamoDBTarget": _create_Crawler,
+        "CrawlerJdbcTarget": _create_Crawler,
+        "CrawlerS3Target": _create_Crawler,
+        "CrawlerSchedule": _create_Crawler,
+        "CrawlerSchemaChangePolicy": _create_Crawler,
+        "CrawlerTargets": _create_Crawler,
+        "DataCatalogEncryptionSettings": _create_DataCatalogEncryptionSettings,
+        "DataCatalogEncryptionSettingsProperties": _create_DataCatalogEncryptionSettings,
+        "DataCatalogEncryptionSettingsConnectionPasswordEncryption": _create_DataCatalogEncryptionSettings,
+        "DataCatalogEncryptionSettingsDataCatalogEncryptionSettings": _create_DataCatalogEncryptionSettings,
+        "DataCatalogEncryptionSettingsEncryptionAtRest": _create_DataCatalogEncryptionSettings,
+        "Database": _create_Database,
+        "DatabaseProperties": _create_Database,
+        "DatabaseDatabaseInput": _create_Database,
+        "DevEndpoint": _create_DevEndpoint,
+        "DevEndpointProperties": _create_DevEndpoint,
+        "Job": _create_Job,
+        "JobProperties": _create_Job,
+        "JobConnectionsList": _create_Job,
+        "JobExecutionProperty": _create_Job,
+        "JobJobCommand": _create_Job,
+        "JobNotificationProperty": _create_Job,
+        "MLTransform": _create_MLTransform,
+        "MLTransformProperties": _create_MLTransform,
+        "MLTransformFindMatchesParameters": _create_MLTransform,
+        "MLTransformGlueTables": _create_MLTransform,
+        "MLTransformInputRecordTables": _create_MLTransform,
+        "MLTransformTransformParameters": _create_MLTransform,
+        "Partition": _create_Partition,
+        "PartitionProperties": _create_Partition,
+        "PartitionColumn": _create_Partition,
+        "PartitionOrder": _create_Partition,
+        "PartitionPartitionInput": _create_Partition,
+        "PartitionSerdeInfo": _create_Partition,
+        "PartitionSkewedInfo": _create_Partition,
+        "PartitionStorageDescriptor": _create_Partition,
+        "SecurityConfiguration": _create_SecurityConfiguration,
+        "SecurityConfigurationProperties": _create_SecurityConfiguration,
+        "SecurityConfigurationCloudWatchEncryption": _create_SecurityConfiguration,
+        "SecurityConfigurationEncryptionConfiguration": _create_SecurityConfiguration,
+        "SecurityConfigurationJobBookmarksEncryption": _create_SecurityConfiguration,
+        "SecurityConfigurationS3Encryption": _create_SecurityConfiguration,
+        "Table": _create_Table,
+        "TableProperties": _create_Table,
+        "TableColumn": _create_Table,
+        "TableOrder": _create_Table,
+        "TableSerdeInfo": _create_Table,
+        "TableSkewedInfo": _create_Table,
+        "TableStorageDescriptor": _create_Table,
+        "TableTableInput": _create_Table,
+        "Trigger": _create_Trigger,
+        "TriggerProperties": _create_Trigger,
+        "TriggerAction": _create_Trigger,
+        "TriggerCondition": _create_Trigger,
+        "TriggerNotificationProperty": _create_Trigger,
+        "TriggerPredicate": _create_Trigger,
+        "Workflow": _create_Workflow,
+        "WorkflowProperties": _create_Workflow,
+    },
+)
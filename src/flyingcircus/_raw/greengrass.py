@@ -7,428 +7,3067 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "ConnectorDefinition",
     "ConnectorDefinitionProperties",
+    "ConnectorDefinitionConnector",
+    "ConnectorDefinitionConnectorDefinitionVersion",
     "ConnectorDefinitionVersion",
     "ConnectorDefinitionVersionProperties",
+    "ConnectorDefinitionVersionConnector",
     "CoreDefinition",
     "CoreDefinitionProperties",
+    "CoreDefinitionCore",
+    "CoreDefinitionCoreDefinitionVersion",
     "CoreDefinitionVersion",
     "CoreDefinitionVersionProperties",
+    "CoreDefinitionVersionCore",
     "DeviceDefinition",
     "DeviceDefinitionProperties",
+    "DeviceDefinitionDevice",
+    "DeviceDefinitionDeviceDefinitionVersion",
     "DeviceDefinitionVersion",
     "DeviceDefinitionVersionProperties",
+    "DeviceDefinitionVersionDevice",
     "FunctionDefinition",
     "FunctionDefinitionProperties",
+    "FunctionDefinitionDefaultConfig",
+    "FunctionDefinitionEnvironment",
+    "FunctionDefinitionExecution",
+    "FunctionDefinitionFunction",
+    "FunctionDefinitionFunctionConfiguration",
+    "FunctionDefinitionFunctionDefinitionVersion",
+    "FunctionDefinitionResourceAccessPolicy",
+    "FunctionDefinitionRunAs",
     "FunctionDefinitionVersion",
     "FunctionDefinitionVersionProperties",
+    "FunctionDefinitionVersionDefaultConfig",
+    "FunctionDefinitionVersionEnvironment",
+    "FunctionDefinitionVersionExecution",
+    "FunctionDefinitionVersionFunction",
+    "FunctionDefinitionVersionFunctionConfiguration",
+    "FunctionDefinitionVersionResourceAccessPolicy",
+    "FunctionDefinitionVersionRunAs",
     "Group",
     "GroupProperties",
+    "GroupGroupVersion",
     "GroupVersion",
     "GroupVersionProperties",
     "LoggerDefinition",
     "LoggerDefinitionProperties",
+    "LoggerDefinitionLogger",
+    "LoggerDefinitionLoggerDefinitionVersion",
     "LoggerDefinitionVersion",
     "LoggerDefinitionVersionProperties",
+    "LoggerDefinitionVersionLogger",
     "ResourceDefinition",
     "ResourceDefinitionProperties",
+    "ResourceDefinitionGroupOwnerSetting",
+    "ResourceDefinitionLocalDeviceResourceData",
+    "ResourceDefinitionLocalVolumeResourceData",
+    "ResourceDefinitionResourceDataContainer",
+    "ResourceDefinitionResourceDefinitionVersion",
+    "ResourceDefinitionResourceInstance",
+    "ResourceDefinitionS3MachineLearningModelResourceData",
+    "ResourceDefinitionSageMakerMachineLearningModelResourceData",
+    "ResourceDefinitionSecretsManagerSecretResourceData",
     "ResourceDefinitionVersion",
     "ResourceDefinitionVersionProperties",
+    "ResourceDefinitionVersionGroupOwnerSetting",
+    "ResourceDefinitionVersionLocalDeviceResourceData",
+    "ResourceDefinitionVersionLocalVolumeResourceData",
+    "ResourceDefinitionVersionResourceDataContainer",
+    "ResourceDefinitionVersionResourceInstance",
+    "ResourceDefinitionVersionS3MachineLearningModelResourceData",
+    "ResourceDefinitionVersionSageMakerMachineLearningModelResourceData",
+    "ResourceDefinitionVersionSecretsManagerSecretResourceData",
     "SubscriptionDefinition",
     "SubscriptionDefinitionProperties",
+    "SubscriptionDefinitionSubscription",
+    "SubscriptionDefinitionSubscriptionDefinitionVersion",
     "SubscriptionDefinitionVersion",
     "SubscriptionDefinitionVersionProperties",
+    "SubscriptionDefinitionVersionSubscription",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ConnectorDefinitionProperties(ResourceProperties):
-    InitialVersion = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ConnectorDefinition(Resource):
-    """A Connector Definition for Greengrass.
-
-    See Also:
-        `AWS Cloud Formation documentation for ConnectorDefinition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-connectordefinition.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Greengrass::ConnectorDefinition"
-
-    Properties: ConnectorDefinitionProperties = attrib(
-        factory=ConnectorDefinitionProperties,
-        converter=create_object_converter(ConnectorDefinitionProperties),
+def _create_ConnectorDefinition():
+    class ConnectorDefinitionConnector(_PropertyType):
+        """The Connector property type for ConnectorDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Connector
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-connectordefinition-connector.html>`_
+        """
+
+        __slots__ = ("ConnectorArn", "Id", "Parameters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectorDefinitionConnector", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ConnectorArn=None, Id=None, Parameters=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConnectorArn", ConnectorArn)
+            _setattr("Id", Id)
+            _setattr("Parameters", Parameters)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConnectorDefinitionConnector_list = create_object_list_converter(
+        ConnectorDefinitionConnector
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ConnectorDefinitionVersionProperties(ResourceProperties):
-    ConnectorDefinitionId = attrib(default=None)
-    Connectors = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ConnectorDefinitionVersion(Resource):
-    """A Connector Definition Version for Greengrass.
-
-    See Also:
-        `AWS Cloud Formation documentation for ConnectorDefinitionVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-connectordefinitionversion.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Greengrass::ConnectorDefinitionVersion"
-
-    Properties: ConnectorDefinitionVersionProperties = attrib(
-        factory=ConnectorDefinitionVersionProperties,
-        converter=create_object_converter(ConnectorDefinitionVersionProperties),
+    class ConnectorDefinitionConnectorDefinitionVersion(_PropertyType):
+        """The Connector Definition Version property type for ConnectorDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConnectorDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-connectordefinition-connectordefinitionversion.html>`_
+        """
+
+        __slots__ = ("Connectors",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectorDefinitionConnectorDefinitionVersion",
+            _PropertyType,
+            __slots__,
+            converters={"Connectors": _convert_ConnectorDefinitionConnector_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Connectors=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Connectors", _convert_ConnectorDefinitionConnector_list(Connectors)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConnectorDefinitionConnectorDefinitionVersion = create_object_converter(
+        ConnectorDefinitionConnectorDefinitionVersion
     )
 
-
-@attrs(**ATTRSCONFIG)
-class CoreDefinitionProperties(ResourceProperties):
-    InitialVersion = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class CoreDefinition(Resource):
-    """A Core Definition for Greengrass.
-
-    See Also:
-        `AWS Cloud Formation documentation for CoreDefinition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-coredefinition.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Greengrass::CoreDefinition"
-
-    Properties: CoreDefinitionProperties = attrib(
-        factory=CoreDefinitionProperties,
-        converter=create_object_converter(CoreDefinitionProperties),
+    class ConnectorDefinitionProperties(_ResourceProperties):
+        __slots__ = ("InitialVersion", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectorDefinitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "InitialVersion": _convert_ConnectorDefinitionConnectorDefinitionVersion
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InitialVersion=None, Name=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InitialVersion",
+                _convert_ConnectorDefinitionConnectorDefinitionVersion(InitialVersion),
+            )
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConnectorDefinitionProperties = create_object_converter(
+        ConnectorDefinitionProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class CoreDefinitionVersionProperties(ResourceProperties):
-    CoreDefinitionId = attrib(default=None)
-    Cores = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class CoreDefinitionVersion(Resource):
-    """A Core Definition Version for Greengrass.
-
-    See Also:
-        `AWS Cloud Formation documentation for CoreDefinitionVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-coredefinitionversion.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Greengrass::CoreDefinitionVersion"
-
-    Properties: CoreDefinitionVersionProperties = attrib(
-        factory=CoreDefinitionVersionProperties,
-        converter=create_object_converter(CoreDefinitionVersionProperties),
+    class ConnectorDefinition(_Resource):
+        """A Connector Definition for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConnectorDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-connectordefinition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::ConnectorDefinition"
+        TAG_FORMAT = "Map"
+
+        Properties: ConnectorDefinitionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectorDefinition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConnectorDefinitionProperties},
+            factories={"Properties": ConnectorDefinitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConnectorDefinitionProperties()
+            _setattr("Properties", _convert_ConnectorDefinitionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ConnectorDefinition,
+        ConnectorDefinitionProperties,
+        ConnectorDefinitionConnector,
+        ConnectorDefinitionConnectorDefinitionVersion,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class DeviceDefinitionProperties(ResourceProperties):
-    InitialVersion = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DeviceDefinition(Resource):
-    """A Device Definition for Greengrass.
-
-    See Also:
-        `AWS Cloud Formation documentation for DeviceDefinition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-devicedefinition.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Greengrass::DeviceDefinition"
+def _create_ConnectorDefinitionVersion():
+    class ConnectorDefinitionVersionConnector(_PropertyType):
+        """The Connector property type for ConnectorDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Connector
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-connectordefinitionversion-connector.html>`_
+        """
+
+        __slots__ = ("ConnectorArn", "Id", "Parameters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectorDefinitionVersionConnector", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ConnectorArn=None, Id=None, Parameters=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConnectorArn", ConnectorArn)
+            _setattr("Id", Id)
+            _setattr("Parameters", Parameters)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConnectorDefinitionVersionConnector_list = create_object_list_converter(
+        ConnectorDefinitionVersionConnector
+    )
 
-    Properties: DeviceDefinitionProperties = attrib(
-        factory=DeviceDefinitionProperties,
-        converter=create_object_converter(DeviceDefinitionProperties),
+    class ConnectorDefinitionVersionProperties(_ResourceProperties):
+        __slots__ = ("ConnectorDefinitionId", "Connectors")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectorDefinitionVersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Connectors": _convert_ConnectorDefinitionVersionConnector_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ConnectorDefinitionId=None, Connectors=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConnectorDefinitionId", ConnectorDefinitionId)
+            _setattr(
+                "Connectors",
+                _convert_ConnectorDefinitionVersionConnector_list(Connectors),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConnectorDefinitionVersionProperties = create_object_converter(
+        ConnectorDefinitionVersionProperties
     )
 
+    class ConnectorDefinitionVersion(_Resource):
+        """A Connector Definition Version for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConnectorDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-connectordefinitionversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::ConnectorDefinitionVersion"
+
+        Properties: ConnectorDefinitionVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConnectorDefinitionVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConnectorDefinitionVersionProperties},
+            factories={"Properties": ConnectorDefinitionVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConnectorDefinitionVersionProperties()
+            _setattr(
+                "Properties", _convert_ConnectorDefinitionVersionProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        ConnectorDefinitionVersion,
+        ConnectorDefinitionVersionProperties,
+        ConnectorDefinitionVersionConnector,
+    )
 
-@attrs(**ATTRSCONFIG)
-class DeviceDefinitionVersionProperties(ResourceProperties):
-    DeviceDefinitionId = attrib(default=None)
-    Devices = attrib(default=None)
 
+def _create_CoreDefinition():
+    class CoreDefinitionCore(_PropertyType):
+        """The Core property type for CoreDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Core
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-coredefinition-core.html>`_
+        """
+
+        __slots__ = ("CertificateArn", "Id", "SyncShadow", "ThingArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CoreDefinitionCore", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CertificateArn=None,
+            Id=None,
+            SyncShadow=None,
+            ThingArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _setattr("Id", Id)
+            _setattr("SyncShadow", SyncShadow)
+            _setattr("ThingArn", ThingArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CoreDefinitionCore_list = create_object_list_converter(CoreDefinitionCore)
+
+    class CoreDefinitionCoreDefinitionVersion(_PropertyType):
+        """The Core Definition Version property type for CoreDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for CoreDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-coredefinition-coredefinitionversion.html>`_
+        """
+
+        __slots__ = ("Cores",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CoreDefinitionCoreDefinitionVersion",
+            _PropertyType,
+            __slots__,
+            converters={"Cores": _convert_CoreDefinitionCore_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Cores=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Cores", _convert_CoreDefinitionCore_list(Cores))
+            _init_PropertyType(self, kwargs)
+
+    _convert_CoreDefinitionCoreDefinitionVersion = create_object_converter(
+        CoreDefinitionCoreDefinitionVersion
+    )
 
-@attrs(**ATTRSCONFIG)
-class DeviceDefinitionVersion(Resource):
-    """A Device Definition Version for Greengrass.
+    class CoreDefinitionProperties(_ResourceProperties):
+        __slots__ = ("InitialVersion", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CoreDefinitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"InitialVersion": _convert_CoreDefinitionCoreDefinitionVersion},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InitialVersion=None, Name=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InitialVersion",
+                _convert_CoreDefinitionCoreDefinitionVersion(InitialVersion),
+            )
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CoreDefinitionProperties = create_object_converter(
+        CoreDefinitionProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for DeviceDefinitionVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-devicedefinitionversion.html>`_
-    """
+    class CoreDefinition(_Resource):
+        """A Core Definition for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for CoreDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-coredefinition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::CoreDefinition"
+        TAG_FORMAT = "Map"
+
+        Properties: CoreDefinitionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CoreDefinition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CoreDefinitionProperties},
+            factories={"Properties": CoreDefinitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CoreDefinitionProperties()
+            _setattr("Properties", _convert_CoreDefinitionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        CoreDefinition,
+        CoreDefinitionProperties,
+        CoreDefinitionCore,
+        CoreDefinitionCoreDefinitionVersion,
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::DeviceDefinitionVersion"
 
-    Properties: DeviceDefinitionVersionProperties = attrib(
-        factory=DeviceDefinitionVersionProperties,
-        converter=create_object_converter(DeviceDefinitionVersionProperties),
+def _create_CoreDefinitionVersion():
+    class CoreDefinitionVersionCore(_PropertyType):
+        """The Core property type for CoreDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Core
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-coredefinitionversion-core.html>`_
+        """
+
+        __slots__ = ("CertificateArn", "Id", "SyncShadow", "ThingArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CoreDefinitionVersionCore", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CertificateArn=None,
+            Id=None,
+            SyncShadow=None,
+            ThingArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _setattr("Id", Id)
+            _setattr("SyncShadow", SyncShadow)
+            _setattr("ThingArn", ThingArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CoreDefinitionVersionCore_list = create_object_list_converter(
+        CoreDefinitionVersionCore
     )
 
+    class CoreDefinitionVersionProperties(_ResourceProperties):
+        __slots__ = ("CoreDefinitionId", "Cores")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CoreDefinitionVersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Cores": _convert_CoreDefinitionVersionCore_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CoreDefinitionId=None, Cores=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CoreDefinitionId", CoreDefinitionId)
+            _setattr("Cores", _convert_CoreDefinitionVersionCore_list(Cores))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CoreDefinitionVersionProperties = create_object_converter(
+        CoreDefinitionVersionProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class FunctionDefinitionProperties(ResourceProperties):
-    InitialVersion = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-
+    class CoreDefinitionVersion(_Resource):
+        """A Core Definition Version for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for CoreDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-coredefinitionversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::CoreDefinitionVersion"
+
+        Properties: CoreDefinitionVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CoreDefinitionVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CoreDefinitionVersionProperties},
+            factories={"Properties": CoreDefinitionVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CoreDefinitionVersionProperties()
+            _setattr("Properties", _convert_CoreDefinitionVersionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        CoreDefinitionVersion,
+        CoreDefinitionVersionProperties,
+        CoreDefinitionVersionCore,
+    )
 
-@attrs(**ATTRSCONFIG)
-class FunctionDefinition(Resource):
-    """A Function Definition for Greengrass.
 
-    See Also:
-        `AWS Cloud Formation documentation for FunctionDefinition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-functiondefinition.html>`_
-    """
+def _create_DeviceDefinition():
+    class DeviceDefinitionDevice(_PropertyType):
+        """The Device property type for DeviceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Device
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-devicedefinition-device.html>`_
+        """
+
+        __slots__ = ("CertificateArn", "Id", "SyncShadow", "ThingArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeviceDefinitionDevice", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CertificateArn=None,
+            Id=None,
+            SyncShadow=None,
+            ThingArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _setattr("Id", Id)
+            _setattr("SyncShadow", SyncShadow)
+            _setattr("ThingArn", ThingArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeviceDefinitionDevice_list = create_object_list_converter(
+        DeviceDefinitionDevice
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::FunctionDefinition"
+    class DeviceDefinitionDeviceDefinitionVersion(_PropertyType):
+        """The Device Definition Version property type for DeviceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeviceDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-devicedefinition-devicedefinitionversion.html>`_
+        """
+
+        __slots__ = ("Devices",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeviceDefinitionDeviceDefinitionVersion",
+            _PropertyType,
+            __slots__,
+            converters={"Devices": _convert_DeviceDefinitionDevice_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Devices=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Devices", _convert_DeviceDefinitionDevice_list(Devices))
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeviceDefinitionDeviceDefinitionVersion = create_object_converter(
+        DeviceDefinitionDeviceDefinitionVersion
+    )
 
-    Properties: FunctionDefinitionProperties = attrib(
-        factory=FunctionDefinitionProperties,
-        converter=create_object_converter(FunctionDefinitionProperties),
+    class DeviceDefinitionProperties(_ResourceProperties):
+        __slots__ = ("InitialVersion", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeviceDefinitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "InitialVersion": _convert_DeviceDefinitionDeviceDefinitionVersion
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InitialVersion=None, Name=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InitialVersion",
+                _convert_DeviceDefinitionDeviceDefinitionVersion(InitialVersion),
+            )
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DeviceDefinitionProperties = create_object_converter(
+        DeviceDefinitionProperties
     )
 
+    class DeviceDefinition(_Resource):
+        """A Device Definition for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeviceDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-devicedefinition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::DeviceDefinition"
+        TAG_FORMAT = "Map"
+
+        Properties: DeviceDefinitionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeviceDefinition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DeviceDefinitionProperties},
+            factories={"Properties": DeviceDefinitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DeviceDefinitionProperties()
+            _setattr("Properties", _convert_DeviceDefinitionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        DeviceDefinition,
+        DeviceDefinitionProperties,
+        DeviceDefinitionDevice,
+        DeviceDefinitionDeviceDefinitionVersion,
+    )
 
-@attrs(**ATTRSCONFIG)
-class FunctionDefinitionVersionProperties(ResourceProperties):
-    DefaultConfig = attrib(default=None)
-    FunctionDefinitionId = attrib(default=None)
-    Functions = attrib(default=None)
 
+def _create_DeviceDefinitionVersion():
+    class DeviceDefinitionVersionDevice(_PropertyType):
+        """The Device property type for DeviceDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Device
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-devicedefinitionversion-device.html>`_
+        """
+
+        __slots__ = ("CertificateArn", "Id", "SyncShadow", "ThingArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeviceDefinitionVersionDevice", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CertificateArn=None,
+            Id=None,
+            SyncShadow=None,
+            ThingArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateArn", CertificateArn)
+            _setattr("Id", Id)
+            _setattr("SyncShadow", SyncShadow)
+            _setattr("ThingArn", ThingArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeviceDefinitionVersionDevice_list = create_object_list_converter(
+        DeviceDefinitionVersionDevice
+    )
 
-@attrs(**ATTRSCONFIG)
-class FunctionDefinitionVersion(Resource):
-    """A Function Definition Version for Greengrass.
+    class DeviceDefinitionVersionProperties(_ResourceProperties):
+        __slots__ = ("DeviceDefinitionId", "Devices")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeviceDefinitionVersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Devices": _convert_DeviceDefinitionVersionDevice_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DeviceDefinitionId=None, Devices=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeviceDefinitionId", DeviceDefinitionId)
+            _setattr("Devices", _convert_DeviceDefinitionVersionDevice_list(Devices))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DeviceDefinitionVersionProperties = create_object_converter(
+        DeviceDefinitionVersionProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for FunctionDefinitionVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-functiondefinitionversion.html>`_
-    """
+    class DeviceDefinitionVersion(_Resource):
+        """A Device Definition Version for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeviceDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-devicedefinitionversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::DeviceDefinitionVersion"
+
+        Properties: DeviceDefinitionVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeviceDefinitionVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DeviceDefinitionVersionProperties},
+            factories={"Properties": DeviceDefinitionVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DeviceDefinitionVersionProperties()
+            _setattr(
+                "Properties", _convert_DeviceDefinitionVersionProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        DeviceDefinitionVersion,
+        DeviceDefinitionVersionProperties,
+        DeviceDefinitionVersionDevice,
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::FunctionDefinitionVersion"
 
-    Properties: FunctionDefinitionVersionProperties = attrib(
-        factory=FunctionDefinitionVersionProperties,
-        converter=create_object_converter(FunctionDefinitionVersionProperties),
+def _create_FunctionDefinition():
+    class FunctionDefinitionRunAs(_PropertyType):
+        """The Run As property type for FunctionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for RunAs
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinition-runas.html>`_
+        """
+
+        __slots__ = ("Gid", "Uid")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionRunAs", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Gid=None, Uid=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Gid", Gid)
+            _setattr("Uid", Uid)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionRunAs = create_object_converter(FunctionDefinitionRunAs)
+
+    class FunctionDefinitionExecution(_PropertyType):
+        """The Execution property type for FunctionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Execution
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinition-execution.html>`_
+        """
+
+        __slots__ = ("IsolationMode", "RunAs")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionExecution",
+            _PropertyType,
+            __slots__,
+            converters={"RunAs": _convert_FunctionDefinitionRunAs},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, IsolationMode=None, RunAs=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IsolationMode", IsolationMode)
+            _setattr("RunAs", _convert_FunctionDefinitionRunAs(RunAs))
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionExecution = create_object_converter(
+        FunctionDefinitionExecution
     )
 
+    class FunctionDefinitionDefaultConfig(_PropertyType):
+        """The Default Config property type for FunctionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for DefaultConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinition-defaultconfig.html>`_
+        """
+
+        __slots__ = ("Execution",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionDefaultConfig",
+            _PropertyType,
+            __slots__,
+            converters={"Execution": _convert_FunctionDefinitionExecution},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Execution=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Execution", _convert_FunctionDefinitionExecution(Execution))
+            _init_PropertyType(self, kwargs)
+
+    class FunctionDefinitionResourceAccessPolicy(_PropertyType):
+        """The Resource Access Policy property type for FunctionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceAccessPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinition-resourceaccesspolicy.html>`_
+        """
+
+        __slots__ = ("Permission", "ResourceId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionResourceAccessPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Permission=None, ResourceId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Permission", Permission)
+            _setattr("ResourceId", ResourceId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionResourceAccessPolicy_list = create_object_list_converter(
+        FunctionDefinitionResourceAccessPolicy
+    )
 
-@attrs(**ATTRSCONFIG)
-class GroupProperties(ResourceProperties):
-    InitialVersion = attrib(default=None)
-    Name = attrib(default=None)
-    RoleArn = attrib(default=None)
-    Tags = attrib(default=None)
-
+    class FunctionDefinitionEnvironment(_PropertyType):
+        """The Environment property type for FunctionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Environment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinition-environment.html>`_
+        """
+
+        __slots__ = ("AccessSysfs", "Execution", "ResourceAccessPolicies", "Variables")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionEnvironment",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Execution": _convert_FunctionDefinitionExecution,
+                "ResourceAccessPolicies": _convert_FunctionDefinitionResourceAccessPolicy_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessSysfs=None,
+            Execution=None,
+            ResourceAccessPolicies=None,
+            Variables=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccessSysfs", AccessSysfs)
+            _setattr("Execution", _convert_FunctionDefinitionExecution(Execution))
+            _setattr(
+                "ResourceAccessPolicies",
+                _convert_FunctionDefinitionResourceAccessPolicy_list(
+                    ResourceAccessPolicies
+                ),
+            )
+            _setattr("Variables", Variables)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionEnvironment = create_object_converter(
+        FunctionDefinitionEnvironment
+    )
 
-@attrs(**ATTRSCONFIG)
-class Group(Resource):
-    """A Group for Greengrass.
+    class FunctionDefinitionFunctionConfiguration(_PropertyType):
+        """The Function Configuration property type for FunctionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for FunctionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinition-functionconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "EncodingType",
+            "Environment",
+            "ExecArgs",
+            "Executable",
+            "MemorySize",
+            "Pinned",
+            "Timeout",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionFunctionConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Environment": _convert_FunctionDefinitionEnvironment},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EncodingType=None,
+            Environment=None,
+            ExecArgs=None,
+            Executable=None,
+            MemorySize=None,
+            Pinned=None,
+            Timeout=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EncodingType", EncodingType)
+            _setattr("Environment", _convert_FunctionDefinitionEnvironment(Environment))
+            _setattr("ExecArgs", ExecArgs)
+            _setattr("Executable", Executable)
+            _setattr("MemorySize", MemorySize)
+            _setattr("Pinned", Pinned)
+            _setattr("Timeout", Timeout)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionFunctionConfiguration = create_object_converter(
+        FunctionDefinitionFunctionConfiguration
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for Group
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-group.html>`_
-    """
+    class FunctionDefinitionFunction(_PropertyType):
+        """The Function property type for FunctionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Function
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinition-function.html>`_
+        """
+
+        __slots__ = ("FunctionArn", "FunctionConfiguration", "Id")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionFunction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FunctionConfiguration": _convert_FunctionDefinitionFunctionConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FunctionArn=None, FunctionConfiguration=None, Id=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FunctionArn", FunctionArn)
+            _setattr(
+                "FunctionConfiguration",
+                _convert_FunctionDefinitionFunctionConfiguration(FunctionConfiguration),
+            )
+            _setattr("Id", Id)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionDefaultConfig = create_object_converter(
+        FunctionDefinitionDefaultConfig
+    )
+    _convert_FunctionDefinitionFunction_list = create_object_list_converter(
+        FunctionDefinitionFunction
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::Group"
+    class FunctionDefinitionFunctionDefinitionVersion(_PropertyType):
+        """The Function Definition Version property type for FunctionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for FunctionDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinition-functiondefinitionversion.html>`_
+        """
+
+        __slots__ = ("DefaultConfig", "Functions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionFunctionDefinitionVersion",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DefaultConfig": _convert_FunctionDefinitionDefaultConfig,
+                "Functions": _convert_FunctionDefinitionFunction_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DefaultConfig=None, Functions=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DefaultConfig", _convert_FunctionDefinitionDefaultConfig(DefaultConfig)
+            )
+            _setattr("Functions", _convert_FunctionDefinitionFunction_list(Functions))
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionFunctionDefinitionVersion = create_object_converter(
+        FunctionDefinitionFunctionDefinitionVersion
+    )
 
-    Properties: GroupProperties = attrib(
-        factory=GroupProperties, converter=create_object_converter(GroupProperties)
+    class FunctionDefinitionProperties(_ResourceProperties):
+        __slots__ = ("InitialVersion", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "InitialVersion": _convert_FunctionDefinitionFunctionDefinitionVersion
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InitialVersion=None, Name=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InitialVersion",
+                _convert_FunctionDefinitionFunctionDefinitionVersion(InitialVersion),
+            )
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FunctionDefinitionProperties = create_object_converter(
+        FunctionDefinitionProperties
     )
 
+    class FunctionDefinition(_Resource):
+        """A Function Definition for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for FunctionDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-functiondefinition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::FunctionDefinition"
+        TAG_FORMAT = "Map"
+
+        Properties: FunctionDefinitionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FunctionDefinitionProperties},
+            factories={"Properties": FunctionDefinitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FunctionDefinitionProperties()
+            _setattr("Properties", _convert_FunctionDefinitionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        FunctionDefinition,
+        FunctionDefinitionProperties,
+        FunctionDefinitionRunAs,
+        FunctionDefinitionExecution,
+        FunctionDefinitionDefaultConfig,
+        FunctionDefinitionResourceAccessPolicy,
+        FunctionDefinitionEnvironment,
+        FunctionDefinitionFunctionConfiguration,
+        FunctionDefinitionFunction,
+        FunctionDefinitionFunctionDefinitionVersion,
+    )
 
-@attrs(**ATTRSCONFIG)
-class GroupVersionProperties(ResourceProperties):
-    ConnectorDefinitionVersionArn = attrib(default=None)
-    CoreDefinitionVersionArn = attrib(default=None)
-    DeviceDefinitionVersionArn = attrib(default=None)
-    FunctionDefinitionVersionArn = attrib(default=None)
-    GroupId = attrib(default=None)
-    LoggerDefinitionVersionArn = attrib(default=None)
-    ResourceDefinitionVersionArn = attrib(default=None)
-    SubscriptionDefinitionVersionArn = attrib(default=None)
 
+def _create_FunctionDefinitionVersion():
+    class FunctionDefinitionVersionRunAs(_PropertyType):
+        """The Run As property type for FunctionDefinitionVersion in Greengrass.
 
-@attrs(**ATTRSCONFIG)
-class GroupVersion(Resource):
-    """A Group Version for Greengrass.
+        See Also:
+            `AWS Cloud Formation documentation for RunAs
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinitionversion-runas.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for GroupVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-groupversion.html>`_
-    """
+        __slots__ = ("Gid", "Uid")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionVersionRunAs", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Greengrass::GroupVersion"
+        def __init__(self, *, Gid=None, Uid=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Gid", Gid)
+            _setattr("Uid", Uid)
+            _init_PropertyType(self, kwargs)
 
-    Properties: GroupVersionProperties = attrib(
-        factory=GroupVersionProperties,
-        converter=create_object_converter(GroupVersionProperties),
+    _convert_FunctionDefinitionVersionRunAs = create_object_converter(
+        FunctionDefinitionVersionRunAs
     )
 
+    class FunctionDefinitionVersionExecution(_PropertyType):
+        """The Execution property type for FunctionDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Execution
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinitionversion-execution.html>`_
+        """
+
+        __slots__ = ("IsolationMode", "RunAs")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionVersionExecution",
+            _PropertyType,
+            __slots__,
+            converters={"RunAs": _convert_FunctionDefinitionVersionRunAs},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, IsolationMode=None, RunAs=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IsolationMode", IsolationMode)
+            _setattr("RunAs", _convert_FunctionDefinitionVersionRunAs(RunAs))
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionVersionExecution = create_object_converter(
+        FunctionDefinitionVersionExecution
+    )
 
-@attrs(**ATTRSCONFIG)
-class LoggerDefinitionProperties(ResourceProperties):
-    InitialVersion = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
+    class FunctionDefinitionVersionDefaultConfig(_PropertyType):
+        """The Default Config property type for FunctionDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for DefaultConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinitionversion-defaultconfig.html>`_
+        """
+
+        __slots__ = ("Execution",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionVersionDefaultConfig",
+            _PropertyType,
+            __slots__,
+            converters={"Execution": _convert_FunctionDefinitionVersionExecution},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Execution=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Execution", _convert_FunctionDefinitionVersionExecution(Execution)
+            )
+            _init_PropertyType(self, kwargs)
+
+    class FunctionDefinitionVersionResourceAccessPolicy(_PropertyType):
+        """The Resource Access Policy property type for FunctionDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceAccessPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinitionversion-resourceaccesspolicy.html>`_
+        """
+
+        __slots__ = ("Permission", "ResourceId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionVersionResourceAccessPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Permission=None, ResourceId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Permission", Permission)
+            _setattr("ResourceId", ResourceId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionVersionResourceAccessPolicy_list = (
+        create_object_list_converter(FunctionDefinitionVersionResourceAccessPolicy)
+    )
 
+    class FunctionDefinitionVersionEnvironment(_PropertyType):
+        """The Environment property type for FunctionDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Environment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinitionversion-environment.html>`_
+        """
+
+        __slots__ = ("AccessSysfs", "Execution", "ResourceAccessPolicies", "Variables")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionVersionEnvironment",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Execution": _convert_FunctionDefinitionVersionExecution,
+                "ResourceAccessPolicies": _convert_FunctionDefinitionVersionResourceAccessPolicy_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessSysfs=None,
+            Execution=None,
+            ResourceAccessPolicies=None,
+            Variables=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccessSysfs", AccessSysfs)
+            _setattr(
+                "Execution", _convert_FunctionDefinitionVersionExecution(Execution)
+            )
+            _setattr(
+                "ResourceAccessPolicies",
+                _convert_FunctionDefinitionVersionResourceAccessPolicy_list(
+                    ResourceAccessPolicies
+                ),
+            )
+            _setattr("Variables", Variables)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionVersionEnvironment = create_object_converter(
+        FunctionDefinitionVersionEnvironment
+    )
 
-@attrs(**ATTRSCONFIG)
-class LoggerDefinition(Resource):
-    """A Logger Definition for Greengrass.
+    class FunctionDefinitionVersionFunctionConfiguration(_PropertyType):
+        """The Function Configuration property type for FunctionDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for FunctionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinitionversion-functionconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "EncodingType",
+            "Environment",
+            "ExecArgs",
+            "Executable",
+            "MemorySize",
+            "Pinned",
+            "Timeout",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionVersionFunctionConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Environment": _convert_FunctionDefinitionVersionEnvironment},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EncodingType=None,
+            Environment=None,
+            ExecArgs=None,
+            Executable=None,
+            MemorySize=None,
+            Pinned=None,
+            Timeout=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EncodingType", EncodingType)
+            _setattr(
+                "Environment",
+                _convert_FunctionDefinitionVersionEnvironment(Environment),
+            )
+            _setattr("ExecArgs", ExecArgs)
+            _setattr("Executable", Executable)
+            _setattr("MemorySize", MemorySize)
+            _setattr("Pinned", Pinned)
+            _setattr("Timeout", Timeout)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionVersionFunctionConfiguration = create_object_converter(
+        FunctionDefinitionVersionFunctionConfiguration
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for LoggerDefinition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-loggerdefinition.html>`_
-    """
+    class FunctionDefinitionVersionFunction(_PropertyType):
+        """The Function property type for FunctionDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Function
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-functiondefinitionversion-function.html>`_
+        """
+
+        __slots__ = ("FunctionArn", "FunctionConfiguration", "Id")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionVersionFunction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FunctionConfiguration": _convert_FunctionDefinitionVersionFunctionConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FunctionArn=None, FunctionConfiguration=None, Id=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FunctionArn", FunctionArn)
+            _setattr(
+                "FunctionConfiguration",
+                _convert_FunctionDefinitionVersionFunctionConfiguration(
+                    FunctionConfiguration
+                ),
+            )
+            _setattr("Id", Id)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionDefinitionVersionDefaultConfig = create_object_converter(
+        FunctionDefinitionVersionDefaultConfig
+    )
+    _convert_FunctionDefinitionVersionFunction_list = create_object_list_converter(
+        FunctionDefinitionVersionFunction
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::LoggerDefinition"
+    class FunctionDefinitionVersionProperties(_ResourceProperties):
+        __slots__ = ("DefaultConfig", "FunctionDefinitionId", "Functions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionVersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DefaultConfig": _convert_FunctionDefinitionVersionDefaultConfig,
+                "Functions": _convert_FunctionDefinitionVersionFunction_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultConfig=None,
+            FunctionDefinitionId=None,
+            Functions=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DefaultConfig",
+                _convert_FunctionDefinitionVersionDefaultConfig(DefaultConfig),
+            )
+            _setattr("FunctionDefinitionId", FunctionDefinitionId)
+            _setattr(
+                "Functions", _convert_FunctionDefinitionVersionFunction_list(Functions)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FunctionDefinitionVersionProperties = create_object_converter(
+        FunctionDefinitionVersionProperties
+    )
 
-    Properties: LoggerDefinitionProperties = attrib(
-        factory=LoggerDefinitionProperties,
-        converter=create_object_converter(LoggerDefinitionProperties),
+    class FunctionDefinitionVersion(_Resource):
+        """A Function Definition Version for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for FunctionDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-functiondefinitionversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::FunctionDefinitionVersion"
+
+        Properties: FunctionDefinitionVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDefinitionVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FunctionDefinitionVersionProperties},
+            factories={"Properties": FunctionDefinitionVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FunctionDefinitionVersionProperties()
+            _setattr(
+                "Properties", _convert_FunctionDefinitionVersionProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        FunctionDefinitionVersion,
+        FunctionDefinitionVersionProperties,
+        FunctionDefinitionVersionRunAs,
+        FunctionDefinitionVersionExecution,
+        FunctionDefinitionVersionDefaultConfig,
+        FunctionDefinitionVersionResourceAccessPolicy,
+        FunctionDefinitionVersionEnvironment,
+        FunctionDefinitionVersionFunctionConfiguration,
+        FunctionDefinitionVersionFunction,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class LoggerDefinitionVersionProperties(ResourceProperties):
-    LoggerDefinitionId = attrib(default=None)
-    Loggers = attrib(default=None)
+def _create_Group():
+    class GroupGroupVersion(_PropertyType):
+        """The Group Version property type for Group in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for GroupVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-group-groupversion.html>`_
+        """
+
+        __slots__ = (
+            "ConnectorDefinitionVersionArn",
+            "CoreDefinitionVersionArn",
+            "DeviceDefinitionVersionArn",
+            "FunctionDefinitionVersionArn",
+            "LoggerDefinitionVersionArn",
+            "ResourceDefinitionVersionArn",
+            "SubscriptionDefinitionVersionArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GroupGroupVersion", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConnectorDefinitionVersionArn=None,
+            CoreDefinitionVersionArn=None,
+            DeviceDefinitionVersionArn=None,
+            FunctionDefinitionVersionArn=None,
+            LoggerDefinitionVersionArn=None,
+            ResourceDefinitionVersionArn=None,
+            SubscriptionDefinitionVersionArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConnectorDefinitionVersionArn", ConnectorDefinitionVersionArn)
+            _setattr("CoreDefinitionVersionArn", CoreDefinitionVersionArn)
+            _setattr("DeviceDefinitionVersionArn", DeviceDefinitionVersionArn)
+            _setattr("FunctionDefinitionVersionArn", FunctionDefinitionVersionArn)
+            _setattr("LoggerDefinitionVersionArn", LoggerDefinitionVersionArn)
+            _setattr("ResourceDefinitionVersionArn", ResourceDefinitionVersionArn)
+            _setattr(
+                "SubscriptionDefinitionVersionArn", SubscriptionDefinitionVersionArn
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_GroupGroupVersion = create_object_converter(GroupGroupVersion)
+
+    class GroupProperties(_ResourceProperties):
+        __slots__ = ("InitialVersion", "Name", "RoleArn", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"InitialVersion": _convert_GroupGroupVersion},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InitialVersion=None, Name=None, RoleArn=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InitialVersion", _convert_GroupGroupVersion(InitialVersion))
+            _setattr("Name", Name)
+            _setattr("RoleArn", RoleArn)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GroupProperties = create_object_converter(GroupProperties)
+
+    class Group(_Resource):
+        """A Group for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Group
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-group.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::Group"
+        TAG_FORMAT = "Map"
+
+        Properties: GroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Group",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GroupProperties},
+            factories={"Properties": GroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GroupProperties()
+            _setattr("Properties", _convert_GroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Group, GroupProperties, GroupGroupVersion
+
+
+def _create_GroupVersion():
+    class GroupVersionProperties(_ResourceProperties):
+        __slots__ = (
+            "ConnectorDefinitionVersionArn",
+            "CoreDefinitionVersionArn",
+            "DeviceDefinitionVersionArn",
+            "FunctionDefinitionVersionArn",
+            "GroupId",
+            "LoggerDefinitionVersionArn",
+            "ResourceDefinitionVersionArn",
+            "SubscriptionDefinitionVersionArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GroupVersionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConnectorDefinitionVersionArn=None,
+            CoreDefinitionVersionArn=None,
+            DeviceDefinitionVersionArn=None,
+            FunctionDefinitionVersionArn=None,
+            GroupId=None,
+            LoggerDefinitionVersionArn=None,
+            ResourceDefinitionVersionArn=None,
+            SubscriptionDefinitionVersionArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConnectorDefinitionVersionArn", ConnectorDefinitionVersionArn)
+            _setattr("CoreDefinitionVersionArn", CoreDefinitionVersionArn)
+            _setattr("DeviceDefinitionVersionArn", DeviceDefinitionVersionArn)
+            _setattr("FunctionDefinitionVersionArn", FunctionDefinitionVersionArn)
+            _setattr("GroupId", GroupId)
+            _setattr("LoggerDefinitionVersionArn", LoggerDefinitionVersionArn)
+            _setattr("ResourceDefinitionVersionArn", ResourceDefinitionVersionArn)
+            _setattr(
+                "SubscriptionDefinitionVersionArn", SubscriptionDefinitionVersionArn
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GroupVersionProperties = create_object_converter(GroupVersionProperties)
+
+    class GroupVersion(_Resource):
+        """A Group Version for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for GroupVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-groupversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::GroupVersion"
+
+        Properties: GroupVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GroupVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GroupVersionProperties},
+            factories={"Properties": GroupVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GroupVersionProperties()
+            _setattr("Properties", _convert_GroupVersionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return GroupVersion, GroupVersionProperties
+
+
+def _create_LoggerDefinition():
+    class LoggerDefinitionLogger(_PropertyType):
+        """The Logger property type for LoggerDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Logger
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-loggerdefinition-logger.html>`_
+        """
+
+        __slots__ = ("Component", "Id", "Level", "Space", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoggerDefinitionLogger", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Component=None,
+            Id=None,
+            Level=None,
+            Space=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Component", Component)
+            _setattr("Id", Id)
+            _setattr("Level", Level)
+            _setattr("Space", Space)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LoggerDefinitionLogger_list = create_object_list_converter(
+        LoggerDefinitionLogger
+    )
 
+    class LoggerDefinitionLoggerDefinitionVersion(_PropertyType):
+        """The Logger Definition Version property type for LoggerDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoggerDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-loggerdefinition-loggerdefinitionversion.html>`_
+        """
+
+        __slots__ = ("Loggers",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoggerDefinitionLoggerDefinitionVersion",
+            _PropertyType,
+            __slots__,
+            converters={"Loggers": _convert_LoggerDefinitionLogger_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Loggers=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Loggers", _convert_LoggerDefinitionLogger_list(Loggers))
+            _init_PropertyType(self, kwargs)
+
+    _convert_LoggerDefinitionLoggerDefinitionVersion = create_object_converter(
+        LoggerDefinitionLoggerDefinitionVersion
+    )
 
-@attrs(**ATTRSCONFIG)
-class LoggerDefinitionVersion(Resource):
-    """A Logger Definition Version for Greengrass.
+    class LoggerDefinitionProperties(_ResourceProperties):
+        __slots__ = ("InitialVersion", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoggerDefinitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "InitialVersion": _convert_LoggerDefinitionLoggerDefinitionVersion
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InitialVersion=None, Name=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InitialVersion",
+                _convert_LoggerDefinitionLoggerDefinitionVersion(InitialVersion),
+            )
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LoggerDefinitionProperties = create_object_converter(
+        LoggerDefinitionProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for LoggerDefinitionVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-loggerdefinitionversion.html>`_
-    """
+    class LoggerDefinition(_Resource):
+        """A Logger Definition for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoggerDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-loggerdefinition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::LoggerDefinition"
+        TAG_FORMAT = "Map"
+
+        Properties: LoggerDefinitionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoggerDefinition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LoggerDefinitionProperties},
+            factories={"Properties": LoggerDefinitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LoggerDefinitionProperties()
+            _setattr("Properties", _convert_LoggerDefinitionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        LoggerDefinition,
+        LoggerDefinitionProperties,
+        LoggerDefinitionLogger,
+        LoggerDefinitionLoggerDefinitionVersion,
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::LoggerDefinitionVersion"
 
-    Properties: LoggerDefinitionVersionProperties = attrib(
-        factory=LoggerDefinitionVersionProperties,
-        converter=create_object_converter(LoggerDefinitionVersionProperties),
+def _create_LoggerDefinitionVersion():
+    class LoggerDefinitionVersionLogger(_PropertyType):
+        """The Logger property type for LoggerDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Logger
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-loggerdefinitionversion-logger.html>`_
+        """
+
+        __slots__ = ("Component", "Id", "Level", "Space", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoggerDefinitionVersionLogger", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Component=None,
+            Id=None,
+            Level=None,
+            Space=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Component", Component)
+            _setattr("Id", Id)
+            _setattr("Level", Level)
+            _setattr("Space", Space)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LoggerDefinitionVersionLogger_list = create_object_list_converter(
+        LoggerDefinitionVersionLogger
     )
 
+    class LoggerDefinitionVersionProperties(_ResourceProperties):
+        __slots__ = ("LoggerDefinitionId", "Loggers")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoggerDefinitionVersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Loggers": _convert_LoggerDefinitionVersionLogger_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, LoggerDefinitionId=None, Loggers=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LoggerDefinitionId", LoggerDefinitionId)
+            _setattr("Loggers", _convert_LoggerDefinitionVersionLogger_list(Loggers))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LoggerDefinitionVersionProperties = create_object_converter(
+        LoggerDefinitionVersionProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class ResourceDefinitionProperties(ResourceProperties):
-    InitialVersion = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
+    class LoggerDefinitionVersion(_Resource):
+        """A Logger Definition Version for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoggerDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-loggerdefinitionversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::LoggerDefinitionVersion"
+
+        Properties: LoggerDefinitionVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LoggerDefinitionVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LoggerDefinitionVersionProperties},
+            factories={"Properties": LoggerDefinitionVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LoggerDefinitionVersionProperties()
+            _setattr(
+                "Properties", _convert_LoggerDefinitionVersionProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        LoggerDefinitionVersion,
+        LoggerDefinitionVersionProperties,
+        LoggerDefinitionVersionLogger,
+    )
 
 
-@attrs(**ATTRSCONFIG)
-class ResourceDefinition(Resource):
-    """A Resource Definition for Greengrass.
+def _create_ResourceDefinition():
+    class ResourceDefinitionGroupOwnerSetting(_PropertyType):
+        """The Group Owner Setting property type for ResourceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for GroupOwnerSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinition-groupownersetting.html>`_
+        """
+
+        __slots__ = ("AutoAddGroupOwner", "GroupOwner")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionGroupOwnerSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AutoAddGroupOwner=None, GroupOwner=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoAddGroupOwner", AutoAddGroupOwner)
+            _setattr("GroupOwner", GroupOwner)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResourceDefinitionGroupOwnerSetting = create_object_converter(
+        ResourceDefinitionGroupOwnerSetting
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for ResourceDefinition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-resourcedefinition.html>`_
-    """
+    class ResourceDefinitionLocalDeviceResourceData(_PropertyType):
+        """The Local Device Resource Data property type for ResourceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for LocalDeviceResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinition-localdeviceresourcedata.html>`_
+        """
+
+        __slots__ = ("GroupOwnerSetting", "SourcePath")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionLocalDeviceResourceData",
+            _PropertyType,
+            __slots__,
+            converters={
+                "GroupOwnerSetting": _convert_ResourceDefinitionGroupOwnerSetting
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, GroupOwnerSetting=None, SourcePath=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "GroupOwnerSetting",
+                _convert_ResourceDefinitionGroupOwnerSetting(GroupOwnerSetting),
+            )
+            _setattr("SourcePath", SourcePath)
+            _init_PropertyType(self, kwargs)
+
+    class ResourceDefinitionLocalVolumeResourceData(_PropertyType):
+        """The Local Volume Resource Data property type for ResourceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for LocalVolumeResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinition-localvolumeresourcedata.html>`_
+        """
+
+        __slots__ = ("DestinationPath", "GroupOwnerSetting", "SourcePath")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionLocalVolumeResourceData",
+            _PropertyType,
+            __slots__,
+            converters={
+                "GroupOwnerSetting": _convert_ResourceDefinitionGroupOwnerSetting
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DestinationPath=None,
+            GroupOwnerSetting=None,
+            SourcePath=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationPath", DestinationPath)
+            _setattr(
+                "GroupOwnerSetting",
+                _convert_ResourceDefinitionGroupOwnerSetting(GroupOwnerSetting),
+            )
+            _setattr("SourcePath", SourcePath)
+            _init_PropertyType(self, kwargs)
+
+    class ResourceDefinitionSecretsManagerSecretResourceData(_PropertyType):
+        """The Secrets Manager Secret Resource Data property type for ResourceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecretsManagerSecretResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinition-secretsmanagersecretresourcedata.html>`_
+        """
+
+        __slots__ = ("AdditionalStagingLabelsToDownload", "ARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionSecretsManagerSecretResourceData",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AdditionalStagingLabelsToDownload=None, ARN=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AdditionalStagingLabelsToDownload", AdditionalStagingLabelsToDownload
+            )
+            _setattr("ARN", ARN)
+            _init_PropertyType(self, kwargs)
+
+    class ResourceDefinitionSageMakerMachineLearningModelResourceData(_PropertyType):
+        """The Sage Maker Machine Learning Model Resource Data property type for ResourceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for SageMakerMachineLearningModelResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinition-sagemakermachinelearningmodelresourcedata.html>`_
+        """
+
+        __slots__ = ("DestinationPath", "SageMakerJobArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionSageMakerMachineLearningModelResourceData",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DestinationPath=None, SageMakerJobArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationPath", DestinationPath)
+            _setattr("SageMakerJobArn", SageMakerJobArn)
+            _init_PropertyType(self, kwargs)
+
+    class ResourceDefinitionS3MachineLearningModelResourceData(_PropertyType):
+        """The S3 Machine Learning Model Resource Data property type for ResourceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3MachineLearningModelResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinition-s3machinelearningmodelresourcedata.html>`_
+        """
+
+        __slots__ = ("DestinationPath", "S3Uri")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionS3MachineLearningModelResourceData",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DestinationPath=None, S3Uri=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationPath", DestinationPath)
+            _setattr("S3Uri", S3Uri)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResourceDefinitionLocalDeviceResourceData = create_object_converter(
+        ResourceDefinitionLocalDeviceResourceData
+    )
+    _convert_ResourceDefinitionLocalVolumeResourceData = create_object_converter(
+        ResourceDefinitionLocalVolumeResourceData
+    )
+    _convert_ResourceDefinitionS3MachineLearningModelResourceData = (
+        create_object_converter(ResourceDefinitionS3MachineLearningModelResourceData)
+    )
+    _convert_ResourceDefinitionSageMakerMachineLearningModelResourceData = (
+        create_object_converter(
+            ResourceDefinitionSageMakerMachineLearningModelResourceData
+        )
+    )
+    _convert_ResourceDefinitionSecretsManagerSecretResourceData = (
+        create_object_converter(ResourceDefinitionSecretsManagerSecretResourceData)
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::ResourceDefinition"
+    class ResourceDefinitionResourceDataContainer(_PropertyType):
+        """The Resource Data Container property type for ResourceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceDataContainer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinition-resourcedatacontainer.html>`_
+        """
+
+        __slots__ = (
+            "LocalDeviceResourceData",
+            "LocalVolumeResourceData",
+            "S3MachineLearningModelResourceData",
+            "SageMakerMachineLearningModelResourceData",
+            "SecretsManagerSecretResourceData",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionResourceDataContainer",
+            _PropertyType,
+            __slots__,
+            converters={
+                "LocalDeviceResourceData": _convert_ResourceDefinitionLocalDeviceResourceData,
+                "LocalVolumeResourceData": _convert_ResourceDefinitionLocalVolumeResourceData,
+                "S3MachineLearningModelResourceData": _convert_ResourceDefinitionS3MachineLearningModelResourceData,
+                "SageMakerMachineLearningModelResourceData": _convert_ResourceDefinitionSageMakerMachineLearningModelResourceData,
+                "SecretsManagerSecretResourceData": _convert_ResourceDefinitionSecretsManagerSecretResourceData,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            LocalDeviceResourceData=None,
+            LocalVolumeResourceData=None,
+            S3MachineLearningModelResourceData=None,
+            SageMakerMachineLearningModelResourceData=None,
+            SecretsManagerSecretResourceData=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "LocalDeviceResourceData",
+                _convert_ResourceDefinitionLocalDeviceResourceData(
+                    LocalDeviceResourceData
+                ),
+            )
+            _setattr(
+                "LocalVolumeResourceData",
+                _convert_ResourceDefinitionLocalVolumeResourceData(
+                    LocalVolumeResourceData
+                ),
+            )
+            _setattr(
+                "S3MachineLearningModelResourceData",
+                _convert_ResourceDefinitionS3MachineLearningModelResourceData(
+                    S3MachineLearningModelResourceData
+                ),
+            )
+            _setattr(
+                "SageMakerMachineLearningModelResourceData",
+                _convert_ResourceDefinitionSageMakerMachineLearningModelResourceData(
+                    SageMakerMachineLearningModelResourceData
+                ),
+            )
+            _setattr(
+                "SecretsManagerSecretResourceData",
+                _convert_ResourceDefinitionSecretsManagerSecretResourceData(
+                    SecretsManagerSecretResourceData
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResourceDefinitionResourceDataContainer = create_object_converter(
+        ResourceDefinitionResourceDataContainer
+    )
 
-    Properties: ResourceDefinitionProperties = attrib(
-        factory=ResourceDefinitionProperties,
-        converter=create_object_converter(ResourceDefinitionProperties),
+    class ResourceDefinitionResourceInstance(_PropertyType):
+        """The Resource Instance property type for ResourceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceInstance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinition-resourceinstance.html>`_
+        """
+
+        __slots__ = ("Id", "Name", "ResourceDataContainer")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionResourceInstance",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ResourceDataContainer": _convert_ResourceDefinitionResourceDataContainer
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Id=None, Name=None, ResourceDataContainer=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Name", Name)
+            _setattr(
+                "ResourceDataContainer",
+                _convert_ResourceDefinitionResourceDataContainer(ResourceDataContainer),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResourceDefinitionResourceInstance_list = create_object_list_converter(
+        ResourceDefinitionResourceInstance
     )
 
+    class ResourceDefinitionResourceDefinitionVersion(_PropertyType):
+        """The Resource Definition Version property type for ResourceDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinition-resourcedefinitionversion.html>`_
+        """
+
+        __slots__ = ("Resources",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionResourceDefinitionVersion",
+            _PropertyType,
+            __slots__,
+            converters={"Resources": _convert_ResourceDefinitionResourceInstance_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Resources=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Resources", _convert_ResourceDefinitionResourceInstance_list(Resources)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResourceDefinitionResourceDefinitionVersion = create_object_converter(
+        ResourceDefinitionResourceDefinitionVersion
+    )
 
-@attrs(**ATTRSCONFIG)
-class ResourceDefinitionVersionProperties(ResourceProperties):
-    ResourceDefinitionId = attrib(default=None)
-    Resources = attrib(default=None)
+    class ResourceDefinitionProperties(_ResourceProperties):
+        __slots__ = ("InitialVersion", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "InitialVersion": _convert_ResourceDefinitionResourceDefinitionVersion
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InitialVersion=None, Name=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InitialVersion",
+                _convert_ResourceDefinitionResourceDefinitionVersion(InitialVersion),
+            )
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResourceDefinitionProperties = create_object_converter(
+        ResourceDefinitionProperties
+    )
 
+    class ResourceDefinition(_Resource):
+        """A Resource Definition for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-resourcedefinition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::ResourceDefinition"
+        TAG_FORMAT = "Map"
+
+        Properties: ResourceDefinitionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResourceDefinitionProperties},
+            factories={"Properties": ResourceDefinitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResourceDefinitionProperties()
+            _setattr("Properties", _convert_ResourceDefinitionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ResourceDefinition,
+        ResourceDefinitionProperties,
+        ResourceDefinitionGroupOwnerSetting,
+        ResourceDefinitionLocalDeviceResourceData,
+        ResourceDefinitionLocalVolumeResourceData,
+        ResourceDefinitionSecretsManagerSecretResourceData,
+        ResourceDefinitionSageMakerMachineLearningModelResourceData,
+        ResourceDefinitionS3MachineLearningModelResourceData,
+        ResourceDefinitionResourceDataContainer,
+        ResourceDefinitionResourceInstance,
+        ResourceDefinitionResourceDefinitionVersion,
+    )
 
-@attrs(**ATTRSCONFIG)
-class ResourceDefinitionVersion(Resource):
-    """A Resource Definition Version for Greengrass.
 
-    See Also:
-        `AWS Cloud Formation documentation for ResourceDefinitionVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-resourcedefinitionversion.html>`_
-    """
+def _create_ResourceDefinitionVersion():
+    class ResourceDefinitionVersionGroupOwnerSetting(_PropertyType):
+        """The Group Owner Setting property type for ResourceDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for GroupOwnerSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinitionversion-groupownersetting.html>`_
+        """
+
+        __slots__ = ("AutoAddGroupOwner", "GroupOwner")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersionGroupOwnerSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AutoAddGroupOwner=None, GroupOwner=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoAddGroupOwner", AutoAddGroupOwner)
+            _setattr("GroupOwner", GroupOwner)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResourceDefinitionVersionGroupOwnerSetting = create_object_converter(
+        ResourceDefinitionVersionGroupOwnerSetting
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::ResourceDefinitionVersion"
+    class ResourceDefinitionVersionLocalDeviceResourceData(_PropertyType):
+        """The Local Device Resource Data property type for ResourceDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for LocalDeviceResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinitionversion-localdeviceresourcedata.html>`_
+        """
+
+        __slots__ = ("GroupOwnerSetting", "SourcePath")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersionLocalDeviceResourceData",
+            _PropertyType,
+            __slots__,
+            converters={
+                "GroupOwnerSetting": _convert_ResourceDefinitionVersionGroupOwnerSetting
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, GroupOwnerSetting=None, SourcePath=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "GroupOwnerSetting",
+                _convert_ResourceDefinitionVersionGroupOwnerSetting(GroupOwnerSetting),
+            )
+            _setattr("SourcePath", SourcePath)
+            _init_PropertyType(self, kwargs)
+
+    class ResourceDefinitionVersionLocalVolumeResourceData(_PropertyType):
+        """The Local Volume Resource Data property type for ResourceDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for LocalVolumeResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinitionversion-localvolumeresourcedata.html>`_
+        """
+
+        __slots__ = ("DestinationPath", "GroupOwnerSetting", "SourcePath")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersionLocalVolumeResourceData",
+            _PropertyType,
+            __slots__,
+            converters={
+                "GroupOwnerSetting": _convert_ResourceDefinitionVersionGroupOwnerSetting
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DestinationPath=None,
+            GroupOwnerSetting=None,
+            SourcePath=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationPath", DestinationPath)
+            _setattr(
+                "GroupOwnerSetting",
+                _convert_ResourceDefinitionVersionGroupOwnerSetting(GroupOwnerSetting),
+            )
+            _setattr("SourcePath", SourcePath)
+            _init_PropertyType(self, kwargs)
+
+    class ResourceDefinitionVersionSecretsManagerSecretResourceData(_PropertyType):
+        """The Secrets Manager Secret Resource Data property type for ResourceDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecretsManagerSecretResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinitionversion-secretsmanagersecretresourcedata.html>`_
+        """
+
+        __slots__ = ("AdditionalStagingLabelsToDownload", "ARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersionSecretsManagerSecretResourceData",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AdditionalStagingLabelsToDownload=None, ARN=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AdditionalStagingLabelsToDownload", AdditionalStagingLabelsToDownload
+            )
+            _setattr("ARN", ARN)
+            _init_PropertyType(self, kwargs)
+
+    class ResourceDefinitionVersionSageMakerMachineLearningModelResourceData(
+        _PropertyType
+    ):
+        """The Sage Maker Machine Learning Model Resource Data property type for ResourceDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for SageMakerMachineLearningModelResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinitionversion-sagemakermachinelearningmodelresourcedata.html>`_
+        """
+
+        __slots__ = ("DestinationPath", "SageMakerJobArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersionSageMakerMachineLearningModelResourceData",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DestinationPath=None, SageMakerJobArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationPath", DestinationPath)
+            _setattr("SageMakerJobArn", SageMakerJobArn)
+            _init_PropertyType(self, kwargs)
+
+    class ResourceDefinitionVersionS3MachineLearningModelResourceData(_PropertyType):
+        """The S3 Machine Learning Model Resource Data property type for ResourceDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3MachineLearningModelResourceData
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinitionversion-s3machinelearningmodelresourcedata.html>`_
+        """
+
+        __slots__ = ("DestinationPath", "S3Uri")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersionS3MachineLearningModelResourceData",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DestinationPath=None, S3Uri=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationPath", DestinationPath)
+            _setattr("S3Uri", S3Uri)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResourceDefinitionVersionLocalDeviceResourceData = create_object_converter(
+        ResourceDefinitionVersionLocalDeviceResourceData
+    )
+    _convert_ResourceDefinitionVersionLocalVolumeResourceData = create_object_converter(
+        ResourceDefinitionVersionLocalVolumeResourceData
+    )
+    _convert_ResourceDefinitionVersionS3MachineLearningModelResourceData = (
+        create_object_converter(
+            ResourceDefinitionVersionS3MachineLearningModelResourceData
+        )
+    )
+    _convert_ResourceDefinitionVersionSageMakerMachineLearningModelResourceData = (
+        create_object_converter(
+            ResourceDefinitionVersionSageMakerMachineLearningModelResourceData
+        )
+    )
+    _convert_ResourceDefinitionVersionSecretsManagerSecretResourceData = (
+        create_object_converter(
+            ResourceDefinitionVersionSecretsManagerSecretResourceData
+        )
+    )
 
-    Properties: ResourceDefinitionVersionProperties = attrib(
-        factory=ResourceDefinitionVersionProperties,
-        converter=create_object_converter(ResourceDefinitionVersionProperties),
+    class ResourceDefinitionVersionResourceDataContainer(_PropertyType):
+        """The Resource Data Container property type for ResourceDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceDataContainer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinitionversion-resourcedatacontainer.html>`_
+        """
+
+        __slots__ = (
+            "LocalDeviceResourceData",
+            "LocalVolumeResourceData",
+            "S3MachineLearningModelResourceData",
+            "SageMakerMachineLearningModelResourceData",
+            "SecretsManagerSecretResourceData",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersionResourceDataContainer",
+            _PropertyType,
+            __slots__,
+            converters={
+                "LocalDeviceResourceData": _convert_ResourceDefinitionVersionLocalDeviceResourceData,
+                "LocalVolumeResourceData": _convert_ResourceDefinitionVersionLocalVolumeResourceData,
+                "S3MachineLearningModelResourceData": _convert_ResourceDefinitionVersionS3MachineLearningModelResourceData,
+                "SageMakerMachineLearningModelResourceData": _convert_ResourceDefinitionVersionSageMakerMachineLearningModelResourceData,
+                "SecretsManagerSecretResourceData": _convert_ResourceDefinitionVersionSecretsManagerSecretResourceData,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            LocalDeviceResourceData=None,
+            LocalVolumeResourceData=None,
+            S3MachineLearningModelResourceData=None,
+            SageMakerMachineLearningModelResourceData=None,
+            SecretsManagerSecretResourceData=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "LocalDeviceResourceData",
+                _convert_ResourceDefinitionVersionLocalDeviceResourceData(
+                    LocalDeviceResourceData
+                ),
+            )
+            _setattr(
+                "LocalVolumeResourceData",
+                _convert_ResourceDefinitionVersionLocalVolumeResourceData(
+                    LocalVolumeResourceData
+                ),
+            )
+            _setattr(
+                "S3MachineLearningModelResourceData",
+                _convert_ResourceDefinitionVersionS3MachineLearningModelResourceData(
+                    S3MachineLearningModelResourceData
+                ),
+            )
+            _setattr(
+                "SageMakerMachineLearningModelResourceData",
+                _convert_ResourceDefinitionVersionSageMakerMachineLearningModelResourceData(
+                    SageMakerMachineLearningModelResourceData
+                ),
+            )
+            _setattr(
+                "SecretsManagerSecretResourceData",
+                _convert_ResourceDefinitionVersionSecretsManagerSecretResourceData(
+                    SecretsManagerSecretResourceData
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResourceDefinitionVersionResourceDataContainer = create_object_converter(
+        ResourceDefinitionVersionResourceDataContainer
     )
 
+    class ResourceDefinitionVersionResourceInstance(_PropertyType):
+        """The Resource Instance property type for ResourceDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceInstance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-resourcedefinitionversion-resourceinstance.html>`_
+        """
+
+        __slots__ = ("Id", "Name", "ResourceDataContainer")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersionResourceInstance",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ResourceDataContainer": _convert_ResourceDefinitionVersionResourceDataContainer
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Id=None, Name=None, ResourceDataContainer=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Name", Name)
+            _setattr(
+                "ResourceDataContainer",
+                _convert_ResourceDefinitionVersionResourceDataContainer(
+                    ResourceDataContainer
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResourceDefinitionVersionResourceInstance_list = (
+        create_object_list_converter(ResourceDefinitionVersionResourceInstance)
+    )
 
-@attrs(**ATTRSCONFIG)
-class SubscriptionDefinitionProperties(ResourceProperties):
-    InitialVersion = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
+    class ResourceDefinitionVersionProperties(_ResourceProperties):
+        __slots__ = ("ResourceDefinitionId", "Resources")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Resources": _convert_ResourceDefinitionVersionResourceInstance_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ResourceDefinitionId=None, Resources=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceDefinitionId", ResourceDefinitionId)
+            _setattr(
+                "Resources",
+                _convert_ResourceDefinitionVersionResourceInstance_list(Resources),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResourceDefinitionVersionProperties = create_object_converter(
+        ResourceDefinitionVersionProperties
+    )
 
+    class ResourceDefinitionVersion(_Resource):
+        """A Resource Definition Version for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-resourcedefinitionversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::ResourceDefinitionVersion"
+
+        Properties: ResourceDefinitionVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDefinitionVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResourceDefinitionVersionProperties},
+            factories={"Properties": ResourceDefinitionVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResourceDefinitionVersionProperties()
+            _setattr(
+                "Properties", _convert_ResourceDefinitionVersionProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        ResourceDefinitionVersion,
+        ResourceDefinitionVersionProperties,
+        ResourceDefinitionVersionGroupOwnerSetting,
+        ResourceDefinitionVersionLocalDeviceResourceData,
+        ResourceDefinitionVersionLocalVolumeResourceData,
+        ResourceDefinitionVersionSecretsManagerSecretResourceData,
+        ResourceDefinitionVersionSageMakerMachineLearningModelResourceData,
+        ResourceDefinitionVersionS3MachineLearningModelResourceData,
+        ResourceDefinitionVersionResourceDataContainer,
+        ResourceDefinitionVersionResourceInstance,
+    )
 
-@attrs(**ATTRSCONFIG)
-class SubscriptionDefinition(Resource):
-    """A Subscription Definition for Greengrass.
 
-    See Also:
-        `AWS Cloud Formation documentation for SubscriptionDefinition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-subscriptiondefinition.html>`_
-    """
+def _create_SubscriptionDefinition():
+    class SubscriptionDefinitionSubscription(_PropertyType):
+        """The Subscription property type for SubscriptionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Subscription
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-subscriptiondefinition-subscription.html>`_
+        """
+
+        __slots__ = ("Id", "Source", "Subject", "Target")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionDefinitionSubscription", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Id=None, Source=None, Subject=None, Target=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Source", Source)
+            _setattr("Subject", Subject)
+            _setattr("Target", Target)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SubscriptionDefinitionSubscription_list = create_object_list_converter(
+        SubscriptionDefinitionSubscription
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::SubscriptionDefinition"
+    class SubscriptionDefinitionSubscriptionDefinitionVersion(_PropertyType):
+        """The Subscription Definition Version property type for SubscriptionDefinition in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubscriptionDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-subscriptiondefinition-subscriptiondefinitionversion.html>`_
+        """
+
+        __slots__ = ("Subscriptions",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionDefinitionSubscriptionDefinitionVersion",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Subscriptions": _convert_SubscriptionDefinitionSubscription_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Subscriptions=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Subscriptions",
+                _convert_SubscriptionDefinitionSubscription_list(Subscriptions),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_SubscriptionDefinitionSubscriptionDefinitionVersion = (
+        create_object_converter(SubscriptionDefinitionSubscriptionDefinitionVersion)
+    )
 
-    Properties: SubscriptionDefinitionProperties = attrib(
-        factory=SubscriptionDefinitionProperties,
-        converter=create_object_converter(SubscriptionDefinitionProperties),
+    class SubscriptionDefinitionProperties(_ResourceProperties):
+        __slots__ = ("InitialVersion", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionDefinitionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "InitialVersion": _convert_SubscriptionDefinitionSubscriptionDefinitionVersion
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InitialVersion=None, Name=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InitialVersion",
+                _convert_SubscriptionDefinitionSubscriptionDefinitionVersion(
+                    InitialVersion
+                ),
+            )
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubscriptionDefinitionProperties = create_object_converter(
+        SubscriptionDefinitionProperties
     )
 
+    class SubscriptionDefinition(_Resource):
+        """A Subscription Definition for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubscriptionDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-subscriptiondefinition.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::SubscriptionDefinition"
+        TAG_FORMAT = "Map"
+
+        Properties: SubscriptionDefinitionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionDefinition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubscriptionDefinitionProperties},
+            factories={"Properties": SubscriptionDefinitionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubscriptionDefinitionProperties()
+            _setattr(
+                "Properties", _convert_SubscriptionDefinitionProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        SubscriptionDefinition,
+        SubscriptionDefinitionProperties,
+        SubscriptionDefinitionSubscription,
+        SubscriptionDefinitionSubscriptionDefinitionVersion,
+    )
 
-@attrs(**ATTRSCONFIG)
-class SubscriptionDefinitionVersionProperties(ResourceProperties):
-    SubscriptionDefinitionId = attrib(default=None)
-    Subscriptions = attrib(default=None)
 
+def _create_SubscriptionDefinitionVersion():
+    class SubscriptionDefinitionVersionSubscription(_PropertyType):
+        """The Subscription property type for SubscriptionDefinitionVersion in Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for Subscription
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-greengrass-subscriptiondefinitionversion-subscription.html>`_
+        """
+
+        __slots__ = ("Id", "Source", "Subject", "Target")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionDefinitionVersionSubscription", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Id=None, Source=None, Subject=None, Target=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Source", Source)
+            _setattr("Subject", Subject)
+            _setattr("Target", Target)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SubscriptionDefinitionVersionSubscription_list = (
+        create_object_list_converter(SubscriptionDefinitionVersionSubscription)
+    )
 
-@attrs(**ATTRSCONFIG)
-class SubscriptionDefinitionVersion(Resource):
-    """A Subscription Definition Version for Greengrass.
+    class SubscriptionDefinitionVersionProperties(_ResourceProperties):
+        __slots__ = ("SubscriptionDefinitionId", "Subscriptions")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionDefinitionVersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Subscriptions": _convert_SubscriptionDefinitionVersionSubscription_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, SubscriptionDefinitionId=None, Subscriptions=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SubscriptionDefinitionId", SubscriptionDefinitionId)
+            _setattr(
+                "Subscriptions",
+                _convert_SubscriptionDefinitionVersionSubscription_list(Subscriptions),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubscriptionDefinitionVersionProperties = create_object_converter(
+        SubscriptionDefinitionVersionProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for SubscriptionDefinitionVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-subscriptiondefinitionversion.html>`_
-    """
+    class SubscriptionDefinitionVersion(_Resource):
+        """A Subscription Definition Version for Greengrass.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubscriptionDefinitionVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-greengrass-subscriptiondefinitionversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Greengrass::SubscriptionDefinitionVersion"
+
+        Properties: SubscriptionDefinitionVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionDefinitionVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubscriptionDefinitionVersionProperties},
+            factories={"Properties": SubscriptionDefinitionVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubscriptionDefinitionVersionProperties()
+            _setattr(
+                "Properties",
+                _convert_SubscriptionDefinitionVersionProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        SubscriptionDefinitionVersion,
+        SubscriptionDefinitionVersionProperties,
+        SubscriptionDefinitionVersionSubscription,
+    )
 
-    RESOURCE_TYPE = "AWS::Greengrass::SubscriptionDefinitionVersion"
 
-    Properties: SubscriptionDefinitionVersionProperties = attrib(
-        factory=SubscriptionDefinitionVersionProperties,
-        converter=create_object_converter(SubscriptionDefinitionVersionProperties),
-    )
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ConnectorDefinition": _create_ConnectorDefinition,
+        "ConnectorDefinitionProperties": _create_ConnectorDefinition,
+        "ConnectorDefinitionConnector": _create_ConnectorDefinition,
+        "ConnectorDefinitionConnectorDefinitionVersion": _create_ConnectorDefinition,
+        "ConnectorDefinitionVersion": _create_ConnectorDefinitionVersion,
+        "ConnectorDefinitionVersionProperties": _create_ConnectorDefinitionVersion,
+        "ConnectorDefinitionVersionConnector": _create_ConnectorDefinitionVersion,
+        "CoreDefinition": _create_CoreDefinition,
+        "CoreDefinitionProperties": _create_CoreDefinition,
+        "CoreDefinitionCore": _create_CoreDefinition,
+        "CoreDefinitionCoreDefinitionVersion": _create_CoreDefinition,
+        "CoreDefinitionVersion": _create_CoreDefinitionVersion,
+        "CoreDefinitionVersionProperties": _create_CoreDefinitionVersion,
+        "CoreDefinitionVersionCore": _create_CoreDefinitionVersion,
+        "DeviceDefinition": _create_DeviceDefinition,
+        "DeviceDefinitionProperties": _create_DeviceDefinition,
+        "DeviceDefinitionDevice": _create_DeviceDefinition,
+        "DeviceDefinitionDeviceDefinitionVersion": _create_DeviceDefinition,
+        "DeviceDefinitionVersion": _create_DeviceDefinitionVersion,
+        "DeviceDefinitionVersionProperties": _create_DeviceDefinitionVersion,
+        "DeviceDefinitionVersionDevice": _create_DeviceDefinitionVersion,
+        "FunctionDefinition": _create_FunctionDefinition,
+        "FunctionDefinitionProperties": _create_FunctionDefinition,
+        "FunctionDefinitionDefaultConfig": _create_FunctionDefinition,
+        "FunctionDefinitionEnvironment": _create_FunctionDefinition,
+        "FunctionDefinitionExecution": _create_FunctionDefinition,
+        "FunctionDefinitionFunction": _create_FunctionDefinition,
+        "FunctionDefinitionFunctionConfiguration": _create_FunctionDefinition,
+        "FunctionDefinitionFunctionDefinitionVersion": _create_FunctionDefinition,
+        "FunctionDefinitionResourceAccessPolicy": _create_FunctionDefinition,
+        "FunctionDefinitionRunAs": _create_FunctionDefinition,
+        "FunctionDefinitionVersion": _create_FunctionDefinitionVersion,
+        "FunctionDefinitionVersionProperties": _create_FunctionDefinitionVersion,
+        "FunctionDefinitionVersionDefaultConfig": _create_FunctionDefinitionVersion,
+        "FunctionDefinitionVersionEnvironment": _create_FunctionDefinitionVersion,
+        "FunctionDefinitionVersionExecution": _create_FunctionDefinitionVersion,
+        "FunctionDefinitionVersionFunction": _create_FunctionDefinitionVersion,
+        "FunctionDefinitionVersionFunctionConfiguration": _create_FunctionDefinitionVersion,
+        "FunctionDefinitionVersionResourceAccessPolicy": _create_FunctionDefinitionVersion,
+        "FunctionDefinitionVersionRunAs": _create_FunctionDefinitionVersion,
+        "Group": _create_Group,
+        "GroupProperties": _create_Group,
+        "GroupGroupVersion": _create_Group,
+        "GroupVersion": _create_GroupVersion,
+        "GroupVersionProperties": _create_GroupVersion,
+        "LoggerDefinition": _create_LoggerDefinition,
+        "LoggerDefinitionProperties": _create_LoggerDefinition,
+        "LoggerDefinitionLogger": _create_LoggerDefinition,
+        "LoggerDefinitionLoggerDefinitionVersion": _create_LoggerDefinition,
+        "LoggerDefinitionVersion": _create_LoggerDefinitionVersion,
+        "LoggerDefinitionVersionProperties": _create_LoggerDefinitionVersion,
+        "LoggerDefinitionVersionLogger": _create_LoggerDefinitionVersion,
+        "ResourceDefinition": _create_ResourceDefinition,
+        "ResourceDefinitionProperties": _create_ResourceDefinition,
+        "ResourceDefinitionGroupOwnerSetting": _create_ResourceDefinition,
+        "ResourceDefinitionLocalDeviceResourceData": _create_ResourceDefinition,
+        "ResourceDefinitionLocalVolumeResourceData": _create_ResourceDefinition,
+        "ResourceDefinitionResourceDataContainer": _create_ResourceDefinition,
+        "ResourceDefinitionResourceDefinitionVersion": _create_ResourceDefinition,
+        "ResourceDefinitionResourceInstance": _create_ResourceDefinition,
+        "ResourceDefinitionS3MachineLearningModelResourceData": _create_ResourceDefinition,
+        "ResourceDefinitionSageMakerMachineLearningModelResourceData": _create_ResourceDefinition,
+        "ResourceDefinitionSecretsManagerSecretResourceData": _create_ResourceDefinition,
+        "ResourceDefinitionVersion": _create_ResourceDefinitionVersion,
+        "ResourceDefinitionVersionProperties": _create_ResourceDefinitionVersion,
+        "ResourceDefinitionVersionGroupOwnerSetting": _create_ResourceDefinitionVersion,
+        "ResourceDefinitionVersionLocalDeviceResourceData": _create_ResourceDefinitionVersion,
+        "ResourceDefinitionVersionLocalVolumeResourceData": _create_ResourceDefinitionVersion,
+        "ResourceDefinitionVersionResourceDataContainer": _create_ResourceDefinitionVersion,
+        "ResourceDefinitionVersionResourceInstance": _create_ResourceDefinitionVersion,
+        "ResourceDefinitionVersionS3MachineLearningModelResourceData": _create_ResourceDefinitionVersion,
+        "ResourceDefinitionVersionSageMakerMachineLearningModelResourceData": _create_ResourceDefinitionVersion,
+        "ResourceDefinitionVersionSecretsManagerSecretResourceData": _create_ResourceDefinitionVersion,
+        "SubscriptionDefinition": _create_SubscriptionDefinition,
+        "SubscriptionDefinitionProperties": _create_SubscriptionDefinition,
+        "SubscriptionDefinitionSubscription": _create_SubscriptionDefinition,
+        "SubscriptionDefinitionSubscriptionDefinitionVersion": _create_SubscriptionDefinition,
+        "SubscriptionDefinitionVersion": _create_SubscriptionDefinitionVersion,
+        "SubscriptionDefinitionVersionProperties": _create_SubscriptionDefinitionVersion,
+        "SubscriptionDefinitionVersionSubscription": _create_SubscriptionDefinitionVersion,
+    },
+)
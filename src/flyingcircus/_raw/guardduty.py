@@ -7,19 +7,27 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
 __all__ = [
     "Detector",
     "DetectorProperties",
     "Filter",
     "FilterProperties",
+    "FilterCondition",
+    "FilterFindingCriteria",
     "IPSet",
     "IPSetProperties",
     "Master",
@@ -31,150 +39,473 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class DetectorProperties(ResourceProperties):
-    Enable = attrib(default=None)
-    FindingPublishingFrequency = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Detector(Resource):
-    """A Detector for GuardDuty.
-
-    See Also:
-        `AWS Cloud Formation documentation for Detector
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-detector.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GuardDuty::Detector"
-
-    Properties: DetectorProperties = attrib(
-        factory=DetectorProperties,
-        converter=create_object_converter(DetectorProperties),
+def _create_Detector():
+    class DetectorProperties(_ResourceProperties):
+        __slots__ = ("Enable", "FindingPublishingFrequency")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Enable=None, FindingPublishingFrequency=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enable", Enable)
+            _setattr("FindingPublishingFrequency", FindingPublishingFrequency)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DetectorProperties = create_object_converter(DetectorProperties)
+
+    class Detector(_Resource):
+        """A Detector for GuardDuty.
+
+        See Also:
+            `AWS Cloud Formation documentation for Detector
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-detector.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GuardDuty::Detector"
+
+        Properties: DetectorProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Detector",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DetectorProperties},
+            factories={"Properties": DetectorProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DetectorProperties()
+            _setattr("Properties", _convert_DetectorProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Detector, DetectorProperties
+
+
+def _create_Filter():
+    class FilterCondition(_PropertyType):
+        """The Condition property type for Filter in GuardDuty.
+
+        See Also:
+            `AWS Cloud Formation documentation for Condition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-guardduty-filter-condition.html>`_
+        """
+
+        __slots__ = ("Eq", "Gte", "Lt", "Lte", "Neq")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FilterCondition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Eq=None, Gte=None, Lt=None, Lte=None, Neq=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Eq", Eq)
+            _setattr("Gte", Gte)
+            _setattr("Lt", Lt)
+            _setattr("Lte", Lte)
+            _setattr("Neq", Neq)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FilterCondition = create_object_converter(FilterCondition)
+
+    class FilterFindingCriteria(_PropertyType):
+        """The Finding Criteria property type for Filter in GuardDuty.
+
+        See Also:
+            `AWS Cloud Formation documentation for FindingCriteria
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-guardduty-filter-findingcriteria.html>`_
+        """
+
+        __slots__ = ("Criterion", "ItemType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FilterFindingCriteria",
+            _PropertyType,
+            __slots__,
+            converters={"ItemType": _convert_FilterCondition},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Criterion=None, ItemType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Criterion", Criterion)
+            _setattr("ItemType", _convert_FilterCondition(ItemType))
+            _init_PropertyType(self, kwargs)
+
+    _convert_FilterFindingCriteria = create_object_converter(FilterFindingCriteria)
+
+    class FilterProperties(_ResourceProperties):
+        __slots__ = (
+            "Action",
+            "Description",
+            "DetectorId",
+            "FindingCriteria",
+            "Name",
+            "Rank",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FilterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"FindingCriteria": _convert_FilterFindingCriteria},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Action=None,
+            Description=None,
+            DetectorId=None,
+            FindingCriteria=None,
+            Name=None,
+            Rank=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", Action)
+            _setattr("Description", Description)
+            _setattr("DetectorId", DetectorId)
+            _setattr("FindingCriteria", _convert_FilterFindingCriteria(FindingCriteria))
+            _setattr("Name", Name)
+            _setattr("Rank", Rank)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FilterProperties = create_object_converter(FilterProperties)
+
+    class Filter(_Resource):
+        """A Filter for GuardDuty.
+
+        See Also:
+            `AWS Cloud Formation documentation for Filter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-filter.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GuardDuty::Filter"
+
+        Properties: FilterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Filter",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FilterProperties},
+            factories={"Properties": FilterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FilterProperties()
+            _setattr("Properties", _convert_FilterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Filter, FilterProperties, FilterCondition, FilterFindingCriteria
+
+
+def _create_IPSet():
+    class IPSetProperties(_ResourceProperties):
+        __slots__ = ("Activate", "DetectorId", "Format", "Location", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IPSetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Activate=None,
+            DetectorId=None,
+            Format=None,
+            Location=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Activate", Activate)
+            _setattr("DetectorId", DetectorId)
+            _setattr("Format", Format)
+            _setattr("Location", Location)
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_IPSetProperties = create_object_converter(IPSetProperties)
+
+    class IPSet(_Resource):
+        """A Ip Set for GuardDuty.
+
+        See Also:
+            `AWS Cloud Formation documentation for IPSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-ipset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GuardDuty::IPSet"
+
+        Properties: IPSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IPSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_IPSetProperties},
+            factories={"Properties": IPSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = IPSetProperties()
+            _setattr("Properties", _convert_IPSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return IPSet, IPSetProperties
+
+
+def _create_Master():
+    class MasterProperties(_ResourceProperties):
+        __slots__ = ("DetectorId", "InvitationId", "MasterId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MasterProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DetectorId=None, InvitationId=None, MasterId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DetectorId", DetectorId)
+            _setattr("InvitationId", InvitationId)
+            _setattr("MasterId", MasterId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MasterProperties = create_object_converter(MasterProperties)
+
+    class Master(_Resource):
+        """A Master for GuardDuty.
+
+        See Also:
+            `AWS Cloud Formation documentation for Master
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-master.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GuardDuty::Master"
+
+        Properties: MasterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Master",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MasterProperties},
+            factories={"Properties": MasterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MasterProperties()
+            _setattr("Properties", _convert_MasterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Master, MasterProperties
+
+
+def _create_Member():
+    class MemberProperties(_ResourceProperties):
+        __slots__ = (
+            "DetectorId",
+            "DisableEmailNotification",
+            "Email",
+            "MemberId",
+            "Message",
+            "Status",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DetectorId=None,
+            DisableEmailNotification=None,
+            Email=None,
+            MemberId=None,
+            Message=None,
+            Status=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DetectorId", DetectorId)
+            _setattr("DisableEmailNotification", DisableEmailNotification)
+            _setattr("Email", Email)
+            _setattr("MemberId", MemberId)
+            _setattr("Message", Message)
+            _setattr("Status", Status)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MemberProperties = create_object_converter(MemberProperties)
+
+    class Member(_Resource):
+        """A Member for GuardDuty.
+
+        See Also:
+            `AWS Cloud Formation documentation for Member
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-member.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GuardDuty::Member"
+
+        Properties: MemberProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Member",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MemberProperties},
+            factories={"Properties": MemberProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MemberProperties()
+            _setattr("Properties", _convert_MemberProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Member, MemberProperties
+
+
+def _create_ThreatIntelSet():
+    class ThreatIntelSetProperties(_ResourceProperties):
+        __slots__ = ("Activate", "DetectorId", "Format", "Location", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ThreatIntelSetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Activate=None,
+            DetectorId=None,
+            Format=None,
+            Location=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Activate", Activate)
+            _setattr("DetectorId", DetectorId)
+            _setattr("Format", Format)
+            _setattr("Location", Location)
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ThreatIntelSetProperties = create_object_converter(
+        ThreatIntelSetProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class FilterProperties(ResourceProperties):
-    Action = attrib(default=None)
-    Description = attrib(default=None)
-    DetectorId = attrib(default=None)
-    FindingCriteria = attrib(default=None)
-    Name = attrib(default=None)
-    Rank = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Filter(Resource):
-    """A Filter for GuardDuty.
-
-    See Also:
-        `AWS Cloud Formation documentation for Filter
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-filter.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GuardDuty::Filter"
-
-    Properties: FilterProperties = attrib(
-        factory=FilterProperties, converter=create_object_converter(FilterProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class IPSetProperties(ResourceProperties):
-    Activate = attrib(default=None)
-    DetectorId = attrib(default=None)
-    Format = attrib(default=None)
-    Location = attrib(default=None)
-    Name = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class IPSet(Resource):
-    """A Ip Set for GuardDuty.
-
-    See Also:
-        `AWS Cloud Formation documentation for IPSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-ipset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GuardDuty::IPSet"
-
-    Properties: IPSetProperties = attrib(
-        factory=IPSetProperties, converter=create_object_converter(IPSetProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class MasterProperties(ResourceProperties):
-    DetectorId = attrib(default=None)
-    InvitationId = attrib(default=None)
-    MasterId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Master(Resource):
-    """A Master for GuardDuty.
-
-    See Also:
-        `AWS Cloud Formation documentation for Master
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-master.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GuardDuty::Master"
-
-    Properties: MasterProperties = attrib(
-        factory=MasterProperties, converter=create_object_converter(MasterProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class MemberProperties(ResourceProperties):
-    DetectorId = attrib(default=None)
-    DisableEmailNotification = attrib(default=None)
-    Email = attrib(default=None)
-    MemberId = attrib(default=None)
-    Message = attrib(default=None)
-    Status = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Member(Resource):
-    """A Member for GuardDuty.
-
-    See Also:
-        `AWS Cloud Formation documentation for Member
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-member.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GuardDuty::Member"
-
-    Properties: MemberProperties = attrib(
-        factory=MemberProperties, converter=create_object_converter(MemberProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class ThreatIntelSetProperties(ResourceProperties):
-    Activate = attrib(default=None)
-    DetectorId = attrib(default=None)
-    Format = attrib(default=None)
-    Location = attrib(default=None)
-    Name = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ThreatIntelSet(Resource):
-    """A Threat Intel Set for GuardDuty.
-
-    See Also:
-        `AWS Cloud Formation documentation for ThreatIntelSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-threatintelset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::GuardDuty::ThreatIntelSet"
-
-    Properties: ThreatIntelSetProperties = attrib(
-        factory=ThreatIntelSetProperties,
-        converter=create_object_converter(ThreatIntelSetProperties),
-    )
+    class ThreatIntelSet(_Resource):
+        """A Threat Intel Set for GuardDuty.
+
+        See Also:
+            `AWS Cloud Formation documentation for ThreatIntelSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-guardduty-threatintelset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::GuardDuty::ThreatIntelSet"
+
+        Properties: ThreatIntelSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ThreatIntelSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ThreatIntelSetProperties},
+            factories={"Properties": ThreatIntelSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ThreatIntelSetProperties()
+            _setattr("Properties", _convert_ThreatIntelSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ThreatIntelSet, ThreatIntelSetProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Detector": _create_Detector,
+        "DetectorProperties": _create_Detector,
+        "Filter": _create_Filter,
+        "FilterProperties": _create_Filter,
+        "FilterCondition": _create_Filter,
+        "FilterFindingCriteria": _create_Filter,
+        "IPSet": _create_IPSet,
+        "IPSetProperties": _create_IPSet,
+        "Master": _create_Master,
+        "MasterProperties": _create_Master,
+        "Member": _create_Member,
+        "MemberProperties": _create_Member,
+        "ThreatIntelSet": _create_ThreatIntelSet,
+        "ThreatIntelSetProperties": _create_ThreatIntelSet,
+    },
+)
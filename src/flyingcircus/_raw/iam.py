@@ -7,19 +7,28 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "AccessKey",
     "AccessKeyProperties",
     "Group",
     "GroupProperties",
+    "GroupPolicy",
     "InstanceProfile",
     "InstanceProfileProperties",
     "ManagedPolicy",
@@ -28,239 +37,753 @@ __all__ = [
     "PolicyProperties",
     "Role",
     "RoleProperties",
+    "RolePolicy",
     "ServiceLinkedRole",
     "ServiceLinkedRoleProperties",
     "User",
     "UserProperties",
+    "UserLoginProfile",
+    "UserPolicy",
     "UserToGroupAddition",
     "UserToGroupAdditionProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AccessKeyProperties(ResourceProperties):
-    Serial = attrib(default=None)
-    Status = attrib(default=None)
-    UserName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class AccessKey(Resource):
-    """A Access Key for IAM.
-
-    See Also:
-        `AWS Cloud Formation documentation for AccessKey
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-accesskey.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::IAM::AccessKey"
-
-    Properties: AccessKeyProperties = attrib(
-        factory=AccessKeyProperties,
-        converter=create_object_converter(AccessKeyProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class GroupProperties(ResourceProperties):
-    GroupName = attrib(default=None)
-    ManagedPolicyArns = attrib(default=None)
-    Path = attrib(default=None)
-    Policies = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Group(Resource):
-    """A Group for IAM.
-
-    See Also:
-        `AWS Cloud Formation documentation for Group
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-group.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::IAM::Group"
-
-    Properties: GroupProperties = attrib(
-        factory=GroupProperties, converter=create_object_converter(GroupProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class InstanceProfileProperties(ResourceProperties):
-    InstanceProfileName = attrib(default=None)
-    Path = attrib(default=None)
-    Roles = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class InstanceProfile(Resource):
-    """A Instance Profile for IAM.
-
-    See Also:
-        `AWS Cloud Formation documentation for InstanceProfile
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-instanceprofile.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::IAM::InstanceProfile"
-
-    Properties: InstanceProfileProperties = attrib(
-        factory=InstanceProfileProperties,
-        converter=create_object_converter(InstanceProfileProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class ManagedPolicyProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Groups = attrib(default=None)
-    ManagedPolicyName = attrib(default=None)
-    Path = attrib(default=None)
-    PolicyDocument = attrib(default=None)
-    Roles = attrib(default=None)
-    Users = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ManagedPolicy(Resource):
-    """A Managed Policy for IAM.
-
-    See Also:
-        `AWS Cloud Formation documentation for ManagedPolicy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-managedpolicy.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::IAM::ManagedPolicy"
-
-    Properties: ManagedPolicyProperties = attrib(
-        factory=ManagedPolicyProperties,
-        converter=create_object_converter(ManagedPolicyProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class PolicyProperties(ResourceProperties):
-    Groups = attrib(default=None)
-    PolicyDocument = attrib(default=None)
-    PolicyName = attrib(default=None)
-    Roles = attrib(default=None)
-    Users = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Policy(Resource):
-    """A Policy for IAM.
-
-    See Also:
-        `AWS Cloud Formation documentation for Policy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-policy.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::IAM::Policy"
-
-    Properties: PolicyProperties = attrib(
-        factory=PolicyProperties, converter=create_object_converter(PolicyProperties)
+def _create_AccessKey():
+    class AccessKeyProperties(_ResourceProperties):
+        __slots__ = ("Serial", "Status", "UserName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AccessKeyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Serial=None, Status=None, UserName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Serial", Serial)
+            _setattr("Status", Status)
+            _setattr("UserName", UserName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AccessKeyProperties = create_object_converter(AccessKeyProperties)
+
+    class AccessKey(_Resource):
+        """A Access Key for IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccessKey
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-accesskey.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IAM::AccessKey"
+
+        Properties: AccessKeyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AccessKey",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AccessKeyProperties},
+            factories={"Properties": AccessKeyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AccessKeyProperties()
+            _setattr("Properties", _convert_AccessKeyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return AccessKey, AccessKeyProperties
+
+
+def _create_Group():
+    class GroupPolicy(_PropertyType):
+        """The Policy property type for Group in IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Policy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-policy.html>`_
+        """
+
+        __slots__ = ("PolicyDocument", "PolicyName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GroupPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PolicyDocument=None, PolicyName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PolicyDocument", PolicyDocument)
+            _setattr("PolicyName", PolicyName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_GroupPolicy_list = create_object_list_converter(GroupPolicy)
+
+    class GroupProperties(_ResourceProperties):
+        __slots__ = ("GroupName", "ManagedPolicyArns", "Path", "Policies")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Policies": _convert_GroupPolicy_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            GroupName=None,
+            ManagedPolicyArns=None,
+            Path=None,
+            Policies=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GroupName", GroupName)
+            _setattr("ManagedPolicyArns", ManagedPolicyArns)
+            _setattr("Path", Path)
+            _setattr("Policies", _convert_GroupPolicy_list(Policies))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GroupProperties = create_object_converter(GroupProperties)
+
+    class Group(_Resource):
+        """A Group for IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Group
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-group.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IAM::Group"
+
+        Properties: GroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Group",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GroupProperties},
+            factories={"Properties": GroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GroupProperties()
+            _setattr("Properties", _convert_GroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Group, GroupProperties, GroupPolicy
+
+
+def _create_InstanceProfile():
+    class InstanceProfileProperties(_ResourceProperties):
+        __slots__ = ("InstanceProfileName", "Path", "Roles")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceProfileProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InstanceProfileName=None, Path=None, Roles=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InstanceProfileName", InstanceProfileName)
+            _setattr("Path", Path)
+            _setattr("Roles", Roles)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InstanceProfileProperties = create_object_converter(
+        InstanceProfileProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RoleProperties(ResourceProperties):
-    AssumeRolePolicyDocument = attrib(default=None)
-    Description = attrib(default=None)
-    ManagedPolicyArns = attrib(default=None)
-    MaxSessionDuration = attrib(default=None)
-    Path = attrib(default=None)
-    PermissionsBoundary = attrib(default=None)
-    Policies = attrib(default=None)
-    RoleName = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Role(Resource):
-    """A Role for IAM.
-
-    See Also:
-        `AWS Cloud Formation documentation for Role
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-role.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::IAM::Role"
-
-    Properties: RoleProperties = attrib(
-        factory=RoleProperties, converter=create_object_converter(RoleProperties)
+    class InstanceProfile(_Resource):
+        """A Instance Profile for IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceProfile
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-instanceprofile.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IAM::InstanceProfile"
+
+        Properties: InstanceProfileProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceProfile",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InstanceProfileProperties},
+            factories={"Properties": InstanceProfileProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InstanceProfileProperties()
+            _setattr("Properties", _convert_InstanceProfileProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return InstanceProfile, InstanceProfileProperties
+
+
+def _create_ManagedPolicy():
+    class ManagedPolicyProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "Groups",
+            "ManagedPolicyName",
+            "Path",
+            "PolicyDocument",
+            "Roles",
+            "Users",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ManagedPolicyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Groups=None,
+            ManagedPolicyName=None,
+            Path=None,
+            PolicyDocument=None,
+            Roles=None,
+            Users=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Groups", Groups)
+            _setattr("ManagedPolicyName", ManagedPolicyName)
+            _setattr("Path", Path)
+            _setattr("PolicyDocument", PolicyDocument)
+            _setattr("Roles", Roles)
+            _setattr("Users", Users)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ManagedPolicyProperties = create_object_converter(ManagedPolicyProperties)
+
+    class ManagedPolicy(_Resource):
+        """A Managed Policy for IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for ManagedPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-managedpolicy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IAM::ManagedPolicy"
+
+        Properties: ManagedPolicyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ManagedPolicy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ManagedPolicyProperties},
+            factories={"Properties": ManagedPolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ManagedPolicyProperties()
+            _setattr("Properties", _convert_ManagedPolicyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ManagedPolicy, ManagedPolicyProperties
+
+
+def _create_Policy():
+    class PolicyProperties(_ResourceProperties):
+        __slots__ = ("Groups", "PolicyDocument", "PolicyName", "Roles", "Users")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PolicyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Groups=None,
+            PolicyDocument=None,
+            PolicyName=None,
+            Roles=None,
+            Users=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Groups", Groups)
+            _setattr("PolicyDocument", PolicyDocument)
+            _setattr("PolicyName", PolicyName)
+            _setattr("Roles", Roles)
+            _setattr("Users", Users)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PolicyProperties = create_object_converter(PolicyProperties)
+
+    class Policy(_Resource):
+        """A Policy for IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Policy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-policy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IAM::Policy"
+
+        Properties: PolicyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Policy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PolicyProperties},
+            factories={"Properties": PolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PolicyProperties()
+            _setattr("Properties", _convert_PolicyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Policy, PolicyProperties
+
+
+def _create_Role():
+    class RolePolicy(_PropertyType):
+        """The Policy property type for Role in IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Policy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-policy.html>`_
+        """
+
+        __slots__ = ("PolicyDocument", "PolicyName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RolePolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PolicyDocument=None, PolicyName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PolicyDocument", PolicyDocument)
+            _setattr("PolicyName", PolicyName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RolePolicy_list = create_object_list_converter(RolePolicy)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class RoleProperties(_ResourceProperties):
+        __slots__ = (
+            "AssumeRolePolicyDocument",
+            "Description",
+            "ManagedPolicyArns",
+            "MaxSessionDuration",
+            "Path",
+            "PermissionsBoundary",
+            "Policies",
+            "RoleName",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RoleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Policies": _convert_RolePolicy_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssumeRolePolicyDocument=None,
+            Description=None,
+            ManagedPolicyArns=None,
+            MaxSessionDuration=None,
+            Path=None,
+            PermissionsBoundary=None,
+            Policies=None,
+            RoleName=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssumeRolePolicyDocument", AssumeRolePolicyDocument)
+            _setattr("Description", Description)
+            _setattr("ManagedPolicyArns", ManagedPolicyArns)
+            _setattr("MaxSessionDuration", MaxSessionDuration)
+            _setattr("Path", Path)
+            _setattr("PermissionsBoundary", PermissionsBoundary)
+            _setattr("Policies", _convert_RolePolicy_list(Policies))
+            _setattr("RoleName", RoleName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RoleProperties = create_object_converter(RoleProperties)
+
+    class Role(_Resource):
+        """A Role for IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Role
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-role.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IAM::Role"
+
+        Properties: RoleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Role",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RoleProperties},
+            factories={"Properties": RoleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RoleProperties()
+            _setattr("Properties", _convert_RoleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Role, RoleProperties, RolePolicy
+
+
+def _create_ServiceLinkedRole():
+    class ServiceLinkedRoleProperties(_ResourceProperties):
+        __slots__ = ("AWSServiceName", "CustomSuffix", "Description")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceLinkedRoleProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AWSServiceName=None, CustomSuffix=None, Description=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AWSServiceName", AWSServiceName)
+            _setattr("CustomSuffix", CustomSuffix)
+            _setattr("Description", Description)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ServiceLinkedRoleProperties = create_object_converter(
+        ServiceLinkedRoleProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ServiceLinkedRoleProperties(ResourceProperties):
-    AWSServiceName = attrib(default=None)
-    CustomSuffix = attrib(default=None)
-    Description = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ServiceLinkedRole(Resource):
-    """A Service Linked Role for IAM.
-
-    See Also:
-        `AWS Cloud Formation documentation for ServiceLinkedRole
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-servicelinkedrole.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::IAM::ServiceLinkedRole"
-
-    Properties: ServiceLinkedRoleProperties = attrib(
-        factory=ServiceLinkedRoleProperties,
-        converter=create_object_converter(ServiceLinkedRoleProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class UserProperties(ResourceProperties):
-    Groups = attrib(default=None)
-    LoginProfile = attrib(default=None)
-    ManagedPolicyArns = attrib(default=None)
-    Path = attrib(default=None)
-    PermissionsBoundary = attrib(default=None)
-    Policies = attrib(default=None)
-    Tags = attrib(default=None)
-    UserName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class User(Resource):
-    """A User for IAM.
-
-    See Also:
-        `AWS Cloud Formation documentation for User
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-user.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::IAM::User"
-
-    Properties: UserProperties = attrib(
-        factory=UserProperties, converter=create_object_converter(UserProperties)
+    class ServiceLinkedRole(_Resource):
+        """A Service Linked Role for IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for ServiceLinkedRole
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iam-servicelinkedrole.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IAM::ServiceLinkedRole"
+
+        Properties: ServiceLinkedRoleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceLinkedRole",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ServiceLinkedRoleProperties},
+            factories={"Properties": ServiceLinkedRoleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ServiceLinkedRoleProperties()
+            _setattr("Properties", _convert_ServiceLinkedRoleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ServiceLinkedRole, ServiceLinkedRoleProperties
+
+
+def _create_User():
+    class UserLoginProfile(_PropertyType):
+        """The Login Profile property type for User in IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoginProfile
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-user-loginprofile.html>`_
+        """
+
+        __slots__ = ("Password", "PasswordResetRequired")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserLoginProfile", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Password=None, PasswordResetRequired=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Password", Password)
+            _setattr("PasswordResetRequired", PasswordResetRequired)
+            _init_PropertyType(self, kwargs)
+
+    class UserPolicy(_PropertyType):
+        """The Policy property type for User in IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Policy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-policy.html>`_
+        """
+
+        __slots__ = ("PolicyDocument", "PolicyName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PolicyDocument=None, PolicyName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PolicyDocument", PolicyDocument)
+            _setattr("PolicyName", PolicyName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_UserLoginProfile = create_object_converter(UserLoginProfile)
+    _convert_UserPolicy_list = create_object_list_converter(UserPolicy)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class UserProperties(_ResourceProperties):
+        __slots__ = (
+            "Groups",
+            "LoginProfile",
+            "ManagedPolicyArns",
+            "Path",
+            "PermissionsBoundary",
+            "Policies",
+            "Tags",
+            "UserName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LoginProfile": _convert_UserLoginProfile,
+                "Policies": _convert_UserPolicy_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Groups=None,
+            LoginProfile=None,
+            ManagedPolicyArns=None,
+            Path=None,
+            PermissionsBoundary=None,
+            Policies=None,
+            Tags=None,
+            UserName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Groups", Groups)
+            _setattr("LoginProfile", _convert_UserLoginProfile(LoginProfile))
+            _setattr("ManagedPolicyArns", ManagedPolicyArns)
+            _setattr("Path", Path)
+            _setattr("PermissionsBoundary", PermissionsBoundary)
+            _setattr("Policies", _convert_UserPolicy_list(Policies))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("UserName", UserName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserProperties = create_object_converter(UserProperties)
+
+    class User(_Resource):
+        """A User for IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for User
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-user.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IAM::User"
+
+        Properties: UserProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "User",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserProperties},
+            factories={"Properties": UserProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserProperties()
+            _setattr("Properties", _convert_UserProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return User, UserProperties, UserLoginProfile, UserPolicy
+
+
+def _create_UserToGroupAddition():
+    class UserToGroupAdditionProperties(_ResourceProperties):
+        __slots__ = ("GroupName", "Users")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserToGroupAdditionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, GroupName=None, Users=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("GroupName", GroupName)
+            _setattr("Users", Users)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserToGroupAdditionProperties = create_object_converter(
+        UserToGroupAdditionProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class UserToGroupAdditionProperties(ResourceProperties):
-    GroupName = attrib(default=None)
-    Users = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class UserToGroupAddition(Resource):
-    """A User To Group Addition for IAM.
-
-    See Also:
-        `AWS Cloud Formation documentation for UserToGroupAddition
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-addusertogroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::IAM::UserToGroupAddition"
-
-    Properties: UserToGroupAdditionProperties = attrib(
-        factory=UserToGroupAdditionProperties,
-        converter=create_object_converter(UserToGroupAdditionProperties),
-    )
+    class UserToGroupAddition(_Resource):
+        """A User To Group Addition for IAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserToGroupAddition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iam-addusertogroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IAM::UserToGroupAddition"
+
+        Properties: UserToGroupAdditionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserToGroupAddition",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserToGroupAdditionProperties},
+            factories={"Properties": UserToGroupAdditionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserToGroupAdditionProperties()
+            _setattr("Properties", _convert_UserToGroupAdditionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return UserToGroupAddition, UserToGroupAdditionProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "AccessKey": _create_AccessKey,
+        "AccessKeyProperties": _create_AccessKey,
+        "Group": _create_Group,
+        "GroupProperties": _create_Group,
+        "GroupPolicy": _create_Group,
+        "InstanceProfile": _create_InstanceProfile,
+        "InstanceProfileProperties": _create_InstanceProfile,
+        "ManagedPolicy": _create_ManagedPolicy,
+        "ManagedPolicyProperties": _create_ManagedPolicy,
+        "Policy": _create_Policy,
+        "PolicyProperties": _create_Policy,
+        "Role": _create_Role,
+        "RoleProperties": _create_Role,
+        "RolePolicy": _create_Role,
+        "ServiceLinkedRole": _create_ServiceLinkedRole,
+        "ServiceLinkedRoleProperties": _create_ServiceLinkedRole,
+        "User": _create_User,
+        "UserProperties": _create_User,
+        "UserLoginProfile": _create_User,
+        "UserPolicy": _create_User,
+        "UserToGroupAddition": _create_UserToGroupAddition,
+        "UserToGroupAdditionProperties": _create_UserToGroupAddition,
+    },
+)
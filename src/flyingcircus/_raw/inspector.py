@@ -7,13 +7,19 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "AssessmentTarget",
@@ -25,72 +31,211 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AssessmentTargetProperties(ResourceProperties):
-    AssessmentTargetName = attrib(default=None)
-    ResourceGroupArn = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class AssessmentTarget(Resource):
-    """A Assessment Target for Inspector.
-
-    See Also:
-        `AWS Cloud Formation documentation for AssessmentTarget
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-inspector-assessmenttarget.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Inspector::AssessmentTarget"
-
-    Properties: AssessmentTargetProperties = attrib(
-        factory=AssessmentTargetProperties,
-        converter=create_object_converter(AssessmentTargetProperties),
+def _create_AssessmentTarget():
+    class AssessmentTargetProperties(_ResourceProperties):
+        __slots__ = ("AssessmentTargetName", "ResourceGroupArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AssessmentTargetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AssessmentTargetName=None, ResourceGroupArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssessmentTargetName", AssessmentTargetName)
+            _setattr("ResourceGroupArn", ResourceGroupArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AssessmentTargetProperties = create_object_converter(
+        AssessmentTargetProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class AssessmentTemplateProperties(ResourceProperties):
-    AssessmentTargetArn = attrib(default=None)
-    AssessmentTemplateName = attrib(default=None)
-    DurationInSeconds = attrib(default=None)
-    RulesPackageArns = attrib(default=None)
-    UserAttributesForFindings = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class AssessmentTemplate(Resource):
-    """A Assessment Template for Inspector.
-
-    See Also:
-        `AWS Cloud Formation documentation for AssessmentTemplate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-inspector-assessmenttemplate.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Inspector::AssessmentTemplate"
-
-    Properties: AssessmentTemplateProperties = attrib(
-        factory=AssessmentTemplateProperties,
-        converter=create_object_converter(AssessmentTemplateProperties),
+    class AssessmentTarget(_Resource):
+        """A Assessment Target for Inspector.
+
+        See Also:
+            `AWS Cloud Formation documentation for AssessmentTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-inspector-assessmenttarget.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Inspector::AssessmentTarget"
+
+        Properties: AssessmentTargetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AssessmentTarget",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AssessmentTargetProperties},
+            factories={"Properties": AssessmentTargetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AssessmentTargetProperties()
+            _setattr("Properties", _convert_AssessmentTargetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return AssessmentTarget, AssessmentTargetProperties
+
+
+def _create_AssessmentTemplate():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class AssessmentTemplateProperties(_ResourceProperties):
+        __slots__ = (
+            "AssessmentTargetArn",
+            "AssessmentTemplateName",
+            "DurationInSeconds",
+            "RulesPackageArns",
+            "UserAttributesForFindings",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AssessmentTemplateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"UserAttributesForFindings": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssessmentTargetArn=None,
+            AssessmentTemplateName=None,
+            DurationInSeconds=None,
+            RulesPackageArns=None,
+            UserAttributesForFindings=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssessmentTargetArn", AssessmentTargetArn)
+            _setattr("AssessmentTemplateName", AssessmentTemplateName)
+            _setattr("DurationInSeconds", DurationInSeconds)
+            _setattr("RulesPackageArns", RulesPackageArns)
+            _setattr(
+                "UserAttributesForFindings",
+                _convert_Tag_list(UserAttributesForFindings),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AssessmentTemplateProperties = create_object_converter(
+        AssessmentTemplateProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ResourceGroupProperties(ResourceProperties):
-    ResourceGroupTags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ResourceGroup(Resource):
-    """A Resource Group for Inspector.
-
-    See Also:
-        `AWS Cloud Formation documentation for ResourceGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-inspector-resourcegroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Inspector::ResourceGroup"
-
-    Properties: ResourceGroupProperties = attrib(
-        factory=ResourceGroupProperties,
-        converter=create_object_converter(ResourceGroupProperties),
-    )
+    class AssessmentTemplate(_Resource):
+        """A Assessment Template for Inspector.
+
+        See Also:
+            `AWS Cloud Formation documentation for AssessmentTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-inspector-assessmenttemplate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Inspector::AssessmentTemplate"
+
+        Properties: AssessmentTemplateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AssessmentTemplate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AssessmentTemplateProperties},
+            factories={"Properties": AssessmentTemplateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AssessmentTemplateProperties()
+            _setattr("Properties", _convert_AssessmentTemplateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return AssessmentTemplate, AssessmentTemplateProperties
+
+
+def _create_ResourceGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ResourceGroupProperties(_ResourceProperties):
+        __slots__ = ("ResourceGroupTags",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"ResourceGroupTags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceGroupTags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceGroupTags", _convert_Tag_list(ResourceGroupTags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResourceGroupProperties = create_object_converter(ResourceGroupProperties)
+
+    class ResourceGroup(_Resource):
+        """A Resource Group for Inspector.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-inspector-resourcegroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Inspector::ResourceGroup"
+        TAG_PROPERTY = "ResourceGroupTags"
+
+        Properties: ResourceGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResourceGroupProperties},
+            factories={"Properties": ResourceGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResourceGroupProperties()
+            _setattr("Properties", _convert_ResourceGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ResourceGroup, ResourceGroupProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "AssessmentTarget": _create_AssessmentTarget,
+        "AssessmentTargetProperties": _create_AssessmentTarget,
+        "AssessmentTemplate": _create_AssessmentTemplate,
+        "AssessmentTemplateProperties": _create_AssessmentTemplate,
+        "ResourceGroup": _create_ResourceGroup,
+        "ResourceGroupProperties": _create_ResourceGroup,
+    },
+)
@@ -7,13 +7,20 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Certificate",
@@ -24,144 +31,1054 @@ __all__ = [
     "PolicyPrincipalAttachmentProperties",
     "Thing",
     "ThingProperties",
+    "ThingAttributePayload",
     "ThingPrincipalAttachment",
     "ThingPrincipalAttachmentProperties",
     "TopicRule",
     "TopicRuleProperties",
+    "TopicRuleAction",
+    "TopicRuleCloudwatchAlarmAction",
+    "TopicRuleCloudwatchMetricAction",
+    "TopicRuleDynamoDBAction",
+    "TopicRuleDynamoDBv2Action",
+    "TopicRuleElasticsearchAction",
+    "TopicRuleFirehoseAction",
+    "TopicRuleIotAnalyticsAction",
+    "TopicRuleKinesisAction",
+    "TopicRuleLambdaAction",
+    "TopicRulePutItemInput",
+    "TopicRuleRepublishAction",
+    "TopicRuleS3Action",
+    "TopicRuleSnsAction",
+    "TopicRuleSqsAction",
+    "TopicRuleStepFunctionsAction",
+    "TopicRuleTopicRulePayload",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class CertificateProperties(ResourceProperties):
-    CertificateSigningRequest = attrib(default=None)
-    Status = attrib(default=None)
+def _create_Certificate():
+    class CertificateProperties(_ResourceProperties):
+        __slots__ = ("CertificateSigningRequest", "Status")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CertificateProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self, *, CertificateSigningRequest=None, Status=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateSigningRequest", CertificateSigningRequest)
+            _setattr("Status", Status)
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Certificate(Resource):
-    """A Certificate for IoT.
+    _convert_CertificateProperties = create_object_converter(CertificateProperties)
 
-    See Also:
-        `AWS Cloud Formation documentation for Certificate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-certificate.html>`_
-    """
+    class Certificate(_Resource):
+        """A Certificate for IoT.
 
-    RESOURCE_TYPE = "AWS::IoT::Certificate"
+        See Also:
+            `AWS Cloud Formation documentation for Certificate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-certificate.html>`_
+        """
 
-    Properties: CertificateProperties = attrib(
-        factory=CertificateProperties,
-        converter=create_object_converter(CertificateProperties),
-    )
+        RESOURCE_TYPE = "AWS::IoT::Certificate"
+
+        Properties: CertificateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Certificate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CertificateProperties},
+            factories={"Properties": CertificateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CertificateProperties()
+            _setattr("Properties", _convert_CertificateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Certificate, CertificateProperties
+
+
+def _create_Policy():
+    class PolicyProperties(_ResourceProperties):
+        __slots__ = ("PolicyDocument", "PolicyName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PolicyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PolicyDocument=None, PolicyName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PolicyDocument", PolicyDocument)
+            _setattr("PolicyName", PolicyName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PolicyProperties = create_object_converter(PolicyProperties)
+
+    class Policy(_Resource):
+        """A Policy for IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for Policy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-policy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoT::Policy"
+
+        Properties: PolicyProperties
 
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Policy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PolicyProperties},
+            factories={"Properties": PolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class PolicyProperties(ResourceProperties):
-    PolicyDocument = attrib(default=None)
-    PolicyName = attrib(default=None)
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PolicyProperties()
+            _setattr("Properties", _convert_PolicyProperties(Properties))
+            _init_Resource(self, kwargs)
 
+    return Policy, PolicyProperties
 
-@attrs(**ATTRSCONFIG)
-class Policy(Resource):
-    """A Policy for IoT.
 
-    See Also:
-        `AWS Cloud Formation documentation for Policy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-policy.html>`_
-    """
+def _create_PolicyPrincipalAttachment():
+    class PolicyPrincipalAttachmentProperties(_ResourceProperties):
+        __slots__ = ("PolicyName", "Principal")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PolicyPrincipalAttachmentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::IoT::Policy"
+        def __init__(self, *, PolicyName=None, Principal=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PolicyName", PolicyName)
+            _setattr("Principal", Principal)
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: PolicyProperties = attrib(
-        factory=PolicyProperties, converter=create_object_converter(PolicyProperties)
+    _convert_PolicyPrincipalAttachmentProperties = create_object_converter(
+        PolicyPrincipalAttachmentProperties
     )
 
+    class PolicyPrincipalAttachment(_Resource):
+        """A Policy Principal Attachment for IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for PolicyPrincipalAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-policyprincipalattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoT::PolicyPrincipalAttachment"
+
+        Properties: PolicyPrincipalAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PolicyPrincipalAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PolicyPrincipalAttachmentProperties},
+            factories={"Properties": PolicyPrincipalAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PolicyPrincipalAttachmentProperties()
+            _setattr(
+                "Properties", _convert_PolicyPrincipalAttachmentProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return PolicyPrincipalAttachment, PolicyPrincipalAttachmentProperties
+
+
+def _create_Thing():
+    class ThingAttributePayload(_PropertyType):
+        """The Attribute Payload property type for Thing in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for AttributePayload
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-thing-attributepayload.html>`_
+        """
+
+        __slots__ = ("Attributes",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ThingAttributePayload", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Attributes=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", Attributes)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ThingAttributePayload = create_object_converter(ThingAttributePayload)
+
+    class ThingProperties(_ResourceProperties):
+        __slots__ = ("AttributePayload", "ThingName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ThingProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"AttributePayload": _convert_ThingAttributePayload},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AttributePayload=None, ThingName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AttributePayload", _convert_ThingAttributePayload(AttributePayload)
+            )
+            _setattr("ThingName", ThingName)
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class PolicyPrincipalAttachmentProperties(ResourceProperties):
-    PolicyName = attrib(default=None)
-    Principal = attrib(default=None)
+    _convert_ThingProperties = create_object_converter(ThingProperties)
 
+    class Thing(_Resource):
+        """A Thing for IoT.
 
-@attrs(**ATTRSCONFIG)
-class PolicyPrincipalAttachment(Resource):
-    """A Policy Principal Attachment for IoT.
+        See Also:
+            `AWS Cloud Formation documentation for Thing
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-thing.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for PolicyPrincipalAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-policyprincipalattachment.html>`_
-    """
+        RESOURCE_TYPE = "AWS::IoT::Thing"
 
-    RESOURCE_TYPE = "AWS::IoT::PolicyPrincipalAttachment"
+        Properties: ThingProperties
 
-    Properties: PolicyPrincipalAttachmentProperties = attrib(
-        factory=PolicyPrincipalAttachmentProperties,
-        converter=create_object_converter(PolicyPrincipalAttachmentProperties),
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Thing",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ThingProperties},
+            factories={"Properties": ThingProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ThingProperties()
+            _setattr("Properties", _convert_ThingProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Thing, ThingProperties, ThingAttributePayload
+
+
+def _create_ThingPrincipalAttachment():
+    class ThingPrincipalAttachmentProperties(_ResourceProperties):
+        __slots__ = ("Principal", "ThingName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ThingPrincipalAttachmentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Principal=None, ThingName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Principal", Principal)
+            _setattr("ThingName", ThingName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ThingPrincipalAttachmentProperties = create_object_converter(
+        ThingPrincipalAttachmentProperties
     )
 
+    class ThingPrincipalAttachment(_Resource):
+        """A Thing Principal Attachment for IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for ThingPrincipalAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-thingprincipalattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoT::ThingPrincipalAttachment"
+
+        Properties: ThingPrincipalAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ThingPrincipalAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ThingPrincipalAttachmentProperties},
+            factories={"Properties": ThingPrincipalAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ThingPrincipalAttachmentProperties()
+            _setattr(
+                "Properties", _convert_ThingPrincipalAttachmentProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return ThingPrincipalAttachment, ThingPrincipalAttachmentProperties
+
+
+def _create_TopicRule():
+    class TopicRuleCloudwatchAlarmAction(_PropertyType):
+        """The Cloudwatch Alarm Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudwatchAlarmAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-cloudwatchalarmaction.html>`_
+        """
+
+        __slots__ = ("AlarmName", "RoleArn", "StateReason", "StateValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleCloudwatchAlarmAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AlarmName=None,
+            RoleArn=None,
+            StateReason=None,
+            StateValue=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AlarmName", AlarmName)
+            _setattr("RoleArn", RoleArn)
+            _setattr("StateReason", StateReason)
+            _setattr("StateValue", StateValue)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleCloudwatchMetricAction(_PropertyType):
+        """The Cloudwatch Metric Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudwatchMetricAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-cloudwatchmetricaction.html>`_
+        """
+
+        __slots__ = (
+            "MetricName",
+            "MetricNamespace",
+            "MetricTimestamp",
+            "MetricUnit",
+            "MetricValue",
+            "RoleArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleCloudwatchMetricAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MetricName=None,
+            MetricNamespace=None,
+            MetricTimestamp=None,
+            MetricUnit=None,
+            MetricValue=None,
+            RoleArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MetricName", MetricName)
+            _setattr("MetricNamespace", MetricNamespace)
+            _setattr("MetricTimestamp", MetricTimestamp)
+            _setattr("MetricUnit", MetricUnit)
+            _setattr("MetricValue", MetricValue)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleDynamoDBAction(_PropertyType):
+        """The Dynamo Db Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for DynamoDBAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-dynamodbaction.html>`_
+        """
+
+        __slots__ = (
+            "HashKeyField",
+            "HashKeyType",
+            "HashKeyValue",
+            "PayloadField",
+            "RangeKeyField",
+            "RangeKeyType",
+            "RangeKeyValue",
+            "RoleArn",
+            "TableName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleDynamoDBAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            HashKeyField=None,
+            HashKeyType=None,
+            HashKeyValue=None,
+            PayloadField=None,
+            RangeKeyField=None,
+            RangeKeyType=None,
+            RangeKeyValue=None,
+            RoleArn=None,
+            TableName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HashKeyField", HashKeyField)
+            _setattr("HashKeyType", HashKeyType)
+            _setattr("HashKeyValue", HashKeyValue)
+            _setattr("PayloadField", PayloadField)
+            _setattr("RangeKeyField", RangeKeyField)
+            _setattr("RangeKeyType", RangeKeyType)
+            _setattr("RangeKeyValue", RangeKeyValue)
+            _setattr("RoleArn", RoleArn)
+            _setattr("TableName", TableName)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRulePutItemInput(_PropertyType):
+        """The Put Item Input property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for PutItemInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-putiteminput.html>`_
+        """
+
+        __slots__ = ("TableName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRulePutItemInput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ThingProperties(ResourceProperties):
-    AttributePayload = attrib(default=None)
-    ThingName = attrib(default=None)
+        def __init__(self, *, TableName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TableName", TableName)
+            _init_PropertyType(self, kwargs)
 
+    _convert_TopicRulePutItemInput = create_object_converter(TopicRulePutItemInput)
 
-@attrs(**ATTRSCONFIG)
-class Thing(Resource):
-    """A Thing for IoT.
+    class TopicRuleDynamoDBv2Action(_PropertyType):
+        """The Dynamo D Bv2 Action property type for TopicRule in IoT.
 
-    See Also:
-        `AWS Cloud Formation documentation for Thing
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-thing.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for DynamoDBv2Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-dynamodbv2action.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::IoT::Thing"
+        __slots__ = ("PutItem", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleDynamoDBv2Action",
+            _PropertyType,
+            __slots__,
+            converters={"PutItem": _convert_TopicRulePutItemInput},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ThingProperties = attrib(
-        factory=ThingProperties, converter=create_object_converter(ThingProperties)
+        def __init__(self, *, PutItem=None, RoleArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PutItem", _convert_TopicRulePutItemInput(PutItem))
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleElasticsearchAction(_PropertyType):
+        """The Elasticsearch Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticsearchAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-elasticsearchaction.html>`_
+        """
+
+        __slots__ = ("Endpoint", "Id", "Index", "RoleArn", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleElasticsearchAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Endpoint=None,
+            Id=None,
+            Index=None,
+            RoleArn=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Endpoint", Endpoint)
+            _setattr("Id", Id)
+            _setattr("Index", Index)
+            _setattr("RoleArn", RoleArn)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleFirehoseAction(_PropertyType):
+        """The Firehose Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for FirehoseAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-firehoseaction.html>`_
+        """
+
+        __slots__ = ("DeliveryStreamName", "RoleArn", "Separator")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleFirehoseAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeliveryStreamName=None, RoleArn=None, Separator=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeliveryStreamName", DeliveryStreamName)
+            _setattr("RoleArn", RoleArn)
+            _setattr("Separator", Separator)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleIotAnalyticsAction(_PropertyType):
+        """The Iot Analytics Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for IotAnalyticsAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-iotanalyticsaction.html>`_
+        """
+
+        __slots__ = ("ChannelName", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleIotAnalyticsAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ChannelName=None, RoleArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ChannelName", ChannelName)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleKinesisAction(_PropertyType):
+        """The Kinesis Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-kinesisaction.html>`_
+        """
+
+        __slots__ = ("PartitionKey", "RoleArn", "StreamName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleKinesisAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, PartitionKey=None, RoleArn=None, StreamName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PartitionKey", PartitionKey)
+            _setattr("RoleArn", RoleArn)
+            _setattr("StreamName", StreamName)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleLambdaAction(_PropertyType):
+        """The Lambda Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for LambdaAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-lambdaaction.html>`_
+        """
+
+        __slots__ = ("FunctionArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleLambdaAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FunctionArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FunctionArn", FunctionArn)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleRepublishAction(_PropertyType):
+        """The Republish Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for RepublishAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-republishaction.html>`_
+        """
+
+        __slots__ = ("RoleArn", "Topic")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleRepublishAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RoleArn=None, Topic=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RoleArn", RoleArn)
+            _setattr("Topic", Topic)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleS3Action(_PropertyType):
+        """The S3 Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-s3action.html>`_
+        """
+
+        __slots__ = ("BucketName", "Key", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleS3Action", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BucketName=None, Key=None, RoleArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketName", BucketName)
+            _setattr("Key", Key)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleSnsAction(_PropertyType):
+        """The Sns Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for SnsAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-snsaction.html>`_
+        """
+
+        __slots__ = ("MessageFormat", "RoleArn", "TargetArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleSnsAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, MessageFormat=None, RoleArn=None, TargetArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MessageFormat", MessageFormat)
+            _setattr("RoleArn", RoleArn)
+            _setattr("TargetArn", TargetArn)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleSqsAction(_PropertyType):
+        """The Sqs Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for SqsAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-sqsaction.html>`_
+        """
+
+        __slots__ = ("QueueUrl", "RoleArn", "UseBase64")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleSqsAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, QueueUrl=None, RoleArn=None, UseBase64=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("QueueUrl", QueueUrl)
+            _setattr("RoleArn", RoleArn)
+            _setattr("UseBase64", UseBase64)
+            _init_PropertyType(self, kwargs)
+
+    class TopicRuleStepFunctionsAction(_PropertyType):
+        """The Step Functions Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for StepFunctionsAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-stepfunctionsaction.html>`_
+        """
+
+        __slots__ = ("ExecutionNamePrefix", "RoleArn", "StateMachineName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleStepFunctionsAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ExecutionNamePrefix=None,
+            RoleArn=None,
+            StateMachineName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExecutionNamePrefix", ExecutionNamePrefix)
+            _setattr("RoleArn", RoleArn)
+            _setattr("StateMachineName", StateMachineName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TopicRuleCloudwatchAlarmAction = create_object_converter(
+        TopicRuleCloudwatchAlarmAction
+    )
+    _convert_TopicRuleCloudwatchMetricAction = create_object_converter(
+        TopicRuleCloudwatchMetricAction
     )
+    _convert_TopicRuleDynamoDBAction = create_object_converter(TopicRuleDynamoDBAction)
+    _convert_TopicRuleDynamoDBv2Action = create_object_converter(
+        TopicRuleDynamoDBv2Action
+    )
+    _convert_TopicRuleElasticsearchAction = create_object_converter(
+        TopicRuleElasticsearchAction
+    )
+    _convert_TopicRuleFirehoseAction = create_object_converter(TopicRuleFirehoseAction)
+    _convert_TopicRuleIotAnalyticsAction = create_object_converter(
+        TopicRuleIotAnalyticsAction
+    )
+    _convert_TopicRuleKinesisAction = create_object_converter(TopicRuleKinesisAction)
+    _convert_TopicRuleLambdaAction = create_object_converter(TopicRuleLambdaAction)
+    _convert_TopicRuleRepublishAction = create_object_converter(
+        TopicRuleRepublishAction
+    )
+    _convert_TopicRuleS3Action = create_object_converter(TopicRuleS3Action)
+    _convert_TopicRuleSnsAction = create_object_converter(TopicRuleSnsAction)
+    _convert_TopicRuleSqsAction = create_object_converter(TopicRuleSqsAction)
+    _convert_TopicRuleStepFunctionsAction = create_object_converter(
+        TopicRuleStepFunctionsAction
+    )
+
+    class TopicRuleAction(_PropertyType):
+        """The Action property type for TopicRule in IoT.
+
+        See Also:
+            `AWS Cloud Formation documentation for Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-action.html>`_
+        """
 
+        __slots__ = (
+            "CloudwatchAlarm",
+            "CloudwatchMetric",
+            "DynamoDB",
+            "DynamoDBv2",
+            "Elasticsearch",
+            "Firehose",
+            "IotAnalytics",
+            "Kinesis",
+            "Lambda",
+            "Republish",
+            "S3",
+            "Sns",
+            "Sqs",
+            "StepFunctions",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudwatchAlarm": _convert_TopicRuleCloudwatchAlarmAction,
+                "CloudwatchMetric": _convert_TopicRuleCloudwatchMetricAction,
+                "DynamoDB": _convert_TopicRuleDynamoDBAction,
+                "DynamoDBv2": _convert_TopicRuleDynamoDBv2Action,
+                "Elasticsearch": _convert_TopicRuleElasticsearchAction,
+                "Firehose": _convert_TopicRuleFirehoseAction,
+                "IotAnalytics": _convert_TopicRuleIotAnalyticsAction,
+                "Kinesis": _convert_TopicRuleKinesisAction,
+                "Lambda": _convert_TopicRuleLambdaAction,
+                "Republish": _convert_TopicRuleRepublishAction,
+                "S3": _convert_TopicRuleS3Action,
+                "Sns": _convert_TopicRuleSnsAction,
+                "Sqs": _convert_TopicRuleSqsAction,
+                "StepFunctions": _convert_TopicRuleStepFunctionsAction,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ThingPrincipalAttachmentProperties(ResourceProperties):
-    Principal = attrib(default=None)
-    ThingName = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            CloudwatchAlarm=None,
+            CloudwatchMetric=None,
+            DynamoDB=None,
+            DynamoDBv2=None,
+            Elasticsearch=None,
+            Firehose=None,
+            IotAnalytics=None,
+            Kinesis=None,
+            Lambda=None,
+            Republish=None,
+            S3=None,
+            Sns=None,
+            Sqs=None,
+            StepFunctions=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudwatchAlarm",
+                _convert_TopicRuleCloudwatchAlarmAction(CloudwatchAlarm),
+            )
+            _setattr(
+                "CloudwatchMetric",
+                _convert_TopicRuleCloudwatchMetricAction(CloudwatchMetric),
+            )
+            _setattr("DynamoDB", _convert_TopicRuleDynamoDBAction(DynamoDB))
+            _setattr("DynamoDBv2", _convert_TopicRuleDynamoDBv2Action(DynamoDBv2))
+            _setattr(
+                "Elasticsearch", _convert_TopicRuleElasticsearchAction(Elasticsearch)
+            )
+            _setattr("Firehose", _convert_TopicRuleFirehoseAction(Firehose))
+            _setattr("IotAnalytics", _convert_TopicRuleIotAnalyticsAction(IotAnalytics))
+            _setattr("Kinesis", _convert_TopicRuleKinesisAction(Kinesis))
+            _setattr("Lambda", _convert_TopicRuleLambdaAction(Lambda))
+            _setattr("Republish", _convert_TopicRuleRepublishAction(Republish))
+            _setattr("S3", _convert_TopicRuleS3Action(S3))
+            _setattr("Sns", _convert_TopicRuleSnsAction(Sns))
+            _setattr("Sqs", _convert_TopicRuleSqsAction(Sqs))
+            _setattr(
+                "StepFunctions", _convert_TopicRuleStepFunctionsAction(StepFunctions)
+            )
+            _init_PropertyType(self, kwargs)
 
+    _convert_TopicRuleAction_list = create_object_list_converter(TopicRuleAction)
+    _convert_TopicRuleAction = create_object_converter(TopicRuleAction)
 
-@attrs(**ATTRSCONFIG)
-class ThingPrincipalAttachment(Resource):
-    """A Thing Principal Attachment for IoT.
+    class TopicRuleTopicRulePayload(_PropertyType):
+        """The Topic Rule Payload property type for TopicRule in IoT.
 
-    See Also:
-        `AWS Cloud Formation documentation for ThingPrincipalAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-thingprincipalattachment.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for TopicRulePayload
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot-topicrule-topicrulepayload.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::IoT::ThingPrincipalAttachment"
+        __slots__ = (
+            "Actions",
+            "AwsIotSqlVersion",
+            "Description",
+            "ErrorAction",
+            "RuleDisabled",
+            "Sql",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleTopicRulePayload",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Actions": _convert_TopicRuleAction_list,
+                "ErrorAction": _convert_TopicRuleAction,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ThingPrincipalAttachmentProperties = attrib(
-        factory=ThingPrincipalAttachmentProperties,
-        converter=create_object_converter(ThingPrincipalAttachmentProperties),
+        def __init__(
+            self,
+            *,
+            Actions=None,
+            AwsIotSqlVersion=None,
+            Description=None,
+            ErrorAction=None,
+            RuleDisabled=None,
+            Sql=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Actions", _convert_TopicRuleAction_list(Actions))
+            _setattr("AwsIotSqlVersion", AwsIotSqlVersion)
+            _setattr("Description", Description)
+            _setattr("ErrorAction", _convert_TopicRuleAction(ErrorAction))
+            _setattr("RuleDisabled", RuleDisabled)
+            _setattr("Sql", Sql)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TopicRuleTopicRulePayload = create_object_converter(
+        TopicRuleTopicRulePayload
     )
 
+    class TopicRuleProperties(_ResourceProperties):
+        __slots__ = ("RuleName", "TopicRulePayload")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"TopicRulePayload": _convert_TopicRuleTopicRulePayload},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RuleName=None, TopicRulePayload=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RuleName", RuleName)
+            _setattr(
+                "TopicRulePayload", _convert_TopicRuleTopicRulePayload(TopicRulePayload)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TopicRuleProperties = create_object_converter(TopicRuleProperties)
 
-@attrs(**ATTRSCONFIG)
-class TopicRuleProperties(ResourceProperties):
-    RuleName = attrib(default=None)
-    TopicRulePayload = attrib(default=None)
+    class TopicRule(_Resource):
+        """A Topic Rule for IoT.
 
+        See Also:
+            `AWS Cloud Formation documentation for TopicRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-topicrule.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class TopicRule(Resource):
-    """A Topic Rule for IoT.
+        RESOURCE_TYPE = "AWS::IoT::TopicRule"
 
-    See Also:
-        `AWS Cloud Formation documentation for TopicRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot-topicrule.html>`_
-    """
+        Properties: TopicRuleProperties
 
-    RESOURCE_TYPE = "AWS::IoT::TopicRule"
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TopicRuleProperties},
+            factories={"Properties": TopicRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: TopicRuleProperties = attrib(
-        factory=TopicRuleProperties,
-        converter=create_object_converter(TopicRuleProperties),
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TopicRuleProperties()
+            _setattr("Properties", _convert_TopicRuleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        TopicRule,
+        TopicRuleProperties,
+        TopicRuleCloudwatchAlarmAction,
+        TopicRuleCloudwatchMetricAction,
+        TopicRuleDynamoDBAction,
+        TopicRulePutItemInput,
+        TopicRuleDynamoDBv2Action,
+        TopicRuleElasticsearchAction,
+        TopicRuleFirehoseAction,
+        TopicRuleIotAnalyticsAction,
+        TopicRuleKinesisAction,
+        TopicRuleLambdaAction,
+        TopicRuleRepublishAction,
+        TopicRuleS3Action,
+        TopicRuleSnsAction,
+        TopicRuleSqsAction,
+        TopicRuleStepFunctionsAction,
+        TopicRuleAction,
+        TopicRuleTopicRulePayload,
     )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Certificate": _create_Certificate,
+        "CertificateProperties": _create_Certificate,
+        "Policy": _create_Policy,
+        "PolicyProperties": _create_Policy,
+        "PolicyPrincipalAttachment": _create_PolicyPrincipalAttachment,
+        "PolicyPrincipalAttachmentProperties": _create_PolicyPrincipalAttachment,
+        "Thing": _create_Thing,
+        "ThingProperties": _create_Thing,
+        "ThingAttributePayload": _create_Thing,
+        "ThingPrincipalAttachment": _create_ThingPrincipalAttachment,
+        "ThingPrincipalAttachmentProperties": _create_ThingPrincipalAttachment,
+        "TopicRule": _create_TopicRule,
+        "TopicRuleProperties": _create_TopicRule,
+        "TopicRuleAction": _create_TopicRule,
+        "TopicRuleCloudwatchAlarmAction": _create_TopicRule,
+        "TopicRuleCloudwatchMetricAction": _create_TopicRule,
+        "TopicRuleDynamoDBAction": _create_TopicRule,
+        "TopicRuleDynamoDBv2Action": _create_TopicRule,
+        "TopicRuleElasticsearchAction": _create_TopicRule,
+        "TopicRuleFirehoseAction": _create_TopicRule,
+        "TopicRuleIotAnalyticsAction": _create_TopicRule,
+        "TopicRuleKinesisAction": _create_TopicRule,
+        "TopicRuleLambdaAction": _create_TopicRule,
+        "TopicRulePutItemInput": _create_TopicRule,
+        "TopicRuleRepublishAction": _create_TopicRule,
+        "TopicRuleS3Action": _create_TopicRule,
+        "TopicRuleSnsAction": _create_TopicRule,
+        "TopicRuleSqsAction": _create_TopicRule,
+        "TopicRuleStepFunctionsAction": _create_TopicRule,
+        "TopicRuleTopicRulePayload": _create_TopicRule,
+    },
+)
@@ -7,14 +7,20 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
 __all__ = [
     "Device",
     "DeviceProperties",
@@ -22,74 +28,257 @@ __all__ = [
     "PlacementProperties",
     "Project",
     "ProjectProperties",
+    "ProjectDeviceTemplate",
+    "ProjectPlacementTemplate",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class DeviceProperties(ResourceProperties):
-    DeviceId = attrib(default=None)
-    Enabled = attrib(default=None)
+def _create_Device():
+    class DeviceProperties(_ResourceProperties):
+        __slots__ = ("DeviceId", "Enabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeviceProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, DeviceId=None, Enabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeviceId", DeviceId)
+            _setattr("Enabled", Enabled)
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Device(Resource):
-    """A Device for IoT1Click.
+    _convert_DeviceProperties = create_object_converter(DeviceProperties)
 
-    See Also:
-        `AWS Cloud Formation documentation for Device
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot1click-device.html>`_
-    """
+    class Device(_Resource):
+        """A Device for IoT1Click.
 
-    RESOURCE_TYPE = "AWS::IoT1Click::Device"
+        See Also:
+            `AWS Cloud Formation documentation for Device
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot1click-device.html>`_
+        """
 
-    Properties: DeviceProperties = attrib(
-        factory=DeviceProperties, converter=create_object_converter(DeviceProperties)
-    )
+        RESOURCE_TYPE = "AWS::IoT1Click::Device"
 
+        Properties: DeviceProperties
 
-@attrs(**ATTRSCONFIG)
-class PlacementProperties(ResourceProperties):
-    AssociatedDevices = attrib(default=None)
-    Attributes = attrib(default=None)
-    PlacementName = attrib(default=None)
-    ProjectName = attrib(default=None)
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Device",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DeviceProperties},
+            factories={"Properties": DeviceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DeviceProperties()
+            _setattr("Properties", _convert_DeviceProperties(Properties))
+            _init_Resource(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Placement(Resource):
-    """A Placement for IoT1Click.
+    return Device, DeviceProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for Placement
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot1click-placement.html>`_
-    """
 
-    RESOURCE_TYPE = "AWS::IoT1Click::Placement"
+def _create_Placement():
+    class PlacementProperties(_ResourceProperties):
+        __slots__ = ("AssociatedDevices", "Attributes", "PlacementName", "ProjectName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PlacementProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: PlacementProperties = attrib(
-        factory=PlacementProperties,
-        converter=create_object_converter(PlacementProperties),
-    )
+        def __init__(
+            self,
+            *,
+            AssociatedDevices=None,
+            Attributes=None,
+            PlacementName=None,
+            ProjectName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssociatedDevices", AssociatedDevices)
+            _setattr("Attributes", Attributes)
+            _setattr("PlacementName", PlacementName)
+            _setattr("ProjectName", ProjectName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PlacementProperties = create_object_converter(PlacementProperties)
+
+    class Placement(_Resource):
+        """A Placement for IoT1Click.
+
+        See Also:
+            `AWS Cloud Formation documentation for Placement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot1click-placement.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoT1Click::Placement"
+
+        Properties: PlacementProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Placement",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PlacementProperties},
+            factories={"Properties": PlacementProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PlacementProperties()
+            _setattr("Properties", _convert_PlacementProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Placement, PlacementProperties
+
+
+def _create_Project():
+    class ProjectDeviceTemplate(_PropertyType):
+        """The Device Template property type for Project in IoT1Click.
 
+        See Also:
+            `AWS Cloud Formation documentation for DeviceTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot1click-project-devicetemplate.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class ProjectProperties(ResourceProperties):
-    Description = attrib(default=None)
-    PlacementTemplate = attrib(default=None)
-    ProjectName = attrib(default=None)
+        __slots__ = ("CallbackOverrides", "DeviceType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectDeviceTemplate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self, *, CallbackOverrides=None, DeviceType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CallbackOverrides", CallbackOverrides)
+            _setattr("DeviceType", DeviceType)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Project(Resource):
-    """A Project for IoT1Click.
+    class ProjectPlacementTemplate(_PropertyType):
+        """The Placement Template property type for Project in IoT1Click.
 
-    See Also:
-        `AWS Cloud Formation documentation for Project
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot1click-project.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for PlacementTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iot1click-project-placementtemplate.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::IoT1Click::Project"
+        __slots__ = ("DefaultAttributes", "DeviceTemplates")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectPlacementTemplate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ProjectProperties = attrib(
-        factory=ProjectProperties, converter=create_object_converter(ProjectProperties)
+        def __init__(
+            self, *, DefaultAttributes=None, DeviceTemplates=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultAttributes", DefaultAttributes)
+            _setattr("DeviceTemplates", DeviceTemplates)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ProjectPlacementTemplate = create_object_converter(
+        ProjectPlacementTemplate
     )
+
+    class ProjectProperties(_ResourceProperties):
+        __slots__ = ("Description", "PlacementTemplate", "ProjectName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ProjectProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"PlacementTemplate": _convert_ProjectPlacementTemplate},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            PlacementTemplate=None,
+            ProjectName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr(
+                "PlacementTemplate",
+                _convert_ProjectPlacementTemplate(PlacementTemplate),
+            )
+            _setattr("ProjectName", ProjectName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ProjectProperties = create_object_converter(ProjectProperties)
+
+    class Project(_Resource):
+        """A Project for IoT1Click.
+
+        See Also:
+            `AWS Cloud Formation documentation for Project
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iot1click-project.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoT1Click::Project"
+
+        Properties: ProjectProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Project",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ProjectProperties},
+            factories={"Properties": ProjectProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ProjectProperties()
+            _setattr("Properties", _convert_ProjectProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Project, ProjectProperties, ProjectDeviceTemplate, ProjectPlacementTemplate
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Device": _create_Device,
+        "DeviceProperties": _create_Device,
+        "Placement": _create_Placement,
+        "PlacementProperties": _create_Placement,
+        "Project": _create_Project,
+        "ProjectProperties": _create_Project,
+        "ProjectDeviceTemplate": _create_Project,
+        "ProjectPlacementTemplate": _create_Project,
+    },
+)
@@ -7,121 +7,1642 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Channel",
     "ChannelProperties",
+    "ChannelChannelStorage",
+    "ChannelCustomerManagedS3",
+    "ChannelRetentionPeriod",
+    "ChannelServiceManagedS3",
     "Dataset",
     "DatasetProperties",
+    "DatasetAction",
+    "DatasetContainerAction",
+    "DatasetDatasetContentDeliveryRule",
+    "DatasetDatasetContentDeliveryRuleDestination",
+    "DatasetDatasetContentVersionValue",
+    "DatasetDeltaTime",
+    "DatasetFilter",
+    "DatasetGlueConfiguration",
+    "DatasetIotEventsDestinationConfiguration",
+    "DatasetOutputFileUriValue",
+    "DatasetQueryAction",
+    "DatasetResourceConfiguration",
+    "DatasetRetentionPeriod",
+    "DatasetS3DestinationConfiguration",
+    "DatasetSchedule",
+    "DatasetTrigger",
+    "DatasetTriggeringDataset",
+    "DatasetVariable",
+    "DatasetVersioningConfiguration",
     "Datastore",
     "DatastoreProperties",
+    "DatastoreCustomerManagedS3",
+    "DatastoreDatastoreStorage",
+    "DatastoreRetentionPeriod",
+    "DatastoreServiceManagedS3",
     "Pipeline",
     "PipelineProperties",
+    "PipelineActivity",
+    "PipelineAddAttributes",
+    "PipelineChannel",
+    "PipelineDatastore",
+    "PipelineDeviceRegistryEnrich",
+    "PipelineDeviceShadowEnrich",
+    "PipelineFilter",
+    "PipelineLambda",
+    "PipelineMath",
+    "PipelineRemoveAttributes",
+    "PipelineSelectAttributes",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ChannelProperties(ResourceProperties):
-    ChannelName = attrib(default=None)
-    ChannelStorage = attrib(default=None)
-    RetentionPeriod = attrib(default=None)
-    Tags = attrib(default=None)
+def _create_Channel():
+    class ChannelCustomerManagedS3(_PropertyType):
+        """The Customer Managed S3 property type for Channel in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomerManagedS3
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-channel-customermanageds3.html>`_
+        """
+
+        __slots__ = ("Bucket", "KeyPrefix", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelCustomerManagedS3", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Bucket=None, KeyPrefix=None, RoleArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("KeyPrefix", KeyPrefix)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class ChannelServiceManagedS3(_PropertyType):
+        """The Service Managed S3 property type for Channel in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for ServiceManagedS3
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-channel-servicemanageds3.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelServiceManagedS3", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelCustomerManagedS3 = create_object_converter(
+        ChannelCustomerManagedS3
+    )
+    _convert_ChannelServiceManagedS3 = create_object_converter(ChannelServiceManagedS3)
+
+    class ChannelChannelStorage(_PropertyType):
+        """The Channel Storage property type for Channel in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for ChannelStorage
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-channel-channelstorage.html>`_
+        """
+
+        __slots__ = ("CustomerManagedS3", "ServiceManagedS3")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelChannelStorage",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CustomerManagedS3": _convert_ChannelCustomerManagedS3,
+                "ServiceManagedS3": _convert_ChannelServiceManagedS3,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CustomerManagedS3=None, ServiceManagedS3=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CustomerManagedS3",
+                _convert_ChannelCustomerManagedS3(CustomerManagedS3),
+            )
+            _setattr(
+                "ServiceManagedS3", _convert_ChannelServiceManagedS3(ServiceManagedS3)
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ChannelRetentionPeriod(_PropertyType):
+        """The Retention Period property type for Channel in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for RetentionPeriod
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-channel-retentionperiod.html>`_
+        """
+
+        __slots__ = ("NumberOfDays", "Unlimited")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelRetentionPeriod", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, NumberOfDays=None, Unlimited=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NumberOfDays", NumberOfDays)
+            _setattr("Unlimited", Unlimited)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelChannelStorage = create_object_converter(ChannelChannelStorage)
+    _convert_ChannelRetentionPeriod = create_object_converter(ChannelRetentionPeriod)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ChannelProperties(_ResourceProperties):
+        __slots__ = ("ChannelName", "ChannelStorage", "RetentionPeriod", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ChannelStorage": _convert_ChannelChannelStorage,
+                "RetentionPeriod": _convert_ChannelRetentionPeriod,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ChannelName=None,
+            ChannelStorage=None,
+            RetentionPeriod=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ChannelName", ChannelName)
+            _setattr("ChannelStorage", _convert_ChannelChannelStorage(ChannelStorage))
+            _setattr(
+                "RetentionPeriod", _convert_ChannelRetentionPeriod(RetentionPeriod)
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ChannelProperties = create_object_converter(ChannelProperties)
+
+    class Channel(_Resource):
+        """A Channel for IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Channel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotanalytics-channel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoTAnalytics::Channel"
+
+        Properties: ChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Channel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ChannelProperties},
+            factories={"Properties": ChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ChannelProperties()
+            _setattr("Properties", _convert_ChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Channel,
+        ChannelProperties,
+        ChannelCustomerManagedS3,
+        ChannelServiceManagedS3,
+        ChannelChannelStorage,
+        ChannelRetentionPeriod,
+    )
+
+
+def _create_Dataset():
+    class DatasetDatasetContentVersionValue(_PropertyType):
+        """The Dataset Content Version Value property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for DatasetContentVersionValue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-variable-datasetcontentversionvalue.html>`_
+        """
+
+        __slots__ = ("DatasetName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetDatasetContentVersionValue", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DatasetName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DatasetName", DatasetName)
+            _init_PropertyType(self, kwargs)
+
+    class DatasetOutputFileUriValue(_PropertyType):
+        """The Output File Uri Value property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for OutputFileUriValue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-variable-outputfileurivalue.html>`_
+        """
+
+        __slots__ = ("FileName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetOutputFileUriValue", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FileName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FileName", FileName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetDatasetContentVersionValue = create_object_converter(
+        DatasetDatasetContentVersionValue
+    )
+    _convert_DatasetOutputFileUriValue = create_object_converter(
+        DatasetOutputFileUriValue
+    )
+
+    class DatasetVariable(_PropertyType):
+        """The Variable property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Variable
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-variable.html>`_
+        """
+
+        __slots__ = (
+            "DatasetContentVersionValue",
+            "DoubleValue",
+            "OutputFileUriValue",
+            "StringValue",
+            "VariableName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetVariable",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DatasetContentVersionValue": _convert_DatasetDatasetContentVersionValue,
+                "OutputFileUriValue": _convert_DatasetOutputFileUriValue,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DatasetContentVersionValue=None,
+            DoubleValue=None,
+            OutputFileUriValue=None,
+            StringValue=None,
+            VariableName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DatasetContentVersionValue",
+                _convert_DatasetDatasetContentVersionValue(DatasetContentVersionValue),
+            )
+            _setattr("DoubleValue", DoubleValue)
+            _setattr(
+                "OutputFileUriValue",
+                _convert_DatasetOutputFileUriValue(OutputFileUriValue),
+            )
+            _setattr("StringValue", StringValue)
+            _setattr("VariableName", VariableName)
+            _init_PropertyType(self, kwargs)
+
+    class DatasetResourceConfiguration(_PropertyType):
+        """The Resource Configuration property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-resourceconfiguration.html>`_
+        """
+
+        __slots__ = ("ComputeType", "VolumeSizeInGB")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetResourceConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ComputeType=None, VolumeSizeInGB=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComputeType", ComputeType)
+            _setattr("VolumeSizeInGB", VolumeSizeInGB)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetResourceConfiguration = create_object_converter(
+        DatasetResourceConfiguration
+    )
+    _convert_DatasetVariable_list = create_object_list_converter(DatasetVariable)
+
+    class DatasetContainerAction(_PropertyType):
+        """The Container Action property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for ContainerAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-containeraction.html>`_
+        """
+
+        __slots__ = ("ExecutionRoleArn", "Image", "ResourceConfiguration", "Variables")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetContainerAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ResourceConfiguration": _convert_DatasetResourceConfiguration,
+                "Variables": _convert_DatasetVariable_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ExecutionRoleArn=None,
+            Image=None,
+            ResourceConfiguration=None,
+            Variables=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExecutionRoleArn", ExecutionRoleArn)
+            _setattr("Image", Image)
+            _setattr(
+                "ResourceConfiguration",
+                _convert_DatasetResourceConfiguration(ResourceConfiguration),
+            )
+            _setattr("Variables", _convert_DatasetVariable_list(Variables))
+            _init_PropertyType(self, kwargs)
+
+    class DatasetDeltaTime(_PropertyType):
+        """The Delta Time property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeltaTime
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-deltatime.html>`_
+        """
+
+        __slots__ = ("OffsetSeconds", "TimeExpression")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetDeltaTime", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, OffsetSeconds=None, TimeExpression=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("OffsetSeconds", OffsetSeconds)
+            _setattr("TimeExpression", TimeExpression)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetDeltaTime = create_object_converter(DatasetDeltaTime)
+
+    class DatasetFilter(_PropertyType):
+        """The Filter property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Filter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-filter.html>`_
+        """
+
+        __slots__ = ("DeltaTime",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetFilter",
+            _PropertyType,
+            __slots__,
+            converters={"DeltaTime": _convert_DatasetDeltaTime},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DeltaTime=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeltaTime", _convert_DatasetDeltaTime(DeltaTime))
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetFilter_list = create_object_list_converter(DatasetFilter)
+
+    class DatasetQueryAction(_PropertyType):
+        """The Query Action property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for QueryAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-queryaction.html>`_
+        """
+
+        __slots__ = ("Filters", "SqlQuery")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetQueryAction",
+            _PropertyType,
+            __slots__,
+            converters={"Filters": _convert_DatasetFilter_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Filters=None, SqlQuery=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Filters", _convert_DatasetFilter_list(Filters))
+            _setattr("SqlQuery", SqlQuery)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetContainerAction = create_object_converter(DatasetContainerAction)
+    _convert_DatasetQueryAction = create_object_converter(DatasetQueryAction)
+
+    class DatasetAction(_PropertyType):
+        """The Action property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-action.html>`_
+        """
+
+        __slots__ = ("ActionName", "ContainerAction", "QueryAction")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ContainerAction": _convert_DatasetContainerAction,
+                "QueryAction": _convert_DatasetQueryAction,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ActionName=None, ContainerAction=None, QueryAction=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ActionName", ActionName)
+            _setattr(
+                "ContainerAction", _convert_DatasetContainerAction(ContainerAction)
+            )
+            _setattr("QueryAction", _convert_DatasetQueryAction(QueryAction))
+            _init_PropertyType(self, kwargs)
+
+    class DatasetIotEventsDestinationConfiguration(_PropertyType):
+        """The Iot Events Destination Configuration property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for IotEventsDestinationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-ioteventsdestinationconfiguration.html>`_
+        """
+
+        __slots__ = ("InputName", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetIotEventsDestinationConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, InputName=None, RoleArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InputName", InputName)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class DatasetGlueConfiguration(_PropertyType):
+        """The Glue Configuration property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for GlueConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-glueconfiguration.html>`_
+        """
+
+        __slots__ = ("DatabaseName", "TableName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetGlueConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DatabaseName=None, TableName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("TableName", TableName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetGlueConfiguration = create_object_converter(
+        DatasetGlueConfiguration
+    )
+
+    class DatasetS3DestinationConfiguration(_PropertyType):
+        """The S3 Destination Configuration property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3DestinationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-s3destinationconfiguration.html>`_
+        """
+
+        __slots__ = ("Bucket", "GlueConfiguration", "Key", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetS3DestinationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"GlueConfiguration": _convert_DatasetGlueConfiguration},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Bucket=None,
+            GlueConfiguration=None,
+            Key=None,
+            RoleArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr(
+                "GlueConfiguration",
+                _convert_DatasetGlueConfiguration(GlueConfiguration),
+            )
+            _setattr("Key", Key)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetIotEventsDestinationConfiguration = create_object_converter(
+        DatasetIotEventsDestinationConfiguration
+    )
+    _convert_DatasetS3DestinationConfiguration = create_object_converter(
+        DatasetS3DestinationConfiguration
+    )
+
+    class DatasetDatasetContentDeliveryRuleDestination(_PropertyType):
+        """The Dataset Content Delivery Rule Destination property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for DatasetContentDeliveryRuleDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-datasetcontentdeliveryruledestination.html>`_
+        """
+
+        __slots__ = ("IotEventsDestinationConfiguration", "S3DestinationConfiguration")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetDatasetContentDeliveryRuleDestination",
+            _PropertyType,
+            __slots__,
+            converters={
+                "IotEventsDestinationConfiguration": _convert_DatasetIotEventsDestinationConfiguration,
+                "S3DestinationConfiguration": _convert_DatasetS3DestinationConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            IotEventsDestinationConfiguration=None,
+            S3DestinationConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "IotEventsDestinationConfiguration",
+                _convert_DatasetIotEventsDestinationConfiguration(
+                    IotEventsDestinationConfiguration
+                ),
+            )
+            _setattr(
+                "S3DestinationConfiguration",
+                _convert_DatasetS3DestinationConfiguration(S3DestinationConfiguration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetDatasetContentDeliveryRuleDestination = create_object_converter(
+        DatasetDatasetContentDeliveryRuleDestination
+    )
+
+    class DatasetDatasetContentDeliveryRule(_PropertyType):
+        """The Dataset Content Delivery Rule property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for DatasetContentDeliveryRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-datasetcontentdeliveryrule.html>`_
+        """
+
+        __slots__ = ("Destination", "EntryName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetDatasetContentDeliveryRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Destination": _convert_DatasetDatasetContentDeliveryRuleDestination
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Destination=None, EntryName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Destination",
+                _convert_DatasetDatasetContentDeliveryRuleDestination(Destination),
+            )
+            _setattr("EntryName", EntryName)
+            _init_PropertyType(self, kwargs)
+
+    class DatasetRetentionPeriod(_PropertyType):
+        """The Retention Period property type for Dataset in IoTAnalytics.
 
+        See Also:
+            `AWS Cloud Formation documentation for RetentionPeriod
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-retentionperiod.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class Channel(Resource):
-    """A Channel for IoTAnalytics.
+        __slots__ = ("NumberOfDays", "Unlimited")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetRetentionPeriod", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for Channel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotanalytics-channel.html>`_
-    """
+        def __init__(self, *, NumberOfDays=None, Unlimited=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NumberOfDays", NumberOfDays)
+            _setattr("Unlimited", Unlimited)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::IoTAnalytics::Channel"
+    class DatasetSchedule(_PropertyType):
+        """The Schedule property type for Dataset in IoTAnalytics.
 
-    Properties: ChannelProperties = attrib(
-        factory=ChannelProperties, converter=create_object_converter(ChannelProperties)
+        See Also:
+            `AWS Cloud Formation documentation for Schedule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-trigger-schedule.html>`_
+        """
+
+        __slots__ = ("ScheduleExpression",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetSchedule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ScheduleExpression=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ScheduleExpression", ScheduleExpression)
+            _init_PropertyType(self, kwargs)
+
+    class DatasetTriggeringDataset(_PropertyType):
+        """The Triggering Dataset property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for TriggeringDataset
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-triggeringdataset.html>`_
+        """
+
+        __slots__ = ("DatasetName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetTriggeringDataset", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DatasetName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DatasetName", DatasetName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetSchedule = create_object_converter(DatasetSchedule)
+    _convert_DatasetTriggeringDataset = create_object_converter(
+        DatasetTriggeringDataset
+    )
+
+    class DatasetTrigger(_PropertyType):
+        """The Trigger property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Trigger
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-trigger.html>`_
+        """
+
+        __slots__ = ("Schedule", "TriggeringDataset")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetTrigger",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Schedule": _convert_DatasetSchedule,
+                "TriggeringDataset": _convert_DatasetTriggeringDataset,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Schedule=None, TriggeringDataset=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Schedule", _convert_DatasetSchedule(Schedule))
+            _setattr(
+                "TriggeringDataset",
+                _convert_DatasetTriggeringDataset(TriggeringDataset),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class DatasetVersioningConfiguration(_PropertyType):
+        """The Versioning Configuration property type for Dataset in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for VersioningConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-dataset-versioningconfiguration.html>`_
+        """
+
+        __slots__ = ("MaxVersions", "Unlimited")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetVersioningConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MaxVersions=None, Unlimited=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MaxVersions", MaxVersions)
+            _setattr("Unlimited", Unlimited)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatasetAction_list = create_object_list_converter(DatasetAction)
+    _convert_DatasetDatasetContentDeliveryRule_list = create_object_list_converter(
+        DatasetDatasetContentDeliveryRule
+    )
+    _convert_DatasetRetentionPeriod = create_object_converter(DatasetRetentionPeriod)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_DatasetTrigger_list = create_object_list_converter(DatasetTrigger)
+    _convert_DatasetVersioningConfiguration = create_object_converter(
+        DatasetVersioningConfiguration
+    )
+
+    class DatasetProperties(_ResourceProperties):
+        __slots__ = (
+            "Actions",
+            "ContentDeliveryRules",
+            "DatasetName",
+            "RetentionPeriod",
+            "Tags",
+            "Triggers",
+            "VersioningConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatasetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Actions": _convert_DatasetAction_list,
+                "ContentDeliveryRules": _convert_DatasetDatasetContentDeliveryRule_list,
+                "RetentionPeriod": _convert_DatasetRetentionPeriod,
+                "Tags": _convert_Tag_list,
+                "Triggers": _convert_DatasetTrigger_list,
+                "VersioningConfiguration": _convert_DatasetVersioningConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Actions=None,
+            ContentDeliveryRules=None,
+            DatasetName=None,
+            RetentionPeriod=None,
+            Tags=None,
+            Triggers=None,
+            VersioningConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Actions", _convert_DatasetAction_list(Actions))
+            _setattr(
+                "ContentDeliveryRules",
+                _convert_DatasetDatasetContentDeliveryRule_list(ContentDeliveryRules),
+            )
+            _setattr("DatasetName", DatasetName)
+            _setattr(
+                "RetentionPeriod", _convert_DatasetRetentionPeriod(RetentionPeriod)
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Triggers", _convert_DatasetTrigger_list(Triggers))
+            _setattr(
+                "VersioningConfiguration",
+                _convert_DatasetVersioningConfiguration(VersioningConfiguration),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DatasetProperties = create_object_converter(DatasetProperties)
+
+    class Dataset(_Resource):
+        """A Dataset for IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Dataset
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotanalytics-dataset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoTAnalytics::Dataset"
+
+        Properties: DatasetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Dataset",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DatasetProperties},
+            factories={"Properties": DatasetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DatasetProperties()
+            _setattr("Properties", _convert_DatasetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Dataset,
+        DatasetProperties,
+        DatasetDatasetContentVersionValue,
+        DatasetOutputFileUriValue,
+        DatasetVariable,
+        DatasetResourceConfiguration,
+        DatasetContainerAction,
+        DatasetDeltaTime,
+        DatasetFilter,
+        DatasetQueryAction,
+        DatasetAction,
+        DatasetIotEventsDestinationConfiguration,
+        DatasetGlueConfiguration,
+        DatasetS3DestinationConfiguration,
+        DatasetDatasetContentDeliveryRuleDestination,
+        DatasetDatasetContentDeliveryRule,
+        DatasetRetentionPeriod,
+        DatasetSchedule,
+        DatasetTriggeringDataset,
+        DatasetTrigger,
+        DatasetVersioningConfiguration,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class DatasetProperties(ResourceProperties):
-    Actions = attrib(default=None)
-    ContentDeliveryRules = attrib(default=None)
-    DatasetName = attrib(default=None)
-    RetentionPeriod = attrib(default=None)
-    Tags = attrib(default=None)
-    Triggers = attrib(default=None)
-    VersioningConfiguration = attrib(default=None)
+def _create_Datastore():
+    class DatastoreCustomerManagedS3(_PropertyType):
+        """The Customer Managed S3 property type for Datastore in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for CustomerManagedS3
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-datastore-customermanageds3.html>`_
+        """
 
+        __slots__ = ("Bucket", "KeyPrefix", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatastoreCustomerManagedS3", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Dataset(Resource):
-    """A Dataset for IoTAnalytics.
+        def __init__(
+            self, *, Bucket=None, KeyPrefix=None, RoleArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("KeyPrefix", KeyPrefix)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Dataset
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotanalytics-dataset.html>`_
-    """
+    class DatastoreServiceManagedS3(_PropertyType):
+        """The Service Managed S3 property type for Datastore in IoTAnalytics.
 
-    RESOURCE_TYPE = "AWS::IoTAnalytics::Dataset"
+        See Also:
+            `AWS Cloud Formation documentation for ServiceManagedS3
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-datastore-servicemanageds3.html>`_
+        """
 
-    Properties: DatasetProperties = attrib(
-        factory=DatasetProperties, converter=create_object_converter(DatasetProperties)
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatastoreServiceManagedS3", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatastoreCustomerManagedS3 = create_object_converter(
+        DatastoreCustomerManagedS3
+    )
+    _convert_DatastoreServiceManagedS3 = create_object_converter(
+        DatastoreServiceManagedS3
     )
 
+    class DatastoreDatastoreStorage(_PropertyType):
+        """The Datastore Storage property type for Datastore in IoTAnalytics.
 
-@attrs(**ATTRSCONFIG)
-class DatastoreProperties(ResourceProperties):
-    DatastoreName = attrib(default=None)
-    DatastoreStorage = attrib(default=None)
-    RetentionPeriod = attrib(default=None)
-    Tags = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for DatastoreStorage
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-datastore-datastorestorage.html>`_
+        """
 
+        __slots__ = ("CustomerManagedS3", "ServiceManagedS3")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatastoreDatastoreStorage",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CustomerManagedS3": _convert_DatastoreCustomerManagedS3,
+                "ServiceManagedS3": _convert_DatastoreServiceManagedS3,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Datastore(Resource):
-    """A Datastore for IoTAnalytics.
+        def __init__(
+            self, *, CustomerManagedS3=None, ServiceManagedS3=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CustomerManagedS3",
+                _convert_DatastoreCustomerManagedS3(CustomerManagedS3),
+            )
+            _setattr(
+                "ServiceManagedS3", _convert_DatastoreServiceManagedS3(ServiceManagedS3)
+            )
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Datastore
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotanalytics-datastore.html>`_
-    """
+    class DatastoreRetentionPeriod(_PropertyType):
+        """The Retention Period property type for Datastore in IoTAnalytics.
 
-    RESOURCE_TYPE = "AWS::IoTAnalytics::Datastore"
+        See Also:
+            `AWS Cloud Formation documentation for RetentionPeriod
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-datastore-retentionperiod.html>`_
+        """
 
-    Properties: DatastoreProperties = attrib(
-        factory=DatastoreProperties,
-        converter=create_object_converter(DatastoreProperties),
+        __slots__ = ("NumberOfDays", "Unlimited")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatastoreRetentionPeriod", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, NumberOfDays=None, Unlimited=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NumberOfDays", NumberOfDays)
+            _setattr("Unlimited", Unlimited)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DatastoreDatastoreStorage = create_object_converter(
+        DatastoreDatastoreStorage
+    )
+    _convert_DatastoreRetentionPeriod = create_object_converter(
+        DatastoreRetentionPeriod
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DatastoreProperties(_ResourceProperties):
+        __slots__ = ("DatastoreName", "DatastoreStorage", "RetentionPeriod", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DatastoreProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DatastoreStorage": _convert_DatastoreDatastoreStorage,
+                "RetentionPeriod": _convert_DatastoreRetentionPeriod,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DatastoreName=None,
+            DatastoreStorage=None,
+            RetentionPeriod=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DatastoreName", DatastoreName)
+            _setattr(
+                "DatastoreStorage", _convert_DatastoreDatastoreStorage(DatastoreStorage)
+            )
+            _setattr(
+                "RetentionPeriod", _convert_DatastoreRetentionPeriod(RetentionPeriod)
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DatastoreProperties = create_object_converter(DatastoreProperties)
 
+    class Datastore(_Resource):
+        """A Datastore for IoTAnalytics.
 
-@attrs(**ATTRSCONFIG)
-class PipelineProperties(ResourceProperties):
-    PipelineActivities = attrib(default=None)
-    PipelineName = attrib(default=None)
-    Tags = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for Datastore
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotanalytics-datastore.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::IoTAnalytics::Datastore"
 
-@attrs(**ATTRSCONFIG)
-class Pipeline(Resource):
-    """A Pipeline for IoTAnalytics.
+        Properties: DatastoreProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for Pipeline
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotanalytics-pipeline.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Datastore",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DatastoreProperties},
+            factories={"Properties": DatastoreProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::IoTAnalytics::Pipeline"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DatastoreProperties()
+            _setattr("Properties", _convert_DatastoreProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    Properties: PipelineProperties = attrib(
-        factory=PipelineProperties,
-        converter=create_object_converter(PipelineProperties),
+    return (
+        Datastore,
+        DatastoreProperties,
+        DatastoreCustomerManagedS3,
+        DatastoreServiceManagedS3,
+        DatastoreDatastoreStorage,
+        DatastoreRetentionPeriod,
     )
+
+
+def _create_Pipeline():
+    class PipelineSelectAttributes(_PropertyType):
+        """The Select Attributes property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for SelectAttributes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-selectattributes.html>`_
+        """
+
+        __slots__ = ("Attributes", "Name", "Next")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineSelectAttributes", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Attributes=None, Name=None, Next=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", Attributes)
+            _setattr("Name", Name)
+            _setattr("Next", Next)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineDatastore(_PropertyType):
+        """The Datastore property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Datastore
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-datastore.html>`_
+        """
+
+        __slots__ = ("DatastoreName", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineDatastore", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DatastoreName=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DatastoreName", DatastoreName)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineFilter(_PropertyType):
+        """The Filter property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Filter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-filter.html>`_
+        """
+
+        __slots__ = ("Filter", "Name", "Next")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Filter=None, Name=None, Next=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Filter", Filter)
+            _setattr("Name", Name)
+            _setattr("Next", Next)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineAddAttributes(_PropertyType):
+        """The Add Attributes property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for AddAttributes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-addattributes.html>`_
+        """
+
+        __slots__ = ("Attributes", "Name", "Next")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineAddAttributes", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Attributes=None, Name=None, Next=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", Attributes)
+            _setattr("Name", Name)
+            _setattr("Next", Next)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineChannel(_PropertyType):
+        """The Channel property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Channel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-channel.html>`_
+        """
+
+        __slots__ = ("ChannelName", "Name", "Next")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineChannel", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ChannelName=None, Name=None, Next=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ChannelName", ChannelName)
+            _setattr("Name", Name)
+            _setattr("Next", Next)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineDeviceShadowEnrich(_PropertyType):
+        """The Device Shadow Enrich property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeviceShadowEnrich
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-deviceshadowenrich.html>`_
+        """
+
+        __slots__ = ("Attribute", "Name", "Next", "RoleArn", "ThingName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineDeviceShadowEnrich", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Attribute=None,
+            Name=None,
+            Next=None,
+            RoleArn=None,
+            ThingName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attribute", Attribute)
+            _setattr("Name", Name)
+            _setattr("Next", Next)
+            _setattr("RoleArn", RoleArn)
+            _setattr("ThingName", ThingName)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineMath(_PropertyType):
+        """The Math property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Math
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-math.html>`_
+        """
+
+        __slots__ = ("Attribute", "Math", "Name", "Next")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineMath", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Attribute=None, Math=None, Name=None, Next=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attribute", Attribute)
+            _setattr("Math", Math)
+            _setattr("Name", Name)
+            _setattr("Next", Next)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineLambda(_PropertyType):
+        """The Lambda property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Lambda
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-lambda.html>`_
+        """
+
+        __slots__ = ("BatchSize", "LambdaName", "Name", "Next")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineLambda", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BatchSize=None, LambdaName=None, Name=None, Next=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BatchSize", BatchSize)
+            _setattr("LambdaName", LambdaName)
+            _setattr("Name", Name)
+            _setattr("Next", Next)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineDeviceRegistryEnrich(_PropertyType):
+        """The Device Registry Enrich property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeviceRegistryEnrich
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-deviceregistryenrich.html>`_
+        """
+
+        __slots__ = ("Attribute", "Name", "Next", "RoleArn", "ThingName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineDeviceRegistryEnrich", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Attribute=None,
+            Name=None,
+            Next=None,
+            RoleArn=None,
+            ThingName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attribute", Attribute)
+            _setattr("Name", Name)
+            _setattr("Next", Next)
+            _setattr("RoleArn", RoleArn)
+            _setattr("ThingName", ThingName)
+            _init_PropertyType(self, kwargs)
+
+    class PipelineRemoveAttributes(_PropertyType):
+        """The Remove Attributes property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for RemoveAttributes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-removeattributes.html>`_
+        """
+
+        __slots__ = ("Attributes", "Name", "Next")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineRemoveAttributes", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Attributes=None, Name=None, Next=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", Attributes)
+            _setattr("Name", Name)
+            _setattr("Next", Next)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PipelineAddAttributes = create_object_converter(PipelineAddAttributes)
+    _convert_PipelineChannel = create_object_converter(PipelineChannel)
+    _convert_PipelineDatastore = create_object_converter(PipelineDatastore)
+    _convert_PipelineDeviceRegistryEnrich = create_object_converter(
+        PipelineDeviceRegistryEnrich
+    )
+    _convert_PipelineDeviceShadowEnrich = create_object_converter(
+        PipelineDeviceShadowEnrich
+    )
+    _convert_PipelineFilter = create_object_converter(PipelineFilter)
+    _convert_PipelineLambda = create_object_converter(PipelineLambda)
+    _convert_PipelineMath = create_object_converter(PipelineMath)
+    _convert_PipelineRemoveAttributes = create_object_converter(
+        PipelineRemoveAttributes
+    )
+    _convert_PipelineSelectAttributes = create_object_converter(
+        PipelineSelectAttributes
+    )
+
+    class PipelineActivity(_PropertyType):
+        """The Activity property type for Pipeline in IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Activity
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotanalytics-pipeline-activity.html>`_
+        """
+
+        __slots__ = (
+            "AddAttributes",
+            "Channel",
+            "Datastore",
+            "DeviceRegistryEnrich",
+            "DeviceShadowEnrich",
+            "Filter",
+            "Lambda",
+            "Math",
+            "RemoveAttributes",
+            "SelectAttributes",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineActivity",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AddAttributes": _convert_PipelineAddAttributes,
+                "Channel": _convert_PipelineChannel,
+                "Datastore": _convert_PipelineDatastore,
+                "DeviceRegistryEnrich": _convert_PipelineDeviceRegistryEnrich,
+                "DeviceShadowEnrich": _convert_PipelineDeviceShadowEnrich,
+                "Filter": _convert_PipelineFilter,
+                "Lambda": _convert_PipelineLambda,
+                "Math": _convert_PipelineMath,
+                "RemoveAttributes": _convert_PipelineRemoveAttributes,
+                "SelectAttributes": _convert_PipelineSelectAttributes,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AddAttributes=None,
+            Channel=None,
+            Datastore=None,
+            DeviceRegistryEnrich=None,
+            DeviceShadowEnrich=None,
+            Filter=None,
+            Lambda=None,
+            Math=None,
+            RemoveAttributes=None,
+            SelectAttributes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AddAttributes", _convert_PipelineAddAttributes(AddAttributes))
+            _setattr("Channel", _convert_PipelineChannel(Channel))
+            _setattr("Datastore", _convert_PipelineDatastore(Datastore))
+            _setattr(
+                "DeviceRegistryEnrich",
+                _convert_PipelineDeviceRegistryEnrich(DeviceRegistryEnrich),
+            )
+            _setattr(
+                "DeviceShadowEnrich",
+                _convert_PipelineDeviceShadowEnrich(DeviceShadowEnrich),
+            )
+            _setattr("Filter", _convert_PipelineFilter(Filter))
+            _setattr("Lambda", _convert_PipelineLambda(Lambda))
+            _setattr("Math", _convert_PipelineMath(Math))
+            _setattr(
+                "RemoveAttributes", _convert_PipelineRemoveAttributes(RemoveAttributes)
+            )
+            _setattr(
+                "SelectAttributes", _convert_PipelineSelectAttributes(SelectAttributes)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_PipelineActivity_list = create_object_list_converter(PipelineActivity)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class PipelineProperties(_ResourceProperties):
+        __slots__ = ("PipelineActivities", "PipelineName", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PipelineProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "PipelineActivities": _convert_PipelineActivity_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, PipelineActivities=None, PipelineName=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "PipelineActivities", _convert_PipelineActivity_list(PipelineActivities)
+            )
+            _setattr("PipelineName", PipelineName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PipelineProperties = create_object_converter(PipelineProperties)
+
+    class Pipeline(_Resource):
+        """A Pipeline for IoTAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Pipeline
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotanalytics-pipeline.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoTAnalytics::Pipeline"
+
+        Properties: PipelineProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Pipeline",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PipelineProperties},
+            factories={"Properties": PipelineProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PipelineProperties()
+            _setattr("Properties", _convert_PipelineProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Pipeline,
+        PipelineProperties,
+        PipelineSelectAttributes,
+        PipelineDatastore,
+        PipelineFilter,
+        PipelineAddAttributes,
+        PipelineChannel,
+        PipelineDeviceShadowEnrich,
+        PipelineMath,
+        PipelineLambda,
+        PipelineDeviceRegistryEnrich,
+        PipelineRemoveAttributes,
+        PipelineActivity,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Channel": _create_Channel,
+        "ChannelProperties": _create_Channel,
+        "ChannelChannelStorage": _create_Channel,
+        "ChannelCustomerManagedS3": _create_Channel,
+        "ChannelRetentionPeriod": _create_Channel,
+        "ChannelServiceManagedS3": _create_Channel,
+        "Dataset": _create_Dataset,
+        "DatasetProperties": _create_Dataset,
+        "DatasetAction": _create_Dataset,
+        "DatasetContainerAction": _create_Dataset,
+        "DatasetDatasetContentDeliveryRule": _create_Dataset,
+        "DatasetDatasetContentDeliveryRuleDestination": _create_Dataset,
+        "DatasetDatasetContentVersionValue": _create_Dataset,
+        "DatasetDeltaTime": _create_Dataset,
+        "DatasetFilter": _create_Dataset,
+        "DatasetGlueConfiguration": _create_Dataset,
+        "DatasetIotEventsDestinationConfiguration": _create_Dataset,
+        "DatasetOutputFileUriValue": _create_Dataset,
+        "DatasetQueryAction": _create_Dataset,
+        "DatasetResourceConfiguration": _create_Dataset,
+        "DatasetRetentionPeriod": _create_Dataset,
+        "DatasetS3DestinationConfiguration": _create_Dataset,
+        "DatasetSchedule": _create_Dataset,
+        "DatasetTrigger": _create_Dataset,
+        "DatasetTriggeringDataset": _create_Dataset,
+        "DatasetVariable": _create_Dataset,
+        "DatasetVersioningConfiguration": _create_Dataset,
+        "Datastore": _create_Datastore,
+        "DatastoreProperties": _create_Datastore,
+        "DatastoreCustomerManagedS3": _create_Datastore,
+        "DatastoreDatastoreStorage": _create_Datastore,
+        "DatastoreRetentionPeriod": _create_Datastore,
+        "DatastoreServiceManagedS3": _create_Datastore,
+        "Pipeline": _create_Pipeline,
+        "PipelineProperties": _create_Pipeline,
+        "PipelineActivity": _create_Pipeline,
+        "PipelineAddAttributes": _create_Pipeline,
+        "PipelineChannel": _create_Pipeline,
+        "PipelineDatastore": _create_Pipeline,
+        "PipelineDeviceRegistryEnrich": _create_Pipeline,
+        "PipelineDeviceShadowEnrich": _create_Pipeline,
+        "PipelineFilter": _create_Pipeline,
+        "PipelineLambda": _create_Pipeline,
+        "PipelineMath": _create_Pipeline,
+        "PipelineRemoveAttributes": _create_Pipeline,
+        "PipelineSelectAttributes": _create_Pipeline,
+    },
+)
@@ -7,63 +7,823 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["DetectorModel", "DetectorModelProperties", "Input", "InputProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "DetectorModel",
+    "DetectorModelProperties",
+    "DetectorModelAction",
+    "DetectorModelClearTimer",
+    "DetectorModelDetectorModelDefinition",
+    "DetectorModelEvent",
+    "DetectorModelFirehose",
+    "DetectorModelIotEvents",
+    "DetectorModelIotTopicPublish",
+    "DetectorModelLambda",
+    "DetectorModelOnEnter",
+    "DetectorModelOnExit",
+    "DetectorModelOnInput",
+    "DetectorModelResetTimer",
+    "DetectorModelSetTimer",
+    "DetectorModelSetVariable",
+    "DetectorModelSns",
+    "DetectorModelSqs",
+    "DetectorModelState",
+    "DetectorModelTransitionEvent",
+    "Input",
+    "InputProperties",
+    "InputAttribute",
+    "InputInputDefinition",
+]
 
-@attrs(**ATTRSCONFIG)
-class DetectorModelProperties(ResourceProperties):
-    DetectorModelDefinition = attrib(default=None)
-    DetectorModelDescription = attrib(default=None)
-    DetectorModelName = attrib(default=None)
-    Key = attrib(default=None)
-    RoleArn = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_DetectorModel():
+    class DetectorModelIotEvents(_PropertyType):
+        """The Iot Events property type for DetectorModel in IoTEvents.
 
-@attrs(**ATTRSCONFIG)
-class DetectorModel(Resource):
-    """A Detector Model for IoTEvents.
+        See Also:
+            `AWS Cloud Formation documentation for IotEvents
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-iotevents.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for DetectorModel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotevents-detectormodel.html>`_
-    """
+        __slots__ = ("InputName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelIotEvents", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::IoTEvents::DetectorModel"
+        def __init__(self, *, InputName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InputName", InputName)
+            _init_PropertyType(self, kwargs)
 
-    Properties: DetectorModelProperties = attrib(
-        factory=DetectorModelProperties,
-        converter=create_object_converter(DetectorModelProperties),
+    class DetectorModelResetTimer(_PropertyType):
+        """The Reset Timer property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResetTimer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-resettimer.html>`_
+        """
+
+        __slots__ = ("TimerName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelResetTimer", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TimerName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TimerName", TimerName)
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelSqs(_PropertyType):
+        """The Sqs property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for Sqs
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-sqs.html>`_
+        """
+
+        __slots__ = ("QueueUrl", "UseBase64")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelSqs", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, QueueUrl=None, UseBase64=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("QueueUrl", QueueUrl)
+            _setattr("UseBase64", UseBase64)
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelFirehose(_PropertyType):
+        """The Firehose property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for Firehose
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-firehose.html>`_
+        """
+
+        __slots__ = ("DeliveryStreamName", "Separator")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelFirehose", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeliveryStreamName=None, Separator=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeliveryStreamName", DeliveryStreamName)
+            _setattr("Separator", Separator)
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelSns(_PropertyType):
+        """The Sns property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for Sns
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-sns.html>`_
+        """
+
+        __slots__ = ("TargetArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelSns", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TargetArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TargetArn", TargetArn)
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelIotTopicPublish(_PropertyType):
+        """The Iot Topic Publish property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for IotTopicPublish
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-iottopicpublish.html>`_
+        """
+
+        __slots__ = ("MqttTopic",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelIotTopicPublish", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MqttTopic=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MqttTopic", MqttTopic)
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelSetTimer(_PropertyType):
+        """The Set Timer property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for SetTimer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-settimer.html>`_
+        """
+
+        __slots__ = ("Seconds", "TimerName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelSetTimer", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Seconds=None, TimerName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Seconds", Seconds)
+            _setattr("TimerName", TimerName)
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelClearTimer(_PropertyType):
+        """The Clear Timer property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClearTimer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-cleartimer.html>`_
+        """
+
+        __slots__ = ("TimerName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelClearTimer", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TimerName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TimerName", TimerName)
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelLambda(_PropertyType):
+        """The Lambda property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for Lambda
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-lambda.html>`_
+        """
+
+        __slots__ = ("FunctionArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelLambda", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FunctionArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FunctionArn", FunctionArn)
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelSetVariable(_PropertyType):
+        """The Set Variable property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for SetVariable
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-setvariable.html>`_
+        """
+
+        __slots__ = ("Value", "VariableName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelSetVariable", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Value=None, VariableName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Value", Value)
+            _setattr("VariableName", VariableName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DetectorModelClearTimer = create_object_converter(DetectorModelClearTimer)
+    _convert_DetectorModelFirehose = create_object_converter(DetectorModelFirehose)
+    _convert_DetectorModelIotEvents = create_object_converter(DetectorModelIotEvents)
+    _convert_DetectorModelIotTopicPublish = create_object_converter(
+        DetectorModelIotTopicPublish
+    )
+    _convert_DetectorModelLambda = create_object_converter(DetectorModelLambda)
+    _convert_DetectorModelResetTimer = create_object_converter(DetectorModelResetTimer)
+    _convert_DetectorModelSetTimer = create_object_converter(DetectorModelSetTimer)
+    _convert_DetectorModelSetVariable = create_object_converter(
+        DetectorModelSetVariable
+    )
+    _convert_DetectorModelSns = create_object_converter(DetectorModelSns)
+    _convert_DetectorModelSqs = create_object_converter(DetectorModelSqs)
+
+    class DetectorModelAction(_PropertyType):
+        """The Action property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-action.html>`_
+        """
+
+        __slots__ = (
+            "ClearTimer",
+            "Firehose",
+            "IotEvents",
+            "IotTopicPublish",
+            "Lambda",
+            "ResetTimer",
+            "SetTimer",
+            "SetVariable",
+            "Sns",
+            "Sqs",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ClearTimer": _convert_DetectorModelClearTimer,
+                "Firehose": _convert_DetectorModelFirehose,
+                "IotEvents": _convert_DetectorModelIotEvents,
+                "IotTopicPublish": _convert_DetectorModelIotTopicPublish,
+                "Lambda": _convert_DetectorModelLambda,
+                "ResetTimer": _convert_DetectorModelResetTimer,
+                "SetTimer": _convert_DetectorModelSetTimer,
+                "SetVariable": _convert_DetectorModelSetVariable,
+                "Sns": _convert_DetectorModelSns,
+                "Sqs": _convert_DetectorModelSqs,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ClearTimer=None,
+            Firehose=None,
+            IotEvents=None,
+            IotTopicPublish=None,
+            Lambda=None,
+            ResetTimer=None,
+            SetTimer=None,
+            SetVariable=None,
+            Sns=None,
+            Sqs=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClearTimer", _convert_DetectorModelClearTimer(ClearTimer))
+            _setattr("Firehose", _convert_DetectorModelFirehose(Firehose))
+            _setattr("IotEvents", _convert_DetectorModelIotEvents(IotEvents))
+            _setattr(
+                "IotTopicPublish",
+                _convert_DetectorModelIotTopicPublish(IotTopicPublish),
+            )
+            _setattr("Lambda", _convert_DetectorModelLambda(Lambda))
+            _setattr("ResetTimer", _convert_DetectorModelResetTimer(ResetTimer))
+            _setattr("SetTimer", _convert_DetectorModelSetTimer(SetTimer))
+            _setattr("SetVariable", _convert_DetectorModelSetVariable(SetVariable))
+            _setattr("Sns", _convert_DetectorModelSns(Sns))
+            _setattr("Sqs", _convert_DetectorModelSqs(Sqs))
+            _init_PropertyType(self, kwargs)
+
+    _convert_DetectorModelAction_list = create_object_list_converter(
+        DetectorModelAction
     )
 
+    class DetectorModelEvent(_PropertyType):
+        """The Event property type for DetectorModel in IoTEvents.
 
-@attrs(**ATTRSCONFIG)
-class InputProperties(ResourceProperties):
-    InputDefinition = attrib(default=None)
-    InputDescription = attrib(default=None)
-    InputName = attrib(default=None)
-    Tags = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for Event
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-event.html>`_
+        """
 
+        __slots__ = ("Actions", "Condition", "EventName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelEvent",
+            _PropertyType,
+            __slots__,
+            converters={"Actions": _convert_DetectorModelAction_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Input(Resource):
-    """A Input for IoTEvents.
+        def __init__(
+            self, *, Actions=None, Condition=None, EventName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Actions", _convert_DetectorModelAction_list(Actions))
+            _setattr("Condition", Condition)
+            _setattr("EventName", EventName)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Input
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotevents-input.html>`_
-    """
+    class DetectorModelTransitionEvent(_PropertyType):
+        """The Transition Event property type for DetectorModel in IoTEvents.
 
-    RESOURCE_TYPE = "AWS::IoTEvents::Input"
+        See Also:
+            `AWS Cloud Formation documentation for TransitionEvent
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-transitionevent.html>`_
+        """
 
-    Properties: InputProperties = attrib(
-        factory=InputProperties, converter=create_object_converter(InputProperties)
+        __slots__ = ("Actions", "Condition", "EventName", "NextState")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelTransitionEvent",
+            _PropertyType,
+            __slots__,
+            converters={"Actions": _convert_DetectorModelAction_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Actions=None,
+            Condition=None,
+            EventName=None,
+            NextState=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Actions", _convert_DetectorModelAction_list(Actions))
+            _setattr("Condition", Condition)
+            _setattr("EventName", EventName)
+            _setattr("NextState", NextState)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DetectorModelEvent_list = create_object_list_converter(DetectorModelEvent)
+    _convert_DetectorModelTransitionEvent_list = create_object_list_converter(
+        DetectorModelTransitionEvent
     )
+
+    class DetectorModelOnInput(_PropertyType):
+        """The On Input property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for OnInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-oninput.html>`_
+        """
+
+        __slots__ = ("Events", "TransitionEvents")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelOnInput",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Events": _convert_DetectorModelEvent_list,
+                "TransitionEvents": _convert_DetectorModelTransitionEvent_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Events=None, TransitionEvents=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Events", _convert_DetectorModelEvent_list(Events))
+            _setattr(
+                "TransitionEvents",
+                _convert_DetectorModelTransitionEvent_list(TransitionEvents),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelOnExit(_PropertyType):
+        """The On Exit property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for OnExit
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-onexit.html>`_
+        """
+
+        __slots__ = ("Events",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelOnExit",
+            _PropertyType,
+            __slots__,
+            converters={"Events": _convert_DetectorModelEvent_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Events=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Events", _convert_DetectorModelEvent_list(Events))
+            _init_PropertyType(self, kwargs)
+
+    class DetectorModelOnEnter(_PropertyType):
+        """The On Enter property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for OnEnter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-onenter.html>`_
+        """
+
+        __slots__ = ("Events",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelOnEnter",
+            _PropertyType,
+            __slots__,
+            converters={"Events": _convert_DetectorModelEvent_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Events=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Events", _convert_DetectorModelEvent_list(Events))
+            _init_PropertyType(self, kwargs)
+
+    _convert_DetectorModelOnEnter = create_object_converter(DetectorModelOnEnter)
+    _convert_DetectorModelOnExit = create_object_converter(DetectorModelOnExit)
+    _convert_DetectorModelOnInput = create_object_converter(DetectorModelOnInput)
+
+    class DetectorModelState(_PropertyType):
+        """The State property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for State
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-state.html>`_
+        """
+
+        __slots__ = ("OnEnter", "OnExit", "OnInput", "StateName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelState",
+            _PropertyType,
+            __slots__,
+            converters={
+                "OnEnter": _convert_DetectorModelOnEnter,
+                "OnExit": _convert_DetectorModelOnExit,
+                "OnInput": _convert_DetectorModelOnInput,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, OnEnter=None, OnExit=None, OnInput=None, StateName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("OnEnter", _convert_DetectorModelOnEnter(OnEnter))
+            _setattr("OnExit", _convert_DetectorModelOnExit(OnExit))
+            _setattr("OnInput", _convert_DetectorModelOnInput(OnInput))
+            _setattr("StateName", StateName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DetectorModelState_list = create_object_list_converter(DetectorModelState)
+
+    class DetectorModelDetectorModelDefinition(_PropertyType):
+        """The Detector Model Definition property type for DetectorModel in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for DetectorModelDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-detectormodel-detectormodeldefinition.html>`_
+        """
+
+        __slots__ = ("InitialStateName", "States")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelDetectorModelDefinition",
+            _PropertyType,
+            __slots__,
+            converters={"States": _convert_DetectorModelState_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, InitialStateName=None, States=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InitialStateName", InitialStateName)
+            _setattr("States", _convert_DetectorModelState_list(States))
+            _init_PropertyType(self, kwargs)
+
+    _convert_DetectorModelDetectorModelDefinition = create_object_converter(
+        DetectorModelDetectorModelDefinition
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DetectorModelProperties(_ResourceProperties):
+        __slots__ = (
+            "DetectorModelDefinition",
+            "DetectorModelDescription",
+            "DetectorModelName",
+            "Key",
+            "RoleArn",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModelProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DetectorModelDefinition": _convert_DetectorModelDetectorModelDefinition,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DetectorModelDefinition=None,
+            DetectorModelDescription=None,
+            DetectorModelName=None,
+            Key=None,
+            RoleArn=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DetectorModelDefinition",
+                _convert_DetectorModelDetectorModelDefinition(DetectorModelDefinition),
+            )
+            _setattr("DetectorModelDescription", DetectorModelDescription)
+            _setattr("DetectorModelName", DetectorModelName)
+            _setattr("Key", Key)
+            _setattr("RoleArn", RoleArn)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DetectorModelProperties = create_object_converter(DetectorModelProperties)
+
+    class DetectorModel(_Resource):
+        """A Detector Model for IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for DetectorModel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotevents-detectormodel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoTEvents::DetectorModel"
+
+        Properties: DetectorModelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DetectorModel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DetectorModelProperties},
+            factories={"Properties": DetectorModelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DetectorModelProperties()
+            _setattr("Properties", _convert_DetectorModelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        DetectorModel,
+        DetectorModelProperties,
+        DetectorModelIotEvents,
+        DetectorModelResetTimer,
+        DetectorModelSqs,
+        DetectorModelFirehose,
+        DetectorModelSns,
+        DetectorModelIotTopicPublish,
+        DetectorModelSetTimer,
+        DetectorModelClearTimer,
+        DetectorModelLambda,
+        DetectorModelSetVariable,
+        DetectorModelAction,
+        DetectorModelEvent,
+        DetectorModelTransitionEvent,
+        DetectorModelOnInput,
+        DetectorModelOnExit,
+        DetectorModelOnEnter,
+        DetectorModelState,
+        DetectorModelDetectorModelDefinition,
+    )
+
+
+def _create_Input():
+    class InputAttribute(_PropertyType):
+        """The Attribute property type for Input in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for Attribute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-input-attribute.html>`_
+        """
+
+        __slots__ = ("JsonPath",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputAttribute", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, JsonPath=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("JsonPath", JsonPath)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InputAttribute_list = create_object_list_converter(InputAttribute)
+
+    class InputInputDefinition(_PropertyType):
+        """The Input Definition property type for Input in IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotevents-input-inputdefinition.html>`_
+        """
+
+        __slots__ = ("Attributes",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputInputDefinition",
+            _PropertyType,
+            __slots__,
+            converters={"Attributes": _convert_InputAttribute_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Attributes=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", _convert_InputAttribute_list(Attributes))
+            _init_PropertyType(self, kwargs)
+
+    _convert_InputInputDefinition = create_object_converter(InputInputDefinition)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class InputProperties(_ResourceProperties):
+        __slots__ = ("InputDefinition", "InputDescription", "InputName", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "InputDefinition": _convert_InputInputDefinition,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            InputDefinition=None,
+            InputDescription=None,
+            InputName=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InputDefinition", _convert_InputInputDefinition(InputDefinition))
+            _setattr("InputDescription", InputDescription)
+            _setattr("InputName", InputName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InputProperties = create_object_converter(InputProperties)
+
+    class Input(_Resource):
+        """A Input for IoTEvents.
+
+        See Also:
+            `AWS Cloud Formation documentation for Input
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotevents-input.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoTEvents::Input"
+
+        Properties: InputProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Input",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InputProperties},
+            factories={"Properties": InputProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InputProperties()
+            _setattr("Properties", _convert_InputProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Input, InputProperties, InputAttribute, InputInputDefinition
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "DetectorModel": _create_DetectorModel,
+        "DetectorModelProperties": _create_DetectorModel,
+        "DetectorModelAction": _create_DetectorModel,
+        "DetectorModelClearTimer": _create_DetectorModel,
+        "DetectorModelDetectorModelDefinition": _create_DetectorModel,
+        "DetectorModelEvent": _create_DetectorModel,
+        "DetectorModelFirehose": _create_DetectorModel,
+        "DetectorModelIotEvents": _create_DetectorModel,
+        "DetectorModelIotTopicPublish": _create_DetectorModel,
+        "DetectorModelLambda": _create_DetectorModel,
+        "DetectorModelOnEnter": _create_DetectorModel,
+        "DetectorModelOnExit": _create_DetectorModel,
+        "DetectorModelOnInput": _create_DetectorModel,
+        "DetectorModelResetTimer": _create_DetectorModel,
+        "DetectorModelSetTimer": _create_DetectorModel,
+        "DetectorModelSetVariable": _create_DetectorModel,
+        "DetectorModelSns": _create_DetectorModel,
+        "DetectorModelSqs": _create_DetectorModel,
+        "DetectorModelState": _create_DetectorModel,
+        "DetectorModelTransitionEvent": _create_DetectorModel,
+        "Input": _create_Input,
+        "InputProperties": _create_Input,
+        "InputAttribute": _create_Input,
+        "InputInputDefinition": _create_Input,
+    },
+)
@@ -7,35 +7,117 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
-__all__ = ["FlowTemplate", "FlowTemplateProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "FlowTemplate",
+    "FlowTemplateProperties",
+    "FlowTemplateDefinitionDocument",
+]
 
-@attrs(**ATTRSCONFIG)
-class FlowTemplateProperties(ResourceProperties):
-    CompatibleNamespaceVersion = attrib(default=None)
-    Definition = attrib(default=None)
 
+def _create_FlowTemplate():
+    class FlowTemplateDefinitionDocument(_PropertyType):
+        """The Definition Document property type for FlowTemplate in IoTThingsGraph.
 
-@attrs(**ATTRSCONFIG)
-class FlowTemplate(Resource):
-    """A Flow Template for IoTThingsGraph.
+        See Also:
+            `AWS Cloud Formation documentation for DefinitionDocument
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-iotthingsgraph-flowtemplate-definitiondocument.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for FlowTemplate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotthingsgraph-flowtemplate.html>`_
-    """
+        __slots__ = ("Language", "Text")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FlowTemplateDefinitionDocument", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::IoTThingsGraph::FlowTemplate"
+        def __init__(self, *, Language=None, Text=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Language", Language)
+            _setattr("Text", Text)
+            _init_PropertyType(self, kwargs)
 
-    Properties: FlowTemplateProperties = attrib(
-        factory=FlowTemplateProperties,
-        converter=create_object_converter(FlowTemplateProperties),
+    _convert_FlowTemplateDefinitionDocument = create_object_converter(
+        FlowTemplateDefinitionDocument
     )
+
+    class FlowTemplateProperties(_ResourceProperties):
+        __slots__ = ("CompatibleNamespaceVersion", "Definition")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FlowTemplateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Definition": _convert_FlowTemplateDefinitionDocument},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CompatibleNamespaceVersion=None, Definition=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CompatibleNamespaceVersion", CompatibleNamespaceVersion)
+            _setattr("Definition", _convert_FlowTemplateDefinitionDocument(Definition))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FlowTemplateProperties = create_object_converter(FlowTemplateProperties)
+
+    class FlowTemplate(_Resource):
+        """A Flow Template for IoTThingsGraph.
+
+        See Also:
+            `AWS Cloud Formation documentation for FlowTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-iotthingsgraph-flowtemplate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::IoTThingsGraph::FlowTemplate"
+
+        Properties: FlowTemplateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FlowTemplate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FlowTemplateProperties},
+            factories={"Properties": FlowTemplateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FlowTemplateProperties()
+            _setattr("Properties", _convert_FlowTemplateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return FlowTemplate, FlowTemplateProperties, FlowTemplateDefinitionDocument
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "FlowTemplate": _create_FlowTemplate,
+        "FlowTemplateProperties": _create_FlowTemplate,
+        "FlowTemplateDefinitionDocument": _create_FlowTemplate,
+    },
+)
@@ -7,60 +7,198 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
-
-__all__ = ["Stream", "StreamProperties", "StreamConsumer", "StreamConsumerProperties"]
-
-
-@attrs(**ATTRSCONFIG)
-class StreamProperties(ResourceProperties):
-    Name = attrib(default=None)
-    RetentionPeriodHours = attrib(default=None)
-    ShardCount = attrib(default=None)
-    StreamEncryption = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Stream(Resource):
-    """A Stream for Kinesis.
-
-    See Also:
-        `AWS Cloud Formation documentation for Stream
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesis-stream.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Kinesis::Stream"
-
-    Properties: StreamProperties = attrib(
-        factory=StreamProperties, converter=create_object_converter(StreamProperties)
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
+__all__ = [
+    "Stream",
+    "StreamProperties",
+    "StreamStreamEncryption",
+    "StreamConsumer",
+    "StreamConsumerProperties",
+]
+
+
+def _create_Stream():
+    class StreamStreamEncryption(_PropertyType):
+        """The Stream Encryption property type for Stream in Kinesis.
+
+        See Also:
+            `AWS Cloud Formation documentation for StreamEncryption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesis-stream-streamencryption.html>`_
+        """
+
+        __slots__ = ("EncryptionType", "KeyId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamStreamEncryption", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EncryptionType=None, KeyId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EncryptionType", EncryptionType)
+            _setattr("KeyId", KeyId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_StreamStreamEncryption = create_object_converter(StreamStreamEncryption)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class StreamProperties(_ResourceProperties):
+        __slots__ = (
+            "Name",
+            "RetentionPeriodHours",
+            "ShardCount",
+            "StreamEncryption",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "StreamEncryption": _convert_StreamStreamEncryption,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Name=None,
+            RetentionPeriodHours=None,
+            ShardCount=None,
+            StreamEncryption=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("RetentionPeriodHours", RetentionPeriodHours)
+            _setattr("ShardCount", ShardCount)
+            _setattr(
+                "StreamEncryption", _convert_StreamStreamEncryption(StreamEncryption)
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StreamProperties = create_object_converter(StreamProperties)
+
+    class Stream(_Resource):
+        """A Stream for Kinesis.
+
+        See Also:
+            `AWS Cloud Formation documentation for Stream
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesis-stream.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Kinesis::Stream"
+
+        Properties: StreamProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Stream",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StreamProperties},
+            factories={"Properties": StreamProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StreamProperties()
+            _setattr("Properties", _convert_StreamProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Stream, StreamProperties, StreamStreamEncryption
+
+
+def _create_StreamConsumer():
+    class StreamConsumerProperties(_ResourceProperties):
+        __slots__ = ("ConsumerName", "StreamARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamConsumerProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ConsumerName=None, StreamARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConsumerName", ConsumerName)
+            _setattr("StreamARN", StreamARN)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StreamConsumerProperties = create_object_converter(
+        StreamConsumerProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class StreamConsumerProperties(ResourceProperties):
-    ConsumerName = attrib(default=None)
-    StreamARN = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class StreamConsumer(Resource):
-    """A Stream Consumer for Kinesis.
-
-    See Also:
-        `AWS Cloud Formation documentation for StreamConsumer
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesis-streamconsumer.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Kinesis::StreamConsumer"
-
-    Properties: StreamConsumerProperties = attrib(
-        factory=StreamConsumerProperties,
-        converter=create_object_converter(StreamConsumerProperties),
-    )
+    class StreamConsumer(_Resource):
+        """A Stream Consumer for Kinesis.
+
+        See Also:
+            `AWS Cloud Formation documentation for StreamConsumer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesis-streamconsumer.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Kinesis::StreamConsumer"
+
+        Properties: StreamConsumerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StreamConsumer",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StreamConsumerProperties},
+            factories={"Properties": StreamConsumerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StreamConsumerProperties()
+            _setattr("Properties", _convert_StreamConsumerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return StreamConsumer, StreamConsumerProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Stream": _create_Stream,
+        "StreamProperties": _create_Stream,
+        "StreamStreamEncryption": _create_Stream,
+        "StreamConsumer": _create_StreamConsumer,
+        "StreamConsumerProperties": _create_StreamConsumer,
+    },
+)
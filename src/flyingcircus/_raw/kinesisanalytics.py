@@ -7,90 +7,1164 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Application",
     "ApplicationProperties",
+    "ApplicationCSVMappingParameters",
+    "ApplicationInput",
+    "ApplicationInputLambdaProcessor",
+    "ApplicationInputParallelism",
+    "ApplicationInputProcessingConfiguration",
+    "ApplicationInputSchema",
+    "ApplicationJSONMappingParameters",
+    "ApplicationKinesisFirehoseInput",
+    "ApplicationKinesisStreamsInput",
+    "ApplicationMappingParameters",
+    "ApplicationRecordColumn",
+    "ApplicationRecordFormat",
     "ApplicationOutput",
     "ApplicationOutputProperties",
+    "ApplicationOutputDestinationSchema",
+    "ApplicationOutputKinesisFirehoseOutput",
+    "ApplicationOutputKinesisStreamsOutput",
+    "ApplicationOutputLambdaOutput",
+    "ApplicationOutputOutput",
     "ApplicationReferenceDataSource",
     "ApplicationReferenceDataSourceProperties",
+    "ApplicationReferenceDataSourceCSVMappingParameters",
+    "ApplicationReferenceDataSourceJSONMappingParameters",
+    "ApplicationReferenceDataSourceMappingParameters",
+    "ApplicationReferenceDataSourceRecordColumn",
+    "ApplicationReferenceDataSourceRecordFormat",
+    "ApplicationReferenceDataSourceReferenceDataSource",
+    "ApplicationReferenceDataSourceReferenceSchema",
+    "ApplicationReferenceDataSourceS3ReferenceDataSource",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ApplicationProperties(ResourceProperties):
-    ApplicationCode = attrib(default=None)
-    ApplicationDescription = attrib(default=None)
-    ApplicationName = attrib(default=None)
-    Inputs = attrib(default=None)
+def _create_Application():
+    class ApplicationCSVMappingParameters(_PropertyType):
+        """The Csv Mapping Parameters property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for CSVMappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-csvmappingparameters.html>`_
+        """
+
+        __slots__ = ("RecordColumnDelimiter", "RecordRowDelimiter")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationCSVMappingParameters", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, RecordColumnDelimiter=None, RecordRowDelimiter=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordColumnDelimiter", RecordColumnDelimiter)
+            _setattr("RecordRowDelimiter", RecordRowDelimiter)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationRecordColumn(_PropertyType):
+        """The Record Column property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordColumn
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-recordcolumn.html>`_
+        """
+
+        __slots__ = ("Mapping", "Name", "SqlType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationRecordColumn", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Mapping=None, Name=None, SqlType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Mapping", Mapping)
+            _setattr("Name", Name)
+            _setattr("SqlType", SqlType)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationJSONMappingParameters(_PropertyType):
+        """The Json Mapping Parameters property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for JSONMappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-jsonmappingparameters.html>`_
+        """
+
+        __slots__ = ("RecordRowPath",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationJSONMappingParameters", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RecordRowPath=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordRowPath", RecordRowPath)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationCSVMappingParameters = create_object_converter(
+        ApplicationCSVMappingParameters
+    )
+    _convert_ApplicationJSONMappingParameters = create_object_converter(
+        ApplicationJSONMappingParameters
+    )
+
+    class ApplicationMappingParameters(_PropertyType):
+        """The Mapping Parameters property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for MappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-mappingparameters.html>`_
+        """
+
+        __slots__ = ("CSVMappingParameters", "JSONMappingParameters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationMappingParameters",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CSVMappingParameters": _convert_ApplicationCSVMappingParameters,
+                "JSONMappingParameters": _convert_ApplicationJSONMappingParameters,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CSVMappingParameters=None, JSONMappingParameters=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CSVMappingParameters",
+                _convert_ApplicationCSVMappingParameters(CSVMappingParameters),
+            )
+            _setattr(
+                "JSONMappingParameters",
+                _convert_ApplicationJSONMappingParameters(JSONMappingParameters),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationMappingParameters = create_object_converter(
+        ApplicationMappingParameters
+    )
+
+    class ApplicationRecordFormat(_PropertyType):
+        """The Record Format property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordFormat
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-recordformat.html>`_
+        """
+
+        __slots__ = ("MappingParameters", "RecordFormatType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationRecordFormat",
+            _PropertyType,
+            __slots__,
+            converters={"MappingParameters": _convert_ApplicationMappingParameters},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, MappingParameters=None, RecordFormatType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "MappingParameters",
+                _convert_ApplicationMappingParameters(MappingParameters),
+            )
+            _setattr("RecordFormatType", RecordFormatType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationRecordColumn_list = create_object_list_converter(
+        ApplicationRecordColumn
+    )
+    _convert_ApplicationRecordFormat = create_object_converter(ApplicationRecordFormat)
+
+    class ApplicationInputSchema(_PropertyType):
+        """The Input Schema property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputSchema
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-inputschema.html>`_
+        """
+
+        __slots__ = ("RecordColumns", "RecordEncoding", "RecordFormat")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInputSchema",
+            _PropertyType,
+            __slots__,
+            converters={
+                "RecordColumns": _convert_ApplicationRecordColumn_list,
+                "RecordFormat": _convert_ApplicationRecordFormat,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            RecordColumns=None,
+            RecordEncoding=None,
+            RecordFormat=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "RecordColumns", _convert_ApplicationRecordColumn_list(RecordColumns)
+            )
+            _setattr("RecordEncoding", RecordEncoding)
+            _setattr("RecordFormat", _convert_ApplicationRecordFormat(RecordFormat))
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationKinesisStreamsInput(_PropertyType):
+        """The Kinesis Streams Input property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisStreamsInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-kinesisstreamsinput.html>`_
+        """
+
+        __slots__ = ("ResourceARN", "RoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationKinesisStreamsInput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceARN=None, RoleARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _setattr("RoleARN", RoleARN)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationKinesisFirehoseInput(_PropertyType):
+        """The Kinesis Firehose Input property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisFirehoseInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-kinesisfirehoseinput.html>`_
+        """
+
+        __slots__ = ("ResourceARN", "RoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationKinesisFirehoseInput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, ResourceARN=None, RoleARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _setattr("RoleARN", RoleARN)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Application(Resource):
-    """A Application for KinesisAnalytics.
+    class ApplicationInputLambdaProcessor(_PropertyType):
+        """The Input Lambda Processor property type for Application in KinesisAnalytics.
 
-    See Also:
-        `AWS Cloud Formation documentation for Application
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalytics-application.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for InputLambdaProcessor
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-inputlambdaprocessor.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::KinesisAnalytics::Application"
+        __slots__ = ("ResourceARN", "RoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInputLambdaProcessor", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ApplicationProperties = attrib(
-        factory=ApplicationProperties,
-        converter=create_object_converter(ApplicationProperties),
+        def __init__(self, *, ResourceARN=None, RoleARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _setattr("RoleARN", RoleARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationInputLambdaProcessor = create_object_converter(
+        ApplicationInputLambdaProcessor
     )
 
+    class ApplicationInputProcessingConfiguration(_PropertyType):
+        """The Input Processing Configuration property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputProcessingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-inputprocessingconfiguration.html>`_
+        """
+
+        __slots__ = ("InputLambdaProcessor",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInputProcessingConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "InputLambdaProcessor": _convert_ApplicationInputLambdaProcessor
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, InputLambdaProcessor=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InputLambdaProcessor",
+                _convert_ApplicationInputLambdaProcessor(InputLambdaProcessor),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationInputParallelism(_PropertyType):
+        """The Input Parallelism property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputParallelism
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-inputparallelism.html>`_
+        """
+
+        __slots__ = ("Count",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInputParallelism", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Count=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Count", Count)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationInputParallelism = create_object_converter(
+        ApplicationInputParallelism
+    )
+    _convert_ApplicationInputProcessingConfiguration = create_object_converter(
+        ApplicationInputProcessingConfiguration
+    )
+    _convert_ApplicationInputSchema = create_object_converter(ApplicationInputSchema)
+    _convert_ApplicationKinesisFirehoseInput = create_object_converter(
+        ApplicationKinesisFirehoseInput
+    )
+    _convert_ApplicationKinesisStreamsInput = create_object_converter(
+        ApplicationKinesisStreamsInput
+    )
+
+    class ApplicationInput(_PropertyType):
+        """The Input property type for Application in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Input
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-application-input.html>`_
+        """
+
+        __slots__ = (
+            "InputParallelism",
+            "InputProcessingConfiguration",
+            "InputSchema",
+            "KinesisFirehoseInput",
+            "KinesisStreamsInput",
+            "NamePrefix",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInput",
+            _PropertyType,
+            __slots__,
+            converters={
+                "InputParallelism": _convert_ApplicationInputParallelism,
+                "InputProcessingConfiguration": _convert_ApplicationInputProcessingConfiguration,
+                "InputSchema": _convert_ApplicationInputSchema,
+                "KinesisFirehoseInput": _convert_ApplicationKinesisFirehoseInput,
+                "KinesisStreamsInput": _convert_ApplicationKinesisStreamsInput,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            InputParallelism=None,
+            InputProcessingConfiguration=None,
+            InputSchema=None,
+            KinesisFirehoseInput=None,
+            KinesisStreamsInput=None,
+            NamePrefix=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InputParallelism",
+                _convert_ApplicationInputParallelism(InputParallelism),
+            )
+            _setattr(
+                "InputProcessingConfiguration",
+                _convert_ApplicationInputProcessingConfiguration(
+                    InputProcessingConfiguration
+                ),
+            )
+            _setattr("InputSchema", _convert_ApplicationInputSchema(InputSchema))
+            _setattr(
+                "KinesisFirehoseInput",
+                _convert_ApplicationKinesisFirehoseInput(KinesisFirehoseInput),
+            )
+            _setattr(
+                "KinesisStreamsInput",
+                _convert_ApplicationKinesisStreamsInput(KinesisStreamsInput),
+            )
+            _setattr("NamePrefix", NamePrefix)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationInput_list = create_object_list_converter(ApplicationInput)
+
+    class ApplicationProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationCode",
+            "ApplicationDescription",
+            "ApplicationName",
+            "Inputs",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Inputs": _convert_ApplicationInput_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ApplicationOutputProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    Output = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            ApplicationCode=None,
+            ApplicationDescription=None,
+            ApplicationName=None,
+            Inputs=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationCode", ApplicationCode)
+            _setattr("ApplicationDescription", ApplicationDescription)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("Inputs", _convert_ApplicationInput_list(Inputs))
+            _init_ResourceProperties(self, kwargs)
 
+    _convert_ApplicationProperties = create_object_converter(ApplicationProperties)
 
-@attrs(**ATTRSCONFIG)
-class ApplicationOutput(Resource):
-    """A Application Output for KinesisAnalytics.
+    class Application(_Resource):
+        """A Application for KinesisAnalytics.
 
-    See Also:
-        `AWS Cloud Formation documentation for ApplicationOutput
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalytics-applicationoutput.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for Application
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalytics-application.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::KinesisAnalytics::ApplicationOutput"
+        RESOURCE_TYPE = "AWS::KinesisAnalytics::Application"
 
-    Properties: ApplicationOutputProperties = attrib(
-        factory=ApplicationOutputProperties,
-        converter=create_object_converter(ApplicationOutputProperties),
+        Properties: ApplicationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Application",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApplicationProperties},
+            factories={"Properties": ApplicationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationProperties()
+            _setattr("Properties", _convert_ApplicationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Application,
+        ApplicationProperties,
+        ApplicationCSVMappingParameters,
+        ApplicationRecordColumn,
+        ApplicationJSONMappingParameters,
+        ApplicationMappingParameters,
+        ApplicationRecordFormat,
+        ApplicationInputSchema,
+        ApplicationKinesisStreamsInput,
+        ApplicationKinesisFirehoseInput,
+        ApplicationInputLambdaProcessor,
+        ApplicationInputProcessingConfiguration,
+        ApplicationInputParallelism,
+        ApplicationInput,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class ApplicationReferenceDataSourceProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    ReferenceDataSource = attrib(default=None)
+def _create_ApplicationOutput():
+    class ApplicationOutputDestinationSchema(_PropertyType):
+        """The Destination Schema property type for ApplicationOutput in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for DestinationSchema
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationoutput-destinationschema.html>`_
+        """
+
+        __slots__ = ("RecordFormatType",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputDestinationSchema", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RecordFormatType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordFormatType", RecordFormatType)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationOutputKinesisFirehoseOutput(_PropertyType):
+        """The Kinesis Firehose Output property type for ApplicationOutput in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisFirehoseOutput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationoutput-kinesisfirehoseoutput.html>`_
+        """
+
+        __slots__ = ("ResourceARN", "RoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputKinesisFirehoseOutput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceARN=None, RoleARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _setattr("RoleARN", RoleARN)
+            _init_PropertyType(self, kwargs)
 
+    class ApplicationOutputKinesisStreamsOutput(_PropertyType):
+        """The Kinesis Streams Output property type for ApplicationOutput in KinesisAnalytics.
 
-@attrs(**ATTRSCONFIG)
-class ApplicationReferenceDataSource(Resource):
-    """A Application Reference Data Source for KinesisAnalytics.
+        See Also:
+            `AWS Cloud Formation documentation for KinesisStreamsOutput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationoutput-kinesisstreamsoutput.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for ApplicationReferenceDataSource
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalytics-applicationreferencedatasource.html>`_
-    """
+        __slots__ = ("ResourceARN", "RoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputKinesisStreamsOutput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::KinesisAnalytics::ApplicationReferenceDataSource"
+        def __init__(self, *, ResourceARN=None, RoleARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _setattr("RoleARN", RoleARN)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ApplicationReferenceDataSourceProperties = attrib(
-        factory=ApplicationReferenceDataSourceProperties,
-        converter=create_object_converter(ApplicationReferenceDataSourceProperties),
+    class ApplicationOutputLambdaOutput(_PropertyType):
+        """The Lambda Output property type for ApplicationOutput in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for LambdaOutput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationoutput-lambdaoutput.html>`_
+        """
+
+        __slots__ = ("ResourceARN", "RoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputLambdaOutput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceARN=None, RoleARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _setattr("RoleARN", RoleARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationOutputDestinationSchema = create_object_converter(
+        ApplicationOutputDestinationSchema
+    )
+    _convert_ApplicationOutputKinesisFirehoseOutput = create_object_converter(
+        ApplicationOutputKinesisFirehoseOutput
     )
+    _convert_ApplicationOutputKinesisStreamsOutput = create_object_converter(
+        ApplicationOutputKinesisStreamsOutput
+    )
+    _convert_ApplicationOutputLambdaOutput = create_object_converter(
+        ApplicationOutputLambdaOutput
+    )
+
+    class ApplicationOutputOutput(_PropertyType):
+        """The Output property type for ApplicationOutput in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for Output
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationoutput-output.html>`_
+        """
+
+        __slots__ = (
+            "DestinationSchema",
+            "KinesisFirehoseOutput",
+            "KinesisStreamsOutput",
+            "LambdaOutput",
+            "Name",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputOutput",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DestinationSchema": _convert_ApplicationOutputDestinationSchema,
+                "KinesisFirehoseOutput": _convert_ApplicationOutputKinesisFirehoseOutput,
+                "KinesisStreamsOutput": _convert_ApplicationOutputKinesisStreamsOutput,
+                "LambdaOutput": _convert_ApplicationOutputLambdaOutput,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DestinationSchema=None,
+            KinesisFirehoseOutput=None,
+            KinesisStreamsOutput=None,
+            LambdaOutput=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DestinationSchema",
+                _convert_ApplicationOutputDestinationSchema(DestinationSchema),
+            )
+            _setattr(
+                "KinesisFirehoseOutput",
+                _convert_ApplicationOutputKinesisFirehoseOutput(KinesisFirehoseOutput),
+            )
+            _setattr(
+                "KinesisStreamsOutput",
+                _convert_ApplicationOutputKinesisStreamsOutput(KinesisStreamsOutput),
+            )
+            _setattr(
+                "LambdaOutput", _convert_ApplicationOutputLambdaOutput(LambdaOutput)
+            )
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationOutputOutput = create_object_converter(ApplicationOutputOutput)
+
+    class ApplicationOutputProperties(_ResourceProperties):
+        __slots__ = ("ApplicationName", "Output")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Output": _convert_ApplicationOutputOutput},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ApplicationName=None, Output=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("Output", _convert_ApplicationOutputOutput(Output))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationOutputProperties = create_object_converter(
+        ApplicationOutputProperties
+    )
+
+    class ApplicationOutput(_Resource):
+        """A Application Output for KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationOutput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalytics-applicationoutput.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::KinesisAnalytics::ApplicationOutput"
+
+        Properties: ApplicationOutputProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutput",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApplicationOutputProperties},
+            factories={"Properties": ApplicationOutputProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationOutputProperties()
+            _setattr("Properties", _convert_ApplicationOutputProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ApplicationOutput,
+        ApplicationOutputProperties,
+        ApplicationOutputDestinationSchema,
+        ApplicationOutputKinesisFirehoseOutput,
+        ApplicationOutputKinesisStreamsOutput,
+        ApplicationOutputLambdaOutput,
+        ApplicationOutputOutput,
+    )
+
+
+def _create_ApplicationReferenceDataSource():
+    class ApplicationReferenceDataSourceCSVMappingParameters(_PropertyType):
+        """The Csv Mapping Parameters property type for ApplicationReferenceDataSource in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for CSVMappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationreferencedatasource-csvmappingparameters.html>`_
+        """
+
+        __slots__ = ("RecordColumnDelimiter", "RecordRowDelimiter")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceCSVMappingParameters",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, RecordColumnDelimiter=None, RecordRowDelimiter=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordColumnDelimiter", RecordColumnDelimiter)
+            _setattr("RecordRowDelimiter", RecordRowDelimiter)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationReferenceDataSourceJSONMappingParameters(_PropertyType):
+        """The Json Mapping Parameters property type for ApplicationReferenceDataSource in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for JSONMappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationreferencedatasource-jsonmappingparameters.html>`_
+        """
+
+        __slots__ = ("RecordRowPath",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceJSONMappingParameters",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RecordRowPath=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordRowPath", RecordRowPath)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceCSVMappingParameters = (
+        create_object_converter(ApplicationReferenceDataSourceCSVMappingParameters)
+    )
+    _convert_ApplicationReferenceDataSourceJSONMappingParameters = (
+        create_object_converter(ApplicationReferenceDataSourceJSONMappingParameters)
+    )
+
+    class ApplicationReferenceDataSourceMappingParameters(_PropertyType):
+        """The Mapping Parameters property type for ApplicationReferenceDataSource in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for MappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationreferencedatasource-mappingparameters.html>`_
+        """
+
+        __slots__ = ("CSVMappingParameters", "JSONMappingParameters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceMappingParameters",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CSVMappingParameters": _convert_ApplicationReferenceDataSourceCSVMappingParameters,
+                "JSONMappingParameters": _convert_ApplicationReferenceDataSourceJSONMappingParameters,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CSVMappingParameters=None, JSONMappingParameters=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CSVMappingParameters",
+                _convert_ApplicationReferenceDataSourceCSVMappingParameters(
+                    CSVMappingParameters
+                ),
+            )
+            _setattr(
+                "JSONMappingParameters",
+                _convert_ApplicationReferenceDataSourceJSONMappingParameters(
+                    JSONMappingParameters
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationReferenceDataSourceRecordColumn(_PropertyType):
+        """The Record Column property type for ApplicationReferenceDataSource in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordColumn
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationreferencedatasource-recordcolumn.html>`_
+        """
+
+        __slots__ = ("Mapping", "Name", "SqlType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceRecordColumn", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Mapping=None, Name=None, SqlType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Mapping", Mapping)
+            _setattr("Name", Name)
+            _setattr("SqlType", SqlType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceMappingParameters = create_object_converter(
+        ApplicationReferenceDataSourceMappingParameters
+    )
+
+    class ApplicationReferenceDataSourceRecordFormat(_PropertyType):
+        """The Record Format property type for ApplicationReferenceDataSource in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordFormat
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationreferencedatasource-recordformat.html>`_
+        """
+
+        __slots__ = ("MappingParameters", "RecordFormatType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceRecordFormat",
+            _PropertyType,
+            __slots__,
+            converters={
+                "MappingParameters": _convert_ApplicationReferenceDataSourceMappingParameters
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, MappingParameters=None, RecordFormatType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "MappingParameters",
+                _convert_ApplicationReferenceDataSourceMappingParameters(
+                    MappingParameters
+                ),
+            )
+            _setattr("RecordFormatType", RecordFormatType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceRecordColumn_list = (
+        create_object_list_converter(ApplicationReferenceDataSourceRecordColumn)
+    )
+    _convert_ApplicationReferenceDataSourceRecordFormat = create_object_converter(
+        ApplicationReferenceDataSourceRecordFormat
+    )
+
+    class ApplicationReferenceDataSourceReferenceSchema(_PropertyType):
+        """The Reference Schema property type for ApplicationReferenceDataSource in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReferenceSchema
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationreferencedatasource-referenceschema.html>`_
+        """
+
+        __slots__ = ("RecordColumns", "RecordEncoding", "RecordFormat")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceReferenceSchema",
+            _PropertyType,
+            __slots__,
+            converters={
+                "RecordColumns": _convert_ApplicationReferenceDataSourceRecordColumn_list,
+                "RecordFormat": _convert_ApplicationReferenceDataSourceRecordFormat,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            RecordColumns=None,
+            RecordEncoding=None,
+            RecordFormat=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "RecordColumns",
+                _convert_ApplicationReferenceDataSourceRecordColumn_list(RecordColumns),
+            )
+            _setattr("RecordEncoding", RecordEncoding)
+            _setattr(
+                "RecordFormat",
+                _convert_ApplicationReferenceDataSourceRecordFormat(RecordFormat),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationReferenceDataSourceS3ReferenceDataSource(_PropertyType):
+        """The S3 Reference Data Source property type for ApplicationReferenceDataSource in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3ReferenceDataSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationreferencedatasource-s3referencedatasource.html>`_
+        """
+
+        __slots__ = ("BucketARN", "FileKey", "ReferenceRoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceS3ReferenceDataSource",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BucketARN=None, FileKey=None, ReferenceRoleARN=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketARN", BucketARN)
+            _setattr("FileKey", FileKey)
+            _setattr("ReferenceRoleARN", ReferenceRoleARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceReferenceSchema = create_object_converter(
+        ApplicationReferenceDataSourceReferenceSchema
+    )
+    _convert_ApplicationReferenceDataSourceS3ReferenceDataSource = (
+        create_object_converter(ApplicationReferenceDataSourceS3ReferenceDataSource)
+    )
+
+    class ApplicationReferenceDataSourceReferenceDataSource(_PropertyType):
+        """The Reference Data Source property type for ApplicationReferenceDataSource in KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReferenceDataSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalytics-applicationreferencedatasource-referencedatasource.html>`_
+        """
+
+        __slots__ = ("ReferenceSchema", "S3ReferenceDataSource", "TableName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceReferenceDataSource",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ReferenceSchema": _convert_ApplicationReferenceDataSourceReferenceSchema,
+                "S3ReferenceDataSource": _convert_ApplicationReferenceDataSourceS3ReferenceDataSource,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ReferenceSchema=None,
+            S3ReferenceDataSource=None,
+            TableName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ReferenceSchema",
+                _convert_ApplicationReferenceDataSourceReferenceSchema(ReferenceSchema),
+            )
+            _setattr(
+                "S3ReferenceDataSource",
+                _convert_ApplicationReferenceDataSourceS3ReferenceDataSource(
+                    S3ReferenceDataSource
+                ),
+            )
+            _setattr("TableName", TableName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceReferenceDataSource = (
+        create_object_converter(ApplicationReferenceDataSourceReferenceDataSource)
+    )
+
+    class ApplicationReferenceDataSourceProperties(_ResourceProperties):
+        __slots__ = ("ApplicationName", "ReferenceDataSource")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ReferenceDataSource": _convert_ApplicationReferenceDataSourceReferenceDataSource
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApplicationName=None, ReferenceDataSource=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr(
+                "ReferenceDataSource",
+                _convert_ApplicationReferenceDataSourceReferenceDataSource(
+                    ReferenceDataSource
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceProperties = create_object_converter(
+        ApplicationReferenceDataSourceProperties
+    )
+
+    class ApplicationReferenceDataSource(_Resource):
+        """A Application Reference Data Source for KinesisAnalytics.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationReferenceDataSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalytics-applicationreferencedatasource.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::KinesisAnalytics::ApplicationReferenceDataSource"
+
+        Properties: ApplicationReferenceDataSourceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSource",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_ApplicationReferenceDataSourceProperties
+            },
+            factories={"Properties": ApplicationReferenceDataSourceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationReferenceDataSourceProperties()
+            _setattr(
+                "Properties",
+                _convert_ApplicationReferenceDataSourceProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        ApplicationReferenceDataSource,
+        ApplicationReferenceDataSourceProperties,
+        ApplicationReferenceDataSourceCSVMappingParameters,
+        ApplicationReferenceDataSourceJSONMappingParameters,
+        ApplicationReferenceDataSourceMappingParameters,
+        ApplicationReferenceDataSourceRecordColumn,
+        ApplicationReferenceDataSourceRecordFormat,
+        ApplicationReferenceDataSourceReferenceSchema,
+        ApplicationReferenceDataSourceS3ReferenceDataSource,
+        ApplicationReferenceDataSourceReferenceDataSource,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Application": _create_Application,
+        "ApplicationProperties": _create_Application,
+        "ApplicationCSVMappingParameters": _create_Application,
+        "ApplicationInput": _create_Application,
+        "ApplicationInputLambdaProcessor": _create_Application,
+        "ApplicationInputParallelism": _create_Application,
+        "ApplicationInputProcessingConfiguration": _create_Application,
+        "ApplicationInputSchema": _create_Application,
+        "ApplicationJSONMappingParameters": _create_Application,
+        "ApplicationKinesisFirehoseInput": _create_Application,
+        "ApplicationKinesisStreamsInput": _create_Application,
+        "ApplicationMappingParameters": _create_Application,
+        "ApplicationRecordColumn": _create_Application,
+        "ApplicationRecordFormat": _create_Application,
+        "ApplicationOutput": _create_ApplicationOutput,
+        "ApplicationOutputProperties": _create_ApplicationOutput,
+        "ApplicationOutputDestinationSchema": _create_ApplicationOutput,
+        "ApplicationOutputKinesisFirehoseOutput": _create_ApplicationOutput,
+        "ApplicationOutputKinesisStreamsOutput": _create_ApplicationOutput,
+        "ApplicationOutputLambdaOutput": _create_ApplicationOutput,
+        "ApplicationOutputOutput": _create_ApplicationOutput,
+        "ApplicationReferenceDataSource": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceProperties": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceCSVMappingParameters": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceJSONMappingParameters": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceMappingParameters": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceRecordColumn": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceRecordFormat": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceReferenceDataSource": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceReferenceSchema": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceS3ReferenceDataSource": _create_ApplicationReferenceDataSource,
+    },
+)
@@ -7,116 +7,1750 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Application",
     "ApplicationProperties",
+    "ApplicationApplicationCodeConfiguration",
+    "ApplicationApplicationConfiguration",
+    "ApplicationApplicationSnapshotConfiguration",
+    "ApplicationCheckpointConfiguration",
+    "ApplicationCodeContent",
+    "ApplicationCSVMappingParameters",
+    "ApplicationEnvironmentProperties",
+    "ApplicationFlinkApplicationConfiguration",
+    "ApplicationInput",
+    "ApplicationInputLambdaProcessor",
+    "ApplicationInputParallelism",
+    "ApplicationInputProcessingConfiguration",
+    "ApplicationInputSchema",
+    "ApplicationJSONMappingParameters",
+    "ApplicationKinesisFirehoseInput",
+    "ApplicationKinesisStreamsInput",
+    "ApplicationMappingParameters",
+    "ApplicationMonitoringConfiguration",
+    "ApplicationParallelismConfiguration",
+    "ApplicationPropertyGroup",
+    "ApplicationRecordColumn",
+    "ApplicationRecordFormat",
+    "ApplicationS3ContentLocation",
+    "ApplicationSqlApplicationConfiguration",
     "ApplicationCloudWatchLoggingOption",
     "ApplicationCloudWatchLoggingOptionProperties",
+    "ApplicationCloudWatchLoggingOptionCloudWatchLoggingOption",
     "ApplicationOutput",
     "ApplicationOutputProperties",
+    "ApplicationOutputDestinationSchema",
+    "ApplicationOutputKinesisFirehoseOutput",
+    "ApplicationOutputKinesisStreamsOutput",
+    "ApplicationOutputLambdaOutput",
+    "ApplicationOutputOutput",
     "ApplicationReferenceDataSource",
     "ApplicationReferenceDataSourceProperties",
+    "ApplicationReferenceDataSourceCSVMappingParameters",
+    "ApplicationReferenceDataSourceJSONMappingParameters",
+    "ApplicationReferenceDataSourceMappingParameters",
+    "ApplicationReferenceDataSourceRecordColumn",
+    "ApplicationReferenceDataSourceRecordFormat",
+    "ApplicationReferenceDataSourceReferenceDataSource",
+    "ApplicationReferenceDataSourceReferenceSchema",
+    "ApplicationReferenceDataSourceS3ReferenceDataSource",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ApplicationProperties(ResourceProperties):
-    ApplicationConfiguration = attrib(default=None)
-    ApplicationDescription = attrib(default=None)
-    ApplicationName = attrib(default=None)
-    RuntimeEnvironment = attrib(default=None)
-    ServiceExecutionRole = attrib(default=None)
+def _create_Application():
+    class ApplicationS3ContentLocation(_PropertyType):
+        """The S3 Content Location property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3ContentLocation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-s3contentlocation.html>`_
+        """
+
+        __slots__ = ("BucketARN", "FileKey", "ObjectVersion")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationS3ContentLocation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BucketARN=None, FileKey=None, ObjectVersion=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketARN", BucketARN)
+            _setattr("FileKey", FileKey)
+            _setattr("ObjectVersion", ObjectVersion)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationS3ContentLocation = create_object_converter(
+        ApplicationS3ContentLocation
+    )
+
+    class ApplicationCodeContent(_PropertyType):
+        """The Code Content property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CodeContent
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-codecontent.html>`_
+        """
+
+        __slots__ = ("S3ContentLocation", "TextContent", "ZipFileContent")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationCodeContent",
+            _PropertyType,
+            __slots__,
+            converters={"S3ContentLocation": _convert_ApplicationS3ContentLocation},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            S3ContentLocation=None,
+            TextContent=None,
+            ZipFileContent=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "S3ContentLocation",
+                _convert_ApplicationS3ContentLocation(S3ContentLocation),
+            )
+            _setattr("TextContent", TextContent)
+            _setattr("ZipFileContent", ZipFileContent)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationCodeContent = create_object_converter(ApplicationCodeContent)
+
+    class ApplicationApplicationCodeConfiguration(_PropertyType):
+        """The Application Code Configuration property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationCodeConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-applicationcodeconfiguration.html>`_
+        """
+
+        __slots__ = ("CodeContent", "CodeContentType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationApplicationCodeConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"CodeContent": _convert_ApplicationCodeContent},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CodeContent=None, CodeContentType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CodeContent", _convert_ApplicationCodeContent(CodeContent))
+            _setattr("CodeContentType", CodeContentType)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationPropertyGroup(_PropertyType):
+        """The Property Group property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for PropertyGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-propertygroup.html>`_
+        """
+
+        __slots__ = ("PropertyGroupId", "PropertyMap")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationPropertyGroup", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PropertyGroupId=None, PropertyMap=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PropertyGroupId", PropertyGroupId)
+            _setattr("PropertyMap", PropertyMap)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationPropertyGroup_list = create_object_list_converter(
+        ApplicationPropertyGroup
+    )
+
+    class ApplicationEnvironmentProperties(_PropertyType):
+        """The Environment Properties property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for EnvironmentProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-environmentproperties.html>`_
+        """
+
+        __slots__ = ("PropertyGroups",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationEnvironmentProperties",
+            _PropertyType,
+            __slots__,
+            converters={"PropertyGroups": _convert_ApplicationPropertyGroup_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PropertyGroups=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "PropertyGroups", _convert_ApplicationPropertyGroup_list(PropertyGroups)
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationCheckpointConfiguration(_PropertyType):
+        """The Checkpoint Configuration property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CheckpointConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-checkpointconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "CheckpointingEnabled",
+            "CheckpointInterval",
+            "ConfigurationType",
+            "MinPauseBetweenCheckpoints",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationCheckpointConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CheckpointingEnabled=None,
+            CheckpointInterval=None,
+            ConfigurationType=None,
+            MinPauseBetweenCheckpoints=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CheckpointingEnabled", CheckpointingEnabled)
+            _setattr("CheckpointInterval", CheckpointInterval)
+            _setattr("ConfigurationType", ConfigurationType)
+            _setattr("MinPauseBetweenCheckpoints", MinPauseBetweenCheckpoints)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationParallelismConfiguration(_PropertyType):
+        """The Parallelism Configuration property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParallelismConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-parallelismconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "AutoScalingEnabled",
+            "ConfigurationType",
+            "Parallelism",
+            "ParallelismPerKPU",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationParallelismConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoScalingEnabled=None,
+            ConfigurationType=None,
+            Parallelism=None,
+            ParallelismPerKPU=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoScalingEnabled", AutoScalingEnabled)
+            _setattr("ConfigurationType", ConfigurationType)
+            _setattr("Parallelism", Parallelism)
+            _setattr("ParallelismPerKPU", ParallelismPerKPU)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationMonitoringConfiguration(_PropertyType):
+        """The Monitoring Configuration property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for MonitoringConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-monitoringconfiguration.html>`_
+        """
+
+        __slots__ = ("ConfigurationType", "LogLevel", "MetricsLevel")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationMonitoringConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ConfigurationType=None, LogLevel=None, MetricsLevel=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConfigurationType", ConfigurationType)
+            _setattr("LogLevel", LogLevel)
+            _setattr("MetricsLevel", MetricsLevel)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationCheckpointConfiguration = create_object_converter(
+        ApplicationCheckpointConfiguration
+    )
+    _convert_ApplicationMonitoringConfiguration = create_object_converter(
+        ApplicationMonitoringConfiguration
+    )
+    _convert_ApplicationParallelismConfiguration = create_object_converter(
+        ApplicationParallelismConfiguration
+    )
+
+    class ApplicationFlinkApplicationConfiguration(_PropertyType):
+        """The Flink Application Configuration property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FlinkApplicationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-flinkapplicationconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "CheckpointConfiguration",
+            "MonitoringConfiguration",
+            "ParallelismConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationFlinkApplicationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CheckpointConfiguration": _convert_ApplicationCheckpointConfiguration,
+                "MonitoringConfiguration": _convert_ApplicationMonitoringConfiguration,
+                "ParallelismConfiguration": _convert_ApplicationParallelismConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CheckpointConfiguration=None,
+            MonitoringConfiguration=None,
+            ParallelismConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CheckpointConfiguration",
+                _convert_ApplicationCheckpointConfiguration(CheckpointConfiguration),
+            )
+            _setattr(
+                "MonitoringConfiguration",
+                _convert_ApplicationMonitoringConfiguration(MonitoringConfiguration),
+            )
+            _setattr(
+                "ParallelismConfiguration",
+                _convert_ApplicationParallelismConfiguration(ParallelismConfiguration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationRecordColumn(_PropertyType):
+        """The Record Column property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordColumn
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-recordcolumn.html>`_
+        """
+
+        __slots__ = ("Mapping", "Name", "SqlType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationRecordColumn", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Mapping=None, Name=None, SqlType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Mapping", Mapping)
+            _setattr("Name", Name)
+            _setattr("SqlType", SqlType)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationJSONMappingParameters(_PropertyType):
+        """The Json Mapping Parameters property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for JSONMappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-jsonmappingparameters.html>`_
+        """
+
+        __slots__ = ("RecordRowPath",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationJSONMappingParameters", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RecordRowPath=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordRowPath", RecordRowPath)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationCSVMappingParameters(_PropertyType):
+        """The Csv Mapping Parameters property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CSVMappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-csvmappingparameters.html>`_
+        """
+
+        __slots__ = ("RecordColumnDelimiter", "RecordRowDelimiter")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationCSVMappingParameters", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, RecordColumnDelimiter=None, RecordRowDelimiter=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordColumnDelimiter", RecordColumnDelimiter)
+            _setattr("RecordRowDelimiter", RecordRowDelimiter)
+            _init_PropertyType(self, kwargs)
 
+    _convert_ApplicationCSVMappingParameters = create_object_converter(
+        ApplicationCSVMappingParameters
+    )
+    _convert_ApplicationJSONMappingParameters = create_object_converter(
+        ApplicationJSONMappingParameters
+    )
 
-@attrs(**ATTRSCONFIG)
-class Application(Resource):
-    """A Application for KinesisAnalyticsV2.
+    class ApplicationMappingParameters(_PropertyType):
+        """The Mapping Parameters property type for Application in KinesisAnalyticsV2.
 
-    See Also:
-        `AWS Cloud Formation documentation for Application
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalyticsv2-application.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for MappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-mappingparameters.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::KinesisAnalyticsV2::Application"
+        __slots__ = ("CSVMappingParameters", "JSONMappingParameters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationMappingParameters",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CSVMappingParameters": _convert_ApplicationCSVMappingParameters,
+                "JSONMappingParameters": _convert_ApplicationJSONMappingParameters,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ApplicationProperties = attrib(
-        factory=ApplicationProperties,
-        converter=create_object_converter(ApplicationProperties),
+        def __init__(
+            self, *, CSVMappingParameters=None, JSONMappingParameters=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CSVMappingParameters",
+                _convert_ApplicationCSVMappingParameters(CSVMappingParameters),
+            )
+            _setattr(
+                "JSONMappingParameters",
+                _convert_ApplicationJSONMappingParameters(JSONMappingParameters),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationMappingParameters = create_object_converter(
+        ApplicationMappingParameters
     )
 
+    class ApplicationRecordFormat(_PropertyType):
+        """The Record Format property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordFormat
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-recordformat.html>`_
+        """
+
+        __slots__ = ("MappingParameters", "RecordFormatType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationRecordFormat",
+            _PropertyType,
+            __slots__,
+            converters={"MappingParameters": _convert_ApplicationMappingParameters},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, MappingParameters=None, RecordFormatType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "MappingParameters",
+                _convert_ApplicationMappingParameters(MappingParameters),
+            )
+            _setattr("RecordFormatType", RecordFormatType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationRecordColumn_list = create_object_list_converter(
+        ApplicationRecordColumn
+    )
+    _convert_ApplicationRecordFormat = create_object_converter(ApplicationRecordFormat)
+
+    class ApplicationInputSchema(_PropertyType):
+        """The Input Schema property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputSchema
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-inputschema.html>`_
+        """
+
+        __slots__ = ("RecordColumns", "RecordEncoding", "RecordFormat")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInputSchema",
+            _PropertyType,
+            __slots__,
+            converters={
+                "RecordColumns": _convert_ApplicationRecordColumn_list,
+                "RecordFormat": _convert_ApplicationRecordFormat,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            RecordColumns=None,
+            RecordEncoding=None,
+            RecordFormat=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "RecordColumns", _convert_ApplicationRecordColumn_list(RecordColumns)
+            )
+            _setattr("RecordEncoding", RecordEncoding)
+            _setattr("RecordFormat", _convert_ApplicationRecordFormat(RecordFormat))
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationKinesisStreamsInput(_PropertyType):
+        """The Kinesis Streams Input property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisStreamsInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-kinesisstreamsinput.html>`_
+        """
+
+        __slots__ = ("ResourceARN",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationKinesisStreamsInput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ApplicationCloudWatchLoggingOptionProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    CloudWatchLoggingOption = attrib(default=None)
+        def __init__(self, *, ResourceARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _init_PropertyType(self, kwargs)
 
+    class ApplicationKinesisFirehoseInput(_PropertyType):
+        """The Kinesis Firehose Input property type for Application in KinesisAnalyticsV2.
 
-@attrs(**ATTRSCONFIG)
-class ApplicationCloudWatchLoggingOption(Resource):
-    """A Application Cloud Watch Logging Option for KinesisAnalyticsV2.
+        See Also:
+            `AWS Cloud Formation documentation for KinesisFirehoseInput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-kinesisfirehoseinput.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for ApplicationCloudWatchLoggingOption
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalyticsv2-applicationcloudwatchloggingoption.html>`_
-    """
+        __slots__ = ("ResourceARN",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationKinesisFirehoseInput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::KinesisAnalyticsV2::ApplicationCloudWatchLoggingOption"
+        def __init__(self, *, ResourceARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ApplicationCloudWatchLoggingOptionProperties = attrib(
-        factory=ApplicationCloudWatchLoggingOptionProperties,
-        converter=create_object_converter(ApplicationCloudWatchLoggingOptionProperties),
+    class ApplicationInputLambdaProcessor(_PropertyType):
+        """The Input Lambda Processor property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputLambdaProcessor
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-inputlambdaprocessor.html>`_
+        """
+
+        __slots__ = ("ResourceARN",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInputLambdaProcessor", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationInputLambdaProcessor = create_object_converter(
+        ApplicationInputLambdaProcessor
     )
 
+    class ApplicationInputProcessingConfiguration(_PropertyType):
+        """The Input Processing Configuration property type for Application in KinesisAnalyticsV2.
 
-@attrs(**ATTRSCONFIG)
-class ApplicationOutputProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    Output = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for InputProcessingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-inputprocessingconfiguration.html>`_
+        """
 
+        __slots__ = ("InputLambdaProcessor",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInputProcessingConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "InputLambdaProcessor": _convert_ApplicationInputLambdaProcessor
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ApplicationOutput(Resource):
-    """A Application Output for KinesisAnalyticsV2.
+        def __init__(self, *, InputLambdaProcessor=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InputLambdaProcessor",
+                _convert_ApplicationInputLambdaProcessor(InputLambdaProcessor),
+            )
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for ApplicationOutput
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalyticsv2-applicationoutput.html>`_
-    """
+    class ApplicationInputParallelism(_PropertyType):
+        """The Input Parallelism property type for Application in KinesisAnalyticsV2.
 
-    RESOURCE_TYPE = "AWS::KinesisAnalyticsV2::ApplicationOutput"
+        See Also:
+            `AWS Cloud Formation documentation for InputParallelism
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-inputparallelism.html>`_
+        """
 
-    Properties: ApplicationOutputProperties = attrib(
-        factory=ApplicationOutputProperties,
-        converter=create_object_converter(ApplicationOutputProperties),
+        __slots__ = ("Count",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInputParallelism", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Count=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Count", Count)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationInputParallelism = create_object_converter(
+        ApplicationInputParallelism
+    )
+    _convert_ApplicationInputProcessingConfiguration = create_object_converter(
+        ApplicationInputProcessingConfiguration
     )
+    _convert_ApplicationInputSchema = create_object_converter(ApplicationInputSchema)
+    _convert_ApplicationKinesisFirehoseInput = create_object_converter(
+        ApplicationKinesisFirehoseInput
+    )
+    _convert_ApplicationKinesisStreamsInput = create_object_converter(
+        ApplicationKinesisStreamsInput
+    )
+
+    class ApplicationInput(_PropertyType):
+        """The Input property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Input
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-input.html>`_
+        """
+
+        __slots__ = (
+            "InputParallelism",
+            "InputProcessingConfiguration",
+            "InputSchema",
+            "KinesisFirehoseInput",
+            "KinesisStreamsInput",
+            "NamePrefix",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationInput",
+            _PropertyType,
+            __slots__,
+            converters={
+                "InputParallelism": _convert_ApplicationInputParallelism,
+                "InputProcessingConfiguration": _convert_ApplicationInputProcessingConfiguration,
+                "InputSchema": _convert_ApplicationInputSchema,
+                "KinesisFirehoseInput": _convert_ApplicationKinesisFirehoseInput,
+                "KinesisStreamsInput": _convert_ApplicationKinesisStreamsInput,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            InputParallelism=None,
+            InputProcessingConfiguration=None,
+            InputSchema=None,
+            KinesisFirehoseInput=None,
+            KinesisStreamsInput=None,
+            NamePrefix=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "InputParallelism",
+                _convert_ApplicationInputParallelism(InputParallelism),
+            )
+            _setattr(
+                "InputProcessingConfiguration",
+                _convert_ApplicationInputProcessingConfiguration(
+                    InputProcessingConfiguration
+                ),
+            )
+            _setattr("InputSchema", _convert_ApplicationInputSchema(InputSchema))
+            _setattr(
+                "KinesisFirehoseInput",
+                _convert_ApplicationKinesisFirehoseInput(KinesisFirehoseInput),
+            )
+            _setattr(
+                "KinesisStreamsInput",
+                _convert_ApplicationKinesisStreamsInput(KinesisStreamsInput),
+            )
+            _setattr("NamePrefix", NamePrefix)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationInput_list = create_object_list_converter(ApplicationInput)
 
+    class ApplicationSqlApplicationConfiguration(_PropertyType):
+        """The Sql Application Configuration property type for Application in KinesisAnalyticsV2.
 
-@attrs(**ATTRSCONFIG)
-class ApplicationReferenceDataSourceProperties(ResourceProperties):
-    ApplicationName = attrib(default=None)
-    ReferenceDataSource = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for SqlApplicationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-sqlapplicationconfiguration.html>`_
+        """
 
+        __slots__ = ("Inputs",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationSqlApplicationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Inputs": _convert_ApplicationInput_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ApplicationReferenceDataSource(Resource):
-    """A Application Reference Data Source for KinesisAnalyticsV2.
+        def __init__(self, *, Inputs=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Inputs", _convert_ApplicationInput_list(Inputs))
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for ApplicationReferenceDataSource
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalyticsv2-applicationreferencedatasource.html>`_
-    """
+    class ApplicationApplicationSnapshotConfiguration(_PropertyType):
+        """The Application Snapshot Configuration property type for Application in KinesisAnalyticsV2.
 
-    RESOURCE_TYPE = "AWS::KinesisAnalyticsV2::ApplicationReferenceDataSource"
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationSnapshotConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-applicationsnapshotconfiguration.html>`_
+        """
 
-    Properties: ApplicationReferenceDataSourceProperties = attrib(
-        factory=ApplicationReferenceDataSourceProperties,
-        converter=create_object_converter(ApplicationReferenceDataSourceProperties),
+        __slots__ = ("SnapshotsEnabled",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationApplicationSnapshotConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SnapshotsEnabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SnapshotsEnabled", SnapshotsEnabled)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationApplicationCodeConfiguration = create_object_converter(
+        ApplicationApplicationCodeConfiguration
+    )
+    _convert_ApplicationApplicationSnapshotConfiguration = create_object_converter(
+        ApplicationApplicationSnapshotConfiguration
+    )
+    _convert_ApplicationEnvironmentProperties = create_object_converter(
+        ApplicationEnvironmentProperties
+    )
+    _convert_ApplicationFlinkApplicationConfiguration = create_object_converter(
+        ApplicationFlinkApplicationConfiguration
+    )
+    _convert_ApplicationSqlApplicationConfiguration = create_object_converter(
+        ApplicationSqlApplicationConfiguration
+    )
+
+    class ApplicationApplicationConfiguration(_PropertyType):
+        """The Application Configuration property type for Application in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-application-applicationconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "ApplicationCodeConfiguration",
+            "ApplicationSnapshotConfiguration",
+            "EnvironmentProperties",
+            "FlinkApplicationConfiguration",
+            "SqlApplicationConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationApplicationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ApplicationCodeConfiguration": _convert_ApplicationApplicationCodeConfiguration,
+                "ApplicationSnapshotConfiguration": _convert_ApplicationApplicationSnapshotConfiguration,
+                "EnvironmentProperties": _convert_ApplicationEnvironmentProperties,
+                "FlinkApplicationConfiguration": _convert_ApplicationFlinkApplicationConfiguration,
+                "SqlApplicationConfiguration": _convert_ApplicationSqlApplicationConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationCodeConfiguration=None,
+            ApplicationSnapshotConfiguration=None,
+            EnvironmentProperties=None,
+            FlinkApplicationConfiguration=None,
+            SqlApplicationConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ApplicationCodeConfiguration",
+                _convert_ApplicationApplicationCodeConfiguration(
+                    ApplicationCodeConfiguration
+                ),
+            )
+            _setattr(
+                "ApplicationSnapshotConfiguration",
+                _convert_ApplicationApplicationSnapshotConfiguration(
+                    ApplicationSnapshotConfiguration
+                ),
+            )
+            _setattr(
+                "EnvironmentProperties",
+                _convert_ApplicationEnvironmentProperties(EnvironmentProperties),
+            )
+            _setattr(
+                "FlinkApplicationConfiguration",
+                _convert_ApplicationFlinkApplicationConfiguration(
+                    FlinkApplicationConfiguration
+                ),
+            )
+            _setattr(
+                "SqlApplicationConfiguration",
+                _convert_ApplicationSqlApplicationConfiguration(
+                    SqlApplicationConfiguration
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationApplicationConfiguration = create_object_converter(
+        ApplicationApplicationConfiguration
+    )
+
+    class ApplicationProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationConfiguration",
+            "ApplicationDescription",
+            "ApplicationName",
+            "RuntimeEnvironment",
+            "ServiceExecutionRole",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ApplicationConfiguration": _convert_ApplicationApplicationConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationConfiguration=None,
+            ApplicationDescription=None,
+            ApplicationName=None,
+            RuntimeEnvironment=None,
+            ServiceExecutionRole=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ApplicationConfiguration",
+                _convert_ApplicationApplicationConfiguration(ApplicationConfiguration),
+            )
+            _setattr("ApplicationDescription", ApplicationDescription)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("RuntimeEnvironment", RuntimeEnvironment)
+            _setattr("ServiceExecutionRole", ServiceExecutionRole)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationProperties = create_object_converter(ApplicationProperties)
+
+    class Application(_Resource):
+        """A Application for KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Application
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalyticsv2-application.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::KinesisAnalyticsV2::Application"
+
+        Properties: ApplicationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Application",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApplicationProperties},
+            factories={"Properties": ApplicationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationProperties()
+            _setattr("Properties", _convert_ApplicationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Application,
+        ApplicationProperties,
+        ApplicationS3ContentLocation,
+        ApplicationCodeContent,
+        ApplicationApplicationCodeConfiguration,
+        ApplicationPropertyGroup,
+        ApplicationEnvironmentProperties,
+        ApplicationCheckpointConfiguration,
+        ApplicationParallelismConfiguration,
+        ApplicationMonitoringConfiguration,
+        ApplicationFlinkApplicationConfiguration,
+        ApplicationRecordColumn,
+        ApplicationJSONMappingParameters,
+        ApplicationCSVMappingParameters,
+        ApplicationMappingParameters,
+        ApplicationRecordFormat,
+        ApplicationInputSchema,
+        ApplicationKinesisStreamsInput,
+        ApplicationKinesisFirehoseInput,
+        ApplicationInputLambdaProcessor,
+        ApplicationInputProcessingConfiguration,
+        ApplicationInputParallelism,
+        ApplicationInput,
+        ApplicationSqlApplicationConfiguration,
+        ApplicationApplicationSnapshotConfiguration,
+        ApplicationApplicationConfiguration,
     )
+
+
+def _create_ApplicationCloudWatchLoggingOption():
+    class ApplicationCloudWatchLoggingOptionCloudWatchLoggingOption(_PropertyType):
+        """The Cloud Watch Logging Option property type for ApplicationCloudWatchLoggingOption in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudWatchLoggingOption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationcloudwatchloggingoption-cloudwatchloggingoption.html>`_
+        """
+
+        __slots__ = ("LogStreamARN",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationCloudWatchLoggingOptionCloudWatchLoggingOption",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, LogStreamARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LogStreamARN", LogStreamARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationCloudWatchLoggingOptionCloudWatchLoggingOption = (
+        create_object_converter(
+            ApplicationCloudWatchLoggingOptionCloudWatchLoggingOption
+        )
+    )
+
+    class ApplicationCloudWatchLoggingOptionProperties(_ResourceProperties):
+        __slots__ = ("ApplicationName", "CloudWatchLoggingOption")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationCloudWatchLoggingOptionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CloudWatchLoggingOption": _convert_ApplicationCloudWatchLoggingOptionCloudWatchLoggingOption
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApplicationName=None, CloudWatchLoggingOption=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr(
+                "CloudWatchLoggingOption",
+                _convert_ApplicationCloudWatchLoggingOptionCloudWatchLoggingOption(
+                    CloudWatchLoggingOption
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationCloudWatchLoggingOptionProperties = create_object_converter(
+        ApplicationCloudWatchLoggingOptionProperties
+    )
+
+    class ApplicationCloudWatchLoggingOption(_Resource):
+        """A Application Cloud Watch Logging Option for KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationCloudWatchLoggingOption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalyticsv2-applicationcloudwatchloggingoption.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::KinesisAnalyticsV2::ApplicationCloudWatchLoggingOption"
+
+        Properties: ApplicationCloudWatchLoggingOptionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationCloudWatchLoggingOption",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_ApplicationCloudWatchLoggingOptionProperties
+            },
+            factories={"Properties": ApplicationCloudWatchLoggingOptionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationCloudWatchLoggingOptionProperties()
+            _setattr(
+                "Properties",
+                _convert_ApplicationCloudWatchLoggingOptionProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        ApplicationCloudWatchLoggingOption,
+        ApplicationCloudWatchLoggingOptionProperties,
+        ApplicationCloudWatchLoggingOptionCloudWatchLoggingOption,
+    )
+
+
+def _create_ApplicationOutput():
+    class ApplicationOutputDestinationSchema(_PropertyType):
+        """The Destination Schema property type for ApplicationOutput in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for DestinationSchema
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationoutput-destinationschema.html>`_
+        """
+
+        __slots__ = ("RecordFormatType",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputDestinationSchema", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RecordFormatType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordFormatType", RecordFormatType)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationOutputKinesisFirehoseOutput(_PropertyType):
+        """The Kinesis Firehose Output property type for ApplicationOutput in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisFirehoseOutput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationoutput-kinesisfirehoseoutput.html>`_
+        """
+
+        __slots__ = ("ResourceARN",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputKinesisFirehoseOutput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationOutputKinesisStreamsOutput(_PropertyType):
+        """The Kinesis Streams Output property type for ApplicationOutput in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisStreamsOutput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationoutput-kinesisstreamsoutput.html>`_
+        """
+
+        __slots__ = ("ResourceARN",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputKinesisStreamsOutput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationOutputLambdaOutput(_PropertyType):
+        """The Lambda Output property type for ApplicationOutput in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for LambdaOutput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationoutput-lambdaoutput.html>`_
+        """
+
+        __slots__ = ("ResourceARN",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputLambdaOutput", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceARN", ResourceARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationOutputDestinationSchema = create_object_converter(
+        ApplicationOutputDestinationSchema
+    )
+    _convert_ApplicationOutputKinesisFirehoseOutput = create_object_converter(
+        ApplicationOutputKinesisFirehoseOutput
+    )
+    _convert_ApplicationOutputKinesisStreamsOutput = create_object_converter(
+        ApplicationOutputKinesisStreamsOutput
+    )
+    _convert_ApplicationOutputLambdaOutput = create_object_converter(
+        ApplicationOutputLambdaOutput
+    )
+
+    class ApplicationOutputOutput(_PropertyType):
+        """The Output property type for ApplicationOutput in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Output
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationoutput-output.html>`_
+        """
+
+        __slots__ = (
+            "DestinationSchema",
+            "KinesisFirehoseOutput",
+            "KinesisStreamsOutput",
+            "LambdaOutput",
+            "Name",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputOutput",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DestinationSchema": _convert_ApplicationOutputDestinationSchema,
+                "KinesisFirehoseOutput": _convert_ApplicationOutputKinesisFirehoseOutput,
+                "KinesisStreamsOutput": _convert_ApplicationOutputKinesisStreamsOutput,
+                "LambdaOutput": _convert_ApplicationOutputLambdaOutput,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DestinationSchema=None,
+            KinesisFirehoseOutput=None,
+            KinesisStreamsOutput=None,
+            LambdaOutput=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DestinationSchema",
+                _convert_ApplicationOutputDestinationSchema(DestinationSchema),
+            )
+            _setattr(
+                "KinesisFirehoseOutput",
+                _convert_ApplicationOutputKinesisFirehoseOutput(KinesisFirehoseOutput),
+            )
+            _setattr(
+                "KinesisStreamsOutput",
+                _convert_ApplicationOutputKinesisStreamsOutput(KinesisStreamsOutput),
+            )
+            _setattr(
+                "LambdaOutput", _convert_ApplicationOutputLambdaOutput(LambdaOutput)
+            )
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationOutputOutput = create_object_converter(ApplicationOutputOutput)
+
+    class ApplicationOutputProperties(_ResourceProperties):
+        __slots__ = ("ApplicationName", "Output")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutputProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Output": _convert_ApplicationOutputOutput},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ApplicationName=None, Output=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr("Output", _convert_ApplicationOutputOutput(Output))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationOutputProperties = create_object_converter(
+        ApplicationOutputProperties
+    )
+
+    class ApplicationOutput(_Resource):
+        """A Application Output for KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationOutput
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalyticsv2-applicationoutput.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::KinesisAnalyticsV2::ApplicationOutput"
+
+        Properties: ApplicationOutputProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationOutput",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApplicationOutputProperties},
+            factories={"Properties": ApplicationOutputProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationOutputProperties()
+            _setattr("Properties", _convert_ApplicationOutputProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ApplicationOutput,
+        ApplicationOutputProperties,
+        ApplicationOutputDestinationSchema,
+        ApplicationOutputKinesisFirehoseOutput,
+        ApplicationOutputKinesisStreamsOutput,
+        ApplicationOutputLambdaOutput,
+        ApplicationOutputOutput,
+    )
+
+
+def _create_ApplicationReferenceDataSource():
+    class ApplicationReferenceDataSourceCSVMappingParameters(_PropertyType):
+        """The Csv Mapping Parameters property type for ApplicationReferenceDataSource in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CSVMappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationreferencedatasource-csvmappingparameters.html>`_
+        """
+
+        __slots__ = ("RecordColumnDelimiter", "RecordRowDelimiter")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceCSVMappingParameters",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, RecordColumnDelimiter=None, RecordRowDelimiter=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordColumnDelimiter", RecordColumnDelimiter)
+            _setattr("RecordRowDelimiter", RecordRowDelimiter)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationReferenceDataSourceJSONMappingParameters(_PropertyType):
+        """The Json Mapping Parameters property type for ApplicationReferenceDataSource in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for JSONMappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationreferencedatasource-jsonmappingparameters.html>`_
+        """
+
+        __slots__ = ("RecordRowPath",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceJSONMappingParameters",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RecordRowPath=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RecordRowPath", RecordRowPath)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceCSVMappingParameters = (
+        create_object_converter(ApplicationReferenceDataSourceCSVMappingParameters)
+    )
+    _convert_ApplicationReferenceDataSourceJSONMappingParameters = (
+        create_object_converter(ApplicationReferenceDataSourceJSONMappingParameters)
+    )
+
+    class ApplicationReferenceDataSourceMappingParameters(_PropertyType):
+        """The Mapping Parameters property type for ApplicationReferenceDataSource in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for MappingParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationreferencedatasource-mappingparameters.html>`_
+        """
+
+        __slots__ = ("CSVMappingParameters", "JSONMappingParameters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceMappingParameters",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CSVMappingParameters": _convert_ApplicationReferenceDataSourceCSVMappingParameters,
+                "JSONMappingParameters": _convert_ApplicationReferenceDataSourceJSONMappingParameters,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CSVMappingParameters=None, JSONMappingParameters=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CSVMappingParameters",
+                _convert_ApplicationReferenceDataSourceCSVMappingParameters(
+                    CSVMappingParameters
+                ),
+            )
+            _setattr(
+                "JSONMappingParameters",
+                _convert_ApplicationReferenceDataSourceJSONMappingParameters(
+                    JSONMappingParameters
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationReferenceDataSourceRecordColumn(_PropertyType):
+        """The Record Column property type for ApplicationReferenceDataSource in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordColumn
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationreferencedatasource-recordcolumn.html>`_
+        """
+
+        __slots__ = ("Mapping", "Name", "SqlType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceRecordColumn", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Mapping=None, Name=None, SqlType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Mapping", Mapping)
+            _setattr("Name", Name)
+            _setattr("SqlType", SqlType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceMappingParameters = create_object_converter(
+        ApplicationReferenceDataSourceMappingParameters
+    )
+
+    class ApplicationReferenceDataSourceRecordFormat(_PropertyType):
+        """The Record Format property type for ApplicationReferenceDataSource in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordFormat
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationreferencedatasource-recordformat.html>`_
+        """
+
+        __slots__ = ("MappingParameters", "RecordFormatType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceRecordFormat",
+            _PropertyType,
+            __slots__,
+            converters={
+                "MappingParameters": _convert_ApplicationReferenceDataSourceMappingParameters
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, MappingParameters=None, RecordFormatType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "MappingParameters",
+                _convert_ApplicationReferenceDataSourceMappingParameters(
+                    MappingParameters
+                ),
+            )
+            _setattr("RecordFormatType", RecordFormatType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceRecordColumn_list = (
+        create_object_list_converter(ApplicationReferenceDataSourceRecordColumn)
+    )
+    _convert_ApplicationReferenceDataSourceRecordFormat = create_object_converter(
+        ApplicationReferenceDataSourceRecordFormat
+    )
+
+    class ApplicationReferenceDataSourceReferenceSchema(_PropertyType):
+        """The Reference Schema property type for ApplicationReferenceDataSource in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReferenceSchema
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationreferencedatasource-referenceschema.html>`_
+        """
+
+        __slots__ = ("RecordColumns", "RecordEncoding", "RecordFormat")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceReferenceSchema",
+            _PropertyType,
+            __slots__,
+            converters={
+                "RecordColumns": _convert_ApplicationReferenceDataSourceRecordColumn_list,
+                "RecordFormat": _convert_ApplicationReferenceDataSourceRecordFormat,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            RecordColumns=None,
+            RecordEncoding=None,
+            RecordFormat=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "RecordColumns",
+                _convert_ApplicationReferenceDataSourceRecordColumn_list(RecordColumns),
+            )
+            _setattr("RecordEncoding", RecordEncoding)
+            _setattr(
+                "RecordFormat",
+                _convert_ApplicationReferenceDataSourceRecordFormat(RecordFormat),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationReferenceDataSourceS3ReferenceDataSource(_PropertyType):
+        """The S3 Reference Data Source property type for ApplicationReferenceDataSource in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3ReferenceDataSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationreferencedatasource-s3referencedatasource.html>`_
+        """
+
+        __slots__ = ("BucketARN", "FileKey")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceS3ReferenceDataSource",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, BucketARN=None, FileKey=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketARN", BucketARN)
+            _setattr("FileKey", FileKey)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceReferenceSchema = create_object_converter(
+        ApplicationReferenceDataSourceReferenceSchema
+    )
+    _convert_ApplicationReferenceDataSourceS3ReferenceDataSource = (
+        create_object_converter(ApplicationReferenceDataSourceS3ReferenceDataSource)
+    )
+
+    class ApplicationReferenceDataSourceReferenceDataSource(_PropertyType):
+        """The Reference Data Source property type for ApplicationReferenceDataSource in KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReferenceDataSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisanalyticsv2-applicationreferencedatasource-referencedatasource.html>`_
+        """
+
+        __slots__ = ("ReferenceSchema", "S3ReferenceDataSource", "TableName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceReferenceDataSource",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ReferenceSchema": _convert_ApplicationReferenceDataSourceReferenceSchema,
+                "S3ReferenceDataSource": _convert_ApplicationReferenceDataSourceS3ReferenceDataSource,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ReferenceSchema=None,
+            S3ReferenceDataSource=None,
+            TableName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ReferenceSchema",
+                _convert_ApplicationReferenceDataSourceReferenceSchema(ReferenceSchema),
+            )
+            _setattr(
+                "S3ReferenceDataSource",
+                _convert_ApplicationReferenceDataSourceS3ReferenceDataSource(
+                    S3ReferenceDataSource
+                ),
+            )
+            _setattr("TableName", TableName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceReferenceDataSource = (
+        create_object_converter(ApplicationReferenceDataSourceReferenceDataSource)
+    )
+
+    class ApplicationReferenceDataSourceProperties(_ResourceProperties):
+        __slots__ = ("ApplicationName", "ReferenceDataSource")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSourceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ReferenceDataSource": _convert_ApplicationReferenceDataSourceReferenceDataSource
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApplicationName=None, ReferenceDataSource=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationName", ApplicationName)
+            _setattr(
+                "ReferenceDataSource",
+                _convert_ApplicationReferenceDataSourceReferenceDataSource(
+                    ReferenceDataSource
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationReferenceDataSourceProperties = create_object_converter(
+        ApplicationReferenceDataSourceProperties
+    )
+
+    class ApplicationReferenceDataSource(_Resource):
+        """A Application Reference Data Source for KinesisAnalyticsV2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationReferenceDataSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisanalyticsv2-applicationreferencedatasource.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::KinesisAnalyticsV2::ApplicationReferenceDataSource"
+
+        Properties: ApplicationReferenceDataSourceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationReferenceDataSource",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_ApplicationReferenceDataSourceProperties
+            },
+            factories={"Properties": ApplicationReferenceDataSourceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationReferenceDataSourceProperties()
+            _setattr(
+                "Properties",
+                _convert_ApplicationReferenceDataSourceProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        ApplicationReferenceDataSource,
+        ApplicationReferenceDataSourceProperties,
+        ApplicationReferenceDataSourceCSVMappingParameters,
+        ApplicationReferenceDataSourceJSONMappingParameters,
+        ApplicationReferenceDataSourceMappingParameters,
+        ApplicationReferenceDataSourceRecordColumn,
+        ApplicationReferenceDataSourceRecordFormat,
+        ApplicationReferenceDataSourceReferenceSchema,
+        ApplicationReferenceDataSourceS3ReferenceDataSource,
+        ApplicationReferenceDataSourceReferenceDataSource,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Application": _create_Application,
+        "ApplicationProperties": _create_Application,
+        "ApplicationApplicationCodeConfiguration": _create_Application,
+        "ApplicationApplicationConfiguration": _create_Application,
+        "ApplicationApplicationSnapshotConfiguration": _create_Application,
+        "ApplicationCheckpointConfiguration": _create_Application,
+        "ApplicationCodeContent": _create_Application,
+        "ApplicationCSVMappingParameters": _create_Application,
+        "ApplicationEnvironmentProperties": _create_Application,
+        "ApplicationFlinkApplicationConfiguration": _create_Application,
+        "ApplicationInput": _create_Application,
+        "ApplicationInputLambdaProcessor": _create_Application,
+        "ApplicationInputParallelism": _create_Application,
+        "ApplicationInputProcessingConfiguration": _create_Application,
+        "ApplicationInputSchema": _create_Application,
+        "ApplicationJSONMappingParameters": _create_Application,
+        "ApplicationKinesisFirehoseInput": _create_Application,
+        "ApplicationKinesisStreamsInput": _create_Application,
+        "ApplicationMappingParameters": _create_Application,
+        "ApplicationMonitoringConfiguration": _create_Application,
+        "ApplicationParallelismConfiguration": _create_Application,
+        "ApplicationPropertyGroup": _create_Application,
+        "ApplicationRecordColumn": _create_Application,
+        "ApplicationRecordFormat": _create_Application,
+        "ApplicationS3ContentLocation": _create_Application,
+        "ApplicationSqlApplicationConfiguration": _create_Application,
+        "ApplicationCloudWatchLoggingOption": _create_ApplicationCloudWatchLoggingOption,
+        "ApplicationCloudWatchLoggingOptionProperties": _create_ApplicationCloudWatchLoggingOption,
+        "ApplicationCloudWatchLoggingOptionCloudWatchLoggingOption": _create_ApplicationCloudWatchLoggingOption,
+        "ApplicationOutput": _create_ApplicationOutput,
+        "ApplicationOutputProperties": _create_ApplicationOutput,
+        "ApplicationOutputDestinationSchema": _create_ApplicationOutput,
+        "ApplicationOutputKinesisFirehoseOutput": _create_ApplicationOutput,
+        "ApplicationOutputKinesisStreamsOutput": _create_ApplicationOutput,
+        "ApplicationOutputLambdaOutput": _create_ApplicationOutput,
+        "ApplicationOutputOutput": _create_ApplicationOutput,
+        "ApplicationReferenceDataSource": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceProperties": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceCSVMappingParameters": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceJSONMappingParameters": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceMappingParameters": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceRecordColumn": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceRecordFormat": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceReferenceDataSource": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceReferenceSchema": _create_ApplicationReferenceDataSource,
+        "ApplicationReferenceDataSourceS3ReferenceDataSource": _create_ApplicationReferenceDataSource,
+    },
+)
@@ -7,41 +7,1378 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["DeliveryStream", "DeliveryStreamProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "DeliveryStream",
+    "DeliveryStreamProperties",
+    "DeliveryStreamBufferingHints",
+    "DeliveryStreamCloudWatchLoggingOptions",
+    "DeliveryStreamCopyCommand",
+    "DeliveryStreamDataFormatConversionConfiguration",
+    "DeliveryStreamDeserializer",
+    "DeliveryStreamElasticsearchBufferingHints",
+    "DeliveryStreamElasticsearchDestinationConfiguration",
+    "DeliveryStreamElasticsearchRetryOptions",
+    "DeliveryStreamEncryptionConfiguration",
+    "DeliveryStreamExtendedS3DestinationConfiguration",
+    "DeliveryStreamHiveJsonSerDe",
+    "DeliveryStreamInputFormatConfiguration",
+    "DeliveryStreamKinesisStreamSourceConfiguration",
+    "DeliveryStreamKMSEncryptionConfig",
+    "DeliveryStreamOpenXJsonSerDe",
+    "DeliveryStreamOrcSerDe",
+    "DeliveryStreamOutputFormatConfiguration",
+    "DeliveryStreamParquetSerDe",
+    "DeliveryStreamProcessingConfiguration",
+    "DeliveryStreamProcessor",
+    "DeliveryStreamProcessorParameter",
+    "DeliveryStreamRedshiftDestinationConfiguration",
+    "DeliveryStreamS3DestinationConfiguration",
+    "DeliveryStreamSchemaConfiguration",
+    "DeliveryStreamSerializer",
+    "DeliveryStreamSplunkDestinationConfiguration",
+    "DeliveryStreamSplunkRetryOptions",
+]
 
-@attrs(**ATTRSCONFIG)
-class DeliveryStreamProperties(ResourceProperties):
-    DeliveryStreamName = attrib(default=None)
-    DeliveryStreamType = attrib(default=None)
-    ElasticsearchDestinationConfiguration = attrib(default=None)
-    ExtendedS3DestinationConfiguration = attrib(default=None)
-    KinesisStreamSourceConfiguration = attrib(default=None)
-    RedshiftDestinationConfiguration = attrib(default=None)
-    S3DestinationConfiguration = attrib(default=None)
-    SplunkDestinationConfiguration = attrib(default=None)
 
+def _create_DeliveryStream():
+    class DeliveryStreamBufferingHints(_PropertyType):
+        """The Buffering Hints property type for DeliveryStream in KinesisFirehose.
 
-@attrs(**ATTRSCONFIG)
-class DeliveryStream(Resource):
-    """A Delivery Stream for KinesisFirehose.
+        See Also:
+            `AWS Cloud Formation documentation for BufferingHints
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-bufferinghints.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for DeliveryStream
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisfirehose-deliverystream.html>`_
-    """
+        __slots__ = ("IntervalInSeconds", "SizeInMBs")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamBufferingHints", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::KinesisFirehose::DeliveryStream"
+        def __init__(self, *, IntervalInSeconds=None, SizeInMBs=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IntervalInSeconds", IntervalInSeconds)
+            _setattr("SizeInMBs", SizeInMBs)
+            _init_PropertyType(self, kwargs)
 
-    Properties: DeliveryStreamProperties = attrib(
-        factory=DeliveryStreamProperties,
-        converter=create_object_converter(DeliveryStreamProperties),
+    class DeliveryStreamCloudWatchLoggingOptions(_PropertyType):
+        """The Cloud Watch Logging Options property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudWatchLoggingOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-cloudwatchloggingoptions.html>`_
+        """
+
+        __slots__ = ("Enabled", "LogGroupName", "LogStreamName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamCloudWatchLoggingOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Enabled=None, LogGroupName=None, LogStreamName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr("LogGroupName", LogGroupName)
+            _setattr("LogStreamName", LogStreamName)
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamCopyCommand(_PropertyType):
+        """The Copy Command property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for CopyCommand
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-copycommand.html>`_
+        """
+
+        __slots__ = ("CopyOptions", "DataTableColumns", "DataTableName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamCopyCommand", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CopyOptions=None,
+            DataTableColumns=None,
+            DataTableName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CopyOptions", CopyOptions)
+            _setattr("DataTableColumns", DataTableColumns)
+            _setattr("DataTableName", DataTableName)
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamHiveJsonSerDe(_PropertyType):
+        """The Hive Json Ser De property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for HiveJsonSerDe
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-hivejsonserde.html>`_
+        """
+
+        __slots__ = ("TimestampFormats",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamHiveJsonSerDe", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TimestampFormats=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TimestampFormats", TimestampFormats)
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamOpenXJsonSerDe(_PropertyType):
+        """The Open X Json Ser De property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for OpenXJsonSerDe
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-openxjsonserde.html>`_
+        """
+
+        __slots__ = (
+            "CaseInsensitive",
+            "ColumnToJsonKeyMappings",
+            "ConvertDotsInJsonKeysToUnderscores",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamOpenXJsonSerDe", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CaseInsensitive=None,
+            ColumnToJsonKeyMappings=None,
+            ConvertDotsInJsonKeysToUnderscores=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CaseInsensitive", CaseInsensitive)
+            _setattr("ColumnToJsonKeyMappings", ColumnToJsonKeyMappings)
+            _setattr(
+                "ConvertDotsInJsonKeysToUnderscores", ConvertDotsInJsonKeysToUnderscores
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamHiveJsonSerDe = create_object_converter(
+        DeliveryStreamHiveJsonSerDe
+    )
+    _convert_DeliveryStreamOpenXJsonSerDe = create_object_converter(
+        DeliveryStreamOpenXJsonSerDe
+    )
+
+    class DeliveryStreamDeserializer(_PropertyType):
+        """The Deserializer property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for Deserializer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-deserializer.html>`_
+        """
+
+        __slots__ = ("HiveJsonSerDe", "OpenXJsonSerDe")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamDeserializer",
+            _PropertyType,
+            __slots__,
+            converters={
+                "HiveJsonSerDe": _convert_DeliveryStreamHiveJsonSerDe,
+                "OpenXJsonSerDe": _convert_DeliveryStreamOpenXJsonSerDe,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, HiveJsonSerDe=None, OpenXJsonSerDe=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "HiveJsonSerDe", _convert_DeliveryStreamHiveJsonSerDe(HiveJsonSerDe)
+            )
+            _setattr(
+                "OpenXJsonSerDe", _convert_DeliveryStreamOpenXJsonSerDe(OpenXJsonSerDe)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamDeserializer = create_object_converter(
+        DeliveryStreamDeserializer
+    )
+
+    class DeliveryStreamInputFormatConfiguration(_PropertyType):
+        """The Input Format Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputFormatConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-inputformatconfiguration.html>`_
+        """
+
+        __slots__ = ("Deserializer",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamInputFormatConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Deserializer": _convert_DeliveryStreamDeserializer},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Deserializer=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Deserializer", _convert_DeliveryStreamDeserializer(Deserializer))
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamOrcSerDe(_PropertyType):
+        """The Orc Ser De property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for OrcSerDe
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-orcserde.html>`_
+        """
+
+        __slots__ = (
+            "BlockSizeBytes",
+            "BloomFilterColumns",
+            "BloomFilterFalsePositiveProbability",
+            "Compression",
+            "DictionaryKeyThreshold",
+            "EnablePadding",
+            "FormatVersion",
+            "PaddingTolerance",
+            "RowIndexStride",
+            "StripeSizeBytes",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamOrcSerDe", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockSizeBytes=None,
+            BloomFilterColumns=None,
+            BloomFilterFalsePositiveProbability=None,
+            Compression=None,
+            DictionaryKeyThreshold=None,
+            EnablePadding=None,
+            FormatVersion=None,
+            PaddingTolerance=None,
+            RowIndexStride=None,
+            StripeSizeBytes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BlockSizeBytes", BlockSizeBytes)
+            _setattr("BloomFilterColumns", BloomFilterColumns)
+            _setattr(
+                "BloomFilterFalsePositiveProbability",
+                BloomFilterFalsePositiveProbability,
+            )
+            _setattr("Compression", Compression)
+            _setattr("DictionaryKeyThreshold", DictionaryKeyThreshold)
+            _setattr("EnablePadding", EnablePadding)
+            _setattr("FormatVersion", FormatVersion)
+            _setattr("PaddingTolerance", PaddingTolerance)
+            _setattr("RowIndexStride", RowIndexStride)
+            _setattr("StripeSizeBytes", StripeSizeBytes)
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamParquetSerDe(_PropertyType):
+        """The Parquet Ser De property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParquetSerDe
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-parquetserde.html>`_
+        """
+
+        __slots__ = (
+            "BlockSizeBytes",
+            "Compression",
+            "EnableDictionaryCompression",
+            "MaxPaddingBytes",
+            "PageSizeBytes",
+            "WriterVersion",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamParquetSerDe", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockSizeBytes=None,
+            Compression=None,
+            EnableDictionaryCompression=None,
+            MaxPaddingBytes=None,
+            PageSizeBytes=None,
+            WriterVersion=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BlockSizeBytes", BlockSizeBytes)
+            _setattr("Compression", Compression)
+            _setattr("EnableDictionaryCompression", EnableDictionaryCompression)
+            _setattr("MaxPaddingBytes", MaxPaddingBytes)
+            _setattr("PageSizeBytes", PageSizeBytes)
+            _setattr("WriterVersion", WriterVersion)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamOrcSerDe = create_object_converter(DeliveryStreamOrcSerDe)
+    _convert_DeliveryStreamParquetSerDe = create_object_converter(
+        DeliveryStreamParquetSerDe
+    )
+
+    class DeliveryStreamSerializer(_PropertyType):
+        """The Serializer property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for Serializer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-serializer.html>`_
+        """
+
+        __slots__ = ("OrcSerDe", "ParquetSerDe")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamSerializer",
+            _PropertyType,
+            __slots__,
+            converters={
+                "OrcSerDe": _convert_DeliveryStreamOrcSerDe,
+                "ParquetSerDe": _convert_DeliveryStreamParquetSerDe,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, OrcSerDe=None, ParquetSerDe=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("OrcSerDe", _convert_DeliveryStreamOrcSerDe(OrcSerDe))
+            _setattr("ParquetSerDe", _convert_DeliveryStreamParquetSerDe(ParquetSerDe))
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamSerializer = create_object_converter(
+        DeliveryStreamSerializer
+    )
+
+    class DeliveryStreamOutputFormatConfiguration(_PropertyType):
+        """The Output Format Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for OutputFormatConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-outputformatconfiguration.html>`_
+        """
+
+        __slots__ = ("Serializer",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamOutputFormatConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Serializer": _convert_DeliveryStreamSerializer},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Serializer=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Serializer", _convert_DeliveryStreamSerializer(Serializer))
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamSchemaConfiguration(_PropertyType):
+        """The Schema Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for SchemaConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-schemaconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "CatalogId",
+            "DatabaseName",
+            "Region",
+            "RoleARN",
+            "TableName",
+            "VersionId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamSchemaConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CatalogId=None,
+            DatabaseName=None,
+            Region=None,
+            RoleARN=None,
+            TableName=None,
+            VersionId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CatalogId", CatalogId)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("Region", Region)
+            _setattr("RoleARN", RoleARN)
+            _setattr("TableName", TableName)
+            _setattr("VersionId", VersionId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamInputFormatConfiguration = create_object_converter(
+        DeliveryStreamInputFormatConfiguration
+    )
+    _convert_DeliveryStreamOutputFormatConfiguration = create_object_converter(
+        DeliveryStreamOutputFormatConfiguration
+    )
+    _convert_DeliveryStreamSchemaConfiguration = create_object_converter(
+        DeliveryStreamSchemaConfiguration
+    )
+
+    class DeliveryStreamDataFormatConversionConfiguration(_PropertyType):
+        """The Data Format Conversion Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for DataFormatConversionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-dataformatconversionconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "Enabled",
+            "InputFormatConfiguration",
+            "OutputFormatConfiguration",
+            "SchemaConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamDataFormatConversionConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "InputFormatConfiguration": _convert_DeliveryStreamInputFormatConfiguration,
+                "OutputFormatConfiguration": _convert_DeliveryStreamOutputFormatConfiguration,
+                "SchemaConfiguration": _convert_DeliveryStreamSchemaConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Enabled=None,
+            InputFormatConfiguration=None,
+            OutputFormatConfiguration=None,
+            SchemaConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr(
+                "InputFormatConfiguration",
+                _convert_DeliveryStreamInputFormatConfiguration(
+                    InputFormatConfiguration
+                ),
+            )
+            _setattr(
+                "OutputFormatConfiguration",
+                _convert_DeliveryStreamOutputFormatConfiguration(
+                    OutputFormatConfiguration
+                ),
+            )
+            _setattr(
+                "SchemaConfiguration",
+                _convert_DeliveryStreamSchemaConfiguration(SchemaConfiguration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamElasticsearchBufferingHints(_PropertyType):
+        """The Elasticsearch Buffering Hints property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticsearchBufferingHints
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-elasticsearchbufferinghints.html>`_
+        """
+
+        __slots__ = ("IntervalInSeconds", "SizeInMBs")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamElasticsearchBufferingHints", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, IntervalInSeconds=None, SizeInMBs=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IntervalInSeconds", IntervalInSeconds)
+            _setattr("SizeInMBs", SizeInMBs)
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamProcessorParameter(_PropertyType):
+        """The Processor Parameter property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProcessorParameter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-processorparameter.html>`_
+        """
+
+        __slots__ = ("ParameterName", "ParameterValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamProcessorParameter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ParameterName=None, ParameterValue=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ParameterName", ParameterName)
+            _setattr("ParameterValue", ParameterValue)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamProcessorParameter_list = create_object_list_converter(
+        DeliveryStreamProcessorParameter
+    )
+
+    class DeliveryStreamProcessor(_PropertyType):
+        """The Processor property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for Processor
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-processor.html>`_
+        """
+
+        __slots__ = ("Parameters", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamProcessor",
+            _PropertyType,
+            __slots__,
+            converters={"Parameters": _convert_DeliveryStreamProcessorParameter_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Parameters=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Parameters", _convert_DeliveryStreamProcessorParameter_list(Parameters)
+            )
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamProcessor_list = create_object_list_converter(
+        DeliveryStreamProcessor
+    )
+
+    class DeliveryStreamProcessingConfiguration(_PropertyType):
+        """The Processing Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProcessingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-processingconfiguration.html>`_
+        """
+
+        __slots__ = ("Enabled", "Processors")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamProcessingConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Processors": _convert_DeliveryStreamProcessor_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Enabled=None, Processors=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr("Processors", _convert_DeliveryStreamProcessor_list(Processors))
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamElasticsearchRetryOptions(_PropertyType):
+        """The Elasticsearch Retry Options property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticsearchRetryOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-elasticsearchretryoptions.html>`_
+        """
+
+        __slots__ = ("DurationInSeconds",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamElasticsearchRetryOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DurationInSeconds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DurationInSeconds", DurationInSeconds)
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamKMSEncryptionConfig(_PropertyType):
+        """The Kms Encryption Config property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for KMSEncryptionConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-kmsencryptionconfig.html>`_
+        """
+
+        __slots__ = ("AWSKMSKeyARN",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamKMSEncryptionConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AWSKMSKeyARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AWSKMSKeyARN", AWSKMSKeyARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamKMSEncryptionConfig = create_object_converter(
+        DeliveryStreamKMSEncryptionConfig
+    )
+
+    class DeliveryStreamEncryptionConfiguration(_PropertyType):
+        """The Encryption Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-encryptionconfiguration.html>`_
+        """
+
+        __slots__ = ("KMSEncryptionConfig", "NoEncryptionConfig")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamEncryptionConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "KMSEncryptionConfig": _convert_DeliveryStreamKMSEncryptionConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, KMSEncryptionConfig=None, NoEncryptionConfig=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "KMSEncryptionConfig",
+                _convert_DeliveryStreamKMSEncryptionConfig(KMSEncryptionConfig),
+            )
+            _setattr("NoEncryptionConfig", NoEncryptionConfig)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamBufferingHints = create_object_converter(
+        DeliveryStreamBufferingHints
+    )
+    _convert_DeliveryStreamCloudWatchLoggingOptions = create_object_converter(
+        DeliveryStreamCloudWatchLoggingOptions
+    )
+    _convert_DeliveryStreamEncryptionConfiguration = create_object_converter(
+        DeliveryStreamEncryptionConfiguration
+    )
+
+    class DeliveryStreamS3DestinationConfiguration(_PropertyType):
+        """The S3 Destination Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3DestinationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-s3destinationconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "BucketARN",
+            "BufferingHints",
+            "CloudWatchLoggingOptions",
+            "CompressionFormat",
+            "EncryptionConfiguration",
+            "ErrorOutputPrefix",
+            "Prefix",
+            "RoleARN",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamS3DestinationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BufferingHints": _convert_DeliveryStreamBufferingHints,
+                "CloudWatchLoggingOptions": _convert_DeliveryStreamCloudWatchLoggingOptions,
+                "EncryptionConfiguration": _convert_DeliveryStreamEncryptionConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BucketARN=None,
+            BufferingHints=None,
+            CloudWatchLoggingOptions=None,
+            CompressionFormat=None,
+            EncryptionConfiguration=None,
+            ErrorOutputPrefix=None,
+            Prefix=None,
+            RoleARN=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketARN", BucketARN)
+            _setattr(
+                "BufferingHints", _convert_DeliveryStreamBufferingHints(BufferingHints)
+            )
+            _setattr(
+                "CloudWatchLoggingOptions",
+                _convert_DeliveryStreamCloudWatchLoggingOptions(
+                    CloudWatchLoggingOptions
+                ),
+            )
+            _setattr("CompressionFormat", CompressionFormat)
+            _setattr(
+                "EncryptionConfiguration",
+                _convert_DeliveryStreamEncryptionConfiguration(EncryptionConfiguration),
+            )
+            _setattr("ErrorOutputPrefix", ErrorOutputPrefix)
+            _setattr("Prefix", Prefix)
+            _setattr("RoleARN", RoleARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamElasticsearchBufferingHints = create_object_converter(
+        DeliveryStreamElasticsearchBufferingHints
+    )
+    _convert_DeliveryStreamProcessingConfiguration = create_object_converter(
+        DeliveryStreamProcessingConfiguration
+    )
+    _convert_DeliveryStreamElasticsearchRetryOptions = create_object_converter(
+        DeliveryStreamElasticsearchRetryOptions
+    )
+    _convert_DeliveryStreamS3DestinationConfiguration = create_object_converter(
+        DeliveryStreamS3DestinationConfiguration
+    )
+
+    class DeliveryStreamElasticsearchDestinationConfiguration(_PropertyType):
+        """The Elasticsearch Destination Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticsearchDestinationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-elasticsearchdestinationconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "BufferingHints",
+            "CloudWatchLoggingOptions",
+            "DomainARN",
+            "IndexName",
+            "IndexRotationPeriod",
+            "ProcessingConfiguration",
+            "RetryOptions",
+            "RoleARN",
+            "S3BackupMode",
+            "S3Configuration",
+            "TypeName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamElasticsearchDestinationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BufferingHints": _convert_DeliveryStreamElasticsearchBufferingHints,
+                "CloudWatchLoggingOptions": _convert_DeliveryStreamCloudWatchLoggingOptions,
+                "ProcessingConfiguration": _convert_DeliveryStreamProcessingConfiguration,
+                "RetryOptions": _convert_DeliveryStreamElasticsearchRetryOptions,
+                "S3Configuration": _convert_DeliveryStreamS3DestinationConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BufferingHints=None,
+            CloudWatchLoggingOptions=None,
+            DomainARN=None,
+            IndexName=None,
+            IndexRotationPeriod=None,
+            ProcessingConfiguration=None,
+            RetryOptions=None,
+            RoleARN=None,
+            S3BackupMode=None,
+            S3Configuration=None,
+            TypeName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "BufferingHints",
+                _convert_DeliveryStreamElasticsearchBufferingHints(BufferingHints),
+            )
+            _setattr(
+                "CloudWatchLoggingOptions",
+                _convert_DeliveryStreamCloudWatchLoggingOptions(
+                    CloudWatchLoggingOptions
+                ),
+            )
+            _setattr("DomainARN", DomainARN)
+            _setattr("IndexName", IndexName)
+            _setattr("IndexRotationPeriod", IndexRotationPeriod)
+            _setattr(
+                "ProcessingConfiguration",
+                _convert_DeliveryStreamProcessingConfiguration(ProcessingConfiguration),
+            )
+            _setattr(
+                "RetryOptions",
+                _convert_DeliveryStreamElasticsearchRetryOptions(RetryOptions),
+            )
+            _setattr("RoleARN", RoleARN)
+            _setattr("S3BackupMode", S3BackupMode)
+            _setattr(
+                "S3Configuration",
+                _convert_DeliveryStreamS3DestinationConfiguration(S3Configuration),
+            )
+            _setattr("TypeName", TypeName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamDataFormatConversionConfiguration = create_object_converter(
+        DeliveryStreamDataFormatConversionConfiguration
+    )
+
+    class DeliveryStreamExtendedS3DestinationConfiguration(_PropertyType):
+        """The Extended S3 Destination Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for ExtendedS3DestinationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-extendeds3destinationconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "BucketARN",
+            "BufferingHints",
+            "CloudWatchLoggingOptions",
+            "CompressionFormat",
+            "DataFormatConversionConfiguration",
+            "EncryptionConfiguration",
+            "ErrorOutputPrefix",
+            "Prefix",
+            "ProcessingConfiguration",
+            "RoleARN",
+            "S3BackupConfiguration",
+            "S3BackupMode",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamExtendedS3DestinationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "BufferingHints": _convert_DeliveryStreamBufferingHints,
+                "CloudWatchLoggingOptions": _convert_DeliveryStreamCloudWatchLoggingOptions,
+                "DataFormatConversionConfiguration": _convert_DeliveryStreamDataFormatConversionConfiguration,
+                "EncryptionConfiguration": _convert_DeliveryStreamEncryptionConfiguration,
+                "ProcessingConfiguration": _convert_DeliveryStreamProcessingConfiguration,
+                "S3BackupConfiguration": _convert_DeliveryStreamS3DestinationConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BucketARN=None,
+            BufferingHints=None,
+            CloudWatchLoggingOptions=None,
+            CompressionFormat=None,
+            DataFormatConversionConfiguration=None,
+            EncryptionConfiguration=None,
+            ErrorOutputPrefix=None,
+            Prefix=None,
+            ProcessingConfiguration=None,
+            RoleARN=None,
+            S3BackupConfiguration=None,
+            S3BackupMode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketARN", BucketARN)
+            _setattr(
+                "BufferingHints", _convert_DeliveryStreamBufferingHints(BufferingHints)
+            )
+            _setattr(
+                "CloudWatchLoggingOptions",
+                _convert_DeliveryStreamCloudWatchLoggingOptions(
+                    CloudWatchLoggingOptions
+                ),
+            )
+            _setattr("CompressionFormat", CompressionFormat)
+            _setattr(
+                "DataFormatConversionConfiguration",
+                _convert_DeliveryStreamDataFormatConversionConfiguration(
+                    DataFormatConversionConfiguration
+                ),
+            )
+            _setattr(
+                "EncryptionConfiguration",
+                _convert_DeliveryStreamEncryptionConfiguration(EncryptionConfiguration),
+            )
+            _setattr("ErrorOutputPrefix", ErrorOutputPrefix)
+            _setattr("Prefix", Prefix)
+            _setattr(
+                "ProcessingConfiguration",
+                _convert_DeliveryStreamProcessingConfiguration(ProcessingConfiguration),
+            )
+            _setattr("RoleARN", RoleARN)
+            _setattr(
+                "S3BackupConfiguration",
+                _convert_DeliveryStreamS3DestinationConfiguration(
+                    S3BackupConfiguration
+                ),
+            )
+            _setattr("S3BackupMode", S3BackupMode)
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamKinesisStreamSourceConfiguration(_PropertyType):
+        """The Kinesis Stream Source Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisStreamSourceConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-kinesisstreamsourceconfiguration.html>`_
+        """
+
+        __slots__ = ("KinesisStreamARN", "RoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamKinesisStreamSourceConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, KinesisStreamARN=None, RoleARN=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("KinesisStreamARN", KinesisStreamARN)
+            _setattr("RoleARN", RoleARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamCopyCommand = create_object_converter(
+        DeliveryStreamCopyCommand
+    )
+
+    class DeliveryStreamRedshiftDestinationConfiguration(_PropertyType):
+        """The Redshift Destination Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for RedshiftDestinationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-redshiftdestinationconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "CloudWatchLoggingOptions",
+            "ClusterJDBCURL",
+            "CopyCommand",
+            "Password",
+            "ProcessingConfiguration",
+            "RoleARN",
+            "S3Configuration",
+            "Username",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamRedshiftDestinationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudWatchLoggingOptions": _convert_DeliveryStreamCloudWatchLoggingOptions,
+                "CopyCommand": _convert_DeliveryStreamCopyCommand,
+                "ProcessingConfiguration": _convert_DeliveryStreamProcessingConfiguration,
+                "S3Configuration": _convert_DeliveryStreamS3DestinationConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CloudWatchLoggingOptions=None,
+            ClusterJDBCURL=None,
+            CopyCommand=None,
+            Password=None,
+            ProcessingConfiguration=None,
+            RoleARN=None,
+            S3Configuration=None,
+            Username=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudWatchLoggingOptions",
+                _convert_DeliveryStreamCloudWatchLoggingOptions(
+                    CloudWatchLoggingOptions
+                ),
+            )
+            _setattr("ClusterJDBCURL", ClusterJDBCURL)
+            _setattr("CopyCommand", _convert_DeliveryStreamCopyCommand(CopyCommand))
+            _setattr("Password", Password)
+            _setattr(
+                "ProcessingConfiguration",
+                _convert_DeliveryStreamProcessingConfiguration(ProcessingConfiguration),
+            )
+            _setattr("RoleARN", RoleARN)
+            _setattr(
+                "S3Configuration",
+                _convert_DeliveryStreamS3DestinationConfiguration(S3Configuration),
+            )
+            _setattr("Username", Username)
+            _init_PropertyType(self, kwargs)
+
+    class DeliveryStreamSplunkRetryOptions(_PropertyType):
+        """The Splunk Retry Options property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for SplunkRetryOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-splunkretryoptions.html>`_
+        """
+
+        __slots__ = ("DurationInSeconds",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamSplunkRetryOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DurationInSeconds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DurationInSeconds", DurationInSeconds)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamSplunkRetryOptions = create_object_converter(
+        DeliveryStreamSplunkRetryOptions
     )
+
+    class DeliveryStreamSplunkDestinationConfiguration(_PropertyType):
+        """The Splunk Destination Configuration property type for DeliveryStream in KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for SplunkDestinationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-kinesisfirehose-deliverystream-splunkdestinationconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "CloudWatchLoggingOptions",
+            "HECAcknowledgmentTimeoutInSeconds",
+            "HECEndpoint",
+            "HECEndpointType",
+            "HECToken",
+            "ProcessingConfiguration",
+            "RetryOptions",
+            "S3BackupMode",
+            "S3Configuration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamSplunkDestinationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudWatchLoggingOptions": _convert_DeliveryStreamCloudWatchLoggingOptions,
+                "ProcessingConfiguration": _convert_DeliveryStreamProcessingConfiguration,
+                "RetryOptions": _convert_DeliveryStreamSplunkRetryOptions,
+                "S3Configuration": _convert_DeliveryStreamS3DestinationConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CloudWatchLoggingOptions=None,
+            HECAcknowledgmentTimeoutInSeconds=None,
+            HECEndpoint=None,
+            HECEndpointType=None,
+            HECToken=None,
+            ProcessingConfiguration=None,
+            RetryOptions=None,
+            S3BackupMode=None,
+            S3Configuration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudWatchLoggingOptions",
+                _convert_DeliveryStreamCloudWatchLoggingOptions(
+                    CloudWatchLoggingOptions
+                ),
+            )
+            _setattr(
+                "HECAcknowledgmentTimeoutInSeconds", HECAcknowledgmentTimeoutInSeconds
+            )
+            _setattr("HECEndpoint", HECEndpoint)
+            _setattr("HECEndpointType", HECEndpointType)
+            _setattr("HECToken", HECToken)
+            _setattr(
+                "ProcessingConfiguration",
+                _convert_DeliveryStreamProcessingConfiguration(ProcessingConfiguration),
+            )
+            _setattr(
+                "RetryOptions", _convert_DeliveryStreamSplunkRetryOptions(RetryOptions)
+            )
+            _setattr("S3BackupMode", S3BackupMode)
+            _setattr(
+                "S3Configuration",
+                _convert_DeliveryStreamS3DestinationConfiguration(S3Configuration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_DeliveryStreamElasticsearchDestinationConfiguration = (
+        create_object_converter(DeliveryStreamElasticsearchDestinationConfiguration)
+    )
+    _convert_DeliveryStreamExtendedS3DestinationConfiguration = create_object_converter(
+        DeliveryStreamExtendedS3DestinationConfiguration
+    )
+    _convert_DeliveryStreamKinesisStreamSourceConfiguration = create_object_converter(
+        DeliveryStreamKinesisStreamSourceConfiguration
+    )
+    _convert_DeliveryStreamRedshiftDestinationConfiguration = create_object_converter(
+        DeliveryStreamRedshiftDestinationConfiguration
+    )
+    _convert_DeliveryStreamSplunkDestinationConfiguration = create_object_converter(
+        DeliveryStreamSplunkDestinationConfiguration
+    )
+
+    class DeliveryStreamProperties(_ResourceProperties):
+        __slots__ = (
+            "DeliveryStreamName",
+            "DeliveryStreamType",
+            "ElasticsearchDestinationConfiguration",
+            "ExtendedS3DestinationConfiguration",
+            "KinesisStreamSourceConfiguration",
+            "RedshiftDestinationConfiguration",
+            "S3DestinationConfiguration",
+            "SplunkDestinationConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStreamProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ElasticsearchDestinationConfiguration": _convert_DeliveryStreamElasticsearchDestinationConfiguration,
+                "ExtendedS3DestinationConfiguration": _convert_DeliveryStreamExtendedS3DestinationConfiguration,
+                "KinesisStreamSourceConfiguration": _convert_DeliveryStreamKinesisStreamSourceConfiguration,
+                "RedshiftDestinationConfiguration": _convert_DeliveryStreamRedshiftDestinationConfiguration,
+                "S3DestinationConfiguration": _convert_DeliveryStreamS3DestinationConfiguration,
+                "SplunkDestinationConfiguration": _convert_DeliveryStreamSplunkDestinationConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeliveryStreamName=None,
+            DeliveryStreamType=None,
+            ElasticsearchDestinationConfiguration=None,
+            ExtendedS3DestinationConfiguration=None,
+            KinesisStreamSourceConfiguration=None,
+            RedshiftDestinationConfiguration=None,
+            S3DestinationConfiguration=None,
+            SplunkDestinationConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeliveryStreamName", DeliveryStreamName)
+            _setattr("DeliveryStreamType", DeliveryStreamType)
+            _setattr(
+                "ElasticsearchDestinationConfiguration",
+                _convert_DeliveryStreamElasticsearchDestinationConfiguration(
+                    ElasticsearchDestinationConfiguration
+                ),
+            )
+            _setattr(
+                "ExtendedS3DestinationConfiguration",
+                _convert_DeliveryStreamExtendedS3DestinationConfiguration(
+                    ExtendedS3DestinationConfiguration
+                ),
+            )
+            _setattr(
+                "KinesisStreamSourceConfiguration",
+                _convert_DeliveryStreamKinesisStreamSourceConfiguration(
+                    KinesisStreamSourceConfiguration
+                ),
+            )
+            _setattr(
+                "RedshiftDestinationConfiguration",
+                _convert_DeliveryStreamRedshiftDestinationConfiguration(
+                    RedshiftDestinationConfiguration
+                ),
+            )
+            _setattr(
+                "S3DestinationConfiguration",
+                _convert_DeliveryStreamS3DestinationConfiguration(
+                    S3DestinationConfiguration
+                ),
+            )
+            _setattr(
+                "SplunkDestinationConfiguration",
+                _convert_DeliveryStreamSplunkDestinationConfiguration(
+                    SplunkDestinationConfiguration
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DeliveryStreamProperties = create_object_converter(
+        DeliveryStreamProperties
+    )
+
+    class DeliveryStream(_Resource):
+        """A Delivery Stream for KinesisFirehose.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeliveryStream
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kinesisfirehose-deliverystream.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::KinesisFirehose::DeliveryStream"
+
+        Properties: DeliveryStreamProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DeliveryStream",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DeliveryStreamProperties},
+            factories={"Properties": DeliveryStreamProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DeliveryStreamProperties()
+            _setattr("Properties", _convert_DeliveryStreamProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        DeliveryStream,
+        DeliveryStreamProperties,
+        DeliveryStreamBufferingHints,
+        DeliveryStreamCloudWatchLoggingOptions,
+        DeliveryStreamCopyCommand,
+        DeliveryStreamHiveJsonSerDe,
+        DeliveryStreamOpenXJsonSerDe,
+        DeliveryStreamDeserializer,
+        DeliveryStreamInputFormatConfiguration,
+        DeliveryStreamOrcSerDe,
+        DeliveryStreamParquetSerDe,
+        DeliveryStreamSerializer,
+        DeliveryStreamOutputFormatConfiguration,
+        DeliveryStreamSchemaConfiguration,
+        DeliveryStreamDataFormatConversionConfiguration,
+        DeliveryStreamElasticsearchBufferingHints,
+        DeliveryStreamProcessorParameter,
+        DeliveryStreamProcessor,
+        DeliveryStreamProcessingConfiguration,
+        DeliveryStreamElasticsearchRetryOptions,
+        DeliveryStreamKMSEncryptionConfig,
+        DeliveryStreamEncryptionConfiguration,
+        DeliveryStreamS3DestinationConfiguration,
+        DeliveryStreamElasticsearchDestinationConfiguration,
+        DeliveryStreamExtendedS3DestinationConfiguration,
+        DeliveryStreamKinesisStreamSourceConfiguration,
+        DeliveryStreamRedshiftDestinationConfiguration,
+        DeliveryStreamSplunkRetryOptions,
+        DeliveryStreamSplunkDestinationConfiguration,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "DeliveryStream": _create_DeliveryStream,
+        "DeliveryStreamProperties": _create_DeliveryStream,
+        "DeliveryStreamBufferingHints": _create_DeliveryStream,
+        "DeliveryStreamCloudWatchLoggingOptions": _create_DeliveryStream,
+        "DeliveryStreamCopyCommand": _create_DeliveryStream,
+        "DeliveryStreamDataFormatConversionConfiguration": _create_DeliveryStream,
+        "DeliveryStreamDeserializer": _create_DeliveryStream,
+        "DeliveryStreamElasticsearchBufferingHints": _create_DeliveryStream,
+        "DeliveryStreamElasticsearchDestinationConfiguration": _create_DeliveryStream,
+        "DeliveryStreamElasticsearchRetryOptions": _create_DeliveryStream,
+        "DeliveryStreamEncryptionConfiguration": _create_DeliveryStream,
+        "DeliveryStreamExtendedS3DestinationConfiguration": _create_DeliveryStream,
+        "DeliveryStreamHiveJsonSerDe": _create_DeliveryStream,
+        "DeliveryStreamInputFormatConfiguration": _create_DeliveryStream,
+        "DeliveryStreamKinesisStreamSourceConfiguration": _create_DeliveryStream,
+        "DeliveryStreamKMSEncryptionConfig": _create_DeliveryStream,
+        "DeliveryStreamOpenXJsonSerDe": _create_DeliveryStream,
+        "DeliveryStreamOrcSerDe": _create_DeliveryStream,
+        "DeliveryStreamOutputFormatConfiguration": _create_DeliveryStream,
+        "DeliveryStreamParquetSerDe": _create_DeliveryStream,
+        "DeliveryStreamProcessingConfiguration": _create_DeliveryStream,
+        "DeliveryStreamProcessor": _create_DeliveryStream,
+        "DeliveryStreamProcessorParameter": _create_DeliveryStream,
+        "DeliveryStreamRedshiftDestinationConfiguration": _create_DeliveryStream,
+        "DeliveryStreamS3DestinationConfiguration": _create_DeliveryStream,
+        "DeliveryStreamSchemaConfiguration": _create_DeliveryStream,
+        "DeliveryStreamSerializer": _create_DeliveryStream,
+        "DeliveryStreamSplunkDestinationConfiguration": _create_DeliveryStream,
+        "DeliveryStreamSplunkRetryOptions": _create_DeliveryStream,
+    },
+)
@@ -7,61 +7,170 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
-
-__all__ = ["Alias", "AliasProperties", "Key", "KeyProperties"]
-
-
-@attrs(**ATTRSCONFIG)
-class AliasProperties(ResourceProperties):
-    AliasName = attrib(default=None)
-    TargetKeyId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Alias(Resource):
-    """A Alias for KMS.
-
-    See Also:
-        `AWS Cloud Formation documentation for Alias
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kms-alias.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::KMS::Alias"
-
-    Properties: AliasProperties = attrib(
-        factory=AliasProperties, converter=create_object_converter(AliasProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class KeyProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Enabled = attrib(default=None)
-    EnableKeyRotation = attrib(default=None)
-    KeyPolicy = attrib(default=None)
-    KeyUsage = attrib(default=None)
-    PendingWindowInDays = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Key(Resource):
-    """A Key for KMS.
-
-    See Also:
-        `AWS Cloud Formation documentation for Key
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kms-key.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::KMS::Key"
-
-    Properties: KeyProperties = attrib(
-        factory=KeyProperties, converter=create_object_converter(KeyProperties)
-    )
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
+__all__ = [
+    "Alias",
+    "AliasProperties",
+    "Key",
+    "KeyProperties",
+]
+
+
+def _create_Alias():
+    class AliasProperties(_ResourceProperties):
+        __slots__ = ("AliasName", "TargetKeyId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AliasProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AliasName=None, TargetKeyId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AliasName", AliasName)
+            _setattr("TargetKeyId", TargetKeyId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AliasProperties = create_object_converter(AliasProperties)
+
+    class Alias(_Resource):
+        """A Alias for KMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Alias
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kms-alias.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::KMS::Alias"
+
+        Properties: AliasProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Alias",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AliasProperties},
+            factories={"Properties": AliasProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AliasProperties()
+            _setattr("Properties", _convert_AliasProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Alias, AliasProperties
+
+
+def _create_Key():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class KeyProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "Enabled",
+            "EnableKeyRotation",
+            "KeyPolicy",
+            "KeyUsage",
+            "PendingWindowInDays",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "KeyProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Enabled=None,
+            EnableKeyRotation=None,
+            KeyPolicy=None,
+            KeyUsage=None,
+            PendingWindowInDays=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Enabled", Enabled)
+            _setattr("EnableKeyRotation", EnableKeyRotation)
+            _setattr("KeyPolicy", KeyPolicy)
+            _setattr("KeyUsage", KeyUsage)
+            _setattr("PendingWindowInDays", PendingWindowInDays)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_KeyProperties = create_object_converter(KeyProperties)
+
+    class Key(_Resource):
+        """A Key for KMS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Key
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-kms-key.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::KMS::Key"
+
+        Properties: KeyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Key",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_KeyProperties},
+            factories={"Properties": KeyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = KeyProperties()
+            _setattr("Properties", _convert_KeyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Key, KeyProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Alias": _create_Alias,
+        "AliasProperties": _create_Alias,
+        "Key": _create_Key,
+        "KeyProperties": _create_Key,
+    },
+)
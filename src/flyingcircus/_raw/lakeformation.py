@@ -7,90 +7,377 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
 __all__ = [
     "DataLakeSettings",
     "DataLakeSettingsProperties",
+    "DataLakeSettingsDataLakePrincipal",
     "Permissions",
     "PermissionsProperties",
+    "PermissionsDatabaseResource",
+    "PermissionsDataLakePrincipal",
+    "PermissionsResource",
+    "PermissionsTableResource",
     "Resource",
     "ResourceProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class DataLakeSettingsProperties(ResourceProperties):
-    Admins = attrib(default=None)
+def _create_DataLakeSettings():
+    class DataLakeSettingsDataLakePrincipal(_PropertyType):
+        """The Data Lake Principal property type for DataLakeSettings in LakeFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for DataLakePrincipal
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lakeformation-datalakesettings-datalakeprincipal.html>`_
+        """
+
+        __slots__ = ("DataLakePrincipalIdentifier",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataLakeSettingsDataLakePrincipal", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DataLakePrincipalIdentifier=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DataLakePrincipalIdentifier", DataLakePrincipalIdentifier)
+            _init_PropertyType(self, kwargs)
+
+    class DataLakeSettingsProperties(_ResourceProperties):
+        __slots__ = ("Admins",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataLakeSettingsProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Admins=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Admins", Admins)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DataLakeSettingsProperties = create_object_converter(
+        DataLakeSettingsProperties
+    )
+
+    class DataLakeSettings(_Resource):
+        """A Data Lake Settings for LakeFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for DataLakeSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lakeformation-datalakesettings.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::LakeFormation::DataLakeSettings"
 
-@attrs(**ATTRSCONFIG)
-class DataLakeSettings(Resource):
-    """A Data Lake Settings for LakeFormation.
+        Properties: DataLakeSettingsProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for DataLakeSettings
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lakeformation-datalakesettings.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DataLakeSettings",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DataLakeSettingsProperties},
+            factories={"Properties": DataLakeSettingsProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::LakeFormation::DataLakeSettings"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DataLakeSettingsProperties()
+            _setattr("Properties", _convert_DataLakeSettingsProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    Properties: DataLakeSettingsProperties = attrib(
-        factory=DataLakeSettingsProperties,
-        converter=create_object_converter(DataLakeSettingsProperties),
+    return (
+        DataLakeSettings,
+        DataLakeSettingsProperties,
+        DataLakeSettingsDataLakePrincipal,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class PermissionsProperties(ResourceProperties):
-    DataLakePrincipal = attrib(default=None)
-    Permissions = attrib(default=None)
-    PermissionsWithGrantOption = attrib(default=None)
-    Resource = attrib(default=None)
+def _create_Permissions():
+    class PermissionsDataLakePrincipal(_PropertyType):
+        """The Data Lake Principal property type for Permissions in LakeFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for DataLakePrincipal
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lakeformation-permissions-datalakeprincipal.html>`_
+        """
+
+        __slots__ = ("DataLakePrincipalIdentifier",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PermissionsDataLakePrincipal", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DataLakePrincipalIdentifier=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DataLakePrincipalIdentifier", DataLakePrincipalIdentifier)
+            _init_PropertyType(self, kwargs)
+
+    class PermissionsDatabaseResource(_PropertyType):
+        """The Database Resource property type for Permissions in LakeFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for DatabaseResource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lakeformation-permissions-databaseresource.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PermissionsDatabaseResource", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class PermissionsTableResource(_PropertyType):
+        """The Table Resource property type for Permissions in LakeFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for TableResource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lakeformation-permissions-tableresource.html>`_
+        """
+
+        __slots__ = ("DatabaseName", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PermissionsTableResource", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, DatabaseName=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Permissions(Resource):
-    """A Permissions for LakeFormation.
+    _convert_PermissionsDatabaseResource = create_object_converter(
+        PermissionsDatabaseResource
+    )
+    _convert_PermissionsTableResource = create_object_converter(
+        PermissionsTableResource
+    )
+
+    class PermissionsResource(_PropertyType):
+        """The Resource property type for Permissions in LakeFormation.
 
-    See Also:
-        `AWS Cloud Formation documentation for Permissions
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lakeformation-permissions.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for Resource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lakeformation-permissions-resource.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::LakeFormation::Permissions"
+        __slots__ = ("DatabaseResource", "TableResource")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PermissionsResource",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DatabaseResource": _convert_PermissionsDatabaseResource,
+                "TableResource": _convert_PermissionsTableResource,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: PermissionsProperties = attrib(
-        factory=PermissionsProperties,
-        converter=create_object_converter(PermissionsProperties),
+        def __init__(
+            self, *, DatabaseResource=None, TableResource=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DatabaseResource",
+                _convert_PermissionsDatabaseResource(DatabaseResource),
+            )
+            _setattr("TableResource", _convert_PermissionsTableResource(TableResource))
+            _init_PropertyType(self, kwargs)
+
+    _convert_PermissionsDataLakePrincipal = create_object_converter(
+        PermissionsDataLakePrincipal
     )
+    _convert_PermissionsResource = create_object_converter(PermissionsResource)
+
+    class PermissionsProperties(_ResourceProperties):
+        __slots__ = (
+            "DataLakePrincipal",
+            "Permissions",
+            "PermissionsWithGrantOption",
+            "Resource",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PermissionsProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DataLakePrincipal": _convert_PermissionsDataLakePrincipal,
+                "Resource": _convert_PermissionsResource,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            DataLakePrincipal=None,
+            Permissions=None,
+            PermissionsWithGrantOption=None,
+            Resource=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DataLakePrincipal",
+                _convert_PermissionsDataLakePrincipal(DataLakePrincipal),
+            )
+            _setattr("Permissions", Permissions)
+            _setattr("PermissionsWithGrantOption", PermissionsWithGrantOption)
+            _setattr("Resource", _convert_PermissionsResource(Resource))
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class ResourceProperties(ResourceProperties):
-    ResourceArn = attrib(default=None)
-    RoleArn = attrib(default=None)
-    UseServiceLinkedRole = attrib(default=None)
+    _convert_PermissionsProperties = create_object_converter(PermissionsProperties)
 
+    class Permissions(_Resource):
+        """A Permissions for LakeFormation.
 
-@attrs(**ATTRSCONFIG)
-class Resource(Resource):
-    """A Resource for LakeFormation.
+        See Also:
+            `AWS Cloud Formation documentation for Permissions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lakeformation-permissions.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Resource
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lakeformation-resource.html>`_
-    """
+        RESOURCE_TYPE = "AWS::LakeFormation::Permissions"
 
-    RESOURCE_TYPE = "AWS::LakeFormation::Resource"
+        Properties: PermissionsProperties
 
-    Properties: ResourceProperties = attrib(
-        factory=ResourceProperties,
-        converter=create_object_converter(ResourceProperties),
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Permissions",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PermissionsProperties},
+            factories={"Properties": PermissionsProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PermissionsProperties()
+            _setattr("Properties", _convert_PermissionsProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Permissions,
+        PermissionsProperties,
+        PermissionsDataLakePrincipal,
+        PermissionsDatabaseResource,
+        PermissionsTableResource,
+        PermissionsResource,
     )
+
+
+def _create_Resource():
+    class ResourceProperties(_ResourceProperties):
+        __slots__ = ("ResourceArn", "RoleArn", "UseServiceLinkedRole")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ResourceArn=None, RoleArn=None, UseServiceLinkedRole=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceArn", ResourceArn)
+            _setattr("RoleArn", RoleArn)
+            _setattr("UseServiceLinkedRole", UseServiceLinkedRole)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResourceProperties = create_object_converter(ResourceProperties)
+
+    class Resource(_Resource):
+        """A Resource for LakeFormation.
+
+        See Also:
+            `AWS Cloud Formation documentation for Resource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lakeformation-resource.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::LakeFormation::Resource"
+
+        Properties: ResourceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Resource",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResourceProperties},
+            factories={"Properties": ResourceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResourceProperties()
+            _setattr("Properties", _convert_ResourceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Resource, ResourceProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "DataLakeSettings": _create_DataLakeSettings,
+        "DataLakeSettingsProperties": _create_DataLakeSettings,
+        "DataLakeSettingsDataLakePrincipal": _create_DataLakeSettings,
+        "Permissions": _create_Permissions,
+        "PermissionsProperties": _create_Permissions,
+        "PermissionsDatabaseResource": _create_Permissions,
+        "PermissionsDataLakePrincipal": _create_Permissions,
+        "PermissionsResource": _create_Permissions,
+        "PermissionsTableResource": _create_Permissions,
+        "Resource": _create_Resource,
+        "ResourceProperties": _create_Resource,
+    },
+)
@@ -10,256 +10,1198 @@ This file is automatically generated, and should not be directly edited.
 from typing import Any
 from typing import Dict
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Alias",
     "AliasProperties",
+    "AliasAliasRoutingConfiguration",
+    "AliasProvisionedConcurrencyConfiguration",
+    "AliasVersionWeight",
     "EventInvokeConfig",
     "EventInvokeConfigProperties",
+    "EventInvokeConfigDestinationConfig",
+    "EventInvokeConfigOnFailure",
+    "EventInvokeConfigOnSuccess",
     "EventSourceMapping",
     "EventSourceMappingProperties",
+    "EventSourceMappingDestinationConfig",
+    "EventSourceMappingOnFailure",
     "Function",
     "FunctionProperties",
+    "FunctionCode",
+    "FunctionDeadLetterConfig",
+    "FunctionEnvironment",
+    "FunctionTracingConfig",
+    "FunctionVpcConfig",
     "LayerVersion",
     "LayerVersionProperties",
+    "LayerVersionContent",
     "LayerVersionPermission",
     "LayerVersionPermissionProperties",
     "Permission",
     "PermissionProperties",
     "Version",
     "VersionProperties",
+    "VersionProvisionedConcurrencyConfiguration",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AliasProperties(ResourceProperties):
-    Description = attrib(default=None)
-    FunctionName = attrib(default=None)
-    FunctionVersion = attrib(default=None)
-    Name = attrib(default=None)
-    ProvisionedConcurrencyConfig = attrib(default=None)
-    RoutingConfig = attrib(default=None)
+def _create_Alias():
+    class AliasVersionWeight(_PropertyType):
+        """The Version Weight property type for Alias in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for VersionWeight
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-alias-versionweight.html>`_
+        """
+
+        __slots__ = ("FunctionVersion", "FunctionWeight")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AliasVersionWeight", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FunctionVersion=None, FunctionWeight=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FunctionVersion", FunctionVersion)
+            _setattr("FunctionWeight", FunctionWeight)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AliasVersionWeight_list = create_object_list_converter(AliasVersionWeight)
+
+    class AliasAliasRoutingConfiguration(_PropertyType):
+        """The Alias Routing Configuration property type for Alias in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for AliasRoutingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-alias-aliasroutingconfiguration.html>`_
+        """
+
+        __slots__ = ("AdditionalVersionWeights",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AliasAliasRoutingConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"AdditionalVersionWeights": _convert_AliasVersionWeight_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, AdditionalVersionWeights=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AdditionalVersionWeights",
+                _convert_AliasVersionWeight_list(AdditionalVersionWeights),
+            )
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Alias(Resource):
-    """A Alias for Lambda.
+    class AliasProvisionedConcurrencyConfiguration(_PropertyType):
+        """The Provisioned Concurrency Configuration property type for Alias in Lambda.
 
-    See Also:
-        `AWS Cloud Formation documentation for Alias
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-alias.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for ProvisionedConcurrencyConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-alias-provisionedconcurrencyconfiguration.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::Lambda::Alias"
+        __slots__ = ("ProvisionedConcurrentExecutions",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AliasProvisionedConcurrencyConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: AliasProperties = attrib(
-        factory=AliasProperties, converter=create_object_converter(AliasProperties)
+        def __init__(self, *, ProvisionedConcurrentExecutions=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ProvisionedConcurrentExecutions", ProvisionedConcurrentExecutions)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AliasProvisionedConcurrencyConfiguration = create_object_converter(
+        AliasProvisionedConcurrencyConfiguration
+    )
+    _convert_AliasAliasRoutingConfiguration = create_object_converter(
+        AliasAliasRoutingConfiguration
     )
 
-    # NB: UpdatePolicy may be set for Alias
-    # (unlike most Resource types)
-    UpdatePolicy: Dict[str, Any] = attrib(factory=dict)
+    class AliasProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "FunctionName",
+            "FunctionVersion",
+            "Name",
+            "ProvisionedConcurrencyConfig",
+            "RoutingConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AliasProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ProvisionedConcurrencyConfig": _convert_AliasProvisionedConcurrencyConfiguration,
+                "RoutingConfig": _convert_AliasAliasRoutingConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            FunctionName=None,
+            FunctionVersion=None,
+            Name=None,
+            ProvisionedConcurrencyConfig=None,
+            RoutingConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("FunctionName", FunctionName)
+            _setattr("FunctionVersion", FunctionVersion)
+            _setattr("Name", Name)
+            _setattr(
+                "ProvisionedConcurrencyConfig",
+                _convert_AliasProvisionedConcurrencyConfiguration(
+                    ProvisionedConcurrencyConfig
+                ),
+            )
+            _setattr(
+                "RoutingConfig", _convert_AliasAliasRoutingConfiguration(RoutingConfig)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AliasProperties = create_object_converter(AliasProperties)
 
+    class Alias(_Resource):
+        """A Alias for Lambda.
 
-@attrs(**ATTRSCONFIG)
-class EventInvokeConfigProperties(ResourceProperties):
-    DestinationConfig = attrib(default=None)
-    FunctionName = attrib(default=None)
-    MaximumEventAgeInSeconds = attrib(default=None)
-    MaximumRetryAttempts = attrib(default=None)
-    Qualifier = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for Alias
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-alias.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::Lambda::Alias"
 
-@attrs(**ATTRSCONFIG)
-class EventInvokeConfig(Resource):
-    """A Event Invoke Config for Lambda.
+        Properties: AliasProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for EventInvokeConfig
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-eventinvokeconfig.html>`_
-    """
+        # NB: UpdatePolicy may be set for Alias
+        # (unlike most Resource types)
+        UpdatePolicy: Dict[str, Any]
 
-    RESOURCE_TYPE = "AWS::Lambda::EventInvokeConfig"
+        __slots__ = ("Properties", "UpdatePolicy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Alias",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AliasProperties},
+            factories={"Properties": AliasProperties, "UpdatePolicy": dict},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: EventInvokeConfigProperties = attrib(
-        factory=EventInvokeConfigProperties,
-        converter=create_object_converter(EventInvokeConfigProperties),
+        def __init__(
+            self,
+            *,
+            Properties=NOTHING,
+            UpdatePolicy: Dict[str, Any] = NOTHING,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AliasProperties()
+            _setattr("Properties", _convert_AliasProperties(Properties))
+            if UpdatePolicy is NOTHING:
+                UpdatePolicy = dict()
+            _setattr("UpdatePolicy", UpdatePolicy)
+            _init_Resource(self, kwargs)
+
+    return (
+        Alias,
+        AliasProperties,
+        AliasVersionWeight,
+        AliasAliasRoutingConfiguration,
+        AliasProvisionedConcurrencyConfiguration,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class EventSourceMappingProperties(ResourceProperties):
-    BatchSize = attrib(default=None)
-    BisectBatchOnFunctionError = attrib(default=None)
-    DestinationConfig = attrib(default=None)
-    Enabled = attrib(default=None)
-    EventSourceArn = attrib(default=None)
-    FunctionName = attrib(default=None)
-    MaximumBatchingWindowInSeconds = attrib(default=None)
-    MaximumRecordAgeInSeconds = attrib(default=None)
-    MaximumRetryAttempts = attrib(default=None)
-    ParallelizationFactor = attrib(default=None)
-    StartingPosition = attrib(default=None)
+def _create_EventInvokeConfig():
+    class EventInvokeConfigOnSuccess(_PropertyType):
+        """The On Success property type for EventInvokeConfig in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for OnSuccess
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-eventinvokeconfig-destinationconfig-onsuccess.html>`_
+        """
+
+        __slots__ = ("Destination",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventInvokeConfigOnSuccess", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, Destination=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Destination", Destination)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class EventSourceMapping(Resource):
-    """A Event Source Mapping for Lambda.
+    class EventInvokeConfigOnFailure(_PropertyType):
+        """The On Failure property type for EventInvokeConfig in Lambda.
 
-    See Also:
-        `AWS Cloud Formation documentation for EventSourceMapping
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-eventsourcemapping.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for OnFailure
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-eventinvokeconfig-destinationconfig-onfailure.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::Lambda::EventSourceMapping"
+        __slots__ = ("Destination",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventInvokeConfigOnFailure", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: EventSourceMappingProperties = attrib(
-        factory=EventSourceMappingProperties,
-        converter=create_object_converter(EventSourceMappingProperties),
+        def __init__(self, *, Destination=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Destination", Destination)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EventInvokeConfigOnFailure = create_object_converter(
+        EventInvokeConfigOnFailure
+    )
+    _convert_EventInvokeConfigOnSuccess = create_object_converter(
+        EventInvokeConfigOnSuccess
     )
 
+    class EventInvokeConfigDestinationConfig(_PropertyType):
+        """The Destination Config property type for EventInvokeConfig in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for DestinationConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-eventinvokeconfig-destinationconfig.html>`_
+        """
+
+        __slots__ = ("OnFailure", "OnSuccess")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventInvokeConfigDestinationConfig",
+            _PropertyType,
+            __slots__,
+            converters={
+                "OnFailure": _convert_EventInvokeConfigOnFailure,
+                "OnSuccess": _convert_EventInvokeConfigOnSuccess,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class FunctionProperties(ResourceProperties):
-    Code = attrib(default=None)
-    DeadLetterConfig = attrib(default=None)
-    Description = attrib(default=None)
-    Environment = attrib(default=None)
-    FunctionName = attrib(default=None)
-    Handler = attrib(default=None)
-    KmsKeyArn = attrib(default=None)
-    Layers = attrib(default=None)
-    MemorySize = attrib(default=None)
-    ReservedConcurrentExecutions = attrib(default=None)
-    Role = attrib(default=None)
-    Runtime = attrib(default=None)
-    Tags = attrib(default=None)
-    Timeout = attrib(default=None)
-    TracingConfig = attrib(default=None)
-    VpcConfig = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Function(Resource):
-    """A Function for Lambda.
-
-    See Also:
-        `AWS Cloud Formation documentation for Function
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-function.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Lambda::Function"
-
-    Properties: FunctionProperties = attrib(
-        factory=FunctionProperties,
-        converter=create_object_converter(FunctionProperties),
+        def __init__(self, *, OnFailure=None, OnSuccess=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("OnFailure", _convert_EventInvokeConfigOnFailure(OnFailure))
+            _setattr("OnSuccess", _convert_EventInvokeConfigOnSuccess(OnSuccess))
+            _init_PropertyType(self, kwargs)
+
+    _convert_EventInvokeConfigDestinationConfig = create_object_converter(
+        EventInvokeConfigDestinationConfig
     )
 
+    class EventInvokeConfigProperties(_ResourceProperties):
+        __slots__ = (
+            "DestinationConfig",
+            "FunctionName",
+            "MaximumEventAgeInSeconds",
+            "MaximumRetryAttempts",
+            "Qualifier",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventInvokeConfigProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DestinationConfig": _convert_EventInvokeConfigDestinationConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DestinationConfig=None,
+            FunctionName=None,
+            MaximumEventAgeInSeconds=None,
+            MaximumRetryAttempts=None,
+            Qualifier=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DestinationConfig",
+                _convert_EventInvokeConfigDestinationConfig(DestinationConfig),
+            )
+            _setattr("FunctionName", FunctionName)
+            _setattr("MaximumEventAgeInSeconds", MaximumEventAgeInSeconds)
+            _setattr("MaximumRetryAttempts", MaximumRetryAttempts)
+            _setattr("Qualifier", Qualifier)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EventInvokeConfigProperties = create_object_converter(
+        EventInvokeConfigProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class LayerVersionProperties(ResourceProperties):
-    CompatibleRuntimes = attrib(default=None)
-    Content = attrib(default=None)
-    Description = attrib(default=None)
-    LayerName = attrib(default=None)
-    LicenseInfo = attrib(default=None)
+    class EventInvokeConfig(_Resource):
+        """A Event Invoke Config for Lambda.
 
+        See Also:
+            `AWS Cloud Formation documentation for EventInvokeConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-eventinvokeconfig.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class LayerVersion(Resource):
-    """A Layer Version for Lambda.
+        RESOURCE_TYPE = "AWS::Lambda::EventInvokeConfig"
 
-    See Also:
-        `AWS Cloud Formation documentation for LayerVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-layerversion.html>`_
-    """
+        Properties: EventInvokeConfigProperties
 
-    RESOURCE_TYPE = "AWS::Lambda::LayerVersion"
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventInvokeConfig",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EventInvokeConfigProperties},
+            factories={"Properties": EventInvokeConfigProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: LayerVersionProperties = attrib(
-        factory=LayerVersionProperties,
-        converter=create_object_converter(LayerVersionProperties),
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EventInvokeConfigProperties()
+            _setattr("Properties", _convert_EventInvokeConfigProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        EventInvokeConfig,
+        EventInvokeConfigProperties,
+        EventInvokeConfigOnSuccess,
+        EventInvokeConfigOnFailure,
+        EventInvokeConfigDestinationConfig,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class LayerVersionPermissionProperties(ResourceProperties):
-    Action = attrib(default=None)
-    LayerVersionArn = attrib(default=None)
-    OrganizationId = attrib(default=None)
-    Principal = attrib(default=None)
+def _create_EventSourceMapping():
+    class EventSourceMappingOnFailure(_PropertyType):
+        """The On Failure property type for EventSourceMapping in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for OnFailure
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-eventsourcemapping-onfailure.html>`_
+        """
 
+        __slots__ = ("Destination",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventSourceMappingOnFailure", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class LayerVersionPermission(Resource):
-    """A Layer Version Permission for Lambda.
+        def __init__(self, *, Destination=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Destination", Destination)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EventSourceMappingOnFailure = create_object_converter(
+        EventSourceMappingOnFailure
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for LayerVersionPermission
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-layerversionpermission.html>`_
-    """
+    class EventSourceMappingDestinationConfig(_PropertyType):
+        """The Destination Config property type for EventSourceMapping in Lambda.
 
-    RESOURCE_TYPE = "AWS::Lambda::LayerVersionPermission"
+        See Also:
+            `AWS Cloud Formation documentation for DestinationConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-eventsourcemapping-destinationconfig.html>`_
+        """
 
-    Properties: LayerVersionPermissionProperties = attrib(
-        factory=LayerVersionPermissionProperties,
-        converter=create_object_converter(LayerVersionPermissionProperties),
+        __slots__ = ("OnFailure",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventSourceMappingDestinationConfig",
+            _PropertyType,
+            __slots__,
+            converters={"OnFailure": _convert_EventSourceMappingOnFailure},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, OnFailure=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("OnFailure", _convert_EventSourceMappingOnFailure(OnFailure))
+            _init_PropertyType(self, kwargs)
+
+    _convert_EventSourceMappingDestinationConfig = create_object_converter(
+        EventSourceMappingDestinationConfig
     )
 
+    class EventSourceMappingProperties(_ResourceProperties):
+        __slots__ = (
+            "BatchSize",
+            "BisectBatchOnFunctionError",
+            "DestinationConfig",
+            "Enabled",
+            "EventSourceArn",
+            "FunctionName",
+            "MaximumBatchingWindowInSeconds",
+            "MaximumRecordAgeInSeconds",
+            "MaximumRetryAttempts",
+            "ParallelizationFactor",
+            "StartingPosition",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventSourceMappingProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DestinationConfig": _convert_EventSourceMappingDestinationConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class PermissionProperties(ResourceProperties):
-    Action = attrib(default=None)
-    EventSourceToken = attrib(default=None)
-    FunctionName = attrib(default=None)
-    Principal = attrib(default=None)
-    SourceAccount = attrib(default=None)
-    SourceArn = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            BatchSize=None,
+            BisectBatchOnFunctionError=None,
+            DestinationConfig=None,
+            Enabled=None,
+            EventSourceArn=None,
+            FunctionName=None,
+            MaximumBatchingWindowInSeconds=None,
+            MaximumRecordAgeInSeconds=None,
+            MaximumRetryAttempts=None,
+            ParallelizationFactor=None,
+            StartingPosition=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BatchSize", BatchSize)
+            _setattr("BisectBatchOnFunctionError", BisectBatchOnFunctionError)
+            _setattr(
+                "DestinationConfig",
+                _convert_EventSourceMappingDestinationConfig(DestinationConfig),
+            )
+            _setattr("Enabled", Enabled)
+            _setattr("EventSourceArn", EventSourceArn)
+            _setattr("FunctionName", FunctionName)
+            _setattr("MaximumBatchingWindowInSeconds", MaximumBatchingWindowInSeconds)
+            _setattr("MaximumRecordAgeInSeconds", MaximumRecordAgeInSeconds)
+            _setattr("MaximumRetryAttempts", MaximumRetryAttempts)
+            _setattr("ParallelizationFactor", ParallelizationFactor)
+            _setattr("StartingPosition", StartingPosition)
+            _init_ResourceProperties(self, kwargs)
 
+    _convert_EventSourceMappingProperties = create_object_converter(
+        EventSourceMappingProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class Permission(Resource):
-    """A Permission for Lambda.
+    class EventSourceMapping(_Resource):
+        """A Event Source Mapping for Lambda.
 
-    See Also:
-        `AWS Cloud Formation documentation for Permission
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-permission.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for EventSourceMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-eventsourcemapping.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::Lambda::Permission"
+        RESOURCE_TYPE = "AWS::Lambda::EventSourceMapping"
 
-    Properties: PermissionProperties = attrib(
-        factory=PermissionProperties,
-        converter=create_object_converter(PermissionProperties),
+        Properties: EventSourceMappingProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventSourceMapping",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EventSourceMappingProperties},
+            factories={"Properties": EventSourceMappingProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EventSourceMappingProperties()
+            _setattr("Properties", _convert_EventSourceMappingProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        EventSourceMapping,
+        EventSourceMappingProperties,
+        EventSourceMappingOnFailure,
+        EventSourceMappingDestinationConfig,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class VersionProperties(ResourceProperties):
-    CodeSha256 = attrib(default=None)
-    Description = attrib(default=None)
-    FunctionName = attrib(default=None)
-    ProvisionedConcurrencyConfig = attrib(default=None)
+def _create_Function():
+    class FunctionCode(_PropertyType):
+        """The Code property type for Function in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for Code
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-function-code.html>`_
+        """
+
+        __slots__ = ("S3Bucket", "S3Key", "S3ObjectVersion", "ZipFile")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionCode", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            S3Bucket=None,
+            S3Key=None,
+            S3ObjectVersion=None,
+            ZipFile=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("S3Bucket", S3Bucket)
+            _setattr("S3Key", S3Key)
+            _setattr("S3ObjectVersion", S3ObjectVersion)
+            _setattr("ZipFile", ZipFile)
+            _init_PropertyType(self, kwargs)
+
+    class FunctionDeadLetterConfig(_PropertyType):
+        """The Dead Letter Config property type for Function in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeadLetterConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-function-deadletterconfig.html>`_
+        """
+
+        __slots__ = ("TargetArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionDeadLetterConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TargetArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TargetArn", TargetArn)
+            _init_PropertyType(self, kwargs)
+
+    class FunctionEnvironment(_PropertyType):
+        """The Environment property type for Function in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for Environment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-function-environment.html>`_
+        """
+
+        __slots__ = ("Variables",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionEnvironment", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Variables=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Variables", Variables)
+            _init_PropertyType(self, kwargs)
+
+    class FunctionTracingConfig(_PropertyType):
+        """The Tracing Config property type for Function in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for TracingConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-function-tracingconfig.html>`_
+        """
+
+        __slots__ = ("Mode",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionTracingConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Mode=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Mode", Mode)
+            _init_PropertyType(self, kwargs)
+
+    class FunctionVpcConfig(_PropertyType):
+        """The Vpc Config property type for Function in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for VpcConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-function-vpcconfig.html>`_
+        """
+
+        __slots__ = ("SecurityGroupIds", "SubnetIds")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionVpcConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SecurityGroupIds=None, SubnetIds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SubnetIds", SubnetIds)
+            _init_PropertyType(self, kwargs)
+
+    _convert_FunctionCode = create_object_converter(FunctionCode)
+    _convert_FunctionDeadLetterConfig = create_object_converter(
+        FunctionDeadLetterConfig
+    )
+    _convert_FunctionEnvironment = create_object_converter(FunctionEnvironment)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_FunctionTracingConfig = create_object_converter(FunctionTracingConfig)
+    _convert_FunctionVpcConfig = create_object_converter(FunctionVpcConfig)
+
+    class FunctionProperties(_ResourceProperties):
+        __slots__ = (
+            "Code",
+            "DeadLetterConfig",
+            "Description",
+            "Environment",
+            "FunctionName",
+            "Handler",
+            "KmsKeyArn",
+            "Layers",
+            "MemorySize",
+            "ReservedConcurrentExecutions",
+            "Role",
+            "Runtime",
+            "Tags",
+            "Timeout",
+            "TracingConfig",
+            "VpcConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FunctionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Code": _convert_FunctionCode,
+                "DeadLetterConfig": _convert_FunctionDeadLetterConfig,
+                "Environment": _convert_FunctionEnvironment,
+                "Tags": _convert_Tag_list,
+                "TracingConfig": _convert_FunctionTracingConfig,
+                "VpcConfig": _convert_FunctionVpcConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Code=None,
+            DeadLetterConfig=None,
+            Description=None,
+            Environment=None,
+            FunctionName=None,
+            Handler=None,
+            KmsKeyArn=None,
+            Layers=None,
+            MemorySize=None,
+            ReservedConcurrentExecutions=None,
+            Role=None,
+            Runtime=None,
+            Tags=None,
+            Timeout=None,
+            TracingConfig=None,
+            VpcConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Code", _convert_FunctionCode(Code))
+            _setattr(
+                "DeadLetterConfig", _convert_FunctionDeadLetterConfig(DeadLetterConfig)
+            )
+            _setattr("Description", Description)
+            _setattr("Environment", _convert_FunctionEnvironment(Environment))
+            _setattr("FunctionName", FunctionName)
+            _setattr("Handler", Handler)
+            _setattr("KmsKeyArn", KmsKeyArn)
+            _setattr("Layers", Layers)
+            _setattr("MemorySize", MemorySize)
+            _setattr("ReservedConcurrentExecutions", ReservedConcurrentExecutions)
+            _setattr("Role", Role)
+            _setattr("Runtime", Runtime)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Timeout", Timeout)
+            _setattr("TracingConfig", _convert_FunctionTracingConfig(TracingConfig))
+            _setattr("VpcConfig", _convert_FunctionVpcConfig(VpcConfig))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FunctionProperties = create_object_converter(FunctionProperties)
+
+    class Function(_Resource):
+        """A Function for Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for Function
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-function.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::Lambda::Function"
 
-@attrs(**ATTRSCONFIG)
-class Version(Resource):
-    """A Version for Lambda.
+        Properties: FunctionProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for Version
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-version.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Function",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FunctionProperties},
+            factories={"Properties": FunctionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Lambda::Version"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FunctionProperties()
+            _setattr("Properties", _convert_FunctionProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    Properties: VersionProperties = attrib(
-        factory=VersionProperties, converter=create_object_converter(VersionProperties)
+    return (
+        Function,
+        FunctionProperties,
+        FunctionCode,
+        FunctionDeadLetterConfig,
+        FunctionEnvironment,
+        FunctionTracingConfig,
+        FunctionVpcConfig,
     )
+
+
+def _create_LayerVersion():
+    class LayerVersionContent(_PropertyType):
+        """The Content property type for LayerVersion in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for Content
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-layerversion-content.html>`_
+        """
+
+        __slots__ = ("S3Bucket", "S3Key", "S3ObjectVersion")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerVersionContent", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, S3Bucket=None, S3Key=None, S3ObjectVersion=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("S3Bucket", S3Bucket)
+            _setattr("S3Key", S3Key)
+            _setattr("S3ObjectVersion", S3ObjectVersion)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LayerVersionContent = create_object_converter(LayerVersionContent)
+
+    class LayerVersionProperties(_ResourceProperties):
+        __slots__ = (
+            "CompatibleRuntimes",
+            "Content",
+            "Description",
+            "LayerName",
+            "LicenseInfo",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerVersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Content": _convert_LayerVersionContent},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CompatibleRuntimes=None,
+            Content=None,
+            Description=None,
+            LayerName=None,
+            LicenseInfo=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CompatibleRuntimes", CompatibleRuntimes)
+            _setattr("Content", _convert_LayerVersionContent(Content))
+            _setattr("Description", Description)
+            _setattr("LayerName", LayerName)
+            _setattr("LicenseInfo", LicenseInfo)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LayerVersionProperties = create_object_converter(LayerVersionProperties)
+
+    class LayerVersion(_Resource):
+        """A Layer Version for Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for LayerVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-layerversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Lambda::LayerVersion"
+
+        Properties: LayerVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LayerVersionProperties},
+            factories={"Properties": LayerVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LayerVersionProperties()
+            _setattr("Properties", _convert_LayerVersionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return LayerVersion, LayerVersionProperties, LayerVersionContent
+
+
+def _create_LayerVersionPermission():
+    class LayerVersionPermissionProperties(_ResourceProperties):
+        __slots__ = ("Action", "LayerVersionArn", "OrganizationId", "Principal")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerVersionPermissionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Action=None,
+            LayerVersionArn=None,
+            OrganizationId=None,
+            Principal=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", Action)
+            _setattr("LayerVersionArn", LayerVersionArn)
+            _setattr("OrganizationId", OrganizationId)
+            _setattr("Principal", Principal)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LayerVersionPermissionProperties = create_object_converter(
+        LayerVersionPermissionProperties
+    )
+
+    class LayerVersionPermission(_Resource):
+        """A Layer Version Permission for Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for LayerVersionPermission
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-layerversionpermission.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Lambda::LayerVersionPermission"
+
+        Properties: LayerVersionPermissionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerVersionPermission",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LayerVersionPermissionProperties},
+            factories={"Properties": LayerVersionPermissionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LayerVersionPermissionProperties()
+            _setattr(
+                "Properties", _convert_LayerVersionPermissionProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return LayerVersionPermission, LayerVersionPermissionProperties
+
+
+def _create_Permission():
+    class PermissionProperties(_ResourceProperties):
+        __slots__ = (
+            "Action",
+            "EventSourceToken",
+            "FunctionName",
+            "Principal",
+            "SourceAccount",
+            "SourceArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PermissionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Action=None,
+            EventSourceToken=None,
+            FunctionName=None,
+            Principal=None,
+            SourceAccount=None,
+            SourceArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", Action)
+            _setattr("EventSourceToken", EventSourceToken)
+            _setattr("FunctionName", FunctionName)
+            _setattr("Principal", Principal)
+            _setattr("SourceAccount", SourceAccount)
+            _setattr("SourceArn", SourceArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PermissionProperties = create_object_converter(PermissionProperties)
+
+    class Permission(_Resource):
+        """A Permission for Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for Permission
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-permission.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Lambda::Permission"
+
+        Properties: PermissionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Permission",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PermissionProperties},
+            factories={"Properties": PermissionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PermissionProperties()
+            _setattr("Properties", _convert_PermissionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Permission, PermissionProperties
+
+
+def _create_Version():
+    class VersionProvisionedConcurrencyConfiguration(_PropertyType):
+        """The Provisioned Concurrency Configuration property type for Version in Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProvisionedConcurrencyConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-lambda-version-provisionedconcurrencyconfiguration.html>`_
+        """
+
+        __slots__ = ("ProvisionedConcurrentExecutions",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VersionProvisionedConcurrencyConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ProvisionedConcurrentExecutions=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ProvisionedConcurrentExecutions", ProvisionedConcurrentExecutions)
+            _init_PropertyType(self, kwargs)
+
+    _convert_VersionProvisionedConcurrencyConfiguration = create_object_converter(
+        VersionProvisionedConcurrencyConfiguration
+    )
+
+    class VersionProperties(_ResourceProperties):
+        __slots__ = (
+            "CodeSha256",
+            "Description",
+            "FunctionName",
+            "ProvisionedConcurrencyConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VersionProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ProvisionedConcurrencyConfig": _convert_VersionProvisionedConcurrencyConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CodeSha256=None,
+            Description=None,
+            FunctionName=None,
+            ProvisionedConcurrencyConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CodeSha256", CodeSha256)
+            _setattr("Description", Description)
+            _setattr("FunctionName", FunctionName)
+            _setattr(
+                "ProvisionedConcurrencyConfig",
+                _convert_VersionProvisionedConcurrencyConfiguration(
+                    ProvisionedConcurrencyConfig
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VersionProperties = create_object_converter(VersionProperties)
+
+    class Version(_Resource):
+        """A Version for Lambda.
+
+        See Also:
+            `AWS Cloud Formation documentation for Version
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-lambda-version.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Lambda::Version"
+
+        Properties: VersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Version",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VersionProperties},
+            factories={"Properties": VersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VersionProperties()
+            _setattr("Properties", _convert_VersionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Version, VersionProperties, VersionProvisionedConcurrencyConfiguration
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Alias": _create_Alias,
+        "AliasProperties": _create_Alias,
+        "AliasAliasRoutingConfiguration": _create_Alias,
+        "AliasProvisionedConcurrencyConfiguration": _create_Alias,
+        "AliasVersionWeight": _create_Alias,
+        "EventInvokeConfig": _create_EventInvokeConfig,
+        "EventInvokeConfigProperties": _create_EventInvokeConfig,
+        "EventInvokeConfigDestinationConfig": _create_EventInvokeConfig,
+        "EventInvokeConfigOnFailure": _create_EventInvokeConfig,
+        "EventInvokeConfigOnSuccess": _create_EventInvokeConfig,
+        "EventSourceMapping": _create_EventSourceMapping,
+        "EventSourceMappingProperties": _create_EventSourceMapping,
+        "EventSourceMappingDestinationConfig": _create_EventSourceMapping,
+        "EventSourceMappingOnFailure": _create_EventSourceMapping,
+        "Function": _create_Function,
+        "FunctionProperties": _create_Function,
+        "FunctionCode": _create_Function,
+        "FunctionDeadLetterConfig": _create_Function,
+        "FunctionEnvironment": _create_Function,
+        "FunctionTracingConfig": _create_Function,
+        "FunctionVpcConfig": _create_Function,
+        "LayerVersion": _create_LayerVersion,
+        "LayerVersionProperties": _create_LayerVersion,
+        "LayerVersionContent": _create_LayerVersion,
+        "LayerVersionPermission": _create_LayerVersionPermission,
+        "LayerVersionPermissionProperties": _create_LayerVersionPermission,
+        "Permission": _create_Permission,
+        "PermissionProperties": _create_Permission,
+        "Version": _create_Version,
+        "VersionProperties": _create_Version,
+        "VersionProvisionedConcurrencyConfiguration": _create_Version,
+    },
+)
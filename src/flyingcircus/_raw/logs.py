@@ -7,13 +7,20 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Destination",
@@ -24,126 +31,367 @@ __all__ = [
     "LogStreamProperties",
     "MetricFilter",
     "MetricFilterProperties",
+    "MetricFilterMetricTransformation",
     "SubscriptionFilter",
     "SubscriptionFilterProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class DestinationProperties(ResourceProperties):
-    DestinationName = attrib(default=None)
-    DestinationPolicy = attrib(default=None)
-    RoleArn = attrib(default=None)
-    TargetArn = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Destination(Resource):
-    """A Destination for Logs.
-
-    See Also:
-        `AWS Cloud Formation documentation for Destination
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-destination.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Logs::Destination"
-
-    Properties: DestinationProperties = attrib(
-        factory=DestinationProperties,
-        converter=create_object_converter(DestinationProperties),
+def _create_Destination():
+    class DestinationProperties(_ResourceProperties):
+        __slots__ = ("DestinationName", "DestinationPolicy", "RoleArn", "TargetArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DestinationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DestinationName=None,
+            DestinationPolicy=None,
+            RoleArn=None,
+            TargetArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationName", DestinationName)
+            _setattr("DestinationPolicy", DestinationPolicy)
+            _setattr("RoleArn", RoleArn)
+            _setattr("TargetArn", TargetArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DestinationProperties = create_object_converter(DestinationProperties)
+
+    class Destination(_Resource):
+        """A Destination for Logs.
+
+        See Also:
+            `AWS Cloud Formation documentation for Destination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-destination.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Logs::Destination"
+
+        Properties: DestinationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Destination",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DestinationProperties},
+            factories={"Properties": DestinationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DestinationProperties()
+            _setattr("Properties", _convert_DestinationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Destination, DestinationProperties
+
+
+def _create_LogGroup():
+    class LogGroupProperties(_ResourceProperties):
+        __slots__ = ("LogGroupName", "RetentionInDays")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LogGroupProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, LogGroupName=None, RetentionInDays=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LogGroupName", LogGroupName)
+            _setattr("RetentionInDays", RetentionInDays)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LogGroupProperties = create_object_converter(LogGroupProperties)
+
+    class LogGroup(_Resource):
+        """A Log Group for Logs.
+
+        See Also:
+            `AWS Cloud Formation documentation for LogGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-loggroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Logs::LogGroup"
+
+        Properties: LogGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LogGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LogGroupProperties},
+            factories={"Properties": LogGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LogGroupProperties()
+            _setattr("Properties", _convert_LogGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return LogGroup, LogGroupProperties
+
+
+def _create_LogStream():
+    class LogStreamProperties(_ResourceProperties):
+        __slots__ = ("LogGroupName", "LogStreamName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LogStreamProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, LogGroupName=None, LogStreamName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LogGroupName", LogGroupName)
+            _setattr("LogStreamName", LogStreamName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LogStreamProperties = create_object_converter(LogStreamProperties)
+
+    class LogStream(_Resource):
+        """A Log Stream for Logs.
+
+        See Also:
+            `AWS Cloud Formation documentation for LogStream
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-logstream.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Logs::LogStream"
+
+        Properties: LogStreamProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LogStream",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LogStreamProperties},
+            factories={"Properties": LogStreamProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LogStreamProperties()
+            _setattr("Properties", _convert_LogStreamProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return LogStream, LogStreamProperties
+
+
+def _create_MetricFilter():
+    class MetricFilterMetricTransformation(_PropertyType):
+        """The Metric Transformation property type for MetricFilter in Logs.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricTransformation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-logs-metricfilter-metrictransformation.html>`_
+        """
+
+        __slots__ = ("DefaultValue", "MetricName", "MetricNamespace", "MetricValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MetricFilterMetricTransformation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultValue=None,
+            MetricName=None,
+            MetricNamespace=None,
+            MetricValue=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultValue", DefaultValue)
+            _setattr("MetricName", MetricName)
+            _setattr("MetricNamespace", MetricNamespace)
+            _setattr("MetricValue", MetricValue)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MetricFilterMetricTransformation_list = create_object_list_converter(
+        MetricFilterMetricTransformation
     )
 
-
-@attrs(**ATTRSCONFIG)
-class LogGroupProperties(ResourceProperties):
-    LogGroupName = attrib(default=None)
-    RetentionInDays = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class LogGroup(Resource):
-    """A Log Group for Logs.
-
-    See Also:
-        `AWS Cloud Formation documentation for LogGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-loggroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Logs::LogGroup"
-
-    Properties: LogGroupProperties = attrib(
-        factory=LogGroupProperties,
-        converter=create_object_converter(LogGroupProperties),
+    class MetricFilterProperties(_ResourceProperties):
+        __slots__ = ("FilterPattern", "LogGroupName", "MetricTransformations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MetricFilterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "MetricTransformations": _convert_MetricFilterMetricTransformation_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            FilterPattern=None,
+            LogGroupName=None,
+            MetricTransformations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FilterPattern", FilterPattern)
+            _setattr("LogGroupName", LogGroupName)
+            _setattr(
+                "MetricTransformations",
+                _convert_MetricFilterMetricTransformation_list(MetricTransformations),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MetricFilterProperties = create_object_converter(MetricFilterProperties)
+
+    class MetricFilter(_Resource):
+        """A Metric Filter for Logs.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-metricfilter.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Logs::MetricFilter"
+
+        Properties: MetricFilterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MetricFilter",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MetricFilterProperties},
+            factories={"Properties": MetricFilterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MetricFilterProperties()
+            _setattr("Properties", _convert_MetricFilterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return MetricFilter, MetricFilterProperties, MetricFilterMetricTransformation
+
+
+def _create_SubscriptionFilter():
+    class SubscriptionFilterProperties(_ResourceProperties):
+        __slots__ = ("DestinationArn", "FilterPattern", "LogGroupName", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionFilterProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DestinationArn=None,
+            FilterPattern=None,
+            LogGroupName=None,
+            RoleArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationArn", DestinationArn)
+            _setattr("FilterPattern", FilterPattern)
+            _setattr("LogGroupName", LogGroupName)
+            _setattr("RoleArn", RoleArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubscriptionFilterProperties = create_object_converter(
+        SubscriptionFilterProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class LogStreamProperties(ResourceProperties):
-    LogGroupName = attrib(default=None)
-    LogStreamName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class LogStream(Resource):
-    """A Log Stream for Logs.
-
-    See Also:
-        `AWS Cloud Formation documentation for LogStream
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-logstream.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Logs::LogStream"
-
-    Properties: LogStreamProperties = attrib(
-        factory=LogStreamProperties,
-        converter=create_object_converter(LogStreamProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class MetricFilterProperties(ResourceProperties):
-    FilterPattern = attrib(default=None)
-    LogGroupName = attrib(default=None)
-    MetricTransformations = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class MetricFilter(Resource):
-    """A Metric Filter for Logs.
-
-    See Also:
-        `AWS Cloud Formation documentation for MetricFilter
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-metricfilter.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Logs::MetricFilter"
-
-    Properties: MetricFilterProperties = attrib(
-        factory=MetricFilterProperties,
-        converter=create_object_converter(MetricFilterProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class SubscriptionFilterProperties(ResourceProperties):
-    DestinationArn = attrib(default=None)
-    FilterPattern = attrib(default=None)
-    LogGroupName = attrib(default=None)
-    RoleArn = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SubscriptionFilter(Resource):
-    """A Subscription Filter for Logs.
-
-    See Also:
-        `AWS Cloud Formation documentation for SubscriptionFilter
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-subscriptionfilter.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Logs::SubscriptionFilter"
-
-    Properties: SubscriptionFilterProperties = attrib(
-        factory=SubscriptionFilterProperties,
-        converter=create_object_converter(SubscriptionFilterProperties),
-    )
+    class SubscriptionFilter(_Resource):
+        """A Subscription Filter for Logs.
+
+        See Also:
+            `AWS Cloud Formation documentation for SubscriptionFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-logs-subscriptionfilter.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Logs::SubscriptionFilter"
+
+        Properties: SubscriptionFilterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionFilter",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubscriptionFilterProperties},
+            factories={"Properties": SubscriptionFilterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubscriptionFilterProperties()
+            _setattr("Properties", _convert_SubscriptionFilterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SubscriptionFilter, SubscriptionFilterProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Destination": _create_Destination,
+        "DestinationProperties": _create_Destination,
+        "LogGroup": _create_LogGroup,
+        "LogGroupProperties": _create_LogGroup,
+        "LogStream": _create_LogStream,
+        "LogStreamProperties": _create_LogStream,
+        "MetricFilter": _create_MetricFilter,
+        "MetricFilterProperties": _create_MetricFilter,
+        "MetricFilterMetricTransformation": _create_MetricFilter,
+        "SubscriptionFilter": _create_SubscriptionFilter,
+        "SubscriptionFilterProperties": _create_SubscriptionFilter,
+    },
+)
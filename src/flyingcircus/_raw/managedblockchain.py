@@ -7,59 +7,517 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
-__all__ = ["Member", "MemberProperties", "Node", "NodeProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Member",
+    "MemberProperties",
+    "MemberApprovalThresholdPolicy",
+    "MemberMemberConfiguration",
+    "MemberMemberFabricConfiguration",
+    "MemberMemberFrameworkConfiguration",
+    "MemberNetworkConfiguration",
+    "MemberNetworkFabricConfiguration",
+    "MemberNetworkFrameworkConfiguration",
+    "MemberVotingPolicy",
+    "Node",
+    "NodeProperties",
+    "NodeNodeConfiguration",
+]
 
-@attrs(**ATTRSCONFIG)
-class MemberProperties(ResourceProperties):
-    InvitationId = attrib(default=None)
-    MemberConfiguration = attrib(default=None)
-    NetworkConfiguration = attrib(default=None)
-    NetworkId = attrib(default=None)
 
+def _create_Member():
+    class MemberApprovalThresholdPolicy(_PropertyType):
+        """The Approval Threshold Policy property type for Member in ManagedBlockchain.
 
-@attrs(**ATTRSCONFIG)
-class Member(Resource):
-    """A Member for ManagedBlockchain.
+        See Also:
+            `AWS Cloud Formation documentation for ApprovalThresholdPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-managedblockchain-member-approvalthresholdpolicy.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Member
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-managedblockchain-member.html>`_
-    """
+        __slots__ = (
+            "ProposalDurationInHours",
+            "ThresholdComparator",
+            "ThresholdPercentage",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberApprovalThresholdPolicy", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::ManagedBlockchain::Member"
+        def __init__(
+            self,
+            *,
+            ProposalDurationInHours=None,
+            ThresholdComparator=None,
+            ThresholdPercentage=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ProposalDurationInHours", ProposalDurationInHours)
+            _setattr("ThresholdComparator", ThresholdComparator)
+            _setattr("ThresholdPercentage", ThresholdPercentage)
+            _init_PropertyType(self, kwargs)
 
-    Properties: MemberProperties = attrib(
-        factory=MemberProperties, converter=create_object_converter(MemberProperties)
+    class MemberMemberFabricConfiguration(_PropertyType):
+        """The Member Fabric Configuration property type for Member in ManagedBlockchain.
+
+        See Also:
+            `AWS Cloud Formation documentation for MemberFabricConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-managedblockchain-member-memberfabricconfiguration.html>`_
+        """
+
+        __slots__ = ("AdminPassword", "AdminUsername")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberMemberFabricConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AdminPassword=None, AdminUsername=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AdminPassword", AdminPassword)
+            _setattr("AdminUsername", AdminUsername)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MemberMemberFabricConfiguration = create_object_converter(
+        MemberMemberFabricConfiguration
+    )
+
+    class MemberMemberFrameworkConfiguration(_PropertyType):
+        """The Member Framework Configuration property type for Member in ManagedBlockchain.
+
+        See Also:
+            `AWS Cloud Formation documentation for MemberFrameworkConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-managedblockchain-member-memberframeworkconfiguration.html>`_
+        """
+
+        __slots__ = ("MemberFabricConfiguration",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberMemberFrameworkConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "MemberFabricConfiguration": _convert_MemberMemberFabricConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, MemberFabricConfiguration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "MemberFabricConfiguration",
+                _convert_MemberMemberFabricConfiguration(MemberFabricConfiguration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_MemberMemberFrameworkConfiguration = create_object_converter(
+        MemberMemberFrameworkConfiguration
+    )
+
+    class MemberMemberConfiguration(_PropertyType):
+        """The Member Configuration property type for Member in ManagedBlockchain.
+
+        See Also:
+            `AWS Cloud Formation documentation for MemberConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-managedblockchain-member-memberconfiguration.html>`_
+        """
+
+        __slots__ = ("Description", "MemberFrameworkConfiguration", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberMemberConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "MemberFrameworkConfiguration": _convert_MemberMemberFrameworkConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            MemberFrameworkConfiguration=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr(
+                "MemberFrameworkConfiguration",
+                _convert_MemberMemberFrameworkConfiguration(
+                    MemberFrameworkConfiguration
+                ),
+            )
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MemberApprovalThresholdPolicy = create_object_converter(
+        MemberApprovalThresholdPolicy
+    )
+
+    class MemberVotingPolicy(_PropertyType):
+        """The Voting Policy property type for Member in ManagedBlockchain.
+
+        See Also:
+            `AWS Cloud Formation documentation for VotingPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-managedblockchain-member-votingpolicy.html>`_
+        """
+
+        __slots__ = ("ApprovalThresholdPolicy",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberVotingPolicy",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ApprovalThresholdPolicy": _convert_MemberApprovalThresholdPolicy
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ApprovalThresholdPolicy=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ApprovalThresholdPolicy",
+                _convert_MemberApprovalThresholdPolicy(ApprovalThresholdPolicy),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class MemberNetworkFabricConfiguration(_PropertyType):
+        """The Network Fabric Configuration property type for Member in ManagedBlockchain.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkFabricConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-managedblockchain-member-networkfabricconfiguration.html>`_
+        """
+
+        __slots__ = ("Edition",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberNetworkFabricConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Edition=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Edition", Edition)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MemberNetworkFabricConfiguration = create_object_converter(
+        MemberNetworkFabricConfiguration
+    )
+
+    class MemberNetworkFrameworkConfiguration(_PropertyType):
+        """The Network Framework Configuration property type for Member in ManagedBlockchain.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkFrameworkConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-managedblockchain-member-networkframeworkconfiguration.html>`_
+        """
+
+        __slots__ = ("NetworkFabricConfiguration",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberNetworkFrameworkConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "NetworkFabricConfiguration": _convert_MemberNetworkFabricConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, NetworkFabricConfiguration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "NetworkFabricConfiguration",
+                _convert_MemberNetworkFabricConfiguration(NetworkFabricConfiguration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_MemberNetworkFrameworkConfiguration = create_object_converter(
+        MemberNetworkFrameworkConfiguration
     )
+    _convert_MemberVotingPolicy = create_object_converter(MemberVotingPolicy)
+
+    class MemberNetworkConfiguration(_PropertyType):
+        """The Network Configuration property type for Member in ManagedBlockchain.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-managedblockchain-member-networkconfiguration.html>`_
+        """
 
+        __slots__ = (
+            "Description",
+            "Framework",
+            "FrameworkVersion",
+            "Name",
+            "NetworkFrameworkConfiguration",
+            "VotingPolicy",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberNetworkConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "NetworkFrameworkConfiguration": _convert_MemberNetworkFrameworkConfiguration,
+                "VotingPolicy": _convert_MemberVotingPolicy,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Framework=None,
+            FrameworkVersion=None,
+            Name=None,
+            NetworkFrameworkConfiguration=None,
+            VotingPolicy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Framework", Framework)
+            _setattr("FrameworkVersion", FrameworkVersion)
+            _setattr("Name", Name)
+            _setattr(
+                "NetworkFrameworkConfiguration",
+                _convert_MemberNetworkFrameworkConfiguration(
+                    NetworkFrameworkConfiguration
+                ),
+            )
+            _setattr("VotingPolicy", _convert_MemberVotingPolicy(VotingPolicy))
+            _init_PropertyType(self, kwargs)
+
+    _convert_MemberMemberConfiguration = create_object_converter(
+        MemberMemberConfiguration
+    )
+    _convert_MemberNetworkConfiguration = create_object_converter(
+        MemberNetworkConfiguration
+    )
 
-@attrs(**ATTRSCONFIG)
-class NodeProperties(ResourceProperties):
-    MemberId = attrib(default=None)
-    NetworkId = attrib(default=None)
-    NodeConfiguration = attrib(default=None)
+    class MemberProperties(_ResourceProperties):
+        __slots__ = (
+            "InvitationId",
+            "MemberConfiguration",
+            "NetworkConfiguration",
+            "NetworkId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MemberProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "MemberConfiguration": _convert_MemberMemberConfiguration,
+                "NetworkConfiguration": _convert_MemberNetworkConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            InvitationId=None,
+            MemberConfiguration=None,
+            NetworkConfiguration=None,
+            NetworkId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InvitationId", InvitationId)
+            _setattr(
+                "MemberConfiguration",
+                _convert_MemberMemberConfiguration(MemberConfiguration),
+            )
+            _setattr(
+                "NetworkConfiguration",
+                _convert_MemberNetworkConfiguration(NetworkConfiguration),
+            )
+            _setattr("NetworkId", NetworkId)
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Node(Resource):
-    """A Node for ManagedBlockchain.
+    _convert_MemberProperties = create_object_converter(MemberProperties)
 
-    See Also:
-        `AWS Cloud Formation documentation for Node
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-managedblockchain-node.html>`_
-    """
+    class Member(_Resource):
+        """A Member for ManagedBlockchain.
 
-    RESOURCE_TYPE = "AWS::ManagedBlockchain::Node"
+        See Also:
+            `AWS Cloud Formation documentation for Member
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-managedblockchain-member.html>`_
+        """
 
-    Properties: NodeProperties = attrib(
-        factory=NodeProperties, converter=create_object_converter(NodeProperties)
+        RESOURCE_TYPE = "AWS::ManagedBlockchain::Member"
+
+        Properties: MemberProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Member",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MemberProperties},
+            factories={"Properties": MemberProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MemberProperties()
+            _setattr("Properties", _convert_MemberProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Member,
+        MemberProperties,
+        MemberApprovalThresholdPolicy,
+        MemberMemberFabricConfiguration,
+        MemberMemberFrameworkConfiguration,
+        MemberMemberConfiguration,
+        MemberVotingPolicy,
+        MemberNetworkFabricConfiguration,
+        MemberNetworkFrameworkConfiguration,
+        MemberNetworkConfiguration,
     )
+
+
+def _create_Node():
+    class NodeNodeConfiguration(_PropertyType):
+        """The Node Configuration property type for Node in ManagedBlockchain.
+
+        See Also:
+            `AWS Cloud Formation documentation for NodeConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-managedblockchain-node-nodeconfiguration.html>`_
+        """
+
+        __slots__ = ("AvailabilityZone", "InstanceType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NodeNodeConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AvailabilityZone=None, InstanceType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("InstanceType", InstanceType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_NodeNodeConfiguration = create_object_converter(NodeNodeConfiguration)
+
+    class NodeProperties(_ResourceProperties):
+        __slots__ = ("MemberId", "NetworkId", "NodeConfiguration")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NodeProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"NodeConfiguration": _convert_NodeNodeConfiguration},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, MemberId=None, NetworkId=None, NodeConfiguration=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MemberId", MemberId)
+            _setattr("NetworkId", NetworkId)
+            _setattr(
+                "NodeConfiguration", _convert_NodeNodeConfiguration(NodeConfiguration)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NodeProperties = create_object_converter(NodeProperties)
+
+    class Node(_Resource):
+        """A Node for ManagedBlockchain.
+
+        See Also:
+            `AWS Cloud Formation documentation for Node
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-managedblockchain-node.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ManagedBlockchain::Node"
+
+        Properties: NodeProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Node",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NodeProperties},
+            factories={"Properties": NodeProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NodeProperties()
+            _setattr("Properties", _convert_NodeProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Node, NodeProperties, NodeNodeConfiguration
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Member": _create_Member,
+        "MemberProperties": _create_Member,
+        "MemberApprovalThresholdPolicy": _create_Member,
+        "MemberMemberConfiguration": _create_Member,
+        "MemberMemberFabricConfiguration": _create_Member,
+        "MemberMemberFrameworkConfiguration": _create_Member,
+        "MemberNetworkConfiguration": _create_Member,
+        "MemberNetworkFabricConfiguration": _create_Member,
+        "MemberNetworkFrameworkConfiguration": _create_Member,
+        "MemberVotingPolicy": _create_Member,
+        "Node": _create_Node,
+        "NodeProperties": _create_Node,
+        "NodeNodeConfiguration": _create_Node,
+    },
+)
@@ -7,17 +7,24 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
 __all__ = [
     "JobTemplate",
     "JobTemplateProperties",
+    "JobTemplateAccelerationSettings",
     "Preset",
     "PresetProperties",
     "Queue",
@@ -25,81 +32,265 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class JobTemplateProperties(ResourceProperties):
-    AccelerationSettings = attrib(default=None)
-    Category = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    Priority = attrib(default=None)
-    Queue = attrib(default=None)
-    SettingsJson = attrib(default=None)
-    StatusUpdateInterval = attrib(default=None)
-    Tags = attrib(default=None)
-
+def _create_JobTemplate():
+    class JobTemplateAccelerationSettings(_PropertyType):
+        """The Acceleration Settings property type for JobTemplate in MediaConvert.
 
-@attrs(**ATTRSCONFIG)
-class JobTemplate(Resource):
-    """A Job Template for MediaConvert.
+        See Also:
+            `AWS Cloud Formation documentation for AccelerationSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-mediaconvert-jobtemplate-accelerationsettings.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for JobTemplate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-mediaconvert-jobtemplate.html>`_
-    """
+        __slots__ = ("Mode",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobTemplateAccelerationSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::MediaConvert::JobTemplate"
+        def __init__(self, *, Mode=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Mode", Mode)
+            _init_PropertyType(self, kwargs)
 
-    Properties: JobTemplateProperties = attrib(
-        factory=JobTemplateProperties,
-        converter=create_object_converter(JobTemplateProperties),
+    _convert_JobTemplateAccelerationSettings = create_object_converter(
+        JobTemplateAccelerationSettings
     )
 
+    class JobTemplateProperties(_ResourceProperties):
+        __slots__ = (
+            "AccelerationSettings",
+            "Category",
+            "Description",
+            "Name",
+            "Priority",
+            "Queue",
+            "SettingsJson",
+            "StatusUpdateInterval",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobTemplateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AccelerationSettings": _convert_JobTemplateAccelerationSettings
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class PresetProperties(ResourceProperties):
-    Category = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    SettingsJson = attrib(default=None)
-    Tags = attrib(default=None)
+        def __init__(
+            self,
+            *,
+            AccelerationSettings=None,
+            Category=None,
+            Description=None,
+            Name=None,
+            Priority=None,
+            Queue=None,
+            SettingsJson=None,
+            StatusUpdateInterval=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccelerationSettings",
+                _convert_JobTemplateAccelerationSettings(AccelerationSettings),
+            )
+            _setattr("Category", Category)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Priority", Priority)
+            _setattr("Queue", Queue)
+            _setattr("SettingsJson", SettingsJson)
+            _setattr("StatusUpdateInterval", StatusUpdateInterval)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
 
+    _convert_JobTemplateProperties = create_object_converter(JobTemplateProperties)
 
-@attrs(**ATTRSCONFIG)
-class Preset(Resource):
-    """A Preset for MediaConvert.
+    class JobTemplate(_Resource):
+        """A Job Template for MediaConvert.
 
-    See Also:
-        `AWS Cloud Formation documentation for Preset
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-mediaconvert-preset.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for JobTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-mediaconvert-jobtemplate.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::MediaConvert::Preset"
+        RESOURCE_TYPE = "AWS::MediaConvert::JobTemplate"
+        TAG_FORMAT = "Map"
 
-    Properties: PresetProperties = attrib(
-        factory=PresetProperties, converter=create_object_converter(PresetProperties)
-    )
+        Properties: JobTemplateProperties
 
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "JobTemplate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_JobTemplateProperties},
+            factories={"Properties": JobTemplateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class QueueProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    PricingPlan = attrib(default=None)
-    Status = attrib(default=None)
-    Tags = attrib(default=None)
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = JobTemplateProperties()
+            _setattr("Properties", _convert_JobTemplateProperties(Properties))
+            _init_Resource(self, kwargs)
 
+    return JobTemplate, JobTemplateProperties, JobTemplateAccelerationSettings
 
-@attrs(**ATTRSCONFIG)
-class Queue(Resource):
-    """A Queue for MediaConvert.
 
-    See Also:
-        `AWS Cloud Formation documentation for Queue
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-mediaconvert-queue.html>`_
-    """
+def _create_Preset():
+    class PresetProperties(_ResourceProperties):
+        __slots__ = ("Category", "Description", "Name", "SettingsJson", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PresetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::MediaConvert::Queue"
+        def __init__(
+            self,
+            *,
+            Category=None,
+            Description=None,
+            Name=None,
+            SettingsJson=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Category", Category)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("SettingsJson", SettingsJson)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: QueueProperties = attrib(
-        factory=QueueProperties, converter=create_object_converter(QueueProperties)
-    )
+    _convert_PresetProperties = create_object_converter(PresetProperties)
+
+    class Preset(_Resource):
+        """A Preset for MediaConvert.
+
+        See Also:
+            `AWS Cloud Formation documentation for Preset
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-mediaconvert-preset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::MediaConvert::Preset"
+        TAG_FORMAT = "Map"
+
+        Properties: PresetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Preset",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PresetProperties},
+            factories={"Properties": PresetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PresetProperties()
+            _setattr("Properties", _convert_PresetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Preset, PresetProperties
+
+
+def _create_Queue():
+    class QueueProperties(_ResourceProperties):
+        __slots__ = ("Description", "Name", "PricingPlan", "Status", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "QueueProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Name=None,
+            PricingPlan=None,
+            Status=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("PricingPlan", PricingPlan)
+            _setattr("Status", Status)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_QueueProperties = create_object_converter(QueueProperties)
+
+    class Queue(_Resource):
+        """A Queue for MediaConvert.
+
+        See Also:
+            `AWS Cloud Formation documentation for Queue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-mediaconvert-queue.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::MediaConvert::Queue"
+        TAG_FORMAT = "Map"
+
+        Properties: QueueProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Queue",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_QueueProperties},
+            factories={"Properties": QueueProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = QueueProperties()
+            _setattr("Properties", _convert_QueueProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Queue, QueueProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "JobTemplate": _create_JobTemplate,
+        "JobTemplateProperties": _create_JobTemplate,
+        "JobTemplateAccelerationSettings": _create_JobTemplate,
+        "Preset": _create_Preset,
+        "PresetProperties": _create_Preset,
+        "Queue": _create_Queue,
+        "QueueProperties": _create_Queue,
+    },
+)
@@ -7,100 +7,1340 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Channel",
     "ChannelProperties",
+    "ChannelAribSourceSettings",
+    "ChannelAudioLanguageSelection",
+    "ChannelAudioPidSelection",
+    "ChannelAudioSelector",
+    "ChannelAudioSelectorSettings",
+    "ChannelCaptionSelector",
+    "ChannelCaptionSelectorSettings",
+    "ChannelDvbSubSourceSettings",
+    "ChannelEmbeddedSourceSettings",
+    "ChannelHlsInputSettings",
+    "ChannelInputAttachment",
+    "ChannelInputSettings",
+    "ChannelInputSpecification",
+    "ChannelMediaPackageOutputDestinationSettings",
+    "ChannelNetworkInputSettings",
+    "ChannelOutputDestination",
+    "ChannelOutputDestinationSettings",
+    "ChannelScte20SourceSettings",
+    "ChannelScte27SourceSettings",
+    "ChannelTeletextSourceSettings",
+    "ChannelVideoSelector",
+    "ChannelVideoSelectorPid",
+    "ChannelVideoSelectorProgramId",
+    "ChannelVideoSelectorSettings",
     "Input",
     "InputProperties",
+    "InputInputDestinationRequest",
+    "InputInputSourceRequest",
+    "InputInputVpcRequest",
+    "InputMediaConnectFlowRequest",
     "InputSecurityGroup",
     "InputSecurityGroupProperties",
+    "InputSecurityGroupInputWhitelistRuleCidr",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ChannelProperties(ResourceProperties):
-    ChannelClass = attrib(default=None)
-    Destinations = attrib(default=None)
-    EncoderSettings = attrib(default=None)
-    InputAttachments = attrib(default=None)
-    InputSpecification = attrib(default=None)
-    LogLevel = attrib(default=None)
-    Name = attrib(default=None)
-    RoleArn = attrib(default=None)
-    Tags = attrib(default=None)
+def _create_Channel():
+    class ChannelAribSourceSettings(_PropertyType):
+        """The Arib Source Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for AribSourceSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-aribsourcesettings.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelAribSourceSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class ChannelAudioLanguageSelection(_PropertyType):
+        """The Audio Language Selection property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for AudioLanguageSelection
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-audiolanguageselection.html>`_
+        """
+
+        __slots__ = ("LanguageCode", "LanguageSelectionPolicy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelAudioLanguageSelection", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, LanguageCode=None, LanguageSelectionPolicy=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LanguageCode", LanguageCode)
+            _setattr("LanguageSelectionPolicy", LanguageSelectionPolicy)
+            _init_PropertyType(self, kwargs)
+
+    class ChannelAudioPidSelection(_PropertyType):
+        """The Audio Pid Selection property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for AudioPidSelection
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-audiopidselection.html>`_
+        """
+
+        __slots__ = ("Pid",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelAudioPidSelection", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, Pid=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Pid", Pid)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Channel(Resource):
-    """A Channel for MediaLive.
+    _convert_ChannelAudioLanguageSelection = create_object_converter(
+        ChannelAudioLanguageSelection
+    )
+    _convert_ChannelAudioPidSelection = create_object_converter(
+        ChannelAudioPidSelection
+    )
+
+    class ChannelAudioSelectorSettings(_PropertyType):
+        """The Audio Selector Settings property type for Channel in MediaLive.
 
-    See Also:
-        `AWS Cloud Formation documentation for Channel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-medialive-channel.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for AudioSelectorSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-audioselectorsettings.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::MediaLive::Channel"
+        __slots__ = ("AudioLanguageSelection", "AudioPidSelection")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelAudioSelectorSettings",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AudioLanguageSelection": _convert_ChannelAudioLanguageSelection,
+                "AudioPidSelection": _convert_ChannelAudioPidSelection,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: ChannelProperties = attrib(
-        factory=ChannelProperties, converter=create_object_converter(ChannelProperties)
+        def __init__(
+            self, *, AudioLanguageSelection=None, AudioPidSelection=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AudioLanguageSelection",
+                _convert_ChannelAudioLanguageSelection(AudioLanguageSelection),
+            )
+            _setattr(
+                "AudioPidSelection",
+                _convert_ChannelAudioPidSelection(AudioPidSelection),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelAudioSelectorSettings = create_object_converter(
+        ChannelAudioSelectorSettings
     )
 
+    class ChannelAudioSelector(_PropertyType):
+        """The Audio Selector property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for AudioSelector
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-audioselector.html>`_
+        """
+
+        __slots__ = ("Name", "SelectorSettings")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelAudioSelector",
+            _PropertyType,
+            __slots__,
+            converters={"SelectorSettings": _convert_ChannelAudioSelectorSettings},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, SelectorSettings=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr(
+                "SelectorSettings",
+                _convert_ChannelAudioSelectorSettings(SelectorSettings),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ChannelDvbSubSourceSettings(_PropertyType):
+        """The Dvb Sub Source Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for DvbSubSourceSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-dvbsubsourcesettings.html>`_
+        """
+
+        __slots__ = ("Pid",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelDvbSubSourceSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Pid=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Pid", Pid)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class InputProperties(ResourceProperties):
-    Destinations = attrib(default=None)
-    InputSecurityGroups = attrib(default=None)
-    MediaConnectFlows = attrib(default=None)
-    Name = attrib(default=None)
-    RoleArn = attrib(default=None)
-    Sources = attrib(default=None)
-    Tags = attrib(default=None)
-    Type = attrib(default=None)
-    Vpc = attrib(default=None)
+    class ChannelScte27SourceSettings(_PropertyType):
+        """The Scte27 Source Settings property type for Channel in MediaLive.
 
+        See Also:
+            `AWS Cloud Formation documentation for Scte27SourceSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-scte27sourcesettings.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class Input(Resource):
-    """A Input for MediaLive.
+        __slots__ = ("Pid",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelScte27SourceSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for Input
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-medialive-input.html>`_
-    """
+        def __init__(self, *, Pid=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Pid", Pid)
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::MediaLive::Input"
+    class ChannelEmbeddedSourceSettings(_PropertyType):
+        """The Embedded Source Settings property type for Channel in MediaLive.
 
-    Properties: InputProperties = attrib(
-        factory=InputProperties, converter=create_object_converter(InputProperties)
+        See Also:
+            `AWS Cloud Formation documentation for EmbeddedSourceSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-embeddedsourcesettings.html>`_
+        """
+
+        __slots__ = (
+            "Convert608To708",
+            "Scte20Detection",
+            "Source608ChannelNumber",
+            "Source608TrackNumber",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelEmbeddedSourceSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Convert608To708=None,
+            Scte20Detection=None,
+            Source608ChannelNumber=None,
+            Source608TrackNumber=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Convert608To708", Convert608To708)
+            _setattr("Scte20Detection", Scte20Detection)
+            _setattr("Source608ChannelNumber", Source608ChannelNumber)
+            _setattr("Source608TrackNumber", Source608TrackNumber)
+            _init_PropertyType(self, kwargs)
+
+    class ChannelScte20SourceSettings(_PropertyType):
+        """The Scte20 Source Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for Scte20SourceSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-scte20sourcesettings.html>`_
+        """
+
+        __slots__ = ("Convert608To708", "Source608ChannelNumber")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelScte20SourceSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Convert608To708=None, Source608ChannelNumber=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Convert608To708", Convert608To708)
+            _setattr("Source608ChannelNumber", Source608ChannelNumber)
+            _init_PropertyType(self, kwargs)
+
+    class ChannelTeletextSourceSettings(_PropertyType):
+        """The Teletext Source Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for TeletextSourceSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-teletextsourcesettings.html>`_
+        """
+
+        __slots__ = ("PageNumber",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelTeletextSourceSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PageNumber=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PageNumber", PageNumber)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelAribSourceSettings = create_object_converter(
+        ChannelAribSourceSettings
+    )
+    _convert_ChannelDvbSubSourceSettings = create_object_converter(
+        ChannelDvbSubSourceSettings
+    )
+    _convert_ChannelEmbeddedSourceSettings = create_object_converter(
+        ChannelEmbeddedSourceSettings
+    )
+    _convert_ChannelScte20SourceSettings = create_object_converter(
+        ChannelScte20SourceSettings
+    )
+    _convert_ChannelScte27SourceSettings = create_object_converter(
+        ChannelScte27SourceSettings
+    )
+    _convert_ChannelTeletextSourceSettings = create_object_converter(
+        ChannelTeletextSourceSettings
     )
 
+    class ChannelCaptionSelectorSettings(_PropertyType):
+        """The Caption Selector Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for CaptionSelectorSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-captionselectorsettings.html>`_
+        """
+
+        __slots__ = (
+            "AribSourceSettings",
+            "DvbSubSourceSettings",
+            "EmbeddedSourceSettings",
+            "Scte20SourceSettings",
+            "Scte27SourceSettings",
+            "TeletextSourceSettings",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelCaptionSelectorSettings",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AribSourceSettings": _convert_ChannelAribSourceSettings,
+                "DvbSubSourceSettings": _convert_ChannelDvbSubSourceSettings,
+                "EmbeddedSourceSettings": _convert_ChannelEmbeddedSourceSettings,
+                "Scte20SourceSettings": _convert_ChannelScte20SourceSettings,
+                "Scte27SourceSettings": _convert_ChannelScte27SourceSettings,
+                "TeletextSourceSettings": _convert_ChannelTeletextSourceSettings,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AribSourceSettings=None,
+            DvbSubSourceSettings=None,
+            EmbeddedSourceSettings=None,
+            Scte20SourceSettings=None,
+            Scte27SourceSettings=None,
+            TeletextSourceSettings=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AribSourceSettings",
+                _convert_ChannelAribSourceSettings(AribSourceSettings),
+            )
+            _setattr(
+                "DvbSubSourceSettings",
+                _convert_ChannelDvbSubSourceSettings(DvbSubSourceSettings),
+            )
+            _setattr(
+                "EmbeddedSourceSettings",
+                _convert_ChannelEmbeddedSourceSettings(EmbeddedSourceSettings),
+            )
+            _setattr(
+                "Scte20SourceSettings",
+                _convert_ChannelScte20SourceSettings(Scte20SourceSettings),
+            )
+            _setattr(
+                "Scte27SourceSettings",
+                _convert_ChannelScte27SourceSettings(Scte27SourceSettings),
+            )
+            _setattr(
+                "TeletextSourceSettings",
+                _convert_ChannelTeletextSourceSettings(TeletextSourceSettings),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelCaptionSelectorSettings = create_object_converter(
+        ChannelCaptionSelectorSettings
+    )
 
-@attrs(**ATTRSCONFIG)
-class InputSecurityGroupProperties(ResourceProperties):
-    Tags = attrib(default=None)
-    WhitelistRules = attrib(default=None)
+    class ChannelCaptionSelector(_PropertyType):
+        """The Caption Selector property type for Channel in MediaLive.
 
+        See Also:
+            `AWS Cloud Formation documentation for CaptionSelector
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-captionselector.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class InputSecurityGroup(Resource):
-    """A Input Security Group for MediaLive.
+        __slots__ = ("LanguageCode", "Name", "SelectorSettings")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelCaptionSelector",
+            _PropertyType,
+            __slots__,
+            converters={"SelectorSettings": _convert_ChannelCaptionSelectorSettings},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for InputSecurityGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-medialive-inputsecuritygroup.html>`_
-    """
+        def __init__(
+            self, *, LanguageCode=None, Name=None, SelectorSettings=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LanguageCode", LanguageCode)
+            _setattr("Name", Name)
+            _setattr(
+                "SelectorSettings",
+                _convert_ChannelCaptionSelectorSettings(SelectorSettings),
+            )
+            _init_PropertyType(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::MediaLive::InputSecurityGroup"
+    class ChannelHlsInputSettings(_PropertyType):
+        """The Hls Input Settings property type for Channel in MediaLive.
 
-    Properties: InputSecurityGroupProperties = attrib(
-        factory=InputSecurityGroupProperties,
-        converter=create_object_converter(InputSecurityGroupProperties),
+        See Also:
+            `AWS Cloud Formation documentation for HlsInputSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-hlsinputsettings.html>`_
+        """
+
+        __slots__ = ("Bandwidth", "BufferSegments", "Retries", "RetryInterval")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelHlsInputSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Bandwidth=None,
+            BufferSegments=None,
+            Retries=None,
+            RetryInterval=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bandwidth", Bandwidth)
+            _setattr("BufferSegments", BufferSegments)
+            _setattr("Retries", Retries)
+            _setattr("RetryInterval", RetryInterval)
+            _init_PropertyType(self, kwargs)
+
+    class ChannelVideoSelectorProgramId(_PropertyType):
+        """The Video Selector Program property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for VideoSelectorProgramId
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-videoselectorprogramid.html>`_
+        """
+
+        __slots__ = ("ProgramId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelVideoSelectorProgramId", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ProgramId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ProgramId", ProgramId)
+            _init_PropertyType(self, kwargs)
+
+    class ChannelVideoSelectorPid(_PropertyType):
+        """The Video Selector Pid property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for VideoSelectorPid
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-videoselectorpid.html>`_
+        """
+
+        __slots__ = ("Pid",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelVideoSelectorPid", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Pid=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Pid", Pid)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelVideoSelectorPid = create_object_converter(ChannelVideoSelectorPid)
+    _convert_ChannelVideoSelectorProgramId = create_object_converter(
+        ChannelVideoSelectorProgramId
+    )
+
+    class ChannelVideoSelectorSettings(_PropertyType):
+        """The Video Selector Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for VideoSelectorSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-videoselectorsettings.html>`_
+        """
+
+        __slots__ = ("VideoSelectorPid", "VideoSelectorProgramId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelVideoSelectorSettings",
+            _PropertyType,
+            __slots__,
+            converters={
+                "VideoSelectorPid": _convert_ChannelVideoSelectorPid,
+                "VideoSelectorProgramId": _convert_ChannelVideoSelectorProgramId,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, VideoSelectorPid=None, VideoSelectorProgramId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "VideoSelectorPid", _convert_ChannelVideoSelectorPid(VideoSelectorPid)
+            )
+            _setattr(
+                "VideoSelectorProgramId",
+                _convert_ChannelVideoSelectorProgramId(VideoSelectorProgramId),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelVideoSelectorSettings = create_object_converter(
+        ChannelVideoSelectorSettings
+    )
+
+    class ChannelVideoSelector(_PropertyType):
+        """The Video Selector property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for VideoSelector
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-videoselector.html>`_
+        """
+
+        __slots__ = ("ColorSpace", "ColorSpaceUsage", "SelectorSettings")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelVideoSelector",
+            _PropertyType,
+            __slots__,
+            converters={"SelectorSettings": _convert_ChannelVideoSelectorSettings},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ColorSpace=None,
+            ColorSpaceUsage=None,
+            SelectorSettings=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ColorSpace", ColorSpace)
+            _setattr("ColorSpaceUsage", ColorSpaceUsage)
+            _setattr(
+                "SelectorSettings",
+                _convert_ChannelVideoSelectorSettings(SelectorSettings),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelHlsInputSettings = create_object_converter(ChannelHlsInputSettings)
+
+    class ChannelNetworkInputSettings(_PropertyType):
+        """The Network Input Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for NetworkInputSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-networkinputsettings.html>`_
+        """
+
+        __slots__ = ("HlsInputSettings", "ServerValidation")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelNetworkInputSettings",
+            _PropertyType,
+            __slots__,
+            converters={"HlsInputSettings": _convert_ChannelHlsInputSettings},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, HlsInputSettings=None, ServerValidation=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "HlsInputSettings", _convert_ChannelHlsInputSettings(HlsInputSettings)
+            )
+            _setattr("ServerValidation", ServerValidation)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelAudioSelector_list = create_object_list_converter(
+        ChannelAudioSelector
+    )
+    _convert_ChannelCaptionSelector_list = create_object_list_converter(
+        ChannelCaptionSelector
+    )
+    _convert_ChannelNetworkInputSettings = create_object_converter(
+        ChannelNetworkInputSettings
     )
+    _convert_ChannelVideoSelector = create_object_converter(ChannelVideoSelector)
+
+    class ChannelInputSettings(_PropertyType):
+        """The Input Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-inputsettings.html>`_
+        """
+
+        __slots__ = (
+            "AudioSelectors",
+            "CaptionSelectors",
+            "DeblockFilter",
+            "DenoiseFilter",
+            "FilterStrength",
+            "InputFilter",
+            "NetworkInputSettings",
+            "SourceEndBehavior",
+            "VideoSelector",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelInputSettings",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AudioSelectors": _convert_ChannelAudioSelector_list,
+                "CaptionSelectors": _convert_ChannelCaptionSelector_list,
+                "NetworkInputSettings": _convert_ChannelNetworkInputSettings,
+                "VideoSelector": _convert_ChannelVideoSelector,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AudioSelectors=None,
+            CaptionSelectors=None,
+            DeblockFilter=None,
+            DenoiseFilter=None,
+            FilterStrength=None,
+            InputFilter=None,
+            NetworkInputSettings=None,
+            SourceEndBehavior=None,
+            VideoSelector=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AudioSelectors", _convert_ChannelAudioSelector_list(AudioSelectors)
+            )
+            _setattr(
+                "CaptionSelectors",
+                _convert_ChannelCaptionSelector_list(CaptionSelectors),
+            )
+            _setattr("DeblockFilter", DeblockFilter)
+            _setattr("DenoiseFilter", DenoiseFilter)
+            _setattr("FilterStrength", FilterStrength)
+            _setattr("InputFilter", InputFilter)
+            _setattr(
+                "NetworkInputSettings",
+                _convert_ChannelNetworkInputSettings(NetworkInputSettings),
+            )
+            _setattr("SourceEndBehavior", SourceEndBehavior)
+            _setattr("VideoSelector", _convert_ChannelVideoSelector(VideoSelector))
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelInputSettings = create_object_converter(ChannelInputSettings)
+
+    class ChannelInputAttachment(_PropertyType):
+        """The Input Attachment property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-inputattachment.html>`_
+        """
+
+        __slots__ = ("InputAttachmentName", "InputId", "InputSettings")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelInputAttachment",
+            _PropertyType,
+            __slots__,
+            converters={"InputSettings": _convert_ChannelInputSettings},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            InputAttachmentName=None,
+            InputId=None,
+            InputSettings=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InputAttachmentName", InputAttachmentName)
+            _setattr("InputId", InputId)
+            _setattr("InputSettings", _convert_ChannelInputSettings(InputSettings))
+            _init_PropertyType(self, kwargs)
+
+    class ChannelInputSpecification(_PropertyType):
+        """The Input Specification property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputSpecification
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-inputspecification.html>`_
+        """
+
+        __slots__ = ("Codec", "MaximumBitrate", "Resolution")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelInputSpecification", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Codec=None, MaximumBitrate=None, Resolution=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Codec", Codec)
+            _setattr("MaximumBitrate", MaximumBitrate)
+            _setattr("Resolution", Resolution)
+            _init_PropertyType(self, kwargs)
+
+    class ChannelMediaPackageOutputDestinationSettings(_PropertyType):
+        """The Media Package Output Destination Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for MediaPackageOutputDestinationSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-mediapackageoutputdestinationsettings.html>`_
+        """
+
+        __slots__ = ("ChannelId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelMediaPackageOutputDestinationSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ChannelId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ChannelId", ChannelId)
+            _init_PropertyType(self, kwargs)
+
+    class ChannelOutputDestinationSettings(_PropertyType):
+        """The Output Destination Settings property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for OutputDestinationSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-outputdestinationsettings.html>`_
+        """
+
+        __slots__ = ("PasswordParam", "StreamName", "Url", "Username")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelOutputDestinationSettings", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            PasswordParam=None,
+            StreamName=None,
+            Url=None,
+            Username=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PasswordParam", PasswordParam)
+            _setattr("StreamName", StreamName)
+            _setattr("Url", Url)
+            _setattr("Username", Username)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelMediaPackageOutputDestinationSettings_list = (
+        create_object_list_converter(ChannelMediaPackageOutputDestinationSettings)
+    )
+    _convert_ChannelOutputDestinationSettings_list = create_object_list_converter(
+        ChannelOutputDestinationSettings
+    )
+
+    class ChannelOutputDestination(_PropertyType):
+        """The Output Destination property type for Channel in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for OutputDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-channel-outputdestination.html>`_
+        """
+
+        __slots__ = ("Id", "MediaPackageSettings", "Settings")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelOutputDestination",
+            _PropertyType,
+            __slots__,
+            converters={
+                "MediaPackageSettings": _convert_ChannelMediaPackageOutputDestinationSettings_list,
+                "Settings": _convert_ChannelOutputDestinationSettings_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Id=None, MediaPackageSettings=None, Settings=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr(
+                "MediaPackageSettings",
+                _convert_ChannelMediaPackageOutputDestinationSettings_list(
+                    MediaPackageSettings
+                ),
+            )
+            _setattr(
+                "Settings", _convert_ChannelOutputDestinationSettings_list(Settings)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ChannelOutputDestination_list = create_object_list_converter(
+        ChannelOutputDestination
+    )
+    _convert_ChannelInputAttachment_list = create_object_list_converter(
+        ChannelInputAttachment
+    )
+    _convert_ChannelInputSpecification = create_object_converter(
+        ChannelInputSpecification
+    )
+
+    class ChannelProperties(_ResourceProperties):
+        __slots__ = (
+            "ChannelClass",
+            "Destinations",
+            "EncoderSettings",
+            "InputAttachments",
+            "InputSpecification",
+            "LogLevel",
+            "Name",
+            "RoleArn",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ChannelProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Destinations": _convert_ChannelOutputDestination_list,
+                "InputAttachments": _convert_ChannelInputAttachment_list,
+                "InputSpecification": _convert_ChannelInputSpecification,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ChannelClass=None,
+            Destinations=None,
+            EncoderSettings=None,
+            InputAttachments=None,
+            InputSpecification=None,
+            LogLevel=None,
+            Name=None,
+            RoleArn=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ChannelClass", ChannelClass)
+            _setattr(
+                "Destinations", _convert_ChannelOutputDestination_list(Destinations)
+            )
+            _setattr("EncoderSettings", EncoderSettings)
+            _setattr(
+                "InputAttachments",
+                _convert_ChannelInputAttachment_list(InputAttachments),
+            )
+            _setattr(
+                "InputSpecification",
+                _convert_ChannelInputSpecification(InputSpecification),
+            )
+            _setattr("LogLevel", LogLevel)
+            _setattr("Name", Name)
+            _setattr("RoleArn", RoleArn)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ChannelProperties = create_object_converter(ChannelProperties)
+
+    class Channel(_Resource):
+        """A Channel for MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for Channel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-medialive-channel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::MediaLive::Channel"
+        TAG_FORMAT = "Map"
+
+        Properties: ChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Channel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ChannelProperties},
+            factories={"Properties": ChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ChannelProperties()
+            _setattr("Properties", _convert_ChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Channel,
+        ChannelProperties,
+        ChannelAribSourceSettings,
+        ChannelAudioLanguageSelection,
+        ChannelAudioPidSelection,
+        ChannelAudioSelectorSettings,
+        ChannelAudioSelector,
+        ChannelDvbSubSourceSettings,
+        ChannelScte27SourceSettings,
+        ChannelEmbeddedSourceSettings,
+        ChannelScte20SourceSettings,
+        ChannelTeletextSourceSettings,
+        ChannelCaptionSelectorSettings,
+        ChannelCaptionSelector,
+        ChannelHlsInputSettings,
+        ChannelVideoSelectorProgramId,
+        ChannelVideoSelectorPid,
+        ChannelVideoSelectorSettings,
+        ChannelVideoSelector,
+        ChannelNetworkInputSettings,
+        ChannelInputSettings,
+        ChannelInputAttachment,
+        ChannelInputSpecification,
+        ChannelMediaPackageOutputDestinationSettings,
+        ChannelOutputDestinationSettings,
+        ChannelOutputDestination,
+    )
+
+
+def _create_Input():
+    class InputInputDestinationRequest(_PropertyType):
+        """The Input Destination Request property type for Input in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputDestinationRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-input-inputdestinationrequest.html>`_
+        """
+
+        __slots__ = ("StreamName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputInputDestinationRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, StreamName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("StreamName", StreamName)
+            _init_PropertyType(self, kwargs)
+
+    class InputInputSourceRequest(_PropertyType):
+        """The Input Source Request property type for Input in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputSourceRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-input-inputsourcerequest.html>`_
+        """
+
+        __slots__ = ("PasswordParam", "Url", "Username")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputInputSourceRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, PasswordParam=None, Url=None, Username=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PasswordParam", PasswordParam)
+            _setattr("Url", Url)
+            _setattr("Username", Username)
+            _init_PropertyType(self, kwargs)
+
+    class InputInputVpcRequest(_PropertyType):
+        """The Input Vpc Request property type for Input in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputVpcRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-input-inputvpcrequest.html>`_
+        """
+
+        __slots__ = ("SecurityGroupIds", "SubnetIds")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputInputVpcRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SecurityGroupIds=None, SubnetIds=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SubnetIds", SubnetIds)
+            _init_PropertyType(self, kwargs)
+
+    class InputMediaConnectFlowRequest(_PropertyType):
+        """The Media Connect Flow Request property type for Input in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for MediaConnectFlowRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-input-mediaconnectflowrequest.html>`_
+        """
+
+        __slots__ = ("FlowArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputMediaConnectFlowRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FlowArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FlowArn", FlowArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InputInputDestinationRequest_list = create_object_list_converter(
+        InputInputDestinationRequest
+    )
+    _convert_InputMediaConnectFlowRequest_list = create_object_list_converter(
+        InputMediaConnectFlowRequest
+    )
+    _convert_InputInputSourceRequest_list = create_object_list_converter(
+        InputInputSourceRequest
+    )
+    _convert_InputInputVpcRequest = create_object_converter(InputInputVpcRequest)
+
+    class InputProperties(_ResourceProperties):
+        __slots__ = (
+            "Destinations",
+            "InputSecurityGroups",
+            "MediaConnectFlows",
+            "Name",
+            "RoleArn",
+            "Sources",
+            "Tags",
+            "Type",
+            "Vpc",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Destinations": _convert_InputInputDestinationRequest_list,
+                "MediaConnectFlows": _convert_InputMediaConnectFlowRequest_list,
+                "Sources": _convert_InputInputSourceRequest_list,
+                "Vpc": _convert_InputInputVpcRequest,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Destinations=None,
+            InputSecurityGroups=None,
+            MediaConnectFlows=None,
+            Name=None,
+            RoleArn=None,
+            Sources=None,
+            Tags=None,
+            Type=None,
+            Vpc=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Destinations", _convert_InputInputDestinationRequest_list(Destinations)
+            )
+            _setattr("InputSecurityGroups", InputSecurityGroups)
+            _setattr(
+                "MediaConnectFlows",
+                _convert_InputMediaConnectFlowRequest_list(MediaConnectFlows),
+            )
+            _setattr("Name", Name)
+            _setattr("RoleArn", RoleArn)
+            _setattr("Sources", _convert_InputInputSourceRequest_list(Sources))
+            _setattr("Tags", Tags)
+            _setattr("Type", Type)
+            _setattr("Vpc", _convert_InputInputVpcRequest(Vpc))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InputProperties = create_object_converter(InputProperties)
+
+    class Input(_Resource):
+        """A Input for MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for Input
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-medialive-input.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::MediaLive::Input"
+        TAG_FORMAT = "Map"
+
+        Properties: InputProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Input",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InputProperties},
+            factories={"Properties": InputProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InputProperties()
+            _setattr("Properties", _convert_InputProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Input,
+        InputProperties,
+        InputInputDestinationRequest,
+        InputInputSourceRequest,
+        InputInputVpcRequest,
+        InputMediaConnectFlowRequest,
+    )
+
+
+def _create_InputSecurityGroup():
+    class InputSecurityGroupInputWhitelistRuleCidr(_PropertyType):
+        """The Input Whitelist Rule Cidr property type for InputSecurityGroup in MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputWhitelistRuleCidr
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-medialive-inputsecuritygroup-inputwhitelistrulecidr.html>`_
+        """
+
+        __slots__ = ("Cidr",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputSecurityGroupInputWhitelistRuleCidr", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Cidr=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Cidr", Cidr)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InputSecurityGroupInputWhitelistRuleCidr_list = (
+        create_object_list_converter(InputSecurityGroupInputWhitelistRuleCidr)
+    )
+
+    class InputSecurityGroupProperties(_ResourceProperties):
+        __slots__ = ("Tags", "WhitelistRules")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputSecurityGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "WhitelistRules": _convert_InputSecurityGroupInputWhitelistRuleCidr_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Tags=None, WhitelistRules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Tags", Tags)
+            _setattr(
+                "WhitelistRules",
+                _convert_InputSecurityGroupInputWhitelistRuleCidr_list(WhitelistRules),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InputSecurityGroupProperties = create_object_converter(
+        InputSecurityGroupProperties
+    )
+
+    class InputSecurityGroup(_Resource):
+        """A Input Security Group for MediaLive.
+
+        See Also:
+            `AWS Cloud Formation documentation for InputSecurityGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-medialive-inputsecuritygroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::MediaLive::InputSecurityGroup"
+        TAG_FORMAT = "Map"
+
+        Properties: InputSecurityGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InputSecurityGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InputSecurityGroupProperties},
+            factories={"Properties": InputSecurityGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InputSecurityGroupProperties()
+            _setattr("Properties", _convert_InputSecurityGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        InputSecurityGroup,
+        InputSecurityGroupProperties,
+        InputSecurityGroupInputWhitelistRuleCidr,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Channel": _create_Channel,
+        "ChannelProperties": _create_Channel,
+        "ChannelAribSourceSettings": _create_Channel,
+        "ChannelAudioLanguageSelection": _create_Channel,
+        "ChannelAudioPidSelection": _create_Channel,
+        "ChannelAudioSelector": _create_Channel,
+        "ChannelAudioSelectorSettings": _create_Channel,
+        "ChannelCaptionSelector": _create_Channel,
+        "ChannelCaptionSelectorSettings": _create_Channel,
+        "ChannelDvbSubSourceSettings": _create_Channel,
+        "ChannelEmbeddedSourceSettings": _create_Channel,
+        "ChannelHlsInputSettings": _create_Channel,
+        "ChannelInputAttachment": _create_Channel,
+        "ChannelInputSettings": _create_Channel,
+        "ChannelInputSpecification": _create_Channel,
+        "ChannelMediaPackageOutputDestinationSettings": _create_Channel,
+        "ChannelNetworkInputSettings": _create_Channel,
+        "ChannelOutputDestination": _create_Channel,
+        "ChannelOutputDestinationSettings": _create_Channel,
+        "ChannelScte20SourceSettings": _create_Channel,
+        "ChannelScte27SourceSettings": _create_Channel,
+        "ChannelTeletextSourceSettings": _create_Channel,
+        "ChannelVideoSelector": _create_Channel,
+        "ChannelVideoSelectorPid": _create_Channel,
+        "ChannelVideoSelectorProgramId": _create_Channel,
+        "ChannelVideoSelectorSettings": _create_Channel,
+        "Input": _create_Input,
+        "InputProperties": _create_Input,
+        "InputInputDestinationRequest": _create_Input,
+        "InputInputSourceRequest": _create_Input,
+        "InputInputVpcRequest": _create_Input,
+        "InputMediaConnectFlowRequest": _create_Input,
+        "InputSecurityGroup": _create_InputSecurityGroup,
+        "InputSecurityGroupProperties": _create_InputSecurityGroup,
+        "InputSecurityGroupInputWhitelistRuleCidr": _create_InputSecurityGroup,
+    },
+)
@@ -7,38 +7,150 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Container", "ContainerProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Container",
+    "ContainerProperties",
+    "ContainerCorsRule",
+]
 
-@attrs(**ATTRSCONFIG)
-class ContainerProperties(ResourceProperties):
-    AccessLoggingEnabled = attrib(default=None)
-    ContainerName = attrib(default=None)
-    CorsPolicy = attrib(default=None)
-    LifecyclePolicy = attrib(default=None)
-    Policy = attrib(default=None)
 
+def _create_Container():
+    class ContainerCorsRule(_PropertyType):
+        """The Cors Rule property type for Container in MediaStore.
 
-@attrs(**ATTRSCONFIG)
-class Container(Resource):
-    """A Container for MediaStore.
+        See Also:
+            `AWS Cloud Formation documentation for CorsRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-mediastore-container-corsrule.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Container
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-mediastore-container.html>`_
-    """
+        __slots__ = (
+            "AllowedHeaders",
+            "AllowedMethods",
+            "AllowedOrigins",
+            "ExposeHeaders",
+            "MaxAgeSeconds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ContainerCorsRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::MediaStore::Container"
+        def __init__(
+            self,
+            *,
+            AllowedHeaders=None,
+            AllowedMethods=None,
+            AllowedOrigins=None,
+            ExposeHeaders=None,
+            MaxAgeSeconds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowedHeaders", AllowedHeaders)
+            _setattr("AllowedMethods", AllowedMethods)
+            _setattr("AllowedOrigins", AllowedOrigins)
+            _setattr("ExposeHeaders", ExposeHeaders)
+            _setattr("MaxAgeSeconds", MaxAgeSeconds)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ContainerProperties = attrib(
-        factory=ContainerProperties,
-        converter=create_object_converter(ContainerProperties),
-    )
+    _convert_ContainerCorsRule_list = create_object_list_converter(ContainerCorsRule)
+
+    class ContainerProperties(_ResourceProperties):
+        __slots__ = (
+            "AccessLoggingEnabled",
+            "ContainerName",
+            "CorsPolicy",
+            "LifecyclePolicy",
+            "Policy",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ContainerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"CorsPolicy": _convert_ContainerCorsRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AccessLoggingEnabled=None,
+            ContainerName=None,
+            CorsPolicy=None,
+            LifecyclePolicy=None,
+            Policy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccessLoggingEnabled", AccessLoggingEnabled)
+            _setattr("ContainerName", ContainerName)
+            _setattr("CorsPolicy", _convert_ContainerCorsRule_list(CorsPolicy))
+            _setattr("LifecyclePolicy", LifecyclePolicy)
+            _setattr("Policy", Policy)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ContainerProperties = create_object_converter(ContainerProperties)
+
+    class Container(_Resource):
+        """A Container for MediaStore.
+
+        See Also:
+            `AWS Cloud Formation documentation for Container
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-mediastore-container.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::MediaStore::Container"
+
+        Properties: ContainerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Container",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ContainerProperties},
+            factories={"Properties": ContainerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ContainerProperties()
+            _setattr("Properties", _convert_ContainerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Container, ContainerProperties, ContainerCorsRule
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Container": _create_Container,
+        "ContainerProperties": _create_Container,
+        "ContainerCorsRule": _create_Container,
+    },
+)
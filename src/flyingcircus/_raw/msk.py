@@ -7,42 +7,533 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
-__all__ = ["Cluster", "ClusterProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Cluster",
+    "ClusterProperties",
+    "ClusterBrokerNodeGroupInfo",
+    "ClusterClientAuthentication",
+    "ClusterConfigurationInfo",
+    "ClusterEBSStorageInfo",
+    "ClusterEncryptionAtRest",
+    "ClusterEncryptionInfo",
+    "ClusterEncryptionInTransit",
+    "ClusterJmxExporter",
+    "ClusterNodeExporter",
+    "ClusterOpenMonitoring",
+    "ClusterPrometheus",
+    "ClusterStorageInfo",
+    "ClusterTls",
+]
 
-@attrs(**ATTRSCONFIG)
-class ClusterProperties(ResourceProperties):
-    BrokerNodeGroupInfo = attrib(default=None)
-    ClientAuthentication = attrib(default=None)
-    ClusterName = attrib(default=None)
-    ConfigurationInfo = attrib(default=None)
-    EncryptionInfo = attrib(default=None)
-    EnhancedMonitoring = attrib(default=None)
-    KafkaVersion = attrib(default=None)
-    NumberOfBrokerNodes = attrib(default=None)
-    OpenMonitoring = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_Cluster():
+    class ClusterEBSStorageInfo(_PropertyType):
+        """The Ebs Storage Info property type for Cluster in MSK.
 
-@attrs(**ATTRSCONFIG)
-class Cluster(Resource):
-    """A Cluster for MSK.
+        See Also:
+            `AWS Cloud Formation documentation for EBSStorageInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-ebsstorageinfo.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Cluster
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-msk-cluster.html>`_
-    """
+        __slots__ = ("VolumeSize",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterEBSStorageInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::MSK::Cluster"
+        def __init__(self, *, VolumeSize=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VolumeSize", VolumeSize)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ClusterProperties = attrib(
-        factory=ClusterProperties, converter=create_object_converter(ClusterProperties)
+    _convert_ClusterEBSStorageInfo = create_object_converter(ClusterEBSStorageInfo)
+
+    class ClusterStorageInfo(_PropertyType):
+        """The Storage Info property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for StorageInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-storageinfo.html>`_
+        """
+
+        __slots__ = ("EBSStorageInfo",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterStorageInfo",
+            _PropertyType,
+            __slots__,
+            converters={"EBSStorageInfo": _convert_ClusterEBSStorageInfo},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EBSStorageInfo=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EBSStorageInfo", _convert_ClusterEBSStorageInfo(EBSStorageInfo))
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterStorageInfo = create_object_converter(ClusterStorageInfo)
+
+    class ClusterBrokerNodeGroupInfo(_PropertyType):
+        """The Broker Node Group Info property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for BrokerNodeGroupInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-brokernodegroupinfo.html>`_
+        """
+
+        __slots__ = (
+            "BrokerAZDistribution",
+            "ClientSubnets",
+            "InstanceType",
+            "SecurityGroups",
+            "StorageInfo",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterBrokerNodeGroupInfo",
+            _PropertyType,
+            __slots__,
+            converters={"StorageInfo": _convert_ClusterStorageInfo},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BrokerAZDistribution=None,
+            ClientSubnets=None,
+            InstanceType=None,
+            SecurityGroups=None,
+            StorageInfo=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BrokerAZDistribution", BrokerAZDistribution)
+            _setattr("ClientSubnets", ClientSubnets)
+            _setattr("InstanceType", InstanceType)
+            _setattr("SecurityGroups", SecurityGroups)
+            _setattr("StorageInfo", _convert_ClusterStorageInfo(StorageInfo))
+            _init_PropertyType(self, kwargs)
+
+    class ClusterTls(_PropertyType):
+        """The Tls property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for Tls
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-tls.html>`_
+        """
+
+        __slots__ = ("CertificateAuthorityArnList",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterTls", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CertificateAuthorityArnList=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CertificateAuthorityArnList", CertificateAuthorityArnList)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterTls = create_object_converter(ClusterTls)
+
+    class ClusterClientAuthentication(_PropertyType):
+        """The Client Authentication property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClientAuthentication
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-clientauthentication.html>`_
+        """
+
+        __slots__ = ("Tls",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterClientAuthentication",
+            _PropertyType,
+            __slots__,
+            converters={"Tls": _convert_ClusterTls},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Tls=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Tls", _convert_ClusterTls(Tls))
+            _init_PropertyType(self, kwargs)
+
+    class ClusterConfigurationInfo(_PropertyType):
+        """The Configuration Info property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-configurationinfo.html>`_
+        """
+
+        __slots__ = ("Arn", "Revision")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterConfigurationInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Arn=None, Revision=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _setattr("Revision", Revision)
+            _init_PropertyType(self, kwargs)
+
+    class ClusterEncryptionAtRest(_PropertyType):
+        """The Encryption At Rest property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionAtRest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-encryptionatrest.html>`_
+        """
+
+        __slots__ = ("DataVolumeKMSKeyId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterEncryptionAtRest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DataVolumeKMSKeyId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DataVolumeKMSKeyId", DataVolumeKMSKeyId)
+            _init_PropertyType(self, kwargs)
+
+    class ClusterEncryptionInTransit(_PropertyType):
+        """The Encryption In Transit property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionInTransit
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-encryptionintransit.html>`_
+        """
+
+        __slots__ = ("ClientBroker", "InCluster")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterEncryptionInTransit", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ClientBroker=None, InCluster=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClientBroker", ClientBroker)
+            _setattr("InCluster", InCluster)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterEncryptionAtRest = create_object_converter(ClusterEncryptionAtRest)
+    _convert_ClusterEncryptionInTransit = create_object_converter(
+        ClusterEncryptionInTransit
+    )
+
+    class ClusterEncryptionInfo(_PropertyType):
+        """The Encryption Info property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-encryptioninfo.html>`_
+        """
+
+        __slots__ = ("EncryptionAtRest", "EncryptionInTransit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterEncryptionInfo",
+            _PropertyType,
+            __slots__,
+            converters={
+                "EncryptionAtRest": _convert_ClusterEncryptionAtRest,
+                "EncryptionInTransit": _convert_ClusterEncryptionInTransit,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, EncryptionAtRest=None, EncryptionInTransit=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "EncryptionAtRest", _convert_ClusterEncryptionAtRest(EncryptionAtRest)
+            )
+            _setattr(
+                "EncryptionInTransit",
+                _convert_ClusterEncryptionInTransit(EncryptionInTransit),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ClusterJmxExporter(_PropertyType):
+        """The Jmx Exporter property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for JmxExporter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-jmxexporter.html>`_
+        """
+
+        __slots__ = ("EnabledInBroker",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterJmxExporter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EnabledInBroker=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EnabledInBroker", EnabledInBroker)
+            _init_PropertyType(self, kwargs)
+
+    class ClusterNodeExporter(_PropertyType):
+        """The Node Exporter property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for NodeExporter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-nodeexporter.html>`_
+        """
+
+        __slots__ = ("EnabledInBroker",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterNodeExporter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, EnabledInBroker=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EnabledInBroker", EnabledInBroker)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterJmxExporter = create_object_converter(ClusterJmxExporter)
+    _convert_ClusterNodeExporter = create_object_converter(ClusterNodeExporter)
+
+    class ClusterPrometheus(_PropertyType):
+        """The Prometheus property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for Prometheus
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-prometheus.html>`_
+        """
+
+        __slots__ = ("JmxExporter", "NodeExporter")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterPrometheus",
+            _PropertyType,
+            __slots__,
+            converters={
+                "JmxExporter": _convert_ClusterJmxExporter,
+                "NodeExporter": _convert_ClusterNodeExporter,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, JmxExporter=None, NodeExporter=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("JmxExporter", _convert_ClusterJmxExporter(JmxExporter))
+            _setattr("NodeExporter", _convert_ClusterNodeExporter(NodeExporter))
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterPrometheus = create_object_converter(ClusterPrometheus)
+
+    class ClusterOpenMonitoring(_PropertyType):
+        """The Open Monitoring property type for Cluster in MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for OpenMonitoring
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-msk-cluster-openmonitoring.html>`_
+        """
+
+        __slots__ = ("Prometheus",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterOpenMonitoring",
+            _PropertyType,
+            __slots__,
+            converters={"Prometheus": _convert_ClusterPrometheus},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Prometheus=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Prometheus", _convert_ClusterPrometheus(Prometheus))
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterBrokerNodeGroupInfo = create_object_converter(
+        ClusterBrokerNodeGroupInfo
+    )
+    _convert_ClusterClientAuthentication = create_object_converter(
+        ClusterClientAuthentication
     )
+    _convert_ClusterConfigurationInfo = create_object_converter(
+        ClusterConfigurationInfo
+    )
+    _convert_ClusterEncryptionInfo = create_object_converter(ClusterEncryptionInfo)
+    _convert_ClusterOpenMonitoring = create_object_converter(ClusterOpenMonitoring)
+
+    class ClusterProperties(_ResourceProperties):
+        __slots__ = (
+            "BrokerNodeGroupInfo",
+            "ClientAuthentication",
+            "ClusterName",
+            "ConfigurationInfo",
+            "EncryptionInfo",
+            "EnhancedMonitoring",
+            "KafkaVersion",
+            "NumberOfBrokerNodes",
+            "OpenMonitoring",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "BrokerNodeGroupInfo": _convert_ClusterBrokerNodeGroupInfo,
+                "ClientAuthentication": _convert_ClusterClientAuthentication,
+                "ConfigurationInfo": _convert_ClusterConfigurationInfo,
+                "EncryptionInfo": _convert_ClusterEncryptionInfo,
+                "OpenMonitoring": _convert_ClusterOpenMonitoring,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BrokerNodeGroupInfo=None,
+            ClientAuthentication=None,
+            ClusterName=None,
+            ConfigurationInfo=None,
+            EncryptionInfo=None,
+            EnhancedMonitoring=None,
+            KafkaVersion=None,
+            NumberOfBrokerNodes=None,
+            OpenMonitoring=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "BrokerNodeGroupInfo",
+                _convert_ClusterBrokerNodeGroupInfo(BrokerNodeGroupInfo),
+            )
+            _setattr(
+                "ClientAuthentication",
+                _convert_ClusterClientAuthentication(ClientAuthentication),
+            )
+            _setattr("ClusterName", ClusterName)
+            _setattr(
+                "ConfigurationInfo",
+                _convert_ClusterConfigurationInfo(ConfigurationInfo),
+            )
+            _setattr("EncryptionInfo", _convert_ClusterEncryptionInfo(EncryptionInfo))
+            _setattr("EnhancedMonitoring", EnhancedMonitoring)
+            _setattr("KafkaVersion", KafkaVersion)
+            _setattr("NumberOfBrokerNodes", NumberOfBrokerNodes)
+            _setattr("OpenMonitoring", _convert_ClusterOpenMonitoring(OpenMonitoring))
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClusterProperties = create_object_converter(ClusterProperties)
+
+    class Cluster(_Resource):
+        """A Cluster for MSK.
+
+        See Also:
+            `AWS Cloud Formation documentation for Cluster
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-msk-cluster.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::MSK::Cluster"
+        TAG_FORMAT = "Map"
+
+        Properties: ClusterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Cluster",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterProperties},
+            factories={"Properties": ClusterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterProperties()
+            _setattr("Properties", _convert_ClusterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Cluster,
+        ClusterProperties,
+        ClusterEBSStorageInfo,
+        ClusterStorageInfo,
+        ClusterBrokerNodeGroupInfo,
+        ClusterTls,
+        ClusterClientAuthentication,
+        ClusterConfigurationInfo,
+        ClusterEncryptionAtRest,
+        ClusterEncryptionInTransit,
+        ClusterEncryptionInfo,
+        ClusterJmxExporter,
+        ClusterNodeExporter,
+        ClusterPrometheus,
+        ClusterOpenMonitoring,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Cluster": _create_Cluster,
+        "ClusterProperties": _create_Cluster,
+        "ClusterBrokerNodeGroupInfo": _create_Cluster,
+        "ClusterClientAuthentication": _create_Cluster,
+        "ClusterConfigurationInfo": _create_Cluster,
+        "ClusterEBSStorageInfo": _create_Cluster,
+        "ClusterEncryptionAtRest": _create_Cluster,
+        "ClusterEncryptionInfo": _create_Cluster,
+        "ClusterEncryptionInTransit": _create_Cluster,
+        "ClusterJmxExporter": _create_Cluster,
+        "ClusterNodeExporter": _create_Cluster,
+        "ClusterOpenMonitoring": _create_Cluster,
+        "ClusterPrometheus": _create_Cluster,
+        "ClusterStorageInfo": _create_Cluster,
+        "ClusterTls": _create_Cluster,
+    },
+)
@@ -7,13 +7,19 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "DBCluster",
@@ -29,146 +35,438 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class DBClusterProperties(ResourceProperties):
-    AvailabilityZones = attrib(default=None)
-    BackupRetentionPeriod = attrib(default=None)
-    DBClusterIdentifier = attrib(default=None)
-    DBClusterParameterGroupName = attrib(default=None)
-    DBSubnetGroupName = attrib(default=None)
-    EnableCloudwatchLogsExports = attrib(default=None)
-    IamAuthEnabled = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    Port = attrib(default=None)
-    PreferredBackupWindow = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    SnapshotIdentifier = attrib(default=None)
-    StorageEncrypted = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcSecurityGroupIds = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBCluster(Resource):
-    """A Db Cluster for Neptune.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBCluster
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbcluster.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Neptune::DBCluster"
-
-    Properties: DBClusterProperties = attrib(
-        factory=DBClusterProperties,
-        converter=create_object_converter(DBClusterProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class DBClusterParameterGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Family = attrib(default=None)
-    Name = attrib(default=None)
-    Parameters = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBClusterParameterGroup(Resource):
-    """A Db Cluster Parameter Group for Neptune.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBClusterParameterGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbclusterparametergroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Neptune::DBClusterParameterGroup"
-
-    Properties: DBClusterParameterGroupProperties = attrib(
-        factory=DBClusterParameterGroupProperties,
-        converter=create_object_converter(DBClusterParameterGroupProperties),
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class DBInstanceProperties(ResourceProperties):
-    AllowMajorVersionUpgrade = attrib(default=None)
-    AutoMinorVersionUpgrade = attrib(default=None)
-    AvailabilityZone = attrib(default=None)
-    DBClusterIdentifier = attrib(default=None)
-    DBInstanceClass = attrib(default=None)
-    DBInstanceIdentifier = attrib(default=None)
-    DBParameterGroupName = attrib(default=None)
-    DBSnapshotIdentifier = attrib(default=None)
-    DBSubnetGroupName = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBInstance(Resource):
-    """A Db Instance for Neptune.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBInstance
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbinstance.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Neptune::DBInstance"
-
-    Properties: DBInstanceProperties = attrib(
-        factory=DBInstanceProperties,
-        converter=create_object_converter(DBInstanceProperties),
+def _create_DBCluster():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBClusterProperties(_ResourceProperties):
+        __slots__ = (
+            "AvailabilityZones",
+            "BackupRetentionPeriod",
+            "DBClusterIdentifier",
+            "DBClusterParameterGroupName",
+            "DBSubnetGroupName",
+            "EnableCloudwatchLogsExports",
+            "IamAuthEnabled",
+            "KmsKeyId",
+            "Port",
+            "PreferredBackupWindow",
+            "PreferredMaintenanceWindow",
+            "SnapshotIdentifier",
+            "StorageEncrypted",
+            "Tags",
+            "VpcSecurityGroupIds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBClusterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AvailabilityZones=None,
+            BackupRetentionPeriod=None,
+            DBClusterIdentifier=None,
+            DBClusterParameterGroupName=None,
+            DBSubnetGroupName=None,
+            EnableCloudwatchLogsExports=None,
+            IamAuthEnabled=None,
+            KmsKeyId=None,
+            Port=None,
+            PreferredBackupWindow=None,
+            PreferredMaintenanceWindow=None,
+            SnapshotIdentifier=None,
+            StorageEncrypted=None,
+            Tags=None,
+            VpcSecurityGroupIds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AvailabilityZones", AvailabilityZones)
+            _setattr("BackupRetentionPeriod", BackupRetentionPeriod)
+            _setattr("DBClusterIdentifier", DBClusterIdentifier)
+            _setattr("DBClusterParameterGroupName", DBClusterParameterGroupName)
+            _setattr("DBSubnetGroupName", DBSubnetGroupName)
+            _setattr("EnableCloudwatchLogsExports", EnableCloudwatchLogsExports)
+            _setattr("IamAuthEnabled", IamAuthEnabled)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("Port", Port)
+            _setattr("PreferredBackupWindow", PreferredBackupWindow)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr("SnapshotIdentifier", SnapshotIdentifier)
+            _setattr("StorageEncrypted", StorageEncrypted)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcSecurityGroupIds", VpcSecurityGroupIds)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBClusterProperties = create_object_converter(DBClusterProperties)
+
+    class DBCluster(_Resource):
+        """A Db Cluster for Neptune.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBCluster
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbcluster.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Neptune::DBCluster"
+
+        Properties: DBClusterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBCluster",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBClusterProperties},
+            factories={"Properties": DBClusterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBClusterProperties()
+            _setattr("Properties", _convert_DBClusterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DBCluster, DBClusterProperties
+
+
+def _create_DBClusterParameterGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBClusterParameterGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "Family", "Name", "Parameters", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBClusterParameterGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Family=None,
+            Name=None,
+            Parameters=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Family", Family)
+            _setattr("Name", Name)
+            _setattr("Parameters", Parameters)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBClusterParameterGroupProperties = create_object_converter(
+        DBClusterParameterGroupProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class DBParameterGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Family = attrib(default=None)
-    Name = attrib(default=None)
-    Parameters = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBParameterGroup(Resource):
-    """A Db Parameter Group for Neptune.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBParameterGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbparametergroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Neptune::DBParameterGroup"
-
-    Properties: DBParameterGroupProperties = attrib(
-        factory=DBParameterGroupProperties,
-        converter=create_object_converter(DBParameterGroupProperties),
+    class DBClusterParameterGroup(_Resource):
+        """A Db Cluster Parameter Group for Neptune.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBClusterParameterGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbclusterparametergroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Neptune::DBClusterParameterGroup"
+
+        Properties: DBClusterParameterGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBClusterParameterGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBClusterParameterGroupProperties},
+            factories={"Properties": DBClusterParameterGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBClusterParameterGroupProperties()
+            _setattr(
+                "Properties", _convert_DBClusterParameterGroupProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return DBClusterParameterGroup, DBClusterParameterGroupProperties
+
+
+def _create_DBInstance():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBInstanceProperties(_ResourceProperties):
+        __slots__ = (
+            "AllowMajorVersionUpgrade",
+            "AutoMinorVersionUpgrade",
+            "AvailabilityZone",
+            "DBClusterIdentifier",
+            "DBInstanceClass",
+            "DBInstanceIdentifier",
+            "DBParameterGroupName",
+            "DBSnapshotIdentifier",
+            "DBSubnetGroupName",
+            "PreferredMaintenanceWindow",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBInstanceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowMajorVersionUpgrade=None,
+            AutoMinorVersionUpgrade=None,
+            AvailabilityZone=None,
+            DBClusterIdentifier=None,
+            DBInstanceClass=None,
+            DBInstanceIdentifier=None,
+            DBParameterGroupName=None,
+            DBSnapshotIdentifier=None,
+            DBSubnetGroupName=None,
+            PreferredMaintenanceWindow=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowMajorVersionUpgrade", AllowMajorVersionUpgrade)
+            _setattr("AutoMinorVersionUpgrade", AutoMinorVersionUpgrade)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("DBClusterIdentifier", DBClusterIdentifier)
+            _setattr("DBInstanceClass", DBInstanceClass)
+            _setattr("DBInstanceIdentifier", DBInstanceIdentifier)
+            _setattr("DBParameterGroupName", DBParameterGroupName)
+            _setattr("DBSnapshotIdentifier", DBSnapshotIdentifier)
+            _setattr("DBSubnetGroupName", DBSubnetGroupName)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBInstanceProperties = create_object_converter(DBInstanceProperties)
+
+    class DBInstance(_Resource):
+        """A Db Instance for Neptune.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBInstance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbinstance.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Neptune::DBInstance"
+
+        Properties: DBInstanceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBInstance",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBInstanceProperties},
+            factories={"Properties": DBInstanceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBInstanceProperties()
+            _setattr("Properties", _convert_DBInstanceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DBInstance, DBInstanceProperties
+
+
+def _create_DBParameterGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBParameterGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "Family", "Name", "Parameters", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBParameterGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Family=None,
+            Name=None,
+            Parameters=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Family", Family)
+            _setattr("Name", Name)
+            _setattr("Parameters", Parameters)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBParameterGroupProperties = create_object_converter(
+        DBParameterGroupProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class DBSubnetGroupProperties(ResourceProperties):
-    DBSubnetGroupDescription = attrib(default=None)
-    DBSubnetGroupName = attrib(default=None)
-    SubnetIds = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBSubnetGroup(Resource):
-    """A Db Subnet Group for Neptune.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBSubnetGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbsubnetgroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Neptune::DBSubnetGroup"
-
-    Properties: DBSubnetGroupProperties = attrib(
-        factory=DBSubnetGroupProperties,
-        converter=create_object_converter(DBSubnetGroupProperties),
-    )
+    class DBParameterGroup(_Resource):
+        """A Db Parameter Group for Neptune.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBParameterGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbparametergroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Neptune::DBParameterGroup"
+
+        Properties: DBParameterGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBParameterGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBParameterGroupProperties},
+            factories={"Properties": DBParameterGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBParameterGroupProperties()
+            _setattr("Properties", _convert_DBParameterGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DBParameterGroup, DBParameterGroupProperties
+
+
+def _create_DBSubnetGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBSubnetGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "DBSubnetGroupDescription",
+            "DBSubnetGroupName",
+            "SubnetIds",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBSubnetGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DBSubnetGroupDescription=None,
+            DBSubnetGroupName=None,
+            SubnetIds=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DBSubnetGroupDescription", DBSubnetGroupDescription)
+            _setattr("DBSubnetGroupName", DBSubnetGroupName)
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBSubnetGroupProperties = create_object_converter(DBSubnetGroupProperties)
+
+    class DBSubnetGroup(_Resource):
+        """A Db Subnet Group for Neptune.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBSubnetGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-neptune-dbsubnetgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Neptune::DBSubnetGroup"
+
+        Properties: DBSubnetGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBSubnetGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBSubnetGroupProperties},
+            factories={"Properties": DBSubnetGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBSubnetGroupProperties()
+            _setattr("Properties", _convert_DBSubnetGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DBSubnetGroup, DBSubnetGroupProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "DBCluster": _create_DBCluster,
+        "DBClusterProperties": _create_DBCluster,
+        "DBClusterParameterGroup": _create_DBClusterParameterGroup,
+        "DBClusterParameterGroupProperties": _create_DBClusterParameterGroup,
+        "DBInstance": _create_DBInstance,
+        "DBInstanceProperties": _create_DBInstance,
+        "DBParameterGroup": _create_DBParameterGroup,
+        "DBParameterGroupProperties": _create_DBParameterGroup,
+        "DBSubnetGroup": _create_DBSubnetGroup,
+        "DBSubnetGroupProperties": _create_DBSubnetGroup,
+    },
+)
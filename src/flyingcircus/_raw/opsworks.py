@@ -7,25 +7,51 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "App",
     "AppProperties",
+    "AppDataSource",
+    "AppEnvironmentVariable",
+    "AppSource",
+    "AppSslConfiguration",
     "ElasticLoadBalancerAttachment",
     "ElasticLoadBalancerAttachmentProperties",
     "Instance",
     "InstanceProperties",
+    "InstanceBlockDeviceMapping",
+    "InstanceEbsBlockDevice",
+    "InstanceTimeBasedAutoScaling",
     "Layer",
     "LayerProperties",
+    "LayerAutoScalingThresholds",
+    "LayerLifecycleEventConfiguration",
+    "LayerLoadBasedAutoScaling",
+    "LayerRecipes",
+    "LayerShutdownEventConfiguration",
+    "LayerVolumeConfiguration",
     "Stack",
     "StackProperties",
+    "StackChefConfiguration",
+    "StackElasticIp",
+    "StackRdsDbInstance",
+    "StackSource",
+    "StackStackConfigurationManager",
     "UserProfile",
     "UserProfileProperties",
     "Volume",
@@ -33,231 +59,1380 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AppProperties(ResourceProperties):
-    AppSource = attrib(default=None)
-    Attributes = attrib(default=None)
-    DataSources = attrib(default=None)
-    Description = attrib(default=None)
-    Domains = attrib(default=None)
-    EnableSsl = attrib(default=None)
-    Environment = attrib(default=None)
-    Name = attrib(default=None)
-    Shortname = attrib(default=None)
-    SslConfiguration = attrib(default=None)
-    StackId = attrib(default=None)
-    Type = attrib(default=None)
+def _create_App():
+    class AppDataSource(_PropertyType):
+        """The Data Source property type for App in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for DataSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-app-datasource.html>`_
+        """
+
+        __slots__ = ("Arn", "DatabaseName", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppDataSource", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Arn=None, DatabaseName=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class AppEnvironmentVariable(_PropertyType):
+        """The Environment Variable property type for App in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for EnvironmentVariable
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-app-environment.html>`_
+        """
+
+        __slots__ = ("Key", "Secure", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppEnvironmentVariable", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Secure=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Secure", Secure)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class AppSource(_PropertyType):
+        """The Source property type for App in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for Source
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-stack-source.html>`_
+        """
+
+        __slots__ = ("Password", "Revision", "SshKey", "Type", "Url", "Username")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppSource", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Password=None,
+            Revision=None,
+            SshKey=None,
+            Type=None,
+            Url=None,
+            Username=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Password", Password)
+            _setattr("Revision", Revision)
+            _setattr("SshKey", SshKey)
+            _setattr("Type", Type)
+            _setattr("Url", Url)
+            _setattr("Username", Username)
+            _init_PropertyType(self, kwargs)
+
+    class AppSslConfiguration(_PropertyType):
+        """The Ssl Configuration property type for App in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for SslConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-app-sslconfiguration.html>`_
+        """
+
+        __slots__ = ("Certificate", "Chain", "PrivateKey")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppSslConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Certificate=None, Chain=None, PrivateKey=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Certificate", Certificate)
+            _setattr("Chain", Chain)
+            _setattr("PrivateKey", PrivateKey)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AppSource = create_object_converter(AppSource)
+    _convert_AppDataSource_list = create_object_list_converter(AppDataSource)
+    _convert_AppEnvironmentVariable_list = create_object_list_converter(
+        AppEnvironmentVariable
+    )
+    _convert_AppSslConfiguration = create_object_converter(AppSslConfiguration)
+
+    class AppProperties(_ResourceProperties):
+        __slots__ = (
+            "AppSource",
+            "Attributes",
+            "DataSources",
+            "Description",
+            "Domains",
+            "EnableSsl",
+            "Environment",
+            "Name",
+            "Shortname",
+            "SslConfiguration",
+            "StackId",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AppSource": _convert_AppSource,
+                "DataSources": _convert_AppDataSource_list,
+                "Environment": _convert_AppEnvironmentVariable_list,
+                "SslConfiguration": _convert_AppSslConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AppSource=None,
+            Attributes=None,
+            DataSources=None,
+            Description=None,
+            Domains=None,
+            EnableSsl=None,
+            Environment=None,
+            Name=None,
+            Shortname=None,
+            SslConfiguration=None,
+            StackId=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AppSource", _convert_AppSource(AppSource))
+            _setattr("Attributes", Attributes)
+            _setattr("DataSources", _convert_AppDataSource_list(DataSources))
+            _setattr("Description", Description)
+            _setattr("Domains", Domains)
+            _setattr("EnableSsl", EnableSsl)
+            _setattr("Environment", _convert_AppEnvironmentVariable_list(Environment))
+            _setattr("Name", Name)
+            _setattr("Shortname", Shortname)
+            _setattr("SslConfiguration", _convert_AppSslConfiguration(SslConfiguration))
+            _setattr("StackId", StackId)
+            _setattr("Type", Type)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AppProperties = create_object_converter(AppProperties)
+
+    class App(_Resource):
+        """A App for OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for App
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-app.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::OpsWorks::App"
+
+        Properties: AppProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "App",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AppProperties},
+            factories={"Properties": AppProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AppProperties()
+            _setattr("Properties", _convert_AppProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        App,
+        AppProperties,
+        AppDataSource,
+        AppEnvironmentVariable,
+        AppSource,
+        AppSslConfiguration,
+    )
+
+
+def _create_ElasticLoadBalancerAttachment():
+    class ElasticLoadBalancerAttachmentProperties(_ResourceProperties):
+        __slots__ = ("ElasticLoadBalancerName", "LayerId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ElasticLoadBalancerAttachmentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ElasticLoadBalancerName=None, LayerId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ElasticLoadBalancerName", ElasticLoadBalancerName)
+            _setattr("LayerId", LayerId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ElasticLoadBalancerAttachmentProperties = create_object_converter(
+        ElasticLoadBalancerAttachmentProperties
+    )
+
+    class ElasticLoadBalancerAttachment(_Resource):
+        """A Elastic Load Balancer Attachment for OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticLoadBalancerAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-elbattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::OpsWorks::ElasticLoadBalancerAttachment"
+
+        Properties: ElasticLoadBalancerAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ElasticLoadBalancerAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ElasticLoadBalancerAttachmentProperties},
+            factories={"Properties": ElasticLoadBalancerAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ElasticLoadBalancerAttachmentProperties()
+            _setattr(
+                "Properties",
+                _convert_ElasticLoadBalancerAttachmentProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return ElasticLoadBalancerAttachment, ElasticLoadBalancerAttachmentProperties
+
+
+def _create_Instance():
+    class InstanceEbsBlockDevice(_PropertyType):
+        """The Ebs Block Device property type for Instance in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for EbsBlockDevice
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-instance-ebsblockdevice.html>`_
+        """
+
+        __slots__ = (
+            "DeleteOnTermination",
+            "Iops",
+            "SnapshotId",
+            "VolumeSize",
+            "VolumeType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceEbsBlockDevice", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeleteOnTermination=None,
+            Iops=None,
+            SnapshotId=None,
+            VolumeSize=None,
+            VolumeType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeleteOnTermination", DeleteOnTermination)
+            _setattr("Iops", Iops)
+            _setattr("SnapshotId", SnapshotId)
+            _setattr("VolumeSize", VolumeSize)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceEbsBlockDevice = create_object_converter(InstanceEbsBlockDevice)
+
+    class InstanceBlockDeviceMapping(_PropertyType):
+        """The Block Device Mapping property type for Instance in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for BlockDeviceMapping
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-instance-blockdevicemapping.html>`_
+        """
+
+        __slots__ = ("DeviceName", "Ebs", "NoDevice", "VirtualName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceBlockDeviceMapping",
+            _PropertyType,
+            __slots__,
+            converters={"Ebs": _convert_InstanceEbsBlockDevice},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            DeviceName=None,
+            Ebs=None,
+            NoDevice=None,
+            VirtualName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeviceName", DeviceName)
+            _setattr("Ebs", _convert_InstanceEbsBlockDevice(Ebs))
+            _setattr("NoDevice", NoDevice)
+            _setattr("VirtualName", VirtualName)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class App(Resource):
-    """A App for OpsWorks.
+    class InstanceTimeBasedAutoScaling(_PropertyType):
+        """The Time Based Auto Scaling property type for Instance in OpsWorks.
 
-    See Also:
-        `AWS Cloud Formation documentation for App
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-app.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for TimeBasedAutoScaling
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-instance-timebasedautoscaling.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::OpsWorks::App"
+        __slots__ = (
+            "Friday",
+            "Monday",
+            "Saturday",
+            "Sunday",
+            "Thursday",
+            "Tuesday",
+            "Wednesday",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceTimeBasedAutoScaling", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: AppProperties = attrib(
-        factory=AppProperties, converter=create_object_converter(AppProperties)
+        def __init__(
+            self,
+            *,
+            Friday=None,
+            Monday=None,
+            Saturday=None,
+            Sunday=None,
+            Thursday=None,
+            Tuesday=None,
+            Wednesday=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Friday", Friday)
+            _setattr("Monday", Monday)
+            _setattr("Saturday", Saturday)
+            _setattr("Sunday", Sunday)
+            _setattr("Thursday", Thursday)
+            _setattr("Tuesday", Tuesday)
+            _setattr("Wednesday", Wednesday)
+            _init_PropertyType(self, kwargs)
+
+    _convert_InstanceBlockDeviceMapping_list = create_object_list_converter(
+        InstanceBlockDeviceMapping
+    )
+    _convert_InstanceTimeBasedAutoScaling = create_object_converter(
+        InstanceTimeBasedAutoScaling
+    )
+
+    class InstanceProperties(_ResourceProperties):
+        __slots__ = (
+            "AgentVersion",
+            "AmiId",
+            "Architecture",
+            "AutoScalingType",
+            "AvailabilityZone",
+            "BlockDeviceMappings",
+            "EbsOptimized",
+            "ElasticIps",
+            "Hostname",
+            "InstallUpdatesOnBoot",
+            "InstanceType",
+            "LayerIds",
+            "Os",
+            "RootDeviceType",
+            "SshKeyName",
+            "StackId",
+            "SubnetId",
+            "Tenancy",
+            "TimeBasedAutoScaling",
+            "VirtualizationType",
+            "Volumes",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "BlockDeviceMappings": _convert_InstanceBlockDeviceMapping_list,
+                "TimeBasedAutoScaling": _convert_InstanceTimeBasedAutoScaling,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AgentVersion=None,
+            AmiId=None,
+            Architecture=None,
+            AutoScalingType=None,
+            AvailabilityZone=None,
+            BlockDeviceMappings=None,
+            EbsOptimized=None,
+            ElasticIps=None,
+            Hostname=None,
+            InstallUpdatesOnBoot=None,
+            InstanceType=None,
+            LayerIds=None,
+            Os=None,
+            RootDeviceType=None,
+            SshKeyName=None,
+            StackId=None,
+            SubnetId=None,
+            Tenancy=None,
+            TimeBasedAutoScaling=None,
+            VirtualizationType=None,
+            Volumes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AgentVersion", AgentVersion)
+            _setattr("AmiId", AmiId)
+            _setattr("Architecture", Architecture)
+            _setattr("AutoScalingType", AutoScalingType)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr(
+                "BlockDeviceMappings",
+                _convert_InstanceBlockDeviceMapping_list(BlockDeviceMappings),
+            )
+            _setattr("EbsOptimized", EbsOptimized)
+            _setattr("ElasticIps", ElasticIps)
+            _setattr("Hostname", Hostname)
+            _setattr("InstallUpdatesOnBoot", InstallUpdatesOnBoot)
+            _setattr("InstanceType", InstanceType)
+            _setattr("LayerIds", LayerIds)
+            _setattr("Os", Os)
+            _setattr("RootDeviceType", RootDeviceType)
+            _setattr("SshKeyName", SshKeyName)
+            _setattr("StackId", StackId)
+            _setattr("SubnetId", SubnetId)
+            _setattr("Tenancy", Tenancy)
+            _setattr(
+                "TimeBasedAutoScaling",
+                _convert_InstanceTimeBasedAutoScaling(TimeBasedAutoScaling),
+            )
+            _setattr("VirtualizationType", VirtualizationType)
+            _setattr("Volumes", Volumes)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InstanceProperties = create_object_converter(InstanceProperties)
+
+    class Instance(_Resource):
+        """A Instance for OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for Instance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-instance.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::OpsWorks::Instance"
+
+        Properties: InstanceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Instance",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InstanceProperties},
+            factories={"Properties": InstanceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InstanceProperties()
+            _setattr("Properties", _convert_InstanceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Instance,
+        InstanceProperties,
+        InstanceEbsBlockDevice,
+        InstanceBlockDeviceMapping,
+        InstanceTimeBasedAutoScaling,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class ElasticLoadBalancerAttachmentProperties(ResourceProperties):
-    ElasticLoadBalancerName = attrib(default=None)
-    LayerId = attrib(default=None)
+def _create_Layer():
+    class LayerAutoScalingThresholds(_PropertyType):
+        """The Auto Scaling Thresholds property type for Layer in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for AutoScalingThresholds
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-layer-loadbasedautoscaling-autoscalingthresholds.html>`_
+        """
+
+        __slots__ = (
+            "CpuThreshold",
+            "IgnoreMetricsTime",
+            "InstanceCount",
+            "LoadThreshold",
+            "MemoryThreshold",
+            "ThresholdsWaitTime",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerAutoScalingThresholds", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CpuThreshold=None,
+            IgnoreMetricsTime=None,
+            InstanceCount=None,
+            LoadThreshold=None,
+            MemoryThreshold=None,
+            ThresholdsWaitTime=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CpuThreshold", CpuThreshold)
+            _setattr("IgnoreMetricsTime", IgnoreMetricsTime)
+            _setattr("InstanceCount", InstanceCount)
+            _setattr("LoadThreshold", LoadThreshold)
+            _setattr("MemoryThreshold", MemoryThreshold)
+            _setattr("ThresholdsWaitTime", ThresholdsWaitTime)
+            _init_PropertyType(self, kwargs)
 
+    class LayerShutdownEventConfiguration(_PropertyType):
+        """The Shutdown Event Configuration property type for Layer in OpsWorks.
 
-@attrs(**ATTRSCONFIG)
-class ElasticLoadBalancerAttachment(Resource):
-    """A Elastic Load Balancer Attachment for OpsWorks.
+        See Also:
+            `AWS Cloud Formation documentation for ShutdownEventConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-layer-lifecycleeventconfiguration-shutdowneventconfiguration.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for ElasticLoadBalancerAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-elbattachment.html>`_
-    """
+        __slots__ = ("DelayUntilElbConnectionsDrained", "ExecutionTimeout")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerShutdownEventConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::OpsWorks::ElasticLoadBalancerAttachment"
+        def __init__(
+            self,
+            *,
+            DelayUntilElbConnectionsDrained=None,
+            ExecutionTimeout=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DelayUntilElbConnectionsDrained", DelayUntilElbConnectionsDrained)
+            _setattr("ExecutionTimeout", ExecutionTimeout)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ElasticLoadBalancerAttachmentProperties = attrib(
-        factory=ElasticLoadBalancerAttachmentProperties,
-        converter=create_object_converter(ElasticLoadBalancerAttachmentProperties),
+    _convert_LayerShutdownEventConfiguration = create_object_converter(
+        LayerShutdownEventConfiguration
     )
 
+    class LayerLifecycleEventConfiguration(_PropertyType):
+        """The Lifecycle Event Configuration property type for Layer in OpsWorks.
 
-@attrs(**ATTRSCONFIG)
-class InstanceProperties(ResourceProperties):
-    AgentVersion = attrib(default=None)
-    AmiId = attrib(default=None)
-    Architecture = attrib(default=None)
-    AutoScalingType = attrib(default=None)
-    AvailabilityZone = attrib(default=None)
-    BlockDeviceMappings = attrib(default=None)
-    EbsOptimized = attrib(default=None)
-    ElasticIps = attrib(default=None)
-    Hostname = attrib(default=None)
-    InstallUpdatesOnBoot = attrib(default=None)
-    InstanceType = attrib(default=None)
-    LayerIds = attrib(default=None)
-    Os = attrib(default=None)
-    RootDeviceType = attrib(default=None)
-    SshKeyName = attrib(default=None)
-    StackId = attrib(default=None)
-    SubnetId = attrib(default=None)
-    Tenancy = attrib(default=None)
-    TimeBasedAutoScaling = attrib(default=None)
-    VirtualizationType = attrib(default=None)
-    Volumes = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Instance(Resource):
-    """A Instance for OpsWorks.
-
-    See Also:
-        `AWS Cloud Formation documentation for Instance
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-instance.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::OpsWorks::Instance"
-
-    Properties: InstanceProperties = attrib(
-        factory=InstanceProperties,
-        converter=create_object_converter(InstanceProperties),
+        See Also:
+            `AWS Cloud Formation documentation for LifecycleEventConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-layer-lifecycleeventconfiguration.html>`_
+        """
+
+        __slots__ = ("ShutdownEventConfiguration",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerLifecycleEventConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ShutdownEventConfiguration": _convert_LayerShutdownEventConfiguration
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ShutdownEventConfiguration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ShutdownEventConfiguration",
+                _convert_LayerShutdownEventConfiguration(ShutdownEventConfiguration),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_LayerAutoScalingThresholds = create_object_converter(
+        LayerAutoScalingThresholds
     )
 
+    class LayerLoadBasedAutoScaling(_PropertyType):
+        """The Load Based Auto Scaling property type for Layer in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoadBasedAutoScaling
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-layer-loadbasedautoscaling.html>`_
+        """
+
+        __slots__ = ("DownScaling", "Enable", "UpScaling")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerLoadBasedAutoScaling",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DownScaling": _convert_LayerAutoScalingThresholds,
+                "UpScaling": _convert_LayerAutoScalingThresholds,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DownScaling=None, Enable=None, UpScaling=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DownScaling", _convert_LayerAutoScalingThresholds(DownScaling))
+            _setattr("Enable", Enable)
+            _setattr("UpScaling", _convert_LayerAutoScalingThresholds(UpScaling))
+            _init_PropertyType(self, kwargs)
+
+    class LayerRecipes(_PropertyType):
+        """The Recipes property type for Layer in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for Recipes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-layer-recipes.html>`_
+        """
+
+        __slots__ = ("Configure", "Deploy", "Setup", "Shutdown", "Undeploy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerRecipes", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class LayerProperties(ResourceProperties):
-    Attributes = attrib(default=None)
-    AutoAssignElasticIps = attrib(default=None)
-    AutoAssignPublicIps = attrib(default=None)
-    CustomInstanceProfileArn = attrib(default=None)
-    CustomJson = attrib(default=None)
-    CustomRecipes = attrib(default=None)
-    CustomSecurityGroupIds = attrib(default=None)
-    EnableAutoHealing = attrib(default=None)
-    InstallUpdatesOnBoot = attrib(default=None)
-    LifecycleEventConfiguration = attrib(default=None)
-    LoadBasedAutoScaling = attrib(default=None)
-    Name = attrib(default=None)
-    Packages = attrib(default=None)
-    Shortname = attrib(default=None)
-    StackId = attrib(default=None)
-    Tags = attrib(default=None)
-    Type = attrib(default=None)
-    UseEbsOptimizedInstances = attrib(default=None)
-    VolumeConfigurations = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Layer(Resource):
-    """A Layer for OpsWorks.
-
-    See Also:
-        `AWS Cloud Formation documentation for Layer
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-layer.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::OpsWorks::Layer"
-
-    Properties: LayerProperties = attrib(
-        factory=LayerProperties, converter=create_object_converter(LayerProperties)
+        def __init__(
+            self,
+            *,
+            Configure=None,
+            Deploy=None,
+            Setup=None,
+            Shutdown=None,
+            Undeploy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Configure", Configure)
+            _setattr("Deploy", Deploy)
+            _setattr("Setup", Setup)
+            _setattr("Shutdown", Shutdown)
+            _setattr("Undeploy", Undeploy)
+            _init_PropertyType(self, kwargs)
+
+    class LayerVolumeConfiguration(_PropertyType):
+        """The Volume Configuration property type for Layer in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for VolumeConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-layer-volumeconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "Encrypted",
+            "Iops",
+            "MountPoint",
+            "NumberOfDisks",
+            "RaidLevel",
+            "Size",
+            "VolumeType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerVolumeConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Encrypted=None,
+            Iops=None,
+            MountPoint=None,
+            NumberOfDisks=None,
+            RaidLevel=None,
+            Size=None,
+            VolumeType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Encrypted", Encrypted)
+            _setattr("Iops", Iops)
+            _setattr("MountPoint", MountPoint)
+            _setattr("NumberOfDisks", NumberOfDisks)
+            _setattr("RaidLevel", RaidLevel)
+            _setattr("Size", Size)
+            _setattr("VolumeType", VolumeType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_LayerRecipes = create_object_converter(LayerRecipes)
+    _convert_LayerLifecycleEventConfiguration = create_object_converter(
+        LayerLifecycleEventConfiguration
+    )
+    _convert_LayerLoadBasedAutoScaling = create_object_converter(
+        LayerLoadBasedAutoScaling
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_LayerVolumeConfiguration_list = create_object_list_converter(
+        LayerVolumeConfiguration
+    )
+
+    class LayerProperties(_ResourceProperties):
+        __slots__ = (
+            "Attributes",
+            "AutoAssignElasticIps",
+            "AutoAssignPublicIps",
+            "CustomInstanceProfileArn",
+            "CustomJson",
+            "CustomRecipes",
+            "CustomSecurityGroupIds",
+            "EnableAutoHealing",
+            "InstallUpdatesOnBoot",
+            "LifecycleEventConfiguration",
+            "LoadBasedAutoScaling",
+            "Name",
+            "Packages",
+            "Shortname",
+            "StackId",
+            "Tags",
+            "Type",
+            "UseEbsOptimizedInstances",
+            "VolumeConfigurations",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LayerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CustomRecipes": _convert_LayerRecipes,
+                "LifecycleEventConfiguration": _convert_LayerLifecycleEventConfiguration,
+                "LoadBasedAutoScaling": _convert_LayerLoadBasedAutoScaling,
+                "Tags": _convert_Tag_list,
+                "VolumeConfigurations": _convert_LayerVolumeConfiguration_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            Attributes=None,
+            AutoAssignElasticIps=None,
+            AutoAssignPublicIps=None,
+            CustomInstanceProfileArn=None,
+            CustomJson=None,
+            CustomRecipes=None,
+            CustomSecurityGroupIds=None,
+            EnableAutoHealing=None,
+            InstallUpdatesOnBoot=None,
+            LifecycleEventConfiguration=None,
+            LoadBasedAutoScaling=None,
+            Name=None,
+            Packages=None,
+            Shortname=None,
+            StackId=None,
+            Tags=None,
+            Type=None,
+            UseEbsOptimizedInstances=None,
+            VolumeConfigurations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", Attributes)
+            _setattr("AutoAssignElasticIps", AutoAssignElasticIps)
+            _setattr("AutoAssignPublicIps", AutoAssignPublicIps)
+            _setattr("CustomInstanceProfileArn", CustomInstanceProfileArn)
+            _setattr("CustomJson", CustomJson)
+            _setattr("CustomRecipes", _convert_LayerRecipes(CustomRecipes))
+            _setattr("CustomSecurityGroupIds", CustomSecurityGroupIds)
+            _setattr("EnableAutoHealing", EnableAutoHealing)
+            _setattr("InstallUpdatesOnBoot", InstallUpdatesOnBoot)
+            _setattr(
+                "LifecycleEventConfiguration",
+                _convert_LayerLifecycleEventConfiguration(LifecycleEventConfiguration),
+            )
+            _setattr(
+                "LoadBasedAutoScaling",
+                _convert_LayerLoadBasedAutoScaling(LoadBasedAutoScaling),
+            )
+            _setattr("Name", Name)
+            _setattr("Packages", Packages)
+            _setattr("Shortname", Shortname)
+            _setattr("StackId", StackId)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Type", Type)
+            _setattr("UseEbsOptimizedInstances", UseEbsOptimizedInstances)
+            _setattr(
+                "VolumeConfigurations",
+                _convert_LayerVolumeConfiguration_list(VolumeConfigurations),
+            )
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class StackProperties(ResourceProperties):
-    AgentVersion = attrib(default=None)
-    Attributes = attrib(default=None)
-    ChefConfiguration = attrib(default=None)
-    CloneAppIds = attrib(default=None)
-    ClonePermissions = attrib(default=None)
-    ConfigurationManager = attrib(default=None)
-    CustomCookbooksSource = attrib(default=None)
-    CustomJson = attrib(default=None)
-    DefaultAvailabilityZone = attrib(default=None)
-    DefaultInstanceProfileArn = attrib(default=None)
-    DefaultOs = attrib(default=None)
-    DefaultRootDeviceType = attrib(default=None)
-    DefaultSshKeyName = attrib(default=None)
-    DefaultSubnetId = attrib(default=None)
-    EcsClusterArn = attrib(default=None)
-    ElasticIps = attrib(default=None)
-    HostnameTheme = attrib(default=None)
-    Name = attrib(default=None)
-    RdsDbInstances = attrib(default=None)
-    ServiceRoleArn = attrib(default=None)
-    SourceStackId = attrib(default=None)
-    Tags = attrib(default=None)
-    UseCustomCookbooks = attrib(default=None)
-    UseOpsworksSecurityGroups = attrib(default=None)
-    VpcId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Stack(Resource):
-    """A Stack for OpsWorks.
-
-    See Also:
-        `AWS Cloud Formation documentation for Stack
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-stack.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::OpsWorks::Stack"
-
-    Properties: StackProperties = attrib(
-        factory=StackProperties, converter=create_object_converter(StackProperties)
+    _convert_LayerProperties = create_object_converter(LayerProperties)
+
+    class Layer(_Resource):
+        """A Layer for OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for Layer
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-layer.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::OpsWorks::Layer"
+
+        Properties: LayerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Layer",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LayerProperties},
+            factories={"Properties": LayerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LayerProperties()
+            _setattr("Properties", _convert_LayerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Layer,
+        LayerProperties,
+        LayerAutoScalingThresholds,
+        LayerShutdownEventConfiguration,
+        LayerLifecycleEventConfiguration,
+        LayerLoadBasedAutoScaling,
+        LayerRecipes,
+        LayerVolumeConfiguration,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class UserProfileProperties(ResourceProperties):
-    AllowSelfManagement = attrib(default=None)
-    IamUserArn = attrib(default=None)
-    SshPublicKey = attrib(default=None)
-    SshUsername = attrib(default=None)
+def _create_Stack():
+    class StackChefConfiguration(_PropertyType):
+        """The Chef Configuration property type for Stack in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for ChefConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-stack-chefconfiguration.html>`_
+        """
+
+        __slots__ = ("BerkshelfVersion", "ManageBerkshelf")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackChefConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BerkshelfVersion=None, ManageBerkshelf=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BerkshelfVersion", BerkshelfVersion)
+            _setattr("ManageBerkshelf", ManageBerkshelf)
+            _init_PropertyType(self, kwargs)
+
+    class StackElasticIp(_PropertyType):
+        """The Elastic Ip property type for Stack in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for ElasticIp
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-stack-elasticip.html>`_
+        """
+
+        __slots__ = ("Ip", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackElasticIp", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Ip=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ip", Ip)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class StackRdsDbInstance(_PropertyType):
+        """The Rds Db Instance property type for Stack in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for RdsDbInstance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-stack-rdsdbinstance.html>`_
+        """
 
+        __slots__ = ("DbPassword", "DbUser", "RdsDbInstanceArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackRdsDbInstance", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class UserProfile(Resource):
-    """A User Profile for OpsWorks.
+        def __init__(
+            self, *, DbPassword=None, DbUser=None, RdsDbInstanceArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DbPassword", DbPassword)
+            _setattr("DbUser", DbUser)
+            _setattr("RdsDbInstanceArn", RdsDbInstanceArn)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for UserProfile
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-userprofile.html>`_
-    """
+    class StackSource(_PropertyType):
+        """The Source property type for Stack in OpsWorks.
 
-    RESOURCE_TYPE = "AWS::OpsWorks::UserProfile"
+        See Also:
+            `AWS Cloud Formation documentation for Source
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-stack-source.html>`_
+        """
 
-    Properties: UserProfileProperties = attrib(
-        factory=UserProfileProperties,
-        converter=create_object_converter(UserProfileProperties),
+        __slots__ = ("Password", "Revision", "SshKey", "Type", "Url", "Username")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackSource", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Password=None,
+            Revision=None,
+            SshKey=None,
+            Type=None,
+            Url=None,
+            Username=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Password", Password)
+            _setattr("Revision", Revision)
+            _setattr("SshKey", SshKey)
+            _setattr("Type", Type)
+            _setattr("Url", Url)
+            _setattr("Username", Username)
+            _init_PropertyType(self, kwargs)
+
+    class StackStackConfigurationManager(_PropertyType):
+        """The Stack Configuration Manager property type for Stack in OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for StackConfigurationManager
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworks-stack-stackconfigmanager.html>`_
+        """
+
+        __slots__ = ("Name", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackStackConfigurationManager", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Version=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    _convert_StackChefConfiguration = create_object_converter(StackChefConfiguration)
+    _convert_StackStackConfigurationManager = create_object_converter(
+        StackStackConfigurationManager
     )
+    _convert_StackSource = create_object_converter(StackSource)
+    _convert_StackElasticIp_list = create_object_list_converter(StackElasticIp)
+    _convert_StackRdsDbInstance_list = create_object_list_converter(StackRdsDbInstance)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class StackProperties(_ResourceProperties):
+        __slots__ = (
+            "AgentVersion",
+            "Attributes",
+            "ChefConfiguration",
+            "CloneAppIds",
+            "ClonePermissions",
+            "ConfigurationManager",
+            "CustomCookbooksSource",
+            "CustomJson",
+            "DefaultAvailabilityZone",
+            "DefaultInstanceProfileArn",
+            "DefaultOs",
+            "DefaultRootDeviceType",
+            "DefaultSshKeyName",
+            "DefaultSubnetId",
+            "EcsClusterArn",
+            "ElasticIps",
+            "HostnameTheme",
+            "Name",
+            "RdsDbInstances",
+            "ServiceRoleArn",
+            "SourceStackId",
+            "Tags",
+            "UseCustomCookbooks",
+            "UseOpsworksSecurityGroups",
+            "VpcId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ChefConfiguration": _convert_StackChefConfiguration,
+                "ConfigurationManager": _convert_StackStackConfigurationManager,
+                "CustomCookbooksSource": _convert_StackSource,
+                "ElasticIps": _convert_StackElasticIp_list,
+                "RdsDbInstances": _convert_StackRdsDbInstance_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AgentVersion=None,
+            Attributes=None,
+            ChefConfiguration=None,
+            CloneAppIds=None,
+            ClonePermissions=None,
+            ConfigurationManager=None,
+            CustomCookbooksSource=None,
+            CustomJson=None,
+            DefaultAvailabilityZone=None,
+            DefaultInstanceProfileArn=None,
+            DefaultOs=None,
+            DefaultRootDeviceType=None,
+            DefaultSshKeyName=None,
+            DefaultSubnetId=None,
+            EcsClusterArn=None,
+            ElasticIps=None,
+            HostnameTheme=None,
+            Name=None,
+            RdsDbInstances=None,
+            ServiceRoleArn=None,
+            SourceStackId=None,
+            Tags=None,
+            UseCustomCookbooks=None,
+            UseOpsworksSecurityGroups=None,
+            VpcId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AgentVersion", AgentVersion)
+            _setattr("Attributes", Attributes)
+            _setattr(
+                "ChefConfiguration", _convert_StackChefConfiguration(ChefConfiguration)
+            )
+            _setattr("CloneAppIds", CloneAppIds)
+            _setattr("ClonePermissions", ClonePermissions)
+            _setattr(
+                "ConfigurationManager",
+                _convert_StackStackConfigurationManager(ConfigurationManager),
+            )
+            _setattr(
+                "CustomCookbooksSource", _convert_StackSource(CustomCookbooksSource)
+            )
+            _setattr("CustomJson", CustomJson)
+            _setattr("DefaultAvailabilityZone", DefaultAvailabilityZone)
+            _setattr("DefaultInstanceProfileArn", DefaultInstanceProfileArn)
+            _setattr("DefaultOs", DefaultOs)
+            _setattr("DefaultRootDeviceType", DefaultRootDeviceType)
+            _setattr("DefaultSshKeyName", DefaultSshKeyName)
+            _setattr("DefaultSubnetId", DefaultSubnetId)
+            _setattr("EcsClusterArn", EcsClusterArn)
+            _setattr("ElasticIps", _convert_StackElasticIp_list(ElasticIps))
+            _setattr("HostnameTheme", HostnameTheme)
+            _setattr("Name", Name)
+            _setattr("RdsDbInstances", _convert_StackRdsDbInstance_list(RdsDbInstances))
+            _setattr("ServiceRoleArn", ServiceRoleArn)
+            _setattr("SourceStackId", SourceStackId)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("UseCustomCookbooks", UseCustomCookbooks)
+            _setattr("UseOpsworksSecurityGroups", UseOpsworksSecurityGroups)
+            _setattr("VpcId", VpcId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StackProperties = create_object_converter(StackProperties)
 
+    class Stack(_Resource):
+        """A Stack for OpsWorks.
 
-@attrs(**ATTRSCONFIG)
-class VolumeProperties(ResourceProperties):
-    Ec2VolumeId = attrib(default=None)
-    MountPoint = attrib(default=None)
-    Name = attrib(default=None)
-    StackId = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for Stack
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-stack.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::OpsWorks::Stack"
 
-@attrs(**ATTRSCONFIG)
-class Volume(Resource):
-    """A Volume for OpsWorks.
+        Properties: StackProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for Volume
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-volume.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Stack",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StackProperties},
+            factories={"Properties": StackProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::OpsWorks::Volume"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StackProperties()
+            _setattr("Properties", _convert_StackProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    Properties: VolumeProperties = attrib(
-        factory=VolumeProperties, converter=create_object_converter(VolumeProperties)
+    return (
+        Stack,
+        StackProperties,
+        StackChefConfiguration,
+        StackElasticIp,
+        StackRdsDbInstance,
+        StackSource,
+        StackStackConfigurationManager,
     )
+
+
+def _create_UserProfile():
+    class UserProfileProperties(_ResourceProperties):
+        __slots__ = ("AllowSelfManagement", "IamUserArn", "SshPublicKey", "SshUsername")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserProfileProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowSelfManagement=None,
+            IamUserArn=None,
+            SshPublicKey=None,
+            SshUsername=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowSelfManagement", AllowSelfManagement)
+            _setattr("IamUserArn", IamUserArn)
+            _setattr("SshPublicKey", SshPublicKey)
+            _setattr("SshUsername", SshUsername)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserProfileProperties = create_object_converter(UserProfileProperties)
+
+    class UserProfile(_Resource):
+        """A User Profile for OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for UserProfile
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-userprofile.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::OpsWorks::UserProfile"
+
+        Properties: UserProfileProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserProfile",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserProfileProperties},
+            factories={"Properties": UserProfileProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserProfileProperties()
+            _setattr("Properties", _convert_UserProfileProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return UserProfile, UserProfileProperties
+
+
+def _create_Volume():
+    class VolumeProperties(_ResourceProperties):
+        __slots__ = ("Ec2VolumeId", "MountPoint", "Name", "StackId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VolumeProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Ec2VolumeId=None,
+            MountPoint=None,
+            Name=None,
+            StackId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ec2VolumeId", Ec2VolumeId)
+            _setattr("MountPoint", MountPoint)
+            _setattr("Name", Name)
+            _setattr("StackId", StackId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VolumeProperties = create_object_converter(VolumeProperties)
+
+    class Volume(_Resource):
+        """A Volume for OpsWorks.
+
+        See Also:
+            `AWS Cloud Formation documentation for Volume
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworks-volume.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::OpsWorks::Volume"
+
+        Properties: VolumeProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Volume",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VolumeProperties},
+            factories={"Properties": VolumeProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VolumeProperties()
+            _setattr("Properties", _convert_VolumeProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Volume, VolumeProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "App": _create_App,
+        "AppProperties": _create_App,
+        "AppDataSource": _create_App,
+        "AppEnvironmentVariable": _create_App,
+        "AppSource": _create_App,
+        "AppSslConfiguration": _create_App,
+        "ElasticLoadBalancerAttachment": _create_ElasticLoadBalancerAttachment,
+        "ElasticLoadBalancerAttachmentProperties": _create_ElasticLoadBalancerAttachment,
+        "Instance": _create_Instance,
+        "InstanceProperties": _create_Instance,
+        "InstanceBlockDeviceMapping": _create_Instance,
+        "InstanceEbsBlockDevice": _create_Instance,
+        "InstanceTimeBasedAutoScaling": _create_Instance,
+        "Layer": _create_Layer,
+        "LayerProperties": _create_Layer,
+        "LayerAutoScalingThresholds": _create_Layer,
+        "LayerLifecycleEventConfiguration": _create_Layer,
+        "LayerLoadBasedAutoScaling": _create_Layer,
+        "LayerRecipes": _create_Layer,
+        "LayerShutdownEventConfiguration": _create_Layer,
+        "LayerVolumeConfiguration": _create_Layer,
+        "Stack": _create_Stack,
+        "StackProperties": _create_Stack,
+        "StackChefConfiguration": _create_Stack,
+        "StackElasticIp": _create_Stack,
+        "StackRdsDbInstance": _create_Stack,
+        "StackSource": _create_Stack,
+        "StackStackConfigurationManager": _create_Stack,
+        "UserProfile": _create_UserProfile,
+        "UserProfileProperties": _create_UserProfile,
+        "Volume": _create_Volume,
+        "VolumeProperties": _create_Volume,
+    },
+)
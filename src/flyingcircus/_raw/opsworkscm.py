@@ -7,52 +7,182 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Server", "ServerProperties"]
-
-
-@attrs(**ATTRSCONFIG)
-class ServerProperties(ResourceProperties):
-    AssociatePublicIpAddress = attrib(default=None)
-    BackupId = attrib(default=None)
-    BackupRetentionCount = attrib(default=None)
-    CustomCertificate = attrib(default=None)
-    CustomDomain = attrib(default=None)
-    CustomPrivateKey = attrib(default=None)
-    DisableAutomatedBackup = attrib(default=None)
-    Engine = attrib(default=None)
-    EngineAttributes = attrib(default=None)
-    EngineModel = attrib(default=None)
-    EngineVersion = attrib(default=None)
-    InstanceProfileArn = attrib(default=None)
-    InstanceType = attrib(default=None)
-    KeyPair = attrib(default=None)
-    PreferredBackupWindow = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    SecurityGroupIds = attrib(default=None)
-    ServerName = attrib(default=None)
-    ServiceRoleArn = attrib(default=None)
-    SubnetIds = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Server(Resource):
-    """A Server for OpsWorksCM.
-
-    See Also:
-        `AWS Cloud Formation documentation for Server
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworkscm-server.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::OpsWorksCM::Server"
-
-    Properties: ServerProperties = attrib(
-        factory=ServerProperties, converter=create_object_converter(ServerProperties)
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
+__all__ = [
+    "Server",
+    "ServerProperties",
+    "ServerEngineAttribute",
+]
+
+
+def _create_Server():
+    class ServerEngineAttribute(_PropertyType):
+        """The Engine Attribute property type for Server in OpsWorksCM.
+
+        See Also:
+            `AWS Cloud Formation documentation for EngineAttribute
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-opsworkscm-server-engineattribute.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServerEngineAttribute", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ServerEngineAttribute_list = create_object_list_converter(
+        ServerEngineAttribute
     )
+
+    class ServerProperties(_ResourceProperties):
+        __slots__ = (
+            "AssociatePublicIpAddress",
+            "BackupId",
+            "BackupRetentionCount",
+            "CustomCertificate",
+            "CustomDomain",
+            "CustomPrivateKey",
+            "DisableAutomatedBackup",
+            "Engine",
+            "EngineAttributes",
+            "EngineModel",
+            "EngineVersion",
+            "InstanceProfileArn",
+            "InstanceType",
+            "KeyPair",
+            "PreferredBackupWindow",
+            "PreferredMaintenanceWindow",
+            "SecurityGroupIds",
+            "ServerName",
+            "ServiceRoleArn",
+            "SubnetIds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"EngineAttributes": _convert_ServerEngineAttribute_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssociatePublicIpAddress=None,
+            BackupId=None,
+            BackupRetentionCount=None,
+            CustomCertificate=None,
+            CustomDomain=None,
+            CustomPrivateKey=None,
+            DisableAutomatedBackup=None,
+            Engine=None,
+            EngineAttributes=None,
+            EngineModel=None,
+            EngineVersion=None,
+            InstanceProfileArn=None,
+            InstanceType=None,
+            KeyPair=None,
+            PreferredBackupWindow=None,
+            PreferredMaintenanceWindow=None,
+            SecurityGroupIds=None,
+            ServerName=None,
+            ServiceRoleArn=None,
+            SubnetIds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssociatePublicIpAddress", AssociatePublicIpAddress)
+            _setattr("BackupId", BackupId)
+            _setattr("BackupRetentionCount", BackupRetentionCount)
+            _setattr("CustomCertificate", CustomCertificate)
+            _setattr("CustomDomain", CustomDomain)
+            _setattr("CustomPrivateKey", CustomPrivateKey)
+            _setattr("DisableAutomatedBackup", DisableAutomatedBackup)
+            _setattr("Engine", Engine)
+            _setattr(
+                "EngineAttributes",
+                _convert_ServerEngineAttribute_list(EngineAttributes),
+            )
+            _setattr("EngineModel", EngineModel)
+            _setattr("EngineVersion", EngineVersion)
+            _setattr("InstanceProfileArn", InstanceProfileArn)
+            _setattr("InstanceType", InstanceType)
+            _setattr("KeyPair", KeyPair)
+            _setattr("PreferredBackupWindow", PreferredBackupWindow)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("ServerName", ServerName)
+            _setattr("ServiceRoleArn", ServiceRoleArn)
+            _setattr("SubnetIds", SubnetIds)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ServerProperties = create_object_converter(ServerProperties)
+
+    class Server(_Resource):
+        """A Server for OpsWorksCM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Server
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-opsworkscm-server.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::OpsWorksCM::Server"
+
+        Properties: ServerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Server",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ServerProperties},
+            factories={"Properties": ServerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ServerProperties()
+            _setattr("Properties", _convert_ServerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Server, ServerProperties, ServerEngineAttribute
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Server": _create_Server,
+        "ServerProperties": _create_Server,
+        "ServerEngineAttribute": _create_Server,
+    },
+)
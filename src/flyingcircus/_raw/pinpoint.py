@@ -7,13 +7,20 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "ADMChannel",
@@ -30,10 +37,27 @@ __all__ = [
     "AppProperties",
     "ApplicationSettings",
     "ApplicationSettingsProperties",
+    "ApplicationSettingsCampaignHook",
+    "ApplicationSettingsLimits",
+    "ApplicationSettingsQuietTime",
     "BaiduChannel",
     "BaiduChannelProperties",
     "Campaign",
     "CampaignProperties",
+    "CampaignAttributeDimension",
+    "CampaignCampaignEmailMessage",
+    "CampaignCampaignEventFilter",
+    "CampaignCampaignHook",
+    "CampaignCampaignSmsMessage",
+    "CampaignEventDimensions",
+    "CampaignLimits",
+    "CampaignMessage",
+    "CampaignMessageConfiguration",
+    "CampaignMetricDimension",
+    "CampaignQuietTime",
+    "CampaignSchedule",
+    "CampaignSetDimension",
+    "CampaignWriteTreatmentResource",
     "EmailChannel",
     "EmailChannelProperties",
     "EmailTemplate",
@@ -44,10 +68,25 @@ __all__ = [
     "GCMChannelProperties",
     "PushTemplate",
     "PushTemplateProperties",
-    "Segment",
-    "SegmentProperties",
+    "PushTemplateAndroidPushNotificationTemplate",
+    "PushTemplateAPNSPushNotificationTemplate",
+    "PushTemplateDefaultPushNotificationTemplate",
     "SMSChannel",
     "SMSChannelProperties",
+    "Segment",
+    "SegmentProperties",
+    "SegmentAttributeDimension",
+    "SegmentBehavior",
+    "SegmentCoordinates",
+    "SegmentDemographic",
+    "SegmentGPSPoint",
+    "SegmentGroups",
+    "SegmentLocation",
+    "SegmentRecency",
+    "SegmentSegmentDimensions",
+    "SegmentSegmentGroups",
+    "SegmentSetDimension",
+    "SegmentSourceSegments",
     "SmsTemplate",
     "SmsTemplateProperties",
     "VoiceChannel",
@@ -55,487 +94,2551 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ADMChannelProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    ClientId = attrib(default=None)
-    ClientSecret = attrib(default=None)
-    Enabled = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ADMChannel(Resource):
-    """A Adm Channel for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for ADMChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-admchannel.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::ADMChannel"
-
-    Properties: ADMChannelProperties = attrib(
-        factory=ADMChannelProperties,
-        converter=create_object_converter(ADMChannelProperties),
+def _create_ADMChannel():
+    class ADMChannelProperties(_ResourceProperties):
+        __slots__ = ("ApplicationId", "ClientId", "ClientSecret", "Enabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ADMChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            ClientId=None,
+            ClientSecret=None,
+            Enabled=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("ClientId", ClientId)
+            _setattr("ClientSecret", ClientSecret)
+            _setattr("Enabled", Enabled)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ADMChannelProperties = create_object_converter(ADMChannelProperties)
+
+    class ADMChannel(_Resource):
+        """A Adm Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for ADMChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-admchannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::ADMChannel"
+
+        Properties: ADMChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ADMChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ADMChannelProperties},
+            factories={"Properties": ADMChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ADMChannelProperties()
+            _setattr("Properties", _convert_ADMChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ADMChannel, ADMChannelProperties
+
+
+def _create_APNSChannel():
+    class APNSChannelProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationId",
+            "BundleId",
+            "Certificate",
+            "DefaultAuthenticationMethod",
+            "Enabled",
+            "PrivateKey",
+            "TeamId",
+            "TokenKey",
+            "TokenKeyId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "APNSChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            BundleId=None,
+            Certificate=None,
+            DefaultAuthenticationMethod=None,
+            Enabled=None,
+            PrivateKey=None,
+            TeamId=None,
+            TokenKey=None,
+            TokenKeyId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("BundleId", BundleId)
+            _setattr("Certificate", Certificate)
+            _setattr("DefaultAuthenticationMethod", DefaultAuthenticationMethod)
+            _setattr("Enabled", Enabled)
+            _setattr("PrivateKey", PrivateKey)
+            _setattr("TeamId", TeamId)
+            _setattr("TokenKey", TokenKey)
+            _setattr("TokenKeyId", TokenKeyId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_APNSChannelProperties = create_object_converter(APNSChannelProperties)
+
+    class APNSChannel(_Resource):
+        """A Apns Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for APNSChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-apnschannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::APNSChannel"
+
+        Properties: APNSChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "APNSChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_APNSChannelProperties},
+            factories={"Properties": APNSChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = APNSChannelProperties()
+            _setattr("Properties", _convert_APNSChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return APNSChannel, APNSChannelProperties
+
+
+def _create_APNSSandboxChannel():
+    class APNSSandboxChannelProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationId",
+            "BundleId",
+            "Certificate",
+            "DefaultAuthenticationMethod",
+            "Enabled",
+            "PrivateKey",
+            "TeamId",
+            "TokenKey",
+            "TokenKeyId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "APNSSandboxChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            BundleId=None,
+            Certificate=None,
+            DefaultAuthenticationMethod=None,
+            Enabled=None,
+            PrivateKey=None,
+            TeamId=None,
+            TokenKey=None,
+            TokenKeyId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("BundleId", BundleId)
+            _setattr("Certificate", Certificate)
+            _setattr("DefaultAuthenticationMethod", DefaultAuthenticationMethod)
+            _setattr("Enabled", Enabled)
+            _setattr("PrivateKey", PrivateKey)
+            _setattr("TeamId", TeamId)
+            _setattr("TokenKey", TokenKey)
+            _setattr("TokenKeyId", TokenKeyId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_APNSSandboxChannelProperties = create_object_converter(
+        APNSSandboxChannelProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class APNSChannelProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    BundleId = attrib(default=None)
-    Certificate = attrib(default=None)
-    DefaultAuthenticationMethod = attrib(default=None)
-    Enabled = attrib(default=None)
-    PrivateKey = attrib(default=None)
-    TeamId = attrib(default=None)
-    TokenKey = attrib(default=None)
-    TokenKeyId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class APNSChannel(Resource):
-    """A Apns Channel for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for APNSChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-apnschannel.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::APNSChannel"
-
-    Properties: APNSChannelProperties = attrib(
-        factory=APNSChannelProperties,
-        converter=create_object_converter(APNSChannelProperties),
+    class APNSSandboxChannel(_Resource):
+        """A Apns Sandbox Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for APNSSandboxChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-apnssandboxchannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::APNSSandboxChannel"
+
+        Properties: APNSSandboxChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "APNSSandboxChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_APNSSandboxChannelProperties},
+            factories={"Properties": APNSSandboxChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = APNSSandboxChannelProperties()
+            _setattr("Properties", _convert_APNSSandboxChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return APNSSandboxChannel, APNSSandboxChannelProperties
+
+
+def _create_APNSVoipChannel():
+    class APNSVoipChannelProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationId",
+            "BundleId",
+            "Certificate",
+            "DefaultAuthenticationMethod",
+            "Enabled",
+            "PrivateKey",
+            "TeamId",
+            "TokenKey",
+            "TokenKeyId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "APNSVoipChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            BundleId=None,
+            Certificate=None,
+            DefaultAuthenticationMethod=None,
+            Enabled=None,
+            PrivateKey=None,
+            TeamId=None,
+            TokenKey=None,
+            TokenKeyId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("BundleId", BundleId)
+            _setattr("Certificate", Certificate)
+            _setattr("DefaultAuthenticationMethod", DefaultAuthenticationMethod)
+            _setattr("Enabled", Enabled)
+            _setattr("PrivateKey", PrivateKey)
+            _setattr("TeamId", TeamId)
+            _setattr("TokenKey", TokenKey)
+            _setattr("TokenKeyId", TokenKeyId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_APNSVoipChannelProperties = create_object_converter(
+        APNSVoipChannelProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class APNSSandboxChannelProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    BundleId = attrib(default=None)
-    Certificate = attrib(default=None)
-    DefaultAuthenticationMethod = attrib(default=None)
-    Enabled = attrib(default=None)
-    PrivateKey = attrib(default=None)
-    TeamId = attrib(default=None)
-    TokenKey = attrib(default=None)
-    TokenKeyId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class APNSSandboxChannel(Resource):
-    """A Apns Sandbox Channel for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for APNSSandboxChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-apnssandboxchannel.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::APNSSandboxChannel"
-
-    Properties: APNSSandboxChannelProperties = attrib(
-        factory=APNSSandboxChannelProperties,
-        converter=create_object_converter(APNSSandboxChannelProperties),
+    class APNSVoipChannel(_Resource):
+        """A Apns Voip Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for APNSVoipChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-apnsvoipchannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::APNSVoipChannel"
+
+        Properties: APNSVoipChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "APNSVoipChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_APNSVoipChannelProperties},
+            factories={"Properties": APNSVoipChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = APNSVoipChannelProperties()
+            _setattr("Properties", _convert_APNSVoipChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return APNSVoipChannel, APNSVoipChannelProperties
+
+
+def _create_APNSVoipSandboxChannel():
+    class APNSVoipSandboxChannelProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationId",
+            "BundleId",
+            "Certificate",
+            "DefaultAuthenticationMethod",
+            "Enabled",
+            "PrivateKey",
+            "TeamId",
+            "TokenKey",
+            "TokenKeyId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "APNSVoipSandboxChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            BundleId=None,
+            Certificate=None,
+            DefaultAuthenticationMethod=None,
+            Enabled=None,
+            PrivateKey=None,
+            TeamId=None,
+            TokenKey=None,
+            TokenKeyId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("BundleId", BundleId)
+            _setattr("Certificate", Certificate)
+            _setattr("DefaultAuthenticationMethod", DefaultAuthenticationMethod)
+            _setattr("Enabled", Enabled)
+            _setattr("PrivateKey", PrivateKey)
+            _setattr("TeamId", TeamId)
+            _setattr("TokenKey", TokenKey)
+            _setattr("TokenKeyId", TokenKeyId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_APNSVoipSandboxChannelProperties = create_object_converter(
+        APNSVoipSandboxChannelProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class APNSVoipChannelProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    BundleId = attrib(default=None)
-    Certificate = attrib(default=None)
-    DefaultAuthenticationMethod = attrib(default=None)
-    Enabled = attrib(default=None)
-    PrivateKey = attrib(default=None)
-    TeamId = attrib(default=None)
-    TokenKey = attrib(default=None)
-    TokenKeyId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class APNSVoipChannel(Resource):
-    """A Apns Voip Channel for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for APNSVoipChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-apnsvoipchannel.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::APNSVoipChannel"
-
-    Properties: APNSVoipChannelProperties = attrib(
-        factory=APNSVoipChannelProperties,
-        converter=create_object_converter(APNSVoipChannelProperties),
+    class APNSVoipSandboxChannel(_Resource):
+        """A Apns Voip Sandbox Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for APNSVoipSandboxChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-apnsvoipsandboxchannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::APNSVoipSandboxChannel"
+
+        Properties: APNSVoipSandboxChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "APNSVoipSandboxChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_APNSVoipSandboxChannelProperties},
+            factories={"Properties": APNSVoipSandboxChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = APNSVoipSandboxChannelProperties()
+            _setattr(
+                "Properties", _convert_APNSVoipSandboxChannelProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return APNSVoipSandboxChannel, APNSVoipSandboxChannelProperties
+
+
+def _create_App():
+    class AppProperties(_ResourceProperties):
+        __slots__ = ("Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AppProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AppProperties = create_object_converter(AppProperties)
+
+    class App(_Resource):
+        """A App for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for App
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-app.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::App"
+        TAG_FORMAT = "Map"
+
+        Properties: AppProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "App",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AppProperties},
+            factories={"Properties": AppProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AppProperties()
+            _setattr("Properties", _convert_AppProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return App, AppProperties
+
+
+def _create_ApplicationSettings():
+    class ApplicationSettingsCampaignHook(_PropertyType):
+        """The Campaign Hook property type for ApplicationSettings in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for CampaignHook
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-applicationsettings-campaignhook.html>`_
+        """
+
+        __slots__ = ("LambdaFunctionName", "Mode", "WebUrl")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationSettingsCampaignHook", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, LambdaFunctionName=None, Mode=None, WebUrl=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LambdaFunctionName", LambdaFunctionName)
+            _setattr("Mode", Mode)
+            _setattr("WebUrl", WebUrl)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationSettingsLimits(_PropertyType):
+        """The Limits property type for ApplicationSettings in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Limits
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-applicationsettings-limits.html>`_
+        """
+
+        __slots__ = ("Daily", "MaximumDuration", "MessagesPerSecond", "Total")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationSettingsLimits", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Daily=None,
+            MaximumDuration=None,
+            MessagesPerSecond=None,
+            Total=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Daily", Daily)
+            _setattr("MaximumDuration", MaximumDuration)
+            _setattr("MessagesPerSecond", MessagesPerSecond)
+            _setattr("Total", Total)
+            _init_PropertyType(self, kwargs)
+
+    class ApplicationSettingsQuietTime(_PropertyType):
+        """The Quiet Time property type for ApplicationSettings in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for QuietTime
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-applicationsettings-quiettime.html>`_
+        """
+
+        __slots__ = ("End", "Start")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationSettingsQuietTime", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, End=None, Start=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("End", End)
+            _setattr("Start", Start)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ApplicationSettingsCampaignHook = create_object_converter(
+        ApplicationSettingsCampaignHook
     )
-
-
-@attrs(**ATTRSCONFIG)
-class APNSVoipSandboxChannelProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    BundleId = attrib(default=None)
-    Certificate = attrib(default=None)
-    DefaultAuthenticationMethod = attrib(default=None)
-    Enabled = attrib(default=None)
-    PrivateKey = attrib(default=None)
-    TeamId = attrib(default=None)
-    TokenKey = attrib(default=None)
-    TokenKeyId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class APNSVoipSandboxChannel(Resource):
-    """A Apns Voip Sandbox Channel for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for APNSVoipSandboxChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-apnsvoipsandboxchannel.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::APNSVoipSandboxChannel"
-
-    Properties: APNSVoipSandboxChannelProperties = attrib(
-        factory=APNSVoipSandboxChannelProperties,
-        converter=create_object_converter(APNSVoipSandboxChannelProperties),
+    _convert_ApplicationSettingsLimits = create_object_converter(
+        ApplicationSettingsLimits
     )
-
-
-@attrs(**ATTRSCONFIG)
-class AppProperties(ResourceProperties):
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class App(Resource):
-    """A App for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for App
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-app.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::App"
-
-    Properties: AppProperties = attrib(
-        factory=AppProperties, converter=create_object_converter(AppProperties)
+    _convert_ApplicationSettingsQuietTime = create_object_converter(
+        ApplicationSettingsQuietTime
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ApplicationSettingsProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    CampaignHook = attrib(default=None)
-    CloudWatchMetricsEnabled = attrib(default=None)
-    Limits = attrib(default=None)
-    QuietTime = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ApplicationSettings(Resource):
-    """A Application Settings for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for ApplicationSettings
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-applicationsettings.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::ApplicationSettings"
-
-    Properties: ApplicationSettingsProperties = attrib(
-        factory=ApplicationSettingsProperties,
-        converter=create_object_converter(ApplicationSettingsProperties),
+    class ApplicationSettingsProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationId",
+            "CampaignHook",
+            "CloudWatchMetricsEnabled",
+            "Limits",
+            "QuietTime",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationSettingsProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "CampaignHook": _convert_ApplicationSettingsCampaignHook,
+                "Limits": _convert_ApplicationSettingsLimits,
+                "QuietTime": _convert_ApplicationSettingsQuietTime,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            CampaignHook=None,
+            CloudWatchMetricsEnabled=None,
+            Limits=None,
+            QuietTime=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr(
+                "CampaignHook", _convert_ApplicationSettingsCampaignHook(CampaignHook)
+            )
+            _setattr("CloudWatchMetricsEnabled", CloudWatchMetricsEnabled)
+            _setattr("Limits", _convert_ApplicationSettingsLimits(Limits))
+            _setattr("QuietTime", _convert_ApplicationSettingsQuietTime(QuietTime))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ApplicationSettingsProperties = create_object_converter(
+        ApplicationSettingsProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class BaiduChannelProperties(ResourceProperties):
-    ApiKey = attrib(default=None)
-    ApplicationId = attrib(default=None)
-    Enabled = attrib(default=None)
-    SecretKey = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class BaiduChannel(Resource):
-    """A Baidu Channel for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for BaiduChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-baiduchannel.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::BaiduChannel"
-
-    Properties: BaiduChannelProperties = attrib(
-        factory=BaiduChannelProperties,
-        converter=create_object_converter(BaiduChannelProperties),
+    class ApplicationSettings(_Resource):
+        """A Application Settings for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for ApplicationSettings
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-applicationsettings.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::ApplicationSettings"
+
+        Properties: ApplicationSettingsProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ApplicationSettings",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ApplicationSettingsProperties},
+            factories={"Properties": ApplicationSettingsProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ApplicationSettingsProperties()
+            _setattr("Properties", _convert_ApplicationSettingsProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ApplicationSettings,
+        ApplicationSettingsProperties,
+        ApplicationSettingsCampaignHook,
+        ApplicationSettingsLimits,
+        ApplicationSettingsQuietTime,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class CampaignProperties(ResourceProperties):
-    AdditionalTreatments = attrib(default=None)
-    ApplicationId = attrib(default=None)
-    CampaignHook = attrib(default=None)
-    Description = attrib(default=None)
-    HoldoutPercent = attrib(default=None)
-    IsPaused = attrib(default=None)
-    Limits = attrib(default=None)
-    MessageConfiguration = attrib(default=None)
-    Name = attrib(default=None)
-    Schedule = attrib(default=None)
-    SegmentId = attrib(default=None)
-    SegmentVersion = attrib(default=None)
-    Tags = attrib(default=None)
-    TreatmentDescription = attrib(default=None)
-    TreatmentName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Campaign(Resource):
-    """A Campaign for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for Campaign
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-campaign.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::Campaign"
-
-    Properties: CampaignProperties = attrib(
-        factory=CampaignProperties,
-        converter=create_object_converter(CampaignProperties),
+def _create_BaiduChannel():
+    class BaiduChannelProperties(_ResourceProperties):
+        __slots__ = ("ApiKey", "ApplicationId", "Enabled", "SecretKey")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BaiduChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApiKey=None,
+            ApplicationId=None,
+            Enabled=None,
+            SecretKey=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiKey", ApiKey)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("Enabled", Enabled)
+            _setattr("SecretKey", SecretKey)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_BaiduChannelProperties = create_object_converter(BaiduChannelProperties)
+
+    class BaiduChannel(_Resource):
+        """A Baidu Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for BaiduChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-baiduchannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::BaiduChannel"
+
+        Properties: BaiduChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BaiduChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BaiduChannelProperties},
+            factories={"Properties": BaiduChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BaiduChannelProperties()
+            _setattr("Properties", _convert_BaiduChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return BaiduChannel, BaiduChannelProperties
+
+
+def _create_Campaign():
+    class CampaignAttributeDimension(_PropertyType):
+        """The Attribute Dimension property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for AttributeDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-attributedimension.html>`_
+        """
+
+        __slots__ = ("AttributeType", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignAttributeDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AttributeType=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AttributeType", AttributeType)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    class CampaignCampaignEmailMessage(_PropertyType):
+        """The Campaign Email Message property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for CampaignEmailMessage
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-campaignemailmessage.html>`_
+        """
+
+        __slots__ = ("Body", "FromAddress", "HtmlBody", "Title")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignCampaignEmailMessage", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Body=None, FromAddress=None, HtmlBody=None, Title=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Body", Body)
+            _setattr("FromAddress", FromAddress)
+            _setattr("HtmlBody", HtmlBody)
+            _setattr("Title", Title)
+            _init_PropertyType(self, kwargs)
+
+    class CampaignSetDimension(_PropertyType):
+        """The Set Dimension property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for SetDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-setdimension.html>`_
+        """
+
+        __slots__ = ("DimensionType", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignSetDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DimensionType=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DimensionType", DimensionType)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CampaignSetDimension = create_object_converter(CampaignSetDimension)
+
+    class CampaignEventDimensions(_PropertyType):
+        """The Event Dimensions property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for EventDimensions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-eventdimensions.html>`_
+        """
+
+        __slots__ = ("Attributes", "EventType", "Metrics")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignEventDimensions",
+            _PropertyType,
+            __slots__,
+            converters={"EventType": _convert_CampaignSetDimension},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Attributes=None, EventType=None, Metrics=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", Attributes)
+            _setattr("EventType", _convert_CampaignSetDimension(EventType))
+            _setattr("Metrics", Metrics)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CampaignEventDimensions = create_object_converter(CampaignEventDimensions)
+
+    class CampaignCampaignEventFilter(_PropertyType):
+        """The Campaign Event Filter property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for CampaignEventFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-campaigneventfilter.html>`_
+        """
+
+        __slots__ = ("Dimensions", "FilterType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignCampaignEventFilter",
+            _PropertyType,
+            __slots__,
+            converters={"Dimensions": _convert_CampaignEventDimensions},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Dimensions=None, FilterType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Dimensions", _convert_CampaignEventDimensions(Dimensions))
+            _setattr("FilterType", FilterType)
+            _init_PropertyType(self, kwargs)
+
+    class CampaignCampaignHook(_PropertyType):
+        """The Campaign Hook property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for CampaignHook
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-campaignhook.html>`_
+        """
+
+        __slots__ = ("LambdaFunctionName", "Mode", "WebUrl")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignCampaignHook", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, LambdaFunctionName=None, Mode=None, WebUrl=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LambdaFunctionName", LambdaFunctionName)
+            _setattr("Mode", Mode)
+            _setattr("WebUrl", WebUrl)
+            _init_PropertyType(self, kwargs)
+
+    class CampaignCampaignSmsMessage(_PropertyType):
+        """The Campaign Sms Message property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for CampaignSmsMessage
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-campaignsmsmessage.html>`_
+        """
+
+        __slots__ = ("Body", "MessageType", "SenderId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignCampaignSmsMessage", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Body=None, MessageType=None, SenderId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Body", Body)
+            _setattr("MessageType", MessageType)
+            _setattr("SenderId", SenderId)
+            _init_PropertyType(self, kwargs)
+
+    class CampaignLimits(_PropertyType):
+        """The Limits property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Limits
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-limits.html>`_
+        """
+
+        __slots__ = ("Daily", "MaximumDuration", "MessagesPerSecond", "Total")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignLimits", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Daily=None,
+            MaximumDuration=None,
+            MessagesPerSecond=None,
+            Total=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Daily", Daily)
+            _setattr("MaximumDuration", MaximumDuration)
+            _setattr("MessagesPerSecond", MessagesPerSecond)
+            _setattr("Total", Total)
+            _init_PropertyType(self, kwargs)
+
+    class CampaignMessage(_PropertyType):
+        """The Message property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Message
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-message.html>`_
+        """
+
+        __slots__ = (
+            "Action",
+            "Body",
+            "ImageIconUrl",
+            "ImageSmallIconUrl",
+            "ImageUrl",
+            "JsonBody",
+            "MediaUrl",
+            "RawContent",
+            "SilentPush",
+            "TimeToLive",
+            "Title",
+            "Url",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignMessage", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Action=None,
+            Body=None,
+            ImageIconUrl=None,
+            ImageSmallIconUrl=None,
+            ImageUrl=None,
+            JsonBody=None,
+            MediaUrl=None,
+            RawContent=None,
+            SilentPush=None,
+            TimeToLive=None,
+            Title=None,
+            Url=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", Action)
+            _setattr("Body", Body)
+            _setattr("ImageIconUrl", ImageIconUrl)
+            _setattr("ImageSmallIconUrl", ImageSmallIconUrl)
+            _setattr("ImageUrl", ImageUrl)
+            _setattr("JsonBody", JsonBody)
+            _setattr("MediaUrl", MediaUrl)
+            _setattr("RawContent", RawContent)
+            _setattr("SilentPush", SilentPush)
+            _setattr("TimeToLive", TimeToLive)
+            _setattr("Title", Title)
+            _setattr("Url", Url)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CampaignMessage = create_object_converter(CampaignMessage)
+    _convert_CampaignCampaignEmailMessage = create_object_converter(
+        CampaignCampaignEmailMessage
     )
-
-
-@attrs(**ATTRSCONFIG)
-class EmailChannelProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    ConfigurationSet = attrib(default=None)
-    Enabled = attrib(default=None)
-    FromAddress = attrib(default=None)
-    Identity = attrib(default=None)
-    RoleArn = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EmailChannel(Resource):
-    """A Email Channel for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for EmailChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-emailchannel.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::EmailChannel"
-
-    Properties: EmailChannelProperties = attrib(
-        factory=EmailChannelProperties,
-        converter=create_object_converter(EmailChannelProperties),
+    _convert_CampaignCampaignSmsMessage = create_object_converter(
+        CampaignCampaignSmsMessage
     )
 
-
-@attrs(**ATTRSCONFIG)
-class EmailTemplateProperties(ResourceProperties):
-    DefaultSubstitutions = attrib(default=None)
-    HtmlPart = attrib(default=None)
-    Subject = attrib(default=None)
-    Tags = attrib(default=None)
-    TemplateDescription = attrib(default=None)
-    TemplateName = attrib(default=None)
-    TextPart = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EmailTemplate(Resource):
-    """A Email Template for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for EmailTemplate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-emailtemplate.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::EmailTemplate"
-
-    Properties: EmailTemplateProperties = attrib(
-        factory=EmailTemplateProperties,
-        converter=create_object_converter(EmailTemplateProperties),
+    class CampaignMessageConfiguration(_PropertyType):
+        """The Message Configuration property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for MessageConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-messageconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "ADMMessage",
+            "APNSMessage",
+            "BaiduMessage",
+            "DefaultMessage",
+            "EmailMessage",
+            "GCMMessage",
+            "SMSMessage",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignMessageConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ADMMessage": _convert_CampaignMessage,
+                "APNSMessage": _convert_CampaignMessage,
+                "BaiduMessage": _convert_CampaignMessage,
+                "DefaultMessage": _convert_CampaignMessage,
+                "EmailMessage": _convert_CampaignCampaignEmailMessage,
+                "GCMMessage": _convert_CampaignMessage,
+                "SMSMessage": _convert_CampaignCampaignSmsMessage,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ADMMessage=None,
+            APNSMessage=None,
+            BaiduMessage=None,
+            DefaultMessage=None,
+            EmailMessage=None,
+            GCMMessage=None,
+            SMSMessage=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ADMMessage", _convert_CampaignMessage(ADMMessage))
+            _setattr("APNSMessage", _convert_CampaignMessage(APNSMessage))
+            _setattr("BaiduMessage", _convert_CampaignMessage(BaiduMessage))
+            _setattr("DefaultMessage", _convert_CampaignMessage(DefaultMessage))
+            _setattr(
+                "EmailMessage", _convert_CampaignCampaignEmailMessage(EmailMessage)
+            )
+            _setattr("GCMMessage", _convert_CampaignMessage(GCMMessage))
+            _setattr("SMSMessage", _convert_CampaignCampaignSmsMessage(SMSMessage))
+            _init_PropertyType(self, kwargs)
+
+    class CampaignMetricDimension(_PropertyType):
+        """The Metric Dimension property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-metricdimension.html>`_
+        """
+
+        __slots__ = ("ComparisonOperator", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignMetricDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ComparisonOperator=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComparisonOperator", ComparisonOperator)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class CampaignQuietTime(_PropertyType):
+        """The Quiet Time property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for QuietTime
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-schedule-quiettime.html>`_
+        """
+
+        __slots__ = ("End", "Start")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignQuietTime", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, End=None, Start=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("End", End)
+            _setattr("Start", Start)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CampaignCampaignEventFilter = create_object_converter(
+        CampaignCampaignEventFilter
     )
-
-
-@attrs(**ATTRSCONFIG)
-class EventStreamProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    DestinationStreamArn = attrib(default=None)
-    RoleArn = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EventStream(Resource):
-    """A Event Stream for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for EventStream
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-eventstream.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::EventStream"
-
-    Properties: EventStreamProperties = attrib(
-        factory=EventStreamProperties,
-        converter=create_object_converter(EventStreamProperties),
+    _convert_CampaignQuietTime = create_object_converter(CampaignQuietTime)
+
+    class CampaignSchedule(_PropertyType):
+        """The Schedule property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Schedule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-schedule.html>`_
+        """
+
+        __slots__ = (
+            "EndTime",
+            "EventFilter",
+            "Frequency",
+            "IsLocalTime",
+            "QuietTime",
+            "StartTime",
+            "TimeZone",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignSchedule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "EventFilter": _convert_CampaignCampaignEventFilter,
+                "QuietTime": _convert_CampaignQuietTime,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EndTime=None,
+            EventFilter=None,
+            Frequency=None,
+            IsLocalTime=None,
+            QuietTime=None,
+            StartTime=None,
+            TimeZone=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EndTime", EndTime)
+            _setattr("EventFilter", _convert_CampaignCampaignEventFilter(EventFilter))
+            _setattr("Frequency", Frequency)
+            _setattr("IsLocalTime", IsLocalTime)
+            _setattr("QuietTime", _convert_CampaignQuietTime(QuietTime))
+            _setattr("StartTime", StartTime)
+            _setattr("TimeZone", TimeZone)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CampaignMessageConfiguration = create_object_converter(
+        CampaignMessageConfiguration
     )
-
-
-@attrs(**ATTRSCONFIG)
-class GCMChannelProperties(ResourceProperties):
-    ApiKey = attrib(default=None)
-    ApplicationId = attrib(default=None)
-    Enabled = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class GCMChannel(Resource):
-    """A Gcm Channel for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for GCMChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-gcmchannel.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::GCMChannel"
-
-    Properties: GCMChannelProperties = attrib(
-        factory=GCMChannelProperties,
-        converter=create_object_converter(GCMChannelProperties),
+    _convert_CampaignSchedule = create_object_converter(CampaignSchedule)
+
+    class CampaignWriteTreatmentResource(_PropertyType):
+        """The Write Treatment Resource property type for Campaign in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for WriteTreatmentResource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-campaign-writetreatmentresource.html>`_
+        """
+
+        __slots__ = (
+            "MessageConfiguration",
+            "Schedule",
+            "SizePercent",
+            "TreatmentDescription",
+            "TreatmentName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignWriteTreatmentResource",
+            _PropertyType,
+            __slots__,
+            converters={
+                "MessageConfiguration": _convert_CampaignMessageConfiguration,
+                "Schedule": _convert_CampaignSchedule,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MessageConfiguration=None,
+            Schedule=None,
+            SizePercent=None,
+            TreatmentDescription=None,
+            TreatmentName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "MessageConfiguration",
+                _convert_CampaignMessageConfiguration(MessageConfiguration),
+            )
+            _setattr("Schedule", _convert_CampaignSchedule(Schedule))
+            _setattr("SizePercent", SizePercent)
+            _setattr("TreatmentDescription", TreatmentDescription)
+            _setattr("TreatmentName", TreatmentName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CampaignWriteTreatmentResource_list = create_object_list_converter(
+        CampaignWriteTreatmentResource
     )
-
-
-@attrs(**ATTRSCONFIG)
-class PushTemplateProperties(ResourceProperties):
-    ADM = attrib(default=None)
-    APNS = attrib(default=None)
-    Baidu = attrib(default=None)
-    Default = attrib(default=None)
-    DefaultSubstitutions = attrib(default=None)
-    GCM = attrib(default=None)
-    Tags = attrib(default=None)
-    TemplateDescription = attrib(default=None)
-    TemplateName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class PushTemplate(Resource):
-    """A Push Template for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for PushTemplate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-pushtemplate.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::PushTemplate"
-
-    Properties: PushTemplateProperties = attrib(
-        factory=PushTemplateProperties,
-        converter=create_object_converter(PushTemplateProperties),
+    _convert_CampaignCampaignHook = create_object_converter(CampaignCampaignHook)
+    _convert_CampaignLimits = create_object_converter(CampaignLimits)
+
+    class CampaignProperties(_ResourceProperties):
+        __slots__ = (
+            "AdditionalTreatments",
+            "ApplicationId",
+            "CampaignHook",
+            "Description",
+            "HoldoutPercent",
+            "IsPaused",
+            "Limits",
+            "MessageConfiguration",
+            "Name",
+            "Schedule",
+            "SegmentId",
+            "SegmentVersion",
+            "Tags",
+            "TreatmentDescription",
+            "TreatmentName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CampaignProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AdditionalTreatments": _convert_CampaignWriteTreatmentResource_list,
+                "CampaignHook": _convert_CampaignCampaignHook,
+                "Limits": _convert_CampaignLimits,
+                "MessageConfiguration": _convert_CampaignMessageConfiguration,
+                "Schedule": _convert_CampaignSchedule,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AdditionalTreatments=None,
+            ApplicationId=None,
+            CampaignHook=None,
+            Description=None,
+            HoldoutPercent=None,
+            IsPaused=None,
+            Limits=None,
+            MessageConfiguration=None,
+            Name=None,
+            Schedule=None,
+            SegmentId=None,
+            SegmentVersion=None,
+            Tags=None,
+            TreatmentDescription=None,
+            TreatmentName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AdditionalTreatments",
+                _convert_CampaignWriteTreatmentResource_list(AdditionalTreatments),
+            )
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("CampaignHook", _convert_CampaignCampaignHook(CampaignHook))
+            _setattr("Description", Description)
+            _setattr("HoldoutPercent", HoldoutPercent)
+            _setattr("IsPaused", IsPaused)
+            _setattr("Limits", _convert_CampaignLimits(Limits))
+            _setattr(
+                "MessageConfiguration",
+                _convert_CampaignMessageConfiguration(MessageConfiguration),
+            )
+            _setattr("Name", Name)
+            _setattr("Schedule", _convert_CampaignSchedule(Schedule))
+            _setattr("SegmentId", SegmentId)
+            _setattr("SegmentVersion", SegmentVersion)
+            _setattr("Tags", Tags)
+            _setattr("TreatmentDescription", TreatmentDescription)
+            _setattr("TreatmentName", TreatmentName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CampaignProperties = create_object_converter(CampaignProperties)
+
+    class Campaign(_Resource):
+        """A Campaign for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Campaign
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-campaign.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::Campaign"
+        TAG_FORMAT = "Map"
+
+        Properties: CampaignProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Campaign",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CampaignProperties},
+            factories={"Properties": CampaignProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CampaignProperties()
+            _setattr("Properties", _convert_CampaignProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Campaign,
+        CampaignProperties,
+        CampaignAttributeDimension,
+        CampaignCampaignEmailMessage,
+        CampaignSetDimension,
+        CampaignEventDimensions,
+        CampaignCampaignEventFilter,
+        CampaignCampaignHook,
+        CampaignCampaignSmsMessage,
+        CampaignLimits,
+        CampaignMessage,
+        CampaignMessageConfiguration,
+        CampaignMetricDimension,
+        CampaignQuietTime,
+        CampaignSchedule,
+        CampaignWriteTreatmentResource,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class SMSChannelProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    Enabled = attrib(default=None)
-    SenderId = attrib(default=None)
-    ShortCode = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SMSChannel(Resource):
-    """A Sms Channel for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for SMSChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-smschannel.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::SMSChannel"
-
-    Properties: SMSChannelProperties = attrib(
-        factory=SMSChannelProperties,
-        converter=create_object_converter(SMSChannelProperties),
+def _create_EmailChannel():
+    class EmailChannelProperties(_ResourceProperties):
+        __slots__ = (
+            "ApplicationId",
+            "ConfigurationSet",
+            "Enabled",
+            "FromAddress",
+            "Identity",
+            "RoleArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EmailChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            ConfigurationSet=None,
+            Enabled=None,
+            FromAddress=None,
+            Identity=None,
+            RoleArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("ConfigurationSet", ConfigurationSet)
+            _setattr("Enabled", Enabled)
+            _setattr("FromAddress", FromAddress)
+            _setattr("Identity", Identity)
+            _setattr("RoleArn", RoleArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EmailChannelProperties = create_object_converter(EmailChannelProperties)
+
+    class EmailChannel(_Resource):
+        """A Email Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for EmailChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-emailchannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::EmailChannel"
+
+        Properties: EmailChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EmailChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EmailChannelProperties},
+            factories={"Properties": EmailChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EmailChannelProperties()
+            _setattr("Properties", _convert_EmailChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EmailChannel, EmailChannelProperties
+
+
+def _create_EmailTemplate():
+    class EmailTemplateProperties(_ResourceProperties):
+        __slots__ = (
+            "DefaultSubstitutions",
+            "HtmlPart",
+            "Subject",
+            "Tags",
+            "TemplateDescription",
+            "TemplateName",
+            "TextPart",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EmailTemplateProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultSubstitutions=None,
+            HtmlPart=None,
+            Subject=None,
+            Tags=None,
+            TemplateDescription=None,
+            TemplateName=None,
+            TextPart=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultSubstitutions", DefaultSubstitutions)
+            _setattr("HtmlPart", HtmlPart)
+            _setattr("Subject", Subject)
+            _setattr("Tags", Tags)
+            _setattr("TemplateDescription", TemplateDescription)
+            _setattr("TemplateName", TemplateName)
+            _setattr("TextPart", TextPart)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EmailTemplateProperties = create_object_converter(EmailTemplateProperties)
+
+    class EmailTemplate(_Resource):
+        """A Email Template for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for EmailTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-emailtemplate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::EmailTemplate"
+        TAG_FORMAT = "Map"
+
+        Properties: EmailTemplateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EmailTemplate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EmailTemplateProperties},
+            factories={"Properties": EmailTemplateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EmailTemplateProperties()
+            _setattr("Properties", _convert_EmailTemplateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EmailTemplate, EmailTemplateProperties
+
+
+def _create_EventStream():
+    class EventStreamProperties(_ResourceProperties):
+        __slots__ = ("ApplicationId", "DestinationStreamArn", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventStreamProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            DestinationStreamArn=None,
+            RoleArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("DestinationStreamArn", DestinationStreamArn)
+            _setattr("RoleArn", RoleArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EventStreamProperties = create_object_converter(EventStreamProperties)
+
+    class EventStream(_Resource):
+        """A Event Stream for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for EventStream
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-eventstream.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::EventStream"
+
+        Properties: EventStreamProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventStream",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EventStreamProperties},
+            factories={"Properties": EventStreamProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EventStreamProperties()
+            _setattr("Properties", _convert_EventStreamProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EventStream, EventStreamProperties
+
+
+def _create_GCMChannel():
+    class GCMChannelProperties(_ResourceProperties):
+        __slots__ = ("ApiKey", "ApplicationId", "Enabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GCMChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ApiKey=None, ApplicationId=None, Enabled=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApiKey", ApiKey)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("Enabled", Enabled)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GCMChannelProperties = create_object_converter(GCMChannelProperties)
+
+    class GCMChannel(_Resource):
+        """A Gcm Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for GCMChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-gcmchannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::GCMChannel"
+
+        Properties: GCMChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GCMChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GCMChannelProperties},
+            factories={"Properties": GCMChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GCMChannelProperties()
+            _setattr("Properties", _convert_GCMChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return GCMChannel, GCMChannelProperties
+
+
+def _create_PushTemplate():
+    class PushTemplateAPNSPushNotificationTemplate(_PropertyType):
+        """The Apns Push Notification Template property type for PushTemplate in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for APNSPushNotificationTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-pushtemplate-apnspushnotificationtemplate.html>`_
+        """
+
+        __slots__ = ("Action", "Body", "MediaUrl", "Sound", "Title", "Url")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PushTemplateAPNSPushNotificationTemplate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Action=None,
+            Body=None,
+            MediaUrl=None,
+            Sound=None,
+            Title=None,
+            Url=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", Action)
+            _setattr("Body", Body)
+            _setattr("MediaUrl", MediaUrl)
+            _setattr("Sound", Sound)
+            _setattr("Title", Title)
+            _setattr("Url", Url)
+            _init_PropertyType(self, kwargs)
+
+    class PushTemplateAndroidPushNotificationTemplate(_PropertyType):
+        """The Android Push Notification Template property type for PushTemplate in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for AndroidPushNotificationTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-pushtemplate-androidpushnotificationtemplate.html>`_
+        """
+
+        __slots__ = (
+            "Action",
+            "Body",
+            "ImageIconUrl",
+            "ImageUrl",
+            "SmallImageIconUrl",
+            "Sound",
+            "Title",
+            "Url",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PushTemplateAndroidPushNotificationTemplate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Action=None,
+            Body=None,
+            ImageIconUrl=None,
+            ImageUrl=None,
+            SmallImageIconUrl=None,
+            Sound=None,
+            Title=None,
+            Url=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", Action)
+            _setattr("Body", Body)
+            _setattr("ImageIconUrl", ImageIconUrl)
+            _setattr("ImageUrl", ImageUrl)
+            _setattr("SmallImageIconUrl", SmallImageIconUrl)
+            _setattr("Sound", Sound)
+            _setattr("Title", Title)
+            _setattr("Url", Url)
+            _init_PropertyType(self, kwargs)
+
+    class PushTemplateDefaultPushNotificationTemplate(_PropertyType):
+        """The Default Push Notification Template property type for PushTemplate in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for DefaultPushNotificationTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-pushtemplate-defaultpushnotificationtemplate.html>`_
+        """
+
+        __slots__ = ("Action", "Body", "Sound", "Title", "Url")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PushTemplateDefaultPushNotificationTemplate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Action=None, Body=None, Sound=None, Title=None, Url=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", Action)
+            _setattr("Body", Body)
+            _setattr("Sound", Sound)
+            _setattr("Title", Title)
+            _setattr("Url", Url)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PushTemplateAndroidPushNotificationTemplate = create_object_converter(
+        PushTemplateAndroidPushNotificationTemplate
     )
-
-
-@attrs(**ATTRSCONFIG)
-class SegmentProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    Dimensions = attrib(default=None)
-    Name = attrib(default=None)
-    SegmentGroups = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Segment(Resource):
-    """A Segment for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for Segment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-segment.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::Segment"
-
-    Properties: SegmentProperties = attrib(
-        factory=SegmentProperties, converter=create_object_converter(SegmentProperties)
+    _convert_PushTemplateAPNSPushNotificationTemplate = create_object_converter(
+        PushTemplateAPNSPushNotificationTemplate
     )
-
-
-@attrs(**ATTRSCONFIG)
-class SmsTemplateProperties(ResourceProperties):
-    Body = attrib(default=None)
-    DefaultSubstitutions = attrib(default=None)
-    Tags = attrib(default=None)
-    TemplateDescription = attrib(default=None)
-    TemplateName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SmsTemplate(Resource):
-    """A Sms Template for Pinpoint.
-
-    See Also:
-        `AWS Cloud Formation documentation for SmsTemplate
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-smstemplate.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Pinpoint::SmsTemplate"
-
-    Properties: SmsTemplateProperties = attrib(
-        factory=SmsTemplateProperties,
-        converter=create_object_converter(SmsTemplateProperties),
+    _convert_PushTemplateDefaultPushNotificationTemplate = create_object_converter(
+        PushTemplateDefaultPushNotificationTemplate
     )
 
-
-@attrs(**ATTRSCONFIG)
-class VoiceChannelProperties(ResourceProperties):
-    ApplicationId = attrib(default=None)
-    Enabled = attrib(default=None)
+    class PushTemplateProperties(_ResourceProperties):
+        __slots__ = (
+            "ADM",
+            "APNS",
+            "Baidu",
+            "Default",
+            "DefaultSubstitutions",
+            "GCM",
+            "Tags",
+            "TemplateDescription",
+            "TemplateName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PushTemplateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ADM": _convert_PushTemplateAndroidPushNotificationTemplate,
+                "APNS": _convert_PushTemplateAPNSPushNotificationTemplate,
+                "Baidu": _convert_PushTemplateAndroidPushNotificationTemplate,
+                "Default": _convert_PushTemplateDefaultPushNotificationTemplate,
+                "GCM": _convert_PushTemplateAndroidPushNotificationTemplate,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ADM=None,
+            APNS=None,
+            Baidu=None,
+            Default=None,
+            DefaultSubstitutions=None,
+            GCM=None,
+            Tags=None,
+            TemplateDescription=None,
+            TemplateName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ADM", _convert_PushTemplateAndroidPushNotificationTemplate(ADM))
+            _setattr("APNS", _convert_PushTemplateAPNSPushNotificationTemplate(APNS))
+            _setattr(
+                "Baidu", _convert_PushTemplateAndroidPushNotificationTemplate(Baidu)
+            )
+            _setattr(
+                "Default", _convert_PushTemplateDefaultPushNotificationTemplate(Default)
+            )
+            _setattr("DefaultSubstitutions", DefaultSubstitutions)
+            _setattr("GCM", _convert_PushTemplateAndroidPushNotificationTemplate(GCM))
+            _setattr("Tags", Tags)
+            _setattr("TemplateDescription", TemplateDescription)
+            _setattr("TemplateName", TemplateName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PushTemplateProperties = create_object_converter(PushTemplateProperties)
+
+    class PushTemplate(_Resource):
+        """A Push Template for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for PushTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-pushtemplate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::PushTemplate"
+        TAG_FORMAT = "Map"
+
+        Properties: PushTemplateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PushTemplate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PushTemplateProperties},
+            factories={"Properties": PushTemplateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PushTemplateProperties()
+            _setattr("Properties", _convert_PushTemplateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        PushTemplate,
+        PushTemplateProperties,
+        PushTemplateAPNSPushNotificationTemplate,
+        PushTemplateAndroidPushNotificationTemplate,
+        PushTemplateDefaultPushNotificationTemplate,
+    )
 
 
-@attrs(**ATTRSCONFIG)
-class VoiceChannel(Resource):
-    """A Voice Channel for Pinpoint.
+def _create_SMSChannel():
+    class SMSChannelProperties(_ResourceProperties):
+        __slots__ = ("ApplicationId", "Enabled", "SenderId", "ShortCode")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SMSChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            Enabled=None,
+            SenderId=None,
+            ShortCode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("Enabled", Enabled)
+            _setattr("SenderId", SenderId)
+            _setattr("ShortCode", ShortCode)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SMSChannelProperties = create_object_converter(SMSChannelProperties)
+
+    class SMSChannel(_Resource):
+        """A Sms Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for SMSChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-smschannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::SMSChannel"
+
+        Properties: SMSChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SMSChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SMSChannelProperties},
+            factories={"Properties": SMSChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SMSChannelProperties()
+            _setattr("Properties", _convert_SMSChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SMSChannel, SMSChannelProperties
+
+
+def _create_Segment():
+    class SegmentAttributeDimension(_PropertyType):
+        """The Attribute Dimension property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for AttributeDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-attributedimension.html>`_
+        """
+
+        __slots__ = ("AttributeType", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentAttributeDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AttributeType=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AttributeType", AttributeType)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    class SegmentRecency(_PropertyType):
+        """The Recency property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Recency
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentdimensions-behavior-recency.html>`_
+        """
+
+        __slots__ = ("Duration", "RecencyType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentRecency", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Duration=None, RecencyType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Duration", Duration)
+            _setattr("RecencyType", RecencyType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SegmentRecency = create_object_converter(SegmentRecency)
+
+    class SegmentBehavior(_PropertyType):
+        """The Behavior property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Behavior
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentdimensions-behavior.html>`_
+        """
+
+        __slots__ = ("Recency",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentBehavior",
+            _PropertyType,
+            __slots__,
+            converters={"Recency": _convert_SegmentRecency},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Recency=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Recency", _convert_SegmentRecency(Recency))
+            _init_PropertyType(self, kwargs)
+
+    class SegmentCoordinates(_PropertyType):
+        """The Coordinates property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Coordinates
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentdimensions-location-gpspoint-coordinates.html>`_
+        """
+
+        __slots__ = ("Latitude", "Longitude")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentCoordinates", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Latitude=None, Longitude=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Latitude", Latitude)
+            _setattr("Longitude", Longitude)
+            _init_PropertyType(self, kwargs)
+
+    class SegmentSetDimension(_PropertyType):
+        """The Set Dimension property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for SetDimension
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-setdimension.html>`_
+        """
+
+        __slots__ = ("DimensionType", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentSetDimension", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DimensionType=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DimensionType", DimensionType)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SegmentSetDimension = create_object_converter(SegmentSetDimension)
+
+    class SegmentDemographic(_PropertyType):
+        """The Demographic property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Demographic
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentdimensions-demographic.html>`_
+        """
+
+        __slots__ = ("AppVersion", "Channel", "DeviceType", "Make", "Model", "Platform")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentDemographic",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AppVersion": _convert_SegmentSetDimension,
+                "Channel": _convert_SegmentSetDimension,
+                "DeviceType": _convert_SegmentSetDimension,
+                "Make": _convert_SegmentSetDimension,
+                "Model": _convert_SegmentSetDimension,
+                "Platform": _convert_SegmentSetDimension,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AppVersion=None,
+            Channel=None,
+            DeviceType=None,
+            Make=None,
+            Model=None,
+            Platform=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AppVersion", _convert_SegmentSetDimension(AppVersion))
+            _setattr("Channel", _convert_SegmentSetDimension(Channel))
+            _setattr("DeviceType", _convert_SegmentSetDimension(DeviceType))
+            _setattr("Make", _convert_SegmentSetDimension(Make))
+            _setattr("Model", _convert_SegmentSetDimension(Model))
+            _setattr("Platform", _convert_SegmentSetDimension(Platform))
+            _init_PropertyType(self, kwargs)
+
+    _convert_SegmentCoordinates = create_object_converter(SegmentCoordinates)
+
+    class SegmentGPSPoint(_PropertyType):
+        """The Gps Point property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for GPSPoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentdimensions-location-gpspoint.html>`_
+        """
+
+        __slots__ = ("Coordinates", "RangeInKilometers")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentGPSPoint",
+            _PropertyType,
+            __slots__,
+            converters={"Coordinates": _convert_SegmentCoordinates},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Coordinates=None, RangeInKilometers=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Coordinates", _convert_SegmentCoordinates(Coordinates))
+            _setattr("RangeInKilometers", RangeInKilometers)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SegmentGPSPoint = create_object_converter(SegmentGPSPoint)
+
+    class SegmentLocation(_PropertyType):
+        """The Location property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Location
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentdimensions-location.html>`_
+        """
+
+        __slots__ = ("Country", "GPSPoint")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentLocation",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Country": _convert_SegmentSetDimension,
+                "GPSPoint": _convert_SegmentGPSPoint,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Country=None, GPSPoint=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Country", _convert_SegmentSetDimension(Country))
+            _setattr("GPSPoint", _convert_SegmentGPSPoint(GPSPoint))
+            _init_PropertyType(self, kwargs)
+
+    _convert_SegmentBehavior = create_object_converter(SegmentBehavior)
+    _convert_SegmentDemographic = create_object_converter(SegmentDemographic)
+    _convert_SegmentLocation = create_object_converter(SegmentLocation)
+
+    class SegmentSegmentDimensions(_PropertyType):
+        """The Segment Dimensions property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for SegmentDimensions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentdimensions.html>`_
+        """
+
+        __slots__ = (
+            "Attributes",
+            "Behavior",
+            "Demographic",
+            "Location",
+            "Metrics",
+            "UserAttributes",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentSegmentDimensions",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Behavior": _convert_SegmentBehavior,
+                "Demographic": _convert_SegmentDemographic,
+                "Location": _convert_SegmentLocation,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Attributes=None,
+            Behavior=None,
+            Demographic=None,
+            Location=None,
+            Metrics=None,
+            UserAttributes=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Attributes", Attributes)
+            _setattr("Behavior", _convert_SegmentBehavior(Behavior))
+            _setattr("Demographic", _convert_SegmentDemographic(Demographic))
+            _setattr("Location", _convert_SegmentLocation(Location))
+            _setattr("Metrics", Metrics)
+            _setattr("UserAttributes", UserAttributes)
+            _init_PropertyType(self, kwargs)
+
+    class SegmentSourceSegments(_PropertyType):
+        """The Source Segments property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for SourceSegments
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentgroups-groups-sourcesegments.html>`_
+        """
+
+        __slots__ = ("Id", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentSourceSegments", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Id=None, Version=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SegmentSegmentDimensions_list = create_object_list_converter(
+        SegmentSegmentDimensions
+    )
+    _convert_SegmentSourceSegments_list = create_object_list_converter(
+        SegmentSourceSegments
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for VoiceChannel
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-voicechannel.html>`_
-    """
+    class SegmentGroups(_PropertyType):
+        """The Groups property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Groups
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentgroups-groups.html>`_
+        """
+
+        __slots__ = ("Dimensions", "SourceSegments", "SourceType", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentGroups",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Dimensions": _convert_SegmentSegmentDimensions_list,
+                "SourceSegments": _convert_SegmentSourceSegments_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Dimensions=None,
+            SourceSegments=None,
+            SourceType=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Dimensions", _convert_SegmentSegmentDimensions_list(Dimensions))
+            _setattr(
+                "SourceSegments", _convert_SegmentSourceSegments_list(SourceSegments)
+            )
+            _setattr("SourceType", SourceType)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SegmentGroups_list = create_object_list_converter(SegmentGroups)
+
+    class SegmentSegmentGroups(_PropertyType):
+        """The Segment Groups property type for Segment in Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for SegmentGroups
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpoint-segment-segmentgroups.html>`_
+        """
+
+        __slots__ = ("Groups", "Include")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentSegmentGroups",
+            _PropertyType,
+            __slots__,
+            converters={"Groups": _convert_SegmentGroups_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Groups=None, Include=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Groups", _convert_SegmentGroups_list(Groups))
+            _setattr("Include", Include)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SegmentSegmentDimensions = create_object_converter(
+        SegmentSegmentDimensions
+    )
+    _convert_SegmentSegmentGroups = create_object_converter(SegmentSegmentGroups)
+
+    class SegmentProperties(_ResourceProperties):
+        __slots__ = ("ApplicationId", "Dimensions", "Name", "SegmentGroups", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SegmentProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Dimensions": _convert_SegmentSegmentDimensions,
+                "SegmentGroups": _convert_SegmentSegmentGroups,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApplicationId=None,
+            Dimensions=None,
+            Name=None,
+            SegmentGroups=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("Dimensions", _convert_SegmentSegmentDimensions(Dimensions))
+            _setattr("Name", Name)
+            _setattr("SegmentGroups", _convert_SegmentSegmentGroups(SegmentGroups))
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SegmentProperties = create_object_converter(SegmentProperties)
+
+    class Segment(_Resource):
+        """A Segment for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for Segment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-segment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::Segment"
+        TAG_FORMAT = "Map"
+
+        Properties: SegmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Segment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SegmentProperties},
+            factories={"Properties": SegmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SegmentProperties()
+            _setattr("Properties", _convert_SegmentProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Segment,
+        SegmentProperties,
+        SegmentAttributeDimension,
+        SegmentRecency,
+        SegmentBehavior,
+        SegmentCoordinates,
+        SegmentSetDimension,
+        SegmentDemographic,
+        SegmentGPSPoint,
+        SegmentLocation,
+        SegmentSegmentDimensions,
+        SegmentSourceSegments,
+        SegmentGroups,
+        SegmentSegmentGroups,
+    )
 
-    RESOURCE_TYPE = "AWS::Pinpoint::VoiceChannel"
 
-    Properties: VoiceChannelProperties = attrib(
-        factory=VoiceChannelProperties,
-        converter=create_object_converter(VoiceChannelProperties),
-    )
+def _create_SmsTemplate():
+    class SmsTemplateProperties(_ResourceProperties):
+        __slots__ = (
+            "Body",
+            "DefaultSubstitutions",
+            "Tags",
+            "TemplateDescription",
+            "TemplateName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SmsTemplateProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Body=None,
+            DefaultSubstitutions=None,
+            Tags=None,
+            TemplateDescription=None,
+            TemplateName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Body", Body)
+            _setattr("DefaultSubstitutions", DefaultSubstitutions)
+            _setattr("Tags", Tags)
+            _setattr("TemplateDescription", TemplateDescription)
+            _setattr("TemplateName", TemplateName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SmsTemplateProperties = create_object_converter(SmsTemplateProperties)
+
+    class SmsTemplate(_Resource):
+        """A Sms Template for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for SmsTemplate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-smstemplate.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::SmsTemplate"
+        TAG_FORMAT = "Map"
+
+        Properties: SmsTemplateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SmsTemplate",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SmsTemplateProperties},
+            factories={"Properties": SmsTemplateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SmsTemplateProperties()
+            _setattr("Properties", _convert_SmsTemplateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return SmsTemplate, SmsTemplateProperties
+
+
+def _create_VoiceChannel():
+    class VoiceChannelProperties(_ResourceProperties):
+        __slots__ = ("ApplicationId", "Enabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VoiceChannelProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ApplicationId=None, Enabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationId", ApplicationId)
+            _setattr("Enabled", Enabled)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_VoiceChannelProperties = create_object_converter(VoiceChannelProperties)
+
+    class VoiceChannel(_Resource):
+        """A Voice Channel for Pinpoint.
+
+        See Also:
+            `AWS Cloud Formation documentation for VoiceChannel
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpoint-voicechannel.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Pinpoint::VoiceChannel"
+
+        Properties: VoiceChannelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "VoiceChannel",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_VoiceChannelProperties},
+            factories={"Properties": VoiceChannelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = VoiceChannelProperties()
+            _setattr("Properties", _convert_VoiceChannelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return VoiceChannel, VoiceChannelProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ADMChannel": _create_ADMChannel,
+        "ADMChannelProperties": _create_ADMChannel,
+        "APNSChannel": _create_APNSChannel,
+        "APNSChannelProperties": _create_APNSChannel,
+        "APNSSandboxChannel": _create_APNSSandboxChannel,
+        "APNSSandboxChannelProperties": _create_APNSSandboxChannel,
+        "APNSVoipChannel": _create_APNSVoipChannel,
+        "APNSVoipChannelProperties": _create_APNSVoipChannel,
+        "APNSVoipSandboxChannel": _create_APNSVoipSandboxChannel,
+        "APNSVoipSandboxChannelProperties": _create_APNSVoipSandboxChannel,
+        "App": _create_App,
+        "AppProperties": _create_App,
+        "ApplicationSettings": _create_ApplicationSettings,
+        "ApplicationSettingsProperties": _create_ApplicationSettings,
+        "ApplicationSettingsCampaignHook": _create_ApplicationSettings,
+        "ApplicationSettingsLimits": _create_ApplicationSettings,
+        "ApplicationSettingsQuietTime": _create_ApplicationSettings,
+        "BaiduChannel": _create_BaiduChannel,
+        "BaiduChannelProperties": _create_BaiduChannel,
+        "Campaign": _create_Campaign,
+        "CampaignProperties": _create_Campaign,
+        "CampaignAttributeDimension": _create_Campaign,
+        "CampaignCampaignEmailMessage": _create_Campaign,
+        "CampaignCampaignEventFilter": _create_Campaign,
+        "CampaignCampaignHook": _create_Campaign,
+        "CampaignCampaignSmsMessage": _create_Campaign,
+        "CampaignEventDimensions": _create_Campaign,
+        "CampaignLimits": _create_Campaign,
+        "CampaignMessage": _create_Campaign,
+        "CampaignMessageConfiguration": _create_Campaign,
+        "CampaignMetricDimension": _create_Campaign,
+        "CampaignQuietTime": _create_Campaign,
+        "CampaignSchedule": _create_Campaign,
+        "CampaignSetDimension": _create_Campaign,
+        "CampaignWriteTreatmentResource": _create_Campaign,
+        "EmailChannel": _create_EmailChannel,
+        "EmailChannelProperties": _create_EmailChannel,
+        "EmailTemplate": _create_EmailTemplate,
+        "EmailTemplateProperties": _create_EmailTemplate,
+        "EventStream": _create_EventStream,
+        "EventStreamProperties": _create_EventStream,
+        "GCMChannel": _create_GCMChannel,
+        "GCMChannelProperties": _create_GCMChannel,
+        "PushTemplate": _create_PushTemplate,
+        "PushTemplateProperties": _create_PushTemplate,
+        "PushTemplateAndroidPushNotificationTemplate": _create_PushTemplate,
+        "PushTemplateAPNSPushNotificationTemplate": _create_PushTemplate,
+        "PushTemplateDefaultPushNotificationTemplate": _create_PushTemplate,
+        "SMSChannel": _create_SMSChannel,
+        "SMSChannelProperties": _create_SMSChannel,
+        "Segment": _create_Segment,
+        "SegmentProperties": _create_Segment,
+        "SegmentAttributeDimension": _create_Segment,
+        "SegmentBehavior": _create_Segment,
+        "SegmentCoordinates": _create_Segment,
+        "SegmentDemographic": _create_Segment,
+        "SegmentGPSPoint": _create_Segment,
+        "SegmentGroups": _create_Segment,
+        "SegmentLocation": _create_Segment,
+        "SegmentRecency": _create_Segment,
+        "SegmentSegmentDimensions": _create_Segment,
+        "SegmentSegmentGroups": _create_Segment,
+        "SegmentSetDimension": _create_Segment,
+        "SegmentSourceSegments": _create_Segment,
+        "SmsTemplate": _create_SmsTemplate,
+        "SmsTemplateProperties": _create_SmsTemplate,
+        "VoiceChannel": _create_VoiceChannel,
+        "VoiceChannelProperties": _create_VoiceChannel,
+    },
+)
@@ -7,121 +7,828 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "ConfigurationSet",
     "ConfigurationSetProperties",
+    "ConfigurationSetDeliveryOptions",
+    "ConfigurationSetReputationOptions",
+    "ConfigurationSetSendingOptions",
+    "ConfigurationSetTags",
+    "ConfigurationSetTrackingOptions",
     "ConfigurationSetEventDestination",
     "ConfigurationSetEventDestinationProperties",
+    "ConfigurationSetEventDestinationCloudWatchDestination",
+    "ConfigurationSetEventDestinationDimensionConfiguration",
+    "ConfigurationSetEventDestinationEventDestination",
+    "ConfigurationSetEventDestinationKinesisFirehoseDestination",
+    "ConfigurationSetEventDestinationPinpointDestination",
+    "ConfigurationSetEventDestinationSnsDestination",
     "DedicatedIpPool",
     "DedicatedIpPoolProperties",
+    "DedicatedIpPoolTags",
     "Identity",
     "IdentityProperties",
+    "IdentityMailFromAttributes",
+    "IdentityTags",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationSetProperties(ResourceProperties):
-    DeliveryOptions = attrib(default=None)
-    Name = attrib(default=None)
-    ReputationOptions = attrib(default=None)
-    SendingOptions = attrib(default=None)
-    Tags = attrib(default=None)
-    TrackingOptions = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ConfigurationSet(Resource):
-    """A Configuration Set for PinpointEmail.
-
-    See Also:
-        `AWS Cloud Formation documentation for ConfigurationSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpointemail-configurationset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::PinpointEmail::ConfigurationSet"
-
-    Properties: ConfigurationSetProperties = attrib(
-        factory=ConfigurationSetProperties,
-        converter=create_object_converter(ConfigurationSetProperties),
+def _create_ConfigurationSet():
+    class ConfigurationSetDeliveryOptions(_PropertyType):
+        """The Delivery Options property type for ConfigurationSet in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for DeliveryOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationset-deliveryoptions.html>`_
+        """
+
+        __slots__ = ("SendingPoolName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetDeliveryOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SendingPoolName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SendingPoolName", SendingPoolName)
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationSetReputationOptions(_PropertyType):
+        """The Reputation Options property type for ConfigurationSet in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReputationOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationset-reputationoptions.html>`_
+        """
+
+        __slots__ = ("ReputationMetricsEnabled",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetReputationOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ReputationMetricsEnabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ReputationMetricsEnabled", ReputationMetricsEnabled)
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationSetSendingOptions(_PropertyType):
+        """The Sending Options property type for ConfigurationSet in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for SendingOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationset-sendingoptions.html>`_
+        """
+
+        __slots__ = ("SendingEnabled",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetSendingOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SendingEnabled=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SendingEnabled", SendingEnabled)
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationSetTags(_PropertyType):
+        """The Tags property type for ConfigurationSet in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for Tags
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationset-tags.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetTags", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationSetTrackingOptions(_PropertyType):
+        """The Tracking Options property type for ConfigurationSet in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for TrackingOptions
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationset-trackingoptions.html>`_
+        """
+
+        __slots__ = ("CustomRedirectDomain",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetTrackingOptions", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CustomRedirectDomain=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CustomRedirectDomain", CustomRedirectDomain)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationSetDeliveryOptions = create_object_converter(
+        ConfigurationSetDeliveryOptions
+    )
+    _convert_ConfigurationSetReputationOptions = create_object_converter(
+        ConfigurationSetReputationOptions
+    )
+    _convert_ConfigurationSetSendingOptions = create_object_converter(
+        ConfigurationSetSendingOptions
+    )
+    _convert_ConfigurationSetTags_list = create_object_list_converter(
+        ConfigurationSetTags
+    )
+    _convert_ConfigurationSetTrackingOptions = create_object_converter(
+        ConfigurationSetTrackingOptions
     )
 
+    class ConfigurationSetProperties(_ResourceProperties):
+        __slots__ = (
+            "DeliveryOptions",
+            "Name",
+            "ReputationOptions",
+            "SendingOptions",
+            "Tags",
+            "TrackingOptions",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DeliveryOptions": _convert_ConfigurationSetDeliveryOptions,
+                "ReputationOptions": _convert_ConfigurationSetReputationOptions,
+                "SendingOptions": _convert_ConfigurationSetSendingOptions,
+                "Tags": _convert_ConfigurationSetTags_list,
+                "TrackingOptions": _convert_ConfigurationSetTrackingOptions,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeliveryOptions=None,
+            Name=None,
+            ReputationOptions=None,
+            SendingOptions=None,
+            Tags=None,
+            TrackingOptions=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DeliveryOptions",
+                _convert_ConfigurationSetDeliveryOptions(DeliveryOptions),
+            )
+            _setattr("Name", Name)
+            _setattr(
+                "ReputationOptions",
+                _convert_ConfigurationSetReputationOptions(ReputationOptions),
+            )
+            _setattr(
+                "SendingOptions",
+                _convert_ConfigurationSetSendingOptions(SendingOptions),
+            )
+            _setattr("Tags", _convert_ConfigurationSetTags_list(Tags))
+            _setattr(
+                "TrackingOptions",
+                _convert_ConfigurationSetTrackingOptions(TrackingOptions),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConfigurationSetProperties = create_object_converter(
+        ConfigurationSetProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationSetEventDestinationProperties(ResourceProperties):
-    ConfigurationSetName = attrib(default=None)
-    EventDestination = attrib(default=None)
-    EventDestinationName = attrib(default=None)
+    class ConfigurationSet(_Resource):
+        """A Configuration Set for PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpointemail-configurationset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::PinpointEmail::ConfigurationSet"
+
+        Properties: ConfigurationSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConfigurationSetProperties},
+            factories={"Properties": ConfigurationSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigurationSetProperties()
+            _setattr("Properties", _convert_ConfigurationSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ConfigurationSet,
+        ConfigurationSetProperties,
+        ConfigurationSetDeliveryOptions,
+        ConfigurationSetReputationOptions,
+        ConfigurationSetSendingOptions,
+        ConfigurationSetTags,
+        ConfigurationSetTrackingOptions,
+    )
 
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationSetEventDestination(Resource):
-    """A Configuration Set Event Destination for PinpointEmail.
+def _create_ConfigurationSetEventDestination():
+    class ConfigurationSetEventDestinationDimensionConfiguration(_PropertyType):
+        """The Dimension Configuration property type for ConfigurationSetEventDestination in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for DimensionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationseteventdestination-dimensionconfiguration.html>`_
+        """
+
+        __slots__ = ("DefaultDimensionValue", "DimensionName", "DimensionValueSource")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationDimensionConfiguration",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultDimensionValue=None,
+            DimensionName=None,
+            DimensionValueSource=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultDimensionValue", DefaultDimensionValue)
+            _setattr("DimensionName", DimensionName)
+            _setattr("DimensionValueSource", DimensionValueSource)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationSetEventDestinationDimensionConfiguration_list = (
+        create_object_list_converter(
+            ConfigurationSetEventDestinationDimensionConfiguration
+        )
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for ConfigurationSetEventDestination
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpointemail-configurationseteventdestination.html>`_
-    """
+    class ConfigurationSetEventDestinationCloudWatchDestination(_PropertyType):
+        """The Cloud Watch Destination property type for ConfigurationSetEventDestination in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudWatchDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationseteventdestination-cloudwatchdestination.html>`_
+        """
+
+        __slots__ = ("DimensionConfigurations",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationCloudWatchDestination",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DimensionConfigurations": _convert_ConfigurationSetEventDestinationDimensionConfiguration_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DimensionConfigurations=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DimensionConfigurations",
+                _convert_ConfigurationSetEventDestinationDimensionConfiguration_list(
+                    DimensionConfigurations
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationSetEventDestinationSnsDestination(_PropertyType):
+        """The Sns Destination property type for ConfigurationSetEventDestination in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for SnsDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationseteventdestination-snsdestination.html>`_
+        """
+
+        __slots__ = ("TopicArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationSnsDestination", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TopicArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TopicArn", TopicArn)
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationSetEventDestinationPinpointDestination(_PropertyType):
+        """The Pinpoint Destination property type for ConfigurationSetEventDestination in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for PinpointDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationseteventdestination-pinpointdestination.html>`_
+        """
+
+        __slots__ = ("ApplicationArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationPinpointDestination",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ApplicationArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApplicationArn", ApplicationArn)
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationSetEventDestinationKinesisFirehoseDestination(_PropertyType):
+        """The Kinesis Firehose Destination property type for ConfigurationSetEventDestination in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisFirehoseDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationseteventdestination-kinesisfirehosedestination.html>`_
+        """
+
+        __slots__ = ("DeliveryStreamArn", "IamRoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationKinesisFirehoseDestination",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeliveryStreamArn=None, IamRoleArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeliveryStreamArn", DeliveryStreamArn)
+            _setattr("IamRoleArn", IamRoleArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationSetEventDestinationCloudWatchDestination = (
+        create_object_converter(ConfigurationSetEventDestinationCloudWatchDestination)
+    )
+    _convert_ConfigurationSetEventDestinationKinesisFirehoseDestination = (
+        create_object_converter(
+            ConfigurationSetEventDestinationKinesisFirehoseDestination
+        )
+    )
+    _convert_ConfigurationSetEventDestinationPinpointDestination = (
+        create_object_converter(ConfigurationSetEventDestinationPinpointDestination)
+    )
+    _convert_ConfigurationSetEventDestinationSnsDestination = create_object_converter(
+        ConfigurationSetEventDestinationSnsDestination
+    )
 
-    RESOURCE_TYPE = "AWS::PinpointEmail::ConfigurationSetEventDestination"
+    class ConfigurationSetEventDestinationEventDestination(_PropertyType):
+        """The Event Destination property type for ConfigurationSetEventDestination in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for EventDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-configurationseteventdestination-eventdestination.html>`_
+        """
+
+        __slots__ = (
+            "CloudWatchDestination",
+            "Enabled",
+            "KinesisFirehoseDestination",
+            "MatchingEventTypes",
+            "PinpointDestination",
+            "SnsDestination",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationEventDestination",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudWatchDestination": _convert_ConfigurationSetEventDestinationCloudWatchDestination,
+                "KinesisFirehoseDestination": _convert_ConfigurationSetEventDestinationKinesisFirehoseDestination,
+                "PinpointDestination": _convert_ConfigurationSetEventDestinationPinpointDestination,
+                "SnsDestination": _convert_ConfigurationSetEventDestinationSnsDestination,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CloudWatchDestination=None,
+            Enabled=None,
+            KinesisFirehoseDestination=None,
+            MatchingEventTypes=None,
+            PinpointDestination=None,
+            SnsDestination=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudWatchDestination",
+                _convert_ConfigurationSetEventDestinationCloudWatchDestination(
+                    CloudWatchDestination
+                ),
+            )
+            _setattr("Enabled", Enabled)
+            _setattr(
+                "KinesisFirehoseDestination",
+                _convert_ConfigurationSetEventDestinationKinesisFirehoseDestination(
+                    KinesisFirehoseDestination
+                ),
+            )
+            _setattr("MatchingEventTypes", MatchingEventTypes)
+            _setattr(
+                "PinpointDestination",
+                _convert_ConfigurationSetEventDestinationPinpointDestination(
+                    PinpointDestination
+                ),
+            )
+            _setattr(
+                "SnsDestination",
+                _convert_ConfigurationSetEventDestinationSnsDestination(SnsDestination),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationSetEventDestinationEventDestination = create_object_converter(
+        ConfigurationSetEventDestinationEventDestination
+    )
 
-    Properties: ConfigurationSetEventDestinationProperties = attrib(
-        factory=ConfigurationSetEventDestinationProperties,
-        converter=create_object_converter(ConfigurationSetEventDestinationProperties),
+    class ConfigurationSetEventDestinationProperties(_ResourceProperties):
+        __slots__ = ("ConfigurationSetName", "EventDestination", "EventDestinationName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "EventDestination": _convert_ConfigurationSetEventDestinationEventDestination
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ConfigurationSetName=None,
+            EventDestination=None,
+            EventDestinationName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConfigurationSetName", ConfigurationSetName)
+            _setattr(
+                "EventDestination",
+                _convert_ConfigurationSetEventDestinationEventDestination(
+                    EventDestination
+                ),
+            )
+            _setattr("EventDestinationName", EventDestinationName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConfigurationSetEventDestinationProperties = create_object_converter(
+        ConfigurationSetEventDestinationProperties
     )
 
+    class ConfigurationSetEventDestination(_Resource):
+        """A Configuration Set Event Destination for PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationSetEventDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpointemail-configurationseteventdestination.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::PinpointEmail::ConfigurationSetEventDestination"
+
+        Properties: ConfigurationSetEventDestinationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestination",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_ConfigurationSetEventDestinationProperties
+            },
+            factories={"Properties": ConfigurationSetEventDestinationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigurationSetEventDestinationProperties()
+            _setattr(
+                "Properties",
+                _convert_ConfigurationSetEventDestinationProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        ConfigurationSetEventDestination,
+        ConfigurationSetEventDestinationProperties,
+        ConfigurationSetEventDestinationDimensionConfiguration,
+        ConfigurationSetEventDestinationCloudWatchDestination,
+        ConfigurationSetEventDestinationSnsDestination,
+        ConfigurationSetEventDestinationPinpointDestination,
+        ConfigurationSetEventDestinationKinesisFirehoseDestination,
+        ConfigurationSetEventDestinationEventDestination,
+    )
 
-@attrs(**ATTRSCONFIG)
-class DedicatedIpPoolProperties(ResourceProperties):
-    PoolName = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_DedicatedIpPool():
+    class DedicatedIpPoolTags(_PropertyType):
+        """The Tags property type for DedicatedIpPool in PinpointEmail.
 
-@attrs(**ATTRSCONFIG)
-class DedicatedIpPool(Resource):
-    """A Dedicated Ip Pool for PinpointEmail.
+        See Also:
+            `AWS Cloud Formation documentation for Tags
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-dedicatedippool-tags.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for DedicatedIpPool
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpointemail-dedicatedippool.html>`_
-    """
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DedicatedIpPoolTags", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::PinpointEmail::DedicatedIpPool"
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    Properties: DedicatedIpPoolProperties = attrib(
-        factory=DedicatedIpPoolProperties,
-        converter=create_object_converter(DedicatedIpPoolProperties),
+    _convert_DedicatedIpPoolTags_list = create_object_list_converter(
+        DedicatedIpPoolTags
     )
 
+    class DedicatedIpPoolProperties(_ResourceProperties):
+        __slots__ = ("PoolName", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DedicatedIpPoolProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_DedicatedIpPoolTags_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PoolName=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PoolName", PoolName)
+            _setattr("Tags", _convert_DedicatedIpPoolTags_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DedicatedIpPoolProperties = create_object_converter(
+        DedicatedIpPoolProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class IdentityProperties(ResourceProperties):
-    DkimSigningEnabled = attrib(default=None)
-    FeedbackForwardingEnabled = attrib(default=None)
-    MailFromAttributes = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Identity(Resource):
-    """A Identity for PinpointEmail.
-
-    See Also:
-        `AWS Cloud Formation documentation for Identity
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpointemail-identity.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::PinpointEmail::Identity"
-
-    Properties: IdentityProperties = attrib(
-        factory=IdentityProperties,
-        converter=create_object_converter(IdentityProperties),
+    class DedicatedIpPool(_Resource):
+        """A Dedicated Ip Pool for PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for DedicatedIpPool
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpointemail-dedicatedippool.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::PinpointEmail::DedicatedIpPool"
+
+        Properties: DedicatedIpPoolProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DedicatedIpPool",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DedicatedIpPoolProperties},
+            factories={"Properties": DedicatedIpPoolProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DedicatedIpPoolProperties()
+            _setattr("Properties", _convert_DedicatedIpPoolProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DedicatedIpPool, DedicatedIpPoolProperties, DedicatedIpPoolTags
+
+
+def _create_Identity():
+    class IdentityMailFromAttributes(_PropertyType):
+        """The Mail From Attributes property type for Identity in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for MailFromAttributes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-identity-mailfromattributes.html>`_
+        """
+
+        __slots__ = ("BehaviorOnMxFailure", "MailFromDomain")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityMailFromAttributes", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, BehaviorOnMxFailure=None, MailFromDomain=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BehaviorOnMxFailure", BehaviorOnMxFailure)
+            _setattr("MailFromDomain", MailFromDomain)
+            _init_PropertyType(self, kwargs)
+
+    class IdentityTags(_PropertyType):
+        """The Tags property type for Identity in PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for Tags
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-pinpointemail-identity-tags.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityTags", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_IdentityMailFromAttributes = create_object_converter(
+        IdentityMailFromAttributes
     )
+    _convert_IdentityTags_list = create_object_list_converter(IdentityTags)
+
+    class IdentityProperties(_ResourceProperties):
+        __slots__ = (
+            "DkimSigningEnabled",
+            "FeedbackForwardingEnabled",
+            "MailFromAttributes",
+            "Name",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IdentityProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "MailFromAttributes": _convert_IdentityMailFromAttributes,
+                "Tags": _convert_IdentityTags_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DkimSigningEnabled=None,
+            FeedbackForwardingEnabled=None,
+            MailFromAttributes=None,
+            Name=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DkimSigningEnabled", DkimSigningEnabled)
+            _setattr("FeedbackForwardingEnabled", FeedbackForwardingEnabled)
+            _setattr(
+                "MailFromAttributes",
+                _convert_IdentityMailFromAttributes(MailFromAttributes),
+            )
+            _setattr("Name", Name)
+            _setattr("Tags", _convert_IdentityTags_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_IdentityProperties = create_object_converter(IdentityProperties)
+
+    class Identity(_Resource):
+        """A Identity for PinpointEmail.
+
+        See Also:
+            `AWS Cloud Formation documentation for Identity
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-pinpointemail-identity.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::PinpointEmail::Identity"
+
+        Properties: IdentityProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Identity",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_IdentityProperties},
+            factories={"Properties": IdentityProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = IdentityProperties()
+            _setattr("Properties", _convert_IdentityProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Identity, IdentityProperties, IdentityMailFromAttributes, IdentityTags
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ConfigurationSet": _create_ConfigurationSet,
+        "ConfigurationSetProperties": _create_ConfigurationSet,
+        "ConfigurationSetDeliveryOptions": _create_ConfigurationSet,
+        "ConfigurationSetReputationOptions": _create_ConfigurationSet,
+        "ConfigurationSetSendingOptions": _create_ConfigurationSet,
+        "ConfigurationSetTags": _create_ConfigurationSet,
+        "ConfigurationSetTrackingOptions": _create_ConfigurationSet,
+        "ConfigurationSetEventDestination": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationProperties": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationCloudWatchDestination": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationDimensionConfiguration": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationEventDestination": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationKinesisFirehoseDestination": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationPinpointDestination": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationSnsDestination": _create_ConfigurationSetEventDestination,
+        "DedicatedIpPool": _create_DedicatedIpPool,
+        "DedicatedIpPoolProperties": _create_DedicatedIpPool,
+        "DedicatedIpPoolTags": _create_DedicatedIpPool,
+        "Identity": _create_Identity,
+        "IdentityProperties": _create_Identity,
+        "IdentityMailFromAttributes": _create_Identity,
+        "IdentityTags": _create_Identity,
+    },
+)
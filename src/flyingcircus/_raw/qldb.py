@@ -7,36 +7,99 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Ledger", "LedgerProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Ledger",
+    "LedgerProperties",
+]
 
-@attrs(**ATTRSCONFIG)
-class LedgerProperties(ResourceProperties):
-    DeletionProtection = attrib(default=None)
-    Name = attrib(default=None)
-    PermissionsMode = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_Ledger():
+    _convert_Tag_list = create_object_list_converter(_Tag)
 
-@attrs(**ATTRSCONFIG)
-class Ledger(Resource):
-    """A Ledger for QLDB.
+    class LedgerProperties(_ResourceProperties):
+        __slots__ = ("DeletionProtection", "Name", "PermissionsMode", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LedgerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for Ledger
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-qldb-ledger.html>`_
-    """
+        def __init__(
+            self,
+            *,
+            DeletionProtection=None,
+            Name=None,
+            PermissionsMode=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeletionProtection", DeletionProtection)
+            _setattr("Name", Name)
+            _setattr("PermissionsMode", PermissionsMode)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::QLDB::Ledger"
+    _convert_LedgerProperties = create_object_converter(LedgerProperties)
 
-    Properties: LedgerProperties = attrib(
-        factory=LedgerProperties, converter=create_object_converter(LedgerProperties)
-    )
+    class Ledger(_Resource):
+        """A Ledger for QLDB.
+
+        See Also:
+            `AWS Cloud Formation documentation for Ledger
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-qldb-ledger.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::QLDB::Ledger"
+
+        Properties: LedgerProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Ledger",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LedgerProperties},
+            factories={"Properties": LedgerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LedgerProperties()
+            _setattr("Properties", _convert_LedgerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Ledger, LedgerProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Ledger": _create_Ledger,
+        "LedgerProperties": _create_Ledger,
+    },
+)
@@ -7,38 +7,107 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["ResourceShare", "ResourceShareProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "ResourceShare",
+    "ResourceShareProperties",
+]
 
-@attrs(**ATTRSCONFIG)
-class ResourceShareProperties(ResourceProperties):
-    AllowExternalPrincipals = attrib(default=None)
-    Name = attrib(default=None)
-    Principals = attrib(default=None)
-    ResourceArns = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_ResourceShare():
+    _convert_Tag_list = create_object_list_converter(_Tag)
 
-@attrs(**ATTRSCONFIG)
-class ResourceShare(Resource):
-    """A Resource Share for RAM.
+    class ResourceShareProperties(_ResourceProperties):
+        __slots__ = (
+            "AllowExternalPrincipals",
+            "Name",
+            "Principals",
+            "ResourceArns",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceShareProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    See Also:
-        `AWS Cloud Formation documentation for ResourceShare
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ram-resourceshare.html>`_
-    """
+        def __init__(
+            self,
+            *,
+            AllowExternalPrincipals=None,
+            Name=None,
+            Principals=None,
+            ResourceArns=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowExternalPrincipals", AllowExternalPrincipals)
+            _setattr("Name", Name)
+            _setattr("Principals", Principals)
+            _setattr("ResourceArns", ResourceArns)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
 
-    RESOURCE_TYPE = "AWS::RAM::ResourceShare"
+    _convert_ResourceShareProperties = create_object_converter(ResourceShareProperties)
 
-    Properties: ResourceShareProperties = attrib(
-        factory=ResourceShareProperties,
-        converter=create_object_converter(ResourceShareProperties),
-    )
+    class ResourceShare(_Resource):
+        """A Resource Share for RAM.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceShare
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ram-resourceshare.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RAM::ResourceShare"
+
+        Properties: ResourceShareProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceShare",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResourceShareProperties},
+            factories={"Properties": ResourceShareProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResourceShareProperties()
+            _setattr("Properties", _convert_ResourceShareProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ResourceShare, ResourceShareProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ResourceShare": _create_ResourceShare,
+        "ResourceShareProperties": _create_ResourceShare,
+    },
+)
@@ -7,25 +7,38 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "DBCluster",
     "DBClusterProperties",
+    "DBClusterDBClusterRole",
+    "DBClusterScalingConfiguration",
     "DBClusterParameterGroup",
     "DBClusterParameterGroupProperties",
     "DBInstance",
     "DBInstanceProperties",
+    "DBInstanceDBInstanceRole",
+    "DBInstanceProcessorFeature",
     "DBParameterGroup",
     "DBParameterGroupProperties",
     "DBSecurityGroup",
     "DBSecurityGroupProperties",
+    "DBSecurityGroupIngressProperty",
     "DBSecurityGroupIngress",
     "DBSecurityGroupIngressProperties",
     "DBSubnetGroup",
@@ -34,306 +47,1179 @@ __all__ = [
     "EventSubscriptionProperties",
     "OptionGroup",
     "OptionGroupProperties",
+    "OptionGroupOptionConfiguration",
+    "OptionGroupOptionSetting",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class DBClusterProperties(ResourceProperties):
-    AssociatedRoles = attrib(default=None)
-    AvailabilityZones = attrib(default=None)
-    BacktrackWindow = attrib(default=None)
-    BackupRetentionPeriod = attrib(default=None)
-    DatabaseName = attrib(default=None)
-    DBClusterIdentifier = attrib(default=None)
-    DBClusterParameterGroupName = attrib(default=None)
-    DBSubnetGroupName = attrib(default=None)
-    DeletionProtection = attrib(default=None)
-    EnableCloudwatchLogsExports = attrib(default=None)
-    EnableHttpEndpoint = attrib(default=None)
-    EnableIAMDatabaseAuthentication = attrib(default=None)
-    Engine = attrib(default=None)
-    EngineMode = attrib(default=None)
-    EngineVersion = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    MasterUsername = attrib(default=None)
-    MasterUserPassword = attrib(default=None)
-    Port = attrib(default=None)
-    PreferredBackupWindow = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    ReplicationSourceIdentifier = attrib(default=None)
-    RestoreType = attrib(default=None)
-    ScalingConfiguration = attrib(default=None)
-    SnapshotIdentifier = attrib(default=None)
-    SourceDBClusterIdentifier = attrib(default=None)
-    SourceRegion = attrib(default=None)
-    StorageEncrypted = attrib(default=None)
-    Tags = attrib(default=None)
-    UseLatestRestorableTime = attrib(default=None)
-    VpcSecurityGroupIds = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBCluster(Resource):
-    """A Db Cluster for RDS.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBCluster
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-dbcluster.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RDS::DBCluster"
-
-    Properties: DBClusterProperties = attrib(
-        factory=DBClusterProperties,
-        converter=create_object_converter(DBClusterProperties),
+def _create_DBCluster():
+    class DBClusterDBClusterRole(_PropertyType):
+        """The Db Cluster Role property type for DBCluster in RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBClusterRole
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-dbcluster-dbclusterrole.html>`_
+        """
+
+        __slots__ = ("FeatureName", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBClusterDBClusterRole", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FeatureName=None, RoleArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FeatureName", FeatureName)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class DBClusterScalingConfiguration(_PropertyType):
+        """The Scaling Configuration property type for DBCluster in RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ScalingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-dbcluster-scalingconfiguration.html>`_
+        """
+
+        __slots__ = ("AutoPause", "MaxCapacity", "MinCapacity", "SecondsUntilAutoPause")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBClusterScalingConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AutoPause=None,
+            MaxCapacity=None,
+            MinCapacity=None,
+            SecondsUntilAutoPause=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutoPause", AutoPause)
+            _setattr("MaxCapacity", MaxCapacity)
+            _setattr("MinCapacity", MinCapacity)
+            _setattr("SecondsUntilAutoPause", SecondsUntilAutoPause)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DBClusterDBClusterRole_list = create_object_list_converter(
+        DBClusterDBClusterRole
     )
-
-
-@attrs(**ATTRSCONFIG)
-class DBClusterParameterGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Family = attrib(default=None)
-    Parameters = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBClusterParameterGroup(Resource):
-    """A Db Cluster Parameter Group for RDS.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBClusterParameterGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-dbclusterparametergroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RDS::DBClusterParameterGroup"
-
-    Properties: DBClusterParameterGroupProperties = attrib(
-        factory=DBClusterParameterGroupProperties,
-        converter=create_object_converter(DBClusterParameterGroupProperties),
+    _convert_DBClusterScalingConfiguration = create_object_converter(
+        DBClusterScalingConfiguration
     )
-
-
-@attrs(**ATTRSCONFIG)
-class DBInstanceProperties(ResourceProperties):
-    AllocatedStorage = attrib(default=None)
-    AllowMajorVersionUpgrade = attrib(default=None)
-    AssociatedRoles = attrib(default=None)
-    AutoMinorVersionUpgrade = attrib(default=None)
-    AvailabilityZone = attrib(default=None)
-    BackupRetentionPeriod = attrib(default=None)
-    CharacterSetName = attrib(default=None)
-    CopyTagsToSnapshot = attrib(default=None)
-    DBClusterIdentifier = attrib(default=None)
-    DBInstanceClass = attrib(default=None)
-    DBInstanceIdentifier = attrib(default=None)
-    DBName = attrib(default=None)
-    DBParameterGroupName = attrib(default=None)
-    DBSecurityGroups = attrib(default=None)
-    DBSnapshotIdentifier = attrib(default=None)
-    DBSubnetGroupName = attrib(default=None)
-    DeleteAutomatedBackups = attrib(default=None)
-    DeletionProtection = attrib(default=None)
-    Domain = attrib(default=None)
-    DomainIAMRoleName = attrib(default=None)
-    EnableCloudwatchLogsExports = attrib(default=None)
-    EnableIAMDatabaseAuthentication = attrib(default=None)
-    EnablePerformanceInsights = attrib(default=None)
-    Engine = attrib(default=None)
-    EngineVersion = attrib(default=None)
-    Iops = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    LicenseModel = attrib(default=None)
-    MasterUsername = attrib(default=None)
-    MasterUserPassword = attrib(default=None)
-    MaxAllocatedStorage = attrib(default=None)
-    MonitoringInterval = attrib(default=None)
-    MonitoringRoleArn = attrib(default=None)
-    MultiAZ = attrib(default=None)
-    OptionGroupName = attrib(default=None)
-    PerformanceInsightsKMSKeyId = attrib(default=None)
-    PerformanceInsightsRetentionPeriod = attrib(default=None)
-    Port = attrib(default=None)
-    PreferredBackupWindow = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    ProcessorFeatures = attrib(default=None)
-    PromotionTier = attrib(default=None)
-    PubliclyAccessible = attrib(default=None)
-    SourceDBInstanceIdentifier = attrib(default=None)
-    SourceRegion = attrib(default=None)
-    StorageEncrypted = attrib(default=None)
-    StorageType = attrib(default=None)
-    Tags = attrib(default=None)
-    Timezone = attrib(default=None)
-    UseDefaultProcessorFeatures = attrib(default=None)
-    VPCSecurityGroups = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBInstance(Resource):
-    """A Db Instance for RDS.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBInstance
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-database-instance.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RDS::DBInstance"
-
-    Properties: DBInstanceProperties = attrib(
-        factory=DBInstanceProperties,
-        converter=create_object_converter(DBInstanceProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBClusterProperties(_ResourceProperties):
+        __slots__ = (
+            "AssociatedRoles",
+            "AvailabilityZones",
+            "BacktrackWindow",
+            "BackupRetentionPeriod",
+            "DatabaseName",
+            "DBClusterIdentifier",
+            "DBClusterParameterGroupName",
+            "DBSubnetGroupName",
+            "DeletionProtection",
+            "EnableCloudwatchLogsExports",
+            "EnableHttpEndpoint",
+            "EnableIAMDatabaseAuthentication",
+            "Engine",
+            "EngineMode",
+            "EngineVersion",
+            "KmsKeyId",
+            "MasterUsername",
+            "MasterUserPassword",
+            "Port",
+            "PreferredBackupWindow",
+            "PreferredMaintenanceWindow",
+            "ReplicationSourceIdentifier",
+            "RestoreType",
+            "ScalingConfiguration",
+            "SnapshotIdentifier",
+            "SourceDBClusterIdentifier",
+            "SourceRegion",
+            "StorageEncrypted",
+            "Tags",
+            "UseLatestRestorableTime",
+            "VpcSecurityGroupIds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBClusterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AssociatedRoles": _convert_DBClusterDBClusterRole_list,
+                "ScalingConfiguration": _convert_DBClusterScalingConfiguration,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssociatedRoles=None,
+            AvailabilityZones=None,
+            BacktrackWindow=None,
+            BackupRetentionPeriod=None,
+            DatabaseName=None,
+            DBClusterIdentifier=None,
+            DBClusterParameterGroupName=None,
+            DBSubnetGroupName=None,
+            DeletionProtection=None,
+            EnableCloudwatchLogsExports=None,
+            EnableHttpEndpoint=None,
+            EnableIAMDatabaseAuthentication=None,
+            Engine=None,
+            EngineMode=None,
+            EngineVersion=None,
+            KmsKeyId=None,
+            MasterUsername=None,
+            MasterUserPassword=None,
+            Port=None,
+            PreferredBackupWindow=None,
+            PreferredMaintenanceWindow=None,
+            ReplicationSourceIdentifier=None,
+            RestoreType=None,
+            ScalingConfiguration=None,
+            SnapshotIdentifier=None,
+            SourceDBClusterIdentifier=None,
+            SourceRegion=None,
+            StorageEncrypted=None,
+            Tags=None,
+            UseLatestRestorableTime=None,
+            VpcSecurityGroupIds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AssociatedRoles", _convert_DBClusterDBClusterRole_list(AssociatedRoles)
+            )
+            _setattr("AvailabilityZones", AvailabilityZones)
+            _setattr("BacktrackWindow", BacktrackWindow)
+            _setattr("BackupRetentionPeriod", BackupRetentionPeriod)
+            _setattr("DatabaseName", DatabaseName)
+            _setattr("DBClusterIdentifier", DBClusterIdentifier)
+            _setattr("DBClusterParameterGroupName", DBClusterParameterGroupName)
+            _setattr("DBSubnetGroupName", DBSubnetGroupName)
+            _setattr("DeletionProtection", DeletionProtection)
+            _setattr("EnableCloudwatchLogsExports", EnableCloudwatchLogsExports)
+            _setattr("EnableHttpEndpoint", EnableHttpEndpoint)
+            _setattr("EnableIAMDatabaseAuthentication", EnableIAMDatabaseAuthentication)
+            _setattr("Engine", Engine)
+            _setattr("EngineMode", EngineMode)
+            _setattr("EngineVersion", EngineVersion)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("MasterUsername", MasterUsername)
+            _setattr("MasterUserPassword", MasterUserPassword)
+            _setattr("Port", Port)
+            _setattr("PreferredBackupWindow", PreferredBackupWindow)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr("ReplicationSourceIdentifier", ReplicationSourceIdentifier)
+            _setattr("RestoreType", RestoreType)
+            _setattr(
+                "ScalingConfiguration",
+                _convert_DBClusterScalingConfiguration(ScalingConfiguration),
+            )
+            _setattr("SnapshotIdentifier", SnapshotIdentifier)
+            _setattr("SourceDBClusterIdentifier", SourceDBClusterIdentifier)
+            _setattr("SourceRegion", SourceRegion)
+            _setattr("StorageEncrypted", StorageEncrypted)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("UseLatestRestorableTime", UseLatestRestorableTime)
+            _setattr("VpcSecurityGroupIds", VpcSecurityGroupIds)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBClusterProperties = create_object_converter(DBClusterProperties)
+
+    class DBCluster(_Resource):
+        """A Db Cluster for RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBCluster
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-dbcluster.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RDS::DBCluster"
+
+        Properties: DBClusterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBCluster",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBClusterProperties},
+            factories={"Properties": DBClusterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBClusterProperties()
+            _setattr("Properties", _convert_DBClusterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        DBCluster,
+        DBClusterProperties,
+        DBClusterDBClusterRole,
+        DBClusterScalingConfiguration,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class DBParameterGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Family = attrib(default=None)
-    Parameters = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBParameterGroup(Resource):
-    """A Db Parameter Group for RDS.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBParameterGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-dbparametergroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RDS::DBParameterGroup"
-
-    Properties: DBParameterGroupProperties = attrib(
-        factory=DBParameterGroupProperties,
-        converter=create_object_converter(DBParameterGroupProperties),
+def _create_DBClusterParameterGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBClusterParameterGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "Family", "Parameters", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBClusterParameterGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Description=None, Family=None, Parameters=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Family", Family)
+            _setattr("Parameters", Parameters)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBClusterParameterGroupProperties = create_object_converter(
+        DBClusterParameterGroupProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class DBSecurityGroupProperties(ResourceProperties):
-    DBSecurityGroupIngress = attrib(default=None)
-    EC2VpcId = attrib(default=None)
-    GroupDescription = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBSecurityGroup(Resource):
-    """A Db Security Group for RDS.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBSecurityGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-security-group.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RDS::DBSecurityGroup"
-
-    Properties: DBSecurityGroupProperties = attrib(
-        factory=DBSecurityGroupProperties,
-        converter=create_object_converter(DBSecurityGroupProperties),
+    class DBClusterParameterGroup(_Resource):
+        """A Db Cluster Parameter Group for RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBClusterParameterGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-dbclusterparametergroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RDS::DBClusterParameterGroup"
+
+        Properties: DBClusterParameterGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBClusterParameterGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBClusterParameterGroupProperties},
+            factories={"Properties": DBClusterParameterGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBClusterParameterGroupProperties()
+            _setattr(
+                "Properties", _convert_DBClusterParameterGroupProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return DBClusterParameterGroup, DBClusterParameterGroupProperties
+
+
+def _create_DBInstance():
+    class DBInstanceDBInstanceRole(_PropertyType):
+        """The Db Instance Role property type for DBInstance in RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBInstanceRole
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-dbinstance-dbinstancerole.html>`_
+        """
+
+        __slots__ = ("FeatureName", "RoleArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBInstanceDBInstanceRole", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FeatureName=None, RoleArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FeatureName", FeatureName)
+            _setattr("RoleArn", RoleArn)
+            _init_PropertyType(self, kwargs)
+
+    class DBInstanceProcessorFeature(_PropertyType):
+        """The Processor Feature property type for DBInstance in RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProcessorFeature
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-dbinstance-processorfeature.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBInstanceProcessorFeature", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DBInstanceDBInstanceRole_list = create_object_list_converter(
+        DBInstanceDBInstanceRole
     )
-
-
-@attrs(**ATTRSCONFIG)
-class DBSecurityGroupIngressProperties(ResourceProperties):
-    CIDRIP = attrib(default=None)
-    DBSecurityGroupName = attrib(default=None)
-    EC2SecurityGroupId = attrib(default=None)
-    EC2SecurityGroupName = attrib(default=None)
-    EC2SecurityGroupOwnerId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBSecurityGroupIngress(Resource):
-    """A Db Security Group Ingress for RDS.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBSecurityGroupIngress
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-security-group-ingress.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RDS::DBSecurityGroupIngress"
-
-    Properties: DBSecurityGroupIngressProperties = attrib(
-        factory=DBSecurityGroupIngressProperties,
-        converter=create_object_converter(DBSecurityGroupIngressProperties),
+    _convert_DBInstanceProcessorFeature_list = create_object_list_converter(
+        DBInstanceProcessorFeature
     )
-
-
-@attrs(**ATTRSCONFIG)
-class DBSubnetGroupProperties(ResourceProperties):
-    DBSubnetGroupDescription = attrib(default=None)
-    DBSubnetGroupName = attrib(default=None)
-    SubnetIds = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class DBSubnetGroup(Resource):
-    """A Db Subnet Group for RDS.
-
-    See Also:
-        `AWS Cloud Formation documentation for DBSubnetGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-dbsubnet-group.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RDS::DBSubnetGroup"
-
-    Properties: DBSubnetGroupProperties = attrib(
-        factory=DBSubnetGroupProperties,
-        converter=create_object_converter(DBSubnetGroupProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBInstanceProperties(_ResourceProperties):
+        __slots__ = (
+            "AllocatedStorage",
+            "AllowMajorVersionUpgrade",
+            "AssociatedRoles",
+            "AutoMinorVersionUpgrade",
+            "AvailabilityZone",
+            "BackupRetentionPeriod",
+            "CharacterSetName",
+            "CopyTagsToSnapshot",
+            "DBClusterIdentifier",
+            "DBInstanceClass",
+            "DBInstanceIdentifier",
+            "DBName",
+            "DBParameterGroupName",
+            "DBSecurityGroups",
+            "DBSnapshotIdentifier",
+            "DBSubnetGroupName",
+            "DeleteAutomatedBackups",
+            "DeletionProtection",
+            "Domain",
+            "DomainIAMRoleName",
+            "EnableCloudwatchLogsExports",
+            "EnableIAMDatabaseAuthentication",
+            "EnablePerformanceInsights",
+            "Engine",
+            "EngineVersion",
+            "Iops",
+            "KmsKeyId",
+            "LicenseModel",
+            "MasterUsername",
+            "MasterUserPassword",
+            "MaxAllocatedStorage",
+            "MonitoringInterval",
+            "MonitoringRoleArn",
+            "MultiAZ",
+            "OptionGroupName",
+            "PerformanceInsightsKMSKeyId",
+            "PerformanceInsightsRetentionPeriod",
+            "Port",
+            "PreferredBackupWindow",
+            "PreferredMaintenanceWindow",
+            "ProcessorFeatures",
+            "PromotionTier",
+            "PubliclyAccessible",
+            "SourceDBInstanceIdentifier",
+            "SourceRegion",
+            "StorageEncrypted",
+            "StorageType",
+            "Tags",
+            "Timezone",
+            "UseDefaultProcessorFeatures",
+            "VPCSecurityGroups",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBInstanceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AssociatedRoles": _convert_DBInstanceDBInstanceRole_list,
+                "ProcessorFeatures": _convert_DBInstanceProcessorFeature_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllocatedStorage=None,
+            AllowMajorVersionUpgrade=None,
+            AssociatedRoles=None,
+            AutoMinorVersionUpgrade=None,
+            AvailabilityZone=None,
+            BackupRetentionPeriod=None,
+            CharacterSetName=None,
+            CopyTagsToSnapshot=None,
+            DBClusterIdentifier=None,
+            DBInstanceClass=None,
+            DBInstanceIdentifier=None,
+            DBName=None,
+            DBParameterGroupName=None,
+            DBSecurityGroups=None,
+            DBSnapshotIdentifier=None,
+            DBSubnetGroupName=None,
+            DeleteAutomatedBackups=None,
+            DeletionProtection=None,
+            Domain=None,
+            DomainIAMRoleName=None,
+            EnableCloudwatchLogsExports=None,
+            EnableIAMDatabaseAuthentication=None,
+            EnablePerformanceInsights=None,
+            Engine=None,
+            EngineVersion=None,
+            Iops=None,
+            KmsKeyId=None,
+            LicenseModel=None,
+            MasterUsername=None,
+            MasterUserPassword=None,
+            MaxAllocatedStorage=None,
+            MonitoringInterval=None,
+            MonitoringRoleArn=None,
+            MultiAZ=None,
+            OptionGroupName=None,
+            PerformanceInsightsKMSKeyId=None,
+            PerformanceInsightsRetentionPeriod=None,
+            Port=None,
+            PreferredBackupWindow=None,
+            PreferredMaintenanceWindow=None,
+            ProcessorFeatures=None,
+            PromotionTier=None,
+            PubliclyAccessible=None,
+            SourceDBInstanceIdentifier=None,
+            SourceRegion=None,
+            StorageEncrypted=None,
+            StorageType=None,
+            Tags=None,
+            Timezone=None,
+            UseDefaultProcessorFeatures=None,
+            VPCSecurityGroups=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllocatedStorage", AllocatedStorage)
+            _setattr("AllowMajorVersionUpgrade", AllowMajorVersionUpgrade)
+            _setattr(
+                "AssociatedRoles",
+                _convert_DBInstanceDBInstanceRole_list(AssociatedRoles),
+            )
+            _setattr("AutoMinorVersionUpgrade", AutoMinorVersionUpgrade)
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("BackupRetentionPeriod", BackupRetentionPeriod)
+            _setattr("CharacterSetName", CharacterSetName)
+            _setattr("CopyTagsToSnapshot", CopyTagsToSnapshot)
+            _setattr("DBClusterIdentifier", DBClusterIdentifier)
+            _setattr("DBInstanceClass", DBInstanceClass)
+            _setattr("DBInstanceIdentifier", DBInstanceIdentifier)
+            _setattr("DBName", DBName)
+            _setattr("DBParameterGroupName", DBParameterGroupName)
+            _setattr("DBSecurityGroups", DBSecurityGroups)
+            _setattr("DBSnapshotIdentifier", DBSnapshotIdentifier)
+            _setattr("DBSubnetGroupName", DBSubnetGroupName)
+            _setattr("DeleteAutomatedBackups", DeleteAutomatedBackups)
+            _setattr("DeletionProtection", DeletionProtection)
+            _setattr("Domain", Domain)
+            _setattr("DomainIAMRoleName", DomainIAMRoleName)
+            _setattr("EnableCloudwatchLogsExports", EnableCloudwatchLogsExports)
+            _setattr("EnableIAMDatabaseAuthentication", EnableIAMDatabaseAuthentication)
+            _setattr("EnablePerformanceInsights", EnablePerformanceInsights)
+            _setattr("Engine", Engine)
+            _setattr("EngineVersion", EngineVersion)
+            _setattr("Iops", Iops)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("LicenseModel", LicenseModel)
+            _setattr("MasterUsername", MasterUsername)
+            _setattr("MasterUserPassword", MasterUserPassword)
+            _setattr("MaxAllocatedStorage", MaxAllocatedStorage)
+            _setattr("MonitoringInterval", MonitoringInterval)
+            _setattr("MonitoringRoleArn", MonitoringRoleArn)
+            _setattr("MultiAZ", MultiAZ)
+            _setattr("OptionGroupName", OptionGroupName)
+            _setattr("PerformanceInsightsKMSKeyId", PerformanceInsightsKMSKeyId)
+            _setattr(
+                "PerformanceInsightsRetentionPeriod", PerformanceInsightsRetentionPeriod
+            )
+            _setattr("Port", Port)
+            _setattr("PreferredBackupWindow", PreferredBackupWindow)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr(
+                "ProcessorFeatures",
+                _convert_DBInstanceProcessorFeature_list(ProcessorFeatures),
+            )
+            _setattr("PromotionTier", PromotionTier)
+            _setattr("PubliclyAccessible", PubliclyAccessible)
+            _setattr("SourceDBInstanceIdentifier", SourceDBInstanceIdentifier)
+            _setattr("SourceRegion", SourceRegion)
+            _setattr("StorageEncrypted", StorageEncrypted)
+            _setattr("StorageType", StorageType)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("Timezone", Timezone)
+            _setattr("UseDefaultProcessorFeatures", UseDefaultProcessorFeatures)
+            _setattr("VPCSecurityGroups", VPCSecurityGroups)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBInstanceProperties = create_object_converter(DBInstanceProperties)
+
+    class DBInstance(_Resource):
+        """A Db Instance for RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBInstance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-database-instance.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RDS::DBInstance"
+
+        Properties: DBInstanceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBInstance",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBInstanceProperties},
+            factories={"Properties": DBInstanceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBInstanceProperties()
+            _setattr("Properties", _convert_DBInstanceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        DBInstance,
+        DBInstanceProperties,
+        DBInstanceDBInstanceRole,
+        DBInstanceProcessorFeature,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class EventSubscriptionProperties(ResourceProperties):
-    Enabled = attrib(default=None)
-    EventCategories = attrib(default=None)
-    SnsTopicArn = attrib(default=None)
-    SourceIds = attrib(default=None)
-    SourceType = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EventSubscription(Resource):
-    """A Event Subscription for RDS.
-
-    See Also:
-        `AWS Cloud Formation documentation for EventSubscription
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-eventsubscription.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RDS::EventSubscription"
-
-    Properties: EventSubscriptionProperties = attrib(
-        factory=EventSubscriptionProperties,
-        converter=create_object_converter(EventSubscriptionProperties),
+def _create_DBParameterGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBParameterGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "Family", "Parameters", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBParameterGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Description=None, Family=None, Parameters=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Family", Family)
+            _setattr("Parameters", Parameters)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBParameterGroupProperties = create_object_converter(
+        DBParameterGroupProperties
     )
 
+    class DBParameterGroup(_Resource):
+        """A Db Parameter Group for RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBParameterGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-dbparametergroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RDS::DBParameterGroup"
+
+        Properties: DBParameterGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBParameterGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBParameterGroupProperties},
+            factories={"Properties": DBParameterGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBParameterGroupProperties()
+            _setattr("Properties", _convert_DBParameterGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DBParameterGroup, DBParameterGroupProperties
+
+
+def _create_DBSecurityGroup():
+    class DBSecurityGroupIngressProperty(_PropertyType):
+        """The Ingress property type for DBSecurityGroup in RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Ingress
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-security-group-rule.html>`_
+        """
+
+        __slots__ = (
+            "CIDRIP",
+            "EC2SecurityGroupId",
+            "EC2SecurityGroupName",
+            "EC2SecurityGroupOwnerId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBSecurityGroupIngressProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CIDRIP=None,
+            EC2SecurityGroupId=None,
+            EC2SecurityGroupName=None,
+            EC2SecurityGroupOwnerId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CIDRIP", CIDRIP)
+            _setattr("EC2SecurityGroupId", EC2SecurityGroupId)
+            _setattr("EC2SecurityGroupName", EC2SecurityGroupName)
+            _setattr("EC2SecurityGroupOwnerId", EC2SecurityGroupOwnerId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_DBSecurityGroupIngressProperty_list = create_object_list_converter(
+        DBSecurityGroupIngressProperty
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBSecurityGroupProperties(_ResourceProperties):
+        __slots__ = ("DBSecurityGroupIngress", "EC2VpcId", "GroupDescription", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBSecurityGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DBSecurityGroupIngress": _convert_DBSecurityGroupIngressProperty_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DBSecurityGroupIngress=None,
+            EC2VpcId=None,
+            GroupDescription=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DBSecurityGroupIngress",
+                _convert_DBSecurityGroupIngressProperty_list(DBSecurityGroupIngress),
+            )
+            _setattr("EC2VpcId", EC2VpcId)
+            _setattr("GroupDescription", GroupDescription)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBSecurityGroupProperties = create_object_converter(
+        DBSecurityGroupProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class OptionGroupProperties(ResourceProperties):
-    EngineName = attrib(default=None)
-    MajorEngineVersion = attrib(default=None)
-    OptionConfigurations = attrib(default=None)
-    OptionGroupDescription = attrib(default=None)
-    Tags = attrib(default=None)
+    class DBSecurityGroup(_Resource):
+        """A Db Security Group for RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBSecurityGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-security-group.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RDS::DBSecurityGroup"
+
+        Properties: DBSecurityGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBSecurityGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBSecurityGroupProperties},
+            factories={"Properties": DBSecurityGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBSecurityGroupProperties()
+            _setattr("Properties", _convert_DBSecurityGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DBSecurityGroup, DBSecurityGroupProperties, DBSecurityGroupIngressProperty
+
+
+def _create_DBSecurityGroupIngress():
+    class DBSecurityGroupIngressProperties(_ResourceProperties):
+        __slots__ = (
+            "CIDRIP",
+            "DBSecurityGroupName",
+            "EC2SecurityGroupId",
+            "EC2SecurityGroupName",
+            "EC2SecurityGroupOwnerId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBSecurityGroupIngressProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CIDRIP=None,
+            DBSecurityGroupName=None,
+            EC2SecurityGroupId=None,
+            EC2SecurityGroupName=None,
+            EC2SecurityGroupOwnerId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CIDRIP", CIDRIP)
+            _setattr("DBSecurityGroupName", DBSecurityGroupName)
+            _setattr("EC2SecurityGroupId", EC2SecurityGroupId)
+            _setattr("EC2SecurityGroupName", EC2SecurityGroupName)
+            _setattr("EC2SecurityGroupOwnerId", EC2SecurityGroupOwnerId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBSecurityGroupIngressProperties = create_object_converter(
+        DBSecurityGroupIngressProperties
+    )
 
+    class DBSecurityGroupIngress(_Resource):
+        """A Db Security Group Ingress for RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBSecurityGroupIngress
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-security-group-ingress.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RDS::DBSecurityGroupIngress"
+
+        Properties: DBSecurityGroupIngressProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBSecurityGroupIngress",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBSecurityGroupIngressProperties},
+            factories={"Properties": DBSecurityGroupIngressProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBSecurityGroupIngressProperties()
+            _setattr(
+                "Properties", _convert_DBSecurityGroupIngressProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return DBSecurityGroupIngress, DBSecurityGroupIngressProperties
+
+
+def _create_DBSubnetGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DBSubnetGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "DBSubnetGroupDescription",
+            "DBSubnetGroupName",
+            "SubnetIds",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBSubnetGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DBSubnetGroupDescription=None,
+            DBSubnetGroupName=None,
+            SubnetIds=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DBSubnetGroupDescription", DBSubnetGroupDescription)
+            _setattr("DBSubnetGroupName", DBSubnetGroupName)
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DBSubnetGroupProperties = create_object_converter(DBSubnetGroupProperties)
+
+    class DBSubnetGroup(_Resource):
+        """A Db Subnet Group for RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for DBSubnetGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-dbsubnet-group.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RDS::DBSubnetGroup"
+
+        Properties: DBSubnetGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DBSubnetGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DBSubnetGroupProperties},
+            factories={"Properties": DBSubnetGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DBSubnetGroupProperties()
+            _setattr("Properties", _convert_DBSubnetGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return DBSubnetGroup, DBSubnetGroupProperties
+
+
+def _create_EventSubscription():
+    class EventSubscriptionProperties(_ResourceProperties):
+        __slots__ = (
+            "Enabled",
+            "EventCategories",
+            "SnsTopicArn",
+            "SourceIds",
+            "SourceType",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventSubscriptionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Enabled=None,
+            EventCategories=None,
+            SnsTopicArn=None,
+            SourceIds=None,
+            SourceType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Enabled", Enabled)
+            _setattr("EventCategories", EventCategories)
+            _setattr("SnsTopicArn", SnsTopicArn)
+            _setattr("SourceIds", SourceIds)
+            _setattr("SourceType", SourceType)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EventSubscriptionProperties = create_object_converter(
+        EventSubscriptionProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class OptionGroup(Resource):
-    """A Option Group for RDS.
+    class EventSubscription(_Resource):
+        """A Event Subscription for RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for EventSubscription
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-eventsubscription.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RDS::EventSubscription"
+
+        Properties: EventSubscriptionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EventSubscription",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EventSubscriptionProperties},
+            factories={"Properties": EventSubscriptionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EventSubscriptionProperties()
+            _setattr("Properties", _convert_EventSubscriptionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EventSubscription, EventSubscriptionProperties
+
+
+def _create_OptionGroup():
+    class OptionGroupOptionSetting(_PropertyType):
+        """The Option Setting property type for OptionGroup in RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for OptionSetting
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-optiongroup-optionconfigurations-optionsettings.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "OptionGroupOptionSetting", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_OptionGroupOptionSetting_list = create_object_list_converter(
+        OptionGroupOptionSetting
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for OptionGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-optiongroup.html>`_
-    """
+    class OptionGroupOptionConfiguration(_PropertyType):
+        """The Option Configuration property type for OptionGroup in RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for OptionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-rds-optiongroup-optionconfigurations.html>`_
+        """
+
+        __slots__ = (
+            "DBSecurityGroupMemberships",
+            "OptionName",
+            "OptionSettings",
+            "OptionVersion",
+            "Port",
+            "VpcSecurityGroupMemberships",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "OptionGroupOptionConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"OptionSettings": _convert_OptionGroupOptionSetting_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DBSecurityGroupMemberships=None,
+            OptionName=None,
+            OptionSettings=None,
+            OptionVersion=None,
+            Port=None,
+            VpcSecurityGroupMemberships=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DBSecurityGroupMemberships", DBSecurityGroupMemberships)
+            _setattr("OptionName", OptionName)
+            _setattr(
+                "OptionSettings", _convert_OptionGroupOptionSetting_list(OptionSettings)
+            )
+            _setattr("OptionVersion", OptionVersion)
+            _setattr("Port", Port)
+            _setattr("VpcSecurityGroupMemberships", VpcSecurityGroupMemberships)
+            _init_PropertyType(self, kwargs)
+
+    _convert_OptionGroupOptionConfiguration_list = create_object_list_converter(
+        OptionGroupOptionConfiguration
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class OptionGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "EngineName",
+            "MajorEngineVersion",
+            "OptionConfigurations",
+            "OptionGroupDescription",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "OptionGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "OptionConfigurations": _convert_OptionGroupOptionConfiguration_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EngineName=None,
+            MajorEngineVersion=None,
+            OptionConfigurations=None,
+            OptionGroupDescription=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EngineName", EngineName)
+            _setattr("MajorEngineVersion", MajorEngineVersion)
+            _setattr(
+                "OptionConfigurations",
+                _convert_OptionGroupOptionConfiguration_list(OptionConfigurations),
+            )
+            _setattr("OptionGroupDescription", OptionGroupDescription)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_OptionGroupProperties = create_object_converter(OptionGroupProperties)
+
+    class OptionGroup(_Resource):
+        """A Option Group for RDS.
+
+        See Also:
+            `AWS Cloud Formation documentation for OptionGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-rds-optiongroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RDS::OptionGroup"
+
+        Properties: OptionGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "OptionGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_OptionGroupProperties},
+            factories={"Properties": OptionGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = OptionGroupProperties()
+            _setattr("Properties", _convert_OptionGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        OptionGroup,
+        OptionGroupProperties,
+        OptionGroupOptionSetting,
+        OptionGroupOptionConfiguration,
+    )
 
-    RESOURCE_TYPE = "AWS::RDS::OptionGroup"
 
-    Properties: OptionGroupProperties = attrib(
-        factory=OptionGroupProperties,
-        converter=create_object_converter(OptionGroupProperties),
-    )
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "DBCluster": _create_DBCluster,
+        "DBClusterProperties": _create_DBCluster,
+        "DBClusterDBClusterRole": _create_DBCluster,
+        "DBClusterScalingConfiguration": _create_DBCluster,
+        "DBClusterParameterGroup": _create_DBClusterParameterGroup,
+        "DBClusterParameterGroupProperties": _create_DBClusterParameterGroup,
+        "DBInstance": _create_DBInstance,
+        "DBInstanceProperties": _create_DBInstance,
+        "DBInstanceDBInstanceRole": _create_DBInstance,
+        "DBInstanceProcessorFeature": _create_DBInstance,
+        "DBParameterGroup": _create_DBParameterGroup,
+        "DBParameterGroupProperties": _create_DBParameterGroup,
+        "DBSecurityGroup": _create_DBSecurityGroup,
+        "DBSecurityGroupProperties": _create_DBSecurityGroup,
+        "DBSecurityGroupIngressProperty": _create_DBSecurityGroup,
+        "DBSecurityGroupIngress": _create_DBSecurityGroupIngress,
+        "DBSecurityGroupIngressProperties": _create_DBSecurityGroupIngress,
+        "DBSubnetGroup": _create_DBSubnetGroup,
+        "DBSubnetGroupProperties": _create_DBSubnetGroup,
+        "EventSubscription": _create_EventSubscription,
+        "EventSubscriptionProperties": _create_EventSubscription,
+        "OptionGroup": _create_OptionGroup,
+        "OptionGroupProperties": _create_OptionGroup,
+        "OptionGroupOptionConfiguration": _create_OptionGroup,
+        "OptionGroupOptionSetting": _create_OptionGroup,
+    },
+)
@@ -7,19 +7,29 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Cluster",
     "ClusterProperties",
+    "ClusterLoggingProperties",
     "ClusterParameterGroup",
     "ClusterParameterGroupProperties",
+    "ClusterParameterGroupParameter",
     "ClusterSecurityGroup",
     "ClusterSecurityGroupProperties",
     "ClusterSecurityGroupIngress",
@@ -29,147 +39,503 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ClusterProperties(ResourceProperties):
-    AllowVersionUpgrade = attrib(default=None)
-    AutomatedSnapshotRetentionPeriod = attrib(default=None)
-    AvailabilityZone = attrib(default=None)
-    ClusterIdentifier = attrib(default=None)
-    ClusterParameterGroupName = attrib(default=None)
-    ClusterSecurityGroups = attrib(default=None)
-    ClusterSubnetGroupName = attrib(default=None)
-    ClusterType = attrib(default=None)
-    ClusterVersion = attrib(default=None)
-    DBName = attrib(default=None)
-    ElasticIp = attrib(default=None)
-    Encrypted = attrib(default=None)
-    HsmClientCertificateIdentifier = attrib(default=None)
-    HsmConfigurationIdentifier = attrib(default=None)
-    IamRoles = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    LoggingProperties = attrib(default=None)
-    MasterUsername = attrib(default=None)
-    MasterUserPassword = attrib(default=None)
-    NodeType = attrib(default=None)
-    NumberOfNodes = attrib(default=None)
-    OwnerAccount = attrib(default=None)
-    Port = attrib(default=None)
-    PreferredMaintenanceWindow = attrib(default=None)
-    PubliclyAccessible = attrib(default=None)
-    SnapshotClusterIdentifier = attrib(default=None)
-    SnapshotIdentifier = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcSecurityGroupIds = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Cluster(Resource):
-    """A Cluster for Redshift.
-
-    See Also:
-        `AWS Cloud Formation documentation for Cluster
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-cluster.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Redshift::Cluster"
-
-    Properties: ClusterProperties = attrib(
-        factory=ClusterProperties, converter=create_object_converter(ClusterProperties)
-    )
-
+def _create_Cluster():
+    class ClusterLoggingProperties(_PropertyType):
+        """The Logging Properties property type for Cluster in Redshift.
 
-@attrs(**ATTRSCONFIG)
-class ClusterParameterGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    ParameterGroupFamily = attrib(default=None)
-    Parameters = attrib(default=None)
-    Tags = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for LoggingProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-redshift-cluster-loggingproperties.html>`_
+        """
 
+        __slots__ = ("BucketName", "S3KeyPrefix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterLoggingProperties", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ClusterParameterGroup(Resource):
-    """A Cluster Parameter Group for Redshift.
+        def __init__(self, *, BucketName=None, S3KeyPrefix=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketName", BucketName)
+            _setattr("S3KeyPrefix", S3KeyPrefix)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for ClusterParameterGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-clusterparametergroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Redshift::ClusterParameterGroup"
-
-    Properties: ClusterParameterGroupProperties = attrib(
-        factory=ClusterParameterGroupProperties,
-        converter=create_object_converter(ClusterParameterGroupProperties),
+    _convert_ClusterLoggingProperties = create_object_converter(
+        ClusterLoggingProperties
     )
-
-
-@attrs(**ATTRSCONFIG)
-class ClusterSecurityGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ClusterSecurityGroup(Resource):
-    """A Cluster Security Group for Redshift.
-
-    See Also:
-        `AWS Cloud Formation documentation for ClusterSecurityGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-clustersecuritygroup.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Redshift::ClusterSecurityGroup"
-
-    Properties: ClusterSecurityGroupProperties = attrib(
-        factory=ClusterSecurityGroupProperties,
-        converter=create_object_converter(ClusterSecurityGroupProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ClusterProperties(_ResourceProperties):
+        __slots__ = (
+            "AllowVersionUpgrade",
+            "AutomatedSnapshotRetentionPeriod",
+            "AvailabilityZone",
+            "ClusterIdentifier",
+            "ClusterParameterGroupName",
+            "ClusterSecurityGroups",
+            "ClusterSubnetGroupName",
+            "ClusterType",
+            "ClusterVersion",
+            "DBName",
+            "ElasticIp",
+            "Encrypted",
+            "HsmClientCertificateIdentifier",
+            "HsmConfigurationIdentifier",
+            "IamRoles",
+            "KmsKeyId",
+            "LoggingProperties",
+            "MasterUsername",
+            "MasterUserPassword",
+            "NodeType",
+            "NumberOfNodes",
+            "OwnerAccount",
+            "Port",
+            "PreferredMaintenanceWindow",
+            "PubliclyAccessible",
+            "SnapshotClusterIdentifier",
+            "SnapshotIdentifier",
+            "Tags",
+            "VpcSecurityGroupIds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LoggingProperties": _convert_ClusterLoggingProperties,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowVersionUpgrade=None,
+            AutomatedSnapshotRetentionPeriod=None,
+            AvailabilityZone=None,
+            ClusterIdentifier=None,
+            ClusterParameterGroupName=None,
+            ClusterSecurityGroups=None,
+            ClusterSubnetGroupName=None,
+            ClusterType=None,
+            ClusterVersion=None,
+            DBName=None,
+            ElasticIp=None,
+            Encrypted=None,
+            HsmClientCertificateIdentifier=None,
+            HsmConfigurationIdentifier=None,
+            IamRoles=None,
+            KmsKeyId=None,
+            LoggingProperties=None,
+            MasterUsername=None,
+            MasterUserPassword=None,
+            NodeType=None,
+            NumberOfNodes=None,
+            OwnerAccount=None,
+            Port=None,
+            PreferredMaintenanceWindow=None,
+            PubliclyAccessible=None,
+            SnapshotClusterIdentifier=None,
+            SnapshotIdentifier=None,
+            Tags=None,
+            VpcSecurityGroupIds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowVersionUpgrade", AllowVersionUpgrade)
+            _setattr(
+                "AutomatedSnapshotRetentionPeriod", AutomatedSnapshotRetentionPeriod
+            )
+            _setattr("AvailabilityZone", AvailabilityZone)
+            _setattr("ClusterIdentifier", ClusterIdentifier)
+            _setattr("ClusterParameterGroupName", ClusterParameterGroupName)
+            _setattr("ClusterSecurityGroups", ClusterSecurityGroups)
+            _setattr("ClusterSubnetGroupName", ClusterSubnetGroupName)
+            _setattr("ClusterType", ClusterType)
+            _setattr("ClusterVersion", ClusterVersion)
+            _setattr("DBName", DBName)
+            _setattr("ElasticIp", ElasticIp)
+            _setattr("Encrypted", Encrypted)
+            _setattr("HsmClientCertificateIdentifier", HsmClientCertificateIdentifier)
+            _setattr("HsmConfigurationIdentifier", HsmConfigurationIdentifier)
+            _setattr("IamRoles", IamRoles)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr(
+                "LoggingProperties",
+                _convert_ClusterLoggingProperties(LoggingProperties),
+            )
+            _setattr("MasterUsername", MasterUsername)
+            _setattr("MasterUserPassword", MasterUserPassword)
+            _setattr("NodeType", NodeType)
+            _setattr("NumberOfNodes", NumberOfNodes)
+            _setattr("OwnerAccount", OwnerAccount)
+            _setattr("Port", Port)
+            _setattr("PreferredMaintenanceWindow", PreferredMaintenanceWindow)
+            _setattr("PubliclyAccessible", PubliclyAccessible)
+            _setattr("SnapshotClusterIdentifier", SnapshotClusterIdentifier)
+            _setattr("SnapshotIdentifier", SnapshotIdentifier)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcSecurityGroupIds", VpcSecurityGroupIds)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClusterProperties = create_object_converter(ClusterProperties)
+
+    class Cluster(_Resource):
+        """A Cluster for Redshift.
+
+        See Also:
+            `AWS Cloud Formation documentation for Cluster
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-cluster.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Redshift::Cluster"
+
+        Properties: ClusterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Cluster",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterProperties},
+            factories={"Properties": ClusterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterProperties()
+            _setattr("Properties", _convert_ClusterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Cluster, ClusterProperties, ClusterLoggingProperties
+
+
+def _create_ClusterParameterGroup():
+    class ClusterParameterGroupParameter(_PropertyType):
+        """The Parameter property type for ClusterParameterGroup in Redshift.
+
+        See Also:
+            `AWS Cloud Formation documentation for Parameter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-property-redshift-clusterparametergroup-parameter.html>`_
+        """
+
+        __slots__ = ("ParameterName", "ParameterValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterParameterGroupParameter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ParameterName=None, ParameterValue=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ParameterName", ParameterName)
+            _setattr("ParameterValue", ParameterValue)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ClusterParameterGroupParameter_list = create_object_list_converter(
+        ClusterParameterGroupParameter
     )
-
-
-@attrs(**ATTRSCONFIG)
-class ClusterSecurityGroupIngressProperties(ResourceProperties):
-    CIDRIP = attrib(default=None)
-    ClusterSecurityGroupName = attrib(default=None)
-    EC2SecurityGroupName = attrib(default=None)
-    EC2SecurityGroupOwnerId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ClusterSecurityGroupIngress(Resource):
-    """A Cluster Security Group Ingress for Redshift.
-
-    See Also:
-        `AWS Cloud Formation documentation for ClusterSecurityGroupIngress
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-clustersecuritygroupingress.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Redshift::ClusterSecurityGroupIngress"
-
-    Properties: ClusterSecurityGroupIngressProperties = attrib(
-        factory=ClusterSecurityGroupIngressProperties,
-        converter=create_object_converter(ClusterSecurityGroupIngressProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ClusterParameterGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "ParameterGroupFamily", "Parameters", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterParameterGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Parameters": _convert_ClusterParameterGroupParameter_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            ParameterGroupFamily=None,
+            Parameters=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("ParameterGroupFamily", ParameterGroupFamily)
+            _setattr(
+                "Parameters", _convert_ClusterParameterGroupParameter_list(Parameters)
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClusterParameterGroupProperties = create_object_converter(
+        ClusterParameterGroupProperties
     )
 
+    class ClusterParameterGroup(_Resource):
+        """A Cluster Parameter Group for Redshift.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClusterParameterGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-clusterparametergroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Redshift::ClusterParameterGroup"
+
+        Properties: ClusterParameterGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterParameterGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterParameterGroupProperties},
+            factories={"Properties": ClusterParameterGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterParameterGroupProperties()
+            _setattr("Properties", _convert_ClusterParameterGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ClusterParameterGroup,
+        ClusterParameterGroupProperties,
+        ClusterParameterGroupParameter,
+    )
 
-@attrs(**ATTRSCONFIG)
-class ClusterSubnetGroupProperties(ResourceProperties):
-    Description = attrib(default=None)
-    SubnetIds = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ClusterSubnetGroup(Resource):
-    """A Cluster Subnet Group for Redshift.
 
-    See Also:
-        `AWS Cloud Formation documentation for ClusterSubnetGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-clustersubnetgroup.html>`_
-    """
+def _create_ClusterSecurityGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ClusterSecurityGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterSecurityGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Description=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClusterSecurityGroupProperties = create_object_converter(
+        ClusterSecurityGroupProperties
+    )
 
-    RESOURCE_TYPE = "AWS::Redshift::ClusterSubnetGroup"
+    class ClusterSecurityGroup(_Resource):
+        """A Cluster Security Group for Redshift.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClusterSecurityGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-clustersecuritygroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Redshift::ClusterSecurityGroup"
+
+        Properties: ClusterSecurityGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterSecurityGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterSecurityGroupProperties},
+            factories={"Properties": ClusterSecurityGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterSecurityGroupProperties()
+            _setattr("Properties", _convert_ClusterSecurityGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ClusterSecurityGroup, ClusterSecurityGroupProperties
+
+
+def _create_ClusterSecurityGroupIngress():
+    class ClusterSecurityGroupIngressProperties(_ResourceProperties):
+        __slots__ = (
+            "CIDRIP",
+            "ClusterSecurityGroupName",
+            "EC2SecurityGroupName",
+            "EC2SecurityGroupOwnerId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterSecurityGroupIngressProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CIDRIP=None,
+            ClusterSecurityGroupName=None,
+            EC2SecurityGroupName=None,
+            EC2SecurityGroupOwnerId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CIDRIP", CIDRIP)
+            _setattr("ClusterSecurityGroupName", ClusterSecurityGroupName)
+            _setattr("EC2SecurityGroupName", EC2SecurityGroupName)
+            _setattr("EC2SecurityGroupOwnerId", EC2SecurityGroupOwnerId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClusterSecurityGroupIngressProperties = create_object_converter(
+        ClusterSecurityGroupIngressProperties
+    )
 
-    Properties: ClusterSubnetGroupProperties = attrib(
-        factory=ClusterSubnetGroupProperties,
-        converter=create_object_converter(ClusterSubnetGroupProperties),
+    class ClusterSecurityGroupIngress(_Resource):
+        """A Cluster Security Group Ingress for Redshift.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClusterSecurityGroupIngress
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-clustersecuritygroupingress.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Redshift::ClusterSecurityGroupIngress"
+
+        Properties: ClusterSecurityGroupIngressProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterSecurityGroupIngress",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterSecurityGroupIngressProperties},
+            factories={"Properties": ClusterSecurityGroupIngressProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterSecurityGroupIngressProperties()
+            _setattr(
+                "Properties", _convert_ClusterSecurityGroupIngressProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return ClusterSecurityGroupIngress, ClusterSecurityGroupIngressProperties
+
+
+def _create_ClusterSubnetGroup():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ClusterSubnetGroupProperties(_ResourceProperties):
+        __slots__ = ("Description", "SubnetIds", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterSubnetGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Description=None, SubnetIds=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("SubnetIds", SubnetIds)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ClusterSubnetGroupProperties = create_object_converter(
+        ClusterSubnetGroupProperties
     )
+
+    class ClusterSubnetGroup(_Resource):
+        """A Cluster Subnet Group for Redshift.
+
+        See Also:
+            `AWS Cloud Formation documentation for ClusterSubnetGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-redshift-clustersubnetgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Redshift::ClusterSubnetGroup"
+
+        Properties: ClusterSubnetGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ClusterSubnetGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ClusterSubnetGroupProperties},
+            factories={"Properties": ClusterSubnetGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ClusterSubnetGroupProperties()
+            _setattr("Properties", _convert_ClusterSubnetGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ClusterSubnetGroup, ClusterSubnetGroupProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Cluster": _create_Cluster,
+        "ClusterProperties": _create_Cluster,
+        "ClusterLoggingProperties": _create_Cluster,
+        "ClusterParameterGroup": _create_ClusterParameterGroup,
+        "ClusterParameterGroupProperties": _create_ClusterParameterGroup,
+        "ClusterParameterGroupParameter": _create_ClusterParameterGroup,
+        "ClusterSecurityGroup": _create_ClusterSecurityGroup,
+        "ClusterSecurityGroupProperties": _create_ClusterSecurityGroup,
+        "ClusterSecurityGroupIngress": _create_ClusterSecurityGroupIngress,
+        "ClusterSecurityGroupIngressProperties": _create_ClusterSecurityGroupIngress,
+        "ClusterSubnetGroup": _create_ClusterSubnetGroup,
+        "ClusterSubnetGroupProperties": _create_ClusterSubnetGroup,
+    },
+)
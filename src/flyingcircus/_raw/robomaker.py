@@ -7,13 +7,20 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Fleet",
@@ -22,157 +29,635 @@ __all__ = [
     "RobotProperties",
     "RobotApplication",
     "RobotApplicationProperties",
+    "RobotApplicationRobotSoftwareSuite",
+    "RobotApplicationSourceConfig",
     "RobotApplicationVersion",
     "RobotApplicationVersionProperties",
     "SimulationApplication",
     "SimulationApplicationProperties",
+    "SimulationApplicationRenderingEngine",
+    "SimulationApplicationRobotSoftwareSuite",
+    "SimulationApplicationSimulationSoftwareSuite",
+    "SimulationApplicationSourceConfig",
     "SimulationApplicationVersion",
     "SimulationApplicationVersionProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class FleetProperties(ResourceProperties):
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Fleet(Resource):
-    """A Fleet for RoboMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for Fleet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-fleet.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RoboMaker::Fleet"
-
-    Properties: FleetProperties = attrib(
-        factory=FleetProperties, converter=create_object_converter(FleetProperties)
+def _create_Fleet():
+    class FleetProperties(_ResourceProperties):
+        __slots__ = ("Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "FleetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_FleetProperties = create_object_converter(FleetProperties)
+
+    class Fleet(_Resource):
+        """A Fleet for RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for Fleet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-fleet.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RoboMaker::Fleet"
+        TAG_FORMAT = "Map"
+
+        Properties: FleetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Fleet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_FleetProperties},
+            factories={"Properties": FleetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = FleetProperties()
+            _setattr("Properties", _convert_FleetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Fleet, FleetProperties
+
+
+def _create_Robot():
+    class RobotProperties(_ResourceProperties):
+        __slots__ = ("Architecture", "Fleet", "GreengrassGroupId", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RobotProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Architecture=None,
+            Fleet=None,
+            GreengrassGroupId=None,
+            Name=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Architecture", Architecture)
+            _setattr("Fleet", Fleet)
+            _setattr("GreengrassGroupId", GreengrassGroupId)
+            _setattr("Name", Name)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RobotProperties = create_object_converter(RobotProperties)
+
+    class Robot(_Resource):
+        """A Robot for RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for Robot
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-robot.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RoboMaker::Robot"
+        TAG_FORMAT = "Map"
+
+        Properties: RobotProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Robot",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RobotProperties},
+            factories={"Properties": RobotProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RobotProperties()
+            _setattr("Properties", _convert_RobotProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Robot, RobotProperties
+
+
+def _create_RobotApplication():
+    class RobotApplicationRobotSoftwareSuite(_PropertyType):
+        """The Robot Software Suite property type for RobotApplication in RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for RobotSoftwareSuite
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-robomaker-robotapplication-robotsoftwaresuite.html>`_
+        """
+
+        __slots__ = ("Name", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RobotApplicationRobotSoftwareSuite", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Version=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class RobotApplicationSourceConfig(_PropertyType):
+        """The Source Config property type for RobotApplication in RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for SourceConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-robomaker-robotapplication-sourceconfig.html>`_
+        """
+
+        __slots__ = ("Architecture", "S3Bucket", "S3Key")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RobotApplicationSourceConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Architecture=None, S3Bucket=None, S3Key=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Architecture", Architecture)
+            _setattr("S3Bucket", S3Bucket)
+            _setattr("S3Key", S3Key)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RobotApplicationRobotSoftwareSuite = create_object_converter(
+        RobotApplicationRobotSoftwareSuite
     )
-
-
-@attrs(**ATTRSCONFIG)
-class RobotProperties(ResourceProperties):
-    Architecture = attrib(default=None)
-    Fleet = attrib(default=None)
-    GreengrassGroupId = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Robot(Resource):
-    """A Robot for RoboMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for Robot
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-robot.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RoboMaker::Robot"
-
-    Properties: RobotProperties = attrib(
-        factory=RobotProperties, converter=create_object_converter(RobotProperties)
+    _convert_RobotApplicationSourceConfig_list = create_object_list_converter(
+        RobotApplicationSourceConfig
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RobotApplicationProperties(ResourceProperties):
-    CurrentRevisionId = attrib(default=None)
-    Name = attrib(default=None)
-    RobotSoftwareSuite = attrib(default=None)
-    Sources = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class RobotApplication(Resource):
-    """A Robot Application for RoboMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for RobotApplication
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-robotapplication.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RoboMaker::RobotApplication"
-
-    Properties: RobotApplicationProperties = attrib(
-        factory=RobotApplicationProperties,
-        converter=create_object_converter(RobotApplicationProperties),
+    class RobotApplicationProperties(_ResourceProperties):
+        __slots__ = (
+            "CurrentRevisionId",
+            "Name",
+            "RobotSoftwareSuite",
+            "Sources",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RobotApplicationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "RobotSoftwareSuite": _convert_RobotApplicationRobotSoftwareSuite,
+                "Sources": _convert_RobotApplicationSourceConfig_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CurrentRevisionId=None,
+            Name=None,
+            RobotSoftwareSuite=None,
+            Sources=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CurrentRevisionId", CurrentRevisionId)
+            _setattr("Name", Name)
+            _setattr(
+                "RobotSoftwareSuite",
+                _convert_RobotApplicationRobotSoftwareSuite(RobotSoftwareSuite),
+            )
+            _setattr("Sources", _convert_RobotApplicationSourceConfig_list(Sources))
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RobotApplicationProperties = create_object_converter(
+        RobotApplicationProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RobotApplicationVersionProperties(ResourceProperties):
-    Application = attrib(default=None)
-    CurrentRevisionId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class RobotApplicationVersion(Resource):
-    """A Robot Application Version for RoboMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for RobotApplicationVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-robotapplicationversion.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RoboMaker::RobotApplicationVersion"
-
-    Properties: RobotApplicationVersionProperties = attrib(
-        factory=RobotApplicationVersionProperties,
-        converter=create_object_converter(RobotApplicationVersionProperties),
+    class RobotApplication(_Resource):
+        """A Robot Application for RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for RobotApplication
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-robotapplication.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RoboMaker::RobotApplication"
+        TAG_FORMAT = "Map"
+
+        Properties: RobotApplicationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RobotApplication",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RobotApplicationProperties},
+            factories={"Properties": RobotApplicationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RobotApplicationProperties()
+            _setattr("Properties", _convert_RobotApplicationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        RobotApplication,
+        RobotApplicationProperties,
+        RobotApplicationRobotSoftwareSuite,
+        RobotApplicationSourceConfig,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class SimulationApplicationProperties(ResourceProperties):
-    CurrentRevisionId = attrib(default=None)
-    Name = attrib(default=None)
-    RenderingEngine = attrib(default=None)
-    RobotSoftwareSuite = attrib(default=None)
-    SimulationSoftwareSuite = attrib(default=None)
-    Sources = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SimulationApplication(Resource):
-    """A Simulation Application for RoboMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for SimulationApplication
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-simulationapplication.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::RoboMaker::SimulationApplication"
-
-    Properties: SimulationApplicationProperties = attrib(
-        factory=SimulationApplicationProperties,
-        converter=create_object_converter(SimulationApplicationProperties),
+def _create_RobotApplicationVersion():
+    class RobotApplicationVersionProperties(_ResourceProperties):
+        __slots__ = ("Application", "CurrentRevisionId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RobotApplicationVersionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Application=None, CurrentRevisionId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Application", Application)
+            _setattr("CurrentRevisionId", CurrentRevisionId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RobotApplicationVersionProperties = create_object_converter(
+        RobotApplicationVersionProperties
     )
 
+    class RobotApplicationVersion(_Resource):
+        """A Robot Application Version for RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for RobotApplicationVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-robotapplicationversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RoboMaker::RobotApplicationVersion"
+
+        Properties: RobotApplicationVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RobotApplicationVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RobotApplicationVersionProperties},
+            factories={"Properties": RobotApplicationVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RobotApplicationVersionProperties()
+            _setattr(
+                "Properties", _convert_RobotApplicationVersionProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return RobotApplicationVersion, RobotApplicationVersionProperties
+
+
+def _create_SimulationApplication():
+    class SimulationApplicationRenderingEngine(_PropertyType):
+        """The Rendering Engine property type for SimulationApplication in RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for RenderingEngine
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-robomaker-simulationapplication-renderingengine.html>`_
+        """
+
+        __slots__ = ("Name", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimulationApplicationRenderingEngine", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Version=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class SimulationApplicationRobotSoftwareSuite(_PropertyType):
+        """The Robot Software Suite property type for SimulationApplication in RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for RobotSoftwareSuite
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-robomaker-simulationapplication-robotsoftwaresuite.html>`_
+        """
+
+        __slots__ = ("Name", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimulationApplicationRobotSoftwareSuite", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Version=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class SimulationApplicationSimulationSoftwareSuite(_PropertyType):
+        """The Simulation Software Suite property type for SimulationApplication in RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for SimulationSoftwareSuite
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-robomaker-simulationapplication-simulationsoftwaresuite.html>`_
+        """
+
+        __slots__ = ("Name", "Version")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimulationApplicationSimulationSoftwareSuite", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Version=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Version", Version)
+            _init_PropertyType(self, kwargs)
+
+    class SimulationApplicationSourceConfig(_PropertyType):
+        """The Source Config property type for SimulationApplication in RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for SourceConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-robomaker-simulationapplication-sourceconfig.html>`_
+        """
+
+        __slots__ = ("Architecture", "S3Bucket", "S3Key")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimulationApplicationSourceConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Architecture=None, S3Bucket=None, S3Key=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Architecture", Architecture)
+            _setattr("S3Bucket", S3Bucket)
+            _setattr("S3Key", S3Key)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SimulationApplicationRenderingEngine = create_object_converter(
+        SimulationApplicationRenderingEngine
+    )
+    _convert_SimulationApplicationRobotSoftwareSuite = create_object_converter(
+        SimulationApplicationRobotSoftwareSuite
+    )
+    _convert_SimulationApplicationSimulationSoftwareSuite = create_object_converter(
+        SimulationApplicationSimulationSoftwareSuite
+    )
+    _convert_SimulationApplicationSourceConfig_list = create_object_list_converter(
+        SimulationApplicationSourceConfig
+    )
 
-@attrs(**ATTRSCONFIG)
-class SimulationApplicationVersionProperties(ResourceProperties):
-    Application = attrib(default=None)
-    CurrentRevisionId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SimulationApplicationVersion(Resource):
-    """A Simulation Application Version for RoboMaker.
+    class SimulationApplicationProperties(_ResourceProperties):
+        __slots__ = (
+            "CurrentRevisionId",
+            "Name",
+            "RenderingEngine",
+            "RobotSoftwareSuite",
+            "SimulationSoftwareSuite",
+            "Sources",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimulationApplicationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "RenderingEngine": _convert_SimulationApplicationRenderingEngine,
+                "RobotSoftwareSuite": _convert_SimulationApplicationRobotSoftwareSuite,
+                "SimulationSoftwareSuite": _convert_SimulationApplicationSimulationSoftwareSuite,
+                "Sources": _convert_SimulationApplicationSourceConfig_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CurrentRevisionId=None,
+            Name=None,
+            RenderingEngine=None,
+            RobotSoftwareSuite=None,
+            SimulationSoftwareSuite=None,
+            Sources=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CurrentRevisionId", CurrentRevisionId)
+            _setattr("Name", Name)
+            _setattr(
+                "RenderingEngine",
+                _convert_SimulationApplicationRenderingEngine(RenderingEngine),
+            )
+            _setattr(
+                "RobotSoftwareSuite",
+                _convert_SimulationApplicationRobotSoftwareSuite(RobotSoftwareSuite),
+            )
+            _setattr(
+                "SimulationSoftwareSuite",
+                _convert_SimulationApplicationSimulationSoftwareSuite(
+                    SimulationSoftwareSuite
+                ),
+            )
+            _setattr(
+                "Sources", _convert_SimulationApplicationSourceConfig_list(Sources)
+            )
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SimulationApplicationProperties = create_object_converter(
+        SimulationApplicationProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for SimulationApplicationVersion
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-simulationapplicationversion.html>`_
-    """
+    class SimulationApplication(_Resource):
+        """A Simulation Application for RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for SimulationApplication
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-simulationapplication.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RoboMaker::SimulationApplication"
+        TAG_FORMAT = "Map"
+
+        Properties: SimulationApplicationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimulationApplication",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SimulationApplicationProperties},
+            factories={"Properties": SimulationApplicationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SimulationApplicationProperties()
+            _setattr("Properties", _convert_SimulationApplicationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        SimulationApplication,
+        SimulationApplicationProperties,
+        SimulationApplicationRenderingEngine,
+        SimulationApplicationRobotSoftwareSuite,
+        SimulationApplicationSimulationSoftwareSuite,
+        SimulationApplicationSourceConfig,
+    )
 
-    RESOURCE_TYPE = "AWS::RoboMaker::SimulationApplicationVersion"
 
-    Properties: SimulationApplicationVersionProperties = attrib(
-        factory=SimulationApplicationVersionProperties,
-        converter=create_object_converter(SimulationApplicationVersionProperties),
+def _create_SimulationApplicationVersion():
+    class SimulationApplicationVersionProperties(_ResourceProperties):
+        __slots__ = ("Application", "CurrentRevisionId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimulationApplicationVersionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Application=None, CurrentRevisionId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Application", Application)
+            _setattr("CurrentRevisionId", CurrentRevisionId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SimulationApplicationVersionProperties = create_object_converter(
+        SimulationApplicationVersionProperties
     )
+
+    class SimulationApplicationVersion(_Resource):
+        """A Simulation Application Version for RoboMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for SimulationApplicationVersion
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-robomaker-simulationapplicationversion.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::RoboMaker::SimulationApplicationVersion"
+
+        Properties: SimulationApplicationVersionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SimulationApplicationVersion",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SimulationApplicationVersionProperties},
+            factories={"Properties": SimulationApplicationVersionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SimulationApplicationVersionProperties()
+            _setattr(
+                "Properties",
+                _convert_SimulationApplicationVersionProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return SimulationApplicationVersion, SimulationApplicationVersionProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Fleet": _create_Fleet,
+        "FleetProperties": _create_Fleet,
+        "Robot": _create_Robot,
+        "RobotProperties": _create_Robot,
+        "RobotApplication": _create_RobotApplication,
+        "RobotApplicationProperties": _create_RobotApplication,
+        "RobotApplicationRobotSoftwareSuite": _create_RobotApplication,
+        "RobotApplicationSourceConfig": _create_RobotApplication,
+        "RobotApplicationVersion": _create_RobotApplicationVersion,
+        "RobotApplicationVersionProperties": _create_RobotApplicationVersion,
+        "SimulationApplication": _create_SimulationApplication,
+        "SimulationApplicationProperties": _create_SimulationApplication,
+        "SimulationApplicationRenderingEngine": _create_SimulationApplication,
+        "SimulationApplicationRobotSoftwareSuite": _create_SimulationApplication,
+        "SimulationApplicationSimulationSoftwareSuite": _create_SimulationApplication,
+        "SimulationApplicationSourceConfig": _create_SimulationApplication,
+        "SimulationApplicationVersion": _create_SimulationApplicationVersion,
+        "SimulationApplicationVersionProperties": _create_SimulationApplicationVersion,
+    },
+)
@@ -7,131 +7,858 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "HealthCheck",
     "HealthCheckProperties",
+    "HealthCheckAlarmIdentifier",
+    "HealthCheckHealthCheckConfig",
+    "HealthCheckHealthCheckTag",
     "HostedZone",
     "HostedZoneProperties",
+    "HostedZoneHostedZoneConfig",
+    "HostedZoneHostedZoneTag",
+    "HostedZoneQueryLoggingConfig",
+    "HostedZoneVPC",
     "RecordSet",
     "RecordSetProperties",
+    "RecordSetAliasTarget",
+    "RecordSetGeoLocation",
     "RecordSetGroup",
     "RecordSetGroupProperties",
+    "RecordSetGroupAliasTarget",
+    "RecordSetGroupGeoLocation",
+    "RecordSetGroupRecordSet",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class HealthCheckProperties(ResourceProperties):
-    HealthCheckConfig = attrib(default=None)
-    HealthCheckTags = attrib(default=None)
-
+def _create_HealthCheck():
+    class HealthCheckAlarmIdentifier(_PropertyType):
+        """The Alarm Identifier property type for HealthCheck in Route53.
 
-@attrs(**ATTRSCONFIG)
-class HealthCheck(Resource):
-    """A Health Check for Route53.
+        See Also:
+            `AWS Cloud Formation documentation for AlarmIdentifier
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-healthcheck-alarmidentifier.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for HealthCheck
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53-healthcheck.html>`_
-    """
+        __slots__ = ("Name", "Region")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HealthCheckAlarmIdentifier", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Route53::HealthCheck"
+        def __init__(self, *, Name=None, Region=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Region", Region)
+            _init_PropertyType(self, kwargs)
 
-    Properties: HealthCheckProperties = attrib(
-        factory=HealthCheckProperties,
-        converter=create_object_converter(HealthCheckProperties),
+    _convert_HealthCheckAlarmIdentifier = create_object_converter(
+        HealthCheckAlarmIdentifier
     )
 
+    class HealthCheckHealthCheckConfig(_PropertyType):
+        """The Health Check Config property type for HealthCheck in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for HealthCheckConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-healthcheck-healthcheckconfig.html>`_
+        """
+
+        __slots__ = (
+            "AlarmIdentifier",
+            "ChildHealthChecks",
+            "EnableSNI",
+            "FailureThreshold",
+            "FullyQualifiedDomainName",
+            "HealthThreshold",
+            "InsufficientDataHealthStatus",
+            "Inverted",
+            "IPAddress",
+            "MeasureLatency",
+            "Port",
+            "Regions",
+            "RequestInterval",
+            "ResourcePath",
+            "SearchString",
+            "Type",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HealthCheckHealthCheckConfig",
+            _PropertyType,
+            __slots__,
+            converters={"AlarmIdentifier": _convert_HealthCheckAlarmIdentifier},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AlarmIdentifier=None,
+            ChildHealthChecks=None,
+            EnableSNI=None,
+            FailureThreshold=None,
+            FullyQualifiedDomainName=None,
+            HealthThreshold=None,
+            InsufficientDataHealthStatus=None,
+            Inverted=None,
+            IPAddress=None,
+            MeasureLatency=None,
+            Port=None,
+            Regions=None,
+            RequestInterval=None,
+            ResourcePath=None,
+            SearchString=None,
+            Type=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AlarmIdentifier", _convert_HealthCheckAlarmIdentifier(AlarmIdentifier)
+            )
+            _setattr("ChildHealthChecks", ChildHealthChecks)
+            _setattr("EnableSNI", EnableSNI)
+            _setattr("FailureThreshold", FailureThreshold)
+            _setattr("FullyQualifiedDomainName", FullyQualifiedDomainName)
+            _setattr("HealthThreshold", HealthThreshold)
+            _setattr("InsufficientDataHealthStatus", InsufficientDataHealthStatus)
+            _setattr("Inverted", Inverted)
+            _setattr("IPAddress", IPAddress)
+            _setattr("MeasureLatency", MeasureLatency)
+            _setattr("Port", Port)
+            _setattr("Regions", Regions)
+            _setattr("RequestInterval", RequestInterval)
+            _setattr("ResourcePath", ResourcePath)
+            _setattr("SearchString", SearchString)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class HealthCheckHealthCheckTag(_PropertyType):
+        """The Health Check Tag property type for HealthCheck in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for HealthCheckTag
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-healthcheck-healthchecktag.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HealthCheckHealthCheckTag", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_HealthCheckHealthCheckConfig = create_object_converter(
+        HealthCheckHealthCheckConfig
+    )
+    _convert_HealthCheckHealthCheckTag_list = create_object_list_converter(
+        HealthCheckHealthCheckTag
+    )
 
-@attrs(**ATTRSCONFIG)
-class HostedZoneProperties(ResourceProperties):
-    HostedZoneConfig = attrib(default=None)
-    HostedZoneTags = attrib(default=None)
-    Name = attrib(default=None)
-    QueryLoggingConfig = attrib(default=None)
-    VPCs = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class HostedZone(Resource):
-    """A Hosted Zone for Route53.
-
-    See Also:
-        `AWS Cloud Formation documentation for HostedZone
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53-hostedzone.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Route53::HostedZone"
-
-    Properties: HostedZoneProperties = attrib(
-        factory=HostedZoneProperties,
-        converter=create_object_converter(HostedZoneProperties),
+    class HealthCheckProperties(_ResourceProperties):
+        __slots__ = ("HealthCheckConfig", "HealthCheckTags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HealthCheckProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "HealthCheckConfig": _convert_HealthCheckHealthCheckConfig,
+                "HealthCheckTags": _convert_HealthCheckHealthCheckTag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, HealthCheckConfig=None, HealthCheckTags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "HealthCheckConfig",
+                _convert_HealthCheckHealthCheckConfig(HealthCheckConfig),
+            )
+            _setattr(
+                "HealthCheckTags",
+                _convert_HealthCheckHealthCheckTag_list(HealthCheckTags),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_HealthCheckProperties = create_object_converter(HealthCheckProperties)
+
+    class HealthCheck(_Resource):
+        """A Health Check for Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for HealthCheck
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53-healthcheck.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Route53::HealthCheck"
+        TAG_PROPERTY = "HealthCheckTags"
+
+        Properties: HealthCheckProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HealthCheck",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_HealthCheckProperties},
+            factories={"Properties": HealthCheckProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = HealthCheckProperties()
+            _setattr("Properties", _convert_HealthCheckProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        HealthCheck,
+        HealthCheckProperties,
+        HealthCheckAlarmIdentifier,
+        HealthCheckHealthCheckConfig,
+        HealthCheckHealthCheckTag,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class RecordSetProperties(ResourceProperties):
-    AliasTarget = attrib(default=None)
-    Comment = attrib(default=None)
-    Failover = attrib(default=None)
-    GeoLocation = attrib(default=None)
-    HealthCheckId = attrib(default=None)
-    HostedZoneId = attrib(default=None)
-    HostedZoneName = attrib(default=None)
-    MultiValueAnswer = attrib(default=None)
-    Name = attrib(default=None)
-    Region = attrib(default=None)
-    ResourceRecords = attrib(default=None)
-    SetIdentifier = attrib(default=None)
-    TTL = attrib(default=None)
-    Type = attrib(default=None)
-    Weight = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class RecordSet(Resource):
-    """A Record Set for Route53.
-
-    See Also:
-        `AWS Cloud Formation documentation for RecordSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-recordset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::Route53::RecordSet"
-
-    Properties: RecordSetProperties = attrib(
-        factory=RecordSetProperties,
-        converter=create_object_converter(RecordSetProperties),
+def _create_HostedZone():
+    class HostedZoneHostedZoneConfig(_PropertyType):
+        """The Hosted Zone Config property type for HostedZone in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for HostedZoneConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-hostedzone-hostedzoneconfig.html>`_
+        """
+
+        __slots__ = ("Comment",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HostedZoneHostedZoneConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Comment=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Comment", Comment)
+            _init_PropertyType(self, kwargs)
+
+    class HostedZoneHostedZoneTag(_PropertyType):
+        """The Hosted Zone Tag property type for HostedZone in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for HostedZoneTag
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-hostedzone-hostedzonetags.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HostedZoneHostedZoneTag", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class HostedZoneQueryLoggingConfig(_PropertyType):
+        """The Query Logging Config property type for HostedZone in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for QueryLoggingConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-hostedzone-queryloggingconfig.html>`_
+        """
+
+        __slots__ = ("CloudWatchLogsLogGroupArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HostedZoneQueryLoggingConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CloudWatchLogsLogGroupArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudWatchLogsLogGroupArn", CloudWatchLogsLogGroupArn)
+            _init_PropertyType(self, kwargs)
+
+    class HostedZoneVPC(_PropertyType):
+        """The Vpc property type for HostedZone in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for VPC
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53-hostedzone-hostedzonevpcs.html>`_
+        """
+
+        __slots__ = ("VPCId", "VPCRegion")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HostedZoneVPC", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VPCId=None, VPCRegion=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VPCId", VPCId)
+            _setattr("VPCRegion", VPCRegion)
+            _init_PropertyType(self, kwargs)
+
+    _convert_HostedZoneHostedZoneConfig = create_object_converter(
+        HostedZoneHostedZoneConfig
+    )
+    _convert_HostedZoneHostedZoneTag_list = create_object_list_converter(
+        HostedZoneHostedZoneTag
+    )
+    _convert_HostedZoneQueryLoggingConfig = create_object_converter(
+        HostedZoneQueryLoggingConfig
+    )
+    _convert_HostedZoneVPC_list = create_object_list_converter(HostedZoneVPC)
+
+    class HostedZoneProperties(_ResourceProperties):
+        __slots__ = (
+            "HostedZoneConfig",
+            "HostedZoneTags",
+            "Name",
+            "QueryLoggingConfig",
+            "VPCs",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HostedZoneProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "HostedZoneConfig": _convert_HostedZoneHostedZoneConfig,
+                "HostedZoneTags": _convert_HostedZoneHostedZoneTag_list,
+                "QueryLoggingConfig": _convert_HostedZoneQueryLoggingConfig,
+                "VPCs": _convert_HostedZoneVPC_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            HostedZoneConfig=None,
+            HostedZoneTags=None,
+            Name=None,
+            QueryLoggingConfig=None,
+            VPCs=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "HostedZoneConfig",
+                _convert_HostedZoneHostedZoneConfig(HostedZoneConfig),
+            )
+            _setattr(
+                "HostedZoneTags", _convert_HostedZoneHostedZoneTag_list(HostedZoneTags)
+            )
+            _setattr("Name", Name)
+            _setattr(
+                "QueryLoggingConfig",
+                _convert_HostedZoneQueryLoggingConfig(QueryLoggingConfig),
+            )
+            _setattr("VPCs", _convert_HostedZoneVPC_list(VPCs))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_HostedZoneProperties = create_object_converter(HostedZoneProperties)
+
+    class HostedZone(_Resource):
+        """A Hosted Zone for Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for HostedZone
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53-hostedzone.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Route53::HostedZone"
+        TAG_PROPERTY = "HostedZoneTags"
+
+        Properties: HostedZoneProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HostedZone",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_HostedZoneProperties},
+            factories={"Properties": HostedZoneProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = HostedZoneProperties()
+            _setattr("Properties", _convert_HostedZoneProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        HostedZone,
+        HostedZoneProperties,
+        HostedZoneHostedZoneConfig,
+        HostedZoneHostedZoneTag,
+        HostedZoneQueryLoggingConfig,
+        HostedZoneVPC,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class RecordSetGroupProperties(ResourceProperties):
-    Comment = attrib(default=None)
-    HostedZoneId = attrib(default=None)
-    HostedZoneName = attrib(default=None)
-    RecordSets = attrib(default=None)
+def _create_RecordSet():
+    class RecordSetAliasTarget(_PropertyType):
+        """The Alias Target property type for RecordSet in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for AliasTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-aliastarget.html>`_
+        """
+
+        __slots__ = ("DNSName", "EvaluateTargetHealth", "HostedZoneId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RecordSetAliasTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DNSName=None,
+            EvaluateTargetHealth=None,
+            HostedZoneId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DNSName", DNSName)
+            _setattr("EvaluateTargetHealth", EvaluateTargetHealth)
+            _setattr("HostedZoneId", HostedZoneId)
+            _init_PropertyType(self, kwargs)
+
+    class RecordSetGeoLocation(_PropertyType):
+        """The Geo Location property type for RecordSet in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for GeoLocation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-recordset-geolocation.html>`_
+        """
+
+        __slots__ = ("ContinentCode", "CountryCode", "SubdivisionCode")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RecordSetGeoLocation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContinentCode=None,
+            CountryCode=None,
+            SubdivisionCode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContinentCode", ContinentCode)
+            _setattr("CountryCode", CountryCode)
+            _setattr("SubdivisionCode", SubdivisionCode)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RecordSetAliasTarget = create_object_converter(RecordSetAliasTarget)
+    _convert_RecordSetGeoLocation = create_object_converter(RecordSetGeoLocation)
+
+    class RecordSetProperties(_ResourceProperties):
+        __slots__ = (
+            "AliasTarget",
+            "Comment",
+            "Failover",
+            "GeoLocation",
+            "HealthCheckId",
+            "HostedZoneId",
+            "HostedZoneName",
+            "MultiValueAnswer",
+            "Name",
+            "Region",
+            "ResourceRecords",
+            "SetIdentifier",
+            "TTL",
+            "Type",
+            "Weight",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RecordSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AliasTarget": _convert_RecordSetAliasTarget,
+                "GeoLocation": _convert_RecordSetGeoLocation,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AliasTarget=None,
+            Comment=None,
+            Failover=None,
+            GeoLocation=None,
+            HealthCheckId=None,
+            HostedZoneId=None,
+            HostedZoneName=None,
+            MultiValueAnswer=None,
+            Name=None,
+            Region=None,
+            ResourceRecords=None,
+            SetIdentifier=None,
+            TTL=None,
+            Type=None,
+            Weight=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AliasTarget", _convert_RecordSetAliasTarget(AliasTarget))
+            _setattr("Comment", Comment)
+            _setattr("Failover", Failover)
+            _setattr("GeoLocation", _convert_RecordSetGeoLocation(GeoLocation))
+            _setattr("HealthCheckId", HealthCheckId)
+            _setattr("HostedZoneId", HostedZoneId)
+            _setattr("HostedZoneName", HostedZoneName)
+            _setattr("MultiValueAnswer", MultiValueAnswer)
+            _setattr("Name", Name)
+            _setattr("Region", Region)
+            _setattr("ResourceRecords", ResourceRecords)
+            _setattr("SetIdentifier", SetIdentifier)
+            _setattr("TTL", TTL)
+            _setattr("Type", Type)
+            _setattr("Weight", Weight)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RecordSetProperties = create_object_converter(RecordSetProperties)
+
+    class RecordSet(_Resource):
+        """A Record Set for Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-recordset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Route53::RecordSet"
+
+        Properties: RecordSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RecordSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RecordSetProperties},
+            factories={"Properties": RecordSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RecordSetProperties()
+            _setattr("Properties", _convert_RecordSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return RecordSet, RecordSetProperties, RecordSetAliasTarget, RecordSetGeoLocation
+
+
+def _create_RecordSetGroup():
+    class RecordSetGroupAliasTarget(_PropertyType):
+        """The Alias Target property type for RecordSetGroup in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for AliasTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-aliastarget.html>`_
+        """
+
+        __slots__ = ("DNSName", "EvaluateTargetHealth", "HostedZoneId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RecordSetGroupAliasTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DNSName=None,
+            EvaluateTargetHealth=None,
+            HostedZoneId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DNSName", DNSName)
+            _setattr("EvaluateTargetHealth", EvaluateTargetHealth)
+            _setattr("HostedZoneId", HostedZoneId)
+            _init_PropertyType(self, kwargs)
+
+    class RecordSetGroupGeoLocation(_PropertyType):
+        """The Geo Location property type for RecordSetGroup in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for GeoLocation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-recordset-geolocation.html>`_
+        """
+
+        __slots__ = ("ContinentCode", "CountryCode", "SubdivisionCode")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RecordSetGroupGeoLocation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContinentCode=None,
+            CountryCode=None,
+            SubdivisionCode=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContinentCode", ContinentCode)
+            _setattr("CountryCode", CountryCode)
+            _setattr("SubdivisionCode", SubdivisionCode)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RecordSetGroupAliasTarget = create_object_converter(
+        RecordSetGroupAliasTarget
+    )
+    _convert_RecordSetGroupGeoLocation = create_object_converter(
+        RecordSetGroupGeoLocation
+    )
 
+    class RecordSetGroupRecordSet(_PropertyType):
+        """The Record Set property type for RecordSetGroup in Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53-recordset.html>`_
+        """
+
+        __slots__ = (
+            "AliasTarget",
+            "Comment",
+            "Failover",
+            "GeoLocation",
+            "HealthCheckId",
+            "HostedZoneId",
+            "HostedZoneName",
+            "MultiValueAnswer",
+            "Name",
+            "Region",
+            "ResourceRecords",
+            "SetIdentifier",
+            "TTL",
+            "Type",
+            "Weight",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RecordSetGroupRecordSet",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AliasTarget": _convert_RecordSetGroupAliasTarget,
+                "GeoLocation": _convert_RecordSetGroupGeoLocation,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AliasTarget=None,
+            Comment=None,
+            Failover=None,
+            GeoLocation=None,
+            HealthCheckId=None,
+            HostedZoneId=None,
+            HostedZoneName=None,
+            MultiValueAnswer=None,
+            Name=None,
+            Region=None,
+            ResourceRecords=None,
+            SetIdentifier=None,
+            TTL=None,
+            Type=None,
+            Weight=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AliasTarget", _convert_RecordSetGroupAliasTarget(AliasTarget))
+            _setattr("Comment", Comment)
+            _setattr("Failover", Failover)
+            _setattr("GeoLocation", _convert_RecordSetGroupGeoLocation(GeoLocation))
+            _setattr("HealthCheckId", HealthCheckId)
+            _setattr("HostedZoneId", HostedZoneId)
+            _setattr("HostedZoneName", HostedZoneName)
+            _setattr("MultiValueAnswer", MultiValueAnswer)
+            _setattr("Name", Name)
+            _setattr("Region", Region)
+            _setattr("ResourceRecords", ResourceRecords)
+            _setattr("SetIdentifier", SetIdentifier)
+            _setattr("TTL", TTL)
+            _setattr("Type", Type)
+            _setattr("Weight", Weight)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RecordSetGroupRecordSet_list = create_object_list_converter(
+        RecordSetGroupRecordSet
+    )
 
-@attrs(**ATTRSCONFIG)
-class RecordSetGroup(Resource):
-    """A Record Set Group for Route53.
+    class RecordSetGroupProperties(_ResourceProperties):
+        __slots__ = ("Comment", "HostedZoneId", "HostedZoneName", "RecordSets")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RecordSetGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"RecordSets": _convert_RecordSetGroupRecordSet_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Comment=None,
+            HostedZoneId=None,
+            HostedZoneName=None,
+            RecordSets=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Comment", Comment)
+            _setattr("HostedZoneId", HostedZoneId)
+            _setattr("HostedZoneName", HostedZoneName)
+            _setattr("RecordSets", _convert_RecordSetGroupRecordSet_list(RecordSets))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RecordSetGroupProperties = create_object_converter(
+        RecordSetGroupProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for RecordSetGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53-recordsetgroup.html>`_
-    """
+    class RecordSetGroup(_Resource):
+        """A Record Set Group for Route53.
+
+        See Also:
+            `AWS Cloud Formation documentation for RecordSetGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53-recordsetgroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Route53::RecordSetGroup"
+
+        Properties: RecordSetGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RecordSetGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RecordSetGroupProperties},
+            factories={"Properties": RecordSetGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RecordSetGroupProperties()
+            _setattr("Properties", _convert_RecordSetGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        RecordSetGroup,
+        RecordSetGroupProperties,
+        RecordSetGroupAliasTarget,
+        RecordSetGroupGeoLocation,
+        RecordSetGroupRecordSet,
+    )
 
-    RESOURCE_TYPE = "AWS::Route53::RecordSetGroup"
 
-    Properties: RecordSetGroupProperties = attrib(
-        factory=RecordSetGroupProperties,
-        converter=create_object_converter(RecordSetGroupProperties),
-    )
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "HealthCheck": _create_HealthCheck,
+        "HealthCheckProperties": _create_HealthCheck,
+        "HealthCheckAlarmIdentifier": _create_HealthCheck,
+        "HealthCheckHealthCheckConfig": _create_HealthCheck,
+        "HealthCheckHealthCheckTag": _create_HealthCheck,
+        "HostedZone": _create_HostedZone,
+        "HostedZoneProperties": _create_HostedZone,
+        "HostedZoneHostedZoneConfig": _create_HostedZone,
+        "HostedZoneHostedZoneTag": _create_HostedZone,
+        "HostedZoneQueryLoggingConfig": _create_HostedZone,
+        "HostedZoneVPC": _create_HostedZone,
+        "RecordSet": _create_RecordSet,
+        "RecordSetProperties": _create_RecordSet,
+        "RecordSetAliasTarget": _create_RecordSet,
+        "RecordSetGeoLocation": _create_RecordSet,
+        "RecordSetGroup": _create_RecordSetGroup,
+        "RecordSetGroupProperties": _create_RecordSetGroup,
+        "RecordSetGroupAliasTarget": _create_RecordSetGroup,
+        "RecordSetGroupGeoLocation": _create_RecordSetGroup,
+        "RecordSetGroupRecordSet": _create_RecordSetGroup,
+    },
+)
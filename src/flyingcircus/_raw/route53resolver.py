@@ -7,96 +7,319 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "ResolverEndpoint",
     "ResolverEndpointProperties",
+    "ResolverEndpointIpAddressRequest",
     "ResolverRule",
     "ResolverRuleProperties",
+    "ResolverRuleTargetAddress",
     "ResolverRuleAssociation",
     "ResolverRuleAssociationProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ResolverEndpointProperties(ResourceProperties):
-    Direction = attrib(default=None)
-    IpAddresses = attrib(default=None)
-    Name = attrib(default=None)
-    SecurityGroupIds = attrib(default=None)
-    Tags = attrib(default=None)
+def _create_ResolverEndpoint():
+    class ResolverEndpointIpAddressRequest(_PropertyType):
+        """The Ip Address Request property type for ResolverEndpoint in Route53Resolver.
+
+        See Also:
+            `AWS Cloud Formation documentation for IpAddressRequest
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53resolver-resolverendpoint-ipaddressrequest.html>`_
+        """
 
+        __slots__ = ("Ip", "SubnetId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverEndpointIpAddressRequest", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class ResolverEndpoint(Resource):
-    """A Resolver Endpoint for Route53Resolver.
+        def __init__(self, *, Ip=None, SubnetId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ip", Ip)
+            _setattr("SubnetId", SubnetId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ResolverEndpointIpAddressRequest_list = create_object_list_converter(
+        ResolverEndpointIpAddressRequest
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
 
-    See Also:
-        `AWS Cloud Formation documentation for ResolverEndpoint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53resolver-resolverendpoint.html>`_
-    """
+    class ResolverEndpointProperties(_ResourceProperties):
+        __slots__ = ("Direction", "IpAddresses", "Name", "SecurityGroupIds", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverEndpointProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "IpAddresses": _convert_ResolverEndpointIpAddressRequest_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Route53Resolver::ResolverEndpoint"
+        def __init__(
+            self,
+            *,
+            Direction=None,
+            IpAddresses=None,
+            Name=None,
+            SecurityGroupIds=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Direction", Direction)
+            _setattr(
+                "IpAddresses",
+                _convert_ResolverEndpointIpAddressRequest_list(IpAddresses),
+            )
+            _setattr("Name", Name)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: ResolverEndpointProperties = attrib(
-        factory=ResolverEndpointProperties,
-        converter=create_object_converter(ResolverEndpointProperties),
+    _convert_ResolverEndpointProperties = create_object_converter(
+        ResolverEndpointProperties
     )
 
+    class ResolverEndpoint(_Resource):
+        """A Resolver Endpoint for Route53Resolver.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResolverEndpoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53resolver-resolverendpoint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Route53Resolver::ResolverEndpoint"
+
+        Properties: ResolverEndpointProperties
 
-@attrs(**ATTRSCONFIG)
-class ResolverRuleProperties(ResourceProperties):
-    DomainName = attrib(default=None)
-    Name = attrib(default=None)
-    ResolverEndpointId = attrib(default=None)
-    RuleType = attrib(default=None)
-    Tags = attrib(default=None)
-    TargetIps = attrib(default=None)
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverEndpoint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResolverEndpointProperties},
+            factories={"Properties": ResolverEndpointProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResolverEndpointProperties()
+            _setattr("Properties", _convert_ResolverEndpointProperties(Properties))
+            _init_Resource(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class ResolverRule(Resource):
-    """A Resolver Rule for Route53Resolver.
+    return (
+        ResolverEndpoint,
+        ResolverEndpointProperties,
+        ResolverEndpointIpAddressRequest,
+    )
+
+
+def _create_ResolverRule():
+    class ResolverRuleTargetAddress(_PropertyType):
+        """The Target Address property type for ResolverRule in Route53Resolver.
+
+        See Also:
+            `AWS Cloud Formation documentation for TargetAddress
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-route53resolver-resolverrule-targetaddress.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for ResolverRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53resolver-resolverrule.html>`_
-    """
+        __slots__ = ("Ip", "Port")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverRuleTargetAddress", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Route53Resolver::ResolverRule"
+        def __init__(self, *, Ip=None, Port=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Ip", Ip)
+            _setattr("Port", Port)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ResolverRuleProperties = attrib(
-        factory=ResolverRuleProperties,
-        converter=create_object_converter(ResolverRuleProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_ResolverRuleTargetAddress_list = create_object_list_converter(
+        ResolverRuleTargetAddress
     )
 
+    class ResolverRuleProperties(_ResourceProperties):
+        __slots__ = (
+            "DomainName",
+            "Name",
+            "ResolverEndpointId",
+            "RuleType",
+            "Tags",
+            "TargetIps",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverRuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Tags": _convert_Tag_list,
+                "TargetIps": _convert_ResolverRuleTargetAddress_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DomainName=None,
+            Name=None,
+            ResolverEndpointId=None,
+            RuleType=None,
+            Tags=None,
+            TargetIps=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DomainName", DomainName)
+            _setattr("Name", Name)
+            _setattr("ResolverEndpointId", ResolverEndpointId)
+            _setattr("RuleType", RuleType)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TargetIps", _convert_ResolverRuleTargetAddress_list(TargetIps))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResolverRuleProperties = create_object_converter(ResolverRuleProperties)
+
+    class ResolverRule(_Resource):
+        """A Resolver Rule for Route53Resolver.
 
-@attrs(**ATTRSCONFIG)
-class ResolverRuleAssociationProperties(ResourceProperties):
-    Name = attrib(default=None)
-    ResolverRuleId = attrib(default=None)
-    VPCId = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for ResolverRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53resolver-resolverrule.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::Route53Resolver::ResolverRule"
 
-@attrs(**ATTRSCONFIG)
-class ResolverRuleAssociation(Resource):
-    """A Resolver Rule Association for Route53Resolver.
+        Properties: ResolverRuleProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for ResolverRuleAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53resolver-resolverruleassociation.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResolverRuleProperties},
+            factories={"Properties": ResolverRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Route53Resolver::ResolverRuleAssociation"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResolverRuleProperties()
+            _setattr("Properties", _convert_ResolverRuleProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    Properties: ResolverRuleAssociationProperties = attrib(
-        factory=ResolverRuleAssociationProperties,
-        converter=create_object_converter(ResolverRuleAssociationProperties),
+    return ResolverRule, ResolverRuleProperties, ResolverRuleTargetAddress
+
+
+def _create_ResolverRuleAssociation():
+    class ResolverRuleAssociationProperties(_ResourceProperties):
+        __slots__ = ("Name", "ResolverRuleId", "VPCId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverRuleAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Name=None, ResolverRuleId=None, VPCId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("ResolverRuleId", ResolverRuleId)
+            _setattr("VPCId", VPCId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResolverRuleAssociationProperties = create_object_converter(
+        ResolverRuleAssociationProperties
     )
+
+    class ResolverRuleAssociation(_Resource):
+        """A Resolver Rule Association for Route53Resolver.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResolverRuleAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-route53resolver-resolverruleassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Route53Resolver::ResolverRuleAssociation"
+
+        Properties: ResolverRuleAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResolverRuleAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResolverRuleAssociationProperties},
+            factories={"Properties": ResolverRuleAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResolverRuleAssociationProperties()
+            _setattr(
+                "Properties", _convert_ResolverRuleAssociationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return ResolverRuleAssociation, ResolverRuleAssociationProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ResolverEndpoint": _create_ResolverEndpoint,
+        "ResolverEndpointProperties": _create_ResolverEndpoint,
+        "ResolverEndpointIpAddressRequest": _create_ResolverEndpoint,
+        "ResolverRule": _create_ResolverRule,
+        "ResolverRuleProperties": _create_ResolverRule,
+        "ResolverRuleTargetAddress": _create_ResolverRule,
+        "ResolverRuleAssociation": _create_ResolverRuleAssociation,
+        "ResolverRuleAssociationProperties": _create_ResolverRuleAssociation,
+    },
+)
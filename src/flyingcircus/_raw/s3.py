@@ -7,109 +7,2001 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "AccessPoint",
     "AccessPointProperties",
+    "AccessPointPublicAccessBlockConfiguration",
+    "AccessPointVpcConfiguration",
     "Bucket",
     "BucketProperties",
+    "BucketAbortIncompleteMultipartUpload",
+    "BucketAccelerateConfiguration",
+    "BucketAccessControlTranslation",
+    "BucketAnalyticsConfiguration",
+    "BucketBucketEncryption",
+    "BucketCorsConfiguration",
+    "BucketCorsRule",
+    "BucketDataExport",
+    "BucketDefaultRetention",
+    "BucketDestination",
+    "BucketEncryptionConfiguration",
+    "BucketFilterRule",
+    "BucketInventoryConfiguration",
+    "BucketLambdaConfiguration",
+    "BucketLifecycleConfiguration",
+    "BucketLoggingConfiguration",
+    "BucketMetricsConfiguration",
+    "BucketNoncurrentVersionTransition",
+    "BucketNotificationConfiguration",
+    "BucketNotificationFilter",
+    "BucketObjectLockConfiguration",
+    "BucketObjectLockRule",
+    "BucketPublicAccessBlockConfiguration",
+    "BucketQueueConfiguration",
+    "BucketRedirectAllRequestsTo",
+    "BucketRedirectRule",
+    "BucketReplicationConfiguration",
+    "BucketReplicationDestination",
+    "BucketReplicationRule",
+    "BucketRoutingRule",
+    "BucketRoutingRuleCondition",
+    "BucketRule",
+    "BucketS3KeyFilter",
+    "BucketServerSideEncryptionByDefault",
+    "BucketServerSideEncryptionRule",
+    "BucketSourceSelectionCriteria",
+    "BucketSseKmsEncryptedObjects",
+    "BucketStorageClassAnalysis",
+    "BucketTagFilter",
+    "BucketTopicConfiguration",
+    "BucketTransition",
+    "BucketVersioningConfiguration",
+    "BucketWebsiteConfiguration",
     "BucketPolicy",
     "BucketPolicyProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AccessPointProperties(ResourceProperties):
-    Bucket = attrib(default=None)
-    CreationDate = attrib(default=None)
-    Name = attrib(default=None)
-    NetworkOrigin = attrib(default=None)
-    Policy = attrib(default=None)
-    PolicyStatus = attrib(default=None)
-    PublicAccessBlockConfiguration = attrib(default=None)
-    VpcConfiguration = attrib(default=None)
+def _create_AccessPoint():
+    class AccessPointPublicAccessBlockConfiguration(_PropertyType):
+        """The Public Access Block Configuration property type for AccessPoint in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for PublicAccessBlockConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-accesspoint-publicaccessblockconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "BlockPublicAcls",
+            "BlockPublicPolicy",
+            "IgnorePublicAcls",
+            "RestrictPublicBuckets",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AccessPointPublicAccessBlockConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockPublicAcls=None,
+            BlockPublicPolicy=None,
+            IgnorePublicAcls=None,
+            RestrictPublicBuckets=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BlockPublicAcls", BlockPublicAcls)
+            _setattr("BlockPublicPolicy", BlockPublicPolicy)
+            _setattr("IgnorePublicAcls", IgnorePublicAcls)
+            _setattr("RestrictPublicBuckets", RestrictPublicBuckets)
+            _init_PropertyType(self, kwargs)
+
+    class AccessPointVpcConfiguration(_PropertyType):
+        """The Vpc Configuration property type for AccessPoint in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for VpcConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-accesspoint-vpcconfiguration.html>`_
+        """
+
+        __slots__ = ("VpcId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AccessPointVpcConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VpcId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VpcId", VpcId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AccessPointPublicAccessBlockConfiguration = create_object_converter(
+        AccessPointPublicAccessBlockConfiguration
+    )
+    _convert_AccessPointVpcConfiguration = create_object_converter(
+        AccessPointVpcConfiguration
+    )
+
+    class AccessPointProperties(_ResourceProperties):
+        __slots__ = (
+            "Bucket",
+            "CreationDate",
+            "Name",
+            "NetworkOrigin",
+            "Policy",
+            "PolicyStatus",
+            "PublicAccessBlockConfiguration",
+            "VpcConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AccessPointProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "PublicAccessBlockConfiguration": _convert_AccessPointPublicAccessBlockConfiguration,
+                "VpcConfiguration": _convert_AccessPointVpcConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Bucket=None,
+            CreationDate=None,
+            Name=None,
+            NetworkOrigin=None,
+            Policy=None,
+            PolicyStatus=None,
+            PublicAccessBlockConfiguration=None,
+            VpcConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("CreationDate", CreationDate)
+            _setattr("Name", Name)
+            _setattr("NetworkOrigin", NetworkOrigin)
+            _setattr("Policy", Policy)
+            _setattr("PolicyStatus", PolicyStatus)
+            _setattr(
+                "PublicAccessBlockConfiguration",
+                _convert_AccessPointPublicAccessBlockConfiguration(
+                    PublicAccessBlockConfiguration
+                ),
+            )
+            _setattr(
+                "VpcConfiguration",
+                _convert_AccessPointVpcConfiguration(VpcConfiguration),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AccessPointProperties = create_object_converter(AccessPointProperties)
+
+    class AccessPoint(_Resource):
+        """A Access Point for S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccessPoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-s3-accesspoint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::S3::AccessPoint"
+
+        Properties: AccessPointProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AccessPoint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AccessPointProperties},
+            factories={"Properties": AccessPointProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AccessPointProperties()
+            _setattr("Properties", _convert_AccessPointProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        AccessPoint,
+        AccessPointProperties,
+        AccessPointPublicAccessBlockConfiguration,
+        AccessPointVpcConfiguration,
+    )
+
+
+def _create_Bucket():
+    class BucketAbortIncompleteMultipartUpload(_PropertyType):
+        """The Abort Incomplete Multipart Upload property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for AbortIncompleteMultipartUpload
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-abortincompletemultipartupload.html>`_
+        """
+
+        __slots__ = ("DaysAfterInitiation",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketAbortIncompleteMultipartUpload", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DaysAfterInitiation=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DaysAfterInitiation", DaysAfterInitiation)
+            _init_PropertyType(self, kwargs)
+
+    class BucketAccelerateConfiguration(_PropertyType):
+        """The Accelerate Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccelerateConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-accelerateconfiguration.html>`_
+        """
+
+        __slots__ = ("AccelerationStatus",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketAccelerateConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AccelerationStatus=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AccelerationStatus", AccelerationStatus)
+            _init_PropertyType(self, kwargs)
+
+    class BucketAccessControlTranslation(_PropertyType):
+        """The Access Control Translation property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for AccessControlTranslation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-accesscontroltranslation.html>`_
+        """
+
+        __slots__ = ("Owner",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketAccessControlTranslation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Owner=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Owner", Owner)
+            _init_PropertyType(self, kwargs)
+
+    class BucketDestination(_PropertyType):
+        """The Destination property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for Destination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-destination.html>`_
+        """
+
+        __slots__ = ("BucketAccountId", "BucketArn", "Format", "Prefix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketDestination", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BucketAccountId=None,
+            BucketArn=None,
+            Format=None,
+            Prefix=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketAccountId", BucketAccountId)
+            _setattr("BucketArn", BucketArn)
+            _setattr("Format", Format)
+            _setattr("Prefix", Prefix)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketDestination = create_object_converter(BucketDestination)
+
+    class BucketDataExport(_PropertyType):
+        """The Data Export property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for DataExport
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-dataexport.html>`_
+        """
+
+        __slots__ = ("Destination", "OutputSchemaVersion")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketDataExport",
+            _PropertyType,
+            __slots__,
+            converters={"Destination": _convert_BucketDestination},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Destination=None, OutputSchemaVersion=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Destination", _convert_BucketDestination(Destination))
+            _setattr("OutputSchemaVersion", OutputSchemaVersion)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketDataExport = create_object_converter(BucketDataExport)
+
+    class BucketStorageClassAnalysis(_PropertyType):
+        """The Storage Class Analysis property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for StorageClassAnalysis
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-storageclassanalysis.html>`_
+        """
+
+        __slots__ = ("DataExport",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketStorageClassAnalysis",
+            _PropertyType,
+            __slots__,
+            converters={"DataExport": _convert_BucketDataExport},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DataExport=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DataExport", _convert_BucketDataExport(DataExport))
+            _init_PropertyType(self, kwargs)
+
+    class BucketTagFilter(_PropertyType):
+        """The Tag Filter property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-tagfilter.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketTagFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketStorageClassAnalysis = create_object_converter(
+        BucketStorageClassAnalysis
+    )
+    _convert_BucketTagFilter_list = create_object_list_converter(BucketTagFilter)
+
+    class BucketAnalyticsConfiguration(_PropertyType):
+        """The Analytics Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for AnalyticsConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-analyticsconfiguration.html>`_
+        """
+
+        __slots__ = ("Id", "Prefix", "StorageClassAnalysis", "TagFilters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketAnalyticsConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "StorageClassAnalysis": _convert_BucketStorageClassAnalysis,
+                "TagFilters": _convert_BucketTagFilter_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Id=None,
+            Prefix=None,
+            StorageClassAnalysis=None,
+            TagFilters=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Prefix", Prefix)
+            _setattr(
+                "StorageClassAnalysis",
+                _convert_BucketStorageClassAnalysis(StorageClassAnalysis),
+            )
+            _setattr("TagFilters", _convert_BucketTagFilter_list(TagFilters))
+            _init_PropertyType(self, kwargs)
+
+    class BucketServerSideEncryptionByDefault(_PropertyType):
+        """The Server Side Encryption By Default property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for ServerSideEncryptionByDefault
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-serversideencryptionbydefault.html>`_
+        """
+
+        __slots__ = ("KMSMasterKeyID", "SSEAlgorithm")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketServerSideEncryptionByDefault", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, KMSMasterKeyID=None, SSEAlgorithm=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("KMSMasterKeyID", KMSMasterKeyID)
+            _setattr("SSEAlgorithm", SSEAlgorithm)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketServerSideEncryptionByDefault = create_object_converter(
+        BucketServerSideEncryptionByDefault
+    )
+
+    class BucketServerSideEncryptionRule(_PropertyType):
+        """The Server Side Encryption Rule property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for ServerSideEncryptionRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-serversideencryptionrule.html>`_
+        """
+
+        __slots__ = ("ServerSideEncryptionByDefault",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketServerSideEncryptionRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ServerSideEncryptionByDefault": _convert_BucketServerSideEncryptionByDefault
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ServerSideEncryptionByDefault=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ServerSideEncryptionByDefault",
+                _convert_BucketServerSideEncryptionByDefault(
+                    ServerSideEncryptionByDefault
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketServerSideEncryptionRule_list = create_object_list_converter(
+        BucketServerSideEncryptionRule
+    )
+
+    class BucketBucketEncryption(_PropertyType):
+        """The Bucket Encryption property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for BucketEncryption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-bucketencryption.html>`_
+        """
+
+        __slots__ = ("ServerSideEncryptionConfiguration",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketBucketEncryption",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ServerSideEncryptionConfiguration": _convert_BucketServerSideEncryptionRule_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ServerSideEncryptionConfiguration=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ServerSideEncryptionConfiguration",
+                _convert_BucketServerSideEncryptionRule_list(
+                    ServerSideEncryptionConfiguration
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class BucketCorsRule(_PropertyType):
+        """The Cors Rule property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for CorsRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-cors-corsrule.html>`_
+        """
+
+        __slots__ = (
+            "AllowedHeaders",
+            "AllowedMethods",
+            "AllowedOrigins",
+            "ExposedHeaders",
+            "Id",
+            "MaxAge",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketCorsRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowedHeaders=None,
+            AllowedMethods=None,
+            AllowedOrigins=None,
+            ExposedHeaders=None,
+            Id=None,
+            MaxAge=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowedHeaders", AllowedHeaders)
+            _setattr("AllowedMethods", AllowedMethods)
+            _setattr("AllowedOrigins", AllowedOrigins)
+            _setattr("ExposedHeaders", ExposedHeaders)
+            _setattr("Id", Id)
+            _setattr("MaxAge", MaxAge)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketCorsRule_list = create_object_list_converter(BucketCorsRule)
+
+    class BucketCorsConfiguration(_PropertyType):
+        """The Cors Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for CorsConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-cors.html>`_
+        """
+
+        __slots__ = ("CorsRules",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketCorsConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"CorsRules": _convert_BucketCorsRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CorsRules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CorsRules", _convert_BucketCorsRule_list(CorsRules))
+            _init_PropertyType(self, kwargs)
+
+    class BucketDefaultRetention(_PropertyType):
+        """The Default Retention property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for DefaultRetention
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-defaultretention.html>`_
+        """
+
+        __slots__ = ("Days", "Mode", "Years")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketDefaultRetention", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Days=None, Mode=None, Years=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Days", Days)
+            _setattr("Mode", Mode)
+            _setattr("Years", Years)
+            _init_PropertyType(self, kwargs)
+
+    class BucketEncryptionConfiguration(_PropertyType):
+        """The Encryption Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for EncryptionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-encryptionconfiguration.html>`_
+        """
+
+        __slots__ = ("ReplicaKmsKeyID",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketEncryptionConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ReplicaKmsKeyID=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ReplicaKmsKeyID", ReplicaKmsKeyID)
+            _init_PropertyType(self, kwargs)
+
+    class BucketFilterRule(_PropertyType):
+        """The Filter Rule property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for FilterRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-notificationconfiguration-config-filter-s3key-rules.html>`_
+        """
+
+        __slots__ = ("Name", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketFilterRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class BucketInventoryConfiguration(_PropertyType):
+        """The Inventory Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for InventoryConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-inventoryconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "Destination",
+            "Enabled",
+            "Id",
+            "IncludedObjectVersions",
+            "OptionalFields",
+            "Prefix",
+            "ScheduleFrequency",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketInventoryConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Destination": _convert_BucketDestination},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Destination=None,
+            Enabled=None,
+            Id=None,
+            IncludedObjectVersions=None,
+            OptionalFields=None,
+            Prefix=None,
+            ScheduleFrequency=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Destination", _convert_BucketDestination(Destination))
+            _setattr("Enabled", Enabled)
+            _setattr("Id", Id)
+            _setattr("IncludedObjectVersions", IncludedObjectVersions)
+            _setattr("OptionalFields", OptionalFields)
+            _setattr("Prefix", Prefix)
+            _setattr("ScheduleFrequency", ScheduleFrequency)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketFilterRule_list = create_object_list_converter(BucketFilterRule)
+
+    class BucketS3KeyFilter(_PropertyType):
+        """The S3 Key Filter property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3KeyFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-notificationconfiguration-config-filter-s3key.html>`_
+        """
+
+        __slots__ = ("Rules",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketS3KeyFilter",
+            _PropertyType,
+            __slots__,
+            converters={"Rules": _convert_BucketFilterRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Rules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Rules", _convert_BucketFilterRule_list(Rules))
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketS3KeyFilter = create_object_converter(BucketS3KeyFilter)
+
+    class BucketNotificationFilter(_PropertyType):
+        """The Notification Filter property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotificationFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-notificationconfiguration-config-filter.html>`_
+        """
+
+        __slots__ = ("S3Key",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketNotificationFilter",
+            _PropertyType,
+            __slots__,
+            converters={"S3Key": _convert_BucketS3KeyFilter},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, S3Key=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("S3Key", _convert_BucketS3KeyFilter(S3Key))
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketNotificationFilter = create_object_converter(
+        BucketNotificationFilter
+    )
+
+    class BucketLambdaConfiguration(_PropertyType):
+        """The Lambda Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for LambdaConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-notificationconfig-lambdaconfig.html>`_
+        """
+
+        __slots__ = ("Event", "Filter", "Function")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketLambdaConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Filter": _convert_BucketNotificationFilter},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Event=None, Filter=None, Function=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Event", Event)
+            _setattr("Filter", _convert_BucketNotificationFilter(Filter))
+            _setattr("Function", Function)
+            _init_PropertyType(self, kwargs)
+
+    class BucketNoncurrentVersionTransition(_PropertyType):
+        """The Noncurrent Version Transition property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for NoncurrentVersionTransition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-lifecycleconfig-rule-noncurrentversiontransition.html>`_
+        """
+
+        __slots__ = ("StorageClass", "TransitionInDays")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketNoncurrentVersionTransition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, StorageClass=None, TransitionInDays=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("StorageClass", StorageClass)
+            _setattr("TransitionInDays", TransitionInDays)
+            _init_PropertyType(self, kwargs)
+
+    class BucketTransition(_PropertyType):
+        """The Transition property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for Transition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-lifecycleconfig-rule-transition.html>`_
+        """
+
+        __slots__ = ("StorageClass", "TransitionDate", "TransitionInDays")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketTransition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            StorageClass=None,
+            TransitionDate=None,
+            TransitionInDays=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("StorageClass", StorageClass)
+            _setattr("TransitionDate", TransitionDate)
+            _setattr("TransitionInDays", TransitionInDays)
+            _init_PropertyType(self, kwargs)
 
+    _convert_BucketAbortIncompleteMultipartUpload = create_object_converter(
+        BucketAbortIncompleteMultipartUpload
+    )
+    _convert_BucketNoncurrentVersionTransition = create_object_converter(
+        BucketNoncurrentVersionTransition
+    )
+    _convert_BucketNoncurrentVersionTransition_list = create_object_list_converter(
+        BucketNoncurrentVersionTransition
+    )
+    _convert_BucketTransition = create_object_converter(BucketTransition)
+    _convert_BucketTransition_list = create_object_list_converter(BucketTransition)
+
+    class BucketRule(_PropertyType):
+        """The Rule property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for Rule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-lifecycleconfig-rule.html>`_
+        """
+
+        __slots__ = (
+            "AbortIncompleteMultipartUpload",
+            "ExpirationDate",
+            "ExpirationInDays",
+            "Id",
+            "NoncurrentVersionExpirationInDays",
+            "NoncurrentVersionTransition",
+            "NoncurrentVersionTransitions",
+            "Prefix",
+            "Status",
+            "TagFilters",
+            "Transition",
+            "Transitions",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AbortIncompleteMultipartUpload": _convert_BucketAbortIncompleteMultipartUpload,
+                "NoncurrentVersionTransition": _convert_BucketNoncurrentVersionTransition,
+                "NoncurrentVersionTransitions": _convert_BucketNoncurrentVersionTransition_list,
+                "TagFilters": _convert_BucketTagFilter_list,
+                "Transition": _convert_BucketTransition,
+                "Transitions": _convert_BucketTransition_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AbortIncompleteMultipartUpload=None,
+            ExpirationDate=None,
+            ExpirationInDays=None,
+            Id=None,
+            NoncurrentVersionExpirationInDays=None,
+            NoncurrentVersionTransition=None,
+            NoncurrentVersionTransitions=None,
+            Prefix=None,
+            Status=None,
+            TagFilters=None,
+            Transition=None,
+            Transitions=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AbortIncompleteMultipartUpload",
+                _convert_BucketAbortIncompleteMultipartUpload(
+                    AbortIncompleteMultipartUpload
+                ),
+            )
+            _setattr("ExpirationDate", ExpirationDate)
+            _setattr("ExpirationInDays", ExpirationInDays)
+            _setattr("Id", Id)
+            _setattr(
+                "NoncurrentVersionExpirationInDays", NoncurrentVersionExpirationInDays
+            )
+            _setattr(
+                "NoncurrentVersionTransition",
+                _convert_BucketNoncurrentVersionTransition(NoncurrentVersionTransition),
+            )
+            _setattr(
+                "NoncurrentVersionTransitions",
+                _convert_BucketNoncurrentVersionTransition_list(
+                    NoncurrentVersionTransitions
+                ),
+            )
+            _setattr("Prefix", Prefix)
+            _setattr("Status", Status)
+            _setattr("TagFilters", _convert_BucketTagFilter_list(TagFilters))
+            _setattr("Transition", _convert_BucketTransition(Transition))
+            _setattr("Transitions", _convert_BucketTransition_list(Transitions))
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketRule_list = create_object_list_converter(BucketRule)
+
+    class BucketLifecycleConfiguration(_PropertyType):
+        """The Lifecycle Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for LifecycleConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-lifecycleconfig.html>`_
+        """
+
+        __slots__ = ("Rules",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketLifecycleConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Rules": _convert_BucketRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Rules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Rules", _convert_BucketRule_list(Rules))
+            _init_PropertyType(self, kwargs)
+
+    class BucketLoggingConfiguration(_PropertyType):
+        """The Logging Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoggingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-loggingconfig.html>`_
+        """
+
+        __slots__ = ("DestinationBucketName", "LogFilePrefix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketLoggingConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DestinationBucketName=None, LogFilePrefix=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DestinationBucketName", DestinationBucketName)
+            _setattr("LogFilePrefix", LogFilePrefix)
+            _init_PropertyType(self, kwargs)
+
+    class BucketMetricsConfiguration(_PropertyType):
+        """The Metrics Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for MetricsConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-metricsconfiguration.html>`_
+        """
+
+        __slots__ = ("Id", "Prefix", "TagFilters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketMetricsConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"TagFilters": _convert_BucketTagFilter_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Id=None, Prefix=None, TagFilters=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Id", Id)
+            _setattr("Prefix", Prefix)
+            _setattr("TagFilters", _convert_BucketTagFilter_list(TagFilters))
+            _init_PropertyType(self, kwargs)
+
+    class BucketQueueConfiguration(_PropertyType):
+        """The Queue Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for QueueConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-notificationconfig-queueconfig.html>`_
+        """
+
+        __slots__ = ("Event", "Filter", "Queue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketQueueConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Filter": _convert_BucketNotificationFilter},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Event=None, Filter=None, Queue=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Event", Event)
+            _setattr("Filter", _convert_BucketNotificationFilter(Filter))
+            _setattr("Queue", Queue)
+            _init_PropertyType(self, kwargs)
+
+    class BucketTopicConfiguration(_PropertyType):
+        """The Topic Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for TopicConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-notificationconfig-topicconfig.html>`_
+        """
+
+        __slots__ = ("Event", "Filter", "Topic")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketTopicConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Filter": _convert_BucketNotificationFilter},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Event=None, Filter=None, Topic=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Event", Event)
+            _setattr("Filter", _convert_BucketNotificationFilter(Filter))
+            _setattr("Topic", Topic)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketLambdaConfiguration_list = create_object_list_converter(
+        BucketLambdaConfiguration
+    )
+    _convert_BucketQueueConfiguration_list = create_object_list_converter(
+        BucketQueueConfiguration
+    )
+    _convert_BucketTopicConfiguration_list = create_object_list_converter(
+        BucketTopicConfiguration
+    )
+
+    class BucketNotificationConfiguration(_PropertyType):
+        """The Notification Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotificationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-notificationconfig.html>`_
+        """
+
+        __slots__ = (
+            "LambdaConfigurations",
+            "QueueConfigurations",
+            "TopicConfigurations",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketNotificationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "LambdaConfigurations": _convert_BucketLambdaConfiguration_list,
+                "QueueConfigurations": _convert_BucketQueueConfiguration_list,
+                "TopicConfigurations": _convert_BucketTopicConfiguration_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            LambdaConfigurations=None,
+            QueueConfigurations=None,
+            TopicConfigurations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "LambdaConfigurations",
+                _convert_BucketLambdaConfiguration_list(LambdaConfigurations),
+            )
+            _setattr(
+                "QueueConfigurations",
+                _convert_BucketQueueConfiguration_list(QueueConfigurations),
+            )
+            _setattr(
+                "TopicConfigurations",
+                _convert_BucketTopicConfiguration_list(TopicConfigurations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketDefaultRetention = create_object_converter(BucketDefaultRetention)
+
+    class BucketObjectLockRule(_PropertyType):
+        """The Object Lock Rule property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for ObjectLockRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-objectlockrule.html>`_
+        """
+
+        __slots__ = ("DefaultRetention",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketObjectLockRule",
+            _PropertyType,
+            __slots__,
+            converters={"DefaultRetention": _convert_BucketDefaultRetention},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DefaultRetention=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DefaultRetention", _convert_BucketDefaultRetention(DefaultRetention)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketObjectLockRule = create_object_converter(BucketObjectLockRule)
+
+    class BucketObjectLockConfiguration(_PropertyType):
+        """The Object Lock Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for ObjectLockConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-objectlockconfiguration.html>`_
+        """
+
+        __slots__ = ("ObjectLockEnabled", "Rule")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketObjectLockConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Rule": _convert_BucketObjectLockRule},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ObjectLockEnabled=None, Rule=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ObjectLockEnabled", ObjectLockEnabled)
+            _setattr("Rule", _convert_BucketObjectLockRule(Rule))
+            _init_PropertyType(self, kwargs)
+
+    class BucketPublicAccessBlockConfiguration(_PropertyType):
+        """The Public Access Block Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for PublicAccessBlockConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-publicaccessblockconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "BlockPublicAcls",
+            "BlockPublicPolicy",
+            "IgnorePublicAcls",
+            "RestrictPublicBuckets",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketPublicAccessBlockConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BlockPublicAcls=None,
+            BlockPublicPolicy=None,
+            IgnorePublicAcls=None,
+            RestrictPublicBuckets=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BlockPublicAcls", BlockPublicAcls)
+            _setattr("BlockPublicPolicy", BlockPublicPolicy)
+            _setattr("IgnorePublicAcls", IgnorePublicAcls)
+            _setattr("RestrictPublicBuckets", RestrictPublicBuckets)
+            _init_PropertyType(self, kwargs)
+
+    class BucketRedirectAllRequestsTo(_PropertyType):
+        """The Redirect All Requests To property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for RedirectAllRequestsTo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-websiteconfiguration-redirectallrequeststo.html>`_
+        """
+
+        __slots__ = ("HostName", "Protocol")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketRedirectAllRequestsTo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, HostName=None, Protocol=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HostName", HostName)
+            _setattr("Protocol", Protocol)
+            _init_PropertyType(self, kwargs)
+
+    class BucketRedirectRule(_PropertyType):
+        """The Redirect Rule property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for RedirectRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-websiteconfiguration-routingrules-redirectrule.html>`_
+        """
+
+        __slots__ = (
+            "HostName",
+            "HttpRedirectCode",
+            "Protocol",
+            "ReplaceKeyPrefixWith",
+            "ReplaceKeyWith",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketRedirectRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            HostName=None,
+            HttpRedirectCode=None,
+            Protocol=None,
+            ReplaceKeyPrefixWith=None,
+            ReplaceKeyWith=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HostName", HostName)
+            _setattr("HttpRedirectCode", HttpRedirectCode)
+            _setattr("Protocol", Protocol)
+            _setattr("ReplaceKeyPrefixWith", ReplaceKeyPrefixWith)
+            _setattr("ReplaceKeyWith", ReplaceKeyWith)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketAccessControlTranslation = create_object_converter(
+        BucketAccessControlTranslation
+    )
+    _convert_BucketEncryptionConfiguration = create_object_converter(
+        BucketEncryptionConfiguration
+    )
+
+    class BucketReplicationDestination(_PropertyType):
+        """The Replication Destination property type for Bucket in S3.
 
-@attrs(**ATTRSCONFIG)
-class AccessPoint(Resource):
-    """A Access Point for S3.
+        See Also:
+            `AWS Cloud Formation documentation for ReplicationDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-replicationconfiguration-rules-destination.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for AccessPoint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-s3-accesspoint.html>`_
-    """
+        __slots__ = (
+            "AccessControlTranslation",
+            "Account",
+            "Bucket",
+            "EncryptionConfiguration",
+            "StorageClass",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketReplicationDestination",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AccessControlTranslation": _convert_BucketAccessControlTranslation,
+                "EncryptionConfiguration": _convert_BucketEncryptionConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::S3::AccessPoint"
+        def __init__(
+            self,
+            *,
+            AccessControlTranslation=None,
+            Account=None,
+            Bucket=None,
+            EncryptionConfiguration=None,
+            StorageClass=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccessControlTranslation",
+                _convert_BucketAccessControlTranslation(AccessControlTranslation),
+            )
+            _setattr("Account", Account)
+            _setattr("Bucket", Bucket)
+            _setattr(
+                "EncryptionConfiguration",
+                _convert_BucketEncryptionConfiguration(EncryptionConfiguration),
+            )
+            _setattr("StorageClass", StorageClass)
+            _init_PropertyType(self, kwargs)
 
-    Properties: AccessPointProperties = attrib(
-        factory=AccessPointProperties,
-        converter=create_object_converter(AccessPointProperties),
+    class BucketSseKmsEncryptedObjects(_PropertyType):
+        """The Sse Kms Encrypted Objects property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for SseKmsEncryptedObjects
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-ssekmsencryptedobjects.html>`_
+        """
+
+        __slots__ = ("Status",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketSseKmsEncryptedObjects", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Status=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Status", Status)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketSseKmsEncryptedObjects = create_object_converter(
+        BucketSseKmsEncryptedObjects
+    )
+
+    class BucketSourceSelectionCriteria(_PropertyType):
+        """The Source Selection Criteria property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for SourceSelectionCriteria
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-sourceselectioncriteria.html>`_
+        """
+
+        __slots__ = ("SseKmsEncryptedObjects",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketSourceSelectionCriteria",
+            _PropertyType,
+            __slots__,
+            converters={
+                "SseKmsEncryptedObjects": _convert_BucketSseKmsEncryptedObjects
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SseKmsEncryptedObjects=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "SseKmsEncryptedObjects",
+                _convert_BucketSseKmsEncryptedObjects(SseKmsEncryptedObjects),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketReplicationDestination = create_object_converter(
+        BucketReplicationDestination
     )
+    _convert_BucketSourceSelectionCriteria = create_object_converter(
+        BucketSourceSelectionCriteria
+    )
+
+    class BucketReplicationRule(_PropertyType):
+        """The Replication Rule property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReplicationRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-replicationconfiguration-rules.html>`_
+        """
+
+        __slots__ = ("Destination", "Id", "Prefix", "SourceSelectionCriteria", "Status")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketReplicationRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Destination": _convert_BucketReplicationDestination,
+                "SourceSelectionCriteria": _convert_BucketSourceSelectionCriteria,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Destination=None,
+            Id=None,
+            Prefix=None,
+            SourceSelectionCriteria=None,
+            Status=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Destination", _convert_BucketReplicationDestination(Destination))
+            _setattr("Id", Id)
+            _setattr("Prefix", Prefix)
+            _setattr(
+                "SourceSelectionCriteria",
+                _convert_BucketSourceSelectionCriteria(SourceSelectionCriteria),
+            )
+            _setattr("Status", Status)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketReplicationRule_list = create_object_list_converter(
+        BucketReplicationRule
+    )
+
+    class BucketReplicationConfiguration(_PropertyType):
+        """The Replication Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReplicationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-replicationconfiguration.html>`_
+        """
+
+        __slots__ = ("Role", "Rules")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketReplicationConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Rules": _convert_BucketReplicationRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Role=None, Rules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Role", Role)
+            _setattr("Rules", _convert_BucketReplicationRule_list(Rules))
+            _init_PropertyType(self, kwargs)
+
+    class BucketRoutingRuleCondition(_PropertyType):
+        """The Routing Rule Condition property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for RoutingRuleCondition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-websiteconfiguration-routingrules-routingrulecondition.html>`_
+        """
+
+        __slots__ = ("HttpErrorCodeReturnedEquals", "KeyPrefixEquals")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketRoutingRuleCondition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, HttpErrorCodeReturnedEquals=None, KeyPrefixEquals=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HttpErrorCodeReturnedEquals", HttpErrorCodeReturnedEquals)
+            _setattr("KeyPrefixEquals", KeyPrefixEquals)
+            _init_PropertyType(self, kwargs)
+
+    _convert_BucketRedirectRule = create_object_converter(BucketRedirectRule)
+    _convert_BucketRoutingRuleCondition = create_object_converter(
+        BucketRoutingRuleCondition
+    )
+
+    class BucketRoutingRule(_PropertyType):
+        """The Routing Rule property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for RoutingRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-websiteconfiguration-routingrules.html>`_
+        """
+
+        __slots__ = ("RedirectRule", "RoutingRuleCondition")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketRoutingRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "RedirectRule": _convert_BucketRedirectRule,
+                "RoutingRuleCondition": _convert_BucketRoutingRuleCondition,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, RedirectRule=None, RoutingRuleCondition=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RedirectRule", _convert_BucketRedirectRule(RedirectRule))
+            _setattr(
+                "RoutingRuleCondition",
+                _convert_BucketRoutingRuleCondition(RoutingRuleCondition),
+            )
+            _init_PropertyType(self, kwargs)
 
+    class BucketVersioningConfiguration(_PropertyType):
+        """The Versioning Configuration property type for Bucket in S3.
 
-@attrs(**ATTRSCONFIG)
-class BucketProperties(ResourceProperties):
-    AccelerateConfiguration = attrib(default=None)
-    AccessControl = attrib(default=None)
-    AnalyticsConfigurations = attrib(default=None)
-    BucketEncryption = attrib(default=None)
-    BucketName = attrib(default=None)
-    CorsConfiguration = attrib(default=None)
-    InventoryConfigurations = attrib(default=None)
-    LifecycleConfiguration = attrib(default=None)
-    LoggingConfiguration = attrib(default=None)
-    MetricsConfigurations = attrib(default=None)
-    NotificationConfiguration = attrib(default=None)
-    ObjectLockConfiguration = attrib(default=None)
-    ObjectLockEnabled = attrib(default=None)
-    PublicAccessBlockConfiguration = attrib(default=None)
-    ReplicationConfiguration = attrib(default=None)
-    Tags = attrib(default=None)
-    VersioningConfiguration = attrib(default=None)
-    WebsiteConfiguration = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for VersioningConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket-versioningconfig.html>`_
+        """
 
+        __slots__ = ("Status",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketVersioningConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Bucket(Resource):
-    """A Bucket for S3.
+        def __init__(self, *, Status=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Status", Status)
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Bucket
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket.html>`_
-    """
+    _convert_BucketRedirectAllRequestsTo = create_object_converter(
+        BucketRedirectAllRequestsTo
+    )
+    _convert_BucketRoutingRule_list = create_object_list_converter(BucketRoutingRule)
+
+    class BucketWebsiteConfiguration(_PropertyType):
+        """The Website Configuration property type for Bucket in S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for WebsiteConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-websiteconfiguration.html>`_
+        """
+
+        __slots__ = (
+            "ErrorDocument",
+            "IndexDocument",
+            "RedirectAllRequestsTo",
+            "RoutingRules",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketWebsiteConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={
+                "RedirectAllRequestsTo": _convert_BucketRedirectAllRequestsTo,
+                "RoutingRules": _convert_BucketRoutingRule_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::S3::Bucket"
+        def __init__(
+            self,
+            *,
+            ErrorDocument=None,
+            IndexDocument=None,
+            RedirectAllRequestsTo=None,
+            RoutingRules=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ErrorDocument", ErrorDocument)
+            _setattr("IndexDocument", IndexDocument)
+            _setattr(
+                "RedirectAllRequestsTo",
+                _convert_BucketRedirectAllRequestsTo(RedirectAllRequestsTo),
+            )
+            _setattr("RoutingRules", _convert_BucketRoutingRule_list(RoutingRules))
+            _init_PropertyType(self, kwargs)
 
-    Properties: BucketProperties = attrib(
-        factory=BucketProperties, converter=create_object_converter(BucketProperties)
+    _convert_BucketAccelerateConfiguration = create_object_converter(
+        BucketAccelerateConfiguration
+    )
+    _convert_BucketAnalyticsConfiguration_list = create_object_list_converter(
+        BucketAnalyticsConfiguration
+    )
+    _convert_BucketBucketEncryption = create_object_converter(BucketBucketEncryption)
+    _convert_BucketCorsConfiguration = create_object_converter(BucketCorsConfiguration)
+    _convert_BucketInventoryConfiguration_list = create_object_list_converter(
+        BucketInventoryConfiguration
+    )
+    _convert_BucketLifecycleConfiguration = create_object_converter(
+        BucketLifecycleConfiguration
+    )
+    _convert_BucketLoggingConfiguration = create_object_converter(
+        BucketLoggingConfiguration
     )
+    _convert_BucketMetricsConfiguration_list = create_object_list_converter(
+        BucketMetricsConfiguration
+    )
+    _convert_BucketNotificationConfiguration = create_object_converter(
+        BucketNotificationConfiguration
+    )
+    _convert_BucketObjectLockConfiguration = create_object_converter(
+        BucketObjectLockConfiguration
+    )
+    _convert_BucketPublicAccessBlockConfiguration = create_object_converter(
+        BucketPublicAccessBlockConfiguration
+    )
+    _convert_BucketReplicationConfiguration = create_object_converter(
+        BucketReplicationConfiguration
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_BucketVersioningConfiguration = create_object_converter(
+        BucketVersioningConfiguration
+    )
+    _convert_BucketWebsiteConfiguration = create_object_converter(
+        BucketWebsiteConfiguration
+    )
+
+    class BucketProperties(_ResourceProperties):
+        __slots__ = (
+            "AccelerateConfiguration",
+            "AccessControl",
+            "AnalyticsConfigurations",
+            "BucketEncryption",
+            "BucketName",
+            "CorsConfiguration",
+            "InventoryConfigurations",
+            "LifecycleConfiguration",
+            "LoggingConfiguration",
+            "MetricsConfigurations",
+            "NotificationConfiguration",
+            "ObjectLockConfiguration",
+            "ObjectLockEnabled",
+            "PublicAccessBlockConfiguration",
+            "ReplicationConfiguration",
+            "Tags",
+            "VersioningConfiguration",
+            "WebsiteConfiguration",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "AccelerateConfiguration": _convert_BucketAccelerateConfiguration,
+                "AnalyticsConfigurations": _convert_BucketAnalyticsConfiguration_list,
+                "BucketEncryption": _convert_BucketBucketEncryption,
+                "CorsConfiguration": _convert_BucketCorsConfiguration,
+                "InventoryConfigurations": _convert_BucketInventoryConfiguration_list,
+                "LifecycleConfiguration": _convert_BucketLifecycleConfiguration,
+                "LoggingConfiguration": _convert_BucketLoggingConfiguration,
+                "MetricsConfigurations": _convert_BucketMetricsConfiguration_list,
+                "NotificationConfiguration": _convert_BucketNotificationConfiguration,
+                "ObjectLockConfiguration": _convert_BucketObjectLockConfiguration,
+                "PublicAccessBlockConfiguration": _convert_BucketPublicAccessBlockConfiguration,
+                "ReplicationConfiguration": _convert_BucketReplicationConfiguration,
+                "Tags": _convert_Tag_list,
+                "VersioningConfiguration": _convert_BucketVersioningConfiguration,
+                "WebsiteConfiguration": _convert_BucketWebsiteConfiguration,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            AccelerateConfiguration=None,
+            AccessControl=None,
+            AnalyticsConfigurations=None,
+            BucketEncryption=None,
+            BucketName=None,
+            CorsConfiguration=None,
+            InventoryConfigurations=None,
+            LifecycleConfiguration=None,
+            LoggingConfiguration=None,
+            MetricsConfigurations=None,
+            NotificationConfiguration=None,
+            ObjectLockConfiguration=None,
+            ObjectLockEnabled=None,
+            PublicAccessBlockConfiguration=None,
+            ReplicationConfiguration=None,
+            Tags=None,
+            VersioningConfiguration=None,
+            WebsiteConfiguration=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AccelerateConfiguration",
+                _convert_BucketAccelerateConfiguration(AccelerateConfiguration),
+            )
+            _setattr("AccessControl", AccessControl)
+            _setattr(
+                "AnalyticsConfigurations",
+                _convert_BucketAnalyticsConfiguration_list(AnalyticsConfigurations),
+            )
+            _setattr(
+                "BucketEncryption", _convert_BucketBucketEncryption(BucketEncryption)
+            )
+            _setattr("BucketName", BucketName)
+            _setattr(
+                "CorsConfiguration", _convert_BucketCorsConfiguration(CorsConfiguration)
+            )
+            _setattr(
+                "InventoryConfigurations",
+                _convert_BucketInventoryConfiguration_list(InventoryConfigurations),
+            )
+            _setattr(
+                "LifecycleConfiguration",
+                _convert_BucketLifecycleConfiguration(LifecycleConfiguration),
+            )
+            _setattr(
+                "LoggingConfiguration",
+                _convert_BucketLoggingConfiguration(LoggingConfiguration),
+            )
+            _setattr(
+                "MetricsConfigurations",
+                _convert_BucketMetricsConfiguration_list(MetricsConfigurations),
+            )
+            _setattr(
+                "NotificationConfiguration",
+                _convert_BucketNotificationConfiguration(NotificationConfiguration),
+            )
+            _setattr(
+                "ObjectLockConfiguration",
+                _convert_BucketObjectLockConfiguration(ObjectLockConfiguration),
+            )
+            _setattr("ObjectLockEnabled", ObjectLockEnabled)
+            _setattr(
+                "PublicAccessBlockConfiguration",
+                _convert_BucketPublicAccessBlockConfiguration(
+                    PublicAccessBlockConfiguration
+                ),
+            )
+            _setattr(
+                "ReplicationConfiguration",
+                _convert_BucketReplicationConfiguration(ReplicationConfiguration),
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr(
+                "VersioningConfiguration",
+                _convert_BucketVersioningConfiguration(VersioningConfiguration),
+            )
+            _setattr(
+                "WebsiteConfiguration",
+                _convert_BucketWebsiteConfiguration(WebsiteConfiguration),
+            )
+            _init_ResourceProperties(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class BucketPolicyProperties(ResourceProperties):
-    Bucket = attrib(default=None)
-    PolicyDocument = attrib(default=None)
+    _convert_BucketProperties = create_object_converter(BucketProperties)
 
+    class Bucket(_Resource):
+        """A Bucket for S3.
 
-@attrs(**ATTRSCONFIG)
-class BucketPolicy(Resource):
-    """A Bucket Policy for S3.
+        See Also:
+            `AWS Cloud Formation documentation for Bucket
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-bucket.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for BucketPolicy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-policy.html>`_
-    """
+        RESOURCE_TYPE = "AWS::S3::Bucket"
 
-    RESOURCE_TYPE = "AWS::S3::BucketPolicy"
+        Properties: BucketProperties
 
-    Properties: BucketPolicyProperties = attrib(
-        factory=BucketPolicyProperties,
-        converter=create_object_converter(BucketPolicyProperties),
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Bucket",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BucketProperties},
+            factories={"Properties": BucketProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BucketProperties()
+            _setattr("Properties", _convert_BucketProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Bucket,
+        BucketProperties,
+        BucketAbortIncompleteMultipartUpload,
+        BucketAccelerateConfiguration,
+        BucketAccessControlTranslation,
+        BucketDestination,
+        BucketDataExport,
+        BucketStorageClassAnalysis,
+        BucketTagFilter,
+        BucketAnalyticsConfiguration,
+        BucketServerSideEncryptionByDefault,
+        BucketServerSideEncryptionRule,
+        BucketBucketEncryption,
+        BucketCorsRule,
+        BucketCorsConfiguration,
+        BucketDefaultRetention,
+        BucketEncryptionConfiguration,
+        BucketFilterRule,
+        BucketInventoryConfiguration,
+        BucketS3KeyFilter,
+        BucketNotificationFilter,
+        BucketLambdaConfiguration,
+        BucketNoncurrentVersionTransition,
+        BucketTransition,
+        BucketRule,
+        BucketLifecycleConfiguration,
+        BucketLoggingConfiguration,
+        BucketMetricsConfiguration,
+        BucketQueueConfiguration,
+        BucketTopicConfiguration,
+        BucketNotificationConfiguration,
+        BucketObjectLockRule,
+        BucketObjectLockConfiguration,
+        BucketPublicAccessBlockConfiguration,
+        BucketRedirectAllRequestsTo,
+        BucketRedirectRule,
+        BucketReplicationDestination,
+        BucketSseKmsEncryptedObjects,
+        BucketSourceSelectionCriteria,
+        BucketReplicationRule,
+        BucketReplicationConfiguration,
+        BucketRoutingRuleCondition,
+        BucketRoutingRule,
+        BucketVersioningConfiguration,
+        BucketWebsiteConfiguration,
     )
+
+
+def _create_BucketPolicy():
+    class BucketPolicyProperties(_ResourceProperties):
+        __slots__ = ("Bucket", "PolicyDocument")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketPolicyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Bucket=None, PolicyDocument=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Bucket", Bucket)
+            _setattr("PolicyDocument", PolicyDocument)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_BucketPolicyProperties = create_object_converter(BucketPolicyProperties)
+
+    class BucketPolicy(_Resource):
+        """A Bucket Policy for S3.
+
+        See Also:
+            `AWS Cloud Formation documentation for BucketPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-s3-policy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::S3::BucketPolicy"
+
+        Properties: BucketPolicyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "BucketPolicy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_BucketPolicyProperties},
+            factories={"Properties": BucketPolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = BucketPolicyProperties()
+            _setattr("Properties", _convert_BucketPolicyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return BucketPolicy, BucketPolicyProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "AccessPoint": _create_AccessPoint,
+        "AccessPointProperties": _create_AccessPoint,
+        "AccessPointPublicAccessBlockConfiguration": _create_AccessPoint,
+        "AccessPointVpcConfiguration": _create_AccessPoint,
+        "Bucket": _create_Bucket,
+        "BucketProperties": _create_Bucket,
+        "BucketAbortIncompleteMultipartUpload": _create_Bucket,
+        "BucketAccelerateConfiguration": _create_Bucket,
+        "BucketAccessControlTranslation": _create_Bucket,
+        "BucketAnalyticsConfiguration": _create_Bucket,
+        "BucketBucketEncryption": _create_Bucket,
+        "BucketCorsConfiguration": _create_Bucket,
+        "BucketCorsRule": _create_Bucket,
+        "BucketDataExport": _create_Bucket,
+        "BucketDefaultRetention": _create_Bucket,
+        "BucketDestination": _create_Bucket,
+        "BucketEncryptionConfiguration": _create_Bucket,
+        "BucketFilterRule": _create_Bucket,
+        "BucketInventoryConfiguration": _create_Bucket,
+        "BucketLambdaConfiguration": _create_Bucket,
+        "BucketLifecycleConfiguration": _create_Bucket,
+        "BucketLoggingConfiguration": _create_Bucket,
+        "BucketMetricsConfiguration": _create_Bucket,
+        "BucketNoncurrentVersionTransition": _create_Bucket,
+        "BucketNotificationConfiguration": _create_Bucket,
+        "BucketNotificationFilter": _create_Bucket,
+        "BucketObjectLockConfiguration": _create_Bucket,
+        "BucketObjectLockRule": _create_Bucket,
+        "BucketPublicAccessBlockConfiguration": _create_Bucket,
+        "BucketQueueConfiguration": _create_Bucket,
+        "BucketRedirectAllRequestsTo": _create_Bucket,
+        "BucketRedirectRule": _create_Bucket,
+        "BucketReplicationConfiguration": _create_Bucket,
+        "BucketReplicationDestination": _create_Bucket,
+        "BucketReplicationRule": _create_Bucket,
+        "BucketRoutingRule": _create_Bucket,
+        "BucketRoutingRuleCondition": _create_Bucket,
+        "BucketRule": _create_Bucket,
+        "BucketS3KeyFilter": _create_Bucket,
+        "BucketServerSideEncryptionByDefault": _create_Bucket,
+        "BucketServerSideEncryptionRule": _create_Bucket,
+        "BucketSourceSelectionCriteria": _create_Bucket,
+        "BucketSseKmsEncryptedObjects": _create_Bucket,
+        "BucketStorageClassAnalysis": _create_Bucket,
+        "BucketTagFilter": _create_Bucket,
+        "BucketTopicConfiguration": _create_Bucket,
+        "BucketTransition": _create_Bucket,
+        "BucketVersioningConfiguration": _create_Bucket,
+        "BucketWebsiteConfiguration": _create_Bucket,
+        "BucketPolicy": _create_BucketPolicy,
+        "BucketPolicyProperties": _create_BucketPolicy,
+    },
+)
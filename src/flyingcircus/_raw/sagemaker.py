@@ -7,212 +7,944 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "CodeRepository",
     "CodeRepositoryProperties",
+    "CodeRepositoryGitConfig",
     "Endpoint",
     "EndpointProperties",
+    "EndpointVariantProperty",
     "EndpointConfig",
     "EndpointConfigProperties",
+    "EndpointConfigProductionVariant",
     "Model",
     "ModelProperties",
+    "ModelContainerDefinition",
+    "ModelVpcConfig",
     "NotebookInstance",
     "NotebookInstanceProperties",
     "NotebookInstanceLifecycleConfig",
     "NotebookInstanceLifecycleConfigProperties",
+    "NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook",
     "Workteam",
     "WorkteamProperties",
+    "WorkteamCognitoMemberDefinition",
+    "WorkteamMemberDefinition",
+    "WorkteamNotificationConfiguration",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class CodeRepositoryProperties(ResourceProperties):
-    CodeRepositoryName = attrib(default=None)
-    GitConfig = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class CodeRepository(Resource):
-    """A Code Repository for SageMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for CodeRepository
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-coderepository.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SageMaker::CodeRepository"
-
-    Properties: CodeRepositoryProperties = attrib(
-        factory=CodeRepositoryProperties,
-        converter=create_object_converter(CodeRepositoryProperties),
+def _create_CodeRepository():
+    class CodeRepositoryGitConfig(_PropertyType):
+        """The Git Config property type for CodeRepository in SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for GitConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sagemaker-coderepository-gitconfig.html>`_
+        """
+
+        __slots__ = ("Branch", "RepositoryUrl", "SecretArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CodeRepositoryGitConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Branch=None, RepositoryUrl=None, SecretArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Branch", Branch)
+            _setattr("RepositoryUrl", RepositoryUrl)
+            _setattr("SecretArn", SecretArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CodeRepositoryGitConfig = create_object_converter(CodeRepositoryGitConfig)
+
+    class CodeRepositoryProperties(_ResourceProperties):
+        __slots__ = ("CodeRepositoryName", "GitConfig")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CodeRepositoryProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"GitConfig": _convert_CodeRepositoryGitConfig},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, CodeRepositoryName=None, GitConfig=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CodeRepositoryName", CodeRepositoryName)
+            _setattr("GitConfig", _convert_CodeRepositoryGitConfig(GitConfig))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CodeRepositoryProperties = create_object_converter(
+        CodeRepositoryProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class EndpointProperties(ResourceProperties):
-    EndpointConfigName = attrib(default=None)
-    EndpointName = attrib(default=None)
-    ExcludeRetainedVariantProperties = attrib(default=None)
-    RetainAllVariantProperties = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Endpoint(Resource):
-    """A Endpoint for SageMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for Endpoint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-endpoint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SageMaker::Endpoint"
-
-    Properties: EndpointProperties = attrib(
-        factory=EndpointProperties,
-        converter=create_object_converter(EndpointProperties),
+    class CodeRepository(_Resource):
+        """A Code Repository for SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for CodeRepository
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-coderepository.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SageMaker::CodeRepository"
+
+        Properties: CodeRepositoryProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CodeRepository",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CodeRepositoryProperties},
+            factories={"Properties": CodeRepositoryProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CodeRepositoryProperties()
+            _setattr("Properties", _convert_CodeRepositoryProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return CodeRepository, CodeRepositoryProperties, CodeRepositoryGitConfig
+
+
+def _create_Endpoint():
+    class EndpointVariantProperty(_PropertyType):
+        """The Variant Property property type for Endpoint in SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for VariantProperty
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sagemaker-endpoint-variantproperty.html>`_
+        """
+
+        __slots__ = ("VariantPropertyType",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointVariantProperty", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, VariantPropertyType=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VariantPropertyType", VariantPropertyType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EndpointVariantProperty_list = create_object_list_converter(
+        EndpointVariantProperty
     )
-
-
-@attrs(**ATTRSCONFIG)
-class EndpointConfigProperties(ResourceProperties):
-    EndpointConfigName = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    ProductionVariants = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class EndpointConfig(Resource):
-    """A Endpoint Config for SageMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for EndpointConfig
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-endpointconfig.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SageMaker::EndpointConfig"
-
-    Properties: EndpointConfigProperties = attrib(
-        factory=EndpointConfigProperties,
-        converter=create_object_converter(EndpointConfigProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class EndpointProperties(_ResourceProperties):
+        __slots__ = (
+            "EndpointConfigName",
+            "EndpointName",
+            "ExcludeRetainedVariantProperties",
+            "RetainAllVariantProperties",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ExcludeRetainedVariantProperties": _convert_EndpointVariantProperty_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EndpointConfigName=None,
+            EndpointName=None,
+            ExcludeRetainedVariantProperties=None,
+            RetainAllVariantProperties=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EndpointConfigName", EndpointConfigName)
+            _setattr("EndpointName", EndpointName)
+            _setattr(
+                "ExcludeRetainedVariantProperties",
+                _convert_EndpointVariantProperty_list(ExcludeRetainedVariantProperties),
+            )
+            _setattr("RetainAllVariantProperties", RetainAllVariantProperties)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EndpointProperties = create_object_converter(EndpointProperties)
+
+    class Endpoint(_Resource):
+        """A Endpoint for SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for Endpoint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-endpoint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SageMaker::Endpoint"
+
+        Properties: EndpointProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Endpoint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EndpointProperties},
+            factories={"Properties": EndpointProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EndpointProperties()
+            _setattr("Properties", _convert_EndpointProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Endpoint, EndpointProperties, EndpointVariantProperty
+
+
+def _create_EndpointConfig():
+    class EndpointConfigProductionVariant(_PropertyType):
+        """The Production Variant property type for EndpointConfig in SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProductionVariant
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sagemaker-endpointconfig-productionvariant.html>`_
+        """
+
+        __slots__ = (
+            "AcceleratorType",
+            "InitialInstanceCount",
+            "InitialVariantWeight",
+            "InstanceType",
+            "ModelName",
+            "VariantName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointConfigProductionVariant", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceleratorType=None,
+            InitialInstanceCount=None,
+            InitialVariantWeight=None,
+            InstanceType=None,
+            ModelName=None,
+            VariantName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceleratorType", AcceleratorType)
+            _setattr("InitialInstanceCount", InitialInstanceCount)
+            _setattr("InitialVariantWeight", InitialVariantWeight)
+            _setattr("InstanceType", InstanceType)
+            _setattr("ModelName", ModelName)
+            _setattr("VariantName", VariantName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_EndpointConfigProductionVariant_list = create_object_list_converter(
+        EndpointConfigProductionVariant
     )
-
-
-@attrs(**ATTRSCONFIG)
-class ModelProperties(ResourceProperties):
-    Containers = attrib(default=None)
-    ExecutionRoleArn = attrib(default=None)
-    ModelName = attrib(default=None)
-    PrimaryContainer = attrib(default=None)
-    Tags = attrib(default=None)
-    VpcConfig = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Model(Resource):
-    """A Model for SageMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for Model
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-model.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SageMaker::Model"
-
-    Properties: ModelProperties = attrib(
-        factory=ModelProperties, converter=create_object_converter(ModelProperties)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class EndpointConfigProperties(_ResourceProperties):
+        __slots__ = ("EndpointConfigName", "KmsKeyId", "ProductionVariants", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointConfigProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ProductionVariants": _convert_EndpointConfigProductionVariant_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EndpointConfigName=None,
+            KmsKeyId=None,
+            ProductionVariants=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EndpointConfigName", EndpointConfigName)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr(
+                "ProductionVariants",
+                _convert_EndpointConfigProductionVariant_list(ProductionVariants),
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_EndpointConfigProperties = create_object_converter(
+        EndpointConfigProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class NotebookInstanceProperties(ResourceProperties):
-    AcceleratorTypes = attrib(default=None)
-    AdditionalCodeRepositories = attrib(default=None)
-    DefaultCodeRepository = attrib(default=None)
-    DirectInternetAccess = attrib(default=None)
-    InstanceType = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    LifecycleConfigName = attrib(default=None)
-    NotebookInstanceName = attrib(default=None)
-    RoleArn = attrib(default=None)
-    RootAccess = attrib(default=None)
-    SecurityGroupIds = attrib(default=None)
-    SubnetId = attrib(default=None)
-    Tags = attrib(default=None)
-    VolumeSizeInGB = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class NotebookInstance(Resource):
-    """A Notebook Instance for SageMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for NotebookInstance
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-notebookinstance.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SageMaker::NotebookInstance"
-
-    Properties: NotebookInstanceProperties = attrib(
-        factory=NotebookInstanceProperties,
-        converter=create_object_converter(NotebookInstanceProperties),
+    class EndpointConfig(_Resource):
+        """A Endpoint Config for SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for EndpointConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-endpointconfig.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SageMaker::EndpointConfig"
+
+        Properties: EndpointConfigProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "EndpointConfig",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_EndpointConfigProperties},
+            factories={"Properties": EndpointConfigProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = EndpointConfigProperties()
+            _setattr("Properties", _convert_EndpointConfigProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return EndpointConfig, EndpointConfigProperties, EndpointConfigProductionVariant
+
+
+def _create_Model():
+    class ModelContainerDefinition(_PropertyType):
+        """The Container Definition property type for Model in SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for ContainerDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sagemaker-model-containerdefinition.html>`_
+        """
+
+        __slots__ = ("ContainerHostname", "Environment", "Image", "ModelDataUrl")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ModelContainerDefinition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContainerHostname=None,
+            Environment=None,
+            Image=None,
+            ModelDataUrl=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContainerHostname", ContainerHostname)
+            _setattr("Environment", Environment)
+            _setattr("Image", Image)
+            _setattr("ModelDataUrl", ModelDataUrl)
+            _init_PropertyType(self, kwargs)
+
+    class ModelVpcConfig(_PropertyType):
+        """The Vpc Config property type for Model in SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for VpcConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sagemaker-model-vpcconfig.html>`_
+        """
+
+        __slots__ = ("SecurityGroupIds", "Subnets")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ModelVpcConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, SecurityGroupIds=None, Subnets=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("Subnets", Subnets)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ModelContainerDefinition_list = create_object_list_converter(
+        ModelContainerDefinition
+    )
+    _convert_ModelContainerDefinition = create_object_converter(
+        ModelContainerDefinition
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_ModelVpcConfig = create_object_converter(ModelVpcConfig)
+
+    class ModelProperties(_ResourceProperties):
+        __slots__ = (
+            "Containers",
+            "ExecutionRoleArn",
+            "ModelName",
+            "PrimaryContainer",
+            "Tags",
+            "VpcConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ModelProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Containers": _convert_ModelContainerDefinition_list,
+                "PrimaryContainer": _convert_ModelContainerDefinition,
+                "Tags": _convert_Tag_list,
+                "VpcConfig": _convert_ModelVpcConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Containers=None,
+            ExecutionRoleArn=None,
+            ModelName=None,
+            PrimaryContainer=None,
+            Tags=None,
+            VpcConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Containers", _convert_ModelContainerDefinition_list(Containers))
+            _setattr("ExecutionRoleArn", ExecutionRoleArn)
+            _setattr("ModelName", ModelName)
+            _setattr(
+                "PrimaryContainer", _convert_ModelContainerDefinition(PrimaryContainer)
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VpcConfig", _convert_ModelVpcConfig(VpcConfig))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ModelProperties = create_object_converter(ModelProperties)
+
+    class Model(_Resource):
+        """A Model for SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for Model
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-model.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SageMaker::Model"
+
+        Properties: ModelProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Model",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ModelProperties},
+            factories={"Properties": ModelProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ModelProperties()
+            _setattr("Properties", _convert_ModelProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Model, ModelProperties, ModelContainerDefinition, ModelVpcConfig
+
+
+def _create_NotebookInstance():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class NotebookInstanceProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceleratorTypes",
+            "AdditionalCodeRepositories",
+            "DefaultCodeRepository",
+            "DirectInternetAccess",
+            "InstanceType",
+            "KmsKeyId",
+            "LifecycleConfigName",
+            "NotebookInstanceName",
+            "RoleArn",
+            "RootAccess",
+            "SecurityGroupIds",
+            "SubnetId",
+            "Tags",
+            "VolumeSizeInGB",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NotebookInstanceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceleratorTypes=None,
+            AdditionalCodeRepositories=None,
+            DefaultCodeRepository=None,
+            DirectInternetAccess=None,
+            InstanceType=None,
+            KmsKeyId=None,
+            LifecycleConfigName=None,
+            NotebookInstanceName=None,
+            RoleArn=None,
+            RootAccess=None,
+            SecurityGroupIds=None,
+            SubnetId=None,
+            Tags=None,
+            VolumeSizeInGB=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceleratorTypes", AcceleratorTypes)
+            _setattr("AdditionalCodeRepositories", AdditionalCodeRepositories)
+            _setattr("DefaultCodeRepository", DefaultCodeRepository)
+            _setattr("DirectInternetAccess", DirectInternetAccess)
+            _setattr("InstanceType", InstanceType)
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("LifecycleConfigName", LifecycleConfigName)
+            _setattr("NotebookInstanceName", NotebookInstanceName)
+            _setattr("RoleArn", RoleArn)
+            _setattr("RootAccess", RootAccess)
+            _setattr("SecurityGroupIds", SecurityGroupIds)
+            _setattr("SubnetId", SubnetId)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VolumeSizeInGB", VolumeSizeInGB)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NotebookInstanceProperties = create_object_converter(
+        NotebookInstanceProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class NotebookInstanceLifecycleConfigProperties(ResourceProperties):
-    NotebookInstanceLifecycleConfigName = attrib(default=None)
-    OnCreate = attrib(default=None)
-    OnStart = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class NotebookInstanceLifecycleConfig(Resource):
-    """A Notebook Instance Lifecycle Config for SageMaker.
-
-    See Also:
-        `AWS Cloud Formation documentation for NotebookInstanceLifecycleConfig
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-notebookinstancelifecycleconfig.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SageMaker::NotebookInstanceLifecycleConfig"
-
-    Properties: NotebookInstanceLifecycleConfigProperties = attrib(
-        factory=NotebookInstanceLifecycleConfigProperties,
-        converter=create_object_converter(NotebookInstanceLifecycleConfigProperties),
+    class NotebookInstance(_Resource):
+        """A Notebook Instance for SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotebookInstance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-notebookinstance.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SageMaker::NotebookInstance"
+
+        Properties: NotebookInstanceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NotebookInstance",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_NotebookInstanceProperties},
+            factories={"Properties": NotebookInstanceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NotebookInstanceProperties()
+            _setattr("Properties", _convert_NotebookInstanceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return NotebookInstance, NotebookInstanceProperties
+
+
+def _create_NotebookInstanceLifecycleConfig():
+    class NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook(_PropertyType):
+        """The Notebook Instance Lifecycle Hook property type for NotebookInstanceLifecycleConfig in SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotebookInstanceLifecycleHook
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sagemaker-notebookinstancelifecycleconfig-notebookinstancelifecyclehook.html>`_
+        """
+
+        __slots__ = ("Content",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Content=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Content", Content)
+            _init_PropertyType(self, kwargs)
+
+    _convert_NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook_list = (
+        create_object_list_converter(
+            NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook
+        )
     )
 
+    class NotebookInstanceLifecycleConfigProperties(_ResourceProperties):
+        __slots__ = ("NotebookInstanceLifecycleConfigName", "OnCreate", "OnStart")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NotebookInstanceLifecycleConfigProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "OnCreate": _convert_NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook_list,
+                "OnStart": _convert_NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            NotebookInstanceLifecycleConfigName=None,
+            OnCreate=None,
+            OnStart=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "NotebookInstanceLifecycleConfigName",
+                NotebookInstanceLifecycleConfigName,
+            )
+            _setattr(
+                "OnCreate",
+                _convert_NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook_list(
+                    OnCreate
+                ),
+            )
+            _setattr(
+                "OnStart",
+                _convert_NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook_list(
+                    OnStart
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_NotebookInstanceLifecycleConfigProperties = create_object_converter(
+        NotebookInstanceLifecycleConfigProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class WorkteamProperties(ResourceProperties):
-    Description = attrib(default=None)
-    MemberDefinitions = attrib(default=None)
-    NotificationConfiguration = attrib(default=None)
-    Tags = attrib(default=None)
-    WorkteamName = attrib(default=None)
+    class NotebookInstanceLifecycleConfig(_Resource):
+        """A Notebook Instance Lifecycle Config for SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotebookInstanceLifecycleConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-notebookinstancelifecycleconfig.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SageMaker::NotebookInstanceLifecycleConfig"
+
+        Properties: NotebookInstanceLifecycleConfigProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "NotebookInstanceLifecycleConfig",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_NotebookInstanceLifecycleConfigProperties
+            },
+            factories={"Properties": NotebookInstanceLifecycleConfigProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = NotebookInstanceLifecycleConfigProperties()
+            _setattr(
+                "Properties",
+                _convert_NotebookInstanceLifecycleConfigProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        NotebookInstanceLifecycleConfig,
+        NotebookInstanceLifecycleConfigProperties,
+        NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook,
+    )
 
 
-@attrs(**ATTRSCONFIG)
-class Workteam(Resource):
-    """A Workteam for SageMaker.
+def _create_Workteam():
+    class WorkteamCognitoMemberDefinition(_PropertyType):
+        """The Cognito Member Definition property type for Workteam in SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for CognitoMemberDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sagemaker-workteam-cognitomemberdefinition.html>`_
+        """
+
+        __slots__ = ("CognitoClientId", "CognitoUserGroup", "CognitoUserPool")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WorkteamCognitoMemberDefinition", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CognitoClientId=None,
+            CognitoUserGroup=None,
+            CognitoUserPool=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CognitoClientId", CognitoClientId)
+            _setattr("CognitoUserGroup", CognitoUserGroup)
+            _setattr("CognitoUserPool", CognitoUserPool)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WorkteamCognitoMemberDefinition = create_object_converter(
+        WorkteamCognitoMemberDefinition
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for Workteam
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-workteam.html>`_
-    """
+    class WorkteamMemberDefinition(_PropertyType):
+        """The Member Definition property type for Workteam in SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for MemberDefinition
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sagemaker-workteam-memberdefinition.html>`_
+        """
+
+        __slots__ = ("CognitoMemberDefinition",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WorkteamMemberDefinition",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CognitoMemberDefinition": _convert_WorkteamCognitoMemberDefinition
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CognitoMemberDefinition=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CognitoMemberDefinition",
+                _convert_WorkteamCognitoMemberDefinition(CognitoMemberDefinition),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class WorkteamNotificationConfiguration(_PropertyType):
+        """The Notification Configuration property type for Workteam in SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotificationConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sagemaker-workteam-notificationconfiguration.html>`_
+        """
+
+        __slots__ = ("NotificationTopicArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WorkteamNotificationConfiguration", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, NotificationTopicArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NotificationTopicArn", NotificationTopicArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WorkteamMemberDefinition_list = create_object_list_converter(
+        WorkteamMemberDefinition
+    )
+    _convert_WorkteamNotificationConfiguration = create_object_converter(
+        WorkteamNotificationConfiguration
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class WorkteamProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "MemberDefinitions",
+            "NotificationConfiguration",
+            "Tags",
+            "WorkteamName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WorkteamProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "MemberDefinitions": _convert_WorkteamMemberDefinition_list,
+                "NotificationConfiguration": _convert_WorkteamNotificationConfiguration,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            MemberDefinitions=None,
+            NotificationConfiguration=None,
+            Tags=None,
+            WorkteamName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr(
+                "MemberDefinitions",
+                _convert_WorkteamMemberDefinition_list(MemberDefinitions),
+            )
+            _setattr(
+                "NotificationConfiguration",
+                _convert_WorkteamNotificationConfiguration(NotificationConfiguration),
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("WorkteamName", WorkteamName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_WorkteamProperties = create_object_converter(WorkteamProperties)
+
+    class Workteam(_Resource):
+        """A Workteam for SageMaker.
+
+        See Also:
+            `AWS Cloud Formation documentation for Workteam
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sagemaker-workteam.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SageMaker::Workteam"
+
+        Properties: WorkteamProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Workteam",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_WorkteamProperties},
+            factories={"Properties": WorkteamProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = WorkteamProperties()
+            _setattr("Properties", _convert_WorkteamProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Workteam,
+        WorkteamProperties,
+        WorkteamCognitoMemberDefinition,
+        WorkteamMemberDefinition,
+        WorkteamNotificationConfiguration,
+    )
 
-    RESOURCE_TYPE = "AWS::SageMaker::Workteam"
 
-    Properties: WorkteamProperties = attrib(
-        factory=WorkteamProperties,
-        converter=create_object_converter(WorkteamProperties),
-    )
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "CodeRepository": _create_CodeRepository,
+        "CodeRepositoryProperties": _create_CodeRepository,
+        "CodeRepositoryGitConfig": _create_CodeRepository,
+        "Endpoint": _create_Endpoint,
+        "EndpointProperties": _create_Endpoint,
+        "EndpointVariantProperty": _create_Endpoint,
+        "EndpointConfig": _create_EndpointConfig,
+        "EndpointConfigProperties": _create_EndpointConfig,
+        "EndpointConfigProductionVariant": _create_EndpointConfig,
+        "Model": _create_Model,
+        "ModelProperties": _create_Model,
+        "ModelContainerDefinition": _create_Model,
+        "ModelVpcConfig": _create_Model,
+        "NotebookInstance": _create_NotebookInstance,
+        "NotebookInstanceProperties": _create_NotebookInstance,
+        "NotebookInstanceLifecycleConfig": _create_NotebookInstanceLifecycleConfig,
+        "NotebookInstanceLifecycleConfigProperties": _create_NotebookInstanceLifecycleConfig,
+        "NotebookInstanceLifecycleConfigNotebookInstanceLifecycleHook": _create_NotebookInstanceLifecycleConfig,
+        "Workteam": _create_Workteam,
+        "WorkteamProperties": _create_Workteam,
+        "WorkteamCognitoMemberDefinition": _create_Workteam,
+        "WorkteamMemberDefinition": _create_Workteam,
+        "WorkteamNotificationConfiguration": _create_Workteam,
+    },
+)
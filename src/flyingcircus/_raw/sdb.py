@@ -7,33 +7,81 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
-__all__ = ["Domain", "DomainProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Domain",
+    "DomainProperties",
+]
 
-@attrs(**ATTRSCONFIG)
-class DomainProperties(ResourceProperties):
-    Description = attrib(default=None)
 
+def _create_Domain():
+    class DomainProperties(_ResourceProperties):
+        __slots__ = ("Description",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DomainProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Domain(Resource):
-    """A Domain for SDB.
+        def __init__(self, *, Description=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _init_ResourceProperties(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Domain
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-simpledb.html>`_
-    """
+    _convert_DomainProperties = create_object_converter(DomainProperties)
 
-    RESOURCE_TYPE = "AWS::SDB::Domain"
+    class Domain(_Resource):
+        """A Domain for SDB.
 
-    Properties: DomainProperties = attrib(
-        factory=DomainProperties, converter=create_object_converter(DomainProperties)
-    )
+        See Also:
+            `AWS Cloud Formation documentation for Domain
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-simpledb.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SDB::Domain"
+
+        Properties: DomainProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Domain",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DomainProperties},
+            factories={"Properties": DomainProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DomainProperties()
+            _setattr("Properties", _convert_DomainProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Domain, DomainProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Domain": _create_Domain,
+        "DomainProperties": _create_Domain,
+    },
+)
@@ -7,118 +7,395 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "ResourcePolicy",
     "ResourcePolicyProperties",
     "RotationSchedule",
     "RotationScheduleProperties",
+    "RotationScheduleRotationRules",
     "Secret",
     "SecretProperties",
+    "SecretGenerateSecretString",
     "SecretTargetAttachment",
     "SecretTargetAttachmentProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ResourcePolicyProperties(ResourceProperties):
-    ResourcePolicy = attrib(default=None)
-    SecretId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ResourcePolicy(Resource):
-    """A Resource Policy for SecretsManager.
-
-    See Also:
-        `AWS Cloud Formation documentation for ResourcePolicy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-secretsmanager-resourcepolicy.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SecretsManager::ResourcePolicy"
-
-    Properties: ResourcePolicyProperties = attrib(
-        factory=ResourcePolicyProperties,
-        converter=create_object_converter(ResourcePolicyProperties),
+def _create_ResourcePolicy():
+    class ResourcePolicyProperties(_ResourceProperties):
+        __slots__ = ("ResourcePolicy", "SecretId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourcePolicyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourcePolicy=None, SecretId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourcePolicy", ResourcePolicy)
+            _setattr("SecretId", SecretId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResourcePolicyProperties = create_object_converter(
+        ResourcePolicyProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RotationScheduleProperties(ResourceProperties):
-    RotationLambdaARN = attrib(default=None)
-    RotationRules = attrib(default=None)
-    SecretId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class RotationSchedule(Resource):
-    """A Rotation Schedule for SecretsManager.
-
-    See Also:
-        `AWS Cloud Formation documentation for RotationSchedule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-secretsmanager-rotationschedule.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SecretsManager::RotationSchedule"
-
-    Properties: RotationScheduleProperties = attrib(
-        factory=RotationScheduleProperties,
-        converter=create_object_converter(RotationScheduleProperties),
+    class ResourcePolicy(_Resource):
+        """A Resource Policy for SecretsManager.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourcePolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-secretsmanager-resourcepolicy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SecretsManager::ResourcePolicy"
+
+        Properties: ResourcePolicyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourcePolicy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResourcePolicyProperties},
+            factories={"Properties": ResourcePolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResourcePolicyProperties()
+            _setattr("Properties", _convert_ResourcePolicyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ResourcePolicy, ResourcePolicyProperties
+
+
+def _create_RotationSchedule():
+    class RotationScheduleRotationRules(_PropertyType):
+        """The Rotation Rules property type for RotationSchedule in SecretsManager.
+
+        See Also:
+            `AWS Cloud Formation documentation for RotationRules
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-secretsmanager-rotationschedule-rotationrules.html>`_
+        """
+
+        __slots__ = ("AutomaticallyAfterDays",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RotationScheduleRotationRules", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AutomaticallyAfterDays=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AutomaticallyAfterDays", AutomaticallyAfterDays)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RotationScheduleRotationRules = create_object_converter(
+        RotationScheduleRotationRules
     )
 
-
-@attrs(**ATTRSCONFIG)
-class SecretProperties(ResourceProperties):
-    Description = attrib(default=None)
-    GenerateSecretString = attrib(default=None)
-    KmsKeyId = attrib(default=None)
-    Name = attrib(default=None)
-    SecretString = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Secret(Resource):
-    """A Secret for SecretsManager.
-
-    See Also:
-        `AWS Cloud Formation documentation for Secret
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-secretsmanager-secret.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SecretsManager::Secret"
-
-    Properties: SecretProperties = attrib(
-        factory=SecretProperties, converter=create_object_converter(SecretProperties)
+    class RotationScheduleProperties(_ResourceProperties):
+        __slots__ = ("RotationLambdaARN", "RotationRules", "SecretId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RotationScheduleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"RotationRules": _convert_RotationScheduleRotationRules},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, RotationLambdaARN=None, RotationRules=None, SecretId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RotationLambdaARN", RotationLambdaARN)
+            _setattr(
+                "RotationRules", _convert_RotationScheduleRotationRules(RotationRules)
+            )
+            _setattr("SecretId", SecretId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RotationScheduleProperties = create_object_converter(
+        RotationScheduleProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class SecretTargetAttachmentProperties(ResourceProperties):
-    SecretId = attrib(default=None)
-    TargetId = attrib(default=None)
-    TargetType = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SecretTargetAttachment(Resource):
-    """A Secret Target Attachment for SecretsManager.
-
-    See Also:
-        `AWS Cloud Formation documentation for SecretTargetAttachment
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-secretsmanager-secrettargetattachment.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SecretsManager::SecretTargetAttachment"
-
-    Properties: SecretTargetAttachmentProperties = attrib(
-        factory=SecretTargetAttachmentProperties,
-        converter=create_object_converter(SecretTargetAttachmentProperties),
+    class RotationSchedule(_Resource):
+        """A Rotation Schedule for SecretsManager.
+
+        See Also:
+            `AWS Cloud Formation documentation for RotationSchedule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-secretsmanager-rotationschedule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SecretsManager::RotationSchedule"
+
+        Properties: RotationScheduleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RotationSchedule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RotationScheduleProperties},
+            factories={"Properties": RotationScheduleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RotationScheduleProperties()
+            _setattr("Properties", _convert_RotationScheduleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return RotationSchedule, RotationScheduleProperties, RotationScheduleRotationRules
+
+
+def _create_Secret():
+    class SecretGenerateSecretString(_PropertyType):
+        """The Generate Secret String property type for Secret in SecretsManager.
+
+        See Also:
+            `AWS Cloud Formation documentation for GenerateSecretString
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-secretsmanager-secret-generatesecretstring.html>`_
+        """
+
+        __slots__ = (
+            "ExcludeCharacters",
+            "ExcludeLowercase",
+            "ExcludeNumbers",
+            "ExcludePunctuation",
+            "ExcludeUppercase",
+            "GenerateStringKey",
+            "IncludeSpace",
+            "PasswordLength",
+            "RequireEachIncludedType",
+            "SecretStringTemplate",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecretGenerateSecretString", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ExcludeCharacters=None,
+            ExcludeLowercase=None,
+            ExcludeNumbers=None,
+            ExcludePunctuation=None,
+            ExcludeUppercase=None,
+            GenerateStringKey=None,
+            IncludeSpace=None,
+            PasswordLength=None,
+            RequireEachIncludedType=None,
+            SecretStringTemplate=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExcludeCharacters", ExcludeCharacters)
+            _setattr("ExcludeLowercase", ExcludeLowercase)
+            _setattr("ExcludeNumbers", ExcludeNumbers)
+            _setattr("ExcludePunctuation", ExcludePunctuation)
+            _setattr("ExcludeUppercase", ExcludeUppercase)
+            _setattr("GenerateStringKey", GenerateStringKey)
+            _setattr("IncludeSpace", IncludeSpace)
+            _setattr("PasswordLength", PasswordLength)
+            _setattr("RequireEachIncludedType", RequireEachIncludedType)
+            _setattr("SecretStringTemplate", SecretStringTemplate)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SecretGenerateSecretString = create_object_converter(
+        SecretGenerateSecretString
+    )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class SecretProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "GenerateSecretString",
+            "KmsKeyId",
+            "Name",
+            "SecretString",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecretProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "GenerateSecretString": _convert_SecretGenerateSecretString,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            GenerateSecretString=None,
+            KmsKeyId=None,
+            Name=None,
+            SecretString=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr(
+                "GenerateSecretString",
+                _convert_SecretGenerateSecretString(GenerateSecretString),
+            )
+            _setattr("KmsKeyId", KmsKeyId)
+            _setattr("Name", Name)
+            _setattr("SecretString", SecretString)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SecretProperties = create_object_converter(SecretProperties)
+
+    class Secret(_Resource):
+        """A Secret for SecretsManager.
+
+        See Also:
+            `AWS Cloud Formation documentation for Secret
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-secretsmanager-secret.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SecretsManager::Secret"
+
+        Properties: SecretProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Secret",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SecretProperties},
+            factories={"Properties": SecretProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SecretProperties()
+            _setattr("Properties", _convert_SecretProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Secret, SecretProperties, SecretGenerateSecretString
+
+
+def _create_SecretTargetAttachment():
+    class SecretTargetAttachmentProperties(_ResourceProperties):
+        __slots__ = ("SecretId", "TargetId", "TargetType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecretTargetAttachmentProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, SecretId=None, TargetId=None, TargetType=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("SecretId", SecretId)
+            _setattr("TargetId", TargetId)
+            _setattr("TargetType", TargetType)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SecretTargetAttachmentProperties = create_object_converter(
+        SecretTargetAttachmentProperties
     )
+
+    class SecretTargetAttachment(_Resource):
+        """A Secret Target Attachment for SecretsManager.
+
+        See Also:
+            `AWS Cloud Formation documentation for SecretTargetAttachment
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-secretsmanager-secrettargetattachment.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SecretsManager::SecretTargetAttachment"
+
+        Properties: SecretTargetAttachmentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SecretTargetAttachment",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SecretTargetAttachmentProperties},
+            factories={"Properties": SecretTargetAttachmentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SecretTargetAttachmentProperties()
+            _setattr(
+                "Properties", _convert_SecretTargetAttachmentProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return SecretTargetAttachment, SecretTargetAttachmentProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ResourcePolicy": _create_ResourcePolicy,
+        "ResourcePolicyProperties": _create_ResourcePolicy,
+        "RotationSchedule": _create_RotationSchedule,
+        "RotationScheduleProperties": _create_RotationSchedule,
+        "RotationScheduleRotationRules": _create_RotationSchedule,
+        "Secret": _create_Secret,
+        "SecretProperties": _create_Secret,
+        "SecretGenerateSecretString": _create_Secret,
+        "SecretTargetAttachment": _create_SecretTargetAttachment,
+        "SecretTargetAttachmentProperties": _create_SecretTargetAttachment,
+    },
+)
@@ -7,33 +7,82 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
 
-__all__ = ["Hub", "HubProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Hub",
+    "HubProperties",
+]
 
-@attrs(**ATTRSCONFIG)
-class HubProperties(ResourceProperties):
-    Tags = attrib(default=None)
 
+def _create_Hub():
+    class HubProperties(_ResourceProperties):
+        __slots__ = ("Tags",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HubProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Hub(Resource):
-    """A Hub for SecurityHub.
+        def __init__(self, *, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Tags", Tags)
+            _init_ResourceProperties(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Hub
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-securityhub-hub.html>`_
-    """
+    _convert_HubProperties = create_object_converter(HubProperties)
 
-    RESOURCE_TYPE = "AWS::SecurityHub::Hub"
+    class Hub(_Resource):
+        """A Hub for SecurityHub.
 
-    Properties: HubProperties = attrib(
-        factory=HubProperties, converter=create_object_converter(HubProperties)
-    )
+        See Also:
+            `AWS Cloud Formation documentation for Hub
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-securityhub-hub.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SecurityHub::Hub"
+        TAG_FORMAT = "Map"
+
+        Properties: HubProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Hub",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_HubProperties},
+            factories={"Properties": HubProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = HubProperties()
+            _setattr("Properties", _convert_HubProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Hub, HubProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Hub": _create_Hub,
+        "HubProperties": _create_Hub,
+    },
+)
@@ -7,21 +7,32 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
-
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from attr import NOTHING
+
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "AcceptedPortfolioShare",
     "AcceptedPortfolioShareProperties",
     "CloudFormationProduct",
     "CloudFormationProductProperties",
+    "CloudFormationProductProvisioningArtifactProperties",
     "CloudFormationProvisionedProduct",
     "CloudFormationProvisionedProductProperties",
+    "CloudFormationProvisionedProductProvisioningParameter",
+    "CloudFormationProvisionedProductProvisioningPreferences",
     "LaunchNotificationConstraint",
     "LaunchNotificationConstraintProperties",
     "LaunchRoleConstraint",
@@ -47,368 +58,1207 @@ __all__ = [
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AcceptedPortfolioShareProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    PortfolioId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class AcceptedPortfolioShare(Resource):
-    """A Accepted Portfolio Share for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for AcceptedPortfolioShare
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-acceptedportfolioshare.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::AcceptedPortfolioShare"
-
-    Properties: AcceptedPortfolioShareProperties = attrib(
-        factory=AcceptedPortfolioShareProperties,
-        converter=create_object_converter(AcceptedPortfolioShareProperties),
+def _create_AcceptedPortfolioShare():
+    class AcceptedPortfolioShareProperties(_ResourceProperties):
+        __slots__ = ("AcceptLanguage", "PortfolioId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AcceptedPortfolioShareProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, AcceptLanguage=None, PortfolioId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("PortfolioId", PortfolioId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AcceptedPortfolioShareProperties = create_object_converter(
+        AcceptedPortfolioShareProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class CloudFormationProductProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    Description = attrib(default=None)
-    Distributor = attrib(default=None)
-    Name = attrib(default=None)
-    Owner = attrib(default=None)
-    ProvisioningArtifactParameters = attrib(default=None)
-    SupportDescription = attrib(default=None)
-    SupportEmail = attrib(default=None)
-    SupportUrl = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class CloudFormationProduct(Resource):
-    """A Cloud Formation Product for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for CloudFormationProduct
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-cloudformationproduct.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::CloudFormationProduct"
-
-    Properties: CloudFormationProductProperties = attrib(
-        factory=CloudFormationProductProperties,
-        converter=create_object_converter(CloudFormationProductProperties),
+    class AcceptedPortfolioShare(_Resource):
+        """A Accepted Portfolio Share for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for AcceptedPortfolioShare
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-acceptedportfolioshare.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::AcceptedPortfolioShare"
+
+        Properties: AcceptedPortfolioShareProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AcceptedPortfolioShare",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AcceptedPortfolioShareProperties},
+            factories={"Properties": AcceptedPortfolioShareProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AcceptedPortfolioShareProperties()
+            _setattr(
+                "Properties", _convert_AcceptedPortfolioShareProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return AcceptedPortfolioShare, AcceptedPortfolioShareProperties
+
+
+def _create_CloudFormationProduct():
+    class CloudFormationProductProvisioningArtifactProperties(_PropertyType):
+        """The Provisioning Artifact Properties property type for CloudFormationProduct in ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProvisioningArtifactProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-servicecatalog-cloudformationproduct-provisioningartifactproperties.html>`_
+        """
+
+        __slots__ = ("Description", "DisableTemplateValidation", "Info", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFormationProductProvisioningArtifactProperties",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            DisableTemplateValidation=None,
+            Info=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("DisableTemplateValidation", DisableTemplateValidation)
+            _setattr("Info", Info)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CloudFormationProductProvisioningArtifactProperties_list = (
+        create_object_list_converter(
+            CloudFormationProductProvisioningArtifactProperties
+        )
     )
-
-
-@attrs(**ATTRSCONFIG)
-class CloudFormationProvisionedProductProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    NotificationArns = attrib(default=None)
-    PathId = attrib(default=None)
-    ProductId = attrib(default=None)
-    ProductName = attrib(default=None)
-    ProvisionedProductName = attrib(default=None)
-    ProvisioningArtifactId = attrib(default=None)
-    ProvisioningArtifactName = attrib(default=None)
-    ProvisioningParameters = attrib(default=None)
-    ProvisioningPreferences = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class CloudFormationProvisionedProduct(Resource):
-    """A Cloud Formation Provisioned Product for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for CloudFormationProvisionedProduct
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-cloudformationprovisionedproduct.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::CloudFormationProvisionedProduct"
-
-    Properties: CloudFormationProvisionedProductProperties = attrib(
-        factory=CloudFormationProvisionedProductProperties,
-        converter=create_object_converter(CloudFormationProvisionedProductProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class CloudFormationProductProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceptLanguage",
+            "Description",
+            "Distributor",
+            "Name",
+            "Owner",
+            "ProvisioningArtifactParameters",
+            "SupportDescription",
+            "SupportEmail",
+            "SupportUrl",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFormationProductProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ProvisioningArtifactParameters": _convert_CloudFormationProductProvisioningArtifactProperties_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            Description=None,
+            Distributor=None,
+            Name=None,
+            Owner=None,
+            ProvisioningArtifactParameters=None,
+            SupportDescription=None,
+            SupportEmail=None,
+            SupportUrl=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("Description", Description)
+            _setattr("Distributor", Distributor)
+            _setattr("Name", Name)
+            _setattr("Owner", Owner)
+            _setattr(
+                "ProvisioningArtifactParameters",
+                _convert_CloudFormationProductProvisioningArtifactProperties_list(
+                    ProvisioningArtifactParameters
+                ),
+            )
+            _setattr("SupportDescription", SupportDescription)
+            _setattr("SupportEmail", SupportEmail)
+            _setattr("SupportUrl", SupportUrl)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CloudFormationProductProperties = create_object_converter(
+        CloudFormationProductProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class LaunchNotificationConstraintProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    Description = attrib(default=None)
-    NotificationArns = attrib(default=None)
-    PortfolioId = attrib(default=None)
-    ProductId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class LaunchNotificationConstraint(Resource):
-    """A Launch Notification Constraint for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for LaunchNotificationConstraint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-launchnotificationconstraint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::LaunchNotificationConstraint"
-
-    Properties: LaunchNotificationConstraintProperties = attrib(
-        factory=LaunchNotificationConstraintProperties,
-        converter=create_object_converter(LaunchNotificationConstraintProperties),
+    class CloudFormationProduct(_Resource):
+        """A Cloud Formation Product for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudFormationProduct
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-cloudformationproduct.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::CloudFormationProduct"
+
+        Properties: CloudFormationProductProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFormationProduct",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_CloudFormationProductProperties},
+            factories={"Properties": CloudFormationProductProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CloudFormationProductProperties()
+            _setattr("Properties", _convert_CloudFormationProductProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        CloudFormationProduct,
+        CloudFormationProductProperties,
+        CloudFormationProductProvisioningArtifactProperties,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class LaunchRoleConstraintProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    Description = attrib(default=None)
-    PortfolioId = attrib(default=None)
-    ProductId = attrib(default=None)
-    RoleArn = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class LaunchRoleConstraint(Resource):
-    """A Launch Role Constraint for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for LaunchRoleConstraint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-launchroleconstraint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::LaunchRoleConstraint"
-
-    Properties: LaunchRoleConstraintProperties = attrib(
-        factory=LaunchRoleConstraintProperties,
-        converter=create_object_converter(LaunchRoleConstraintProperties),
+def _create_CloudFormationProvisionedProduct():
+    class CloudFormationProvisionedProductProvisioningParameter(_PropertyType):
+        """The Provisioning Parameter property type for CloudFormationProvisionedProduct in ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProvisioningParameter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-servicecatalog-cloudformationprovisionedproduct-provisioningparameter.html>`_
+        """
+
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFormationProvisionedProductProvisioningParameter",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    class CloudFormationProvisionedProductProvisioningPreferences(_PropertyType):
+        """The Provisioning Preferences property type for CloudFormationProvisionedProduct in ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for ProvisioningPreferences
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-servicecatalog-cloudformationprovisionedproduct-provisioningpreferences.html>`_
+        """
+
+        __slots__ = (
+            "StackSetAccounts",
+            "StackSetFailureToleranceCount",
+            "StackSetFailureTolerancePercentage",
+            "StackSetMaxConcurrencyCount",
+            "StackSetMaxConcurrencyPercentage",
+            "StackSetOperationType",
+            "StackSetRegions",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFormationProvisionedProductProvisioningPreferences",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            StackSetAccounts=None,
+            StackSetFailureToleranceCount=None,
+            StackSetFailureTolerancePercentage=None,
+            StackSetMaxConcurrencyCount=None,
+            StackSetMaxConcurrencyPercentage=None,
+            StackSetOperationType=None,
+            StackSetRegions=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("StackSetAccounts", StackSetAccounts)
+            _setattr("StackSetFailureToleranceCount", StackSetFailureToleranceCount)
+            _setattr(
+                "StackSetFailureTolerancePercentage", StackSetFailureTolerancePercentage
+            )
+            _setattr("StackSetMaxConcurrencyCount", StackSetMaxConcurrencyCount)
+            _setattr(
+                "StackSetMaxConcurrencyPercentage", StackSetMaxConcurrencyPercentage
+            )
+            _setattr("StackSetOperationType", StackSetOperationType)
+            _setattr("StackSetRegions", StackSetRegions)
+            _init_PropertyType(self, kwargs)
+
+    _convert_CloudFormationProvisionedProductProvisioningParameter_list = (
+        create_object_list_converter(
+            CloudFormationProvisionedProductProvisioningParameter
+        )
     )
-
-
-@attrs(**ATTRSCONFIG)
-class LaunchTemplateConstraintProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    Description = attrib(default=None)
-    PortfolioId = attrib(default=None)
-    ProductId = attrib(default=None)
-    Rules = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class LaunchTemplateConstraint(Resource):
-    """A Launch Template Constraint for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for LaunchTemplateConstraint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-launchtemplateconstraint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::LaunchTemplateConstraint"
-
-    Properties: LaunchTemplateConstraintProperties = attrib(
-        factory=LaunchTemplateConstraintProperties,
-        converter=create_object_converter(LaunchTemplateConstraintProperties),
+    _convert_CloudFormationProvisionedProductProvisioningPreferences = (
+        create_object_converter(CloudFormationProvisionedProductProvisioningPreferences)
     )
-
-
-@attrs(**ATTRSCONFIG)
-class PortfolioProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    Description = attrib(default=None)
-    DisplayName = attrib(default=None)
-    ProviderName = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Portfolio(Resource):
-    """A Portfolio for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for Portfolio
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-portfolio.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::Portfolio"
-
-    Properties: PortfolioProperties = attrib(
-        factory=PortfolioProperties,
-        converter=create_object_converter(PortfolioProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class CloudFormationProvisionedProductProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceptLanguage",
+            "NotificationArns",
+            "PathId",
+            "ProductId",
+            "ProductName",
+            "ProvisionedProductName",
+            "ProvisioningArtifactId",
+            "ProvisioningArtifactName",
+            "ProvisioningParameters",
+            "ProvisioningPreferences",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFormationProvisionedProductProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ProvisioningParameters": _convert_CloudFormationProvisionedProductProvisioningParameter_list,
+                "ProvisioningPreferences": _convert_CloudFormationProvisionedProductProvisioningPreferences,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            NotificationArns=None,
+            PathId=None,
+            ProductId=None,
+            ProductName=None,
+            ProvisionedProductName=None,
+            ProvisioningArtifactId=None,
+            ProvisioningArtifactName=None,
+            ProvisioningParameters=None,
+            ProvisioningPreferences=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("NotificationArns", NotificationArns)
+            _setattr("PathId", PathId)
+            _setattr("ProductId", ProductId)
+            _setattr("ProductName", ProductName)
+            _setattr("ProvisionedProductName", ProvisionedProductName)
+            _setattr("ProvisioningArtifactId", ProvisioningArtifactId)
+            _setattr("ProvisioningArtifactName", ProvisioningArtifactName)
+            _setattr(
+                "ProvisioningParameters",
+                _convert_CloudFormationProvisionedProductProvisioningParameter_list(
+                    ProvisioningParameters
+                ),
+            )
+            _setattr(
+                "ProvisioningPreferences",
+                _convert_CloudFormationProvisionedProductProvisioningPreferences(
+                    ProvisioningPreferences
+                ),
+            )
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_CloudFormationProvisionedProductProperties = create_object_converter(
+        CloudFormationProvisionedProductProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class PortfolioPrincipalAssociationProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    PortfolioId = attrib(default=None)
-    PrincipalARN = attrib(default=None)
-    PrincipalType = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class PortfolioPrincipalAssociation(Resource):
-    """A Portfolio Principal Association for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for PortfolioPrincipalAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-portfolioprincipalassociation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::PortfolioPrincipalAssociation"
-
-    Properties: PortfolioPrincipalAssociationProperties = attrib(
-        factory=PortfolioPrincipalAssociationProperties,
-        converter=create_object_converter(PortfolioPrincipalAssociationProperties),
+    class CloudFormationProvisionedProduct(_Resource):
+        """A Cloud Formation Provisioned Product for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudFormationProvisionedProduct
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-cloudformationprovisionedproduct.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::CloudFormationProvisionedProduct"
+
+        Properties: CloudFormationProvisionedProductProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "CloudFormationProvisionedProduct",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_CloudFormationProvisionedProductProperties
+            },
+            factories={"Properties": CloudFormationProvisionedProductProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = CloudFormationProvisionedProductProperties()
+            _setattr(
+                "Properties",
+                _convert_CloudFormationProvisionedProductProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        CloudFormationProvisionedProduct,
+        CloudFormationProvisionedProductProperties,
+        CloudFormationProvisionedProductProvisioningParameter,
+        CloudFormationProvisionedProductProvisioningPreferences,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class PortfolioProductAssociationProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    PortfolioId = attrib(default=None)
-    ProductId = attrib(default=None)
-    SourcePortfolioId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class PortfolioProductAssociation(Resource):
-    """A Portfolio Product Association for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for PortfolioProductAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-portfolioproductassociation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::PortfolioProductAssociation"
-
-    Properties: PortfolioProductAssociationProperties = attrib(
-        factory=PortfolioProductAssociationProperties,
-        converter=create_object_converter(PortfolioProductAssociationProperties),
+def _create_LaunchNotificationConstraint():
+    class LaunchNotificationConstraintProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceptLanguage",
+            "Description",
+            "NotificationArns",
+            "PortfolioId",
+            "ProductId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchNotificationConstraintProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            Description=None,
+            NotificationArns=None,
+            PortfolioId=None,
+            ProductId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("Description", Description)
+            _setattr("NotificationArns", NotificationArns)
+            _setattr("PortfolioId", PortfolioId)
+            _setattr("ProductId", ProductId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LaunchNotificationConstraintProperties = create_object_converter(
+        LaunchNotificationConstraintProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class PortfolioShareProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    AccountId = attrib(default=None)
-    PortfolioId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class PortfolioShare(Resource):
-    """A Portfolio Share for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for PortfolioShare
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-portfolioshare.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::PortfolioShare"
-
-    Properties: PortfolioShareProperties = attrib(
-        factory=PortfolioShareProperties,
-        converter=create_object_converter(PortfolioShareProperties),
+    class LaunchNotificationConstraint(_Resource):
+        """A Launch Notification Constraint for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchNotificationConstraint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-launchnotificationconstraint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::LaunchNotificationConstraint"
+
+        Properties: LaunchNotificationConstraintProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchNotificationConstraint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LaunchNotificationConstraintProperties},
+            factories={"Properties": LaunchNotificationConstraintProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LaunchNotificationConstraintProperties()
+            _setattr(
+                "Properties",
+                _convert_LaunchNotificationConstraintProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return LaunchNotificationConstraint, LaunchNotificationConstraintProperties
+
+
+def _create_LaunchRoleConstraint():
+    class LaunchRoleConstraintProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceptLanguage",
+            "Description",
+            "PortfolioId",
+            "ProductId",
+            "RoleArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchRoleConstraintProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            Description=None,
+            PortfolioId=None,
+            ProductId=None,
+            RoleArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("Description", Description)
+            _setattr("PortfolioId", PortfolioId)
+            _setattr("ProductId", ProductId)
+            _setattr("RoleArn", RoleArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LaunchRoleConstraintProperties = create_object_converter(
+        LaunchRoleConstraintProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ResourceUpdateConstraintProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    Description = attrib(default=None)
-    PortfolioId = attrib(default=None)
-    ProductId = attrib(default=None)
-    TagUpdateOnProvisionedProduct = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ResourceUpdateConstraint(Resource):
-    """A Resource Update Constraint for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for ResourceUpdateConstraint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-resourceupdateconstraint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::ResourceUpdateConstraint"
-
-    Properties: ResourceUpdateConstraintProperties = attrib(
-        factory=ResourceUpdateConstraintProperties,
-        converter=create_object_converter(ResourceUpdateConstraintProperties),
+    class LaunchRoleConstraint(_Resource):
+        """A Launch Role Constraint for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchRoleConstraint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-launchroleconstraint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::LaunchRoleConstraint"
+
+        Properties: LaunchRoleConstraintProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchRoleConstraint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LaunchRoleConstraintProperties},
+            factories={"Properties": LaunchRoleConstraintProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LaunchRoleConstraintProperties()
+            _setattr("Properties", _convert_LaunchRoleConstraintProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return LaunchRoleConstraint, LaunchRoleConstraintProperties
+
+
+def _create_LaunchTemplateConstraint():
+    class LaunchTemplateConstraintProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceptLanguage",
+            "Description",
+            "PortfolioId",
+            "ProductId",
+            "Rules",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateConstraintProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            Description=None,
+            PortfolioId=None,
+            ProductId=None,
+            Rules=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("Description", Description)
+            _setattr("PortfolioId", PortfolioId)
+            _setattr("ProductId", ProductId)
+            _setattr("Rules", Rules)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_LaunchTemplateConstraintProperties = create_object_converter(
+        LaunchTemplateConstraintProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class StackSetConstraintProperties(ResourceProperties):
-    AcceptLanguage = attrib(default=None)
-    AccountList = attrib(default=None)
-    AdminRole = attrib(default=None)
-    Description = attrib(default=None)
-    ExecutionRole = attrib(default=None)
-    PortfolioId = attrib(default=None)
-    ProductId = attrib(default=None)
-    RegionList = attrib(default=None)
-    StackInstanceControl = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class StackSetConstraint(Resource):
-    """A Stack Set Constraint for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for StackSetConstraint
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-stacksetconstraint.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::StackSetConstraint"
-
-    Properties: StackSetConstraintProperties = attrib(
-        factory=StackSetConstraintProperties,
-        converter=create_object_converter(StackSetConstraintProperties),
+    class LaunchTemplateConstraint(_Resource):
+        """A Launch Template Constraint for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for LaunchTemplateConstraint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-launchtemplateconstraint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::LaunchTemplateConstraint"
+
+        Properties: LaunchTemplateConstraintProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "LaunchTemplateConstraint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_LaunchTemplateConstraintProperties},
+            factories={"Properties": LaunchTemplateConstraintProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = LaunchTemplateConstraintProperties()
+            _setattr(
+                "Properties", _convert_LaunchTemplateConstraintProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return LaunchTemplateConstraint, LaunchTemplateConstraintProperties
+
+
+def _create_Portfolio():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class PortfolioProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceptLanguage",
+            "Description",
+            "DisplayName",
+            "ProviderName",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PortfolioProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            Description=None,
+            DisplayName=None,
+            ProviderName=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("Description", Description)
+            _setattr("DisplayName", DisplayName)
+            _setattr("ProviderName", ProviderName)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PortfolioProperties = create_object_converter(PortfolioProperties)
+
+    class Portfolio(_Resource):
+        """A Portfolio for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for Portfolio
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-portfolio.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::Portfolio"
+
+        Properties: PortfolioProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Portfolio",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PortfolioProperties},
+            factories={"Properties": PortfolioProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PortfolioProperties()
+            _setattr("Properties", _convert_PortfolioProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Portfolio, PortfolioProperties
+
+
+def _create_PortfolioPrincipalAssociation():
+    class PortfolioPrincipalAssociationProperties(_ResourceProperties):
+        __slots__ = ("AcceptLanguage", "PortfolioId", "PrincipalARN", "PrincipalType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PortfolioPrincipalAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            PortfolioId=None,
+            PrincipalARN=None,
+            PrincipalType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("PortfolioId", PortfolioId)
+            _setattr("PrincipalARN", PrincipalARN)
+            _setattr("PrincipalType", PrincipalType)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PortfolioPrincipalAssociationProperties = create_object_converter(
+        PortfolioPrincipalAssociationProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class TagOptionProperties(ResourceProperties):
-    Active = attrib(default=None)
-    Key = attrib(default=None)
-    Value = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TagOption(Resource):
-    """A Tag Option for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for TagOption
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-tagoption.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceCatalog::TagOption"
-
-    Properties: TagOptionProperties = attrib(
-        factory=TagOptionProperties,
-        converter=create_object_converter(TagOptionProperties),
+    class PortfolioPrincipalAssociation(_Resource):
+        """A Portfolio Principal Association for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for PortfolioPrincipalAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-portfolioprincipalassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::PortfolioPrincipalAssociation"
+
+        Properties: PortfolioPrincipalAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PortfolioPrincipalAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PortfolioPrincipalAssociationProperties},
+            factories={"Properties": PortfolioPrincipalAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PortfolioPrincipalAssociationProperties()
+            _setattr(
+                "Properties",
+                _convert_PortfolioPrincipalAssociationProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return PortfolioPrincipalAssociation, PortfolioPrincipalAssociationProperties
+
+
+def _create_PortfolioProductAssociation():
+    class PortfolioProductAssociationProperties(_ResourceProperties):
+        __slots__ = ("AcceptLanguage", "PortfolioId", "ProductId", "SourcePortfolioId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PortfolioProductAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            PortfolioId=None,
+            ProductId=None,
+            SourcePortfolioId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("PortfolioId", PortfolioId)
+            _setattr("ProductId", ProductId)
+            _setattr("SourcePortfolioId", SourcePortfolioId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PortfolioProductAssociationProperties = create_object_converter(
+        PortfolioProductAssociationProperties
     )
 
+    class PortfolioProductAssociation(_Resource):
+        """A Portfolio Product Association for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for PortfolioProductAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-portfolioproductassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::PortfolioProductAssociation"
+
+        Properties: PortfolioProductAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PortfolioProductAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PortfolioProductAssociationProperties},
+            factories={"Properties": PortfolioProductAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PortfolioProductAssociationProperties()
+            _setattr(
+                "Properties", _convert_PortfolioProductAssociationProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return PortfolioProductAssociation, PortfolioProductAssociationProperties
+
+
+def _create_PortfolioShare():
+    class PortfolioShareProperties(_ResourceProperties):
+        __slots__ = ("AcceptLanguage", "AccountId", "PortfolioId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PortfolioShareProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, AcceptLanguage=None, AccountId=None, PortfolioId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("AccountId", AccountId)
+            _setattr("PortfolioId", PortfolioId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PortfolioShareProperties = create_object_converter(
+        PortfolioShareProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class TagOptionAssociationProperties(ResourceProperties):
-    ResourceId = attrib(default=None)
-    TagOptionId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class TagOptionAssociation(Resource):
-    """A Tag Option Association for ServiceCatalog.
-
-    See Also:
-        `AWS Cloud Formation documentation for TagOptionAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-tagoptionassociation.html>`_
-    """
+    class PortfolioShare(_Resource):
+        """A Portfolio Share for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for PortfolioShare
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-portfolioshare.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::PortfolioShare"
+
+        Properties: PortfolioShareProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PortfolioShare",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PortfolioShareProperties},
+            factories={"Properties": PortfolioShareProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PortfolioShareProperties()
+            _setattr("Properties", _convert_PortfolioShareProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return PortfolioShare, PortfolioShareProperties
+
+
+def _create_ResourceUpdateConstraint():
+    class ResourceUpdateConstraintProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceptLanguage",
+            "Description",
+            "PortfolioId",
+            "ProductId",
+            "TagUpdateOnProvisionedProduct",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceUpdateConstraintProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            Description=None,
+            PortfolioId=None,
+            ProductId=None,
+            TagUpdateOnProvisionedProduct=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("Description", Description)
+            _setattr("PortfolioId", PortfolioId)
+            _setattr("ProductId", ProductId)
+            _setattr("TagUpdateOnProvisionedProduct", TagUpdateOnProvisionedProduct)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ResourceUpdateConstraintProperties = create_object_converter(
+        ResourceUpdateConstraintProperties
+    )
 
-    RESOURCE_TYPE = "AWS::ServiceCatalog::TagOptionAssociation"
+    class ResourceUpdateConstraint(_Resource):
+        """A Resource Update Constraint for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceUpdateConstraint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-resourceupdateconstraint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::ResourceUpdateConstraint"
+
+        Properties: ResourceUpdateConstraintProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceUpdateConstraint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResourceUpdateConstraintProperties},
+            factories={"Properties": ResourceUpdateConstraintProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResourceUpdateConstraintProperties()
+            _setattr(
+                "Properties", _convert_ResourceUpdateConstraintProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
+
+    return ResourceUpdateConstraint, ResourceUpdateConstraintProperties
+
+
+def _create_StackSetConstraint():
+    class StackSetConstraintProperties(_ResourceProperties):
+        __slots__ = (
+            "AcceptLanguage",
+            "AccountList",
+            "AdminRole",
+            "Description",
+            "ExecutionRole",
+            "PortfolioId",
+            "ProductId",
+            "RegionList",
+            "StackInstanceControl",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackSetConstraintProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AcceptLanguage=None,
+            AccountList=None,
+            AdminRole=None,
+            Description=None,
+            ExecutionRole=None,
+            PortfolioId=None,
+            ProductId=None,
+            RegionList=None,
+            StackInstanceControl=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AcceptLanguage", AcceptLanguage)
+            _setattr("AccountList", AccountList)
+            _setattr("AdminRole", AdminRole)
+            _setattr("Description", Description)
+            _setattr("ExecutionRole", ExecutionRole)
+            _setattr("PortfolioId", PortfolioId)
+            _setattr("ProductId", ProductId)
+            _setattr("RegionList", RegionList)
+            _setattr("StackInstanceControl", StackInstanceControl)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StackSetConstraintProperties = create_object_converter(
+        StackSetConstraintProperties
+    )
 
-    Properties: TagOptionAssociationProperties = attrib(
-        factory=TagOptionAssociationProperties,
-        converter=create_object_converter(TagOptionAssociationProperties),
+    class StackSetConstraint(_Resource):
+        """A Stack Set Constraint for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for StackSetConstraint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-stacksetconstraint.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::StackSetConstraint"
+
+        Properties: StackSetConstraintProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StackSetConstraint",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StackSetConstraintProperties},
+            factories={"Properties": StackSetConstraintProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StackSetConstraintProperties()
+            _setattr("Properties", _convert_StackSetConstraintProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return StackSetConstraint, StackSetConstraintProperties
+
+
+def _create_TagOption():
+    class TagOptionProperties(_ResourceProperties):
+        __slots__ = ("Active", "Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TagOptionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Active=None, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Active", Active)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TagOptionProperties = create_object_converter(TagOptionProperties)
+
+    class TagOption(_Resource):
+        """A Tag Option for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagOption
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-tagoption.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::TagOption"
+
+        Properties: TagOptionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TagOption",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TagOptionProperties},
+            factories={"Properties": TagOptionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TagOptionProperties()
+            _setattr("Properties", _convert_TagOptionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return TagOption, TagOptionProperties
+
+
+def _create_TagOptionAssociation():
+    class TagOptionAssociationProperties(_ResourceProperties):
+        __slots__ = ("ResourceId", "TagOptionId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TagOptionAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceId=None, TagOptionId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceId", ResourceId)
+            _setattr("TagOptionId", TagOptionId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TagOptionAssociationProperties = create_object_converter(
+        TagOptionAssociationProperties
     )
+
+    class TagOptionAssociation(_Resource):
+        """A Tag Option Association for ServiceCatalog.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagOptionAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicecatalog-tagoptionassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceCatalog::TagOptionAssociation"
+
+        Properties: TagOptionAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TagOptionAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TagOptionAssociationProperties},
+            factories={"Properties": TagOptionAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TagOptionAssociationProperties()
+            _setattr("Properties", _convert_TagOptionAssociationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return TagOptionAssociation, TagOptionAssociationProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "AcceptedPortfolioShare": _create_AcceptedPortfolioShare,
+        "AcceptedPortfolioShareProperties": _create_AcceptedPortfolioShare,
+        "CloudFormationProduct": _create_CloudFormationProduct,
+        "CloudFormationProductProperties": _create_CloudFormationProduct,
+        "CloudFormationProductProvisioningArtifactProperties": _create_CloudFormationProduct,
+        "CloudFormationProvisionedProduct": _create_CloudFormationProvisionedProduct,
+        "CloudFormationProvisionedProductProperties": _create_CloudFormationProvisionedProduct,
+        "CloudFormationProvisionedProductProvisioningParameter": _create_CloudFormationProvisionedProduct,
+        "CloudFormationProvisionedProductProvisioningPreferences": _create_CloudFormationProvisionedProduct,
+        "LaunchNotificationConstraint": _create_LaunchNotificationConstraint,
+        "LaunchNotificationConstraintProperties": _create_LaunchNotificationConstraint,
+        "LaunchRoleConstraint": _create_LaunchRoleConstraint,
+        "LaunchRoleConstraintProperties": _create_LaunchRoleConstraint,
+        "LaunchTemplateConstraint": _create_LaunchTemplateConstraint,
+        "LaunchTemplateConstraintProperties": _create_LaunchTemplateConstraint,
+        "Portfolio": _create_Portfolio,
+        "PortfolioProperties": _create_Portfolio,
+        "PortfolioPrincipalAssociation": _create_PortfolioPrincipalAssociation,
+        "PortfolioPrincipalAssociationProperties": _create_PortfolioPrincipalAssociation,
+        "PortfolioProductAssociation": _create_PortfolioProductAssociation,
+        "PortfolioProductAssociationProperties": _create_PortfolioProductAssociation,
+        "PortfolioShare": _create_PortfolioShare,
+        "PortfolioShareProperties": _create_PortfolioShare,
+        "ResourceUpdateConstraint": _create_ResourceUpdateConstraint,
+        "ResourceUpdateConstraintProperties": _create_ResourceUpdateConstraint,
+        "StackSetConstraint": _create_StackSetConstraint,
+        "StackSetConstraintProperties": _create_StackSetConstraint,
+        "TagOption": _create_TagOption,
+        "TagOptionProperties": _create_TagOption,
+        "TagOptionAssociation": _create_TagOptionAssociation,
+        "TagOptionAssociationProperties": _create_TagOptionAssociation,
+    },
+)
@@ -7,13 +7,20 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "HttpNamespace",
@@ -26,124 +33,450 @@ __all__ = [
     "PublicDnsNamespaceProperties",
     "Service",
     "ServiceProperties",
+    "ServiceDnsConfig",
+    "ServiceDnsRecord",
+    "ServiceHealthCheckConfig",
+    "ServiceHealthCheckCustomConfig",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class HttpNamespaceProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class HttpNamespace(Resource):
-    """A Http Namespace for ServiceDiscovery.
-
-    See Also:
-        `AWS Cloud Formation documentation for HttpNamespace
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-httpnamespace.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceDiscovery::HttpNamespace"
-
-    Properties: HttpNamespaceProperties = attrib(
-        factory=HttpNamespaceProperties,
-        converter=create_object_converter(HttpNamespaceProperties),
+def _create_HttpNamespace():
+    class HttpNamespaceProperties(_ResourceProperties):
+        __slots__ = ("Description", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HttpNamespaceProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Description=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_HttpNamespaceProperties = create_object_converter(HttpNamespaceProperties)
+
+    class HttpNamespace(_Resource):
+        """A Http Namespace for ServiceDiscovery.
+
+        See Also:
+            `AWS Cloud Formation documentation for HttpNamespace
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-httpnamespace.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceDiscovery::HttpNamespace"
+
+        Properties: HttpNamespaceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "HttpNamespace",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_HttpNamespaceProperties},
+            factories={"Properties": HttpNamespaceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = HttpNamespaceProperties()
+            _setattr("Properties", _convert_HttpNamespaceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return HttpNamespace, HttpNamespaceProperties
+
+
+def _create_Instance():
+    class InstanceProperties(_ResourceProperties):
+        __slots__ = ("InstanceAttributes", "InstanceId", "ServiceId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "InstanceProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, InstanceAttributes=None, InstanceId=None, ServiceId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InstanceAttributes", InstanceAttributes)
+            _setattr("InstanceId", InstanceId)
+            _setattr("ServiceId", ServiceId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_InstanceProperties = create_object_converter(InstanceProperties)
+
+    class Instance(_Resource):
+        """A Instance for ServiceDiscovery.
+
+        See Also:
+            `AWS Cloud Formation documentation for Instance
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-instance.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceDiscovery::Instance"
+
+        Properties: InstanceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Instance",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_InstanceProperties},
+            factories={"Properties": InstanceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = InstanceProperties()
+            _setattr("Properties", _convert_InstanceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Instance, InstanceProperties
+
+
+def _create_PrivateDnsNamespace():
+    class PrivateDnsNamespaceProperties(_ResourceProperties):
+        __slots__ = ("Description", "Name", "Vpc")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PrivateDnsNamespaceProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Description=None, Name=None, Vpc=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Vpc", Vpc)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PrivateDnsNamespaceProperties = create_object_converter(
+        PrivateDnsNamespaceProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class InstanceProperties(ResourceProperties):
-    InstanceAttributes = attrib(default=None)
-    InstanceId = attrib(default=None)
-    ServiceId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Instance(Resource):
-    """A Instance for ServiceDiscovery.
-
-    See Also:
-        `AWS Cloud Formation documentation for Instance
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-instance.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceDiscovery::Instance"
-
-    Properties: InstanceProperties = attrib(
-        factory=InstanceProperties,
-        converter=create_object_converter(InstanceProperties),
+    class PrivateDnsNamespace(_Resource):
+        """A Private Dns Namespace for ServiceDiscovery.
+
+        See Also:
+            `AWS Cloud Formation documentation for PrivateDnsNamespace
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-privatednsnamespace.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceDiscovery::PrivateDnsNamespace"
+
+        Properties: PrivateDnsNamespaceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PrivateDnsNamespace",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PrivateDnsNamespaceProperties},
+            factories={"Properties": PrivateDnsNamespaceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PrivateDnsNamespaceProperties()
+            _setattr("Properties", _convert_PrivateDnsNamespaceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return PrivateDnsNamespace, PrivateDnsNamespaceProperties
+
+
+def _create_PublicDnsNamespace():
+    class PublicDnsNamespaceProperties(_ResourceProperties):
+        __slots__ = ("Description", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PublicDnsNamespaceProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Description=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PublicDnsNamespaceProperties = create_object_converter(
+        PublicDnsNamespaceProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class PrivateDnsNamespaceProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    Vpc = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class PrivateDnsNamespace(Resource):
-    """A Private Dns Namespace for ServiceDiscovery.
-
-    See Also:
-        `AWS Cloud Formation documentation for PrivateDnsNamespace
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-privatednsnamespace.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceDiscovery::PrivateDnsNamespace"
-
-    Properties: PrivateDnsNamespaceProperties = attrib(
-        factory=PrivateDnsNamespaceProperties,
-        converter=create_object_converter(PrivateDnsNamespaceProperties),
+    class PublicDnsNamespace(_Resource):
+        """A Public Dns Namespace for ServiceDiscovery.
+
+        See Also:
+            `AWS Cloud Formation documentation for PublicDnsNamespace
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-publicdnsnamespace.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceDiscovery::PublicDnsNamespace"
+
+        Properties: PublicDnsNamespaceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PublicDnsNamespace",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PublicDnsNamespaceProperties},
+            factories={"Properties": PublicDnsNamespaceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PublicDnsNamespaceProperties()
+            _setattr("Properties", _convert_PublicDnsNamespaceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return PublicDnsNamespace, PublicDnsNamespaceProperties
+
+
+def _create_Service():
+    class ServiceDnsRecord(_PropertyType):
+        """The Dns Record property type for Service in ServiceDiscovery.
+
+        See Also:
+            `AWS Cloud Formation documentation for DnsRecord
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-servicediscovery-service-dnsrecord.html>`_
+        """
+
+        __slots__ = ("TTL", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceDnsRecord", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TTL=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TTL", TTL)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ServiceDnsRecord_list = create_object_list_converter(ServiceDnsRecord)
+
+    class ServiceDnsConfig(_PropertyType):
+        """The Dns Config property type for Service in ServiceDiscovery.
+
+        See Also:
+            `AWS Cloud Formation documentation for DnsConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-servicediscovery-service-dnsconfig.html>`_
+        """
+
+        __slots__ = ("DnsRecords", "NamespaceId", "RoutingPolicy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceDnsConfig",
+            _PropertyType,
+            __slots__,
+            converters={"DnsRecords": _convert_ServiceDnsRecord_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DnsRecords=None, NamespaceId=None, RoutingPolicy=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DnsRecords", _convert_ServiceDnsRecord_list(DnsRecords))
+            _setattr("NamespaceId", NamespaceId)
+            _setattr("RoutingPolicy", RoutingPolicy)
+            _init_PropertyType(self, kwargs)
+
+    class ServiceHealthCheckConfig(_PropertyType):
+        """The Health Check Config property type for Service in ServiceDiscovery.
+
+        See Also:
+            `AWS Cloud Formation documentation for HealthCheckConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-servicediscovery-service-healthcheckconfig.html>`_
+        """
+
+        __slots__ = ("FailureThreshold", "ResourcePath", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceHealthCheckConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FailureThreshold=None, ResourcePath=None, Type=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FailureThreshold", FailureThreshold)
+            _setattr("ResourcePath", ResourcePath)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    class ServiceHealthCheckCustomConfig(_PropertyType):
+        """The Health Check Custom Config property type for Service in ServiceDiscovery.
+
+        See Also:
+            `AWS Cloud Formation documentation for HealthCheckCustomConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-servicediscovery-service-healthcheckcustomconfig.html>`_
+        """
+
+        __slots__ = ("FailureThreshold",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceHealthCheckCustomConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, FailureThreshold=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FailureThreshold", FailureThreshold)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ServiceDnsConfig = create_object_converter(ServiceDnsConfig)
+    _convert_ServiceHealthCheckConfig = create_object_converter(
+        ServiceHealthCheckConfig
     )
-
-
-@attrs(**ATTRSCONFIG)
-class PublicDnsNamespaceProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class PublicDnsNamespace(Resource):
-    """A Public Dns Namespace for ServiceDiscovery.
-
-    See Also:
-        `AWS Cloud Formation documentation for PublicDnsNamespace
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-publicdnsnamespace.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceDiscovery::PublicDnsNamespace"
-
-    Properties: PublicDnsNamespaceProperties = attrib(
-        factory=PublicDnsNamespaceProperties,
-        converter=create_object_converter(PublicDnsNamespaceProperties),
+    _convert_ServiceHealthCheckCustomConfig = create_object_converter(
+        ServiceHealthCheckCustomConfig
     )
 
+    class ServiceProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "DnsConfig",
+            "HealthCheckConfig",
+            "HealthCheckCustomConfig",
+            "Name",
+            "NamespaceId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServiceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DnsConfig": _convert_ServiceDnsConfig,
+                "HealthCheckConfig": _convert_ServiceHealthCheckConfig,
+                "HealthCheckCustomConfig": _convert_ServiceHealthCheckCustomConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            DnsConfig=None,
+            HealthCheckConfig=None,
+            HealthCheckCustomConfig=None,
+            Name=None,
+            NamespaceId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("DnsConfig", _convert_ServiceDnsConfig(DnsConfig))
+            _setattr(
+                "HealthCheckConfig",
+                _convert_ServiceHealthCheckConfig(HealthCheckConfig),
+            )
+            _setattr(
+                "HealthCheckCustomConfig",
+                _convert_ServiceHealthCheckCustomConfig(HealthCheckCustomConfig),
+            )
+            _setattr("Name", Name)
+            _setattr("NamespaceId", NamespaceId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ServiceProperties = create_object_converter(ServiceProperties)
+
+    class Service(_Resource):
+        """A Service for ServiceDiscovery.
+
+        See Also:
+            `AWS Cloud Formation documentation for Service
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-service.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::ServiceDiscovery::Service"
+
+        Properties: ServiceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Service",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ServiceProperties},
+            factories={"Properties": ServiceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ServiceProperties()
+            _setattr("Properties", _convert_ServiceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Service,
+        ServiceProperties,
+        ServiceDnsRecord,
+        ServiceDnsConfig,
+        ServiceHealthCheckConfig,
+        ServiceHealthCheckCustomConfig,
+    )
 
-@attrs(**ATTRSCONFIG)
-class ServiceProperties(ResourceProperties):
-    Description = attrib(default=None)
-    DnsConfig = attrib(default=None)
-    HealthCheckConfig = attrib(default=None)
-    HealthCheckCustomConfig = attrib(default=None)
-    Name = attrib(default=None)
-    NamespaceId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Service(Resource):
-    """A Service for ServiceDiscovery.
-
-    See Also:
-        `AWS Cloud Formation documentation for Service
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-servicediscovery-service.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::ServiceDiscovery::Service"
 
-    Properties: ServiceProperties = attrib(
-        factory=ServiceProperties, converter=create_object_converter(ServiceProperties)
-    )
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "HttpNamespace": _create_HttpNamespace,
+        "HttpNamespaceProperties": _create_HttpNamespace,
+        "Instance": _create_Instance,
+        "InstanceProperties": _create_Instance,
+        "PrivateDnsNamespace": _create_PrivateDnsNamespace,
+        "PrivateDnsNamespaceProperties": _create_PrivateDnsNamespace,
+        "PublicDnsNamespace": _create_PublicDnsNamespace,
+        "PublicDnsNamespaceProperties": _create_PublicDnsNamespace,
+        "Service": _create_Service,
+        "ServiceProperties": _create_Service,
+        "ServiceDnsConfig": _create_Service,
+        "ServiceDnsRecord": _create_Service,
+        "ServiceHealthCheckConfig": _create_Service,
+        "ServiceHealthCheckCustomConfig": _create_Service,
+    },
+)
@@ -7,160 +7,1008 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "ConfigurationSet",
     "ConfigurationSetProperties",
     "ConfigurationSetEventDestination",
     "ConfigurationSetEventDestinationProperties",
+    "ConfigurationSetEventDestinationCloudWatchDestination",
+    "ConfigurationSetEventDestinationDimensionConfiguration",
+    "ConfigurationSetEventDestinationEventDestination",
+    "ConfigurationSetEventDestinationKinesisFirehoseDestination",
     "ReceiptFilter",
     "ReceiptFilterProperties",
+    "ReceiptFilterFilter",
+    "ReceiptFilterIpFilter",
     "ReceiptRule",
     "ReceiptRuleProperties",
+    "ReceiptRuleAction",
+    "ReceiptRuleAddHeaderAction",
+    "ReceiptRuleBounceAction",
+    "ReceiptRuleLambdaAction",
+    "ReceiptRuleRule",
+    "ReceiptRuleS3Action",
+    "ReceiptRuleSNSAction",
+    "ReceiptRuleStopAction",
+    "ReceiptRuleWorkmailAction",
     "ReceiptRuleSet",
     "ReceiptRuleSetProperties",
     "Template",
     "TemplateProperties",
+    "TemplateTemplate",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ConfigurationSetProperties(ResourceProperties):
-    Name = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ConfigurationSet(Resource):
-    """A Configuration Set for SES.
-
-    See Also:
-        `AWS Cloud Formation documentation for ConfigurationSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-configurationset.html>`_
-    """
+def _create_ConfigurationSet():
+    class ConfigurationSetProperties(_ResourceProperties):
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::SES::ConfigurationSet"
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: ConfigurationSetProperties = attrib(
-        factory=ConfigurationSetProperties,
-        converter=create_object_converter(ConfigurationSetProperties),
+    _convert_ConfigurationSetProperties = create_object_converter(
+        ConfigurationSetProperties
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ConfigurationSetEventDestinationProperties(ResourceProperties):
-    ConfigurationSetName = attrib(default=None)
-    EventDestination = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ConfigurationSetEventDestination(Resource):
-    """A Configuration Set Event Destination for SES.
-
-    See Also:
-        `AWS Cloud Formation documentation for ConfigurationSetEventDestination
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-configurationseteventdestination.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SES::ConfigurationSetEventDestination"
-
-    Properties: ConfigurationSetEventDestinationProperties = attrib(
-        factory=ConfigurationSetEventDestinationProperties,
-        converter=create_object_converter(ConfigurationSetEventDestinationProperties),
+    class ConfigurationSet(_Resource):
+        """A Configuration Set for SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-configurationset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SES::ConfigurationSet"
+
+        Properties: ConfigurationSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ConfigurationSetProperties},
+            factories={"Properties": ConfigurationSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigurationSetProperties()
+            _setattr("Properties", _convert_ConfigurationSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ConfigurationSet, ConfigurationSetProperties
+
+
+def _create_ConfigurationSetEventDestination():
+    class ConfigurationSetEventDestinationDimensionConfiguration(_PropertyType):
+        """The Dimension Configuration property type for ConfigurationSetEventDestination in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for DimensionConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-configurationseteventdestination-dimensionconfiguration.html>`_
+        """
+
+        __slots__ = ("DefaultDimensionValue", "DimensionName", "DimensionValueSource")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationDimensionConfiguration",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultDimensionValue=None,
+            DimensionName=None,
+            DimensionValueSource=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultDimensionValue", DefaultDimensionValue)
+            _setattr("DimensionName", DimensionName)
+            _setattr("DimensionValueSource", DimensionValueSource)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationSetEventDestinationDimensionConfiguration_list = (
+        create_object_list_converter(
+            ConfigurationSetEventDestinationDimensionConfiguration
+        )
     )
 
-
-@attrs(**ATTRSCONFIG)
-class ReceiptFilterProperties(ResourceProperties):
-    Filter = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ReceiptFilter(Resource):
-    """A Receipt Filter for SES.
-
-    See Also:
-        `AWS Cloud Formation documentation for ReceiptFilter
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-receiptfilter.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SES::ReceiptFilter"
-
-    Properties: ReceiptFilterProperties = attrib(
-        factory=ReceiptFilterProperties,
-        converter=create_object_converter(ReceiptFilterProperties),
+    class ConfigurationSetEventDestinationCloudWatchDestination(_PropertyType):
+        """The Cloud Watch Destination property type for ConfigurationSetEventDestination in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudWatchDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-configurationseteventdestination-cloudwatchdestination.html>`_
+        """
+
+        __slots__ = ("DimensionConfigurations",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationCloudWatchDestination",
+            _PropertyType,
+            __slots__,
+            converters={
+                "DimensionConfigurations": _convert_ConfigurationSetEventDestinationDimensionConfiguration_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DimensionConfigurations=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "DimensionConfigurations",
+                _convert_ConfigurationSetEventDestinationDimensionConfiguration_list(
+                    DimensionConfigurations
+                ),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class ConfigurationSetEventDestinationKinesisFirehoseDestination(_PropertyType):
+        """The Kinesis Firehose Destination property type for ConfigurationSetEventDestination in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for KinesisFirehoseDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-configurationseteventdestination-kinesisfirehosedestination.html>`_
+        """
+
+        __slots__ = ("DeliveryStreamARN", "IAMRoleARN")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationKinesisFirehoseDestination",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, DeliveryStreamARN=None, IAMRoleARN=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeliveryStreamARN", DeliveryStreamARN)
+            _setattr("IAMRoleARN", IAMRoleARN)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationSetEventDestinationCloudWatchDestination = (
+        create_object_converter(ConfigurationSetEventDestinationCloudWatchDestination)
     )
-
-
-@attrs(**ATTRSCONFIG)
-class ReceiptRuleProperties(ResourceProperties):
-    After = attrib(default=None)
-    Rule = attrib(default=None)
-    RuleSetName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ReceiptRule(Resource):
-    """A Receipt Rule for SES.
-
-    See Also:
-        `AWS Cloud Formation documentation for ReceiptRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-receiptrule.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SES::ReceiptRule"
-
-    Properties: ReceiptRuleProperties = attrib(
-        factory=ReceiptRuleProperties,
-        converter=create_object_converter(ReceiptRuleProperties),
+    _convert_ConfigurationSetEventDestinationKinesisFirehoseDestination = (
+        create_object_converter(
+            ConfigurationSetEventDestinationKinesisFirehoseDestination
+        )
     )
 
+    class ConfigurationSetEventDestinationEventDestination(_PropertyType):
+        """The Event Destination property type for ConfigurationSetEventDestination in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for EventDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-configurationseteventdestination-eventdestination.html>`_
+        """
+
+        __slots__ = (
+            "CloudWatchDestination",
+            "Enabled",
+            "KinesisFirehoseDestination",
+            "MatchingEventTypes",
+            "Name",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationEventDestination",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudWatchDestination": _convert_ConfigurationSetEventDestinationCloudWatchDestination,
+                "KinesisFirehoseDestination": _convert_ConfigurationSetEventDestinationKinesisFirehoseDestination,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CloudWatchDestination=None,
+            Enabled=None,
+            KinesisFirehoseDestination=None,
+            MatchingEventTypes=None,
+            Name=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudWatchDestination",
+                _convert_ConfigurationSetEventDestinationCloudWatchDestination(
+                    CloudWatchDestination
+                ),
+            )
+            _setattr("Enabled", Enabled)
+            _setattr(
+                "KinesisFirehoseDestination",
+                _convert_ConfigurationSetEventDestinationKinesisFirehoseDestination(
+                    KinesisFirehoseDestination
+                ),
+            )
+            _setattr("MatchingEventTypes", MatchingEventTypes)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ConfigurationSetEventDestinationEventDestination = create_object_converter(
+        ConfigurationSetEventDestinationEventDestination
+    )
 
-@attrs(**ATTRSCONFIG)
-class ReceiptRuleSetProperties(ResourceProperties):
-    RuleSetName = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class ReceiptRuleSet(Resource):
-    """A Receipt Rule Set for SES.
+    class ConfigurationSetEventDestinationProperties(_ResourceProperties):
+        __slots__ = ("ConfigurationSetName", "EventDestination")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestinationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "EventDestination": _convert_ConfigurationSetEventDestinationEventDestination
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ConfigurationSetName=None, EventDestination=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ConfigurationSetName", ConfigurationSetName)
+            _setattr(
+                "EventDestination",
+                _convert_ConfigurationSetEventDestinationEventDestination(
+                    EventDestination
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ConfigurationSetEventDestinationProperties = create_object_converter(
+        ConfigurationSetEventDestinationProperties
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for ReceiptRuleSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-receiptruleset.html>`_
-    """
+    class ConfigurationSetEventDestination(_Resource):
+        """A Configuration Set Event Destination for SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for ConfigurationSetEventDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-configurationseteventdestination.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SES::ConfigurationSetEventDestination"
+
+        Properties: ConfigurationSetEventDestinationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ConfigurationSetEventDestination",
+            _Resource,
+            __slots__,
+            converters={
+                "Properties": _convert_ConfigurationSetEventDestinationProperties
+            },
+            factories={"Properties": ConfigurationSetEventDestinationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ConfigurationSetEventDestinationProperties()
+            _setattr(
+                "Properties",
+                _convert_ConfigurationSetEventDestinationProperties(Properties),
+            )
+            _init_Resource(self, kwargs)
+
+    return (
+        ConfigurationSetEventDestination,
+        ConfigurationSetEventDestinationProperties,
+        ConfigurationSetEventDestinationDimensionConfiguration,
+        ConfigurationSetEventDestinationCloudWatchDestination,
+        ConfigurationSetEventDestinationKinesisFirehoseDestination,
+        ConfigurationSetEventDestinationEventDestination,
+    )
 
-    RESOURCE_TYPE = "AWS::SES::ReceiptRuleSet"
 
-    Properties: ReceiptRuleSetProperties = attrib(
-        factory=ReceiptRuleSetProperties,
-        converter=create_object_converter(ReceiptRuleSetProperties),
+def _create_ReceiptFilter():
+    class ReceiptFilterIpFilter(_PropertyType):
+        """The Ip Filter property type for ReceiptFilter in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for IpFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptfilter-ipfilter.html>`_
+        """
+
+        __slots__ = ("Cidr", "Policy")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptFilterIpFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Cidr=None, Policy=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Cidr", Cidr)
+            _setattr("Policy", Policy)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ReceiptFilterIpFilter = create_object_converter(ReceiptFilterIpFilter)
+
+    class ReceiptFilterFilter(_PropertyType):
+        """The Filter property type for ReceiptFilter in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for Filter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptfilter-filter.html>`_
+        """
+
+        __slots__ = ("IpFilter", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptFilterFilter",
+            _PropertyType,
+            __slots__,
+            converters={"IpFilter": _convert_ReceiptFilterIpFilter},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, IpFilter=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IpFilter", _convert_ReceiptFilterIpFilter(IpFilter))
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ReceiptFilterFilter = create_object_converter(ReceiptFilterFilter)
+
+    class ReceiptFilterProperties(_ResourceProperties):
+        __slots__ = ("Filter",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptFilterProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Filter": _convert_ReceiptFilterFilter},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Filter=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Filter", _convert_ReceiptFilterFilter(Filter))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ReceiptFilterProperties = create_object_converter(ReceiptFilterProperties)
+
+    class ReceiptFilter(_Resource):
+        """A Receipt Filter for SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReceiptFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-receiptfilter.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SES::ReceiptFilter"
+
+        Properties: ReceiptFilterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptFilter",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ReceiptFilterProperties},
+            factories={"Properties": ReceiptFilterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ReceiptFilterProperties()
+            _setattr("Properties", _convert_ReceiptFilterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ReceiptFilter,
+        ReceiptFilterProperties,
+        ReceiptFilterIpFilter,
+        ReceiptFilterFilter,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class TemplateProperties(ResourceProperties):
-    Template = attrib(default=None)
+def _create_ReceiptRule():
+    class ReceiptRuleBounceAction(_PropertyType):
+        """The Bounce Action property type for ReceiptRule in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for BounceAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptrule-bounceaction.html>`_
+        """
+
+        __slots__ = ("Message", "Sender", "SmtpReplyCode", "StatusCode", "TopicArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleBounceAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Message=None,
+            Sender=None,
+            SmtpReplyCode=None,
+            StatusCode=None,
+            TopicArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Message", Message)
+            _setattr("Sender", Sender)
+            _setattr("SmtpReplyCode", SmtpReplyCode)
+            _setattr("StatusCode", StatusCode)
+            _setattr("TopicArn", TopicArn)
+            _init_PropertyType(self, kwargs)
+
+    class ReceiptRuleS3Action(_PropertyType):
+        """The S3 Action property type for ReceiptRule in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptrule-s3action.html>`_
+        """
+
+        __slots__ = ("BucketName", "KmsKeyArn", "ObjectKeyPrefix", "TopicArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleS3Action", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BucketName=None,
+            KmsKeyArn=None,
+            ObjectKeyPrefix=None,
+            TopicArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketName", BucketName)
+            _setattr("KmsKeyArn", KmsKeyArn)
+            _setattr("ObjectKeyPrefix", ObjectKeyPrefix)
+            _setattr("TopicArn", TopicArn)
+            _init_PropertyType(self, kwargs)
+
+    class ReceiptRuleStopAction(_PropertyType):
+        """The Stop Action property type for ReceiptRule in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for StopAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptrule-stopaction.html>`_
+        """
+
+        __slots__ = ("Scope", "TopicArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleStopAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Scope=None, TopicArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Scope", Scope)
+            _setattr("TopicArn", TopicArn)
+            _init_PropertyType(self, kwargs)
+
+    class ReceiptRuleSNSAction(_PropertyType):
+        """The Sns Action property type for ReceiptRule in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for SNSAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptrule-snsaction.html>`_
+        """
+
+        __slots__ = ("Encoding", "TopicArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleSNSAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Encoding=None, TopicArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Encoding", Encoding)
+            _setattr("TopicArn", TopicArn)
+            _init_PropertyType(self, kwargs)
+
+    class ReceiptRuleWorkmailAction(_PropertyType):
+        """The Workmail Action property type for ReceiptRule in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for WorkmailAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptrule-workmailaction.html>`_
+        """
+
+        __slots__ = ("OrganizationArn", "TopicArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleWorkmailAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, OrganizationArn=None, TopicArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("OrganizationArn", OrganizationArn)
+            _setattr("TopicArn", TopicArn)
+            _init_PropertyType(self, kwargs)
+
+    class ReceiptRuleAddHeaderAction(_PropertyType):
+        """The Add Header Action property type for ReceiptRule in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for AddHeaderAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptrule-addheaderaction.html>`_
+        """
+
+        __slots__ = ("HeaderName", "HeaderValue")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleAddHeaderAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, HeaderName=None, HeaderValue=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HeaderName", HeaderName)
+            _setattr("HeaderValue", HeaderValue)
+            _init_PropertyType(self, kwargs)
+
+    class ReceiptRuleLambdaAction(_PropertyType):
+        """The Lambda Action property type for ReceiptRule in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for LambdaAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptrule-lambdaaction.html>`_
+        """
+
+        __slots__ = ("FunctionArn", "InvocationType", "TopicArn")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleLambdaAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FunctionArn=None, InvocationType=None, TopicArn=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FunctionArn", FunctionArn)
+            _setattr("InvocationType", InvocationType)
+            _setattr("TopicArn", TopicArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ReceiptRuleAddHeaderAction = create_object_converter(
+        ReceiptRuleAddHeaderAction
+    )
+    _convert_ReceiptRuleBounceAction = create_object_converter(ReceiptRuleBounceAction)
+    _convert_ReceiptRuleLambdaAction = create_object_converter(ReceiptRuleLambdaAction)
+    _convert_ReceiptRuleS3Action = create_object_converter(ReceiptRuleS3Action)
+    _convert_ReceiptRuleSNSAction = create_object_converter(ReceiptRuleSNSAction)
+    _convert_ReceiptRuleStopAction = create_object_converter(ReceiptRuleStopAction)
+    _convert_ReceiptRuleWorkmailAction = create_object_converter(
+        ReceiptRuleWorkmailAction
+    )
 
+    class ReceiptRuleAction(_PropertyType):
+        """The Action property type for ReceiptRule in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptrule-action.html>`_
+        """
+
+        __slots__ = (
+            "AddHeaderAction",
+            "BounceAction",
+            "LambdaAction",
+            "S3Action",
+            "SNSAction",
+            "StopAction",
+            "WorkmailAction",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AddHeaderAction": _convert_ReceiptRuleAddHeaderAction,
+                "BounceAction": _convert_ReceiptRuleBounceAction,
+                "LambdaAction": _convert_ReceiptRuleLambdaAction,
+                "S3Action": _convert_ReceiptRuleS3Action,
+                "SNSAction": _convert_ReceiptRuleSNSAction,
+                "StopAction": _convert_ReceiptRuleStopAction,
+                "WorkmailAction": _convert_ReceiptRuleWorkmailAction,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AddHeaderAction=None,
+            BounceAction=None,
+            LambdaAction=None,
+            S3Action=None,
+            SNSAction=None,
+            StopAction=None,
+            WorkmailAction=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AddHeaderAction", _convert_ReceiptRuleAddHeaderAction(AddHeaderAction)
+            )
+            _setattr("BounceAction", _convert_ReceiptRuleBounceAction(BounceAction))
+            _setattr("LambdaAction", _convert_ReceiptRuleLambdaAction(LambdaAction))
+            _setattr("S3Action", _convert_ReceiptRuleS3Action(S3Action))
+            _setattr("SNSAction", _convert_ReceiptRuleSNSAction(SNSAction))
+            _setattr("StopAction", _convert_ReceiptRuleStopAction(StopAction))
+            _setattr(
+                "WorkmailAction", _convert_ReceiptRuleWorkmailAction(WorkmailAction)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_ReceiptRuleAction_list = create_object_list_converter(ReceiptRuleAction)
+
+    class ReceiptRuleRule(_PropertyType):
+        """The Rule property type for ReceiptRule in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for Rule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-receiptrule-rule.html>`_
+        """
+
+        __slots__ = (
+            "Actions",
+            "Enabled",
+            "Name",
+            "Recipients",
+            "ScanEnabled",
+            "TlsPolicy",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleRule",
+            _PropertyType,
+            __slots__,
+            converters={"Actions": _convert_ReceiptRuleAction_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Actions=None,
+            Enabled=None,
+            Name=None,
+            Recipients=None,
+            ScanEnabled=None,
+            TlsPolicy=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Actions", _convert_ReceiptRuleAction_list(Actions))
+            _setattr("Enabled", Enabled)
+            _setattr("Name", Name)
+            _setattr("Recipients", Recipients)
+            _setattr("ScanEnabled", ScanEnabled)
+            _setattr("TlsPolicy", TlsPolicy)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ReceiptRuleRule = create_object_converter(ReceiptRuleRule)
+
+    class ReceiptRuleProperties(_ResourceProperties):
+        __slots__ = ("After", "Rule", "RuleSetName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Rule": _convert_ReceiptRuleRule},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, After=None, Rule=None, RuleSetName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("After", After)
+            _setattr("Rule", _convert_ReceiptRuleRule(Rule))
+            _setattr("RuleSetName", RuleSetName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ReceiptRuleProperties = create_object_converter(ReceiptRuleProperties)
+
+    class ReceiptRule(_Resource):
+        """A Receipt Rule for SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReceiptRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-receiptrule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SES::ReceiptRule"
+
+        Properties: ReceiptRuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ReceiptRuleProperties},
+            factories={"Properties": ReceiptRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ReceiptRuleProperties()
+            _setattr("Properties", _convert_ReceiptRuleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ReceiptRule,
+        ReceiptRuleProperties,
+        ReceiptRuleBounceAction,
+        ReceiptRuleS3Action,
+        ReceiptRuleStopAction,
+        ReceiptRuleSNSAction,
+        ReceiptRuleWorkmailAction,
+        ReceiptRuleAddHeaderAction,
+        ReceiptRuleLambdaAction,
+        ReceiptRuleAction,
+        ReceiptRuleRule,
+    )
 
-@attrs(**ATTRSCONFIG)
-class Template(Resource):
-    """A Template for SES.
 
-    See Also:
-        `AWS Cloud Formation documentation for Template
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-template.html>`_
-    """
+def _create_ReceiptRuleSet():
+    class ReceiptRuleSetProperties(_ResourceProperties):
+        __slots__ = ("RuleSetName",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleSetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::SES::Template"
+        def __init__(self, *, RuleSetName=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RuleSetName", RuleSetName)
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: TemplateProperties = attrib(
-        factory=TemplateProperties,
-        converter=create_object_converter(TemplateProperties),
+    _convert_ReceiptRuleSetProperties = create_object_converter(
+        ReceiptRuleSetProperties
     )
+
+    class ReceiptRuleSet(_Resource):
+        """A Receipt Rule Set for SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for ReceiptRuleSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-receiptruleset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SES::ReceiptRuleSet"
+
+        Properties: ReceiptRuleSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ReceiptRuleSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ReceiptRuleSetProperties},
+            factories={"Properties": ReceiptRuleSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ReceiptRuleSetProperties()
+            _setattr("Properties", _convert_ReceiptRuleSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ReceiptRuleSet, ReceiptRuleSetProperties
+
+
+def _create_Template():
+    class TemplateTemplate(_PropertyType):
+        """The Template property type for Template in SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for Template
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ses-template-template.html>`_
+        """
+
+        __slots__ = ("HtmlPart", "SubjectPart", "TemplateName", "TextPart")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TemplateTemplate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            HtmlPart=None,
+            SubjectPart=None,
+            TemplateName=None,
+            TextPart=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HtmlPart", HtmlPart)
+            _setattr("SubjectPart", SubjectPart)
+            _setattr("TemplateName", TemplateName)
+            _setattr("TextPart", TextPart)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TemplateTemplate = create_object_converter(TemplateTemplate)
+
+    class TemplateProperties(_ResourceProperties):
+        __slots__ = ("Template",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TemplateProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Template": _convert_TemplateTemplate},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Template=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Template", _convert_TemplateTemplate(Template))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TemplateProperties = create_object_converter(TemplateProperties)
+
+    class Template(_Resource):
+        """A Template for SES.
+
+        See Also:
+            `AWS Cloud Formation documentation for Template
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ses-template.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SES::Template"
+
+        Properties: TemplateProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Template",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TemplateProperties},
+            factories={"Properties": TemplateProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TemplateProperties()
+            _setattr("Properties", _convert_TemplateProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Template, TemplateProperties, TemplateTemplate
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ConfigurationSet": _create_ConfigurationSet,
+        "ConfigurationSetProperties": _create_ConfigurationSet,
+        "ConfigurationSetEventDestination": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationProperties": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationCloudWatchDestination": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationDimensionConfiguration": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationEventDestination": _create_ConfigurationSetEventDestination,
+        "ConfigurationSetEventDestinationKinesisFirehoseDestination": _create_ConfigurationSetEventDestination,
+        "ReceiptFilter": _create_ReceiptFilter,
+        "ReceiptFilterProperties": _create_ReceiptFilter,
+        "ReceiptFilterFilter": _create_ReceiptFilter,
+        "ReceiptFilterIpFilter": _create_ReceiptFilter,
+        "ReceiptRule": _create_ReceiptRule,
+        "ReceiptRuleProperties": _create_ReceiptRule,
+        "ReceiptRuleAction": _create_ReceiptRule,
+        "ReceiptRuleAddHeaderAction": _create_ReceiptRule,
+        "ReceiptRuleBounceAction": _create_ReceiptRule,
+        "ReceiptRuleLambdaAction": _create_ReceiptRule,
+        "ReceiptRuleRule": _create_ReceiptRule,
+        "ReceiptRuleS3Action": _create_ReceiptRule,
+        "ReceiptRuleSNSAction": _create_ReceiptRule,
+        "ReceiptRuleStopAction": _create_ReceiptRule,
+        "ReceiptRuleWorkmailAction": _create_ReceiptRule,
+        "ReceiptRuleSet": _create_ReceiptRuleSet,
+        "ReceiptRuleSetProperties": _create_ReceiptRuleSet,
+        "Template": _create_Template,
+        "TemplateProperties": _create_Template,
+        "TemplateTemplate": _create_Template,
+    },
+)
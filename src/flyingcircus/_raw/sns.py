@@ -7,96 +7,278 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Subscription",
     "SubscriptionProperties",
     "Topic",
     "TopicProperties",
+    "TopicSubscription",
     "TopicPolicy",
     "TopicPolicyProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class SubscriptionProperties(ResourceProperties):
-    DeliveryPolicy = attrib(default=None)
-    Endpoint = attrib(default=None)
-    FilterPolicy = attrib(default=None)
-    Protocol = attrib(default=None)
-    RawMessageDelivery = attrib(default=None)
-    RedrivePolicy = attrib(default=None)
-    Region = attrib(default=None)
-    TopicArn = attrib(default=None)
+def _create_Subscription():
+    class SubscriptionProperties(_ResourceProperties):
+        __slots__ = (
+            "DeliveryPolicy",
+            "Endpoint",
+            "FilterPolicy",
+            "Protocol",
+            "RawMessageDelivery",
+            "RedrivePolicy",
+            "Region",
+            "TopicArn",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SubscriptionProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DeliveryPolicy=None,
+            Endpoint=None,
+            FilterPolicy=None,
+            Protocol=None,
+            RawMessageDelivery=None,
+            RedrivePolicy=None,
+            Region=None,
+            TopicArn=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DeliveryPolicy", DeliveryPolicy)
+            _setattr("Endpoint", Endpoint)
+            _setattr("FilterPolicy", FilterPolicy)
+            _setattr("Protocol", Protocol)
+            _setattr("RawMessageDelivery", RawMessageDelivery)
+            _setattr("RedrivePolicy", RedrivePolicy)
+            _setattr("Region", Region)
+            _setattr("TopicArn", TopicArn)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SubscriptionProperties = create_object_converter(SubscriptionProperties)
+
+    class Subscription(_Resource):
+        """A Subscription for SNS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Subscription
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sns-subscription.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SNS::Subscription"
+
+        Properties: SubscriptionProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Subscription",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SubscriptionProperties},
+            factories={"Properties": SubscriptionProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SubscriptionProperties()
+            _setattr("Properties", _convert_SubscriptionProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Subscription, SubscriptionProperties
+
+
+def _create_Topic():
+    class TopicSubscription(_PropertyType):
+        """The Subscription property type for Topic in SNS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Subscription
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sns-subscription.html>`_
+        """
+
+        __slots__ = ("Endpoint", "Protocol")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicSubscription", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Endpoint=None, Protocol=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Endpoint", Endpoint)
+            _setattr("Protocol", Protocol)
+            _init_PropertyType(self, kwargs)
+
+    _convert_TopicSubscription_list = create_object_list_converter(TopicSubscription)
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class TopicProperties(_ResourceProperties):
+        __slots__ = (
+            "DisplayName",
+            "KmsMasterKeyId",
+            "Subscription",
+            "Tags",
+            "TopicName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Subscription": _convert_TopicSubscription_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DisplayName=None,
+            KmsMasterKeyId=None,
+            Subscription=None,
+            Tags=None,
+            TopicName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DisplayName", DisplayName)
+            _setattr("KmsMasterKeyId", KmsMasterKeyId)
+            _setattr("Subscription", _convert_TopicSubscription_list(Subscription))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("TopicName", TopicName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_TopicProperties = create_object_converter(TopicProperties)
+
+    class Topic(_Resource):
+        """A Topic for SNS.
 
+        See Also:
+            `AWS Cloud Formation documentation for Topic
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sns-topic.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class Subscription(Resource):
-    """A Subscription for SNS.
+        RESOURCE_TYPE = "AWS::SNS::Topic"
 
-    See Also:
-        `AWS Cloud Formation documentation for Subscription
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-sns-subscription.html>`_
-    """
+        Properties: TopicProperties
 
-    RESOURCE_TYPE = "AWS::SNS::Subscription"
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Topic",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TopicProperties},
+            factories={"Properties": TopicProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: SubscriptionProperties = attrib(
-        factory=SubscriptionProperties,
-        converter=create_object_converter(SubscriptionProperties),
-    )
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TopicProperties()
+            _setattr("Properties", _convert_TopicProperties(Properties))
+            _init_Resource(self, kwargs)
 
+    return Topic, TopicProperties, TopicSubscription
 
-@attrs(**ATTRSCONFIG)
-class TopicProperties(ResourceProperties):
-    DisplayName = attrib(default=None)
-    KmsMasterKeyId = attrib(default=None)
-    Subscription = attrib(default=None)
-    Tags = attrib(default=None)
-    TopicName = attrib(default=None)
 
+def _create_TopicPolicy():
+    class TopicPolicyProperties(_ResourceProperties):
+        __slots__ = ("PolicyDocument", "Topics")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicPolicyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Topic(Resource):
-    """A Topic for SNS.
+        def __init__(self, *, PolicyDocument=None, Topics=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PolicyDocument", PolicyDocument)
+            _setattr("Topics", Topics)
+            _init_ResourceProperties(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Topic
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sns-topic.html>`_
-    """
+    _convert_TopicPolicyProperties = create_object_converter(TopicPolicyProperties)
 
-    RESOURCE_TYPE = "AWS::SNS::Topic"
+    class TopicPolicy(_Resource):
+        """A Topic Policy for SNS.
 
-    Properties: TopicProperties = attrib(
-        factory=TopicProperties, converter=create_object_converter(TopicProperties)
-    )
+        See Also:
+            `AWS Cloud Formation documentation for TopicPolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sns-policy.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::SNS::TopicPolicy"
 
-@attrs(**ATTRSCONFIG)
-class TopicPolicyProperties(ResourceProperties):
-    PolicyDocument = attrib(default=None)
-    Topics = attrib(default=None)
+        Properties: TopicPolicyProperties
 
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "TopicPolicy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_TopicPolicyProperties},
+            factories={"Properties": TopicPolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class TopicPolicy(Resource):
-    """A Topic Policy for SNS.
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = TopicPolicyProperties()
+            _setattr("Properties", _convert_TopicPolicyProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for TopicPolicy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sns-policy.html>`_
-    """
+    return TopicPolicy, TopicPolicyProperties
 
-    RESOURCE_TYPE = "AWS::SNS::TopicPolicy"
 
-    Properties: TopicPolicyProperties = attrib(
-        factory=TopicPolicyProperties,
-        converter=create_object_converter(TopicPolicyProperties),
-    )
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Subscription": _create_Subscription,
+        "SubscriptionProperties": _create_Subscription,
+        "Topic": _create_Topic,
+        "TopicProperties": _create_Topic,
+        "TopicSubscription": _create_Topic,
+        "TopicPolicy": _create_TopicPolicy,
+        "TopicPolicyProperties": _create_TopicPolicy,
+    },
+)
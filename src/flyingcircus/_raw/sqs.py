@@ -7,67 +7,185 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
-
-__all__ = ["Queue", "QueueProperties", "QueuePolicy", "QueuePolicyProperties"]
-
-
-@attrs(**ATTRSCONFIG)
-class QueueProperties(ResourceProperties):
-    ContentBasedDeduplication = attrib(default=None)
-    DelaySeconds = attrib(default=None)
-    FifoQueue = attrib(default=None)
-    KmsDataKeyReusePeriodSeconds = attrib(default=None)
-    KmsMasterKeyId = attrib(default=None)
-    MaximumMessageSize = attrib(default=None)
-    MessageRetentionPeriod = attrib(default=None)
-    QueueName = attrib(default=None)
-    ReceiveMessageWaitTimeSeconds = attrib(default=None)
-    RedrivePolicy = attrib(default=None)
-    Tags = attrib(default=None)
-    VisibilityTimeout = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Queue(Resource):
-    """A Queue for SQS.
-
-    See Also:
-        `AWS Cloud Formation documentation for Queue
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sqs-queues.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SQS::Queue"
-
-    Properties: QueueProperties = attrib(
-        factory=QueueProperties, converter=create_object_converter(QueueProperties)
-    )
-
-
-@attrs(**ATTRSCONFIG)
-class QueuePolicyProperties(ResourceProperties):
-    PolicyDocument = attrib(default=None)
-    Queues = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class QueuePolicy(Resource):
-    """A Queue Policy for SQS.
-
-    See Also:
-        `AWS Cloud Formation documentation for QueuePolicy
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sqs-policy.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SQS::QueuePolicy"
-
-    Properties: QueuePolicyProperties = attrib(
-        factory=QueuePolicyProperties,
-        converter=create_object_converter(QueuePolicyProperties),
-    )
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
+
+__all__ = [
+    "Queue",
+    "QueueProperties",
+    "QueuePolicy",
+    "QueuePolicyProperties",
+]
+
+
+def _create_Queue():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class QueueProperties(_ResourceProperties):
+        __slots__ = (
+            "ContentBasedDeduplication",
+            "DelaySeconds",
+            "FifoQueue",
+            "KmsDataKeyReusePeriodSeconds",
+            "KmsMasterKeyId",
+            "MaximumMessageSize",
+            "MessageRetentionPeriod",
+            "QueueName",
+            "ReceiveMessageWaitTimeSeconds",
+            "RedrivePolicy",
+            "Tags",
+            "VisibilityTimeout",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "QueueProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ContentBasedDeduplication=None,
+            DelaySeconds=None,
+            FifoQueue=None,
+            KmsDataKeyReusePeriodSeconds=None,
+            KmsMasterKeyId=None,
+            MaximumMessageSize=None,
+            MessageRetentionPeriod=None,
+            QueueName=None,
+            ReceiveMessageWaitTimeSeconds=None,
+            RedrivePolicy=None,
+            Tags=None,
+            VisibilityTimeout=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ContentBasedDeduplication", ContentBasedDeduplication)
+            _setattr("DelaySeconds", DelaySeconds)
+            _setattr("FifoQueue", FifoQueue)
+            _setattr("KmsDataKeyReusePeriodSeconds", KmsDataKeyReusePeriodSeconds)
+            _setattr("KmsMasterKeyId", KmsMasterKeyId)
+            _setattr("MaximumMessageSize", MaximumMessageSize)
+            _setattr("MessageRetentionPeriod", MessageRetentionPeriod)
+            _setattr("QueueName", QueueName)
+            _setattr("ReceiveMessageWaitTimeSeconds", ReceiveMessageWaitTimeSeconds)
+            _setattr("RedrivePolicy", RedrivePolicy)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("VisibilityTimeout", VisibilityTimeout)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_QueueProperties = create_object_converter(QueueProperties)
+
+    class Queue(_Resource):
+        """A Queue for SQS.
+
+        See Also:
+            `AWS Cloud Formation documentation for Queue
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sqs-queues.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SQS::Queue"
+
+        Properties: QueueProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Queue",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_QueueProperties},
+            factories={"Properties": QueueProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = QueueProperties()
+            _setattr("Properties", _convert_QueueProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Queue, QueueProperties
+
+
+def _create_QueuePolicy():
+    class QueuePolicyProperties(_ResourceProperties):
+        __slots__ = ("PolicyDocument", "Queues")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "QueuePolicyProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, PolicyDocument=None, Queues=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PolicyDocument", PolicyDocument)
+            _setattr("Queues", Queues)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_QueuePolicyProperties = create_object_converter(QueuePolicyProperties)
+
+    class QueuePolicy(_Resource):
+        """A Queue Policy for SQS.
+
+        See Also:
+            `AWS Cloud Formation documentation for QueuePolicy
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-sqs-policy.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SQS::QueuePolicy"
+
+        Properties: QueuePolicyProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "QueuePolicy",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_QueuePolicyProperties},
+            factories={"Properties": QueuePolicyProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = QueuePolicyProperties()
+            _setattr("Properties", _convert_QueuePolicyProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return QueuePolicy, QueuePolicyProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Queue": _create_Queue,
+        "QueueProperties": _create_Queue,
+        "QueuePolicy": _create_QueuePolicy,
+        "QueuePolicyProperties": _create_QueuePolicy,
+    },
+)
@@ -7,265 +7,1424 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+from ..core import create_object_map_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "Association",
     "AssociationProperties",
+    "AssociationInstanceAssociationOutputLocation",
+    "AssociationParameterValues",
+    "AssociationS3OutputLocation",
+    "AssociationTarget",
     "Document",
     "DocumentProperties",
     "MaintenanceWindow",
     "MaintenanceWindowProperties",
     "MaintenanceWindowTarget",
     "MaintenanceWindowTargetProperties",
+    "MaintenanceWindowTargetTargets",
     "MaintenanceWindowTask",
     "MaintenanceWindowTaskProperties",
+    "MaintenanceWindowTaskLoggingInfo",
+    "MaintenanceWindowTaskMaintenanceWindowAutomationParameters",
+    "MaintenanceWindowTaskMaintenanceWindowLambdaParameters",
+    "MaintenanceWindowTaskMaintenanceWindowRunCommandParameters",
+    "MaintenanceWindowTaskMaintenanceWindowStepFunctionsParameters",
+    "MaintenanceWindowTaskNotificationConfig",
+    "MaintenanceWindowTaskTarget",
+    "MaintenanceWindowTaskTaskInvocationParameters",
     "Parameter",
     "ParameterProperties",
     "PatchBaseline",
     "PatchBaselineProperties",
+    "PatchBaselinePatchFilter",
+    "PatchBaselinePatchFilterGroup",
+    "PatchBaselinePatchSource",
+    "PatchBaselineRule",
+    "PatchBaselineRuleGroup",
     "ResourceDataSync",
     "ResourceDataSyncProperties",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class AssociationProperties(ResourceProperties):
-    AssociationName = attrib(default=None)
-    DocumentVersion = attrib(default=None)
-    InstanceId = attrib(default=None)
-    Name = attrib(default=None)
-    OutputLocation = attrib(default=None)
-    Parameters = attrib(default=None)
-    ScheduleExpression = attrib(default=None)
-    Targets = attrib(default=None)
+def _create_Association():
+    class AssociationS3OutputLocation(_PropertyType):
+        """The S3 Output Location property type for Association in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for S3OutputLocation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-association-s3outputlocation.html>`_
+        """
+
+        __slots__ = ("OutputS3BucketName", "OutputS3KeyPrefix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AssociationS3OutputLocation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, OutputS3BucketName=None, OutputS3KeyPrefix=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("OutputS3BucketName", OutputS3BucketName)
+            _setattr("OutputS3KeyPrefix", OutputS3KeyPrefix)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AssociationS3OutputLocation = create_object_converter(
+        AssociationS3OutputLocation
+    )
+
+    class AssociationInstanceAssociationOutputLocation(_PropertyType):
+        """The Instance Association Output Location property type for Association in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for InstanceAssociationOutputLocation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-association-instanceassociationoutputlocation.html>`_
+        """
+
+        __slots__ = ("S3Location",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AssociationInstanceAssociationOutputLocation",
+            _PropertyType,
+            __slots__,
+            converters={"S3Location": _convert_AssociationS3OutputLocation},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, S3Location=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("S3Location", _convert_AssociationS3OutputLocation(S3Location))
+            _init_PropertyType(self, kwargs)
+
+    class AssociationParameterValues(_PropertyType):
+        """The Parameter Values property type for Association in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for ParameterValues
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-association-parametervalues.html>`_
+        """
+
+        __slots__ = ("ParameterValues",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AssociationParameterValues", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ParameterValues=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ParameterValues", ParameterValues)
+            _init_PropertyType(self, kwargs)
+
+    class AssociationTarget(_PropertyType):
+        """The Target property type for Association in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Target
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-association-target.html>`_
+        """
+
+        __slots__ = ("Key", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AssociationTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_AssociationInstanceAssociationOutputLocation = create_object_converter(
+        AssociationInstanceAssociationOutputLocation
+    )
+    _convert_AssociationParameterValues_map = create_object_map_converter(
+        AssociationParameterValues
+    )
+    _convert_AssociationTarget_list = create_object_list_converter(AssociationTarget)
+
+    class AssociationProperties(_ResourceProperties):
+        __slots__ = (
+            "AssociationName",
+            "DocumentVersion",
+            "InstanceId",
+            "Name",
+            "OutputLocation",
+            "Parameters",
+            "ScheduleExpression",
+            "Targets",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "AssociationProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "OutputLocation": _convert_AssociationInstanceAssociationOutputLocation,
+                "Parameters": _convert_AssociationParameterValues_map,
+                "Targets": _convert_AssociationTarget_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AssociationName=None,
+            DocumentVersion=None,
+            InstanceId=None,
+            Name=None,
+            OutputLocation=None,
+            Parameters=None,
+            ScheduleExpression=None,
+            Targets=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AssociationName", AssociationName)
+            _setattr("DocumentVersion", DocumentVersion)
+            _setattr("InstanceId", InstanceId)
+            _setattr("Name", Name)
+            _setattr(
+                "OutputLocation",
+                _convert_AssociationInstanceAssociationOutputLocation(OutputLocation),
+            )
+            _setattr("Parameters", _convert_AssociationParameterValues_map(Parameters))
+            _setattr("ScheduleExpression", ScheduleExpression)
+            _setattr("Targets", _convert_AssociationTarget_list(Targets))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_AssociationProperties = create_object_converter(AssociationProperties)
+
+    class Association(_Resource):
+        """A Association for SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Association
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-association.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SSM::Association"
+
+        Properties: AssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Association",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_AssociationProperties},
+            factories={"Properties": AssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = AssociationProperties()
+            _setattr("Properties", _convert_AssociationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Association,
+        AssociationProperties,
+        AssociationS3OutputLocation,
+        AssociationInstanceAssociationOutputLocation,
+        AssociationParameterValues,
+        AssociationTarget,
+    )
+
+
+def _create_Document():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class DocumentProperties(_ResourceProperties):
+        __slots__ = ("Content", "DocumentType", "Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "DocumentProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Content=None, DocumentType=None, Name=None, Tags=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Content", Content)
+            _setattr("DocumentType", DocumentType)
+            _setattr("Name", Name)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_DocumentProperties = create_object_converter(DocumentProperties)
+
+    class Document(_Resource):
+        """A Document for SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Document
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-document.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SSM::Document"
+
+        Properties: DocumentProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Document",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_DocumentProperties},
+            factories={"Properties": DocumentProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = DocumentProperties()
+            _setattr("Properties", _convert_DocumentProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Document, DocumentProperties
+
+
+def _create_MaintenanceWindow():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class MaintenanceWindowProperties(_ResourceProperties):
+        __slots__ = (
+            "AllowUnassociatedTargets",
+            "Cutoff",
+            "Description",
+            "Duration",
+            "EndDate",
+            "Name",
+            "Schedule",
+            "ScheduleTimezone",
+            "StartDate",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowUnassociatedTargets=None,
+            Cutoff=None,
+            Description=None,
+            Duration=None,
+            EndDate=None,
+            Name=None,
+            Schedule=None,
+            ScheduleTimezone=None,
+            StartDate=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowUnassociatedTargets", AllowUnassociatedTargets)
+            _setattr("Cutoff", Cutoff)
+            _setattr("Description", Description)
+            _setattr("Duration", Duration)
+            _setattr("EndDate", EndDate)
+            _setattr("Name", Name)
+            _setattr("Schedule", Schedule)
+            _setattr("ScheduleTimezone", ScheduleTimezone)
+            _setattr("StartDate", StartDate)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MaintenanceWindowProperties = create_object_converter(
+        MaintenanceWindowProperties
+    )
+
+    class MaintenanceWindow(_Resource):
+        """A Maintenance Window for SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for MaintenanceWindow
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-maintenancewindow.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SSM::MaintenanceWindow"
+
+        Properties: MaintenanceWindowProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindow",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MaintenanceWindowProperties},
+            factories={"Properties": MaintenanceWindowProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MaintenanceWindowProperties()
+            _setattr("Properties", _convert_MaintenanceWindowProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return MaintenanceWindow, MaintenanceWindowProperties
+
+
+def _create_MaintenanceWindowTarget():
+    class MaintenanceWindowTargetTargets(_PropertyType):
+        """The Targets property type for MaintenanceWindowTarget in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Targets
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-maintenancewindowtarget-targets.html>`_
+        """
+
+        __slots__ = ("Key", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTargetTargets", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MaintenanceWindowTargetTargets_list = create_object_list_converter(
+        MaintenanceWindowTargetTargets
+    )
+
+    class MaintenanceWindowTargetProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "Name",
+            "OwnerInformation",
+            "ResourceType",
+            "Targets",
+            "WindowId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTargetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Targets": _convert_MaintenanceWindowTargetTargets_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Name=None,
+            OwnerInformation=None,
+            ResourceType=None,
+            Targets=None,
+            WindowId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("OwnerInformation", OwnerInformation)
+            _setattr("ResourceType", ResourceType)
+            _setattr("Targets", _convert_MaintenanceWindowTargetTargets_list(Targets))
+            _setattr("WindowId", WindowId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_MaintenanceWindowTargetProperties = create_object_converter(
+        MaintenanceWindowTargetProperties
+    )
+
+    class MaintenanceWindowTarget(_Resource):
+        """A Maintenance Window Target for SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for MaintenanceWindowTarget
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-maintenancewindowtarget.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SSM::MaintenanceWindowTarget"
+
+        Properties: MaintenanceWindowTargetProperties
 
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTarget",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MaintenanceWindowTargetProperties},
+            factories={"Properties": MaintenanceWindowTargetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Association(Resource):
-    """A Association for SSM.
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MaintenanceWindowTargetProperties()
+            _setattr(
+                "Properties", _convert_MaintenanceWindowTargetProperties(Properties)
+            )
+            _init_Resource(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Association
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-association.html>`_
-    """
+    return (
+        MaintenanceWindowTarget,
+        MaintenanceWindowTargetProperties,
+        MaintenanceWindowTargetTargets,
+    )
+
+
+def _create_MaintenanceWindowTask():
+    class MaintenanceWindowTaskLoggingInfo(_PropertyType):
+        """The Logging Info property type for MaintenanceWindowTask in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoggingInfo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-maintenancewindowtask-logginginfo.html>`_
+        """
+
+        __slots__ = ("Region", "S3Bucket", "S3Prefix")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTaskLoggingInfo", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Region=None, S3Bucket=None, S3Prefix=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Region", Region)
+            _setattr("S3Bucket", S3Bucket)
+            _setattr("S3Prefix", S3Prefix)
+            _init_PropertyType(self, kwargs)
+
+    class MaintenanceWindowTaskMaintenanceWindowAutomationParameters(_PropertyType):
+        """The Maintenance Window Automation Parameters property type for MaintenanceWindowTask in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for MaintenanceWindowAutomationParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-maintenancewindowtask-maintenancewindowautomationparameters.html>`_
+        """
+
+        __slots__ = ("DocumentVersion", "Parameters")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTaskMaintenanceWindowAutomationParameters",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::SSM::Association"
+        def __init__(self, *, DocumentVersion=None, Parameters=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DocumentVersion", DocumentVersion)
+            _setattr("Parameters", Parameters)
+            _init_PropertyType(self, kwargs)
 
-    Properties: AssociationProperties = attrib(
-        factory=AssociationProperties,
-        converter=create_object_converter(AssociationProperties),
+    class MaintenanceWindowTaskMaintenanceWindowLambdaParameters(_PropertyType):
+        """The Maintenance Window Lambda Parameters property type for MaintenanceWindowTask in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for MaintenanceWindowLambdaParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-maintenancewindowtask-maintenancewindowlambdaparameters.html>`_
+        """
+
+        __slots__ = ("ClientContext", "Payload", "Qualifier")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTaskMaintenanceWindowLambdaParameters",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ClientContext=None, Payload=None, Qualifier=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ClientContext", ClientContext)
+            _setattr("Payload", Payload)
+            _setattr("Qualifier", Qualifier)
+            _init_PropertyType(self, kwargs)
+
+    class MaintenanceWindowTaskNotificationConfig(_PropertyType):
+        """The Notification Config property type for MaintenanceWindowTask in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotificationConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-maintenancewindowtask-notificationconfig.html>`_
+        """
+
+        __slots__ = ("NotificationArn", "NotificationEvents", "NotificationType")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTaskNotificationConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            NotificationArn=None,
+            NotificationEvents=None,
+            NotificationType=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("NotificationArn", NotificationArn)
+            _setattr("NotificationEvents", NotificationEvents)
+            _setattr("NotificationType", NotificationType)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MaintenanceWindowTaskNotificationConfig = create_object_converter(
+        MaintenanceWindowTaskNotificationConfig
     )
 
+    class MaintenanceWindowTaskMaintenanceWindowRunCommandParameters(_PropertyType):
+        """The Maintenance Window Run Command Parameters property type for MaintenanceWindowTask in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for MaintenanceWindowRunCommandParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-maintenancewindowtask-maintenancewindowruncommandparameters.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class DocumentProperties(ResourceProperties):
-    Content = attrib(default=None)
-    DocumentType = attrib(default=None)
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
+        __slots__ = (
+            "Comment",
+            "DocumentHash",
+            "DocumentHashType",
+            "NotificationConfig",
+            "OutputS3BucketName",
+            "OutputS3KeyPrefix",
+            "Parameters",
+            "ServiceRoleArn",
+            "TimeoutSeconds",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTaskMaintenanceWindowRunCommandParameters",
+            _PropertyType,
+            __slots__,
+            converters={
+                "NotificationConfig": _convert_MaintenanceWindowTaskNotificationConfig
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            Comment=None,
+            DocumentHash=None,
+            DocumentHashType=None,
+            NotificationConfig=None,
+            OutputS3BucketName=None,
+            OutputS3KeyPrefix=None,
+            Parameters=None,
+            ServiceRoleArn=None,
+            TimeoutSeconds=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Comment", Comment)
+            _setattr("DocumentHash", DocumentHash)
+            _setattr("DocumentHashType", DocumentHashType)
+            _setattr(
+                "NotificationConfig",
+                _convert_MaintenanceWindowTaskNotificationConfig(NotificationConfig),
+            )
+            _setattr("OutputS3BucketName", OutputS3BucketName)
+            _setattr("OutputS3KeyPrefix", OutputS3KeyPrefix)
+            _setattr("Parameters", Parameters)
+            _setattr("ServiceRoleArn", ServiceRoleArn)
+            _setattr("TimeoutSeconds", TimeoutSeconds)
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class Document(Resource):
-    """A Document for SSM.
+    class MaintenanceWindowTaskMaintenanceWindowStepFunctionsParameters(_PropertyType):
+        """The Maintenance Window Step Functions Parameters property type for MaintenanceWindowTask in SSM.
 
-    See Also:
-        `AWS Cloud Formation documentation for Document
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-document.html>`_
-    """
+        See Also:
+            `AWS Cloud Formation documentation for MaintenanceWindowStepFunctionsParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-maintenancewindowtask-maintenancewindowstepfunctionsparameters.html>`_
+        """
 
-    RESOURCE_TYPE = "AWS::SSM::Document"
+        __slots__ = ("Input", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTaskMaintenanceWindowStepFunctionsParameters",
+            _PropertyType,
+            __slots__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: DocumentProperties = attrib(
-        factory=DocumentProperties,
-        converter=create_object_converter(DocumentProperties),
+        def __init__(self, *, Input=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Input", Input)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class MaintenanceWindowTaskTarget(_PropertyType):
+        """The Target property type for MaintenanceWindowTask in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Target
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-maintenancewindowtask-target.html>`_
+        """
+
+        __slots__ = ("Key", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTaskTarget", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_MaintenanceWindowTaskMaintenanceWindowAutomationParameters = (
+        create_object_converter(
+            MaintenanceWindowTaskMaintenanceWindowAutomationParameters
+        )
     )
+    _convert_MaintenanceWindowTaskMaintenanceWindowLambdaParameters = (
+        create_object_converter(MaintenanceWindowTaskMaintenanceWindowLambdaParameters)
+    )
+    _convert_MaintenanceWindowTaskMaintenanceWindowRunCommandParameters = (
+        create_object_converter(
+            MaintenanceWindowTaskMaintenanceWindowRunCommandParameters
+        )
+    )
+    _convert_MaintenanceWindowTaskMaintenanceWindowStepFunctionsParameters = (
+        create_object_converter(
+            MaintenanceWindowTaskMaintenanceWindowStepFunctionsParameters
+        )
+    )
+
+    class MaintenanceWindowTaskTaskInvocationParameters(_PropertyType):
+        """The Task Invocation Parameters property type for MaintenanceWindowTask in SSM.
 
+        See Also:
+            `AWS Cloud Formation documentation for TaskInvocationParameters
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-maintenancewindowtask-taskinvocationparameters.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class MaintenanceWindowProperties(ResourceProperties):
-    AllowUnassociatedTargets = attrib(default=None)
-    Cutoff = attrib(default=None)
-    Description = attrib(default=None)
-    Duration = attrib(default=None)
-    EndDate = attrib(default=None)
-    Name = attrib(default=None)
-    Schedule = attrib(default=None)
-    ScheduleTimezone = attrib(default=None)
-    StartDate = attrib(default=None)
-    Tags = attrib(default=None)
+        __slots__ = (
+            "MaintenanceWindowAutomationParameters",
+            "MaintenanceWindowLambdaParameters",
+            "MaintenanceWindowRunCommandParameters",
+            "MaintenanceWindowStepFunctionsParameters",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTaskTaskInvocationParameters",
+            _PropertyType,
+            __slots__,
+            converters={
+                "MaintenanceWindowAutomationParameters": _convert_MaintenanceWindowTaskMaintenanceWindowAutomationParameters,
+                "MaintenanceWindowLambdaParameters": _convert_MaintenanceWindowTaskMaintenanceWindowLambdaParameters,
+                "MaintenanceWindowRunCommandParameters": _convert_MaintenanceWindowTaskMaintenanceWindowRunCommandParameters,
+                "MaintenanceWindowStepFunctionsParameters": _convert_MaintenanceWindowTaskMaintenanceWindowStepFunctionsParameters,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
+        def __init__(
+            self,
+            *,
+            MaintenanceWindowAutomationParameters=None,
+            MaintenanceWindowLambdaParameters=None,
+            MaintenanceWindowRunCommandParameters=None,
+            MaintenanceWindowStepFunctionsParameters=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "MaintenanceWindowAutomationParameters",
+                _convert_MaintenanceWindowTaskMaintenanceWindowAutomationParameters(
+                    MaintenanceWindowAutomationParameters
+                ),
+            )
+            _setattr(
+                "MaintenanceWindowLambdaParameters",
+                _convert_MaintenanceWindowTaskMaintenanceWindowLambdaParameters(
+                    MaintenanceWindowLambdaParameters
+                ),
+            )
+            _setattr(
+                "MaintenanceWindowRunCommandParameters",
+                _convert_MaintenanceWindowTaskMaintenanceWindowRunCommandParameters(
+                    MaintenanceWindowRunCommandParameters
+                ),
+            )
+            _setattr(
+                "MaintenanceWindowStepFunctionsParameters",
+                _convert_MaintenanceWindowTaskMaintenanceWindowStepFunctionsParameters(
+                    MaintenanceWindowStepFunctionsParameters
+                ),
+            )
+            _init_PropertyType(self, kwargs)
 
-@attrs(**ATTRSCONFIG)
-class MaintenanceWindow(Resource):
-    """A Maintenance Window for SSM.
+    _convert_MaintenanceWindowTaskLoggingInfo = create_object_converter(
+        MaintenanceWindowTaskLoggingInfo
+    )
+    _convert_MaintenanceWindowTaskTarget_list = create_object_list_converter(
+        MaintenanceWindowTaskTarget
+    )
+    _convert_MaintenanceWindowTaskTaskInvocationParameters = create_object_converter(
+        MaintenanceWindowTaskTaskInvocationParameters
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for MaintenanceWindow
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-maintenancewindow.html>`_
-    """
+    class MaintenanceWindowTaskProperties(_ResourceProperties):
+        __slots__ = (
+            "Description",
+            "LoggingInfo",
+            "MaxConcurrency",
+            "MaxErrors",
+            "Name",
+            "Priority",
+            "ServiceRoleArn",
+            "Targets",
+            "TaskArn",
+            "TaskInvocationParameters",
+            "TaskParameters",
+            "TaskType",
+            "WindowId",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTaskProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LoggingInfo": _convert_MaintenanceWindowTaskLoggingInfo,
+                "Targets": _convert_MaintenanceWindowTaskTarget_list,
+                "TaskInvocationParameters": _convert_MaintenanceWindowTaskTaskInvocationParameters,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::SSM::MaintenanceWindow"
+        def __init__(
+            self,
+            *,
+            Description=None,
+            LoggingInfo=None,
+            MaxConcurrency=None,
+            MaxErrors=None,
+            Name=None,
+            Priority=None,
+            ServiceRoleArn=None,
+            Targets=None,
+            TaskArn=None,
+            TaskInvocationParameters=None,
+            TaskParameters=None,
+            TaskType=None,
+            WindowId=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr(
+                "LoggingInfo", _convert_MaintenanceWindowTaskLoggingInfo(LoggingInfo)
+            )
+            _setattr("MaxConcurrency", MaxConcurrency)
+            _setattr("MaxErrors", MaxErrors)
+            _setattr("Name", Name)
+            _setattr("Priority", Priority)
+            _setattr("ServiceRoleArn", ServiceRoleArn)
+            _setattr("Targets", _convert_MaintenanceWindowTaskTarget_list(Targets))
+            _setattr("TaskArn", TaskArn)
+            _setattr(
+                "TaskInvocationParameters",
+                _convert_MaintenanceWindowTaskTaskInvocationParameters(
+                    TaskInvocationParameters
+                ),
+            )
+            _setattr("TaskParameters", TaskParameters)
+            _setattr("TaskType", TaskType)
+            _setattr("WindowId", WindowId)
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: MaintenanceWindowProperties = attrib(
-        factory=MaintenanceWindowProperties,
-        converter=create_object_converter(MaintenanceWindowProperties),
+    _convert_MaintenanceWindowTaskProperties = create_object_converter(
+        MaintenanceWindowTaskProperties
     )
 
+    class MaintenanceWindowTask(_Resource):
+        """A Maintenance Window Task for SSM.
 
-@attrs(**ATTRSCONFIG)
-class MaintenanceWindowTargetProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    OwnerInformation = attrib(default=None)
-    ResourceType = attrib(default=None)
-    Targets = attrib(default=None)
-    WindowId = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for MaintenanceWindowTask
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-maintenancewindowtask.html>`_
+        """
 
+        RESOURCE_TYPE = "AWS::SSM::MaintenanceWindowTask"
 
-@attrs(**ATTRSCONFIG)
-class MaintenanceWindowTarget(Resource):
-    """A Maintenance Window Target for SSM.
+        Properties: MaintenanceWindowTaskProperties
 
-    See Also:
-        `AWS Cloud Formation documentation for MaintenanceWindowTarget
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-maintenancewindowtarget.html>`_
-    """
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "MaintenanceWindowTask",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_MaintenanceWindowTaskProperties},
+            factories={"Properties": MaintenanceWindowTaskProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::SSM::MaintenanceWindowTarget"
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = MaintenanceWindowTaskProperties()
+            _setattr("Properties", _convert_MaintenanceWindowTaskProperties(Properties))
+            _init_Resource(self, kwargs)
 
-    Properties: MaintenanceWindowTargetProperties = attrib(
-        factory=MaintenanceWindowTargetProperties,
-        converter=create_object_converter(MaintenanceWindowTargetProperties),
+    return (
+        MaintenanceWindowTask,
+        MaintenanceWindowTaskProperties,
+        MaintenanceWindowTaskLoggingInfo,
+        MaintenanceWindowTaskMaintenanceWindowAutomationParameters,
+        MaintenanceWindowTaskMaintenanceWindowLambdaParameters,
+        MaintenanceWindowTaskNotificationConfig,
+        MaintenanceWindowTaskMaintenanceWindowRunCommandParameters,
+        MaintenanceWindowTaskMaintenanceWindowStepFunctionsParameters,
+        MaintenanceWindowTaskTarget,
+        MaintenanceWindowTaskTaskInvocationParameters,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class MaintenanceWindowTaskProperties(ResourceProperties):
-    Description = attrib(default=None)
-    LoggingInfo = attrib(default=None)
-    MaxConcurrency = attrib(default=None)
-    MaxErrors = attrib(default=None)
-    Name = attrib(default=None)
-    Priority = attrib(default=None)
-    ServiceRoleArn = attrib(default=None)
-    Targets = attrib(default=None)
-    TaskArn = attrib(default=None)
-    TaskInvocationParameters = attrib(default=None)
-    TaskParameters = attrib(default=None)
-    TaskType = attrib(default=None)
-    WindowId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class MaintenanceWindowTask(Resource):
-    """A Maintenance Window Task for SSM.
-
-    See Also:
-        `AWS Cloud Formation documentation for MaintenanceWindowTask
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-maintenancewindowtask.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SSM::MaintenanceWindowTask"
-
-    Properties: MaintenanceWindowTaskProperties = attrib(
-        factory=MaintenanceWindowTaskProperties,
-        converter=create_object_converter(MaintenanceWindowTaskProperties),
+def _create_Parameter():
+    class ParameterProperties(_ResourceProperties):
+        __slots__ = (
+            "AllowedPattern",
+            "Description",
+            "Name",
+            "Policies",
+            "Tags",
+            "Tier",
+            "Type",
+            "Value",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ParameterProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllowedPattern=None,
+            Description=None,
+            Name=None,
+            Policies=None,
+            Tags=None,
+            Tier=None,
+            Type=None,
+            Value=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AllowedPattern", AllowedPattern)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Policies", Policies)
+            _setattr("Tags", Tags)
+            _setattr("Tier", Tier)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ParameterProperties = create_object_converter(ParameterProperties)
+
+    class Parameter(_Resource):
+        """A Parameter for SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Parameter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-parameter.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SSM::Parameter"
+        TAG_FORMAT = "Map"
+
+        Properties: ParameterProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Parameter",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ParameterProperties},
+            factories={"Properties": ParameterProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ParameterProperties()
+            _setattr("Properties", _convert_ParameterProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Parameter, ParameterProperties
+
+
+def _create_PatchBaseline():
+    class PatchBaselinePatchFilter(_PropertyType):
+        """The Patch Filter property type for PatchBaseline in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for PatchFilter
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-patchbaseline-patchfilter.html>`_
+        """
+
+        __slots__ = ("Key", "Values")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PatchBaselinePatchFilter", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Key=None, Values=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Values", Values)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PatchBaselinePatchFilter_list = create_object_list_converter(
+        PatchBaselinePatchFilter
     )
 
+    class PatchBaselinePatchFilterGroup(_PropertyType):
+        """The Patch Filter Group property type for PatchBaseline in SSM.
 
-@attrs(**ATTRSCONFIG)
-class ParameterProperties(ResourceProperties):
-    AllowedPattern = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    Policies = attrib(default=None)
-    Tags = attrib(default=None)
-    Tier = attrib(default=None)
-    Type = attrib(default=None)
-    Value = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for PatchFilterGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-patchbaseline-patchfiltergroup.html>`_
+        """
 
+        __slots__ = ("PatchFilters",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PatchBaselinePatchFilterGroup",
+            _PropertyType,
+            __slots__,
+            converters={"PatchFilters": _convert_PatchBaselinePatchFilter_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class Parameter(Resource):
-    """A Parameter for SSM.
+        def __init__(self, *, PatchFilters=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "PatchFilters", _convert_PatchBaselinePatchFilter_list(PatchFilters)
+            )
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for Parameter
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-parameter.html>`_
-    """
+    class PatchBaselinePatchSource(_PropertyType):
+        """The Patch Source property type for PatchBaseline in SSM.
 
-    RESOURCE_TYPE = "AWS::SSM::Parameter"
+        See Also:
+            `AWS Cloud Formation documentation for PatchSource
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-patchbaseline-patchsource.html>`_
+        """
 
-    Properties: ParameterProperties = attrib(
-        factory=ParameterProperties,
-        converter=create_object_converter(ParameterProperties),
+        __slots__ = ("Configuration", "Name", "Products")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PatchBaselinePatchSource", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Configuration=None, Name=None, Products=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Configuration", Configuration)
+            _setattr("Name", Name)
+            _setattr("Products", Products)
+            _init_PropertyType(self, kwargs)
+
+    _convert_PatchBaselinePatchFilterGroup = create_object_converter(
+        PatchBaselinePatchFilterGroup
     )
 
+    class PatchBaselineRule(_PropertyType):
+        """The Rule property type for PatchBaseline in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for Rule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-patchbaseline-rule.html>`_
+        """
+
+        __slots__ = (
+            "ApproveAfterDays",
+            "ComplianceLevel",
+            "EnableNonSecurity",
+            "PatchFilterGroup",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PatchBaselineRule",
+            _PropertyType,
+            __slots__,
+            converters={"PatchFilterGroup": _convert_PatchBaselinePatchFilterGroup},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApproveAfterDays=None,
+            ComplianceLevel=None,
+            EnableNonSecurity=None,
+            PatchFilterGroup=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApproveAfterDays", ApproveAfterDays)
+            _setattr("ComplianceLevel", ComplianceLevel)
+            _setattr("EnableNonSecurity", EnableNonSecurity)
+            _setattr(
+                "PatchFilterGroup",
+                _convert_PatchBaselinePatchFilterGroup(PatchFilterGroup),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_PatchBaselineRule_list = create_object_list_converter(PatchBaselineRule)
+
+    class PatchBaselineRuleGroup(_PropertyType):
+        """The Rule Group property type for PatchBaseline in SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for RuleGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-ssm-patchbaseline-rulegroup.html>`_
+        """
+
+        __slots__ = ("PatchRules",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PatchBaselineRuleGroup",
+            _PropertyType,
+            __slots__,
+            converters={"PatchRules": _convert_PatchBaselineRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class PatchBaselineProperties(ResourceProperties):
-    ApprovalRules = attrib(default=None)
-    ApprovedPatches = attrib(default=None)
-    ApprovedPatchesComplianceLevel = attrib(default=None)
-    ApprovedPatchesEnableNonSecurity = attrib(default=None)
-    Description = attrib(default=None)
-    GlobalFilters = attrib(default=None)
-    Name = attrib(default=None)
-    OperatingSystem = attrib(default=None)
-    PatchGroups = attrib(default=None)
-    RejectedPatches = attrib(default=None)
-    RejectedPatchesAction = attrib(default=None)
-    Sources = attrib(default=None)
-    Tags = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class PatchBaseline(Resource):
-    """A Patch Baseline for SSM.
-
-    See Also:
-        `AWS Cloud Formation documentation for PatchBaseline
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-patchbaseline.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::SSM::PatchBaseline"
-
-    Properties: PatchBaselineProperties = attrib(
-        factory=PatchBaselineProperties,
-        converter=create_object_converter(PatchBaselineProperties),
+        def __init__(self, *, PatchRules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("PatchRules", _convert_PatchBaselineRule_list(PatchRules))
+            _init_PropertyType(self, kwargs)
+
+    _convert_PatchBaselineRuleGroup = create_object_converter(PatchBaselineRuleGroup)
+    _convert_PatchBaselinePatchSource_list = create_object_list_converter(
+        PatchBaselinePatchSource
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class PatchBaselineProperties(_ResourceProperties):
+        __slots__ = (
+            "ApprovalRules",
+            "ApprovedPatches",
+            "ApprovedPatchesComplianceLevel",
+            "ApprovedPatchesEnableNonSecurity",
+            "Description",
+            "GlobalFilters",
+            "Name",
+            "OperatingSystem",
+            "PatchGroups",
+            "RejectedPatches",
+            "RejectedPatchesAction",
+            "Sources",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PatchBaselineProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "ApprovalRules": _convert_PatchBaselineRuleGroup,
+                "GlobalFilters": _convert_PatchBaselinePatchFilterGroup,
+                "Sources": _convert_PatchBaselinePatchSource_list,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ApprovalRules=None,
+            ApprovedPatches=None,
+            ApprovedPatchesComplianceLevel=None,
+            ApprovedPatchesEnableNonSecurity=None,
+            Description=None,
+            GlobalFilters=None,
+            Name=None,
+            OperatingSystem=None,
+            PatchGroups=None,
+            RejectedPatches=None,
+            RejectedPatchesAction=None,
+            Sources=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ApprovalRules", _convert_PatchBaselineRuleGroup(ApprovalRules))
+            _setattr("ApprovedPatches", ApprovedPatches)
+            _setattr("ApprovedPatchesComplianceLevel", ApprovedPatchesComplianceLevel)
+            _setattr(
+                "ApprovedPatchesEnableNonSecurity", ApprovedPatchesEnableNonSecurity
+            )
+            _setattr("Description", Description)
+            _setattr(
+                "GlobalFilters", _convert_PatchBaselinePatchFilterGroup(GlobalFilters)
+            )
+            _setattr("Name", Name)
+            _setattr("OperatingSystem", OperatingSystem)
+            _setattr("PatchGroups", PatchGroups)
+            _setattr("RejectedPatches", RejectedPatches)
+            _setattr("RejectedPatchesAction", RejectedPatchesAction)
+            _setattr("Sources", _convert_PatchBaselinePatchSource_list(Sources))
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_PatchBaselineProperties = create_object_converter(PatchBaselineProperties)
+
+    class PatchBaseline(_Resource):
+        """A Patch Baseline for SSM.
 
+        See Also:
+            `AWS Cloud Formation documentation for PatchBaseline
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-patchbaseline.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class ResourceDataSyncProperties(ResourceProperties):
-    BucketName = attrib(default=None)
-    BucketPrefix = attrib(default=None)
-    BucketRegion = attrib(default=None)
-    KMSKeyArn = attrib(default=None)
-    SyncFormat = attrib(default=None)
-    SyncName = attrib(default=None)
+        RESOURCE_TYPE = "AWS::SSM::PatchBaseline"
 
+        Properties: PatchBaselineProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "PatchBaseline",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_PatchBaselineProperties},
+            factories={"Properties": PatchBaselineProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = PatchBaselineProperties()
+            _setattr("Properties", _convert_PatchBaselineProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        PatchBaseline,
+        PatchBaselineProperties,
+        PatchBaselinePatchFilter,
+        PatchBaselinePatchFilterGroup,
+        PatchBaselinePatchSource,
+        PatchBaselineRule,
+        PatchBaselineRuleGroup,
+    )
 
-@attrs(**ATTRSCONFIG)
-class ResourceDataSync(Resource):
-    """A Resource Data Sync for SSM.
 
-    See Also:
-        `AWS Cloud Formation documentation for ResourceDataSync
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-resourcedatasync.html>`_
-    """
+def _create_ResourceDataSync():
+    class ResourceDataSyncProperties(_ResourceProperties):
+        __slots__ = (
+            "BucketName",
+            "BucketPrefix",
+            "BucketRegion",
+            "KMSKeyArn",
+            "SyncFormat",
+            "SyncName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDataSyncProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::SSM::ResourceDataSync"
+        def __init__(
+            self,
+            *,
+            BucketName=None,
+            BucketPrefix=None,
+            BucketRegion=None,
+            KMSKeyArn=None,
+            SyncFormat=None,
+            SyncName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BucketName", BucketName)
+            _setattr("BucketPrefix", BucketPrefix)
+            _setattr("BucketRegion", BucketRegion)
+            _setattr("KMSKeyArn", KMSKeyArn)
+            _setattr("SyncFormat", SyncFormat)
+            _setattr("SyncName", SyncName)
+            _init_ResourceProperties(self, kwargs)
 
-    Properties: ResourceDataSyncProperties = attrib(
-        factory=ResourceDataSyncProperties,
-        converter=create_object_converter(ResourceDataSyncProperties),
+    _convert_ResourceDataSyncProperties = create_object_converter(
+        ResourceDataSyncProperties
     )
+
+    class ResourceDataSync(_Resource):
+        """A Resource Data Sync for SSM.
+
+        See Also:
+            `AWS Cloud Formation documentation for ResourceDataSync
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-ssm-resourcedatasync.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::SSM::ResourceDataSync"
+
+        Properties: ResourceDataSyncProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ResourceDataSync",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ResourceDataSyncProperties},
+            factories={"Properties": ResourceDataSyncProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ResourceDataSyncProperties()
+            _setattr("Properties", _convert_ResourceDataSyncProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return ResourceDataSync, ResourceDataSyncProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Association": _create_Association,
+        "AssociationProperties": _create_Association,
+        "AssociationInstanceAssociationOutputLocation": _create_Association,
+        "AssociationParameterValues": _create_Association,
+        "AssociationS3OutputLocation": _create_Association,
+        "AssociationTarget": _create_Association,
+        "Document": _create_Document,
+        "DocumentProperties": _create_Document,
+        "MaintenanceWindow": _create_MaintenanceWindow,
+        "MaintenanceWindowProperties": _create_MaintenanceWindow,
+        "MaintenanceWindowTarget": _create_MaintenanceWindowTarget,
+        "MaintenanceWindowTargetProperties": _create_MaintenanceWindowTarget,
+        "MaintenanceWindowTargetTargets": _create_MaintenanceWindowTarget,
+        "MaintenanceWindowTask": _create_MaintenanceWindowTask,
+        "MaintenanceWindowTaskProperties": _create_MaintenanceWindowTask,
+        "MaintenanceWindowTaskLoggingInfo": _create_MaintenanceWindowTask,
+        "MaintenanceWindowTaskMaintenanceWindowAutomationParameters": _create_MaintenanceWindowTask,
+        "MaintenanceWindowTaskMaintenanceWindowLambdaParameters": _create_MaintenanceWindowTask,
+        "MaintenanceWindowTaskMaintenanceWindowRunCommandParameters": _create_MaintenanceWindowTask,
+        "MaintenanceWindowTaskMaintenanceWindowStepFunctionsParameters": _create_MaintenanceWindowTask,
+        "MaintenanceWindowTaskNotificationConfig": _create_MaintenanceWindowTask,
+        "MaintenanceWindowTaskTarget": _create_MaintenanceWindowTask,
+        "MaintenanceWindowTaskTaskInvocationParameters": _create_MaintenanceWindowTask,
+        "Parameter": _create_Parameter,
+        "ParameterProperties": _create_Parameter,
+        "PatchBaseline": _create_PatchBaseline,
+        "PatchBaselineProperties": _create_PatchBaseline,
+        "PatchBaselinePatchFilter": _create_PatchBaseline,
+        "PatchBaselinePatchFilterGroup": _create_PatchBaseline,
+        "PatchBaselinePatchSource": _create_PatchBaseline,
+        "PatchBaselineRule": _create_PatchBaseline,
+        "PatchBaselineRuleGroup": _create_PatchBaseline,
+        "ResourceDataSync": _create_ResourceDataSync,
+        "ResourceDataSyncProperties": _create_ResourceDataSync,
+    },
+)
@@ -7,62 +7,333 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Activity", "ActivityProperties", "StateMachine", "StateMachineProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Activity",
+    "ActivityProperties",
+    "ActivityTagsEntry",
+    "StateMachine",
+    "StateMachineProperties",
+    "StateMachineCloudWatchLogsLogGroup",
+    "StateMachineLogDestination",
+    "StateMachineLoggingConfiguration",
+    "StateMachineTagsEntry",
+]
 
-@attrs(**ATTRSCONFIG)
-class ActivityProperties(ResourceProperties):
-    Name = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_Activity():
+    class ActivityTagsEntry(_PropertyType):
+        """The Tags Entry property type for Activity in StepFunctions.
 
-@attrs(**ATTRSCONFIG)
-class Activity(Resource):
-    """A Activity for StepFunctions.
+        See Also:
+            `AWS Cloud Formation documentation for TagsEntry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-stepfunctions-activity-tagsentry.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Activity
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-stepfunctions-activity.html>`_
-    """
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ActivityTagsEntry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::StepFunctions::Activity"
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ActivityProperties = attrib(
-        factory=ActivityProperties,
-        converter=create_object_converter(ActivityProperties),
+    _convert_ActivityTagsEntry_list = create_object_list_converter(ActivityTagsEntry)
+
+    class ActivityProperties(_ResourceProperties):
+        __slots__ = ("Name", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ActivityProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_ActivityTagsEntry_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, Tags=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("Tags", _convert_ActivityTagsEntry_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ActivityProperties = create_object_converter(ActivityProperties)
+
+    class Activity(_Resource):
+        """A Activity for StepFunctions.
+
+        See Also:
+            `AWS Cloud Formation documentation for Activity
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-stepfunctions-activity.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::StepFunctions::Activity"
+
+        Properties: ActivityProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Activity",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ActivityProperties},
+            factories={"Properties": ActivityProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ActivityProperties()
+            _setattr("Properties", _convert_ActivityProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Activity, ActivityProperties, ActivityTagsEntry
+
+
+def _create_StateMachine():
+    class StateMachineCloudWatchLogsLogGroup(_PropertyType):
+        """The Cloud Watch Logs Log Group property type for StateMachine in StepFunctions.
+
+        See Also:
+            `AWS Cloud Formation documentation for CloudWatchLogsLogGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-stepfunctions-statemachine-logdestination-cloudwatchlogsloggroup.html>`_
+        """
+
+        __slots__ = ("LogGroupArn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StateMachineCloudWatchLogsLogGroup", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, LogGroupArn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("LogGroupArn", LogGroupArn)
+            _init_PropertyType(self, kwargs)
+
+    _convert_StateMachineCloudWatchLogsLogGroup = create_object_converter(
+        StateMachineCloudWatchLogsLogGroup
+    )
+
+    class StateMachineLogDestination(_PropertyType):
+        """The Log Destination property type for StateMachine in StepFunctions.
+
+        See Also:
+            `AWS Cloud Formation documentation for LogDestination
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-stepfunctions-statemachine-logdestination.html>`_
+        """
+
+        __slots__ = ("CloudWatchLogsLogGroup",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StateMachineLogDestination",
+            _PropertyType,
+            __slots__,
+            converters={
+                "CloudWatchLogsLogGroup": _convert_StateMachineCloudWatchLogsLogGroup
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CloudWatchLogsLogGroup=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "CloudWatchLogsLogGroup",
+                _convert_StateMachineCloudWatchLogsLogGroup(CloudWatchLogsLogGroup),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_StateMachineLogDestination_list = create_object_list_converter(
+        StateMachineLogDestination
     )
 
+    class StateMachineLoggingConfiguration(_PropertyType):
+        """The Logging Configuration property type for StateMachine in StepFunctions.
+
+        See Also:
+            `AWS Cloud Formation documentation for LoggingConfiguration
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-stepfunctions-statemachine-loggingconfiguration.html>`_
+        """
+
+        __slots__ = ("Destinations", "IncludeExecutionData", "Level")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StateMachineLoggingConfiguration",
+            _PropertyType,
+            __slots__,
+            converters={"Destinations": _convert_StateMachineLogDestination_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class StateMachineProperties(ResourceProperties):
-    DefinitionString = attrib(default=None)
-    LoggingConfiguration = attrib(default=None)
-    RoleArn = attrib(default=None)
-    StateMachineName = attrib(default=None)
-    StateMachineType = attrib(default=None)
-    Tags = attrib(default=None)
+        def __init__(
+            self, *, Destinations=None, IncludeExecutionData=None, Level=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "Destinations", _convert_StateMachineLogDestination_list(Destinations)
+            )
+            _setattr("IncludeExecutionData", IncludeExecutionData)
+            _setattr("Level", Level)
+            _init_PropertyType(self, kwargs)
 
+    class StateMachineTagsEntry(_PropertyType):
+        """The Tags Entry property type for StateMachine in StepFunctions.
 
-@attrs(**ATTRSCONFIG)
-class StateMachine(Resource):
-    """A State Machine for StepFunctions.
+        See Also:
+            `AWS Cloud Formation documentation for TagsEntry
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-stepfunctions-statemachine-tagsentry.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for StateMachine
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-stepfunctions-statemachine.html>`_
-    """
+        __slots__ = ("Key", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StateMachineTagsEntry", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::StepFunctions::StateMachine"
+        def __init__(self, *, Key=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Key", Key)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    Properties: StateMachineProperties = attrib(
-        factory=StateMachineProperties,
-        converter=create_object_converter(StateMachineProperties),
+    _convert_StateMachineLoggingConfiguration = create_object_converter(
+        StateMachineLoggingConfiguration
     )
+    _convert_StateMachineTagsEntry_list = create_object_list_converter(
+        StateMachineTagsEntry
+    )
+
+    class StateMachineProperties(_ResourceProperties):
+        __slots__ = (
+            "DefinitionString",
+            "LoggingConfiguration",
+            "RoleArn",
+            "StateMachineName",
+            "StateMachineType",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StateMachineProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "LoggingConfiguration": _convert_StateMachineLoggingConfiguration,
+                "Tags": _convert_StateMachineTagsEntry_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefinitionString=None,
+            LoggingConfiguration=None,
+            RoleArn=None,
+            StateMachineName=None,
+            StateMachineType=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefinitionString", DefinitionString)
+            _setattr(
+                "LoggingConfiguration",
+                _convert_StateMachineLoggingConfiguration(LoggingConfiguration),
+            )
+            _setattr("RoleArn", RoleArn)
+            _setattr("StateMachineName", StateMachineName)
+            _setattr("StateMachineType", StateMachineType)
+            _setattr("Tags", _convert_StateMachineTagsEntry_list(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_StateMachineProperties = create_object_converter(StateMachineProperties)
+
+    class StateMachine(_Resource):
+        """A State Machine for StepFunctions.
+
+        See Also:
+            `AWS Cloud Formation documentation for StateMachine
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-stepfunctions-statemachine.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::StepFunctions::StateMachine"
+
+        Properties: StateMachineProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "StateMachine",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_StateMachineProperties},
+            factories={"Properties": StateMachineProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = StateMachineProperties()
+            _setattr("Properties", _convert_StateMachineProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        StateMachine,
+        StateMachineProperties,
+        StateMachineCloudWatchLogsLogGroup,
+        StateMachineLogDestination,
+        StateMachineLoggingConfiguration,
+        StateMachineTagsEntry,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Activity": _create_Activity,
+        "ActivityProperties": _create_Activity,
+        "ActivityTagsEntry": _create_Activity,
+        "StateMachine": _create_StateMachine,
+        "StateMachineProperties": _create_StateMachine,
+        "StateMachineCloudWatchLogsLogGroup": _create_StateMachine,
+        "StateMachineLogDestination": _create_StateMachine,
+        "StateMachineLoggingConfiguration": _create_StateMachine,
+        "StateMachineTagsEntry": _create_StateMachine,
+    },
+)
@@ -7,65 +7,261 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Server", "ServerProperties", "User", "UserProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Server",
+    "ServerProperties",
+    "ServerEndpointDetails",
+    "ServerIdentityProviderDetails",
+    "User",
+    "UserProperties",
+]
 
-@attrs(**ATTRSCONFIG)
-class ServerProperties(ResourceProperties):
-    EndpointDetails = attrib(default=None)
-    EndpointType = attrib(default=None)
-    IdentityProviderDetails = attrib(default=None)
-    IdentityProviderType = attrib(default=None)
-    LoggingRole = attrib(default=None)
-    Tags = attrib(default=None)
 
+def _create_Server():
+    class ServerEndpointDetails(_PropertyType):
+        """The Endpoint Details property type for Server in Transfer.
 
-@attrs(**ATTRSCONFIG)
-class Server(Resource):
-    """A Server for Transfer.
+        See Also:
+            `AWS Cloud Formation documentation for EndpointDetails
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-transfer-server-endpointdetails.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Server
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-transfer-server.html>`_
-    """
+        __slots__ = ("VpcEndpointId",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServerEndpointDetails", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::Transfer::Server"
+        def __init__(self, *, VpcEndpointId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("VpcEndpointId", VpcEndpointId)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ServerProperties = attrib(
-        factory=ServerProperties, converter=create_object_converter(ServerProperties)
+    class ServerIdentityProviderDetails(_PropertyType):
+        """The Identity Provider Details property type for Server in Transfer.
+
+        See Also:
+            `AWS Cloud Formation documentation for IdentityProviderDetails
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-transfer-server-identityproviderdetails.html>`_
+        """
+
+        __slots__ = ("InvocationRole", "Url")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServerIdentityProviderDetails", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, InvocationRole=None, Url=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("InvocationRole", InvocationRole)
+            _setattr("Url", Url)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ServerEndpointDetails = create_object_converter(ServerEndpointDetails)
+    _convert_ServerIdentityProviderDetails = create_object_converter(
+        ServerIdentityProviderDetails
     )
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class ServerProperties(_ResourceProperties):
+        __slots__ = (
+            "EndpointDetails",
+            "EndpointType",
+            "IdentityProviderDetails",
+            "IdentityProviderType",
+            "LoggingRole",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ServerProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "EndpointDetails": _convert_ServerEndpointDetails,
+                "IdentityProviderDetails": _convert_ServerIdentityProviderDetails,
+                "Tags": _convert_Tag_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            EndpointDetails=None,
+            EndpointType=None,
+            IdentityProviderDetails=None,
+            IdentityProviderType=None,
+            LoggingRole=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("EndpointDetails", _convert_ServerEndpointDetails(EndpointDetails))
+            _setattr("EndpointType", EndpointType)
+            _setattr(
+                "IdentityProviderDetails",
+                _convert_ServerIdentityProviderDetails(IdentityProviderDetails),
+            )
+            _setattr("IdentityProviderType", IdentityProviderType)
+            _setattr("LoggingRole", LoggingRole)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _init_ResourceProperties(self, kwargs)
 
+    _convert_ServerProperties = create_object_converter(ServerProperties)
 
-@attrs(**ATTRSCONFIG)
-class UserProperties(ResourceProperties):
-    HomeDirectory = attrib(default=None)
-    Policy = attrib(default=None)
-    Role = attrib(default=None)
-    ServerId = attrib(default=None)
-    SshPublicKeys = attrib(default=None)
-    Tags = attrib(default=None)
-    UserName = attrib(default=None)
+    class Server(_Resource):
+        """A Server for Transfer.
 
+        See Also:
+            `AWS Cloud Formation documentation for Server
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-transfer-server.html>`_
+        """
 
-@attrs(**ATTRSCONFIG)
-class User(Resource):
-    """A User for Transfer.
+        RESOURCE_TYPE = "AWS::Transfer::Server"
 
-    See Also:
-        `AWS Cloud Formation documentation for User
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-transfer-user.html>`_
-    """
+        Properties: ServerProperties
 
-    RESOURCE_TYPE = "AWS::Transfer::User"
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Server",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ServerProperties},
+            factories={"Properties": ServerProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    Properties: UserProperties = attrib(
-        factory=UserProperties, converter=create_object_converter(UserProperties)
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ServerProperties()
+            _setattr("Properties", _convert_ServerProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        Server,
+        ServerProperties,
+        ServerEndpointDetails,
+        ServerIdentityProviderDetails,
     )
+
+
+def _create_User():
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class UserProperties(_ResourceProperties):
+        __slots__ = (
+            "HomeDirectory",
+            "Policy",
+            "Role",
+            "ServerId",
+            "SshPublicKeys",
+            "Tags",
+            "UserName",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "UserProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Tags": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            HomeDirectory=None,
+            Policy=None,
+            Role=None,
+            ServerId=None,
+            SshPublicKeys=None,
+            Tags=None,
+            UserName=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("HomeDirectory", HomeDirectory)
+            _setattr("Policy", Policy)
+            _setattr("Role", Role)
+            _setattr("ServerId", ServerId)
+            _setattr("SshPublicKeys", SshPublicKeys)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("UserName", UserName)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_UserProperties = create_object_converter(UserProperties)
+
+    class User(_Resource):
+        """A User for Transfer.
+
+        See Also:
+            `AWS Cloud Formation documentation for User
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-transfer-user.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::Transfer::User"
+
+        Properties: UserProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "User",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_UserProperties},
+            factories={"Properties": UserProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = UserProperties()
+            _setattr("Properties", _convert_UserProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return User, UserProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Server": _create_Server,
+        "ServerProperties": _create_Server,
+        "ServerEndpointDetails": _create_Server,
+        "ServerIdentityProviderDetails": _create_Server,
+        "User": _create_User,
+        "UserProperties": _create_User,
+    },
+)
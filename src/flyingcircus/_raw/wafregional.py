@@ -7,291 +7,1205 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "ByteMatchSet",
     "ByteMatchSetProperties",
+    "ByteMatchSetByteMatchTuple",
+    "ByteMatchSetFieldToMatch",
     "GeoMatchSet",
     "GeoMatchSetProperties",
+    "GeoMatchSetGeoMatchConstraint",
     "IPSet",
     "IPSetProperties",
+    "IPSetIPSetDescriptor",
     "RateBasedRule",
     "RateBasedRuleProperties",
+    "RateBasedRulePredicate",
     "RegexPatternSet",
     "RegexPatternSetProperties",
     "Rule",
     "RuleProperties",
+    "RulePredicate",
     "SizeConstraintSet",
     "SizeConstraintSetProperties",
+    "SizeConstraintSetFieldToMatch",
+    "SizeConstraintSetSizeConstraint",
     "SqlInjectionMatchSet",
     "SqlInjectionMatchSetProperties",
+    "SqlInjectionMatchSetFieldToMatch",
+    "SqlInjectionMatchSetSqlInjectionMatchTuple",
     "WebACL",
     "WebACLProperties",
+    "WebACLAction",
+    "WebACLRule",
     "WebACLAssociation",
     "WebACLAssociationProperties",
     "XssMatchSet",
     "XssMatchSetProperties",
+    "XssMatchSetFieldToMatch",
+    "XssMatchSetXssMatchTuple",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class ByteMatchSetProperties(ResourceProperties):
-    ByteMatchTuples = attrib(default=None)
-    Name = attrib(default=None)
-
+def _create_ByteMatchSet():
+    class ByteMatchSetFieldToMatch(_PropertyType):
+        """The Field To Match property type for ByteMatchSet in WAFRegional.
 
-@attrs(**ATTRSCONFIG)
-class ByteMatchSet(Resource):
-    """A Byte Match Set for WAFRegional.
+        See Also:
+            `AWS Cloud Formation documentation for FieldToMatch
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-bytematchset-fieldtomatch.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for ByteMatchSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-bytematchset.html>`_
-    """
+        __slots__ = ("Data", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ByteMatchSetFieldToMatch", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::WAFRegional::ByteMatchSet"
+        def __init__(self, *, Data=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Data", Data)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
 
-    Properties: ByteMatchSetProperties = attrib(
-        factory=ByteMatchSetProperties,
-        converter=create_object_converter(ByteMatchSetProperties),
+    _convert_ByteMatchSetFieldToMatch = create_object_converter(
+        ByteMatchSetFieldToMatch
     )
 
-
-@attrs(**ATTRSCONFIG)
-class GeoMatchSetProperties(ResourceProperties):
-    GeoMatchConstraints = attrib(default=None)
-    Name = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class GeoMatchSet(Resource):
-    """A Geo Match Set for WAFRegional.
-
-    See Also:
-        `AWS Cloud Formation documentation for GeoMatchSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-geomatchset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::WAFRegional::GeoMatchSet"
-
-    Properties: GeoMatchSetProperties = attrib(
-        factory=GeoMatchSetProperties,
-        converter=create_object_converter(GeoMatchSetProperties),
+    class ByteMatchSetByteMatchTuple(_PropertyType):
+        """The Byte Match Tuple property type for ByteMatchSet in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for ByteMatchTuple
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-bytematchset-bytematchtuple.html>`_
+        """
+
+        __slots__ = (
+            "FieldToMatch",
+            "PositionalConstraint",
+            "TargetString",
+            "TargetStringBase64",
+            "TextTransformation",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ByteMatchSetByteMatchTuple",
+            _PropertyType,
+            __slots__,
+            converters={"FieldToMatch": _convert_ByteMatchSetFieldToMatch},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            FieldToMatch=None,
+            PositionalConstraint=None,
+            TargetString=None,
+            TargetStringBase64=None,
+            TextTransformation=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FieldToMatch", _convert_ByteMatchSetFieldToMatch(FieldToMatch))
+            _setattr("PositionalConstraint", PositionalConstraint)
+            _setattr("TargetString", TargetString)
+            _setattr("TargetStringBase64", TargetStringBase64)
+            _setattr("TextTransformation", TextTransformation)
+            _init_PropertyType(self, kwargs)
+
+    _convert_ByteMatchSetByteMatchTuple_list = create_object_list_converter(
+        ByteMatchSetByteMatchTuple
     )
 
-
-@attrs(**ATTRSCONFIG)
-class IPSetProperties(ResourceProperties):
-    IPSetDescriptors = attrib(default=None)
-    Name = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class IPSet(Resource):
-    """A Ip Set for WAFRegional.
-
-    See Also:
-        `AWS Cloud Formation documentation for IPSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-ipset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::WAFRegional::IPSet"
-
-    Properties: IPSetProperties = attrib(
-        factory=IPSetProperties, converter=create_object_converter(IPSetProperties)
+    class ByteMatchSetProperties(_ResourceProperties):
+        __slots__ = ("ByteMatchTuples", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ByteMatchSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"ByteMatchTuples": _convert_ByteMatchSetByteMatchTuple_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ByteMatchTuples=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ByteMatchTuples",
+                _convert_ByteMatchSetByteMatchTuple_list(ByteMatchTuples),
+            )
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_ByteMatchSetProperties = create_object_converter(ByteMatchSetProperties)
+
+    class ByteMatchSet(_Resource):
+        """A Byte Match Set for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for ByteMatchSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-bytematchset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::ByteMatchSet"
+
+        Properties: ByteMatchSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "ByteMatchSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_ByteMatchSetProperties},
+            factories={"Properties": ByteMatchSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = ByteMatchSetProperties()
+            _setattr("Properties", _convert_ByteMatchSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        ByteMatchSet,
+        ByteMatchSetProperties,
+        ByteMatchSetFieldToMatch,
+        ByteMatchSetByteMatchTuple,
     )
 
 
-@attrs(**ATTRSCONFIG)
-class RateBasedRuleProperties(ResourceProperties):
-    MatchPredicates = attrib(default=None)
-    MetricName = attrib(default=None)
-    Name = attrib(default=None)
-    RateKey = attrib(default=None)
-    RateLimit = attrib(default=None)
-
+def _create_GeoMatchSet():
+    class GeoMatchSetGeoMatchConstraint(_PropertyType):
+        """The Geo Match Constraint property type for GeoMatchSet in WAFRegional.
 
-@attrs(**ATTRSCONFIG)
-class RateBasedRule(Resource):
-    """A Rate Based Rule for WAFRegional.
+        See Also:
+            `AWS Cloud Formation documentation for GeoMatchConstraint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-geomatchset-geomatchconstraint.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for RateBasedRule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-ratebasedrule.html>`_
-    """
+        __slots__ = ("Type", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GeoMatchSetGeoMatchConstraint", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::WAFRegional::RateBasedRule"
+        def __init__(self, *, Type=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
 
-    Properties: RateBasedRuleProperties = attrib(
-        factory=RateBasedRuleProperties,
-        converter=create_object_converter(RateBasedRuleProperties),
+    _convert_GeoMatchSetGeoMatchConstraint_list = create_object_list_converter(
+        GeoMatchSetGeoMatchConstraint
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RegexPatternSetProperties(ResourceProperties):
-    Name = attrib(default=None)
-    RegexPatternStrings = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class RegexPatternSet(Resource):
-    """A Regex Pattern Set for WAFRegional.
-
-    See Also:
-        `AWS Cloud Formation documentation for RegexPatternSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-regexpatternset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::WAFRegional::RegexPatternSet"
-
-    Properties: RegexPatternSetProperties = attrib(
-        factory=RegexPatternSetProperties,
-        converter=create_object_converter(RegexPatternSetProperties),
+    class GeoMatchSetProperties(_ResourceProperties):
+        __slots__ = ("GeoMatchConstraints", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GeoMatchSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "GeoMatchConstraints": _convert_GeoMatchSetGeoMatchConstraint_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, GeoMatchConstraints=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "GeoMatchConstraints",
+                _convert_GeoMatchSetGeoMatchConstraint_list(GeoMatchConstraints),
+            )
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_GeoMatchSetProperties = create_object_converter(GeoMatchSetProperties)
+
+    class GeoMatchSet(_Resource):
+        """A Geo Match Set for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for GeoMatchSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-geomatchset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::GeoMatchSet"
+
+        Properties: GeoMatchSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "GeoMatchSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_GeoMatchSetProperties},
+            factories={"Properties": GeoMatchSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = GeoMatchSetProperties()
+            _setattr("Properties", _convert_GeoMatchSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return GeoMatchSet, GeoMatchSetProperties, GeoMatchSetGeoMatchConstraint
+
+
+def _create_IPSet():
+    class IPSetIPSetDescriptor(_PropertyType):
+        """The Ip Set Descriptor property type for IPSet in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for IPSetDescriptor
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-ipset-ipsetdescriptor.html>`_
+        """
+
+        __slots__ = ("Type", "Value")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IPSetIPSetDescriptor", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Type=None, Value=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _setattr("Value", Value)
+            _init_PropertyType(self, kwargs)
+
+    _convert_IPSetIPSetDescriptor_list = create_object_list_converter(
+        IPSetIPSetDescriptor
     )
 
-
-@attrs(**ATTRSCONFIG)
-class RuleProperties(ResourceProperties):
-    MetricName = attrib(default=None)
-    Name = attrib(default=None)
-    Predicates = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class Rule(Resource):
-    """A Rule for WAFRegional.
-
-    See Also:
-        `AWS Cloud Formation documentation for Rule
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-rule.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::WAFRegional::Rule"
-
-    Properties: RuleProperties = attrib(
-        factory=RuleProperties, converter=create_object_converter(RuleProperties)
+    class IPSetProperties(_ResourceProperties):
+        __slots__ = ("IPSetDescriptors", "Name")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IPSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"IPSetDescriptors": _convert_IPSetIPSetDescriptor_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, IPSetDescriptors=None, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "IPSetDescriptors", _convert_IPSetIPSetDescriptor_list(IPSetDescriptors)
+            )
+            _setattr("Name", Name)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_IPSetProperties = create_object_converter(IPSetProperties)
+
+    class IPSet(_Resource):
+        """A Ip Set for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for IPSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-ipset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::IPSet"
+
+        Properties: IPSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IPSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_IPSetProperties},
+            factories={"Properties": IPSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = IPSetProperties()
+            _setattr("Properties", _convert_IPSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return IPSet, IPSetProperties, IPSetIPSetDescriptor
+
+
+def _create_RateBasedRule():
+    class RateBasedRulePredicate(_PropertyType):
+        """The Predicate property type for RateBasedRule in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for Predicate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-ratebasedrule-predicate.html>`_
+        """
+
+        __slots__ = ("DataId", "Negated", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RateBasedRulePredicate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DataId=None, Negated=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DataId", DataId)
+            _setattr("Negated", Negated)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RateBasedRulePredicate_list = create_object_list_converter(
+        RateBasedRulePredicate
     )
 
-
-@attrs(**ATTRSCONFIG)
-class SizeConstraintSetProperties(ResourceProperties):
-    Name = attrib(default=None)
-    SizeConstraints = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SizeConstraintSet(Resource):
-    """A Size Constraint Set for WAFRegional.
-
-    See Also:
-        `AWS Cloud Formation documentation for SizeConstraintSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-sizeconstraintset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::WAFRegional::SizeConstraintSet"
-
-    Properties: SizeConstraintSetProperties = attrib(
-        factory=SizeConstraintSetProperties,
-        converter=create_object_converter(SizeConstraintSetProperties),
+    class RateBasedRuleProperties(_ResourceProperties):
+        __slots__ = ("MatchPredicates", "MetricName", "Name", "RateKey", "RateLimit")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RateBasedRuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"MatchPredicates": _convert_RateBasedRulePredicate_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            MatchPredicates=None,
+            MetricName=None,
+            Name=None,
+            RateKey=None,
+            RateLimit=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "MatchPredicates", _convert_RateBasedRulePredicate_list(MatchPredicates)
+            )
+            _setattr("MetricName", MetricName)
+            _setattr("Name", Name)
+            _setattr("RateKey", RateKey)
+            _setattr("RateLimit", RateLimit)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RateBasedRuleProperties = create_object_converter(RateBasedRuleProperties)
+
+    class RateBasedRule(_Resource):
+        """A Rate Based Rule for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for RateBasedRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-ratebasedrule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::RateBasedRule"
+
+        Properties: RateBasedRuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RateBasedRule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RateBasedRuleProperties},
+            factories={"Properties": RateBasedRuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RateBasedRuleProperties()
+            _setattr("Properties", _convert_RateBasedRuleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return RateBasedRule, RateBasedRuleProperties, RateBasedRulePredicate
+
+
+def _create_RegexPatternSet():
+    class RegexPatternSetProperties(_ResourceProperties):
+        __slots__ = ("Name", "RegexPatternStrings")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RegexPatternSetProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, RegexPatternStrings=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr("RegexPatternStrings", RegexPatternStrings)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RegexPatternSetProperties = create_object_converter(
+        RegexPatternSetProperties
     )
 
+    class RegexPatternSet(_Resource):
+        """A Regex Pattern Set for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for RegexPatternSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-regexpatternset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::RegexPatternSet"
+
+        Properties: RegexPatternSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RegexPatternSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RegexPatternSetProperties},
+            factories={"Properties": RegexPatternSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RegexPatternSetProperties()
+            _setattr("Properties", _convert_RegexPatternSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return RegexPatternSet, RegexPatternSetProperties
+
+
+def _create_Rule():
+    class RulePredicate(_PropertyType):
+        """The Predicate property type for Rule in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for Predicate
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-rule-predicate.html>`_
+        """
+
+        __slots__ = ("DataId", "Negated", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RulePredicate", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, DataId=None, Negated=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DataId", DataId)
+            _setattr("Negated", Negated)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RulePredicate_list = create_object_list_converter(RulePredicate)
+
+    class RuleProperties(_ResourceProperties):
+        __slots__ = ("MetricName", "Name", "Predicates")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"Predicates": _convert_RulePredicate_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, MetricName=None, Name=None, Predicates=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("MetricName", MetricName)
+            _setattr("Name", Name)
+            _setattr("Predicates", _convert_RulePredicate_list(Predicates))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RuleProperties = create_object_converter(RuleProperties)
+
+    class Rule(_Resource):
+        """A Rule for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for Rule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-rule.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::Rule"
+
+        Properties: RuleProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Rule",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RuleProperties},
+            factories={"Properties": RuleProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RuleProperties()
+            _setattr("Properties", _convert_RuleProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Rule, RuleProperties, RulePredicate
+
+
+def _create_SizeConstraintSet():
+    class SizeConstraintSetFieldToMatch(_PropertyType):
+        """The Field To Match property type for SizeConstraintSet in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for FieldToMatch
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-sizeconstraintset-fieldtomatch.html>`_
+        """
+
+        __slots__ = ("Data", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SizeConstraintSetFieldToMatch", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Data=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Data", Data)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SizeConstraintSetFieldToMatch = create_object_converter(
+        SizeConstraintSetFieldToMatch
+    )
 
-@attrs(**ATTRSCONFIG)
-class SqlInjectionMatchSetProperties(ResourceProperties):
-    Name = attrib(default=None)
-    SqlInjectionMatchTuples = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class SqlInjectionMatchSet(Resource):
-    """A Sql Injection Match Set for WAFRegional.
-
-    See Also:
-        `AWS Cloud Formation documentation for SqlInjectionMatchSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-sqlinjectionmatchset.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::WAFRegional::SqlInjectionMatchSet"
+    class SizeConstraintSetSizeConstraint(_PropertyType):
+        """The Size Constraint property type for SizeConstraintSet in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for SizeConstraint
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-sizeconstraintset-sizeconstraint.html>`_
+        """
+
+        __slots__ = ("ComparisonOperator", "FieldToMatch", "Size", "TextTransformation")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SizeConstraintSetSizeConstraint",
+            _PropertyType,
+            __slots__,
+            converters={"FieldToMatch": _convert_SizeConstraintSetFieldToMatch},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ComparisonOperator=None,
+            FieldToMatch=None,
+            Size=None,
+            TextTransformation=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComparisonOperator", ComparisonOperator)
+            _setattr(
+                "FieldToMatch", _convert_SizeConstraintSetFieldToMatch(FieldToMatch)
+            )
+            _setattr("Size", Size)
+            _setattr("TextTransformation", TextTransformation)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SizeConstraintSetSizeConstraint_list = create_object_list_converter(
+        SizeConstraintSetSizeConstraint
+    )
 
-    Properties: SqlInjectionMatchSetProperties = attrib(
-        factory=SqlInjectionMatchSetProperties,
-        converter=create_object_converter(SqlInjectionMatchSetProperties),
+    class SizeConstraintSetProperties(_ResourceProperties):
+        __slots__ = ("Name", "SizeConstraints")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SizeConstraintSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "SizeConstraints": _convert_SizeConstraintSetSizeConstraint_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, SizeConstraints=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr(
+                "SizeConstraints",
+                _convert_SizeConstraintSetSizeConstraint_list(SizeConstraints),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SizeConstraintSetProperties = create_object_converter(
+        SizeConstraintSetProperties
     )
 
+    class SizeConstraintSet(_Resource):
+        """A Size Constraint Set for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for SizeConstraintSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-sizeconstraintset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::SizeConstraintSet"
+
+        Properties: SizeConstraintSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SizeConstraintSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SizeConstraintSetProperties},
+            factories={"Properties": SizeConstraintSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SizeConstraintSetProperties()
+            _setattr("Properties", _convert_SizeConstraintSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        SizeConstraintSet,
+        SizeConstraintSetProperties,
+        SizeConstraintSetFieldToMatch,
+        SizeConstraintSetSizeConstraint,
+    )
 
-@attrs(**ATTRSCONFIG)
-class WebACLProperties(ResourceProperties):
-    DefaultAction = attrib(default=None)
-    MetricName = attrib(default=None)
-    Name = attrib(default=None)
-    Rules = attrib(default=None)
 
+def _create_SqlInjectionMatchSet():
+    class SqlInjectionMatchSetFieldToMatch(_PropertyType):
+        """The Field To Match property type for SqlInjectionMatchSet in WAFRegional.
 
-@attrs(**ATTRSCONFIG)
-class WebACL(Resource):
-    """A Web Acl for WAFRegional.
+        See Also:
+            `AWS Cloud Formation documentation for FieldToMatch
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-sqlinjectionmatchset-fieldtomatch.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for WebACL
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-webacl.html>`_
-    """
+        __slots__ = ("Data", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SqlInjectionMatchSetFieldToMatch", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::WAFRegional::WebACL"
+        def __init__(self, *, Data=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Data", Data)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
 
-    Properties: WebACLProperties = attrib(
-        factory=WebACLProperties, converter=create_object_converter(WebACLProperties)
+    _convert_SqlInjectionMatchSetFieldToMatch = create_object_converter(
+        SqlInjectionMatchSetFieldToMatch
     )
 
+    class SqlInjectionMatchSetSqlInjectionMatchTuple(_PropertyType):
+        """The Sql Injection Match Tuple property type for SqlInjectionMatchSet in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for SqlInjectionMatchTuple
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-sqlinjectionmatchset-sqlinjectionmatchtuple.html>`_
+        """
+
+        __slots__ = ("FieldToMatch", "TextTransformation")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SqlInjectionMatchSetSqlInjectionMatchTuple",
+            _PropertyType,
+            __slots__,
+            converters={"FieldToMatch": _convert_SqlInjectionMatchSetFieldToMatch},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FieldToMatch=None, TextTransformation=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "FieldToMatch", _convert_SqlInjectionMatchSetFieldToMatch(FieldToMatch)
+            )
+            _setattr("TextTransformation", TextTransformation)
+            _init_PropertyType(self, kwargs)
+
+    _convert_SqlInjectionMatchSetSqlInjectionMatchTuple_list = (
+        create_object_list_converter(SqlInjectionMatchSetSqlInjectionMatchTuple)
+    )
 
-@attrs(**ATTRSCONFIG)
-class WebACLAssociationProperties(ResourceProperties):
-    ResourceArn = attrib(default=None)
-    WebACLId = attrib(default=None)
-
-
-@attrs(**ATTRSCONFIG)
-class WebACLAssociation(Resource):
-    """A Web Acl Association for WAFRegional.
-
-    See Also:
-        `AWS Cloud Formation documentation for WebACLAssociation
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-webaclassociation.html>`_
-    """
-
-    RESOURCE_TYPE = "AWS::WAFRegional::WebACLAssociation"
-
-    Properties: WebACLAssociationProperties = attrib(
-        factory=WebACLAssociationProperties,
-        converter=create_object_converter(WebACLAssociationProperties),
+    class SqlInjectionMatchSetProperties(_ResourceProperties):
+        __slots__ = ("Name", "SqlInjectionMatchTuples")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SqlInjectionMatchSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "SqlInjectionMatchTuples": _convert_SqlInjectionMatchSetSqlInjectionMatchTuple_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Name=None, SqlInjectionMatchTuples=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr(
+                "SqlInjectionMatchTuples",
+                _convert_SqlInjectionMatchSetSqlInjectionMatchTuple_list(
+                    SqlInjectionMatchTuples
+                ),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_SqlInjectionMatchSetProperties = create_object_converter(
+        SqlInjectionMatchSetProperties
     )
 
+    class SqlInjectionMatchSet(_Resource):
+        """A Sql Injection Match Set for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for SqlInjectionMatchSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-sqlinjectionmatchset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::SqlInjectionMatchSet"
+
+        Properties: SqlInjectionMatchSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "SqlInjectionMatchSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_SqlInjectionMatchSetProperties},
+            factories={"Properties": SqlInjectionMatchSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = SqlInjectionMatchSetProperties()
+            _setattr("Properties", _convert_SqlInjectionMatchSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        SqlInjectionMatchSet,
+        SqlInjectionMatchSetProperties,
+        SqlInjectionMatchSetFieldToMatch,
+        SqlInjectionMatchSetSqlInjectionMatchTuple,
+    )
 
-@attrs(**ATTRSCONFIG)
-class XssMatchSetProperties(ResourceProperties):
-    Name = attrib(default=None)
-    XssMatchTuples = attrib(default=None)
 
+def _create_WebACL():
+    class WebACLAction(_PropertyType):
+        """The Action property type for WebACL in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for Action
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-webacl-action.html>`_
+        """
+
+        __slots__ = ("Type",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLAction = create_object_converter(WebACLAction)
+
+    class WebACLRule(_PropertyType):
+        """The Rule property type for WebACL in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for Rule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-webacl-rule.html>`_
+        """
+
+        __slots__ = ("Action", "Priority", "RuleId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLRule",
+            _PropertyType,
+            __slots__,
+            converters={"Action": _convert_WebACLAction},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Action=None, Priority=None, RuleId=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", _convert_WebACLAction(Action))
+            _setattr("Priority", Priority)
+            _setattr("RuleId", RuleId)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLRule_list = create_object_list_converter(WebACLRule)
+
+    class WebACLProperties(_ResourceProperties):
+        __slots__ = ("DefaultAction", "MetricName", "Name", "Rules")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DefaultAction": _convert_WebACLAction,
+                "Rules": _convert_WebACLRule_list,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultAction=None,
+            MetricName=None,
+            Name=None,
+            Rules=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultAction", _convert_WebACLAction(DefaultAction))
+            _setattr("MetricName", MetricName)
+            _setattr("Name", Name)
+            _setattr("Rules", _convert_WebACLRule_list(Rules))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_WebACLProperties = create_object_converter(WebACLProperties)
+
+    class WebACL(_Resource):
+        """A Web Acl for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for WebACL
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-webacl.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::WebACL"
+
+        Properties: WebACLProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACL",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_WebACLProperties},
+            factories={"Properties": WebACLProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = WebACLProperties()
+            _setattr("Properties", _convert_WebACLProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return WebACL, WebACLProperties, WebACLAction, WebACLRule
+
+
+def _create_WebACLAssociation():
+    class WebACLAssociationProperties(_ResourceProperties):
+        __slots__ = ("ResourceArn", "WebACLId")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLAssociationProperties", _ResourceProperties, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ResourceArn=None, WebACLId=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ResourceArn", ResourceArn)
+            _setattr("WebACLId", WebACLId)
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_WebACLAssociationProperties = create_object_converter(
+        WebACLAssociationProperties
+    )
 
-@attrs(**ATTRSCONFIG)
-class XssMatchSet(Resource):
-    """A Xss Match Set for WAFRegional.
+    class WebACLAssociation(_Resource):
+        """A Web Acl Association for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for WebACLAssociation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-webaclassociation.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::WebACLAssociation"
+
+        Properties: WebACLAssociationProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLAssociation",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_WebACLAssociationProperties},
+            factories={"Properties": WebACLAssociationProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = WebACLAssociationProperties()
+            _setattr("Properties", _convert_WebACLAssociationProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return WebACLAssociation, WebACLAssociationProperties
+
+
+def _create_XssMatchSet():
+    class XssMatchSetFieldToMatch(_PropertyType):
+        """The Field To Match property type for XssMatchSet in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for FieldToMatch
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-xssmatchset-fieldtomatch.html>`_
+        """
+
+        __slots__ = ("Data", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "XssMatchSetFieldToMatch", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Data=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Data", Data)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_XssMatchSetFieldToMatch = create_object_converter(XssMatchSetFieldToMatch)
+
+    class XssMatchSetXssMatchTuple(_PropertyType):
+        """The Xss Match Tuple property type for XssMatchSet in WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for XssMatchTuple
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafregional-xssmatchset-xssmatchtuple.html>`_
+        """
+
+        __slots__ = ("FieldToMatch", "TextTransformation")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "XssMatchSetXssMatchTuple",
+            _PropertyType,
+            __slots__,
+            converters={"FieldToMatch": _convert_XssMatchSetFieldToMatch},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FieldToMatch=None, TextTransformation=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FieldToMatch", _convert_XssMatchSetFieldToMatch(FieldToMatch))
+            _setattr("TextTransformation", TextTransformation)
+            _init_PropertyType(self, kwargs)
+
+    _convert_XssMatchSetXssMatchTuple_list = create_object_list_converter(
+        XssMatchSetXssMatchTuple
+    )
 
-    See Also:
-        `AWS Cloud Formation documentation for XssMatchSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-xssmatchset.html>`_
-    """
+    class XssMatchSetProperties(_ResourceProperties):
+        __slots__ = ("Name", "XssMatchTuples")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "XssMatchSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={"XssMatchTuples": _convert_XssMatchSetXssMatchTuple_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, XssMatchTuples=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _setattr(
+                "XssMatchTuples", _convert_XssMatchSetXssMatchTuple_list(XssMatchTuples)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_XssMatchSetProperties = create_object_converter(XssMatchSetProperties)
+
+    class XssMatchSet(_Resource):
+        """A Xss Match Set for WAFRegional.
+
+        See Also:
+            `AWS Cloud Formation documentation for XssMatchSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafregional-xssmatchset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFRegional::XssMatchSet"
+
+        Properties: XssMatchSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "XssMatchSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_XssMatchSetProperties},
+            factories={"Properties": XssMatchSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = XssMatchSetProperties()
+            _setattr("Properties", _convert_XssMatchSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        XssMatchSet,
+        XssMatchSetProperties,
+        XssMatchSetFieldToMatch,
+        XssMatchSetXssMatchTuple,
+    )
 
-    RESOURCE_TYPE = "AWS::WAFRegional::XssMatchSet"
 
-    Properties: XssMatchSetProperties = attrib(
-        factory=XssMatchSetProperties,
-        converter=create_object_converter(XssMatchSetProperties),
-    )
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "ByteMatchSet": _create_ByteMatchSet,
+        "ByteMatchSetProperties": _create_ByteMatchSet,
+        "ByteMatchSetByteMatchTuple": _create_ByteMatchSet,
+        "ByteMatchSetFieldToMatch": _create_ByteMatchSet,
+        "GeoMatchSet": _create_GeoMatchSet,
+        "GeoMatchSetProperties": _create_GeoMatchSet,
+        "GeoMatchSetGeoMatchConstraint": _create_GeoMatchSet,
+        "IPSet": _create_IPSet,
+        "IPSetProperties": _create_IPSet,
+        "IPSetIPSetDescriptor": _create_IPSet,
+        "RateBasedRule": _create_RateBasedRule,
+        "RateBasedRuleProperties": _create_RateBasedRule,
+        "RateBasedRulePredicate": _create_RateBasedRule,
+        "RegexPatternSet": _create_RegexPatternSet,
+        "RegexPatternSetProperties": _create_RegexPatternSet,
+        "Rule": _create_Rule,
+        "RuleProperties": _create_Rule,
+        "RulePredicate": _create_Rule,
+        "SizeConstraintSet": _create_SizeConstraintSet,
+        "SizeConstraintSetProperties": _create_SizeConstraintSet,
+        "SizeConstraintSetFieldToMatch": _create_SizeConstraintSet,
+        "SizeConstraintSetSizeConstraint": _create_SizeConstraintSet,
+        "SqlInjectionMatchSet": _create_SqlInjectionMatchSet,
+        "SqlInjectionMatchSetProperties": _create_SqlInjectionMatchSet,
+        "SqlInjectionMatchSetFieldToMatch": _create_SqlInjectionMatchSet,
+        "SqlInjectionMatchSetSqlInjectionMatchTuple": _create_SqlInjectionMatchSet,
+        "WebACL": _create_WebACL,
+        "WebACLProperties": _create_WebACL,
+        "WebACLAction": _create_WebACL,
+        "WebACLRule": _create_WebACL,
+        "WebACLAssociation": _create_WebACLAssociation,
+        "WebACLAssociationProperties": _create_WebACLAssociation,
+        "XssMatchSet": _create_XssMatchSet,
+        "XssMatchSetProperties": _create_XssMatchSet,
+        "XssMatchSetFieldToMatch": _create_XssMatchSet,
+        "XssMatchSetXssMatchTuple": _create_XssMatchSet,
+    },
+)
@@ -7,128 +7,3683 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
+
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
 __all__ = [
     "IPSet",
     "IPSetProperties",
+    "IPSetIPAddresses",
+    "IPSetTagList",
     "RegexPatternSet",
     "RegexPatternSetProperties",
+    "RegexPatternSetRegex",
+    "RegexPatternSetRegularExpressionList",
+    "RegexPatternSetTagList",
     "RuleGroup",
     "RuleGroupProperties",
+    "RuleGroupAllowAction",
+    "RuleGroupAllQueryArguments",
+    "RuleGroupAndStatementOne",
+    "RuleGroupAndStatementTwo",
+    "RuleGroupBlockAction",
+    "RuleGroupBody",
+    "RuleGroupByteMatchStatement",
+    "RuleGroupCountAction",
+    "RuleGroupCountryCodes",
+    "RuleGroupFieldToMatch",
+    "RuleGroupGeoMatchStatement",
+    "RuleGroupIPSetReferenceStatement",
+    "RuleGroupMethod",
+    "RuleGroupNotStatementOne",
+    "RuleGroupNotStatementTwo",
+    "RuleGroupOrStatementOne",
+    "RuleGroupOrStatementTwo",
+    "RuleGroupQueryString",
+    "RuleGroupRateBasedStatementOne",
+    "RuleGroupRateBasedStatementTwo",
+    "RuleGroupRegexPatternSetReferenceStatement",
+    "RuleGroupRule",
+    "RuleGroupRuleAction",
+    "RuleGroupRules",
+    "RuleGroupSingleHeader",
+    "RuleGroupSingleQueryArgument",
+    "RuleGroupSizeConstraintStatement",
+    "RuleGroupSqliMatchStatement",
+    "RuleGroupStatementOne",
+    "RuleGroupStatementThree",
+    "RuleGroupStatementThrees",
+    "RuleGroupStatementTwo",
+    "RuleGroupStatementTwos",
+    "RuleGroupTagList",
+    "RuleGroupTextTransformation",
+    "RuleGroupTextTransformations",
+    "RuleGroupUriPath",
+    "RuleGroupVisibilityConfig",
+    "RuleGroupXssMatchStatement",
     "WebACL",
     "WebACLProperties",
+    "WebACLAllowAction",
+    "WebACLAllQueryArguments",
+    "WebACLAndStatementOne",
+    "WebACLAndStatementTwo",
+    "WebACLBlockAction",
+    "WebACLBody",
+    "WebACLByteMatchStatement",
+    "WebACLCountAction",
+    "WebACLCountryCodes",
+    "WebACLDefaultAction",
+    "WebACLExcludedRule",
+    "WebACLExcludedRules",
+    "WebACLFieldToMatch",
+    "WebACLGeoMatchStatement",
+    "WebACLIPSetReferenceStatement",
+    "WebACLManagedRuleGroupStatement",
+    "WebACLMethod",
+    "WebACLNoneAction",
+    "WebACLNotStatementOne",
+    "WebACLNotStatementTwo",
+    "WebACLOrStatementOne",
+    "WebACLOrStatementTwo",
+    "WebACLQueryString",
+    "WebACLRateBasedStatementOne",
+    "WebACLRateBasedStatementTwo",
+    "WebACLRegexPatternSetReferenceStatement",
+    "WebACLRule",
+    "WebACLRuleAction",
+    "WebACLRuleGroupReferenceStatement",
+    "WebACLRules",
+    "WebACLSingleHeader",
+    "WebACLSingleQueryArgument",
+    "WebACLSizeConstraintStatement",
+    "WebACLSqliMatchStatement",
+    "WebACLStatementOne",
+    "WebACLStatementThree",
+    "WebACLStatementThrees",
+    "WebACLStatementTwo",
+    "WebACLStatementTwos",
+    "WebACLTagList",
+    "WebACLTextTransformation",
+    "WebACLTextTransformations",
+    "WebACLUriPath",
+    "WebACLVisibilityConfig",
+    "WebACLXssMatchStatement",
 ]
 
 
-@attrs(**ATTRSCONFIG)
-class IPSetProperties(ResourceProperties):
-    Addresses = attrib(default=None)
-    Description = attrib(default=None)
-    IPAddressVersion = attrib(default=None)
-    Name = attrib(default=None)
-    Scope = attrib(default=None)
-    Tags = attrib(default=None)
+def _create_IPSet():
+    class IPSetIPAddresses(_PropertyType):
+        """The Ip Addresses property type for IPSet in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for IPAddresses
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-ipset-ipaddresses.html>`_
+        """
+
+        __slots__ = ("IPAddresses",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IPSetIPAddresses", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, IPAddresses=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("IPAddresses", IPAddresses)
+            _init_PropertyType(self, kwargs)
+
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class IPSetTagList(_PropertyType):
+        """The Tag List property type for IPSet in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagList
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-ipset-taglist.html>`_
+        """
+
+        __slots__ = ("TagList",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IPSetTagList",
+            _PropertyType,
+            __slots__,
+            converters={"TagList": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TagList=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TagList", _convert_Tag_list(TagList))
+            _init_PropertyType(self, kwargs)
+
+    _convert_IPSetIPAddresses = create_object_converter(IPSetIPAddresses)
+    _convert_IPSetTagList = create_object_converter(IPSetTagList)
+
+    class IPSetProperties(_ResourceProperties):
+        __slots__ = (
+            "Addresses",
+            "Description",
+            "IPAddressVersion",
+            "Name",
+            "Scope",
+            "Tags",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IPSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Addresses": _convert_IPSetIPAddresses,
+                "Tags": _convert_IPSetTagList,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Addresses=None,
+            Description=None,
+            IPAddressVersion=None,
+            Name=None,
+            Scope=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Addresses", _convert_IPSetIPAddresses(Addresses))
+            _setattr("Description", Description)
+            _setattr("IPAddressVersion", IPAddressVersion)
+            _setattr("Name", Name)
+            _setattr("Scope", Scope)
+            _setattr("Tags", _convert_IPSetTagList(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_IPSetProperties = create_object_converter(IPSetProperties)
+
+    class IPSet(_Resource):
+        """A Ip Set for WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for IPSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafv2-ipset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFv2::IPSet"
+        # NB: IPSet stores tags in a format that we don't support
+        TAG_FORMAT = None
+
+        Properties: IPSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "IPSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_IPSetProperties},
+            factories={"Properties": IPSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = IPSetProperties()
+            _setattr("Properties", _convert_IPSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return IPSet, IPSetProperties, IPSetIPAddresses, IPSetTagList
+
+
+def _create_RegexPatternSet():
+    class RegexPatternSetRegex(_PropertyType):
+        """The Regex property type for RegexPatternSet in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Regex
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-regexpatternset-regex.html>`_
+        """
+
+        __slots__ = ("RegexString",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RegexPatternSetRegex", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RegexString=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("RegexString", RegexString)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RegexPatternSetRegex_list = create_object_list_converter(
+        RegexPatternSetRegex
+    )
+
+    class RegexPatternSetRegularExpressionList(_PropertyType):
+        """The Regular Expression List property type for RegexPatternSet in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RegularExpressionList
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-regexpatternset-regularexpressionlist.html>`_
+        """
+
+        __slots__ = ("RegularExpressionList",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RegexPatternSetRegularExpressionList",
+            _PropertyType,
+            __slots__,
+            converters={"RegularExpressionList": _convert_RegexPatternSetRegex_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, RegularExpressionList=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "RegularExpressionList",
+                _convert_RegexPatternSetRegex_list(RegularExpressionList),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class RegexPatternSetTagList(_PropertyType):
+        """The Tag List property type for RegexPatternSet in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagList
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-regexpatternset-taglist.html>`_
+        """
+
+        __slots__ = ("TagList",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RegexPatternSetTagList",
+            _PropertyType,
+            __slots__,
+            converters={"TagList": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TagList=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TagList", _convert_Tag_list(TagList))
+            _init_PropertyType(self, kwargs)
+
+    _convert_RegexPatternSetRegularExpressionList = create_object_converter(
+        RegexPatternSetRegularExpressionList
+    )
+    _convert_RegexPatternSetTagList = create_object_converter(RegexPatternSetTagList)
+
+    class RegexPatternSetProperties(_ResourceProperties):
+        __slots__ = ("Description", "Name", "RegularExpressionList", "Scope", "Tags")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RegexPatternSetProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "RegularExpressionList": _convert_RegexPatternSetRegularExpressionList,
+                "Tags": _convert_RegexPatternSetTagList,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Description=None,
+            Name=None,
+            RegularExpressionList=None,
+            Scope=None,
+            Tags=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr(
+                "RegularExpressionList",
+                _convert_RegexPatternSetRegularExpressionList(RegularExpressionList),
+            )
+            _setattr("Scope", Scope)
+            _setattr("Tags", _convert_RegexPatternSetTagList(Tags))
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RegexPatternSetProperties = create_object_converter(
+        RegexPatternSetProperties
+    )
+
+    class RegexPatternSet(_Resource):
+        """A Regex Pattern Set for WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RegexPatternSet
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafv2-regexpatternset.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFv2::RegexPatternSet"
+        # NB: RegexPatternSet stores tags in a format that we don't support
+        TAG_FORMAT = None
+
+        Properties: RegexPatternSetProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RegexPatternSet",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RegexPatternSetProperties},
+            factories={"Properties": RegexPatternSetProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RegexPatternSetProperties()
+            _setattr("Properties", _convert_RegexPatternSetProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        RegexPatternSet,
+        RegexPatternSetProperties,
+        RegexPatternSetRegex,
+        RegexPatternSetRegularExpressionList,
+        RegexPatternSetTagList,
+    )
+
+
+def _create_RuleGroup():
+    class RuleGroupAllQueryArguments(_PropertyType):
+        """The All Query Arguments property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AllQueryArguments
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-allqueryarguments.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupAllQueryArguments", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupAllowAction(_PropertyType):
+        """The Allow Action property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AllowAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-allowaction.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupAllowAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupSingleHeader(_PropertyType):
+        """The Single Header property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SingleHeader
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-singleheader.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupSingleHeader", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupSingleQueryArgument(_PropertyType):
+        """The Single Query Argument property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SingleQueryArgument
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-singlequeryargument.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupSingleQueryArgument", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupUriPath(_PropertyType):
+        """The Uri Path property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for UriPath
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-uripath.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupUriPath", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupQueryString(_PropertyType):
+        """The Query String property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for QueryString
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-querystring.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupQueryString", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupBody(_PropertyType):
+        """The Body property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Body
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-body.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupBody", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupMethod(_PropertyType):
+        """The Method property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Method
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-method.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupMethod", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupAllQueryArguments = create_object_converter(
+        RuleGroupAllQueryArguments
+    )
+    _convert_RuleGroupBody = create_object_converter(RuleGroupBody)
+    _convert_RuleGroupMethod = create_object_converter(RuleGroupMethod)
+    _convert_RuleGroupQueryString = create_object_converter(RuleGroupQueryString)
+    _convert_RuleGroupSingleHeader = create_object_converter(RuleGroupSingleHeader)
+    _convert_RuleGroupSingleQueryArgument = create_object_converter(
+        RuleGroupSingleQueryArgument
+    )
+    _convert_RuleGroupUriPath = create_object_converter(RuleGroupUriPath)
+
+    class RuleGroupFieldToMatch(_PropertyType):
+        """The Field To Match property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FieldToMatch
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-fieldtomatch.html>`_
+        """
+
+        __slots__ = (
+            "AllQueryArguments",
+            "Body",
+            "Method",
+            "QueryString",
+            "SingleHeader",
+            "SingleQueryArgument",
+            "UriPath",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupFieldToMatch",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AllQueryArguments": _convert_RuleGroupAllQueryArguments,
+                "Body": _convert_RuleGroupBody,
+                "Method": _convert_RuleGroupMethod,
+                "QueryString": _convert_RuleGroupQueryString,
+                "SingleHeader": _convert_RuleGroupSingleHeader,
+                "SingleQueryArgument": _convert_RuleGroupSingleQueryArgument,
+                "UriPath": _convert_RuleGroupUriPath,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllQueryArguments=None,
+            Body=None,
+            Method=None,
+            QueryString=None,
+            SingleHeader=None,
+            SingleQueryArgument=None,
+            UriPath=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AllQueryArguments",
+                _convert_RuleGroupAllQueryArguments(AllQueryArguments),
+            )
+            _setattr("Body", _convert_RuleGroupBody(Body))
+            _setattr("Method", _convert_RuleGroupMethod(Method))
+            _setattr("QueryString", _convert_RuleGroupQueryString(QueryString))
+            _setattr("SingleHeader", _convert_RuleGroupSingleHeader(SingleHeader))
+            _setattr(
+                "SingleQueryArgument",
+                _convert_RuleGroupSingleQueryArgument(SingleQueryArgument),
+            )
+            _setattr("UriPath", _convert_RuleGroupUriPath(UriPath))
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupTextTransformation(_PropertyType):
+        """The Text Transformation property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TextTransformation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-texttransformation.html>`_
+        """
+
+        __slots__ = ("Priority", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupTextTransformation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Priority=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Priority", Priority)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupTextTransformation_list = create_object_list_converter(
+        RuleGroupTextTransformation
+    )
+
+    class RuleGroupTextTransformations(_PropertyType):
+        """The Text Transformations property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TextTransformations
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-texttransformations.html>`_
+        """
+
+        __slots__ = ("TextTransformations",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupTextTransformations",
+            _PropertyType,
+            __slots__,
+            converters={
+                "TextTransformations": _convert_RuleGroupTextTransformation_list
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TextTransformations=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "TextTransformations",
+                _convert_RuleGroupTextTransformation_list(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupFieldToMatch = create_object_converter(RuleGroupFieldToMatch)
+    _convert_RuleGroupTextTransformations = create_object_converter(
+        RuleGroupTextTransformations
+    )
+
+    class RuleGroupByteMatchStatement(_PropertyType):
+        """The Byte Match Statement property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ByteMatchStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-bytematchstatement.html>`_
+        """
+
+        __slots__ = (
+            "FieldToMatch",
+            "PositionalConstraint",
+            "SearchString",
+            "SearchStringBase64",
+            "TextTransformations",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupByteMatchStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_RuleGroupFieldToMatch,
+                "TextTransformations": _convert_RuleGroupTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            FieldToMatch=None,
+            PositionalConstraint=None,
+            SearchString=None,
+            SearchStringBase64=None,
+            TextTransformations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FieldToMatch", _convert_RuleGroupFieldToMatch(FieldToMatch))
+            _setattr("PositionalConstraint", PositionalConstraint)
+            _setattr("SearchString", SearchString)
+            _setattr("SearchStringBase64", SearchStringBase64)
+            _setattr(
+                "TextTransformations",
+                _convert_RuleGroupTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupSqliMatchStatement(_PropertyType):
+        """The Sqli Match Statement property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SqliMatchStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-sqlimatchstatement.html>`_
+        """
+
+        __slots__ = ("FieldToMatch", "TextTransformations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupSqliMatchStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_RuleGroupFieldToMatch,
+                "TextTransformations": _convert_RuleGroupTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FieldToMatch=None, TextTransformations=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FieldToMatch", _convert_RuleGroupFieldToMatch(FieldToMatch))
+            _setattr(
+                "TextTransformations",
+                _convert_RuleGroupTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupXssMatchStatement(_PropertyType):
+        """The Xss Match Statement property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for XssMatchStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-xssmatchstatement.html>`_
+        """
+
+        __slots__ = ("FieldToMatch", "TextTransformations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupXssMatchStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_RuleGroupFieldToMatch,
+                "TextTransformations": _convert_RuleGroupTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FieldToMatch=None, TextTransformations=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FieldToMatch", _convert_RuleGroupFieldToMatch(FieldToMatch))
+            _setattr(
+                "TextTransformations",
+                _convert_RuleGroupTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
 
+    class RuleGroupSizeConstraintStatement(_PropertyType):
+        """The Size Constraint Statement property type for RuleGroup in WAFv2.
 
-@attrs(**ATTRSCONFIG)
-class IPSet(Resource):
-    """A Ip Set for WAFv2.
+        See Also:
+            `AWS Cloud Formation documentation for SizeConstraintStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-sizeconstraintstatement.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for IPSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafv2-ipset.html>`_
-    """
+        __slots__ = (
+            "ComparisonOperator",
+            "FieldToMatch",
+            "Size",
+            "TextTransformations",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupSizeConstraintStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_RuleGroupFieldToMatch,
+                "TextTransformations": _convert_RuleGroupTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::WAFv2::IPSet"
+        def __init__(
+            self,
+            *,
+            ComparisonOperator=None,
+            FieldToMatch=None,
+            Size=None,
+            TextTransformations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComparisonOperator", ComparisonOperator)
+            _setattr("FieldToMatch", _convert_RuleGroupFieldToMatch(FieldToMatch))
+            _setattr("Size", Size)
+            _setattr(
+                "TextTransformations",
+                _convert_RuleGroupTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
 
-    Properties: IPSetProperties = attrib(
-        factory=IPSetProperties, converter=create_object_converter(IPSetProperties)
+    class RuleGroupCountryCodes(_PropertyType):
+        """The Country Codes property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CountryCodes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-countrycodes.html>`_
+        """
+
+        __slots__ = ("CountryCodes",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupCountryCodes", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CountryCodes=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CountryCodes", CountryCodes)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupCountryCodes = create_object_converter(RuleGroupCountryCodes)
+
+    class RuleGroupGeoMatchStatement(_PropertyType):
+        """The Geo Match Statement property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for GeoMatchStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-geomatchstatement.html>`_
+        """
+
+        __slots__ = ("CountryCodes",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupGeoMatchStatement",
+            _PropertyType,
+            __slots__,
+            converters={"CountryCodes": _convert_RuleGroupCountryCodes},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CountryCodes=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CountryCodes", _convert_RuleGroupCountryCodes(CountryCodes))
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupIPSetReferenceStatement(_PropertyType):
+        """The Ip Set Reference Statement property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for IPSetReferenceStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-ipsetreferencestatement.html>`_
+        """
+
+        __slots__ = ("Arn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupIPSetReferenceStatement", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Arn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupRegexPatternSetReferenceStatement(_PropertyType):
+        """The Regex Pattern Set Reference Statement property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RegexPatternSetReferenceStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-regexpatternsetreferencestatement.html>`_
+        """
+
+        __slots__ = ("Arn", "FieldToMatch", "TextTransformations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupRegexPatternSetReferenceStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_RuleGroupFieldToMatch,
+                "TextTransformations": _convert_RuleGroupTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Arn=None, FieldToMatch=None, TextTransformations=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _setattr("FieldToMatch", _convert_RuleGroupFieldToMatch(FieldToMatch))
+            _setattr(
+                "TextTransformations",
+                _convert_RuleGroupTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupByteMatchStatement = create_object_converter(
+        RuleGroupByteMatchStatement
+    )
+    _convert_RuleGroupGeoMatchStatement = create_object_converter(
+        RuleGroupGeoMatchStatement
+    )
+    _convert_RuleGroupIPSetReferenceStatement = create_object_converter(
+        RuleGroupIPSetReferenceStatement
+    )
+    _convert_RuleGroupRegexPatternSetReferenceStatement = create_object_converter(
+        RuleGroupRegexPatternSetReferenceStatement
+    )
+    _convert_RuleGroupSizeConstraintStatement = create_object_converter(
+        RuleGroupSizeConstraintStatement
+    )
+    _convert_RuleGroupSqliMatchStatement = create_object_converter(
+        RuleGroupSqliMatchStatement
+    )
+    _convert_RuleGroupXssMatchStatement = create_object_converter(
+        RuleGroupXssMatchStatement
+    )
+
+    class RuleGroupStatementThree(_PropertyType):
+        """The Statement Three property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementThree
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-statementthree.html>`_
+        """
+
+        __slots__ = (
+            "ByteMatchStatement",
+            "GeoMatchStatement",
+            "IPSetReferenceStatement",
+            "RegexPatternSetReferenceStatement",
+            "SizeConstraintStatement",
+            "SqliMatchStatement",
+            "XssMatchStatement",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupStatementThree",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ByteMatchStatement": _convert_RuleGroupByteMatchStatement,
+                "GeoMatchStatement": _convert_RuleGroupGeoMatchStatement,
+                "IPSetReferenceStatement": _convert_RuleGroupIPSetReferenceStatement,
+                "RegexPatternSetReferenceStatement": _convert_RuleGroupRegexPatternSetReferenceStatement,
+                "SizeConstraintStatement": _convert_RuleGroupSizeConstraintStatement,
+                "SqliMatchStatement": _convert_RuleGroupSqliMatchStatement,
+                "XssMatchStatement": _convert_RuleGroupXssMatchStatement,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ByteMatchStatement=None,
+            GeoMatchStatement=None,
+            IPSetReferenceStatement=None,
+            RegexPatternSetReferenceStatement=None,
+            SizeConstraintStatement=None,
+            SqliMatchStatement=None,
+            XssMatchStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ByteMatchStatement",
+                _convert_RuleGroupByteMatchStatement(ByteMatchStatement),
+            )
+            _setattr(
+                "GeoMatchStatement",
+                _convert_RuleGroupGeoMatchStatement(GeoMatchStatement),
+            )
+            _setattr(
+                "IPSetReferenceStatement",
+                _convert_RuleGroupIPSetReferenceStatement(IPSetReferenceStatement),
+            )
+            _setattr(
+                "RegexPatternSetReferenceStatement",
+                _convert_RuleGroupRegexPatternSetReferenceStatement(
+                    RegexPatternSetReferenceStatement
+                ),
+            )
+            _setattr(
+                "SizeConstraintStatement",
+                _convert_RuleGroupSizeConstraintStatement(SizeConstraintStatement),
+            )
+            _setattr(
+                "SqliMatchStatement",
+                _convert_RuleGroupSqliMatchStatement(SqliMatchStatement),
+            )
+            _setattr(
+                "XssMatchStatement",
+                _convert_RuleGroupXssMatchStatement(XssMatchStatement),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupStatementThree = create_object_converter(RuleGroupStatementThree)
+
+    class RuleGroupRateBasedStatementTwo(_PropertyType):
+        """The Rate Based Statement Two property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RateBasedStatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-ratebasedstatementtwo.html>`_
+        """
+
+        __slots__ = ("AggregateKeyType", "Limit", "ScopeDownStatement")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupRateBasedStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={"ScopeDownStatement": _convert_RuleGroupStatementThree},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AggregateKeyType=None,
+            Limit=None,
+            ScopeDownStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AggregateKeyType", AggregateKeyType)
+            _setattr("Limit", Limit)
+            _setattr(
+                "ScopeDownStatement",
+                _convert_RuleGroupStatementThree(ScopeDownStatement),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupStatementThree_list = create_object_list_converter(
+        RuleGroupStatementThree
+    )
+
+    class RuleGroupStatementThrees(_PropertyType):
+        """The Statement Threes property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementThrees
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-statementthrees.html>`_
+        """
+
+        __slots__ = ("StatementThrees",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupStatementThrees",
+            _PropertyType,
+            __slots__,
+            converters={"StatementThrees": _convert_RuleGroupStatementThree_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, StatementThrees=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "StatementThrees",
+                _convert_RuleGroupStatementThree_list(StatementThrees),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupStatementThrees = create_object_converter(
+        RuleGroupStatementThrees
+    )
+
+    class RuleGroupAndStatementTwo(_PropertyType):
+        """The And Statement Two property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AndStatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-andstatementtwo.html>`_
+        """
+
+        __slots__ = ("Statements",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupAndStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={"Statements": _convert_RuleGroupStatementThrees},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statements=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statements", _convert_RuleGroupStatementThrees(Statements))
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupOrStatementTwo(_PropertyType):
+        """The Or Statement Two property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for OrStatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-orstatementtwo.html>`_
+        """
+
+        __slots__ = ("Statements",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupOrStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={"Statements": _convert_RuleGroupStatementThrees},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statements=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statements", _convert_RuleGroupStatementThrees(Statements))
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupNotStatementTwo(_PropertyType):
+        """The Not Statement Two property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotStatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-notstatementtwo.html>`_
+        """
+
+        __slots__ = ("Statement",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupNotStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={"Statement": _convert_RuleGroupStatementThree},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statement=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statement", _convert_RuleGroupStatementThree(Statement))
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupAndStatementTwo = create_object_converter(
+        RuleGroupAndStatementTwo
+    )
+    _convert_RuleGroupNotStatementTwo = create_object_converter(
+        RuleGroupNotStatementTwo
+    )
+    _convert_RuleGroupOrStatementTwo = create_object_converter(RuleGroupOrStatementTwo)
+    _convert_RuleGroupRateBasedStatementTwo = create_object_converter(
+        RuleGroupRateBasedStatementTwo
+    )
+
+    class RuleGroupStatementTwo(_PropertyType):
+        """The Statement Two property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-statementtwo.html>`_
+        """
+
+        __slots__ = (
+            "AndStatement",
+            "ByteMatchStatement",
+            "GeoMatchStatement",
+            "IPSetReferenceStatement",
+            "NotStatement",
+            "OrStatement",
+            "RateBasedStatement",
+            "RegexPatternSetReferenceStatement",
+            "SizeConstraintStatement",
+            "SqliMatchStatement",
+            "XssMatchStatement",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AndStatement": _convert_RuleGroupAndStatementTwo,
+                "ByteMatchStatement": _convert_RuleGroupByteMatchStatement,
+                "GeoMatchStatement": _convert_RuleGroupGeoMatchStatement,
+                "IPSetReferenceStatement": _convert_RuleGroupIPSetReferenceStatement,
+                "NotStatement": _convert_RuleGroupNotStatementTwo,
+                "OrStatement": _convert_RuleGroupOrStatementTwo,
+                "RateBasedStatement": _convert_RuleGroupRateBasedStatementTwo,
+                "RegexPatternSetReferenceStatement": _convert_RuleGroupRegexPatternSetReferenceStatement,
+                "SizeConstraintStatement": _convert_RuleGroupSizeConstraintStatement,
+                "SqliMatchStatement": _convert_RuleGroupSqliMatchStatement,
+                "XssMatchStatement": _convert_RuleGroupXssMatchStatement,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AndStatement=None,
+            ByteMatchStatement=None,
+            GeoMatchStatement=None,
+            IPSetReferenceStatement=None,
+            NotStatement=None,
+            OrStatement=None,
+            RateBasedStatement=None,
+            RegexPatternSetReferenceStatement=None,
+            SizeConstraintStatement=None,
+            SqliMatchStatement=None,
+            XssMatchStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AndStatement", _convert_RuleGroupAndStatementTwo(AndStatement))
+            _setattr(
+                "ByteMatchStatement",
+                _convert_RuleGroupByteMatchStatement(ByteMatchStatement),
+            )
+            _setattr(
+                "GeoMatchStatement",
+                _convert_RuleGroupGeoMatchStatement(GeoMatchStatement),
+            )
+            _setattr(
+                "IPSetReferenceStatement",
+                _convert_RuleGroupIPSetReferenceStatement(IPSetReferenceStatement),
+            )
+            _setattr("NotStatement", _convert_RuleGroupNotStatementTwo(NotStatement))
+            _setattr("OrStatement", _convert_RuleGroupOrStatementTwo(OrStatement))
+            _setattr(
+                "RateBasedStatement",
+                _convert_RuleGroupRateBasedStatementTwo(RateBasedStatement),
+            )
+            _setattr(
+                "RegexPatternSetReferenceStatement",
+                _convert_RuleGroupRegexPatternSetReferenceStatement(
+                    RegexPatternSetReferenceStatement
+                ),
+            )
+            _setattr(
+                "SizeConstraintStatement",
+                _convert_RuleGroupSizeConstraintStatement(SizeConstraintStatement),
+            )
+            _setattr(
+                "SqliMatchStatement",
+                _convert_RuleGroupSqliMatchStatement(SqliMatchStatement),
+            )
+            _setattr(
+                "XssMatchStatement",
+                _convert_RuleGroupXssMatchStatement(XssMatchStatement),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupStatementTwo_list = create_object_list_converter(
+        RuleGroupStatementTwo
     )
 
+    class RuleGroupStatementTwos(_PropertyType):
+        """The Statement Twos property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementTwos
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-statementtwos.html>`_
+        """
+
+        __slots__ = ("StatementTwos",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupStatementTwos",
+            _PropertyType,
+            __slots__,
+            converters={"StatementTwos": _convert_RuleGroupStatementTwo_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, StatementTwos=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "StatementTwos", _convert_RuleGroupStatementTwo_list(StatementTwos)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupStatementTwos = create_object_converter(RuleGroupStatementTwos)
+
+    class RuleGroupAndStatementOne(_PropertyType):
+        """The And Statement One property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AndStatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-andstatementone.html>`_
+        """
+
+        __slots__ = ("Statements",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupAndStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={"Statements": _convert_RuleGroupStatementTwos},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statements=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statements", _convert_RuleGroupStatementTwos(Statements))
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupBlockAction(_PropertyType):
+        """The Block Action property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for BlockAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-blockaction.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupBlockAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupCountAction(_PropertyType):
+        """The Count Action property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CountAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-countaction.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupCountAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupStatementTwo = create_object_converter(RuleGroupStatementTwo)
+
+    class RuleGroupNotStatementOne(_PropertyType):
+        """The Not Statement One property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotStatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-notstatementone.html>`_
+        """
+
+        __slots__ = ("Statement",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupNotStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={"Statement": _convert_RuleGroupStatementTwo},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statement=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statement", _convert_RuleGroupStatementTwo(Statement))
+            _init_PropertyType(self, kwargs)
+
+    class RuleGroupOrStatementOne(_PropertyType):
+        """The Or Statement One property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for OrStatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-orstatementone.html>`_
+        """
+
+        __slots__ = ("Statements",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupOrStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={"Statements": _convert_RuleGroupStatementTwos},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class RegexPatternSetProperties(ResourceProperties):
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    RegularExpressionList = attrib(default=None)
-    Scope = attrib(default=None)
-    Tags = attrib(default=None)
+        def __init__(self, *, Statements=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statements", _convert_RuleGroupStatementTwos(Statements))
+            _init_PropertyType(self, kwargs)
 
+    class RuleGroupRateBasedStatementOne(_PropertyType):
+        """The Rate Based Statement One property type for RuleGroup in WAFv2.
 
-@attrs(**ATTRSCONFIG)
-class RegexPatternSet(Resource):
-    """A Regex Pattern Set for WAFv2.
+        See Also:
+            `AWS Cloud Formation documentation for RateBasedStatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-ratebasedstatementone.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for RegexPatternSet
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafv2-regexpatternset.html>`_
-    """
+        __slots__ = ("AggregateKeyType", "Limit", "ScopeDownStatement")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupRateBasedStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={"ScopeDownStatement": _convert_RuleGroupStatementTwo},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::WAFv2::RegexPatternSet"
+        def __init__(
+            self,
+            *,
+            AggregateKeyType=None,
+            Limit=None,
+            ScopeDownStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AggregateKeyType", AggregateKeyType)
+            _setattr("Limit", Limit)
+            _setattr(
+                "ScopeDownStatement", _convert_RuleGroupStatementTwo(ScopeDownStatement)
+            )
+            _init_PropertyType(self, kwargs)
 
-    Properties: RegexPatternSetProperties = attrib(
-        factory=RegexPatternSetProperties,
-        converter=create_object_converter(RegexPatternSetProperties),
+    _convert_RuleGroupAndStatementOne = create_object_converter(
+        RuleGroupAndStatementOne
     )
+    _convert_RuleGroupNotStatementOne = create_object_converter(
+        RuleGroupNotStatementOne
+    )
+    _convert_RuleGroupOrStatementOne = create_object_converter(RuleGroupOrStatementOne)
+    _convert_RuleGroupRateBasedStatementOne = create_object_converter(
+        RuleGroupRateBasedStatementOne
+    )
+
+    class RuleGroupStatementOne(_PropertyType):
+        """The Statement One property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-statementone.html>`_
+        """
+
+        __slots__ = (
+            "AndStatement",
+            "ByteMatchStatement",
+            "GeoMatchStatement",
+            "IPSetReferenceStatement",
+            "NotStatement",
+            "OrStatement",
+            "RateBasedStatement",
+            "RegexPatternSetReferenceStatement",
+            "SizeConstraintStatement",
+            "SqliMatchStatement",
+            "XssMatchStatement",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AndStatement": _convert_RuleGroupAndStatementOne,
+                "ByteMatchStatement": _convert_RuleGroupByteMatchStatement,
+                "GeoMatchStatement": _convert_RuleGroupGeoMatchStatement,
+                "IPSetReferenceStatement": _convert_RuleGroupIPSetReferenceStatement,
+                "NotStatement": _convert_RuleGroupNotStatementOne,
+                "OrStatement": _convert_RuleGroupOrStatementOne,
+                "RateBasedStatement": _convert_RuleGroupRateBasedStatementOne,
+                "RegexPatternSetReferenceStatement": _convert_RuleGroupRegexPatternSetReferenceStatement,
+                "SizeConstraintStatement": _convert_RuleGroupSizeConstraintStatement,
+                "SqliMatchStatement": _convert_RuleGroupSqliMatchStatement,
+                "XssMatchStatement": _convert_RuleGroupXssMatchStatement,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AndStatement=None,
+            ByteMatchStatement=None,
+            GeoMatchStatement=None,
+            IPSetReferenceStatement=None,
+            NotStatement=None,
+            OrStatement=None,
+            RateBasedStatement=None,
+            RegexPatternSetReferenceStatement=None,
+            SizeConstraintStatement=None,
+            SqliMatchStatement=None,
+            XssMatchStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AndStatement", _convert_RuleGroupAndStatementOne(AndStatement))
+            _setattr(
+                "ByteMatchStatement",
+                _convert_RuleGroupByteMatchStatement(ByteMatchStatement),
+            )
+            _setattr(
+                "GeoMatchStatement",
+                _convert_RuleGroupGeoMatchStatement(GeoMatchStatement),
+            )
+            _setattr(
+                "IPSetReferenceStatement",
+                _convert_RuleGroupIPSetReferenceStatement(IPSetReferenceStatement),
+            )
+            _setattr("NotStatement", _convert_RuleGroupNotStatementOne(NotStatement))
+            _setattr("OrStatement", _convert_RuleGroupOrStatementOne(OrStatement))
+            _setattr(
+                "RateBasedStatement",
+                _convert_RuleGroupRateBasedStatementOne(RateBasedStatement),
+            )
+            _setattr(
+                "RegexPatternSetReferenceStatement",
+                _convert_RuleGroupRegexPatternSetReferenceStatement(
+                    RegexPatternSetReferenceStatement
+                ),
+            )
+            _setattr(
+                "SizeConstraintStatement",
+                _convert_RuleGroupSizeConstraintStatement(SizeConstraintStatement),
+            )
+            _setattr(
+                "SqliMatchStatement",
+                _convert_RuleGroupSqliMatchStatement(SqliMatchStatement),
+            )
+            _setattr(
+                "XssMatchStatement",
+                _convert_RuleGroupXssMatchStatement(XssMatchStatement),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupAllowAction = create_object_converter(RuleGroupAllowAction)
+    _convert_RuleGroupBlockAction = create_object_converter(RuleGroupBlockAction)
+    _convert_RuleGroupCountAction = create_object_converter(RuleGroupCountAction)
 
+    class RuleGroupRuleAction(_PropertyType):
+        """The Rule Action property type for RuleGroup in WAFv2.
 
-@attrs(**ATTRSCONFIG)
-class RuleGroupProperties(ResourceProperties):
-    Capacity = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    Rules = attrib(default=None)
-    Scope = attrib(default=None)
-    Tags = attrib(default=None)
-    VisibilityConfig = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for RuleAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-ruleaction.html>`_
+        """
 
+        __slots__ = ("Allow", "Block", "Count")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupRuleAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Allow": _convert_RuleGroupAllowAction,
+                "Block": _convert_RuleGroupBlockAction,
+                "Count": _convert_RuleGroupCountAction,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class RuleGroup(Resource):
-    """A Rule Group for WAFv2.
+        def __init__(self, *, Allow=None, Block=None, Count=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Allow", _convert_RuleGroupAllowAction(Allow))
+            _setattr("Block", _convert_RuleGroupBlockAction(Block))
+            _setattr("Count", _convert_RuleGroupCountAction(Count))
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for RuleGroup
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafv2-rulegroup.html>`_
-    """
+    class RuleGroupVisibilityConfig(_PropertyType):
+        """The Visibility Config property type for RuleGroup in WAFv2.
 
-    RESOURCE_TYPE = "AWS::WAFv2::RuleGroup"
+        See Also:
+            `AWS Cloud Formation documentation for VisibilityConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-visibilityconfig.html>`_
+        """
 
-    Properties: RuleGroupProperties = attrib(
-        factory=RuleGroupProperties,
-        converter=create_object_converter(RuleGroupProperties),
+        __slots__ = ("CloudWatchMetricsEnabled", "MetricName", "SampledRequestsEnabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupVisibilityConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CloudWatchMetricsEnabled=None,
+            MetricName=None,
+            SampledRequestsEnabled=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudWatchMetricsEnabled", CloudWatchMetricsEnabled)
+            _setattr("MetricName", MetricName)
+            _setattr("SampledRequestsEnabled", SampledRequestsEnabled)
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupRuleAction = create_object_converter(RuleGroupRuleAction)
+    _convert_RuleGroupStatementOne = create_object_converter(RuleGroupStatementOne)
+    _convert_RuleGroupVisibilityConfig = create_object_converter(
+        RuleGroupVisibilityConfig
     )
 
+    class RuleGroupRule(_PropertyType):
+        """The Rule property type for RuleGroup in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Rule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-rule.html>`_
+        """
+
+        __slots__ = ("Action", "Name", "Priority", "Statement", "VisibilityConfig")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Action": _convert_RuleGroupRuleAction,
+                "Statement": _convert_RuleGroupStatementOne,
+                "VisibilityConfig": _convert_RuleGroupVisibilityConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Action=None,
+            Name=None,
+            Priority=None,
+            Statement=None,
+            VisibilityConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", _convert_RuleGroupRuleAction(Action))
+            _setattr("Name", Name)
+            _setattr("Priority", Priority)
+            _setattr("Statement", _convert_RuleGroupStatementOne(Statement))
+            _setattr(
+                "VisibilityConfig", _convert_RuleGroupVisibilityConfig(VisibilityConfig)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupRule_list = create_object_list_converter(RuleGroupRule)
+
+    class RuleGroupRules(_PropertyType):
+        """The Rules property type for RuleGroup in WAFv2.
 
-@attrs(**ATTRSCONFIG)
-class WebACLProperties(ResourceProperties):
-    DefaultAction = attrib(default=None)
-    Description = attrib(default=None)
-    Name = attrib(default=None)
-    Rules = attrib(default=None)
-    Scope = attrib(default=None)
-    Tags = attrib(default=None)
-    VisibilityConfig = attrib(default=None)
+        See Also:
+            `AWS Cloud Formation documentation for Rules
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-rules.html>`_
+        """
 
+        __slots__ = ("Rules",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupRules",
+            _PropertyType,
+            __slots__,
+            converters={"Rules": _convert_RuleGroupRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-@attrs(**ATTRSCONFIG)
-class WebACL(Resource):
-    """A Web Acl for WAFv2.
+        def __init__(self, *, Rules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Rules", _convert_RuleGroupRule_list(Rules))
+            _init_PropertyType(self, kwargs)
 
-    See Also:
-        `AWS Cloud Formation documentation for WebACL
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafv2-webacl.html>`_
-    """
+    _convert_Tag_list = create_object_list_converter(_Tag)
 
-    RESOURCE_TYPE = "AWS::WAFv2::WebACL"
+    class RuleGroupTagList(_PropertyType):
+        """The Tag List property type for RuleGroup in WAFv2.
 
-    Properties: WebACLProperties = attrib(
-        factory=WebACLProperties, converter=create_object_converter(WebACLProperties)
+        See Also:
+            `AWS Cloud Formation documentation for TagList
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-rulegroup-taglist.html>`_
+        """
+
+        __slots__ = ("TagList",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupTagList",
+            _PropertyType,
+            __slots__,
+            converters={"TagList": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TagList=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TagList", _convert_Tag_list(TagList))
+            _init_PropertyType(self, kwargs)
+
+    _convert_RuleGroupRules = create_object_converter(RuleGroupRules)
+    _convert_RuleGroupTagList = create_object_converter(RuleGroupTagList)
+
+    class RuleGroupProperties(_ResourceProperties):
+        __slots__ = (
+            "Capacity",
+            "Description",
+            "Name",
+            "Rules",
+            "Scope",
+            "Tags",
+            "VisibilityConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroupProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Rules": _convert_RuleGroupRules,
+                "Tags": _convert_RuleGroupTagList,
+                "VisibilityConfig": _convert_RuleGroupVisibilityConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Capacity=None,
+            Description=None,
+            Name=None,
+            Rules=None,
+            Scope=None,
+            Tags=None,
+            VisibilityConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Capacity", Capacity)
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Rules", _convert_RuleGroupRules(Rules))
+            _setattr("Scope", Scope)
+            _setattr("Tags", _convert_RuleGroupTagList(Tags))
+            _setattr(
+                "VisibilityConfig", _convert_RuleGroupVisibilityConfig(VisibilityConfig)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_RuleGroupProperties = create_object_converter(RuleGroupProperties)
+
+    class RuleGroup(_Resource):
+        """A Rule Group for WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RuleGroup
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafv2-rulegroup.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFv2::RuleGroup"
+        # NB: RuleGroup stores tags in a format that we don't support
+        TAG_FORMAT = None
+
+        Properties: RuleGroupProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "RuleGroup",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_RuleGroupProperties},
+            factories={"Properties": RuleGroupProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = RuleGroupProperties()
+            _setattr("Properties", _convert_RuleGroupProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        RuleGroup,
+        RuleGroupProperties,
+        RuleGroupAllQueryArguments,
+        RuleGroupAllowAction,
+        RuleGroupSingleHeader,
+        RuleGroupSingleQueryArgument,
+        RuleGroupUriPath,
+        RuleGroupQueryString,
+        RuleGroupBody,
+        RuleGroupMethod,
+        RuleGroupFieldToMatch,
+        RuleGroupTextTransformation,
+        RuleGroupTextTransformations,
+        RuleGroupByteMatchStatement,
+        RuleGroupSqliMatchStatement,
+        RuleGroupXssMatchStatement,
+        RuleGroupSizeConstraintStatement,
+        RuleGroupCountryCodes,
+        RuleGroupGeoMatchStatement,
+        RuleGroupIPSetReferenceStatement,
+        RuleGroupRegexPatternSetReferenceStatement,
+        RuleGroupStatementThree,
+        RuleGroupRateBasedStatementTwo,
+        RuleGroupStatementThrees,
+        RuleGroupAndStatementTwo,
+        RuleGroupOrStatementTwo,
+        RuleGroupNotStatementTwo,
+        RuleGroupStatementTwo,
+        RuleGroupStatementTwos,
+        RuleGroupAndStatementOne,
+        RuleGroupBlockAction,
+        RuleGroupCountAction,
+        RuleGroupNotStatementOne,
+        RuleGroupOrStatementOne,
+        RuleGroupRateBasedStatementOne,
+        RuleGroupStatementOne,
+        RuleGroupRuleAction,
+        RuleGroupVisibilityConfig,
+        RuleGroupRule,
+        RuleGroupRules,
+        RuleGroupTagList,
     )
+
+
+def _create_WebACL():
+    class WebACLAllQueryArguments(_PropertyType):
+        """The All Query Arguments property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AllQueryArguments
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-allqueryarguments.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLAllQueryArguments", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class WebACLAllowAction(_PropertyType):
+        """The Allow Action property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AllowAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-allowaction.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLAllowAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class WebACLSingleHeader(_PropertyType):
+        """The Single Header property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SingleHeader
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-singleheader.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLSingleHeader", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class WebACLSingleQueryArgument(_PropertyType):
+        """The Single Query Argument property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SingleQueryArgument
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-singlequeryargument.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLSingleQueryArgument", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    class WebACLUriPath(_PropertyType):
+        """The Uri Path property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for UriPath
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-uripath.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLUriPath", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class WebACLQueryString(_PropertyType):
+        """The Query String property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for QueryString
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-querystring.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLQueryString", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class WebACLBody(_PropertyType):
+        """The Body property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Body
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-body.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLBody", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class WebACLMethod(_PropertyType):
+        """The Method property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Method
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-method.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLMethod", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLAllQueryArguments = create_object_converter(WebACLAllQueryArguments)
+    _convert_WebACLBody = create_object_converter(WebACLBody)
+    _convert_WebACLMethod = create_object_converter(WebACLMethod)
+    _convert_WebACLQueryString = create_object_converter(WebACLQueryString)
+    _convert_WebACLSingleHeader = create_object_converter(WebACLSingleHeader)
+    _convert_WebACLSingleQueryArgument = create_object_converter(
+        WebACLSingleQueryArgument
+    )
+    _convert_WebACLUriPath = create_object_converter(WebACLUriPath)
+
+    class WebACLFieldToMatch(_PropertyType):
+        """The Field To Match property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for FieldToMatch
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-fieldtomatch.html>`_
+        """
+
+        __slots__ = (
+            "AllQueryArguments",
+            "Body",
+            "Method",
+            "QueryString",
+            "SingleHeader",
+            "SingleQueryArgument",
+            "UriPath",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLFieldToMatch",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AllQueryArguments": _convert_WebACLAllQueryArguments,
+                "Body": _convert_WebACLBody,
+                "Method": _convert_WebACLMethod,
+                "QueryString": _convert_WebACLQueryString,
+                "SingleHeader": _convert_WebACLSingleHeader,
+                "SingleQueryArgument": _convert_WebACLSingleQueryArgument,
+                "UriPath": _convert_WebACLUriPath,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AllQueryArguments=None,
+            Body=None,
+            Method=None,
+            QueryString=None,
+            SingleHeader=None,
+            SingleQueryArgument=None,
+            UriPath=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "AllQueryArguments", _convert_WebACLAllQueryArguments(AllQueryArguments)
+            )
+            _setattr("Body", _convert_WebACLBody(Body))
+            _setattr("Method", _convert_WebACLMethod(Method))
+            _setattr("QueryString", _convert_WebACLQueryString(QueryString))
+            _setattr("SingleHeader", _convert_WebACLSingleHeader(SingleHeader))
+            _setattr(
+                "SingleQueryArgument",
+                _convert_WebACLSingleQueryArgument(SingleQueryArgument),
+            )
+            _setattr("UriPath", _convert_WebACLUriPath(UriPath))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLTextTransformation(_PropertyType):
+        """The Text Transformation property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TextTransformation
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-texttransformation.html>`_
+        """
+
+        __slots__ = ("Priority", "Type")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLTextTransformation", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Priority=None, Type=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Priority", Priority)
+            _setattr("Type", Type)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLTextTransformation_list = create_object_list_converter(
+        WebACLTextTransformation
+    )
+
+    class WebACLTextTransformations(_PropertyType):
+        """The Text Transformations property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TextTransformations
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-texttransformations.html>`_
+        """
+
+        __slots__ = ("TextTransformations",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLTextTransformations",
+            _PropertyType,
+            __slots__,
+            converters={"TextTransformations": _convert_WebACLTextTransformation_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TextTransformations=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "TextTransformations",
+                _convert_WebACLTextTransformation_list(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLFieldToMatch = create_object_converter(WebACLFieldToMatch)
+    _convert_WebACLTextTransformations = create_object_converter(
+        WebACLTextTransformations
+    )
+
+    class WebACLByteMatchStatement(_PropertyType):
+        """The Byte Match Statement property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ByteMatchStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-bytematchstatement.html>`_
+        """
+
+        __slots__ = (
+            "FieldToMatch",
+            "PositionalConstraint",
+            "SearchString",
+            "SearchStringBase64",
+            "TextTransformations",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLByteMatchStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_WebACLFieldToMatch,
+                "TextTransformations": _convert_WebACLTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            FieldToMatch=None,
+            PositionalConstraint=None,
+            SearchString=None,
+            SearchStringBase64=None,
+            TextTransformations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FieldToMatch", _convert_WebACLFieldToMatch(FieldToMatch))
+            _setattr("PositionalConstraint", PositionalConstraint)
+            _setattr("SearchString", SearchString)
+            _setattr("SearchStringBase64", SearchStringBase64)
+            _setattr(
+                "TextTransformations",
+                _convert_WebACLTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class WebACLSqliMatchStatement(_PropertyType):
+        """The Sqli Match Statement property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SqliMatchStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-sqlimatchstatement.html>`_
+        """
+
+        __slots__ = ("FieldToMatch", "TextTransformations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLSqliMatchStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_WebACLFieldToMatch,
+                "TextTransformations": _convert_WebACLTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FieldToMatch=None, TextTransformations=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FieldToMatch", _convert_WebACLFieldToMatch(FieldToMatch))
+            _setattr(
+                "TextTransformations",
+                _convert_WebACLTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class WebACLXssMatchStatement(_PropertyType):
+        """The Xss Match Statement property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for XssMatchStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-xssmatchstatement.html>`_
+        """
+
+        __slots__ = ("FieldToMatch", "TextTransformations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLXssMatchStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_WebACLFieldToMatch,
+                "TextTransformations": _convert_WebACLTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, FieldToMatch=None, TextTransformations=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("FieldToMatch", _convert_WebACLFieldToMatch(FieldToMatch))
+            _setattr(
+                "TextTransformations",
+                _convert_WebACLTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class WebACLSizeConstraintStatement(_PropertyType):
+        """The Size Constraint Statement property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for SizeConstraintStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-sizeconstraintstatement.html>`_
+        """
+
+        __slots__ = (
+            "ComparisonOperator",
+            "FieldToMatch",
+            "Size",
+            "TextTransformations",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLSizeConstraintStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_WebACLFieldToMatch,
+                "TextTransformations": _convert_WebACLTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ComparisonOperator=None,
+            FieldToMatch=None,
+            Size=None,
+            TextTransformations=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComparisonOperator", ComparisonOperator)
+            _setattr("FieldToMatch", _convert_WebACLFieldToMatch(FieldToMatch))
+            _setattr("Size", Size)
+            _setattr(
+                "TextTransformations",
+                _convert_WebACLTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class WebACLCountryCodes(_PropertyType):
+        """The Country Codes property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CountryCodes
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-countrycodes.html>`_
+        """
+
+        __slots__ = ("CountryCodes",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLCountryCodes", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CountryCodes=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CountryCodes", CountryCodes)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLCountryCodes = create_object_converter(WebACLCountryCodes)
+
+    class WebACLGeoMatchStatement(_PropertyType):
+        """The Geo Match Statement property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for GeoMatchStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-geomatchstatement.html>`_
+        """
+
+        __slots__ = ("CountryCodes",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLGeoMatchStatement",
+            _PropertyType,
+            __slots__,
+            converters={"CountryCodes": _convert_WebACLCountryCodes},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, CountryCodes=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CountryCodes", _convert_WebACLCountryCodes(CountryCodes))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLExcludedRule(_PropertyType):
+        """The Excluded Rule property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ExcludedRule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-excludedrule.html>`_
+        """
+
+        __slots__ = ("Name",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLExcludedRule", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Name=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Name", Name)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLExcludedRule_list = create_object_list_converter(WebACLExcludedRule)
+
+    class WebACLExcludedRules(_PropertyType):
+        """The Excluded Rules property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ExcludedRules
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-excludedrules.html>`_
+        """
+
+        __slots__ = ("ExcludedRules",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLExcludedRules",
+            _PropertyType,
+            __slots__,
+            converters={"ExcludedRules": _convert_WebACLExcludedRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, ExcludedRules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExcludedRules", _convert_WebACLExcludedRule_list(ExcludedRules))
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLExcludedRules = create_object_converter(WebACLExcludedRules)
+
+    class WebACLRuleGroupReferenceStatement(_PropertyType):
+        """The Rule Group Reference Statement property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RuleGroupReferenceStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-rulegroupreferencestatement.html>`_
+        """
+
+        __slots__ = ("Arn", "ExcludedRules")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLRuleGroupReferenceStatement",
+            _PropertyType,
+            __slots__,
+            converters={"ExcludedRules": _convert_WebACLExcludedRules},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Arn=None, ExcludedRules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _setattr("ExcludedRules", _convert_WebACLExcludedRules(ExcludedRules))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLIPSetReferenceStatement(_PropertyType):
+        """The Ip Set Reference Statement property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for IPSetReferenceStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-ipsetreferencestatement.html>`_
+        """
+
+        __slots__ = ("Arn",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLIPSetReferenceStatement", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Arn=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _init_PropertyType(self, kwargs)
+
+    class WebACLRegexPatternSetReferenceStatement(_PropertyType):
+        """The Regex Pattern Set Reference Statement property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RegexPatternSetReferenceStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-regexpatternsetreferencestatement.html>`_
+        """
+
+        __slots__ = ("Arn", "FieldToMatch", "TextTransformations")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLRegexPatternSetReferenceStatement",
+            _PropertyType,
+            __slots__,
+            converters={
+                "FieldToMatch": _convert_WebACLFieldToMatch,
+                "TextTransformations": _convert_WebACLTextTransformations,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, Arn=None, FieldToMatch=None, TextTransformations=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Arn", Arn)
+            _setattr("FieldToMatch", _convert_WebACLFieldToMatch(FieldToMatch))
+            _setattr(
+                "TextTransformations",
+                _convert_WebACLTextTransformations(TextTransformations),
+            )
+            _init_PropertyType(self, kwargs)
+
+    class WebACLManagedRuleGroupStatement(_PropertyType):
+        """The Managed Rule Group Statement property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for ManagedRuleGroupStatement
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-managedrulegroupstatement.html>`_
+        """
+
+        __slots__ = ("ExcludedRules", "Name", "VendorName")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLManagedRuleGroupStatement",
+            _PropertyType,
+            __slots__,
+            converters={"ExcludedRules": _convert_WebACLExcludedRules},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self, *, ExcludedRules=None, Name=None, VendorName=None, **kwargs
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ExcludedRules", _convert_WebACLExcludedRules(ExcludedRules))
+            _setattr("Name", Name)
+            _setattr("VendorName", VendorName)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLByteMatchStatement = create_object_converter(
+        WebACLByteMatchStatement
+    )
+    _convert_WebACLGeoMatchStatement = create_object_converter(WebACLGeoMatchStatement)
+    _convert_WebACLIPSetReferenceStatement = create_object_converter(
+        WebACLIPSetReferenceStatement
+    )
+    _convert_WebACLManagedRuleGroupStatement = create_object_converter(
+        WebACLManagedRuleGroupStatement
+    )
+    _convert_WebACLRegexPatternSetReferenceStatement = create_object_converter(
+        WebACLRegexPatternSetReferenceStatement
+    )
+    _convert_WebACLRuleGroupReferenceStatement = create_object_converter(
+        WebACLRuleGroupReferenceStatement
+    )
+    _convert_WebACLSizeConstraintStatement = create_object_converter(
+        WebACLSizeConstraintStatement
+    )
+    _convert_WebACLSqliMatchStatement = create_object_converter(
+        WebACLSqliMatchStatement
+    )
+    _convert_WebACLXssMatchStatement = create_object_converter(WebACLXssMatchStatement)
+
+    class WebACLStatementThree(_PropertyType):
+        """The Statement Three property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementThree
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-statementthree.html>`_
+        """
+
+        __slots__ = (
+            "ByteMatchStatement",
+            "GeoMatchStatement",
+            "IPSetReferenceStatement",
+            "ManagedRuleGroupStatement",
+            "RegexPatternSetReferenceStatement",
+            "RuleGroupReferenceStatement",
+            "SizeConstraintStatement",
+            "SqliMatchStatement",
+            "XssMatchStatement",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLStatementThree",
+            _PropertyType,
+            __slots__,
+            converters={
+                "ByteMatchStatement": _convert_WebACLByteMatchStatement,
+                "GeoMatchStatement": _convert_WebACLGeoMatchStatement,
+                "IPSetReferenceStatement": _convert_WebACLIPSetReferenceStatement,
+                "ManagedRuleGroupStatement": _convert_WebACLManagedRuleGroupStatement,
+                "RegexPatternSetReferenceStatement": _convert_WebACLRegexPatternSetReferenceStatement,
+                "RuleGroupReferenceStatement": _convert_WebACLRuleGroupReferenceStatement,
+                "SizeConstraintStatement": _convert_WebACLSizeConstraintStatement,
+                "SqliMatchStatement": _convert_WebACLSqliMatchStatement,
+                "XssMatchStatement": _convert_WebACLXssMatchStatement,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            ByteMatchStatement=None,
+            GeoMatchStatement=None,
+            IPSetReferenceStatement=None,
+            ManagedRuleGroupStatement=None,
+            RegexPatternSetReferenceStatement=None,
+            RuleGroupReferenceStatement=None,
+            SizeConstraintStatement=None,
+            SqliMatchStatement=None,
+            XssMatchStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "ByteMatchStatement",
+                _convert_WebACLByteMatchStatement(ByteMatchStatement),
+            )
+            _setattr(
+                "GeoMatchStatement", _convert_WebACLGeoMatchStatement(GeoMatchStatement)
+            )
+            _setattr(
+                "IPSetReferenceStatement",
+                _convert_WebACLIPSetReferenceStatement(IPSetReferenceStatement),
+            )
+            _setattr(
+                "ManagedRuleGroupStatement",
+                _convert_WebACLManagedRuleGroupStatement(ManagedRuleGroupStatement),
+            )
+            _setattr(
+                "RegexPatternSetReferenceStatement",
+                _convert_WebACLRegexPatternSetReferenceStatement(
+                    RegexPatternSetReferenceStatement
+                ),
+            )
+            _setattr(
+                "RuleGroupReferenceStatement",
+                _convert_WebACLRuleGroupReferenceStatement(RuleGroupReferenceStatement),
+            )
+            _setattr(
+                "SizeConstraintStatement",
+                _convert_WebACLSizeConstraintStatement(SizeConstraintStatement),
+            )
+            _setattr(
+                "SqliMatchStatement",
+                _convert_WebACLSqliMatchStatement(SqliMatchStatement),
+            )
+            _setattr(
+                "XssMatchStatement", _convert_WebACLXssMatchStatement(XssMatchStatement)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLStatementThree = create_object_converter(WebACLStatementThree)
+
+    class WebACLRateBasedStatementTwo(_PropertyType):
+        """The Rate Based Statement Two property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RateBasedStatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-ratebasedstatementtwo.html>`_
+        """
+
+        __slots__ = ("AggregateKeyType", "Limit", "ScopeDownStatement")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLRateBasedStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={"ScopeDownStatement": _convert_WebACLStatementThree},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AggregateKeyType=None,
+            Limit=None,
+            ScopeDownStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AggregateKeyType", AggregateKeyType)
+            _setattr("Limit", Limit)
+            _setattr(
+                "ScopeDownStatement", _convert_WebACLStatementThree(ScopeDownStatement)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLStatementThree_list = create_object_list_converter(
+        WebACLStatementThree
+    )
+
+    class WebACLStatementThrees(_PropertyType):
+        """The Statement Threes property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementThrees
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-statementthrees.html>`_
+        """
+
+        __slots__ = ("StatementThrees",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLStatementThrees",
+            _PropertyType,
+            __slots__,
+            converters={"StatementThrees": _convert_WebACLStatementThree_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, StatementThrees=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr(
+                "StatementThrees", _convert_WebACLStatementThree_list(StatementThrees)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLStatementThrees = create_object_converter(WebACLStatementThrees)
+
+    class WebACLAndStatementTwo(_PropertyType):
+        """The And Statement Two property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AndStatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-andstatementtwo.html>`_
+        """
+
+        __slots__ = ("Statements",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLAndStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={"Statements": _convert_WebACLStatementThrees},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statements=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statements", _convert_WebACLStatementThrees(Statements))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLOrStatementTwo(_PropertyType):
+        """The Or Statement Two property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for OrStatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-orstatementtwo.html>`_
+        """
+
+        __slots__ = ("Statements",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLOrStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={"Statements": _convert_WebACLStatementThrees},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statements=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statements", _convert_WebACLStatementThrees(Statements))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLNotStatementTwo(_PropertyType):
+        """The Not Statement Two property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotStatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-notstatementtwo.html>`_
+        """
+
+        __slots__ = ("Statement",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLNotStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={"Statement": _convert_WebACLStatementThree},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statement=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statement", _convert_WebACLStatementThree(Statement))
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLAndStatementTwo = create_object_converter(WebACLAndStatementTwo)
+    _convert_WebACLNotStatementTwo = create_object_converter(WebACLNotStatementTwo)
+    _convert_WebACLOrStatementTwo = create_object_converter(WebACLOrStatementTwo)
+    _convert_WebACLRateBasedStatementTwo = create_object_converter(
+        WebACLRateBasedStatementTwo
+    )
+
+    class WebACLStatementTwo(_PropertyType):
+        """The Statement Two property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementTwo
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-statementtwo.html>`_
+        """
+
+        __slots__ = (
+            "AndStatement",
+            "ByteMatchStatement",
+            "GeoMatchStatement",
+            "IPSetReferenceStatement",
+            "ManagedRuleGroupStatement",
+            "NotStatement",
+            "OrStatement",
+            "RateBasedStatement",
+            "RegexPatternSetReferenceStatement",
+            "RuleGroupReferenceStatement",
+            "SizeConstraintStatement",
+            "SqliMatchStatement",
+            "XssMatchStatement",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLStatementTwo",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AndStatement": _convert_WebACLAndStatementTwo,
+                "ByteMatchStatement": _convert_WebACLByteMatchStatement,
+                "GeoMatchStatement": _convert_WebACLGeoMatchStatement,
+                "IPSetReferenceStatement": _convert_WebACLIPSetReferenceStatement,
+                "ManagedRuleGroupStatement": _convert_WebACLManagedRuleGroupStatement,
+                "NotStatement": _convert_WebACLNotStatementTwo,
+                "OrStatement": _convert_WebACLOrStatementTwo,
+                "RateBasedStatement": _convert_WebACLRateBasedStatementTwo,
+                "RegexPatternSetReferenceStatement": _convert_WebACLRegexPatternSetReferenceStatement,
+                "RuleGroupReferenceStatement": _convert_WebACLRuleGroupReferenceStatement,
+                "SizeConstraintStatement": _convert_WebACLSizeConstraintStatement,
+                "SqliMatchStatement": _convert_WebACLSqliMatchStatement,
+                "XssMatchStatement": _convert_WebACLXssMatchStatement,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AndStatement=None,
+            ByteMatchStatement=None,
+            GeoMatchStatement=None,
+            IPSetReferenceStatement=None,
+            ManagedRuleGroupStatement=None,
+            NotStatement=None,
+            OrStatement=None,
+            RateBasedStatement=None,
+            RegexPatternSetReferenceStatement=None,
+            RuleGroupReferenceStatement=None,
+            SizeConstraintStatement=None,
+            SqliMatchStatement=None,
+            XssMatchStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AndStatement", _convert_WebACLAndStatementTwo(AndStatement))
+            _setattr(
+                "ByteMatchStatement",
+                _convert_WebACLByteMatchStatement(ByteMatchStatement),
+            )
+            _setattr(
+                "GeoMatchStatement", _convert_WebACLGeoMatchStatement(GeoMatchStatement)
+            )
+            _setattr(
+                "IPSetReferenceStatement",
+                _convert_WebACLIPSetReferenceStatement(IPSetReferenceStatement),
+            )
+            _setattr(
+                "ManagedRuleGroupStatement",
+                _convert_WebACLManagedRuleGroupStatement(ManagedRuleGroupStatement),
+            )
+            _setattr("NotStatement", _convert_WebACLNotStatementTwo(NotStatement))
+            _setattr("OrStatement", _convert_WebACLOrStatementTwo(OrStatement))
+            _setattr(
+                "RateBasedStatement",
+                _convert_WebACLRateBasedStatementTwo(RateBasedStatement),
+            )
+            _setattr(
+                "RegexPatternSetReferenceStatement",
+                _convert_WebACLRegexPatternSetReferenceStatement(
+                    RegexPatternSetReferenceStatement
+                ),
+            )
+            _setattr(
+                "RuleGroupReferenceStatement",
+                _convert_WebACLRuleGroupReferenceStatement(RuleGroupReferenceStatement),
+            )
+            _setattr(
+                "SizeConstraintStatement",
+                _convert_WebACLSizeConstraintStatement(SizeConstraintStatement),
+            )
+            _setattr(
+                "SqliMatchStatement",
+                _convert_WebACLSqliMatchStatement(SqliMatchStatement),
+            )
+            _setattr(
+                "XssMatchStatement", _convert_WebACLXssMatchStatement(XssMatchStatement)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLStatementTwo_list = create_object_list_converter(WebACLStatementTwo)
+
+    class WebACLStatementTwos(_PropertyType):
+        """The Statement Twos property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementTwos
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-statementtwos.html>`_
+        """
+
+        __slots__ = ("StatementTwos",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLStatementTwos",
+            _PropertyType,
+            __slots__,
+            converters={"StatementTwos": _convert_WebACLStatementTwo_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, StatementTwos=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("StatementTwos", _convert_WebACLStatementTwo_list(StatementTwos))
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLStatementTwos = create_object_converter(WebACLStatementTwos)
+
+    class WebACLAndStatementOne(_PropertyType):
+        """The And Statement One property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for AndStatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-andstatementone.html>`_
+        """
+
+        __slots__ = ("Statements",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLAndStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={"Statements": _convert_WebACLStatementTwos},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statements=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statements", _convert_WebACLStatementTwos(Statements))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLBlockAction(_PropertyType):
+        """The Block Action property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for BlockAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-blockaction.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLBlockAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    class WebACLCountAction(_PropertyType):
+        """The Count Action property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for CountAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-countaction.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLCountAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLAllowAction = create_object_converter(WebACLAllowAction)
+    _convert_WebACLBlockAction = create_object_converter(WebACLBlockAction)
+
+    class WebACLDefaultAction(_PropertyType):
+        """The Default Action property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for DefaultAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-defaultaction.html>`_
+        """
+
+        __slots__ = ("Allow", "Block")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLDefaultAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Allow": _convert_WebACLAllowAction,
+                "Block": _convert_WebACLBlockAction,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Allow=None, Block=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Allow", _convert_WebACLAllowAction(Allow))
+            _setattr("Block", _convert_WebACLBlockAction(Block))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLNoneAction(_PropertyType):
+        """The None Action property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NoneAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-noneaction.html>`_
+        """
+
+        __slots__ = ()
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLNoneAction", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, **kwargs) -> None:
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLStatementTwo = create_object_converter(WebACLStatementTwo)
+
+    class WebACLNotStatementOne(_PropertyType):
+        """The Not Statement One property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for NotStatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-notstatementone.html>`_
+        """
+
+        __slots__ = ("Statement",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLNotStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={"Statement": _convert_WebACLStatementTwo},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statement=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statement", _convert_WebACLStatementTwo(Statement))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLOrStatementOne(_PropertyType):
+        """The Or Statement One property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for OrStatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-orstatementone.html>`_
+        """
+
+        __slots__ = ("Statements",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLOrStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={"Statements": _convert_WebACLStatementTwos},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Statements=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Statements", _convert_WebACLStatementTwos(Statements))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLRateBasedStatementOne(_PropertyType):
+        """The Rate Based Statement One property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RateBasedStatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-ratebasedstatementone.html>`_
+        """
+
+        __slots__ = ("AggregateKeyType", "Limit", "ScopeDownStatement")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLRateBasedStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={"ScopeDownStatement": _convert_WebACLStatementTwo},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AggregateKeyType=None,
+            Limit=None,
+            ScopeDownStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AggregateKeyType", AggregateKeyType)
+            _setattr("Limit", Limit)
+            _setattr(
+                "ScopeDownStatement", _convert_WebACLStatementTwo(ScopeDownStatement)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLAndStatementOne = create_object_converter(WebACLAndStatementOne)
+    _convert_WebACLNotStatementOne = create_object_converter(WebACLNotStatementOne)
+    _convert_WebACLOrStatementOne = create_object_converter(WebACLOrStatementOne)
+    _convert_WebACLRateBasedStatementOne = create_object_converter(
+        WebACLRateBasedStatementOne
+    )
+
+    class WebACLStatementOne(_PropertyType):
+        """The Statement One property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for StatementOne
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-statementone.html>`_
+        """
+
+        __slots__ = (
+            "AndStatement",
+            "ByteMatchStatement",
+            "GeoMatchStatement",
+            "IPSetReferenceStatement",
+            "ManagedRuleGroupStatement",
+            "NotStatement",
+            "OrStatement",
+            "RateBasedStatement",
+            "RegexPatternSetReferenceStatement",
+            "RuleGroupReferenceStatement",
+            "SizeConstraintStatement",
+            "SqliMatchStatement",
+            "XssMatchStatement",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLStatementOne",
+            _PropertyType,
+            __slots__,
+            converters={
+                "AndStatement": _convert_WebACLAndStatementOne,
+                "ByteMatchStatement": _convert_WebACLByteMatchStatement,
+                "GeoMatchStatement": _convert_WebACLGeoMatchStatement,
+                "IPSetReferenceStatement": _convert_WebACLIPSetReferenceStatement,
+                "ManagedRuleGroupStatement": _convert_WebACLManagedRuleGroupStatement,
+                "NotStatement": _convert_WebACLNotStatementOne,
+                "OrStatement": _convert_WebACLOrStatementOne,
+                "RateBasedStatement": _convert_WebACLRateBasedStatementOne,
+                "RegexPatternSetReferenceStatement": _convert_WebACLRegexPatternSetReferenceStatement,
+                "RuleGroupReferenceStatement": _convert_WebACLRuleGroupReferenceStatement,
+                "SizeConstraintStatement": _convert_WebACLSizeConstraintStatement,
+                "SqliMatchStatement": _convert_WebACLSqliMatchStatement,
+                "XssMatchStatement": _convert_WebACLXssMatchStatement,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            AndStatement=None,
+            ByteMatchStatement=None,
+            GeoMatchStatement=None,
+            IPSetReferenceStatement=None,
+            ManagedRuleGroupStatement=None,
+            NotStatement=None,
+            OrStatement=None,
+            RateBasedStatement=None,
+            RegexPatternSetReferenceStatement=None,
+            RuleGroupReferenceStatement=None,
+            SizeConstraintStatement=None,
+            SqliMatchStatement=None,
+            XssMatchStatement=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("AndStatement", _convert_WebACLAndStatementOne(AndStatement))
+            _setattr(
+                "ByteMatchStatement",
+                _convert_WebACLByteMatchStatement(ByteMatchStatement),
+            )
+            _setattr(
+                "GeoMatchStatement", _convert_WebACLGeoMatchStatement(GeoMatchStatement)
+            )
+            _setattr(
+                "IPSetReferenceStatement",
+                _convert_WebACLIPSetReferenceStatement(IPSetReferenceStatement),
+            )
+            _setattr(
+                "ManagedRuleGroupStatement",
+                _convert_WebACLManagedRuleGroupStatement(ManagedRuleGroupStatement),
+            )
+            _setattr("NotStatement", _convert_WebACLNotStatementOne(NotStatement))
+            _setattr("OrStatement", _convert_WebACLOrStatementOne(OrStatement))
+            _setattr(
+                "RateBasedStatement",
+                _convert_WebACLRateBasedStatementOne(RateBasedStatement),
+            )
+            _setattr(
+                "RegexPatternSetReferenceStatement",
+                _convert_WebACLRegexPatternSetReferenceStatement(
+                    RegexPatternSetReferenceStatement
+                ),
+            )
+            _setattr(
+                "RuleGroupReferenceStatement",
+                _convert_WebACLRuleGroupReferenceStatement(RuleGroupReferenceStatement),
+            )
+            _setattr(
+                "SizeConstraintStatement",
+                _convert_WebACLSizeConstraintStatement(SizeConstraintStatement),
+            )
+            _setattr(
+                "SqliMatchStatement",
+                _convert_WebACLSqliMatchStatement(SqliMatchStatement),
+            )
+            _setattr(
+                "XssMatchStatement", _convert_WebACLXssMatchStatement(XssMatchStatement)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLCountAction = create_object_converter(WebACLCountAction)
+
+    class WebACLRuleAction(_PropertyType):
+        """The Rule Action property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for RuleAction
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-ruleaction.html>`_
+        """
+
+        __slots__ = ("Allow", "Block", "Count")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLRuleAction",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Allow": _convert_WebACLAllowAction,
+                "Block": _convert_WebACLBlockAction,
+                "Count": _convert_WebACLCountAction,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Allow=None, Block=None, Count=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Allow", _convert_WebACLAllowAction(Allow))
+            _setattr("Block", _convert_WebACLBlockAction(Block))
+            _setattr("Count", _convert_WebACLCountAction(Count))
+            _init_PropertyType(self, kwargs)
+
+    class WebACLVisibilityConfig(_PropertyType):
+        """The Visibility Config property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for VisibilityConfig
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-visibilityconfig.html>`_
+        """
+
+        __slots__ = ("CloudWatchMetricsEnabled", "MetricName", "SampledRequestsEnabled")
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLVisibilityConfig", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            CloudWatchMetricsEnabled=None,
+            MetricName=None,
+            SampledRequestsEnabled=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("CloudWatchMetricsEnabled", CloudWatchMetricsEnabled)
+            _setattr("MetricName", MetricName)
+            _setattr("SampledRequestsEnabled", SampledRequestsEnabled)
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLRuleAction = create_object_converter(WebACLRuleAction)
+    _convert_WebACLStatementOne = create_object_converter(WebACLStatementOne)
+    _convert_WebACLVisibilityConfig = create_object_converter(WebACLVisibilityConfig)
+
+    class WebACLRule(_PropertyType):
+        """The Rule property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Rule
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-rule.html>`_
+        """
+
+        __slots__ = (
+            "Action",
+            "Name",
+            "OverrideAction",
+            "Priority",
+            "Statement",
+            "VisibilityConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLRule",
+            _PropertyType,
+            __slots__,
+            converters={
+                "Action": _convert_WebACLRuleAction,
+                "Statement": _convert_WebACLStatementOne,
+                "VisibilityConfig": _convert_WebACLVisibilityConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            Action=None,
+            Name=None,
+            OverrideAction=None,
+            Priority=None,
+            Statement=None,
+            VisibilityConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Action", _convert_WebACLRuleAction(Action))
+            _setattr("Name", Name)
+            _setattr("OverrideAction", OverrideAction)
+            _setattr("Priority", Priority)
+            _setattr("Statement", _convert_WebACLStatementOne(Statement))
+            _setattr(
+                "VisibilityConfig", _convert_WebACLVisibilityConfig(VisibilityConfig)
+            )
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLRule_list = create_object_list_converter(WebACLRule)
+
+    class WebACLRules(_PropertyType):
+        """The Rules property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for Rules
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-rules.html>`_
+        """
+
+        __slots__ = ("Rules",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLRules",
+            _PropertyType,
+            __slots__,
+            converters={"Rules": _convert_WebACLRule_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Rules=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("Rules", _convert_WebACLRule_list(Rules))
+            _init_PropertyType(self, kwargs)
+
+    _convert_Tag_list = create_object_list_converter(_Tag)
+
+    class WebACLTagList(_PropertyType):
+        """The Tag List property type for WebACL in WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for TagList
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-wafv2-webacl-taglist.html>`_
+        """
+
+        __slots__ = ("TagList",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLTagList",
+            _PropertyType,
+            __slots__,
+            converters={"TagList": _convert_Tag_list},
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, TagList=None, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("TagList", _convert_Tag_list(TagList))
+            _init_PropertyType(self, kwargs)
+
+    _convert_WebACLDefaultAction = create_object_converter(WebACLDefaultAction)
+    _convert_WebACLRules = create_object_converter(WebACLRules)
+    _convert_WebACLTagList = create_object_converter(WebACLTagList)
+
+    class WebACLProperties(_ResourceProperties):
+        __slots__ = (
+            "DefaultAction",
+            "Description",
+            "Name",
+            "Rules",
+            "Scope",
+            "Tags",
+            "VisibilityConfig",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACLProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "DefaultAction": _convert_WebACLDefaultAction,
+                "Rules": _convert_WebACLRules,
+                "Tags": _convert_WebACLTagList,
+                "VisibilityConfig": _convert_WebACLVisibilityConfig,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            DefaultAction=None,
+            Description=None,
+            Name=None,
+            Rules=None,
+            Scope=None,
+            Tags=None,
+            VisibilityConfig=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("DefaultAction", _convert_WebACLDefaultAction(DefaultAction))
+            _setattr("Description", Description)
+            _setattr("Name", Name)
+            _setattr("Rules", _convert_WebACLRules(Rules))
+            _setattr("Scope", Scope)
+            _setattr("Tags", _convert_WebACLTagList(Tags))
+            _setattr(
+                "VisibilityConfig", _convert_WebACLVisibilityConfig(VisibilityConfig)
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_WebACLProperties = create_object_converter(WebACLProperties)
+
+    class WebACL(_Resource):
+        """A Web Acl for WAFv2.
+
+        See Also:
+            `AWS Cloud Formation documentation for WebACL
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-wafv2-webacl.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WAFv2::WebACL"
+        # NB: WebACL stores tags in a format that we don't support
+        TAG_FORMAT = None
+
+        Properties: WebACLProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WebACL",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_WebACLProperties},
+            factories={"Properties": WebACLProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = WebACLProperties()
+            _setattr("Properties", _convert_WebACLProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return (
+        WebACL,
+        WebACLProperties,
+        WebACLAllQueryArguments,
+        WebACLAllowAction,
+        WebACLSingleHeader,
+        WebACLSingleQueryArgument,
+        WebACLUriPath,
+        WebACLQueryString,
+        WebACLBody,
+        WebACLMethod,
+        WebACLFieldToMatch,
+        WebACLTextTransformation,
+        WebACLTextTransformations,
+        WebACLByteMatchStatement,
+        WebACLSqliMatchStatement,
+        WebACLXssMatchStatement,
+        WebACLSizeConstraintStatement,
+        WebACLCountryCodes,
+        WebACLGeoMatchStatement,
+        WebACLExcludedRule,
+        WebACLExcludedRules,
+        WebACLRuleGroupReferenceStatement,
+        WebACLIPSetReferenceStatement,
+        WebACLRegexPatternSetReferenceStatement,
+        WebACLManagedRuleGroupStatement,
+        WebACLStatementThree,
+        WebACLRateBasedStatementTwo,
+        WebACLStatementThrees,
+        WebACLAndStatementTwo,
+        WebACLOrStatementTwo,
+        WebACLNotStatementTwo,
+        WebACLStatementTwo,
+        WebACLStatementTwos,
+        WebACLAndStatementOne,
+        WebACLBlockAction,
+        WebACLCountAction,
+        WebACLDefaultAction,
+        WebACLNoneAction,
+        WebACLNotStatementOne,
+        WebACLOrStatementOne,
+        WebACLRateBasedStatementOne,
+        WebACLStatementOne,
+        WebACLRuleAction,
+        WebACLVisibilityConfig,
+        WebACLRule,
+        WebACLRules,
+        WebACLTagList,
+    )
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "IPSet": _create_IPSet,
+        "IPSetProperties": _create_IPSet,
+        "IPSetIPAddresses": _create_IPSet,
+        "IPSetTagList": _create_IPSet,
+        "RegexPatternSet": _create_RegexPatternSet,
+        "RegexPatternSetProperties": _create_RegexPatternSet,
+        "RegexPatternSetRegex": _create_RegexPatternSet,
+        "RegexPatternSetRegularExpressionList": _create_RegexPatternSet,
+        "RegexPatternSetTagList": _create_RegexPatternSet,
+        "RuleGroup": _create_RuleGroup,
+        "RuleGroupProperties": _create_RuleGroup,
+        "RuleGroupAllowAction": _create_RuleGroup,
+        "RuleGroupAllQueryArguments": _create_RuleGroup,
+        "RuleGroupAndStatementOne": _create_RuleGroup,
+        "RuleGroupAndStatementTwo": _create_RuleGroup,
+        "RuleGroupBlockAction": _create_RuleGroup,
+        "RuleGroupBody": _create_RuleGroup,
+        "RuleGroupByteMatchStatement": _create_RuleGroup,
+        "RuleGroupCountAction": _create_RuleGroup,
+        "RuleGroupCountryCodes": _create_RuleGroup,
+        "RuleGroupFieldToMatch": _create_RuleGroup,
+        "RuleGroupGeoMatchStatement": _create_RuleGroup,
+        "RuleGroupIPSetReferenceStatement": _create_RuleGroup,
+        "RuleGroupMethod": _create_RuleGroup,
+        "RuleGroupNotStatementOne": _create_RuleGroup,
+        "RuleGroupNotStatementTwo": _create_RuleGroup,
+        "RuleGroupOrStatementOne": _create_RuleGroup,
+        "RuleGroupOrStatementTwo": _create_RuleGroup,
+        "RuleGroupQueryString": _create_RuleGroup,
+        "RuleGroupRateBasedStatementOne": _create_RuleGroup,
+        "RuleGroupRateBasedStatementTwo": _create_RuleGroup,
+        "RuleGroupRegexPatternSetReferenceStatement": _create_RuleGroup,
+        "RuleGroupRule": _create_RuleGroup,
+        "RuleGroupRuleAction": _create_RuleGroup,
+        "RuleGroupRules": _create_RuleGroup,
+        "RuleGroupSingleHeader": _create_RuleGroup,
+        "RuleGroupSingleQueryArgument": _create_RuleGroup,
+        "RuleGroupSizeConstraintStatement": _create_RuleGroup,
+        "RuleGroupSqliMatchStatement": _create_RuleGroup,
+        "RuleGroupStatementOne": _create_RuleGroup,
+        "RuleGroupStatementThree": _create_RuleGroup,
+        "RuleGroupStatementThrees": _create_RuleGroup,
+        "RuleGroupStatementTwo": _create_RuleGroup,
+        "RuleGroupStatementTwos": _create_RuleGroup,
+        "RuleGroupTagList": _create_RuleGroup,
+        "RuleGroupTextTransformation": _create_RuleGroup,
+        "RuleGroupTextTransformations": _create_RuleGroup,
+        "RuleGroupUriPath": _create_RuleGroup,
+        "RuleGroupVisibilityConfig": _create_RuleGroup,
+        "RuleGroupXssMatchStatement": _create_RuleGroup,
+        "WebACL": _create_WebACL,
+        "WebACLProperties": _create_WebACL,
+        "WebACLAllowAction": _create_WebACL,
+        "WebACLAllQueryArguments": _create_WebACL,
+        "WebACLAndStatementOne": _create_WebACL,
+        "WebACLAndStatementTwo": _create_WebACL,
+        "WebACLBlockAction": _create_WebACL,
+        "WebACLBody": _create_WebACL,
+        "WebACLByteMatchStatement": _create_WebACL,
+        "WebACLCountAction": _create_WebACL,
+        "WebACLCountryCodes": _create_WebACL,
+        "WebACLDefaultAction": _create_WebACL,
+        "WebACLExcludedRule": _create_WebACL,
+        "WebACLExcludedRules": _create_WebACL,
+        "WebACLFieldToMatch": _create_WebACL,
+        "WebACLGeoMatchStatement": _create_WebACL,
+        "WebACLIPSetReferenceStatement": _create_WebACL,
+        "WebACLManagedRuleGroupStatement": _create_WebACL,
+        "WebACLMethod": _create_WebACL,
+        "WebACLNoneAction": _create_WebACL,
+        "WebACLNotStatementOne": _create_WebACL,
+        "WebACLNotStatementTwo": _create_WebACL,
+        "WebACLOrStatementOne": _create_WebACL,
+        "WebACLOrStatementTwo": _create_WebACL,
+        "WebACLQueryString": _create_WebACL,
+        "WebACLRateBasedStatementOne": _create_WebACL,
+        "WebACLRateBasedStatementTwo": _create_WebACL,
+        "WebACLRegexPatternSetReferenceStatement": _create_WebACL,
+        "WebACLRule": _create_WebACL,
+        "WebACLRuleAction": _create_WebACL,
+        "WebACLRuleGroupReferenceStatement": _create_WebACL,
+        "WebACLRules": _create_WebACL,
+        "WebACLSingleHeader": _create_WebACL,
+        "WebACLSingleQueryArgument": _create_WebACL,
+        "WebACLSizeConstraintStatement": _create_WebACL,
+        "WebACLSqliMatchStatement": _create_WebACL,
+        "WebACLStatementOne": _create_WebACL,
+        "WebACLStatementThree": _create_WebACL,
+        "WebACLStatementThrees": _create_WebACL,
+        "WebACLStatementTwo": _create_WebACL,
+        "WebACLStatementTwos": _create_WebACL,
+        "WebACLTagList": _create_WebACL,
+        "WebACLTextTransformation": _create_WebACL,
+        "WebACLTextTransformations": _create_WebACL,
+        "WebACLUriPath": _create_WebACL,
+        "WebACLVisibilityConfig": _create_WebACL,
+        "WebACLXssMatchStatement": _create_WebACL,
+    },
+)
@@ -7,41 +7,172 @@ See Also:
 This file is automatically generated, and should not be directly edited.
 """
 
-from attr import attrib
-from attr import attrs
+from attr import NOTHING
 
-from ..core import ATTRSCONFIG
-from ..core import Resource
-from ..core import ResourceProperties
+from .. import _lazy
+from .. import _prebuilt
+from ..core import PropertyType as _PropertyType
+from ..core import Resource as _Resource
+from ..core import ResourceProperties as _ResourceProperties
+from ..core import Tag as _Tag
 from ..core import create_object_converter
+from ..core import create_object_list_converter
 
-__all__ = ["Workspace", "WorkspaceProperties"]
+# Each class sets the attributes that it inherits with one of these
+_init_PropertyType = _prebuilt.create_inherited_init(_PropertyType)
+_init_Resource = _prebuilt.create_inherited_init(_Resource)
+_init_ResourceProperties = _prebuilt.create_inherited_init(_ResourceProperties)
 
+__all__ = [
+    "Workspace",
+    "WorkspaceProperties",
+    "WorkspaceWorkspaceProperties",
+]
 
-@attrs(**ATTRSCONFIG)
-class WorkspaceProperties(ResourceProperties):
-    BundleId = attrib(default=None)
-    DirectoryId = attrib(default=None)
-    RootVolumeEncryptionEnabled = attrib(default=None)
-    Tags = attrib(default=None)
-    UserName = attrib(default=None)
-    UserVolumeEncryptionEnabled = attrib(default=None)
-    VolumeEncryptionKey = attrib(default=None)
-    WorkspaceProperties = attrib(default=None)
 
+def _create_Workspace():
+    class WorkspaceWorkspaceProperties(_PropertyType):
+        """The Workspace Properties property type for Workspace in WorkSpaces.
 
-@attrs(**ATTRSCONFIG)
-class Workspace(Resource):
-    """A Workspace for WorkSpaces.
+        See Also:
+            `AWS Cloud Formation documentation for WorkspaceProperties
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-workspaces-workspace-workspaceproperties.html>`_
+        """
 
-    See Also:
-        `AWS Cloud Formation documentation for Workspace
-        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-workspaces-workspace.html>`_
-    """
+        __slots__ = (
+            "ComputeTypeName",
+            "RootVolumeSizeGib",
+            "RunningMode",
+            "RunningModeAutoStopTimeoutInMinutes",
+            "UserVolumeSizeGib",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WorkspaceWorkspaceProperties", _PropertyType, __slots__
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
 
-    RESOURCE_TYPE = "AWS::WorkSpaces::Workspace"
+        def __init__(
+            self,
+            *,
+            ComputeTypeName=None,
+            RootVolumeSizeGib=None,
+            RunningMode=None,
+            RunningModeAutoStopTimeoutInMinutes=None,
+            UserVolumeSizeGib=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("ComputeTypeName", ComputeTypeName)
+            _setattr("RootVolumeSizeGib", RootVolumeSizeGib)
+            _setattr("RunningMode", RunningMode)
+            _setattr(
+                "RunningModeAutoStopTimeoutInMinutes",
+                RunningModeAutoStopTimeoutInMinutes,
+            )
+            _setattr("UserVolumeSizeGib", UserVolumeSizeGib)
+            _init_PropertyType(self, kwargs)
 
-    Properties: WorkspaceProperties = attrib(
-        factory=WorkspaceProperties,
-        converter=create_object_converter(WorkspaceProperties),
+    _convert_Tag_list = create_object_list_converter(_Tag)
+    _convert_WorkspaceWorkspaceProperties = create_object_converter(
+        WorkspaceWorkspaceProperties
     )
+
+    class WorkspaceProperties(_ResourceProperties):
+        __slots__ = (
+            "BundleId",
+            "DirectoryId",
+            "RootVolumeEncryptionEnabled",
+            "Tags",
+            "UserName",
+            "UserVolumeEncryptionEnabled",
+            "VolumeEncryptionKey",
+            "WorkspaceProperties",
+        )
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "WorkspaceProperties",
+            _ResourceProperties,
+            __slots__,
+            converters={
+                "Tags": _convert_Tag_list,
+                "WorkspaceProperties": _convert_WorkspaceWorkspaceProperties,
+            },
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(
+            self,
+            *,
+            BundleId=None,
+            DirectoryId=None,
+            RootVolumeEncryptionEnabled=None,
+            Tags=None,
+            UserName=None,
+            UserVolumeEncryptionEnabled=None,
+            VolumeEncryptionKey=None,
+            WorkspaceProperties=None,
+            **kwargs,
+        ) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            _setattr("BundleId", BundleId)
+            _setattr("DirectoryId", DirectoryId)
+            _setattr("RootVolumeEncryptionEnabled", RootVolumeEncryptionEnabled)
+            _setattr("Tags", _convert_Tag_list(Tags))
+            _setattr("UserName", UserName)
+            _setattr("UserVolumeEncryptionEnabled", UserVolumeEncryptionEnabled)
+            _setattr("VolumeEncryptionKey", VolumeEncryptionKey)
+            _setattr(
+                "WorkspaceProperties",
+                _convert_WorkspaceWorkspaceProperties(WorkspaceProperties),
+            )
+            _init_ResourceProperties(self, kwargs)
+
+    _convert_WorkspaceProperties = create_object_converter(WorkspaceProperties)
+
+    class Workspace(_Resource):
+        """A Workspace for WorkSpaces.
+
+        See Also:
+            `AWS Cloud Formation documentation for Workspace
+            <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-resource-workspaces-workspace.html>`_
+        """
+
+        RESOURCE_TYPE = "AWS::WorkSpaces::Workspace"
+
+        Properties: WorkspaceProperties
+
+        __slots__ = ("Properties",)
+        __attrs_attrs__ = _prebuilt.create_attributes(
+            "Workspace",
+            _Resource,
+            __slots__,
+            converters={"Properties": _convert_WorkspaceProperties},
+            factories={"Properties": WorkspaceProperties},
+            types=__annotations__,
+        )
+        __repr__ = _prebuilt.create_repr(__attrs_attrs__)
+        __getstate__, __setstate__ = _prebuilt.create_state_methods(__attrs_attrs__)
+
+        def __init__(self, *, Properties=NOTHING, **kwargs) -> None:
+            # Converters are applied here, so the values are set directly
+            _setattr = object.__setattr__.__get__(self)
+            if Properties is NOTHING:
+                Properties = WorkspaceProperties()
+            _setattr("Properties", _convert_WorkspaceProperties(Properties))
+            _init_Resource(self, kwargs)
+
+    return Workspace, WorkspaceProperties, WorkspaceWorkspaceProperties
+
+
+# Each class is only created when it is first used
+__getattr__, __dir__ = _lazy.create_lazy_classes(
+    globals(),
+    {
+        "Workspace": _create_Workspace,
+        "WorkspaceProperties": _create_Workspace,
+        "WorkspaceWorkspaceProperties": _create_Workspace,
+    },
+)
@@ -0,0 +1,230 @@
+"""An on-disk cache of exported CloudFormation templates."""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Optional
+
+from attr import attrib
+from attr import attrs
+
+from . import _about
+from .core import Stack
+from .core import _EXPORT_FORMATS
+from .core import _validate_deferred_objects
+
+#: File extension for a cached template
+_TEMPLATE_EXTENSION = ".template"
+
+
+@attrs(slots=True)
+class CacheStatistics:
+    """Counts of how a `TemplateCache` has been used."""
+
+    #: Number of templates that were found in the cache
+    hits: int = attrib(default=0)
+
+    #: Number of templates that had to be exported
+    misses: int = attrib(default=0)
+
+    #: Number of templates that were removed to keep the cache small enough
+    evictions: int = attrib(default=0)
+
+    @property
+    def hit_rate(self) -> float:
+        """The proportion of lookups that were found in the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self):
+        return "{} hits, {} misses ({:.0%} hit rate), {} evictions".format(
+            self.hits, self.misses, self.hit_rate, self.evictions
+        )
+
+
+def get_content_hash(
+    stack: Stack, format: str = "yaml", compact: bool = False, fast: bool = False
+) -> str:
+    """Calculate a hash that identifies the exported template for a stack.
+
+    Stacks which have the same hash will be exported as the same template,
+    with the same export options and version of Flying Circus. This combines
+    the stack's fingerprint (see `Stack.fingerprint`) with the options.
+    """
+    data = [_about.__version__, format, compact, fast, stack.fingerprint()]
+    return hashlib.sha256(json.dumps(data).encode("utf-8")).hexdigest()
+
+
+class TemplateCache:
+    """An on-disk cache of exported CloudFormation templates.
+
+    Templates are stored using a hash of the stack's content and the export
+    options (see `get_content_hash`), so an unchanged stack doesn't need to
+    be exported again. Calculating the hash is much cheaper than exporting.
+
+    The cache can be limited to a total size and/or number of templates, in
+    which case the least recently used templates are removed. The directory
+    can be shared by several processes.
+
+    Example:
+        >>> cache = TemplateCache(".template-cache", max_size=100_000_000)
+        >>> template = cache.export(stack)
+        >>> print(cache.statistics)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Args:
+            directory: The directory to store templates in. It is created if
+                it doesn't exist.
+            max_size: (Optional) The maximum total size of all cached
+                templates, in bytes.
+            max_entries: (Optional) The maximum number of cached templates.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.max_size = max_size
+        self.max_entries = max_entries
+
+        #: Counts of how this cache object has been used
+        self.statistics = CacheStatistics()
+
+    def export(
+        self,
+        stack: Stack,
+        format: str = "yaml",
+        compact: bool = False,
+        fast: bool = False,
+    ) -> str:
+        """Export a stack as CloudFormation, using the cached template if
+        there is one.
+
+        This has the same parameters and result as `Stack.export`.
+        """
+        key = self.get_key(stack, format, compact, fast)
+        template = self.get(key)
+        if template is None:
+            template = stack.export(format=format, compact=compact, fast=fast)
+            self.put(key, template)
+        return template
+
+    def get_key(
+        self,
+        stack: Stack,
+        format: str = "yaml",
+        compact: bool = False,
+        fast: bool = False,
+    ) -> str:
+        """Get the cache key for exporting a stack with these options."""
+        if format not in _EXPORT_FORMATS:
+            raise ValueError("Export format '{}' is unknown".format(format))
+
+        # Don't use a cached template for objects in an unvalidated state
+        _validate_deferred_objects()
+
+        return get_content_hash(stack, format, compact, fast)
+
+    def get(self, key: str) -> Optional[str]:
+        """Get the cached template for this key, or None if it isn't cached."""
+        path = self._get_path(key)
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as fp:
+                template = fp.read()
+        except FileNotFoundError:
+            self.statistics.misses += 1
+            return None
+        except UnicodeDecodeError:
+            # The file has been damaged, so discard it
+            self._remove(path)
+            self.statistics.misses += 1
+            return None
+
+        # Mark this template as recently used. It might have just been
+        # evicted by another process, which doesn't matter.
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        self.statistics.hits += 1
+        return template
+
+    def put(self, key: str, template: str):
+        """Store a template in the cache."""
+        # Write to a temporary file first, so that other processes never see
+        # a partial template
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except FileNotFoundError:
+            # The directory has been removed since the cache was created
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with open(fd, "w", encoding="utf-8", newline="") as fp:
+                fp.write(template)
+            os.replace(temp_path, self._get_path(key))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self._evict()
+
+    def clear(self):
+        """Remove all templates from the cache."""
+        for entry in self._get_entries():
+            self._remove(entry.path)
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _TEMPLATE_EXTENSION)
+
+    def _get_entries(self) -> list:
+        """Get the directory entries for all cached templates."""
+        with os.scandir(self.directory) as entries:
+            return [
+                entry
+                for entry in entries
+                if entry.name.endswith(_TEMPLATE_EXTENSION) and entry.is_file()
+            ]
+
+    def _evict(self):
+        """Remove the least recently used templates until the cache is
+        within it's limits.
+        """
+        if self.max_size is None and self.max_entries is None:
+            return
+
+        entries = []
+        for entry in self._get_entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+
+        total_size = sum(size for _, size, _ in entries)
+        total_count = len(entries)
+        for _, size, path in entries:
+            if (self.max_size is None or total_size <= self.max_size) and (
+                self.max_entries is None or total_count <= self.max_entries
+            ):
+                break
+            self._remove(path)
+            total_size -= size
+            total_count -= 1
+            self.statistics.evictions += 1
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Another process got there first
+            pass
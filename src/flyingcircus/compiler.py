@@ -0,0 +1,94 @@
+"""Convert Flying Circus objects into plain Python data."""
+
+from operator import itemgetter
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+
+import flyingcircus
+from .yaml import CustomYamlObject
+
+
+class TemplateCompiler:
+    """Converts a tree of Flying Circus objects into plain Python data.
+
+    The result only contains dictionaries, lists, strings, numbers, booleans
+    and None. Intrinsic functions are converted to the long form used by
+    CloudFormation JSON templates (eg. `{"Ref": "LogicalName"}`), and
+    references to other objects are resolved to their logical names in the
+    current stack.
+
+    This fulfils the same role as the PyYAML dumper does during YAML export.
+    Each custom object is converted by it's `as_plain_data` method, which
+    uses this compiler to convert any nested data.
+    """
+
+    def __init__(self, sort_keys: bool = False):
+        self.__cloud_formation_stack: "flyingcircus.core.Stack" = None
+
+        #: Cache of the exportable attributes for each AWSObject that has
+        #: been examined during this compilation, keyed by object identity.
+        self.pruned_objects: Dict[int, list] = {}
+
+        #: Whether the keys of dictionaries are sorted, as they are in YAML
+        #: output. The attributes of an AWSObject are always in the order
+        #: they are exported.
+        self.sort_keys = sort_keys
+
+    @property
+    def cfn_stack(self) -> "flyingcircus.core.Stack":
+        """The Cloud Formation stack being compiled.
+
+        This should be set by the stack object when it is first compiled.
+        """
+        return self.__cloud_formation_stack
+
+    @cfn_stack.setter
+    def cfn_stack(self, value: Optional["flyingcircus.core.Stack"]):
+        # Checks
+        if value is not None:
+            from .core import Stack
+
+            if not isinstance(value, Stack):
+                raise TypeError(
+                    "The current CloudFormation stack must be a Stack object, "
+                    "in order to prevent surprise to users."
+                )
+
+            if self.__cloud_formation_stack is not None:
+                raise RuntimeError("The current CloudFormation stack is already set!")
+
+        # Set value
+        self.__cloud_formation_stack = value
+
+    def compile(self, data: Any) -> Any:
+        """Convert some data into it's plain Python equivalent."""
+        if isinstance(data, CustomYamlObject):
+            return data.as_plain_data(self)
+        if isinstance(data, str):
+            return str(data)
+        if data is None or isinstance(data, (bool, int, float)):
+            return data
+        if isinstance(data, dict):
+            return {key: self.compile(value) for key, value in self.get_items(data)}
+        if isinstance(data, (list, tuple)):
+            return [self.compile(value) for value in data]
+
+        # Don't silently fail if we try to export something weird
+        raise TypeError(
+            "{} object cannot be compiled because it does not "
+            "extend CustomYamlObject".format(data.__class__.__name__)
+        )
+
+    def get_items(self, data: dict) -> Iterable[Tuple[Any, Any]]:
+        """Get the (key, value) pairs of a dictionary, in output order."""
+        if self.sort_keys:
+            # Keys that can't be compared are left in their original order,
+            # like PyYAML does
+            try:
+                return sorted(data.items(), key=itemgetter(0))
+            except TypeError:
+                pass
+        return data.items()
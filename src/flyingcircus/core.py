@@ -1,14 +1,22 @@
 """Core classes for composing AWS Cloud Formation Stacks."""
 
+import collections.abc
 import copy
+import json
+import pickle
 import re
 import textwrap
-from itertools import chain
+import threading
+from contextlib import contextmanager
 from typing import Any
 from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import TextIO
+from typing import Tuple
+from typing import Union
 
 import attr
 import yaml
@@ -18,9 +26,12 @@ from attr import attrib
 from attr import attrs
 
 from . import _about
+from .compiler import TemplateCompiler
 from .exceptions import StackMergeError
+from .exceptions import ValidationError
 from .yaml import AmazonCFNDumper
 from .yaml import CustomYamlObject
+from .yaml import FastAmazonCFNDumper
 
 # TODO rename "AWS attribute" to "CloudFormation attribute" (or YAML attribute) everywhere ?
 
@@ -49,7 +60,7 @@ def create_object_converter(ObjectClass):
     def convert_to_object(value):
         """Convert a possible dictionary argument into it's object type"""
         # Convert a dictionary
-        if isinstance(value, dict):
+        if isinstance(value, dict) and not _is_function_data(value):
             return ObjectClass(**value)
 
         # Leave all other objects untouched. If they have an invalid type,
@@ -59,13 +70,129 @@ def create_object_converter(ObjectClass):
     return convert_to_object
 
 
+def create_object_list_converter(ObjectClass):
+    """Create a converter for attributes that are a list of this AWSObject class.
+
+    Dictionaries in the list are replaced by objects in-place, so that the
+    attribute still refers to the list that was set.
+    """
+
+    def convert_items_to_objects(value):
+        """Convert any dictionaries in a possible list argument into objects"""
+        if isinstance(value, list):
+            for i, item in enumerate(value):
+                if isinstance(item, dict) and not _is_function_data(item):
+                    value[i] = ObjectClass(**item)
+        return value
+
+    return convert_items_to_objects
+
+
+def create_object_map_converter(ObjectClass):
+    """Create a converter for attributes that are a dictionary of this
+    AWSObject class, keyed by name.
+
+    Dictionaries in the values are replaced by objects in-place, so that the
+    attribute still refers to the dictionary that was set.
+    """
+
+    def convert_values_to_objects(value):
+        """Convert any dictionaries in a possible map argument into objects"""
+        if isinstance(value, dict) and not _is_function_data(value):
+            for key, item in value.items():
+                if isinstance(item, dict) and not _is_function_data(item):
+                    value[key] = ObjectClass(**item)
+        return value
+
+    return convert_values_to_objects
+
+
+def _is_function_data(value: dict) -> bool:
+    """Whether a dictionary is an intrinsic function in it's long form
+    (eg. `{"Ref": "MyBucket"}`), rather than the data for an object.
+    """
+    if len(value) != 1:
+        return False
+    key, argument = next(iter(value.items()))
+    if key == "Condition":
+        # Some property types have a Condition property, which is an object
+        return isinstance(argument, str)
+    return key == "Ref" or (isinstance(key, str) and key.startswith("Fn::"))
+
+
+#: The state of deferred validation in each thread. It's `objects` are the
+#: objects that have had attributes set while validation is deferred, keyed
+#: by object identity. This is `None` when validation is not being deferred.
+#:
+#: See `Stack.building()`
+_DEFERRED_VALIDATION = threading.local()
+
+
+def _get_deferred_objects() -> Optional[Dict[int, "AWSObject"]]:
+    """Get the objects that are waiting to be validated in this thread, or
+    None if validation is not being deferred."""
+    return getattr(_DEFERRED_VALIDATION, "objects", None)
+
+
+def _validate_deferred_objects():
+    """Validate all objects that were modified while validation was deferred."""
+    deferred_objects = _get_deferred_objects()
+    if not deferred_objects:
+        return
+
+    pending = list(deferred_objects.values())
+    deferred_objects.clear()
+
+    # Validate every object, even if an earlier one is invalid
+    errors = []
+    for obj in pending:
+        try:
+            attr.validate(obj)
+        except (TypeError, ValueError) as ex:
+            errors.append(ex)
+
+    if len(errors) == 1:
+        raise errors[0]
+    if errors:
+        raise ValidationError(
+            "{} objects are invalid:\n{}".format(
+                len(errors),
+                "\n".join(
+                    "* {}".format(ex.args[0] if ex.args else ex) for ex in errors
+                ),
+            ),
+            errors,
+        )
+
+
+#: The export formats that are supported by `AWSObject.export`
+_EXPORT_FORMATS = {"json", "yaml"}
+
+
 # TODO create some prototypes or helper functions for creating attribs().
 # prototype_aws_attribute: int = attrib(default=None)
 # _prototype_internal_attribute: int = attrib(default=None, init=False)
 
 
+class _FingerprintedObject(CustomYamlObject):
+    """Base class with a slot for an object's cached fingerprint.
+
+    This isn't an `attrs` attribute, so it isn't part of the object's
+    state when it is copied or pickled.
+    """
+
+    __slots__ = ["_fingerprint"]
+
+    def __new__(cls, *args, **kwargs):
+        # Every new object starts without a cached fingerprint, even if it
+        # is created without calling `__init__` (eg. when unpickling)
+        self = super().__new__(cls)
+        object.__setattr__(self, "_fingerprint", None)
+        return self
+
+
 @attrs(**ATTRSCONFIG)
-class AWSObject(CustomYamlObject):
+class AWSObject(_FingerprintedObject):
     """Base class to represent any dictionary-like object from AWS Cloud Formation.
 
     Cloud Formation attributes are stored as Python attributes on the object,
@@ -94,6 +221,34 @@ class AWSObject(CustomYamlObject):
 
     # FIXME convert existing "safe" getattr code to simple attribute lookup
 
+    #: Lookup table of the `attrs` attribute declarations for this class,
+    #: keyed by attribute name. Each entry is a tuple of
+    #: (converter, validator, attribute).
+    #:
+    #: This is calculated once for each class when it is created, so that we
+    #: don't have to query `attrs` every time an attribute is set.
+    _ATTRIBUTE_TABLE: Dict[str, Tuple[Any, Any, Attribute]] = {}
+
+    #: The names of the CloudFormation attributes for this class, in the
+    #: order they are exported. This is calculated once for each class when
+    #: it is created.
+    _CFN_ATTRIBUTE_NAMES: Tuple[str, ...] = ()
+
+    # The cached fingerprint of this object is set by
+    # `flyingcircus.fingerprint`, and cleared whenever an attribute is set.
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Beware that the `attrs` decorator creates a new class when `slots`
+        # is used, so this is called twice for each decorated class. The
+        # second call has the complete set of attribute declarations.
+        cls._ATTRIBUTE_TABLE = {
+            attrib.name: (attrib.converter, attrib.validator, attrib)
+            for attrib in getattr(cls, "__attrs_attrs__", ())
+        }
+        cls._CFN_ATTRIBUTE_NAMES = cls._calculate_cfn_attribute_names()
+
     # Attribute Access
     # ----------------
 
@@ -102,25 +257,37 @@ class AWSObject(CustomYamlObject):
         # we use the existing attribute declaration to also execute them when
         # attributes are set
         # TODO push this upstream to the attrs library, controlled by a flag on @attrs ?
-
-        # Convert value first, if necessary
         try:
-            data: Attribute = attr.fields_dict(self.__class__)[key]
+            converter, validator, data = self._ATTRIBUTE_TABLE[key]
         except KeyError:
             # This attribute is not actually an attrs attribute. Let the
             # superclass deal with that...
-            pass
-        else:
-            if data.converter:
-                value = data.converter(value)
+            super(AWSObject, self).__setattr__(key, value)
+            return
+
+        # Convert value first, if necessary
+        if converter:
+            value = converter(value)
 
         # Set the value normally
         super(AWSObject, self).__setattr__(key, value)
 
-        # Run per-attribute and per-class validation
-        attr.validate(self)
+        # This object has changed, so any cached fingerprint is out of date
+        if self._fingerprint is not None:
+            super(AWSObject, self).__setattr__("_fingerprint", None)
+
+        # Run validation for the attribute that has changed. Other
+        # attributes can't have been affected.
+        if validator:
+            deferred_objects = _get_deferred_objects()
+            if deferred_objects is None:
+                validator(self, data, value)
+            else:
+                # Validate the whole object once, later on
+                deferred_objects[id(self)] = self
 
-    def _is_internal_attribute(self, name: str) -> bool:
+    @classmethod
+    def _is_internal_attribute(cls, name: str) -> bool:
         """Whether this attribute name corresponds to an internal attribute for this object.
 
         This is effectively the inverse of _is_cfn_attribute().
@@ -129,11 +296,31 @@ class AWSObject(CustomYamlObject):
         # Internal attributes all start with an underscore
         return name.startswith("_")
 
-    def _is_cfn_attribute(self, name: str) -> bool:
+    @classmethod
+    def _is_cfn_attribute(cls, name: str) -> bool:
         """Whether this attribute name corresponds to a known CloudFormation attribute for this object."""
         # TODO use attribs metadata
         # A CloudFormation attribute is an attribute that's not internal.
-        return not self._is_internal_attribute(name)
+        return not cls._is_internal_attribute(name)
+
+    @classmethod
+    def _calculate_cfn_attribute_names(cls) -> Tuple[str, ...]:
+        """Calculate the names of the CloudFormation attributes for this class, in export order."""
+        # We treat the object like a dictionary for iteration. This means
+        # we use a sorted list of CloudFormation attribute names.
+
+        # Sorting by declaration order does not work with subclassing. For
+        # now, we achieve this by having the sorted subclass override the
+        # behaviour of this function.
+        #
+        # If there turns out to be a real need for more control, we can
+        # re-introduce partial sort-order declaration like we used to
+        # have, controlled by a class constant.
+        return tuple(
+            attrib.name
+            for attrib in getattr(cls, "__attrs_attrs__", ())
+            if cls._is_cfn_attribute(attrib.name)
+        )
 
     def is_attribute_set(self, name: str) -> bool:
         """Whether this attribute has a valid value."""
@@ -148,7 +335,7 @@ class AWSObject(CustomYamlObject):
 
     # Container-Like Access For CloudFormation Attributes
     # ---------------------------------------------------
-    # TODO implement other container functions: __reversed__, __contains__
+    # TODO implement other container functions: __reversed__
     # TODO probably need __reversed__ otherwise an attempt to reverse the object will break like crazy (int item lookups)
 
     def __getitem__(self, item: str) -> Any:
@@ -178,43 +365,127 @@ class AWSObject(CustomYamlObject):
 
     def __iter__(self) -> Iterator[str]:
         # We treat the object like a dictionary for iteration. This means
-        # we return a sorted list of CloudFormation attribute names.
-
-        # Sorting by declaration order does not work with subclassing. For
-        # now, we achieve this by having the sorted subclass override the
-        # behaviour of this function.
-        #
-        # If there turns out to be a real need for more control, we can
-        # re-introduce partial sort-order declaration like we used to
-        # have, controlled by a class constant.
-
-        # noinspection PyUnresolvedReferences
-        for attrib in self.__attrs_attrs__:
-            if self._is_cfn_attribute(attrib.name):
-                yield attrib.name
+        # we return a sorted list of CloudFormation attribute names, which
+        # is pre-calculated for the class.
+        return iter(self._CFN_ATTRIBUTE_NAMES)
 
     def __len__(self) -> int:
         # The length of the object is the number of attributes currently set,
         # in order to match the result from __iter__
-        return len(list(iter(self)))
+        return len(self._CFN_ATTRIBUTE_NAMES)
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._CFN_ATTRIBUTE_NAMES
+
+    def keys(self) -> Tuple[str, ...]:
+        """The names of all CloudFormation attributes, in sorted order."""
+        return self._CFN_ATTRIBUTE_NAMES
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """The (name, value) pairs for all CloudFormation attributes, in sorted order."""
+        return [(name, getattr(self, name)) for name in self._CFN_ATTRIBUTE_NAMES]
+
+    def values(self) -> List[Any]:
+        """The values of all CloudFormation attributes, in sorted order."""
+        return [getattr(self, name) for name in self._CFN_ATTRIBUTE_NAMES]
 
     # Export Data
     # -----------
 
     # TODO change param name to prevent namespace clash
-    def export(self, format: str = "yaml") -> str:
-        """Export this AWS object as CloudFormation in the specified format."""
-        # TODO document the formats. 'json' or 'yaml'
+    def export(
+        self, format: str = "yaml", compact: bool = False, fast: bool = False
+    ) -> str:
+        """Export this AWS object as CloudFormation in the specified format.
+
+        Args:
+            format: Either "yaml" (the default) or "json". JSON output uses
+                the long form of intrinsic functions.
+            compact: (Optional) Minify JSON output by removing all optional
+                whitespace. This has no effect on YAML output.
+            fast: (Optional) Use the LibYAML dumper for YAML output, if it is
+                available. This is much faster for large templates. This has
+                no effect on JSON output.
+
+        Returns:
+            The CloudFormation template as a string.
+        """
+        # Don't export objects in an unvalidated state
+        _validate_deferred_objects()
+
         if format == "yaml":
-            return yaml.dump_all(
-                [self],
-                Dumper=AmazonCFNDumper,
-                default_flow_style=False,
-                explicit_start=True,
+            return yaml.dump_all([self], **self._get_yaml_export_args(fast))
+        elif format == "json":
+            return (
+                json.dumps(self.to_dict(), **self._get_json_export_args(compact)) + "\n"
             )
         else:
             raise ValueError("Export format '{}' is unknown".format(format))
 
+    def export_to_file(
+        self,
+        fp: TextIO,
+        format: str = "yaml",
+        compact: bool = False,
+        fast: bool = False,
+    ):
+        """Export this AWS object as CloudFormation to a text file object.
+
+        The output is written incrementally, so the complete template never
+        has to be held in memory as a single string. The output is otherwise
+        the same as for `export()`, which describes the parameters.
+        """
+        # Don't export objects in an unvalidated state
+        _validate_deferred_objects()
+
+        if format == "yaml":
+            yaml.dump_all([self], stream=fp, **self._get_yaml_export_args(fast))
+        elif format == "json":
+            json.dump(self.to_dict(), fp, **self._get_json_export_args(compact))
+            fp.write("\n")
+        else:
+            raise ValueError("Export format '{}' is unknown".format(format))
+
+    @staticmethod
+    def _get_yaml_export_args(fast: bool) -> Dict[str, Any]:
+        """Get the arguments to PyYAML for exporting CloudFormation YAML."""
+        return dict(
+            Dumper=FastAmazonCFNDumper if fast else AmazonCFNDumper,
+            default_flow_style=False,
+            explicit_start=True,
+        )
+
+    @staticmethod
+    def _get_json_export_args(compact: bool) -> Dict[str, Any]:
+        """Get the arguments to the `json` library for exporting CloudFormation JSON."""
+        # Keys aren't sorted by the `json` library, because the order of
+        # attributes is already deterministic, and it follows CloudFormation
+        # conventions (eg. `Type` comes before `Properties` in a Resource).
+        # The keys of dictionaries are sorted by the compiler instead, so
+        # they are in the same order as in YAML output.
+        #
+        # NaN and Infinity are not valid JSON, so we don't allow them.
+        if compact:
+            return dict(allow_nan=False, separators=(",", ":"))
+        return dict(allow_nan=False, indent=2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert this AWS object into plain Python data.
+
+        The result is a dictionary that contains only dictionaries, lists,
+        strings, numbers, booleans and None. It has the same content as the
+        exported CloudFormation, except that intrinsic functions always use
+        the long form from CloudFormation JSON templates (eg.
+        `{"Fn::GetAtt": ["LogicalName", "Arn"]}`) rather than a YAML tag.
+        References to other objects are resolved to their logical names in
+        the stack. Dictionaries have their keys in the same order as in the
+        exported CloudFormation.
+        """
+        # Don't export objects in an unvalidated state
+        _validate_deferred_objects()
+
+        return TemplateCompiler(sort_keys=True).compile(self)
+
     def as_yaml_node(self, dumper: yaml.Dumper) -> yaml.Node:
         # Ideally, we would create a tag that contains the object name
         # (eg. "!Bucket") for completeness. Unfortunately, there is no way
@@ -225,45 +496,48 @@ class AWSObject(CustomYamlObject):
         # TODO investigate hacking a Dumper subclass like we did for aliasing
         tag = yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG
 
-        # Get all cloud formation attributes that are set, in sorted order
-        attributes = [(key, self[key]) for key in self if self.is_attribute_set(key)]
-
-        # Create neater YAML by filtering out empty blocks at this level
-        attributes = [
-            (key, value) for key, value in attributes if is_non_empty_attribute(value)
-        ]
-
-        # Create neater YAML by filtering out empty entries in sub-lists
-        attributes = [
-            (key, remove_empty_values_from_attribute(value))
-            for key, value in attributes
-        ]
+        # Get all cloud formation attributes that are set and non-empty, in
+        # sorted order. Create neater YAML by filtering out empty entries in
+        # sub-lists and sub-dictionaries.
+        #
+        # The emptiness of the whole tree of nested objects is calculated in
+        # one pass, and the result for each nested object is shared through
+        # the dumper (if it supports that), so that nested objects don't
+        # have to re-examine their own sub-tree when they are represented.
+        attributes = self._get_pruned_attributes(
+            getattr(dumper, "pruned_objects", None)
+        )
 
         # Represent this object as a mapping of it's AWS attributes.
         # Note that `represent_mapping` works on a list of 2-tuples, not a map!
         return dumper.represent_mapping(tag, attributes)
 
+    def as_plain_data(self, compiler: TemplateCompiler) -> Dict[str, Any]:
+        attributes = self._get_pruned_attributes(compiler.pruned_objects)
+        return {key: compiler.compile(value) for key, value in attributes}
+
+    def _get_pruned_attributes(
+        self, pruned_objects: Optional[Dict[int, list]]
+    ) -> List[Tuple[str, Any]]:
+        """Get the (name, value) pairs for all attributes that should be exported.
+
+        Args:
+            pruned_objects: (Optional) Cache of the exportable attributes for
+                every AWSObject that has already been examined in the current
+                export.
+        """
+        if pruned_objects is None:
+            pruned_objects = {}
+        try:
+            return pruned_objects[id(self)]
+        except KeyError:
+            _prune_empty_values(self, pruned_objects)
+            return pruned_objects[id(self)]
+
 
 def remove_empty_values_from_attribute(data):
     """If this attribute is a list or dictionary, return a copy with empty entries recursively removed."""
-    if isinstance(data, list):
-        cleaned = map(remove_empty_values_from_attribute, data)
-        cleaned = filter(is_non_empty_attribute, cleaned)
-        return list(cleaned)
-    elif isinstance(data, dict):
-        cleaned = {
-            key: remove_empty_values_from_attribute(value)
-            for key, value in data.items()
-        }
-        cleaned = {
-            key: value
-            for key, value in cleaned.items()
-            if is_non_empty_attribute(value)
-        }
-        return dict(cleaned)
-
-    # Don't modify other types
-    return data
+    return _prune_empty_values(data)[1]
 
 
 def is_non_empty_attribute(data):
@@ -277,24 +551,103 @@ def is_non_empty_attribute(data):
       - not a block-like object
       - a block-like object that contains at least one non-empty attribute.
     """
-    if isinstance(data, (tuple, list)):
-        for value in data:
-            if is_non_empty_attribute(value):
-                return True
-        return False
-    elif isinstance(data, dict):
-        for value in data.values():
-            if is_non_empty_attribute(value):
-                return True
-        return False
-    elif isinstance(data, AWSObject):
-        for key in data:
-            if data.is_attribute_set(key) and is_non_empty_attribute(data[key]):
-                return True
-        return False
+    return _prune_empty_values(data)[0]
 
-    # Other types of object are never empty
-    return True
+
+def _prune_empty_values(data, pruned_objects: Optional[Dict[int, list]] = None):
+    """Calculate the emptiness of an attribute, and remove empty values from it.
+
+    This combines `is_non_empty_attribute` and
+    `remove_empty_values_from_attribute` into a single bottom-up pass over
+    the data, without recursion. Lists and dictionaries that don't contain
+    any empty values are returned unmodified, rather than being copied.
+
+    Args:
+        data: The attribute value to examine.
+        pruned_objects: (Optional) Mapping from the identity of an AWSObject
+            to the list of (name, value) pairs that it should export. This
+            is populated for every AWSObject in the data, and any objects
+            that are already present are not examined again.
+
+    Returns:
+        A tuple of (is_non_empty, cleaned_value)
+    """
+    if pruned_objects is None:
+        pruned_objects = {}
+
+    # A stack of partially-examined block-like objects. Each frame is a list
+    # of [object, keys, children, results], where `results` has an entry of
+    # (is_non_empty, cleaned_value) for each child that has been examined.
+    stack = []
+
+    def visit(value):
+        """Get the result for a scalar value, or push a frame for a block-like value."""
+        if isinstance(value, (tuple, list)):
+            stack.append([value, None, value, []])
+        elif isinstance(value, dict):
+            stack.append([value, list(value.keys()), list(value.values()), []])
+        elif isinstance(value, AWSObject):
+            try:
+                return bool(pruned_objects[id(value)]), value
+            except KeyError:
+                pass
+            keys = [key for key in value if value.is_attribute_set(key)]
+            stack.append([value, keys, [value[key] for key in keys], []])
+        else:
+            # Other types of object are never empty
+            return True, value
+        return None
+
+    result = visit(data)
+    while stack:
+        frame = stack[-1]
+        value, keys, children, results = frame
+
+        # Examine the next child, if there is one
+        if len(results) < len(children):
+            child_result = visit(children[len(results)])
+            if child_result is not None:
+                results.append(child_result)
+            continue
+
+        # All children have been examined, so we can calculate the result
+        # for this object.
+        stack.pop()
+        if isinstance(value, AWSObject):
+            attributes = [
+                (key, cleaned)
+                for key, (is_non_empty, cleaned) in zip(keys, results)
+                if is_non_empty
+            ]
+            pruned_objects[id(value)] = attributes
+            result = bool(attributes), value
+        elif isinstance(value, tuple):
+            # Tuples are never modified
+            result = any(is_non_empty for is_non_empty, _ in results), value
+        else:
+            is_modified = False
+            for (is_non_empty, cleaned), child in zip(results, children):
+                if not is_non_empty or cleaned is not child:
+                    is_modified = True
+                    break
+
+            if isinstance(value, list):
+                if is_modified:
+                    value = [
+                        cleaned for is_non_empty, cleaned in results if is_non_empty
+                    ]
+            elif is_modified:
+                value = {
+                    key: cleaned
+                    for key, (is_non_empty, cleaned) in zip(keys, results)
+                    if is_non_empty
+                }
+            result = bool(value), value
+
+        if stack:
+            stack[-1][3].append(result)
+
+    return result
 
 
 class _EmptyList(CustomYamlObject):
@@ -303,6 +656,13 @@ class _EmptyList(CustomYamlObject):
     def as_yaml_node(self, dumper):
         return dumper.represent_list([])
 
+    def as_plain_data(self, compiler):
+        return []
+
+    def __reduce__(self):
+        # Keep the signal value as a singleton when it is copied or pickled
+        return "EMPTY_LIST"
+
 
 #: Signal value for an empty list.
 #:
@@ -318,6 +678,13 @@ class _EmptyDict(CustomYamlObject):
     def as_yaml_node(self, dumper):
         return dumper.represent_dict({})
 
+    def as_plain_data(self, compiler):
+        return {}
+
+    def __reduce__(self):
+        # Keep the signal value as a singleton when it is copied or pickled
+        return "EMPTY_DICT"
+
 
 #: Signal value for an empty dictionary.
 #:
@@ -327,6 +694,247 @@ class _EmptyDict(CustomYamlObject):
 EMPTY_DICT = _EmptyDict()
 
 
+def _get_export_name(data) -> Any:
+    """Get the export name for an Output-like object, or None if it doesn't
+    have one that can be indexed."""
+    export = getattr(data, "Export", None) or {}
+    export_name = export.get("Name") or None
+    try:
+        hash(export_name)
+    except TypeError:
+        # An intrinsic function in it's long form (ie. a dictionary) can't
+        # be used as a key
+        return None
+    return export_name
+
+
+class TemplateSection(CustomYamlObject, dict):
+    """A section of a template that maps logical names to objects.
+
+    This is used for the Resources, Parameters and Outputs of a Stack. It
+    behaves exactly like a dictionary, but it also keeps indexes of the
+    objects that it contains up to date, so that they can be found without
+    searching the whole stack.
+
+    Logical names are checked when an item is added. The same object may be
+    added under several names, but then it will be an error to look up the
+    logical name of that object (eg. to export a `Ref` to it).
+
+    The export name of an Output can be changed after it has been added, so
+    the export name of every item is checked again when Outputs are looked
+    up by their export name. Export names that are plain data for an
+    intrinsic function (eg. `{"Fn::Sub": "..."}`) are not indexed.
+    """
+
+    __slots__ = [
+        "_export_names",
+        "_names_by_export",
+        "_names_by_id",
+        "_names_by_type",
+    ]
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self)
+        self._export_names: Dict[str, Any] = {}
+        self._names_by_export: Dict[Any, List[str]] = {}
+        self._names_by_id: Dict[int, List[str]] = {}
+        self._names_by_type: Dict[type, Dict[str, None]] = {}
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # Copying or pickling a dictionary normally bypasses the constructor,
+        # which would leave us without indexes.
+        return self.__class__, (dict(self),)
+
+    # Dictionary Modification
+    # -----------------------
+
+    @staticmethod
+    def _check_logical_name(name: str):
+        if not isinstance(name, str):
+            raise TypeError("Logical name should be a string: {!r}".format(name))
+        if not re.fullmatch(r"[A-Za-z0-9_]+", name):
+            raise ValueError(
+                "Logical name should only have alphanumeric or underscore "
+                "characters: '{}'".format(name)
+            )
+
+    def __setitem__(self, name: str, value: Any):
+        self._check_logical_name(name)
+
+        # The indexes are updated first, so that the item isn't added if
+        # they can't be
+        if name in self:
+            self._remove_from_indexes(name, dict.__getitem__(self, name))
+        self._add_to_indexes(name, value)
+        dict.__setitem__(self, name, value)
+
+    def __delitem__(self, name: str):
+        value = dict.__getitem__(self, name)
+        dict.__delitem__(self, name)
+        self._remove_from_indexes(name, value)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        dict.clear(self)
+        self._export_names.clear()
+        self._names_by_export.clear()
+        self._names_by_id.clear()
+        self._names_by_type.clear()
+
+    def copy(self) -> "TemplateSection":
+        return self.__class__(self)
+
+    def pop(self, name: str, *args) -> Any:
+        if name not in self:
+            return dict.pop(self, name, *args)
+        value = dict.__getitem__(self, name)
+        del self[name]
+        return value
+
+    def popitem(self) -> Tuple[str, Any]:
+        name, value = dict.popitem(self)
+        self._remove_from_indexes(name, value)
+        return name, value
+
+    def setdefault(self, name: str, default: Any = None) -> Any:
+        if name not in self:
+            self[name] = default
+        return dict.__getitem__(self, name)
+
+    def update(self, *args, **kwargs):
+        if len(args) > 1:
+            raise TypeError(
+                "update expected at most 1 positional argument, got {}".format(
+                    len(args)
+                )
+            )
+
+        # Add items directly from any mapping, without copying it first
+        if args:
+            other = args[0]
+            if hasattr(other, "keys"):
+                for name in other.keys():
+                    self[name] = other[name]
+            else:
+                for name, value in other:
+                    self[name] = value
+        for name, value in kwargs.items():
+            self[name] = value
+
+    def rename(self, old_name: str, new_name: str):
+        """Change the logical name of an item, retaining it's position."""
+        if old_name not in self:
+            raise KeyError(old_name)
+        self._check_logical_name(new_name)
+        if new_name in self:
+            raise KeyError(
+                "There is already an item with the logical name {}".format(new_name)
+            )
+
+        # Rebuild the dictionary in the same order. This is slow, but renaming
+        # is rare.
+        items = list(self.items())
+        self.clear()
+        for name, value in items:
+            self[new_name if name == old_name else name] = value
+
+    # Indexes
+    # -------
+
+    def _add_to_indexes(self, name: str, value: Any):
+        self._names_by_id.setdefault(id(value), []).append(name)
+        self._names_by_type.setdefault(type(value), {})[name] = None
+        self._add_export_name(name, _get_export_name(value))
+
+    def _remove_from_indexes(self, name: str, value: Any):
+        _remove_from_index(self._names_by_id, id(value), name)
+        _remove_from_index(self._names_by_type, type(value), name)
+        self._remove_export_name(name)
+
+    def _add_export_name(self, name: str, export_name: Any):
+        if export_name is not None:
+            self._export_names[name] = export_name
+            self._names_by_export.setdefault(export_name, []).append(name)
+
+    def _remove_export_name(self, name: str):
+        # The export name that was indexed is removed, which might not be the
+        # item's current export name
+        export_name = self._export_names.pop(name, None)
+        if export_name is not None:
+            _remove_from_index(self._names_by_export, export_name, name)
+
+    def _update_export_names(self):
+        """Index the current export name of each item, in case an Output was
+        changed after it was added."""
+        for name, value in dict.items(self):
+            export_name = _get_export_name(value)
+            if export_name != self._export_names.get(name):
+                self._remove_export_name(name)
+                self._add_export_name(name, export_name)
+
+    def get_names(self, obj: Any) -> List[str]:
+        """Get all the logical names for this object, by identity."""
+        return list(self._names_by_id.get(id(obj), ()))
+
+    def find_by_type(self, cls: type) -> Iterator[Tuple[str, Any]]:
+        """Find all items that are an instance of this class.
+
+        Items are grouped by their exact type, so they are not returned in
+        insertion order.
+        """
+        for item_type, names in list(self._names_by_type.items()):
+            if issubclass(item_type, cls):
+                for name in list(names):
+                    yield name, dict.__getitem__(self, name)
+
+    def find_by_export_name(self, export_name: Any) -> List[str]:
+        """Get the logical names of all Outputs with this export name."""
+        self._update_export_names()
+        return list(self._names_by_export.get(export_name, ()))
+
+    def get_export_names(self) -> set:
+        """Get the export names of all the Outputs in this section."""
+        self._update_export_names()
+        return set(self._names_by_export.keys())
+
+    # Export Data
+    # -----------
+
+    def as_yaml_node(self, dumper):
+        return dumper.represent_dict(self)
+
+    def as_plain_data(self, compiler):
+        return {
+            name: compiler.compile(value) for name, value in compiler.get_items(self)
+        }
+
+
+#: Marker at the start of a stack snapshot file. See `Stack.save`.
+_SNAPSHOT_MAGIC = "flyingcircus.Stack snapshot"
+
+
+def _remove_from_index(index: Dict[Any, Any], key: Any, name: str):
+    """Remove a name from a single entry in an index, tidying up if it is empty."""
+    names = index[key]
+    if isinstance(names, list):
+        names.remove(name)
+    else:
+        del names[name]
+    if not names:
+        del index[key]
+
+
+def _convert_to_template_section(value) -> TemplateSection:
+    """Convert a possible dictionary into a TemplateSection."""
+    if isinstance(value, TemplateSection):
+        return value
+    return TemplateSection(value)
+
+
 @attrs(**ATTRSCONFIG)
 class Stack(AWSObject):
     """Represents a CloudFormation Stack, the top-level template object.
@@ -339,12 +947,18 @@ class Stack(AWSObject):
     AWSTemplateFormatVersion: str = attrib(default="2010-09-09")
     Description: Optional[str] = attrib(default=None)
     Metadata: Dict[str, Any] = attrib(factory=dict)
-    Parameters: Dict[str, Any] = attrib(factory=dict)
+    Parameters: TemplateSection = attrib(
+        factory=TemplateSection, converter=_convert_to_template_section
+    )
     Mappings: Dict[str, Any] = attrib(factory=dict)
     Conditions: Dict[str, Any] = attrib(factory=dict)
     Transform: Optional[str] = attrib(default=None)
-    Resources: Dict[str, Any] = attrib(factory=dict)
-    Outputs: Dict[str, Any] = attrib(factory=dict)
+    Resources: TemplateSection = attrib(
+        factory=TemplateSection, converter=_convert_to_template_section
+    )
+    Outputs: TemplateSection = attrib(
+        factory=TemplateSection, converter=_convert_to_template_section
+    )
 
     def __attrs_post_init__(self):
         # Set standard Metadata
@@ -354,6 +968,118 @@ class Stack(AWSObject):
         dumper.cfn_stack = self
         return super().as_yaml_node(dumper)
 
+    def as_plain_data(self, compiler):
+        compiler.cfn_stack = self
+        return super().as_plain_data(compiler)
+
+    @staticmethod
+    @contextmanager
+    def building():
+        """Context manager that defers attribute validation while a stack is built.
+
+        Normally an attribute is validated every time it is set. Inside this
+        context, attribute converters are still applied immediately, but each
+        modified object is only validated once, when the context exits (or
+        when something is exported, whichever comes first). This makes bulk
+        construction and modification of objects much cheaper.
+
+        Nested contexts are validated when the outermost context exits. If
+        the block raises an exception, the pending validation is discarded.
+        Validation is only deferred in the current thread.
+
+        Every pending object is validated, even if an earlier one is invalid.
+        If more than one object is invalid, a
+        `flyingcircus.exceptions.ValidationError` describes all of them.
+
+        Validators that `attrs` runs when an object is constructed (for a
+        class that is decorated with `attrs`) are not deferred, because the
+        generated `__init__` runs them directly. Only the attributes that are
+        set after construction are validated later.
+
+        Example:
+            >>> with Stack.building():
+            ...     for resource in stack.Resources.values():
+            ...         resource.DeletionPolicy = "Retain"
+        """
+        if _get_deferred_objects() is not None:
+            # We're already deferring validation in an outer context
+            yield
+            return
+
+        _DEFERRED_VALIDATION.objects = {}
+        try:
+            yield
+            _validate_deferred_objects()
+        finally:
+            _DEFERRED_VALIDATION.objects = None
+
+    def save(self, path: str):
+        """Save a snapshot of this stack to a binary file.
+
+        The snapshot contains the complete Python object model for the stack,
+        including any shared objects and references between objects (eg.
+        `Ref` and `GetAtt`). Use `Stack.load` to re-create it.
+
+        Every object in the stack (including any custom classes it uses)
+        must be able to be pickled.
+        """
+        # Don't save objects in an unvalidated state
+        _validate_deferred_objects()
+
+        with open(path, "wb") as fp:
+            # The header is pickled separately, so that we can check it
+            # before we try to unpickle the objects
+            pickle.dump(_SNAPSHOT_MAGIC, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(_about.__version__, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(self, fp, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "Stack":
+        """Load a stack from a snapshot file created by `Stack.save`.
+
+        The snapshot must have been created with the same version of Flying
+        Circus. Beware that loading a snapshot can run arbitrary code, so
+        only load files that you trust.
+
+        Raises:
+            ValueError: If the file is not a compatible snapshot.
+        """
+        with open(path, "rb") as fp:
+            try:
+                magic = pickle.load(fp)
+            except (pickle.UnpicklingError, EOFError):
+                magic = None
+            if magic != _SNAPSHOT_MAGIC:
+                raise ValueError("{} is not a stack snapshot".format(path))
+
+            version = pickle.load(fp)
+            if version != _about.__version__:
+                raise ValueError(
+                    "Stack snapshot {} was created by version {} of Flying "
+                    "Circus, not this version ({})".format(
+                        path, version, _about.__version__
+                    )
+                )
+
+            stack = pickle.load(fp)
+
+        if not isinstance(stack, cls):
+            raise ValueError(
+                "Stack snapshot {} contains a {}, not a {}".format(
+                    path, type(stack).__name__, cls.__name__
+                )
+            )
+        return stack
+
+    def fingerprint(self) -> str:
+        """Calculate a hash that identifies the content of this stack.
+
+        See `flyingcircus.fingerprint.fingerprint` for details.
+        """
+        from .fingerprint import fingerprint
+
+        return fingerprint(self)
+
     def get_logical_name(self, resource, resources_only=False):
         """Get the logical name used for this object in this stack.
 
@@ -365,14 +1091,9 @@ class Stack(AWSObject):
         if not resources_only and isinstance(resource, PseudoParameter):
             return str(resource)
 
-        # The lazy and non-performant approach is to iterate through all
-        # the objects in this stack until we find the supplied object.
-        # That should do for now, really.
-        matches = [name for name, data in self.Resources.items() if data is resource]
+        matches = self.Resources.get_names(resource)
         if not resources_only:
-            matches.extend(
-                [name for name, data in self.Parameters.items() if data is resource]
-            )
+            matches.extend(self.Parameters.get_names(resource))
 
         if len(matches) > 1:
             raise ValueError(
@@ -387,28 +1108,127 @@ class Stack(AWSObject):
 
         Return the current stack for call-chaining purposes.
         """
+        return self.merge_all([other])
+
+    def merge_all(self, others: Iterable[Union["Stack", "PrefixedStackView"]]):
+        """Add a reference in this stack to all objects from all the supplied stacks.
+
+        This is the same as calling `merge_stack` for each stack in turn,
+        except that the conflicts between all of the stacks are found before
+        anything is merged. If there are any conflicts, then nothing is
+        merged, and the StackMergeError describes every conflict.
+
+        Return the current stack for call-chaining purposes.
+        """
+        others = list(others)
+
+        conflicts = self._find_merge_conflicts(others)
+        if len(conflicts) == 1:
+            raise StackMergeError(conflicts[0])
+        elif conflicts:
+            raise StackMergeError(
+                "Unable to merge stacks because of {} conflicts:\n{}".format(
+                    len(conflicts), "\n".join("* " + c for c in conflicts)
+                ),
+                conflicts,
+            )
+
+        # Copy the name and reference for the relevant item types
+        for other in others:
+            for item_type in ["Resources", "Parameters", "Outputs"]:
+                self[item_type].update(other[item_type])
+
+            # Copy across metadata from other sources.
+            for name, value in other.Metadata.items():
+                if name != "FlyingCircus":
+                    self.Metadata[name] = value
+
+        return self
+
+    def _find_merge_conflicts(
+        self, others: List[Union["Stack", "PrefixedStackView"]]
+    ) -> List[str]:
+        """Describe every conflict that prevents merging these stacks into this stack."""
+        conflicts = []
+
+        # When there is only one other stack (ie. from `merge_stack`), the
+        # messages are worded in the same way as they always have been
+        single = len(others) == 1
+
+        def describe(i):
+            # Describe one of the other stacks in an error message
+            return "other stack {}".format(i + 1)
+
+        def source(i):
+            # Describe which other stack conflicts with this stack
+            return "" if single else " (from {})".format(describe(i))
+
         # Check that we aren't using incompatible versions. Note that the
         # 'Transform' attribute is currently used to store the version of
         # the Serverless Application Model we are using (if any), so it
         # counts as a version too.
-        if self.AWSTemplateFormatVersion != other.AWSTemplateFormatVersion:
-            raise StackMergeError(
-                "This template has a different template version ({}) to the "
-                "other template ({})".format(
-                    self.AWSTemplateFormatVersion, other.AWSTemplateFormatVersion
-                )
-            )
-        if (
-            self.Transform is not None
-            and other.Transform is not None
-            and self.Transform != other.Transform
-        ):
-            raise StackMergeError(
-                "This template has a different Serverless Application Model "
-                "Transform version ({}) to the other template ({})".format(
-                    self.Transform, other.Transform
-                )
-            )
+        transform = self.Transform
+        transform_source = "this stack"
+        for i, other in enumerate(others):
+            if self.AWSTemplateFormatVersion != other.AWSTemplateFormatVersion:
+                if single:
+                    conflicts.append(
+                        "This template has a different template version ({}) to "
+                        "the other template ({})".format(
+                            self.AWSTemplateFormatVersion,
+                            other.AWSTemplateFormatVersion,
+                        )
+                    )
+                else:
+                    conflicts.append(
+                        "The template version of {} ({}) is different to this "
+                        "stack ({})".format(
+                            describe(i),
+                            other.AWSTemplateFormatVersion,
+                            self.AWSTemplateFormatVersion,
+                        )
+                    )
+            if other.Transform is None:
+                continue
+            if transform is None:
+                transform = other.Transform
+                transform_source = describe(i)
+            elif transform != other.Transform:
+                if single:
+                    conflicts.append(
+                        "This template has a different Serverless Application "
+                        "Model Transform version ({}) to the other template "
+                        "({})".format(transform, other.Transform)
+                    )
+                else:
+                    conflicts.append(
+                        "The Serverless Application Model Transform version of "
+                        "{} ({}) is different to {} ({})".format(
+                            describe(i), other.Transform, transform_source, transform
+                        )
+                    )
+
+        # Check for repeated logical names, both with this stack and between
+        # the other stacks.
+        for item_type in ["Resources", "Parameters", "Outputs"]:
+            existing_items = self[item_type]
+            sources = {}
+            for i, other in enumerate(others):
+                for name in other[item_type]:
+                    if name in existing_items:
+                        conflicts.append(
+                            "{} in this stack already has an item with the "
+                            "logical name {}{}".format(item_type, name, source(i))
+                        )
+                    elif name in sources:
+                        conflicts.append(
+                            "{} in {} and {} both have an item with the logical "
+                            "name {}".format(
+                                item_type, describe(sources[name]), describe(i), name
+                            )
+                        )
+                    else:
+                        sources[name] = i
 
         # Check for output's with a repeated name. The export name can be
         # different from the logical name of the Output in the stack, so it
@@ -417,112 +1237,76 @@ class Stack(AWSObject):
         # Duplicated export names are picked up by cloud formation when we
         # import the template, but when merging stacks it is a lot more
         # helpful to catch these errors early
-        existing_exports = {
-            getattr(output, "Export", {}).get("Name", "")
-            for output in self.Outputs.values()
-        }
-        new_exports = {
-            getattr(output, "Export", {}).get("Name", "")
-            for output in other.Outputs.values()
-        }
-        shared_exports = existing_exports.intersection(new_exports)
-        shared_exports.discard("")
-        if shared_exports:
-            raise StackMergeError(
-                "The target stack already has exports named {}".format(
-                    ", ".join(sorted(shared_exports))
-                )
-            )
-
-        # Copy the name and reference for the relevant item types
-        for item_type in ["Resources", "Parameters", "Outputs"]:
-            existing_items = self[item_type]
-            new_items = other[item_type]
-            for name, value in new_items.items():
-                if name in existing_items:
-                    raise StackMergeError(
-                        "{} in this stack already has an item with the logical name {}".format(
-                            item_type, name
+        existing_exports = self.Outputs.get_export_names()
+        sources = {}
+        for i, other in enumerate(others):
+            shared_exports = []
+            for export_name in other.Outputs.get_export_names():
+                if export_name in existing_exports:
+                    shared_exports.append(export_name)
+                elif export_name in sources:
+                    conflicts.append(
+                        "{} and {} both have exports named {}".format(
+                            describe(sources[export_name]), describe(i), export_name
                         )
                     )
-                existing_items[name] = value
-
-        # Copy across metadata from other sources.
-        for name, value in other.Metadata.items():
-            if name == "FlyingCircus":
-                continue
-            if name in self.Metadata:
-                raise StackMergeError(
-                    "Metadata in this stack already has an item with the logical name {}".format(
-                        name
+                else:
+                    sources[export_name] = i
+            if shared_exports:
+                conflicts.append(
+                    "The target stack already has exports named {}{}".format(
+                        ", ".join(sorted(str(name) for name in shared_exports)),
+                        source(i),
                     )
                 )
-            self.Metadata[name] = value
 
-        return self
+        # Check for repeated metadata from other sources.
+        sources = {}
+        for i, other in enumerate(others):
+            for name in other.Metadata:
+                if name == "FlyingCircus":
+                    continue
+                if name in self.Metadata:
+                    conflicts.append(
+                        "Metadata in this stack already has an item with the "
+                        "logical name {}{}".format(name, source(i))
+                    )
+                elif name in sources:
+                    conflicts.append(
+                        "Metadata in {} and {} both have an item with the "
+                        "logical name {}".format(
+                            describe(sources[name]), describe(i), name
+                        )
+                    )
+                else:
+                    sources[name] = i
 
-    def with_prefixed_names(self, prefix):
+        return conflicts
+
+    def with_prefixed_names(self, prefix: str) -> "Stack":
         """Create a new stack which has the same objects as the current stack,
         but with the supplied prefix added to the logical and external names
         of all appropriate objects.
 
         Return the new stack.
-        """
-        # TODO Add checks for logical name format when we set items, as well as here
-        # FIXME #43 Copy across Metadata. i don't think we should prefix it.
-
-        # Filter out ridiculous prefixes before they cause subtle damage
-        if not isinstance(prefix, str):
-            raise TypeError("Prefix should be a string")
-        if not prefix:
-            raise ValueError("Prefix should not be empty")
-        if not re.fullmatch(r"[A-Z]\w*", prefix):
-            raise ValueError(
-                "Prefix should have alphanumeric or underscore characters, "
-                "beginning with an uppercase character: '{}'".format(prefix)
-            )
-
-        # Create a new stack with copies of the static text fields
-        new_stack = Stack(
-            AWSTemplateFormatVersion=self.AWSTemplateFormatVersion,
-            Transform=self.Transform,
-        )
 
-        # Modify the description to refer to the prefix. This is a bit hacky,
-        # but for our use cases we don't expect the description to be
-        # retained in final output, so it's good enough for now
-        if self.Description:
-            new_stack.Description = prefix + ": " + self.Description
-        else:
-            new_stack.Description = prefix
+        If you only want to merge the prefixed objects into another stack,
+        then `prefixed_view` is more efficient.
+        """
+        return self.prefixed_view(prefix).to_stack()
 
-        # Insert all references to standard existing objects into new stack, with modified names
-        # Copy the name and reference for the relevant item types
-        for item_type in ["Resources", "Parameters"]:
-            new_stack[item_type] = new_items = {}
-            for name, value in self[item_type].items():
-                new_items[prefix + name] = value
-
-        # Create copies of all Outputs, with modified Export name where appropriate
-        if hasattr(self, "Outputs"):
-            new_stack.Outputs = {}
-            for name, output in self.Outputs.items():
-                # Beware that a deep copy may wreck any intrinsic functions
-                # we have attached (a common use case), which is undesirable.
-                #
-                # OTOH, a shallow copy means that any modifications to the
-                # attribute's values (like Export) will affect the original,
-                # which is also undesirable. We just need to remember to
-                # allow for this
-                output = copy.copy(output)
-                if getattr(output, "Export", {}).get("Name", ""):
-                    output.Export = {"Name": prefix + output.Export["Name"]}
-
-                new_stack.Outputs[prefix + name] = output
+    def prefixed_view(self, prefix: str) -> "PrefixedStackView":
+        """Create a read-only view of the current stack, with the supplied
+        prefix added to the logical and external names of all appropriate
+        objects.
 
-        return new_stack
+        This has the same contents as the stack from `with_prefixed_names`,
+        but nothing is renamed or copied until it is used. It can be merged
+        into another stack with `merge_stack` or `merge_all`.
+        """
+        return PrefixedStackView(self, prefix)
 
-    def tag(self, tags=None, tag_derived_resources=True, **more_tags):
+    def tag(self, tags=None, tag_derived_resources=None, **more_tags):
         """Apply tags to all resources in this stack, where they are supported.
 
         Parameters:
@@ -534,7 +1318,8 @@ class Stack(AWSObject):
              of duplicates.
             tag_derived_resources (bool): Whether to attempt to apply the
              same tags to derived resources, using Cloud Formation
-             (eg. EC2 instances started by an auto-scaling group).
+             (eg. EC2 instances started by an auto-scaling group). See
+             `Resource.tag` for the default.
 
         See Also:
             `AWS documentation on resource tagging
@@ -557,6 +1342,153 @@ class Stack(AWSObject):
                 resource.tag(tags=tags, tag_derived_resources=tag_derived_resources)
 
 
+class PrefixedStackView:
+    """A read-only view of a stack, with a prefix added to the logical and
+    external names of all appropriate objects.
+
+    Use `Stack.prefixed_view` to create one of these. The view reflects the
+    current contents of the underlying stack. The same objects are used,
+    except that Outputs are shallow copies with a modified export name. Each
+    Output is only copied when it is first used.
+    """
+
+    __slots__ = ["_stack", "_prefix", "Resources", "Parameters", "Outputs"]
+
+    def __init__(self, stack: Stack, prefix: str):
+        # FIXME #43 Copy across Metadata. i don't think we should prefix it.
+
+        # Filter out ridiculous prefixes before they cause subtle damage
+        if not isinstance(prefix, str):
+            raise TypeError("Prefix should be a string")
+        if not prefix:
+            raise ValueError("Prefix should not be empty")
+        if not re.fullmatch(r"[A-Z][A-Za-z0-9_]*", prefix):
+            raise ValueError(
+                "Prefix should have alphanumeric or underscore characters, "
+                "beginning with an uppercase character: '{}'".format(prefix)
+            )
+
+        self._stack = stack
+        self._prefix = prefix
+
+        self.Resources = _PrefixedSection(stack.Resources, prefix)
+        self.Parameters = _PrefixedSection(stack.Parameters, prefix)
+        self.Outputs = _PrefixedOutputs(stack.Outputs, prefix)
+
+    def __getitem__(self, key: str):
+        if key not in ("Resources", "Parameters", "Outputs"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    @property
+    def AWSTemplateFormatVersion(self) -> str:
+        return self._stack.AWSTemplateFormatVersion
+
+    @property
+    def Transform(self) -> Optional[str]:
+        return self._stack.Transform
+
+    @property
+    def Description(self) -> str:
+        # Modify the description to refer to the prefix. This is a bit hacky,
+        # but for our use cases we don't expect the description to be
+        # retained in final output, so it's good enough for now
+        if self._stack.Description:
+            return self._prefix + ": " + self._stack.Description
+        return self._prefix
+
+    @property
+    def Metadata(self) -> Dict[str, Any]:
+        # Metadata is not included in the prefixed stack (see FIXME above)
+        return {}
+
+    def to_stack(self) -> Stack:
+        """Create a new stack with the contents of this view."""
+        new_stack = Stack(
+            AWSTemplateFormatVersion=self.AWSTemplateFormatVersion,
+            Transform=self.Transform,
+            Description=self.Description,
+        )
+        for item_type in ["Resources", "Parameters", "Outputs"]:
+            new_stack[item_type].update(self[item_type])
+        return new_stack
+
+
+class _PrefixedSection(collections.abc.Mapping):
+    """A read-only view of a TemplateSection with prefixed logical names."""
+
+    __slots__ = ["_prefix", "_section"]
+
+    def __init__(self, section: TemplateSection, prefix: str):
+        self._section = section
+        self._prefix = prefix
+
+    def _get_original_name(self, name: Any) -> str:
+        if isinstance(name, str) and name.startswith(self._prefix):
+            original_name = name[len(self._prefix) :]
+            if original_name in self._section:
+                return original_name
+        raise KeyError(name)
+
+    def __getitem__(self, name: str) -> Any:
+        return self._section[self._get_original_name(name)]
+
+    def __contains__(self, name: Any) -> bool:
+        try:
+            self._get_original_name(name)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        for name in self._section:
+            yield self._prefix + name
+
+    def __len__(self) -> int:
+        return len(self._section)
+
+    def get_export_names(self) -> set:
+        """Get the prefixed export names of all the Outputs in this section."""
+        return {self._prefix + name for name in self._section.get_export_names()}
+
+
+class _PrefixedOutputs(_PrefixedSection):
+    """A read-only view of Outputs, which have prefixed export names."""
+
+    __slots__ = ["_copies"]
+
+    def __init__(self, section: TemplateSection, prefix: str):
+        super().__init__(section, prefix)
+
+        #: Copies of the original Outputs, keyed by their original name
+        self._copies: Dict[str, Tuple[Any, Any]] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        original_name = self._get_original_name(name)
+        output = self._section[original_name]
+
+        # Re-use an existing copy, as long as the original Output hasn't
+        # been replaced in the meantime
+        original, output_copy = self._copies.get(original_name, (None, None))
+        if original is not output:
+            output_copy = self._copy_output(output)
+            self._copies[original_name] = (output, output_copy)
+        return output_copy
+
+    def _copy_output(self, output: Any) -> Any:
+        # Beware that a deep copy may wreck any intrinsic functions
+        # we have attached (a common use case), which is undesirable.
+        #
+        # OTOH, a shallow copy means that any modifications to the
+        # attribute's values (like Export) will affect the original,
+        # which is also undesirable. We just need to remember to
+        # allow for this
+        output = copy.copy(output)
+        if getattr(output, "Export", {}).get("Name", ""):
+            output.Export = {"Name": self._prefix + output.Export["Name"]}
+        return output
+
+
 @attrs(**ATTRSCONFIG)
 class Parameter(AWSObject):
     """Represents a CloudFormation Parameter.
@@ -613,6 +1545,115 @@ AWS_StackName = PseudoParameter._create_standard_parameter("AWS::StackName")
 AWS_URLSuffix = PseudoParameter._create_standard_parameter("AWS::URLSuffix")
 
 
+class _KeyValueListTagFormat:
+    """Tags stored as a list of `{"Key": key, "Value": value}` objects.
+
+    This is the format used by most resources.
+    """
+
+    @staticmethod
+    def create_tag_data() -> list:
+        return []
+
+    @staticmethod
+    def get_tag(tagdata: list, key: str):
+        for tag_object in tagdata:
+            if tag_object["Key"] == key:
+                return tag_object["Value"]
+        return None
+
+    def set_tags(
+        self, tagdata: list, tags: dict, tag_derived_resources: Optional[bool]
+    ):
+        # Find the existing tags in a single pass, rather than searching the
+        # list for every tag we apply. The list belongs to the user and can
+        # be changed at any time, so we don't keep this index around.
+        indexes = {}
+        for i, tag_object in enumerate(tagdata):
+            try:
+                indexes.setdefault(tag_object["Key"], i)
+            except TypeError:
+                # The key is an intrinsic function in it's long form (ie. a
+                # dictionary), so it can't match a key that we are setting
+                pass
+
+        for key, value in tags.items():
+            try:
+                tag_object = tagdata[indexes[key]]
+            except KeyError:
+                indexes[key] = len(tagdata)
+                tagdata.append(
+                    self._create_tag_object(key, value, tag_derived_resources)
+                )
+            else:
+                self._update_tag_object(tag_object, value, tag_derived_resources)
+
+    @staticmethod
+    def _create_tag_object(
+        key: str, value, tag_derived_resources: Optional[bool]
+    ) -> dict:
+        return {"Key": key, "Value": value}
+
+    @staticmethod
+    def _update_tag_object(tag_object, value, tag_derived_resources: Optional[bool]):
+        tag_object["Value"] = value
+
+
+class _PropagatingKeyValueListTagFormat(_KeyValueListTagFormat):
+    """Tags stored as a list of Key/Value objects, which also have a
+    `PropagateAtLaunch` flag.
+
+    This is used by resources which create other resources on our behalf
+    (eg. an AutoScalingGroup launching EC2 instances), where each tag
+    specifies whether it is copied to those derived resources.
+    """
+
+    @staticmethod
+    def _create_tag_object(
+        key: str, value, tag_derived_resources: Optional[bool]
+    ) -> dict:
+        return {
+            "Key": key,
+            "Value": value,
+            "PropagateAtLaunch": (
+                True if tag_derived_resources is None else tag_derived_resources
+            ),
+        }
+
+    @staticmethod
+    def _update_tag_object(tag_object, value, tag_derived_resources: Optional[bool]):
+        tag_object["Value"] = value
+
+        # Don't change an existing setting unless we were asked to
+        if tag_derived_resources is not None:
+            tag_object["PropagateAtLaunch"] = tag_derived_resources
+
+
+class _MapTagFormat:
+    """Tags stored as a dictionary of keys to values."""
+
+    @staticmethod
+    def create_tag_data() -> dict:
+        return {}
+
+    @staticmethod
+    def get_tag(tagdata: dict, key: str):
+        return tagdata.get(key, None)
+
+    @staticmethod
+    def set_tags(tagdata: dict, tags: dict, tag_derived_resources: Optional[bool]):
+        tagdata.update(tags)
+
+
+#: The ways in which tags can be stored on a Resource, keyed by the name
+#: used for `Resource.TAG_FORMAT`
+_TAG_FORMATS = {
+    "KeyValueList": _KeyValueListTagFormat(),
+    "Map": _MapTagFormat(),
+    "PropagatingKeyValueList": _PropagatingKeyValueListTagFormat(),
+}
+
+
 @attrs(**ATTRSCONFIG)
 class Resource(AWSObject):
     """Represents a CloudFormation Resource in a Stack.
@@ -689,8 +1730,56 @@ class Resource(AWSObject):
     #: The name of the property that tags are stored in (if any)
     TAG_PROPERTY = "Tags"
 
+    #: The way that tags are stored in the `TAG_PROPERTY` property. This is
+    #: one of "KeyValueList", "Map" or "PropagatingKeyValueList", or None if
+    #: this resource uses a tag format that we don't support.
+    TAG_FORMAT = "KeyValueList"
+
+    #: The implementation of `TAG_FORMAT` for this class, or None if tags are
+    #: not supported. This is calculated once for each class when it is
+    #: created.
+    _TAG_FORMAT_IMPL = None
+
     # TODO implement a shortcut function for get_ref(), instead of having to bring in the fn.Ref function?
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._TAG_FORMAT_IMPL = cls._find_tag_format()
+
+    @classmethod
+    def _find_tag_format(cls):
+        """Get the tag format implementation for this Resource class, or None
+        if tags are not supported.
+        """
+        if cls.TAG_FORMAT is None:
+            return None
+        try:
+            tag_format = _TAG_FORMATS[cls.TAG_FORMAT]
+        except KeyError:
+            raise ValueError(
+                "Resource class {} has an unknown TAG_FORMAT '{}'".format(
+                    cls.__name__, cls.TAG_FORMAT
+                )
+            )
+
+        # Tags are supported if the declared Properties class has a
+        # property to store them in
+        try:
+            properties = cls._ATTRIBUTE_TABLE["Properties"][2]
+        except KeyError:
+            return None
+        properties_class = properties.type
+        if properties_class is None and isinstance(properties.default, attr.Factory):
+            properties_class = properties.default.factory
+        if not (
+            isinstance(properties_class, type)
+            and issubclass(properties_class, AWSObject)
+            and cls.TAG_PROPERTY in properties_class._ATTRIBUTE_TABLE
+        ):
+            return None
+
+        return tag_format
+
     def __attrs_post_init__(self):
         # Check that the resource type is specified
         try:
@@ -726,9 +1815,17 @@ class Resource(AWSObject):
             )
         return self.RESOURCE_TYPE
 
-    def __iter__(self) -> Iterator[str]:
-        # Get the attributes for this Resource type
-        attribs = set(super().__iter__())
+    @classmethod
+    def _calculate_cfn_attribute_names(cls) -> Tuple[str, ...]:
+        # Get the attributes for this Resource type.
+        #
+        # Beware that we can't use `super()` here, because this is called
+        # whilst `attrs` is still creating the slotted class.
+        attribs = {
+            attrib.name
+            for attrib in getattr(cls, "__attrs_attrs__", ())
+            if cls._is_cfn_attribute(attrib.name)
+        }
 
         # Type is a class-specific fixed-value attribute, which means we
         # define it specially. We need to explicitly add it to the list
@@ -737,9 +1834,7 @@ class Resource(AWSObject):
 
         # Filter our custom sort order based on which fields actually exist
         # for this Resource class
-        for name in self._SORT_ORDER:
-            if name in attribs:
-                yield name
+        return tuple(name for name in cls._SORT_ORDER if name in attribs)
 
     @property
     def is_retained(self) -> bool:
@@ -767,9 +1862,9 @@ class Resource(AWSObject):
     @property
     def is_taggable(self):
         """Is this resource taggable."""
-        return hasattr(self.Properties, self.TAG_PROPERTY)
+        return self._TAG_FORMAT_IMPL is not None
 
-    def tag(self, tags=None, tag_derived_resources=True, **more_tags):
+    def tag(self, tags=None, tag_derived_resources=None, **more_tags):
         """Apply tags to this resource, if they are supported.
 
         Existing tags with the same key will be overwritten.
@@ -784,7 +1879,9 @@ class Resource(AWSObject):
             tag_derived_resources (bool): Whether to attempt to apply the
              same tags to resources which are derived from this one, using
              Cloud Formation (eg. EC2 instances started by an auto-scaling
-             group).
+             group). This only has an effect on resource types whose tags
+             have a setting for this. By default, new tags are applied to
+             derived resources, and existing tags keep their setting.
 
         Returns:
             Whether tags are actually supported by this resource type.
@@ -793,24 +1890,19 @@ class Resource(AWSObject):
             `AWS documentation on resource tagging
             <https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-resource-tags.html>`_
         """
-        if not self.is_taggable:
+        tag_format = self._TAG_FORMAT_IMPL
+        if tag_format is None:
             return False
 
+        # Handle multiple ways of passing tags
         if tags is None:
-            tags = {}
-
-        # Add Tags to our horribly structured list
-        for key, value in chain(tags.items(), more_tags.items()):
-            # Ensure a tag with key and value exists, overwriting any existing
-            # value with that key
-            for tag_object in self._get_tag_list():
-                if tag_object["Key"] == key:
-                    # Overwrite the existing value
-                    tag_object["Value"] = value
-                    break
-            else:
-                # Key was not found, so append a new tag object
-                self._get_tag_list().append({"Key": key, "Value": value})
+            tags = more_tags
+        elif more_tags:
+            tags = dict(tags)
+            tags.update(more_tags)
+
+        if tags:
+            tag_format.set_tags(self._get_tag_data(), tags, tag_derived_resources)
 
         return True
 
@@ -823,34 +1915,34 @@ class Resource(AWSObject):
         Returns:
             The tag's value, or else `None` if it is not set
         """
-        # TODO tests
-        if not self.is_taggable:
+        tag_format = self._TAG_FORMAT_IMPL
+        if tag_format is None:
             raise AttributeError("Tags are not supported by {}".format(self.Type))
 
-        # Search through existing tags looking for the tag
-        for tag_object in self._get_tag_list():
-            if tag_object["Key"] == key:
-                return tag_object["Value"]
+        tagdata = self.Properties[self.TAG_PROPERTY]
+        if tagdata is None:
+            # No tags set yet
+            return None
 
-        # Tag was not found
-        return None
+        return tag_format.get_tag(tagdata, key)
 
-    def _get_tag_list(self):
-        """Get the internal list of all the tag objects on this resource,
+    def _get_tag_data(self):
+        """Get the internal container of all the tags on this resource,
         creating it if necessary
         """
-        if not self.is_taggable:
+        tag_format = self._TAG_FORMAT_IMPL
+        if tag_format is None:
             raise AttributeError("Tags are not supported by {}".format(self.Type))
 
-        # Get or create the Tags property
+        # Get or create the tag property
         #
         # Note that Properties might be a `ResourceProperties` object, which
         # doesn't support `setdefault`
-        taglist = self.Properties[self.TAG_PROPERTY]
-        if taglist is not None:
-            return taglist
+        tagdata = self.Properties[self.TAG_PROPERTY]
+        if tagdata is not None:
+            return tagdata
 
-        self.Properties[self.TAG_PROPERTY] = []
+        self.Properties[self.TAG_PROPERTY] = tag_format.create_tag_data()
         return self.Properties[self.TAG_PROPERTY]
 
     @property
@@ -886,6 +1978,31 @@ class ResourceProperties(AWSObject):
     pass
 
 
+class PropertyType(AWSObject):
+    """Base class for a structured value inside a Resource's Properties.
+
+    Each property type in the AWS specification (eg. the
+    `BlockDeviceMapping` of an EC2 Instance) has a generated subclass, and
+    dictionaries that are assigned to a property of that type are converted
+    into it.
+    """
+
+    __slots__ = []
+
+
+@attrs(**ATTRSCONFIG)
+class Tag(PropertyType):
+    """A tag in the standard CloudFormation format.
+
+    See Also:
+        `AWS Cloud Formation documentation for Tag
+        <http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/aws-properties-resource-tags.html>`_
+    """
+
+    Key: str = attrib(default=None)
+    Value: str = attrib(default=None)
+
+
 class LogicalName(CustomYamlObject):
     """Represents the logical name of a resource in an exported stack.
 
@@ -919,6 +2036,11 @@ class LogicalName(CustomYamlObject):
         )  # Pass error through
         return dumper.represent_str(name)
 
+    def as_plain_data(self, compiler):
+        return compiler.cfn_stack.get_logical_name(
+            self._resource, resources_only=True
+        )  # Pass error through
+
 
 @attrs(**ATTRSCONFIG)
 class Output(AWSObject):
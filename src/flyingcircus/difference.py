@@ -0,0 +1,246 @@
+"""Find the differences between two CloudFormation stacks."""
+
+from itertools import zip_longest
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from attr import attrib
+from attr import attrs
+
+from .compiler import TemplateCompiler
+from .core import AWSObject
+from .core import Stack
+from .core import _prune_empty_values
+from .core import _validate_deferred_objects
+from .fingerprint import _FingerprintCompiler
+
+#: A change where a value only exists in the new stack
+ADDED = "added"
+
+#: A change where a value only exists in the old stack
+REMOVED = "removed"
+
+#: A change where a value exists in both stacks, but is different
+MODIFIED = "modified"
+
+
+@attrs(frozen=True, slots=True)
+class Change:
+    """A single difference between two stacks."""
+
+    #: What kind of change this is: `ADDED`, `REMOVED` or `MODIFIED`
+    action: str = attrib()
+
+    #: The location of the changed value in the template, as a tuple of
+    #: dictionary keys and list indexes (eg.
+    #: `("Resources", "MyBucket", "Properties", "BucketName")`)
+    path: Tuple[Union[str, int], ...] = attrib()
+
+    #: The old value as plain data, or None if it was added
+    old: Any = attrib(default=None)
+
+    #: The new value as plain data, or None if it was removed
+    new: Any = attrib(default=None)
+
+    def __str__(self):
+        return "{} {}".format(self.action, ".".join(str(key) for key in self.path))
+
+
+def diff(
+    old: Union[Stack, Dict[str, Any]], new: Union[Stack, Dict[str, Any]]
+) -> List[Change]:
+    """Find the differences between two stacks.
+
+    Either stack can be a `Stack` object, or a template that has been
+    loaded as plain data with intrinsic functions in their long form (eg. by
+    using `json.load`). Stacks are compared by the CloudFormation that they
+    export, so (for example) an attribute that is set to an empty list is
+    the same as an unset attribute, and a `Ref` is the same as the
+    equivalent plain dictionary.
+
+    Values are compared recursively, so each change is reported at the most
+    specific path possible. A list which has changed length is compared
+    item-by-item up to the shorter length, and the remaining items are
+    reported as added or removed. When both stacks are `Stack` objects, any
+    nested objects with the same fingerprint (see `Stack.fingerprint`) are
+    skipped without examining their contents, so finding a few changes in a
+    large stack is cheap.
+
+    Returns:
+        The changes, in template order.
+    """
+    # Don't compare objects in an unvalidated state
+    _validate_deferred_objects()
+
+    differ = _Differ(_Side(old), _Side(new))
+    differ.compare((), old, new)
+    return differ.changes
+
+
+#: Signal value for a dictionary key or list index that doesn't exist
+_MISSING = object()
+
+
+class _Side:
+    """The data for one of the stacks that is being compared."""
+
+    def __init__(self, template: Union[Stack, Dict[str, Any]]):
+        self.stack = template if isinstance(template, Stack) else None
+
+        self.compiler = TemplateCompiler()
+        self.compiler.cfn_stack = self.stack
+
+        self.fingerprints = _FingerprintCompiler()
+        self.fingerprints.cfn_stack = self.stack
+
+        #: Whether each list, dictionary and object that has been examined
+        #: would be exported, keyed by identity. The value is also kept, so
+        #: that it's identity isn't re-used.
+        self._non_empty: Dict[int, Tuple[Any, bool]] = {}
+
+    def get_digest(self, value: AWSObject) -> Optional[str]:
+        """Get the fingerprint of an object in this stack."""
+        if self.stack is None:
+            return None
+        return self.fingerprints.get_object_digest(value)[0]
+
+    def get_plain_value(self, value: Any) -> Any:
+        """Get the exported value for some data, as a dictionary, list or
+        scalar.
+
+        This doesn't remove empty values from the result (except from a
+        list, where they would change the position of other items), because
+        the data might be very large and only a small part of it might need
+        to be compared.
+        """
+        if isinstance(value, AWSObject):
+            return {key: item for key, item in value.items() if item is not None}
+        if isinstance(value, dict):
+            return value
+        if isinstance(value, (list, tuple)):
+            return [item for item in value if self.is_non_empty(item)]
+
+        # Intrinsic functions and other custom values are compared as the
+        # plain data they export
+        return self.compiler.compile(value)
+
+    def export(self, value: Any) -> Any:
+        """Get the plain data that would be exported for some data."""
+        if value is _MISSING:
+            return None
+        return self.compiler.compile(
+            _prune_empty_values(value, self.compiler.pruned_objects)[1]
+        )
+
+    def is_non_empty(self, value: Any) -> bool:
+        """Whether some data would be exported.
+
+        This is the same as `is_non_empty_attribute`, except that it stops as
+        soon as it finds something that would be exported, rather than
+        examining all of the data. The result for each nested list,
+        dictionary and object is remembered, so that it is only examined
+        once while the stacks are compared.
+        """
+        if value is _MISSING:
+            return False
+        result = self._get_known_emptiness(value)
+        if result is not None:
+            return result
+
+        # Search the data without recursion. Each frame is a block-like value
+        # and an iterator over the children that haven't been examined yet.
+        stack = [(value, _iterate_children(value))]
+        while stack:
+            block, children = stack[-1]
+            for child in children:
+                result = self._get_known_emptiness(child)
+                if result is None:
+                    stack.append((child, _iterate_children(child)))
+                    break
+                if result:
+                    # Everything that contains this child is also non-empty
+                    for block, _ in stack:
+                        self._non_empty[id(block)] = (block, True)
+                    return True
+            else:
+                # None of the children would be exported
+                stack.pop()
+                self._non_empty[id(block)] = (block, False)
+        return False
+
+    def _get_known_emptiness(self, value: Any) -> Optional[bool]:
+        """Whether some data would be exported, or None if it is a block-like
+        value that hasn't been examined yet."""
+        if isinstance(value, (AWSObject, dict, list, tuple)):
+            try:
+                return self._non_empty[id(value)][1]
+            except KeyError:
+                return None
+        # Other types of object are never empty
+        return True
+
+
+def _iterate_children(value: Any) -> Iterator[Any]:
+    """Iterate over the values inside a block-like value."""
+    if isinstance(value, AWSObject):
+        return (item for item in value.values() if item is not None)
+    if isinstance(value, dict):
+        return iter(value.values())
+    return iter(value)
+
+
+class _Differ:
+    """Compares the data from two stacks, and accumulates the changes."""
+
+    def __init__(self, old: _Side, new: _Side):
+        self.old = old
+        self.new = new
+        self.changes: List[Change] = []
+
+    def compare(self, path: Tuple[Union[str, int], ...], old: Any, new: Any):
+        if (
+            isinstance(old, AWSObject)
+            and isinstance(new, AWSObject)
+            and type(old) is type(new)
+        ):
+            old_digest = self.old.get_digest(old)
+            if old_digest is not None and old_digest == self.new.get_digest(new):
+                return
+
+        # Empty values aren't exported, so they are treated as missing
+        if not self.old.is_non_empty(old):
+            if self.new.is_non_empty(new):
+                self._add_change(ADDED, path, new=new)
+            return
+        if not self.new.is_non_empty(new):
+            self._add_change(REMOVED, path, old=old)
+            return
+
+        old = self.old.get_plain_value(old)
+        new = self.new.get_plain_value(new)
+
+        if isinstance(old, dict) and isinstance(new, dict):
+            for key, old_value in old.items():
+                self.compare(path + (key,), old_value, new.get(key, _MISSING))
+            for key, new_value in new.items():
+                if key not in old:
+                    self.compare(path + (key,), _MISSING, new_value)
+        elif isinstance(old, list) and isinstance(new, list):
+            for index, (old_value, new_value) in enumerate(
+                zip_longest(old, new, fillvalue=_MISSING)
+            ):
+                self.compare(path + (index,), old_value, new_value)
+        elif type(old) is not type(new) or old != new:
+            self._add_change(MODIFIED, path, old=old, new=new)
+
+    def _add_change(
+        self, action: str, path: tuple, old: Any = _MISSING, new: Any = _MISSING
+    ):
+        self.changes.append(
+            Change(action, path, old=self.old.export(old), new=self.new.export(new))
+        )
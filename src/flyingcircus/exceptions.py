@@ -1,7 +1,29 @@
 """Exceptions used by Flying Circus."""
 
+from typing import List
+from typing import Optional
+
 
 class StackMergeError(Exception):
     """Unable to merge the objects in one stack into another stack."""
 
-    pass
+    def __init__(self, message: str, conflicts: Optional[List[str]] = None):
+        super().__init__(message)
+
+        #: A description of every conflict that prevented the merge
+        self.conflicts: List[str] = conflicts or [message]
+
+
+class ValidationError(TypeError, ValueError):
+    """More than one object failed validation at the same time.
+
+    This happens when the validation that was deferred by `Stack.building()`
+    is run. It is both a TypeError and a ValueError, because those are the
+    errors that are raised when a single object is invalid.
+    """
+
+    def __init__(self, message: str, errors: List[Exception]):
+        super().__init__(message)
+
+        #: The error from each invalid object
+        self.errors: List[Exception] = errors
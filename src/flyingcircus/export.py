@@ -0,0 +1,397 @@
+"""Export CloudFormation stacks efficiently."""
+
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .cache import TemplateCache
+from .compiler import TemplateCompiler
+from .core import Stack
+from .core import TemplateSection
+from .core import _EXPORT_FORMATS
+from .core import _prune_empty_values
+from .core import _validate_deferred_objects
+from .fingerprint import _FingerprintCompiler
+from .yaml import AmazonCFNCDumper
+
+
+def export_many(
+    stacks: Iterable[Stack],
+    workers: Optional[int] = None,
+    format: str = "yaml",
+    compact: bool = False,
+    fast: bool = False,
+    paths: Optional[Iterable[str]] = None,
+    cache: Optional[TemplateCache] = None,
+) -> Optional[List[str]]:
+    """Export many stacks as CloudFormation, using a pool of processes.
+
+    Exporting a large stack is CPU-bound, so this spreads the work for
+    independent stacks across several processes. Each stack is sent to a
+    worker process as a single unit, so references between objects in the
+    same stack (eg. `Ref` and `GetAtt`) still work. Every stack (including
+    any custom classes it uses) must be able to be pickled.
+
+    Args:
+        stacks: The stacks to export.
+        workers: (Optional) The number of worker processes to use. The
+            default is the number of CPUs. If this is 1 then the stacks are
+            exported in the current process.
+        format: Either "yaml" (the default) or "json".
+        compact: (Optional) Minify JSON output. See `Stack.export`.
+        fast: (Optional) Use the LibYAML dumper. See `Stack.export`.
+        paths: (Optional) A file path for each stack. If this is supplied,
+            each template is written to it's file, rather than being
+            returned.
+        cache: (Optional) A cache of previously exported templates. Only
+            the stacks which aren't in the cache are sent to a worker
+            process, and their templates are added to the cache.
+
+    Returns:
+        The CloudFormation templates as strings, in the same order as the
+        input stacks, or else None if the templates were written to files.
+    """
+    if format not in _EXPORT_FORMATS:
+        raise ValueError("Export format '{}' is unknown".format(format))
+
+    stacks = list(stacks)
+    write_files = paths is not None
+    if write_files:
+        paths = list(paths)
+        if len(paths) != len(stacks):
+            raise ValueError(
+                "There should be one path for each stack, not {} paths for {} "
+                "stacks".format(len(paths), len(stacks))
+            )
+    else:
+        paths = [None] * len(stacks)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("There should be at least one worker")
+
+    # Don't send objects to another process in an unvalidated state
+    _validate_deferred_objects()
+
+    # Find the templates that are already cached
+    if cache is None:
+        keys = [None] * len(stacks)
+        templates = [None] * len(stacks)
+    else:
+        keys = [cache.get_key(stack, format, compact, fast) for stack in stacks]
+        templates = [cache.get(key) for key in keys]
+    pending = [i for i, template in enumerate(templates) if template is None]
+
+    # Export everything else. When we use a cache, the new templates have to
+    # come back to this process to be stored, so they are written to their
+    # file here as well
+    tasks = [
+        (stacks[i], paths[i] if cache is None else None, format, compact, fast)
+        for i in pending
+    ]
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        results = [_export_stack(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_export_stack, tasks))
+
+    for i, template in zip(pending, results):
+        templates[i] = template
+        if cache is not None:
+            cache.put(keys[i], template)
+
+    if not write_files:
+        return templates
+
+    if cache is not None:
+        for path, template in zip(paths, templates):
+            with open(path, "w", encoding="utf-8") as fp:
+                fp.write(template)
+    return None
+
+
+def _export_stack(task) -> Optional[str]:
+    """Export a single stack, either to a string or to a file.
+
+    This runs in a worker process, so it needs to be a module-level function
+    that takes a single picklable argument.
+    """
+    stack, path, format, compact, fast = task
+
+    if path is None:
+        return stack.export(format=format, compact=compact, fast=fast)
+
+    with open(path, "w", encoding="utf-8") as fp:
+        stack.export_to_file(fp, format=format, compact=compact, fast=fast)
+    return None
+
+
+class IncrementalExporter:
+    """Export a stack repeatedly, only re-rendering the parts that changed.
+
+    This is intended for workflows where a large stack is modified a little
+    and then exported again, many times. The rendered text of each item in
+    the stack's sections (eg. each Resource) is remembered from the previous
+    export, along with the item's fingerprint (see `Stack.fingerprint`).
+    Items with an unchanged fingerprint re-use their remembered text, and
+    the other items are rendered again.
+
+    The result is always exactly the same as `Stack.export`. References to
+    other objects are part of the fingerprint, so an item is also rendered
+    again when an object that it references is renamed.
+
+    Example:
+        >>> exporter = IncrementalExporter()
+        >>> template = exporter.export(stack)
+        >>> stack.Resources["MyBucket"].DeletionPolicy = "Retain"
+        >>> template = exporter.export(stack)  # Only renders MyBucket again
+    """
+
+    def __init__(self, format: str = "yaml", compact: bool = False, fast: bool = False):
+        """
+        Args:
+            format: Either "yaml" (the default) or "json".
+            compact: (Optional) Minify JSON output. See `Stack.export`.
+            fast: (Optional) Use the LibYAML dumper. See `Stack.export`.
+        """
+        if format not in _EXPORT_FORMATS:
+            raise ValueError("Export format '{}' is unknown".format(format))
+
+        self.format = format
+        self.compact = compact
+        self.fast = fast
+
+        #: The rendered text of each section item from the previous export,
+        #: keyed by the section and item names. Each entry is a tuple of the
+        #: item's fingerprint and it's rendered fragment, which is None if
+        #: the item is empty and so isn't exported.
+        self._fragments: Dict[Tuple[str, Any], Tuple[str, Any]] = {}
+
+    def export(self, stack: Stack) -> str:
+        """Export a stack as CloudFormation, re-using any unchanged parts of
+        the previous export.
+
+        Returns:
+            The CloudFormation template as a string.
+        """
+        # Don't export objects in an unvalidated state
+        _validate_deferred_objects()
+
+        renderer = (
+            _YamlRenderer(stack, self.fast)
+            if self.format == "yaml"
+            else _JsonRenderer(stack, self.compact)
+        )
+
+        # The fingerprint of each unchanged item is cached on the item, so
+        # only changed items (and items with references) are walked again.
+        # Objects that are shared between items are only hashed once.
+        fingerprints = _FingerprintCompiler()
+        fingerprints.cfn_stack = stack
+
+        # Render the stack's attributes in the same way as
+        # `AWSObject._get_pruned_attributes`, except that each section item
+        # is pruned and rendered separately
+        entries = []
+        fragments = {}
+        for name in stack._CFN_ATTRIBUTE_NAMES:
+            value = getattr(stack, name)
+            if value is None:
+                continue
+
+            if isinstance(value, TemplateSection):
+                items = []
+                for item_name, item in value.items():
+                    key = (name, item_name)
+                    digest = fingerprints.get_digest(item)
+                    cached = self._fragments.get(key)
+                    if cached is None or cached[0] != digest:
+                        cached = (digest, renderer.render_item(name, item_name, item))
+                    fragments[key] = cached
+                    if cached[1] is not None:
+                        items.append((item_name, cached[1]))
+                if items:
+                    entries.append(renderer.get_section(name, items))
+            else:
+                is_non_empty, cleaned = _prune_empty_values(
+                    value, renderer.pruned_objects
+                )
+                if is_non_empty:
+                    entries.append(renderer.render_attribute(name, cleaned))
+
+        # Forget about items that have been removed from the stack
+        self._fragments = fragments
+
+        return renderer.get_template(entries)
+
+
+class _YamlRenderer:
+    """Renders parts of a CloudFormation YAML template for `IncrementalExporter`.
+
+    Each part is rendered as a separate YAML document, which has the same
+    surrounding structure as the complete template. This means that the
+    part is rendered with the same indentation (and so the same line
+    wrapping) as it would be in the complete template.
+
+    A rendered fragment is a tuple of (header, text, is_open_ended). The
+    text for a section item doesn't include the header line with the
+    section's name, and the text for a top-level attribute has no header.
+    """
+
+    def __init__(self, stack: Stack, fast: bool):
+        self.stack = stack
+        self.args = Stack._get_yaml_export_args(fast)
+        self.dumper_class = self.args.pop("Dumper")
+        self.sort_keys = self.args.get("sort_keys", True)
+
+        #: Cache of the exportable attributes for each AWSObject that has
+        #: been examined during this export, keyed by object identity.
+        self.pruned_objects: Dict[int, list] = {}
+
+    def render_item(
+        self, section_name: str, item_name: Any, item: Any
+    ) -> Optional[Tuple[str, str, bool]]:
+        is_non_empty, cleaned = _prune_empty_values(item, self.pruned_objects)
+        if not is_non_empty:
+            return None
+
+        text, is_open_ended = self._render({section_name: {item_name: cleaned}})
+        header, text = text.split("\n", 1)
+        return header + "\n", text, is_open_ended
+
+    def render_attribute(self, name: str, value: Any) -> Tuple[str, str, bool]:
+        text, is_open_ended = self._render({name: value})
+        return "", text, is_open_ended
+
+    def get_section(
+        self, name: str, items: List[Tuple[Any, Tuple[str, str, bool]]]
+    ) -> Tuple[str, str, bool]:
+        # Sections are dictionaries, so PyYAML normally sorts them
+        if self.sort_keys:
+            try:
+                items = sorted(items, key=lambda item: item[0])
+            except TypeError:
+                pass
+
+        fragments = [fragment for _, fragment in items]
+        return (
+            fragments[0][0],
+            "".join(text for _, text, _ in fragments),
+            self._is_open_ended(fragments),
+        )
+
+    def get_template(self, entries: List[Tuple[str, str, bool]]) -> str:
+        template = "---\n" + "".join(header + text for header, text, _ in entries)
+        if self._is_open_ended(entries):
+            template += "...\n"
+        return template
+
+    def _is_open_ended(self, fragments: List[Tuple[str, str, bool]]) -> bool:
+        """Whether a document that contains these fragments needs an explicit
+        document end marker.
+
+        The pure Python emitter only needs this when the document ends with
+        an open-ended scalar (eg. a literal block with trailing newlines),
+        but LibYAML remembers that any scalar was open-ended.
+        """
+        if not fragments:
+            return False
+        if AmazonCFNCDumper is not None and issubclass(
+            self.dumper_class, AmazonCFNCDumper
+        ):
+            return any(is_open_ended for _, _, is_open_ended in fragments)
+        return fragments[-1][2]
+
+    def _render(self, data: dict) -> Tuple[str, bool]:
+        """Render a YAML document, without it's start and end markers."""
+        stream = io.StringIO()
+        dumper = self.dumper_class(stream, **self.args)
+        dumper.cfn_stack = self.stack
+        dumper.pruned_objects = self.pruned_objects
+        try:
+            dumper.open()
+            dumper.represent(data)
+            dumper.close()
+        finally:
+            dumper.dispose()
+
+        text = stream.getvalue()
+        assert text.startswith("---\n")
+        text = text[4:]
+        is_open_ended = text.endswith("\n...\n")
+        if is_open_ended:
+            text = text[:-4]
+        return text, is_open_ended
+
+
+class _JsonRenderer:
+    """Renders parts of a CloudFormation JSON template for `IncrementalExporter`.
+
+    A rendered fragment is the text for a single dictionary entry, as it
+    appears in the complete template. JSON strings can't contain a line
+    break, so a fragment can be indented by adding spaces to each line.
+    """
+
+    def __init__(self, stack: Stack, compact: bool):
+        self.args = Stack._get_json_export_args(compact)
+        self.indent = self.args.get("indent")
+
+        self.compiler = TemplateCompiler(sort_keys=True)
+        self.compiler.cfn_stack = stack
+        self.pruned_objects = self.compiler.pruned_objects
+
+    def render_item(
+        self, section_name: str, item_name: Any, item: Any
+    ) -> Optional[str]:
+        is_non_empty, cleaned = _prune_empty_values(item, self.pruned_objects)
+        if not is_non_empty:
+            return None
+        return self._indent(self.render_attribute(item_name, cleaned))
+
+    def render_attribute(self, name: str, value: Any) -> str:
+        # Render a dictionary with a single entry, and remove the braces
+        text = json.dumps({name: self.compiler.compile(value)}, **self.args)
+        if self.indent is None:
+            return text[1:-1]
+        return text[2:-2]
+
+    def get_section(self, name: str, items: List[Tuple[Any, str]]) -> str:
+        # Sections are dictionaries, so their keys are sorted like the YAML
+        # output
+        try:
+            items = sorted(items, key=lambda item: item[0])
+        except TypeError:
+            pass
+        return self._get_entry(name, self._get_dictionary([text for _, text in items]))
+
+    def get_template(self, entries: List[str]) -> str:
+        return self._get_dictionary(entries, level=0) + "\n"
+
+    def _get_entry(self, name: str, value_text: str) -> str:
+        if self.indent is None:
+            return json.dumps(name) + ":" + value_text
+        return " " * self.indent + json.dumps(name) + ": " + value_text
+
+    def _get_dictionary(self, entries: List[str], level: int = 1) -> str:
+        """Join some rendered entries into a dictionary at this nesting level."""
+        if not entries:
+            return "{}"
+        if self.indent is None:
+            return "{" + ",".join(entries) + "}"
+        return "{\n" + ",\n".join(entries) + "\n" + " " * (self.indent * level) + "}"
+
+    def _indent(self, text: str) -> str:
+        """Indent a rendered entry by one more level."""
+        if self.indent is None:
+            return text
+        prefix = " " * self.indent
+        return prefix + text.replace("\n", "\n" + prefix)
@@ -0,0 +1,388 @@
+"""Calculate content hashes for Flying Circus objects."""
+
+import hashlib
+import json
+import marshal
+from operator import attrgetter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .compiler import TemplateCompiler
+from .core import AWSObject
+from .core import EMPTY_DICT
+from .core import EMPTY_LIST
+from .core import LogicalName
+from .core import Stack
+from .intrinsic_function import _Function
+from .yaml import CustomYamlObject
+
+#: The types which appear unchanged in plain data. Any other type is marked
+#: with it's name in a fingerprint.
+_PLAIN_TYPES = {dict, list, str, int, float, bool, type(None)}
+
+#: The immutable types which can be hashed directly
+_SCALAR_TYPES = {str, int, float, bool, type(None)}
+
+#: The mutable types whose content is checked to see whether a cached
+#: fingerprint is still valid
+_CONTAINER_TYPES = {dict, list}
+
+#: The custom objects that can't be changed after they are created, so a
+#: cached fingerprint only needs to check that they are the same object
+_IMMUTABLE_TYPES = (_Function, LogicalName)
+
+#: Placeholders in the structure of some data. See `_get_skeleton`.
+_SCALAR = 0
+_OBJECT = 1
+
+#: The `marshal` format used to serialise plain data. Version 2 is the
+#: latest version that doesn't depend on whether objects are shared or
+#: interned, so equal data always has the same serialisation.
+_MARSHAL_VERSION = 2
+
+#: Functions that get the values of all CloudFormation attributes of an
+#: object, keyed by class. See `_get_attribute_values`.
+_ATTRIBUTE_GETTERS: Dict[type, Callable[[AWSObject], tuple]] = {}
+
+
+def fingerprint(data: Any, stack: Optional[Stack] = None) -> str:
+    """Calculate a hash that identifies the content of some data.
+
+    The data can be any `AWSObject` (including a `Stack`), an intrinsic
+    function, or plain data containing these. Objects with the same
+    fingerprint have the same type and the same content, in the same order,
+    so they will be exported as the same CloudFormation.
+
+    References to other objects (eg. `Ref` and `GetAtt`) are hashed as the
+    logical name of the target object in the stack, so the fingerprint
+    changes when the target is renamed.
+
+    The fingerprint of each nested object is cached on that object, and
+    re-used until one of it's attributes is set. This means that
+    fingerprinting a large stack again after a few changes only has to
+    re-hash the changed objects. Changes made inside a plain list or
+    dictionary don't set an attribute, so the cache also records the
+    content of any plain lists and dictionaries (eg. a resource's `Tags`),
+    and the identity of the objects inside them, and checks that these
+    haven't changed. It also records the logical name of every referenced
+    object, and checks that the object still has that name in the current
+    stack. Intrinsic functions are treated as immutable, so changes made
+    inside an existing function object won't be noticed. Objects that
+    contain other kinds of collection (eg. a stack's template sections) are
+    hashed again every time.
+
+    Args:
+        data: The data to fingerprint.
+        stack: (Optional) The stack used to find the logical names of
+            referenced objects. The default is the data itself, if it is a
+            stack.
+
+    Returns:
+        A hex string.
+
+    Raises:
+        ValueError: If the data contains a reference to another object, but
+            there isn't a stack.
+    """
+    if stack is None and isinstance(data, Stack):
+        stack = data
+
+    compiler = _FingerprintCompiler()
+    compiler.cfn_stack = stack
+    return compiler.get_digest(data)
+
+
+def _hash(data: Any) -> str:
+    return hashlib.sha256(marshal.dumps(data, _MARSHAL_VERSION)).hexdigest()
+
+
+def _get_cached_digest(obj: AWSObject, stack: Optional[Stack]) -> Optional[str]:
+    """Get the cached fingerprint for an object, if it is still valid."""
+    cached = obj._fingerprint
+    if cached is None:
+        return None
+
+    # The cache is only cleared when an attribute of this object is set, so
+    # we also need to check whether any nested objects, references or plain
+    # data have changed
+    digest, children, references, skeleton = cached
+    for child, child_digest in children:
+        if _get_cached_digest(child, stack) != child_digest:
+            return None
+    if references:
+        if stack is None:
+            return None
+        for target, resources_only, name in references:
+            try:
+                if stack.get_logical_name(target, resources_only) != name:
+                    return None
+            except ValueError:
+                return None
+    if skeleton is not None and not _is_same_skeleton(
+        skeleton, _get_skeleton(_get_attribute_values(obj))
+    ):
+        return None
+    return digest
+
+
+def _get_skeleton(values: tuple) -> Any:
+    """Describe the content of the mutable attribute values of an object.
+
+    This is the serialisation of any values that only contain plain data.
+    Otherwise, it is the structure of the plain lists, tuples and
+    dictionaries, the serialisation of the scalar values inside them, and
+    the other objects inside them (which are compared by identity). It is
+    None if all of the values are scalars.
+    """
+    values = tuple(value for value in values if type(value) not in _SCALAR_TYPES)
+    if not values:
+        return None
+    try:
+        return marshal.dumps(values, _MARSHAL_VERSION)
+    except ValueError:
+        scalars = []
+        objects = []
+        structure = _get_structure(values, scalars, objects)
+        return structure, marshal.dumps(scalars, _MARSHAL_VERSION), objects
+
+
+def _get_structure(value: Any, scalars: list, objects: list) -> Any:
+    valuetype = type(value)
+    if valuetype in _SCALAR_TYPES:
+        scalars.append(value)
+        return _SCALAR
+    if valuetype is list:
+        return [_get_structure(item, scalars, objects) for item in value]
+    if valuetype is tuple:
+        return tuple(_get_structure(item, scalars, objects) for item in value)
+    if valuetype is dict:
+        return (
+            dict,
+            tuple(
+                (
+                    _get_structure(key, scalars, objects),
+                    _get_structure(item, scalars, objects),
+                )
+                for key, item in value.items()
+            ),
+        )
+    objects.append(value)
+    return _OBJECT
+
+
+def _is_same_skeleton(old: Any, new: Any) -> bool:
+    if type(old) is bytes or type(new) is bytes:
+        return old == new
+    old_structure, old_scalars, old_objects = old
+    new_structure, new_scalars, new_objects = new
+    return (
+        old_structure == new_structure
+        and old_scalars == new_scalars
+        and len(old_objects) == len(new_objects)
+        and all(a is b for a, b in zip(old_objects, new_objects))
+    )
+
+
+class _ReferenceRecorder:
+    """Finds the logical names of objects in a stack, and remembers them."""
+
+    __slots__ = ["stack", "references"]
+
+    def __init__(self, stack: Stack, references: list):
+        self.stack = stack
+        self.references = references
+
+    def get_logical_name(self, resource, resources_only=False):
+        name = self.stack.get_logical_name(resource, resources_only)
+        self.references.append((resource, resources_only, name))
+        return name
+
+
+class _FingerprintCompiler(TemplateCompiler):
+    """Converts data into plain data that uniquely describes it's content.
+
+    This is the same as the normal plain data, except that:
+
+    * Any object which isn't a plain Python type is wrapped in a marker with
+      it's type name. That means that (for example) a `Ref` is distinguished
+      from a literal dictionary with the same contents, because they have a
+      different YAML representation.
+    * Nested AWSObjects are replaced by their own fingerprint, which is
+      calculated from all of their CloudFormation attributes (not just the
+      ones that would be exported).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.__stack: Optional[Stack] = None
+
+        #: The fingerprint of each object seen so far, along with whether it
+        #: can be cached, keyed by object identity.
+        self._digests: Dict[int, Tuple[str, bool]] = {}
+
+        #: Whether the object currently being hashed can have it's
+        #: fingerprint cached, because it only contains data whose changes
+        #: can be detected.
+        self._cacheable = True
+
+        #: The nested objects in the object currently being hashed, along
+        #: with their fingerprints.
+        self._children: List[Tuple[AWSObject, str]] = []
+
+        #: The objects referenced by the object currently being hashed, along
+        #: with the arguments used to find their logical names, and the
+        #: names.
+        self._references: List[Tuple[Any, bool, str]] = []
+
+    @property
+    def cfn_stack(self) -> Stack:
+        if self.__stack is None:
+            raise ValueError(
+                "A stack is needed to fingerprint a reference to another object"
+            )
+        # Remember each logical name that is used, so that cached
+        # fingerprints can check that it hasn't changed
+        return _ReferenceRecorder(self.__stack, self._references)
+
+    @cfn_stack.setter
+    def cfn_stack(self, value: Optional[Stack]):
+        # Use the same checks as a normal compiler
+        TemplateCompiler.cfn_stack.fset(self, value)
+        self.__stack = value
+
+    def compile(self, data: Any) -> Any:
+        if isinstance(data, AWSObject):
+            digest, cacheable = self.get_object_digest(data)
+            self._children.append((data, digest))
+            self._cacheable = self._cacheable and cacheable
+            return _TypeMarker(_get_type_name(data), digest)
+
+        if isinstance(data, (dict, list)):
+            if type(data) not in _CONTAINER_TYPES:
+                self._cacheable = False
+        elif (
+            isinstance(data, CustomYamlObject)
+            and not isinstance(data, _IMMUTABLE_TYPES)
+            and data is not EMPTY_LIST
+            and data is not EMPTY_DICT
+        ):
+            self._cacheable = False
+
+        if type(data) in _PLAIN_TYPES:
+            return super().compile(data)
+        return _TypeMarker(_get_type_name(data), super().compile(data))
+
+    def get_digest(self, data: Any) -> str:
+        """Get the fingerprint for some data."""
+        if isinstance(data, AWSObject):
+            return self.get_object_digest(data)[0]
+        return _hash(self.get_value_token(data))
+
+    def get_object_digest(self, obj: AWSObject) -> Tuple[str, bool]:
+        """Get the fingerprint for an object, and whether it can be cached."""
+        try:
+            return self._digests[id(obj)]
+        except KeyError:
+            pass
+
+        digest = _get_cached_digest(obj, self.__stack)
+        if digest is not None:
+            result = (digest, True)
+        else:
+            outer_state = (self._cacheable, self._children, self._references)
+            self._cacheable = True
+            self._children = []
+            self._references = []
+            try:
+                values = _get_attribute_values(obj)
+                try:
+                    # Most objects only contain plain data, so try to
+                    # serialise all of the attributes at once
+                    data = ("marshal", marshal.dumps(values, _MARSHAL_VERSION))
+                except ValueError:
+                    data = tuple(
+                        value
+                        if type(value) in _SCALAR_TYPES
+                        else self.get_value_token(value)
+                        for value in values
+                    )
+                digest = _hash((_get_type_name(obj), data))
+                if self._cacheable:
+                    object.__setattr__(
+                        obj,
+                        "_fingerprint",
+                        (
+                            digest,
+                            tuple(self._children),
+                            tuple(self._references),
+                            _get_skeleton(values),
+                        ),
+                    )
+                result = (digest, self._cacheable)
+            finally:
+                self._cacheable, self._children, self._references = outer_state
+
+        self._digests[id(obj)] = result
+        return result
+
+    def get_value_token(self, value: Any) -> Tuple[str, Any]:
+        """Get a serialisation of some data that uniquely describes it."""
+        if isinstance(value, AWSObject):
+            return ("object", self.compile(value).data)
+
+        # Plain data can be serialised much more quickly by `marshal`, which
+        # rejects anything that isn't a plain Python type (including
+        # subclasses)
+        try:
+            return ("marshal", marshal.dumps(value, _MARSHAL_VERSION))
+        except ValueError:
+            pass
+
+        return (
+            "json",
+            json.dumps(
+                self.compile(value),
+                default=_TypeMarker.as_json_data,
+                separators=(",", ":"),
+            ),
+        )
+
+
+def _get_attribute_values(obj: AWSObject) -> tuple:
+    """Get the values of all CloudFormation attributes of an object, in order."""
+    try:
+        getter = _ATTRIBUTE_GETTERS[type(obj)]
+    except KeyError:
+        names = type(obj)._CFN_ATTRIBUTE_NAMES
+        if len(names) == 0:
+            getter = lambda obj: ()  # noqa: E731
+        elif len(names) == 1:
+            getter = lambda obj, get=attrgetter(names[0]): (get(obj),)  # noqa: E731
+        else:
+            getter = attrgetter(*names)
+        _ATTRIBUTE_GETTERS[type(obj)] = getter
+    return getter(obj)
+
+
+def _get_type_name(data: Any) -> str:
+    datatype = type(data)
+    return datatype.__module__ + "." + datatype.__qualname__
+
+
+class _TypeMarker:
+    """Plain data for an object that isn't a plain Python type."""
+
+    __slots__ = ["type_name", "data"]
+
+    def __init__(self, type_name: str, data: Any):
+        self.type_name = type_name
+        self.data = data
+
+    def as_json_data(self) -> dict:
+        # Real dictionary keys in a stack won't start with a NUL character,
+        # so this won't be confused with normal data
+        return {"\0type": self.type_name, "\0data": self.data}
@@ -7,12 +7,15 @@ be resolved internally.
 See http://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/intrinsic-function-reference.html
 """
 
+from typing import Any
+from typing import Dict
 from typing import Union
 
 import yaml
 
 from flyingcircus.core import AWS_Region
 from flyingcircus.core import PseudoParameter
+from .compiler import TemplateCompiler
 from .yaml import CustomYamlObject
 from .yaml import represent_string
 
@@ -40,6 +43,15 @@ class _Function(CustomYamlObject):
             # TODO use represent_string instead, perhaps
             return dumper.represent_scalar(f"!{tag}", value, style="")
 
+    def _get_string_data(
+        self, compiler: TemplateCompiler, value: Union["_Function", str], tag: str
+    ) -> Dict[str, Any]:
+        """Get the plain data for a function that takes a single string.
+
+        This is the plain data equivalent of `_get_string_node`.
+        """
+        return {f"Fn::{tag}": compiler.compile(value)}
+
 
 class Base64(_Function):
     """Models the behaviour of Fn::Base64 for Python objects.
@@ -57,6 +69,9 @@ class Base64(_Function):
         # TODO If the content is a string, try to format multi-line strings nicely (eg. from EC2 UserData)
         return self._get_string_node(dumper, self._data, "Base64")
 
+    def as_plain_data(self, compiler):
+        return self._get_string_data(compiler, self._data, "Base64")
+
 
 class GetAtt(_Function):
     """Models the behaviour of Fn::GetAtt for Python objects.
@@ -114,6 +129,19 @@ class GetAtt(_Function):
                 "!GetAtt", ".".join([name] + list(self._attribute_name)), style=""
             )
 
+    def as_plain_data(self, compiler):
+        name = compiler.cfn_stack.get_logical_name(
+            self._resource, resources_only=True
+        )  # Pass error through
+
+        if self._attribute_name_has_refs:
+            return {
+                "Fn::GetAtt": [name]
+                + [compiler.compile(component) for component in self._attribute_name]
+            }
+        else:
+            return {"Fn::GetAtt": [name, ".".join(self._attribute_name)]}
+
     def __eq__(self, other):
         # noinspection PyProtectedMember
         if not isinstance(other, self.__class__):
@@ -147,6 +175,9 @@ class GetAZs(_Function):
     def as_yaml_node(self, dumper):
         return self._get_string_node(dumper, self._region, "GetAZs")
 
+    def as_plain_data(self, compiler):
+        return self._get_string_data(compiler, self._region, "GetAZs")
+
 
 class ImportValue(_Function):
     """Models the behaviour of Fn::ImportValue for Python objects.
@@ -160,6 +191,9 @@ class ImportValue(_Function):
     def as_yaml_node(self, dumper):
         return self._get_string_node(dumper, self._export_name, "ImportValue")
 
+    def as_plain_data(self, compiler):
+        return self._get_string_data(compiler, self._export_name, "ImportValue")
+
     def __eq__(self, other):
         # noinspection PyProtectedMember
         if not isinstance(other, self.__class__):
@@ -222,6 +256,9 @@ class Join(_Function):
         # TODO The default block layout is ugly. Better to use a compact form if values are not too large
         return dumper.represent_sequence("!Join", [self._delimiter, self._values])
 
+    def as_plain_data(self, compiler):
+        return {"Fn::Join": [self._delimiter, compiler.compile(self._values)]}
+
 
 class Ref(_Function):
     """Models the behaviour of Ref for Python objects.
@@ -248,6 +285,9 @@ class Ref(_Function):
         name = dumper.cfn_stack.get_logical_name(self._data)  # Pass error through
         return dumper.represent_scalar("!Ref", name, style="")
 
+    def as_plain_data(self, compiler):
+        return {"Ref": compiler.cfn_stack.get_logical_name(self._data)}
+
     @classmethod
     def _for_name(cls, name):
         # TODO doco - you can use this, but better not to
@@ -317,3 +357,8 @@ class Sub(_Function):
         # TODO not sure this forced quoting makes sense. Maybe revisit with some concrete examples.
         # If we do want it, we need to apply it to the long form as well
         return represent_string(dumper, self._input, tag="!Sub", basicsep="'")
+
+    def as_plain_data(self, compiler):
+        if self._variables:
+            return {"Fn::Sub": [self._input, compiler.compile(self._variables)]}
+        return {"Fn::Sub": self._input}
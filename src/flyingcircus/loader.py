@@ -0,0 +1,380 @@
+"""Load existing CloudFormation templates as Flying Circus objects."""
+
+import importlib
+import json
+from typing import IO
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import yaml
+from attr import attrib
+from attr import attrs
+
+from ._raw._registry import RESOURCE_TYPES
+from .core import ATTRSCONFIG
+from .core import AWSObject
+from .core import Output
+from .core import Parameter
+from .core import PseudoParameter
+from .core import Resource
+from .core import Stack
+from .core import TemplateSection
+from .intrinsic_function import Base64
+from .intrinsic_function import GetAZs
+from .intrinsic_function import GetAtt
+from .intrinsic_function import ImportValue
+from .intrinsic_function import Join
+from .intrinsic_function import Ref
+from .intrinsic_function import Sub
+from .yaml import FastAmazonCFNLoader
+
+#: The template sections that contain named items
+_ITEM_SECTIONS = ("Parameters", "Resources", "Outputs")
+
+
+def read_template(source: Union[str, bytes, IO]) -> Dict[str, Any]:
+    """Parse a CloudFormation template in YAML or JSON format.
+
+    Intrinsic functions in their YAML short form (eg. `!Ref Foo`) are
+    loaded as the plain data for their long form (eg. `{"Ref": "Foo"}`), so
+    the result is the same for either format. LibYAML is used to parse YAML
+    if it is available.
+
+    Args:
+        source: The template text, or a file-like object to read it from.
+
+    Raises:
+        ValueError: If the data is not a CloudFormation template.
+    """
+    if not isinstance(source, (str, bytes)):
+        source = source.read()
+
+    # JSON is much faster to parse with a dedicated parser. It is also a
+    # subset of YAML, so anything unusual can be left to the YAML parser
+    data = None
+    if source.lstrip()[:1] in ("{", b"{"):
+        try:
+            data = json.loads(source)
+        except ValueError:
+            pass
+    if data is None:
+        data = yaml.load(source, Loader=FastAmazonCFNLoader)
+
+    if not isinstance(data, dict):
+        raise ValueError("A CloudFormation template should be a mapping")
+    return data
+
+
+def load_stack(source: Union[str, bytes, IO]) -> Stack:
+    """Load a CloudFormation template in YAML or JSON format as a Stack.
+
+    See `TemplateLoader` for details of how the template is converted.
+
+    Args:
+        source: The template text, or a file-like object to read it from.
+
+    Raises:
+        ValueError: If the template can't be represented by Flying Circus
+            objects.
+    """
+    return TemplateLoader(read_template(source)).to_stack()
+
+
+def get_resource_class(resource_type: str) -> Optional[type]:
+    """Get the Flying Circus class for a CloudFormation resource type, or
+    None if it isn't known.
+
+    The class is found in the `flyingcircus.service` module for it's AWS
+    service, so it includes any extra functionality for that service. Only
+    that module is imported.
+    """
+    try:
+        module_name, class_name = RESOURCE_TYPES[resource_type]
+    except KeyError:
+        return None
+
+    module = importlib.import_module("flyingcircus.service." + module_name)
+    return getattr(module, class_name)
+
+
+@attrs(**ATTRSCONFIG)
+class GenericResource(Resource):
+    """A resource with a type that doesn't have a Flying Circus class.
+
+    This is used for custom resources (and any other unknown resource
+    types) in a loaded template. The resource type is set when the object is
+    created, and the Properties are a plain dictionary.
+    """
+
+    _resource_type: str = attrib()
+    Properties: Dict[str, Any] = attrib(factory=dict)
+
+    @property
+    def Type(self) -> str:
+        return self._resource_type
+
+
+class TemplateLoader:
+    """Creates Flying Circus objects from a parsed CloudFormation template.
+
+    The Parameters, Resources and Outputs of the template are each
+    converted into an object of the appropriate class, and intrinsic
+    functions that refer to them (eg. `Ref` and `GetAtt`) are converted
+    into the equivalent `flyingcircus.intrinsic_function` object, bound to
+    the object that they refer to. Any other data is copied as-is.
+
+    Objects are only created when they are requested, or when they are
+    referred to by another object that is being created. This means that a
+    single item or section of a large template can be inspected without
+    creating everything else.
+
+    A function that can't be represented by a Flying Circus object (eg.
+    `Fn::If`, or a `Ref` to a name that isn't in the template) is left as
+    plain data in it's long form, which will be exported unchanged.
+
+    However, an item with an attribute that Flying Circus objects don't
+    have can't be loaded at all, and raises a ValueError when it is
+    created. In particular, a Resource or Output with a `Condition` isn't
+    supported.
+    """
+
+    def __init__(self, template: Dict[str, Any]):
+        """
+        Args:
+            template: The plain data for the template, with intrinsic
+                functions in their long form (see `read_template`).
+
+        Raises:
+            ValueError: If the template has sections that a Stack doesn't
+                support.
+        """
+        unknown_sections = set(template) - set(Stack._CFN_ATTRIBUTE_NAMES)
+        if unknown_sections:
+            raise ValueError(
+                "Template has unsupported sections: {}".format(
+                    ", ".join(sorted(unknown_sections))
+                )
+            )
+
+        #: The plain data for the template
+        self.template = template
+
+        #: The objects that have been created for each item, keyed by
+        #: (section, logical name)
+        self._items: Dict[Tuple[str, str], Any] = {}
+
+        #: The converted data for each section that has been requested
+        self._sections: Dict[str, Any] = {}
+
+        self._stack: Optional[Stack] = None
+
+        self._functions: Dict[str, Callable[[Any], Any]] = {
+            "Fn::Base64": Base64,
+            "Fn::GetAtt": self._create_getatt,
+            "Fn::GetAZs": GetAZs,
+            "Fn::ImportValue": ImportValue,
+            "Fn::Join": self._create_join,
+            "Fn::Sub": self._create_sub,
+            "Ref": self._create_ref,
+        }
+
+    def get_names(self, section: str) -> List[str]:
+        """Get the logical names of the items in a section, without creating them."""
+        return list(self._get_section_data(section))
+
+    def get_item(self, section: str, name: str) -> Any:
+        """Get the object for a single Parameter, Resource or Output.
+
+        Raises:
+            KeyError: If the item doesn't exist.
+            ValueError: If the item can't be represented by a Flying Circus
+                object.
+        """
+        try:
+            return self._items[(section, name)]
+        except KeyError:
+            pass
+
+        data = self._get_section_data(section)[name]
+        with Stack.building():
+            return self._create_item(section, name, data)
+
+    def get_section(self, section: str) -> Any:
+        """Get the converted contents of a section of the template.
+
+        Parameters, Resources and Outputs are returned as a TemplateSection
+        in template order, creating any of their objects that don't exist yet.
+
+        Raises:
+            ValueError: If the section can't be represented by Flying Circus
+                objects.
+        """
+        try:
+            return self._sections[section]
+        except KeyError:
+            pass
+
+        if section in _ITEM_SECTIONS:
+            value = TemplateSection(
+                (name, self.get_item(section, name))
+                for name in self._get_section_data(section)
+            )
+        else:
+            with Stack.building():
+                value = self._convert(self.template.get(section))
+
+        self._sections[section] = value
+        return value
+
+    def to_stack(self) -> Stack:
+        """Get a Stack containing every part of the template.
+
+        Raises:
+            ValueError: If the template can't be represented by Flying
+                Circus objects.
+        """
+        if self._stack is None:
+            self._stack = Stack(
+                **{
+                    section: self.get_section(section)
+                    for section, data in self.template.items()
+                    if data is not None
+                }
+            )
+        return self._stack
+
+    def _get_section_data(self, section: str) -> Dict[str, Any]:
+        if section not in _ITEM_SECTIONS:
+            raise ValueError("{} is not a section of named items".format(section))
+        return self.template.get(section) or {}
+
+    # Object Creation
+    # ---------------
+
+    def _create_item(self, section: str, name: str, data: Any) -> Any:
+        path = section + "." + name
+        if not isinstance(data, dict):
+            raise ValueError("{} should be a mapping".format(path))
+
+        if section == "Resources":
+            try:
+                resource_type = data["Type"]
+            except KeyError:
+                raise ValueError("{} doesn't have a Type".format(path)) from None
+            resource_class = get_resource_class(resource_type)
+            if resource_class is None:
+                item = GenericResource(resource_type=resource_type)
+            else:
+                item = resource_class()
+        elif section == "Parameters":
+            item = Parameter()
+        else:
+            item = Output()
+
+        # The item is registered before it's attributes are converted, so
+        # that any references back to it can be resolved
+        self._items[(section, name)] = item
+        try:
+            self._set_attributes(item, data, path)
+        except BaseException:
+            del self._items[(section, name)]
+            raise
+        return item
+
+    def _set_attributes(self, obj: AWSObject, data: Dict[str, Any], path: str):
+        for key, value in data.items():
+            if key == "Type" and isinstance(obj, Resource):
+                continue
+            if key not in obj:
+                raise ValueError(
+                    "{} has an unsupported attribute: {}".format(path, key)
+                )
+
+            current = getattr(obj, key)
+            if isinstance(current, AWSObject) and isinstance(value, dict):
+                self._set_attributes(current, value, path + "." + key)
+                continue
+
+            try:
+                setattr(obj, key, self._convert(value))
+            except TypeError as ex:
+                # A dictionary couldn't be converted to a property type
+                # object, because it has an unsupported attribute
+                raise ValueError(
+                    "{}.{} has an unsupported value: {}".format(path, key, ex)
+                ) from ex
+
+    def _convert(self, value: Any) -> Any:
+        """Convert plain data, replacing any intrinsic functions with objects."""
+        if isinstance(value, list):
+            return [self._convert(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+
+        converted = {key: self._convert(item) for key, item in value.items()}
+        if len(converted) == 1:
+            ((key, arguments),) = converted.items()
+            create_function = self._functions.get(key)
+            if create_function is not None:
+                try:
+                    function = create_function(arguments)
+                except (TypeError, ValueError):
+                    # These arguments can't be represented by our function
+                    # object
+                    function = None
+                if function is not None:
+                    return function
+        return converted
+
+    def _find_object(self, name: Any, resources_only: bool = False) -> Any:
+        """Find the object with this logical name, or None if it doesn't exist."""
+        if not isinstance(name, str):
+            return None
+
+        if not resources_only:
+            if name in _PSEUDO_PARAMETERS:
+                return _PSEUDO_PARAMETERS[name]
+            if name in self._get_section_data("Parameters"):
+                return self.get_item("Parameters", name)
+        if name in self._get_section_data("Resources"):
+            return self.get_item("Resources", name)
+        return None
+
+    def _create_getatt(self, arguments: Any) -> Optional[GetAtt]:
+        if not (isinstance(arguments, list) and len(arguments) == 2):
+            return None
+        resource = self._find_object(arguments[0], resources_only=True)
+        if resource is None:
+            return None
+        return GetAtt(resource, arguments[1])
+
+    def _create_join(self, arguments: Any) -> Optional[Join]:
+        if not (
+            isinstance(arguments, list)
+            and len(arguments) == 2
+            and isinstance(arguments[1], list)
+        ):
+            return None
+        return Join(arguments[0], arguments[1])
+
+    def _create_ref(self, name: Any) -> Optional[Ref]:
+        target = self._find_object(name)
+        if target is None:
+            return None
+        return Ref(target)
+
+    def _create_sub(self, arguments: Any) -> Optional[Sub]:
+        if isinstance(arguments, list):
+            if not (len(arguments) == 2 and isinstance(arguments[1], dict)):
+                return None
+            return Sub(arguments[0], **arguments[1])
+        return Sub(arguments)
+
+
+#: The standard pseudo parameters, keyed by name
+_PSEUDO_PARAMETERS = {str(parameter): parameter for parameter in PseudoParameter.ALL}
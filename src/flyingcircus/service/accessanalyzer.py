@@ -5,8 +5,10 @@ See Also:
     <https://aws.amazon.com/iam/features/analyze-access/>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import accessanalyzer as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.accessanalyzer import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
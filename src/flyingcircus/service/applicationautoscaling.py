@@ -5,8 +5,10 @@ See Also:
     <https://docs.aws.amazon.com/autoscaling/application/APIReference/Welcome.html>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import applicationautoscaling as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.applicationautoscaling import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
@@ -11,11 +11,20 @@ from flyingcircus.core import Stack
 from flyingcircus.core import dedent
 from . import cloudwatch
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import autoscaling as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.autoscaling import *
+from .._raw.autoscaling import AutoScalingGroup
+from .._raw.autoscaling import AutoScalingGroupProperties
+from .._raw.autoscaling import LaunchConfiguration
+from .._raw.autoscaling import LaunchConfigurationProperties
+from .._raw.autoscaling import ScalingPolicy
+from .._raw.autoscaling import ScalingPolicyProperties
+
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 
 def autoscaling_group_by_cpu(low=20, high=80):
@@ -48,14 +57,15 @@ def autoscaling_group_by_cpu(low=20, high=80):
         )
     )
 
-    stack.merge_stack(
-        simple_scaling_policy(
-            cloudwatch.Alarms.high_cpu(threshold=high), Fn.Ref(asg), downscale=False
-        ).with_prefixed_names("ScaleUp")
-    ).merge_stack(
-        simple_scaling_policy(
-            cloudwatch.Alarms.low_cpu(threshold=low), Fn.Ref(asg), downscale=True
-        ).with_prefixed_names("ScaleDown")
+    stack.merge_all(
+        [
+            simple_scaling_policy(
+                cloudwatch.Alarms.high_cpu(threshold=high), Fn.Ref(asg), downscale=False
+            ).prefixed_view("ScaleUp"),
+            simple_scaling_policy(
+                cloudwatch.Alarms.low_cpu(threshold=low), Fn.Ref(asg), downscale=True
+            ).prefixed_view("ScaleDown"),
+        ]
     )
 
     return stack
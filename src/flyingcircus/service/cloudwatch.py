@@ -5,11 +5,15 @@ See Also:
      <http://docs.aws.amazon.com/AmazonCloudWatch/latest/monitoring/WhatIsCloudWatch.html>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import cloudwatch as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.cloudwatch import *
+from .._raw.cloudwatch import Alarm
+
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 
 class Alarms:
@@ -5,44 +5,16 @@ See Also:
     <https://docs.aws.amazon.com/cognito/latest/developerguide/index.html>`_
 """
 
+from .. import _lazy
 from .._raw import cognito as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.cognito import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 
 class UserPool(_raw.UserPool):
     __slots__ = []
 
-    # Implement Tagging
-    # -----------------
-    #
-    # User Pools store tags as a dictionary (somebody had to), and use a
-    # different Property name for the tag data
-    TAG_PROPERTY = "UserPoolTags"
-
-    def tag(self, tags=None, tag_derived_resources=True, **more_tags):
-        tagdata = self.Properties[self.TAG_PROPERTY]
-
-        if tagdata is None:
-            # No tags set yet
-            self.Properties[self.TAG_PROPERTY] = {}
-            tagdata = self.Properties[self.TAG_PROPERTY]
-
-        tagdata.update(tags or {})
-        tagdata.update(more_tags)
-
-        return True
-
-    def get_tag(self, key: str):
-        tagdata = self.Properties[self.TAG_PROPERTY]
-
-        if tagdata is None:
-            # No tags set yet
-            return None
-
-        return tagdata.get(key, None)
-
     # Implement Naming
     # ----------------
     @property
@@ -11,8 +11,14 @@ from attr import attrs
 from flyingcircus.core import ATTRSCONFIG
 from flyingcircus.core import Stack
 from flyingcircus.intrinsic_function import Ref
+from .. import _lazy
 from .._raw import ec2 as _raw
-from .._raw.ec2 import *
+from .._raw.ec2 import InternetGateway
+from .._raw.ec2 import VPCGatewayAttachment
+from .._raw.ec2 import VPCGatewayAttachmentProperties
+
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 
 class SecurityGroup(_raw.SecurityGroup):
@@ -71,15 +77,9 @@ class VPC(_raw.VPC):
         # nothing more to do
         if self._internet_gateway is not None:
             # Check that the internet gateway is in the desired stack
-            if not [
-                res for res in stack.Resources.values() if res is self._internet_gateway
-            ]:
+            if not stack.Resources.get_names(self._internet_gateway):
                 raise RuntimeError("Existing InternetGateway is not in this stack")
-            if not [
-                res
-                for res in stack.Resources.values()
-                if res is self._internet_gateway_attachment
-            ]:
+            if not stack.Resources.get_names(self._internet_gateway_attachment):
                 raise RuntimeError(
                     "Existing VPCGatewayAttachment for InternetGateway is not in this stack"
                 )
@@ -87,12 +87,8 @@ class VPC(_raw.VPC):
             return
 
         # Look for an existing gateway attached to this VPC
-        for res in stack.Resources.values():
-            if (
-                isinstance(res, VPCGatewayAttachment)
-                and res.Properties.VpcId == Ref(self)
-                and res.Properties.InternetGatewayId
-            ):
+        for _, res in stack.Resources.find_by_type(VPCGatewayAttachment):
+            if res.Properties.VpcId == Ref(self) and res.Properties.InternetGatewayId:
                 self._internet_gateway_attachment = res
 
                 # Try to dodgily unwrap the internet gateway...
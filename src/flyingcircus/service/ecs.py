@@ -5,11 +5,13 @@ See Also:
     <https://docs.aws.amazon.com/AmazonECS/latest/developerguide/index.html>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import ecs as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.ecs import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 
 # TODO specialised Service and TaskDefinition for use with fargate (which explicitly excludes some of the fields)
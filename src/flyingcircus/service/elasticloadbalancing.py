@@ -5,8 +5,10 @@ See Also:
     <https://docs.aws.amazon.com/elasticloadbalancing/latest/userguide/index.html>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import elasticloadbalancing as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.elasticloadbalancing import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
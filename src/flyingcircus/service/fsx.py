@@ -5,8 +5,10 @@ See Also:
     <https://docs.aws.amazon.com/fsx/latest/WindowsGuide/index.html>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import fsx as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.fsx import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
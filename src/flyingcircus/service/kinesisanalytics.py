@@ -5,8 +5,10 @@ See Also:
     <https://docs.aws.amazon.com/kinesisanalytics/latest/dev/what-is.html>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import kinesisanalytics as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.kinesisanalytics import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
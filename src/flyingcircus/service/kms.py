@@ -5,10 +5,11 @@ See Also:
     <https://docs.aws.amazon.com/kms/latest/developerguide/overview.html>`_
 """
 
+from .. import _lazy
 from .._raw import kms as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.kms import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 
 class Key(_raw.Key):
@@ -12,11 +12,15 @@ from typing import Callable
 
 import inflection
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import lambda_ as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.lambda_ import *
+from .._raw.lambda_ import FunctionProperties
+
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 
 class Function(_raw.Function):
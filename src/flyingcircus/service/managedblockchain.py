@@ -5,8 +5,10 @@ See Also:
     <https://docs.aws.amazon.com/managed-blockchain/latest/managementguide>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import managedblockchain as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.managedblockchain import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
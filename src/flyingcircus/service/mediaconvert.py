@@ -5,8 +5,10 @@ See Also:
     <http://docs.aws.amazon.com/mediaconvert/latest/ug/what-is.html>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import mediaconvert as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.mediaconvert import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
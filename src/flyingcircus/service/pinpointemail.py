@@ -5,8 +5,10 @@ See Also:
     <http://docs.aws.amazon.com/pinpoint/latest/userguide/welcome.html>`_
 """
 
+from .. import _lazy
+
 # noinspection PyUnresolvedReferences
 from .._raw import pinpointemail as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.pinpointemail import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
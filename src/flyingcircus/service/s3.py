@@ -5,10 +5,11 @@ See Also:
     <https://docs.aws.amazon.com/AmazonS3/latest/dev/Welcome.html>`_
 """
 
+from .. import _lazy
 from .._raw import s3 as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.s3 import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 
 class Bucket(_raw.Bucket):
@@ -45,7 +46,7 @@ class Bucket(_raw.Bucket):
         config = self.Properties["BucketEncryption"]
         if not config:
             self.Properties["BucketEncryption"] = {}
-            config = self.Properties["BucketEncryption"] = {}
+            config = self.Properties["BucketEncryption"]
 
         # Create a fresh single-value list of server-side encryption rules
         if s3_managed:
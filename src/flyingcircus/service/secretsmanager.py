@@ -5,10 +5,11 @@ See Also:
     <https://docs.aws.amazon.com/secretsmanager/latest/userguide/intro.html>`_
 """
 
+from .. import _lazy
 from .._raw import secretsmanager as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.secretsmanager import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 
 class Secret(_raw.Secret):
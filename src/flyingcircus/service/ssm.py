@@ -5,10 +5,11 @@ See Also:
     <https://docs.aws.amazon.com/systems-manager/latest/APIReference/Welcome.html>`_
 """
 
+from .. import _lazy
 from .._raw import ssm as _raw
 
-# noinspection PyUnresolvedReferences
-from .._raw.ssm import *
+# Re-export everything from the raw module, without creating the classes yet
+__getattr__, __dir__ = _lazy.reexport_lazily(globals(), _raw)
 
 # Also provide an alias for the SSM Parameter resource, to reduce conflicts
 # with the top-level template Parameter object
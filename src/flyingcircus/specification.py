@@ -0,0 +1,238 @@
+"""Lookups in the AWS CloudFormation resource specification.
+
+The resource specification is a large JSON document, which would take a
+noticeable amount of time and memory to load in full. Instead, the code
+generator stores it in the `_raw` package as a compact indexed file, which
+is memory-mapped when it is first used. Each lookup finds it's entry in
+the index with a binary search, and only decodes the data for that entry.
+The file is read-only, so the operating system can share it's pages
+between every process that uses it.
+
+The file contains a header, a table of fixed-size index entries sorted by
+key, and then the keys and values that they refer to::
+
+    header:  magic (8 bytes), number of entries (uint32)
+    entry:   key offset, key length, value offset, value length (uint32 each)
+
+All integers are little-endian. Each key is the UTF-8 encoded name of a
+section of the specification and the name of the item in it, separated by
+a NUL character (eg. "ResourceTypes\\0AWS::S3::Bucket"). Each value is the
+compact JSON for that item.
+"""
+
+import functools
+import json
+import mmap
+import os
+import struct
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+#: The location of the specification that is generated with the package
+SPECIFICATION_FILENAME = os.path.join(
+    os.path.dirname(__file__), "_raw", "_specification.bin"
+)
+
+#: Identifies the file format (including it's version)
+_MAGIC = b"FCSPEC\x00\x01"
+
+_HEADER = struct.Struct("<8sI")
+_ENTRY = struct.Struct("<IIII")
+
+#: The section of the store for each type of item
+_ATTRIBUTES = "Attributes"
+_PROPERTY_TYPES = "PropertyTypes"
+_RESOURCE_TYPES = "ResourceTypes"
+_VERSION = "ResourceSpecificationVersion"
+
+
+class Specification:
+    """A read-only view of the resource specification in an indexed file.
+
+    Each lookup returns a new copy of the data for that item, in the same
+    format as the original JSON document.
+
+    See Also:
+        `AWS CloudFormation resource specification format
+        <https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/cfn-resource-specification-format.html>`_
+    """
+
+    def __init__(self, filename: str = SPECIFICATION_FILENAME):
+        """
+        Args:
+            filename: The file to read the specification from.
+
+        Raises:
+            ValueError: If the file isn't a resource specification in the
+                format that this version of Flying Circus creates.
+        """
+        with open(filename, "rb") as fp:
+            try:
+                self._data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # The file is empty
+                raise ValueError(
+                    "{} is not a resource specification".format(filename)
+                ) from None
+
+        try:
+            magic, self._size = _HEADER.unpack_from(self._data)
+        except struct.error:
+            magic = None
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError("{} is not a resource specification".format(filename))
+
+    def close(self):
+        """Release the memory-mapped file."""
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def version(self) -> str:
+        """The version of the resource specification."""
+        return self._get(_VERSION, "")
+
+    def get_resource_type(self, resource_type: str) -> Dict[str, Any]:
+        """Get the specification of a resource type (eg. "AWS::S3::Bucket").
+
+        Raises:
+            KeyError: If the resource type doesn't exist.
+        """
+        return self._get(_RESOURCE_TYPES, resource_type)
+
+    def get_property_type(self, property_type: str) -> Dict[str, Any]:
+        """Get the specification of a property type.
+
+        The name of a property type includes the resource type it belongs
+        to (eg. "AWS::S3::Bucket.VersioningConfiguration"), unless it is
+        shared by every resource type (eg. "Tag").
+
+        Raises:
+            KeyError: If the property type doesn't exist.
+        """
+        return self._get(_PROPERTY_TYPES, property_type)
+
+    def get_attribute(self, resource_type: str, attribute_name: str) -> Dict[str, Any]:
+        """Get the specification of an attribute of a resource type (ie.
+        something that can be retrieved with `Fn::GetAtt`).
+
+        Raises:
+            KeyError: If the attribute doesn't exist.
+        """
+        return self._get(_ATTRIBUTES, resource_type + "." + attribute_name)
+
+    def get_resource_type_names(self) -> List[str]:
+        """Get the name of every resource type, in sorted order."""
+        return list(self._iter_names(_RESOURCE_TYPES))
+
+    def get_property_type_names(self) -> List[str]:
+        """Get the name of every property type, in sorted order."""
+        return list(self._iter_names(_PROPERTY_TYPES))
+
+    def _get(self, section: str, name: str) -> Any:
+        key = _make_key(section, name)
+        index = self._find(key)
+        if index < self._size:
+            key_offset, key_length, value_offset, value_length = self._get_entry(index)
+            if self._data[key_offset : key_offset + key_length] == key:
+                return json.loads(
+                    self._data[value_offset : value_offset + value_length].decode(
+                        "utf-8"
+                    )
+                )
+        raise KeyError(name)
+
+    def _iter_names(self, section: str) -> Iterator[str]:
+        prefix = _make_key(section, "")
+        for index in range(self._find(prefix), self._size):
+            key = self._get_key(index)
+            if not key.startswith(prefix):
+                break
+            yield key[len(prefix) :].decode("utf-8")
+
+    def _find(self, key: bytes) -> int:
+        """Find the index of the first entry with a key that is not less
+        than this key."""
+        low = 0
+        high = self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._get_key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _get_entry(self, index: int) -> Tuple[int, int, int, int]:
+        return _ENTRY.unpack_from(self._data, _HEADER.size + index * _ENTRY.size)
+
+    def _get_key(self, index: int) -> bytes:
+        key_offset, key_length, _, _ = self._get_entry(index)
+        return self._data[key_offset : key_offset + key_length]
+
+
+@functools.lru_cache(maxsize=None)
+def get_specification() -> Specification:
+    """Get the resource specification that was generated with the package.
+
+    The file is opened when this is first called, and then shared.
+    """
+    return Specification()
+
+
+def write_specification(data: Dict[str, Any], filename: str):
+    """Write a resource specification to an indexed file.
+
+    Args:
+        data: The resource specification, as loaded from the JSON document
+            published by AWS.
+        filename: The file to write.
+    """
+    items = {_make_key(_VERSION, ""): data[_VERSION]}
+    for section in (_PROPERTY_TYPES, _RESOURCE_TYPES):
+        for name, item in data[section].items():
+            items[_make_key(section, name)] = item
+    for resource_type, item in data[_RESOURCE_TYPES].items():
+        for attribute_name, attribute in item.get(_ATTRIBUTES, {}).items():
+            items[_make_key(_ATTRIBUTES, resource_type + "." + attribute_name)] = (
+                attribute
+            )
+
+    keys = sorted(items)
+    values = [
+        json.dumps(items[key], sort_keys=True, separators=(",", ":")).encode("utf-8")
+        for key in keys
+    ]
+
+    # The keys are stored together, so that a search only reads the pages
+    # that contain the index and the keys
+    offset = _HEADER.size + len(keys) * _ENTRY.size
+    entries = []
+    for key in keys:
+        entries.append([offset, len(key)])
+        offset += len(key)
+    for entry, value in zip(entries, values):
+        entry.extend([offset, len(value)])
+        offset += len(value)
+
+    with open(filename, "wb") as fp:
+        fp.write(_HEADER.pack(_MAGIC, len(keys)))
+        for entry in entries:
+            fp.write(_ENTRY.pack(*entry))
+        for key in keys:
+            fp.write(key)
+        for value in values:
+            fp.write(value)
+
+
+def _make_key(section: str, name: str) -> bytes:
+    return (section + "\0" + name).encode("utf-8")
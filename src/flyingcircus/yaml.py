@@ -2,6 +2,7 @@
 
 # TODO rename this module to avoid confusion with external `yaml` module
 
+from typing import Dict
 from typing import Optional
 
 import yaml
@@ -14,10 +15,6 @@ def register_yaml_representers():
     """Configure YAML output from PyYAML."""
     # TODO better to add these to a custom Dumper than pollute the global object?
 
-    # Add marshalling/representers for custom types
-    yaml.add_representer(str, represent_string)
-    yaml.add_multi_representer(CustomYamlObject, CustomYamlObject.represent_object)
-
     # Don't silently fail if we try to export something weird
     def unknown_type(dumper, data):
         raise TypeError(
@@ -25,7 +22,19 @@ def register_yaml_representers():
             "extend CustomYamlObject".format(data.__class__.__name__)
         )
 
-    yaml.add_multi_representer(object, unknown_type)
+    # The LibYAML dumper does not inherit from `yaml.Dumper`, so it needs
+    # it's own copy of the representers.
+    dumpers = [yaml.Dumper]
+    if AmazonCFNCDumper is not None:
+        dumpers.append(AmazonCFNCDumper)
+
+    for dumper in dumpers:
+        # Add marshalling/representers for custom types
+        yaml.add_representer(str, represent_string, Dumper=dumper)
+        yaml.add_multi_representer(
+            CustomYamlObject, CustomYamlObject.represent_object, Dumper=dumper
+        )
+        yaml.add_multi_representer(object, unknown_type, Dumper=dumper)
 
 
 class CustomYamlObject(object):
@@ -37,6 +46,10 @@ class CustomYamlObject(object):
         """Get a representation of this object as a PyYAML node."""
         raise NotImplementedError("as_yaml_node")
 
+    def as_plain_data(self, compiler: "flyingcircus.compiler.TemplateCompiler"):
+        """Get a representation of this object as plain Python data."""
+        raise NotImplementedError("as_plain_data")
+
     @classmethod
     def represent_object(
         cls, dumper: yaml.Dumper, data: "CustomYamlObject"
@@ -104,14 +117,18 @@ class NonAliasingDumper(yaml.Dumper):
         super(NonAliasingDumper, self).serialize_node(node, parent, index)
 
 
-class AmazonCFNDumper(NonAliasingDumper, yaml.Dumper):
-    """A YAML dumper with output customised for AWS CloudFormation."""
+class _CloudFormationDumperMixin:
+    """Functionality that is common to all CloudFormation YAML dumpers."""
 
     def __init__(self, *args, **kwargs):
-        yaml.Dumper.__init__(self, *args, **kwargs)
+        super().__init__(*args, **kwargs)
 
         self.__cloud_formation_stack: "flyingcircus.core.Stack" = None
 
+        #: Cache of the exportable attributes for each AWSObject that has
+        #: been examined during this export, keyed by object identity.
+        self.pruned_objects: Dict[int, list] = {}
+
     @property
     def cfn_stack(self) -> "flyingcircus.core.Stack":
         """The Cloud Formation stack being exported.
@@ -138,6 +155,10 @@ class AmazonCFNDumper(NonAliasingDumper, yaml.Dumper):
         # Set value
         self.__cloud_formation_stack = value
 
+
+class AmazonCFNDumper(_CloudFormationDumperMixin, NonAliasingDumper, yaml.Dumper):
+    """A YAML dumper with output customised for AWS CloudFormation."""
+
     def choose_scalar_style(self) -> str:
         if self.analysis is None:
             self.analysis = self.analyze_scalar(self.event.value)
@@ -151,3 +172,100 @@ class AmazonCFNDumper(NonAliasingDumper, yaml.Dumper):
                 return ""
 
         return super().choose_scalar_style()
+
+
+if yaml.__with_libyaml__:
+
+    class AmazonCFNCDumper(_CloudFormationDumperMixin, yaml.CDumper):
+        """A faster equivalent of `AmazonCFNDumper` that uses LibYAML.
+
+        This is only available if PyYAML was built with LibYAML support, so
+        you should normally use `FastAmazonCFNDumper` instead.
+
+        The output is the same as `AmazonCFNDumper`, with one exception. The
+        LibYAML emitter already honours a request for plain scalar style
+        when a scalar has an explicit tag, but it will quote the value if it
+        is not safe to represent as a plain scalar (eg. `!Ref 'a: b'`).
+        Values like this are not normally used in intrinsic functions.
+        """
+
+        def ignore_aliases(self, data) -> bool:
+            # The serializer is implemented in C, so we can't clobber it in
+            # the same way as `NonAliasingDumper`. Instead we never re-use a
+            # node for the same object, which means that there is nothing to
+            # create an alias for.
+            return True
+
+else:  # pragma: no cover
+    # PyYAML was built without LibYAML support
+    AmazonCFNCDumper = None
+
+#: The fastest CloudFormation YAML dumper that is available
+FastAmazonCFNDumper = AmazonCFNCDumper or AmazonCFNDumper
+
+
+def _construct_long_form_function(
+    loader: yaml.SafeLoader, function_name: str, node: yaml.Node
+) -> dict:
+    """Load a short form intrinsic function (eg. `!Ref Foo`) as it's long
+    form (eg. `{"Ref": "Foo"}`).
+    """
+    if isinstance(node, yaml.ScalarNode):
+        value = loader.construct_scalar(node)
+    elif isinstance(node, yaml.SequenceNode):
+        value = loader.construct_sequence(node, deep=True)
+    else:
+        value = loader.construct_mapping(node, deep=True)
+
+    if function_name in ("Ref", "Condition"):
+        return {function_name: value}
+    if function_name == "GetAtt" and isinstance(value, str):
+        # The short form uses a dotted name, but the long form uses a list
+        value = value.split(".", 1)
+    return {"Fn::" + function_name: value}
+
+
+def _configure_loader(loader: type):
+    """Configure a YAML loader class to read CloudFormation templates."""
+    loader.add_multi_constructor("!", _construct_long_form_function)
+
+    # CloudFormation treats dates (eg. the AWSTemplateFormatVersion) as
+    # strings, so we don't want them to be converted into date objects
+    loader.yaml_implicit_resolvers = {
+        first_char: [
+            (tag, regexp)
+            for tag, regexp in resolvers
+            if tag != "tag:yaml.org,2002:timestamp"
+        ]
+        for first_char, resolvers in loader.yaml_implicit_resolvers.items()
+    }
+
+
+class AmazonCFNLoader(yaml.SafeLoader):
+    """A YAML loader for AWS CloudFormation templates.
+
+    Intrinsic functions in their short form (eg. `!Ref Foo`) are loaded as
+    the plain data for their long form (eg. `{"Ref": "Foo"}`), so the result
+    is the same as loading the equivalent JSON template.
+    """
+
+
+_configure_loader(AmazonCFNLoader)
+
+if yaml.__with_libyaml__:
+
+    class AmazonCFNCLoader(yaml.CSafeLoader):
+        """A faster equivalent of `AmazonCFNLoader` that uses LibYAML.
+
+        This is only available if PyYAML was built with LibYAML support, so
+        you should normally use `FastAmazonCFNLoader` instead.
+        """
+
+    _configure_loader(AmazonCFNCLoader)
+
+else:  # pragma: no cover
+    # PyYAML was built without LibYAML support
+    AmazonCFNCLoader = None
+
+#: The fastest CloudFormation YAML loader that is available
+FastAmazonCFNLoader = AmazonCFNCLoader or AmazonCFNLoader
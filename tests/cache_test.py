@@ -0,0 +1,191 @@
+"""Tests for the on-disk cache of exported templates."""
+
+import os
+
+import pytest
+
+from flyingcircus import export_many
+from flyingcircus.cache import CacheStatistics
+from flyingcircus.cache import TemplateCache
+from flyingcircus.cache import get_content_hash
+from .core_test.common import create_example_stack
+
+
+class TestContentHash:
+    """Verify the cache key for a stack's exported content."""
+
+    @pytest.mark.parametrize(
+        "options",
+        [dict(format="json"), dict(compact=True), dict(fast=True)],
+        ids=["format", "compact", "fast"],
+    )
+    def test_hash_depends_on_export_options(self, options):
+        stack = create_example_stack()
+
+        assert get_content_hash(stack) != get_content_hash(stack, **options)
+
+
+class TestTemplateCache:
+    """Verify the behaviour of the template cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return TemplateCache(str(tmp_path / "cache"))
+
+    def test_first_export_is_a_miss(self, cache):
+        stack = create_example_stack()
+
+        result = cache.export(stack)
+
+        assert result == stack.export()
+        assert cache.statistics == CacheStatistics(hits=0, misses=1)
+
+    def test_second_export_is_a_hit(self, cache):
+        cache.export(create_example_stack())
+
+        result = cache.export(create_example_stack())
+
+        assert result == create_example_stack().export()
+        assert cache.statistics == CacheStatistics(hits=1, misses=1)
+        assert cache.statistics.hit_rate == 0.5
+
+    def test_changed_stack_is_a_miss(self, cache):
+        cache.export(create_example_stack(1))
+
+        result = cache.export(create_example_stack(2))
+
+        assert result == create_example_stack(2).export()
+        assert cache.statistics.misses == 2
+
+    def test_export_options_are_cached_separately(self, cache):
+        stack = create_example_stack()
+        cache.export(stack)
+
+        result = cache.export(stack, format="json", compact=True)
+
+        assert result == stack.export("json", compact=True)
+        assert cache.statistics.misses == 2
+
+    def test_cache_is_shared_between_objects(self, tmp_path):
+        directory = str(tmp_path / "cache")
+        TemplateCache(directory).export(create_example_stack())
+        cache = TemplateCache(directory)
+
+        cache.export(create_example_stack())
+
+        assert cache.statistics.hits == 1
+
+    def test_unknown_format_is_rejected(self, cache):
+        with pytest.raises(ValueError, match="format"):
+            cache.export(create_example_stack(), format="xml")
+
+    def test_missing_template_is_a_miss(self, cache):
+        stack = create_example_stack()
+        cache.export(stack)
+        os.remove(cache._get_path(cache.get_key(stack)))
+
+        result = cache.export(stack)
+
+        assert result == stack.export()
+        assert cache.statistics == CacheStatistics(hits=0, misses=2)
+
+    def test_corrupt_template_is_a_miss_and_is_replaced(self, cache):
+        stack = create_example_stack()
+        key = cache.get_key(stack)
+        with open(cache._get_path(key), "wb") as fp:
+            fp.write(b"\xff\xfe not a template")
+
+        result = cache.export(stack)
+
+        assert result == stack.export()
+        assert cache.get(key) == result
+        assert cache.statistics == CacheStatistics(hits=1, misses=1)
+
+    def test_missing_directory_is_created_again(self, cache):
+        stack = create_example_stack()
+        cache.clear()
+        os.rmdir(cache.directory)
+
+        result = cache.export(stack)
+
+        assert result == stack.export()
+        assert cache.export(stack) == result
+        assert cache.statistics == CacheStatistics(hits=1, misses=1)
+
+    def test_clear_removes_all_templates(self, cache):
+        cache.export(create_example_stack())
+
+        cache.clear()
+        cache.export(create_example_stack())
+
+        assert cache.statistics.misses == 2
+
+
+class TestEviction:
+    """Verify that the cache is kept within it's limits."""
+
+    def _set_last_used(self, cache, key, timestamp):
+        os.utime(cache._get_path(key), (timestamp, timestamp))
+
+    def test_least_recently_used_template_is_evicted(self, tmp_path):
+        cache = TemplateCache(str(tmp_path), max_entries=2)
+        cache.put("first", "1")
+        cache.put("second", "2")
+        self._set_last_used(cache, "first", 1000)
+        self._set_last_used(cache, "second", 2000)
+        assert cache.get("first") == "1"
+
+        cache.put("third", "3")
+
+        assert cache.get("first") == "1"
+        assert cache.get("second") is None
+        assert cache.get("third") == "3"
+        assert cache.statistics.evictions == 1
+
+    def test_templates_are_evicted_by_total_size(self, tmp_path):
+        cache = TemplateCache(str(tmp_path), max_size=25)
+        cache.put("first", "a" * 10)
+        cache.put("second", "b" * 10)
+        self._set_last_used(cache, "first", 1000)
+        self._set_last_used(cache, "second", 2000)
+
+        cache.put("third", "c" * 10)
+
+        assert cache.get("first") is None
+        assert cache.get("second") == "b" * 10
+        assert cache.get("third") == "c" * 10
+
+    def test_there_are_no_limits_by_default(self, tmp_path):
+        cache = TemplateCache(str(tmp_path))
+
+        for i in range(10):
+            cache.put(str(i), "x" * 1000)
+
+        assert len(cache._get_entries()) == 10
+        assert cache.statistics.evictions == 0
+
+
+class TestExportManyWithCache:
+    """Verify that exporting many stacks can use a cache."""
+
+    def test_cached_stacks_are_not_exported_again(self, tmp_path):
+        cache = TemplateCache(str(tmp_path))
+        stacks = [create_example_stack(i) for i in range(3)]
+        export_many(stacks[:2], workers=2, cache=cache)
+
+        result = export_many(stacks, workers=2, cache=cache)
+
+        assert result == [stack.export() for stack in stacks]
+        assert cache.statistics == CacheStatistics(hits=2, misses=3)
+
+    def test_templates_are_written_to_files(self, tmp_path):
+        cache = TemplateCache(str(tmp_path / "cache"))
+        stacks = [create_example_stack(i) for i in range(2)]
+        paths = [str(tmp_path / "stack{}.yaml".format(i)) for i in range(2)]
+        cache.export(stacks[0])
+
+        export_many(stacks, workers=2, paths=paths, cache=cache)
+
+        for stack, path in zip(stacks, paths):
+            with open(path, encoding="utf-8") as fp:
+                assert fp.read() == stack.export()
@@ -0,0 +1,209 @@
+"""Tests for conversion of Flying Circus objects into plain Python data."""
+
+import pytest
+import yaml
+
+from flyingcircus.compiler import TemplateCompiler
+from flyingcircus.core import AWS_Region
+from flyingcircus.core import AWS_StackName
+from flyingcircus.core import EMPTY_DICT
+from flyingcircus.core import EMPTY_LIST
+from flyingcircus.core import LogicalName
+from flyingcircus.core import Output
+from flyingcircus.core import Parameter
+from flyingcircus.core import Stack
+from flyingcircus.intrinsic_function import Base64
+from flyingcircus.intrinsic_function import GetAZs
+from flyingcircus.intrinsic_function import GetAtt
+from flyingcircus.intrinsic_function import ImportValue
+from flyingcircus.intrinsic_function import Join
+from flyingcircus.intrinsic_function import Ref
+from flyingcircus.intrinsic_function import Sub
+from .core_test.common import DualAttributeObject
+from .core_test.common import FullResource
+from .core_test.common import NestedAttributeObject
+from .core_test.common import SimpleResource
+from .core_test.common import SingleAttributeObject
+
+
+def _compile_in_stack(value, **resources):
+    """Compile a value as an attribute of a resource in a new stack."""
+    resources["Target"] = SingleAttributeObject(one=value)
+    stack = Stack(Resources=resources)
+    return stack.to_dict()["Resources"]["Target"]["one"]
+
+
+class TestTemplateCompiler:
+    """Verify behaviour of the compiler for basic Python types."""
+
+    @pytest.mark.parametrize("value", ["hello", 42, 4.2, True, False, None])
+    def test_scalars_are_unchanged(self, value):
+        assert TemplateCompiler().compile(value) == value
+
+    def test_pseudo_parameter_becomes_a_plain_string(self):
+        result = TemplateCompiler().compile(AWS_Region)
+
+        assert result == "AWS::Region"
+        assert type(result) is str
+
+    def test_tuple_becomes_a_list(self):
+        assert TemplateCompiler().compile((1, "two")) == [1, "two"]
+
+    def test_nested_containers_are_copied(self):
+        data = {"a": [1, {"b": 2}]}
+
+        result = TemplateCompiler().compile(data)
+
+        assert result == data
+        assert result is not data
+        assert result["a"] is not data["a"]
+
+    def test_dictionary_keys_are_unchanged_by_default(self):
+        result = TemplateCompiler().compile({"b": 1, "a": 2})
+
+        assert list(result) == ["b", "a"]
+
+    def test_dictionary_keys_can_be_sorted(self):
+        result = TemplateCompiler(sort_keys=True).compile(
+            {"b": {"d": 1, "c": 2}, "a": 3}
+        )
+
+        assert list(result) == ["a", "b"]
+        assert list(result["b"]) == ["c", "d"]
+
+    def test_incomparable_dictionary_keys_are_unchanged(self):
+        result = TemplateCompiler(sort_keys=True).compile({"b": 1, 2: 3, "a": 4})
+
+        assert list(result) == ["b", 2, "a"]
+
+    def test_unknown_types_are_rejected(self):
+        with pytest.raises(TypeError, match="object"):
+            TemplateCompiler().compile(object())
+
+    def test_stack_cannot_be_set_twice(self):
+        compiler = TemplateCompiler()
+        compiler.cfn_stack = Stack()
+
+        with pytest.raises(RuntimeError):
+            compiler.cfn_stack = Stack()
+
+    def test_stack_must_be_a_stack(self):
+        compiler = TemplateCompiler()
+
+        with pytest.raises(TypeError):
+            compiler.cfn_stack = {}
+
+
+class TestToDict:
+    """Verify behaviour of the to_dict method on AWS objects."""
+
+    def test_attributes_are_in_export_order(self):
+        data = FullResource(DeletionPolicy="Retain", DependsOn=["Foo"])
+
+        result = data.to_dict()
+
+        assert list(result.keys()) == [
+            "Type",
+            "DependsOn",
+            "DeletionPolicy",
+        ]
+
+    def test_unset_and_empty_attributes_are_removed(self):
+        data = DualAttributeObject(one={"a": [], "b": 1}, two=[])
+
+        assert data.to_dict() == {"one": {"b": 1}}
+
+    def test_nested_objects_become_dictionaries(self):
+        data = NestedAttributeObject(top={"one": 42})
+
+        assert data.to_dict() == {"top": {"one": 42}}
+
+    def test_empty_signal_values_are_retained(self):
+        data = DualAttributeObject(one=EMPTY_LIST, two=EMPTY_DICT)
+
+        assert data.to_dict() == {"one": [], "two": {}}
+
+    def test_stack_matches_yaml_export_without_functions(self):
+        stack = Stack(Description="A simple stack")
+        stack.Resources["Foo"] = FullResource(DependsOn=["Bar"])
+        stack.Resources["Bar"] = SimpleResource()
+        stack.Parameters["Baz"] = Parameter(Type="String", Default="hello")
+        stack.Outputs["Qux"] = Output(Value="world", Export={"Name": "Qux"})
+
+        result = stack.to_dict()
+
+        assert result == yaml.safe_load(stack.export("yaml"))
+
+
+class TestIntrinsicFunctionsUseLongForm:
+    """Verify the plain data for each intrinsic function."""
+
+    def test_base64(self):
+        assert _compile_in_stack(Base64("Hello")) == {"Fn::Base64": "Hello"}
+
+    def test_base64_with_nested_function(self):
+        assert _compile_in_stack(Base64(Ref(AWS_StackName))) == {
+            "Fn::Base64": {"Ref": "AWS::StackName"}
+        }
+
+    def test_getatt(self):
+        resource = SimpleResource()
+
+        result = _compile_in_stack(GetAtt(resource, "Foo", "Bar"), Res=resource)
+
+        assert result == {"Fn::GetAtt": ["Res", "Foo.Bar"]}
+
+    def test_getatt_with_ref_in_attribute_name(self):
+        resource = SimpleResource()
+        param = Parameter(Type="String")
+
+        result = _compile_in_stack(
+            GetAtt(resource, Ref(param)), Res=resource, Param=param
+        )
+
+        assert result == {"Fn::GetAtt": ["Res", {"Ref": "Param"}]}
+
+    def test_getazs(self):
+        assert _compile_in_stack(GetAZs()) == {"Fn::GetAZs": {"Ref": "AWS::Region"}}
+
+    def test_getazs_with_region(self):
+        assert _compile_in_stack(GetAZs("us-east-1")) == {"Fn::GetAZs": "us-east-1"}
+
+    def test_importvalue(self):
+        assert _compile_in_stack(ImportValue("Foo")) == {"Fn::ImportValue": "Foo"}
+
+    def test_join(self):
+        resource = SimpleResource()
+
+        result = _compile_in_stack(Join(",", "a", Ref(resource)), Res=resource)
+
+        assert result == {"Fn::Join": [",", ["a", {"Ref": "Res"}]]}
+
+    def test_ref(self):
+        resource = SimpleResource()
+
+        assert _compile_in_stack(Ref(resource), Res=resource) == {"Ref": "Res"}
+
+    def test_ref_to_pseudo_parameter(self):
+        assert _compile_in_stack(Ref(AWS_Region)) == {"Ref": "AWS::Region"}
+
+    def test_ref_to_object_outside_stack_is_rejected(self):
+        with pytest.raises(ValueError):
+            _compile_in_stack(Ref(SimpleResource()))
+
+    def test_sub(self):
+        assert _compile_in_stack(Sub("${AWS::Region}-foo")) == {
+            "Fn::Sub": "${AWS::Region}-foo"
+        }
+
+    def test_sub_with_variables(self):
+        resource = SimpleResource()
+
+        result = _compile_in_stack(Sub("${Foo}-bar", Foo=Ref(resource)), Res=resource)
+
+        assert result == {"Fn::Sub": ["${Foo}-bar", {"Foo": {"Ref": "Res"}}]}
+
+    def test_logical_name(self):
+        resource = SimpleResource()
+
+        assert _compile_in_stack(LogicalName(resource), Res=resource) == "Res"
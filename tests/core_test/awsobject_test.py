@@ -7,6 +7,7 @@ import hypothesis.strategies as st
 import pytest
 from attr import attrib
 from attr import attrs
+from attr.validators import instance_of
 from hypothesis import given
 
 from flyingcircus.core import ATTRSCONFIG
@@ -58,7 +59,7 @@ class TestInitMethod:
 class TestExport:
     """Verify behaviour of the export method"""
 
-    VALID_EXPORT_FORMATS = {"yaml"}
+    VALID_EXPORT_FORMATS = {"yaml", "json"}
 
     @pytest.mark.parametrize("format", VALID_EXPORT_FORMATS)
     def test_valid_export_methods_produce_a_result(self, format):
@@ -112,6 +113,55 @@ class TestAttributeAccess:
         # Verify
         assert data.one == 42
 
+    def test_attributes_on_parent_class_are_converted_in_subclass(self):
+        @attrs(**ATTRSCONFIG)
+        class InheritedNestedObject(NestedAttributeObject):
+            other = attrib(default=None)
+
+        data = InheritedNestedObject()
+
+        # Exercise
+        data.top = {"one": 42}
+
+        # Verify
+        assert isinstance(data.top, SingleAttributeObject)
+        assert data.top.one == 42
+
+    def test_validator_is_applied_when_attribute_is_set(self):
+        @attrs(**ATTRSCONFIG)
+        class ValidatedObject(AWSObject):
+            number = attrib(default=None, validator=instance_of((int, type(None))))
+
+        data = ValidatedObject()
+
+        with pytest.raises(TypeError, match="number"):
+            data.number = "not a number"
+
+    def test_validator_is_only_applied_to_the_attribute_that_is_set(self):
+        calls = []
+
+        def record_validation(instance, attribute, value):
+            calls.append(attribute.name)
+
+        @attrs(**ATTRSCONFIG)
+        class ValidatedObject(AWSObject):
+            one = attrib(default=None, validator=record_validation)
+            two = attrib(default=None, validator=record_validation)
+
+        data = ValidatedObject()
+        calls.clear()
+
+        # Exercise
+        data.two = 42
+
+        # Verify
+        assert calls == ["two"]
+
+    def test_attribute_table_is_calculated_for_each_class(self):
+        assert set(SingleAttributeObject._ATTRIBUTE_TABLE.keys()) == {"one"}
+        assert set(InheritedAttributeObject._ATTRIBUTE_TABLE.keys()) == {"one", "two"}
+        assert ZeroAttributeObject._ATTRIBUTE_TABLE == {}
+
 
 class TestDictionaryAccess:
     """Verify behaviour of dictionary access to attributes on a Flying Circus AWS object"""
@@ -228,3 +278,60 @@ class TestIteratorAccess:
         # Verify
         assert list(attribs) == ["b", "a"]
         assert len(data) == 2
+
+    def test_object_iteration_includes_attributes_from_parent_class(self):
+        # Setup
+        data = InheritedAttributeObject(one=42, two="hello world")
+
+        # Exercise
+        attribs = iter(data)
+
+        # Verify
+        assert list(attribs) == ["one", "two"]
+        assert len(data) == 2
+
+
+class TestMappingAccess:
+    """Verify behaviour of the dict-like access methods on a Flying Circus AWS object."""
+
+    def test_contains_aws_attribute(self):
+        data = MixedAttributeObject()
+
+        assert "one" in data
+        assert "two" in data
+
+    def test_does_not_contain_internal_attribute(self):
+        data = MixedAttributeObject()
+
+        assert "_a" not in data
+        assert "a" not in data
+
+    def test_does_not_contain_unknown_attribute(self):
+        data = MixedAttributeObject()
+
+        assert "WeirdValue" not in data
+
+    def test_keys_are_sorted_attribute_names(self):
+        data = MixedAttributeObject(one=42, two="hello world", a="nope")
+
+        assert list(data.keys()) == ["one", "two"]
+
+    def test_items_are_sorted_attribute_names_and_values(self):
+        data = MixedAttributeObject(one=42, two="hello world", a="nope")
+
+        assert list(data.items()) == [("one", 42), ("two", "hello world")]
+
+    def test_items_include_attributes_that_are_not_set(self):
+        data = DualAttributeObject(two="hello world")
+
+        assert list(data.items()) == [("one", None), ("two", "hello world")]
+
+    def test_values_are_sorted_attribute_values(self):
+        data = MixedAttributeObject(one=42, two="hello world", a="nope")
+
+        assert list(data.values()) == [42, "hello world"]
+
+    def test_object_can_be_converted_to_dictionary(self):
+        data = DualAttributeObject(one=42, two="hello world")
+
+        assert dict(data) == {"one": 42, "two": "hello world"}
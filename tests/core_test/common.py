@@ -10,9 +10,19 @@ from attr import attrs
 
 from flyingcircus.core import ATTRSCONFIG
 from flyingcircus.core import AWSObject
+from flyingcircus.core import AWS_Region
+from flyingcircus.core import EMPTY_DICT
+from flyingcircus.core import EMPTY_LIST
+from flyingcircus.core import Output
+from flyingcircus.core import Parameter
 from flyingcircus.core import Resource
 from flyingcircus.core import ResourceProperties
+from flyingcircus.core import Stack
 from flyingcircus.core import create_object_converter
+from flyingcircus.intrinsic_function import GetAZs
+from flyingcircus.intrinsic_function import GetAtt
+from flyingcircus.intrinsic_function import Ref
+from flyingcircus.intrinsic_function import Sub
 
 
 class CommonAWSObjectTests:
@@ -171,6 +181,33 @@ class TaggableResource(Resource):
     Properties: TaggableProperties = attrib(factory=TaggableProperties)
 
 
+def create_example_stack(value: Any = 42) -> Stack:
+    """Create a small stack with references between it's objects.
+
+    Stacks that are created with the same value have the same content. The
+    value is stored in the "Size" of the "Foo" resource's properties.
+    """
+    stack = Stack(Description="A stack")
+    stack.Parameters["Param"] = Parameter(Type="String")
+
+    foo = SimpleResource()
+    foo.Properties.props = {
+        "Size": value,
+        "Items": ["a", "b"],
+        "Param": Ref(stack.Parameters["Param"]),
+        "Signals": [EMPTY_LIST, EMPTY_DICT],
+        "Zones": GetAZs(Ref(AWS_Region)),
+    }
+    stack.Resources["Foo"] = foo
+    stack.Resources["Bar"] = FullResource(DependsOn=["Foo"])
+
+    stack.Outputs["Baz"] = Output(
+        Value=Ref(foo), Export={"Name": Sub("${AWS::StackName}-Baz")}
+    )
+    stack.Outputs["Arn"] = Output(Value=GetAtt(foo, "Arn"))
+    return stack
+
+
 LOREM_IPSUM = """\
 Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor
 incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis
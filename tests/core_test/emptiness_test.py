@@ -92,3 +92,50 @@ class TestRemoveEmptyAttributes:
         data = {"a": 1, "b": []}
         cleaned = remove_empty_values_from_attribute(data)
         assert cleaned == {"a": 1}
+
+    def test_lists_without_empty_entries_are_not_copied(self):
+        data = [1, [2], {"a": 3}]
+        cleaned = remove_empty_values_from_attribute(data)
+        assert cleaned is data
+
+    def test_dictionaries_without_empty_values_are_not_copied(self):
+        data = {"a": 1, "b": [2]}
+        cleaned = remove_empty_values_from_attribute(data)
+        assert cleaned is data
+
+    def test_nested_empty_values_are_removed(self):
+        data = {"a": [1, {"b": [], "c": 2}, {"d": {}}], "e": {"f": [[]]}}
+        cleaned = remove_empty_values_from_attribute(data)
+        assert cleaned == {"a": [1, {"c": 2}]}
+
+    def test_unmodified_parts_of_a_nested_value_are_not_copied(self):
+        unmodified = {"c": [1, 2]}
+        data = {"a": unmodified, "b": []}
+        cleaned = remove_empty_values_from_attribute(data)
+        assert cleaned == {"a": {"c": [1, 2]}}
+        assert cleaned["a"] is unmodified
+
+    def test_empty_awsobjects_are_removed(self):
+        data = [1, DualAttributeObject(one=[], two={})]
+        cleaned = remove_empty_values_from_attribute(data)
+        assert cleaned == [1]
+
+
+class TestDeeplyNestedAttributes:
+    """Verify emptiness behaviour on deeply nested data structures."""
+
+    DEPTH = 5000
+
+    def _create_nested_objects(self, leaf):
+        data = leaf
+        for _ in range(self.DEPTH):
+            data = DualAttributeObject(one=[data])
+        return data
+
+    def test_deeply_nested_empty_object_is_empty(self):
+        data = self._create_nested_objects({})
+        assert is_non_empty_attribute(data) is False
+
+    def test_deeply_nested_non_empty_object_is_not_empty(self):
+        data = self._create_nested_objects("hello")
+        assert is_non_empty_attribute(data) is True
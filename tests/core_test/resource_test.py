@@ -2,7 +2,6 @@
 
 import importlib
 
-import hypothesis.strategies as st
 import pytest
 from attr import attrib
 from attr import attrs
@@ -15,12 +14,16 @@ from flyingcircus.core import Parameter
 from flyingcircus.core import Resource
 from flyingcircus.core import Stack
 from flyingcircus.core import dedent
+from flyingcircus.service import autoscaling
+from flyingcircus.service import eks
+from flyingcircus.service import wafv2
 from .common import BaseTaggingTest
 from .common import FullResource
 from .common import SimpleResource
 from .common import SimpleResourceProperties
 from .common import TaggableResource
 from .common import aws_deletion_policy_strategy
+from .common import aws_logical_name_strategy
 from .common import parametrize_tagging_techniques
 from ..pyyaml_helper import create_refsafe_dumper
 
@@ -87,6 +90,23 @@ class TestResourceSpecialAttributes:
         assert "Type" in set(attribs)
         assert len(data) == 6
 
+    def test_type_is_contained_in_resource(self):
+        data = SimpleResource()
+
+        assert "Type" in data
+        assert data.keys()[0] == "Type"
+        assert dict(data.items())["Type"] == SimpleResource.RESOURCE_TYPE
+
+    def test_attribute_order_is_inherited_by_plain_subclass(self):
+        class PlainSubclass(FullResource):
+            __slots__ = []
+
+        # Exercise
+        attribs = iter(PlainSubclass())
+
+        # Verify
+        assert list(attribs) == list(iter(FullResource()))
+
     # Properties
     # ----------
 
@@ -238,10 +258,7 @@ class TestTagging(BaseTaggingTest):
     #       - value has wrong length or invalid characters
     #   same key and same value appears in both tags and more_tags
     #   same key and different value appears n both tags and more_tags
-    #   tag_derived_resources behaviour. Need specific implementation
     #   Resource is a Stack Resource => we should tag it's children
-    # TODO look up the weird resources that have unusual tag syntax (eg. ASG)
-    # TODO look up the resources that have an unusual name for Tag property
 
     @parametrize_tagging_techniques()
     def test_tag_is_added_to_properties(self, apply_tags):
@@ -311,7 +328,9 @@ class TestTagging(BaseTaggingTest):
         # Verify
         assert not tagged
 
-    @pytest.mark.parametrize("name", ["cognito.UserPool"])
+    @pytest.mark.parametrize(
+        "name", ["backup.BackupVault", "cognito.UserPool", "route53.HostedZone"]
+    )
     @parametrize_tagging_techniques()
     def test_resource_with_nonstandard_tag_property_is_supported(
         self, name: str, apply_tags: callable
@@ -336,6 +355,182 @@ class TestTagging(BaseTaggingTest):
         ), "Tags should not be stored on the 'Tags' property"
 
 
+class TestTagFormats(BaseTaggingTest):
+    """Test tagging for resources which store their tags in different ways."""
+
+    def test_existing_tags_are_updated_in_place(self):
+        # Setup
+        res = TaggableResource()
+        existing = {"Key": "Foo", "Value": "1"}
+        res.Properties.Tags = [existing, {"Key": "Bar", "Value": "2"}]
+
+        # Exercise
+        res.tag(Foo="3", Baz="4")
+
+        # Verify
+        assert res.Properties.Tags == [
+            {"Key": "Foo", "Value": "3"},
+            {"Key": "Bar", "Value": "2"},
+            {"Key": "Baz", "Value": "4"},
+        ]
+        assert res.Properties.Tags[0] is existing
+
+    def test_existing_tag_with_a_long_form_function_key_is_kept(self):
+        # Setup
+        res = TaggableResource()
+        res.Properties.Tags = [{"Key": {"Fn::Sub": "${Env}-name"}, "Value": "1"}]
+
+        # Exercise
+        res.tag(Foo="2")
+
+        # Verify
+        assert res.Properties.Tags == [
+            {"Key": {"Fn::Sub": "${Env}-name"}, "Value": "1"},
+            {"Key": "Foo", "Value": "2"},
+        ]
+
+    def test_tags_applied_at_once_are_only_added_once(self):
+        # Setup
+        res = TaggableResource()
+
+        # Exercise
+        res.tag({"Foo": "1"}, Foo="2")
+
+        # Verify
+        assert res.Properties.Tags == [{"Key": "Foo", "Value": "2"}]
+
+    def test_get_tag_does_not_create_tags(self):
+        # Setup
+        res = autoscaling.AutoScalingGroup()
+
+        # Exercise
+        result = res.get_tag("Foo")
+
+        # Verify
+        assert result is None
+        assert res.Properties.Tags is None
+
+    def test_map_tags_are_stored_in_a_dictionary(self):
+        # Setup
+        res = eks.Nodegroup()
+
+        # Exercise
+        res.tag({"Foo": "1"}, Bar="2")
+
+        # Verify
+        assert res.Properties.Tags == {"Foo": "1", "Bar": "2"}
+
+    @pytest.mark.parametrize("tag_derived_resources", [True, False])
+    def test_derived_resources_are_tagged_when_requested(self, tag_derived_resources):
+        # Setup
+        res = autoscaling.AutoScalingGroup()
+
+        # Exercise
+        res.tag(Foo="1", tag_derived_resources=tag_derived_resources)
+
+        # Verify
+        assert res.Properties.Tags == [
+            {"Key": "Foo", "Value": "1", "PropagateAtLaunch": tag_derived_resources}
+        ]
+
+    def test_derived_resource_tagging_is_updated_for_existing_tags(self):
+        # Setup
+        res = autoscaling.AutoScalingGroup()
+        res.tag(Foo="1")
+
+        # Exercise
+        res.tag(Foo="2", tag_derived_resources=False)
+
+        # Verify
+        assert res.Properties.Tags == [
+            {"Key": "Foo", "Value": "2", "PropagateAtLaunch": False}
+        ]
+
+    def test_new_tags_are_applied_to_derived_resources_by_default(self):
+        # Setup
+        res = autoscaling.AutoScalingGroup()
+
+        # Exercise
+        res.tag(Foo="1")
+
+        # Verify
+        assert res.Properties.Tags == [
+            {"Key": "Foo", "Value": "1", "PropagateAtLaunch": True}
+        ]
+
+    def test_derived_resource_tagging_is_kept_for_existing_tags_by_default(self):
+        # Setup
+        res = autoscaling.AutoScalingGroup()
+        res.tag(Foo="1", tag_derived_resources=False)
+
+        # Exercise
+        res.tag(Foo="2", Bar="3")
+
+        # Verify
+        assert res.Properties.Tags == [
+            {"Key": "Foo", "Value": "2", "PropagateAtLaunch": False},
+            {"Key": "Bar", "Value": "3", "PropagateAtLaunch": True},
+        ]
+
+    def test_stack_keeps_derived_resource_tagging_for_existing_tags(self):
+        # Setup
+        res = autoscaling.AutoScalingGroup()
+        res.tag(Foo="1", tag_derived_resources=False)
+        stack = Stack(Resources={"Group": res})
+
+        # Exercise
+        stack.tag(Foo="2")
+
+        # Verify
+        assert res.Properties.Tags[0]["PropagateAtLaunch"] is False
+
+    def test_stack_passes_derived_resource_tagging_to_resources(self):
+        # Setup
+        res = autoscaling.AutoScalingGroup()
+        stack = Stack(Resources={"Group": res})
+
+        # Exercise
+        stack.tag(Foo="1", tag_derived_resources=False)
+
+        # Verify
+        assert res.get_tag("Foo") == "1"
+        assert res.Properties.Tags[0]["PropagateAtLaunch"] is False
+
+    def test_resource_with_unsupported_tag_format_is_not_taggable(self):
+        # Setup
+        res = wafv2.WebACL()
+
+        # Exercise
+        tagged = res.tag(Foo="1")
+
+        # Verify
+        assert not tagged
+        assert res.is_taggable is False
+        assert res.Properties.Tags is None
+
+    def test_resource_without_tag_property_is_not_taggable(self):
+        @attrs(**ATTRSCONFIG)
+        class UntaggableResource(Resource):
+            RESOURCE_TYPE = "NameSpace::Service::UntaggableResource"
+            TAG_FORMAT = "Map"
+            Properties: SimpleResourceProperties = attrib(
+                factory=SimpleResourceProperties
+            )
+
+        assert UntaggableResource().is_taggable is False
+
+    def test_unknown_tag_format_is_rejected(self):
+        with pytest.raises(ValueError, match="TAG_FORMAT"):
+
+            @attrs(**ATTRSCONFIG)
+            class BadResource(Resource):
+                RESOURCE_TYPE = "NameSpace::Service::BadResource"
+                TAG_FORMAT = "Bogus"
+                Properties: SimpleResourceProperties = attrib(
+                    factory=SimpleResourceProperties
+                )
+
+
 class TestNameAccess:
     """Test automatic name access for Resource objects.
 
@@ -399,7 +594,7 @@ class TestNameAccess:
 class TestLogicalName:
     """Test behaviour/output of the LogicalName function."""
 
-    @given(st.text(min_size=1))
+    @given(aws_logical_name_strategy())
     def test_uses_logical_name_from_stack(self, name):
         # Setup
         data = SimpleResource(Properties={"props": 42})
@@ -1,21 +1,30 @@
 """Tests for the Stack base class."""
 
 import re
+import threading
 from copy import copy
 
 import hypothesis.strategies as st
 import pytest
+from attr import attrib
+from attr import attrs
+from attr.validators import instance_of
 from hypothesis import given
 
 import flyingcircus
+from flyingcircus.core import ATTRSCONFIG
+from flyingcircus.core import AWSObject
 from flyingcircus.core import AWS_Region
 from flyingcircus.core import Output
 from flyingcircus.core import Parameter
 from flyingcircus.core import Stack
 from flyingcircus.core import dedent
 from flyingcircus.exceptions import StackMergeError
+from flyingcircus.exceptions import ValidationError
+from flyingcircus.intrinsic_function import Ref
 from .common import BaseTaggingTest
 from .common import LOREM_IPSUM
+from .common import NestedAttributeObject
 from .common import SimpleResource
 from .common import SingleAttributeObject
 from .common import TaggableResource
@@ -61,6 +70,224 @@ class TestBasicStackBehaviour:
         assert stack.Metadata["FlyingCircus"]["version"] == flyingcircus.__version__
 
 
+@attrs(**ATTRSCONFIG)
+class _ValidatedObject(AWSObject):
+    number = attrib(default=None, validator=instance_of((int, type(None))))
+
+
+class TestBuildingContext:
+    """Verify behaviour of deferred validation while building a stack"""
+
+    def test_validation_is_deferred_until_the_context_exits(self):
+        data = _ValidatedObject()
+
+        with pytest.raises(TypeError, match="number"):
+            with Stack.building():
+                data.number = "not a number"
+
+                # Verify (still inside the context)
+                assert data.number == "not a number"
+
+    def test_object_can_be_fixed_before_the_context_exits(self):
+        data = _ValidatedObject()
+
+        with Stack.building():
+            data.number = "not a number"
+            data.number = 42
+
+        assert data.number == 42
+
+    def test_validation_is_not_deferred_after_the_context_exits(self):
+        data = _ValidatedObject()
+
+        with Stack.building():
+            data.number = 42
+
+        with pytest.raises(TypeError, match="number"):
+            data.number = "not a number"
+
+    def test_converters_are_applied_immediately(self):
+        data = NestedAttributeObject()
+
+        with Stack.building():
+            data.top = {"one": 42}
+
+            assert isinstance(data.top, SingleAttributeObject)
+
+    def test_nested_context_is_validated_when_outer_context_exits(self):
+        data = _ValidatedObject()
+
+        with pytest.raises(TypeError, match="number"):
+            with Stack.building():
+                with Stack.building():
+                    data.number = "not a number"
+
+                # Verify (still inside the outer context)
+                assert data.number == "not a number"
+
+    def test_export_validates_pending_objects(self):
+        data = _ValidatedObject()
+
+        with Stack.building():
+            data.number = "not a number"
+
+            with pytest.raises(TypeError, match="number"):
+                data.export("yaml")
+
+    def test_every_pending_object_is_validated(self):
+        first = _ValidatedObject()
+        second = _ValidatedObject()
+
+        with pytest.raises(ValidationError) as excinfo:
+            with Stack.building():
+                first.number = "not a number"
+                second.number = "also not a number"
+
+        assert len(excinfo.value.errors) == 2
+        assert all(isinstance(ex, TypeError) for ex in excinfo.value.errors)
+        assert "'not a number'" in str(excinfo.value)
+        assert "'also not a number'" in str(excinfo.value)
+
+    def test_multiple_errors_are_a_type_error(self):
+        first = _ValidatedObject()
+        second = _ValidatedObject()
+
+        with pytest.raises(TypeError, match="number"):
+            with Stack.building():
+                first.number = "not a number"
+                second.number = "not a number"
+
+    def test_validators_are_run_when_an_object_is_constructed(self):
+        # The attrs constructor runs validators directly, so they can't be
+        # deferred
+        with pytest.raises(TypeError, match="number"):
+            with Stack.building():
+                _ValidatedObject(number="not a number")
+                pytest.fail("Object was not validated when it was constructed")
+
+    def test_pending_validation_is_discarded_when_block_raises(self):
+        data = _ValidatedObject()
+
+        with pytest.raises(RuntimeError):
+            with Stack.building():
+                data.number = "not a number"
+                raise RuntimeError("Oops")
+
+        # Verify that later validation is unaffected
+        data.number = 42
+
+    def test_validation_is_only_deferred_in_the_current_thread(self):
+        data = _ValidatedObject()
+        errors = []
+
+        def set_invalid_number():
+            try:
+                data.number = "not a number"
+            except TypeError as ex:
+                errors.append(ex)
+
+        with Stack.building():
+            thread = threading.Thread(target=set_invalid_number)
+            thread.start()
+            thread.join()
+
+        assert len(errors) == 1
+
+    def test_other_thread_does_not_end_deferral(self):
+        data = _ValidatedObject()
+        other_thread_started = threading.Event()
+        other_thread_can_finish = threading.Event()
+
+        def build_in_other_thread():
+            with Stack.building():
+                other_thread_started.set()
+                other_thread_can_finish.wait()
+
+        thread = threading.Thread(target=build_in_other_thread)
+        thread.start()
+        other_thread_started.wait()
+        try:
+            with pytest.raises(TypeError, match="number"):
+                with Stack.building():
+                    other_thread_can_finish.set()
+                    thread.join()
+
+                    # The other thread's context has exited
+                    data.number = "not a number"
+                    assert data.number == "not a number"
+        finally:
+            other_thread_can_finish.set()
+            thread.join()
+
+
+class TestSaveAndLoad:
+    """Verify saving and loading a snapshot of a stack"""
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / "stack.snapshot")
+
+    def test_loaded_stack_has_the_same_template(self, path):
+        stack = Stack(Description="Snapshot")
+        stack.Parameters["Param"] = Parameter(Type="String")
+        stack.Resources["Foo"] = SimpleResource()
+        stack.Resources["Foo"].Properties.props = Ref(stack.Parameters["Param"])
+        stack.Outputs["Bar"] = Output(Value=Ref(stack.Resources["Foo"]))
+
+        stack.save(path)
+        result = Stack.load(path)
+
+        assert result is not stack
+        assert result.export("yaml") == stack.export("yaml")
+
+    def test_references_are_to_objects_in_the_loaded_stack(self, path):
+        stack = Stack(Resources={"Foo": SimpleResource()})
+        stack.Outputs["Bar"] = Output(Value=Ref(stack.Resources["Foo"]))
+
+        stack.save(path)
+        result = Stack.load(path)
+
+        assert result.Outputs["Bar"].Value._data is result.Resources["Foo"]
+
+    def test_shared_objects_are_still_shared(self, path):
+        resource = SimpleResource()
+        resource.Properties.props = {"Shared": 42}
+        resource.Properties.kudos = resource.Properties.props
+        stack = Stack(Resources={"Foo": resource, "Bar": resource})
+
+        stack.save(path)
+        result = Stack.load(path)
+
+        assert result.Resources["Foo"] is result.Resources["Bar"]
+        assert result.Resources.get_names(result.Resources["Foo"]) == ["Foo", "Bar"]
+        properties = result.Resources["Foo"].Properties
+        assert properties.props is properties.kudos
+
+    def test_other_files_are_rejected(self, path):
+        with open(path, "w") as fp:
+            fp.write("Not a snapshot")
+
+        with pytest.raises(ValueError, match="not a stack snapshot"):
+            Stack.load(path)
+
+    def test_snapshot_from_another_version_is_rejected(self, path, monkeypatch):
+        Stack().save(path)
+        monkeypatch.setattr(flyingcircus._about, "__version__", "0.0.0")
+
+        with pytest.raises(ValueError, match="version"):
+            Stack.load(path)
+
+    def test_save_validates_pending_objects(self, path):
+        data = _ValidatedObject()
+        stack = Stack(Resources={"Foo": data})
+
+        with Stack.building():
+            data.number = "not a number"
+
+            with pytest.raises(TypeError, match="number"):
+                stack.save(path)
+
+
 class TestGetLogicalName:
     """Verify reverse lookup of a resource's logical name"""
 
@@ -195,6 +422,79 @@ class TestGetLogicalName:
 
         assert "multiple names" in str(excinfo.value)
 
+    def test_fail_if_object_is_both_a_resource_and_a_parameter(self):
+        # Setup
+        stack = Stack()
+        data = ZeroAttributeObject()
+
+        stack.Resources["Foo"] = data
+        stack.Parameters["Bar"] = data
+
+        # Exercise & Verify
+        with pytest.raises(ValueError) as excinfo:
+            stack.get_logical_name(data)
+
+        assert "multiple names" in str(excinfo.value)
+        assert stack.get_logical_name(data, resources_only=True) == "Foo"
+
+    def test_find_a_resource_during_export(self):
+        # Setup
+        stack = Stack()
+        data = SimpleResource()
+        stack.Resources["Foo"] = data
+        stack.Resources["Bar"] = SimpleResource(Properties=dict(props=Ref(data)))
+
+        # Exercise & Verify
+        assert stack.to_dict()["Resources"]["Bar"]["Properties"] == {
+            "props": {"Ref": "Foo"}
+        }
+
+    def test_fail_if_object_is_duplicated_during_export(self):
+        # Setup
+        stack = Stack()
+        data = SimpleResource()
+        stack.Resources["Foo"] = data
+        stack.Resources["Bar"] = data
+        stack.Resources["Baz"] = SimpleResource(Properties=dict(props=Ref(data)))
+
+        # Exercise & Verify
+        with pytest.raises(ValueError) as excinfo:
+            stack.export("yaml")
+
+        assert "multiple names" in str(excinfo.value)
+
+    @pytest.mark.parametrize("format", ["yaml", "json"])
+    def test_index_is_not_retained_after_export(self, format):
+        # Setup
+        stack = Stack()
+        data = SimpleResource()
+        stack.Resources["Foo"] = data
+        stack.export(format)
+
+        # Exercise
+        stack.Resources["Bar"] = stack.Resources.pop("Foo")
+
+        # Verify
+        assert stack.get_logical_name(data) == "Bar"
+
+    def test_index_is_not_retained_after_failed_export(self):
+        # Setup
+        stack = Stack()
+        data = SimpleResource()
+        stack.Resources["Foo"] = data
+        stack.Resources["Bar"] = SimpleResource(
+            Properties=dict(props=Ref(SimpleResource()))
+        )
+
+        with pytest.raises(ValueError):
+            stack.export("yaml")
+
+        # Exercise
+        stack.Resources["Baz"] = stack.Resources.pop("Foo")
+
+        # Verify
+        assert stack.get_logical_name(data) == "Baz"
+
 
 class _ObjectThatReferencesStack(SingleAttributeObject):
     """Test object that verifies it has the correct stack when exported"""
@@ -396,6 +696,213 @@ class TestMergeStack:
 
         assert "the target stack already has exports" in str(excinfo.value).lower()
 
+    @pytest.mark.parametrize(
+        "attributes,message",
+        [
+            (
+                {"AWSTemplateFormatVersion": "123"},
+                "This template has a different template version (2010-09-09) "
+                "to the other template (123)",
+            ),
+            (
+                {"Transform": "123"},
+                "This template has a different Serverless Application Model "
+                "Transform version (456) to the other template (123)",
+            ),
+            (
+                {"Resources": {"Foo": SimpleResource()}},
+                "Resources in this stack already has an item with the logical "
+                "name Foo",
+            ),
+            (
+                {"Outputs": {"Bar": Output(Value=1, Export={"Name": "Baz"})}},
+                "The target stack already has exports named Baz",
+            ),
+            (
+                {"Metadata": {"Foo": 1}},
+                "Metadata in this stack already has an item with the logical "
+                "name Foo",
+            ),
+        ],
+        ids=["version", "transform", "logical-name", "export", "metadata"],
+    )
+    def test_conflict_is_described(self, attributes, message):
+        # Setup
+        target = Stack(
+            Transform="456",
+            Resources={"Foo": SimpleResource()},
+            Outputs={"Foo": Output(Value=1, Export={"Name": "Baz"})},
+            Metadata={"Foo": 1},
+        )
+        source = Stack(**attributes)
+
+        # Exercise & Verify
+        with pytest.raises(StackMergeError) as excinfo:
+            target.merge_stack(source)
+
+        assert str(excinfo.value) == message
+
+    def test_cannot_merge_if_an_export_name_was_changed_to_the_same_name(self):
+        # Setup
+        source = Stack(Outputs={"SourceOutput": Output(Value=123, Export={})})
+        target = Stack(
+            Outputs={"TargetOutput": Output(Value=987, Export={"Name": "Old"})}
+        )
+        source.Outputs["SourceOutput"].Export["Name"] = "SpecialExportedValue"
+        target.Outputs["TargetOutput"].Export = {"Name": "SpecialExportedValue"}
+
+        # Exercise & Verify
+        with pytest.raises(StackMergeError) as excinfo:
+            target.merge_stack(source)
+
+        assert "the target stack already has exports" in str(excinfo.value).lower()
+
+
+class TestMergeAll:
+    """Verify the bulk stack merging functionality."""
+
+    def _create_stack(self, resource_name, **kwargs):
+        return Stack(Resources={resource_name: SimpleResource()}, **kwargs)
+
+    def test_merge_returns_target_stack(self):
+        target = Stack()
+
+        assert target.merge_all([self._create_stack("Foo")]) is target
+
+    def test_all_items_are_added_to_the_target_stack(self):
+        # Setup
+        sources = [
+            Stack(
+                Resources={"Res{}".format(i): SimpleResource()},
+                Parameters={"Param{}".format(i): Parameter(Type="String")},
+                Outputs={"Out{}".format(i): Output(Value=i)},
+                Metadata={"Meta{}".format(i): i},
+            )
+            for i in range(3)
+        ]
+        target = Stack()
+
+        # Exercise
+        target.merge_all(iter(sources))
+
+        # Verify
+        for i, source in enumerate(sources):
+            for item_type in ["Resources", "Parameters", "Outputs"]:
+                for name, item in source[item_type].items():
+                    assert target[item_type][name] is item
+            assert target.Metadata["Meta{}".format(i)] == i
+
+    def test_merging_nothing_has_no_effect(self):
+        target = self._create_stack("Foo")
+
+        target.merge_all([])
+
+        assert list(target.Resources) == ["Foo"]
+
+    def test_all_conflicts_are_reported_together(self):
+        # Setup
+        target = self._create_stack("Foo", Transform="AWS::Serverless-2016-10-31")
+        sources = [
+            self._create_stack("Foo"),
+            self._create_stack("Bar", AWSTemplateFormatVersion="2000-01-01"),
+            self._create_stack("Bar", Transform="AWS::Serverless-2000-01-01"),
+        ]
+
+        # Exercise
+        with pytest.raises(StackMergeError) as excinfo:
+            target.merge_all(sources)
+
+        # Verify
+        conflicts = excinfo.value.conflicts
+        assert len(conflicts) == 4
+        assert "4 conflicts" in str(excinfo.value)
+        for conflict in conflicts:
+            assert conflict in str(excinfo.value)
+
+    def test_conflict_with_this_stack_names_the_other_stack(self):
+        # Setup
+        target = self._create_stack("Foo")
+        sources = [self._create_stack("Bar"), self._create_stack("Foo")]
+
+        # Exercise
+        with pytest.raises(StackMergeError) as excinfo:
+            target.merge_all(sources)
+
+        # Verify
+        assert str(excinfo.value) == (
+            "Resources in this stack already has an item with the logical name "
+            "Foo (from other stack 2)"
+        )
+
+    def test_nothing_is_merged_when_there_is_a_conflict(self):
+        # Setup
+        target = self._create_stack("Foo")
+        sources = [self._create_stack("Bar"), self._create_stack("Foo")]
+
+        # Exercise
+        with pytest.raises(StackMergeError):
+            target.merge_all(sources)
+
+        # Verify
+        assert list(target.Resources) == ["Foo"]
+
+    @pytest.mark.parametrize("item_type", ["Resources", "Parameters", "Outputs"])
+    def test_cannot_merge_if_logical_name_is_used_in_two_other_stacks(self, item_type):
+        # Setup
+        sources = [Stack(), Stack(), Stack()]
+        sources[0][item_type] = {"Foo": Output(Value=1)}
+        sources[2][item_type] = {"Foo": Output(Value=2)}
+
+        # Exercise & Verify
+        with pytest.raises(StackMergeError) as excinfo:
+            Stack().merge_all(sources)
+
+        assert str(excinfo.value) == (
+            "{} in other stack 1 and other stack 3 both have an item with the "
+            "logical name Foo".format(item_type)
+        )
+
+    def test_cannot_merge_if_export_name_is_used_in_two_other_stacks(self):
+        # Setup
+        sources = [
+            Stack(Outputs={"Foo": Output(Value=1, Export={"Name": "Baz"})}),
+            Stack(Outputs={"Bar": Output(Value=2, Export={"Name": "Baz"})}),
+        ]
+
+        # Exercise & Verify
+        with pytest.raises(StackMergeError) as excinfo:
+            Stack().merge_all(sources)
+
+        assert "both have exports named Baz" in str(excinfo.value)
+
+    def test_cannot_merge_if_metadata_is_used_in_two_other_stacks(self):
+        # Setup
+        sources = [Stack(Metadata={"Foo": 1}), Stack(Metadata={"Foo": 2})]
+
+        # Exercise & Verify
+        with pytest.raises(StackMergeError) as excinfo:
+            Stack().merge_all(sources)
+
+        assert "Metadata in other stack 1 and other stack 2" in str(excinfo.value)
+
+    def test_flying_circus_metadata_does_not_conflict(self):
+        Stack().merge_all([Stack(), Stack()])
+
+    def test_cannot_merge_if_two_other_stacks_have_different_transforms(self):
+        # Setup
+        sources = [
+            self._create_stack("Foo"),
+            self._create_stack("Bar", Transform="AWS::Serverless-2016-10-31"),
+            self._create_stack("Baz", Transform="AWS::Serverless-2000-01-01"),
+        ]
+
+        # Exercise & Verify
+        with pytest.raises(StackMergeError) as excinfo:
+            Stack().merge_all(sources)
+
+        assert "transform version of other stack 3" in str(excinfo.value).lower()
+        assert "different to other stack 2" in str(excinfo.value)
+
 
 class TestPrefixedNames:
     """Verify the object name prefixing functionality."""
@@ -633,6 +1140,135 @@ class TestPrefixedNames:
         assert new_output.Export == {}
 
 
+class TestPrefixedView:
+    """Verify the lazy view of a stack with prefixed names."""
+
+    STACK_PREFIX = "NewScope"
+
+    def _create_stack(self):
+        return Stack(
+            Description="Some stack",
+            Resources={"Foo": SimpleResource()},
+            Parameters={"Bar": Parameter(Type="String")},
+            Outputs={"Baz": Output(Value=42, Export={"Name": "Exported"})},
+        )
+
+    def test_view_has_same_content_as_prefixed_stack(self):
+        # Setup
+        stack = self._create_stack()
+
+        # Exercise
+        view = stack.prefixed_view(self.STACK_PREFIX)
+        prefixed = stack.with_prefixed_names(self.STACK_PREFIX)
+
+        # Verify
+        assert view.Description == prefixed.Description
+        for item_type in ["Resources", "Parameters"]:
+            assert dict(view[item_type]) == dict(prefixed[item_type])
+        assert list(view.Outputs) == list(prefixed.Outputs)
+        assert view.Outputs.get_export_names() == {"NewScopeExported"}
+
+    @pytest.mark.parametrize(
+        "prefix", ["", "lowercase", "Special-Characters", "A¹", 42, None]
+    )
+    def test_prefix_is_checked(self, prefix):
+        with pytest.raises((TypeError, ValueError)):
+            Stack().prefixed_view(prefix)
+
+    def test_view_reflects_later_changes_to_stack(self):
+        # Setup
+        stack = self._create_stack()
+        view = stack.prefixed_view(self.STACK_PREFIX)
+        resource = SimpleResource()
+
+        # Exercise
+        stack.Resources["Qux"] = resource
+
+        # Verify
+        assert view.Resources["NewScopeQux"] is resource
+        assert len(view.Resources) == 2
+
+    def test_names_must_have_the_prefix(self):
+        view = self._create_stack().prefixed_view(self.STACK_PREFIX)
+
+        assert "Foo" not in view.Resources
+        assert "NewScopeFoo" in view.Resources
+        with pytest.raises(KeyError):
+            _ = view.Resources["Foo"]
+
+    def test_view_is_read_only(self):
+        view = self._create_stack().prefixed_view(self.STACK_PREFIX)
+
+        with pytest.raises(TypeError):
+            view.Resources["NewScopeQux"] = SimpleResource()
+
+    def test_output_is_copied_once_when_it_is_used(self):
+        # Setup
+        stack = self._create_stack()
+        view = stack.prefixed_view(self.STACK_PREFIX)
+
+        # Exercise
+        output = view.Outputs["NewScopeBaz"]
+
+        # Verify
+        assert output is not stack.Outputs["Baz"]
+        assert output.Export == {"Name": "NewScopeExported"}
+        assert stack.Outputs["Baz"].Export == {"Name": "Exported"}
+        assert view.Outputs["NewScopeBaz"] is output
+
+    def test_output_is_copied_again_when_it_is_replaced(self):
+        # Setup
+        stack = self._create_stack()
+        view = stack.prefixed_view(self.STACK_PREFIX)
+        old_output = view.Outputs["NewScopeBaz"]
+
+        # Exercise
+        stack.Outputs["Baz"] = Output(Value=0)
+
+        # Verify
+        assert view.Outputs["NewScopeBaz"] is not old_output
+        assert view.Outputs["NewScopeBaz"].Value == 0
+
+    def test_view_can_be_merged(self):
+        # Setup
+        stack = self._create_stack()
+        target = Stack()
+
+        # Exercise
+        target.merge_stack(stack.prefixed_view(self.STACK_PREFIX))
+
+        # Verify
+        assert target.Resources["NewScopeFoo"] is stack.Resources["Foo"]
+        assert target.Parameters["NewScopeBar"] is stack.Parameters["Bar"]
+        assert target.Outputs["NewScopeBaz"].Export == {"Name": "NewScopeExported"}
+        assert target.Outputs.find_by_export_name("NewScopeExported") == ["NewScopeBaz"]
+
+    def test_views_with_different_prefixes_can_be_merged(self):
+        # Setup
+        stack = self._create_stack()
+        target = Stack()
+
+        # Exercise
+        target.merge_all([stack.prefixed_view("One"), stack.prefixed_view("Two")])
+
+        # Verify
+        assert set(target.Resources) == {"OneFoo", "TwoFoo"}
+        assert target.Outputs.get_export_names() == {"OneExported", "TwoExported"}
+
+    def test_prefixed_export_names_are_checked_when_merging(self):
+        # Setup
+        stack = self._create_stack()
+        target = Stack(
+            Outputs={"Other": Output(Value=1, Export={"Name": "NewScopeExported"})}
+        )
+
+        # Exercise & Verify
+        with pytest.raises(StackMergeError) as excinfo:
+            target.merge_stack(stack.prefixed_view(self.STACK_PREFIX))
+
+        assert "the target stack already has exports" in str(excinfo.value).lower()
+
+
 class TestTagStack(BaseTaggingTest):
     """Test recursive tagging for stack objects."""
 
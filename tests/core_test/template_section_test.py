@@ -0,0 +1,392 @@
+"""Tests for the TemplateSection mapping used in Stacks."""
+
+import copy
+import pickle
+
+import pytest
+
+from flyingcircus.core import Output
+from flyingcircus.core import Parameter
+from flyingcircus.core import Resource
+from flyingcircus.core import Stack
+from flyingcircus.core import TemplateSection
+from .common import FullResource
+from .common import SimpleResource
+
+
+class TestDictionaryBehaviour:
+    """Verify that a TemplateSection can be used like a normal dictionary."""
+
+    def test_is_a_dictionary(self):
+        section = TemplateSection(Foo=1)
+
+        assert isinstance(section, dict)
+        assert section == {"Foo": 1}
+
+    def test_can_be_created_from_a_dictionary_and_keywords(self):
+        section = TemplateSection({"Foo": 1}, Bar=2)
+
+        assert section == {"Foo": 1, "Bar": 2}
+
+    def test_retains_insertion_order(self):
+        section = TemplateSection()
+        section["Foo"] = 1
+        section["Bar"] = 2
+        section["Baz"] = 3
+
+        assert list(section) == ["Foo", "Bar", "Baz"]
+
+    def test_copy_is_an_independent_template_section(self):
+        data = SimpleResource()
+        section = TemplateSection(Foo=data)
+
+        result = section.copy()
+        del section["Foo"]
+
+        assert isinstance(result, TemplateSection)
+        assert result.get_names(data) == ["Foo"]
+
+    @pytest.mark.parametrize(
+        "duplicate", [copy.copy, lambda x: pickle.loads(pickle.dumps(x))]
+    )
+    def test_duplicate_has_indexes(self, duplicate):
+        section = TemplateSection(Foo=Output(Value=1, Export={"Name": "Bar"}))
+
+        result = duplicate(section)
+
+        assert isinstance(result, TemplateSection)
+        assert result.get_names(result["Foo"]) == ["Foo"]
+        assert result.find_by_export_name("Bar") == ["Foo"]
+
+    def test_update_accepts_pairs(self):
+        data = SimpleResource()
+        section = TemplateSection()
+
+        section.update([("Foo", data)], Bar=1)
+
+        assert section == {"Foo": data, "Bar": 1}
+        assert section.get_names(data) == ["Foo"]
+
+    def test_update_accepts_a_single_positional_argument(self):
+        with pytest.raises(TypeError):
+            TemplateSection().update({}, {})
+
+    def test_in_place_union_updates_indexes(self):
+        data = SimpleResource()
+        section = TemplateSection()
+
+        section |= {"Foo": data}
+
+        assert section.get_names(data) == ["Foo"]
+
+
+class TestLogicalNameValidation:
+    """Verify that logical names are checked when an item is added."""
+
+    @pytest.mark.parametrize("name", ["Foo", "foo", "Foo123", "Foo_Bar", "1"])
+    def test_valid_names_are_accepted(self, name):
+        section = TemplateSection()
+
+        section[name] = 42
+
+        assert section[name] == 42
+
+    @pytest.mark.parametrize("name", ["", "Foo-Bar", "Foo Bar", "Foo::Bar", "A¹"])
+    def test_invalid_names_are_rejected(self, name):
+        section = TemplateSection()
+
+        with pytest.raises(ValueError, match="Logical name"):
+            section[name] = 42
+
+        assert name not in section
+
+    def test_non_string_names_are_rejected(self):
+        section = TemplateSection()
+
+        with pytest.raises(TypeError, match="Logical name"):
+            section[42] = 42
+
+    def test_names_are_checked_in_constructor(self):
+        with pytest.raises(ValueError, match="Logical name"):
+            TemplateSection({"Foo-Bar": 42})
+
+    def test_names_are_checked_when_assigned_to_stack(self):
+        with pytest.raises(ValueError, match="Logical name"):
+            Stack(Resources={"Foo-Bar": SimpleResource()})
+
+
+class TestIdentityIndex:
+    """Verify the index from objects to their logical names."""
+
+    def test_object_is_found_after_it_is_added(self):
+        data = SimpleResource()
+        section = TemplateSection()
+
+        section["Foo"] = data
+
+        assert section.get_names(data) == ["Foo"]
+
+    def test_equal_objects_are_not_found(self):
+        section = TemplateSection(Foo={})
+
+        assert section.get_names({}) == []
+
+    def test_object_is_not_found_after_it_is_replaced(self):
+        data = SimpleResource()
+        section = TemplateSection(Foo=data)
+
+        section["Foo"] = SimpleResource()
+
+        assert section.get_names(data) == []
+
+    @pytest.mark.parametrize(
+        "remove",
+        [
+            lambda section: section.__delitem__("Foo"),
+            lambda section: section.pop("Foo"),
+            lambda section: section.popitem(),
+            lambda section: section.clear(),
+        ],
+    )
+    def test_object_is_not_found_after_it_is_removed(self, remove):
+        data = SimpleResource()
+        section = TemplateSection(Foo=data)
+
+        remove(section)
+
+        assert section.get_names(data) == []
+
+    def test_pop_uses_default_for_missing_item(self):
+        section = TemplateSection()
+
+        assert section.pop("Foo", 42) == 42
+
+    def test_pop_fails_for_missing_item(self):
+        section = TemplateSection()
+
+        with pytest.raises(KeyError):
+            section.pop("Foo")
+
+    def test_object_is_found_after_setdefault(self):
+        data = SimpleResource()
+        section = TemplateSection()
+
+        assert section.setdefault("Foo", data) is data
+        assert section.setdefault("Foo", SimpleResource()) is data
+        assert section.get_names(data) == ["Foo"]
+
+    def test_duplicated_object_has_all_names(self):
+        data = SimpleResource()
+        section = TemplateSection()
+
+        section["Foo"] = data
+        section["Bar"] = data
+
+        assert section.get_names(data) == ["Foo", "Bar"]
+
+    def test_removing_one_duplicate_keeps_the_other(self):
+        data = SimpleResource()
+        section = TemplateSection(Foo=data, Bar=data)
+
+        del section["Foo"]
+
+        assert section.get_names(data) == ["Bar"]
+
+    def test_returned_names_are_a_copy(self):
+        data = SimpleResource()
+        section = TemplateSection(Foo=data)
+
+        section.get_names(data).append("Bar")
+
+        assert section.get_names(data) == ["Foo"]
+
+
+class TestRename:
+    """Verify renaming an item in a TemplateSection."""
+
+    def test_object_is_found_with_new_name(self):
+        data = SimpleResource()
+        section = TemplateSection(Foo=data)
+
+        section.rename("Foo", "Bar")
+
+        assert section.get_names(data) == ["Bar"]
+        assert section == {"Bar": data}
+
+    def test_position_is_retained(self):
+        section = TemplateSection(One=1, Two=2, Three=3)
+
+        section.rename("Two", "Deux")
+
+        assert list(section.items()) == [("One", 1), ("Deux", 2), ("Three", 3)]
+
+    def test_missing_item_cannot_be_renamed(self):
+        section = TemplateSection()
+
+        with pytest.raises(KeyError):
+            section.rename("Foo", "Bar")
+
+    def test_cannot_rename_to_an_existing_name(self):
+        section = TemplateSection(Foo=1, Bar=2)
+
+        with pytest.raises(KeyError, match="Bar"):
+            section.rename("Foo", "Bar")
+
+        assert section == {"Foo": 1, "Bar": 2}
+
+    def test_new_name_is_checked(self):
+        section = TemplateSection(Foo=1)
+
+        with pytest.raises(ValueError, match="Logical name"):
+            section.rename("Foo", "Foo-Bar")
+
+        assert section == {"Foo": 1}
+
+
+class TestTypeIndex:
+    """Verify finding objects by their type."""
+
+    def test_objects_are_found_by_exact_type(self):
+        simple = SimpleResource()
+        section = TemplateSection(Foo=simple, Bar=FullResource())
+
+        assert list(section.find_by_type(SimpleResource)) == [("Foo", simple)]
+
+    def test_objects_are_found_by_base_class(self):
+        simple = SimpleResource()
+        full = FullResource()
+        section = TemplateSection(Foo=simple, Bar=full, Baz=Parameter(Type="String"))
+
+        result = dict(section.find_by_type(Resource))
+
+        assert result == {"Foo": simple, "Bar": full}
+
+    def test_removed_objects_are_not_found(self):
+        section = TemplateSection(Foo=SimpleResource())
+
+        del section["Foo"]
+
+        assert list(section.find_by_type(SimpleResource)) == []
+
+    def test_section_can_be_modified_while_searching(self):
+        section = TemplateSection(Foo=SimpleResource(), Bar=SimpleResource())
+
+        for name, _ in section.find_by_type(SimpleResource):
+            section[name + "Copy"] = SimpleResource()
+
+        assert len(section) == 4
+
+
+class TestExportNameIndex:
+    """Verify finding Outputs by their export name."""
+
+    def test_output_is_found_by_export_name(self):
+        section = TemplateSection(Foo=Output(Value=1, Export={"Name": "Bar"}))
+
+        assert section.find_by_export_name("Bar") == ["Foo"]
+        assert section.get_export_names() == {"Bar"}
+
+    @pytest.mark.parametrize(
+        "output",
+        [Output(Value=1), Output(Value=1, Export={}), SimpleResource(), {}, 42],
+    )
+    def test_objects_without_an_export_name_are_ignored(self, output):
+        section = TemplateSection(Foo=output)
+
+        assert section.get_export_names() == set()
+
+    def test_removed_output_is_not_found(self):
+        section = TemplateSection(Foo=Output(Value=1, Export={"Name": "Bar"}))
+
+        del section["Foo"]
+
+        assert section.find_by_export_name("Bar") == []
+        assert section.get_export_names() == set()
+
+    def test_duplicated_export_names_are_all_found(self):
+        section = TemplateSection(
+            Foo=Output(Value=1, Export={"Name": "Baz"}),
+            Bar=Output(Value=2, Export={"Name": "Baz"}),
+        )
+
+        assert section.find_by_export_name("Baz") == ["Foo", "Bar"]
+
+    def test_changed_export_name_is_found(self):
+        section = TemplateSection(Foo=Output(Value=1, Export={"Name": "Bar"}))
+
+        section["Foo"].Export = {"Name": "Baz"}
+
+        assert section.find_by_export_name("Bar") == []
+        assert section.find_by_export_name("Baz") == ["Foo"]
+        assert section.get_export_names() == {"Baz"}
+
+    @pytest.mark.parametrize("looked_up", [False, True])
+    def test_output_with_changed_export_name_can_be_removed(self, looked_up):
+        section = TemplateSection(Foo=Output(Value=1, Export={"Name": "Bar"}))
+        section["Foo"].Export["Name"] = "Baz"
+        if looked_up:
+            section.get_export_names()
+
+        del section["Foo"]
+
+        assert section == {}
+        assert section.get_export_names() == set()
+
+    def test_output_with_changed_export_name_can_be_added_again(self):
+        output = Output(Value=1, Export={"Name": "Bar"})
+        section = TemplateSection(Foo=output)
+        output.Export["Name"] = "Baz"
+
+        section["Foo"] = output
+
+        assert section.find_by_export_name("Bar") == []
+        assert section.find_by_export_name("Baz") == ["Foo"]
+
+    def test_long_form_function_export_name_is_not_indexed(self):
+        section = TemplateSection()
+
+        section["Foo"] = Output(Value="x", Export={"Name": {"Fn::Sub": "a"}})
+
+        assert section.get_export_names() == set()
+        assert section.get_names(section["Foo"]) == ["Foo"]
+
+        del section["Foo"]
+        assert section == {}
+
+
+class TestStackSections:
+    """Verify that a Stack uses TemplateSection for the relevant attributes."""
+
+    @pytest.mark.parametrize("section", ["Resources", "Parameters", "Outputs"])
+    def test_section_is_created_by_default(self, section):
+        stack = Stack()
+
+        assert isinstance(stack[section], TemplateSection)
+
+    @pytest.mark.parametrize("section", ["Resources", "Parameters", "Outputs"])
+    def test_dictionary_is_converted_when_assigned(self, section):
+        data = SimpleResource()
+        stack = Stack()
+
+        setattr(stack, section, {"Foo": data})
+
+        assert isinstance(stack[section], TemplateSection)
+        assert stack[section].get_names(data) == ["Foo"]
+
+    def test_existing_section_is_not_copied_when_assigned(self):
+        section = TemplateSection()
+        stack = Stack()
+
+        stack.Resources = section
+
+        assert stack.Resources is section
+
+    def test_stack_can_be_exported(self):
+        stack = Stack(Resources={"Foo": SimpleResource()})
+        del stack.Metadata["FlyingCircus"]
+
+        assert stack.to_dict() == {
+            "AWSTemplateFormatVersion": "2010-09-09",
+            "Resources": {"Foo": {"Type": "NameSpace::Service::SimpleResource"}},
+        }
+        assert "Foo:" in stack.export("yaml")
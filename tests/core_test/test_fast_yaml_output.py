@@ -0,0 +1,160 @@
+"""Tests for YAML output using the LibYAML dumper."""
+
+import io
+import os.path
+
+import pytest
+
+from flyingcircus.core import AWS_Region
+from flyingcircus.core import EMPTY_DICT
+from flyingcircus.core import EMPTY_LIST
+from flyingcircus.core import Output
+from flyingcircus.core import Parameter
+from flyingcircus.core import Stack
+from flyingcircus.intrinsic_function import Base64
+from flyingcircus.intrinsic_function import GetAZs
+from flyingcircus.intrinsic_function import GetAtt
+from flyingcircus.intrinsic_function import ImportValue
+from flyingcircus.intrinsic_function import Join
+from flyingcircus.intrinsic_function import Ref
+from flyingcircus.intrinsic_function import Sub
+from flyingcircus.yaml import AmazonCFNCDumper
+from flyingcircus.yaml import AmazonCFNDumper
+from flyingcircus.yaml import FastAmazonCFNDumper
+from .common import FullResource
+from .common import LOREM_IPSUM
+from .common import SimpleResource
+
+GOLDEN_TEMPLATE = os.path.join(os.path.dirname(__file__), "data", "golden_stack.yaml")
+
+requires_libyaml = pytest.mark.skipif(
+    AmazonCFNCDumper is None, reason="PyYAML was built without LibYAML support"
+)
+
+
+def _create_golden_stack() -> Stack:
+    """Create a stack that exercises all of our YAML output customisations."""
+    stack = Stack(AWSTemplateFormatVersion="2010-09-09", Description="A golden stack")
+    # Don't break the golden template whenever the version number changes
+    del stack.Metadata["FlyingCircus"]
+
+    stack.Parameters["Environment"] = Parameter(
+        Type="String", Default="test", AllowedValues=["test", "prod"]
+    )
+
+    shared_tags = [{"Key": "Owner", "Value": "Ministry of Silly Walks"}]
+
+    first = SimpleResource()
+    first.Properties.props = {
+        "Strings": ["plain", "with: colon", "it's", "'quoted'", "", "1.5", "true"],
+        "Numbers": [0, -1, 4.2, 1e100],
+        "Booleans": [True, False],
+        "LongString": "x" * 80,
+        "MultiLine": LOREM_IPSUM,
+        "Unicode": "Dinsdale Piranha ✈ ünïcödé",
+        "Empty": {"List": [], "Dict": {}, "Value": None},
+        "EmptySignals": {"List": EMPTY_LIST, "Dict": EMPTY_DICT},
+        "Tags": shared_tags,
+    }
+    first.Properties.kudos = Base64(Sub("#!/bin/bash\necho ${AWS::Region}\n"))
+    stack.Resources["First"] = first
+
+    second = FullResource(DependsOn=["First"], DeletionPolicy="Retain")
+    second.Properties.props = {
+        "Ref": Ref(first),
+        "Parameter": Ref(stack.Parameters["Environment"]),
+        "Pseudo": Ref(AWS_Region),
+        "GetAtt": GetAtt(first, "Some", "Attribute"),
+        "GetAttWithRef": GetAtt(first, Ref(stack.Parameters["Environment"])),
+        "GetAZs": GetAZs(),
+        "GetAZsWithRegion": GetAZs("us-east-1"),
+        "ImportValue": ImportValue("SharedExport"),
+        "Join": Join(",", "a", Ref(first), "c"),
+        "Sub": Sub("${AWS::StackName}-bucket"),
+        "SubWithVariables": Sub("${Name}-${Env}", Name="fish", Env=Ref(first)),
+        "Tags": shared_tags,
+    }
+    second.Properties.kudos = shared_tags
+    stack.Resources["Second"] = second
+
+    stack.Outputs["FirstName"] = Output(
+        Value=Ref(first), Export={"Name": Sub("${AWS::StackName}-First")}
+    )
+
+    return stack
+
+
+class TestGoldenTemplate:
+    """Verify that every dumper produces exactly the same output."""
+
+    @pytest.fixture
+    def expected(self):
+        with open(GOLDEN_TEMPLATE, encoding="utf-8") as fp:
+            return fp.read()
+
+    def test_python_dumper_matches_golden_template(self, expected):
+        assert _create_golden_stack().export("yaml") == expected
+
+    @requires_libyaml
+    def test_libyaml_dumper_matches_golden_template(self, expected):
+        assert _create_golden_stack().export("yaml", fast=True) == expected
+
+    @requires_libyaml
+    def test_libyaml_dumper_matches_golden_template_in_file(self, expected):
+        fp = io.StringIO()
+
+        _create_golden_stack().export_to_file(fp, "yaml", fast=True)
+
+        assert fp.getvalue() == expected
+
+
+class TestFastDumper:
+    """Verify selection and behaviour of the fastest available dumper."""
+
+    def test_libyaml_dumper_is_preferred_when_available(self):
+        if AmazonCFNCDumper is None:
+            assert FastAmazonCFNDumper is AmazonCFNDumper
+        else:
+            assert FastAmazonCFNDumper is AmazonCFNCDumper
+
+    @requires_libyaml
+    def test_repeated_objects_are_not_aliased(self):
+        resource = SimpleResource()
+        resource.Properties.props = {"Nested": {"Value": 42}}
+        resource.Properties.kudos = resource.Properties.props
+        stack = Stack(Resources={"Foo": resource})
+
+        output = stack.export("yaml", fast=True)
+
+        assert "&" not in output
+        assert "*" not in output
+        assert output == stack.export("yaml")
+
+    @requires_libyaml
+    def test_stack_is_initialised_to_none(self):
+        dumper = AmazonCFNCDumper(io.StringIO())
+
+        assert dumper.cfn_stack is None
+
+    @requires_libyaml
+    def test_stack_must_be_a_stack_object(self):
+        dumper = AmazonCFNCDumper(io.StringIO())
+
+        with pytest.raises(TypeError, match="must be a Stack"):
+            dumper.cfn_stack = SimpleResource()
+
+    @requires_libyaml
+    def test_stack_cannot_be_set_when_it_is_already_set(self):
+        dumper = AmazonCFNCDumper(io.StringIO())
+        dumper.cfn_stack = Stack()
+
+        with pytest.raises(RuntimeError, match="already set"):
+            dumper.cfn_stack = Stack()
+
+    @requires_libyaml
+    def test_unknown_types_are_rejected(self):
+        stack = Stack(Resources={"Foo": SimpleResource()})
+        stack.Resources["Foo"].Properties.props = object()
+
+        with pytest.raises(TypeError, match="CustomYamlObject"):
+            stack.export("yaml", fast=True)
@@ -0,0 +1,161 @@
+"""Tests for JSON output from the AWSObject base class."""
+
+import io
+import json
+
+import pytest
+import yaml
+
+from flyingcircus.core import EMPTY_DICT
+from flyingcircus.core import EMPTY_LIST
+from flyingcircus.core import Stack
+from flyingcircus.core import dedent
+from flyingcircus.intrinsic_function import GetAtt
+from flyingcircus.intrinsic_function import Ref
+from .common import DualAttributeObject
+from .common import FullResource
+from .common import MixedAttributeObject
+from .common import SimpleResource
+from .common import SingleAttributeObject
+
+
+class TestJsonAttributeExport:
+    """Verify all relevant attributes are exported to JSON"""
+
+    def test_aws_attributes_are_exported_when_set(self):
+        data = SingleAttributeObject(one=42)
+
+        output = data.export("json")
+
+        assert output == dedent("""
+            {
+              "one": 42
+            }
+            """)
+
+    def test_aws_attributes_are_not_exported_when_set_to_none(self):
+        data = DualAttributeObject(one=42, two=15)
+        data.two = None
+
+        output = data.export("json")
+
+        assert json.loads(output) == {"one": 42}
+
+    def test_internal_attributes_are_not_exported(self):
+        data = MixedAttributeObject(one=42, a="nope")
+
+        output = data.export("json")
+
+        assert json.loads(output) == {"one": 42}
+
+    def test_empty_signal_values_are_exported(self):
+        data = DualAttributeObject(one=EMPTY_LIST, two=EMPTY_DICT)
+
+        output = data.export("json")
+
+        assert json.loads(output) == {"one": [], "two": {}}
+
+    def test_non_finite_numbers_are_rejected(self):
+        data = SingleAttributeObject(one=float("nan"))
+
+        with pytest.raises(ValueError):
+            data.export("json")
+
+
+class TestJsonFormatting:
+    """Verify the layout of exported JSON"""
+
+    def test_keys_are_in_cloudformation_order(self):
+        data = FullResource(DeletionPolicy="Retain", DependsOn=["Foo"])
+
+        output = data.export("json")
+
+        assert output == dedent("""
+            {
+              "Type": "NameSpace::Service::FullResource",
+              "DependsOn": [
+                "Foo"
+              ],
+              "DeletionPolicy": "Retain"
+            }
+            """)
+
+    def test_dictionary_keys_are_sorted(self):
+        data = DualAttributeObject(one={"b": 1, "a": {"d": 2, "c": 3}}, two=None)
+
+        output = data.export("json", compact=True)
+
+        assert output == '{"one":{"a":{"c":3,"d":2},"b":1}}\n'
+
+    def test_keys_are_in_the_same_order_as_yaml(self):
+        stack = Stack(
+            Description="Example",
+            Resources=dict(
+                Zebra=SimpleResource(),
+                Aardvark=DualAttributeObject(
+                    one={"b": 1, "a": 2}, two=[{"y": 1, "x": 2}]
+                ),
+            ),
+        )
+        stack.Metadata["Zzz"] = "last"
+        stack.Metadata["Aaa"] = "first"
+
+        yaml_data = yaml.safe_load(stack.export("yaml"))
+        json_data = json.loads(stack.export("json"))
+
+        assert json.dumps(json_data) == json.dumps(yaml_data)
+
+    def test_compact_output_has_no_whitespace(self):
+        data = DualAttributeObject(one=[1, 2], two={"a": "b c"})
+
+        output = data.export("json", compact=True)
+
+        assert output == '{"one":[1,2],"two":{"a":"b c"}}\n'
+
+    def test_intrinsic_functions_use_long_form(self):
+        resource = SimpleResource()
+        stack = Stack(
+            Resources=dict(
+                Res=resource,
+                Target=DualAttributeObject(
+                    one=Ref(resource), two=GetAtt(resource, "Arn")
+                ),
+            )
+        )
+        del stack.Metadata
+
+        output = stack.export("json", compact=True)
+
+        assert json.loads(output)["Resources"]["Target"] == {
+            "one": {"Ref": "Res"},
+            "two": {"Fn::GetAtt": ["Res", "Arn"]},
+        }
+
+    def test_output_is_deterministic(self):
+        def create_stack():
+            stack = Stack()
+            for i in range(20):
+                stack.Resources["Res{}".format(i)] = SimpleResource()
+            return stack
+
+        assert create_stack().export("json") == create_stack().export("json")
+
+
+class TestExportToFile:
+    """Verify behaviour of exporting directly to a file object"""
+
+    @pytest.mark.parametrize("format", ["json", "yaml"])
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_file_output_is_the_same_as_string_output(self, format, compact):
+        data = Stack(Resources=dict(Foo=SimpleResource()))
+        fp = io.StringIO()
+
+        data.export_to_file(fp, format, compact=compact)
+
+        assert fp.getvalue() == data.export(format, compact=compact)
+
+    def test_unknown_format_is_rejected(self):
+        data = SingleAttributeObject(one=42)
+
+        with pytest.raises(ValueError, match="xml"):
+            data.export_to_file(io.StringIO(), "xml")
@@ -0,0 +1,166 @@
+"""Tests for finding the differences between stacks."""
+
+import copy
+import json
+
+import pytest
+
+from flyingcircus import diff
+from flyingcircus import difference
+from flyingcircus.core import EMPTY_LIST
+from flyingcircus.difference import ADDED
+from flyingcircus.difference import Change
+from flyingcircus.difference import MODIFIED
+from flyingcircus.difference import REMOVED
+from .core_test.common import SimpleResource
+from .core_test.common import create_example_stack
+
+
+class TestDiff:
+    """Verify the changes found between two stacks."""
+
+    def test_equivalent_stacks_have_no_changes(self):
+        assert diff(create_example_stack(), create_example_stack()) == []
+
+    def test_modified_property(self):
+        new = create_example_stack()
+        new.Resources["Foo"].Properties.props["Size"] = 20
+
+        assert diff(create_example_stack(), new) == [
+            Change(
+                MODIFIED, ("Resources", "Foo", "Properties", "props", "Size"), 42, 20
+            )
+        ]
+
+    def test_added_and_removed_items(self):
+        new = create_example_stack()
+        new.Resources["Qux"] = new.Resources.pop("Bar")
+
+        assert diff(create_example_stack(), new) == [
+            Change(
+                REMOVED,
+                ("Resources", "Bar"),
+                old={"DependsOn": ["Foo"], "Type": "NameSpace::Service::FullResource"},
+            ),
+            Change(
+                ADDED,
+                ("Resources", "Qux"),
+                new={"DependsOn": ["Foo"], "Type": "NameSpace::Service::FullResource"},
+            ),
+        ]
+
+    def test_added_attribute(self):
+        new = create_example_stack()
+        new.Resources["Bar"].DeletionPolicy = "Retain"
+
+        assert diff(create_example_stack(), new) == [
+            Change(ADDED, ("Resources", "Bar", "DeletionPolicy"), new="Retain")
+        ]
+
+    def test_list_items_are_compared_by_position(self):
+        new = create_example_stack()
+        new.Resources["Foo"].Properties.props["Items"] = ["a", "c", "d"]
+
+        path = ("Resources", "Foo", "Properties", "props", "Items")
+        assert diff(create_example_stack(), new) == [
+            Change(MODIFIED, path + (1,), "b", "c"),
+            Change(ADDED, path + (2,), new="d"),
+        ]
+
+    def test_renamed_reference_is_a_change(self):
+        new = create_example_stack()
+        new.Resources.rename("Foo", "Renamed")
+
+        changes = diff(create_example_stack(), new)
+
+        assert (
+            Change(MODIFIED, ("Outputs", "Baz", "Value", "Ref"), "Foo", "Renamed")
+            in changes
+        )
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [(1, 1.0), (1, True), ("1", 1), ([1], {"0": 1})],
+        ids=["int-float", "int-bool", "str-int", "list-dict"],
+    )
+    def test_different_types_are_a_change(self, old, new):
+        assert diff({"Foo": old}, {"Foo": new}) == [
+            Change(MODIFIED, ("Foo",), old, new)
+        ]
+
+    def test_empty_values_are_ignored(self):
+        new = create_example_stack()
+        new.Resources["Bar"].Properties.props = []
+
+        assert diff(create_example_stack(), new) == []
+
+    def test_empty_signal_value_is_a_change(self):
+        new = create_example_stack()
+        new.Resources["Bar"].Properties.props = EMPTY_LIST
+
+        assert diff(create_example_stack(), new) == [
+            Change(ADDED, ("Resources", "Bar", "Properties"), new={"props": []})
+        ]
+
+    def test_deeply_nested_empty_values_are_ignored(self):
+        empty = []
+        for _ in range(5000):
+            empty = [{"Foo": empty}]
+
+        assert diff({"Foo": 1, "Bar": empty}, {"Foo": 1}) == []
+
+    def test_emptiness_of_each_value_is_only_examined_once(self, monkeypatch):
+        nested = {"Value": 1}
+        for _ in range(50):
+            nested = {"Nested": [nested]}
+        examined = []
+        original = difference._iterate_children
+
+        def iterate_children(value):
+            examined.append(id(value))
+            return original(value)
+
+        monkeypatch.setattr(difference, "_iterate_children", iterate_children)
+        diff({"Foo": nested, "Bar": 1}, {"Foo": copy.deepcopy(nested), "Bar": 2})
+
+        assert examined
+        assert len(examined) == len(set(examined))
+
+    def test_stack_can_be_compared_with_a_template(self):
+        # Plain data can't distinguish the signal values for exporting empty
+        # data from other empty values
+        old = create_example_stack()
+        del old.Resources["Foo"].Properties.props["Signals"]
+        template = json.loads(old.export("json"))
+        new = create_example_stack()
+        del new.Resources["Foo"].Properties.props["Signals"]
+        new.Description = "Changed"
+
+        assert diff(template, new) == [
+            Change(MODIFIED, ("Description",), "A stack", "Changed")
+        ]
+        assert diff(new, template) == [
+            Change(MODIFIED, ("Description",), "Changed", "A stack")
+        ]
+
+    def test_objects_with_the_same_fingerprint_are_not_examined(self, monkeypatch):
+        old = create_example_stack()
+        new = create_example_stack()
+        new.Description = "Changed"
+        examined = []
+        original = difference._Side.get_plain_value
+
+        def get_plain_value(self, value):
+            examined.append(value)
+            return original(self, value)
+
+        monkeypatch.setattr(difference._Side, "get_plain_value", get_plain_value)
+        changes = diff(old, new)
+
+        assert changes == [Change(MODIFIED, ("Description",), "A stack", "Changed")]
+        assert not any(isinstance(value, SimpleResource) for value in examined)
+
+    def test_change_is_described_by_its_path(self):
+        change = Change(MODIFIED, ("Resources", "Foo", "Properties", "Items", 1))
+
+        assert str(change) == "modified Resources.Foo.Properties.Items.1"
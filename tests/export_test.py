@@ -0,0 +1,242 @@
+"""Tests for exporting stacks efficiently."""
+
+import pickle
+
+import pytest
+from attr import attrib
+from attr import attrs
+
+import flyingcircus.export
+from flyingcircus import export_many
+from flyingcircus import fingerprint as fingerprint_module
+from flyingcircus.core import ATTRSCONFIG
+from flyingcircus.core import EMPTY_DICT
+from flyingcircus.core import EMPTY_LIST
+from flyingcircus.core import Resource
+from flyingcircus.core import Stack
+from flyingcircus.export import IncrementalExporter
+from .core_test.common import SimpleResource
+from .core_test.common import SimpleResourceProperties
+from .core_test.common import create_example_stack
+
+
+class TestPickling:
+    """Verify that stacks can be transferred to another process."""
+
+    def test_references_are_resolved_after_unpickling(self):
+        stack = create_example_stack(1)
+
+        result = pickle.loads(pickle.dumps(stack))
+
+        assert result.export("yaml") == stack.export("yaml")
+        assert result.export("json") == stack.export("json")
+
+    @pytest.mark.parametrize("signal", [EMPTY_LIST, EMPTY_DICT])
+    def test_empty_signal_values_are_singletons(self, signal):
+        assert pickle.loads(pickle.dumps(signal)) is signal
+
+
+class TestExportMany:
+    """Verify exporting many stacks using a process pool."""
+
+    @pytest.mark.parametrize("format", ["yaml", "json"])
+    def test_templates_are_returned_in_input_order(self, format):
+        stacks = [create_example_stack(i) for i in range(5)]
+
+        result = export_many(stacks, workers=2, format=format)
+
+        assert result == [stack.export(format) for stack in stacks]
+
+    def test_export_options_are_used(self):
+        stacks = [create_example_stack(i) for i in range(2)]
+
+        result = export_many(stacks, workers=2, format="json", compact=True)
+
+        assert result == [stack.export("json", compact=True) for stack in stacks]
+
+    def test_templates_are_written_to_files(self, tmp_path):
+        stacks = [create_example_stack(i) for i in range(3)]
+        paths = [str(tmp_path / "stack{}.yaml".format(i)) for i in range(3)]
+
+        result = export_many(stacks, workers=2, paths=paths)
+
+        assert result is None
+        for stack, path in zip(stacks, paths):
+            with open(path, encoding="utf-8") as fp:
+                assert fp.read() == stack.export("yaml")
+
+    def test_single_worker_exports_in_this_process(self):
+        # Locally defined classes can't be pickled, so this would fail in
+        # another process
+        @attrs(**ATTRSCONFIG)
+        class LocalResource(Resource):
+            RESOURCE_TYPE = "NameSpace::Service::LocalResource"
+            Properties: SimpleResourceProperties = attrib(
+                factory=SimpleResourceProperties
+            )
+
+        stack = Stack(Resources={"Foo": LocalResource()})
+
+        assert export_many([stack], workers=1) == [stack.export("yaml")]
+
+    def test_no_stacks(self):
+        assert export_many([]) == []
+
+    def test_unknown_format_is_rejected(self):
+        with pytest.raises(ValueError, match="format"):
+            export_many([Stack()], format="xml")
+
+    def test_paths_must_match_stacks(self, tmp_path):
+        with pytest.raises(ValueError, match="one path for each stack"):
+            export_many([Stack(), Stack()], paths=[str(tmp_path / "foo.yaml")])
+
+    def test_workers_must_be_positive(self):
+        with pytest.raises(ValueError, match="worker"):
+            export_many([Stack()], workers=0)
+
+
+#: Export options for each format, and each variant of that format
+EXPORT_OPTIONS = [
+    dict(format="yaml"),
+    dict(format="yaml", fast=True),
+    dict(format="json"),
+    dict(format="json", compact=True),
+]
+
+
+def _rename_parameter(stack):
+    stack.Parameters.rename("Param", "Renamed")
+
+
+def _modify_property(stack):
+    stack.Resources["Foo"].Properties.props["Size"] = 1000
+
+
+def _add_resource(stack):
+    stack.Resources["Added"] = SimpleResource()
+    stack.Resources["Added"].Properties.props = "x" * 70
+
+
+def _add_resource_before_others(stack):
+    stack.Resources["Aardvark"] = SimpleResource()
+
+
+def _remove_resource(stack):
+    del stack.Resources["Bar"]
+
+
+def _empty_output(stack):
+    stack.Outputs["Baz"].Value = None
+    stack.Outputs["Baz"].Export = None
+
+
+def _open_ended_value(stack):
+    stack.Resources["Bar"].Properties.props = "trailing\nnewlines\n\n"
+
+
+def _open_ended_value_in_middle(stack):
+    stack.Resources["Foo"].Properties.kudos = "trailing\nnewlines\n\n"
+
+
+def _change_description(stack):
+    stack.Description = "A long description which is " + "wrapped " * 20
+
+
+class TestIncrementalExporter:
+    """Verify exporting a stack repeatedly, re-using unchanged parts."""
+
+    @pytest.mark.parametrize("options", EXPORT_OPTIONS)
+    def test_first_export_is_the_same_as_a_full_export(self, options):
+        stack = create_example_stack(1)
+
+        result = IncrementalExporter(**options).export(stack)
+
+        assert result == stack.export(**options)
+
+    @pytest.mark.parametrize(
+        "modify",
+        [
+            _rename_parameter,
+            _modify_property,
+            _add_resource,
+            _add_resource_before_others,
+            _remove_resource,
+            _empty_output,
+            _open_ended_value,
+            _open_ended_value_in_middle,
+            _change_description,
+        ],
+    )
+    @pytest.mark.parametrize("options", EXPORT_OPTIONS)
+    def test_export_after_modification_is_the_same_as_a_full_export(
+        self, options, modify
+    ):
+        stack = create_example_stack(1)
+        exporter = IncrementalExporter(**options)
+        exporter.export(stack)
+
+        modify(stack)
+        result = exporter.export(stack)
+
+        assert result == stack.export(**options)
+
+    @pytest.mark.parametrize("options", EXPORT_OPTIONS)
+    def test_empty_stack(self, options):
+        stack = Stack(AWSTemplateFormatVersion=None, Metadata={})
+
+        result = IncrementalExporter(**options).export(stack)
+
+        assert result == stack.export(**options)
+
+    @pytest.mark.parametrize("format", ["yaml", "json"])
+    def test_only_changed_items_are_rendered_again(self, format, monkeypatch):
+        stack = create_example_stack(1)
+        exporter = IncrementalExporter(format=format)
+        exporter.export(stack)
+        rendered = []
+        renderer_class = (
+            flyingcircus.export._YamlRenderer
+            if format == "yaml"
+            else flyingcircus.export._JsonRenderer
+        )
+        original = renderer_class.render_item
+
+        def render_item(self, section_name, item_name, item):
+            rendered.append(item_name)
+            return original(self, section_name, item_name, item)
+
+        monkeypatch.setattr(renderer_class, "render_item", render_item)
+
+        stack.Resources["Bar"].DeletionPolicy = "Retain"
+        exporter.export(stack)
+
+        assert rendered == ["Bar"]
+
+    def test_unchanged_items_are_not_hashed_again(self, monkeypatch):
+        stack = create_example_stack()
+        exporter = IncrementalExporter()
+        hashed = []
+        original = fingerprint_module._hash
+
+        def counting_hash(data):
+            hashed.append(data[0])
+            return original(data)
+
+        monkeypatch.setattr(fingerprint_module, "_hash", counting_hash)
+        exporter.export(stack)
+        assert any(name.endswith(".FullResource") for name in hashed)
+        del hashed[:]
+
+        stack.Resources["Foo"].Properties.props["Size"] = 20
+        exporter.export(stack)
+
+        # Only the changed item is hashed again. The items that refer to it
+        # only check that it still has the same logical name.
+        assert sorted(name.rsplit(".", 1)[-1] for name in hashed) == [
+            "SimpleResource",
+            "SimpleResourceProperties",
+        ]
+
+    def test_unknown_format_is_rejected(self):
+        with pytest.raises(ValueError, match="format"):
+            IncrementalExporter(format="xml")
@@ -0,0 +1,283 @@
+"""Tests for content hashes of Flying Circus objects."""
+
+import pickle
+
+import attr
+import pytest
+
+from flyingcircus import fingerprint as fingerprint_module
+from flyingcircus.core import EMPTY_LIST
+from flyingcircus.core import Stack
+from flyingcircus.core import Tag
+from flyingcircus.fingerprint import fingerprint
+from flyingcircus.intrinsic_function import GetAtt
+from flyingcircus.intrinsic_function import Ref
+from flyingcircus.intrinsic_function import Sub
+from flyingcircus.service import ec2
+from .core_test.common import DualAttributeObject
+from .core_test.common import FullResource
+from .core_test.common import MixedAttributeObject
+from .core_test.common import NestedAttributeObject
+from .core_test.common import SimpleResource
+from .core_test.common import SingleAttributeObject
+from .core_test.common import create_example_stack
+
+
+class TestFingerprint:
+    """Verify the content hash of objects."""
+
+    def test_equivalent_stacks_have_the_same_fingerprint(self):
+        assert (
+            create_example_stack().fingerprint() == create_example_stack().fingerprint()
+        )
+
+    def test_fingerprint_changes_when_content_changes(self):
+        assert (
+            create_example_stack(1).fingerprint()
+            != create_example_stack(2).fingerprint()
+        )
+
+    def test_fingerprint_depends_on_the_order_of_items(self):
+        stack = create_example_stack()
+        reordered = create_example_stack()
+        reordered.Resources["Foo"] = reordered.Resources.pop("Foo")
+
+        assert stack.fingerprint() != reordered.fingerprint()
+
+    def test_fingerprint_depends_on_the_order_of_dictionary_keys(self):
+        assert fingerprint({"a": 1, "b": 2}) != fingerprint({"b": 2, "a": 1})
+
+    def test_fingerprint_depends_on_the_type_of_object(self):
+        assert fingerprint(SimpleResource()) != fingerprint(FullResource())
+
+    def test_unset_attribute_is_different_to_an_empty_value(self):
+        assert fingerprint(SingleAttributeObject()) != fingerprint(
+            SingleAttributeObject(one=[])
+        )
+
+    def test_internal_attributes_are_ignored(self):
+        assert fingerprint(MixedAttributeObject(one=1, a=2)) == fingerprint(
+            MixedAttributeObject(one=1, a=3)
+        )
+
+    def test_tuple_is_different_to_a_list(self):
+        assert fingerprint((1, 2)) != fingerprint([1, 2])
+
+    def test_function_is_different_to_its_plain_data(self):
+        stack = create_example_stack()
+        literal = create_example_stack()
+        literal.Outputs["Baz"].Value = {"Ref": "Foo"}
+
+        assert stack.to_dict() == literal.to_dict()
+        assert stack.fingerprint() != literal.fingerprint()
+
+    def test_reference_is_hashed_as_the_logical_name(self):
+        stack = create_example_stack()
+        renamed = create_example_stack()
+        renamed.Resources.rename("Foo", "Qux")
+
+        assert stack.fingerprint() != renamed.fingerprint()
+
+    def test_function_references_are_resolved_in_the_supplied_stack(self):
+        first = create_example_stack()
+        second = create_example_stack()
+
+        assert fingerprint(GetAtt(first.Resources["Foo"], "Arn"), first) == (
+            fingerprint(GetAtt(second.Resources["Foo"], "Arn"), second)
+        )
+        assert fingerprint(GetAtt(first.Resources["Foo"], "Arn"), first) != (
+            fingerprint(GetAtt(first.Resources["Bar"], "Arn"), first)
+        )
+
+    def test_function_without_references_does_not_need_a_stack(self):
+        assert fingerprint(Sub("${AWS::Region}")) != fingerprint(
+            Sub("${AWS::AccountId}")
+        )
+
+    def test_reference_without_a_stack_is_rejected(self):
+        stack = create_example_stack()
+
+        with pytest.raises(ValueError, match="stack is needed"):
+            fingerprint(stack.Outputs["Baz"])
+
+
+class TestCachedFingerprint:
+    """Verify that fingerprints are only re-calculated for changed objects."""
+
+    @pytest.fixture
+    def hash_count(self, monkeypatch):
+        calls = []
+        original = fingerprint_module._hash
+
+        def counting_hash(data):
+            calls.append(data)
+            return original(data)
+
+        monkeypatch.setattr(fingerprint_module, "_hash", counting_hash)
+        return calls
+
+    def test_unchanged_object_is_not_hashed_again(self, hash_count):
+        data = NestedAttributeObject(top=SingleAttributeObject(one=1))
+        expected = fingerprint(data)
+        del hash_count[:]
+
+        result = fingerprint(data)
+
+        assert result == expected
+        assert hash_count == []
+
+    def test_setting_an_attribute_clears_the_cache(self):
+        data = DualAttributeObject(one=1, two=EMPTY_LIST)
+        original = fingerprint(data)
+
+        data.one = 2
+
+        assert fingerprint(data) != original
+        assert fingerprint(data) == fingerprint(
+            DualAttributeObject(one=2, two=EMPTY_LIST)
+        )
+
+    def test_change_to_nested_object_is_detected(self, hash_count):
+        nested = SingleAttributeObject(one=1)
+        data = NestedAttributeObject(top=nested)
+        original = fingerprint(data)
+        del hash_count[:]
+
+        nested.one = 2
+
+        assert fingerprint(data) != original
+        assert len(hash_count) == 2
+
+    def test_only_changed_objects_are_hashed_again(self, hash_count):
+        unchanged = SingleAttributeObject(one=1)
+        changed = SingleAttributeObject(one=2)
+        data = DualAttributeObject(one=unchanged, two=changed)
+        fingerprint(data)
+        del hash_count[:]
+
+        changed.one = 3
+
+        fingerprint(data)
+        assert len(hash_count) == 2
+
+    def test_resource_with_default_attributes_is_not_hashed_again(self, hash_count):
+        resource = FullResource()
+        resource.Properties.kudos = 7
+        expected = fingerprint(resource)
+        del hash_count[:]
+
+        result = fingerprint(resource)
+
+        assert result == expected
+        assert hash_count == []
+
+    def test_change_inside_a_default_attribute_is_detected(self):
+        resource = FullResource()
+        original = fingerprint(resource)
+
+        resource.DependsOn.append("Foo")
+
+        assert fingerprint(resource) != original
+        assert fingerprint(resource) == fingerprint(FullResource(DependsOn=["Foo"]))
+
+    def test_change_inside_a_plain_list_is_detected(self):
+        data = SingleAttributeObject(one=[1, 2])
+        original = fingerprint(data)
+
+        data.one.append(3)
+
+        assert fingerprint(data) != original
+
+    def test_change_inside_a_plain_dictionary_is_detected(self):
+        nested = SingleAttributeObject(one={"a": 1})
+        data = NestedAttributeObject(top=nested)
+        original = fingerprint(data)
+
+        nested.one["a"] = 2
+
+        assert fingerprint(data) != original
+
+    def test_object_added_to_a_plain_list_is_detected(self):
+        data = SingleAttributeObject(one=[1])
+        original = fingerprint(data)
+
+        data.one.append(SingleAttributeObject(one=2))
+
+        assert fingerprint(data) != original
+
+    def test_cache_is_not_part_of_the_object_state(self):
+        data = NestedAttributeObject(top=SingleAttributeObject(one=1))
+        expected = fingerprint(data)
+
+        copy = pickle.loads(pickle.dumps(data))
+
+        assert "_fingerprint" not in [a.name for a in attr.fields(type(data))]
+        assert data._fingerprint is not None
+        assert copy._fingerprint is None
+        assert copy.top._fingerprint is None
+        assert fingerprint(copy) == expected
+
+    def test_tagged_resource_with_a_reference_is_not_hashed_again(self, hash_count):
+        vpc = ec2.VPC(Properties=dict(CidrBlock="10.0.0.0/16"))
+        subnet = ec2.Subnet(
+            Properties=dict(
+                CidrBlock="10.0.0.0/24",
+                VpcId=Ref(vpc),
+                Tags=[Tag(Key="Name", Value="Public")],
+            )
+        )
+        stack = Stack(Resources={"Network": vpc, "Subnet": subnet})
+        expected = fingerprint(subnet, stack)
+        del hash_count[:]
+
+        result = fingerprint(subnet, stack)
+
+        assert result == expected
+        assert hash_count == []
+
+    def test_tag_added_to_a_tag_list_is_detected(self):
+        resource = ec2.VPC(
+            Properties=dict(CidrBlock="10.0.0.0/16", Tags=[Tag(Key="Foo", Value="1")])
+        )
+        original = fingerprint(resource)
+
+        resource.Properties.Tags.append(Tag(Key="Bar", Value="2"))
+
+        assert fingerprint(resource) != original
+
+    def test_replaced_tag_is_detected(self):
+        resource = ec2.VPC(
+            Properties=dict(CidrBlock="10.0.0.0/16", Tags=[Tag(Key="Foo", Value="1")])
+        )
+        original = fingerprint(resource)
+
+        resource.Properties.Tags[0] = Tag(Key="Foo", Value="2")
+
+        assert fingerprint(resource) != original
+
+    def test_reference_is_checked_in_the_current_stack(self):
+        stack = create_example_stack()
+        output = stack.Outputs["Baz"]
+        original = fingerprint(output, stack)
+        other = Stack(Resources={"Qux": stack.Resources["Foo"]})
+
+        assert fingerprint(output, other) != original
+        assert fingerprint(output, stack) == original
+
+    def test_renamed_reference_target_is_detected(self):
+        stack = create_example_stack()
+        original = stack.fingerprint()
+
+        stack.Resources.rename("Foo", "Qux")
+
+        assert stack.fingerprint() != original
+
+    def test_modified_stack_has_the_same_fingerprint_as_a_new_one(self):
+        stack = create_example_stack()
+        stack.fingerprint()
+        expected = create_example_stack()
+        expected.Resources["Bar"].Properties.kudos = 7
+
+        stack.Resources["Bar"].Properties.kudos = 7
+
+        assert stack.fingerprint() == expected.fingerprint()
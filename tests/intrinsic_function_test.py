@@ -3,7 +3,6 @@
 import re
 from unittest.mock import Mock
 
-import hypothesis.strategies as st
 import pytest
 from hypothesis import given
 from yaml import ScalarNode
@@ -22,6 +21,7 @@ from flyingcircus.intrinsic_function import Ref
 from flyingcircus.intrinsic_function import Sub
 from .core_test.common import SingleAttributeObject
 from .core_test.common import ZeroAttributeObject
+from .core_test.common import aws_logical_name_strategy
 from .pyyaml_helper import create_refsafe_dumper
 from .pyyaml_helper import get_mapping_node_key
 
@@ -871,7 +871,7 @@ class TestRef:
         assert isinstance(node, ScalarNode)
         assert node.tag == "!Ref"
 
-    @given(st.text(min_size=1))
+    @given(aws_logical_name_strategy())
     def test_uses_logical_name_from_stack(self, name):
         # Setup
         data = SingleAttributeObject(one=42)
@@ -0,0 +1,100 @@
+"""Tests for classes that are created when they are first used."""
+
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from flyingcircus import _lazy
+from flyingcircus._raw import s3 as raw_s3
+from flyingcircus.core import Resource
+from flyingcircus.service import s3
+
+
+def _run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout.strip()
+
+
+@pytest.mark.skipif(
+    not _lazy._HAS_MODULE_GETATTR, reason="Classes are always created on Python 3.6"
+)
+class TestLazyClasses:
+    """Verify that generated classes are only created when they are used."""
+
+    def test_importing_a_service_does_not_create_the_classes(self):
+        output = _run_python(
+            "import flyingcircus.service.sqs, flyingcircus._raw.sqs as raw\n"
+            "print(sorted(name for name in raw.__all__ if name in vars(raw)))"
+        )
+
+        assert output == "[]"
+
+    def test_using_a_class_only_creates_related_classes(self):
+        output = _run_python(
+            "from flyingcircus.service import sqs\n"
+            "from flyingcircus._raw import sqs as raw\n"
+            "sqs.Queue()\n"
+            "print(sorted(name for name in raw.__all__ if name in vars(raw)))"
+        )
+
+        assert output == "['Queue', 'QueueProperties']"
+
+
+class TestLazyModule:
+    """Verify that a module with lazy classes behaves like a normal module."""
+
+    def test_class_is_created_once(self):
+        assert raw_s3.AccessPoint is raw_s3.AccessPoint
+        assert raw_s3.AccessPoint().Properties.__class__ is (
+            raw_s3.AccessPointProperties
+        )
+
+    def test_class_looks_like_a_module_level_class(self):
+        assert raw_s3.BucketPolicy.__module__ == "flyingcircus._raw.s3"
+        assert raw_s3.BucketPolicy.__qualname__ == "BucketPolicy"
+
+    def test_service_module_reexports_raw_classes(self):
+        assert s3.BucketPolicy is raw_s3.BucketPolicy
+        assert issubclass(s3.Bucket, raw_s3.Bucket)
+        assert issubclass(s3.BucketPolicy, Resource)
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError, match="DoesNotExist"):
+            _ = raw_s3.DoesNotExist
+        with pytest.raises(AttributeError, match="DoesNotExist"):
+            _ = s3.DoesNotExist
+
+    def test_dir_includes_classes_that_do_not_exist_yet(self):
+        assert set(raw_s3.__all__) <= set(dir(raw_s3))
+        assert set(raw_s3.__all__) <= set(dir(s3))
+
+    def test_star_import_includes_all_classes(self):
+        namespace = {}
+
+        exec("from flyingcircus.service.s3 import *", namespace)
+
+        assert namespace["Bucket"] is s3.Bucket
+        assert namespace["AccessPointProperties"] is raw_s3.AccessPointProperties
+
+    def test_service_module_all_includes_its_own_names(self):
+        from flyingcircus._raw import autoscaling as raw_autoscaling
+        from flyingcircus.service import autoscaling
+
+        assert set(raw_autoscaling.__all__) < set(autoscaling.__all__)
+        assert "simple_scaling_policy" in autoscaling.__all__
+        assert "_raw" not in autoscaling.__all__
+
+    def test_objects_can_be_pickled(self):
+        policy = s3.BucketPolicy()
+        policy.Properties.Bucket = "foo"
+
+        copy = pickle.loads(pickle.dumps(policy))
+
+        assert type(copy) is raw_s3.BucketPolicy
+        assert copy.Properties.Bucket == "foo"
@@ -0,0 +1,344 @@
+"""Tests for loading existing CloudFormation templates."""
+
+import io
+import json
+
+import pytest
+
+from flyingcircus.core import AWS_Region
+from flyingcircus.core import Output
+from flyingcircus.core import Parameter
+from flyingcircus.core import Stack
+from flyingcircus.intrinsic_function import GetAtt
+from flyingcircus.intrinsic_function import Join
+from flyingcircus.intrinsic_function import Ref
+from flyingcircus.intrinsic_function import Sub
+from flyingcircus.loader import GenericResource
+from flyingcircus.loader import TemplateLoader
+from flyingcircus.loader import get_resource_class
+from flyingcircus.loader import load_stack
+from flyingcircus.loader import read_template
+from flyingcircus.service import s3
+from flyingcircus.service import sqs
+
+YAML_TEMPLATE = """
+AWSTemplateFormatVersion: 2010-09-09
+Parameters:
+  Env:
+    Type: String
+Resources:
+  Bucket:
+    Type: AWS::S3::Bucket
+    Properties:
+      BucketName: !Sub "${Env}-bucket"
+  Queue:
+    Type: AWS::SQS::Queue
+    Properties:
+      QueueName: !Join ["-", [!Ref Env, !GetAtt Bucket.Arn]]
+Outputs:
+  BucketName:
+    Value: !Ref Bucket
+"""
+
+JSON_TEMPLATE = """
+{
+  "AWSTemplateFormatVersion": "2010-09-09",
+  "Parameters": {"Env": {"Type": "String"}},
+  "Resources": {
+    "Bucket": {
+      "Type": "AWS::S3::Bucket",
+      "Properties": {"BucketName": {"Fn::Sub": "${Env}-bucket"}}
+    },
+    "Queue": {
+      "Type": "AWS::SQS::Queue",
+      "Properties": {
+        "QueueName": {
+          "Fn::Join": ["-", [{"Ref": "Env"}, {"Fn::GetAtt": ["Bucket", "Arn"]}]]
+        }
+      }
+    }
+  },
+  "Outputs": {"BucketName": {"Value": {"Ref": "Bucket"}}}
+}
+"""
+
+
+def _load_resource_properties(properties: dict, resource_type="AWS::S3::Bucket"):
+    stack = load_stack(
+        json.dumps(
+            {
+                "Parameters": {"Env": {"Type": "String"}},
+                "Resources": {
+                    "Target": {"Type": "AWS::SQS::Queue"},
+                    "Subject": {"Type": resource_type, "Properties": properties},
+                },
+            }
+        )
+    )
+    return stack, stack.Resources["Subject"].Properties
+
+
+class TestReadTemplate:
+    """Verify parsing of template text."""
+
+    def test_yaml_is_the_same_as_json(self):
+        assert read_template(YAML_TEMPLATE) == read_template(JSON_TEMPLATE)
+
+    def test_yaml_short_form_functions_are_loaded_in_long_form(self):
+        data = read_template(
+            "A: !Ref Foo\nB: !GetAtt Foo.Bar.Baz\nC: !If [Cond, 1, 2]\n"
+            "D: !Condition IsProd\n"
+        )
+
+        assert data == {
+            "A": {"Ref": "Foo"},
+            "B": {"Fn::GetAtt": ["Foo", "Bar.Baz"]},
+            "C": {"Fn::If": ["Cond", 1, 2]},
+            "D": {"Condition": "IsProd"},
+        }
+
+    def test_dates_are_loaded_as_strings(self):
+        data = read_template("AWSTemplateFormatVersion: 2010-09-09\n")
+
+        assert data == {"AWSTemplateFormatVersion": "2010-09-09"}
+
+    def test_template_is_read_from_a_file_object(self):
+        assert read_template(io.StringIO(JSON_TEMPLATE)) == read_template(JSON_TEMPLATE)
+
+    def test_template_can_be_bytes(self):
+        assert read_template(YAML_TEMPLATE.encode("utf-8")) == read_template(
+            YAML_TEMPLATE
+        )
+
+    def test_yaml_flow_mapping_is_not_mistaken_for_json(self):
+        assert read_template("{Foo: !Ref Bar}") == {"Foo": {"Ref": "Bar"}}
+
+    def test_template_must_be_a_mapping(self):
+        with pytest.raises(ValueError, match="mapping"):
+            read_template("- 1\n- 2\n")
+
+
+class TestLoadStack:
+    """Verify conversion of a template into Flying Circus objects."""
+
+    @pytest.mark.parametrize("template", [YAML_TEMPLATE, JSON_TEMPLATE])
+    def test_resources_use_the_service_classes(self, template):
+        stack = load_stack(template)
+
+        assert type(stack.Resources["Bucket"]) is s3.Bucket
+        assert type(stack.Resources["Queue"]) is sqs.Queue
+        assert isinstance(stack.Parameters["Env"], Parameter)
+        assert isinstance(stack.Outputs["BucketName"], Output)
+
+    @pytest.mark.parametrize("template", [YAML_TEMPLATE, JSON_TEMPLATE])
+    def test_exported_template_is_unchanged(self, template):
+        stack = load_stack(template)
+
+        data = stack.to_dict()
+        del data["Metadata"]
+        assert data == read_template(template)
+
+    def test_template_sections_are_in_template_order(self):
+        stack = load_stack(YAML_TEMPLATE)
+
+        assert list(stack.Resources) == ["Bucket", "Queue"]
+
+    def test_ref_is_bound_to_the_referenced_object(self):
+        stack = load_stack(YAML_TEMPLATE)
+
+        assert stack.Outputs["BucketName"].Value == Ref(stack.Resources["Bucket"])
+
+    def test_ref_to_a_pseudo_parameter(self):
+        _, properties = _load_resource_properties(
+            {"BucketName": {"Ref": "AWS::Region"}}
+        )
+
+        assert properties.BucketName == Ref(AWS_Region)
+
+    def test_getatt_is_bound_to_the_referenced_resource(self):
+        stack, properties = _load_resource_properties(
+            {"BucketName": {"Fn::GetAtt": ["Target", "QueueName"]}}
+        )
+
+        assert properties.BucketName == GetAtt(stack.Resources["Target"], "QueueName")
+
+    def test_nested_functions_are_converted(self):
+        stack, properties = _load_resource_properties(
+            {"BucketName": {"Fn::Join": ["-", [{"Ref": "Env"}, "bucket"]]}}
+        )
+
+        assert isinstance(properties.BucketName, Join)
+        assert properties.BucketName._values[0] == Ref(stack.Parameters["Env"])
+
+    def test_sub_with_variables(self):
+        stack, properties = _load_resource_properties(
+            {"BucketName": {"Fn::Sub": ["${Name}", {"Name": {"Ref": "Target"}}]}}
+        )
+
+        assert isinstance(properties.BucketName, Sub)
+        assert properties.BucketName._variables == {
+            "Name": Ref(stack.Resources["Target"])
+        }
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"Fn::If": ["Condition", "a", "b"]},
+            {"Ref": "DoesNotExist"},
+            {"Fn::GetAtt": ["Env", "Arn"]},
+            {"Fn::Join": [",", {"Ref": "AWS::NotificationARNs"}]},
+        ],
+        ids=["unsupported", "unknown-name", "not-a-resource", "unsupported-arguments"],
+    )
+    def test_unrepresentable_function_is_left_as_plain_data(self, value):
+        stack, properties = _load_resource_properties({"BucketName": value})
+
+        assert stack.to_dict()["Resources"]["Subject"]["Properties"] == {
+            "BucketName": value
+        }
+
+    def test_unknown_resource_type_uses_a_generic_resource(self):
+        stack, properties = _load_resource_properties(
+            {"Target": {"Ref": "Target"}, "Anything": [1, 2]},
+            resource_type="Custom::Thing",
+        )
+
+        resource = stack.Resources["Subject"]
+        assert isinstance(resource, GenericResource)
+        assert resource.Type == "Custom::Thing"
+        assert properties == {
+            "Target": Ref(stack.Resources["Target"]),
+            "Anything": [1, 2],
+        }
+
+    def test_unknown_property_is_rejected(self):
+        with pytest.raises(ValueError, match=r"Resources\.Subject\.Properties.*Foo"):
+            _load_resource_properties({"Foo": "bar"})
+
+    def test_property_types_are_converted(self):
+        _, properties = _load_resource_properties(
+            {"VersioningConfiguration": {"Status": {"Ref": "Env"}}}
+        )
+
+        configuration = properties.VersioningConfiguration
+        assert type(configuration) is s3.BucketVersioningConfiguration
+        assert isinstance(configuration.Status, Ref)
+
+    def test_unknown_nested_property_is_rejected(self):
+        with pytest.raises(
+            ValueError, match=r"Properties\.VersioningConfiguration.*Foo"
+        ):
+            _load_resource_properties({"VersioningConfiguration": {"Foo": "bar"}})
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            {
+                "Resources": {
+                    "Foo": {"Type": "AWS::SQS::Queue", "Condition": "IsProduction"}
+                }
+            },
+            {"Outputs": {"Foo": {"Value": "bar", "Condition": "IsProduction"}}},
+        ],
+        ids=["resource", "output"],
+    )
+    def test_item_with_a_condition_is_rejected(self, template):
+        with pytest.raises(ValueError, match=r"\.Foo.*Condition"):
+            TemplateLoader(template).to_stack()
+
+    def test_resource_without_type_is_rejected(self):
+        with pytest.raises(ValueError, match="Type"):
+            load_stack('{"Resources": {"Foo": {"Properties": {}}}}')
+
+    def test_unsupported_section_is_rejected(self):
+        with pytest.raises(ValueError, match="Rules"):
+            load_stack('{"Rules": {}}')
+
+
+class TestTemplateLoader:
+    """Verify that objects are only created when they are needed."""
+
+    @pytest.fixture
+    def loader(self):
+        return TemplateLoader(read_template(YAML_TEMPLATE))
+
+    def test_names_are_available_without_creating_objects(self, loader):
+        assert loader.get_names("Resources") == ["Bucket", "Queue"]
+        assert loader._items == {}
+
+    def test_only_the_requested_item_and_its_references_are_created(self, loader):
+        queue = loader.get_item("Resources", "Queue")
+
+        assert isinstance(queue, sqs.Queue)
+        assert set(loader._items) == {
+            ("Resources", "Queue"),
+            ("Resources", "Bucket"),
+            ("Parameters", "Env"),
+        }
+        assert loader.get_section("Outputs")["BucketName"].Value == Ref(
+            loader.get_item("Resources", "Bucket")
+        )
+
+    def test_item_is_only_created_once(self, loader):
+        queue = loader.get_item("Resources", "Queue")
+
+        assert loader.get_item("Resources", "Queue") is queue
+        assert loader.get_section("Resources")["Queue"] is queue
+        assert loader.to_stack().Resources["Queue"] is queue
+
+    def test_section_is_created_on_its_own(self, loader):
+        section = loader.get_section("Parameters")
+
+        assert list(section) == ["Env"]
+        assert set(loader._items) == {("Parameters", "Env")}
+
+    def test_missing_item_raises_key_error(self, loader):
+        with pytest.raises(KeyError):
+            loader.get_item("Resources", "DoesNotExist")
+
+    def test_circular_references_are_resolved(self):
+        loader = TemplateLoader(
+            {
+                "Resources": {
+                    "First": {
+                        "Type": "AWS::SQS::Queue",
+                        "Properties": {"QueueName": {"Ref": "Second"}},
+                    },
+                    "Second": {
+                        "Type": "AWS::SQS::Queue",
+                        "Properties": {"QueueName": {"Ref": "First"}},
+                    },
+                }
+            }
+        )
+
+        stack = loader.to_stack()
+
+        first = stack.Resources["First"]
+        second = stack.Resources["Second"]
+        assert first.Properties.QueueName == Ref(second)
+        assert second.Properties.QueueName == Ref(first)
+
+
+class TestGetResourceClass:
+    """Verify lookup of the class for a resource type."""
+
+    def test_known_resource_type(self):
+        assert get_resource_class("AWS::S3::Bucket") is s3.Bucket
+
+    def test_unknown_resource_type(self):
+        assert get_resource_class("Custom::Thing") is None
+
+    def test_every_registered_class_has_the_right_type(self):
+        from flyingcircus._raw._registry import RESOURCE_TYPES
+
+        for resource_type in RESOURCE_TYPES:
+            assert get_resource_class(resource_type).RESOURCE_TYPE == resource_type
+
+
+def test_loaded_stack_can_be_merged():
+    stack = Stack()
+
+    stack.merge_stack(load_stack(YAML_TEMPLATE))
+
+    assert stack.Outputs["BucketName"].Value == Ref(stack.Resources["Bucket"])
@@ -0,0 +1,345 @@
+"""Tests for the generated classes that are built ahead of time.
+
+Each class in the `_raw` package should be the same as the class that the
+code generator creates with the `--decorated` option, which uses the `attrs`
+decorator instead.
+"""
+
+import copy
+import importlib
+import importlib.util
+import inspect
+import os
+import pickle
+import pkgutil
+import shutil
+import subprocess
+import sys
+
+import attr
+import pytest
+
+import flyingcircus
+from flyingcircus import _prebuilt
+from flyingcircus import _raw
+from flyingcircus.core import ATTRSCONFIG
+from flyingcircus.core import AWSObject
+from flyingcircus.core import ResourceProperties
+from flyingcircus.service import ec2
+from flyingcircus.service import s3
+
+RAW_MODULE_NAMES = sorted(
+    module.name
+    for module in pkgutil.iter_modules(_raw.__path__)
+    if not module.name.startswith("_")
+)
+
+GENERATOR_SCRIPT = os.path.join(
+    os.path.dirname(__file__), "..", "tools", "create_raw_modules.py"
+)
+
+
+@pytest.fixture(scope="module")
+def decorated_raw_dirname(tmp_path_factory):
+    """Generate the `_raw` package again with decorated classes."""
+    for name in ("black", "click", "inflection", "jinja2"):
+        pytest.importorskip(name)
+
+    packagedir = str(tmp_path_factory.mktemp("decorated") / "flyingcircus")
+    shutil.copytree(
+        os.path.dirname(flyingcircus.__file__),
+        packagedir,
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(flyingcircus.__file__))
+    subprocess.run(
+        [sys.executable, GENERATOR_SCRIPT, packagedir, "--force", "--decorated"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=True,
+    )
+    return os.path.join(packagedir, "_raw")
+
+
+def _load_decorated_module(raw_dirname, module_name):
+    """Load a generated module as a private module in the `_raw` package, so
+    that it uses the same base classes as the prebuilt module."""
+    spec = importlib.util.spec_from_file_location(
+        "flyingcircus._raw._decorated_" + module_name,
+        os.path.join(raw_dirname, module_name + ".py"),
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _describe_converter(converter):
+    """Get the kind of a converter, and the name of the class it creates."""
+    if converter is None:
+        return None
+    if converter.__name__ == "convert_to_object":
+        converted = converter({})
+    elif converter.__name__ == "convert_items_to_objects":
+        (converted,) = converter([{}])
+    else:
+        converted = converter({"Name": {}})["Name"]
+    return converter.__name__, type(converted).__name__
+
+
+def _describe_attribute(attribute):
+    default = attribute.default
+    if isinstance(default, attr.Factory):
+        default = ("factory", default.factory.__name__, default.takes_self)
+    return (
+        attribute.name,
+        default,
+        attribute.init,
+        attribute.kw_only,
+        getattr(attribute.type, "__name__", attribute.type),
+        _describe_converter(attribute.converter),
+    )
+
+
+def _create_arguments(cls):
+    """Create a real value for every argument of a class's constructor."""
+    arguments = {}
+    for attribute in attr.fields(cls):
+        if not attribute.init:
+            continue
+        converter = _describe_converter(attribute.converter)
+        if converter is None:
+            arguments[attribute.name] = attribute.name.lower()
+        elif converter[0] == "convert_to_object":
+            arguments[attribute.name] = {}
+        elif converter[0] == "convert_items_to_objects":
+            arguments[attribute.name] = [{}, "other"]
+        else:
+            arguments[attribute.name] = {"Name": {}}
+    return arguments
+
+
+def _get_prebuilt_signature(cls):
+    """Get the constructor signature that the prebuilt version of a
+    decorated class should have, with the inherited attributes passed as
+    keyword arguments."""
+    inherited = {attribute.name for attribute in attr.fields(cls.__bases__[0])}
+    signature = inspect.signature(cls)
+    return signature.replace(
+        parameters=[
+            parameter
+            for parameter in signature.parameters.values()
+            if parameter.name not in inherited
+        ]
+        + [inspect.Parameter("kwargs", inspect.Parameter.VAR_KEYWORD)]
+    )
+
+
+@pytest.mark.parametrize("module_name", RAW_MODULE_NAMES)
+def test_prebuilt_classes_are_the_same_as_decorated_classes(
+    decorated_raw_dirname, module_name
+):
+    prebuilt_module = importlib.import_module("flyingcircus._raw." + module_name)
+    decorated_module = _load_decorated_module(decorated_raw_dirname, module_name)
+    assert prebuilt_module.__all__ == decorated_module.__all__
+
+    for name in prebuilt_module.__all__:
+        prebuilt_class = getattr(prebuilt_module, name)
+        decorated_class = getattr(decorated_module, name)
+
+        assert prebuilt_class.__bases__ == decorated_class.__bases__
+        assert prebuilt_class.__doc__ == decorated_class.__doc__
+        assert [_describe_attribute(a) for a in attr.fields(prebuilt_class)] == [
+            _describe_attribute(a) for a in attr.fields(decorated_class)
+        ]
+        assert prebuilt_class.__slots__ == decorated_class.__slots__
+        assert str(inspect.signature(prebuilt_class)) == str(
+            _get_prebuilt_signature(decorated_class)
+        )
+        assert list(prebuilt_class._ATTRIBUTE_TABLE) == list(
+            decorated_class._ATTRIBUTE_TABLE
+        )
+        assert (
+            prebuilt_class._CFN_ATTRIBUTE_NAMES == decorated_class._CFN_ATTRIBUTE_NAMES
+        )
+        assert getattr(prebuilt_class, "_TAG_FORMAT_IMPL", None) is getattr(
+            decorated_class, "_TAG_FORMAT_IMPL", None
+        )
+
+        # Objects created with the default values and with real arguments
+        # should be the same, including the objects created by converters
+        # and factories
+        arguments = _create_arguments(decorated_class)
+        for prebuilt_object, decorated_object in [
+            (prebuilt_class(), decorated_class()),
+            (
+                prebuilt_class(**copy.deepcopy(arguments)),
+                decorated_class(**copy.deepcopy(arguments)),
+            ),
+        ]:
+            assert repr(prebuilt_object) == repr(decorated_object)
+            assert repr(prebuilt_object.__getstate__()) == repr(
+                decorated_object.__getstate__()
+            )
+            assert prebuilt_object.to_dict() == decorated_object.to_dict()
+
+
+class TestPrebuiltClass:
+    """Verify the behaviour that a prebuilt class shares with an attrs class."""
+
+    def test_converters_are_applied_in_constructor(self):
+        bucket = s3.Bucket(Properties=dict(VersioningConfiguration={"Status": "On"}))
+
+        assert type(bucket.Properties) is s3.BucketProperties
+        assert type(bucket.Properties.VersioningConfiguration) is (
+            s3.BucketVersioningConfiguration
+        )
+
+    def test_factory_is_called_for_each_object(self):
+        first = ec2.Instance()
+        second = ec2.Instance()
+
+        assert first.Properties is not second.Properties
+        assert first.DependsOn is not second.DependsOn
+
+    def test_post_init_is_called(self):
+        properties = ec2.InstanceProperties()
+
+        assert properties._fingerprint is None
+        assert ec2.Instance().Metadata == {}
+
+    def test_arguments_are_keyword_only(self):
+        with pytest.raises(TypeError):
+            ec2.InstanceCpuOptions(2)
+
+    def test_inherited_attributes_are_set(self):
+        instance = ec2.Instance(DeletionPolicy="Retain", DependsOn=["Foo"])
+
+        assert instance.DeletionPolicy == "Retain"
+        assert instance.DependsOn == ["Foo"]
+        assert instance.UpdateReplacePolicy is None
+
+    def test_unknown_argument_is_rejected(self):
+        with pytest.raises(TypeError, match="unexpected keyword argument 'Foo'"):
+            ec2.Instance(Foo=1)
+
+        with pytest.raises(TypeError, match="unexpected keyword argument 'Foo'"):
+            ec2.InstanceCpuOptions(CoreCount=2, Foo=1)
+
+    def test_own_attributes_are_only_converted_once(self, monkeypatch):
+        # AWSObject.__setattr__ would apply the converter again
+        names = []
+        original = AWSObject.__setattr__
+
+        def recording_setattr(self, key, value):
+            names.append(key)
+            original(self, key, value)
+
+        monkeypatch.setattr(AWSObject, "__setattr__", recording_setattr)
+        ec2.Instance(Properties=dict(CpuOptions={"CoreCount": 2}))
+
+        assert "Properties" not in names
+        assert "CpuOptions" not in names
+
+    def test_evolve(self):
+        cpu_options = ec2.InstanceCpuOptions(CoreCount=2, ThreadsPerCore=1)
+
+        copy = attr.evolve(cpu_options, ThreadsPerCore=2)
+
+        assert copy.CoreCount == 2
+        assert copy.ThreadsPerCore == 2
+
+    def test_pickle(self):
+        instance = ec2.Instance(Properties=dict(CpuOptions={"CoreCount": 2}))
+
+        copy = pickle.loads(pickle.dumps(instance))
+
+        assert copy.to_dict() == instance.to_dict()
+        assert copy.Properties.CpuOptions.CoreCount == 2
+
+    def test_recursive_repr(self):
+        properties = s3.BucketProperties()
+        properties.BucketName = [properties]
+
+        assert "BucketName=[...]" in repr(properties)
+
+    def test_subclass_can_be_decorated_with_attrs(self):
+        @attr.attrs(**ATTRSCONFIG)
+        class Subclass(s3.BucketProperties):
+            Extra = attr.ib(default=None)
+
+        subject = Subclass(BucketName="foo", Extra="bar")
+
+        assert subject.BucketName == "foo"
+        assert subject.Extra == "bar"
+        assert [a.name for a in attr.fields(Subclass)][-2:] == [
+            "WebsiteConfiguration",
+            "Extra",
+        ]
+
+
+class TestCreateAttributes:
+    """Verify creation of the `__attrs_attrs__` for a prebuilt class."""
+
+    def test_inherited_attributes_come_first(self):
+        attributes = _prebuilt.create_attributes(
+            "Example", ResourceProperties, ("Name",)
+        )
+
+        assert [a.name for a in attributes] == [
+            a.name for a in attr.fields(ResourceProperties)
+        ] + ["Name"]
+        assert attributes.Name is attributes[-1]
+
+    def test_attributes_have_defaults_factories_and_converters(self):
+        attributes = _prebuilt.create_attributes(
+            "Example",
+            ResourceProperties,
+            ("Converted", "Listed"),
+            converters={"Converted": str},
+            factories={"Listed": list},
+        )
+
+        assert attributes.Converted.default is None
+        assert attributes.Converted.converter is str
+        assert attributes.Converted.kw_only
+        assert attributes.Listed.default == attr.Factory(list)
+        assert attributes.Listed.converter is None
+
+
+class TestCreateInheritedInit:
+    """Verify the function that sets the attributes a prebuilt class inherits."""
+
+    @attr.attrs(**ATTRSCONFIG)
+    class Base(ResourceProperties):
+        Listed = attr.ib(factory=list)
+        Hidden = attr.ib(default=None, init=False)
+
+    def test_attributes_are_found_from_the_base_class(self):
+        init = _prebuilt.create_inherited_init(self.Base)
+        subject = self.Base.__new__(self.Base)
+
+        init(subject, {"Listed": [1]})
+
+        assert subject.Listed == [1]
+        assert subject.Hidden is None
+
+    def test_factory_is_called_for_a_missing_argument(self):
+        init = _prebuilt.create_inherited_init(self.Base)
+        first = self.Base.__new__(self.Base)
+        second = self.Base.__new__(self.Base)
+
+        init(first, {})
+        init(second, {})
+
+        assert first.Listed == []
+        assert first.Listed is not second.Listed
+
+    def test_attribute_without_init_is_not_an_argument(self):
+        init = _prebuilt.create_inherited_init(self.Base)
+        subject = self.Base.__new__(self.Base)
+
+        with pytest.raises(TypeError, match="unexpected keyword argument 'Hidden'"):
+            init(subject, {"Hidden": 1})
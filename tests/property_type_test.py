@@ -0,0 +1,151 @@
+"""Tests for the generated classes for CloudFormation property types."""
+
+import pickle
+
+import pytest
+
+from flyingcircus.core import PropertyType
+from flyingcircus.core import Stack
+from flyingcircus.core import Tag
+from flyingcircus.intrinsic_function import Ref
+from flyingcircus.service import ec2
+from flyingcircus.service import elasticsearch
+from flyingcircus.service import emr
+
+
+class TestConversion:
+    """Verify that dictionaries are converted into property type objects."""
+
+    def test_dict_is_converted_in_constructor(self):
+        properties = ec2.InstanceProperties(
+            CpuOptions={"CoreCount": 2, "ThreadsPerCore": 1}
+        )
+
+        assert type(properties.CpuOptions) is ec2.InstanceCpuOptions
+        assert properties.CpuOptions.CoreCount == 2
+
+    def test_nested_dicts_are_converted(self):
+        properties = ec2.InstanceProperties()
+
+        properties.BlockDeviceMappings = [
+            {"DeviceName": "/dev/sda1", "Ebs": {"VolumeSize": 20}}
+        ]
+
+        mapping = properties.BlockDeviceMappings[0]
+        assert type(mapping) is ec2.InstanceBlockDeviceMapping
+        assert type(mapping.Ebs) is ec2.InstanceEbs
+        assert mapping.Ebs.VolumeSize == 20
+
+    def test_list_is_converted_in_place(self):
+        properties = ec2.InstanceProperties()
+        mappings = [{"DeviceName": "/dev/sda1"}]
+
+        properties.BlockDeviceMappings = mappings
+
+        assert properties.BlockDeviceMappings is mappings
+        assert isinstance(mappings[0], ec2.InstanceBlockDeviceMapping)
+
+    def test_map_values_are_converted(self):
+        properties = elasticsearch.DomainProperties(
+            LogPublishingOptions={"Search": {"Enabled": True}}
+        )
+
+        option = properties.LogPublishingOptions["Search"]
+        assert type(option) is elasticsearch.DomainLogPublishingOption
+        assert option.Enabled is True
+
+    def test_tags_use_the_core_tag_class(self):
+        properties = ec2.InstanceProperties(Tags=[{"Key": "Name", "Value": "web"}])
+
+        assert type(properties.Tags[0]) is Tag
+
+    def test_class_can_contain_itself(self):
+        configuration = emr.ClusterConfiguration(
+            Configurations=[{"Classification": "nested"}]
+        )
+
+        assert type(configuration.Configurations[0]) is emr.ClusterConfiguration
+
+    @pytest.mark.parametrize(
+        "value",
+        [{"Ref": "MyParameter"}, {"Fn::If": ["Condition", {}, {}]}],
+        ids=["ref", "function"],
+    )
+    def test_intrinsic_function_data_is_not_converted(self, value):
+        properties = ec2.InstanceProperties(CpuOptions=value)
+
+        assert properties.CpuOptions is value
+
+    def test_existing_object_is_not_converted(self):
+        cpu_options = ec2.InstanceCpuOptions(CoreCount=2)
+
+        properties = ec2.InstanceProperties(CpuOptions=cpu_options)
+
+        assert properties.CpuOptions is cpu_options
+
+    def test_unknown_property_is_rejected(self):
+        with pytest.raises(TypeError, match="NotAProperty"):
+            ec2.InstanceProperties(CpuOptions={"NotAProperty": 1})
+
+    def test_property_types_are_slotted_property_types(self):
+        cpu_options = ec2.InstanceCpuOptions()
+
+        assert isinstance(cpu_options, PropertyType)
+        with pytest.raises(AttributeError):
+            cpu_options.NotAProperty = 1
+
+
+class TestExport:
+    """Verify that property type objects export the same as dictionaries."""
+
+    def test_export_is_unchanged(self):
+        stack = Stack()
+        stack.Resources["Volume"] = ec2.Volume()
+        stack.Resources["Instance"] = ec2.Instance(
+            Properties=dict(
+                BlockDeviceMappings=[
+                    {"DeviceName": "/dev/sda1", "Ebs": {"VolumeSize": 20}},
+                    {"DeviceName": "/dev/sdb", "NoDevice": {}},
+                ],
+                CpuOptions={
+                    "Fn::If": ["Condition", {"CoreCount": 2}, {"Ref": "AWS::NoValue"}]
+                },
+                Tags=[{"Key": "Name", "Value": "web"}],
+                Volumes=[
+                    {"Device": "/dev/sdc", "VolumeId": Ref(stack.Resources["Volume"])}
+                ],
+            )
+        )
+
+        assert stack.to_dict()["Resources"]["Instance"]["Properties"] == {
+            "BlockDeviceMappings": [
+                {"DeviceName": "/dev/sda1", "Ebs": {"VolumeSize": 20}},
+                {"DeviceName": "/dev/sdb"},
+            ],
+            "CpuOptions": {
+                "Fn::If": ["Condition", {"CoreCount": 2}, {"Ref": "AWS::NoValue"}]
+            },
+            "Tags": [{"Key": "Name", "Value": "web"}],
+            "Volumes": [{"Device": "/dev/sdc", "VolumeId": {"Ref": "Volume"}}],
+        }
+
+    def test_property_types_are_pickled_by_reference_to_their_class(self):
+        mapping = ec2.InstanceBlockDeviceMapping(Ebs={"VolumeSize": 20})
+
+        copy = pickle.loads(pickle.dumps(mapping))
+
+        assert type(copy.Ebs) is ec2.InstanceEbs
+        assert copy.Ebs.VolumeSize == 20
+
+
+def test_tagging_a_resource_with_converted_tags():
+    instance = ec2.Instance(Properties=dict(Tags=[{"Key": "Name", "Value": "old"}]))
+
+    instance.tag(Name="new", Team="core")
+
+    assert instance.get_tag("Name") == "new"
+    assert instance.get_tag("Team") == "core"
+    assert instance.to_dict()["Properties"]["Tags"] == [
+        {"Key": "Name", "Value": "new"},
+        {"Key": "Team", "Value": "core"},
+    ]
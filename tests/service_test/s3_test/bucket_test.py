@@ -32,7 +32,7 @@ class TestEncryption(object):
 
         sse_config = encryption_rules[0]["ServerSideEncryptionByDefault"]
         assert sse_config["SSEAlgorithm"] == "AES256"
-        assert "KMSMasterKeyID" not in sse_config
+        assert not sse_config.is_attribute_set("KMSMasterKeyID")
 
     def test_sets_kms_encryption_with_default_key_when_no_parameters_set(self):
         bucket = Bucket()
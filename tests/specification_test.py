@@ -0,0 +1,149 @@
+"""Tests for lookups in the stored resource specification."""
+
+import pytest
+
+from flyingcircus._raw._registry import RESOURCE_TYPES
+from flyingcircus.specification import Specification
+from flyingcircus.specification import get_specification
+from flyingcircus.specification import write_specification
+
+SPECIFICATION_DATA = {
+    "PropertyTypes": {
+        "AWS::Foo::Bar.Baz": {"Properties": {"Name": {"PrimitiveType": "String"}}},
+        "Tag": {"Properties": {"Key": {"PrimitiveType": "String"}}},
+    },
+    "ResourceSpecificationVersion": "1.2.3",
+    "ResourceTypes": {
+        "AWS::Foo::Bar": {
+            "Attributes": {"Arn": {"PrimitiveType": "String"}},
+            "Properties": {"Baz": {"Type": "Baz", "UpdateType": "Immutable"}},
+        },
+        "AWS::Foo::Another": {"Properties": {}},
+        "AWS::Foo::Ünicode": {"Properties": {}},
+    },
+}
+
+
+@pytest.fixture
+def specification(tmp_path):
+    filename = str(tmp_path / "specification.bin")
+    write_specification(SPECIFICATION_DATA, filename)
+    with Specification(filename) as specification:
+        yield specification
+
+
+class TestLookup:
+    """Verify lookups of items in a stored specification."""
+
+    def test_version(self, specification):
+        assert specification.version == "1.2.3"
+
+    def test_resource_type(self, specification):
+        assert (
+            specification.get_resource_type("AWS::Foo::Bar")
+            == SPECIFICATION_DATA["ResourceTypes"]["AWS::Foo::Bar"]
+        )
+
+    @pytest.mark.parametrize("name", ["AWS::Foo::Bar.Baz", "Tag"])
+    def test_property_type(self, specification, name):
+        assert (
+            specification.get_property_type(name)
+            == SPECIFICATION_DATA["PropertyTypes"][name]
+        )
+
+    def test_attribute(self, specification):
+        assert specification.get_attribute("AWS::Foo::Bar", "Arn") == {
+            "PrimitiveType": "String"
+        }
+
+    def test_non_ascii_name(self, specification):
+        assert specification.get_resource_type("AWS::Foo::Ünicode") == {
+            "Properties": {}
+        }
+
+    @pytest.mark.parametrize(
+        "lookup",
+        [
+            lambda s: s.get_resource_type("AWS::Foo::Missing"),
+            lambda s: s.get_resource_type("AWS::Foo::Bar.Baz"),
+            lambda s: s.get_resource_type("AWS::Foo::Ba"),
+            lambda s: s.get_resource_type("ZZZ"),
+            lambda s: s.get_property_type("AWS::Foo::Bar"),
+            lambda s: s.get_attribute("AWS::Foo::Bar", "Missing"),
+            lambda s: s.get_attribute("AWS::Foo::Another", "Arn"),
+        ],
+        ids=[
+            "resource",
+            "property-as-resource",
+            "prefix",
+            "after-last",
+            "resource-as-property",
+            "attribute",
+            "no-attributes",
+        ],
+    )
+    def test_missing_item_raises_key_error(self, specification, lookup):
+        with pytest.raises(KeyError):
+            lookup(specification)
+
+    def test_each_lookup_returns_a_new_copy(self, specification):
+        resource = specification.get_resource_type("AWS::Foo::Bar")
+        resource["Properties"].clear()
+
+        assert specification.get_resource_type("AWS::Foo::Bar")["Properties"]
+
+    def test_names_are_sorted(self, specification):
+        assert specification.get_resource_type_names() == [
+            "AWS::Foo::Another",
+            "AWS::Foo::Bar",
+            "AWS::Foo::Ünicode",
+        ]
+        assert specification.get_property_type_names() == ["AWS::Foo::Bar.Baz", "Tag"]
+
+
+class TestFile:
+    """Verify reading and writing of the specification file."""
+
+    def test_file_is_the_same_when_written_again(self, tmp_path):
+        first = tmp_path / "first.bin"
+        second = tmp_path / "second.bin"
+        reordered = dict(SPECIFICATION_DATA)
+        reordered["ResourceTypes"] = dict(
+            reversed(list(SPECIFICATION_DATA["ResourceTypes"].items()))
+        )
+
+        write_specification(SPECIFICATION_DATA, str(first))
+        write_specification(reordered, str(second))
+
+        assert first.read_bytes() == second.read_bytes()
+
+    @pytest.mark.parametrize("content", [b"", b"FCSPEC", b'{"ResourceTypes": {}}'])
+    def test_other_file_is_rejected(self, tmp_path, content):
+        filename = tmp_path / "specification.bin"
+        filename.write_bytes(content)
+
+        with pytest.raises(ValueError, match="not a resource specification"):
+            Specification(str(filename))
+
+
+class TestPackagedSpecification:
+    """Verify the specification that is generated with the package."""
+
+    def test_specification_is_shared(self):
+        assert get_specification() is get_specification()
+
+    def test_every_resource_type_is_in_the_specification(self):
+        names = get_specification().get_resource_type_names()
+
+        assert set(RESOURCE_TYPES) <= set(names)
+
+    def test_lookup(self):
+        specification = get_specification()
+
+        assert (
+            "BucketName"
+            in specification.get_resource_type("AWS::S3::Bucket")["Properties"]
+        )
+        assert specification.get_attribute("AWS::SQS::Queue", "Arn") == {
+            "PrimitiveType": "String"
+        }
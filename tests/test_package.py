@@ -47,7 +47,9 @@ def test_all_exported_classes_have_slots():
     # Verify that every AWSObject-like class in a public module has
     # a well-defined attribute list
     for module in public_modules:
-        for name, obj in module.__dict__.items():
+        # Classes may be created lazily, so they aren't all in `__dict__` yet
+        for name in dir(module):
+            obj = getattr(module, name)
 
             if not inspect.isclass(obj):
                 continue
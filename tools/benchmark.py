@@ -0,0 +1,790 @@
+#!/usr/bin/env python
+
+"""
+Micro-benchmarks for performance-sensitive parts of Flying Circus.
+
+These are not run as part of the test suite. They are intended to be run by
+hand when working on the relevant code, in order to measure the effect of a
+change.
+"""
+
+import json
+import logging
+import os.path
+import pkgutil
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import attr
+import click
+
+import flyingcircus.service
+from flyingcircus import Fn
+from flyingcircus import diff
+from flyingcircus import export_many
+from flyingcircus.cache import TemplateCache
+from flyingcircus.core import AWSObject
+from flyingcircus.core import Stack
+from flyingcircus.export import IncrementalExporter
+from flyingcircus.loader import TemplateLoader
+from flyingcircus.loader import read_template
+from flyingcircus.service import ec2
+from flyingcircus.specification import Specification
+
+LOGGER = logging.getLogger(os.path.splitext(os.path.basename(__file__))[0])
+
+
+def _legacy_setattr(obj: AWSObject, key, value):
+    """Set an attribute using the original per-assignment approach.
+
+    This re-creates the `attrs` field lookup and whole-object validation that
+    `AWSObject.__setattr__` used to perform, so that we have a baseline to
+    compare against.
+    """
+    data = attr.fields_dict(obj.__class__)[key]
+    if data.converter:
+        value = data.converter(value)
+    object.__setattr__(obj, key, value)
+    attr.validate(obj)
+
+
+def _report(name, seconds, number):
+    click.echo("{:<40} {:>10.0f} ns/op".format(name, seconds / number * 1_000_000_000))
+
+
+@click.group()
+def benchmark():
+    """Run a micro-benchmark."""
+    pass
+
+
+@benchmark.command("setattr")
+@click.option(
+    "--number",
+    "-n",
+    type=int,
+    default=100_000,
+    help="Number of assignments to time.",
+    show_default=True,
+)
+def time_setattr(number):
+    """Time the cost of setting a single attribute on a wide object.
+
+    This uses EC2 InstanceProperties, which has one of the largest sets of
+    attributes in the CloudFormation specification.
+    """
+    obj = ec2.InstanceProperties()
+    click.echo(
+        "Assigning to {} ({} attributes)".format(
+            obj.__class__.__name__, len(attr.fields(obj.__class__))
+        )
+    )
+
+    def assign_attribute():
+        obj.InstanceType = "t3.micro"
+
+    def assign_attribute_legacy():
+        _legacy_setattr(obj, "InstanceType", "t3.micro")
+
+    _report(
+        "legacy (fields_dict + validate)",
+        timeit.timeit(assign_attribute_legacy, number=number),
+        number,
+    )
+    _report(
+        "AWSObject.__setattr__", timeit.timeit(assign_attribute, number=number), number
+    )
+
+
+def _create_benchmark_stack(resource_count, depth):
+    """Create a stack with many inter-dependent resources and nested data."""
+    stack = Stack(Description="Benchmark stack")
+    previous = None
+    for i in range(resource_count):
+        nested = {"Value": i}
+        for _ in range(depth):
+            nested = {"Nested": [nested, {"Empty": []}]}
+
+        instance = ec2.Instance(
+            Properties=dict(
+                ImageId="ami-12345678",
+                InstanceType="t3.micro",
+                BlockDeviceMappings=[
+                    {"DeviceName": "/dev/sda1", "Ebs": {"VolumeSize": 20}},
+                    {"DeviceName": "/dev/sdb", "NoDevice": {}},
+                ],
+                CpuOptions={"CoreCount": 2, "ThreadsPerCore": 1},
+                Tags=[{"Key": "Name", "Value": "Instance{}".format(i)}],
+            )
+        )
+        instance.Metadata = nested
+        if previous is not None:
+            instance.Properties.SubnetId = Fn.GetAtt(previous, "SubnetId")
+            instance.Properties.KeyName = Fn.Ref(previous)
+        stack.Resources["Instance{}".format(i)] = instance
+        previous = instance
+
+    return stack
+
+
+@benchmark.command("export")
+@click.option(
+    "--resources",
+    "-r",
+    type=int,
+    default=500,
+    help="Number of resources in the stack.",
+    show_default=True,
+)
+@click.option(
+    "--depth",
+    "-d",
+    type=int,
+    default=10,
+    help="Depth of nested metadata in each resource.",
+    show_default=True,
+)
+@click.option(
+    "--number",
+    "-n",
+    type=int,
+    default=3,
+    help="Number of exports to time.",
+    show_default=True,
+)
+def time_export(resources, depth, number):
+    """Time the export of a large stack."""
+    stack = _create_benchmark_stack(resources, depth)
+    click.echo("Exporting {} resources with nesting depth {}".format(resources, depth))
+
+    for name, kwargs in (
+        ("export yaml", dict(format="yaml")),
+        ("export yaml (LibYAML)", dict(format="yaml", fast=True)),
+        ("export json", dict(format="json")),
+    ):
+        seconds = timeit.timeit(lambda: stack.export(**kwargs), number=number)
+        click.echo("{:<40} {:>10.3f} s/op".format(name, seconds / number))
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = TemplateCache(directory)
+        cache.export(stack)
+        seconds = timeit.timeit(lambda: cache.export(stack), number=number)
+        click.echo(
+            "{:<40} {:>10.3f} s/op".format("export yaml (cached)", seconds / number)
+        )
+
+    exporter = IncrementalExporter()
+    exporter.export(stack)
+    resource = stack.Resources["Instance0"]
+
+    def change_and_export():
+        resource.DeletionPolicy = (
+            "Retain" if resource.DeletionPolicy != "Retain" else "Delete"
+        )
+        exporter.export(stack)
+
+    seconds = timeit.timeit(change_and_export, number=number)
+    click.echo(
+        "{:<40} {:>10.3f} s/op".format(
+            "export yaml (incremental, 1 change)", seconds / number
+        )
+    )
+
+
+@benchmark.command("export-many")
+@click.option(
+    "--stacks",
+    "-s",
+    type=int,
+    default=32,
+    help="Number of stacks to export.",
+    show_default=True,
+)
+@click.option(
+    "--resources",
+    "-r",
+    type=int,
+    default=100,
+    help="Number of resources in each stack.",
+    show_default=True,
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of worker processes.  [default: number of CPUs]",
+)
+def time_export_many(stacks, resources, workers):
+    """Time the export of many stacks, one after another and in parallel."""
+    all_stacks = [_create_benchmark_stack(resources, 5) for _ in range(stacks)]
+    click.echo("Exporting {} stacks of {} resources".format(stacks, resources))
+
+    for name, func in (
+        ("sequential", lambda: [stack.export() for stack in all_stacks]),
+        ("export_many", lambda: export_many(all_stacks, workers=workers)),
+    ):
+        seconds = timeit.timeit(func, number=1)
+        click.echo("{:<40} {:>10.3f} s".format(name, seconds))
+
+
+@benchmark.command("load")
+@click.option(
+    "--resources",
+    "-r",
+    type=int,
+    default=5_000,
+    help="Number of resources in the template.",
+    show_default=True,
+)
+@click.option(
+    "--number",
+    "-n",
+    type=int,
+    default=3,
+    help="Number of loads to time.",
+    show_default=True,
+)
+def time_load(resources, number):
+    """Time loading a large template as Flying Circus objects."""
+    stack = _create_benchmark_stack(resources, 5)
+    click.echo("Loading a template of {} resources".format(resources))
+
+    for template_format in ("yaml", "json"):
+        text = stack.export(template_format)
+        click.echo(
+            "{:<40} {:>10.1f} MB".format(
+                template_format + " template size", len(text) / 1_000_000
+            )
+        )
+
+        seconds = timeit.timeit(lambda: read_template(text), number=number)
+        click.echo(
+            "{:<40} {:>10.3f} s/op".format("read " + template_format, seconds / number)
+        )
+
+    template = read_template(text)
+    for name, func in (
+        (
+            "create one resource",
+            lambda: TemplateLoader(template).get_item("Resources", "Instance0"),
+        ),
+        ("create stack", lambda: TemplateLoader(template).to_stack()),
+    ):
+        seconds = timeit.timeit(func, number=number)
+        click.echo("{:<40} {:>10.3f} s/op".format(name, seconds / number))
+
+
+@benchmark.command("fingerprint")
+@click.option(
+    "--resources",
+    "-r",
+    type=int,
+    default=10_000,
+    help="Number of resources in the stack.",
+    show_default=True,
+)
+@click.option(
+    "--number",
+    "-n",
+    type=int,
+    default=3,
+    help="Number of fingerprints to time.",
+    show_default=True,
+)
+def time_fingerprint(resources, number):
+    """Time the fingerprint of a large stack, before and after a small change."""
+    stack = _create_benchmark_stack(resources, 0)
+    click.echo("Fingerprinting {} resources".format(resources))
+
+    seconds = timeit.timeit(stack.fingerprint, number=1)
+    click.echo("{:<40} {:>10.3f} s/op".format("first fingerprint", seconds))
+
+    seconds = timeit.timeit(stack.fingerprint, number=number)
+    click.echo("{:<40} {:>10.3f} s/op".format("unchanged", seconds / number))
+
+    resource = stack.Resources["Instance0"]
+
+    def change_and_fingerprint():
+        resource.DeletionPolicy = (
+            "Retain" if resource.DeletionPolicy != "Retain" else "Delete"
+        )
+        stack.fingerprint()
+
+    seconds = timeit.timeit(change_and_fingerprint, number=number)
+    click.echo("{:<40} {:>10.3f} s/op".format("one resource changed", seconds / number))
+
+
+@benchmark.command("diff")
+@click.option(
+    "--resources",
+    "-r",
+    type=int,
+    default=10_000,
+    help="Number of resources in each stack.",
+    show_default=True,
+)
+def time_diff(resources):
+    """Time finding a single change between two large stacks."""
+    old = _create_benchmark_stack(resources, 0)
+    new = _create_benchmark_stack(resources, 0)
+    new.Resources["Instance0"].DeletionPolicy = "Retain"
+    click.echo("Comparing stacks of {} resources".format(resources))
+
+    seconds = timeit.timeit(lambda: diff(old, new), number=1)
+    click.echo("{:<40} {:>10.3f} s".format("diff", seconds))
+
+
+@benchmark.command("tag")
+@click.option(
+    "--resources",
+    "-r",
+    type=int,
+    default=500,
+    help="Number of resources in the stack.",
+    show_default=True,
+)
+@click.option(
+    "--tags",
+    "-t",
+    type=int,
+    default=40,
+    help="Number of tags to apply.",
+    show_default=True,
+)
+@click.option(
+    "--number",
+    "-n",
+    type=int,
+    default=10,
+    help="Number of times to tag the stack.",
+    show_default=True,
+)
+def time_tag(resources, tags, number):
+    """Time applying many tags to every resource in a large stack."""
+    stack = _create_benchmark_stack(resources, 0)
+    new_tags = {"Tag{}".format(i): "Value{}".format(i) for i in range(tags)}
+    click.echo("Applying {} tags to {} resources".format(tags, resources))
+
+    seconds = timeit.timeit(lambda: stack.tag(new_tags), number=number)
+    click.echo("{:<40} {:>10.3f} s/op".format("Stack.tag", seconds / number))
+
+
+def _convert_to_plain_data(value):
+    """Replace property type objects with the plain dictionaries that were
+    used before they were generated."""
+    if isinstance(value, list):
+        return [_convert_to_plain_data(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _convert_to_plain_data(item) for key, item in value.items()}
+    if isinstance(value, AWSObject):
+        return {
+            key: _convert_to_plain_data(item)
+            for key, item in value.items()
+            if item is not None
+        }
+    return value
+
+
+def _create_plain_benchmark_stack(resource_count):
+    """Create the benchmark stack with property types as plain dictionaries."""
+    stack = _create_benchmark_stack(resource_count, 0)
+    for resource in stack.Resources.values():
+        for key, value in resource.Properties.items():
+            # Bypass the converter, which would create an object again
+            object.__setattr__(resource.Properties, key, _convert_to_plain_data(value))
+    return stack
+
+
+@benchmark.command("memory")
+@click.option(
+    "--resources",
+    "-r",
+    type=int,
+    default=5_000,
+    help="Number of resources in the stack.",
+    show_default=True,
+)
+@click.option(
+    "--number",
+    "-n",
+    type=int,
+    default=3,
+    help="Number of exports to time.",
+    show_default=True,
+)
+def measure_memory(resources, number):
+    """Measure the memory used by property types, as dictionaries and objects."""
+    click.echo("Creating stacks of {} resources".format(resources))
+
+    for name, create_stack in (
+        ("dictionaries", _create_plain_benchmark_stack),
+        ("property type objects", lambda count: _create_benchmark_stack(count, 0)),
+    ):
+        # Create all of the classes before measuring
+        create_stack(1)
+
+        tracemalloc.start()
+        stack = create_stack(resources)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        click.echo("{:<40} {:>10.1f} MB".format(name, size / 1_000_000))
+        seconds = timeit.timeit(stack.export, number=number)
+        click.echo("{:<40} {:>10.3f} s/op".format("  export", seconds / number))
+        del stack
+
+
+#: The JSON resource specification that the generated code is based on
+SPECIFICATION_JSON = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "contrib",
+    "CloudFormationResourceSpecification.json",
+)
+
+
+@benchmark.command("specification")
+@click.option(
+    "--number",
+    "-n",
+    type=int,
+    default=5,
+    help="Number of times to open the specification.",
+    show_default=True,
+)
+def time_specification(number):
+    """Time looking up a resource type in the specification, from the JSON
+    document and from the indexed store."""
+
+    def lookup_json():
+        with open(SPECIFICATION_JSON) as fp:
+            data = json.load(fp)
+        return data["ResourceTypes"]["AWS::S3::Bucket"]
+
+    def lookup_store():
+        with Specification() as specification:
+            return specification.get_resource_type("AWS::S3::Bucket")
+
+    for name, func in (("json document", lookup_json), ("indexed store", lookup_store)):
+        seconds = timeit.timeit(func, number=number)
+        click.echo("{:<40} {:>10.3f} ms/op".format(name, seconds / number * 1000))
+
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        click.echo("{:<40} {:>10.1f} MB".format("  peak memory", peak / 1_000_000))
+
+    with Specification() as specification:
+        names = specification.get_property_type_names()
+        seconds = timeit.timeit(
+            lambda: [specification.get_property_type(name) for name in names], number=1
+        )
+    click.echo(
+        "{:<40} {:>10.1f} us/op".format(
+            "store property type lookup", seconds / len(names) * 1_000_000
+        )
+    )
+
+
+#: The file that stores the baseline startup measurements
+STARTUP_BASELINE = os.path.join(os.path.dirname(__file__), "startup_baseline.json")
+
+#: The target name for importing every service module together
+ALL_SERVICES = "flyingcircus.service.*"
+
+#: The startup measurements that are compared against the baseline, with the
+#: smallest increase that is treated as a regression (so that noise in small
+#: values is ignored)
+_STARTUP_METRICS = {"seconds": 0.005, "rss_mb": 1.0}
+
+#: The number of modules recorded from the `-X importtime` breakdown
+_BREAKDOWN_SIZE = 5
+
+#: Code that runs in a fresh interpreter. It imports the modules named on the
+#: command line, and prints the time taken and the increase in RSS.
+_IMPORT_SCRIPT = """
+import importlib, resource, sys, time
+
+def get_rss_mb():
+    # The current RSS is used on Linux, because the peak RSS includes the
+    # parent process
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * resource.getpagesize() / 1048576
+    except OSError:
+        # Use the peak RSS, which is reported in bytes on macOS and kilobytes
+        # elsewhere
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / 1048576 if sys.platform == "darwin" else rss / 1024
+
+rss_before = get_rss_mb()
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    importlib.import_module(name)
+seconds = time.perf_counter() - start
+rss_after = get_rss_mb()
+
+import json
+print(json.dumps({
+    "seconds": seconds,
+    "rss_mb": rss_after - rss_before,
+    "total_rss_mb": rss_after,
+}))
+"""
+
+
+def _get_service_modules():
+    return sorted(
+        "flyingcircus.service." + module.name
+        for module in pkgutil.iter_modules(flyingcircus.service.__path__)
+    )
+
+
+def _get_import_names(target):
+    if target == ALL_SERVICES:
+        return _get_service_modules()
+    return [target]
+
+
+def _run_import(names, importtime=False, write_bytecode=False):
+    """Import some modules in a fresh interpreter.
+
+    Args:
+        names: The modules to import.
+        importtime: Whether to print the time taken by each import.
+        write_bytecode: Write the bytecode for each module, even if the
+            environment would otherwise prevent it.
+
+    Returns:
+        The measurements printed by the interpreter, and it's stderr.
+    """
+    env = dict(os.environ)
+    if write_bytecode:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path
+        for path in (
+            os.path.dirname(os.path.dirname(flyingcircus.__file__)),
+            env.get("PYTHONPATH"),
+        )
+        if path
+    )
+
+    args = [sys.executable]
+    if importtime:
+        args += ["-X", "importtime"]
+    process = subprocess.run(
+        args + ["-c", _IMPORT_SCRIPT] + list(names),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    if process.returncode != 0:
+        raise click.ClickException(
+            "Failed to import {}:\n{}".format(", ".join(names), process.stderr)
+        )
+    return json.loads(process.stdout.splitlines()[-1]), process.stderr
+
+
+def _get_import_breakdown(names):
+    """Get the modules that took the longest to import, using `-X importtime`."""
+    _, stderr = _run_import(names, importtime=True)
+
+    # Each line looks like "import time: <self us> | <cumulative us> | <name>"
+    breakdown = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        try:
+            breakdown.append(
+                {
+                    "module": module.strip(),
+                    "self_ms": int(self_us) / 1000,
+                    "cumulative_ms": int(cumulative_us) / 1000,
+                }
+            )
+        except ValueError:
+            # This is the header line
+            pass
+
+    breakdown.sort(key=lambda item: item["self_ms"], reverse=True)
+    return breakdown[:_BREAKDOWN_SIZE]
+
+
+def _measure_startup(target, repeat):
+    names = _get_import_names(target)
+    runs = [_run_import(names)[0] for _ in range(repeat)]
+
+    # Other processes can only make an import slower, so the fastest time is
+    # the most repeatable
+    result = {"seconds": min(run["seconds"] for run in runs)}
+    for key in ("rss_mb", "total_rss_mb"):
+        result[key] = statistics.median(run[key] for run in runs)
+    result["breakdown"] = _get_import_breakdown(names)
+    return result
+
+
+def _compare_startup(result, baseline, tolerance):
+    """Compare a startup measurement with it's baseline.
+
+    Returns:
+        A description of the change in each metric, and whether any of them
+        is a regression.
+    """
+    changes = []
+    regressed = False
+    for key, minimum_increase in _STARTUP_METRICS.items():
+        old = baseline[key]
+        new = result[key]
+        if new - old > max(minimum_increase, old * tolerance):
+            regressed = True
+        changes.append(
+            "{:+.0%}".format(new / old - 1) if old > 0 else "{:+.1f}".format(new - old)
+        )
+    return " ".join("{:>6}".format(change) for change in changes), regressed
+
+
+@benchmark.command("startup")
+@click.option(
+    "--module",
+    "-m",
+    "modules",
+    multiple=True,
+    help=(
+        "Module to import. Use {} to import every service module together. "
+        "[default: flyingcircus, each service module, and every service "
+        "module together]".format(ALL_SERVICES)
+    ),
+)
+@click.option(
+    "--repeat",
+    "-n",
+    type=int,
+    default=5,
+    help="Number of times to import each module.",
+    show_default=True,
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False),
+    default=STARTUP_BASELINE,
+    help="File containing the baseline measurements.",
+    show_default=True,
+)
+@click.option(
+    "--tolerance",
+    type=float,
+    default=0.2,
+    help="Fractional increase over the baseline that is a regression.",
+    show_default=True,
+)
+@click.option(
+    "--breakdown",
+    "-b",
+    type=click.IntRange(0, _BREAKDOWN_SIZE),
+    default=0,
+    help="Number of slowest modules to show from `-X importtime`.",
+    show_default=True,
+)
+@click.option("--save", is_flag=True, help="Save the measurements as the new baseline.")
+def time_startup(modules, repeat, baseline, tolerance, breakdown, save):
+    """Time importing the package, and measure the memory it uses.
+
+    Each module is imported in a fresh interpreter, so nothing is shared
+    between measurements. The time and the increase in peak RSS are compared
+    against the baseline, and the command fails if either has regressed.
+    Measurements are only comparable on the same machine and Python version,
+    so the baseline should be saved from the original code before making a
+    change. The saved baseline only has the targets that were measured, so
+    the baseline in the repository is a small reference for the package and
+    for every service module together.
+    """
+    targets = list(modules) or (
+        ["flyingcircus"] + _get_service_modules() + [ALL_SERVICES]
+    )
+
+    try:
+        with open(baseline) as baseline_file:
+            baseline_data = json.load(baseline_file)
+    except FileNotFoundError:
+        baseline_data = {"modules": {}}
+    environment = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+    if baseline_data["modules"] and any(
+        baseline_data.get(key) != value for key, value in environment.items()
+    ):
+        LOGGER.warning(
+            "The baseline was measured with Python %s on %s",
+            baseline_data.get("python"),
+            baseline_data.get("platform"),
+        )
+
+    # Compile the bytecode for every module before it is timed, because an
+    # installed package always has it's bytecode. Otherwise, the time to
+    # compile the (large) generated modules would be measured on every run.
+    _run_import(
+        sorted({name for target in targets for name in _get_import_names(target)}),
+        write_bytecode=True,
+    )
+
+    click.echo(
+        "{:<40} {:>10} {:>10}   {}".format("module", "time", "RSS", "vs baseline")
+    )
+    regressions = []
+    for target in targets:
+        result = _measure_startup(target, repeat)
+        line = "{:<40} {:>7.1f} ms {:>7.1f} MB".format(
+            target, result["seconds"] * 1000, result["rss_mb"]
+        )
+        if target in baseline_data["modules"]:
+            changes, regressed = _compare_startup(
+                result, baseline_data["modules"][target], tolerance
+            )
+            line += "   " + changes
+            if regressed:
+                line += "  REGRESSION"
+                regressions.append(target)
+        click.echo(line)
+
+        for item in result["breakdown"][:breakdown]:
+            click.echo(
+                "    {:<36} {:>7.1f} ms self {:>7.1f} ms cumulative".format(
+                    item["module"], item["self_ms"], item["cumulative_ms"]
+                )
+            )
+
+        # Only the compared metrics are saved, so the baseline stays small
+        baseline_data["modules"][target] = {
+            key: result[key] for key in _STARTUP_METRICS
+        }
+
+    if save:
+        baseline_data.update(environment)
+        with open(baseline, "w") as baseline_file:
+            json.dump(baseline_data, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+        click.echo("Saved the baseline to {}".format(baseline))
+
+    if regressions:
+        raise click.ClickException(
+            "Startup regressed for: {}".format(", ".join(regressions))
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    LOGGER.setLevel(logging.INFO)
+
+    benchmark()
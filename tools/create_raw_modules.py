@@ -7,9 +7,16 @@ These are automatically generated from a JSON specification provided by Amazon,
 which is documented at https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/cfn-resource-specification-format.html
 """
 
+import functools
+import hashlib
+import importlib
 import json
+import keyword
 import logging
 import os.path
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
 
 import black
 import click
@@ -153,9 +160,312 @@ RESOURCES_WITH_EXTRA_ATTRIBUTES = {
     "AWS::Lambda::Alias": ["UpdatePolicy"],
 }
 
+#: The name of the property that most resources store their tags in
+DEFAULT_TAG_PROPERTY = "Tags"
+
+#: The format that most resources store their tags in
+DEFAULT_TAG_FORMAT = "KeyValueList"
+
+#: Property types that are shared by every resource, along with the name of
+#: the class in the `core` module that represents them
+GLOBAL_PROPERTY_TYPES = {"Tag": "Tag"}
+
+#: The names that every generated module imports from the `core` module.
+#: Base classes are imported with a private name, so that they don't clash
+#: with generated classes of the same name.
+CORE_IMPORTS = [
+    "Resource as _Resource",
+    "ResourceProperties as _ResourceProperties",
+    "create_object_converter",
+]
+
+#: The classes in the `core` module that generated classes are derived
+#: from, keyed by the name they are imported as. The value is the import.
+BASE_CLASSES = {
+    "_PropertyType": "PropertyType as _PropertyType",
+    "_Resource": "Resource as _Resource",
+    "_ResourceProperties": "ResourceProperties as _ResourceProperties",
+}
+
+#: The suffix for the name of a variable that holds a converter in a
+#: prebuilt module, for each function that creates a converter
+CONVERTER_SUFFIXES = {
+    "create_object_converter": "",
+    "create_object_list_converter": "_list",
+    "create_object_map_converter": "_map",
+}
+
 #: The directory where this script lives
 SCRIPTDIR = os.path.dirname(__file__)
 
+#: The template used to generate each module in the `_raw` package
+RAW_MODULE_TEMPLATE = "raw_module.py.jinja2"
+
+#: The template used to generate a new module in the `service` package
+SERVICE_MODULE_TEMPLATE = "service_module.py.jinja2"
+
+#: The file in the `_raw` package that records the hash of the inputs for
+#: each generated module
+MANIFEST_FILENAME = "_manifest.json"
+
+#: The file in the `_raw` package that stores the resource specification
+#: (see `flyingcircus.specification`)
+SPECIFICATION_FILENAME = "_specification.bin"
+
+
+def get_tag_details(resource_type, resource_data, property_types):
+    """Determine where and how a resource stores its tags.
+
+    Tags are either stored in a property called "Tags", or else in a property
+    named after the resource (eg. "UserPoolTags" for a Cognito UserPool).
+
+    Returns:
+        A tuple of (property_name, tag_format), where `tag_format` is the
+        name of a `Resource.TAG_FORMAT` in the core package, or None if we
+        don't know how to set tags in this format. Both values are None if
+        the resource doesn't support tags at all.
+    """
+    resource_name = resource_type.split("::")[-1]
+    properties = resource_data.get("Properties", {})
+    for property_name in (DEFAULT_TAG_PROPERTY, resource_name + "Tags"):
+        if property_name in properties:
+            break
+    else:
+        return None, None
+
+    tag_property = properties[property_name]
+    if tag_property.get("PrimitiveType") == "Json" or tag_property.get("Type") == "Map":
+        return property_name, "Map"
+
+    if tag_property.get("Type") == "List":
+        item_type = tag_property.get("ItemType")
+        item_data = property_types.get(
+            "{}.{}".format(resource_type, item_type), property_types.get(item_type, {})
+        )
+        item_properties = set(item_data.get("Properties", {}))
+        if item_properties == {"Key", "Value"}:
+            return property_name, "KeyValueList"
+        if item_properties == {"Key", "Value", "PropagateAtLaunch"}:
+            return property_name, "PropagatingKeyValueList"
+
+    LOGGER.warning(
+        "Resource '%s' has tags in an unknown format, so tagging will not be supported",
+        resource_type,
+    )
+    return property_name, None
+
+
+def is_structured_property_type(property_data):
+    """Whether a property type is an object with it's own properties.
+
+    A few property types in the specification are actually an alias for a
+    primitive type or a list, and those don't need a class. Property types
+    with a property name that can't be a Python attribute (eg. "None") are
+    left as dictionaries.
+    """
+    if {"ItemType", "PrimitiveItemType", "PrimitiveType", "Type"} & set(property_data):
+        return False
+    return all(
+        name.isidentifier() and not keyword.iskeyword(name)
+        for name in property_data.get("Properties", {})
+    )
+
+
+def get_property_type_name(property_data):
+    """Get the name of the property type used by a property, if any.
+
+    This is the type of the items for a list or map property.
+    """
+    if "ItemType" in property_data:
+        return property_data["ItemType"]
+    if property_data.get("Type") not in (None, "List", "Map"):
+        return property_data["Type"]
+    return None
+
+
+def add_property_types(service, resource_property_types):
+    """Add the property types for each resource in a service to it's data.
+
+    Each structured property type becomes a class named after the resource
+    and the property type (eg. "InstanceBlockDeviceMapping"), or with a
+    "Property" suffix if that clashes with another class. The classes for
+    each resource are listed so that a class is defined before any classes
+    which use it.
+
+    Each property of a resource or property type that uses one of these
+    classes has a converter, which converts dictionaries into that class.
+    """
+    class_names = set(service["resources"]) | {
+        resource_name + "Properties" for resource_name in service["resources"]
+    }
+
+    for resource_name, resource in sorted(service["resources"].items()):
+        available_types = resource_property_types.get(resource["type"]["fullname"], {})
+
+        # Name the class for each property type
+        type_class_names = {}
+        for type_name, property_data in sorted(available_types.items()):
+            if not is_structured_property_type(property_data):
+                continue
+            class_name = resource_name + type_name
+            if class_name in class_names:
+                class_name += "Property"
+            assert class_name not in class_names, "property type is defined twice"
+            class_names.add(class_name)
+            type_class_names[type_name] = class_name
+
+        # Sort the property types so that each class comes after the
+        # classes that it uses
+        ordered_types = []
+        visiting = set()
+
+        def visit(type_name):
+            if type_name in ordered_types or type_name in visiting:
+                return
+            visiting.add(type_name)
+            for property_data in (
+                available_types[type_name].get("Properties", {}).values()
+            ):
+                dependency = get_property_type_name(property_data)
+                if dependency in type_class_names:
+                    visit(dependency)
+            visiting.remove(type_name)
+            ordered_types.append(type_name)
+
+        for type_name in sorted(type_class_names):
+            visit(type_name)
+
+        def get_converter(property_data):
+            """Get the converter function for a property and the class that
+            it converts to, if it needs one."""
+            type_name = get_property_type_name(property_data)
+            if type_name in type_class_names:
+                class_name = type_class_names[type_name]
+            elif type_name in GLOBAL_PROPERTY_TYPES:
+                class_name = "_" + GLOBAL_PROPERTY_TYPES[type_name]
+                service["core_imports"].add(
+                    "{} as {}".format(GLOBAL_PROPERTY_TYPES[type_name], class_name)
+                )
+            else:
+                return None
+
+            if property_data.get("Type") == "List":
+                function_name = "create_object_list_converter"
+            elif property_data.get("Type") == "Map":
+                function_name = "create_object_map_converter"
+            else:
+                function_name = "create_object_converter"
+            service["core_imports"].add(function_name)
+            return function_name, class_name
+
+        # The core classes for global property types are always available
+        defined_classes = {"_" + name for name in GLOBAL_PROPERTY_TYPES.values()}
+        defined_variables = set()
+
+        def add_converters(class_data, properties):
+            """Add the converters for the properties of a class, which is
+            defined after the classes in `defined_classes`.
+
+            A decorated class has the code for each converter in it's class
+            body. A prebuilt class refers to a variable in the enclosing
+            function instead, and the new variables that it needs are
+            defined before the class.
+            """
+            class_data["converters"] = {}
+            class_data["attributes"] = []
+            class_data["new_converters"] = []
+            for property_name in sorted(properties, key=str.lower):
+                converter = get_converter(properties[property_name])
+                if converter is None:
+                    class_data["converters"][property_name] = None
+                    class_data["attributes"].append({"name": property_name})
+                    continue
+
+                function_name, class_name = converter
+                deferred_class = "lambda **kwargs: {}(**kwargs)".format(class_name)
+
+                # The class can't be used directly if it hasn't been created
+                # yet (because it contains itself), or if it is hidden by a
+                # property of the same name in the class body. A function
+                # can still find it when it is called.
+                if class_name not in defined_classes or class_name in properties:
+                    code = "{}({})".format(function_name, deferred_class)
+                else:
+                    code = "{}({})".format(function_name, class_name)
+                class_data["converters"][property_name] = code
+
+                # Converters in the enclosing function are shared by all of
+                # the classes for the resource, and aren't hidden by
+                # properties
+                variable = "_convert_{}{}".format(
+                    class_name.lstrip("_"), CONVERTER_SUFFIXES[function_name]
+                )
+                if variable not in defined_variables:
+                    if class_name not in defined_classes:
+                        code = "{}({})".format(function_name, deferred_class)
+                    else:
+                        code = "{}({})".format(function_name, class_name)
+                    class_data["new_converters"].append((variable, code))
+                    defined_variables.add(variable)
+                class_data["attributes"].append(
+                    {"name": property_name, "converter": variable}
+                )
+
+        resource["property_types"] = []
+        for type_name in ordered_types:
+            property_data = available_types[type_name]
+            class_name = type_class_names[type_name]
+            property_type = {
+                "class_name": class_name,
+                "documentation": property_data.get("Documentation"),
+                "friendly_name": inflection.titleize(type_name),
+                "name": type_name,
+            }
+            add_converters(property_type, property_data.get("Properties", {}))
+            resource["property_types"].append(property_type)
+            defined_classes.add(class_name)
+
+        add_converters(resource, resource.get("Properties", {}))
+
+        if resource["property_types"]:
+            service["core_imports"].add("PropertyType as _PropertyType")
+
+
+def add_resource_attributes(service):
+    """Add the attributes that each resource class declares, in addition to
+    those inherited from `Resource`, for generating prebuilt classes."""
+    for resource_name, resource in service["resources"].items():
+        properties_class = resource_name + "Properties"
+        resource["resource_attributes"] = [
+            {
+                "name": "Properties",
+                "converter": "_convert_" + properties_class,
+                "factory": properties_class,
+            }
+        ]
+        for attribute_name, is_present in (
+            ("CreationPolicy", resource["has_creation_policy"]),
+            ("UpdatePolicy", resource["has_update_policy"]),
+        ):
+            if is_present:
+                resource["resource_attributes"].append(
+                    {
+                        "name": attribute_name,
+                        "annotation": "Dict[str, Any]",
+                        "factory": "dict",
+                    }
+                )
+
+
+def import_package_module(packagedir, module_name):
+    """Import a module from the package that is being generated."""
+    packagedir = os.path.abspath(packagedir)
+    sys.path.insert(0, os.path.dirname(packagedir))
+    try:
+        return importlib.import_module(os.path.basename(packagedir) + "." + module_name)
+    finally:
+        del sys.path[0]
+
 
 @click.command()
 @click.argument(
@@ -174,13 +484,49 @@ SCRIPTDIR = os.path.dirname(__file__)
     help="JSON resource specification from Amazon Web Services.",
     show_default=True,
 )
-def generate_modules(packagedir, specification):
+@click.option(
+    "--force",
+    "-f",
+    is_flag=True,
+    help="Generate every module, even if its inputs haven't changed.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=int,
+    default=None,
+    help="Number of worker processes.  [default: number of CPUs]",
+)
+@click.option(
+    "--prebuilt/--decorated",
+    default=True,
+    help="Write out the finished classes, or decorate them with attrs when "
+    "they are created.",
+    show_default=True,
+)
+def generate_modules(packagedir, specification, force, workers, prebuilt):
     """Create the basic Python modules in the `_raw` package,
     and ensure the accompanying modules in the `service` package exist.
 
     The output directory argument should be the location of the existing
     'src/flyingcircus/' directory, where generated files will be placed.
     Existing files will be replaced.
+
+    The resource specification is also stored in the `_raw` package, as an
+    indexed file that can be read without loading the whole document (see
+    `flyingcircus.specification`).
+
+    A hash of the inputs for each module is recorded in a manifest in the
+    `_raw` package, and modules are only generated again when their hash
+    changes (eg. when the specification for that service changes). Modules
+    are generated in parallel.
+
+    By default, the generated classes are prebuilt: the code that `attrs`
+    would create for each class when it is decorated (such as it's
+    `__init__`) is written out in full, so importing the module doesn't
+    need to compile any code (see `flyingcircus._prebuilt`). The
+    `--decorated` option generates classes that use the `attrs` decorator
+    instead.
     """
     # Check inputs
     raw_dirname = os.path.join(packagedir, "_raw")
@@ -201,6 +547,19 @@ def generate_modules(packagedir, specification):
         "ResourceTypes",
     }, "Found an unknown top-level key"
 
+    # Store the unmodified specification in an indexed file, for lookups at
+    # runtime. This is cheap, so it is always written
+    LOGGER.debug("Generating resource specification store")
+    specification_module = import_package_module(packagedir, "specification")
+    specification_module.write_specification(
+        all_data, os.path.join(raw_dirname, SPECIFICATION_FILENAME)
+    )
+
+    if prebuilt:
+        core_imports = set(CORE_IMPORTS)
+    else:
+        core_imports = set(CORE_IMPORTS) | {"ATTRSCONFIG"}
+
     # Group the data by AWS service and calculate additional data
     services = {}
 
@@ -238,6 +597,8 @@ def generate_modules(packagedir, specification):
                 "documentation": {"url": doc_url},
                 "module_name": service_name.lower(),
                 "name": service_name,
+                "core_imports": set(core_imports),
+                "prebuilt": prebuilt,
                 "resources": {},
                 "typing_imports": set(),
             },
@@ -269,23 +630,51 @@ def generate_modules(packagedir, specification):
             }
         )
 
+        tag_property, tag_format = get_tag_details(
+            resource_type, resource_data, all_data["PropertyTypes"]
+        )
+        resource_data["tags"] = {"property": tag_property, "format": tag_format}
+
         if resource_data["has_creation_policy"]:
             service["typing_imports"].update(["Any", "Dict"])
         if resource_data["has_update_policy"]:
             service["typing_imports"].update(["Any", "Dict"])
 
-    # TODO collect property types in the same way
-    # TODO verify that a property doesn't have the same name as a resource (nor an existing property)
+    # Collect the property types for each resource, which are generated as
+    # Python classes in the same module
+    resource_property_types = {}
+    for property_type, property_data in all_data["PropertyTypes"].items():
+        if "." not in property_type:
+            assert (
+                property_type in GLOBAL_PROPERTY_TYPES
+            ), "Found an unknown global property type"
+            continue
+        resource_type, type_name = property_type.split(".")
+        resource_property_types.setdefault(resource_type, {})[type_name] = property_data
+
+    for service in services.values():
+        add_property_types(service, resource_property_types)
+        if prebuilt:
+            add_resource_attributes(service)
+
+            # The attributes that each class inherits are set by a function
+            # that is created for each base class when the module is imported
+            service["base_classes"] = [
+                name
+                for name, import_name in BASE_CLASSES.items()
+                if import_name in service["core_imports"]
+            ]
 
     # Create a Python module for each AWS service, with a Python class for
-    # each AWS resource type
-    env = Environment(
-        loader=FileSystemLoader(
-            SCRIPTDIR
-        )  # TODO put our template into a "standard" location for Jinja
-    )
-    raw_template = env.get_template("raw_module.py.jinja2")
-    service_template = env.get_template("service_module.py.jinja2")
+    # each AWS resource type. Only services that have changed since the last
+    # run are generated
+    with open(os.path.join(SCRIPTDIR, RAW_MODULE_TEMPLATE), "r") as fp:
+        template_source = fp.read()
+
+    manifest_filename = os.path.join(raw_dirname, MANIFEST_FILENAME)
+    old_hashes = {} if force else load_manifest(manifest_filename)
+    new_hashes = {}
+    pending = {}
 
     for service_name, service in sorted(services.items()):
         if not service["documentation"]["url"]:
@@ -293,26 +682,127 @@ def generate_modules(packagedir, specification):
                 "Service %s does not have a documentation URL configured", service_name
             )
 
-        # Create or update the "raw" python module
-        raw_module_name = os.path.join(raw_dirname, service["module_name"] + ".py")
-        with open(raw_module_name, "w") as fp:
-            LOGGER.debug("Generating raw module %s.py", service["module_name"])
+        module_name = service["module_name"]
+        raw_module_name = os.path.join(raw_dirname, module_name + ".py")
+        service_hash = get_service_hash(service, template_source)
+        if old_hashes.get(module_name) == service_hash and os.path.exists(
+            raw_module_name
+        ):
+            new_hashes[module_name] = service_hash
+        else:
+            pending[module_name] = (service, service_hash)
+
+    for module_name in sorted(set(old_hashes) - set(new_hashes) - set(pending)):
+        LOGGER.warning(
+            "Service module %s.py is no longer in the specification", module_name
+        )
 
-            rendered = raw_template.render(service=service)
-            formatted = black.format_str(rendered, mode=BLACK_SETTINGS)
-            fp.write(formatted)
+    LOGGER.info("Generating %d of %d service modules", len(pending), len(services))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    create_service_modules, service, raw_dirname, service_dirname
+                ): (module_name, service_hash)
+                for module_name, (service, service_hash) in pending.items()
+            }
+            for future in as_completed(futures):
+                future.result()
+                module_name, service_hash = futures[future]
+                new_hashes[module_name] = service_hash
+    finally:
+        # Record the modules that were generated, even if some of them failed
+        with open(manifest_filename, "w") as fp:
+            json.dump(
+                {
+                    "ResourceSpecificationVersion": all_data[
+                        "ResourceSpecificationVersion"
+                    ],
+                    "modules": new_hashes,
+                },
+                fp,
+                indent=2,
+                sort_keys=True,
+            )
+            fp.write("\n")
 
-        # Ensure that the "service" module exists, and pre-populate it with
-        # the boilerplate if it doesn't
-        service_module_name = os.path.join(
-            service_dirname, service["module_name"] + ".py"
+    # Create a lookup table of the Python class for every resource type
+    resource_types = {
+        resource["type"]["fullname"]: (service["module_name"], resource_name)
+        for service in services.values()
+        for resource_name, resource in service["resources"].items()
+    }
+    with open(os.path.join(raw_dirname, "_registry.py"), "w") as fp:
+        LOGGER.debug("Generating resource type registry")
+
+        registry_template = get_template_environment().get_template(
+            "raw_registry.py.jinja2"
         )
-        if not os.path.exists(service_module_name):
-            with open(service_module_name, "w") as fp:
-                LOGGER.debug("Generating service module %s.py", service["module_name"])
-                rendered = service_template.render(service=service)
-                formatted = black.format_str(rendered, mode=BLACK_SETTINGS)
-                fp.write(formatted)
+        rendered = registry_template.render(resource_types=resource_types)
+        formatted = black.format_str(rendered, mode=BLACK_SETTINGS)
+        fp.write(formatted)
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_environment():
+    """Get the Jinja environment, which is created once in each process."""
+    return Environment(
+        loader=FileSystemLoader(
+            SCRIPTDIR
+        )  # TODO put our template into a "standard" location for Jinja
+    )
+
+
+def get_service_hash(service, template_source):
+    """Calculate a hash of everything that the generated module for a
+    service depends on.
+
+    This is the data for the service (including the parts of the
+    specification that it uses), the template, and the version of black
+    used to format it.
+    """
+    service_data = json.dumps(service, sort_keys=True, default=sorted)
+
+    digest = hashlib.sha256()
+    for value in (black.__version__, template_source, service_data):
+        digest.update(value.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_manifest(filename):
+    """Load the hash for each module that was generated on the last run."""
+    try:
+        with open(filename, "r") as fp:
+            return json.load(fp)["modules"]
+    except FileNotFoundError:
+        return {}
+
+
+def create_service_modules(service, raw_dirname, service_dirname):
+    """Create the modules for a single AWS service.
+
+    This is run in a worker process.
+    """
+    env = get_template_environment()
+
+    # Create or update the "raw" python module
+    raw_module_name = os.path.join(raw_dirname, service["module_name"] + ".py")
+    LOGGER.debug("Generating raw module %s.py", service["module_name"])
+    rendered = env.get_template(RAW_MODULE_TEMPLATE).render(service=service)
+    formatted = black.format_str(rendered, mode=BLACK_SETTINGS)
+    with open(raw_module_name, "w") as fp:
+        fp.write(formatted)
+
+    # Ensure that the "service" module exists, and pre-populate it with
+    # the boilerplate if it doesn't
+    service_module_name = os.path.join(service_dirname, service["module_name"] + ".py")
+    if not os.path.exists(service_module_name):
+        LOGGER.debug("Generating service module %s.py", service["module_name"])
+        rendered = env.get_template(SERVICE_MODULE_TEMPLATE).render(service=service)
+        formatted = black.format_str(rendered, mode=BLACK_SETTINGS)
+        with open(service_module_name, "w") as fp:
+            fp.write(formatted)
 
 
 if __name__ == "__main__":